@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+bench.py
+
+Benchmarks for the hot paths of the Hershey Text plugin and the font
+converter. Runs without Inkscape: if inkex is not installed, the stubs
+in benchmarks/stubs stand in for it.
+
+    python benchmarks/bench.py -o results.json
+    python benchmarks/bench.py -b baseline.json
+    python benchmarks/bench.py -k wrap -k convert
+
+Every benchmark is measured --repeat times (fast ones in loops of many
+calls) and its best time per call counts, which is the least disturbed
+by other load on the machine. Results are printed
+and can be saved as JSON (-o); with a baseline from an earlier run (-b),
+each result is compared against it and the run fails (exit status 1) if
+any benchmark got slower by more than --threshold.
+
+Benchmarks:
+    draw/<font>         draw_svg_text() throughput per font, in glyphs
+    wrap/<size>-<mode>  line breaking at boxwidth 500, short and multi-page texts
+    sample              sample sheet of all fonts (render_table_of_all_fonts)
+    plugin/render       the whole Inkscape effect, on the stubs if needed
+    import/hersheydata  import of hersheydata from source, in a new interpreter
+    import/load_font    first font from the registry, in a new interpreter
+    convert/<glyphs>    converter.generateFont() on synthetic .sf2 files
+'''
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import struct
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(1, os.path.join(ROOT, 'font_converter'))
+try:
+    from importlib.util import find_spec
+except ImportError:     # Python 2
+    import imp
+
+    def find_spec( name ):
+        try:
+            return imp.find_module(name)
+        except ImportError:
+            return None
+if find_spec('inkex') is None:
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stubs'))
+
+import hersheyengine
+
+DRAW_FONTS = ['futural', 'timesr', 'scripts', 'gothiceng', 'EMSReadability', 'EMSTech', 'Glober_Thin_Free']
+SHORT_TEXT = 'The Quick Brown Fox Jumps Over a Lazy Dog'
+CYRILLIC_TEXT = u'Съешь же ещё этих ' \
+                u'мягких французских ' \
+                u'булок'
+SF2_GLYPHS = [32, 96, 224]
+
+
+def words( count, seed=1 ):
+    """A reproducible text of count words, with a paragraph break every 80 words."""
+    rnd = random.Random(seed)
+    vocabulary = SHORT_TEXT.split() + ['engraving', 'plotter', 'stroke', 'a', 'of', 'single', 'line',
+                                       'Hershey', 'typesetting', 'coordinates', 'font', 'to', 'in']
+    text = []
+    for i in range(count):
+        text.append(rnd.choice(vocabulary))
+        text.append('\n' if i % 80 == 79 else ' ')
+    return ''.join(text).strip()
+
+
+def synthetic_sf2( glyphs, seed=1 ):
+    """An .sf2 file (as converter.py reads them) with glyphs random glyphs of 0-3 strokes."""
+    rnd = random.Random(seed)
+    chars = list(range(32, 32 + glyphs))
+    head = bytearray(0xAC)
+    struct.pack_into('<H', head, 0x60, glyphs)
+    name = b'Bench Font'
+    head[0x6c:0x6c + len(name)] = name
+    table = bytearray(glyphs * 2 + (glyphs % 4) * 2)
+    for i, c in enumerate(chars):
+        struct.pack_into('<H', table, i * 2, c)
+    body = bytearray()
+    offsets = []
+    for c in chars:
+        offsets.append(len(body))
+        strokes = [rnd.randint(2, 8) for _ in range(rnd.randint(0, 3))] if c != 32 else []
+        body += struct.pack('<II', 500, len(strokes))
+        body += b''.join(struct.pack('<I', n) for n in strokes)
+        for n in strokes:
+            for k in range(n):
+                body += struct.pack('<6h', *[rnd.randint(-600, 600) for _ in range(6)])
+        for n in strokes:
+            body += bytearray([3 if rnd.random() < 0.3 else 1] * n)
+    return bytes(head + table + b''.join(struct.pack('<I', o) for o in offsets) + body)
+
+
+def draw_benchmark( fontface, text, fontface_cyr='cyrillic' ):
+    engine = hersheyengine.HersheyEngine(fontface=fontface, fontface_cyr=fontface_cyr)
+    codepoints = [ord(c) for c in text]   # draw_svg_text() takes code points
+
+    def run():
+        engine.paths = []
+        offset = 0
+        for q in codepoints:
+            offset = engine.draw_svg_text(q, engine.font, offset, 0)
+    run()
+    visible = len([c for c in text if not c.isspace()])
+    if len(engine.paths) != visible:
+        raise AssertionError('draw/{}: {} of {} glyphs drawn'.format(fontface, len(engine.paths), visible))
+    return run
+
+
+def wrap_benchmark( text, layout ):
+    engine = hersheyengine.HersheyEngine(boxwidth=500, layout=layout)
+
+    def run():
+        hersheyengine.text_widths.clear()   # measure the widths too, not just cache hits
+        engine.run('render', text)
+    return run
+
+
+def sample_benchmark():
+    engine = hersheyengine.HersheyEngine()
+
+    def run():
+        engine.run('sample', 'Abc')
+    return run
+
+
+def plugin_benchmark( text ):
+    import hershey
+
+    def run():
+        hershey.Hershey().affect(['--text', text, '--boxwidth', '500'])
+    return run
+
+
+def subprocess_benchmark( code ):
+    """Time code in a new interpreter (which reports its own time), without writing bytecode."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    script = 'import time; t = time.time()\n' + code + '\nprint(time.time() - t)'
+
+    def run():
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT, env=env)
+        return float(output.decode('ascii').split()[-1])
+    return run
+
+
+def convert_benchmark( glyphs ):
+    import converter
+    data = synthetic_sf2(glyphs)
+
+    def run():
+        converter.generateFont(data, None, False)
+    return run
+
+
+def benchmarks():
+    """List of (name, setup, work count, unit); setup() returns the function to time."""
+    long_text = words(6000)
+    text = SHORT_TEXT * 25
+    result = []
+    for fontface in DRAW_FONTS:
+        result.append( ('draw/' + fontface, lambda f=fontface: draw_benchmark(f, text), len(text), 'glyphs') )
+    cyrillic = CYRILLIC_TEXT * 25
+    result.append( ('draw/cyrillic', lambda: draw_benchmark('futural', cyrillic), len(cyrillic), 'glyphs') )
+    for size, sample in (('short', SHORT_TEXT), ('pages', long_text)):
+        for layout in ('greedy', 'optimal'):
+            result.append( ('wrap/{}-{}'.format(size, layout), lambda s=sample, l=layout: wrap_benchmark(s, l),
+                            len(sample), 'chars') )
+    result.append( ('sample', sample_benchmark, 1, 'sheets') )
+    result.append( ('plugin/render', lambda: plugin_benchmark(words(300)), 1, 'runs') )
+    result.append( ('import/hersheydata', lambda: subprocess_benchmark('import hersheydata'), 1, 'imports') )
+    result.append( ('import/load_font', lambda: subprocess_benchmark(
+        'import hersheyfonts; hersheyfonts.load_font("futural")'), 1, 'imports') )
+    for glyphs in SF2_GLYPHS:
+        result.append( ('convert/{}'.format(glyphs), lambda g=glyphs: convert_benchmark(g), glyphs, 'glyphs') )
+    return result
+
+
+MIN_TIME = 0.2    # shortest measurement; faster benchmarks are run in loops that take this long
+
+
+def timed( function, number ):
+    """Time number calls of function, with the garbage collector off (like timeit)."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.time()
+        for k in range(number):
+            reported = function()
+        return time.time() - start, reported
+    finally:
+        gc.enable()
+
+
+def measure( function, repeat ):
+    """
+    Best time per call over repeat measurements. A function may return its own time
+    (e.g. measured in a subprocess); others are looped until a measurement takes MIN_TIME.
+    """
+    elapsed, reported = timed(function, 1)
+    if reported is not None:
+        return min([reported] + [timed(function, 1)[1] for i in range(repeat - 1)])
+    number = 1
+    while elapsed < MIN_TIME:
+        number *= 10 if elapsed < MIN_TIME / 10 else 2
+        elapsed = timed(function, number)[0]
+    best = min([elapsed] + [timed(function, number)[0] for i in range(repeat - 1)])
+    return best / number
+
+
+def compare( results, baseline, threshold ):
+    """Print the results against the baseline; returns the names of the benchmarks that got slower."""
+    slower = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name]['seconds'] / max(baseline[name]['seconds'], 1e-9)
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  SLOWER'
+            slower.append(name)
+        elif ratio < 1 - threshold:
+            flag = '  faster'
+        sys.stdout.write('{:28} {:12.3f} ms  baseline {:12.3f} ms  x{:.2f}{}\n'.format(
+            name, results[name]['seconds'] * 1000, baseline[name]['seconds'] * 1000, ratio, flag))
+    return slower
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", "--select", action="append", default=[], metavar="TEXT",
+                        help="only run benchmarks whose name contains TEXT (repeatable)")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", metavar="FILE", help="save the results as JSON")
+    parser.add_argument("-b", "--baseline", metavar="FILE", help="compare against results saved earlier")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default 0.2)")
+    options = parser.parse_args(args)
+
+    results = {}
+    for name, setup, count, unit in benchmarks():
+        if options.select and not any(text in name for text in options.select):
+            continue
+        seconds = measure(setup(), options.repeat)
+        results[name] = {'seconds': seconds, 'count': count, 'unit': unit}
+        sys.stdout.write('{:28} {:12.3f} ms  {:12.0f} {}/s\n'.format(
+            name, seconds * 1000, count / max(seconds, 1e-9), unit))
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                       'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'repeat': options.repeat,
+                       'results': results}, f, indent=1, sort_keys=True)
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)['results']
+        sys.stdout.write('\n')
+        slower = compare(results, baseline, options.threshold)
+        if slower:
+            sys.stdout.write('{} benchmark(s) slower than the baseline: {}\n'.format(len(slower), ', '.join(slower)))
+            return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+'''
+Minimal stand-in for Inkscape's inkex module, enough to run hershey.py
+outside Inkscape for benchmarking. Only used if inkex is not installed.
+'''
+
+import optparse
+import sys
+import xml.etree.ElementTree as etree
+
+NSS = {
+    'inkscape': 'http://www.inkscape.org/namespaces/inkscape',
+    'svg': 'http://www.w3.org/2000/svg',
+    'xlink': 'http://www.w3.org/1999/xlink',
+}
+
+
+def addNS( tag, ns=None ):
+    if ns:
+        return '{%s}%s' % (NSS[ns], tag)
+    return tag
+
+
+def errormsg( msg ):
+    sys.stderr.write(str(msg) + '\n')
+
+
+def _check_inkbool( option, opt, value ):
+    return str(value).capitalize() == 'True'
+
+
+class _Option( optparse.Option ):
+    TYPES = optparse.Option.TYPES + ('inkbool',)
+    TYPE_CHECKER = dict(optparse.Option.TYPE_CHECKER)
+    TYPE_CHECKER['inkbool'] = _check_inkbool
+
+
+class Effect( object ):
+    def __init__( self ):
+        self.OptionParser = optparse.OptionParser(option_class=_Option)
+        self.OptionParser.add_option("--id", action="append", type="string", dest="ids", default=[])
+        self.selected = {}
+
+    def unittouu( self, string ):
+        return 1.0
+
+    def affect( self, args=None ):
+        """Run the effect on an empty document; the result is left in self.document."""
+        self.options, self.args = self.OptionParser.parse_args(args if args is not None else sys.argv[1:])
+        self.document = etree.ElementTree(etree.Element(addNS('svg', 'svg')))
+        self.current_layer = self.document.getroot()
+        self.view_center = (100.0, 100.0)
+        self.effect()
@@ -0,0 +1,5 @@
+'''Minimal stand-in for Inkscape's simplestyle module, see inkex.py.'''
+
+
+def formatStyle( a ):
+    return ';'.join([att + ':' + str(val) for att, val in a.items()])
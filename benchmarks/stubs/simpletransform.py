@@ -0,0 +1,5 @@
+'''Minimal stand-in for Inkscape's simpletransform module, see inkex.py.'''
+
+
+def computePointInNode( pt, node, mat=None ):
+    return pt
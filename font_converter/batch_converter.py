@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+'''
+batch_converter.py
+
+Converts a whole set of .sf2 fonts at once, with the same conversion as
+converter.py, spread over several processes.
+
+    python batch_converter.py fonts/ -o converted -w 4
+    python batch_converter.py -m fonts.csv -o converted
+
+Fonts are given as directories, where every .sf2 file is paired with the
+.ttf file of the same name next to it, or as a manifest: a CSV file with
+a header, or a JSON lines file (.jsonl), with the fields sf2, ttf and
+optionally cyrillic (1 for a Cyrillic version as well, like -c);
+relative paths are relative to the manifest.
+
+Each font gets its <name>.svg preview and <name>.py code in the output
+directory, as from converter.py. All fonts also go into one merged file
+(fonts.py), with every font list and the hershey.inx and font group
+entries as comments below them, ready for hersheydata.py or hersheypack.py.
+
+A font is converted again only if its inputs have changed: the content
+hashes of the .sf2 and .ttf files (and of the converter and its options)
+are kept in the output directory with the generated code.
+'''
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import converter
+
+CACHE_FILE = '.batch_converter.json'
+
+
+def read_manifest(path):
+    # list of (sf2, ttf, cyrillic); relative paths are relative to the manifest
+    with open(path, 'rb') as f:
+        data = f.read().decode('utf-8')
+    if path.endswith('.jsonl'):
+        rows = [json.loads(line) for line in data.splitlines() if line.strip()]
+    elif sys.version_info[0] < 3:
+        rows = [dict((k.decode('utf-8'), v.decode('utf-8')) for k, v in row.items() if v is not None)
+                for row in csv.DictReader(io.BytesIO(data.encode('utf-8')))]
+    else:
+        rows = list(csv.DictReader(io.StringIO(data)))
+    base = os.path.dirname(path)
+    fonts = []
+    for row in rows:
+        ttf = row.get('ttf') or None
+        fonts.append((os.path.join(base, row['sf2']), ttf and os.path.join(base, ttf),
+                      str(row.get('cyrillic', '')).strip().lower() in ('1', 'true', 'yes')))
+    return fonts
+
+
+def scan_directory(path, cyr):
+    # every .sf2 file of a directory, with the .ttf file of the same name if there is one
+    fonts = []
+    for name in sorted(os.listdir(path)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() == '.sf2':
+            ttf = os.path.join(path, stem + '.ttf')
+            fonts.append((os.path.join(path, name), ttf if os.path.exists(ttf) else None, cyr))
+    return fonts
+
+
+def file_hash(path, digest):
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+
+
+def input_hash(font, settings):
+    # content hash of everything a conversion depends on
+    sf2, ttf, cyr = font
+    digest = hashlib.sha1()
+    file_hash(converter.__file__.replace('.pyc', '.py'), digest)
+    file_hash(sf2, digest)
+    if ttf != None:
+        file_hash(ttf, digest)
+    if settings['flatten']:
+        # flattening runs the plugin's hersheyflatten.py and the modules it uses
+        for name in ('hersheyflatten', 'hersheyfonts', 'hersheyplot'):
+            file_hash(converter.loadPluginModule(name).__file__.replace('.pyc', '.py'), digest)
+    digest.update(repr((cyr, settings['flatten'], settings['simplify'])).encode('ascii'))
+    return digest.hexdigest()
+
+
+_settings = None   # conversion settings shared by all jobs, see init_worker()
+
+
+def init_worker(settings):
+    global _settings
+    _settings = settings
+
+
+def convert_job(font):
+    # convert one font, write its preview and code; returns (name, code)
+    sf2, ttf, cyr = font
+    fontName, preview, code = converter.convertFont(sf2, ttf, cyr, _settings['flatten'], _settings['simplify'])
+    with open(os.path.join(_settings['output_dir'], "{}.svg".format(fontName)), "w") as f:
+        f.write(preview)
+    with open(os.path.join(_settings['output_dir'], "{}.py".format(fontName)), "w") as f:
+        f.write(code)
+    return fontName, code
+
+
+def merge_code(codes):
+    # font lists of all fonts, then their registry entries as comments
+    lists = []
+    items = []
+    groups = []
+    for code in codes:
+        for line in code.splitlines():
+            if line.startswith('# <_item'):
+                items.append(line)
+            elif line.startswith('# ['):
+                groups.append(line)
+            elif line.strip():
+                lists.append(line)
+    return ''.join(line + '\n' for line in
+                   ["# generated by batch_converter.py from {} fonts".format(len(codes))] + lists +
+                   ["", "# hershey.inx entries:"] + items + ["", "# font group entries:"] + groups)
+
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dirs", metavar="DIR", nargs="*", help="directories with .sf2 and .ttf fonts")
+    parser.add_argument("-m", "--manifest", action="append", default=[],
+                        help="CSV or JSON lines (.jsonl) list of fonts, fields sf2, ttf, cyrillic (repeatable)")
+    parser.add_argument("-c", "--cyrillic", dest="cyr", action="store_true", default=False,
+                        help="output Cyrillic versions of the fonts found in directories")
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("--merged", default="fonts.py", help="merged output file, in the output directory")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of worker processes (0 = one per CPU)")
+    parser.add_argument("-f", "--force", action="store_true", default=False,
+                        help="convert all fonts, even if their inputs have not changed")
+    parser.add_argument("--flatten", metavar="TOLERANCE", type=float, default=0,
+                        help="store curves as polylines within this chord tolerance")
+    parser.add_argument("--simplify", metavar="TOLERANCE", type=float, default=0,
+                        help="simplify the polylines (Douglas-Peucker) with this tolerance")
+    options = parser.parse_args(args)
+    if options.simplify and not options.flatten:
+        parser.error("--simplify needs --flatten")
+
+    fonts = []
+    for path in options.dirs:
+        fonts.extend(scan_directory(path, options.cyr))
+    for path in options.manifest:
+        fonts.extend(read_manifest(path))
+    if not fonts:
+        parser.error("no fonts to convert, give DIR or --manifest")
+    if not os.path.isdir(options.output_dir):
+        os.makedirs(options.output_dir)
+
+    settings = dict((key, getattr(options, key)) for key in ('flatten', 'simplify', 'output_dir'))
+    cachePath = os.path.join(options.output_dir, CACHE_FILE)
+    cache = {} if options.force else load_cache(cachePath)
+    hashes = [input_hash(font, settings) for font in fonts]
+    results = [None] * len(fonts)
+    jobs = []
+    for i, font in enumerate(fonts):
+        entry = cache.get(os.path.abspath(font[0]))
+        if entry and entry['hash'] == hashes[i]:
+            results[i] = (entry['name'], entry['code'])
+        else:
+            jobs.append(i)
+
+    workers = options.workers or multiprocessing.cpu_count()
+    start = time.time()
+    if workers == 1 or len(jobs) < 2:
+        init_worker(settings)
+        converted = [convert_job(fonts[i]) for i in jobs]
+    else:
+        pool = multiprocessing.Pool(min(workers, len(jobs)), init_worker, (settings,))
+        converted = pool.map(convert_job, [fonts[i] for i in jobs], chunksize=1)
+        pool.close()
+        pool.join()
+    for i, result in zip(jobs, converted):
+        results[i] = result
+
+    names = {}
+    for font, (fontName, code) in zip(fonts, results):
+        if fontName in names:
+            parser.error("{} and {} both contain font {}".format(names[fontName], font[0], fontName))
+        names[fontName] = font[0]
+
+    cache = dict((os.path.abspath(font[0]), {'hash': h, 'name': result[0], 'code': result[1]})
+                 for font, h, result in zip(fonts, hashes, results))
+    with open(cachePath, "w") as f:
+        json.dump(cache, f)
+    with open(os.path.join(options.output_dir, options.merged), "w") as f:
+        f.write(merge_code([code for fontName, code in results]))
+
+    sys.stderr.write("converted {} of {} fonts ({} unchanged) with {} worker(s) in {:.2f}s\n".format(
+        len(jobs), len(fonts), len(fonts) - len(jobs), workers, time.time() - start))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ Originally written by Igor Repinetski, http://pixelmeister.org
 
 '''
 
+import os
 import struct
 import argparse
 import sys
@@ -25,22 +26,10 @@ charspacing = 3
 def getNumberOfGlyphs(fileContent):
     return struct.unpack_from("H", fileContent, 0x60)[0]
 
-def getChar(fileContent, i):
-    return chr(struct.unpack_from("H", fileContent, 0xAC + i * 2)[0])
-
 def getDataOffsetTableStart(fileContent):
     n = getNumberOfGlyphs(fileContent)
     return 0xAC + n * 2 + (n % 4) * 2
 
-def getDataStart(fileContent):
-    n = getNumberOfGlyphs(fileContent)
-    return getDataOffsetTableStart(fileContent) + n * 4
-
-def getGlyphDefStart(fileContent, i):
-    off = struct.unpack_from("<I", fileContent, getDataOffsetTableStart(fileContent) + i * 4)[0]
-    ds = getDataStart(fileContent)
-    return ds + off
-
 def getFontName(fileContent):
     fontName = ""
     fontMeta = fileContent[0x6c:0x8b]
@@ -62,102 +51,110 @@ def getFontLabel(fileContent):
         fontName += c
     return fontName
 
-def computeBaseline(fileContent):
+def parseFont(fileContent):
+    # Single pass over the glyph data: every table and node block is read with one
+    # unpack. Returns the glyphs as (char, strokes), a stroke being a list of nodes
+    # ((cx, cy, xx, xy, yx, yy), flag), and the baseline.
     glyphNo = getNumberOfGlyphs(fileContent)
+    chars = struct.unpack_from("<{}H".format(glyphNo), fileContent, 0xAC)
+    tableStart = getDataOffsetTableStart(fileContent)
+    dataStart = tableStart + glyphNo * 4
+    offsets = struct.unpack_from("<{}I".format(glyphNo), fileContent, tableStart)
+    flagBytes = bytearray(fileContent)
+
+    glyphs = []
     maxh = 0
-    for i in range(glyphNo): 
-        offset = getGlyphDefStart(fileContent, i)
-        offset += 4
-        
+    for i in range(glyphNo):
+        offset = dataStart + offsets[i] + 4
         strokesNum = struct.unpack_from("<I", fileContent, offset)[0]
         offset += 4
-        nodesNum = []
-        for j in range(strokesNum):
-            segments = struct.unpack_from("<I", fileContent, offset)[0]
-            offset += 4
-            nodesNum.append(segments)
-    
-        for j in range(strokesNum):
-            for k in range(nodesNum[j]):
-                offset += 2
-                cy = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 10
-                maxh = max(maxh, cy/scale)
-    
-    return maxh + 2
-
-def generateFont(fileContent, ttFont, cyr):
+        nodesNum = struct.unpack_from("<{}I".format(strokesNum), fileContent, offset)
+        offset += strokesNum * 4
+        total = sum(nodesNum)
+        values = struct.unpack_from("<{}h".format(total * 6), fileContent, offset)
+        offset += total * 12
+        if total:
+            maxh = max(maxh, max(values[1::6])/scale)
+
+        strokes = []
+        node = 0
+        for n in nodesNum:
+            strokes.append([(values[k * 6:k * 6 + 6], flagBytes[offset + k]) for k in range(node, node + n)])
+            node += n
+        glyphs.append((chr(chars[i]), strokes))
+
+    return glyphs, maxh + 2
+
+def loadPluginModule(name):
+    # hersheyflatten.py and hersheyprofile.py live with the plugin files, one directory up
+    pluginDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+    if pluginDir not in sys.path:
+        sys.path.insert(0, pluginDir)
+    return __import__(name)
+
+class NoProfile(object):
+    # stands in for a hersheyprofile.Profile when not profiling
+    def phase(self, name):
+        return self
+    def count(self, name, n=1):
+        pass
+    def __enter__(self):
+        pass
+    def __exit__(self, *exc):
+        pass
+
+def generateFont(fileContent, ttFont, cyr, tolerance=0, simplify=0, profile=None):
     previewCode = ""
     glyphs = {}   
-
-    glyphNo = getNumberOfGlyphs(fileContent)
-    baseline = computeBaseline(fileContent)
+    if profile == None:
+        profile = NoProfile()
+
+    with profile.phase('parse'):
+        glyphData, baseline = parseFont(fileContent)
+    with profile.phase('metrics'):
+        metricIndex = getMetricIndex(ttFont, cyr)
+    flattener = loadPluginModule('hersheyflatten') if tolerance else None
+    profile.count('glyphs', len(glyphData))
     
-    xx = 0
-    yy = 0
-    for i in range(glyphNo): 
-        xx = (i % 16) * 50 + 10
-        yy = int(i / 16) * 40 + 40
-        
-        ch = getChar(fileContent, i)
-        offset = getGlyphDefStart(fileContent, i)
-        
-        previewCode += "<g transform='translate({}, {})'>\n".format(xx, yy)
-    
-        sx = struct.unpack_from("<I", fileContent, offset)[0]
-        offset += 4
+    with profile.phase('glyphs'):
+        for i, (ch, strokes) in enumerate(glyphData): 
+            xx = (i % 16) * 50 + 10
+            yy = int(i / 16) * 40 + 40
         
-        strokesNum = struct.unpack_from("<I", fileContent, offset)[0]
-        offset += 4
-    
-        nodesNum = []
-        for j in range(strokesNum):
-            segments = struct.unpack_from("<I", fileContent, offset)[0]
-            offset += 4
-            nodesNum.append(segments)
-            
-        coords = []
-        for j in range(strokesNum):
-            for k in range(nodesNum[j]):
-                cx = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                cy = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                xx = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                xy = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                yx = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                yy = struct.unpack_from("<h", fileContent, offset)[0]
-                offset += 2
-                
-                crd = [cx, cy, xx, xy, yx, yy]
-                coords.append(crd)
+            previewCode += "<g transform='translate({}, {})'>\n".format(xx, yy)
     
-        count = 0 
-        maxw = 4
-        glyphCode = ""
-        for j in range(strokesNum):
-            previewCode += "\t<path d=\""
-            pathCode = ""
+            maxw = 4
+            glyphCode = ""
+            profile.count('strokes', len(strokes))
+            for nodes in strokes:
+                profile.count('nodes', len(nodes))
+                previewCode += "\t<path d=\""
+                pathCode = ""
             
-            countsav = count
-            flag = None
-            prevcrd = None
-            for k in range(nodesNum[j]):
-                flag = ord(fileContent[offset])
-                offset += 1
-                
-                crd = coords[count]
-                suff = ""
-                pref = " L"
+                flag = None
+                prevcrd = None
+                for k, (crd, flag) in enumerate(nodes):
+                    if k == 0:
+                        pathCode += " M{:.2f},{:.2f} ".format((crd[0])/scale, (crd[1])/scale + baseline)
+                    else:
+                        dx1 = prevcrd[0] + prevcrd[4]
+                        dy1 = prevcrd[1] + prevcrd[5]
+
+                        dx2 = crd[0] + crd[2]
+                        dy2 = crd[1] + crd[3]
+
+                        xx = crd[0]
+                        yy = crd[1]
+
+                        pathCode += " C{:.2f},{:.2f} {:.2f},{:.2f} {:.2f},{:.2f}".format(dx1/scale, dy1/scale + baseline, dx2/scale, dy2/scale + baseline, xx/scale, yy/scale + baseline)
+                    prevcrd = crd
+                    
+                    pathCode = pathCode.strip()
+                        
+                    maxw = max(maxw, crd[0]/scale) 
+        
                 if flag == 7 or flag == 3:
-                    suff = ""
-                if k == 0:
-                    pref = "M"
-                    pathCode += " M{:.2f},{:.2f} ".format((crd[0])/scale, (crd[1])/scale + baseline)
-                else:
+                    crd = nodes[0][0]
                     dx1 = prevcrd[0] + prevcrd[4]
                     dy1 = prevcrd[1] + prevcrd[5]
 
@@ -167,59 +164,56 @@ def generateFont(fileContent, ttFont, cyr):
                     xx = crd[0]
                     yy = crd[1]
 
-                    pathCode += " C{:.2f},{:.2f} {:.2f},{:.2f} {:.2f},{:.2f} {}".format(dx1/scale, dy1/scale + baseline, dx2/scale, dy2/scale + baseline, xx/scale, yy/scale + baseline, suff)
-                prevcrd = crd
-                    
-                pathCode = pathCode.strip()
-                        
-                maxw = max(maxw, crd[0]/scale) 
-                count += 1
-        
-            if flag == 7 or flag == 3:
-                crd = coords[countsav]
-                dx1 = prevcrd[0] + prevcrd[4]
-                dy1 = prevcrd[1] + prevcrd[5]
-
-                dx2 = crd[0] + crd[2]
-                dy2 = crd[1] + crd[3]
-
-                xx = crd[0]
-                yy = crd[1]
-
-                pathCode += " C{:.2f},{:.2f} {:.2f},{:.2f} {:.2f},{:.2f} Z".format(dx1/scale, dy1/scale + baseline, dx2/scale, dy2/scale + baseline, xx/scale, yy/scale + baseline)
+                    pathCode += " C{:.2f},{:.2f} {:.2f},{:.2f} {:.2f},{:.2f} Z".format(dx1/scale, dy1/scale + baseline, dx2/scale, dy2/scale + baseline, xx/scale, yy/scale + baseline)
             
-            glyphCode += pathCode
-            previewCode += pathCode
-            previewCode += "\" fill=\"none\" stroke=\"red\" stroke-width=\"1\"  />\n"
+                if flattener != None:
+                    # store the stroke as a polyline, so the renderer never flattens it
+                    with profile.phase('flatten'):
+                        pathCode = flattener.flatten_path(pathCode, tolerance, simplify)
+                glyphCode += pathCode
+                previewCode += pathCode
+                previewCode += "\" fill=\"none\" stroke=\"red\" stroke-width=\"1\"  />\n"
         
-        mtx = getMetric(ttFont, chr(ord(ch)), cyr)
-        ww = maxw
-        if mtx != None:
-            ww = mtx[0]/scale/1.5
-            
-        previewCode += "</g> <!-- {:.2f} vs. {:.2f} -->\n".format(maxw, ww)
-        glyphs[ord(ch)] = ("0 {:.2f} ".format(ww + charspacing) + glyphCode).strip()  
+            mtx = getMetric(ttFont, metricIndex, ch)
+            ww = maxw
+            if mtx != None:
+                ww = mtx[0]/scale/1.5
             
-        maxw = 4
+            previewCode += "</g> <!-- {:.2f} vs. {:.2f} -->\n".format(maxw, ww)
+            glyphs[ord(ch)] = ("0 {:.2f} ".format(ww + charspacing) + glyphCode).strip()  
         
     return previewCode, glyphs
 
-def getMetric( ttFont, ch, cyr ):
-    if ttFont == None or ord(ch) == 0x98:
-        return None
-    
-    if cyr:
-        ch = ch.decode('cp1251')
-    hmtx = ttFont['hmtx']
-    cmap = ttFont['cmap']
-    for table in cmap.tables:
+def getMetricIndex( ttFont, cyr ):
+    # .sf2 character code -> glyph name, built once per font: each cmap entry is
+    # visited once, and for Cyrillic fonts the cp1251 codes are translated here
+    index = {}
+    if ttFont == None:
+        return index
+    glyphNames = {}
+    for table in ttFont['cmap'].tables:
         if table.format in [4, 12, 13, 14]:
-            for key in table.cmap:
-                if key == ord(ch):
-                    mmx  = hmtx.metrics[table.cmap[key]]
-                    return mmx
-                
-    return None
+            for key, glyphName in table.cmap.items():
+                if key not in glyphNames:
+                    glyphNames[key] = glyphName
+    if cyr:
+        for code in range(256):
+            try:
+                codepoint = ord(bytearray([code]).decode('cp1251'))
+            except UnicodeDecodeError:
+                continue
+            if codepoint in glyphNames:
+                index[code] = glyphNames[codepoint]
+    else:
+        index = glyphNames
+    index.pop(0x98, None)
+    return index
+
+def getMetric( ttFont, metricIndex, ch ):
+    glyphName = metricIndex.get(ord(ch))
+    if glyphName == None:
+        return None
+    return ttFont['hmtx'].metrics[glyphName]
 
 dict = {
     192 : ord("A"),
@@ -306,41 +300,36 @@ def hexdump(src, length=16):
     return ''.join(lines)
 
 
-def main(args=None):
-    parser = argparse.ArgumentParser()
-    parser.add_argument("sf2", metavar="font.sf2")
-    parser.add_argument("ttf", metavar="font.ttf")
-    parser.add_argument("-c", "--cyrillic", dest="cyr", action="store_true", default=False)
-    options = parser.parse_args(args)
-
-    sfontFile = options.sf2
-    ttFile = options.ttf
-
-    with open(sfontFile, "rb") as file:
-        fileContent = file.read()
-    
-    ttFont = None
-    if ttFile != None:
-        from fontTools.ttLib import TTFont
-        ttFont = TTFont(ttFile)
+def convertFont(sfontFile, ttFile, cyr, tolerance=0, simplify=0, profile=None):
+    # Convert one .sf2 font, taking the glyph widths from the TrueType font ttFile
+    # (if not None). Returns the font name, the preview SVG and the Python code
+    # of the font lists, with the registry entries as comments. The time taken by
+    # each step and work counters are added to profile (a hersheyprofile.Profile).
+    if profile == None:
+        profile = NoProfile()
+    with profile.phase('read'):
+        with open(sfontFile, "rb") as file:
+            fileContent = file.read()
+        
+        ttFont = None
+        if ttFile != None:
+            from fontTools.ttLib import TTFont
+            ttFont = TTFont(ttFile)
     
     fontName = getFontName(fileContent)
-    previewCode, glyphs = generateFont(fileContent, ttFont, options.cyr)
+    previewCode, glyphs = generateFont(fileContent, ttFont, cyr, tolerance, simplify, profile)
     
-    result = '''<?xml version="1.0" standalone="no"?>
+    preview = '''<?xml version="1.0" standalone="no"?>
 <!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">
 <svg width="16cm" height="12cm" viewBox="0 0 820 620" xmlns="http://www.w3.org/2000/svg" version="1.1">
 <g transform='translate(20, 20)'>
   <rect x="0" y="0" width="800" height="600" fill="none" stroke="blue" stroke-width="1" />
 '''
-    result += previewCode
-    result += '''  
+    preview += previewCode
+    preview += '''  
 </g>
 </svg>
     '''
-    
-    with open("{}.svg".format(fontName), "w") as file:
-        file.write(result)
             
     result = "{} = [".format(fontName)
     count = 0
@@ -351,7 +340,7 @@ def main(args=None):
             break
     result += "]\n"
     
-    if options.cyr:
+    if cyr:
         result += "{}_cyr = [".format(fontName)
         count = 0
         for ch in glyphs:
@@ -365,17 +354,43 @@ def main(args=None):
     label = getFontLabel(fileContent)    
     
     result += "\n# <_item value=\"{}\">{}</_item>\n".format(fontName, label)
-    if options.cyr:
+    if cyr:
         result += "# <_item value=\"{}_cyr\">{} Cyrillic</_item>\n".format(fontName, label)
     result += "# ['{}','{}'],\n".format(fontName, label)
-    if options.cyr:
+    if cyr:
         result += "# ['{}_cyr','{} Cyrillic'],\n".format(fontName, label)
+    profile.count('output size', len(result))
+    
+    return fontName, preview, result
+
+def main(args=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sf2", metavar="font.sf2")
+    parser.add_argument("ttf", metavar="font.ttf")
+    parser.add_argument("-c", "--cyrillic", dest="cyr", action="store_true", default=False)
+    parser.add_argument("--flatten", metavar="TOLERANCE", type=float, default=0,
+                        help="store curves as polylines within this chord tolerance")
+    parser.add_argument("--simplify", metavar="TOLERANCE", type=float, default=0,
+                        help="simplify the polylines (Douglas-Peucker) with this tolerance")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="write the time taken by each step and work counters to this JSON file")
+    options = parser.parse_args(args)
+    if options.simplify and not options.flatten:
+        parser.error("--simplify needs --flatten")
+
+    profile = loadPluginModule('hersheyprofile').Profile() if options.profile else None
+    fontName, preview, result = convertFont(options.sf2, options.ttf, options.cyr, options.flatten, options.simplify, profile)
+    if profile != None:
+        profile.write(options.profile)
+    
+    with open("{}.svg".format(fontName), "w") as file:
+        file.write(preview)
     
     with open("{}.py".format(fontName), "w") as file:
-        fileContent = file.write(result)
+        file.write(result)
         
-    print result
-    print "generated font size: {}".format(len(result))
+    print(result)
+    print("generated font size: {}".format(len(result)))
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -4,6 +4,11 @@ prepare_font.py
 
 TTF font converter for SFEdit2 compatibility. Converts OTF to TTF (if needed) and moves cyrillic glyphs to editable positions
 
+Glyphs that SFEdit2 and the Hershey Text plugin cannot use (all but ASCII and
+cp1251 by default, see --unicodes) are dropped before the conversion, so big
+pan-Unicode fonts convert quickly and give small TTF files. Fonts with many
+glyphs (CJK, icons) can be converted by several processes at once (-w).
+
 Version 1.0.0, dated May 02, 2017.
 
 Based on fontTools library sample 
@@ -14,8 +19,11 @@ Extended by Igor Repinetski, http://pixelmeister.org
 '''
 
 #from __future__ import print_function, division, absolute_import
+import io
+import multiprocessing
 import sys
 from fontTools.ttLib import TTFont, newTable
+from fontTools import subset
 from cu2qu.pens import Cu2QuPen
 from fontTools.pens.ttGlyphPen import TTGlyphPen
 from fontTools.ttx import makeOutputFileName
@@ -31,11 +39,39 @@ POST_FORMAT = 2.0
 # we just flip it to clockwise
 REVERSE_DIRECTION = True
 
+# cp1251 code -> Unicode code point of the Cyrillic letter moved there for -c
+CYRILLIC_REMAP = dict([(key - 0x350, key) for key in range(0x410, 0x450)] + [(0xA8, 0x401), (0xB8, 0x451)])
+
+
+def default_unicodes():
+    # ASCII and the characters of cp1251, the code page SFEdit2 and the plugin work with
+    unicodes = set(range(0x80))
+    for code in range(0x80, 0x100):
+        try:
+            unicodes.add(ord(bytearray([code]).decode('cp1251')))
+        except UnicodeDecodeError:
+            pass
+    return unicodes
+
+
+def subset_glyphs(ttFont, unicodes):
+    # drop the glyphs not needed for the unicodes (and the tables entries using them),
+    # keeping names, layout features and .notdef as they are
+    options = subset.Options()
+    options.glyph_names = True
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.layout_features = ['*']
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(ttFont)
+
 
 def glyphs_to_quadratic(
-        glyphs, max_err=MAX_ERR, reverse_direction=REVERSE_DIRECTION):
+        glyphs, max_err=MAX_ERR, reverse_direction=REVERSE_DIRECTION, names=None):
     quadGlyphs = {}
-    for gname in glyphs.keys():
+    for gname in (glyphs.keys() if names == None else names):
         glyph = glyphs[gname]
         ttPen = TTGlyphPen(glyphs)
         cu2quPen = Cu2QuPen(ttPen, max_err,
@@ -45,7 +81,47 @@ def glyphs_to_quadratic(
     return quadGlyphs
 
 
-def otf_to_ttf(ttFont, post_format=POST_FORMAT, **kwargs):
+_glyphSet = None   # glyph set of the font being converted, in worker processes
+
+
+def init_worker(fontFile, fontData):
+    global _glyphSet
+    _glyphSet = TTFont(fontFile or io.BytesIO(fontData)).getGlyphSet()
+
+
+def convert_shard(job):
+    names, max_err, reverse_direction = job
+    quadGlyphs = glyphs_to_quadratic(_glyphSet, max_err, reverse_direction, names)
+    return [(gname, quadGlyphs[gname]) for gname in names]
+
+
+def glyphs_to_quadratic_parallel(
+        ttFont, workers, max_err=MAX_ERR, reverse_direction=REVERSE_DIRECTION, fontFile=None):
+    # same as glyphs_to_quadratic(ttFont.getGlyphSet()), with the glyph order cut into
+    # shards that a pool of processes converts, each with its own copy of the font:
+    # read from fontFile if ttFont is unchanged from it, otherwise saved for them
+    # (which compiles the CFF table again, slow for big fonts)
+    fontData = None
+    if fontFile == None:
+        data = io.BytesIO()
+        ttFont.save(data)
+        fontData = data.getvalue()
+    names = ttFont.getGlyphOrder()
+    size = max(1, -(-len(names) // (workers * 4)))
+    shards = [(names[i:i + size], max_err, reverse_direction) for i in range(0, len(names), size)]
+    pool = multiprocessing.Pool(workers, init_worker, (fontFile, fontData))
+    try:
+        results = pool.map(convert_shard, shards, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    quadGlyphs = {}
+    for shard in results:
+        quadGlyphs.update(shard)
+    return quadGlyphs
+
+
+def otf_to_ttf(ttFont, post_format=POST_FORMAT, workers=1, fontFile=None, **kwargs):
     if ttFont.sfntVersion != "OTTO":
         return
     
@@ -53,11 +129,15 @@ def otf_to_ttf(ttFont, post_format=POST_FORMAT, **kwargs):
     assert "CFF " in ttFont
 
     glyphOrder = ttFont.getGlyphOrder()
+    if workers > 1:
+        quadGlyphs = glyphs_to_quadratic_parallel(ttFont, workers, fontFile=fontFile, **kwargs)
+    else:
+        quadGlyphs = glyphs_to_quadratic(ttFont.getGlyphSet(), **kwargs)
 
     ttFont["loca"] = newTable("loca")
     ttFont["glyf"] = glyf = newTable("glyf")
     glyf.glyphOrder = glyphOrder
-    glyf.glyphs = glyphs_to_quadratic(ttFont.getGlyphSet(), **kwargs)
+    glyf.glyphs = quadGlyphs
     del ttFont["CFF "]
 
     ttFont["maxp"] = maxp = newTable("maxp")
@@ -90,14 +170,24 @@ def main(args=None):
     parser.add_argument("-e", "--max-error", type=float, default=MAX_ERR)
     parser.add_argument("--post-format", type=float, default=POST_FORMAT)
     parser.add_argument("--keep-direction", dest='reverse_direction', action='store_false')
+    parser.add_argument("-u", "--unicodes", default=None,
+                        help="characters to keep, as for pyftsubset (e.g. U+0020-007E,U+0410-044F), "
+                             "'*' for all; default ASCII and cp1251")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of processes converting the glyphs (0 = one per CPU)")
     options = parser.parse_args(args)
 
     output = options.output or makeOutputFileName(options.input,
                                                   outputDir=None,
                                                   extension='.ttf')
     font = TTFont(options.input)
+    if options.unicodes != '*':
+        unicodes = default_unicodes() if options.unicodes == None else subset.parse_unicodes(options.unicodes)
+        subset_glyphs(font, unicodes)
     otf_to_ttf(font,
                post_format=options.post_format,
+               workers=options.workers or multiprocessing.cpu_count(),
+               fontFile=options.input if options.unicodes == '*' else None,
                max_err=options.max_error,
                reverse_direction=options.reverse_direction)
     
@@ -105,13 +195,9 @@ def main(args=None):
         cmap = font['cmap']
         for table in cmap.tables:
             if table.format in [4, 12, 13, 14]:
-                for key in table.cmap:
-                    if (key >= 0x410 and key <= 0x44F):
-                        table.cmap[key - 0x350] = table.cmap[key] 
-                    if key == 0x401:
-                        table.cmap[0xA8] = table.cmap[key]
-                    if key == 0x451:
-                        table.cmap[0xB8] = table.cmap[key]
+                for code, key in CYRILLIC_REMAP.items():
+                    if key in table.cmap:
+                        table.cmap[code] = table.cmap[key]
 
     font.save(output)
 
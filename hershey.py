@@ -23,89 +23,35 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
-import hersheydata          #data file w/ Hershey font data
+import hashlib
+import json
+import hersheyengine        #text layout and glyph emission
+import hersheyvector        #absolute coordinates, with NumPy
+import hersheyprofile       #phase timing for --profile
 import inkex
 import simplestyle
 from simpletransform import computePointInNode
+from hersheyengine import STYLE
+from hersheyunicode import decode_text, fallback_chain    #UTF-8 input, with cp1251 as fallback
+from hersheyengine import text_width, text_widths    #memoized text widths, with hit/miss counters
+from hersheyengine import split_lines
 
-Debug = False
-FONT_GROUP_V_SPACING = 45
-
-spacing = 3  # spacing between letters
+__all__ = ['Hershey', 'text_width', 'text_widths']    #text_width(s) stay importable from here
 
-font_cyr = ""
-
-dict = {
-    192 : ord("A"),
-    193 : ord("B"),
-    194 : ord("V"),
-    195 : ord("G"),
-    196 : ord("D"),
-    197 : ord("["),
-    198 : ord("H"),
-    199 : ord("Z"),
-    200 : ord("I"),
-    201 : ord("E"),
-    202 : ord("K"),
-    203 : ord("L"),
-    204 : ord("M"),
-    205 : ord("N"),
-    206 : ord("O"),
-    207 : ord("P"),
-    208 : ord("R"),
-    209 : ord("S"),
-    210 : ord("T"),
-    211 : ord("Y"),
-    212 : ord("F"),
-    213 : ord("X"), # Х
-    214 : ord("`"),
-    215 : ord("J"),
-    216 : ord("Q"),
-    217 : ord("W"),
-    218 : ord("]"), # Ь
-    219 : ord("$"),
-    220 : ord("_"),
-    221 : ord("C"),
-    222 : ord("U"),
-    223 : ord("^"), # Я
-    224 : ord("a"),
-    225 : ord("b"),
-    226 : ord("v"),
-    227 : ord("g"),
-    228 : ord("d"),
-    229 : ord("{"),
-    230 : ord("h"),
-    231 : ord("z"),
-    232 : ord("i"),
-    233 : ord("e"),
-    234 : ord("k"),
-    235 : ord("l"),
-    236 : ord("m"),
-    237 : ord("n"),
-    238 : ord("o"),
-    239 : ord("p"),
-    240 : ord("r"),
-    241 : ord("s"),
-    242 : ord("t"),
-    243 : ord("y"),
-    244 : ord("f"),
-    245 : ord("x"),
-    246 : ord("%"), # ц
-    247 : ord("j"),
-    248 : ord("q"),
-    249 : ord("w"),
-    250 : ord("|"),
-    251 : ord("&"),
-    252 : ord("~"),
-    253 : ord("c"),
-    254 : ord("u"),
-    255 : ord("}"),
-}
+Debug = False
 
+# Rendered text groups keep their layout inputs as data-hershey-<option> attributes,
+# and a hash and the element count of each line in data-hershey-lines, for --action update
+INPUTS = ('fontface', 'fontface_cyr', 'fallback', 'boxwidth', 'layout', 'align', 'merge',
+          'optimize', 'reverse', 'coordinates', 'rotate', 'flatten', 'simplify')
+LINES = 'data-hershey-lines'
+TEXT = 'data-hershey-text'    #the text as a JSON string, which keeps control characters out of the XML
+PLACEMENT = 'data-hershey-placement'    #view center and text center of absolute coordinates
 
-def convert_cyrillic( c ):
-    return dict.get( c, ord("*") );
-    # inkex.debug(dict.get( c + 32, ord("*") ) - 32)
+def line_hash( records ):
+    """Short hash of the output records (d, x, y) of one line: its content and position."""
+    data = u''.join(u'%s %s %s\n' % record for record in records)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:16]
 
 class Hershey( inkex.Effect ):
     def __init__( self ):
@@ -121,188 +67,257 @@ class Hershey( inkex.Effect ):
         self.OptionParser.add_option( "--action",
             action="store", type="string",
             dest="action", default="render",
-            help="The active option when Apply was pressed" )
+            help="render, sample, table, or update: re-render the selected Hershey Text group, replacing only the lines that changed" )
         self.OptionParser.add_option( "--fontface",
             action="store", type="string",
-            dest="fontface", default="rowmans",
+            dest="fontface", default="futural",
             help="The selected font face when Apply was pressed" )
         self.OptionParser.add_option( "--fontface_cyr",
             action="store", type="string",
             dest="fontface_cyr", default="cyrillic",
             help="The selected font face when Apply was pressed" )
+        self.OptionParser.add_option( "--fallback",
+            action="store", type="string",
+            dest="fallback", default="",
+            help="Fonts to take glyphs from that the selected fonts lack, separated by commas" )
         self.OptionParser.add_option( "--boxwidth",
             action="store", type="string",
             dest="boxwidth", default="500",
             help="Prferrable max text width before line break" )
+        self.OptionParser.add_option( "--layout",
+            action="store", type="string",
+            dest="layout", default="greedy",
+            help="Line breaking: greedy (fill each line) or optimal (balance the lines of a paragraph)" )
+        self.OptionParser.add_option( "--align",
+            action="store", type="string",
+            dest="align", default="left",
+            help="Text alignment: left, center, right or justify" )
+        self.OptionParser.add_option( "--merge",
+            action="store", type="string",
+            dest="merge", default="glyph",
+            help="Output one path per glyph, per line or for the whole block, or glyph definitions reused with <use>" )
+        self.OptionParser.add_option( "--optimize",
+            action="store", type="inkbool",
+            dest="optimize", default=False,
+            help="Reorder strokes to minimise pen-up travel" )
+        self.OptionParser.add_option( "--reverse",
+            action="store", type="inkbool",
+            dest="reverse", default=True,
+            help="Allow strokes to be drawn backwards when optimising pen travel" )
+        self.OptionParser.add_option( "--coordinates",
+            action="store", type="string",
+            dest="coordinates", default="relative",
+            help="relative: place glyphs and group with transforms, absolute: bake them into the path data (needs NumPy)" )
+        self.OptionParser.add_option( "--rotate",
+            action="store", type="float",
+            dest="rotate", default=0.0,
+            help="Rotate the text about its center, in degrees" )
+        self.OptionParser.add_option( "--flatten",
+            action="store", type="float",
+            dest="flatten", default=0.0,
+            help="Draw curves as polylines within this chord tolerance (0 = keep curves)" )
+        self.OptionParser.add_option( "--simplify",
+            action="store", type="float",
+            dest="simplify", default=0.0,
+            help="Drop polyline points within this distance of their neighbours' line (0 = keep all)" )
+        self.OptionParser.add_option( "--profile",
+            action="store", type="string",
+            dest="profile", default="",
+            help="Write the time taken by each phase and work counters to this JSON file" )
 
-    def draw_svg_text(self, char, face, offset, vertoffset, parent):
-        style = { 'stroke': '#000000', 'fill': 'none' }
-        if char > 127: #  face == hersheydata.cyrillic:
-            char = convert_cyrillic(char)
-            if char > 127: #  face == hersheydata.cyrillic:
-                return offset + 2 * spacing
-            else:
-                f = eval('hersheydata.' + str(self.options.fontface_cyr))
-                pathString = f[char - 32]
-        else:       
-            pathString = face[char - 32]
-
-        splitString = pathString.split()  
-        midpoint = offset - float(splitString[0]) 
-        splitpoint = pathString.find("M")
-        # Space glyphs have just widths with no moves, so their splitpoint is 0
-        # We only want to generate paths for visible glyphs where splitpoint > 0
-        if splitpoint > 0:
-            pathString = pathString[splitpoint:] #portion after first move
-            trans = 'translate(' + str(midpoint) + ',' + str(vertoffset) + ')'
-            text_attribs = {'style':simplestyle.formatStyle(style), 'd':pathString, 'transform':trans}
-            inkex.etree.SubElement(parent, inkex.addNS('path','svg'), text_attribs) 
-
-        return midpoint + float(splitString[1])   #new offset value
-
-    def svg_char_width(self, char, face, offset):
-        if char > 127: 
-            char = convert_cyrillic(char)
-            if char > 127: 
-                return offset + 2 * spacing
-            else:
-                f = eval('hersheydata.' + str(self.options.fontface_cyr))
-                pathString = f[char - 32]
-        else:       
-            pathString = face[char - 32]
-
-        splitString = pathString.split()  
-        midpoint = offset - float(splitString[0])
-        return midpoint + float(splitString[1]) 
-
-    def svg_text_width(char, face, offset):
-        pathString = face[char - 32]
-        splitString = pathString.split()  
-        midpoint = offset - float(splitString[0])
-        return midpoint + float(splitString[1]) #new offset value
-        
     def effect( self ):
-
-        OutputGenerated = False
-
-        # Embed text in group to make manipulation easier:
-        g_attribs = {inkex.addNS('label','inkscape'):'Hershey Text' }
-        g = inkex.etree.SubElement(self.current_layer, 'g', g_attribs)
+        profile = hersheyprofile.Profile() if self.options.profile else hersheyprofile.OFF
+        update = self.options.action == 'update'
+        if update:
+            g = self.selected_text_group()
+            if g is None:
+                inkex.errormsg('To update a text, select a Hershey Text group rendered with this version of the extension.')
+                return
+        text = decode_text(self.options.text)
+        if update and self.stored_text(g) == text and self.same_inputs(g, INPUTS):
+            return    # nothing to do
+
+        # Resolve the selected faces once; the per-character code uses them directly
+        try:
+            with profile.phase('fonts'):
+                engine = hersheyengine.HersheyEngine(
+                    fontface=str(self.options.fontface), fontface_cyr=str(self.options.fontface_cyr),
+                    boxwidth=self.options.boxwidth, layout=self.options.layout, align=self.options.align,
+                    merge=self.options.merge, optimize=self.options.optimize, reverse=self.options.reverse,
+                    fallback=fallback_chain(self.options.fallback),
+                    flatten=self.options.flatten, simplify=self.options.simplify, profile=profile)
+        except ValueError as e:
+            inkex.errormsg(str(e))
+            return
 
         scale = self.unittouu('1px')    # convert to document units
-        font = eval('hersheydata.' + str(self.options.fontface))
-        clearfont = hersheydata.futural  
-        #Baseline: modernized roman simplex from JHF distribution.
-        
-        w = 0  #Initial spacing offset
-        v = 0  #Initial vertical offset
-
-        text = self.options.text
-
-        if self.options.action == "render":
-            #evaluate text string
-            letterVals = [ord(q) for q in text] 
-            i = 0
-            for q in letterVals:
-                if q == 10:
-                    v += FONT_GROUP_V_SPACING
-                    w = 0
-                elif (q <= 32): 
-                    w += 2 * spacing
-                else:
-                    w = self.draw_svg_text(q, font, w, v, g)
-                    OutputGenerated = True
-
-                if (q == 32 or q == 7) and (int(self.options.boxwidth) > 0):
-                    tokenw = 0
-                    for j in range(len(letterVals) - i - 1): 
-                        ch = letterVals[j + i + 1]
-                        if (ch == 32 or ch == 7):
-                            break
-                        tokenw = self.svg_char_width(ch, font, tokenw)
-                        if (w > 0) and ((tokenw + w) > int(self.options.boxwidth)):
-                            v += FONT_GROUP_V_SPACING
-                            w = 0
-                            break
-                i += 1
-
-        elif self.options.action == 'sample':
-            w,v = self.render_table_of_all_fonts( 'group_allfonts', g, spacing, clearfont )
-            OutputGenerated = True
+        action = 'render' if update else self.options.action
+        with profile.phase('render'):
+            paths, w, v = engine.run(action, text)
+        if self.options.action == 'sample':
             scale *= 0.4	#Typically scales to about A4/US Letter size
-        else:
-            #Generate glyph table
-            wmax = 0;
-            for p in range(0,10):
-                w = 0
-                v = spacing * (15*p - 67 )
-                for q in range(0,10):
-                    r = p*10 + q 
-                    if (r <= 32) or (r > 127):
-                        w += 5*spacing
-                    else:
-                        w = self.draw_svg_text(r, clearfont, w, v, g)
-                        w = self.draw_svg_text(r, font, w, v, g)
-                        w += 5 * spacing
-                if w > wmax:
-                    wmax = w
-            w = wmax
-            OutputGenerated = True            
-        #  Translate group to center of view, approximately
-        view_center = computePointInNode(list(self.view_center), self.current_layer)
-        t = 'translate(' + str( view_center[0] - scale*w/2) + ',' + str( view_center[1] - scale*v/2 ) + ')'
-        if scale != 1:
-            t += ' scale(' + str(scale) + ')'
-        g.set( 'transform',t)
-
-#        inkex.debug(self.options.boxwidth)
-#        inkex.debug(w)
 
-        if not OutputGenerated:
-            self.current_layer.remove(g)    #remove empty group, if no SVG was generated.
-
-    def render_table_of_all_fonts( self, fontgroupname, parent, spacing, clearfont ):
-        v = 0
-        wmax = 0
-        wmin = 0
-        fontgroup = eval( 'hersheydata.' + fontgroupname )
-        
-        # Render list of font names in a vertical column:
-        nFontIndex = 0
-        for f in fontgroup:
-            w = 0
-            letterVals = [ord(q) for q in (f[1] + ' -> ')]
-            # we want to right-justify the clear text, so need to know its width
-            for q in letterVals:
-                w = self.svg_text_width(q, clearfont, w)
-                
-            w = -w  # move the name text left by its width
-            if w < wmin:
-                wmin = w
-            # print the font name
-            for q in letterVals:
-                w = self.draw_svg_text(q, clearfont, w, v, parent)
-            v += FONT_GROUP_V_SPACING
-            if w > wmax:
-                wmax = w
-            
-        # Next, we render a second column. The user's text, in each of the different fonts:
-        v = 0                   # back to top line
-        wmaxname = wmax + 8     # single space width
-        for f in fontgroup:
-            w = wmaxname
-            font = eval('hersheydata.' + f[0])
-            #evaluate text string
-            letterVals = [ord(q) - 32 for q in self.options.text] 
-            for q in letterVals:
-                if (q <= 32) or (q > 127):
-                    w += 2*spacing
-                else:
-                    w = self.draw_svg_text(q, font, w, v, parent)
-            v += FONT_GROUP_V_SPACING
-            if w > wmax:
-                wmax = w
-        return wmax + wmin, v
+        if engine.travel is not None:
+            inkex.errormsg('Pen-up travel: {:.1f} before, {:.1f} after optimisation'.format(*engine.travel))
+
+        style = simplestyle.formatStyle(STYLE)
+        absolute = self.options.coordinates == 'absolute'
+        # an updated group stays where it is, unless it is placed differently now
+        keep_place = update and self.same_inputs(g, ('coordinates', 'rotate'))
+        with profile.phase('center'):
+            view_center = computePointInNode(list(self.view_center), self.current_layer)
+        placement = list(view_center) + [w/2.0, v/2.0]
+        if keep_place and absolute and g.get(PLACEMENT):
+            # same pivot as before, so that the lines that did not change stay in place
+            placement = [float(c) for c in g.get(PLACEMENT).split(',')]
+        lines = split_lines(paths)
+        if absolute:
+            # glyph offsets, scale, rotation and placement all go into the coordinates
+            try:
+                with profile.phase('place'):
+                    placed = iter(engine.place(paths, hersheyvector.affine(scale, self.options.rotate,
+                        *placement)))
+            except ImportError as e:
+                inkex.errormsg(str(e))
+                return
+            lines = [[next(placed) for record in line] for line in lines]
+
+        if not update:
+            # Embed text in group to make manipulation easier:
+            g_attribs = {inkex.addNS('label','inkscape'):'Hershey Text' }
+            g = inkex.etree.SubElement(self.current_layer, 'g', g_attribs)
+        use = bool(engine.symbols)
+        with profile.phase('elements'):
+            if use:
+                # each distinct glyph is defined once, the text references the definitions
+                profile.count('glyph definitions', len(engine.symbols))
+                self.define_glyphs(engine.symbols)
+            if update:
+                self.update_lines(g, lines, style, use, profile)
+            else:
+                for line in lines:
+                    for record in line:
+                        g.append(self.output_element(record, style, use))
+        profile.count('elements', len(g))
+        if action == 'render':
+            for name in INPUTS:
+                g.set('data-hershey-' + name, str(getattr(self.options, name)))
+            g.set(TEXT, json.dumps(text))
+            g.set(LINES, ' '.join('%s:%d' % (line_hash(line), len(line)) for line in lines))
+            if absolute:
+                g.set(PLACEMENT, '%s,%s,%s,%s' % tuple(placement))
+            elif update:
+                g.attrib.pop(PLACEMENT, None)
+        if self.options.merge != 'glyph' or self.options.optimize or absolute:
+            # merged paths and glyph references carry no style of their own, the group does
+            g.set('style', style)
+        elif update:
+            g.attrib.pop('style', None)
+
+        #  Translate group to center of view, approximately (absolute coordinates are already there)
+        if keep_place:
+            pass
+        elif absolute:
+            g.attrib.pop('transform', None)
+        elif self.options.rotate:
+            t = 'translate(' + str(view_center[0]) + ',' + str(view_center[1]) + ')'
+            t += ' rotate(' + str(self.options.rotate) + ')'
+            if scale != 1:
+                t += ' scale(' + str(scale) + ')'
+            t += ' translate(' + str(-w/2.0) + ',' + str(-v/2.0) + ')'
+            g.set( 'transform',t)
+        else:
+            t = 'translate(' + str( view_center[0] - scale*w/2) + ',' + str( view_center[1] - scale*v/2 ) + ')'
+            if scale != 1:
+                t += ' scale(' + str(scale) + ')'
+            g.set( 'transform',t)
+
+        if len(g) == 0:
+            g.getparent().remove(g)    #remove empty group, if no SVG was generated.
+
+        if self.options.profile:
+            try:
+                profile.write(self.options.profile)
+            except (IOError, OSError) as e:
+                inkex.errormsg('Cannot write the profile: ' + str(e))
+
+    def output_element( self, record, style, use ):
+        """The SVG element for an output record (d, x, y) of the engine, or a <use> of glyph d."""
+        d, x, y = record
+        if use:
+            return inkex.etree.Element(inkex.addNS('use','svg'),
+                {inkex.addNS('href','xlink'): '#' + d, 'x': str(x), 'y': str(y)})
+        if x is None:
+            return inkex.etree.Element(inkex.addNS('path','svg'), {'d': d})
+        trans = 'translate(' + str(x) + ',' + str(y) + ')'
+        text_attribs = {'style':style, 'd':d, 'transform':trans}
+        return inkex.etree.Element(inkex.addNS('path','svg'), text_attribs)
+
+    def selected_text_group( self ):
+        """The selected Hershey Text group, or the one holding a selected element; None if there is none."""
+        selected = list(self.selected.values())
+        for node in selected:
+            if node.get(LINES) is not None:
+                return node
+        for group in self.document.getroot().iter():
+            if group.get(LINES) is not None and any(node in selected for node in group):
+                return group
+        return None
+
+    def stored_text( self, g ):
+        """The text a group was rendered from, or None if it is not recorded."""
+        try:
+            return json.loads(g.get(TEXT))
+        except (TypeError, ValueError):
+            return None
+
+    def same_inputs( self, g, names ):
+        """Whether the group was rendered with the current values of the named options."""
+        return all(g.get('data-hershey-' + name) == str(getattr(self.options, name)) for name in names)
+
+    def update_lines( self, g, lines, style, use, profile ):
+        """
+        Bring the elements of a rendered group up to date with the output lines of a new
+        run: the elements of lines whose hash (content and position) is unchanged stay
+        as they are, the others are replaced. The group's children are taken to be the
+        lines of data-hershey-lines; if they do not add up, all of them are replaced.
+        """
+        old = []
+        for entry in g.get(LINES).split():
+            h, count = entry.split(':')
+            old.append( (h, int(count)) )
+        if sum([count for h, count in old]) != len(g):
+            old = []
+            for node in list(g):
+                g.remove(node)
+        index = 0
+        for i, line in enumerate(lines):
+            h = line_hash(line)
+            if i < len(old):
+                if old[i][0] == h:
+                    index += old[i][1]
+                    profile.count('lines kept')
+                    continue
+                for node in list(g[index:index + old[i][1]]):
+                    g.remove(node)
+            for record in line:
+                g.insert(index, self.output_element(record, style, use))
+                index += 1
+            profile.count('lines replaced')
+        for node in list(g[index:]):
+            g.remove(node)
+
+    def define_glyphs( self, symbols ):
+        """Add the glyph definitions (id -> path data) to the document's <defs>, unless already there."""
+        svg = self.document.getroot()
+        defs = svg.find(inkex.addNS('defs','svg'))
+        if defs is None:
+            defs = inkex.etree.Element(inkex.addNS('defs','svg'))
+            svg.insert(0, defs)
+        defined = set(node.get('id') for node in defs)
+        for symbol, d in symbols.items():
+            if symbol not in defined:
+                inkex.etree.SubElement(defs, inkex.addNS('path','svg'), {'id': symbol, 'd': d})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+'''
+hersheybatch.py
+
+Renders Hershey Text to standalone SVG files from the command line,
+without Inkscape. All texts of a run share one engine, so the fonts are
+loaded once however many texts are rendered.
+
+    python hersheybatch.py -f EMSReadability -b 500 -t "Label 1" -t "Label 2" notes.txt
+
+Each --text, and each line of a --labels file, is written to
+label-NNNN.svg and each text file to <name>.svg, in the output directory
+(-o, current directory by default). Text files are read as UTF-8, or as
+cp1251 if they are not valid UTF-8, like the plugin's text field.
+
+Large label sets can be given as a job list (--jobs), a CSV file with a
+header or a JSON lines file, with the fields text, font, boxwidth and
+optionally name (the output file name); missing fields fall back to the
+command line settings. With --workers, jobs are spread over a process
+pool. The fonts are loaded before the pool starts, so forked workers
+inherit them instead of loading their own copies. Output files depend
+only on their job and are reported in job order.
+
+Texts too large to hold in memory can be streamed with --stream FILE
+(or - for standard input): the text is read in blocks and every line is
+written out as soon as it is laid out. Streaming uses the greedy layout
+with left alignment; the result goes to <name>.svg, or to standard
+output when reading standard input.
+
+With --absolute the glyph offsets are baked into the path data, so the
+document has plain paths without transforms (needs NumPy).
+'''
+
+import argparse
+import codecs
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import hersheyengine
+import hersheyfonts
+import hersheyvector
+from hersheyunicode import decode_text, fallback_chain
+from hersheyengine import FONT_GROUP_V_SPACING, STYLE, spacing
+
+
+def read_text( path ):
+    """Read a text file (UTF-8 or cp1251), without its trailing line break."""
+    with open(path, 'rb') as f:
+        text = decode_text(f.read())
+    return text.replace('\r\n', '\n').rstrip('\n')
+
+
+def read_jobs( path ):
+    """Read a job list (CSV with a header, or JSON lines if the file name ends with .jsonl) as a list of dicts."""
+    with open(path, 'rb') as f:
+        data = f.read().decode('utf-8')
+    if path.endswith('.jsonl'):
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+    if sys.version_info[0] < 3:
+        rows = csv.DictReader(io.BytesIO(data.encode('utf-8')))
+        return [dict((k.decode('utf-8'), v.decode('utf-8')) for k, v in row.items() if v is not None)
+                for row in rows]
+    return list(csv.DictReader(io.StringIO(data)))
+
+
+SVG_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" version="1.1"'
+SVG_OPEN_XLINK = '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" version="1.1"'
+
+_fragments = {}   # glyph path data -> start of its <path> element, up to the translation
+
+
+def svg_elements( paths, symbols=None ):
+    """
+    SVG elements for paths of an engine run, one per line. With symbols (merge 'use'),
+    the paths are references to glyph definitions, see svg_defs().
+    """
+    num = hersheyfonts.format_number
+    lines = []
+    for d, x, y in paths:
+        if symbols is not None:
+            lines.append('<use xlink:href="#{}" x="{}" y="{}"/>\n'.format(d, num(x), num(y)))
+        elif x is None:
+            lines.append('<path d="{}"/>\n'.format(d))
+        else:
+            fragment = _fragments.get(d)
+            if fragment is None:
+                fragment = _fragments[d] = '<path d="{}" transform="translate('.format(d)
+            lines.append('{}{},{})"/>\n'.format(fragment, num(x), num(y)))
+    return ''.join(lines)
+
+
+def svg_defs( symbols ):
+    """<defs> element defining each glyph used by a run in merge 'use' mode once."""
+    lines = ['<defs>\n']
+    for symbol, d in symbols.items():
+        lines.append('<path id="{}" d="{}"/>\n'.format(symbol, d))
+    lines.append('</defs>\n')
+    return ''.join(lines)
+
+
+def svg_document( paths, w, v, symbols=None ):
+    """Standalone SVG document for the paths of one engine run, framed around the text."""
+    style = ';'.join('{}:{}'.format(k, STYLE[k]) for k in sorted(STYLE))
+    return ''.join([
+        '<?xml version="1.0" standalone="no"?>\n',
+        '{} {}>\n'.format(SVG_OPEN if symbols is None else SVG_OPEN_XLINK, svg_size(w, v)),
+        svg_defs(symbols) if symbols is not None else '',
+        '<g style="{}">\n'.format(style),
+        svg_elements(paths, symbols),
+        '</g>\n</svg>\n'])
+
+
+SIZE_FIELD = 100   # room left in the <svg> tag of a streamed document for its size
+
+
+def svg_size( w, v ):
+    """width, height and viewBox attributes that frame a text of width w and last line offset v."""
+    x0 = -2 * spacing
+    y0 = -FONT_GROUP_V_SPACING / 2.0
+    width = w + 4 * spacing
+    height = v + FONT_GROUP_V_SPACING
+    num = hersheyfonts.format_number
+    return 'width="{}" height="{}" viewBox="{} {} {} {}"'.format(
+        num(width), num(height), num(x0), num(y0), num(width), num(height))
+
+
+def stream_document( engine, chunks, out ):
+    """
+    Write the text read from chunks as an SVG document to the file object out, line by
+    line. The size of the document is known only at the end; it is filled into
+    the <svg> tag if out can seek, otherwise the document is left without one.
+    """
+    style = ';'.join('{}:{}'.format(k, STYLE[k]) for k in sorted(STYLE))
+    use = engine.merge == 'use'
+    out.write('<?xml version="1.0" standalone="no"?>\n' + (SVG_OPEN_XLINK if use else SVG_OPEN))
+    try:
+        sizeAt = out.tell()
+    except (AttributeError, IOError, OSError):
+        sizeAt = None
+    out.write(' ' * SIZE_FIELD + '>\n<g style="{}">\n'.format(style))
+    for paths in engine.stream_text(chunks):
+        out.write(svg_elements(paths, engine.symbols if use else None))
+    out.write('</g>\n')
+    if use:
+        # references may come before the definitions; the glyphs used are known only now
+        out.write(svg_defs(engine.symbols))
+    out.write('</svg>\n')
+    if sizeAt is not None:
+        size = ' ' + svg_size(*engine.extent)
+        if len(size) <= SIZE_FIELD:
+            end = out.tell()
+            out.seek(sizeAt)
+            out.write(size)
+            out.seek(end)
+    return engine.extent
+
+
+def read_chunks( f, size=65536 ):
+    """
+    Read a binary file in blocks as text, like read_text(): it is decoded as UTF-8
+    until a block turns out not to be, from there on as cp1251. Line breaks are made
+    plain and trailing line breaks of the file are dropped.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    carry = u''
+    while True:
+        block = f.read(size)
+        if not block:
+            break
+        try:
+            decoded = decoder.decode(block)
+        except UnicodeDecodeError:
+            pending = decoder.getstate()[0]
+            decoder = codecs.getincrementaldecoder('cp1251')('replace')
+            decoded = decoder.decode(pending + block)
+        text = carry + decoded
+        # hold back line breaks at the end of the block until more text follows
+        body = text.rstrip('\r\n')
+        carry = text[len(body):]
+        if body:
+            yield body.replace('\r\n', '\n')
+
+
+def add_engine_arguments( parser ):
+    parser.add_argument("-f", "--fontface", default="futural")
+    parser.add_argument("--fontface_cyr", default="cyrillic")
+    parser.add_argument("--fallback", type=fallback_chain, default=(),
+                        help="fonts for glyphs the selected fonts lack, e.g. futural,cyrillic,symbolic")
+    parser.add_argument("-b", "--boxwidth", type=int, default=0)
+    parser.add_argument("--layout", choices=["greedy", "optimal"], default="greedy")
+    parser.add_argument("--align", choices=["left", "center", "right", "justify"], default="left")
+    parser.add_argument("--merge", choices=["glyph", "line", "block", "use"], default="glyph")
+    parser.add_argument("--optimize", action="store_true", default=False)
+    parser.add_argument("--keep-direction", dest="reverse", action="store_false", default=True)
+    parser.add_argument("--flatten", type=float, default=0, metavar="TOLERANCE",
+                        help="draw curves as polylines within this chord tolerance")
+    parser.add_argument("--simplify", type=float, default=0, metavar="TOLERANCE",
+                        help="simplify polylines (Douglas-Peucker) with this tolerance")
+    parser.add_argument("--absolute", action="store_true", default=False,
+                        help="bake glyph offsets into the path data (needs NumPy)")
+
+
+_settings = None   # engine settings shared by all jobs of a run, see init_worker()
+_engines = {}      # (fontface, boxwidth) -> engine
+
+
+def init_worker( settings ):
+    global _settings, _engines
+    _settings = settings
+    _engines = {}
+
+
+def render_job( job ):
+    """Render one job (name, text, fontface, boxwidth) into the output directory; returns its file name."""
+    name, text, fontface, boxwidth = job
+    engine = _engines.get((fontface, boxwidth))
+    if engine is None:
+        engine = hersheyengine.HersheyEngine(
+            fontface=fontface, fontface_cyr=_settings['fontface_cyr'], boxwidth=boxwidth,
+            layout=_settings['layout'], align=_settings['align'], merge=_settings['merge'],
+            optimize=_settings['optimize'], reverse=_settings['reverse'], fallback=_settings['fallback'],
+            flatten=_settings['flatten'], simplify=_settings['simplify'])
+        _engines[(fontface, boxwidth)] = engine
+    paths, w, v = engine.run(_settings['action'], text)
+    if _settings['absolute']:
+        paths = engine.place(paths, hersheyvector.affine())
+    with open(os.path.join(_settings['output_dir'], name), "w") as f:
+        f.write(svg_document(paths, w, v, engine.symbols or None))
+    return name
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("files", metavar="FILE", nargs="*", help="text files to render")
+    parser.add_argument("-t", "--text", action="append", default=[], help="text to render (repeatable)")
+    parser.add_argument("-l", "--labels", metavar="FILE", help="file with one text to render per line")
+    parser.add_argument("-j", "--jobs", metavar="FILE", help="job list, CSV or JSON lines (.jsonl)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of worker processes (0 = one per CPU)")
+    parser.add_argument("-a", "--action", choices=["render", "sample", "table"], default="render")
+    parser.add_argument("-o", "--output-dir", default=".")
+    parser.add_argument("-s", "--stream", metavar="FILE",
+                        help="stream a large text file (- for standard input) line by line")
+    add_engine_arguments(parser)
+    options = parser.parse_args(args)
+
+    if options.stream:
+        return stream_main(parser, options)
+
+    texts = [decode_text(text) for text in options.text]
+    if options.labels:
+        texts.extend(read_text(options.labels).split('\n'))
+    jobs = []
+    for i, text in enumerate(texts):
+        jobs.append( ("label-{:04d}.svg".format(i + 1), text, options.fontface, options.boxwidth) )
+    for path in options.files:
+        name = os.path.splitext(os.path.basename(path))[0]
+        jobs.append( ("{}.svg".format(name), read_text(path), options.fontface, options.boxwidth) )
+    if options.jobs:
+        for i, row in enumerate(read_jobs(options.jobs)):
+            jobs.append( (row.get('name') or "job-{:05d}.svg".format(i + 1),
+                          decode_text(row['text']),
+                          row.get('font') or options.fontface,
+                          int(row.get('boxwidth') or options.boxwidth)) )
+    if not jobs:
+        parser.error("nothing to render, give --text, --labels, --jobs or FILE")
+
+    # load every face before any worker starts, so that forked workers share them
+    try:
+        for fontface in set([job[2] for job in jobs] + [options.fontface_cyr, 'futural'] + list(options.fallback)):
+            hersheyfonts.load_font(fontface)
+    except ValueError as e:
+        parser.error(str(e))
+    if options.absolute:
+        try:
+            hersheyvector.require_numpy()
+        except ImportError as e:
+            parser.error(str(e))
+
+    settings = dict((key, getattr(options, key)) for key in
+                    ('fontface_cyr', 'fallback', 'layout', 'align', 'merge', 'optimize', 'reverse', 'action',
+                     'flatten', 'simplify', 'absolute', 'output_dir'))
+    workers = options.workers or multiprocessing.cpu_count()
+    start = time.time()
+    if workers == 1:
+        init_worker(settings)
+        names = [render_job(job) for job in jobs]
+    else:
+        pool = multiprocessing.Pool(workers, init_worker, (settings,))
+        names = list(pool.imap(render_job, jobs, chunksize=max(1, len(jobs) // (workers * 16))))
+        pool.close()
+        pool.join()
+    elapsed = time.time() - start
+    sys.stderr.write("rendered {} texts with {} worker(s) in {:.2f}s ({:.0f} texts/s)\n".format(
+        len(names), workers, elapsed, len(names) / max(elapsed, 1e-9)))
+    if workers == 1:
+        sys.stderr.write("text widths: {} cache hits, {} misses\n".format(
+            hersheyengine.text_widths.hits, hersheyengine.text_widths.misses))
+
+
+def stream_main( parser, options ):
+    if options.layout != "greedy" or options.align != "left" or options.optimize or options.absolute:
+        parser.error("--stream needs the greedy layout, left alignment and no --optimize or --absolute")
+    try:
+        engine = hersheyengine.HersheyEngine(
+            fontface=options.fontface, fontface_cyr=options.fontface_cyr, boxwidth=options.boxwidth,
+            merge=options.merge, fallback=options.fallback,
+            flatten=options.flatten, simplify=options.simplify)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.time()
+    if options.stream == '-':
+        stdin = getattr(sys.stdin, 'buffer', sys.stdin)
+        w, v = stream_document(engine, read_chunks(stdin), sys.stdout)
+    else:
+        name = os.path.splitext(os.path.basename(options.stream))[0]
+        with open(options.stream, 'rb') as f:
+            with open(os.path.join(options.output_dir, name + '.svg'), 'w') as out:
+                w, v = stream_document(engine, read_chunks(f), out)
+    sys.stderr.write("streamed {} lines in {:.2f}s\n".format(
+        v // FONT_GROUP_V_SPACING + 1, time.time() - start))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
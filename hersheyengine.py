@@ -0,0 +1,577 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+hersheyengine.py
+
+Text layout and glyph emission of the Hershey Text plugin, without any
+dependency on Inkscape. hershey.py wraps the engine as an Inkscape effect
+and hersheybatch.py renders to standalone SVG files from the command line.
+
+The engine does not build SVG elements. A run produces a list of paths
+(d, x, y): the path data and the offset to translate it by, or
+x = y = None if the offset is already baked into the coordinates (merged
+output, see the merge setting). The stroke style for all of them is STYLE.
+With merge 'use', d is instead the id of a glyph definition, and the
+engine's symbols map the ids used by the run to their path data, so the
+output can define every distinct glyph once and reference it with <use>.
+place() turns the paths of a run into absolute coordinates (NumPy, see
+hersheyvector.py). With flatten or simplify set, glyphs are drawn as
+polylines, see hersheyflatten.py. An engine given a profile (see
+hersheyprofile.py) times the phases of its runs and counts their work.
+'''
+
+from collections import OrderedDict
+
+import hersheyflatten
+import hersheyfonts
+import hersheyplot
+import hersheyprofile
+import hersheyunicode
+import hersheyvector
+
+FONT_GROUP_V_SPACING = 45
+
+spacing = 3  # spacing between letters
+
+STYLE = { 'stroke': '#000000', 'fill': 'none' }
+
+
+def measure_text( fontface, fontface_cyr, text, fallback=() ):
+    """
+    Width of text set in the named fonts (and fallback chain), without line breaks.
+    Spaces and control characters count 2 * spacing, as render_text() advances them.
+    """
+    font = hersheyfonts.load_font(fontface)
+    cmap = hersheyunicode.charmap(fontface, fontface_cyr, fallback)
+    glyphs = cmap.glyphs
+    width = 0
+    for c in text:
+        q = ord(c)
+        table, index = glyphs.get(q) or cmap.resolve(q)
+        if q <= 32 or index is None:
+            width += 2 * spacing
+        else:
+            width += (table or font)[index][1]
+    return width
+
+
+class TextWidthCache( object ):
+    """
+    Bounded LRU cache of text widths keyed on (fontface, fontface_cyr, text) and the
+    fallback chain, so that
+    labels and words that come up again and again are measured once. hits and
+    misses count the lookups since the cache was created or cleared, measured
+    the characters measured on misses.
+    """
+    def __init__( self, maxsize=4096 ):
+        self.maxsize = maxsize
+        self.widths = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.measured = 0
+
+    def width( self, fontface, fontface_cyr, text, fallback=() ):
+        key = (fontface, fontface_cyr, text, fallback)
+        width = self.widths.pop(key, None)
+        if width is None:
+            self.misses += 1
+            self.measured += len(text)
+            width = measure_text(fontface, fontface_cyr, text, fallback)
+            if len(self.widths) >= self.maxsize:
+                self.widths.popitem(last=False)   # least recently used
+        else:
+            self.hits += 1
+        self.widths[key] = width   # (re)insert as most recently used
+        return width
+
+    def clear( self ):
+        self.widths.clear()
+        self.hits = 0
+        self.misses = 0
+        self.measured = 0
+
+
+text_widths = TextWidthCache()
+
+
+def text_width( fontface, fontface_cyr, text, fallback=() ):
+    """
+    Width of text in the named fonts, as used for line breaking and centring. Spaces and
+    control characters count 2 * spacing; results are cached in text_widths. Unknown font
+    names raise ValueError.
+    """
+    return text_widths.width(fontface, fontface_cyr, text, tuple(fallback))
+
+
+def split_lines( paths ):
+    """
+    Split the paths of a run into its lines: runs of consecutive paths at the same
+    vertical offset. Merged paths (without offsets) are a line each.
+    """
+    lines = []
+    last = None
+    for record in paths:
+        y = record[2]
+        if y is None or y != last or not lines:
+            lines.append([])
+        lines[-1].append(record)
+        last = y
+    return lines
+
+
+class HersheyEngine( object ):
+    """
+    Renders text with one set of layout settings. Fonts are resolved when the engine
+    is created (unknown names raise ValueError), so an engine can be reused to render
+    any number of texts without loading anything again.
+    """
+    def __init__( self, fontface='futural', fontface_cyr='cyrillic', boxwidth=0,
+                  layout='greedy', align='left', merge='glyph', optimize=False, reverse=True,
+                  fallback=(), flatten=0, simplify=0, profile=None ):
+        self.font = hersheyfonts.load_font(fontface)
+        self.font_cyr = hersheyfonts.load_font(fontface_cyr)
+        self.fontface = fontface
+        self.fontface_cyr = fontface_cyr
+        self.fallback = tuple(fallback)   # fonts for glyphs the selected ones do not cover
+        self.charmap = hersheyunicode.charmap(fontface, fontface_cyr, self.fallback)
+        self.glyphs = self.charmap.glyphs   # codepoint -> (glyph table, index), see CharMap
+        #Baseline: modernized roman simplex from JHF distribution.
+        self.clearfont = hersheyfonts.load_font('futural')
+        self.boxwidth = int(boxwidth)
+        self.layout = layout
+        self.align = align
+        self.merge = merge
+        self.optimize = optimize
+        self.reverse = reverse
+        # chord tolerance for curves and Douglas-Peucker tolerance, 0 = off
+        self.flatten = float(flatten or (simplify and hersheyflatten.TOLERANCE))
+        self.simplify = float(simplify)
+        self.paths = []
+        self.merged_paths = {}   # path bodies per line (or block), used by merge line/block
+        self.merged_order = []
+        self.symbols = OrderedDict()   # glyph id -> path data of the glyphs used, for merge 'use'
+        self.glyph_ids = {}            # (font name, glyph index) -> glyph id
+        self.travel = None       # pen-up travel (before, after) of the last optimised run
+        self.extent = None       # (widest line, last vertical offset) of the last stream_text()
+        self.drawn = 0           # glyphs drawn by the last run
+        self.profile = profile or hersheyprofile.OFF
+
+    def run( self, action, text ):
+        """
+        Render text ('render'), a sample of it in every font ('sample') or the glyph
+        table of the font (any other action). Returns the paths, the width of the
+        result and the vertical offset of its last line.
+        """
+        self.paths = []
+        self.symbols = OrderedDict()
+        self.travel = None
+        self.drawn = 0
+        profile = self.profile
+        widths = (text_widths.hits, text_widths.misses, text_widths.measured)
+        if action == 'render':
+            w, v = self.render_text(text)
+            profile.count('chars', len(text))
+            profile.count('lines', int(v // FONT_GROUP_V_SPACING) + 1)
+        elif action == 'sample':
+            w, v = self.render_table_of_all_fonts('group_allfonts', text)
+        else:
+            w, v = self.render_glyph_table()
+        if self.merge in ('line', 'block'):
+            self.emit_merged_paths()
+        if self.optimize:
+            with profile.phase('optimize'):
+                self.travel = self.optimize_pen_travel()
+        paths = self.paths
+        self.paths = []
+        profile.count('glyphs', self.drawn)
+        profile.count('width cache hits', text_widths.hits - widths[0])
+        profile.count('width cache misses', text_widths.misses - widths[1])
+        profile.count('chars measured', text_widths.measured - widths[2])
+        return paths, w, v
+
+    def draw_svg_text( self, char, face, offset, vertoffset ):
+        # Latin glyphs come from face, other scripts from their own fonts; the fallback
+        # chain only stands in for the engine's font, other faces (the clear text, the
+        # rows of the sample sheet) resolve their own glyphs
+        if face is self.font:
+            cmap = self.charmap
+        else:
+            cmap = hersheyunicode.charmap(face.name, self.fontface_cyr)
+        table, index = cmap.glyphs.get(char) or cmap.resolve(char)
+        if index is None:
+            return offset + 2 * spacing
+        if table is not None:
+            face = table
+        left, advance, pathString = face[index]
+
+        midpoint = offset - left
+        # Space glyphs have just widths with no moves, so their path is None
+        # We only want to generate paths for visible glyphs
+        if pathString is not None:
+            self.drawn += 1
+            if self.flatten:
+                pathString = hersheyflatten.flatten_path(pathString, self.flatten, self.simplify)
+            if self.merge == 'glyph':
+                self.paths.append( (pathString, midpoint, vertoffset) )
+            elif self.merge == 'use':
+                key = (face.name, index)
+                symbol = self.glyph_ids.get(key)
+                if symbol is None:
+                    symbol = hersheyfonts.glyph_id(face.name, index, self.flatten, self.simplify)
+                    self.glyph_ids[key] = symbol
+                if symbol not in self.symbols:
+                    self.symbols[symbol] = pathString
+                self.paths.append( (symbol, midpoint, vertoffset) )
+            else:
+                # bake the offset into the coordinates; emit_merged_paths() writes the result
+                key = vertoffset if self.merge == 'line' else 0
+                parts = self.merged_paths.get(key)
+                if parts is None:
+                    parts = self.merged_paths[key] = []
+                    self.merged_order.append(key)
+                parts.append(hersheyfonts.translate_path(pathString, midpoint, vertoffset))
+
+        return offset + advance   #new offset value
+
+    def emit_merged_paths( self ):
+        """Output the glyphs collected by draw_svg_text in line/block merge mode as one path each."""
+        for key in self.merged_order:
+            self.paths.append( (' '.join(self.merged_paths[key]), None, None) )
+        self.merged_paths = {}
+        self.merged_order = []
+
+    def optimize_pen_travel( self ):
+        """
+        Replace the output paths by a single path whose strokes are ordered (and,
+        with reverse, turned around) to minimise pen-up travel.
+        Returns the travel distance before and after.
+        """
+        subpaths = []
+        for d, x, y in self.paths:
+            if self.merge == 'use':
+                d = self.symbols[d]
+            subpaths.extend(hersheyplot.split_subpaths(hersheyfonts.split_path(d), x or 0, y or 0))
+
+        before = hersheyplot.travel_distance(subpaths)
+        ordered = hersheyplot.order_subpaths(subpaths, self.reverse)
+        after = hersheyplot.travel_distance(ordered)
+        if after < before:
+            subpaths = ordered
+        else:
+            after = before  # nearest neighbour can lose to reading order on short texts
+        self.paths = []
+        self.symbols = OrderedDict()
+        if subpaths:
+            self.paths.append( (hersheyplot.format_subpaths(subpaths), None, None) )
+        return before, after
+
+    def place( self, paths, matrix ):
+        """
+        Paths of the last run with their offsets and matrix (see hersheyvector.affine)
+        baked into absolute coordinates, as paths (d, None, None).
+        """
+        if self.symbols:
+            paths = [(self.symbols[d], x, y) for d, x, y in paths]
+            self.symbols = OrderedDict()
+        return hersheyvector.transform_paths(paths, matrix)
+
+    def text_width( self, text, fontface=None ):
+        """Width of text in fontface (the engine's font by default), see text_width()."""
+        return text_width(fontface or self.fontface, self.fontface_cyr, text, self.fallback)
+
+    def measure_tokens( self, text ):
+        """
+        Measure, in a single pass, the token following each space or BEL character.
+        Returns a list holding the token width at the index of the space/BEL that
+        precedes it; a token ends at the next space, BEL or newline.
+        """
+        widths = [0] * len(text)
+        start = -1  # index of the space/BEL before the current token, if any
+        for i, c in enumerate(text):
+            if c == ' ' or c == '\x07' or c == '\n':
+                if start >= 0:
+                    widths[start] = self.text_width(text[start + 1:i])
+                start = i if c != '\n' else -1
+        if start >= 0:
+            widths[start] = self.text_width(text[start + 1:])
+        return widths
+
+    def break_greedy( self, widths, boxwidth ):
+        """Fill each line with as many words as fit. Returns a list of (first word, last word + 1)."""
+        lines = []
+        i = 0
+        linew = 0
+        for j in range(len(widths)):
+            if j > i and linew + 2 * spacing + widths[j] > boxwidth:
+                lines.append((i, j))
+                i = j
+            if j == i:
+                linew = widths[j]
+            else:
+                linew += 2 * spacing + widths[j]
+        lines.append((i, len(widths)))
+        return lines
+
+    def break_optimal( self, widths, boxwidth ):
+        """
+        Choose the line breaks that minimise the raggedness of a paragraph, i.e. the sum
+        of squared free space of all lines but the last (dynamic programming from the end
+        of the paragraph). Returns a list of (first word, last word + 1).
+        Candidate lines stop as soon as they get wider than boxwidth, so the work per word
+        is bounded by the number of words that fit on one line.
+        """
+        n = len(widths)
+        if n == 0:
+            return [(0, 0)]     # an empty paragraph is still a line
+        cost = [0] * (n + 1)
+        nextBreak = [n] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            best = None
+            linew = -2 * spacing
+            for j in range(i + 1, n + 1):
+                linew += 2 * spacing + widths[j - 1]
+                if linew > boxwidth and j > i + 1:
+                    break
+                if j == n:
+                    c = 0   # the last line may stay short
+                else:
+                    c = max(boxwidth - linew, 0) ** 2 + cost[j]
+                if best is None or c < best:
+                    best = c
+                    nextBreak[i] = j
+            cost[i] = best
+        lines = []
+        i = 0
+        while i < n:
+            lines.append((i, nextBreak[i]))
+            i = nextBreak[i]
+        return lines
+
+    def render_text( self, text ):
+        """Typeset text; returns the width of the last line and its vertical offset."""
+        if self.layout != "greedy" or self.align != "left":
+            return self.render_paragraphs(text)
+
+        font = self.font
+        w = 0  #Initial spacing offset
+        v = 0  #Initial vertical offset
+        #evaluate text string
+        letterVals = [ord(q) for q in text]
+        boxwidth = self.boxwidth
+        if boxwidth > 0:
+            with self.profile.phase('measure'):
+                tokenWidths = self.measure_tokens(text)
+        i = 0
+        for q in letterVals:
+            if q == 10:
+                v += FONT_GROUP_V_SPACING
+                w = 0
+            elif (q <= 32):
+                w += 2 * spacing
+            else:
+                w = self.draw_svg_text(q, font, w, v)
+
+            # break the line if the next token does not fit
+            if (q == 32 or q == 7) and (boxwidth > 0):
+                if (w > 0) and ((tokenWidths[i] + w) > boxwidth):
+                    v += FONT_GROUP_V_SPACING
+                    w = 0
+            i += 1
+        return w, v
+
+    def stream_text( self, chunks ):
+        """
+        Typeset text arriving in chunks (e.g. read from a file) like render_text() with
+        the greedy layout, yielding the paths of each line as soon as the line is done.
+        Only the current line and the token after the last space are held, so memory
+        does not grow with the input. In line/block merge mode each line is one path;
+        with merge 'use', self.symbols collects the glyph definitions for the end.
+        When the generator is exhausted, self.extent holds the width of the widest
+        line and the vertical offset of the last one.
+        """
+        if self.layout != "greedy" or self.align != "left":
+            raise ValueError('Streaming supports the greedy layout with left alignment only')
+        font = self.font
+        boxwidth = self.boxwidth
+        self.paths = []
+        self.symbols = OrderedDict()
+        self.extent = None
+        w = 0
+        v = 0
+        wmax = 0
+        lineV = 0
+        token = None    # characters after the last space/BEL, while the token is incomplete
+        for chunk in chunks:
+            for c in chunk:
+                q = ord(c)
+                if token is not None:
+                    if q != 32 and q != 7 and q != 10:
+                        token.append(c)
+                        continue
+                    # the token is complete: break the line if it does not fit
+                    if (w > 0) and ((self.text_width(''.join(token)) + w) > boxwidth):
+                        v += FONT_GROUP_V_SPACING
+                        w = 0
+                    if v != lineV:
+                        lineV = v
+                        paths = self.finish_line()
+                        if paths:
+                            yield paths
+                    for t in token:
+                        t = ord(t)
+                        w = self.draw_svg_text(t, font, w, v) if t > 32 else w + 2 * spacing
+                    token = None
+                    wmax = max(wmax, w)
+
+                if q == 10:
+                    v += FONT_GROUP_V_SPACING
+                    w = 0
+                elif (q <= 32):
+                    w += 2 * spacing
+                else:
+                    w = self.draw_svg_text(q, font, w, v)
+                wmax = max(wmax, w)
+                if (q == 32 or q == 7) and (boxwidth > 0):
+                    token = []
+                if v != lineV:
+                    lineV = v
+                    paths = self.finish_line()
+                    if paths:
+                        yield paths
+
+        if token is not None:
+            if (w > 0) and ((self.text_width(''.join(token)) + w) > boxwidth):
+                v += FONT_GROUP_V_SPACING
+                w = 0
+                paths = self.finish_line()
+                if paths:
+                    yield paths
+            for t in token:
+                t = ord(t)
+                w = self.draw_svg_text(t, font, w, v) if t > 32 else w + 2 * spacing
+            wmax = max(wmax, w)
+        paths = self.finish_line()
+        if paths:
+            yield paths
+        self.extent = (wmax, v)
+
+    def finish_line( self ):
+        """Return the paths drawn since the last call (merged in line/block mode) and start anew."""
+        if self.merge in ('line', 'block'):
+            self.emit_merged_paths()
+        paths = self.paths
+        self.paths = []
+        return paths
+
+    def render_paragraphs( self, text ):
+        """
+        Typeset text paragraph by paragraph (a paragraph ends at a newline), breaking lines
+        as selected by layout and placing them as selected by align. Without a boxwidth,
+        paragraphs are not wrapped and are aligned to the widest of them.
+        Returns the block width and the vertical offset of its last line.
+        """
+        font = self.font
+        boxwidth = self.boxwidth
+        align = self.align
+        lines = []  # (words, their widths, is last line of paragraph)
+        for paragraph in text.split('\n'):
+            # runs of spaces leave empty words, so every space advances 2 * spacing
+            # as in render_text(), indentation included
+            words = paragraph.replace('\x07', ' ').split(' ')
+            with self.profile.phase('measure'):
+                widths = [self.text_width(word) for word in words]
+            with self.profile.phase('wrap'):
+                if boxwidth <= 0:
+                    breaks = [(0, len(words))]
+                elif self.layout == 'optimal':
+                    breaks = self.break_optimal(widths, boxwidth)
+                else:
+                    breaks = self.break_greedy(widths, boxwidth)
+            for k, (i, j) in enumerate(breaks):
+                lines.append((words[i:j], widths[i:j], k == len(breaks) - 1))
+
+        def line_width( widths ):
+            return sum(widths) + 2 * spacing * max(len(widths) - 1, 0)
+
+        blockw = boxwidth
+        if blockw <= 0:
+            blockw = max([line_width(widths) for words, widths, last in lines])
+
+        v = -FONT_GROUP_V_SPACING
+        for words, widths, last in lines:
+            v += FONT_GROUP_V_SPACING
+            free = blockw - line_width(widths)
+            wordgap = 2 * spacing
+            w = 0
+            if align == 'right':
+                w = free
+            elif align == 'center':
+                w = free / 2.0
+            elif align == 'justify' and not last and len(words) > 1 and free > 0:
+                wordgap += free / float(len(words) - 1)
+            for word in words:
+                for c in word:
+                    q = ord(c)
+                    if q < 32:
+                        w += 2 * spacing
+                    else:
+                        w = self.draw_svg_text(q, font, w, v)
+                w += wordgap
+        return blockw, v
+
+    def render_glyph_table( self ):
+        """Every glyph of the font next to its counterpart in the clear font."""
+        wmax = 0;
+        for p in range(0,10):
+            w = 0
+            v = spacing * (15*p - 67 )
+            for q in range(0,10):
+                r = p*10 + q
+                if (r <= 32) or (r > 127):
+                    w += 5*spacing
+                else:
+                    w = self.draw_svg_text(r, self.clearfont, w, v)
+                    w = self.draw_svg_text(r, self.font, w, v)
+                    w += 5 * spacing
+            if w > wmax:
+                wmax = w
+        return wmax, v
+
+    def render_table_of_all_fonts( self, fontgroupname, text ):
+        clearfont = self.clearfont
+        v = 0
+        wmax = 0
+        wmin = 0
+        fontgroup = hersheyfonts.font_group( fontgroupname )
+
+        # Render list of font names in a vertical column:
+        for f in fontgroup:
+            letterVals = [ord(q) for q in (f[1] + ' -> ')]
+            # we want to right-justify the clear text, so need to know its width
+            w = -self.text_width(f[1] + ' -> ', 'futural')  # move the name text left by its width
+            if w < wmin:
+                wmin = w
+            # print the font name, spaces advanced as text_width() counts them
+            for q in letterVals:
+                w = self.draw_svg_text(q, clearfont, w, v) if q > 32 else w + 2 * spacing
+            v += FONT_GROUP_V_SPACING
+            if w > wmax:
+                wmax = w
+
+        # Next, we render a second column. The user's text, in each of the different fonts:
+        v = 0                   # back to top line
+        wmaxname = wmax + 8     # single space width
+        for f in fontgroup:
+            w = wmaxname
+            font = hersheyfonts.load_font(f[0])
+            #evaluate text string
+            letterVals = [ord(q) for q in text]
+            for q in letterVals:
+                if (q <= 32) or (q > 127):
+                    w += 2*spacing
+                else:
+                    w = self.draw_svg_text(q, font, w, v)
+            v += FONT_GROUP_V_SPACING
+            if w > wmax:
+                wmax = w
+        return wmax + wmin, v
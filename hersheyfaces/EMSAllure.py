@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 11.4 M 20.8 -12.1 L 19.5 -9.8 L 16.1 -2.5 L 14.1 2.2 M 13.2 7.0 L 12.5 7.7","0 9.6 M 12.0 -8.4 L 11.5 -3.8 M 16.4 -8.4 L 15.7 -3.7","0 29.4 M 22.0 -14.6 L 14.3 7.7 M 31.0 -14.4 L 23.6 7.8 M 12.0 -5.9 L 35.2 -6.0 M 9.4 2.9 L 32.9 2.9","0 18.8 M 20.8 -3.8 L 23.2 -5.7 L 24.2 -7.9 L 23.7 -9.6 L 22.3 -10.3 L 19.4 -10.3 L 15.5 -9.3 L 13.0 -7.3 L 12.1 -5.5 L 11.9 -4.4 L 12.1 -2.9 L 16.8 2.7 L 17.7 4.2 L 16.9 5.3 L 15.1 5.8 L 13.5 5.6 L 11.8 5.3 L 11.0 4.9 M 22.7 -11.9 L 21.8 -11.1 L 16.6 -2.4 L 11.0 8.6","0 17.4 M 15.0 -11.6 L 12.8 -10.7 L 11.1 -8.7 L 11.1 -6.2 L 12.3 -5.1 L 14.2 -5.3 L 15.7 -6.7 L 16.7 -8.3 L 16.8 -10.1 L 16.4 -11.1 L 15.5 -11.5 L 17.6 -10.8 L 22.1 -11.0 L 24.1 -12.0 L 22.0 -9.2 L 15.7 .1 L 10.8 8.4 M 18.7 2.6 L 17.3 4.8 L 17.1 7.1 L 18.4 8.3 L 19.8 8.3 L 21.7 6.9 L 22.7 5.4 L 23.0 2.6 L 22.0 1.6 L 20.2 1.5 L 18.7 2.6","0 26.3 M 28.1 -11.9 L 27.2 -11.5 L 26.2 -9.9 L 25.7 -8.8 L 25.7 -7.5 M 26.4 -10.7 L 25.2 -12.0 L 23.5 -12.9 L 20.4 -12.6 L 17.9 -11.7 L 16.9 -9.0 L 17.7 -6.5 L 19.2 -4.0 L 21.3 -1.8 L 17.7 -1.4 L 14.2 -1.0 L 11.1 1.4 L 9.8 4.4 L 10.8 7.1 L 12.8 8.9 L 16.1 9.5 L 19.9 9.1 L 23.3 8.2 L 26.1 6.7 L 28.0 4.5 L 29.2 2.2 L 29.5 .1 L 29.3 -1.2 L 28.7 -2.9 M 32.1 -6.6 L 32.1 -5.7 L 31.1 -4.6 L 27.1 -2.1 L 24.0 -.8 L 21.2 .6 L 19.8 2.9 L 19.9 4.1 L 20.8 5.5","0 5.5 M 12.1 -8.5 L 11.5 -3.7","0 14.2 M 24.9 -12.7 L 18.3 -9.2 L 13.7 -5.1 L 11.3 -1.0 L 9.8 4.1 L 9.6 8.4 L 10.2 12.1 L 11.1 14.1","0 19.6 M 20.8 -12.7 L 22.6 -8.6 L 22.5 -2.5 L 20.3 4.0 L 16.8 8.7 L 13.4 11.4 L 10.3 12.9 L 7.4 14.0","0 24.2 M 16.5 -10.1 L 16.7 -10.0 L 21.7 .7 M 23.5 -10.6 L 14.9 .4 M 26.6 -4.9 L 12.7 -4.6","0 23.2 M 12.2 1.3 L 27.6 1.3 M 22.8 -4.7 L 16.9 8.5","0 6.7 M 12.3 7.2 L 12.9 8.3 L 12.2 9.3 L 9.9 12.7","0 14.1 M 14.1 1.5 L 21.3 1.3","0 7.1 M 13.6 7.0 L 13.1 7.8","0 17.9 M 24.3 -11.8 L 17.0 -2.3 L 13.0 3.2 L 9.8 8.3","0 21.0 M 23.8 -9.5 L 22.7 -10.3 L 19.9 -10.4 L 18.3 -9.7 L 15.0 -7.5 L 13.2 -5.7 L 11.7 -3.3 L 10.5 .6 L 10.3 3.8 L 11.6 7.0 L 13.8 8.5 L 16.3 9.2 L 19.1 8.7 L 22.4 7.0 L 25.5 3.9 L 27.3 .5 L 28.3 -3.2 L 28.3 -6.2 L 27.5 -8.7 L 25.9 -10.3 L 24.2 -11.6 L 22.5 -12.1 L 20.1 -12.2","0 12.0 M 14.4 -5.3 L 17.3 -7.6 L 19.0 -9.7 L 20.3 -11.5 L 21.2 -11.5 L 18.1 -4.6 L 15.1 2.3 L 13.9 5.8 L 13.6 7.8 M 9.2 8.7 L 11.2 8.0 L 13.2 8.0 L 15.5 7.8 L 18.0 7.9","0 22.3 M 15.3 -6.6 L 15.2 -6.9 L 15.2 -8.0 L 18.1 -10.1 L 20.8 -11.0 L 24.0 -11.4 L 27.2 -10.7 L 28.7 -9.6 L 29.6 -7.2 L 28.6 -4.7 L 26.1 -2.0 L 22.8 .6 L 20.1 2.5 L 17.3 4.3 L 15.3 5.4 L 14.4 5.9 L 12.9 6.9 L 12.3 7.5 L 10.8 8.5 L 10.8 7.5 L 11.6 6.4 L 12.8 6.0 L 14.9 6.1 L 17.1 6.9 L 18.5 7.8 L 21.8 9.1 L 25.3 9.2 L 27.1 8.4 L 28.6 7.2 L 29.0 6.3","0 21.1 M 16.6 -6.8 L 17.1 -9.0 L 19.2 -10.6 L 21.9 -11.3 L 24.2 -11.4 L 26.7 -10.8 L 28.2 -8.9 L 28.3 -6.8 L 27.7 -5.6 L 26.3 -4.4 L 25.2 -3.5 L 22.9 -3.0 L 20.5 -2.6 L 18.9 -2.0 L 18.5 -2.3 L 18.3 -3.2 L 20.7 -3.0 L 24.3 -2.3 L 26.0 -1.7 L 27.0 -.2 L 27.3 2.4 L 26.6 4.4 L 24.7 6.5 L 22.6 8.0 L 20.2 9.0 L 16.0 9.6 L 13.7 9.3 L 12.3 8.4 L 11.4 6.7 L 11.7 5.5 L 12.2 4.8","0 17.7 M 16.7 9.2 L 17.5 6.0 L 19.2 1.1 L 22.3 -5.7 L 25.0 -11.2 L 20.8 -7.7 L 16.6 -4.4 L 12.3 -1.8 L 10.2 .0 L 8.9 1.9 L 10.6 1.0 L 11.8 .5 L 14.8 .5 L 17.3 .6 L 19.6 1.1 L 22.0 1.1 L 24.6 .1 L 25.8 -.7 L 26.6 -1.7","0 20.4 M 19.1 -10.3 L 16.0 -5.6 L 14.2 -2.5 L 16.0 -3.6 L 18.9 -4.6 L 21.3 -4.7 L 23.6 -4.2 L 25.6 -3.0 L 26.4 -1.2 L 26.4 .9 L 25.6 3.2 L 23.5 5.8 L 21.0 7.4 L 18.0 8.6 L 15.1 9.1 L 12.7 9.1 L 10.6 8.7 L 9.1 8.0 L 8.2 6.5 L 7.9 4.9 L 8.5 4.1 M 17.9 -10.5 L 22.4 -10.8 L 27.1 -11.0 L 29.7 -10.8","0 19.1 M 26.5 -7.1 L 26.6 -9.3 L 25.6 -10.8 L 23.3 -11.2 L 19.7 -10.5 L 15.8 -7.5 L 13.6 -4.7 L 11.8 -.9 L 10.9 3.1 L 11.2 5.9 L 12.8 8.0 L 15.2 8.8 L 17.7 8.8 L 19.6 7.9 L 21.9 6.1 L 23.4 4.1 L 24.2 1.0 L 23.7 -1.3 L 21.9 -2.6 L 19.7 -2.8 L 17.6 -2.4 L 16.2 -1.2","0 15.9 M 12.5 -7.1 L 13.7 -9.8 L 15.6 -11.0 L 19.1 -11.2 L 23.2 -10.7 L 25.6 -10.6 L 27.3 -10.4 L 28.6 -11.1 L 22.8 -4.9 L 18.3 .7 L 15.0 4.6 L 13.0 8.0 L 12.6 8.2","0 18.8 M 21.2 -12.0 L 17.5 -10.4 L 15.2 -8.0 L 15.4 -5.6 L 16.2 -3.9 L 18.3 -2.9 L 20.4 -2.9 L 22.8 -2.1 L 24.3 .1 L 24.2 2.8 L 23.1 4.4 L 19.9 6.6 L 17.1 8.2 L 14.5 8.5 L 12.0 8.3 L 10.2 7.3 L 9.8 4.8 L 11.2 2.2 L 14.4 -.2 L 22.4 -4.6 L 24.9 -5.9 L 26.6 -7.3 L 27.2 -9.7 L 26.4 -11.4 L 24.6 -12.2 L 21.2 -12.0","0 19.2 M 20.7 -1.4 L 19.1 -.3 L 16.7 .0 L 14.2 -.8 L 13.0 -2.4 L 13.0 -5.4 L 14.4 -8.5 L 16.6 -10.4 L 18.5 -11.4 L 21.8 -11.9 L 24.4 -11.0 L 26.1 -8.7 L 26.5 -6.3 L 25.8 -2.7 L 24.8 .0 L 22.8 3.2 L 20.4 5.5 L 18.0 7.4 L 16.2 8.3 L 14.0 8.7 L 12.3 8.7 L 10.5 7.3 L 10.1 6.2 L 10.2 4.0","0 7.8 M 15.2 1.0 L 14.8 1.7 M 13.4 7.0 L 13.0 7.7","0 7.1 M 15.0 1.0 L 14.5 1.7 M 12.2 7.1 L 12.8 7.7 L 12.7 8.4 L 12.2 9.3 L 10.0 12.2","0 14.3 M 21.4 -8.8 L 12.2 .2 L 14.3 3.1 L 15.6 4.8 L 17.0 7.1","0 20.5 M 15.0 -1.1 L 27.2 -1.4 M 13.6 4.6 L 15.0 4.1 L 26.4 4.2","0 15.0 M 17.0 -8.6 L 19.4 -4.9 L 21.4 -2.9 L 18.3 .1 L 14.5 3.8 L 11.7 6.5","0 17.9 M 13.4 -8.8 L 13.8 -10.1 L 14.5 -10.8 L 16.8 -12.1 L 18.8 -13.1 L 22.1 -13.0 L 23.9 -11.7 L 24.8 -8.8 L 23.8 -6.1 L 22.4 -4.1 L 20.5 -2.6 L 19.0 -1.7 L 16.8 .1 L 15.8 1.5 L 15.4 2.5 M 13.1 7.2 L 12.4 8.0","0 28.4 M 28.1 -7.4 L 25.2 -8.5 L 21.1 -6.9 L 18.0 -4.6 L 16.0 -2.3 L 14.9 -.3 L 14.8 1.5 L 15.6 2.6 L 16.9 3.1 L 18.8 2.6 L 20.5 1.0 L 23.3 -1.8 L 26.6 -5.7 L 27.3 -5.7 L 25.8 -2.7 L 25.1 -.5 L 24.9 2.2 L 25.8 3.2 L 28.0 3.0 L 30.6 .9 L 32.8 -2.4 L 34.0 -5.2 L 34.3 -8.6 L 33.1 -11.6 L 29.9 -13.6 L 26.1 -14.0 L 21.9 -13.5 L 17.4 -11.5 L 13.2 -8.2 L 10.7 -4.9 L 8.9 .0 L 9.2 3.6 L 10.3 5.9 L 13.2 8.4 L 17.2 9.5 L 22.0 9.4 L 27.1 8.1 L 27.4 7.9 L 31.7 5.1 L 34.0 2.6 L 34.9 .8 L 35.1 -.9 L 34.9 -3.0","0 33.7 M 8.7 7.7 L 9.3 9.5 L 11.1 10.8 L 13.9 11.1 L 17.7 9.8 L 21.9 6.5 L 25.8 2.5 L 30.0 -2.4 L 32.4 -5.7 L 34.8 -8.7 L 37.0 -11.2 L 38.8 -13.2 L 39.4 -13.4 L 36.8 -9.1 L 34.3 -2.0 L 32.9 3.0 L 32.8 5.9 L 33.6 8.4 L 35.0 8.9 L 37.9 7.3 L 40.3 5.0 L 41.7 3.3 M 13.1 3.9 L 13.2 1.2 L 14.3 -.6 L 16.9 -1.5 L 19.3 -1.6 L 23.0 -.9 L 25.3 -.4 L 29.7 .1 L 34.8 .7 L 37.6 .7 L 38.5 .3 L 39.4 -.3","0 27.3 M 12.0 -1.4 L 9.7 -2.7 L 9.1 -4.3 L 9.8 -7.2 L 12.7 -9.5 L 19.4 -12.6 L 26.4 -13.6 L 31.1 -13.5 L 33.8 -12.5 L 35.0 -10.9 L 34.9 -8.8 L 34.0 -7.5 L 32.4 -6.2 L 28.0 -4.8 L 25.8 -4.5 L 23.9 -4.2 L 22.6 -4.0 L 26.2 -1.3 L 29.1 1.2 L 30.2 4.0 L 29.7 6.7 L 28.2 8.6 L 25.9 10.2 L 22.9 10.4 L 20.9 10.4 L 19.1 9.8 L 18.2 8.0 L 17.8 6.4 L 15.6 8.0 L 14.1 9.0 L 13.7 8.2 L 14.9 4.3 L 19.3 -3.9 L 20.8 -7.2 L 22.3 -8.8 L 24.2 -9.2 L 25.4 -9.1","0 21.9 M 18.4 -2.5 L 21.8 -2.8 L 25.7 -5.0 L 28.6 -7.7 L 29.9 -10.3 L 29.3 -12.6 L 26.9 -13.6 L 20.9 -12.0 L 16.9 -9.3 L 12.5 -4.3 L 10.3 .1 L 9.4 4.8 L 10.9 8.2 L 15.0 10.0 L 20.0 9.5 L 24.1 7.9 L 27.9 5.4 L 30.2 3.0","0 32.8 M 29.7 -8.6 L 26.3 -7.1 L 24.0 -3.8 L 23.4 -1.6 L 21.3 3.1 L 20.1 5.6 L 18.6 8.7 L 17.4 10.4 L 16.5 10.2 L 15.5 8.0 L 15.4 5.4 L 15.8 2.4 L 16.4 4.4 L 20.9 7.9 L 25.2 9.3 L 32.1 8.2 L 36.4 5.4 L 40.0 2.0 L 41.8 -2.8 L 41.4 -7.9 L 39.2 -10.9 L 35.3 -12.6 L 28.3 -13.4 L 22.1 -12.3 L 17.3 -10.5 L 13.9 -8.4 L 12.0 -5.6 L 11.7 -3.2 L 13.0 -1.2 L 15.0 -.3","0 27.0 M 30.0 -9.4 L 30.2 -7.0 L 27.7 -12.0 L 24.9 -13.8 L 21.7 -13.4 L 19.3 -10.7 L 19.4 -7.7 L 20.6 -4.6 L 21.9 -2.8 L 23.1 -1.2 L 25.0 -.7 L 25.1 -1.7 L 23.8 -2.1 L 20.4 -2.0 L 14.7 -1.2 L 10.3 2.1 L 8.9 5.6 L 10.4 8.7 L 14.4 10.6 L 19.1 10.5 L 24.8 9.7 L 29.4 7.8 L 33.0 5.4 L 34.5 3.3 L 34.7 2.5 L 34.6 1.0","0 19.8 M 25.4 -9.3 L 22.8 -8.5 L 20.7 -6.2 L 19.5 -3.2 L 17.8 -.4 L 15.9 3.6 L 14.2 6.6 L 14.0 8.2 L 14.6 9.0 L 16.1 8.7 L 17.0 7.5 L 17.5 6.9 M 11.3 -2.8 L 9.8 -3.8 L 8.8 -6.1 L 10.4 -9.7 L 13.6 -11.7 L 20.0 -12.9 L 25.3 -12.4 L 29.0 -11.9 L 31.5 -11.9 L 34.1 -11.8 L 35.3 -12.5 L 34.8 -12.6 L 32.5 -10.2 L 31.8 -8.6 L 31.9 -7.1 M 16.3 -.8 L 15.2 -.1 L 27.1 -1.5","0 30.2 M 35.2 -11.3 L 33.8 -13.1 L 32.2 -13.8 L 28.7 -13.8 L 23.4 -12.5 L 19.4 -10.3 L 15.6 -7.4 L 13.3 -4.3 L 11.8 -1.7 L 11.1 1.2 L 11.5 3.9 L 13.0 6.0 L 15.8 7.6 L 19.3 8.0 L 24.0 6.7 L 27.4 4.5 L 31.2 1.6 L 32.9 .0 L 33.6 -.9 L 35.5 -2.2 L 36.1 -2.8 L 35.1 -2.5 L 33.4 .4 L 30.5 10.3 L 27.2 15.6 L 23.8 20.2 L 20.6 21.9 L 17.6 22.1 L 16.2 20.9 L 16.2 18.6 L 17.4 16.0 L 20.6 12.7 L 24.7 10.0 L 28.3 8.1 L 32.2 6.8 L 33.2 6.6 L 35.9 6.1","0 29.8 M 18.2 -8.1 L 18.6 -8.1 L 21.7 -9.8 L 23.2 -11.7 L 24.3 -13.2 L 23.1 -9.7 M 23.1 -9.7 L 19.3 .9 L 15.7 7.2 L 12.5 11.3 L 9.2 13.0 L 7.4 13.0 L 5.1 12.0 L 4.9 11.3 M 38.8 -12.6 L 36.1 -11.4 L 34.7 -9.0 L 33.1 -5.2 L 31.6 -1.7 L 30.1 2.3 L 29.1 5.6 L 29.4 7.7 L 30.3 8.7 L 32.1 8.8 L 34.2 7.2 L 36.6 4.8 L 37.8 3.2 M 10.3 2.7 L 10.0 -.3 L 11.6 -2.2 L 16.5 -2.8 L 19.0 -2.4 L 23.0 -1.9 L 28.5 -.7 L 33.1 -.2 L 35.4 -.7 L 36.0 -1.2","0 17.4 M 24.9 -13.0 L 22.0 -4.1 L 19.6 1.9 L 17.9 5.0 L 16.0 7.4 L 14.3 8.1 L 12.1 8.4 L 9.3 8.2 L 8.8 7.4 L 9.7 6.7 L 11.1 7.7 L 12.7 8.0 L 23.2 7.8 M 16.4 -5.3 L 14.6 -7.6 L 15.4 -10.1 L 17.8 -12.1 L 21.5 -12.7 L 25.6 -12.5 L 28.0 -12.4 L 30.1 -11.6","0 21.8 M 29.4 -13.7 L 28.5 -12.8 L 27.0 -9.6 L 24.9 -3.7 L 22.6 2.6 L 19.4 7.7 L 17.2 10.1 L 13.6 12.0 L 10.7 11.3 L 9.9 8.7 L 11.6 5.5 L 15.8 1.3 L 18.8 -.6 L 22.6 -2.3 L 25.8 -3.2 L 28.8 -3.8 M 17.5 -4.9 L 15.9 -6.1 L 15.7 -9.0 L 17.4 -11.1 L 21.6 -12.4 L 25.6 -12.7 L 29.2 -12.2 L 30.7 -11.5","0 24.1 M 13.2 -7.9 L 17.1 -9.8 L 19.6 -13.2 L 15.6 -2.4 L 13.9 2.4 L 12.5 4.8 L 10.3 8.0 L 8.2 10.6 L 5.0 12.8 L 2.3 13.1 L .8 12.6 L -.3 10.8 M 33.0 -13.2 L 26.9 -9.5 L 21.1 -4.8 L 16.5 -.3 L 13.6 3.3 M 18.4 -3.8 L 20.1 3.0 L 22.8 7.7 L 25.8 9.3 L 27.9 8.9 L 28.8 7.4 L 28.4 6.7 L 27.9 5.9","0 19.6 M 16.3 5.0 L 16.6 5.0 L 22.5 2.6 L 27.7 -1.7 L 30.8 -7.2 L 31.3 -10.8 M 31.5 -10.8 L 30.3 -13.3 L 28.2 -13.9 L 24.8 -12.6 L 22.0 -9.0 L 20.0 -2.7 L 16.9 6.2 L 15.8 9.2 L 14.6 11.2 L 13.6 12.4 L 13.0 12.8 M 12.9 6.4 L 9.2 7.4 L 9.6 6.4 L 13.3 7.7 L 18.6 11.4 L 22.8 13.8 L 27.5 15.7 L 32.8 15.4 L 35.0 13.8 L 35.6 12.8 L 35.7 10.8","0 42.9 M 16.1 -8.0 L 18.6 -9.1 L 19.9 -10.2 L 21.0 -11.5 L 21.9 -13.0 L 22.6 -13.2 L 20.6 -7.8 L 18.1 -1.0 L 15.5 4.3 L 13.1 8.4 L 11.0 10.3 L 9.0 10.9 L 7.8 9.5 L 8.4 7.5 L 12.0 3.1 L 16.9 -2.3 L 23.2 -8.2 L 27.1 -10.5 L 29.6 -11.1 L 31.9 -10.2 L 33.0 -7.3 L 32.5 -1.0 L 31.9 3.0 L 30.8 6.6 L 31.6 6.4 L 33.9 2.7 L 39.5 -5.7 L 41.9 -9.1 L 44.1 -10.7 L 45.7 -10.5 L 46.3 -9.7 L 46.7 -8.1 L 45.5 -4.6 L 44.3 -2.1 L 42.9 .9 L 42.2 3.3 L 42.2 5.8 L 43.4 8.3 L 46.5 7.8 L 49.8 4.9 L 50.9 3.2","0 29.6 M 1.7 10.2 L 2.3 11.9 L 4.1 13.0 L 6.9 12.4 L 10.2 10.1 L 13.1 5.6 L 15.8 .4 L 17.7 -4.7 L 19.2 -8.8 L 20.1 -11.9 L 20.4 -1.4 L 21.1 3.0 L 23.2 7.9 L 25.1 9.6 L 27.2 10.1 L 29.4 9.0 L 32.2 4.9 L 34.0 .3 L 35.2 -6.0 L 35.4 -9.7 L 35.0 -11.5 L 34.3 -13.5 L 35.8 -11.4 L 36.7 -10.2 L 37.5 -9.6 L 38.4 -9.1 M 14.0 -7.3 L 14.4 -7.4 L 17.2 -8.7 L 18.3 -9.9 L 19.4 -11.9 M 14.0 -7.3 L 14.4 -7.4 L 17.2 -8.7 L 18.3 -9.9 L 19.4 -11.9","0 27.0 M 10.2 -1.4 L 10.2 -1.6 L 11.8 -6.6 L 14.9 -10.0 L 19.6 -12.6 L 23.1 -13.7 L 26.5 -13.6 L 29.7 -13.1 L 32.4 -10.9 L 33.7 -7.7 L 34.1 -5.4 L 33.6 -1.3 L 32.1 2.7 L 29.2 6.5 L 26.2 9.0 L 23.2 10.4 L 18.2 10.7 L 14.7 9.0 L 12.7 4.9 L 13.1 -.4 L 14.8 -3.7 L 17.5 -6.9 L 20.2 -8.3 L 22.3 -9.3 L 23.6 -9.3 L 25.0 -9.1","0 20.3 M 25.0 -9.3 L 23.0 -8.8 L 21.3 -7.7 L 20.0 -6.2 L 19.5 -4.2 L 18.7 -2.5 L 16.8 .6 L 15.3 3.5 L 14.4 5.9 L 14.1 7.0 L 13.9 8.0 L 14.4 9.0 L 15.5 8.6 L 16.7 7.2 M 12.2 -2.4 L 10.3 -3.5 L 9.7 -5.7 L 10.4 -8.3 L 13.2 -10.4 L 16.3 -11.9 L 19.3 -12.8 L 23.3 -13.3 L 28.8 -13.0 L 32.5 -11.6 L 34.5 -9.9 L 34.7 -7.6 L 33.6 -5.0 L 31.8 -3.0 L 29.3 -1.8 L 25.0 -.4 L 20.9 .3 L 18.5 .7 L 15.8 .4","0 25.4 M 31.2 -13.7 L 33.6 -12.6 L 34.9 -10.3 L 34.8 -5.7 L 33.1 -.1 L 29.5 5.1 L 25.9 7.9 L 23.2 9.1 L 19.7 9.8 L 15.7 9.1 L 12.6 7.3 L 10.7 3.7 L 10.6 -2.2 L 12.7 -7.3 L 15.8 -10.5 L 18.4 -12.2 L 21.2 -13.7 L 24.2 -14.5 L 27.2 -14.0 L 29.5 -12.5 L 30.7 -9.9 L 30.8 -5.9 L 30.2 -2.3 L 28.0 1.4 L 25.3 4.2 L 22.9 5.7 L 21.2 6.3 L 17.7 7.5 L 16.3 7.0 L 16.5 6.3 L 18.4 6.5 L 21.6 8.0 L 24.8 10.2 L 28.2 12.4 L 32.3 14.8 L 37.5 15.8 M 37.4 15.8 L 41.9 15.0 L 43.3 13.2 L 43.4 12.3 L 43.3 10.2","0 20.3 M 24.8 -9.2 L 22.3 -8.9 L 20.3 -6.9 L 19.8 -4.9 L 18.3 -1.6 L 15.6 2.7 L 13.9 6.3 L 13.5 7.9 L 14.1 8.9 L 15.3 8.4 L 16.0 7.8 L 16.2 7.6 M 11.6 -2.7 L 9.9 -4.3 L 9.7 -6.7 L 10.7 -8.8 L 14.1 -11.2 L 17.7 -12.3 L 21.9 -13.1 L 26.7 -13.0 L 30.3 -12.6 L 33.5 -10.6 L 34.8 -8.0 L 34.0 -5.2 L 30.5 -2.6 L 26.6 -1.2 L 22.7 .0 L 19.6 .1 L 15.4 -.3 L 15.3 -1.0 L 18.9 1.7 L 21.1 5.3 L 24.8 9.7 L 28.9 12.7 L 33.2 14.6 L 37.0 14.6 L 39.0 13.4 L 39.8 12.2 L 40.0 11.1","0 22.4 M 31.0 -9.4 L 31.9 -10.7 L 31.9 -12.2 L 30.1 -13.5 L 25.5 -12.9 L 20.1 -11.2 L 17.5 -8.7 L 17.4 -6.4 L 20.5 -4.9 L 25.4 -3.4 L 28.6 -1.7 L 29.9 .2 L 29.7 1.9 L 28.6 3.6 L 25.6 5.9 L 20.8 7.9 L 14.3 9.2 L 11.0 8.7 L 9.9 7.5 L 9.6 4.9 L 10.7 2.6 L 12.7 .9 L 15.0 -.3 L 18.3 -1.3","0 17.6 M 10.8 -3.0 L 9.3 -4.5 L 8.9 -6.9 L 10.2 -9.8 L 12.6 -11.5 L 15.3 -12.5 L 18.1 -12.9 L 23.8 -12.8 L 29.3 -12.1 L 34.6 -12.0 L 36.3 -12.4 L 35.2 -12.9 L 32.6 -9.4 L 32.3 -8.1 L 32.1 -6.4 L 32.6 -5.7 M 25.8 -9.1 L 23.3 -8.1 L 21.4 -6.1 L 19.3 -2.2 L 16.6 2.5 L 14.7 6.9 L 14.7 8.2 L 15.3 9.0 L 16.3 8.3 L 17.5 7.0","0 21.3 M 9.3 -6.1 L 9.6 -6.3 L 12.3 -7.5 L 14.3 -9.1 L 16.4 -11.0 L 16.9 -12.0 L 17.9 -12.0 L 15.6 -8.7 L 12.3 -1.5 L 10.7 2.0 L 10.1 5.3 L 10.8 8.0 L 13.1 8.7 L 16.1 7.7 L 19.9 5.1 L 25.0 .2 L 28.7 -4.3 L 31.3 -8.4 L 32.6 -11.5 L 32.4 -13.5 L 31.1 -14.2 L 29.5 -13.6 L 27.9 -12.7 L 26.4 -10.1 L 25.3 -6.8 L 24.2 -2.4 L 23.1 3.1 L 22.4 7.5 L 22.5 10.8 L 23.0 13.4 L 23.7 14.7 L 24.8 15.2 L 25.8 15.3 L 26.7 14.8","0 23.4 M 10.7 -5.4 L 9.0 -7.8 L 9.8 -10.4 L 11.3 -11.5 L 15.0 -12.2 L 18.6 -12.5 L 21.4 -12.5 L 23.2 -11.8 L 23.9 -11.6 M 19.5 -13.8 L 19.7 -9.6 L 18.5 -6.3 L 17.2 -4.0 L 15.7 -.2 L 14.2 3.7 L 13.5 6.4 L 13.6 9.3 L 14.9 10.2 L 17.8 10.2 L 21.7 8.0 L 25.9 4.1 L 30.5 -1.9 L 33.9 -7.1 L 35.8 -10.0 L 37.4 -12.0 L 38.8 -13.1 L 40.2 -14.0 L 40.8 -14.0","0 38.3 M 11.2 -5.1 L 10.1 -6.1 L 9.3 -8.3 L 10.5 -10.5 L 13.6 -12.0 L 17.4 -12.6 L 21.4 -12.5 L 23.6 -12.1 L 24.5 -11.7 M 22.2 -13.5 L 21.3 -9.8 L 19.4 -6.9 L 16.0 -2.2 L 13.3 2.1 L 11.9 4.4 L 10.7 6.9 L 10.3 8.8 L 10.5 10.2 L 11.0 10.8 L 12.1 11.1 L 13.7 10.9 L 16.4 9.9 L 19.4 8.1 L 21.5 6.3 L 24.7 3.7 L 27.6 .5 L 30.7 -3.5 L 31.6 -5.9 L 31.9 -7.8 L 31.6 -9.6 L 30.5 -9.1 L 30.1 -7.1 L 30.2 -4.2 L 30.0 -.5 L 30.8 3.4 L 32.2 6.1 L 34.0 7.7 L 36.8 8.9 L 38.8 8.6 L 40.3 8.0 L 42.4 5.0 L 43.8 1.9 L 44.5 -1.3 L 44.8 -3.3 L 44.4 -7.4 L 43.4 -10.0 L 41.3 -11.6 L 39.0 -12.2 L 37.5 -12.0 L 36.8 -11.4","0 25.6 M 11.1 -5.5 L 9.5 -6.6 L 9.1 -8.6 L 9.8 -10.7 L 12.3 -12.1 L 15.2 -12.8 L 17.5 -13.1 L 21.0 -12.7 L 23.0 -12.4 L 23.9 -12.1 L 24.4 -12.0 M 22.3 -13.2 L 21.6 -8.8 L 22.0 -4.0 L 22.7 .0 L 24.5 4.3 L 26.7 7.3 L 28.7 8.5 L 31.3 7.4 L 33.6 5.4 L 34.9 4.0 M 33.7 -13.1 L 31.1 -9.5 L 27.1 -4.3 L 23.9 -.1 L 20.1 3.5 L 16.7 7.0 L 13.3 9.5 L 10.0 11.8 L 5.8 13.2 L 2.9 12.8 L 1.2 12.2 L .5 10.9 L .4 10.3","0 19.9 M 9.9 -6.3 L 10.1 -6.4 L 12.8 -7.6 L 15.2 -9.5 L 17.0 -11.5 L 17.8 -12.1 L 18.1 -12.2 L 16.3 -8.6 L 13.5 -3.5 L 11.2 1.7 L 10.8 4.1 L 10.6 6.6 L 11.7 8.5 L 14.0 8.5 L 16.4 7.3 L 19.6 4.4 L 21.8 2.0 L 23.7 -.7 L 26.2 -4.2 L 27.9 -7.2 L 28.7 -9.6 L 30.0 -11.6 L 31.7 -12.4 L 33.1 -12.6 L 30.7 -11.1 L 29.1 -9.3 L 27.5 -3.7 L 25.7 2.5 L 23.5 9.2 L 21.9 12.6 L 20.0 15.7 L 18.4 18.0 L 16.4 20.0 L 13.7 21.7 L 11.2 22.1 L 10.0 21.7 L 9.1 20.1 L 9.2 18.4 L 10.2 16.4 L 12.4 13.8 L 15.5 10.9 L 19.5 8.7 L 22.2 7.7 L 27.1 6.1 L 28.0 6.1","0 19.9 M 13.6 -8.6 L 13.3 -10.4 L 14.7 -12.0 L 17.1 -13.0 L 21.1 -13.2 L 24.9 -12.9 L 27.9 -12.4 L 30.4 -11.6 L 32.3 -11.1 L 34.0 -11.6 L 35.1 -12.2 L 35.5 -13.3 L 34.5 -13.5 L 33.1 -12.7 L 31.9 -11.5 L 27.9 -8.1 L 23.5 -3.7 L 20.5 -.2 L 18.6 1.9 L 16.2 4.3 L 14.2 5.7 L 12.4 7.0 L 10.8 7.8 L 9.6 8.1 L 9.0 7.3 L 9.5 6.7 L 11.0 7.3 L 13.6 8.3 L 16.7 10.6 L 21.0 13.3 L 25.3 15.5 L 30.3 15.5 L 32.7 14.3 L 33.8 12.1 L 33.6 11.2 L 33.4 10.3 M 16.6 -1.8 L 16.5 -1.2 L 28.7 -1.8","0 16.7 M 27.1 -11.7 L 23.1 -11.7 L 19.1 -5.9 L 14.7 1.5 L 12.0 6.6 L 11.2 8.6 L 15.4 8.6","0 12.1 M 10.4 -11.7 L 13.7 -5.2 L 15.8 .2 L 17.2 3.9 L 18.8 8.1","0 16.2 M 22.6 -11.8 L 26.6 -11.6 L 24.2 -6.1 L 20.5 .2 L 17.9 4.3 L 14.9 8.6 L 10.7 8.4","0 25.1 M 14.9 -12.0 L 21.0 -15.3 L 24.4 -11.9","0 22.5 M 8.1 10.1 L 30.4 10.1","0 12.9 M 11.3 -7.6 L 15.4 -5.1","0 16.7 M 24.7 3.2 L 23.5 4.8 L 21.9 6.5 L 19.5 8.0 L 17.6 8.4 L 16.7 7.0 L 17.1 4.5 L 18.4 .3 L 17.8 1.3 L 14.6 4.4 L 11.2 7.2 L 8.4 8.4 L 7.0 6.9 L 7.2 4.1 L 10.1 .7 L 13.7 -1.5 L 16.3 -2.3 L 18.9 -2.3 L 19.3 -1.9","0 13.2 M 8.0 3.2 L 10.5 1.0 L 13.2 -1.4 L 16.4 -3.9 L 18.9 -6.1 L 21.5 -9.5 L 22.2 -12.4 L 20.8 -13.9 L 18.0 -12.6 L 15.2 -8.9 L 12.1 -2.4 L 10.2 2.6 L 9.9 6.7 L 10.2 7.3 L 10.6 4.4 L 13.2 1.3 L 16.9 -1.0 L 19.6 -1.6 L 20.6 -.4 L 20.7 1.0 L 19.4 3.2 L 18.1 5.2 L 15.0 7.7 L 13.3 8.4 L 8.6 9.3","0 11.0 M 16.7 -.7 L 16.6 -2.1 L 15.3 -2.6 L 12.2 -1.4 L 8.5 2.4 L 7.5 3.6 L 6.7 5.5 L 6.9 6.9 L 7.5 8.2 L 10.8 8.5 L 14.9 7.2 L 17.5 5.1 L 19.0 3.2","0 12.1 M 19.4 -.9 L 18.6 -2.3 L 17.2 -2.7 L 13.8 -1.6 L 10.5 .6 L 7.8 3.4 L 7.0 5.6 L 7.2 7.4 L 9.4 8.5 L 11.5 7.0 L 14.6 4.3 L 17.8 1.0 L 21.3 -1.6 L 25.9 -5.5 L 30.2 -9.8 L 31.0 -12.2 L 30.9 -13.5 L 29.3 -13.9 L 26.8 -12.7 L 25.2 -11.1 L 23.0 -7.6 L 21.3 -4.5 L 18.3 2.1 L 16.8 6.9 L 16.4 10.4 L 17.2 12.1 L 18.6 12.6 L 19.8 12.2","0 11.0 M 11.1 3.6 L 13.7 2.3 L 15.9 1.1 L 17.0 -.7 L 16.6 -2.1 L 14.7 -2.3 L 11.0 -.1 L 9.5 1.0 L 7.9 2.9 L 6.9 4.6 L 6.7 6.2 L 7.4 7.6 L 10.0 8.7 L 14.4 7.6 L 15.8 6.4 L 17.8 4.7 L 19.0 3.2","0 10.6 M 5.5 20.6 L 7.1 19.2 L 9.3 12.0 L 12.3 4.1 L 15.3 -2.7 L 17.8 -7.4 L 19.4 -10.6 L 22.3 -13.1 L 23.8 -13.8 L 25.6 -13.1 L 25.1 -10.0 L 21.9 -5.1 L 18.2 -1.2 L 16.0 .7 L 14.5 2.0 L 12.7 2.9 L 9.8 3.2 L 9.9 2.4 L 15.6 2.5 L 18.7 2.1","0 14.9 M 18.7 -2.1 L 15.2 -2.2 L 11.2 -.1 L 8.5 2.5 L 7.2 3.8 L 6.5 5.5 L 7.1 7.2 L 8.4 8.4 L 11.9 6.8 L 14.6 4.0 L 17.4 1.0 L 18.1 .3 L 19.1 .3 L 14.2 11.7 L 10.1 19.5 L 8.3 21.1 L 6.7 22.0 L 5.3 22.2 L 3.7 21.1 L 4.3 17.9 L 6.5 16.0 L 9.7 13.2 L 11.7 11.8 L 17.2 8.3 L 20.7 5.5 L 22.9 3.2","0 17.8 M 8.0 3.2 L 12.6 -1.0 L 19.9 -6.3 L 23.2 -10.2 L 23.9 -13.3 L 21.5 -13.8 L 19.3 -12.0 L 17.1 -9.6 L 14.7 -5.5 L 12.2 -.8 L 9.4 8.0 L 12.5 4.3 L 15.1 1.0 L 18.1 -1.0 L 19.4 -1.6 L 20.1 -.9 L 19.8 .7 L 18.2 3.2 L 17.3 6.6 L 18.0 8.4 L 20.1 8.4 L 22.1 7.0 L 24.3 4.9 L 25.8 3.2","0 7.9 M 8.0 3.2 L 10.2 1.5 L 10.9 -1.4 L 7.8 6.3 L 8.4 8.3 L 10.7 8.8 L 13.2 6.8 L 14.8 4.9 L 15.9 3.2 M 12.9 -6.1 L 12.0 -4.9","0 8.2 M 8.0 3.2 L 11.1 -.1 L 12.3 -.9 L 12.6 -.5 L 6.4 13.6 L 3.5 18.8 L 1.3 21.4 L -.7 22.2 L -2.6 21.9 L -3.3 20.2 L -2.4 18.1 L 1.0 14.8 L 6.8 10.9 L 10.8 8.0 L 13.8 5.6 L 16.2 3.2 M 15.5 -6.3 L 14.3 -5.1 L 14.9 -4.6","0 11.3 M 8.0 3.2 L 10.0 1.0 L 12.1 -1.7 M 11.3 -2.3 L 14.0 -2.3 L 17.6 -4.6 L 21.1 -8.2 L 22.9 -10.9 L 23.3 -13.1 L 21.9 -14.1 L 19.1 -13.1 L 16.9 -10.6 L 14.8 -6.8 L 13.0 -3.5 L 9.6 4.6 L 8.4 8.6 L 9.8 7.3 L 12.6 3.5 L 15.8 .0 L 18.2 -1.9 L 19.8 -2.0 M 13.4 1.1 L 14.9 7.6 L 17.2 11.7 L 20.5 13.7 L 22.6 13.7 L 23.5 12.8 L 23.6 12.2 L 23.5 11.1","0 8.3 M 8.2 3.4 L 11.9 .6 L 16.6 -4.6 L 20.0 -9.7 L 21.5 -12.0 L 21.1 -13.5 L 18.9 -13.8 L 16.7 -12.4 L 13.7 -7.9 L 10.3 -1.8 L 8.1 2.7 L 7.4 6.3 L 8.3 8.2 L 10.4 8.4 L 12.8 7.3 L 15.2 4.8 L 16.3 3.2","0 21.8 M 8.0 3.2 L 10.5 .9 L 11.4 -1.2 L 7.9 8.1 L 10.2 5.7 L 14.3 1.0 L 16.4 -.8 L 17.9 -1.7 L 18.6 -1.8 L 18.8 -.9 L 18.4 .3 L 15.6 5.6 L 19.1 2.8 L 21.8 .7 L 24.6 -.3 L 23.2 1.7 L 21.7 6.0 L 22.1 7.8 L 24.0 8.4 L 26.8 6.8 L 29.8 3.2","0 18.4 M 13.7 -1.4 L 10.3 8.2 L 14.8 3.1 L 17.6 .1 L 19.6 -1.1 L 21.1 -1.7 L 21.5 -.9 L 19.5 2.8 L 18.2 5.8 L 18.3 7.5 L 19.4 8.5 L 21.3 8.2 L 23.3 6.8 L 25.3 4.8 L 26.4 3.2","0 12.4 M 15.2 -1.7 L 13.5 -2.6 L 11.1 -1.0 L 8.8 1.6 L 7.7 3.9 L 7.2 6.6 L 9.4 8.7 L 12.2 7.7 L 14.8 5.5 L 16.3 2.4 L 16.6 1.2 L 16.6 .0 L 16.0 .0 M 14.3 4.0 L 14.8 5.8 L 15.8 6.7 L 17.1 6.6 L 18.4 5.5 L 20.4 3.2","0 11.3 M 9.8 -2.4 L 6.7 7.2 L 3.4 15.1 L 1.8 20.1 L .9 20.7 L 6.1 7.8 L 7.6 8.6 L 11.7 7.0 L 15.6 4.7 L 17.2 1.8 L 17.5 -.5 L 16.2 -2.0 L 13.4 -1.2 L 11.3 .3 L 9.5 2.7 L 8.2 4.3 L 6.1 8.0","0 17.2 M 19.3 -1.6 L 16.1 -2.4 L 11.8 -.3 L 7.9 3.3 L 7.1 5.2 L 7.3 6.8 L 8.0 8.1 L 10.1 8.2 L 12.8 6.6 L 14.9 4.1 L 19.0 .0 L 22.4 -4.2 L 20.8 -3.9 L 17.1 6.1 L 13.4 15.5 L 13.1 20.1 L 14.1 21.8 L 16.8 21.8 L 17.9 20.3 L 18.3 16.9 L 17.9 12.5 L 16.8 7.9 L 19.2 8.1 L 22.1 6.5 L 24.1 4.7 L 25.1 3.2","0 11.7 M 8.0 3.2 L 10.1 -.1 L 13.9 -5.7 L 10.5 -3.4 L 10.5 -2.6 L 10.9 -2.3 L 17.2 -2.2 L 13.6 2.2 L 11.6 5.8 L 12.1 8.3 L 14.9 8.1 L 18.4 4.8 L 19.7 3.2","0 9.6 M 8.0 3.2 L 9.3 2.1 L 10.1 .7 L 11.1 -1.4 L 12.7 -3.5 L 16.9 -5.2 L 18.3 -5.4 L 19.9 -5.1 L 20.1 -4.1 L 19.9 -3.1 L 19.4 -2.6 M 10.7 .3 L 11.3 1.6 L 14.1 3.2 L 15.3 4.7 L 15.2 6.2 L 13.8 7.9 L 11.5 9.2 L 10.0 9.9 L 8.2 10.0 L 7.9 9.6 L 7.9 8.5 L 8.5 7.9","0 9.2 M 8.0 3.2 L 9.6 1.9 L 10.7 .7 L 12.5 -1.7 L 14.8 -5.5 L 15.9 -7.2 L 14.8 -7.4 L 9.3 4.2 L 8.8 6.9 L 9.6 8.3 L 12.1 8.1 L 15.1 5.5 L 17.2 3.2 M 10.7 -2.0 L 17.2 -2.3","0 15.7 M 10.5 -.8 L 8.4 2.1 L 7.3 5.1 L 7.2 7.2 L 8.7 8.1 L 11.5 7.3 L 13.6 4.6 L 16.2 1.4 L 18.3 -2.2 L 19.3 -1.9 L 15.8 3.8 L 15.5 5.9 L 15.4 7.3 L 17.1 8.3 L 19.2 7.7 L 22.1 5.2 L 23.7 3.2","0 10.2 M 8.0 3.2 L 10.8 .3 L 11.3 -.9 L 11.2 -1.7 L 10.1 -2.3 L 9.0 -2.3 M 10.3 -1.6 L 9.9 3.6 L 9.0 6.3 L 9.0 8.7 L 13.0 3.1 L 16.1 -.5 L 19.1 -3.1 L 21.8 -4.7 L 23.2 -4.3","0 17.6 M 11.2 -2.0 L 8.6 1.8 L 7.2 5.2 L 7.0 6.8 L 7.4 8.0 L 8.9 8.4 L 10.8 7.7 L 12.8 5.4 L 15.2 1.8 L 16.5 -.2 L 17.4 -.1 L 15.5 3.4 L 15.2 6.3 L 16.1 8.0 L 17.9 8.5 L 21.4 6.4 L 24.9 2.5 L 26.5 -.9 L 26.5 -2.7 L 25.8 -4.4 L 24.1 -4.8","0 15.5 M 8.0 3.2 L 10.9 -.7 L 13.0 -1.2 L 13.5 .2 L 14.0 2.6 L 14.7 5.3 L 15.4 7.7 L 17.6 8.6 L 19.8 7.7 L 21.6 5.8 L 23.5 3.2 M 21.7 -2.0 L 20.5 -1.9 L 16.2 1.5 L 12.5 4.7 L 8.9 8.8 L 6.4 12.2 L 5.9 13.2 L 5.3 14.8","0 15.5 M 11.8 -.9 L 9.1 1.6 L 8.0 3.1 L 7.5 4.8 L 7.3 6.3 L 7.8 7.5 L 9.4 8.0 L 11.2 7.5 L 14.6 4.2 L 17.9 .2 L 19.6 -1.6 L 20.7 -1.5 L 17.7 4.6 L 14.8 12.1 L 12.4 16.3 L 9.9 20.0 L 8.1 21.6 L 4.7 21.5 L 3.7 20.0 L 5.1 17.0 L 8.5 14.3 L 12.9 11.1 L 17.4 8.7 L 21.9 5.1 L 23.5 3.2","0 17.5 M 10.1 2.6 L 11.7 .2 L 13.6 -1.5 L 15.8 -1.8 L 18.6 -1.0 L 21.2 -.4 L 23.2 -1.1 L 23.5 -1.8 L 22.7 -2.3 L 21.6 -1.6 L 19.8 .1 L 13.0 6.3 L 10.9 8.3 L 9.1 8.7 L 8.6 7.8 L 9.6 6.9 L 11.1 6.9 L 12.7 7.7 L 16.0 9.5 L 19.0 9.6 L 21.2 8.1 L 23.9 5.3 L 25.5 3.2","0 15.5 M 22.7 -12.2 L 18.5 -11.4 L 16.4 -8.3 L 16.2 -5.1 L 15.0 -3.2 L 13.2 -2.7 L 11.0 -2.5 L 13.0 -1.4 L 13.9 .3 L 12.9 2.4 L 11.4 4.0 L 10.1 6.7 L 11.3 9.1 L 12.6 9.6 L 14.0 9.9","0 9.4 M 13.2 -12.7 L 13.0 9.9","0 17.7 M 20.8 -12.4 L 23.2 -12.1 L 24.3 -10.9 L 24.0 -9.0 L 22.7 -7.2 L 21.6 -5.1 L 20.7 -3.2 L 22.3 -2.5 L 24.3 -2.3 L 20.9 -1.0 L 19.3 .3 L 18.6 1.8 L 18.3 4.4 L 17.1 6.6 L 14.1 9.6 L 12.8 9.9 L 9.9 10.0","0 15.6 M 14.1 -5.7 L 15.2 -6.8 L 16.8 -6.8 L 19.2 -6.0 L 21.2 -5.2 L 21.9 -5.9 L 22.4 -6.3","0 13.2 M 14.2 -15.9 L 13.1 -14.3 L 13.0 -12.8 L 14.4 -11.5 L 17.1 -10.8 L 19.2 -12.3 L 19.3 -15.4 L 18.0 -16.5 L 17.0 -16.7 L 15.5 -16.8 L 14.2 -15.9"]
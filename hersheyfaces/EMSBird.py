@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 8.4 M 19.1 -14.1 L 19.9 -14.0 L 15.8 -6.3 L 13.5 -.8 L 13.4 .6 L 13.5 1.2 M 11.5 6.1 L 10.9 7.3","0 13.3 M 14.8 -12.3 L 15.1 -10.6 L 13.6 -8.1 L 11.6 -6.2 M 19.0 -12.3 L 19.3 -10.6 L 17.8 -8.1 L 15.8 -6.2","0 25.0 M 20.4 -9.5 L 14.9 5.8 M 27.5 -9.5 L 21.8 6.0 M 10.9 1.1 L 28.6 1.2 M 13.2 -5.1 L 31.5 -5.2","0 21.5 M 24.5 -6.8 L 24.5 -8.0 L 23.7 -9.1 L 22.1 -9.3 L 20.4 -9.3 L 18.2 -8.5 L 16.5 -7.5 L 15.2 -6.4 L 14.6 -4.6 L 15.4 -2.6 L 16.9 -1.5 L 20.3 -.4 L 21.8 .8 L 22.5 2.3 L 22.4 3.7 L 21.4 5.0 L 18.9 6.6 L 17.0 7.4 L 14.7 7.6 L 13.5 7.6 L 12.7 7.1 L 12.1 6.0 M 23.1 -13.2 L 15.1 9.8 L 14.6 11.5 L 14.6 12.4 L 14.9 13.5","0 19.6 M 15.4 -11.1 L 13.3 -9.0 L 11.7 -6.6 L 11.1 -4.7 L 11.6 -3.2 L 12.9 -3.4 L 14.8 -4.3 L 16.4 -6.1 L 17.4 -8.0 L 17.7 -9.1 L 18.1 -10.1 L 18.2 -11.3 L 17.8 -11.9 L 16.9 -12.1 L 16.1 -11.8 L 18.0 -9.6 L 19.1 -9.6 L 22.6 -10.5 L 26.2 -11.5 L 17.4 -.5 L 12.9 5.9 L 11.8 8.1 L 11.4 9.2 L 11.4 10.4 L 11.6 10.5 M 21.5 1.6 L 19.0 4.0 L 17.4 6.5 L 16.8 8.1 L 17.1 9.4 L 18.4 9.9 L 20.1 8.9 L 21.9 6.7 L 23.0 5.2 L 23.5 4.1 L 23.8 2.7 L 23.9 1.6 L 23.2 1.1 L 21.9 1.4 L 22.2 2.5 L 23.6 3.1 L 24.2 3.2","0 28.2 M 26.2 -5.5 L 26.6 -5.7 L 28.9 -6.5 L 30.5 -7.9 L 31.5 -9.3 L 31.6 -10.3 L 31.1 -11.5 L 30.3 -12.4 L 28.4 -13.0 L 26.4 -13.0 L 21.9 -12.4 L 17.5 -10.9 L 15.4 -9.4 L 13.7 -7.3 L 13.2 -5.5 L 13.4 -3.8 L 14.9 -3.0 L 16.6 -2.7 L 18.3 -2.8 L 20.8 -3.1 L 16.4 -1.6 L 14.1 -.3 L 12.3 1.6 L 11.2 3.8 L 11.2 5.7 L 12.4 7.1 L 14.7 8.3 L 18.5 8.4 L 22.6 7.6 L 25.8 5.9 L 28.2 3.7 L 28.8 1.3 L 28.4 -.7 L 27.7 -1.2 L 26.8 -1.8 M 21.7 1.0 L 21.7 -.2 L 22.8 -1.6 L 23.8 -2.1 L 25.8 -2.1 L 28.6 -1.5 L 30.9 -.9 L 32.8 -.5 L 33.9 -.5 L 35.0 -.9","0 6.6 M 15.9 -9.9 L 16.6 -10.2 L 16.6 -8.7 L 15.6 -6.5 L 14.5 -5.3 L 13.4 -4.4","0 8.7 M 21.8 -14.1 L 19.4 -13.9 L 15.5 -12.3 L 11.9 -9.4 L 9.5 -5.9 L 8.2 -2.7 L 7.5 2.2 L 7.8 5.3 L 8.8 8.3 L 10.3 9.3 L 10.8 9.5","0 12.5 M 14.9 -14.4 L 17.7 -13.9 L 19.5 -12.4 L 20.4 -10.1 L 20.1 -6.3 L 18.9 -2.8 L 16.9 .9 L 14.7 3.7 L 11.9 6.6 L 9.5 8.3 L 6.9 8.9","0 6.5 M 8.8 -13.5 L 13.1 -10.9 M 11.1 -14.6 L 11.1 -9.8 M 13.2 -13.6 L 9.0 -11.0","0 12.4 M 15.7 -2.0 L 12.9 7.3 M 10.4 2.2 L 18.9 2.1","0 6.4 M 11.4 7.0 L 12.4 6.3 L 11.7 8.8 L 10.4 10.9 L 8.6 12.8","0 9.4 M 9.7 2.5 L 9.1 3.2 L 15.2 3.0","0 7.9 M 12.9 6.1 L 12.0 6.9 L 12.5 7.5 L 12.9 6.1 L 12.9 6.1","0 19.9 M 26.4 -15.0 L 20.9 -8.4 L 16.8 -3.0 L 13.5 1.8 L 10.9 5.8 L 9.3 8.6 L 8.8 9.9 L 9.0 11.1 L 9.2 11.5","0 10.6 M 11.4 8.0 L 13.0 7.8 L 15.0 5.9 L 16.2 3.5 L 16.9 1.0 L 17.2 -1.7 L 16.9 -3.6 L 15.6 -4.3 L 13.9 -3.9 L 11.9 -1.7 L 10.6 .7 L 10.0 3.3 L 9.9 5.6 L 10.2 7.4 L 11.4 8.0","0 8.9 M 10.5 7.8 L 15.0 -4.5 L 13.4 -2.8 L 11.3 -1.3 L 9.3 -.1","0 13.1 M 13.0 -3.9 L 10.7 -2.0 L 13.6 -3.4 L 16.5 -4.2 L 18.6 -4.3 L 19.8 -3.4 L 19.7 -1.6 L 18.0 .8 L 14.9 3.6 L 11.3 5.9 L 9.4 6.6 L 8.5 7.3 L 8.6 7.7 L 11.7 6.9 L 15.2 6.2 L 18.0 6.0 L 19.4 6.3 L 19.8 6.8 L 19.8 7.7 L 19.3 8.6","0 16.2 M 15.8 -3.8 L 13.7 -2.1 L 16.6 -3.4 L 19.6 -4.4 L 21.7 -4.2 L 22.6 -3.4 L 22.7 -1.8 L 21.7 -.5 L 19.7 .9 L 17.1 1.8 L 14.2 2.3 L 17.0 2.0 L 19.3 2.1 L 21.1 2.7 L 22.3 4.5 L 22.2 7.0 L 21.0 9.5 L 18.9 11.4 L 16.1 12.9 L 12.9 13.5 L 10.4 13.2 L 8.4 11.6 L 8.1 9.5 L 9.2 7.7 L 11.0 6.6 L 12.8 6.4","0 14.9 M 16.9 11.1 L 16.7 12.2 L 16.0 13.2 L 18.4 5.9 L 20.3 .6 L 22.4 -4.4 L 17.3 -.1 L 12.1 4.3 L 8.2 7.3 L 11.0 6.8 L 14.2 6.5 L 17.2 6.3 L 19.8 6.1 L 21.2 6.3 L 22.0 6.7 L 21.9 7.4 L 21.5 8.6","0 15.7 M 13.6 6.4 L 11.1 7.1 L 9.6 8.7 L 9.5 10.9 L 10.8 12.3 L 13.0 12.9 L 16.3 12.6 L 19.2 11.3 L 21.4 9.0 L 22.2 6.1 L 21.9 4.0 L 20.2 2.4 L 18.2 1.8 L 15.8 2.1 L 13.9 2.6 L 16.4 -3.5 L 16.2 -3.5 L 20.0 -4.2 L 22.9 -4.4 L 24.6 -4.2 L 25.4 -3.8 L 25.4 -3.2 L 25.0 -2.0","0 18.7 M 25.0 -11.5 L 23.1 -10.0 L 19.6 -7.7 L 15.6 -4.3 L 12.4 -.5 L 10.9 2.1 L 10.5 4.4 L 11.0 6.3 L 12.4 7.4 L 15.4 7.3 L 18.6 6.2 L 21.7 3.8 L 23.6 1.3 L 24.5 -.9 L 24.2 -2.5 L 23.2 -3.4 L 21.0 -3.2 L 18.5 -1.9 L 16.4 .5 L 14.9 2.8 L 14.5 4.1 L 14.3 6.0","0 13.7 M 9.9 -4.2 L 8.9 -.3 L 9.6 -1.5 L 10.6 -2.9 L 11.9 -3.8 L 14.2 -4.0 L 17.1 -3.7 L 21.0 -3.3 L 21.7 -3.9 L 16.3 1.2 L 13.3 4.4 L 11.1 7.5 L 10.0 9.8 L 9.1 12.1 L 9.1 13.7","0 13.5 M 21.3 -6.6 L 21.6 -7.6 L 21.1 -8.8 L 19.6 -9.5 L 17.6 -9.4 L 15.3 -8.7 L 13.7 -7.5 L 12.8 -5.3 L 13.4 -3.2 L 14.9 -1.5 L 17.1 -.1 L 18.9 1.6 L 19.8 3.4 L 19.3 5.0 L 17.3 6.7 L 15.0 7.8 L 12.4 8.2 L 10.2 7.6 L 9.4 6.5 L 9.5 4.4 L 11.0 2.3 L 12.9 .8 L 18.0 -2.4 L 20.7 -3.9 L 22.8 -5.9 L 23.8 -7.8 L 24.1 -9.7","0 16.9 M 11.6 7.4 L 10.5 8.0 L 10.1 8.8 L 11.7 7.8 L 14.3 5.8 L 17.4 3.6 L 20.3 .6 L 22.4 -2.4 L 23.3 -5.0 L 23.7 -7.3 L 23.3 -9.0 L 20.6 -10.2 L 17.7 -9.7 L 14.2 -8.3 L 11.5 -5.9 L 10.6 -4.0 L 10.4 -2.2 L 10.9 -.7 L 12.6 .0 L 14.6 -.2 L 17.7 -1.8 L 19.8 -4.0 L 21.2 -6.3 L 21.4 -8.1","0 6.5 M 13.8 -3.6 L 12.9 -2.6 L 13.4 -1.8 M 12.3 3.3 L 11.5 4.4 L 11.9 5.1","0 6.5 M 14.1 -.1 L 13.2 1.0 L 13.4 1.7 M 11.3 7.2 L 12.3 6.3 L 11.9 8.6 L 10.7 10.5 L 9.3 12.1","0 10.4 M 14.9 -6.5 L 11.3 -1.4 L 15.0 2.9","0 13.1 M 12.7 -.3 L 11.9 .5 L 15.9 .5 L 18.5 .1 M 12.7 2.4 L 11.9 3.2 L 15.9 3.2 L 18.5 2.8","0 10.2 M 10.8 -6.3 L 13.6 -3.1 L 14.5 -2.4 L 10.9 2.9","0 15.2 M 14.4 -6.3 L 13.2 -6.7 L 12.9 -7.9 L 13.1 -9.1 L 13.9 -10.4 L 15.4 -11.7 L 17.5 -12.7 L 19.8 -13.4 L 21.6 -13.5 L 23.4 -13.2 L 24.5 -12.5 L 25.1 -11.8 L 25.3 -10.1 L 25.1 -8.9 L 23.5 -6.4 L 22.0 -5.1 L 18.8 -3.0 L 15.9 -1.2 L 14.9 -.3 L 14.0 .8 L 13.7 2.0 L 13.9 2.3 M 13.0 5.8 L 12.1 6.9 L 12.5 7.6","0 29.3 M 15.7 -13.4 L 17.8 -13.4 L 20.6 -13.4 L 24.4 -12.6 L 27.2 -12.1 L 30.3 -10.6 L 32.3 -8.9 L 33.9 -6.5 L 34.5 -4.3 L 34.5 -2.9 L 34.0 -1.1 L 32.9 1.2 L 30.5 3.6 L 28.2 5.1 L 24.8 6.6 L 21.5 7.3 L 17.9 7.2 L 15.2 6.3 L 13.0 4.0 L 11.6 1.0 L 11.3 -2.0 L 12.6 -6.5 L 14.6 -9.2 L 17.8 -11.8 L 19.9 -13.0 L 22.5 -13.9 L 25.8 -14.3 L 28.0 -14.6 L 30.9 -14.3 L 33.2 -12.9 L 34.1 -11.4 L 34.2 -10.2 L 34.0 -8.6 L 33.2 -6.3 L 32.4 -4.5 L 30.2 -1.2 L 28.9 .3 L 27.4 1.7 L 26.0 2.9 L 24.7 3.3 L 23.7 3.1 L 23.5 2.3 L 24.0 -.1 L 25.2 -4.6 L 26.2 -6.4 L 27.2 -7.7 L 27.3 -8.4 L 26.6 -8.3 L 26.1 -6.7 L 25.5 -4.8 L 23.4 -2.2 L 21.7 -.2 L 20.3 1.5 L 18.4 2.9 L 17.6 2.8 L 17.5 1.1 L 18.9 -3.1 L 20.1 -5.4 L 21.7 -7.6 L 22.6 -8.3 L 23.7 -8.6 L 24.7 -8.6 L 26.6 -8.2","0 20.2 M 9.4 7.7 L 9.4 7.7 L 10.8 3.2 L 12.8 -1.1 L 15.7 -5.7 L 18.0 -8.8 L 20.3 -11.5 L 21.7 -12.9 L 22.4 -13.5 L 22.5 -14.0 L 22.0 -14.3 L 21.6 -13.9 L 22.7 -12.0 L 24.3 -6.3 L 25.1 -1.0 L 25.6 4.1 L 25.9 7.3 M 10.9 -1.7 L 26.3 -1.8","0 20.0 M 11.2 -13.6 L 16.6 -13.2 L 20.6 -11.9 L 23.0 -10.2 L 23.6 -8.1 L 22.5 -5.4 L 19.7 -3.4 L 17.1 -2.5 L 14.4 -2.1 L 12.0 -2.0 L 17.5 -2.3 L 22.2 -2.1 L 24.8 -1.4 L 26.6 .5 L 26.7 3.1 L 24.7 5.3 L 21.7 7.0 L 16.7 7.9 L 10.8 7.5 L 12.0 7.5 L 12.0 8.2 L 11.9 2.5 L 12.0 -4.3 L 13.1 -9.8 L 14.1 -14.6 L 14.5 -14.8","0 22.4 M 26.9 -8.6 L 27.1 -8.7 L 27.6 -9.6 L 27.3 -11.7 L 25.3 -13.3 L 22.6 -13.7 L 18.4 -13.3 L 14.9 -11.3 L 12.3 -8.6 L 10.4 -4.2 L 10.0 -.3 L 10.9 4.1 L 13.1 6.3 L 16.1 7.9 L 19.5 8.3 L 23.2 7.7 L 26.4 6.2 L 27.9 5.2 L 29.0 3.8 L 29.0 3.3","0 24.0 M 11.4 -13.2 L 12.3 -13.4 L 16.2 -13.4 L 20.7 -13.0 L 24.0 -12.2 L 26.8 -10.9 L 29.1 -9.1 L 30.8 -6.6 L 31.2 -3.5 L 30.0 -.1 L 27.8 2.9 L 24.7 5.1 L 20.0 7.0 L 15.8 7.8 L 13.3 7.6 L 11.7 7.0 L 11.6 3.3 L 12.1 -3.7 L 13.0 -8.9 L 14.2 -14.7 L 14.7 -15.1","0 18.9 M 14.8 -14.9 L 13.6 -11.4 L 12.5 -4.9 L 11.9 1.9 L 11.7 7.3 L 10.8 7.2 L 24.2 7.2 L 24.6 6.8 M 11.2 -3.1 L 22.1 -3.2 M 11.3 -13.5 L 11.9 -13.4 L 24.6 -13.4 L 24.7 -12.7","0 15.5 M 10.9 6.3 L 11.2 7.4 L 10.6 7.5 L 10.9 1.7 L 11.7 -5.4 L 12.7 -10.4 L 13.7 -14.6 L 14.3 -15.0 M 10.8 -13.6 L 24.1 -13.2 L 24.1 -12.5 M 10.4 -3.2 L 21.5 -3.2","0 24.4 M 28.6 -8.4 L 29.3 -9.5 L 29.3 -11.2 L 27.7 -12.8 L 25.0 -13.5 L 21.3 -13.5 L 16.2 -11.8 L 12.8 -8.7 L 10.8 -5.0 L 10.1 -1.2 L 10.7 2.6 L 12.3 5.5 L 15.2 7.5 L 18.9 8.3 L 22.2 8.0 L 25.5 6.8 L 27.4 5.2 L 28.9 3.6 L 29.4 2.0 L 29.8 -.9 L 29.0 3.8 L 28.8 5.9 L 28.6 7.9 M 21.7 -1.0 L 31.8 -.9","0 19.4 M 14.4 -13.3 L 12.7 -9.2 L 11.5 -2.2 L 11.2 2.3 L 11.0 7.5 M 10.7 -2.9 L 26.2 -2.9 M 27.1 -13.1 L 26.2 -10.1 L 25.1 -4.3 L 24.5 1.7 L 24.2 7.7","0 14.5 M 12.8 -13.4 L 22.5 -13.3 M 17.9 -14.1 L 15.9 -6.4 L 15.1 2.3 L 14.6 7.8 M 10.0 7.3 L 19.6 7.3","0 15.0 M 9.3 3.1 L 11.1 6.6 L 13.4 8.3 L 15.4 8.0 L 16.8 5.2 L 17.5 -.8 L 18.5 -8.7 L 19.0 -13.0 L 19.8 -14.2 M 14.5 -13.3 L 14.7 -13.3 L 23.6 -13.3","0 20.6 M 13.3 -11.4 L 13.6 -12.9 L 14.4 -13.5 L 13.0 -9.1 L 11.9 -1.8 L 11.4 2.8 L 11.1 7.6 M 28.5 -14.6 L 28.3 -13.7 L 24.3 -9.8 L 19.6 -6.3 L 16.0 -4.1 L 14.0 -3.5 L 12.3 -3.3 L 10.8 -3.3 L 13.7 -.5 L 16.5 2.6 L 19.3 5.2 L 22.1 7.3 L 24.7 8.1 L 26.0 7.5 L 26.8 5.5 L 26.7 2.7","0 19.2 M 13.4 -11.1 L 14.0 -12.6 L 15.3 -13.4 L 14.0 -11.1 L 13.0 -5.3 L 12.2 1.3 L 11.7 8.0 L 11.7 7.5 L 10.9 7.3 L 22.8 7.5 L 24.0 7.5 L 25.0 6.9","0 24.0 M 10.0 7.7 L 10.4 2.8 L 11.3 -1.7 L 12.2 -5.9 L 13.5 -9.8 L 15.4 -13.3 L 14.1 -13.3 L 13.5 -12.6 L 13.7 -10.0 L 14.1 -6.8 L 14.7 -3.1 L 16.9 1.2 L 19.0 2.5 L 21.7 1.4 L 24.2 -1.0 L 26.5 -4.2 L 28.3 -7.3 L 29.7 -9.5 L 30.2 -11.8 L 30.7 -13.2 L 29.2 -12.5 L 29.1 -10.2 L 29.0 -5.6 L 28.6 -.6 L 28.6 3.6 L 28.5 7.3 L 29.0 7.7","0 20.1 M 10.9 7.1 L 11.3 1.2 L 12.2 -4.1 L 13.1 -8.8 L 13.7 -10.8 L 14.4 -12.2 L 14.9 -13.0 L 14.8 -13.4 L 13.9 -12.9 L 13.6 -11.9 L 14.4 -10.7 L 14.9 -8.8 L 17.8 -5.1 L 20.2 -2.7 L 22.5 -.2 L 24.5 1.7 L 25.3 3.2 L 25.8 4.6 L 25.8 6.3 L 25.6 7.4 L 25.3 7.6 L 25.4 5.5 L 25.5 2.6 L 26.2 -3.5 L 27.1 -9.0 L 27.6 -12.2 L 28.4 -13.2","0 25.1 M 12.0 -9.8 L 15.4 -11.4 L 19.5 -12.4 L 23.2 -12.3 L 26.1 -12.1 L 29.1 -10.7 L 31.6 -8.1 L 32.1 -4.9 L 31.4 -.4 L 29.8 2.9 L 26.8 5.8 L 22.1 8.0 L 17.7 8.2 L 13.9 6.9 L 11.3 4.1 L 10.2 .2 L 10.9 -4.6 L 12.3 -7.6 L 14.2 -10.0 L 17.1 -13.0 L 20.4 -14.7 L 23.7 -15.5 L 25.7 -14.7 L 25.3 -13.7 L 24.2 -11.6","0 16.0 M 11.1 7.5 L 11.3 1.2 L 11.9 -3.6 L 12.9 -9.0 L 13.4 -12.0 L 14.1 -14.6 L 14.7 -14.8 M 11.3 -13.7 L 11.5 -13.7 L 16.8 -13.4 L 19.9 -12.6 L 22.7 -10.8 L 23.6 -8.3 L 22.4 -5.3 L 20.3 -3.3 L 17.5 -2.1 L 14.7 -1.9 L 11.8 -2.0","0 25.1 M 12.0 -9.8 L 12.2 -9.8 L 15.5 -11.4 L 18.8 -12.3 L 22.0 -12.5 L 25.5 -12.2 L 28.9 -11.1 L 30.9 -8.9 L 32.1 -5.6 L 31.9 -1.7 L 30.1 2.7 L 26.9 5.8 L 23.7 7.4 L 20.3 8.2 L 15.4 7.6 L 12.2 5.2 L 10.3 .8 L 10.8 -3.9 L 12.3 -7.5 L 14.7 -10.6 L 17.3 -13.0 L 20.3 -14.6 L 23.5 -15.4 L 25.0 -15.3 L 25.7 -14.7 L 25.5 -13.9 L 25.0 -12.5 L 24.3 -11.5 M 15.3 4.4 L 16.6 3.4 L 18.1 3.4 L 19.7 4.5 L 20.9 6.0 L 21.8 7.5 L 23.5 10.2 L 25.1 12.9 L 27.7 15.1 L 29.9 15.7 L 31.9 15.1 L 32.7 14.3 L 33.1 12.6","0 19.1 M 11.0 7.5 L 11.2 2.0 L 11.9 -3.3 L 13.0 -9.4 L 14.1 -14.2 L 14.6 -14.8 M 11.4 -13.6 L 16.8 -13.3 L 20.7 -12.3 L 22.8 -11.2 L 23.8 -9.4 L 23.7 -7.1 L 22.3 -4.9 L 19.9 -2.8 L 17.4 -2.1 L 14.9 -1.9 L 12.5 -1.8 L 10.9 -2.3 L 14.4 1.0 L 17.8 4.3 L 20.5 6.6 L 23.2 8.1 L 24.8 8.2 L 25.6 7.3 L 26.1 5.4 L 26.1 2.9","0 16.0 M 9.6 5.4 L 9.9 6.8 L 11.2 7.8 L 13.4 8.2 L 16.9 7.3 L 19.4 6.2 L 21.0 4.7 L 22.0 2.8 L 22.1 1.5 L 21.8 .3 L 20.5 -.7 L 16.8 -2.1 L 13.2 -4.0 L 11.5 -6.1 L 11.3 -8.5 L 12.6 -10.5 L 15.4 -12.6 L 18.4 -13.7 L 21.1 -13.7 L 22.6 -13.1 L 23.3 -11.8 L 23.0 -9.9","0 18.4 M 15.6 7.6 L 15.8 3.9 L 16.2 -1.9 L 17.1 -7.2 L 17.9 -11.5 L 18.0 -12.8 L 18.9 -13.6 M 9.5 -13.3 L 26.8 -13.3","0 18.5 M 12.0 -11.4 L 13.2 -13.3 L 14.2 -13.7 L 12.2 -9.4 L 11.0 -5.0 L 10.3 .4 L 10.6 4.7 L 11.5 6.4 L 13.6 7.2 L 16.0 6.2 L 18.4 3.7 L 20.8 .7 L 23.6 -3.7 L 25.1 -7.2 L 26.2 -10.4 L 27.1 -13.3 L 26.2 -13.0 L 25.6 -12.2 L 25.0 -6.8 L 24.3 -1.2 L 23.8 3.6 L 23.6 7.6","0 17.1 M 11.1 -11.4 L 11.6 -13.0 L 12.9 -14.2 L 12.0 -11.8 L 11.0 -7.1 L 10.8 -2.7 L 10.8 1.5 L 11.6 5.1 L 12.6 6.7 L 13.9 7.3 L 15.5 7.0 L 17.4 5.3 L 19.2 3.2 L 21.1 .3 L 23.0 -3.4 L 24.5 -7.4 L 25.6 -11.6 L 26.1 -13.4 L 26.0 -15.3","0 27.9 M 12.1 -11.2 L 12.9 -13.3 L 14.3 -14.1 L 12.8 -11.5 L 11.3 -7.0 L 10.7 -2.4 L 10.3 1.5 L 10.4 4.3 L 11.3 6.5 L 12.8 7.2 L 14.3 7.0 L 15.6 6.1 L 17.7 4.0 L 19.4 1.5 L 21.3 -2.0 L 22.3 -4.2 L 23.6 -8.6 L 24.4 -11.0 L 25.1 -12.5 L 24.4 -12.5 L 23.6 -11.6 L 23.7 -10.8 L 23.6 -9.1 L 22.9 -4.7 L 22.6 -.5 L 23.0 3.7 L 24.1 6.5 L 26.1 7.3 L 28.3 6.2 L 30.9 2.9 L 32.8 -.5 L 34.4 -4.9 L 35.7 -8.7 L 36.4 -11.5 L 36.1 -14.0","0 22.1 M 8.0 8.1 L 10.5 4.5 L 13.7 1.0 L 17.0 -2.3 L 20.8 -5.6 L 24.3 -9.0 L 26.3 -11.4 L 26.9 -12.7 L 27.0 -13.7 M 15.2 -13.5 L 14.0 -13.5 L 13.5 -12.6 L 14.4 -9.9 L 15.8 -5.6 L 18.1 -.1 L 20.7 4.5 L 22.7 7.2 L 23.9 7.7 L 25.1 7.5 L 26.5 6.4 L 27.6 4.8 L 28.8 1.7","0 14.6 M 10.5 -13.3 L 9.5 -13.0 L 9.6 -11.6 L 11.1 -6.8 L 12.8 -2.6 L 13.2 -1.3 L 12.5 2.9 L 11.7 5.4 L 11.0 6.9 L 11.4 7.0 L 12.3 5.3 L 12.2 4.3 M 13.2 -1.7 L 13.4 -1.7 L 16.7 -4.6 L 20.4 -8.5 L 22.3 -11.1 L 23.6 -13.7","0 18.4 M 13.1 -11.4 L 12.3 -12.5 L 14.6 -13.2 L 18.0 -13.4 L 21.3 -13.4 L 24.7 -13.2 L 25.5 -12.7 L 25.4 -11.5 L 23.6 -9.8 L 18.5 -4.4 L 14.7 -.6 L 11.2 3.2 L 9.5 5.4 L 8.8 6.4 L 9.2 7.3 L 13.0 6.6 L 17.2 6.0 L 22.3 5.7 L 24.3 6.1 L 24.9 6.5 L 24.9 7.5 L 24.2 8.5","0 19.2 M 25.7 -14.3 L 21.2 -14.2 L 20.3 -13.7 L 16.6 -8.8 L 13.9 -3.8 L 11.2 1.1 L 10.0 3.7 L 9.2 5.9 L 9.1 7.3 L 9.9 7.9 L 11.4 8.0 L 15.8 8.0","0 19.8 M 9.7 -14.6 L 14.2 -9.3 L 17.9 -4.4 L 21.1 -.1 L 24.5 4.8 L 25.9 7.0 L 26.7 8.7 L 27.3 10.0 L 27.3 10.7","0 18.1 M 18.7 -14.2 L 22.8 -14.3 L 25.2 -13.9 L 25.4 -13.1 L 24.7 -10.9 L 22.3 -5.9 L 19.9 -1.2 L 17.2 3.3 L 14.8 6.9 L 13.6 7.9 L 12.5 8.3 L 8.7 8.2","0 11.0 M 9.6 -7.3 L 13.2 -9.9 L 16.6 -7.5","0 11.1 M 8.3 8.4 L 18.5 8.4","0 11.6 M 10.8 -11.2 L 15.9 -8.2","0 10.9 M 17.7 -3.6 L 15.3 -4.1 L 13.5 -3.9 L 11.1 -.8 L 10.0 1.4 L 9.0 4.0 L 8.5 6.0 L 8.6 7.1 L 9.1 7.6 L 10.6 6.7 L 12.6 4.7 L 14.5 2.3 L 15.8 .6 L 16.8 -1.6 L 17.3 -2.8 L 17.7 -3.9 L 18.1 -4.1 L 17.9 -3.1 L 16.5 -.6 L 15.5 2.8 L 14.9 5.3 L 14.7 6.8 L 14.9 7.4 L 15.4 7.5 L 16.5 7.1 L 17.6 6.2 L 18.8 4.9","0 9.5 M 15.6 -13.1 L 15.0 -11.9 L 12.9 -5.6 L 10.9 .1 L 9.8 3.0 L 9.2 4.5 L 9.2 6.3 L 10.0 7.9 L 11.7 7.7 L 12.9 7.1 L 14.3 5.9 L 15.6 3.2 L 16.3 1.6 L 17.0 -.7 L 17.2 -2.4 L 17.2 -3.4 L 17.0 -4.0 L 15.9 -3.6 L 14.5 -2.3 L 12.7 .1 L 11.4 1.7 L 10.4 3.2 L 9.6 4.8 L 9.0 7.0 L 8.5 7.4 L 8.2 6.6 L 8.8 5.1 L 11.1 3.7 L 13.4 2.2 L 15.9 .6 L 18.0 -.3","0 7.5 M 15.8 -1.5 L 16.2 -2.7 L 15.9 -3.5 L 15.2 -4.0 L 13.5 -3.7 L 11.9 -2.5 L 10.2 .4 L 9.1 2.9 L 8.7 5.6 L 8.8 7.2 L 9.8 7.8 L 11.7 7.6 L 13.4 6.5 L 14.5 5.3 L 15.3 4.2","0 11.1 M 18.7 -3.3 L 15.9 -3.9 L 14.4 -3.9 L 12.7 -3.0 L 11.0 -.4 L 9.8 1.9 L 9.0 4.3 L 8.7 5.7 L 8.7 7.0 L 9.0 7.4 L 10.0 7.1 L 12.2 5.0 L 14.3 2.4 L 15.8 .7 L 17.8 -4.0 L 20.3 -10.9 L 20.2 -11.4 L 20.9 -13.1 L 21.2 -13.2 L 18.4 -4.8 L 16.4 .2 L 15.5 3.4 L 14.7 5.8 L 14.7 7.1 L 15.5 7.4 L 17.0 6.7 L 17.9 5.8 L 18.7 5.1","0 8.2 M 9.3 .9 L 11.7 1.3 L 14.2 1.2 L 15.4 .6 L 16.0 -.1 L 16.1 -1.5 L 15.7 -2.9 L 15.0 -3.6 L 13.8 -3.7 L 12.5 -3.0 L 11.2 -.8 L 9.9 2.2 L 9.3 4.2 L 9.1 6.0 L 9.5 7.6 L 10.6 8.0 L 11.9 7.6 L 13.5 6.4 L 14.9 4.5","0 6.9 M 20.7 -12.8 L 20.5 -13.4 L 18.5 -13.6 L 16.8 -13.0 L 15.2 -10.5 L 9.3 9.3 L 8.6 10.9 L 7.7 12.8 L 6.8 13.8 L 5.1 14.7 L 3.8 14.7 L 2.4 13.6 L 2.2 12.1 L 2.2 11.1 M 9.9 -3.9 L 17.5 -4.2","0 9.6 M 16.1 -3.5 L 14.2 -4.1 L 12.0 -2.1 L 11.0 .0 L 10.2 2.6 L 10.2 4.7 L 12.1 5.4 L 13.7 4.8 L 15.4 2.8 L 16.3 1.0 L 16.7 -.8 L 16.5 -1.7 L 16.3 -2.4 L 16.1 -4.7 L 16.8 -5.0 L 16.9 -2.6 L 17.8 -1.7 M 9.8 6.9 L 13.0 9.6 L 14.6 12.9 L 14.9 16.0 L 13.3 17.6 L 9.6 19.1 L 7.0 19.3 L 5.6 18.1 L 6.4 15.0 L 8.1 11.8 L 10.3 8.8","0 10.1 M 13.7 -9.3 L 15.2 -11.9 L 15.9 -12.5 L 12.4 -3.4 L 10.1 4.0 L 8.7 7.6 L 10.1 5.5 L 12.0 2.2 L 14.3 -1.3 L 16.2 -3.1 L 17.2 -3.8 L 18.2 -4.4 L 18.5 -4.1 L 16.8 -1.3 L 15.0 2.8 L 13.7 6.1 L 13.3 8.1 L 13.7 9.1 L 14.0 9.3 L 14.7 9.0 L 15.3 8.7","0 5.4 M 11.2 -1.1 L 12.4 -3.3 L 12.7 -3.8 L 13.4 -4.3 L 11.1 .6 L 10.3 3.2 L 9.4 5.8 L 8.9 7.4 L 9.1 7.6 L 10.4 7.3 L 12.5 6.0 M 15.6 -10.0 L 13.9 -8.4 L 13.7 -7.5","0 6.5 M 12.4 -1.4 L 13.2 -3.7 L 14.1 -4.3 L 11.5 3.4 L 9.8 9.9 L 9.1 12.9 L 8.0 14.9 L 6.7 16.1 L 5.7 16.6 L 4.6 16.7 L 3.5 16.0 L 2.7 14.9 L 2.7 12.6 M 16.2 -10.2 L 14.2 -8.7 L 14.3 -7.6","0 8.7 M 13.7 -9.4 L 15.1 -12.0 L 15.6 -12.4 L 13.0 -5.6 L 11.0 .0 L 9.5 5.0 L 8.8 7.6 L 8.2 8.3 M 18.9 -4.4 L 15.5 -1.9 L 12.9 .9 L 11.4 2.1 L 10.4 2.5 L 10.7 1.2 L 11.8 2.1 L 13.2 5.3 L 14.1 6.7 L 15.8 8.4","0 5.8 M 13.8 -9.5 L 14.5 -11.4 L 15.2 -12.2 L 15.8 -12.5 L 12.7 -4.3 L 10.6 2.2 L 9.4 6.2 L 9.1 7.3 L 9.4 7.5 L 11.2 6.6 L 12.7 5.9","0 15.9 M 11.3 -1.4 L 12.4 -3.8 L 13.0 -4.2 L 10.8 1.2 L 8.4 7.7 L 10.6 4.4 L 12.9 .9 L 14.6 -1.6 L 16.0 -3.0 L 17.8 -4.5 L 19.0 -4.7 L 18.5 -3.4 L 16.7 -.1 L 15.3 3.8 L 14.7 6.6 L 14.6 7.6 L 15.3 7.2 L 16.6 4.0 L 18.5 .7 L 20.3 -1.5 L 22.2 -3.0 L 23.6 -4.1 L 24.1 -4.4 L 25.2 -4.6 L 24.1 -2.9 L 22.4 1.1 L 20.7 4.8 L 20.1 7.2 L 20.0 8.4 L 20.1 8.9 L 20.9 9.2 L 22.1 8.4","0 10.5 M 11.1 -1.3 L 12.1 -3.5 L 12.9 -4.1 L 10.0 3.1 L 8.3 7.9 L 9.6 5.8 L 12.8 1.0 L 15.0 -2.0 L 16.7 -3.9 L 18.4 -4.8 L 18.9 -4.8 L 17.0 -1.2 L 15.3 3.2 L 14.5 6.0 L 14.3 8.0 L 14.7 8.8 L 15.3 8.8 L 16.2 8.2","0 8.4 M 15.6 -3.4 L 14.1 -4.1 L 12.0 -2.6 L 10.8 -.1 L 9.8 2.4 L 9.2 4.2 L 9.1 6.5 L 9.4 7.6 L 10.3 8.2 L 11.7 8.0 L 13.5 6.3 L 15.0 4.3 L 15.6 2.3 L 16.0 .6 L 15.9 -.9 L 16.0 -2.9 L 15.3 -4.7 L 14.8 -5.0 L 15.1 -3.0 L 16.4 -1.4 L 17.5 -1.4","0 9.8 M 13.3 -5.6 L 12.7 -4.8 L 6.6 13.9 L 6.2 15.2 L 6.1 16.5 L 6.8 15.3 M 11.5 -4.0 L 13.5 -3.7 L 15.0 -2.1 L 15.9 .5 L 16.2 2.9 L 16.1 5.8 L 14.3 7.5 L 12.4 8.0 L 11.4 7.9 L 10.4 7.4 L 9.3 6.7 L 8.8 5.9 L 9.3 5.1 L 11.5 3.6 L 14.2 2.1 L 16.8 1.1 L 18.7 .6","0 10.3 M 18.2 -3.8 L 16.2 -4.3 L 13.9 -3.3 L 11.7 -.1 L 9.9 3.3 L 9.1 6.0 L 9.1 7.0 L 9.3 7.4 L 10.3 7.2 L 12.3 5.8 L 14.5 3.5 L 16.2 1.3 L 17.3 -.2 L 18.1 -1.9 L 18.7 -3.4 L 19.2 -3.9 L 19.5 -3.6 L 19.4 -2.5 L 18.6 -1.6 L 17.9 -.7 L 15.8 4.5 L 13.7 10.3 L 12.9 13.6 L 12.9 14.4 L 13.4 15.0 L 14.3 14.6 L 17.4 12.3","0 8.8 M 10.3 -1.5 L 11.5 -3.7 L 12.5 -4.6 L 10.6 -.2 L 9.7 4.2 L 9.3 6.7 L 8.9 7.4 L 8.6 7.4 L 8.7 6.6 L 11.3 2.4 L 13.9 -1.5 L 15.5 -3.3 L 16.7 -4.1 L 17.5 -4.1 L 17.7 -3.4 L 16.7 -1.3","0 8.4 M 15.5 -.7 L 16.6 -2.5 L 16.6 -3.8 L 15.8 -4.0 L 13.5 -3.4 L 11.4 -2.2 L 10.2 -.9 L 9.6 .1 L 10.2 1.1 L 12.1 2.7 L 13.7 3.7 L 14.1 4.4 L 14.2 5.1 L 13.9 5.9 L 13.0 6.9 L 10.9 7.7 L 8.7 8.1","0 7.6 M 13.5 -6.0 L 14.4 -8.4 L 15.5 -9.1 L 12.8 -2.0 L 10.8 4.8 L 10.4 6.8 L 10.6 7.7 L 11.6 7.4 L 12.5 7.0 L 14.7 5.2 M 10.5 -3.9 L 18.0 -4.1","0 11.0 M 11.4 -1.6 L 12.3 -3.7 L 13.1 -4.2 L 9.6 5.0 L 9.1 6.6 L 8.9 7.4 L 10.5 6.6 L 13.0 4.2 L 15.5 1.1 L 16.3 -.1 L 17.9 -1.7 L 18.9 -4.3 L 17.7 -3.1 L 17.4 -1.3 L 16.8 1.6 L 15.3 6.4 L 15.0 8.5 L 14.2 9.6 L 13.6 9.7 L 16.6 7.4 L 18.5 6.1","0 11.5 M 10.8 -.5 L 10.9 -2.8 L 11.8 -3.5 L 10.8 5.8 L 10.6 6.8 L 10.0 8.0 L 13.5 5.3 L 16.3 1.9 L 17.9 -1.4 L 18.4 -2.5 L 18.7 -4.7 L 17.8 -3.3","0 16.4 M 8.8 -3.0 L 10.0 -3.9 L 10.6 -3.8 L 11.1 -1.7 L 11.3 1.1 L 11.4 2.6 L 10.8 4.9 L 10.0 7.0 L 9.8 7.5 L 10.4 8.0 L 11.0 5.0 L 13.5 .7 L 15.3 -2.3 L 16.1 -3.3 L 16.7 -3.9 L 17.6 -3.0 L 18.4 .3 L 18.9 2.9 L 19.2 5.5 L 19.0 7.4 L 20.2 5.5 L 21.9 2.6 L 23.6 -.7 L 24.2 -2.3 L 24.7 -3.6 L 24.7 -4.8 L 24.5 -5.0 L 24.3 -4.3","0 10.3 M 10.8 -2.7 L 12.2 -3.1 L 13.0 -3.6 L 13.7 -1.9 L 15.0 2.2 L 15.8 6.3 L 16.4 8.0 L 16.3 8.6 M 19.6 -3.6 L 19.5 -3.9 L 17.1 -1.6 L 13.4 2.4 L 10.6 5.8 L 8.6 8.2 L 7.4 9.8 L 6.8 11.1","0 10.6 M 9.8 -2.5 L 10.4 -3.3 L 11.7 -.2 L 11.8 2.5 L 11.8 6.2 L 11.5 9.0 M 18.0 -3.8 L 19.4 -4.3 L 18.9 -3.1 L 17.3 .0 L 15.3 2.8 L 13.2 5.8 L 9.9 10.2 L 7.5 13.8 L 6.2 15.8 L 5.7 17.5 L 5.8 18.6","0 10.5 M 11.2 -2.0 L 11.8 -3.2 L 12.7 -3.8 L 15.4 -3.8 L 17.4 -3.7 L 18.2 -3.7 L 18.4 -3.3 L 18.0 -2.7 L 15.8 -1.0 L 12.8 2.3 L 9.5 5.6 L 8.6 6.5 L 8.5 7.3 L 9.4 7.7 L 14.1 7.6 L 15.9 7.6 L 17.3 7.1 L 17.1 7.8","0 10.7 M 21.7 -12.9 L 19.0 -12.5 L 17.2 -11.1 L 16.0 -8.6 L 15.7 -5.9 L 14.4 -3.3 L 13.4 -2.0 L 11.6 -1.1 L 10.7 -.9 L 9.4 -1.0 L 11.4 -.7 L 12.5 .4 L 13.0 1.3 L 12.5 4.5 L 11.5 7.8 L 11.4 10.3 L 11.9 11.3 L 13.4 12.0 L 14.6 11.9","0 6.8 M 12.3 -11.0 L 11.7 -11.9 L 12.1 -6.6 L 11.9 1.6 L 11.7 6.0 L 11.7 8.9 L 11.3 10.5","0 13.8 M 15.8 -13.0 L 17.2 -13.0 L 18.1 -12.8 L 19.1 -12.2 L 19.5 -10.6 L 18.9 -8.0 L 17.8 -4.9 L 17.6 -3.0 L 18.1 -1.6 L 18.9 -1.0 L 19.5 -.5 L 20.0 -.2 L 21.1 -.2 L 18.6 .1 L 16.9 1.1 L 15.5 3.2 L 14.8 6.1 L 14.3 8.4 L 13.0 10.5 L 11.8 11.3 L 10.2 11.7 L 9.1 11.9","0 12.0 M 11.0 -6.9 L 12.0 -7.7 L 12.8 -8.0 L 14.1 -7.6 L 15.4 -7.1 L 16.6 -7.3 L 17.5 -7.6 L 17.8 -8.0","0 9.1 M 12.7 -8.2 L 11.2 -7.6 L 10.6 -6.7 L 10.1 -5.4 L 10.5 -4.0 L 11.3 -3.2 L 12.9 -2.8 L 14.5 -3.3 L 15.4 -4.7 L 15.5 -6.1 L 14.9 -7.3 L 14.1 -7.9 L 13.5 -8.1 L 12.7 -8.2"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.4 M 19.4 -14.5 L 20.2 -14.3 L 16.1 -6.5 L 13.7 -.8 L 13.5 .7 L 13.7 1.3 M 11.6 6.3 L 10.9 7.6","0 13.7 M 15.0 -12.6 L 15.4 -10.9 L 13.8 -8.3 L 11.7 -6.3 M 19.3 -12.6 L 19.7 -10.9 L 18.1 -8.3 L 16.0 -6.3","0 27.5 M 21.3 -9.7 L 15.7 6.0 M 28.6 -9.7 L 22.7 6.3 M 11.6 1.2 L 29.7 1.3 M 13.9 -5.2 L 32.7 -5.3","0 22.8 M 25.7 -6.9 L 25.7 -8.2 L 24.9 -9.3 L 23.2 -9.5 L 21.4 -9.5 L 19.1 -8.7 L 17.4 -7.6 L 16.1 -6.5 L 15.4 -4.7 L 16.3 -2.6 L 17.9 -1.5 L 21.3 -.3 L 22.9 .9 L 23.6 2.4 L 23.5 3.9 L 22.4 5.3 L 19.9 6.9 L 17.9 7.7 L 15.5 7.9 L 14.3 7.9 L 13.5 7.4 L 12.9 6.3 M 24.2 -13.5 L 16.0 10.1 L 15.4 11.9 L 15.4 12.8 L 15.7 14.0","0 20.2 M 15.6 -11.3 L 13.5 -9.2 L 11.8 -6.7 L 11.2 -4.7 L 11.7 -3.2 L 13.1 -3.4 L 15.0 -4.3 L 16.7 -6.2 L 17.6 -8.2 L 18.0 -9.3 L 18.4 -10.3 L 18.5 -11.6 L 18.1 -12.1 L 17.2 -12.4 L 16.3 -12.0 L 18.3 -9.8 L 19.4 -9.8 L 23.0 -10.7 L 26.7 -11.7 L 17.7 -.5 L 13.0 6.1 L 11.9 8.4 L 11.5 9.6 L 11.5 10.8 L 11.7 10.9 M 21.9 1.7 L 19.3 4.2 L 17.6 6.8 L 17.1 8.4 L 17.4 9.7 L 18.7 10.3 L 20.5 9.3 L 22.4 7.0 L 23.5 5.4 L 23.9 4.3 L 24.2 2.9 L 24.3 1.7 L 23.6 1.2 L 22.4 1.5 L 22.6 2.7 L 24.0 3.3 L 24.6 3.4","0 32.0 M 28.4 -5.6 L 28.8 -5.8 L 31.1 -6.6 L 32.8 -8.0 L 33.8 -9.5 L 33.9 -10.6 L 33.4 -11.8 L 32.5 -12.7 L 30.6 -13.3 L 28.5 -13.3 L 23.9 -12.7 L 19.4 -11.2 L 17.3 -9.6 L 15.5 -7.5 L 15.0 -5.6 L 15.2 -3.9 L 16.7 -3.0 L 18.4 -2.7 L 20.2 -2.8 L 22.8 -3.1 L 18.3 -1.6 L 15.9 -.2 L 14.0 1.7 L 12.9 4.0 L 12.9 5.9 L 14.1 7.4 L 16.6 8.6 L 20.4 8.7 L 24.7 7.9 L 28.0 6.1 L 30.4 3.9 L 31.0 1.4 L 30.6 -.6 L 29.9 -1.2 L 29.0 -1.8 M 23.7 1.1 L 23.7 -.2 L 24.9 -1.6 L 25.9 -2.1 L 28.0 -2.1 L 30.8 -1.5 L 33.2 -.9 L 35.1 -.5 L 36.3 -.5 L 37.4 -.9","0 6.8 M 16.1 -10.1 L 16.9 -10.5 L 16.9 -8.9 L 15.8 -6.6 L 14.7 -5.4 L 13.5 -4.4","0 9.0 M 22.2 -14.4 L 19.7 -14.3 L 15.7 -12.6 L 12.0 -9.6 L 9.6 -6.0 L 8.2 -2.7 L 7.5 2.4 L 7.8 5.6 L 8.9 8.6 L 10.4 9.7 L 10.8 9.8","0 12.8 M 15.1 -14.7 L 18.0 -14.3 L 19.8 -12.7 L 20.7 -10.3 L 20.4 -6.4 L 19.3 -2.8 L 17.1 1.0 L 14.9 3.9 L 12.0 6.9 L 9.6 8.6 L 6.9 9.3","0 6.7 M 8.9 -13.9 L 13.3 -11.2 M 11.1 -15.0 L 11.2 -10.0 M 13.4 -13.9 L 9.0 -11.3","0 12.8 M 15.9 -2.0 L 13.0 7.5 M 10.5 2.4 L 19.3 2.3","0 6.6 M 11.5 7.2 L 12.5 6.6 L 11.9 9.1 L 10.4 11.3 L 8.6 13.2","0 9.6 M 9.7 2.7 L 9.2 3.4 L 15.4 3.1","0 8.2 M 13.0 6.4 L 12.1 7.2 L 12.6 7.8 L 13.0 6.4 L 13.0 6.4","0 20.5 M 26.9 -15.4 L 21.3 -8.6 L 17.1 -3.0 L 13.7 2.0 L 11.0 6.0 L 9.3 8.9 L 8.8 10.3 L 9.0 11.5 L 9.2 11.9","0 19.0 M 25.7 -10.1 L 24.8 -10.4 L 23.7 -10.6 L 21.2 -9.9 L 18.9 -8.9 L 15.7 -6.4 L 13.4 -4.2 L 11.8 -2.0 L 10.3 .8 L 9.6 3.1 L 9.4 5.5 L 9.8 7.0 L 10.8 8.0 L 12.3 8.1 L 15.3 7.5 L 18.3 6.0 L 21.9 3.3 L 24.5 .3 L 25.6 -1.8 L 26.3 -4.4 L 26.2 -6.4 L 25.9 -7.7 L 24.8 -8.8 L 24.2 -9.4 L 23.5 -9.7 L 22.8 -9.9 L 21.9 -10.1 L 20.4 -10.1","0 9.9 M 14.2 -5.6 L 16.8 -6.7 L 18.4 -7.9 L 20.0 -9.3 L 20.5 -9.5 L 17.8 -4.7 L 15.2 -.4 L 11.3 6.5 M 8.5 7.9 L 11.1 6.9 L 13.5 6.3 L 16.3 6.1","0 21.2 M 15.6 -4.9 L 17.6 -6.3 L 20.2 -7.9 L 22.7 -8.8 L 25.6 -9.1 L 27.1 -8.7 L 27.9 -7.9 L 27.8 -6.0 L 26.9 -4.3 L 25.1 -2.2 L 22.7 .0 L 20.0 1.9 L 17.5 3.4 L 15.0 4.7 L 12.1 6.4 L 10.7 7.1 L 9.5 7.6 L 8.7 7.5 L 9.2 6.6 L 10.7 6.0 L 11.9 5.8 L 13.1 5.7 L 15.5 6.4 L 18.7 7.2 L 21.5 8.1 L 24.4 8.1 L 26.0 7.4 L 26.6 6.5 L 26.8 5.5 L 26.6 4.8 L 25.4 4.0","0 20.6 M 20.6 -8.9 L 18.6 -7.2 L 21.8 -8.8 L 24.6 -9.3 L 26.5 -9.4 L 27.6 -8.6 L 27.8 -7.1 L 27.0 -6.0 L 25.6 -4.4 L 23.8 -3.7 L 22.9 -3.4 L 20.2 -2.7 L 18.9 -2.3 L 18.3 -2.6 L 18.6 -2.9 L 22.8 -2.8 L 23.9 -2.7 L 26.1 -1.8 L 27.0 .6 L 26.5 2.9 L 25.0 4.7 L 22.5 6.5 L 19.9 7.4 L 17.1 7.9 L 13.8 8.0 L 11.2 7.1 L 10.1 6.0 L 9.6 4.7 L 9.7 3.4 L 10.4 2.3 L 11.2 1.4 L 12.2 .7 L 13.7 .4 L 15.0 .1","0 16.3 M 26.2 -1.8 L 26.6 -.6 L 26.1 .2 L 24.5 .8 L 23.0 .7 L 21.6 .7 L 18.2 -.4 L 16.9 -.7 L 15.2 -.9 L 13.3 -.7 L 11.4 -.2 L 9.6 .4 L 13.0 -1.8 L 17.3 -3.9 L 20.7 -5.9 L 23.5 -7.7 L 25.6 -9.2 L 26.5 -9.9 L 26.6 -9.9 L 22.1 -3.9 L 20.0 -.7 L 18.5 1.9 L 17.2 4.0 L 16.8 4.8 L 16.6 6.7 M 12.3 8.3 L 14.2 7.5 L 15.8 6.9 L 17.7 6.5 L 19.5 6.5 L 20.2 6.5","0 20.8 M 18.7 -6.9 L 14.2 -1.5 L 16.9 -2.8 L 19.1 -3.6 L 21.6 -3.8 L 23.2 -3.8 L 25.4 -3.0 L 26.4 -2.0 L 26.3 -.3 L 25.6 2.2 L 24.4 4.0 L 22.0 6.0 L 19.6 7.4 L 16.4 8.3 L 12.6 8.7 L 9.9 7.8 L 8.8 6.8 L 8.5 5.6 L 8.8 4.7 L 9.8 3.6 L 10.7 2.7 M 18.0 -8.1 L 19.5 -8.8 L 21.5 -9.1 L 23.7 -8.6 L 25.7 -8.1 L 27.1 -7.8 L 28.5 -7.6 L 30.0 -7.8 L 31.1 -8.3 L 31.7 -8.8 L 31.9 -9.6","0 18.9 M 24.9 -9.2 L 27.4 -9.0 L 28.2 -8.7 L 22.3 -7.0 L 17.4 -4.7 L 14.6 -2.8 L 11.5 .3 L 10.1 2.4 L 9.4 4.8 L 9.6 6.5 L 11.4 8.0 L 14.2 8.3 L 16.8 8.0 L 20.6 6.7 L 23.2 5.1 L 24.0 3.3 L 24.0 2.3 L 23.5 1.7 L 21.9 1.3 L 19.6 1.5 L 17.2 2.4 L 15.8 3.5 L 14.6 5.0 L 14.3 5.6 L 14.3 6.6","0 14.0 M 12.0 -9.1 L 11.6 -6.3 L 12.6 -8.6 L 14.8 -9.9 L 18.0 -10.2 L 19.9 -10.1 L 22.2 -9.4 L 24.6 -9.2 L 25.9 -9.2 L 27.1 -9.9 L 23.5 -6.9 L 20.5 -4.3 L 17.3 -1.6 L 15.2 .7 L 13.8 2.6 L 12.3 5.0 L 11.7 6.6 L 11.7 7.5 L 11.7 8.0","0 17.8 M 25.4 -6.6 L 25.9 -7.4 L 26.1 -8.9 L 24.9 -9.8 L 22.5 -9.9 L 20.1 -9.4 L 18.1 -8.4 L 17.0 -7.1 L 16.7 -6.0 L 17.2 -5.1 L 18.7 -3.9 L 20.9 -2.9 L 22.6 -1.9 L 23.6 -1.0 L 24.4 .6 L 24.0 2.2 L 22.5 4.1 L 20.3 5.6 L 17.0 7.1 L 13.5 8.1 L 10.7 8.3 L 8.8 6.9 L 8.8 4.9 L 10.6 2.0 L 13.0 -.2 L 15.5 -1.9 L 17.1 -2.9 L 18.9 -3.7 L 21.1 -4.9 L 24.0 -6.1 L 26.7 -6.9 L 28.3 -7.4","0 12.5 M 24.4 -9.5 L 20.4 -9.3 L 17.6 -8.5 L 13.7 -7.0 L 11.7 -5.4 L 10.6 -3.7 L 10.6 -2.1 L 12.0 -1.4 L 14.4 -2.0 L 16.5 -3.2 L 18.6 -4.3 L 20.6 -5.4 L 24.3 -8.2 L 24.9 -8.2 L 20.8 -4.2 L 17.4 -.6 L 15.3 2.0 L 13.9 4.4 L 12.5 6.9 L 11.8 9.5 L 11.8 10.9 L 11.8 11.9 L 12.3 12.1","0 6.6 M 14.0 -3.7 L 13.0 -2.6 L 13.5 -1.8 M 12.4 3.5 L 11.6 4.6 L 12.0 5.3","0 6.7 M 14.3 .0 L 13.3 1.1 L 13.6 1.8 M 11.4 7.5 L 12.4 6.6 L 12.0 8.9 L 10.8 10.9 L 9.4 12.5","0 10.7 M 15.1 -6.6 L 11.4 -1.4 L 15.2 3.0","0 13.5 M 12.8 -.3 L 12.0 .6 L 16.2 .6 L 18.8 .2 M 12.8 2.5 L 12.0 3.4 L 16.2 3.4 L 18.8 3.0","0 10.5 M 10.9 -6.4 L 13.7 -3.2 L 14.7 -2.4 L 10.9 3.1","0 15.7 M 14.6 -6.4 L 13.4 -6.8 L 13.0 -8.1 L 13.2 -9.3 L 14.1 -10.7 L 15.6 -12.0 L 17.7 -13.0 L 20.1 -13.7 L 22.0 -13.8 L 23.8 -13.6 L 25.0 -12.8 L 25.6 -12.1 L 25.9 -10.3 L 25.6 -9.1 L 24.0 -6.5 L 22.5 -5.2 L 19.1 -3.0 L 16.2 -1.2 L 15.1 -.3 L 14.2 .9 L 13.9 2.1 L 14.1 2.4 M 13.1 6.0 L 12.2 7.1 L 12.7 7.9","0 30.2 M 16.0 -13.7 L 18.1 -13.7 L 21.0 -13.7 L 24.9 -12.9 L 27.8 -12.3 L 30.9 -10.9 L 33.0 -9.1 L 34.7 -6.7 L 35.3 -4.3 L 35.3 -2.9 L 34.8 -1.1 L 33.7 1.3 L 31.2 3.7 L 28.8 5.3 L 25.3 6.9 L 21.9 7.6 L 18.2 7.5 L 15.4 6.5 L 13.2 4.2 L 11.7 1.1 L 11.5 -2.0 L 12.7 -6.7 L 14.8 -9.4 L 18.1 -12.1 L 20.3 -13.3 L 22.9 -14.2 L 26.3 -14.7 L 28.6 -15.0 L 31.6 -14.6 L 33.9 -13.2 L 34.9 -11.6 L 34.9 -10.4 L 34.8 -8.8 L 33.9 -6.4 L 33.1 -4.5 L 30.9 -1.2 L 29.5 .4 L 28.0 1.9 L 26.5 3.0 L 25.2 3.5 L 24.1 3.3 L 24.0 2.5 L 24.5 .0 L 25.7 -4.7 L 26.7 -6.5 L 27.8 -7.9 L 27.9 -8.6 L 27.2 -8.5 L 26.6 -6.8 L 26.0 -4.9 L 23.9 -2.2 L 22.1 -.1 L 20.7 1.6 L 18.7 3.1 L 17.9 3.0 L 17.8 1.2 L 19.2 -3.2 L 20.5 -5.5 L 22.1 -7.7 L 23.0 -8.5 L 24.1 -8.8 L 25.3 -8.8 L 27.2 -8.3","0 20.9 M 25.0 -14.2 L 20.9 -10.0 L 16.8 -5.8 L 12.7 -.4 L 10.2 3.7 L 8.6 8.6 L 8.7 11.4 L 8.7 13.1 L 9.5 14.0 M 23.1 -14.6 L 24.7 -9.5 L 25.0 -3.2 L 25.0 3.8 L 25.0 7.5 M 23.1 9.6 L 25.6 7.2 L 28.1 5.8 M 9.2 -1.8 L 27.3 -2.0","0 29.5 M 13.0 -1.6 L 12.9 -.6 L 10.3 -3.1 L 8.6 -6.6 L 8.7 -10.0 L 10.6 -12.8 L 13.4 -14.0 L 17.1 -14.4 L 21.3 -13.9 L 26.4 -13.1 L 30.2 -11.6 L 33.7 -9.2 L 34.5 -7.0 L 34.3 -5.5 L 33.3 -4.2 L 31.3 -2.9 L 27.1 -1.4 L 20.5 -.4 L 26.3 -.9 L 30.0 -.4 L 33.9 1.1 L 35.9 3.1 L 36.0 5.2 L 34.8 7.1 L 33.0 8.7 L 30.1 9.8 L 26.1 10.1 L 22.2 9.8 L 18.9 9.1 L 16.0 7.7 L 15.6 7.2 M 26.6 -15.3 L 23.0 -8.6 L 20.7 -2.2 L 19.1 2.9 L 18.4 5.9 L 18.2 7.9 L 18.3 10.3","0 25.7 M 31.6 -14.9 L 31.6 -13.9 L 31.1 -12.7 L 30.5 -10.8 L 30.1 -8.8 L 31.3 -8.8 L 31.4 -10.0 L 31.4 -11.4 L 29.8 -13.6 L 27.5 -14.4 L 25.2 -14.6 L 21.4 -14.1 L 16.9 -11.6 L 13.7 -8.6 L 11.4 -5.7 L 9.5 -1.3 L 9.4 2.6 L 10.7 5.5 L 13.6 8.7 L 17.1 10.1 L 22.3 10.1 L 27.8 8.4 L 30.4 6.7 L 32.1 5.1 L 32.8 3.9","0 31.3 M 9.3 -2.8 L 7.6 -4.0 L 6.9 -5.7 L 7.4 -7.3 L 11.3 -9.7 L 14.4 -10.8 L 19.3 -12.0 L 23.2 -12.4 L 27.0 -12.0 L 31.1 -11.3 L 33.9 -10.0 L 36.4 -8.0 L 37.9 -5.2 L 38.1 -1.8 L 36.3 2.1 L 32.8 5.4 L 28.9 7.5 L 25.7 8.5 L 23.7 9.0 L 21.8 8.9 L 20.4 8.8 L 19.1 8.2 L 18.6 7.6 L 17.9 6.4 L 16.1 8.5 L 16.3 4.9 L 17.1 -.3 L 18.9 -6.3 L 20.2 -9.5 L 22.3 -13.7 L 23.1 -14.8","0 31.8 M 31.1 -11.9 L 30.2 -13.0 L 29.5 -13.1 L 28.1 -9.3 L 26.5 -4.7 L 23.9 2.7 L 22.8 4.6 L 21.9 6.4 L 20.3 7.7 L 18.8 8.9 L 16.8 9.8 L 14.5 10.2 L 12.9 10.3 L 10.8 9.6 L 9.8 8.6 L 9.2 7.3 L 9.8 5.9 L 11.1 5.1 L 13.0 4.9 L 16.5 5.5 L 20.0 6.7 L 24.8 9.0 L 29.6 10.7 L 33.7 11.0 L 36.0 10.5 L 37.7 9.0 L 38.7 7.5 L 38.6 5.8 L 38.2 4.8 L 37.5 3.9 M 16.7 -.1 L 13.7 -1.8 L 10.8 -3.9 L 8.6 -6.5 L 7.5 -8.9 L 7.4 -11.4 L 8.6 -12.8 L 10.4 -13.5 L 13.4 -13.9 L 16.9 -13.4 L 21.3 -12.6 L 25.3 -11.5 L 27.8 -10.8 L 32.3 -9.3 L 35.5 -8.7 L 37.4 -8.7 L 38.8 -8.8 L 39.9 -9.1 L 40.3 -9.5 M 21.7 -2.5 L 33.3 -2.6","0 25.2 M 32.5 -11.8 L 31.9 -12.8 L 31.4 -13.3 L 30.7 -12.8 L 26.8 -1.0 L 25.2 4.1 L 23.9 6.9 L 22.4 9.2 L 21.0 10.7 L 19.6 11.6 L 17.8 12.3 L 16.1 12.3 L 14.5 11.8 L 12.4 10.5 L 11.1 8.4 L 10.5 6.2 L 10.4 4.2 M 18.3 .6 L 15.4 -.9 L 12.5 -3.3 L 9.8 -7.2 L 8.9 -10.5 L 9.2 -12.8 L 11.1 -14.3 L 13.8 -14.9 L 18.0 -14.7 L 21.8 -13.7 L 25.5 -12.4 L 31.8 -9.8 L 34.8 -8.9 L 36.8 -8.5 L 38.3 -8.8 L 38.8 -9.4 M 21.9 -2.2 L 33.5 -2.3","0 28.9 M 32.2 -9.3 L 32.9 -11.3 L 31.0 -13.1 L 28.2 -13.7 L 21.8 -13.2 L 16.8 -11.2 L 13.0 -7.8 L 10.6 -4.7 L 9.5 -1.4 L 9.1 2.0 L 10.4 5.1 L 12.4 7.6 L 16.7 9.0 L 22.2 8.8 L 26.2 7.1 L 29.3 5.0 L 31.2 2.5 L 33.0 -.9 L 31.9 4.0 L 30.0 9.4 L 28.3 13.0 L 27.1 14.9 L 24.8 17.4 L 22.1 19.2 L 19.2 20.1 L 16.4 19.4 L 15.1 18.7 L 14.2 17.5 M 23.0 -2.0 L 22.1 -1.2 L 36.4 -1.3","0 32.6 M 17.6 .9 L 13.7 -1.5 L 11.5 -3.5 L 9.7 -6.1 L 8.5 -8.8 L 8.2 -11.4 L 9.3 -13.5 L 12.0 -14.8 L 15.8 -14.7 L 19.6 -14.1 L 31.0 -9.9 L 32.6 -9.9 L 33.5 -10.3 M 29.3 -10.3 L 24.1 4.8 L 22.8 7.5 L 20.6 10.4 L 18.2 12.0 L 16.2 12.6 L 13.9 12.3 L 11.7 11.0 L 10.3 9.0 L 9.5 6.9 L 9.2 4.4 M 40.1 -9.4 L 41.4 -11.6 L 38.4 -2.8 L 36.2 4.5 L 35.3 7.4 L 34.8 9.6 L 34.9 10.9 L 35.9 11.1 L 37.5 9.9 L 38.6 8.6 M 23.3 .1 L 40.1 .0","0 16.2 M 23.0 -12.5 L 21.8 -7.7 L 19.9 -2.5 L 17.9 2.1 L 15.9 6.2 L 14.5 7.9 L 13.6 8.9 L 12.2 9.6 L 10.7 9.8 L 8.8 9.1 L 8.7 8.1 L 9.2 7.1 L 10.1 6.7 L 11.6 6.9 L 18.9 9.5 L 21.4 9.8 L 22.7 9.5 L 23.4 8.9 L 23.6 8.1 L 23.5 7.2 L 23.2 6.6 M 16.1 -7.6 L 14.4 -9.3 L 14.1 -11.3 L 14.7 -12.6 L 16.2 -13.4 L 18.9 -13.3 L 21.4 -12.8 L 25.1 -12.2 L 26.7 -12.3 L 27.7 -12.6 L 27.9 -12.8","0 20.8 M 30.1 -12.2 L 30.1 -12.0 L 27.9 -4.9 L 25.3 2.4 L 23.0 7.4 L 21.3 10.9 L 19.7 13.4 L 18.2 14.9 L 16.0 16.2 L 13.8 16.4 L 12.0 15.6 L 9.7 12.9 L 8.9 11.0 L 8.5 9.4 L 8.6 7.9 M 22.0 -5.8 L 18.8 -7.8 L 17.4 -9.7 L 17.0 -12.1 L 18.4 -13.7 L 21.2 -13.9 L 24.8 -13.2 L 27.3 -12.9 L 32.3 -11.9 L 33.4 -12.2 L 34.4 -12.6","0 32.3 M 29.4 -10.3 L 28.1 -6.1 L 26.6 -1.8 L 25.1 3.0 L 23.4 6.7 L 21.4 9.7 L 19.4 11.6 L 17.7 12.5 L 15.7 12.5 L 13.9 12.0 L 11.6 10.5 L 10.2 7.9 L 9.7 5.7 L 9.7 4.2 M 17.4 .8 L 13.9 -1.4 L 10.2 -5.4 L 8.5 -8.9 L 8.4 -12.7 L 11.5 -14.4 L 15.8 -14.7 L 20.9 -13.7 L 25.8 -11.8 L 31.4 -9.8 L 32.6 -9.8 L 33.2 -10.0 L 33.5 -10.3 M 41.8 -11.6 L 41.8 -10.9 L 37.6 -7.0 L 33.9 -4.4 L 30.4 -2.2 L 28.4 -1.0 L 25.3 -.2 L 23.7 .1 L 27.6 4.1 L 33.3 9.3 L 36.2 11.4 L 37.9 11.8 L 39.4 10.4 L 39.7 9.1 L 39.8 7.2 L 39.7 5.9","0 27.2 M 28.9 -12.0 L 27.9 -12.2 L 27.0 -10.9 L 24.2 -3.5 L 22.3 1.5 L 20.5 5.4 L 19.6 6.7 L 18.0 8.4 L 16.9 9.1 L 15.7 9.8 L 14.4 10.0 L 12.0 10.0 L 9.7 8.9 L 9.1 8.1 L 9.1 6.5 L 10.6 5.5 L 11.6 5.2 L 15.2 5.9 L 18.3 7.0 L 25.4 10.2 L 28.8 11.0 M 28.9 11.0 L 31.2 10.5 L 33.3 9.3 L 34.3 7.7 L 33.9 5.7 L 33.5 4.6 M 18.3 -6.8 L 17.9 -4.9 L 18.7 -3.1 L 20.0 -1.8 L 22.6 -1.1 L 25.5 -1.5 L 27.6 -3.0 L 29.5 -4.9 L 30.8 -7.0 L 31.5 -9.4 L 32.0 -11.7 L 32.0 -14.1 L 31.5 -14.4","0 32.9 M 14.8 -3.2 L 11.2 -5.0 L 10.0 -6.5 L 9.0 -8.4 L 9.2 -10.7 L 10.8 -12.9 L 13.5 -13.6 L 17.4 -13.2 L 22.5 -12.6 L 23.9 -11.8 M 11.3 15.1 L 10.8 12.8 L 12.5 7.7 L 14.7 2.3 L 18.7 -4.7 L 22.1 -10.1 L 24.0 -11.9 L 23.0 -6.2 L 22.2 -.8 L 22.4 4.6 L 23.4 6.5 L 25.0 7.0 L 27.4 5.2 L 30.5 1.8 L 33.1 -2.2 L 36.3 -7.0 L 38.7 -11.4 L 39.0 -6.5 L 38.6 -2.3 L 37.8 1.4 L 36.4 5.0 L 35.0 8.9 L 34.5 10.5 L 33.8 11.0 L 33.0 10.9 L 33.5 10.3 L 36.8 8.3 L 38.4 7.2 L 39.4 6.6","0 33.0 M 20.8 -5.5 L 17.6 -7.3 L 15.7 -9.4 L 15.2 -11.4 L 15.7 -13.3 L 17.1 -13.8 L 19.4 -14.1 L 21.9 -13.9 L 30.0 -11.9 M 28.4 -12.3 L 25.3 -1.8 L 22.7 4.4 L 20.4 8.3 L 18.4 10.4 L 15.3 11.7 L 13.8 11.7 L 12.0 10.8 L 10.0 8.6 L 9.0 6.1 L 9.0 3.7 M 29.5 -9.8 L 30.3 -.9 L 31.8 5.5 L 33.0 7.8 L 33.7 8.6 L 34.7 9.1 L 35.7 8.0 L 36.4 6.5 L 37.7 3.4 L 38.6 .3 L 39.2 -3.0 L 39.5 -6.8 L 39.8 -11.4 M 38.4 -14.1 L 39.1 -11.9 L 40.6 -9.6 L 41.8 -8.1 L 42.4 -7.4","0 27.3 M 19.1 -6.7 L 22.4 -8.6 L 24.5 -10.4 L 26.0 -11.9 L 26.9 -13.8 L 26.5 -14.6 L 25.0 -15.1 L 21.2 -14.6 L 17.0 -12.4 L 13.4 -9.3 L 11.0 -5.7 L 9.3 -1.4 L 8.8 2.0 L 9.8 5.7 L 13.0 8.8 L 17.0 10.0 L 20.9 9.7 L 25.7 8.3 L 30.0 5.4 L 33.3 1.1 L 34.0 -3.1 L 33.5 -7.2 L 31.0 -10.3 L 28.1 -11.6 L 23.4 -12.2 L 18.6 -11.8 L 14.0 -10.7 L 9.6 -8.9","0 29.0 M 28.7 -11.9 L 25.3 -1.7 L 21.6 6.8 L 18.8 10.7 L 16.6 12.5 L 14.7 13.0 L 12.8 12.6 L 11.1 11.5 L 9.8 9.9 L 8.7 7.6 L 8.3 5.8 L 8.4 4.4 M 17.8 -3.8 L 15.3 -6.1 L 14.3 -7.7 L 14.6 -10.0 L 16.3 -11.5 L 20.0 -13.1 L 25.6 -13.9 L 29.6 -13.9 L 33.4 -13.2 L 36.6 -11.8 L 38.9 -9.4 L 39.6 -7.1 L 38.9 -5.3 L 37.7 -3.8 L 35.3 -2.2 L 32.4 -1.2 L 27.7 -.5 L 23.5 -.5","0 27.1 M 18.8 -6.5 L 22.2 -8.7 L 24.7 -10.9 L 25.7 -12.0 L 26.5 -13.4 L 26.6 -14.4 L 25.6 -14.9 L 23.1 -15.0 L 19.3 -13.7 L 15.3 -11.3 L 11.8 -7.3 L 9.5 -3.4 L 8.8 .1 L 8.8 3.5 L 10.0 6.1 L 12.0 8.6 L 15.8 10.1 L 19.9 10.0 L 25.2 8.5 L 29.9 5.1 L 32.8 1.7 L 33.8 -2.2 L 33.7 -5.8 L 32.2 -8.9 L 29.8 -11.0 L 27.3 -11.7 L 24.0 -12.0 L 19.8 -11.9 L 17.1 -11.3 L 12.9 -10.3 L 10.0 -8.9 M 8.0 14.1 L 8.7 12.0 L 9.8 11.3 L 11.4 11.0 L 14.6 12.0 L 17.7 13.1 L 22.5 15.7 L 26.7 16.8 L 29.2 16.9 L 31.6 16.1 L 32.6 15.1 L 33.3 13.5 L 33.3 12.3 L 32.6 10.8","0 32.3 M 28.7 -11.8 L 26.6 -4.8 L 24.1 1.4 L 21.7 6.9 L 18.8 10.8 L 16.8 12.4 L 14.5 13.1 L 12.2 12.3 L 9.9 10.0 L 8.9 7.7 L 8.4 6.0 L 8.3 4.7 M 17.8 -3.9 L 15.3 -6.1 L 14.4 -8.3 L 15.6 -11.0 L 18.8 -12.7 L 23.7 -13.9 L 28.5 -13.9 L 32.8 -13.4 L 35.2 -12.8 L 38.1 -10.8 L 39.5 -8.7 L 39.4 -6.1 L 38.5 -4.4 L 36.5 -2.9 L 33.9 -1.8 L 31.0 -1.1 L 27.7 -.6 L 26.5 -.4 L 23.9 -1.1 L 26.8 2.9 L 31.1 7.4 L 33.7 9.8 L 35.7 11.2 L 37.7 11.6 L 39.2 10.8 L 39.7 9.3 L 39.9 7.4 L 39.9 6.2","0 15.6 M 24.4 -6.2 L 26.4 -6.7 L 28.4 -7.7 L 29.9 -9.8 L 30.0 -11.9 L 29.1 -13.9 L 27.0 -15.0 L 23.7 -15.3 L 19.7 -14.6 L 15.6 -13.1 L 12.4 -11.2 L 9.4 -8.1 L 8.4 -4.0 L 9.2 -1.2 L 11.7 1.0 L 18.4 3.0 L 21.0 3.9 L 21.9 5.5 L 21.4 7.4 L 18.4 9.5 L 15.1 10.6 L 11.3 10.8 L 9.5 10.0 L 9.0 8.4","0 23.8 M 32.4 -12.1 L 31.6 -13.2 L 30.7 -12.9 L 28.0 -4.4 L 26.4 1.1 L 24.4 5.5 L 22.5 8.9 L 20.1 11.2 L 18.7 12.1 L 16.7 12.3 L 13.6 11.5 L 11.4 9.2 L 10.4 6.7 L 10.2 4.5 M 17.9 .6 L 14.7 -1.0 L 11.8 -3.9 L 9.5 -7.6 L 8.6 -9.6 L 9.0 -12.3 L 11.5 -14.2 L 14.9 -14.8 L 19.6 -14.2 L 24.8 -12.8 L 33.4 -9.2 L 35.5 -8.6 L 37.9 -8.4 L 38.2 -8.9 L 38.7 -9.4","0 30.8 M 18.5 -.1 L 16.7 2.0 L 14.4 3.1 L 12.1 3.3 L 10.3 2.5 L 9.2 .9 L 9.1 -1.7 L 9.8 -4.4 L 10.9 -6.6 L 13.7 -9.9 L 18.2 -12.7 L 22.2 -13.6 L 25.0 -13.9 L 26.8 -12.8 L 26.9 -11.2 L 26.1 -8.9 L 23.3 -1.9 L 20.6 3.7 L 20.0 6.2 L 20.0 7.7 L 20.4 8.4 L 21.7 8.5 L 22.6 8.0 L 25.5 6.0 L 29.2 2.3 L 32.4 -1.5 L 35.1 -5.1 L 37.2 -8.3 L 39.3 -11.9 L 39.8 -12.5 L 40.2 -12.1 L 37.0 -4.4 L 34.8 2.4 L 33.8 5.5 L 33.5 7.2 L 33.5 8.4 L 33.8 9.1 L 34.8 9.0 L 36.1 8.6 L 37.2 7.9 L 37.8 7.4","0 24.2 M 13.1 -3.2 L 11.0 -3.7 L 9.7 -5.1 L 8.9 -7.7 L 9.1 -10.5 L 9.9 -12.3 L 11.6 -13.9 L 13.7 -14.8 L 16.9 -15.1 L 18.5 -14.8 L 20.7 -13.7 L 22.3 -12.0 L 23.1 -9.8 L 23.7 -7.4 L 24.0 -3.7 L 24.1 -1.2 L 23.9 1.4 L 23.6 4.2 L 23.5 5.2 L 23.3 7.2 L 22.8 8.0 L 22.2 7.9 L 23.2 6.5 L 24.4 5.2 L 27.4 .1 L 30.2 -4.1 L 33.1 -8.3 L 34.8 -10.4 L 37.6 -13.5 L 39.3 -14.8 L 39.9 -15.1 L 41.0 -15.2","0 40.1 M 17.9 .2 L 16.1 .8 L 13.5 .8 L 10.7 -.7 L 9.6 -2.1 L 9.1 -4.7 L 9.7 -7.3 L 11.3 -9.8 L 14.1 -12.0 L 17.7 -13.5 L 20.4 -14.5 L 23.7 -15.2 L 25.9 -15.0 L 27.7 -14.0 L 28.6 -12.6 L 28.8 -10.9 L 29.0 -8.7 L 27.9 -4.0 L 25.5 2.8 L 24.4 6.8 L 23.7 8.8 L 23.4 9.6 L 23.5 10.4 L 24.2 9.8 L 25.5 7.5 L 28.0 4.2 L 30.8 .5 L 33.4 -2.7 L 35.8 -5.1 L 37.9 -7.5 L 38.3 -8.0 L 38.7 -7.7 L 37.2 -2.7 L 35.9 3.3 L 35.7 6.9 L 36.3 9.0 L 37.5 9.7 L 38.8 9.2 L 40.7 8.0 L 43.3 5.5 L 46.0 2.0 L 48.4 -2.1 L 49.7 -5.8 L 50.3 -8.5 L 50.3 -10.6 L 50.0 -12.4 L 49.6 -13.3 L 49.2 -13.6 L 48.0 -14.1","0 24.9 M 10.0 -4.2 L 8.8 -5.1 L 8.4 -7.2 L 8.4 -9.4 L 9.3 -11.7 L 10.6 -13.4 L 12.0 -14.5 L 13.9 -14.9 L 15.7 -14.3 L 17.2 -13.1 L 18.4 -11.3 L 21.8 -1.7 L 24.0 2.5 L 25.8 5.4 L 27.0 7.1 L 28.2 8.0 L 29.4 8.2 L 30.5 7.8 L 31.2 7.2 L 31.8 6.3 L 32.2 5.7 L 32.3 4.6 M 32.9 -14.1 L 32.2 -11.9 L 30.1 -9.7 L 27.8 -7.8 L 24.6 -5.3 L 20.1 -1.4 L 16.7 1.6 L 13.7 4.7 L 11.1 7.7 L 9.5 9.5 L 8.5 11.4","0 32.7 M 20.0 -.5 L 17.9 1.5 L 14.3 3.0 L 11.0 2.0 L 9.6 -.5 L 10.4 -3.7 L 12.4 -7.6 L 15.9 -10.8 L 19.0 -13.1 L 22.8 -14.6 L 27.2 -14.9 L 28.6 -13.7 L 28.5 -11.8 L 26.9 -6.7 L 24.5 -2.2 L 22.5 2.2 L 21.5 5.1 L 21.0 7.9 L 22.0 8.4 L 23.2 8.3 L 25.9 6.7 L 29.9 2.7 L 33.1 -.8 L 36.0 -4.0 L 38.8 -7.9 L 39.7 -9.3 L 41.3 -13.0 L 42.0 -13.7 L 42.2 -12.5 L 39.8 -4.3 L 37.0 2.8 L 33.9 8.5 L 30.6 13.7 L 27.1 17.8 L 23.7 20.1 L 21.2 21.4 L 18.7 21.2 L 15.9 19.7 L 15.3 18.5 L 15.5 16.2","0 22.6 M 14.2 -12.1 L 13.1 -13.2 L 14.4 -13.7 L 19.4 -14.1 L 25.2 -14.1 L 28.2 -14.0 L 29.2 -13.9 L 29.5 -13.4 L 29.1 -12.2 L 22.7 -5.9 L 17.0 -.9 L 13.7 2.1 L 10.3 6.0 L 9.1 7.7 L 9.0 8.9 L 10.7 9.1 L 16.1 8.3 L 20.9 8.1 L 24.1 7.8 L 27.3 8.1 L 28.3 8.4 L 28.3 9.2 L 27.5 10.7","0 19.7 M 26.3 -15.0 L 21.6 -14.8 L 20.7 -14.3 L 16.9 -9.3 L 14.1 -4.1 L 11.3 .9 L 10.0 3.6 L 9.2 5.8 L 9.1 7.3 L 10.0 7.9 L 11.5 8.0 L 16.1 8.0","0 20.3 M 9.8 -15.3 L 14.4 -9.8 L 18.2 -4.8 L 21.5 -.3 L 25.0 4.7 L 26.5 7.0 L 27.2 8.8 L 27.8 10.0 L 27.9 10.8","0 18.6 M 19.0 -14.8 L 23.3 -14.9 L 25.7 -14.5 L 25.9 -13.7 L 25.2 -11.5 L 22.8 -6.3 L 20.3 -1.5 L 17.5 3.2 L 15.0 6.9 L 13.8 7.9 L 12.6 8.3 L 8.7 8.2","0 11.4 M 9.7 -7.8 L 13.4 -10.5 L 16.9 -8.0","0 11.4 M 8.3 8.4 L 18.8 8.4","0 11.9 M 10.9 -11.7 L 16.2 -8.7","0 11.2 M 18.0 -4.0 L 15.5 -4.5 L 13.6 -4.2 L 11.1 -1.1 L 10.1 1.2 L 9.0 3.9 L 8.5 5.9 L 8.7 7.1 L 9.2 7.6 L 10.7 6.6 L 12.8 4.6 L 14.7 2.1 L 16.0 .4 L 17.0 -1.9 L 17.6 -3.1 L 18.0 -4.3 L 18.4 -4.4 L 18.2 -3.5 L 16.8 -.9 L 15.7 2.7 L 15.1 5.2 L 14.9 6.7 L 15.1 7.4 L 15.6 7.5 L 16.7 7.1 L 17.9 6.1 L 19.2 4.8","0 9.8 M 15.8 -13.7 L 15.2 -12.4 L 13.0 -6.0 L 11.0 -.1 L 9.8 2.9 L 9.3 4.4 L 9.2 6.2 L 10.1 7.9 L 11.8 7.7 L 13.1 7.1 L 14.5 5.9 L 15.9 3.1 L 16.6 1.4 L 17.2 -1.0 L 17.5 -2.7 L 17.5 -3.8 L 17.3 -4.4 L 16.2 -3.9 L 14.7 -2.6 L 12.8 -.2 L 11.5 1.5 L 10.4 3.0 L 9.7 4.7 L 9.1 7.0 L 8.6 7.3 L 8.2 6.5 L 8.8 5.1 L 11.1 3.6 L 13.5 2.0 L 16.1 .4 L 18.3 -.6","0 7.8 M 16.0 -1.8 L 16.4 -3.0 L 16.2 -3.9 L 15.4 -4.3 L 13.7 -4.1 L 12.0 -2.8 L 10.3 .1 L 9.1 2.7 L 8.7 5.6 L 8.9 7.2 L 9.9 7.8 L 11.8 7.6 L 13.5 6.4 L 14.6 5.2 L 15.5 4.1","0 11.4 M 19.0 -3.6 L 16.2 -4.3 L 14.6 -4.3 L 12.8 -3.3 L 11.1 -.6 L 9.8 1.7 L 9.0 4.2 L 8.7 5.7 L 8.7 7.0 L 9.0 7.3 L 10.1 7.1 L 12.4 4.9 L 14.5 2.2 L 16.0 .5 L 18.1 -4.4 L 20.6 -11.4 L 20.5 -12.0 L 21.3 -13.7 L 21.6 -13.8 L 18.7 -5.2 L 16.7 .0 L 15.7 3.3 L 14.9 5.7 L 14.9 7.1 L 15.8 7.4 L 17.2 6.6 L 18.2 5.8 L 19.0 5.0","0 8.4 M 9.4 .7 L 11.8 1.1 L 14.4 1.0 L 15.6 .3 L 16.3 -.3 L 16.3 -1.8 L 15.9 -3.2 L 15.2 -3.9 L 14.0 -4.0 L 12.6 -3.4 L 11.3 -1.1 L 9.9 2.1 L 9.3 4.1 L 9.1 5.9 L 9.5 7.6 L 10.7 8.0 L 12.1 7.5 L 13.6 6.3 L 15.1 4.4","0 7.1 M 21.1 -13.4 L 20.8 -14.0 L 18.8 -14.3 L 17.1 -13.6 L 15.4 -11.1 L 9.4 9.4 L 8.6 11.0 L 7.7 12.9 L 6.8 13.9 L 5.0 14.9 L 3.7 14.9 L 2.2 13.8 L 2.0 12.2 L 2.0 11.2 M 10.0 -4.2 L 17.8 -4.5","0 9.9 M 16.4 -3.8 L 14.4 -4.5 L 12.1 -2.4 L 11.1 -.2 L 10.3 2.5 L 10.3 4.6 L 12.3 5.4 L 13.9 4.7 L 15.6 2.7 L 16.6 .8 L 16.9 -1.0 L 16.8 -2.0 L 16.6 -2.7 L 16.4 -5.1 L 17.1 -5.4 L 17.1 -2.9 L 18.0 -2.0 M 9.9 6.9 L 13.1 9.6 L 14.8 13.1 L 15.1 16.3 L 13.4 17.9 L 9.6 19.4 L 7.0 19.7 L 5.5 18.4 L 6.4 15.2 L 8.1 11.9 L 10.4 8.9","0 10.4 M 13.9 -9.8 L 15.4 -12.5 L 16.2 -13.1 L 12.5 -3.7 L 10.2 3.9 L 8.7 7.6 L 10.2 5.5 L 12.1 2.0 L 14.5 -1.5 L 16.5 -3.4 L 17.4 -4.2 L 18.5 -4.8 L 18.8 -4.5 L 17.1 -1.6 L 15.2 2.7 L 13.8 6.1 L 13.5 8.1 L 13.8 9.1 L 14.2 9.3 L 14.9 9.0 L 15.5 8.7","0 5.5 M 11.3 -1.4 L 12.5 -3.6 L 12.8 -4.2 L 13.6 -4.7 L 11.2 .4 L 10.3 3.1 L 9.5 5.8 L 8.9 7.3 L 9.1 7.6 L 10.4 7.2 L 12.6 5.9 M 15.9 -10.5 L 14.1 -8.9 L 13.9 -8.0","0 6.7 M 12.5 -1.7 L 13.4 -4.0 L 14.3 -4.6 L 11.6 3.3 L 9.8 10.0 L 9.1 13.0 L 8.0 15.1 L 6.6 16.4 L 5.7 16.9 L 4.5 16.9 L 3.4 16.2 L 2.5 15.1 L 2.5 12.7 M 16.4 -10.7 L 14.3 -9.2 L 14.5 -8.1","0 9.0 M 13.9 -9.9 L 15.3 -12.6 L 15.9 -13.0 L 13.1 -6.0 L 11.1 -.2 L 9.5 4.9 L 8.9 7.6 L 8.2 8.3 M 19.2 -4.8 L 15.7 -2.2 L 13.0 .7 L 11.5 1.9 L 10.4 2.4 L 10.8 1.0 L 11.9 1.9 L 13.3 5.2 L 14.3 6.7 L 16.1 8.4","0 6.0 M 14.0 -10.0 L 14.7 -12.0 L 15.4 -12.8 L 16.0 -13.1 L 12.8 -4.6 L 10.7 2.0 L 9.4 6.2 L 9.1 7.3 L 9.4 7.5 L 11.3 6.6 L 12.8 5.8","0 16.4 M 11.4 -1.7 L 12.5 -4.1 L 13.2 -4.6 L 10.8 1.0 L 8.4 7.7 L 10.6 4.3 L 13.0 .7 L 14.8 -1.9 L 16.3 -3.4 L 18.1 -4.8 L 19.4 -5.0 L 18.8 -3.8 L 17.0 -.4 L 15.5 3.7 L 14.9 6.6 L 14.8 7.6 L 15.5 7.2 L 16.8 3.9 L 18.8 .5 L 20.7 -1.7 L 22.6 -3.4 L 24.1 -4.5 L 24.6 -4.7 L 25.7 -4.9 L 24.6 -3.2 L 22.9 .9 L 21.1 4.7 L 20.4 7.2 L 20.4 8.4 L 20.4 9.0 L 21.3 9.2 L 22.6 8.4","0 10.8 M 11.2 -1.5 L 12.2 -3.8 L 13.0 -4.5 L 10.1 3.0 L 8.3 7.9 L 9.7 5.7 L 13.0 .8 L 15.2 -2.3 L 17.0 -4.2 L 18.7 -5.2 L 19.3 -5.2 L 17.2 -1.5 L 15.6 3.1 L 14.7 6.0 L 14.5 8.0 L 14.9 8.8 L 15.5 8.8 L 16.5 8.2","0 8.7 M 15.9 -3.8 L 14.3 -4.5 L 12.1 -2.9 L 10.9 -.3 L 9.8 2.2 L 9.2 4.1 L 9.1 6.5 L 9.5 7.6 L 10.4 8.3 L 11.8 8.0 L 13.7 6.3 L 15.2 4.2 L 15.9 2.2 L 16.3 .4 L 16.1 -1.1 L 16.2 -3.2 L 15.6 -5.0 L 15.0 -5.4 L 15.3 -3.3 L 16.7 -1.7 L 17.8 -1.7","0 10.1 M 13.4 -6.0 L 12.8 -5.2 L 6.6 14.0 L 6.2 15.4 L 6.1 16.7 L 6.8 15.5 M 11.6 -4.4 L 13.6 -4.1 L 15.2 -2.4 L 16.1 .3 L 16.4 2.7 L 16.3 5.7 L 14.5 7.5 L 12.6 8.0 L 11.5 7.9 L 10.5 7.4 L 9.4 6.6 L 8.9 5.8 L 9.3 5.0 L 11.6 3.5 L 14.3 1.9 L 17.1 .9 L 19.0 .3","0 10.6 M 18.5 -4.1 L 16.4 -4.7 L 14.1 -3.6 L 11.8 -.4 L 9.9 3.1 L 9.1 5.9 L 9.1 7.0 L 9.3 7.4 L 10.3 7.2 L 12.4 5.7 L 14.6 3.4 L 16.5 1.1 L 17.6 -.5 L 18.4 -2.2 L 19.0 -3.7 L 19.6 -4.3 L 19.9 -3.9 L 19.7 -2.8 L 18.9 -1.9 L 18.2 -.9 L 16.1 4.4 L 13.8 10.4 L 13.0 13.8 L 13.0 14.6 L 13.5 15.2 L 14.5 14.8 L 17.6 12.4","0 9.1 M 10.4 -1.8 L 11.6 -4.1 L 12.7 -4.9 L 10.7 -.4 L 9.7 4.1 L 9.4 6.6 L 9.0 7.4 L 8.6 7.4 L 8.7 6.6 L 11.4 2.3 L 14.1 -1.7 L 15.7 -3.7 L 17.0 -4.5 L 17.8 -4.5 L 18.0 -3.7 L 17.0 -1.6","0 8.6 M 15.7 -.9 L 16.8 -2.8 L 16.9 -4.2 L 16.1 -4.3 L 13.7 -3.8 L 11.5 -2.5 L 10.2 -1.2 L 9.7 -.1 L 10.3 .9 L 12.2 2.5 L 13.9 3.6 L 14.3 4.3 L 14.4 5.1 L 14.1 5.9 L 13.1 6.8 L 11.0 7.7 L 8.7 8.1","0 7.8 M 13.6 -6.4 L 14.6 -8.9 L 15.7 -9.6 L 12.9 -2.3 L 10.8 4.8 L 10.4 6.8 L 10.6 7.7 L 11.7 7.3 L 12.7 7.0 L 14.9 5.1 M 10.6 -4.3 L 18.3 -4.5","0 11.3 M 11.5 -1.9 L 12.4 -4.1 L 13.3 -4.6 L 9.7 4.9 L 9.1 6.6 L 8.9 7.4 L 10.6 6.6 L 13.2 4.0 L 15.7 .9 L 16.5 -.4 L 18.1 -2.0 L 19.3 -4.7 L 18.0 -3.5 L 17.6 -1.5 L 17.0 1.4 L 15.5 6.3 L 15.2 8.5 L 14.3 9.6 L 13.7 9.7 L 16.9 7.3 L 18.8 6.1","0 11.8 M 10.9 -.8 L 11.0 -3.1 L 11.9 -3.8 L 10.9 5.7 L 10.7 6.7 L 10.0 8.0 L 13.6 5.3 L 16.5 1.7 L 18.2 -1.7 L 18.7 -2.8 L 19.1 -5.1 L 18.1 -3.7","0 16.8 M 8.8 -3.3 L 10.1 -4.3 L 10.6 -4.2 L 11.2 -2.0 L 11.4 .9 L 11.5 2.5 L 10.8 4.8 L 10.1 7.0 L 9.9 7.5 L 10.4 8.0 L 11.1 4.9 L 13.6 .5 L 15.5 -2.6 L 16.3 -3.6 L 16.9 -4.3 L 17.8 -3.4 L 18.7 .1 L 19.3 2.8 L 19.5 5.4 L 19.4 7.4 L 20.5 5.5 L 22.3 2.4 L 24.1 -1.0 L 24.7 -2.6 L 25.2 -3.9 L 25.2 -5.2 L 25.0 -5.4 L 24.8 -4.7","0 10.6 M 10.9 -3.0 L 12.4 -3.4 L 13.2 -4.0 L 13.9 -2.2 L 15.2 2.1 L 16.1 6.2 L 16.7 8.0 L 16.6 8.6 M 20.0 -3.9 L 19.8 -4.3 L 17.3 -1.9 L 13.5 2.2 L 10.6 5.7 L 8.6 8.3 L 7.4 9.8 L 6.7 11.2","0 10.9 M 9.8 -2.8 L 10.5 -3.6 L 11.8 -.4 L 11.9 2.3 L 11.9 6.1 L 11.6 9.1 M 18.3 -4.2 L 19.7 -4.6 L 19.3 -3.4 L 17.6 -.3 L 15.5 2.6 L 13.3 5.7 L 10.0 10.2 L 7.4 14.0 L 6.2 16.1 L 5.7 17.8 L 5.8 18.9","0 10.8 M 11.3 -2.3 L 11.9 -3.6 L 12.8 -4.1 L 15.6 -4.2 L 17.6 -4.1 L 18.5 -4.0 L 18.7 -3.6 L 18.3 -3.0 L 16.0 -1.3 L 13.0 2.1 L 9.5 5.6 L 8.7 6.5 L 8.6 7.3 L 9.4 7.7 L 14.3 7.6 L 16.1 7.5 L 17.6 7.1 L 17.4 7.8","0 11.0 M 22.1 -13.5 L 19.4 -13.1 L 17.5 -11.7 L 16.3 -9.1 L 15.9 -6.3 L 14.6 -3.7 L 13.5 -2.3 L 11.7 -1.4 L 10.8 -1.2 L 9.5 -1.2 L 11.5 -1.0 L 12.6 .1 L 13.1 1.1 L 12.7 4.4 L 11.6 7.8 L 11.5 10.4 L 12.0 11.4 L 13.5 12.1 L 14.8 12.0","0 7.0 M 12.4 -11.6 L 11.8 -12.5 L 12.2 -7.1 L 12.0 1.4 L 11.9 6.0 L 11.8 9.0 L 11.4 10.6","0 14.2 M 16.0 -13.6 L 17.5 -13.6 L 18.4 -13.4 L 19.4 -12.8 L 19.8 -11.2 L 19.3 -8.5 L 18.1 -5.3 L 17.9 -3.3 L 18.4 -1.9 L 19.2 -1.3 L 19.8 -.7 L 20.4 -.4 L 21.5 -.4 L 18.9 -.1 L 17.2 .9 L 15.7 3.1 L 15.0 6.0 L 14.5 8.4 L 13.2 10.5 L 11.9 11.4 L 10.2 11.8 L 9.1 12.0","0 10.2 M 9.0 -7.3 L 9.9 -8.1 L 10.8 -8.5 L 12.2 -8.0 L 13.5 -7.5 L 14.7 -7.7 L 15.6 -8.1 L 15.9 -8.5","0 9.4 M 12.9 -8.7 L 11.3 -8.1 L 10.6 -7.1 L 10.2 -5.8 L 10.6 -4.4 L 11.4 -3.5 L 13.1 -3.1 L 14.6 -3.7 L 15.6 -5.1 L 15.7 -6.5 L 15.1 -7.7 L 14.3 -8.3 L 13.7 -8.5 L 12.9 -8.7"]
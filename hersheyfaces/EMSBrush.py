@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 11.7 M 22.6 -9.8 L 19.1 -5.8 L 17.0 -2.7 L 15.8 -.7 L 15.0 .8 L 14.7 2.1 M 12.6 5.7 L 12.6 6.9 L 13.7 7.0 L 13.9 5.8 L 12.6 5.7","0 13.4 M 14.0 -9.6 L 13.3 -10.0 L 14.0 -10.6 L 14.8 -9.7 L 14.7 -8.0 L 12.7 -5.9 M 18.3 -9.6 L 17.5 -10.0 L 18.2 -10.6 L 19.0 -9.7 L 18.9 -8.0 L 16.9 -5.9","0 32.3 M 22.9 -17.0 L 14.8 5.3 M 32.6 -16.7 L 24.5 5.2 M 9.3 -1.9 L 34.8 -1.9 M 13.0 -10.4 L 37.7 -10.5","0 22.5 M 10.6 -7.4 L 9.3 -6.1 L 9.4 -3.9 L 10.7 -2.5 L 12.2 -1.4 L 15.5 -.8 L 19.3 -1.0 L 21.9 -1.9 L 24.9 -4.0 L 25.7 -6.0 L 25.7 -7.0 L 25.2 -7.9 L 23.9 -8.5 L 19.2 -9.5 L 17.4 -10.4 L 16.8 -12.0 L 17.4 -13.5 L 19.3 -15.0 L 21.6 -16.0 L 23.9 -16.2 L 26.8 -16.1 L 28.3 -15.6 L 28.9 -14.6 L 29.1 -13.0 L 28.2 -12.1 L 27.0 -12.0 M 28.9 -20.5 L 21.4 -11.5 L 17.0 -5.5 L 13.3 -.3 L 11.5 2.6 L 10.8 5.6 L 10.6 6.8","0 29.0 M 20.8 -19.5 L 17.5 -17.1 L 15.2 -14.3 L 13.9 -11.9 L 13.3 -9.5 L 14.2 -7.9 L 16.2 -8.0 L 19.3 -10.3 L 21.7 -13.3 L 22.6 -15.2 L 22.8 -17.7 L 22.7 -19.3 L 21.7 -20.2 L 21.1 -20.0 L 21.2 -18.5 L 22.0 -16.8 L 24.3 -16.8 L 27.4 -17.5 L 34.3 -19.5 L 27.7 -11.5 L 20.4 -1.9 L 16.5 3.8 L 14.5 7.9 L 13.9 8.9 L 14.0 11.2 M 30.9 1.4 L 30.1 -1.1 L 28.8 -2.0 L 24.7 1.2 L 22.5 4.4 L 21.3 7.0 L 21.4 9.2 L 22.4 10.3 L 23.8 10.2 L 26.9 7.9 L 29.5 4.7 L 30.9 1.4","0 31.1 M 30.7 -13.5 L 32.5 -13.9 L 33.7 -15.6 L 33.7 -16.8 L 32.4 -17.9 L 29.4 -18.3 L 26.5 -17.7 L 23.6 -16.4 L 22.1 -15.6 L 20.4 -13.4 L 20.2 -11.9 L 20.6 -10.2 L 21.9 -8.7 L 23.6 -7.8 L 24.9 -7.9 L 25.8 -8.3 L 25.9 -9.2 L 25.2 -9.8 L 23.0 -10.0 L 21.9 -9.4 L 19.1 -8.8 L 16.0 -7.0 L 13.2 -5.0 L 11.5 -2.9 L 10.5 -.9 L 10.3 .8 L 10.7 2.3 L 12.2 3.7 L 14.2 4.5 L 18.7 4.9 L 23.5 3.7 L 27.2 1.6 L 29.0 -.3 L 30.0 -1.9 L 30.3 -3.8 L 30.1 -4.9 L 28.9 -6.2 M 37.7 -10.1 L 37.0 -8.2 L 34.5 -7.3 L 31.2 -6.5 L 26.6 -5.9 L 22.0 -4.0 L 18.9 -1.3 L 17.4 1.4 L 16.7 4.2 L 16.4 6.6 L 17.2 9.6 L 19.7 11.6 L 22.7 12.8 L 24.6 12.4 L 25.7 11.6 L 26.4 10.0","0 10.0 M 15.9 -8.1 L 15.3 -8.5 L 16.1 -9.2 L 17.0 -8.2 L 16.3 -6.0 L 14.5 -3.9","0 15.8 M 32.8 -22.0 L 25.5 -20.1 L 19.4 -16.8 L 14.3 -12.1 L 11.3 -7.3 L 9.9 -3.1 L 9.6 2.2 L 10.8 5.0 L 13.3 7.5 L 14.8 8.3 L 16.8 8.4","0 26.9 M 10.0 8.6 L 15.0 7.5 L 19.4 5.6 L 24.3 2.4 L 27.5 -.8 L 30.3 -4.3 L 32.4 -8.6 L 33.3 -12.0 L 33.2 -16.0 L 31.1 -19.6 L 28.6 -21.3 L 26.1 -21.8","0 15.2 M 14.9 -1.7 L 16.7 -11.0 M 11.8 -3.4 L 19.9 -9.2 M 11.2 -6.3 L 20.4 -6.4 M 13.1 -10.0 L 19.0 -2.6","0 17.7 M 18.0 -8.9 L 17.1 -3.7 L 16.8 -1.6 L 15.0 3.9 M 10.4 -1.9 L 22.4 -2.0","0 8.8 M 13.2 6.7 L 12.5 6.1 L 13.9 5.6 L 13.9 7.5 L 13.4 8.7 L 11.7 10.4","0 12.4 M 9.5 -1.9 L 18.3 -2.2","0 10.0 M 12.6 6.0 L 13.0 6.8 L 14.2 6.9 L 14.2 5.9 L 12.6 6.0","0 25.5 M 10.6 12.1 L 10.2 10.9 L 10.7 8.7 L 12.6 4.9 L 15.0 1.1 L 19.0 -4.2 L 22.2 -8.6 L 25.2 -12.4 L 29.0 -17.1 L 30.8 -19.3","0 23.5 M 33.2 -17.0 L 29.7 -17.5 L 26.0 -16.5 L 21.6 -13.8 L 16.8 -9.6 L 13.8 -6.0 L 11.9 -2.0 L 10.9 1.6 L 11.0 5.2 L 12.0 6.8 L 14.7 7.6 L 19.5 6.6 L 23.6 4.6 L 28.1 1.3 L 31.6 -3.1 L 33.5 -6.8 L 33.9 -11.1 L 33.8 -12.8 L 33.1 -14.5 L 31.4 -15.9 L 29.3 -16.9 L 26.0 -17.0","0 15.4 M 17.4 -10.7 L 21.1 -12.5 L 23.9 -14.1 L 25.8 -15.9 L 26.2 -16.1 L 13.9 5.6 L 9.7 7.3 L 13.9 5.6 L 16.4 5.0 L 20.3 5.0","0 27.2 M 19.0 -10.0 L 24.1 -13.2 L 29.2 -15.2 L 32.3 -15.8 L 34.6 -15.5 L 35.7 -13.6 L 35.3 -11.0 L 33.7 -8.3 L 31.2 -5.5 L 27.3 -2.2 L 18.5 3.3 L 15.5 5.0 L 12.6 6.5 L 10.7 7.1 L 9.5 7.0 L 9.8 6.0 L 11.0 5.1 L 13.0 4.7 L 14.3 4.8 L 18.4 5.8 L 24.9 8.1 L 28.7 9.0 L 32.0 8.6 L 33.9 7.4 L 35.0 5.9 L 35.0 4.3 L 32.3 2.5","0 29.7 M 27.1 -15.0 L 24.6 -12.9 L 29.9 -15.1 L 33.5 -16.0 L 36.3 -15.3 L 36.9 -13.6 L 36.6 -11.8 L 35.4 -10.1 L 32.6 -8.5 L 30.1 -7.3 L 27.5 -7.0 L 24.6 -6.3 L 24.6 -6.9 L 31.3 -6.7 L 33.9 -6.2 L 35.8 -4.4 L 36.0 -2.4 L 34.3 .9 L 31.8 3.7 L 28.6 5.4 L 24.3 7.0 L 18.6 7.4 L 14.1 6.8 L 11.9 5.4 L 10.8 3.6 L 11.0 1.4 L 13.3 -1.1 L 16.8 -2.5 L 18.8 -3.2","0 23.5 M 22.1 10.0 L 21.4 8.4 L 21.6 5.3 L 22.8 1.6 L 24.6 -2.1 L 27.6 -6.9 L 30.7 -11.7 L 34.5 -16.8 L 29.2 -12.5 L 10.8 .4 L 10.0 .2 L 10.1 -.5 L 12.3 -1.0 L 14.7 -1.5 L 17.1 -1.6 L 19.4 -1.4 L 21.7 -.8 L 25.6 .3 L 28.3 1.1 L 31.1 1.1 L 32.3 .4 L 33.1 -1.0 L 33.1 -3.0","0 27.9 M 10.3 -.1 L 8.5 2.4 L 8.6 4.6 L 10.5 6.4 L 14.2 7.5 L 18.0 7.1 L 21.2 6.1 L 24.6 4.4 L 28.8 1.4 L 31.3 -1.7 L 32.4 -4.9 L 32.1 -7.0 L 30.8 -8.5 L 27.8 -9.3 L 24.6 -9.3 L 20.9 -8.7 L 15.5 -6.2 L 20.9 -12.7 M 21.0 -15.3 L 22.2 -16.1 L 25.0 -16.5 L 27.5 -16.3 L 30.4 -15.6 L 34.5 -14.9 L 37.1 -14.9 L 38.7 -15.5 L 39.4 -16.3 L 39.6 -17.4","0 25.8 M 17.9 5.6 L 18.9 3.2 L 21.8 .4 L 25.3 -1.3 L 28.5 -1.7 L 30.7 -.9 L 31.2 .6 L 30.5 2.9 L 27.9 4.9 L 24.6 6.7 L 19.5 7.7 L 16.7 7.9 L 14.8 7.5 L 12.6 6.7 L 11.4 4.2 L 11.8 1.1 L 14.2 -3.3 L 18.4 -7.4 L 24.2 -10.7 L 32.2 -14.3 L 36.4 -15.5 L 32.6 -15.6","0 20.8 M 14.1 7.6 L 14.3 4.5 L 16.3 1.1 L 19.2 -2.9 L 23.2 -7.0 L 28.3 -11.3 L 35.1 -16.7 L 33.2 -15.1 L 29.2 -16.3 L 25.1 -17.0 L 20.5 -17.1 L 17.7 -16.4 L 15.4 -14.8 L 14.1 -11.9 L 14.5 -13.8 L 14.7 -15.7","0 25.1 M 33.0 -13.5 L 33.2 -14.9 L 32.0 -16.3 L 28.5 -16.8 L 24.7 -15.9 L 22.2 -14.5 L 20.7 -12.5 L 20.6 -10.9 L 22.0 -9.5 L 24.0 -8.5 L 26.6 -7.4 L 29.7 -5.7 L 30.8 -4.1 L 31.3 -2.2 L 30.6 .0 L 28.9 1.5 L 26.0 3.9 L 22.5 5.7 L 17.9 7.4 L 14.7 7.8 L 12.5 7.7 L 10.4 6.5 L 9.7 4.2 L 10.5 1.9 L 13.7 -1.6 L 18.7 -5.7 L 22.8 -8.2 L 29.7 -11.1 L 31.9 -12.1 L 36.6 -13.6","0 18.8 M 31.7 -16.5 L 25.2 -15.7 L 19.8 -13.9 L 15.1 -11.4 L 13.3 -9.2 L 12.6 -7.0 L 13.4 -5.1 L 16.7 -5.6 L 20.7 -7.3 L 24.9 -10.0 L 28.6 -12.5 L 31.6 -14.8 L 32.2 -14.6 L 26.0 -8.5 L 20.8 -2.8 L 16.9 3.1 L 15.2 7.0 L 14.5 9.5 L 14.5 11.7 L 15.5 13.2","0 10.7 M 14.9 -1.8 L 14.8 -.8 L 16.1 -.8 L 16.2 -1.7 L 14.9 -1.8 M 13.4 5.9 L 13.5 6.8 L 14.5 6.8 L 14.7 5.9 L 13.4 5.9","0 10.5 M 14.6 -2.0 L 14.6 -.8 L 15.7 -.7 L 15.9 -1.9 L 14.6 -2.0 M 13.9 6.6 L 13.2 6.1 L 14.3 5.6 L 14.7 7.5 L 13.5 9.3 L 12.5 10.3","0 13.9 M 17.1 -9.3 L 12.8 -3.3 L 17.2 1.4","0 17.4 M 11.9 -6.7 L 24.6 -7.1 M 10.4 -1.9 L 23.6 -2.3","0 14.0 M 12.8 -9.0 L 17.2 -4.5 L 12.9 1.8","0 17.5 M 16.6 -5.3 L 15.1 -4.2 L 13.6 -4.4 L 12.7 -5.3 L 12.7 -7.5 L 13.9 -9.0 L 15.8 -10.2 L 18.4 -11.0 L 21.5 -10.8 L 23.4 -10.4 L 24.7 -9.1 L 25.0 -6.9 L 24.2 -5.0 L 22.1 -3.4 L 19.5 -1.9 L 17.4 -.5 L 15.8 1.0 L 15.0 2.5 M 13.1 6.0 L 13.0 7.0 L 14.2 7.2 L 14.4 6.1 L 13.1 6.0","0 34.9 M 28.3 -12.0 L 26.3 -12.5 L 23.6 -11.2 L 20.2 -8.6 L 18.0 -6.3 L 16.9 -4.3 L 16.4 -2.2 L 16.9 -.9 L 18.3 -.1 L 20.3 -.7 L 22.5 -2.6 L 24.5 -4.7 L 29.2 -10.9 L 30.2 -10.6 L 26.5 -5.6 L 25.4 -3.1 L 25.3 -1.8 L 26.1 -.6 L 27.5 -.4 L 29.6 -1.6 L 33.8 -5.1 L 37.4 -9.1 L 40.1 -12.9 L 40.4 -16.0 L 39.7 -17.9 L 37.5 -19.7 L 34.7 -20.5 L 29.9 -20.1 L 25.9 -18.9 L 21.0 -16.5 L 16.9 -13.5 L 13.9 -10.2 L 11.5 -6.2 L 10.4 -2.0 L 10.7 1.8 L 12.5 4.6 L 15.4 6.0 L 20.3 6.1 L 26.0 4.8 L 30.3 2.5 L 33.9 -.2 L 37.2 -3.6 L 38.9 -6.6 L 39.3 -9.6 L 39.1 -12.2 L 37.0 -14.8 L 34.2 -16.3 L 31.3 -17.2 L 27.6 -17.0","0 41.7 M 28.3 -4.1 L 30.2 -6.9 L 31.0 -9.9 L 30.3 -12.0 L 28.7 -12.9 L 25.9 -12.9 L 21.4 -11.2 L 16.5 -7.4 L 13.2 -3.2 L 10.8 .7 L 9.6 4.3 L 9.9 8.1 L 11.8 10.7 L 15.2 11.8 L 18.2 11.3 L 22.7 9.1 L 28.9 4.9 L 34.5 .1 L 44.1 -9.4 L 49.4 -15.0 L 51.1 -16.7 L 52.2 -17.4 L 51.9 -15.5 L 48.0 -9.6 L 45.9 -5.8 L 43.6 -1.9 L 42.1 2.3 L 41.3 5.1 L 41.0 7.2 L 41.0 8.4 L 41.6 9.1 L 42.6 9.4 L 43.5 9.1 L 44.3 8.4 M 32.7 -3.1 L 33.1 -3.1 L 34.6 -3.5 L 48.8 -3.3","0 34.2 M 15.4 -5.9 L 14.0 -7.8 L 14.5 -10.3 L 16.3 -12.9 L 20.4 -15.7 L 24.9 -17.5 L 30.6 -18.5 L 35.4 -18.5 L 38.6 -18.0 L 42.0 -16.1 L 43.4 -13.5 L 42.9 -10.6 L 41.9 -8.3 L 39.3 -6.8 L 36.4 -6.1 L 31.7 -5.7 L 29.3 -5.8 L 29.4 -6.5 L 34.5 -4.9 L 36.4 -3.8 L 37.9 -1.3 L 38.1 1.1 L 36.9 3.9 L 35.0 5.9 L 32.3 7.4 L 29.0 8.6 L 25.4 8.9 L 23.0 8.7 L 20.9 8.1 L 19.2 6.3 L 18.3 5.0 L 17.3 2.9 L 15.9 -1.6 L 15.5 -2.1 L 14.4 -2.3 L 12.9 -1.1 L 11.5 1.5 L 10.5 4.0 L 10.3 5.8 L 10.6 7.3 L 11.5 8.2 L 13.4 7.7 L 15.6 5.7 L 19.8 1.7 L 24.2 -3.7 L 29.8 -10.7 L 32.7 -13.6 L 34.2 -14.6 L 35.4 -14.6","0 29.9 M 27.9 -11.4 L 25.6 -9.4 L 25.1 -7.8 L 25.2 -6.6 L 26.2 -5.1 L 28.2 -4.0 L 31.1 -3.9 L 33.9 -4.5 L 36.9 -6.6 L 38.9 -9.2 L 39.6 -11.5 L 39.5 -13.7 L 38.3 -15.9 L 36.2 -17.1 L 33.7 -17.8 L 30.2 -17.7 L 24.0 -15.7 L 20.2 -13.5 L 16.1 -9.9 L 13.0 -5.7 L 11.6 -1.9 L 11.0 2.8 L 12.0 5.9 L 14.1 8.2 L 18.9 9.6 L 23.3 9.2 L 25.8 8.5 L 30.1 6.4 L 32.7 4.6 L 34.7 2.6","0 38.1 M 14.7 -6.1 L 14.2 -7.8 L 14.9 -10.1 L 17.8 -13.3 L 21.8 -15.4 L 25.6 -16.6 L 30.2 -17.0 L 35.2 -16.6 L 38.7 -15.7 L 41.8 -13.1 L 43.7 -9.8 L 44.2 -5.4 L 43.4 -1.7 L 41.5 1.5 L 39.0 4.3 L 35.9 6.7 L 31.7 8.4 L 26.3 9.3 L 23.0 9.4 L 20.9 9.1 L 18.6 8.1 L 17.1 6.8 L 15.7 4.7 L 14.6 1.9 L 14.2 -.8 L 14.0 -1.8 L 13.2 -1.5 L 11.5 1.1 L 10.4 4.1 L 10.1 6.1 L 10.4 8.1 L 11.4 8.8 L 12.8 8.3 L 15.1 6.7 L 19.5 2.2 L 25.2 -4.9 L 28.6 -9.2 L 32.3 -12.8 L 33.6 -13.6 L 34.7 -13.6","0 28.2 M 22.5 5.9 L 21.7 5.1 L 21.7 2.6 L 23.7 -.3 L 26.2 -2.0 L 28.7 -3.1 L 31.4 -3.3 L 33.4 -2.0 L 33.8 .1 L 33.2 2.8 L 29.8 6.6 L 25.9 8.8 L 22.3 9.9 L 16.2 10.2 L 12.4 9.2 L 10.2 7.7 L 9.0 5.3 L 9.0 3.3 L 10.4 .6 L 12.9 -2.2 L 16.0 -4.4 L 20.0 -6.3 L 22.9 -7.3 L 25.8 -8.0 L 28.1 -8.3 L 30.2 -7.8 L 30.9 -7.1 L 30.9 -6.6 L 29.8 -5.4 L 27.7 -5.1 L 25.7 -5.6 L 23.8 -6.5 L 21.9 -7.7 L 21.2 -9.6 L 21.1 -11.8 L 22.9 -14.5 L 25.9 -16.3 L 29.2 -17.8 L 32.5 -18.4 L 36.0 -18.0 L 37.6 -17.0 L 38.0 -15.1 L 37.0 -13.4 L 36.1 -12.8 L 34.5 -12.7","0 26.4 M 21.4 -5.8 L 21.1 -4.0 L 19.4 -2.0 L 17.8 -.1 L 15.4 .9 L 13.0 1.0 L 11.0 .9 L 9.1 -.9 L 9.2 -4.2 L 10.7 -7.5 L 14.3 -11.4 L 18.7 -14.6 L 23.8 -17.0 L 27.9 -18.1 L 31.7 -18.3 L 34.7 -17.8 L 36.3 -15.9 L 36.4 -14.4 L 35.6 -11.9 L 21.0 7.6 L 19.3 9.8 L 20.1 10.1 M 22.9 -1.8 L 34.0 -1.9","0 34.0 M 29.7 -12.1 L 29.7 -9.4 L 31.2 -7.8 L 33.5 -7.3 L 36.8 -8.6 L 39.2 -10.0 L 40.5 -12.3 L 40.4 -14.2 L 37.5 -16.5 L 32.5 -17.0 L 25.2 -15.2 L 18.1 -11.4 L 13.9 -7.9 L 11.2 -4.8 L 9.5 -1.9 L 8.9 1.0 L 8.8 3.1 L 10.7 6.5 L 14.1 8.1 L 19.1 8.5 L 24.1 7.4 L 28.1 5.6 L 32.2 3.1 L 35.7 .0 L 37.8 -2.6 L 38.1 -3.5 L 38.8 -3.6 L 29.0 12.4 M 24.1 -2.7 L 27.3 -3.7 L 31.1 -4.1 L 44.2 -4.2","0 39.1 M 21.5 -9.5 L 21.9 -8.9 L 21.8 -5.4 L 20.2 -2.8 L 18.4 -1.1 L 16.2 -.1 L 13.9 -.1 L 11.7 -1.0 L 10.5 -4.3 L 11.8 -10.2 L 14.5 -13.7 L 19.2 -17.4 L 23.4 -19.2 L 26.6 -20.1 L 31.8 -19.9 L 33.9 -19.4 L 35.2 -16.9 L 34.9 -14.4 L 33.0 -10.8 L 20.8 9.0 M 17.7 2.2 L 20.1 .3 L 22.7 -.3 L 27.8 -.1 L 32.5 .5 L 37.7 .4 L 41.3 .1 L 43.6 -.6 M 58.1 -21.1 L 53.4 -17.6 L 49.1 -13.0 L 45.2 -8.1 L 42.2 -3.3 L 39.1 1.7 L 37.8 5.4 L 37.5 7.8 L 37.7 9.0 L 38.9 9.8 L 40.4 9.6 L 41.0 9.2 L 42.7 8.0","0 24.5 M 14.0 -1.6 L 13.4 .6 L 14.0 2.2 L 15.8 3.1 L 18.4 2.3 L 20.0 .5 L 21.8 -1.9 L 22.6 -4.3 L 22.6 -7.6 L 22.1 -8.5 L 19.5 -9.6 L 16.0 -8.6 L 13.5 -6.4 L 11.2 -1.9 L 10.5 .7 L 10.3 4.1 L 11.2 6.7 L 12.2 8.4 L 15.6 9.9 L 19.0 8.8 L 22.6 6.4 L 25.6 2.6 L 29.1 -2.6 L 32.2 -8.1 L 34.8 -11.6 L 37.8 -14.5 L 39.9 -16.1 L 42.0 -16.3 L 42.9 -16.3 L 41.9 -17.9 L 38.9 -19.4 L 33.8 -19.3 L 28.4 -16.3 L 26.3 -13.2 L 25.7 -10.5 L 26.4 -7.9 L 28.3 -6.0 L 32.5 -4.9 L 35.5 -5.4 L 37.1 -6.3 L 37.6 -7.2 L 37.6 -8.7","0 34.0 M 26.0 3.6 L 27.2 1.5 L 27.7 -1.0 L 27.2 -2.4 L 26.0 -4.0 L 23.3 -4.6 L 20.8 -4.4 L 17.1 -2.7 L 13.7 .4 L 11.6 4.2 L 11.5 7.5 L 12.4 9.9 L 14.2 11.8 L 17.5 12.2 L 21.2 11.7 L 25.4 10.1 L 29.6 7.4 L 34.2 2.7 L 38.2 -2.5 L 42.7 -9.7 L 45.0 -13.9 L 46.8 -17.7 L 46.9 -19.6 M 34.8 -11.7 L 33.5 -13.7 L 33.9 -15.7 L 35.8 -17.5 L 39.0 -18.6 L 42.7 -19.3 L 45.7 -19.3 L 48.8 -18.6 L 50.8 -18.1 L 52.2 -17.2 L 52.5 -16.1","0 38.1 M 23.6 -3.6 L 23.6 -4.2 L 23.0 -5.0 L 20.5 -5.6 L 17.4 -5.1 L 14.0 -3.1 L 11.6 -.3 L 10.5 2.6 L 10.3 5.8 L 12.3 9.0 L 16.3 10.0 L 21.0 8.7 L 24.9 6.2 L 28.0 3.2 L 30.4 .7 L 34.0 -4.3 L 36.9 -9.1 L 39.5 -14.0 L 40.6 -16.1 L 41.3 -18.1 L 41.4 -19.2 L 40.7 -19.3 L 36.2 -17.5 L 32.5 -15.4 L 30.5 -13.3 L 29.4 -11.8 L 29.2 -10.4 L 29.6 -9.8 L 30.6 -9.7 L 31.7 -9.7 M 53.4 8.8 L 53.3 10.3 L 52.1 11.8 L 49.7 12.0 L 47.1 11.4 L 44.5 9.5 L 40.6 5.4 L 36.9 -.4 L 35.0 -4.9 L 34.5 -6.2 L 33.3 -6.9 L 32.2 -6.8 L 30.9 -5.8 L 30.2 -4.7 L 30.1 -2.6 L 30.8 -1.5 L 32.2 -.8 L 34.3 -1.2 L 37.2 -3.0 L 43.8 -7.9 L 50.9 -13.4 L 56.9 -17.4 L 62.1 -20.0 L 65.8 -20.9 L 68.4 -21.1 L 70.2 -20.8 L 70.8 -20.3","0 27.7 M 24.2 -10.0 L 22.9 -10.7 L 20.9 -10.0 L 19.8 -8.7 L 19.3 -6.6 L 20.1 -4.3 L 22.5 -2.8 L 25.2 -1.5 L 28.8 -1.9 L 34.7 -4.6 L 38.8 -8.6 L 41.6 -13.4 L 42.1 -16.9 L 40.8 -18.6 L 39.0 -19.1 L 35.6 -17.8 L 31.0 -13.2 L 27.8 -8.3 L 18.7 3.8 L 15.7 7.0 L 13.3 8.7 L 10.5 8.6 L 9.5 6.6 L 10.0 3.0 L 11.2 .3 L 12.8 -1.8 L 13.5 -2.2 L 18.4 6.1 L 23.4 9.8 L 27.9 11.1 L 32.4 11.0 L 34.8 9.9 L 35.8 8.6 L 35.9 7.0","0 46.5 M 23.2 -2.3 L 23.0 .1 L 21.0 2.1 L 18.8 3.8 L 15.2 4.4 L 12.6 3.7 L 10.7 1.6 L 10.1 -1.1 L 11.1 -6.2 L 13.9 -10.1 L 17.2 -13.1 L 20.7 -15.5 L 25.9 -17.4 L 29.7 -17.9 L 33.0 -17.0 L 34.2 -14.3 L 33.5 -10.9 L 30.9 -4.9 L 27.4 .3 L 22.4 8.3 L 23.2 8.3 L 31.2 -2.9 L 36.1 -8.8 L 42.1 -14.4 L 44.1 -15.5 L 45.7 -15.4 L 46.0 -14.6 L 45.1 -12.1 L 41.1 -4.2 L 34.5 7.3 L 40.2 .3 L 47.0 -6.9 L 57.8 -16.1 L 58.6 -15.4 L 57.7 -13.8 L 52.4 -7.4 L 47.8 .1 L 45.8 4.2 L 45.2 7.2 L 45.8 9.4 L 47.4 9.5 L 50.8 8.0","0 38.3 M 22.0 -1.6 L 22.3 1.1 L 20.5 3.2 L 17.6 4.9 L 14.9 5.3 L 12.1 5.0 L 10.3 3.6 L 9.5 -.4 L 10.5 -4.4 L 13.6 -8.7 L 16.9 -11.6 L 20.3 -14.0 L 23.5 -15.5 L 27.5 -16.5 L 30.8 -16.3 L 33.0 -14.8 L 32.9 -10.5 L 30.7 -5.0 L 26.7 1.2 L 21.7 9.3 L 22.7 9.4 L 24.3 5.6 L 29.7 -.7 L 36.5 -6.7 L 42.1 -10.7 L 49.9 -14.5 L 51.1 -13.6 L 49.6 -11.7 L 45.6 -7.1 L 40.4 .5 L 38.2 5.7 L 37.8 8.6 L 37.9 10.2 L 38.5 11.0 L 40.1 10.5 L 43.4 8.9","0 31.9 M 31.8 -1.0 L 32.1 -1.0 L 37.0 -5.2 L 39.5 -8.1 L 40.7 -11.0 L 40.5 -14.3 L 37.0 -16.9 L 32.2 -17.3 L 26.5 -16.1 L 20.9 -13.1 L 15.6 -8.6 L 12.6 -4.1 L 10.7 .8 L 10.7 5.0 L 12.6 7.8 L 15.3 9.4 L 21.9 9.3 L 27.6 7.3 L 33.5 3.4 L 38.4 -1.2 L 39.7 -5.7 L 39.0 -9.6 L 36.1 -12.5 L 32.8 -13.7 L 28.3 -13.9","0 43.5 M 23.0 3.3 L 24.2 1.5 L 24.6 -.4 L 23.3 -2.6 L 20.4 -3.2 L 17.5 -3.0 L 14.3 -.7 L 11.7 2.2 L 11.0 4.8 L 11.2 8.0 L 13.4 10.7 L 17.9 11.4 L 22.9 10.0 L 26.3 7.3 L 30.6 1.9 L 36.8 -8.4 L 40.4 -17.0 M 26.8 -9.4 L 23.9 -7.9 L 21.0 -7.6 L 18.3 -7.8 L 16.9 -9.1 L 16.7 -11.0 L 18.7 -13.0 L 22.4 -14.6 L 28.0 -16.1 L 36.2 -16.8 L 39.6 -16.9 L 46.0 -16.0 L 50.5 -14.9 L 54.3 -12.6 L 55.0 -9.9 L 54.2 -7.7 L 51.7 -5.0 L 47.3 -2.4 L 42.4 -1.0 L 38.8 -.8 L 34.3 -1.2","0 32.5 M 31.4 -.9 L 35.6 -3.8 L 38.5 -6.7 L 40.2 -9.6 L 40.8 -12.3 L 39.9 -14.7 L 37.3 -16.7 L 32.3 -17.1 L 26.0 -15.9 L 19.1 -11.9 L 13.9 -6.8 L 11.8 -2.8 L 10.6 .7 L 10.8 4.2 L 11.7 7.1 L 13.3 8.6 L 17.2 9.6 L 21.6 9.3 L 27.6 7.4 L 33.5 3.5 L 37.9 -.8 L 39.6 -5.4 L 39.1 -9.2 L 36.5 -12.1 L 33.7 -13.6 L 31.2 -14.0 L 27.6 -13.6 M 12.4 10.4 L 12.6 7.8 L 14.1 5.2 L 16.2 4.4 L 19.4 5.4 L 33.6 14.2 L 36.5 15.2 L 38.4 14.5 L 39.0 13.6 L 38.8 12.0","0 30.7 M 10.6 1.8 L 7.4 5.7 L 7.1 8.0 L 7.8 9.3 L 9.6 10.3 L 11.8 9.9 L 15.5 8.0 L 19.9 4.0 L 30.5 -8.9 L 32.6 -11.1 L 33.8 -11.6 L 34.7 -11.6 L 34.9 -11.1 M 22.3 -7.7 L 21.5 -6.3 L 18.6 -4.1 L 15.3 -3.1 L 13.9 -3.1 L 12.6 -3.6 L 12.2 -6.0 L 14.2 -9.7 L 17.5 -12.6 L 22.9 -15.2 L 29.5 -16.6 L 34.8 -16.6 L 39.2 -15.6 L 42.0 -13.5 L 43.1 -11.1 L 43.1 -9.3 L 41.7 -7.1 L 39.1 -5.4 L 34.6 -4.2 L 30.3 -3.9 L 25.9 -4.3 L 24.2 -4.3 L 23.7 -5.1 L 24.5 -5.8 L 25.8 -5.4 L 26.8 -1.7 L 29.4 7.4 L 31.2 10.0 L 33.2 11.0 L 34.6 10.9 L 35.8 10.2 L 37.2 7.2","0 30.6 M 19.7 11.0 L 17.0 9.9 L 15.2 8.2 L 13.4 5.4 L 12.7 2.7 L 12.4 .3 L 12.1 -1.1 L 11.1 -1.7 L 10.1 -1.5 L 9.1 -.3 L 8.6 .6 L 9.0 3.7 L 10.6 6.3 L 13.0 8.4 L 15.8 9.1 L 23.7 9.3 L 29.6 7.3 L 33.5 4.9 L 35.7 1.6 L 35.8 -.6 L 35.1 -2.0 L 33.6 -3.2 L 29.4 -4.1 L 24.3 -5.3 L 21.5 -7.1 L 20.8 -8.6 L 20.8 -10.4 L 22.6 -12.8 L 25.7 -14.7 L 30.2 -16.3 L 34.4 -16.4 L 38.4 -16.1 L 40.2 -15.2 L 41.1 -13.5 L 41.3 -11.7 L 40.7 -10.3 L 39.5 -9.4 L 36.8 -9.1","0 27.6 M 14.2 .4 L 14.6 1.7 L 16.4 2.3 L 19.9 .8 L 23.3 -1.9 L 24.9 -4.1 L 26.2 -6.7 L 26.3 -9.0 L 25.1 -10.1 L 22.3 -10.5 L 18.8 -8.9 L 15.1 -6.0 L 12.5 -2.6 L 11.0 1.4 L 10.1 5.6 L 11.1 9.4 L 12.9 10.7 L 15.4 11.3 L 19.0 10.1 L 21.8 8.0 L 25.3 4.0 L 29.0 -1.5 L 33.5 -8.0 L 36.1 -10.7 L 37.8 -12.1 L 39.1 -12.2 L 40.4 -12.0 M 50.1 -17.2 L 50.7 -15.5 L 50.0 -14.1 L 48.4 -13.4 L 46.4 -13.2 L 44.2 -13.5 L 41.1 -14.8 L 31.0 -19.2 L 28.2 -19.7 L 23.9 -20.0 L 18.7 -19.0 L 13.0 -15.6 L 10.6 -11.9 L 10.3 -7.9 L 10.9 -5.4 L 12.6 -3.9 L 15.3 -2.9 L 18.8 -2.6","0 33.2 M 20.1 .3 L 16.5 2.9 L 13.5 3.8 L 10.4 3.0 L 9.7 .4 L 10.7 -3.6 L 14.2 -8.1 L 18.7 -12.2 L 23.5 -15.6 L 27.5 -17.3 L 30.8 -18.1 L 34.2 -17.8 L 35.4 -16.9 L 35.3 -15.1 L 32.8 -11.2 L 24.7 .4 L 22.2 4.4 L 21.6 6.4 L 21.7 7.2 L 22.7 7.6 L 24.1 7.4 L 26.3 6.1 L 31.8 1.5 L 41.0 -8.2 L 45.3 -13.5 L 46.0 -13.6 L 46.4 -13.0 L 43.9 -10.0 L 37.7 -1.1 L 34.2 5.3 L 33.5 7.2 L 34.2 7.6 L 36.5 6.5 L 38.6 4.5","0 28.2 M 20.0 -3.2 L 20.0 -.9 L 18.6 1.1 L 16.1 2.6 L 14.2 2.9 L 11.0 1.6 L 8.7 -1.5 L 8.6 -5.6 L 10.3 -9.8 L 13.8 -14.3 L 18.2 -16.8 L 22.1 -18.1 L 26.3 -17.8 L 28.6 -16.7 L 30.1 -14.2 L 30.2 -10.9 L 28.9 -6.4 L 24.0 5.0 L 22.6 9.3 L 24.9 8.0 L 27.2 5.6 L 40.0 -9.4 L 44.6 -14.0 L 48.6 -17.1 L 52.2 -18.9 L 53.9 -19.3 L 56.0 -18.7","0 45.6 M 20.6 -1.7 L 17.8 .5 L 15.1 1.2 L 12.1 1.2 L 10.2 -.3 L 10.6 -3.3 L 13.2 -7.5 L 17.3 -11.4 L 21.9 -14.4 L 27.2 -16.8 L 30.5 -17.1 L 32.0 -16.7 L 32.9 -15.3 L 32.7 -13.5 L 30.7 -9.6 L 28.1 -5.3 L 17.6 9.6 L 17.2 11.2 L 18.4 10.7 L 22.3 6.1 L 28.5 -1.3 L 35.2 -7.4 L 39.9 -11.1 L 40.8 -11.4 L 41.3 -11.1 L 40.0 -9.8 L 37.0 -4.9 L 34.1 1.5 L 33.3 4.3 L 33.1 7.3 L 33.9 8.9 L 37.0 9.5 L 40.7 8.4 L 44.9 5.0 L 49.8 -.1 L 53.5 -6.3 L 55.0 -9.7 L 55.1 -12.1 L 54.9 -13.6 L 53.9 -15.5 L 52.9 -16.2 L 52.1 -15.5 L 52.2 -14.6 L 54.4 -13.6 L 55.9 -13.7 L 57.8 -14.4","0 27.8 M 6.4 -1.3 L 4.3 2.2 L 3.7 5.4 L 3.9 8.1 L 6.1 9.7 L 9.6 9.6 L 15.5 6.4 L 23.7 .6 L 41.0 -14.1 L 44.8 -17.0 L 47.1 -18.2 L 49.7 -18.4 M 19.8 -2.8 L 17.5 -1.6 L 14.9 -1.9 L 13.7 -3.3 L 13.5 -6.0 L 15.1 -9.8 L 17.3 -12.4 L 20.7 -15.4 L 24.0 -17.0 L 26.8 -17.4 L 29.4 -17.0 L 31.1 -14.7 L 31.6 -11.8 L 31.0 -7.4 L 28.3 4.2 L 27.8 6.2 L 28.0 7.7 L 29.1 8.3 L 30.8 7.4 L 35.8 2.5","0 36.0 M 21.5 -2.7 L 17.3 .3 L 13.4 .8 L 11.0 -.3 L 10.3 -4.7 L 12.5 -9.4 L 16.5 -13.0 L 21.5 -16.0 L 27.2 -18.0 L 30.7 -18.3 L 32.8 -17.2 L 33.3 -14.9 L 31.8 -12.2 L 23.3 -1.1 L 21.5 2.1 L 21.1 4.0 L 21.3 6.4 L 23.2 6.8 L 25.7 5.3 L 29.0 2.6 L 41.0 -9.2 L 43.2 -12.7 L 44.0 -13.4 L 44.8 -13.6 L 30.7 10.8 L 27.3 14.9 L 23.8 16.8 L 21.1 17.0 L 19.6 16.3 L 18.4 13.9","0 30.5 M 16.7 -10.2 L 17.0 -13.1 L 19.9 -15.0 L 25.2 -16.2 L 31.7 -15.7 L 35.9 -15.7 L 39.1 -14.9 L 42.8 -14.2 L 45.1 -14.3 L 45.1 -15.0 M 42.4 -16.3 L 25.3 -5.9 L 17.2 .0 L 9.5 7.0 L 8.9 7.4 L 7.3 7.6 L 7.1 6.6 L 11.7 7.2 L 16.9 6.5 L 25.2 5.9 L 29.4 6.3 L 33.0 7.1 L 34.2 8.0 L 34.5 9.6 L 33.8 11.0","0 24.2 M 30.5 -20.1 L 25.0 -19.9 L 21.1 -16.0 L 13.6 -3.4 L 11.4 2.6 L 10.6 6.2 L 11.5 7.3 L 18.0 7.7","0 23.6 M 10.7 -19.3 L 19.6 -8.5 L 26.7 1.6 L 30.0 6.3 L 31.0 9.1 L 31.6 10.7 L 31.3 11.7","0 23.0 M 22.6 -20.2 L 28.8 -20.0 L 30.0 -19.3 L 30.2 -18.3 L 27.9 -10.9 L 24.7 -4.2 L 20.9 1.9 L 17.3 6.5 L 15.7 7.4 L 10.4 7.5","0 15.9 M 12.0 -5.9 L 16.5 -9.5 L 21.3 -5.9","0 33.0 M 9.2 9.3 L 39.3 9.3","0 10.4 M 10.7 -7.6 L 14.7 -4.6","0 15.2 M 19.5 -2.7 L 19.6 -4.4 L 18.0 -5.4 L 14.6 -4.2 L 10.5 -1.2 L 8.2 1.9 L 7.4 4.0 L 7.6 5.8 L 8.6 7.2 L 10.5 6.8 L 12.8 5.0 L 15.4 2.4 L 20.4 -3.5 L 16.1 3.0 L 16.2 5.7 L 17.3 6.9 L 19.0 6.4 L 21.6 4.3 L 23.2 2.4","0 13.7 M 17.5 -10.3 L 9.5 -.9 L 7.5 3.5 L 7.6 6.1 L 9.2 7.1 L 11.9 5.8 L 14.6 2.8 L 15.9 .7 L 17.4 -1.9 L 17.6 -3.8 L 16.8 -4.2 L 15.8 -3.0 L 15.9 -.6 L 17.6 1.7 L 19.4 3.3 L 20.8 3.2 L 21.7 2.4","0 10.2 M 15.5 -1.2 L 16.5 -1.8 L 17.0 -3.0 L 16.7 -4.2 L 15.3 -4.4 L 12.8 -3.3 L 10.1 -.6 L 8.3 1.7 L 7.3 4.0 L 7.4 5.9 L 8.5 7.7 L 12.0 7.5 L 15.6 4.9 L 18.2 2.4","0 17.3 M 19.6 -4.0 L 17.5 -5.4 L 13.9 -3.9 L 11.3 -1.8 L 8.7 1.2 L 7.3 3.5 L 7.1 6.1 L 8.7 7.3 L 10.3 7.1 L 13.1 4.9 L 15.7 1.7 L 21.7 -6.5 L 25.0 -10.7 L 25.9 -10.8 L 23.9 -8.2 L 17.3 .2 L 16.4 2.1 L 16.1 4.4 L 16.6 6.6 L 18.1 7.1 L 20.1 6.7 L 22.3 5.2 L 24.6 3.2 L 25.3 2.4","0 10.1 M 8.6 2.2 L 10.8 2.6 L 14.7 .7 L 17.0 -1.4 L 17.6 -2.7 L 17.2 -4.0 L 15.4 -4.3 L 11.2 -1.9 L 8.3 1.5 L 7.2 4.4 L 7.8 6.9 L 10.5 7.6 L 14.4 5.7 L 18.1 2.4","0 11.5 M -.5 12.8 L 1.1 14.9 L 3.7 15.1 L 6.2 13.1 L 9.3 9.4 L 13.0 1.9 L 16.9 -6.8 L 19.8 -11.8 L 21.9 -13.0 L 23.2 -12.8 L 24.5 -11.9 M 11.4 -4.5 L 17.1 -4.2 L 21.7 -4.6","0 14.1 M 3.4 12.8 L 5.1 14.8 L 8.0 14.8 L 11.1 12.5 L 15.2 6.3 L 18.4 .6 L 20.8 -3.3 L 19.8 -3.1 L 14.6 3.3 L 11.6 5.9 L 9.6 7.2 L 7.7 6.1 L 7.2 4.2 L 8.5 1.1 L 11.5 -2.2 L 14.9 -4.6 L 17.1 -5.4 L 18.6 -5.6 L 19.6 -4.9 L 20.0 -3.8","0 13.6 M 17.3 -11.3 L 11.8 -4.2 L 5.4 6.9 L 9.5 2.0 L 13.3 -1.0 L 16.0 -2.9 L 18.9 -4.2 L 19.7 -4.0 L 17.3 -.6 L 15.4 2.3 L 14.7 4.1 L 14.7 5.7 L 15.4 6.5 L 16.6 6.9 L 21.6 2.4","0 8.0 M 12.3 -3.4 L 8.8 .7 L 6.9 4.7 L 6.9 6.9 L 8.9 7.8 L 12.9 5.6 L 16.0 2.4 M 14.8 -7.8 L 14.9 -6.7 L 15.9 -6.9 L 15.9 -7.5 L 14.8 -7.8","0 8.7 M 8.0 2.4 L 12.1 -2.5 L 13.5 -3.4 L 12.2 .4 L 7.9 8.2 L 4.8 12.2 L 3.0 14.2 L 1.2 15.2 L -.5 15.0 L -2.1 14.1 L -2.2 13.9 M 15.0 -7.8 L 15.0 -6.7 L 16.0 -6.7 L 16.3 -7.7 L 16.3 -7.7 L 16.3 -7.7 L 13.7 -8.0 L 12.4 -8.1 L 15.0 -7.8","0 14.2 M 18.0 -11.5 L 14.4 -7.4 L 10.9 -2.7 L 8.5 1.5 L 7.0 4.3 L 6.0 6.6 L 10.6 -1.7 L 14.4 -4.2 L 17.9 -5.7 L 20.7 -4.9 L 21.2 -2.9 L 20.7 -1.4 L 18.2 .2 L 16.4 1.1 L 12.5 1.3 L 9.9 1.1 L 11.0 4.1 L 12.7 6.6 L 14.1 7.5 L 16.5 7.1 L 18.4 5.9 L 22.2 2.4","0 8.6 M 17.2 -11.1 L 10.2 -1.7 L 7.3 3.6 L 7.1 5.9 L 8.7 7.2 L 11.8 6.9 L 14.8 4.3 L 16.6 2.4","0 24.7 M 8.0 2.4 L 10.9 -.4 L 13.8 -4.2 L 8.9 5.7 L 9.1 6.5 L 13.0 1.9 L 16.8 -1.6 L 19.9 -4.2 L 21.8 -4.7 L 21.4 -3.3 L 17.2 6.3 L 19.4 3.1 L 22.6 -.6 L 25.8 -2.6 L 28.3 -4.1 L 30.0 -4.4 L 26.2 .9 L 24.9 4.0 L 25.4 6.4 L 27.4 6.4 L 30.9 4.3 L 32.8 2.4","0 15.7 M 8.0 2.4 L 9.1 1.3 L 13.9 -4.2 L 10.6 1.6 L 9.0 4.9 L 9.0 6.7 L 10.6 5.2 L 14.3 .8 L 17.7 -2.3 L 20.3 -4.3 L 21.8 -4.6 L 22.4 -4.3 L 19.9 -1.2 L 17.3 2.8 L 16.6 5.6 L 17.4 7.0 L 19.2 6.9 L 22.1 4.3 L 23.6 2.4","0 10.8 M 16.7 -4.0 L 16.5 -.5 L 14.7 2.7 L 11.8 5.9 L 9.4 7.2 L 7.8 6.7 L 7.1 4.3 L 8.8 .7 L 10.8 -1.9 L 13.4 -4.1 L 15.4 -5.1 L 16.4 -4.6 L 15.4 -4.3 L 15.7 -2.7 L 17.1 -1.8 L 19.3 -2.8","0 13.6 M 11.2 -1.0 L 14.5 -3.3 L 17.2 -4.0 L 19.1 -3.7 L 20.3 -2.0 L 20.2 -.4 L 19.2 1.7 L 17.2 4.3 L 14.0 6.2 L 11.2 7.1 L 8.9 6.8 L 7.6 6.1 L 6.9 4.8 L 8.4 2.1 L 13.2 -3.7 L 6.6 4.0 L 3.8 9.0 L 3.0 11.2 L 3.1 13.0 L 3.9 14.5","0 13.0 M 19.4 -1.5 L 14.0 3.9 L 9.9 6.5 L 7.6 6.9 L 6.7 6.2 L 6.8 3.8 L 9.4 .8 L 12.6 -1.5 L 16.5 -3.0 L 18.0 -3.3 L 18.9 -3.2 L 19.0 -2.0 L 13.1 5.5 L 11.3 9.3 L 10.0 11.9 L 9.8 15.0 L 11.1 16.8 L 12.7 16.4 L 14.3 14.8 L 15.8 12.0 L 16.3 9.5 L 15.7 8.1 L 15.0 7.7 L 12.6 7.3","0 15.4 M 8.0 2.4 L 11.9 -2.2 L 14.2 -5.1 L 15.3 -6.7 L 15.6 -7.7 L 15.1 -7.9 L 14.1 -6.9 L 13.6 -5.7 L 13.8 -4.3 L 14.8 -3.2 L 16.6 -3.3 L 18.5 -4.2 L 15.2 -.3 L 13.8 2.9 L 13.5 5.4 L 14.3 7.0 L 16.2 7.2 L 19.4 6.0 L 21.7 4.1 L 23.4 2.4","0 13.7 M 8.0 2.4 L 12.2 -1.9 L 18.5 -7.7 L 19.1 -7.7 L 18.2 -6.5 L 17.4 -5.1 L 16.7 -.1 L 15.9 3.8 L 15.2 5.2 L 14.3 6.3 L 11.8 6.6 L 10.5 6.1 L 9.3 4.8 L 8.6 1.8 L 9.3 4.9 L 10.4 6.0 L 12.8 6.5 L 14.8 6.1 L 17.4 5.4 L 20.4 3.8 L 23.1 1.1","0 10.7 M 14.9 -8.1 L 9.3 -.4 L 7.6 3.3 L 7.2 6.0 L 8.4 7.3 L 10.8 7.3 L 13.3 6.3 L 16.1 4.9 L 18.7 2.4 M 8.6 -4.4 L 14.5 -4.5 L 20.6 -4.9","0 16.6 M 8.0 2.4 L 10.1 .6 L 13.5 -3.5 L 14.5 -4.1 L 11.1 .8 L 8.7 4.9 L 8.5 6.2 L 9.1 7.1 L 10.7 7.4 L 12.2 6.5 L 14.5 4.3 L 22.3 -4.1 L 22.9 -4.3 L 23.0 -3.5 L 17.5 3.1 L 16.9 5.4 L 17.3 6.8 L 18.9 7.3 L 20.5 6.3 L 23.5 3.6 L 24.6 2.4","0 11.0 M 10.6 -4.2 L 7.1 4.6 L 7.3 6.0 L 8.0 6.9 L 13.5 3.2 L 16.8 .2 L 18.8 -2.8 L 19.3 -4.6 L 19.1 -6.0 L 18.7 -6.8 L 17.3 -7.7","0 16.4 M 11.6 -4.3 L 8.3 1.5 L 6.7 6.1 L 6.9 6.6 L 9.1 4.5 L 12.3 .7 L 15.3 -2.7 L 17.1 -4.2 L 17.7 -3.9 L 14.8 .4 L 14.1 2.9 L 14.6 5.4 L 15.6 6.6 L 17.7 6.7 L 19.7 5.6 L 21.7 3.3 L 22.9 .7 L 23.4 -1.5 L 23.6 -3.2 L 22.9 -4.3","0 16.8 M 8.0 2.4 L 11.5 -1.9 L 14.1 -5.4 L 15.0 -6.3 L 15.9 -6.6 L 15.6 1.4 L 15.9 5.5 L 16.4 6.9 L 17.4 7.4 L 18.9 7.4 L 22.4 4.9 L 24.8 2.4 M 7.1 10.9 L 10.3 6.5 L 12.8 3.4 L 15.0 1.1 L 18.3 -2.1 L 23.6 -6.5 L 25.5 -8.0","0 13.8 M 13.0 -3.5 L 8.7 1.4 L 6.7 4.4 L 6.4 5.8 L 7.2 6.6 L 8.5 6.7 L 10.5 5.8 L 14.9 2.2 L 19.5 -1.3 L 21.1 -3.1 L 17.6 3.0 L 14.6 9.0 L 11.5 13.3 L 9.7 14.6 L 7.6 15.2 L 6.4 14.6 L 4.9 13.2","0 19.2 M 15.2 -1.3 L 14.5 -2.2 L 14.5 -3.8 L 16.9 -4.8 L 20.3 -4.1 L 23.1 -3.1 L 25.1 -2.5 L 25.4 -2.5 L 25.7 -3.3 L 24.7 -3.9 L 24.0 -3.8 L 22.6 -3.0 L 20.7 -1.6 L 15.6 3.8 L 14.3 5.4 L 13.2 6.1 L 11.8 6.5 L 10.7 5.8 L 10.7 4.7 L 11.1 3.7 L 12.5 3.5 L 15.1 5.8 L 17.2 7.2 L 20.2 7.7 L 22.8 7.3 L 24.6 6.3 L 25.1 5.1 L 25.1 3.8","0 14.1 M 21.9 -17.2 L 19.0 -16.5 L 17.2 -14.0 L 16.7 -10.8 L 16.1 -7.6 L 15.3 -5.2 L 13.9 -4.1 L 12.6 -3.4 L 10.1 -3.2 L 13.0 -2.1 L 14.2 -.9 L 14.1 .8 L 13.2 6.3 L 12.8 9.3 L 13.0 10.8 L 14.5 11.9 L 16.7 12.1","0 9.6 M 13.7 -16.3 L 14.0 -8.0 L 13.2 -.2 L 12.5 5.4 L 11.9 8.6 L 11.3 11.0","0 18.8 M 19.2 -17.0 L 21.5 -17.0 L 22.8 -16.2 L 22.9 -14.7 L 22.1 -11.4 L 20.7 -7.4 L 20.4 -5.5 L 20.8 -4.2 L 22.5 -2.9 L 24.5 -2.5 L 21.9 -2.1 L 19.2 .0 L 17.9 2.5 L 16.6 6.9 L 15.5 9.7 L 13.8 11.3 L 10.3 12.0","0 13.4 M 11.2 -8.9 L 12.8 -9.8 L 14.3 -9.6 L 15.8 -8.9 L 16.9 -8.7 L 18.1 -9.1 L 18.8 -9.7","0 12.5 M 14.5 -11.5 L 12.6 -10.9 L 11.6 -8.6 L 12.5 -6.3 L 14.5 -5.5 L 17.0 -6.4 L 17.8 -8.5 L 16.8 -10.9 L 14.5 -11.5"]
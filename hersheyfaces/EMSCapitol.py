@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 11.5 M 14.4 -22.0 L 13.6 1.8 M 13.0 6.6 L 13.1 7.4 L 14.0 7.4 L 14.0 6.6 L 13.0 6.6","0 8.6 M 11.0 -21.8 L 10.5 -17.0 M 14.3 -22.3 L 13.6 -17.4","0 18.5 M 19.5 -13.7 L 14.6 2.2 M 23.4 -14.7 L 18.2 3.2 M 15.3 -9.2 L 24.7 -9.2 M 13.7 -3.6 L 23.4 -3.6","0 29.9 M 27.9 -21.6 L 27.6 -15.6 M 36.1 -11.0 L 35.9 -12.9 L 34.0 -14.6 L 32.1 -15.1 L 29.6 -15.5 L 25.7 -15.1 L 23.5 -14.5 L 21.1 -13.4 L 19.1 -11.8 L 18.6 -9.7 L 19.3 -8.0 L 20.9 -7.0 L 25.5 -6.0 L 29.6 -5.5 L 31.9 -5.0 L 33.5 -3.7 L 33.1 -2.2 L 31.9 -.6 L 28.7 .0 L 26.0 .1 L 23.1 -.4 L 21.5 -1.2 M 26.7 .2 L 26.7 6.6","0 28.3 M 17.8 -17.2 L 14.4 -15.8 L 13.1 -13.0 L 13.1 -10.6 L 14.8 -8.5 L 17.8 -7.4 L 20.5 -8.2 L 22.2 -10.5 L 22.5 -13.7 L 21.3 -15.6 L 19.9 -17.0 L 17.8 -17.2 M 29.7 -5.4 L 26.4 -4.0 L 25.0 -1.1 L 25.1 1.2 L 26.8 3.4 L 29.7 4.5 L 32.5 3.6 L 34.2 1.3 L 34.5 -1.8 L 33.2 -3.7 L 31.9 -5.1 L 29.7 -5.4 M 31.6 -16.7 L 15.8 4.5","0 33.1 M 24.8 -9.4 L 26.7 -8.3 L 29.1 -8.9 L 29.8 -11.1 L 28.8 -12.9 L 27.0 -13.8 L 24.1 -13.8 L 21.0 -13.2 L 18.4 -10.6 L 18.1 -8.0 L 18.7 -6.3 L 20.4 -5.3 L 22.9 -4.4 L 18.9 -4.1 L 16.3 -2.9 L 14.5 .0 L 14.6 3.7 L 16.6 5.9 L 20.4 6.9 L 25.3 6.2 L 28.3 4.2 L 30.3 2.2 L 30.6 .4 L 30.4 -2.0 M 26.2 -1.7 L 38.6 -2.5","0 5.4 M 11.1 -22.2 L 10.5 -17.4","0 15.2 M 22.3 -25.3 L 18.7 -22.3 L 15.1 -17.0 L 13.2 -12.9 L 12.1 -7.4 L 12.1 -2.0 L 13.4 2.3 L 15.6 7.7 L 19.2 11.5","0 15.1 M 11.5 -25.2 L 14.6 -22.5 L 16.4 -19.2 L 18.1 -14.6 L 18.6 -10.7 L 18.8 -7.7 L 18.3 -2.9 L 17.4 .9 L 15.4 4.6 L 13.1 7.6 L 9.2 11.4","0 12.0 M 13.9 -22.3 L 14.0 -18.6 L 17.5 -19.6 M 14.0 -18.6 L 16.3 -14.9 M 11.2 -15.5 L 14.0 -18.4 L 10.4 -20.2","0 15.9 M 16.3 -10.9 L 15.8 -.4 M 10.4 -5.3 L 21.6 -5.9","0 7.7 M 11.7 6.7 L 11.3 9.4 L 9.9 11.4","0 15.9 M 14.2 .4 L 20.8 .1","0 7.9 M 11.4 6.5 L 11.5 7.3 L 12.3 7.3 L 12.3 6.6 L 11.4 6.5","0 21.3 M 27.2 -22.1 L 9.9 7.3","0 33.2 M 24.4 -22.3 L 18.4 -20.8 L 13.5 -17.1 L 10.9 -11.9 L 9.9 -6.5 L 10.6 -1.7 L 13.7 3.3 L 16.7 5.8 L 20.9 7.8 L 26.0 8.1 L 32.1 5.8 L 37.2 .4 L 39.2 -5.1 L 38.8 -10.2 L 36.7 -15.4 L 34.3 -18.4 L 31.0 -20.4 L 27.6 -21.9 L 24.4 -22.3","0 14.3 M 10.0 -9.3 L 13.9 -12.5 L 16.6 -15.3 L 18.5 -17.6 L 19.5 -19.9 L 19.5 -21.7 L 18.7 -22.3 L 18.3 -21.2 L 18.3 7.3","0 34.1 M 13.6 -9.1 L 12.5 -11.6 L 12.5 -14.7 L 13.9 -18.4 L 16.9 -21.2 L 20.6 -22.8 L 26.2 -23.2 L 31.2 -21.5 L 34.6 -17.9 L 35.6 -13.9 L 35.3 -9.9 L 33.5 -5.2 L 31.3 -2.2 L 28.1 .8 L 26.1 2.2 L 20.1 5.5 L 15.6 6.8 L 11.2 7.0 L 9.4 6.2 L 8.8 4.4 L 10.0 2.5 L 13.1 2.3 L 17.1 3.1 L 25.1 5.3 L 30.7 7.0 L 36.2 7.1 L 40.3 6.3 L 42.6 5.0 L 44.4 3.3","0 26.0 M 10.7 -16.4 L 13.5 -19.3 L 17.1 -21.4 L 21.0 -22.3 L 24.6 -22.0 L 28.0 -20.5 L 29.6 -18.1 L 30.1 -15.6 L 28.9 -12.2 L 26.3 -9.8 L 22.8 -7.8 L 19.5 -7.1 L 16.9 -7.1 L 15.5 -7.4 L 15.1 -8.2 L 17.2 -9.0 L 19.6 -8.9 L 21.3 -8.5 L 24.4 -8.1 L 28.7 -6.2 L 31.5 -3.2 L 32.1 .6 L 30.8 4.6 L 27.8 7.0 L 23.6 8.5 L 18.7 8.8 L 13.5 7.4 L 9.6 4.8","0 34.7 M 32.2 7.8 L 32.5 -19.5 L 32.9 -22.3 L 33.5 -23.5 L 34.4 -23.7 L 35.0 -22.7 L 34.5 -21.5 L 31.0 -17.9 L 26.5 -13.4 L 22.9 -10.4 L 18.1 -6.4 L 13.9 -3.6 L 9.7 -1.0 L 21.6 -1.7 L 31.5 -2.0 L 41.3 -1.7","0 27.9 M 31.0 -22.2 L 23.3 -21.4 L 12.5 -21.5 L 12.1 -7.4 L 16.0 -8.8 L 21.6 -9.3 L 26.3 -8.7 L 30.2 -6.9 L 33.2 -4.0 L 33.6 .8 L 32.6 4.0 L 29.9 6.7 L 25.4 8.5 L 21.2 9.3 L 16.0 8.9 L 13.2 8.3 L 10.4 7.3 L 8.6 6.0","0 31.3 M 29.4 -23.6 L 23.6 -22.6 L 19.8 -21.2 L 15.8 -17.9 L 13.1 -14.2 L 10.9 -9.5 L 10.2 -4.4 L 11.0 -.1 L 13.4 3.4 L 17.5 6.4 L 21.4 7.6 L 26.2 7.6 L 30.7 6.4 L 33.9 4.5 L 36.7 .6 L 37.3 -3.6 L 36.7 -6.4 L 34.3 -9.3 L 31.1 -11.1 L 26.9 -11.7 L 21.8 -10.7 L 18.4 -9.0 L 15.9 -6.7 L 14.6 -3.3","0 27.9 M 8.9 -21.4 L 15.8 -20.3 L 21.9 -20.1 L 26.6 -20.1 L 30.4 -20.2 L 35.0 -21.4 L 29.0 -15.4 L 23.7 -9.0 L 20.2 -4.1 L 16.6 1.5 L 13.8 7.3","0 28.3 M 21.7 -23.3 L 17.6 -22.4 L 14.5 -20.4 L 13.2 -17.7 L 13.0 -15.1 L 15.3 -12.2 L 18.0 -10.7 L 25.6 -8.1 L 29.3 -6.7 L 32.3 -4.8 L 34.1 -2.0 L 34.1 2.7 L 31.8 5.5 L 28.3 7.1 L 24.5 7.9 L 20.7 8.3 L 15.2 7.5 L 11.6 5.3 L 9.9 2.3 L 10.2 -1.5 L 11.9 -4.1 L 15.3 -6.2 L 25.6 -10.9 L 29.4 -13.0 L 31.3 -15.8 L 31.3 -18.3 L 30.1 -20.7 L 26.9 -22.8 L 24.5 -23.4 L 21.7 -23.3","0 31.2 M 33.1 -11.7 L 30.2 -6.7 L 27.0 -4.6 L 22.8 -3.3 L 17.0 -3.7 L 13.1 -5.7 L 10.9 -8.4 L 10.1 -13.4 L 12.7 -18.8 L 17.4 -21.6 L 23.9 -22.7 L 29.4 -21.6 L 34.3 -18.0 L 37.1 -13.1 L 36.7 -8.0 L 35.7 -3.3 L 32.7 1.6 L 28.8 5.1 L 25.4 7.3 L 23.0 8.1 L 18.4 8.8","0 9.7 M 12.4 6.4 L 12.5 7.1 L 13.4 7.1 L 13.4 6.4 L 12.4 6.4 M 12.4 -2.0 L 12.4 -1.2 L 13.3 -1.2 L 13.3 -2.0 L 12.4 -2.0","0 10.0 M 12.9 6.5 L 12.8 8.5 L 12.2 10.0 L 11.0 11.6 M 12.5 -2.1 L 12.5 -1.3 L 13.4 -1.3 L 13.4 -2.0 L 12.5 -2.1","0 16.0 M 21.2 -13.5 L 19.0 -10.9 L 16.2 -9.0 L 14.2 -7.4 L 11.2 -5.5 L 14.5 -3.3 L 18.2 -.7 L 21.1 1.1","0 15.8 M 10.4 -7.9 L 21.0 -8.2 M 10.3 -2.8 L 21.0 -3.0","0 15.8 M 10.5 -13.5 L 14.1 -10.0 L 17.4 -7.4 L 20.8 -5.5 L 17.3 -3.2 L 14.2 -1.2 L 10.7 1.0","0 33.7 M 21.3 -9.5 L 18.7 -8.5 L 16.2 -8.4 L 13.1 -9.5 L 10.6 -11.9 L 9.9 -15.5 L 11.0 -18.8 L 14.3 -21.5 L 19.4 -23.0 L 24.9 -23.3 L 30.4 -22.3 L 35.6 -20.2 L 38.7 -16.9 L 39.6 -13.3 L 39.0 -9.9 L 37.7 -7.8 L 34.9 -6.2 L 28.2 -3.2 L 25.5 -1.5 L 23.8 -.3 L 22.7 .7 L 22.5 1.8 M 21.5 6.6 L 21.6 7.4 L 22.4 7.4 L 22.4 6.6 L 21.5 6.6","0 29.1 M 27.4 -4.8 L 25.7 -5.7 L 23.3 -5.5 L 21.1 -4.1 L 19.4 -1.1 L 19.4 1.7 L 20.6 3.0 L 23.1 3.6 L 25.2 1.5 L 25.9 -.1 L 26.3 -1.6 L 26.6 1.3 L 27.8 3.0 L 29.7 3.5 L 31.9 2.9 L 33.7 -.1 L 34.3 -3.9 L 33.4 -7.1 L 31.0 -9.7 L 28.7 -10.9 L 25.5 -11.7 L 20.9 -11.3 L 16.9 -9.4 L 13.8 -4.8 L 12.8 -.8 L 13.2 2.9 L 14.8 5.9 L 17.9 8.3 L 21.4 9.7 L 25.0 9.4","0 45.8 M 6.7 4.9 L 11.5 7.3 L 17.3 7.7 L 22.9 6.0 L 27.8 3.3 L 32.9 -1.6 L 39.4 -9.0 L 48.0 -22.8 L 47.2 -19.9 L 46.9 -12.0 L 47.1 -.6 L 47.6 3.7 L 48.7 7.5 M 15.1 -11.6 L 13.3 -9.4 L 13.1 -6.0 L 16.1 -3.2 L 23.1 -2.0 L 31.9 -2.2 L 53.9 -4.8","0 50.0 M 46.4 -24.0 L 44.2 -21.4 L 41.4 -17.2 L 38.7 -10.3 L 36.3 -3.8 L 33.9 .1 L 29.7 4.2 L 25.3 6.7 L 20.4 7.4 L 15.4 6.6 L 11.8 4.1 L 9.9 -.4 L 11.2 -6.8 L 15.5 -13.0 L 20.9 -17.6 L 26.2 -20.1 L 31.1 -21.7 L 38.6 -22.7 L 44.4 -22.3 L 49.4 -20.6 L 51.9 -18.7 L 53.1 -16.7 L 53.1 -13.5 L 52.0 -10.4 L 49.3 -8.7 L 44.4 -6.9 L 41.8 -6.4 L 39.1 -6.2 L 37.2 -6.2 L 36.1 -6.7 L 36.3 -7.6 L 39.4 -7.7 L 42.8 -7.6 L 46.0 -7.1 L 49.9 -5.7 L 53.8 -2.7 L 54.7 .3 L 53.7 3.8 L 49.8 6.6 L 45.7 7.4 L 40.5 7.4 L 34.9 6.0","0 36.7 M 25.7 -15.1 L 24.3 -13.3 L 23.9 -10.7 L 24.7 -7.6 L 28.2 -6.0 L 32.3 -6.0 L 36.6 -7.5 L 39.3 -10.1 L 41.0 -13.7 L 40.1 -17.7 L 36.6 -20.6 L 32.2 -22.3 L 26.9 -22.3 L 20.7 -21.1 L 16.4 -18.5 L 12.4 -14.3 L 10.2 -9.2 L 9.9 -3.8 L 11.8 .9 L 14.8 3.9 L 19.3 6.4 L 24.9 7.8 L 31.0 7.2 L 36.5 5.0 L 39.5 2.9 L 42.5 -.8","0 44.3 M 17.4 -6.4 L 15.2 -7.2 L 12.5 -9.9 L 11.6 -13.1 L 12.2 -16.5 L 15.5 -20.3 L 19.6 -21.9 L 25.2 -22.8 L 31.0 -22.6 L 35.9 -21.7 L 40.7 -19.8 L 44.7 -17.2 L 48.2 -12.9 L 50.0 -7.8 L 49.3 -.8 L 45.5 4.3 L 40.4 6.9 L 36.3 7.5 L 30.6 6.7 L 26.5 4.8 L 19.7 1.3 L 15.9 .2 L 12.3 .7 L 10.1 2.7 L 9.8 4.4 L 11.8 6.2 L 15.1 7.3 L 18.1 6.6 L 21.9 4.9 L 24.5 2.5 L 26.6 -1.7 L 27.4 -7.6 L 28.2 -11.7 L 29.6 -14.9 L 30.7 -16.6 L 32.4 -17.5","0 35.8 M 36.1 -17.4 L 33.8 -20.4 L 31.4 -21.8 L 27.7 -23.0 L 22.8 -22.9 L 19.3 -21.9 L 15.5 -19.2 L 14.5 -15.7 L 15.4 -12.1 L 17.7 -9.7 L 21.3 -8.4 L 24.7 -8.1 L 27.3 -8.2 L 28.7 -8.9 L 28.8 -10.0 L 28.1 -10.8 L 25.4 -11.0 L 22.3 -10.8 L 19.1 -10.5 L 15.4 -9.2 L 11.6 -5.9 L 10.4 -3.5 L 10.4 -1.2 L 11.1 2.7 L 14.1 5.4 L 18.8 7.5 L 23.0 7.7 L 29.6 7.4 L 35.2 5.3 L 38.3 3.1 L 40.1 1.4 L 41.9 -1.7","0 47.0 M 11.8 -9.4 L 10.0 -10.9 L 9.0 -14.3 L 9.7 -18.1 L 13.5 -20.8 L 18.1 -21.5 L 22.9 -21.2 L 28.1 -20.5 L 38.6 -18.1 L 43.5 -17.2 L 48.8 -16.4 L 53.4 -16.5 L 57.2 -17.0 L 59.8 -18.7 L 60.5 -20.9 L 59.7 -22.5 L 56.3 -23.2 L 52.9 -22.8 L 49.8 -21.0 L 47.7 -19.1 L 46.9 -17.9 L 45.8 -14.4 L 45.4 -10.2 L 45.5 -6.4 L 44.9 -1.4 L 43.1 2.7 L 39.5 5.9 L 33.7 7.5 L 28.2 7.4 L 22.9 5.7 L 19.9 3.5 L 18.5 1.5 L 17.1 -1.0 M 34.4 -6.8 L 42.7 -7.6 L 47.0 -7.4 L 51.0 -7.5 L 53.8 -7.5","0 37.6 M 43.9 -12.8 L 43.0 -16.6 L 41.0 -19.8 L 37.9 -21.9 L 32.0 -23.1 L 26.0 -22.3 L 21.6 -20.1 L 15.8 -15.6 L 13.3 -12.3 L 11.0 -7.4 L 10.5 -2.4 L 11.0 1.7 L 12.9 4.6 L 15.4 6.5 L 21.4 7.5 L 27.1 5.7 L 30.9 3.3 L 34.3 .2 L 38.0 -4.6 L 39.6 -6.9 L 40.6 -8.9 L 41.2 -10.7 L 40.5 -11.8 L 39.5 -10.8 L 39.1 -8.6 L 39.4 -2.9 L 39.9 1.8 L 40.8 8.1 L 40.0 14.9 L 38.6 19.8 L 36.2 22.3 L 33.7 23.1 L 30.5 22.1 L 28.6 19.5 L 29.3 15.4 L 32.1 10.9 L 34.6 8.3 L 38.4 5.5 L 42.9 3.2","0 51.2 M 11.5 -9.9 L 9.7 -11.3 L 8.6 -13.7 L 9.0 -16.1 L 10.9 -18.9 L 14.3 -20.5 L 17.8 -20.7 L 22.3 -19.9 L 29.3 -18.7 L 32.0 -18.4 L 35.2 -19.3 L 37.8 -20.5 L 38.9 -22.3 L 39.3 -23.4 L 39.0 -24.1 L 37.9 -24.2 L 36.4 -22.8 L 35.5 -21.1 L 34.6 -17.7 L 34.2 -11.2 L 34.0 -5.9 L 31.9 2.0 L 27.1 6.4 L 20.1 7.6 L 14.8 6.2 L 12.4 4.8 L 10.3 2.5 M 60.8 -21.0 L 59.3 -21.5 L 56.9 -20.8 L 54.4 -17.6 L 53.4 -13.5 L 52.6 -7.1 L 52.5 -2.8 L 53.1 1.1 L 53.6 3.9 L 55.3 7.9 M 28.5 -6.6 L 35.8 -6.9 L 43.8 -7.2 L 53.4 -7.2 L 58.6 -7.0","0 27.4 M 26.3 -6.6 L 24.0 -7.1 L 22.5 -8.6 L 21.5 -10.2 L 21.5 -12.3 L 22.3 -14.0 L 23.8 -15.6 L 28.7 -17.9 L 32.1 -19.7 L 33.7 -20.7 L 35.2 -22.5 L 35.4 -24.0 L 34.9 -24.7 L 33.7 -24.4 L 33.3 -23.4 L 32.8 -21.2 L 32.1 -17.0 L 31.9 -7.0 L 30.6 -.2 L 28.6 4.3 L 25.3 6.5 L 20.7 8.0 L 16.2 8.1 L 11.9 6.3 L 9.5 3.9 L 8.9 .6 L 10.1 -2.9 L 12.1 -4.6 L 14.7 -5.7 L 17.7 -5.8","0 24.5 M 18.1 -3.6 L 16.1 -3.9 L 13.5 -4.8 L 11.7 -6.6 L 11.1 -8.8 L 11.3 -11.8 L 12.5 -13.9 L 15.0 -15.7 L 20.6 -17.5 L 25.4 -19.1 L 28.6 -20.7 L 31.4 -22.9 L 32.6 -24.1 L 32.6 -25.4 L 32.3 -25.8 L 31.0 -25.6 L 29.9 -24.2 L 29.4 -23.0 L 27.9 -17.6 L 27.4 -14.5 L 27.2 -9.5 L 27.6 -3.1 L 27.6 2.0 L 27.5 7.0 L 26.5 11.8 L 25.1 16.2 L 23.2 19.3 L 21.2 20.9 L 17.7 21.6 L 14.8 20.8 L 12.7 18.4 L 11.8 13.5 L 13.7 8.3 L 19.0 2.9 L 23.7 -.2 L 29.5 -2.8","0 50.0 M 14.9 -9.9 L 13.3 -10.4 L 11.6 -12.4 L 11.2 -15.2 L 12.4 -18.3 L 15.6 -20.7 L 18.9 -20.9 L 23.6 -20.7 L 28.0 -20.3 L 31.6 -20.3 L 33.9 -21.0 L 34.9 -22.3 L 35.0 -23.0 L 33.9 -23.3 L 32.7 -23.2 L 31.4 -22.4 L 30.1 -20.7 L 28.7 -18.7 L 27.8 -15.3 L 27.6 -10.1 L 27.3 -4.6 L 26.4 .6 L 25.0 3.6 L 22.4 6.2 L 20.2 7.1 L 17.3 7.4 L 13.5 7.1 L 10.9 6.3 L 8.9 4.7 M 54.5 -23.7 L 51.6 -23.1 L 48.4 -20.5 L 45.9 -16.9 L 43.5 -13.7 L 40.9 -10.4 L 39.0 -8.8 L 36.1 -7.1 L 34.1 -6.6 L 30.8 -5.9 L 28.3 -6.0 L 26.8 -6.4 L 26.4 -7.4 L 29.2 -8.2 L 32.8 -7.4 L 36.0 -5.5 L 39.0 -2.3 L 42.2 .8 L 44.6 3.6 L 47.4 6.1 L 50.4 7.4 L 52.8 6.9 L 55.0 5.7 L 56.3 4.3","0 38.9 M 37.3 -13.9 L 38.6 -15.6 L 39.1 -18.6 L 38.4 -20.7 L 36.3 -22.3 L 33.4 -23.1 L 29.3 -22.2 L 26.7 -20.2 L 25.0 -16.0 L 24.6 -10.0 L 24.6 -3.6 L 24.4 -.3 L 22.7 3.1 L 21.3 4.8 L 18.2 6.4 L 13.8 7.4 L 9.2 6.7 L 7.2 4.4 L 8.0 1.2 L 11.1 -1.3 L 15.1 -1.4 L 19.1 -.6 L 23.7 1.4 L 28.6 4.1 L 33.0 6.4 L 37.9 7.1 L 42.1 6.4 L 43.7 5.2 L 45.4 3.7","0 57.5 M 24.2 -5.4 L 21.5 -7.5 L 18.3 -8.0 L 14.4 -7.6 L 10.6 -5.0 L 9.2 -1.4 L 10.0 2.2 L 12.2 4.9 L 16.5 7.0 L 21.4 7.4 L 26.0 6.2 L 29.7 4.1 L 33.2 -.6 L 36.2 -5.8 L 38.3 -10.9 L 40.0 -16.5 M 40.1 -16.5 L 40.7 -19.9 L 40.4 -22.1 L 39.5 -22.6 L 38.7 -21.4 L 39.2 -17.6 L 41.8 -5.8 L 44.6 6.0 L 47.1 .2 L 51.2 -9.1 L 56.1 -17.8 L 59.0 -22.0 L 60.7 -24.2 L 59.3 -20.4 L 57.5 -13.9 L 57.1 -9.2 L 57.0 -4.5 L 57.3 .1 L 58.8 3.9 L 60.9 6.0 L 62.3 6.8 L 64.1 7.1","0 48.7 M 25.8 -4.1 L 22.9 -7.0 L 19.2 -8.1 L 14.8 -7.5 L 11.5 -5.5 L 9.7 -2.7 L 9.3 .1 L 11.0 4.3 L 15.5 6.6 L 22.1 7.0 L 27.2 5.3 L 31.8 1.9 L 33.9 -.1 L 36.9 -5.8 L 38.4 -12.0 L 39.6 -17.1 L 39.7 -22.1 L 50.0 6.8 L 50.8 .7 L 51.7 -6.4 L 52.9 -13.0 L 54.7 -18.6 L 57.1 -22.3 L 59.5 -23.9 L 60.9 -24.4 L 63.4 -24.5","0 33.6 M 18.7 -20.6 L 14.9 -17.7 L 12.0 -13.9 L 10.3 -9.3 L 10.1 -4.6 L 11.5 .8 L 13.8 3.9 L 16.8 6.1 L 21.8 7.4 L 27.6 6.9 L 31.8 5.1 L 35.4 1.5 L 37.7 -3.2 L 38.4 -6.7 L 38.8 -10.2 L 38.7 -13.8 L 36.4 -19.4 L 33.2 -21.7 L 28.1 -23.0 L 24.7 -22.0 L 21.8 -19.3 L 20.8 -15.1 L 21.8 -11.7 L 24.8 -8.7 L 29.7 -6.9 L 33.8 -7.1 L 37.4 -8.0 L 40.6 -9.9 L 42.8 -11.9","0 40.4 M 24.9 -5.7 L 22.5 -4.0 L 17.7 -3.4 L 13.9 -4.4 L 11.7 -6.4 L 10.6 -10.4 L 11.8 -14.6 L 14.5 -18.3 L 17.9 -20.5 L 23.5 -22.6 L 29.2 -23.5 L 35.6 -23.7 L 42.2 -21.9 L 45.4 -19.1 L 46.7 -15.3 L 46.9 -12.0 L 46.2 -9.2 L 44.5 -6.9 L 42.5 -5.3 L 40.4 -4.3 L 36.8 -3.5 L 34.4 -3.4 M 35.1 -17.6 L 33.4 -15.8 L 31.9 -13.9 L 31.3 -10.8 L 31.0 -6.8 L 31.0 -2.8 L 30.8 .7 L 29.1 4.5 L 27.1 6.7 L 24.6 7.6 L 22.3 7.8 L 19.7 7.5 L 17.1 6.0 L 14.5 3.7","0 36.4 M 20.0 2.0 L 17.1 .5 L 13.8 -2.7 L 12.0 -6.9 L 11.8 -11.6 L 13.8 -16.7 L 17.6 -20.2 L 20.8 -22.1 L 25.6 -23.1 L 31.2 -22.9 L 36.8 -20.3 L 39.4 -17.3 L 41.2 -13.2 L 41.3 -7.6 L 39.5 -2.9 L 37.1 -.1 L 33.2 2.8 L 28.3 5.4 L 24.1 6.4 L 20.6 6.9 L 15.3 6.7 L 12.0 5.5 L 10.9 4.1 L 11.2 1.8 L 13.5 .1 L 15.3 -.3 L 18.6 -.5 L 23.7 .5 L 28.2 2.5 L 34.7 6.5 L 39.4 9.7 L 43.1 10.9 L 47.3 11.1 L 50.9 10.1","0 43.7 M 24.7 -5.7 L 23.3 -4.5 L 20.9 -3.7 L 18.3 -3.4 L 15.7 -3.6 L 13.9 -4.4 L 11.2 -7.2 L 10.8 -11.1 L 12.0 -15.1 L 14.0 -17.7 L 20.0 -21.5 L 24.9 -22.9 L 29.4 -23.7 L 33.9 -23.8 L 38.6 -23.0 L 42.2 -21.9 L 44.2 -20.3 L 45.7 -18.1 L 46.4 -15.6 L 46.1 -13.5 L 45.0 -11.0 L 43.8 -9.3 L 41.7 -7.6 L 37.4 -6.2 L 35.2 -5.5 L 32.5 -5.3 L 30.4 -5.6 L 29.4 -6.2 L 29.5 -7.4 L 32.0 -7.9 L 34.4 -8.3 L 37.9 -7.2 L 40.4 -5.7 L 42.1 -3.2 L 43.2 1.3 L 43.3 4.3 L 43.9 6.9 L 46.2 8.0 L 49.1 7.3 L 50.9 5.4 L 52.4 3.5 L 53.3 1.1 M 35.0 -17.7 L 32.8 -15.4 L 31.6 -12.0 L 30.9 -8.5 L 31.1 -2.7 L 30.7 .5 L 30.0 2.9 L 27.8 6.1 L 25.5 7.4 L 22.7 7.9 L 19.9 7.6 L 17.3 6.4 L 15.9 5.4 L 14.5 3.7","0 35.4 M 45.7 -14.8 L 45.6 -17.8 L 43.5 -20.7 L 37.9 -22.9 L 33.0 -23.5 L 26.2 -23.3 L 20.4 -22.1 L 15.7 -19.8 L 13.5 -18.0 L 11.5 -15.2 L 10.8 -13.0 L 11.2 -10.9 L 12.2 -8.8 L 15.2 -6.8 L 17.8 -5.8 L 23.9 -4.8 L 35.7 -3.6 L 38.1 -2.8 L 39.9 -1.5 L 40.5 .8 L 40.0 3.2 L 38.1 5.3 L 35.6 6.5 L 31.3 7.4 L 27.4 7.5 L 22.9 6.9 L 19.4 6.1 L 17.1 4.9","0 37.9 M 44.9 -21.3 L 43.0 -19.9 L 40.6 -16.2 L 39.5 -11.8 L 39.2 -2.2 L 38.7 .8 L 37.0 4.3 L 34.1 7.1 L 31.6 7.9 L 28.1 7.9 L 24.8 6.8 L 22.2 5.1 L 20.3 2.7 M 24.6 -14.6 L 23.3 -11.7 L 20.8 -9.6 L 17.5 -8.5 L 13.9 -8.8 L 10.5 -11.1 L 9.5 -14.5 L 10.3 -18.9 L 13.1 -22.0 L 16.4 -23.6 L 22.1 -23.7 L 27.8 -22.3 L 36.5 -19.8 L 41.4 -18.4 L 46.3 -17.8 L 51.0 -18.6 L 54.1 -19.8 L 55.8 -21.4","0 42.8 M 14.5 -7.6 L 12.1 -8.6 L 10.4 -10.8 L 9.9 -14.9 L 12.2 -19.5 L 16.4 -21.9 L 20.1 -22.3 L 22.7 -22.1 L 25.3 -20.2 L 26.3 -17.9 L 26.6 -14.8 L 26.0 -11.1 L 25.2 -6.6 L 24.3 -3.3 L 23.9 .8 L 24.0 4.1 L 25.3 6.2 L 27.2 7.8 L 29.5 8.1 L 31.6 7.6 L 34.6 5.7 L 37.0 2.4 L 38.7 -.6 L 40.7 -4.8 L 42.3 -10.4 L 43.6 -15.8 L 44.7 -21.2 L 42.7 -6.0 L 42.1 -1.6 L 42.0 2.2 L 42.5 5.7 L 44.2 7.6 L 45.9 8.2 L 48.2 7.5 L 50.0 5.8 L 51.6 3.2 L 52.2 1.1","0 44.7 M 22.6 -8.6 L 20.1 -7.1 L 16.4 -6.6 L 12.9 -8.3 L 10.9 -10.8 L 10.7 -14.9 L 12.2 -18.4 L 16.0 -21.3 L 19.6 -22.1 L 24.9 -21.8 L 29.0 -20.2 L 31.8 -17.2 L 33.6 -13.7 L 34.9 -9.5 L 35.3 -5.3 L 35.4 .0 L 35.7 4.1 L 35.4 8.0 L 40.4 3.9 L 45.7 -2.0 L 49.1 -6.8 L 51.4 -11.5 L 52.7 -15.7 L 52.9 -19.8 L 52.4 -23.5 L 50.8 -26.3 L 49.4 -27.7 L 48.2 -28.2 L 46.3 -28.2","0 60.4 M 23.5 -5.3 L 21.1 -4.1 L 17.6 -3.4 L 14.6 -4.3 L 12.2 -6.2 L 10.4 -10.2 L 11.0 -14.6 L 13.0 -17.9 L 16.5 -20.3 L 22.1 -20.9 L 26.7 -18.8 L 29.5 -15.3 L 30.9 -9.7 L 31.7 -3.4 L 31.7 1.1 L 31.6 8.0 L 47.2 -20.9 L 46.1 -13.1 L 45.6 -6.0 L 45.9 .1 L 47.0 3.9 L 48.5 6.2 L 51.1 7.4 L 54.1 7.6 L 57.4 6.0 L 60.2 2.9 L 63.0 -2.1 L 65.0 -7.6 L 66.5 -13.4 L 66.8 -18.7 L 65.6 -23.0 L 63.6 -25.8","0 42.5 M 21.1 -9.3 L 19.4 -7.9 L 17.4 -7.0 L 14.8 -6.9 L 12.4 -7.9 L 10.8 -10.2 L 10.4 -13.6 L 11.5 -17.4 L 14.4 -20.8 L 17.6 -22.3 L 20.8 -23.0 L 25.2 -22.4 L 29.5 -20.0 L 33.0 -14.4 L 36.7 -5.6 L 40.1 2.0 L 42.8 5.1 L 44.9 6.4 L 46.7 6.9 L 48.6 7.3 M 51.3 -24.3 L 46.8 -18.6 L 41.6 -12.3 L 37.4 -7.8 L 33.5 -4.2 L 26.9 1.8 L 19.2 8.1","0 44.0 M 16.6 -2.6 L 12.9 -4.3 L 11.0 -7.8 L 10.3 -13.1 L 12.2 -17.8 L 15.7 -21.4 L 19.2 -22.6 L 23.9 -22.0 L 26.6 -20.5 L 28.6 -16.0 L 28.1 -10.4 L 26.3 -2.4 L 25.8 2.7 L 26.9 5.5 L 29.3 7.8 L 32.5 8.0 L 34.9 7.3 L 37.6 4.8 L 39.7 1.4 L 42.4 -3.3 L 43.8 -8.0 L 46.4 -17.7 L 44.4 -2.3 L 44.6 5.3 L 44.7 12.3 L 44.8 16.5 L 44.2 19.3 L 43.1 21.8 L 41.0 24.0 L 39.2 24.4 L 36.0 23.3 L 34.4 19.2 L 36.5 14.3 L 39.0 11.4 L 41.5 9.7 L 44.7 8.4 L 46.6 7.3 L 51.0 6.2","0 39.3 M 22.3 -11.5 L 20.0 -9.8 L 17.0 -9.4 L 13.9 -9.7 L 11.3 -11.5 L 10.2 -13.2 L 9.9 -16.2 L 11.2 -19.6 L 12.8 -21.3 L 15.1 -22.5 L 20.2 -23.2 L 24.6 -22.6 L 30.5 -21.5 L 35.6 -20.6 L 41.9 -19.8 L 44.7 -19.4 L 46.4 -19.6 L 14.5 6.9 L 14.7 7.7 L 20.1 6.5 L 26.8 6.0 L 32.5 6.0 L 39.3 6.2 L 45.7 7.1","0 15.0 M 20.9 -26.6 L 20.1 -26.1 L 17.6 -25.8 L 13.9 -25.5 L 13.7 -19.3 L 13.4 -8.7 L 13.1 -.8 L 12.8 5.7 L 12.9 11.9 L 13.2 11.9 L 14.7 11.4 L 16.4 11.1 L 18.0 11.1","0 21.3 M 9.9 -22.1 L 27.2 7.5","0 14.9 M 12.6 -25.5 L 15.1 -25.6 L 17.9 -26.3 L 17.7 -19.8 L 16.8 11.1 L 14.4 11.1 L 12.1 11.4 L 10.0 12.0","0 13.1 M 10.9 -17.4 L 14.5 -22.2 L 18.3 -17.2","0 12.9 M 8.7 11.0 L 20.2 11.1","0 10.6 M 11.7 -8.9 L 15.2 -5.7","0 14.8 M 16.7 -1.2 L 15.6 -1.9 L 12.8 -2.0 L 10.0 .3 L 8.9 3.4 L 10.0 6.6 L 11.5 7.1 L 12.7 6.8 L 14.5 5.5 L 15.3 3.7 L 15.7 2.3 L 16.3 5.5 L 18.2 7.1 L 19.9 6.9 L 21.7 5.5 L 23.2 3.6 L 24.2 1.4","0 16.3 M 10.1 1.5 L 12.0 -3.6 L 13.9 -8.5 L 15.2 -14.6 L 15.2 -18.9 L 14.3 -22.1 L 13.6 -22.6 L 12.6 -22.8 L 11.3 -21.9 L 10.1 -19.0 L 9.5 -14.7 L 9.4 -9.9 L 9.5 -4.3 L 9.9 1.0 L 10.7 4.6 L 11.6 6.5 L 13.5 7.8 L 16.1 6.9 L 17.5 5.5 L 18.2 3.3 L 18.2 .6 L 16.8 -1.6 L 16.0 -2.0 L 14.2 -2.1 L 13.6 -.8 L 13.8 1.0 L 14.6 1.9 M 18.1 3.7 L 20.6 5.4 L 22.9 5.5 L 24.3 4.1 L 25.9 1.5","0 12.5 M 15.1 .8 L 15.6 -.2 L 15.1 -2.0 L 13.7 -2.8 L 12.1 -2.4 L 9.9 .4 L 9.6 4.1 L 10.8 6.7 L 13.8 7.8 L 16.6 7.2 L 19.1 5.2 L 20.9 3.1 L 21.6 1.5","0 15.9 M 14.1 -2.2 L 11.3 -1.0 L 9.3 2.7 L 9.4 5.1 L 11.2 6.9 L 13.4 6.5 L 15.0 3.9 L 17.6 -2.0 L 19.5 -8.3 L 20.4 -13.0 L 20.3 -18.6 L 19.8 -19.6 L 18.8 -20.2 L 17.6 -19.8 L 16.3 -17.7 L 15.5 -13.9 L 15.3 -9.5 L 15.6 -3.9 L 16.3 2.5 L 17.2 4.6 L 18.3 6.2 L 19.5 7.0 L 21.8 6.7 L 22.7 5.8 L 24.5 3.5 L 25.6 1.2","0 11.0 M 10.4 4.6 L 12.5 3.6 L 14.3 1.1 L 14.3 -1.0 L 13.5 -2.2 L 11.6 -2.2 L 10.2 -1.0 L 9.6 1.7 L 9.7 4.1 L 11.7 6.7 L 14.4 7.5 L 17.4 6.2 L 19.3 4.0 L 20.4 1.3","0 9.7 M 10.2 -.1 L 12.6 -5.0 L 13.9 -8.9 L 15.0 -13.6 L 15.3 -17.9 L 15.1 -20.4 L 14.4 -22.0 L 13.4 -22.6 L 11.8 -22.3 L 10.7 -20.2 L 10.1 -15.6 L 9.8 -10.4 L 9.4 20.4 L 9.8 23.1 L 10.3 25.7 L 11.3 26.8 L 12.9 27.3 L 13.9 26.6 L 15.0 23.9 L 15.1 19.9 L 15.0 18.0 L 13.9 14.8 L 12.5 12.1 L 11.8 11.3 L 9.7 9.7 L 13.5 7.6 L 16.2 5.5 L 17.9 3.4 L 19.1 1.4","0 13.0 M 16.6 -1.2 L 14.7 -2.2 L 12.3 -1.7 L 10.1 .6 L 9.0 3.4 L 9.6 5.8 L 11.0 6.9 L 12.8 6.9 L 14.6 5.3 L 15.4 3.5 L 15.7 2.0 L 15.8 20.3 L 15.4 23.3 L 15.0 26.3 L 14.0 28.3 L 12.6 29.6 L 10.3 29.2 L 9.6 27.3 L 9.6 24.4 L 11.2 19.3 L 12.9 15.6 L 14.5 13.1 L 18.0 8.7 L 20.0 5.8 L 22.5 1.5","0 16.2 M 10.0 .0 L 12.2 -4.4 L 14.1 -8.2 L 15.0 -12.9 L 15.3 -17.0 L 15.0 -19.7 L 14.2 -22.3 L 13.1 -22.7 L 11.8 -22.1 L 10.6 -20.1 L 9.9 -17.0 L 9.6 -9.4 L 9.6 5.7 L 9.6 6.6 L 10.5 7.1 L 11.1 6.0 L 12.8 2.9 L 15.0 -.8 L 16.7 -1.7 L 17.5 -1.7 L 18.4 -.4 L 18.2 1.1 L 18.0 5.3 L 18.8 6.7 L 20.6 7.2 L 22.9 5.8 L 24.4 3.4 L 25.6 1.3","0 9.2 M 10.3 -2.7 L 10.0 5.0 L 10.9 6.9 L 12.6 7.7 L 14.8 6.9 L 16.0 5.7 L 17.3 3.8 L 18.1 2.6 L 18.8 1.4 M 10.6 -10.7 L 9.5 -10.4 L 8.6 -9.1 L 9.7 -7.5 L 11.1 -7.4 L 12.3 -8.3 L 12.5 -9.7 L 12.0 -10.5 L 10.6 -10.7","0 7.1 M 10.0 -3.0 L 9.6 1.8 L 9.6 8.8 L 9.6 14.9 L 9.6 20.5 L 9.3 23.6 L 8.2 26.2 L 6.4 27.5 L 3.9 26.8 L 3.1 24.6 L 2.9 22.1 L 4.6 17.0 L 7.2 13.0 L 10.8 8.8 L 14.0 5.3 L 15.8 2.9 L 16.7 1.3 M 10.5 -10.7 L 9.4 -10.4 L 8.6 -9.1 L 9.6 -7.5 L 11.0 -7.4 L 12.2 -8.3 L 12.4 -9.7 L 11.9 -10.5 L 10.5 -10.7","0 15.1 M 9.9 -21.4 L 9.7 7.4 L 11.3 3.6 L 12.9 .0 L 15.2 -2.2 L 16.6 -2.5 L 18.2 -1.3 L 18.2 .6 L 17.8 1.9 L 16.1 3.3 L 14.7 4.1 L 13.3 4.4 L 13.8 6.2 L 16.0 7.4 L 17.7 7.4 L 19.9 6.7 L 22.2 5.0 L 23.3 3.4 L 24.5 1.3","0 10.8 M 10.3 -.1 L 12.3 -3.6 L 14.5 -9.4 L 15.4 -13.2 L 15.8 -17.2 L 15.7 -20.2 L 15.2 -21.6 L 14.2 -22.5 L 13.0 -22.6 L 11.5 -20.7 L 10.3 -16.3 L 9.6 -9.9 L 9.6 -4.2 L 10.3 2.2 L 11.4 5.5 L 13.8 7.3 L 15.9 6.9 L 18.0 5.1 L 20.1 1.5","0 27.9 M 9.5 1.1 L 11.2 -1.8 L 12.3 -2.7 L 13.0 -2.7 L 13.5 -.8 L 12.9 6.6 L 13.4 7.3 L 14.8 5.0 L 16.6 1.7 L 18.1 -.3 L 19.1 -1.4 L 20.1 -1.7 L 21.2 -1.3 L 21.2 .1 L 21.3 7.1 L 22.4 6.3 L 24.0 2.7 L 25.4 .0 L 27.0 -1.3 L 28.2 -1.7 L 29.1 -1.4 L 29.6 .7 L 29.3 4.6 L 29.9 6.5 L 31.3 7.3 L 33.4 6.5 L 34.6 5.5 L 35.8 3.9 L 37.2 1.4","0 19.4 M 9.5 1.2 L 10.7 -1.5 L 11.5 -2.7 L 12.5 -2.9 L 13.3 -2.0 L 13.2 .6 L 12.7 6.7 L 13.7 7.1 L 14.4 5.5 L 16.4 1.7 L 17.7 -.5 L 18.9 -1.4 L 20.0 -1.6 L 20.9 -1.5 L 21.1 -.1 L 21.1 5.5 L 22.1 6.8 L 23.5 6.9 L 24.9 6.4 L 26.2 5.2 L 27.6 3.2 L 28.6 1.2","0 13.6 M 12.2 -1.5 L 10.2 .1 L 9.2 2.0 L 9.0 4.4 L 10.2 6.4 L 12.5 7.5 L 14.5 7.1 L 16.2 5.7 L 17.0 4.0 L 17.6 1.7 L 17.4 -.1 L 16.7 -1.5 L 15.9 -2.2 L 14.4 -1.8 L 13.9 .2 L 14.8 2.4 L 16.0 3.7 L 18.8 4.6 L 21.3 3.5 L 22.1 2.7 L 23.0 1.3","0 15.0 M 9.3 1.2 L 10.8 -2.0 L 10.8 -5.0 L 10.6 15.1 L 10.0 21.0 L 10.1 22.9 L 9.0 26.2 L 8.0 27.7 L 6.9 28.2 L 5.6 28.0 L 4.7 26.8 L 4.5 23.8 L 5.3 18.6 L 7.2 13.0 L 8.5 9.0 L 10.9 4.4 L 13.3 .4 L 14.8 -1.8 L 16.6 -2.2 L 18.1 -.9 L 18.7 1.5 L 18.1 4.1 L 17.3 5.6 L 16.1 6.4 L 15.1 6.7 L 14.2 6.7 L 12.4 5.6 L 16.3 7.8 L 19.9 7.1 L 21.9 5.4 L 23.6 3.3 L 24.4 1.3","0 13.2 M 16.9 -1.1 L 15.7 -2.2 L 12.2 -1.8 L 10.1 .4 L 9.2 3.9 L 10.1 6.4 L 12.4 7.1 L 14.5 5.8 L 15.7 3.7 L 16.2 1.3 L 15.3 19.5 L 15.7 25.4 L 16.0 27.7 L 17.4 29.4 L 19.3 29.4 L 20.0 28.2 L 20.5 26.7 L 20.7 23.0 L 19.5 18.1 L 18.3 14.6 L 17.4 13.2 L 15.7 11.5 L 18.1 8.9 L 20.1 5.7 L 22.7 1.4","0 13.4 M 9.6 1.3 L 10.4 -1.0 L 10.6 -3.2 L 10.0 -5.0 L 9.4 -5.2 L 8.2 -4.3 L 8.0 -2.9 L 8.9 -2.0 L 12.0 -2.1 L 13.5 -2.1 L 14.4 -1.2 L 13.9 1.5 L 13.7 5.0 L 15.4 6.7 L 17.0 7.3 L 19.3 6.3 L 22.7 1.5","0 10.9 M 9.7 1.0 L 11.0 -1.4 L 11.7 -3.6 L 11.7 -4.6 L 10.8 -5.2 L 10.5 -4.5 L 11.5 -1.4 L 13.1 1.2 L 13.8 3.3 L 14.0 5.1 L 12.8 6.2 L 11.3 6.9 L 9.7 6.7 L 9.1 6.0 L 13.6 8.0 L 17.4 6.5 L 19.8 3.4 L 20.6 1.5","0 10.1 M 9.9 1.1 L 11.5 -2.1 L 13.0 -7.6 L 13.6 -11.8 L 13.4 -15.2 L 12.5 -17.1 L 11.9 -17.4 L 10.6 -16.5 L 9.8 -15.1 L 9.0 -9.7 L 8.8 -5.2 L 9.2 -.3 L 10.2 3.5 L 11.3 5.5 L 13.1 6.9 L 15.1 6.9 L 16.5 6.2 L 17.4 4.8 L 19.6 1.6 M 1.0 -13.9 L 24.7 -13.8","0 15.2 M 11.1 -2.1 L 9.9 .6 L 9.3 4.5 L 10.9 6.9 L 12.7 6.9 L 14.5 5.6 L 15.6 4.1 L 16.6 1.0 L 16.4 -1.6 L 16.0 4.3 L 17.0 5.9 L 18.5 7.0 L 21.1 6.4 L 22.6 5.1 L 24.7 1.3","0 14.3 M 9.8 -2.0 L 9.3 1.3 L 10.2 4.8 L 11.7 6.9 L 13.3 7.0 L 14.9 4.8 L 16.3 2.0 L 16.6 -.1 L 16.6 -3.0 L 18.0 .7 L 19.6 2.5 L 21.5 2.9 L 22.9 2.5 L 23.6 1.4","0 20.3 M 11.2 -2.1 L 9.8 .3 L 9.7 3.2 L 9.9 5.5 L 11.7 7.1 L 14.0 6.3 L 15.1 5.3 L 15.9 4.1 L 16.3 2.9 L 16.5 -1.4 L 16.7 5.0 L 17.3 6.3 L 19.1 6.9 L 21.5 6.4 L 22.4 4.8 L 22.9 2.8 L 22.7 -2.7 L 24.0 .8 L 25.9 2.5 L 27.6 3.1 L 28.9 2.4 L 29.6 1.5","0 16.0 M 9.5 1.1 L 11.8 -3.3 L 13.2 1.3 L 14.6 4.3 L 16.1 6.0 L 18.7 7.4 L 21.5 6.9 L 23.2 5.3 L 24.4 3.2 L 25.4 1.3 M 20.7 -5.0 L 17.2 -.2 L 15.3 2.5 L 13.2 6.2 L 12.4 7.8","0 13.3 M 10.7 -2.0 L 9.6 1.4 L 9.3 4.9 L 10.7 6.9 L 12.9 6.8 L 14.4 5.3 L 15.5 3.6 L 16.4 -.4 L 15.8 8.7 L 15.6 14.0 L 15.8 19.0 L 15.1 23.1 L 13.5 26.2 L 11.2 26.8 L 10.0 25.6 L 9.6 22.4 L 10.7 18.3 L 12.6 13.9 L 14.8 10.9 L 18.1 7.1 L 20.2 5.2 L 22.7 1.3","0 15.6 M 9.5 1.3 L 11.1 -1.7 L 13.5 -3.5 L 16.6 -3.6 L 17.9 -2.0 L 18.0 .8 L 16.2 3.8 L 14.4 5.7 L 13.3 6.7 L 12.5 6.7 L 12.3 6.1 L 13.4 5.2 L 15.3 5.0 L 17.3 6.4 L 18.0 9.7 L 18.2 15.6 L 17.5 20.5 L 16.8 23.2 L 15.2 25.2 L 14.0 25.8 L 12.9 25.3 L 11.9 24.0 L 11.8 20.8 L 13.1 16.7 L 15.4 13.0 L 19.3 8.5 L 21.9 5.5 L 23.5 3.9 L 24.9 1.5","0 17.7 M 23.7 -24.1 L 21.4 -25.1 L 19.0 -24.5 L 16.8 -22.3 L 16.1 -19.3 L 16.3 -15.4 L 17.0 -12.3 L 17.0 -9.1 L 16.0 -7.8 L 14.8 -7.4 L 12.5 -7.4 L 15.7 -5.4 L 16.9 -3.2 L 17.0 -.3 L 16.0 3.8 L 15.2 7.1 L 15.6 9.7 L 17.2 10.4 L 18.0 10.4 L 19.1 9.5","0 10.8 M 12.8 -23.5 L 13.4 -8.6 L 13.4 10.2","0 17.8 M 14.4 -24.1 L 16.1 -25.0 L 17.9 -24.7 L 18.7 -22.8 L 17.7 -18.4 L 16.5 -13.7 L 16.5 -11.1 L 17.8 -9.0 L 19.3 -8.1 L 21.0 -7.6 L 19.3 -7.3 L 17.6 -6.7 L 16.5 -5.5 L 16.6 -2.6 L 17.7 2.2 L 17.5 5.7 L 16.6 7.9 L 15.4 9.5 L 13.0 10.2 L 11.4 10.3 L 10.0 9.7","0 15.9 M 10.3 -4.1 L 10.4 -5.8 L 11.2 -7.9 L 12.6 -8.6 L 14.1 -8.5 L 15.4 -7.3 L 17.1 -4.8 L 19.4 -3.5 L 21.1 -4.5 L 21.8 -5.7 L 21.8 -7.4 L 21.1 -8.5","0 7.3 M 10.5 -22.2 L 9.5 -20.9 L 9.4 -19.2 L 10.6 -17.7 L 12.8 -17.6 L 14.4 -18.7 L 14.7 -20.9 L 13.8 -22.2 L 12.1 -22.8 L 10.8 -22.3 L 10.5 -22.2"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 3.1 M 11.6 -20.8 L 11.5 -5.6 M 10.9 6.0 L 10.9 7.2 L 12.1 7.2 L 12.1 6.1 L 10.9 6.0","0 8.8 M 12.7 -18.0 L 12.4 -10.7 L 12.6 -9.6 M 16.1 -18.6 L 16.6 -17.1 L 17.2 -9.0","0 15.8 M 15.1 -16.7 L 15.5 -6.3 L 16.3 -.7 M 19.3 -18.4 L 19.3 -8.2 L 20.3 -1.2 M 11.0 -9.3 L 21.9 -14.7 M 12.6 -4.2 L 16.9 -6.5 L 24.7 -11.4","0 11.8 M 17.7 6.6 L 16.2 -3.2 L 16.0 -16.7 L 16.8 -26.4 M 20.1 -19.8 L 16.6 -18.5 L 12.9 -14.4 L 11.3 -11.2 L 11.5 -10.1 L 13.5 -9.1 L 17.9 -9.3 L 20.5 -8.7 L 21.1 -7.2 L 19.2 -4.4 L 16.3 -2.5 L 15.3 -1.9 L 13.9 -1.9","0 15.0 M 20.1 -1.8 L 19.1 .3 L 19.6 3.1 L 20.9 3.8 L 23.0 2.1 L 23.3 -.4 L 23.0 -2.6 L 21.7 -2.9 L 17.2 -.3 L 14.5 1.5 L 12.7 3.9 L 11.8 6.0 L 21.9 -21.6 L 20.0 -18.6 L 17.0 -15.9 L 14.2 -14.3 L 11.8 -12.9 L 10.3 -13.8 L 10.3 -16.7 L 11.3 -18.9 L 13.4 -19.7 L 14.5 -19.1 L 14.8 -17.2 L 14.6 -16.0 L 13.9 -14.3","0 12.2 M 17.1 8.8 L 16.8 5.0 M 20.2 .3 L 16.2 -.5 L 13.9 -2.5 L 12.4 -4.8 L 13.6 -6.1 L 18.9 -6.6 L 15.5 -9.2 L 13.2 -10.8 L 13.3 -11.8 L 16.3 -12.3 L 19.6 -12.4 M 16.0 -16.7 L 15.7 -19.9","0 3.7 M 11.5 -9.6 L 12.0 -16.1","0 8.6 M 15.7 7.0 L 12.2 4.4 L 11.4 -2.3 L 13.1 -11.2 L 15.1 -16.4 L 17.1 -18.8","0 8.8 M 11.5 7.0 L 15.8 1.4 L 17.7 -5.1 L 17.7 -11.5 L 16.6 -18.5 L 14.4 -21.7","0 15.9 M 17.7 3.7 L 17.8 -10.5 M 13.0 1.4 L 23.9 -7.1 M 11.1 -1.4 L 24.6 -4.4 M 13.0 -6.5 L 23.5 2.5","0 15.9 M 17.5 3.4 L 17.8 -10.3 M 11.1 -1.4 L 13.0 -1.5 L 24.2 -4.2","0 3.5 M 12.2 3.4 L 11.4 9.9","0 14.3 M 12.7 -2.1 L 23.5 -3.1","0 3.8 M 11.2 5.9 L 11.2 7.1 L 12.4 7.1 L 12.4 6.0 L 11.2 5.9","0 9.2 M 11.6 8.9 L 18.5 -27.4","0 11.6 M 12.6 -7.5 L 11.8 2.2 L 12.7 5.7 L 15.1 6.8 L 17.9 5.4 L 19.9 .9 L 20.2 -5.5 L 19.6 -9.0 L 17.5 -11.7 L 14.2 -11.4 L 12.6 -7.5","0 4.1 M 11.8 6.3 L 11.6 -3.1 L 12.5 -13.5","0 16.9 M 11.9 -5.5 L 12.2 -5.6 L 16.0 -8.8 L 18.9 -10.3 L 20.3 -10.2 L 20.8 -8.1 L 19.7 -3.5 L 17.5 1.2 L 14.4 6.1 L 19.1 4.0 L 23.1 2.1 L 26.1 1.5","0 14.2 M 17.0 6.5 L 18.1 6.6 L 21.4 3.9 L 22.8 -.4 L 22.3 -3.8 L 19.3 -4.7 L 14.7 -2.5 L 13.8 -2.4 L 14.5 -3.9 L 18.9 -10.2 L 19.9 -11.9 L 19.1 -12.5 L 14.7 -11.1 L 11.1 -9.1","0 14.7 M 20.1 6.8 L 19.1 -4.6 L 19.1 -13.8 L 11.7 -2.4 L 16.9 -3.1 L 23.4 -4.9","0 15.2 M 15.2 6.5 L 18.9 2.7 L 20.8 -.6 L 20.4 -2.3 L 18.5 -2.5 L 15.3 -.8 L 12.8 .9 L 12.0 1.3 L 11.8 -.6 L 13.1 -9.8 L 13.0 -8.4 L 23.9 -10.1","0 11.3 M 13.5 11.0 L 14.0 6.4 L 16.6 1.7 L 19.0 -.8 L 20.1 -.8 L 20.2 .6 L 19.3 4.2 L 17.0 6.1 L 15.2 6.3 L 13.0 5.5 L 11.7 3.1 L 12.1 -1.9 L 15.3 -12.4","0 12.8 M 18.6 6.8 L 18.9 .1 L 20.0 -8.6 L 21.0 -14.3 L 15.1 -12.5 L 11.2 -12.2","0 11.1 M 16.9 6.8 L 19.3 5.4 L 20.0 3.2 L 19.3 .2 L 16.6 -2.5 L 13.2 -5.3 L 11.2 -8.1 L 11.6 -10.3 L 14.5 -12.4 L 16.6 -12.8 L 18.7 -11.7 L 18.4 -8.8 L 17.7 -6.3 L 15.2 -.6 L 14.2 2.2 L 14.1 4.9 L 15.6 6.6 L 16.9 6.8","0 11.4 M 18.3 6.5 L 20.0 -15.4 L 19.1 -15.6 L 15.9 -11.2 L 14.1 -8.8 L 12.0 -9.2 L 11.6 -12.2 L 13.5 -16.4 L 16.1 -18.3 L 17.5 -18.5 L 18.5 -17.2 L 18.7 -15.0","0 3.6 M 11.1 -6.7 L 11.1 -5.5 L 12.4 -5.6 L 12.4 -6.7 L 11.1 -6.7 M 11.2 1.4 L 11.2 2.6 L 12.4 2.5 L 12.4 1.5 L 11.2 1.4","0 4.2 M 11.7 -2.2 L 11.7 -1.0 L 12.9 -1.0 L 12.9 -2.1 L 11.7 -2.2 M 11.8 5.3 L 12.0 8.6 L 10.1 15.7","0 16.3 M 20.7 -11.5 L 15.9 -3.9 L 11.7 1.7 L 21.5 2.1 L 23.1 2.3 L 25.0 3.2","0 14.6 M 11.1 -3.4 L 23.2 -6.4 M 13.3 1.7 L 13.7 1.7 L 22.9 -1.9","0 15.3 M 15.2 3.7 L 16.6 2.5 L 24.0 -7.6 L 11.7 -12.6","0 13.4 M 17.4 5.6 L 17.4 6.8 L 18.6 6.7 L 18.6 5.7 L 17.4 5.6 M 16.3 -1.7 L 14.9 -2.8 L 16.6 -5.9 L 19.5 -9.8 L 21.3 -13.2 L 21.4 -14.8 L 20.7 -15.6 L 18.7 -15.7 L 14.5 -14.1 L 11.5 -11.9","0 27.8 M 23.9 -7.8 L 23.0 -8.8 L 20.8 -8.2 L 17.8 -5.3 L 16.3 -2.3 L 16.6 -.5 L 17.9 -.3 L 20.4 -2.5 L 21.8 -4.5 L 23.5 -6.9 L 23.2 -3.1 L 24.5 -.8 L 26.8 -1.1 L 27.7 -2.7 L 28.1 -7.7 L 27.6 -13.5 L 26.3 -16.2 L 24.3 -17.0 L 21.8 -16.4 L 16.9 -11.4 L 13.4 -5.3 L 11.6 .2 L 13.0 4.2 L 16.9 6.7 L 22.6 6.7 L 32.5 2.4 L 35.5 .7 L 37.1 -.8","0 18.8 M 11.8 6.7 L 12.9 -7.2 L 14.9 -19.2 L 16.0 -19.3 L 21.6 -3.9 L 24.6 2.3 M 12.5 .1 L 21.4 -5.0 L 27.9 -8.5","0 18.4 M 11.7 -8.4 L 16.5 -12.9 L 20.6 -14.9 L 21.7 -14.5 L 21.9 -12.9 L 20.2 -10.2 L 18.5 -7.3 L 14.5 -4.5 L 18.3 -7.0 L 22.5 -8.0 L 25.9 -7.1 L 27.4 -5.2 L 27.0 -3.0 L 24.7 .2 L 17.2 6.2 L 15.5 6.5 L 14.8 3.5 L 13.7 -16.4","0 15.6 M 21.0 -13.8 L 18.6 -15.3 L 16.7 -15.5 L 14.3 -13.5 L 12.9 -8.4 L 12.0 -1.4 L 11.7 4.4 L 13.3 6.8 L 16.2 5.9 L 19.9 1.9 L 22.1 -1.3 L 23.6 -5.3","0 18.6 M 11.0 -11.9 L 11.4 -12.1 L 16.7 -14.2 L 22.7 -14.5 L 26.0 -12.6 L 27.5 -8.1 L 26.7 -4.4 L 23.3 -.1 L 17.0 6.7 L 16.3 6.8 L 16.2 -16.6","0 14.8 M 23.8 -4.4 L 19.2 .7 L 16.9 4.7 L 14.9 6.3 L 13.9 6.2 L 13.2 1.9 L 12.4 -14.6 L 23.2 -19.1 M 20.8 -10.4 L 11.8 -3.2","0 15.4 M 14.3 7.0 L 12.1 -13.3 L 12.5 -11.1 L 21.4 -15.8 M 24.6 -7.7 L 16.5 -3.2 L 11.7 -2.2","0 18.3 M 23.3 -14.2 L 20.3 -13.4 L 16.8 -9.6 L 13.3 -5.4 L 12.0 -2.3 L 11.4 1.6 L 13.1 5.0 L 15.9 6.1 L 19.1 5.0 L 20.6 2.6 L 23.5 -2.6 L 24.6 -4.8 L 24.3 1.1 L 24.7 6.1 L 24.7 9.6 L 25.5 11.3 M 18.7 -4.3 L 21.7 -4.2 L 24.2 -5.1 L 26.7 -6.5","0 12.9 M 12.8 5.5 L 11.8 -16.8 M 11.3 -3.4 L 15.8 -3.6 L 21.1 -5.3 M 19.3 -21.9 L 20.3 -16.2 L 20.7 -9.7 L 20.5 -1.1 L 20.5 3.6 L 20.6 5.1 L 20.8 5.9","0 4.6 M 12.8 6.7 L 12.0 -13.5","0 11.1 M 10.9 -1.7 L 18.1 6.4 L 18.8 6.5 L 18.9 -17.2","0 21.6 M 14.6 6.8 L 11.9 -15.8 M 22.9 -15.6 L 21.8 -11.8 L 19.6 -7.7 L 16.4 -4.1 L 12.3 .9 L 16.1 .6 L 21.3 -.2 L 30.8 -.5","0 15.8 M 12.1 -17.0 L 12.2 5.4 L 13.5 6.0 L 20.2 3.1 L 24.9 1.2","0 21.3 M 12.0 6.5 L 12.0 -15.5 L 21.1 -.2 L 24.1 -11.9 L 26.7 -19.3 L 27.3 -15.4 L 28.2 -3.5 L 29.5 4.0","0 16.3 M 11.9 6.4 L 12.2 -15.7 L 12.2 -13.5 L 24.3 3.6 L 23.1 -1.3 L 21.7 -15.2 L 21.6 -21.2","0 11.1 M 15.2 6.6 L 15.8 6.3 L 18.9 4.0 L 19.8 .8 L 19.2 -9.8 L 18.3 -14.7 L 17.3 -16.6 L 15.5 -16.8 L 13.6 -15.0 L 12.0 -11.1 L 11.6 -4.7 L 11.7 -.5 L 12.3 3.5 L 13.2 5.2 L 15.2 6.6","0 19.4 M 17.6 6.8 L 16.4 -5.8 L 16.1 -18.2 L 16.2 -15.8 L 12.0 -11.8 L 20.6 -18.9 L 24.8 -20.3 L 28.5 -19.7 L 30.1 -17.6 L 28.7 -13.8 L 24.9 -10.5 L 16.5 -4.4","0 18.5 M 15.4 -14.0 L 12.8 -5.7 L 11.6 1.4 L 12.9 5.4 L 15.1 6.1 L 18.3 3.7 L 20.9 -2.7 L 21.4 -9.4 L 20.8 -11.9 L 19.1 -12.9 L 16.6 -11.7 L 13.9 -8.3 M 18.5 -.8 L 30.8 11.6","0 28.5 M 14.5 6.6 L 13.0 -15.4 L 13.3 -11.0 L 11.4 -8.8 L 19.0 -15.8 L 23.2 -17.5 L 25.8 -17.3 L 27.1 -15.6 L 26.0 -12.6 L 23.0 -9.4 L 13.2 -2.5 L 17.9 -1.4 L 28.6 -.8 L 37.5 .0","0 19.9 M 17.5 6.8 L 22.8 4.6 L 27.1 1.8 L 28.7 .1 L 28.9 -1.0 L 27.5 -2.3 L 16.0 -3.8 L 13.0 -4.5 L 11.7 -5.6 L 11.8 -7.5 L 13.5 -9.6 L 23.8 -13.0","0 16.4 M 21.0 6.8 L 19.4 -10.4 L 18.3 -15.6 L 18.7 -14.0 L 11.0 -12.0 L 18.9 -14.0 L 27.6 -16.1","0 14.8 M 13.5 -8.8 L 12.8 -.2 L 12.8 4.0 L 13.3 6.3 L 15.2 7.4 L 16.7 6.4 L 19.2 3.8 L 20.9 1.0 L 22.3 -2.4 L 22.3 -11.7 L 22.3 1.5 L 22.9 7.1 L 23.4 10.1 L 24.0 12.0","0 19.4 M 11.2 -12.9 L 21.1 2.7 L 21.7 3.4 L 22.0 6.3 L 23.1 -.6 L 26.9 -14.3","0 18.2 M 11.1 -13.5 L 11.7 -12.8 L 16.4 2.3 L 17.3 -8.8 L 18.5 -13.8 L 20.7 -4.8 L 24.6 6.2 L 24.7 -4.6 L 26.2 -14.3 L 27.0 -19.0","0 16.9 M 13.5 5.8 L 18.0 -4.6 L 20.5 -13.9 M 11.7 -10.2 L 17.2 -1.5 L 25.2 6.4","0 15.3 M 19.9 8.2 L 23.4 -16.9 M 21.5 -4.0 L 15.9 -7.3 L 11.7 -11.8","0 27.9 M 11.4 -8.8 L 11.9 -8.8 L 14.0 -8.8 L 24.4 -10.2 L 20.4 -4.0 L 14.0 6.3 L 23.8 5.2 L 34.5 3.6 L 36.2 3.8","0 14.9 M 23.7 6.9 L 13.5 10.9 L 12.9 10.3 L 13.0 -6.7 L 11.8 -20.3 L 19.9 -23.6","0 20.3 M 11.6 -26.4 L 29.2 6.3","0 14.7 M 15.8 9.2 L 18.3 8.6 L 23.4 8.2 L 20.1 -24.6 L 11.1 -23.9","0 12.8 M 12.1 -18.5 L 15.8 -24.8 L 20.5 -18.9","0 21.8 M 11.8 6.6 L 30.6 2.8","0 8.1 M 13.8 -19.6 L 17.4 -16.4","0 14.0 M 20.4 -10.1 L 19.0 -5.4 L 15.7 .7 L 13.3 3.6 L 12.2 4.0 L 11.9 .0 L 13.7 -7.9 L 16.6 -11.4 L 19.1 -12.8 L 20.1 -12.6 L 22.2 6.4","0 13.2 M 12.1 -20.4 L 12.7 -18.3 L 13.3 6.5 L 18.1 1.3 L 20.9 -3.9 L 22.4 -7.8 L 21.4 -10.1 L 19.1 -10.7 L 15.4 -8.8 L 11.7 -5.6","0 12.8 M 18.0 -3.0 L 17.8 -6.9 L 16.7 -7.7 L 14.6 -6.1 L 12.4 -1.6 L 11.9 2.6 L 12.9 5.6 L 14.6 6.8 L 16.8 6.1 L 19.2 3.5 L 21.2 .3","0 14.1 M 21.0 -4.6 L 19.1 -6.7 L 15.8 -5.8 L 12.6 -1.8 L 11.6 1.0 L 11.4 4.0 L 12.7 6.1 L 15.5 5.4 L 19.3 1.5 L 20.8 -1.4 L 21.2 -3.6 L 20.3 -13.8 L 20.3 -19.8 L 20.4 -13.2 L 21.6 -.6 L 23.3 12.2","0 16.2 M 11.2 -.4 L 14.4 -1.7 L 17.5 -3.8 L 19.3 -5.7 L 19.3 -7.2 L 17.9 -8.6 L 15.9 -8.5 L 13.9 -5.1 L 12.5 2.3 L 12.6 5.1 L 13.4 6.5 L 15.4 6.0 L 25.0 -3.3","0 9.7 M 16.3 7.0 L 13.0 -3.5 L 11.0 -1.9 L 17.7 -7.1 L 21.7 -9.1 L 17.6 -7.1 L 12.9 -3.5 L 12.3 -9.5 L 12.6 -17.9 L 13.8 -19.9 L 15.3 -20.4 L 16.8 -20.4","0 14.8 M 21.2 -7.7 L 19.5 -8.8 L 16.9 -7.6 L 14.1 -3.5 L 12.0 .7 L 11.4 4.3 L 12.4 6.0 L 15.3 4.7 L 18.6 .7 L 20.4 -2.3 L 21.5 -7.3 L 22.7 6.0 L 23.9 14.8 L 23.5 18.5 L 21.3 21.0 L 18.5 21.7 L 13.6 21.3","0 13.8 M 12.0 -20.2 L 13.4 6.5 L 14.0 .1 L 16.6 -4.2 L 19.0 -6.8 L 21.1 -6.9 L 21.9 -5.9 L 22.5 -2.2 L 22.3 6.3","0 5.6 M 13.5 6.4 L 12.1 -10.4 M 10.9 -21.7 L 12.0 -20.5 L 12.7 -21.5 L 10.9 -21.7","0 6.2 M 5.8 13.8 L 8.1 15.5 L 10.6 15.8 L 12.7 14.8 L 14.7 11.7 L 14.7 6.8 L 13.4 -10.1 M 10.5 -20.7 L 12.0 -19.5 L 12.4 -20.1 L 10.8 -20.6","0 14.4 M 12.6 9.0 L 12.4 -18.1 M 23.3 -.1 L 12.0 -1.9 L 21.6 -12.8","0 4.5 M 12.2 6.4 L 11.9 -18.3","0 20.7 M 12.2 -8.6 L 12.5 -6.9 L 13.3 6.3 L 15.3 -1.7 L 17.6 -6.3 L 19.6 -9.2 L 21.3 5.3 L 23.5 -2.7 L 25.2 -6.7 L 26.2 -8.8 L 27.0 -6.0 L 29.6 5.8","0 14.8 M 12.2 -10.3 L 12.0 6.1 L 15.9 -4.8 L 17.4 -8.4 L 18.3 -9.4 L 18.9 -8.8 L 20.6 -1.6 L 22.2 4.9 L 23.1 6.5","0 11.7 M 13.0 -7.3 L 11.6 1.5 L 12.7 5.7 L 15.7 6.3 L 17.9 4.6 L 20.0 1.8 L 20.4 -1.9 L 19.3 -4.7 L 17.8 -6.5 L 15.9 -6.1 L 13.7 -4.3 L 12.2 -1.7","0 15.3 M 13.7 17.4 L 12.8 -6.7 L 12.8 -3.5 L 11.0 -.8 L 15.5 -6.4 L 20.0 -8.9 L 23.1 -8.8 L 23.7 -6.5 L 22.9 -3.6 L 20.7 .2 L 17.2 3.8 L 13.4 6.5","0 13.8 M 22.1 -7.5 L 19.9 -1.9 L 16.8 3.4 L 14.3 5.7 L 12.4 5.5 L 11.3 2.8 L 11.9 -1.1 L 13.8 -4.2 L 16.8 -7.1 L 19.1 -8.1 L 21.5 -8.3 L 21.4 1.5 L 21.3 11.8 L 22.0 18.9","0 12.8 M 13.7 6.6 L 13.4 5.2 L 12.2 -10.1 L 12.8 -1.7 L 16.2 -6.5 L 19.0 -9.8 L 21.4 -11.7","0 14.8 M 17.7 6.7 L 21.9 1.3 L 23.0 -.4 L 22.9 -1.2 L 21.5 -1.6 L 16.6 -.3 L 14.1 -.4 L 12.6 -.6 L 12.0 -1.3 L 13.0 -3.3 L 16.8 -6.6 L 19.7 -8.1 L 22.0 -8.4","0 15.8 M 16.8 6.3 L 15.6 -6.3 L 11.5 -4.4 L 24.5 -9.5 L 15.6 -6.1 L 14.9 -19.9","0 12.2 M 12.1 -8.4 L 11.5 -2.2 L 11.4 2.8 L 12.9 6.1 L 15.2 6.6 L 16.4 5.2 L 17.8 2.7 L 19.4 -2.6 L 20.0 -9.1 L 20.1 8.1","0 13.8 M 11.6 -8.1 L 17.7 5.7 L 22.1 -9.5","0 18.2 M 11.7 -9.1 L 12.2 -7.8 L 16.7 5.8 L 19.1 -6.1 L 23.1 4.1 L 24.3 5.5 L 26.8 -9.3","0 15.2 M 13.3 11.3 L 20.6 -10.2 M 11.8 -6.2 L 19.7 1.6 L 24.2 5.6","0 11.5 M 11.4 -3.2 L 19.6 6.5 L 19.5 -8.2 L 19.6 19.7","0 27.8 M 11.8 -8.0 L 13.3 -7.6 L 19.1 -9.5 L 21.2 -9.8 L 23.1 -9.0 L 23.1 -8.2 L 16.6 5.9 L 17.1 6.3 L 23.3 3.7 L 29.5 1.6 L 36.1 -.1","0 13.7 M 21.7 7.2 L 19.5 9.7 L 18.0 9.7 L 17.3 8.0 L 17.7 .0 L 17.4 -5.3 L 16.6 -7.2 L 15.2 -8.1 L 11.8 -6.3 L 14.8 -7.9 L 15.3 -9.3 L 14.7 -14.3 L 14.8 -19.8 L 16.9 -24.1 L 19.5 -26.2 L 22.1 -26.5","0 5.1 M 13.6 6.4 L 12.8 4.3 L 12.2 -22.9 L 12.0 -27.1","0 10.2 M 11.7 11.3 L 15.2 10.1 L 17.9 7.0 L 18.9 4.2 L 18.0 2.1 L 15.0 .2 L 12.8 -1.4 L 12.8 -3.0 L 14.2 -4.8 L 15.8 -5.6 L 13.3 -6.5 L 13.5 -8.4 L 15.5 -13.8 L 16.7 -17.9 L 16.5 -20.4 L 14.9 -22.8 L 13.4 -23.4 L 11.7 -23.1","0 14.3 M 11.9 -11.8 L 13.8 -15.6 L 14.7 -15.9 L 15.7 -14.8 L 18.2 -12.0 L 19.4 -12.3 L 21.3 -15.0","0 9.8 M 13.1 -14.4 L 12.0 -12.6 L 11.9 -11.1 L 13.7 -9.9 L 15.8 -10.5 L 17.0 -11.3 L 17.9 -13.2 L 17.0 -14.7 L 15.1 -15.3 L 13.1 -14.4"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.0 M 25.1 -14.2 L 16.2 3.0 M 14.4 6.3 L 13.6 6.6 L 13.6 7.2 L 14.3 7.5 L 14.8 6.8 L 14.4 6.3","0 6.0 M 22.5 -14.2 L 22.3 -13.1 L 21.7 -11.6 L 21.0 -10.5 L 20.3 -9.6 M 25.6 -14.2 L 25.3 -13.1 L 24.8 -11.6 L 24.1 -10.5 L 23.4 -9.6","0 16.9 M 24.5 -10.2 L 14.9 7.8 M 30.3 -10.2 L 20.7 7.8 M 18.1 -4.5 L 31.0 -4.5 M 14.2 2.5 L 27.2 2.5","0 15.6 M 16.6 -.2 L 15.8 -.2 L 14.7 1.0 L 14.2 2.7 L 14.1 4.7 L 14.9 6.3 L 16.0 7.4 L 18.1 7.6 L 16.8 10.2 L 18.0 7.7 L 20.1 7.4 L 21.9 6.7 L 23.7 5.3 L 24.9 3.4 L 25.4 1.5 L 25.0 -.6 L 23.9 -2.5 L 23.0 -4.1 L 22.9 -6.5 L 23.9 -8.9 L 25.7 -10.6 L 27.8 -11.2 L 29.0 -11.3 L 30.1 -13.6 L 29.1 -11.3 L 30.2 -11.1 L 31.0 -10.2 L 31.6 -9.2 L 31.4 -7.3 L 30.4 -5.2","0 27.0 M 18.2 10.1 L 37.0 -12.4 M 25.7 -10.5 L 23.6 -10.6 L 21.4 -9.7 L 19.4 -8.2 L 18.1 -6.7 L 16.8 -4.6 L 16.1 -2.3 L 16.1 -.6 L 16.6 .9 L 17.9 1.6 L 19.5 1.4 L 21.5 .6 L 23.5 -.8 L 25.3 -3.2 L 26.5 -5.4 L 27.1 -7.6 L 27.0 -9.3 L 26.4 -10.2 L 25.7 -10.5 M 38.9 -4.5 L 36.8 -4.6 L 34.6 -3.7 L 32.6 -2.1 L 31.4 -.7 L 30.1 1.4 L 29.4 3.8 L 29.4 5.4 L 29.9 6.9 L 31.1 7.6 L 32.8 7.4 L 34.8 6.6 L 36.7 5.2 L 38.6 2.8 L 39.8 .6 L 40.4 -1.6 L 40.2 -3.3 L 39.6 -4.1 L 38.9 -4.5","0 21.9 M 30.2 -7.5 L 32.0 -8.4 L 33.2 -10.1 L 33.2 -11.8 L 31.0 -13.1 L 28.1 -12.8 L 26.0 -11.6 L 24.6 -10.1 L 24.2 -8.3 L 24.4 -6.8 L 24.8 -6.0 L 25.2 -5.5 L 26.5 -5.3 L 24.5 -5.1 L 21.6 -4.0 L 19.5 -2.5 L 17.8 -.4 L 17.1 1.7 L 17.0 3.8 L 17.5 5.5 L 18.9 7.2 L 20.9 7.8 L 23.2 7.4 L 25.3 6.6 L 27.0 5.0 L 28.2 3.3 L 28.8 1.8 L 29.1 .5 L 29.1 -.7 L 28.4 -2.3 M 23.1 .5 L 23.5 -.7 L 24.4 -1.7 L 25.6 -2.3 L 27.1 -2.5 L 29.1 -2.2 L 30.4 -1.6 L 32.1 -1.7 L 33.7 -2.5 L 34.8 -3.8 L 35.6 -5.1","0 2.9 M 20.8 -14.3 L 20.6 -13.1 L 20.0 -11.6 L 19.3 -10.5 L 18.6 -9.6","0 12.2 M 16.6 7.9 L 15.6 6.3 L 14.7 3.9 L 14.5 1.4 L 14.7 -.8 L 15.9 -4.3 L 17.2 -6.8 L 19.3 -9.2 L 21.3 -11.1 L 23.5 -12.5 L 25.5 -13.4 L 27.1 -13.9 L 28.3 -14.0","0 12.5 M 25.0 -13.9 L 26.0 -12.2 L 26.9 -9.9 L 27.0 -7.4 L 26.8 -5.1 L 25.6 -1.6 L 24.3 .8 L 22.3 3.2 L 20.2 5.2 L 18.1 6.5 L 16.1 7.4 L 14.4 7.9 L 13.2 8.1","0 9.1 M 19.2 -3.2 L 20.7 -12.0 M 23.8 -10.0 L 15.9 -5.1 M 16.8 -10.2 L 23.0 -5.2","0 10.0 M 19.9 -5.2 L 18.3 4.0 M 14.7 -.6 L 23.7 -.6","0 5.3 M 14.0 7.4 L 13.3 7.1 L 13.3 6.5 L 14.1 6.2 L 14.5 6.7 L 14.4 7.7 L 14.1 8.7 L 13.2 9.6 L 12.5 10.0 L 11.8 10.1","0 12.9 M 16.5 -.6 L 24.4 -.6","0 5.4 M 14.3 6.2 L 13.5 6.5 L 13.5 7.1 L 14.2 7.4 L 14.7 6.7 L 14.3 6.2","0 9.2 M 12.9 10.2 L 25.1 -12.5","0 16.4 M 19.5 8.2 L 21.7 7.8 L 24.2 6.1 L 26.1 4.1 L 28.3 1.0 L 30.0 -2.1 L 31.0 -4.9 L 31.5 -7.4 L 31.4 -8.6 L 30.5 -10.0 L 29.3 -10.6 L 27.3 -10.5 L 24.7 -9.4 L 22.5 -7.6 L 20.4 -4.7 L 18.7 -1.7 L 17.7 .8 L 16.8 3.6 L 16.7 5.6 L 17.2 7.2 L 18.3 8.0 L 19.5 8.2","0 13.8 M 17.6 -4.5 L 19.6 -4.7 L 22.0 -5.9 L 24.3 -7.2 L 26.0 -8.7 L 28.2 -10.6 L 18.4 7.6","0 15.1 M 18.0 -5.4 L 18.6 -7.1 L 19.9 -8.6 L 21.6 -10.0 L 23.3 -10.5 L 25.2 -10.8 L 27.2 -10.2 L 28.5 -9.1 L 28.9 -7.5 L 28.5 -5.8 L 27.1 -3.4 L 24.5 -1.4 L 20.2 1.5 L 17.9 2.9 L 15.7 4.6 L 14.8 5.8 L 14.2 6.9 L 25.6 6.9","0 16.0 M 16.9 1.6 L 15.9 3.0 L 15.4 4.3 L 15.6 6.1 L 16.8 7.5 L 18.7 8.1 L 20.5 8.2 L 22.7 7.4 L 25.1 5.5 L 26.3 3.4 L 26.6 1.7 L 26.2 -.3 L 25.2 -1.4 L 24.0 -2.2 L 22.8 -2.1 L 24.9 -2.5 L 27.3 -3.6 L 28.7 -5.5 L 29.2 -7.4 L 29.1 -9.1 L 27.6 -10.3 L 25.0 -10.5 L 23.0 -10.0 L 21.3 -8.7 L 20.3 -7.1","0 15.9 M 21.0 10.1 L 32.3 -10.6 L 14.5 4.3 L 28.0 4.3","0 14.3 M 12.8 6.1 L 14.1 7.4 L 16.3 8.2 L 18.6 8.1 L 20.8 7.4 L 23.5 5.6 L 25.0 3.8 L 26.0 1.9 L 26.0 -.1 L 25.4 -1.9 L 23.3 -3.3 L 21.2 -3.8 L 19.3 -3.8 L 22.7 -10.1 L 29.8 -10.1","0 16.9 M 18.6 -.2 L 20.3 -2.3 L 22.6 -3.7 L 24.9 -4.2 L 26.9 -3.8 L 28.3 -2.8 L 28.9 -1.4 L 29.1 .2 L 28.7 2.3 L 27.7 4.3 L 26.4 5.8 L 24.0 7.4 L 21.6 8.1 L 20.1 8.2 L 18.2 7.2 L 17.2 5.2 L 17.3 2.9 L 17.9 .9 L 19.6 -2.6 L 21.1 -5.2 L 22.9 -7.6 L 25.1 -9.9 L 27.6 -11.4 L 30.2 -12.2 L 32.0 -12.2 L 33.7 -12.0 L 34.4 -11.7","0 14.8 M 14.2 10.4 L 31.6 -10.0 L 20.7 -10.0","0 15.2 M 18.9 8.1 L 21.0 7.8 L 23.5 6.4 L 24.9 4.8 L 25.6 2.4 L 25.3 .0 L 24.2 -1.9 L 22.8 -3.9 L 21.8 -6.0 L 21.6 -8.3 L 23.0 -10.6 L 25.0 -12.0 L 27.1 -12.6 L 29.5 -12.4 L 30.7 -11.1 L 30.8 -9.3 L 29.8 -7.5 L 28.2 -5.9 L 26.0 -4.3 L 21.3 -2.2 L 19.0 -1.0 L 17.1 .5 L 15.6 2.2 L 15.0 4.3 L 15.2 6.2 L 16.6 7.7 L 17.5 8.1 L 18.9 8.1","0 16.7 M 13.3 9.4 L 16.1 9.8 L 19.6 9.1 L 22.4 7.5 L 25.1 4.7 L 27.4 1.7 L 29.1 -1.6 L 30.1 -4.4 L 30.3 -7.4 L 29.6 -9.5 L 28.0 -10.6 L 26.0 -10.8 L 23.5 -9.9 L 21.2 -8.0 L 19.7 -5.8 L 18.8 -3.8 L 18.8 -1.3 L 19.5 .4 L 21.4 1.6 L 23.8 1.7 L 25.7 1.0 L 27.8 -.6 L 28.9 -2.0 L 30.0 -3.8","0 7.7 M 14.3 6.1 L 13.5 6.5 L 13.5 7.1 L 14.2 7.4 L 14.7 6.7 L 14.3 6.1 M 20.8 -6.1 L 20.0 -5.7 L 20.0 -5.1 L 20.7 -4.8 L 21.2 -5.5 L 20.8 -6.1","0 7.7 M 20.8 -6.2 L 20.1 -5.8 L 20.1 -5.2 L 20.7 -4.9 L 21.3 -5.6 L 20.8 -6.2 M 123.5 6.3 L 122.7 6.7 L 122.7 7.3 L 123.4 7.6 L 123.9 6.9 L 123.5 6.3 M 14.1 7.4 L 13.5 7.1 L 13.5 6.5 L 14.2 6.1 L 14.7 6.7 L 14.6 7.7 L 14.3 8.6 L 13.3 9.5 L 12.6 10.0 L 11.9 10.1","0 11.6 M 21.3 4.0 L 15.2 -.7 L 26.5 -5.8","0 14.0 M 14.5 2.5 L 24.9 2.5 M 17.0 -2.4 L 27.5 -2.4","0 12.1 M 13.8 3.9 L 25.2 -1.2 L 18.9 -5.8","0 13.9 M 16.2 2.9 L 17.5 1.0 L 19.8 -1.2 L 23.1 -3.8 L 25.9 -6.3 L 27.6 -8.0 L 28.1 -10.4 L 27.6 -12.8 L 25.7 -13.9 L 23.2 -14.0 L 20.9 -12.9 L 19.3 -11.2 L 18.6 -9.1 L 19.2 -7.7 L 20.6 -6.7","0 24.3 M 28.6 8.8 L 26.7 9.8 L 23.4 10.0 L 19.9 9.7 L 17.7 8.1 L 16.3 5.2 L 16.2 1.8 L 17.2 -1.4 L 19.3 -4.9 L 22.0 -7.8 L 25.5 -9.6 L 29.2 -10.5 L 32.4 -10.0 L 34.8 -8.3 L 35.8 -5.5 L 35.4 -2.3 L 34.1 .9 L 32.7 2.7 L 31.0 4.3 L 28.7 5.1 L 27.2 4.6 L 27.2 2.3 L 28.3 .0 L 29.4 -2.1 L 29.4 -3.8 L 28.3 -4.9 L 26.3 -4.4 L 24.1 -2.7 L 22.1 .0 L 21.1 1.9 L 20.9 3.9 L 21.5 5.0 L 23.4 4.7 L 25.0 3.5 L 26.0 2.3 L 28.4 -.1 L 30.9 -4.8","0 27.1 M 17.5 .2 L 15.9 .4 L 14.2 1.9 L 13.6 3.1 L 13.0 5.0 L 13.4 7.3 L 14.8 8.3 L 16.7 8.3 L 18.8 7.5 L 21.3 5.4 L 23.9 2.1 L 26.6 -1.8 L 28.6 -4.9 L 30.6 -8.0 L 32.1 -10.4 L 34.0 -12.4 L 35.6 -13.2 L 37.1 -13.1 L 37.9 -12.3 L 37.7 -10.7 L 36.3 -7.3 L 33.6 -2.3 L 27.0 -2.3 L 33.6 -2.3 L 32.4 .3 L 31.1 3.0 L 30.3 4.7 L 30.2 6.4 L 30.7 7.5 L 31.9 8.2 L 33.9 7.9 L 36.3 6.5 L 38.4 4.3 L 40.4 1.9 L 41.4 .5","0 25.1 M 22.7 6.8 L 23.9 7.9 L 26.0 8.3 L 28.5 7.4 L 30.5 6.1 L 32.1 4.5 L 33.0 2.6 L 33.5 1.0 L 33.5 -.8 L 32.7 -2.3 L 31.8 -3.0 L 30.0 -3.7 L 31.5 -3.7 L 34.1 -4.8 L 35.9 -6.4 L 37.3 -8.4 L 37.7 -10.3 L 36.9 -12.0 L 35.3 -13.1 L 32.7 -13.1 L 30.2 -12.8 L 27.1 -11.8 L 24.1 -10.2 L 22.1 -8.9 L 19.7 -6.9 L 17.3 -4.2 L 15.6 -1.9 L 14.3 .9 L 13.4 3.3 L 13.2 5.3 L 13.3 7.1 L 14.7 8.0 L 16.4 8.2 L 19.0 7.3 L 22.1 4.2 L 24.6 .3 L 27.6 -5.0 L 29.8 -8.6 L 31.3 -10.6 L 32.9 -11.9 L 34.6 -12.6","0 14.9 M 29.3 .5 L 28.5 1.7 L 27.0 3.6 L 25.2 5.2 L 23.4 6.7 L 21.3 7.7 L 18.8 8.2 L 16.0 7.7 L 14.1 5.2 L 14.1 1.4 L 15.8 -2.7 L 17.9 -6.2 L 20.5 -9.1 L 23.6 -11.5 L 26.0 -12.8 L 28.1 -13.1 L 30.2 -12.7 L 30.9 -11.4 L 30.4 -9.1 L 29.4 -7.8 L 27.7 -6.5","0 28.2 M 19.6 -1.4 L 18.7 -2.5 L 18.4 -4.6 L 19.3 -7.1 L 21.0 -9.6 L 22.9 -11.1 L 25.4 -12.3 L 27.4 -12.9 L 29.9 -13.1 L 32.3 -13.0 L 34.9 -12.4 L 36.8 -11.5 L 38.4 -9.8 L 39.0 -7.5 L 38.9 -4.9 L 37.9 -1.4 L 36.3 1.4 L 34.5 3.7 L 32.3 5.6 L 29.9 7.1 L 26.8 8.0 L 24.4 8.1 L 22.1 7.8 L 19.7 6.8 L 18.0 6.2 L 15.5 5.7 L 13.9 5.9 L 12.8 6.7 L 12.7 7.8 L 13.5 8.3 L 15.5 8.3 L 17.6 7.6 L 19.8 6.7 L 22.6 3.6 L 25.2 -.2 L 27.6 -4.6 L 29.8 -8.3 L 31.7 -10.5 L 33.1 -11.8 L 34.5 -12.4","0 14.7 M 29.2 .5 L 27.5 2.6 L 26.0 4.4 L 24.3 5.8 L 22.5 6.9 L 20.1 7.8 L 18.0 8.2 L 16.0 7.8 L 14.4 6.7 L 13.8 4.8 L 14.1 2.7 L 14.9 .5 L 16.7 -1.6 L 18.7 -3.0 L 20.4 -3.8 L 22.0 -4.1 L 23.1 -4.1 L 22.0 -4.2 L 21.0 -5.6 L 20.9 -7.4 L 21.8 -9.5 L 23.3 -11.3 L 25.4 -12.7 L 27.5 -13.2 L 29.3 -12.8 L 30.3 -11.8 L 30.4 -10.4 L 29.3 -8.5 L 28.7 -7.5 L 27.5 -6.6","0 21.0 M 15.4 1.8 L 14.5 2.3 L 13.4 4.0 L 13.0 5.1 L 13.5 7.2 L 15.0 8.0 L 16.9 8.5 L 19.7 7.6 L 22.2 5.7 L 24.0 3.6 L 26.1 .7 L 27.9 -2.9 L 23.5 -2.9 L 32.8 -2.9 L 27.9 -2.9 L 29.0 -4.8 L 30.7 -7.6 L 32.1 -9.6 L 33.6 -11.3 L 35.4 -12.6 L 37.6 -13.3 L 38.8 -13.7 L 40.5 -13.3 L 40.4 -12.2 L 38.3 -11.5 L 36.9 -11.5 L 34.4 -11.6 L 30.7 -12.3 L 28.4 -12.8 L 25.4 -12.9 L 22.9 -12.6 L 20.5 -11.4 L 19.5 -9.9 L 19.4 -8.1 L 20.7 -6.9 L 22.5 -6.7 L 24.4 -7.1 L 25.6 -7.6","0 22.2 M 32.3 -6.8 L 33.7 -8.7 L 34.4 -10.8 L 33.9 -12.5 L 31.3 -13.3 L 28.8 -12.9 L 26.3 -11.9 L 23.4 -9.9 L 21.1 -7.5 L 19.1 -4.7 L 18.1 -2.1 L 17.7 .8 L 18.1 3.2 L 19.7 4.5 L 22.0 4.4 L 24.2 3.2 L 26.7 1.4 L 28.7 -.5 L 30.2 -2.3 L 26.0 5.0 L 23.7 8.3 L 21.1 11.4 L 18.9 13.3 L 16.8 14.3 L 14.0 14.5 L 12.3 13.9 L 11.5 12.4 L 12.2 10.6 L 13.7 9.7 L 15.6 8.7 L 18.7 8.1 L 20.8 7.8 L 25.3 7.4 L 29.5 6.7 L 32.3 5.3 L 34.5 3.4 L 35.7 1.8 L 36.6 .5","0 28.5 M 21.3 -8.2 L 21.5 -10.1 L 22.3 -11.6 L 24.1 -12.8 L 26.3 -12.9 L 28.3 -12.3 L 30.3 -12.1 L 32.1 -12.3 L 34.0 -12.5 L 34.9 -13.0 L 32.6 -11.6 L 30.5 -9.7 L 28.6 -6.5 L 26.8 -2.9 L 24.7 .7 L 22.6 3.9 L 20.4 6.5 L 18.0 8.0 L 15.7 8.3 L 13.8 7.5 L 12.9 5.6 L 13.4 3.7 L 15.0 1.9 L 17.5 .6 L 20.6 -.3 L 24.1 -1.0 L 29.2 -1.8 L 33.7 -3.1 L 37.7 -4.7 L 41.0 -6.3 L 43.9 -8.2 L 45.6 -9.7 L 46.5 -11.5 L 46.3 -12.5 L 45.2 -13.3 L 42.6 -12.6 L 40.2 -10.8 L 37.8 -8.4 L 35.8 -6.0 L 33.8 -2.7 L 32.2 1.0 L 31.5 4.1 L 31.5 6.4 L 32.1 7.7 L 33.2 8.3 L 34.9 8.1 L 36.9 7.2 L 38.9 5.3 L 40.8 3.2 L 42.9 .5","0 19.3 M 15.4 2.0 L 14.2 2.5 L 13.4 3.9 L 13.1 5.6 L 13.7 7.3 L 15.4 8.1 L 17.3 8.3 L 19.8 7.6 L 21.9 6.2 L 24.0 3.9 L 27.0 -.9 L 29.3 -5.2 L 31.4 -8.4 L 32.9 -10.6 L 34.4 -11.9 L 36.5 -13.0 L 35.2 -12.4 L 32.7 -12.2 L 30.8 -12.2 L 27.8 -12.8 L 26.0 -12.8 L 23.9 -11.9 L 22.9 -10.2 L 22.8 -8.2","0 22.3 M 25.0 -8.1 L 25.1 -10.0 L 26.0 -11.8 L 27.9 -12.8 L 29.8 -12.9 L 31.8 -12.3 L 34.0 -12.1 L 36.6 -12.3 L 38.9 -13.1 L 36.7 -12.0 L 34.5 -9.9 L 32.7 -7.1 L 30.9 -4.0 L 29.5 -1.3 L 27.8 1.4 L 26.2 4.4 L 23.9 8.0 L 22.0 10.3 L 20.3 12.2 L 17.9 13.7 L 15.6 14.4 L 13.6 14.5 L 11.9 13.7 L 11.8 11.6 L 13.1 10.0 L 15.2 8.9 L 18.6 8.1 L 21.2 7.8 L 26.0 7.5 L 29.7 6.6 L 32.4 5.2 L 34.7 3.0 L 36.6 .5","0 28.1 M 15.4 1.9 L 14.1 2.4 L 13.5 3.4 L 13.0 4.8 L 13.2 6.3 L 13.6 7.2 L 14.7 8.0 L 16.2 8.3 L 18.0 8.1 L 20.2 7.2 L 22.6 5.3 L 24.9 2.5 L 27.4 -1.8 L 29.3 -5.3 L 31.2 -8.3 L 32.8 -10.5 L 34.0 -11.6 L 34.8 -12.4 L 36.4 -13.0 L 34.7 -12.4 L 32.9 -12.2 L 30.4 -12.2 L 28.3 -12.9 L 26.5 -12.8 L 25.0 -12.5 L 23.6 -11.5 L 22.7 -10.0 L 22.7 -8.2 M 46.3 -13.0 L 44.6 -13.1 L 43.0 -12.7 L 41.4 -11.8 L 40.0 -10.0 L 38.6 -8.4 L 36.9 -6.5 L 35.4 -4.9 L 34.0 -4.0 L 32.6 -3.4 L 31.7 -3.6 L 33.1 -2.7 L 33.9 -1.9 L 33.9 -1.0 L 33.7 .2 L 32.2 3.4 L 31.5 5.0 L 31.3 6.5 L 32.6 7.9 L 34.8 8.1 L 36.8 7.4 L 39.4 4.8 L 42.7 .4","0 22.8 M 33.1 -5.2 L 34.6 -6.7 L 36.3 -8.5 L 37.4 -10.6 L 37.4 -12.1 L 36.9 -13.0 L 35.4 -13.1 L 33.1 -12.1 L 31.2 -10.2 L 29.5 -7.6 L 27.5 -4.3 L 25.8 -1.3 L 23.5 2.4 L 22.0 4.6 L 20.5 6.3 L 19.1 7.4 L 16.7 8.2 L 14.7 8.4 L 12.5 7.6 L 12.9 6.2 L 14.3 5.6 L 16.0 5.6 L 18.1 6.1 L 20.9 7.2 L 23.5 8.0 L 26.5 8.4 L 28.9 7.9 L 31.6 6.7 L 34.1 4.5 L 35.7 2.8 L 37.3 .5","0 30.0 M 15.1 -7.1 L 16.9 -9.4 L 18.9 -11.8 L 21.2 -13.1 L 22.5 -13.1 L 23.5 -12.2 L 23.3 -10.2 L 22.5 -8.0 L 14.0 7.6 L 22.6 -7.4 L 24.6 -9.7 L 26.3 -11.7 L 27.8 -12.8 L 29.5 -13.1 L 31.1 -12.9 L 32.1 -11.8 L 32.4 -10.3 L 31.6 -7.9 L 23.1 7.8 L 31.0 -6.5 L 32.9 -8.4 L 34.6 -10.5 L 35.8 -11.8 L 37.2 -12.8 L 38.9 -13.2 L 40.3 -13.0 L 41.1 -12.2 L 41.4 -10.3 L 40.0 -7.1 L 35.2 .8 L 33.7 4.4 L 33.3 6.0 L 33.6 7.2 L 34.8 8.2 L 36.3 8.3 L 38.2 7.5 L 40.1 5.8 L 42.4 3.2 L 44.5 .5","0 22.5 M 15.1 -7.0 L 16.5 -9.1 L 18.1 -11.2 L 19.8 -12.7 L 21.8 -13.1 L 23.1 -12.4 L 23.0 -10.6 L 22.5 -8.4 L 21.1 -5.5 L 13.8 7.6 L 21.7 -6.1 L 23.5 -7.8 L 25.4 -10.2 L 27.0 -11.6 L 28.7 -12.8 L 30.4 -13.0 L 32.1 -12.7 L 32.9 -11.7 L 32.9 -9.7 L 32.0 -7.4 L 28.5 -1.3 L 26.3 2.8 L 25.6 4.5 L 25.4 5.8 L 25.5 7.1 L 26.3 7.9 L 28.2 8.1 L 30.3 7.5 L 32.6 5.5 L 34.6 3.2 L 36.6 .5","0 21.3 M 19.6 8.1 L 22.1 7.5 L 24.6 6.0 L 27.0 4.0 L 29.2 1.3 L 31.2 -1.6 L 32.4 -4.5 L 33.3 -7.1 L 33.5 -9.5 L 33.3 -11.4 L 32.1 -12.7 L 30.1 -13.1 L 27.9 -12.9 L 25.7 -11.9 L 23.5 -10.6 L 20.5 -7.6 L 18.7 -5.1 L 17.1 -2.3 L 16.2 .1 L 15.6 3.0 L 15.6 4.9 L 16.4 7.1 L 18.0 8.1 L 19.6 8.1","0 22.9 M 29.1 -2.3 L 31.3 -2.8 L 34.1 -4.2 L 36.2 -6.1 L 37.3 -8.3 L 37.7 -10.4 L 36.8 -12.3 L 35.4 -13.1 L 33.3 -13.2 L 29.8 -12.8 L 26.7 -11.6 L 23.4 -9.9 L 20.5 -7.6 L 17.8 -4.8 L 16.0 -2.2 L 14.7 -.1 L 13.9 1.9 L 13.4 3.8 L 13.3 5.4 L 13.4 7.0 L 14.2 7.9 L 15.8 8.4 L 17.7 8.0 L 19.7 6.8 L 21.7 5.0 L 24.0 1.4 L 25.9 -1.9 L 28.4 -6.2 L 30.3 -9.1 L 32.0 -10.9 L 33.3 -11.8 L 34.3 -12.5","0 23.8 M 24.9 5.3 L 23.6 6.2 L 22.2 6.6 L 20.9 6.7 L 19.3 6.3 L 18.4 4.8 L 18.3 2.3 L 19.3 -.9 L 21.5 -5.6 L 24.0 -8.7 L 27.1 -11.2 L 30.0 -12.8 L 32.6 -13.2 L 34.3 -12.9 L 35.6 -11.8 L 36.1 -10.4 L 36.2 -8.2 L 35.5 -5.6 L 33.9 -2.1 L 32.1 .7 L 30.4 2.9 L 28.4 5.1 L 26.2 6.9 L 23.2 9.0 L 20.3 10.5 L 17.6 11.8 L 15.2 12.1 L 12.8 12.0 L 11.7 11.1 L 12.6 9.7 L 13.8 9.3 L 15.3 9.3 L 17.2 9.8 L 18.9 10.5 L 21.2 11.4 L 24.2 12.1 L 26.7 12.1 L 29.1 11.3 L 30.8 10.1 L 32.8 8.4","0 26.9 M 34.4 -12.5 L 32.4 -11.4 L 30.8 -10.0 L 29.2 -7.8 L 27.8 -4.9 L 25.7 -1.4 L 24.1 1.5 L 22.0 4.3 L 20.5 6.1 L 18.3 7.6 L 16.0 8.2 L 14.0 7.8 L 13.0 5.7 L 13.5 2.8 L 14.5 .2 L 16.4 -3.0 L 18.8 -5.8 L 21.5 -8.5 L 25.2 -10.9 L 28.2 -12.4 L 32.1 -13.0 L 34.1 -13.0 L 36.0 -12.8 L 37.2 -11.6 L 37.8 -10.0 L 37.4 -8.2 L 35.8 -6.3 L 34.1 -4.7 L 32.4 -3.9 L 31.6 -3.6 L 30.5 -3.6 L 30.2 -3.5 L 31.8 -2.7 L 32.3 -1.9 L 32.5 -.4 L 31.2 2.0 L 30.0 4.7 L 29.9 6.2 L 30.6 7.3 L 32.1 8.2 L 34.2 8.0 L 36.1 6.6 L 38.7 3.8 L 41.4 .5","0 18.4 M 15.7 .3 L 15.1 .4 L 13.8 1.9 L 13.3 3.3 L 13.3 4.7 L 14.3 6.5 L 15.6 7.8 L 18.0 8.4 L 20.5 7.8 L 23.3 6.5 L 25.3 3.9 L 25.9 1.5 L 25.6 -1.1 L 24.3 -4.1 L 24.0 -6.7 L 24.5 -9.6 L 26.1 -11.6 L 28.5 -13.1 L 30.5 -13.1 L 32.1 -12.7 L 33.2 -11.8 L 33.6 -10.2 L 32.9 -8.7 L 31.9 -7.1","0 19.9 M 15.5 1.8 L 14.5 2.4 L 13.5 3.9 L 13.2 5.7 L 13.5 6.8 L 14.8 8.0 L 16.8 8.4 L 19.0 8.1 L 21.3 6.8 L 23.6 4.1 L 26.1 .7 L 28.9 -4.3 L 30.8 -7.6 L 32.1 -9.4 L 33.8 -11.4 L 35.2 -12.6 L 37.3 -13.6 L 39.3 -13.8 L 40.6 -13.7 L 41.0 -13.1 L 40.5 -12.4 L 39.7 -11.9 L 37.9 -11.3 L 36.4 -11.3 L 33.2 -11.9 L 29.1 -12.6 L 26.0 -12.9 L 23.0 -12.7 L 20.9 -11.8 L 19.6 -10.2 L 19.4 -8.7 L 20.1 -7.5 L 21.6 -6.7 L 23.4 -6.9 L 24.4 -7.1 L 25.6 -7.6","0 21.4 M 15.0 -6.9 L 16.0 -8.5 L 17.6 -10.6 L 19.3 -12.2 L 20.6 -13.1 L 21.9 -13.2 L 23.2 -12.6 L 23.4 -10.9 L 21.9 -7.5 L 19.2 -2.9 L 16.7 1.7 L 15.4 4.6 L 15.3 6.2 L 15.9 7.5 L 16.9 8.1 L 18.4 8.1 L 20.1 7.5 L 22.4 5.3 L 24.6 2.4 L 26.8 -.2 L 28.5 -2.7 L 34.2 -13.0 L 25.3 3.6 L 24.9 5.3 L 25.0 6.7 L 25.7 7.8 L 27.2 8.2 L 29.0 7.8 L 31.6 5.9 L 34.0 3.2 L 35.9 .5","0 18.2 M 15.2 -6.8 L 16.5 -9.1 L 18.4 -11.3 L 20.0 -12.8 L 22.0 -13.3 L 23.5 -12.8 L 23.5 -11.3 L 23.0 -9.2 L 19.0 -2.5 L 16.8 1.4 L 15.8 3.4 L 15.4 5.3 L 15.3 6.2 L 15.8 7.4 L 16.8 8.1 L 18.1 8.1 L 19.6 7.5 L 21.6 6.4 L 23.6 4.2 L 26.7 .6 L 28.9 -2.8 L 30.6 -6.0 L 32.2 -9.5 L 32.6 -12.2 L 32.4 -14.2","0 27.8 M 15.1 -7.1 L 16.5 -9.2 L 18.5 -11.6 L 20.1 -12.8 L 22.1 -13.2 L 23.1 -12.5 L 23.3 -11.1 L 22.7 -9.3 L 20.1 -4.5 L 17.3 .3 L 15.5 3.9 L 15.1 5.5 L 15.2 6.7 L 16.0 7.8 L 17.4 8.3 L 19.3 7.6 L 21.6 5.8 L 24.0 3.4 L 26.4 .8 L 33.0 -11.3 L 25.3 2.7 L 24.7 4.6 L 24.9 6.1 L 25.4 7.6 L 27.3 8.1 L 29.1 7.6 L 31.4 6.3 L 34.3 3.4 L 37.0 -.2 L 39.3 -3.9 L 41.2 -7.6 L 42.4 -11.1 L 42.5 -13.0 L 42.1 -14.2","0 22.5 M 12.7 9.4 L 13.2 7.6 L 14.3 6.1 L 16.2 4.1 L 18.9 1.8 L 21.5 -.1 L 26.5 -2.9 L 29.2 -4.4 L 32.3 -7.1 L 35.2 -9.9 L 36.7 -12.2 L 37.1 -13.3 M 18.2 -10.1 L 19.3 -11.5 L 20.9 -12.8 L 22.4 -13.1 L 23.8 -12.9 L 25.1 -11.7 L 25.5 -10.1 L 25.5 -8.1 L 24.1 3.3 L 24.1 6.2 L 25.1 7.7 L 27.0 8.3 L 29.6 7.6 L 32.4 5.7 L 35.1 3.0 L 37.1 .5","0 22.4 M 16.7 -6.8 L 18.0 -8.9 L 19.6 -11.0 L 21.3 -12.4 L 22.7 -13.1 L 24.4 -13.0 L 25.2 -12.3 L 25.1 -10.5 L 23.9 -7.6 L 21.1 -3.2 L 19.8 -1.0 L 18.9 1.6 L 19.2 3.2 L 20.9 4.6 L 22.9 4.2 L 25.1 2.6 L 27.3 .4 L 29.3 -2.0 L 32.6 -7.1 L 35.5 -12.1 L 26.0 5.0 L 24.0 8.2 L 22.2 10.4 L 20.2 12.3 L 18.1 13.8 L 16.1 14.5 L 14.1 14.6 L 12.8 14.3 L 11.6 12.9 L 11.6 11.5 L 13.0 9.9 L 15.0 9.0 L 18.9 8.1 L 22.2 7.7 L 26.4 7.3 L 30.1 6.6 L 33.3 4.6 L 35.0 2.7 L 36.8 .5","0 19.2 M 17.0 -7.0 L 18.6 -9.3 L 20.5 -11.6 L 22.1 -12.7 L 23.1 -12.9 L 24.3 -12.6 L 25.7 -11.9 L 27.0 -11.3 L 28.3 -11.1 L 29.8 -11.3 L 31.9 -12.0 L 34.1 -12.7 L 24.7 -3.2 L 20.0 -3.2 L 29.3 -3.2 L 24.7 -3.2 L 14.0 7.7 L 15.7 6.1 L 17.1 5.8 L 18.7 5.9 L 20.0 6.3 L 22.0 7.2 L 23.6 7.4 L 25.1 7.8 L 26.6 7.5 L 28.3 6.4 L 30.5 4.2 L 32.5 1.9 L 33.6 .5","0 14.4 M 17.3 10.2 L 13.0 10.1 L 26.1 -13.9 L 30.5 -13.9","0 9.2 M 16.9 -12.6 L 21.1 10.2","0 14.4 M 12.6 10.1 L 17.0 10.1 L 30.0 -14.0 L 25.8 -14.0","0 11.3 M 14.8 1.0 L 20.3 -4.3 L 24.3 1.2","0 14.5 M 11.8 8.5 L 23.8 8.7","0 4.2 M 17.1 -13.9 L 17.3 -13.0 L 18.0 -11.8 L 19.7 -10.1","0 18.9 M 25.4 -1.8 L 26.2 -4.1 L 26.2 -6.4 L 25.1 -7.5 L 22.2 -7.4 L 18.6 -5.2 L 16.2 -2.8 L 14.7 .1 L 13.5 2.2 L 12.8 5.2 L 13.0 6.8 L 14.6 8.0 L 17.2 7.2 L 20.4 4.5 L 23.3 1.3 L 26.2 -3.1 L 28.5 -7.1 L 22.9 2.9 L 22.3 5.2 L 22.5 6.8 L 23.8 8.0 L 25.8 7.7 L 28.3 6.3 L 31.3 3.0 L 33.4 .5","0 15.7 M 22.5 -14.5 L 14.4 .7 L 13.2 2.8 L 12.3 4.9 L 12.3 6.1 L 13.1 7.4 L 15.2 8.0 L 18.5 6.7 L 21.9 3.9 L 24.3 .3 L 26.1 -3.6 L 26.3 -5.9 L 25.5 -7.5 L 23.9 -7.6 L 21.8 -6.9 L 19.9 -5.2 L 17.7 -3.0 L 14.9 -.1","0 13.2 M 24.2 -5.8 L 24.5 -5.3 L 25.3 -5.6 L 25.5 -6.3 L 25.3 -7.1 L 24.0 -7.8 L 21.4 -7.4 L 19.2 -6.0 L 16.9 -3.8 L 15.0 -.8 L 13.8 1.6 L 13.4 4.2 L 13.7 6.3 L 14.9 7.6 L 16.5 8.0 L 18.9 7.8 L 21.3 6.7 L 23.7 5.0 L 25.9 2.5 L 27.7 .5","0 18.9 M 25.6 -2.5 L 26.0 -4.9 L 25.7 -6.9 L 24.6 -7.8 L 22.3 -7.5 L 19.4 -5.9 L 17.2 -3.7 L 15.4 -1.5 L 13.9 1.1 L 13.0 3.8 L 12.8 6.0 L 13.4 7.4 L 15.0 8.0 L 17.6 6.9 L 20.4 4.5 L 22.8 1.7 L 26.6 -4.0 L 32.3 -14.5 L 24.0 .7 L 23.1 2.7 L 22.4 4.0 L 22.3 5.7 L 22.9 7.2 L 24.4 7.9 L 26.3 7.6 L 28.8 5.9 L 31.0 3.5 L 33.3 .5","0 13.6 M 15.2 .5 L 18.1 -.4 L 21.2 -1.2 L 23.3 -2.2 L 25.0 -3.7 L 25.7 -5.8 L 25.1 -7.4 L 22.6 -7.9 L 19.3 -6.2 L 16.4 -2.8 L 14.6 .7 L 13.6 3.9 L 13.9 6.3 L 15.5 7.8 L 18.1 7.9 L 21.3 6.8 L 24.4 4.4 L 26.1 2.6 L 27.7 .5","0 9.3 M 6.9 14.4 L 18.7 -7.5 L 23.5 -7.5 L 14.6 -7.5 L 18.6 -7.5 L 21.3 -11.9 L 22.8 -13.3 L 24.1 -14.1 L 25.8 -14.4 L 27.0 -14.2 L 27.8 -13.3 L 27.8 -12.7 L 27.5 -12.0 L 26.5 -11.9 L 26.5 -12.4 L 26.9 -12.6","0 17.0 M 9.9 12.0 L 10.4 11.6 L 9.9 11.2 L 9.2 11.8 L 8.9 12.8 L 10.2 14.4 L 12.5 14.8 L 15.5 14.1 L 17.4 12.6 L 20.3 8.3 L 24.6 .1 L 26.1 -3.7 L 26.1 -5.8 L 25.7 -7.3 L 23.9 -7.8 L 21.1 -6.9 L 19.0 -5.5 L 16.9 -3.4 L 15.1 -.7 L 13.9 1.5 L 13.1 3.8 L 12.8 5.5 L 13.1 7.0 L 14.1 7.8 L 15.6 7.8 L 17.7 6.8 L 20.2 4.7 L 22.1 2.5 L 25.7 -2.1 L 28.6 -7.4","0 18.2 M 22.3 -14.5 L 10.3 7.7 L 15.5 -1.0 L 17.8 -3.2 L 20.2 -5.7 L 21.9 -7.1 L 24.0 -7.6 L 25.6 -7.4 L 26.6 -6.4 L 26.6 -4.5 L 25.6 -2.5 L 23.1 1.9 L 21.7 4.8 L 21.7 5.9 L 22.0 7.2 L 23.4 7.9 L 25.0 7.7 L 27.2 6.7 L 30.2 3.8 L 32.7 .5","0 9.0 M 20.7 -11.9 L 20.1 -11.6 L 20.2 -10.7 L 21.0 -10.8 L 21.4 -11.5 L 20.7 -11.9 M 18.5 -7.3 L 13.5 2.1 L 12.6 4.1 L 12.2 5.4 L 12.5 6.7 L 13.4 7.7 L 15.5 7.8 L 17.7 6.7 L 20.4 4.4 L 21.7 2.8 L 23.3 .5","0 7.1 M 3.7 12.4 L 4.2 11.7 L 3.5 11.5 L 2.8 12.6 L 2.7 13.8 L 3.3 14.6 L 4.9 14.7 L 6.2 14.0 L 8.2 11.8 L 10.3 8.2 L 18.6 -7.3 M 20.6 -12.1 L 20.1 -11.5 L 20.1 -10.6 L 20.8 -10.7 L 21.4 -11.3 L 20.6 -12.1","0 17.2 M 22.4 -14.6 L 10.3 7.6 L 14.8 -.1 L 17.8 -3.3 L 20.1 -6.0 L 21.1 -6.6 L 22.7 -7.6 L 24.2 -8.0 L 25.7 -7.8 L 26.5 -6.8 L 26.4 -5.2 L 25.8 -3.7 L 24.6 -2.4 L 22.3 -1.3 L 19.5 -.3 L 20.9 .0 L 21.9 .6 L 22.3 1.9 L 21.6 3.4 L 20.5 5.7 L 20.7 6.8 L 21.6 7.6 L 23.2 7.9 L 25.3 7.3 L 28.1 5.0 L 29.9 2.8 L 31.7 .5","0 8.9 M 22.4 -14.6 L 13.3 2.3 L 12.5 3.9 L 12.2 5.3 L 12.5 6.3 L 13.3 7.5 L 14.9 7.8 L 17.0 7.2 L 18.9 5.8 L 21.5 2.9 L 23.4 .5","0 27.5 M 18.6 -7.4 L 10.6 7.6 L 14.8 -.1 L 17.2 -2.4 L 20.2 -5.8 L 23.1 -7.6 L 24.9 -7.8 L 26.0 -7.2 L 26.5 -5.8 L 26.2 -3.8 L 25.6 -2.1 L 20.2 7.6 L 25.4 -1.2 L 27.8 -3.7 L 30.2 -6.6 L 32.0 -7.6 L 33.8 -8.0 L 35.6 -7.4 L 36.0 -5.8 L 36.0 -4.1 L 33.6 .0 L 31.9 3.2 L 31.0 5.3 L 31.2 6.9 L 32.7 8.0 L 34.9 7.7 L 37.8 5.8 L 39.9 3.6 L 42.2 .5","0 18.6 M 18.7 -7.4 L 10.4 7.7 L 14.8 .4 L 17.0 -2.2 L 18.9 -4.4 L 21.0 -6.3 L 23.2 -7.6 L 25.1 -7.6 L 26.2 -7.1 L 26.9 -5.6 L 26.1 -3.1 L 24.0 .6 L 22.5 3.3 L 21.8 5.4 L 22.2 6.9 L 23.3 7.8 L 25.2 7.8 L 27.3 6.7 L 29.7 4.5 L 31.4 2.5 L 33.0 .5","0 15.1 M 15.7 7.8 L 17.9 7.3 L 21.0 5.4 L 24.0 1.9 L 25.8 -1.9 L 26.5 -4.9 L 25.9 -6.9 L 24.4 -7.8 L 22.3 -7.8 L 19.7 -6.4 L 17.5 -4.5 L 15.6 -2.2 L 14.4 .4 L 13.6 2.7 L 13.2 5.1 L 13.7 6.9 L 14.5 7.6 L 15.7 7.8","0 15.6 M 6.8 14.6 L 14.9 -.4 L 17.6 -2.8 L 20.8 -6.2 L 22.8 -7.5 L 24.7 -7.7 L 26.1 -7.0 L 26.6 -4.8 L 25.6 -2.1 L 23.6 1.8 L 22.1 3.9 L 19.6 6.2 L 17.7 7.2 L 16.1 7.7 L 14.9 7.9 L 13.7 7.8 L 13.0 6.8 L 13.0 5.3 L 13.3 3.3 L 15.0 -.6 L 18.8 -7.6","0 17.0 M 16.5 14.8 L 26.0 -2.5 L 26.0 -5.5 L 25.9 -7.0 L 24.7 -7.8 L 22.9 -7.8 L 20.8 -6.7 L 18.1 -4.4 L 15.6 -1.3 L 14.0 1.7 L 13.2 3.9 L 13.2 6.3 L 13.9 7.6 L 15.5 7.9 L 18.1 6.4 L 20.4 4.3 L 22.3 2.3 L 25.9 -2.1 L 28.6 -7.5","0 11.5 M 18.6 -7.4 L 10.5 7.6 L 14.9 .0 L 17.6 -2.8 L 19.6 -5.0 L 21.4 -6.8 L 23.1 -7.6 L 24.4 -7.8 L 25.0 -7.3 L 25.2 -6.5 L 24.9 -5.4 L 24.0 -5.1 L 23.7 -5.4 L 24.3 -6.1","0 13.3 M 14.0 .5 L 16.6 -2.4 L 20.7 -7.1 L 22.5 -8.4 L 24.0 -9.5 L 24.0 -10.5 L 22.5 -10.8 L 21.6 -9.5 L 21.5 -8.3 L 21.4 -3.4 L 21.6 .8 L 20.9 3.3 L 18.9 6.2 L 16.7 7.5 L 14.8 7.9 L 13.0 7.3 L 12.0 5.6 L 12.4 3.1 L 13.2 1.8 L 14.5 .5 L 15.1 .1 L 15.4 .9 L 14.9 1.5 L 14.6 1.0","0 9.7 M 20.3 -10.7 L 18.7 -7.4 L 23.5 -7.4 L 14.2 -7.4 L 18.7 -7.4 L 13.5 1.9 L 12.6 4.4 L 12.5 6.7 L 14.5 8.1 L 16.8 7.6 L 19.4 6.1 L 22.2 3.0 L 24.0 .5","0 18.7 M 18.7 -7.4 L 13.0 3.3 L 12.3 4.9 L 12.4 6.3 L 12.8 7.3 L 14.2 8.0 L 15.6 7.7 L 18.0 6.6 L 19.9 4.6 L 21.6 2.9 L 23.7 .9 L 25.0 -.9 L 28.3 -7.2 L 22.5 3.8 L 22.1 5.3 L 22.1 6.5 L 22.7 7.4 L 23.8 7.8 L 25.3 7.8 L 26.9 7.2 L 29.6 4.9 L 31.5 2.8 L 33.2 .5","0 14.1 M 18.6 -7.3 L 13.3 2.0 L 12.5 4.5 L 12.4 6.5 L 13.1 7.6 L 14.5 7.9 L 16.6 7.4 L 19.1 5.7 L 21.7 3.2 L 23.3 .6 L 24.7 -2.6 L 25.1 -5.3 L 25.3 -6.5 L 25.0 -7.4","0 21.9 M 18.6 -7.3 L 12.7 3.6 L 12.3 5.1 L 12.3 6.5 L 12.9 7.5 L 14.0 8.0 L 15.5 7.7 L 17.6 6.7 L 19.2 5.2 L 20.6 3.8 L 22.3 1.8 L 27.4 -7.3 L 21.3 4.2 L 21.0 5.8 L 21.3 7.1 L 22.2 7.8 L 23.4 7.9 L 25.0 7.3 L 26.7 6.2 L 28.9 4.1 L 30.8 1.3 L 32.1 -1.2 L 33.0 -4.0 L 33.4 -5.6 L 33.1 -7.3","0 20.0 M 13.8 6.1 L 14.6 6.1 L 14.7 5.3 L 14.0 5.1 L 13.2 6.1 L 13.3 7.2 L 14.9 8.1 L 17.1 7.4 L 19.3 5.2 L 21.7 2.1 L 24.4 -2.4 L 26.4 -4.9 L 28.1 -6.6 L 29.9 -7.6 L 31.2 -7.8 L 32.2 -7.4 L 32.7 -7.0 L 32.8 -6.2 L 32.5 -5.4 L 32.0 -5.2 L 31.6 -5.3 L 31.8 -6.0 L 32.2 -5.9 M 13.8 .2 L 16.8 -3.7 L 18.6 -5.9 L 20.4 -7.4 L 22.2 -7.8 L 23.3 -7.1 L 23.8 -5.8 L 23.5 -2.9 L 22.0 2.6 L 21.7 5.4 L 22.2 7.1 L 24.3 7.9 L 26.2 7.5 L 28.6 6.5 L 31.3 4.1 L 33.1 2.0 L 34.1 .5","0 17.0 M 18.5 -7.3 L 13.5 2.1 L 12.5 4.8 L 12.4 6.6 L 13.1 7.5 L 14.4 8.0 L 16.3 7.5 L 18.3 6.2 L 21.0 3.6 L 24.2 -.1 L 25.6 -2.0 L 28.5 -7.3 L 21.3 5.9 L 19.2 9.6 L 17.5 12.1 L 15.9 13.7 L 14.0 14.5 L 11.9 14.7 L 10.1 14.5 L 9.0 13.3 L 8.9 11.8 L 9.6 11.2 L 10.4 11.8 L 10.1 12.3","0 17.5 M 13.4 .4 L 17.2 -4.2 L 19.3 -6.5 L 20.2 -7.1 L 21.1 -7.5 L 22.0 -7.3 L 24.2 -6.2 L 25.6 -5.6 L 27.6 -5.9 L 28.6 -6.2 L 30.6 -7.3 L 13.4 7.8 L 15.5 6.1 L 17.2 5.8 L 19.2 6.3 L 20.4 6.9 L 21.8 7.6 L 23.8 7.7 L 25.9 7.2 L 29.4 3.9 L 32.1 .5","0 11.9 M 15.1 10.0 L 14.0 10.0 L 13.2 9.6 L 13.1 8.6 L 13.7 6.9 L 16.5 2.8 L 17.7 .5 L 18.1 -.7 L 18.0 -1.8 L 17.8 -2.9 L 18.4 -3.1 L 19.7 -3.9 L 21.4 -6.5 L 23.7 -11.4 L 24.4 -12.9 L 25.0 -13.6 L 25.8 -13.9 L 26.6 -13.8 L 27.5 -13.2","0 5.3 M 15.3 8.1 L 19.0 -12.7","0 11.7 M 12.7 9.5 L 13.8 9.9 L 15.3 9.9 L 16.5 8.7 L 17.3 6.1 L 18.8 2.9 L 19.7 1.2 L 21.1 -.2 L 22.2 -.5 L 22.7 -.8 L 22.5 -2.7 L 22.8 -4.3 L 24.1 -6.7 L 26.6 -10.5 L 27.5 -12.1 L 27.3 -13.2 L 26.6 -13.7 L 25.5 -13.8","0 13.2 M 13.5 2.1 L 14.5 .2 L 16.5 -1.6 L 18.3 -1.4 L 22.9 1.3 L 24.0 1.5 L 25.5 .9 L 26.5 -.2 L 27.6 -1.7","0 8.2 M 20.2 -8.0 L 21.5 -8.4 L 22.8 -9.5 L 23.3 -10.7 L 23.3 -12.2 L 22.5 -13.1 L 21.4 -13.6 L 19.7 -13.3 L 18.6 -12.5 L 17.9 -11.5 L 17.6 -10.3 L 17.9 -9.0 L 18.8 -8.2 L 20.2 -8.0"]
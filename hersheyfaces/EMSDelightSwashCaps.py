@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 6.3 M 13.8 -13.6 L 13.8 1.8 M 13.3 6.5 L 13.2 7.9 L 14.2 7.8 L 14.2 6.5 L 13.3 6.5","0 9.4 M 13.2 -12.1 L 13.2 -6.7 M 17.8 -12.2 L 17.8 -6.8","0 22.6 M 20.4 -11.9 L 16.6 7.9 M 27.5 -11.7 L 23.6 8.0 M 12.6 1.1 L 30.2 1.1 M 13.8 -5.6 L 31.4 -5.5","0 15.4 M 23.2 -10.1 L 21.8 -11.0 L 19.8 -11.6 L 17.5 -11.5 L 14.8 -10.3 L 13.9 -8.3 L 14.4 -6.2 L 16.2 -4.5 L 19.5 -2.3 L 22.0 -.7 L 24.0 1.7 L 23.9 4.5 L 22.4 6.9 L 19.0 7.8 L 15.7 7.6 L 12.9 6.0 M 18.7 -14.3 L 18.7 10.7","0 22.6 M 18.3 -10.6 L 19.3 -8.5 L 19.3 -6.1 L 18.2 -4.2 L 16.2 -3.4 L 14.1 -3.7 L 12.6 -5.7 L 12.6 -8.0 L 13.5 -10.5 L 15.2 -11.6 L 17.2 -11.5 L 19.2 -10.2 L 21.0 -9.1 L 23.0 -9.3 L 25.0 -9.7 L 26.3 -11.2 L 26.6 -12.3 L 26.3 -13.1 L 25.7 -12.8 L 25.3 -11.5 L 24.9 -9.1 L 18.7 7.9 M 28.1 -.4 L 26.2 .1 L 25.0 2.2 L 24.6 4.0 L 25.0 6.1 L 26.5 7.6 L 28.3 7.9 L 29.9 7.3 L 31.0 6.0 L 31.5 3.8 L 31.2 1.7 L 30.4 .4 L 29.0 -.3 L 28.3 -.4","0 21.4 M 21.4 -11.2 L 19.7 -12.2 L 17.9 -12.6 L 15.7 -11.9 L 14.2 -10.4 L 14.1 -9.0 L 14.5 -6.9 L 15.9 -5.4 L 17.2 -4.6 L 18.9 -4.3 L 19.4 -4.6 L 19.0 -4.9 L 17.0 -4.7 L 15.1 -3.5 L 13.2 -1.3 L 12.6 1.6 L 13.1 4.6 L 14.8 6.4 L 17.9 7.8 L 21.2 7.3 L 23.8 5.5 L 24.8 3.2 L 24.7 1.6 L 24.5 .1 L 23.6 -.8 L 21.7 -1.2 L 20.4 -.5 L 23.5 -1.1 L 26.3 -1.0 L 29.0 -1.7 L 30.7 -3.2 L 30.8 -5.7 L 30.2 -7.5 L 28.7 -8.5 L 27.1 -9.2","0 4.6 M 13.1 -12.1 L 13.1 -6.7","0 8.1 M 17.7 -13.0 L 15.1 -9.3 L 13.5 -5.0 L 12.7 -.7 L 12.7 3.2 L 13.5 6.6 L 14.9 10.9 L 17.4 14.4","0 8.1 M 12.1 -13.1 L 14.6 -9.1 L 16.3 -3.4 L 16.9 2.1 L 16.4 5.9 L 15.3 9.6 L 13.0 13.4 L 12.4 14.1","0 11.4 M 12.9 -7.1 L 19.9 -11.0 M 13.0 -11.1 L 20.1 -7.1 M 16.5 -5.0 L 16.4 -13.1","0 14.5 M 12.6 .7 L 23.7 .7 M 18.1 -4.9 L 18.1 6.5","0 5.3 M 13.7 6.4 L 12.9 6.5 L 13.4 9.7 L 12.2 11.9","0 11.7 M 12.9 .7 L 20.2 .7","0 5.3 M 12.9 6.4 L 12.8 7.4 L 13.6 7.5 L 13.7 6.5 L 12.9 6.4","0 9.7 M 18.3 -13.2 L 13.0 11.8","0 18.4 M 20.0 -11.6 L 17.4 -11.0 L 15.0 -8.7 L 13.4 -5.0 L 13.2 -2.6 L 13.5 .8 L 14.1 3.3 L 15.2 5.0 L 16.8 6.7 L 18.4 7.7 L 20.8 7.7 L 23.2 6.7 L 25.5 4.1 L 26.7 .5 L 26.5 -3.9 L 25.9 -6.9 L 24.6 -9.0 L 23.4 -10.4 L 22.2 -11.2 L 20.0 -11.6","0 10.6 M 11.8 -4.6 L 17.6 -11.7 L 17.6 7.5","0 15.3 M 13.3 -8.6 L 14.8 -10.4 L 16.9 -11.3 L 19.4 -11.5 L 21.1 -10.8 L 22.6 -9.2 L 23.1 -7.5 L 22.8 -5.4 L 21.7 -3.8 L 13.2 6.0 L 12.9 6.6 L 12.9 7.3 L 24.1 7.4","0 15.9 M 13.4 -11.2 L 23.1 -11.2 L 23.2 -10.6 L 16.5 -2.8 L 15.3 -2.3 L 15.3 -2.7 L 16.0 -3.5 L 17.6 -3.8 L 20.1 -3.6 L 22.7 -2.0 L 24.1 .7 L 23.8 4.0 L 22.1 6.6 L 19.4 8.0 L 16.2 7.6 L 14.5 6.7 L 13.0 5.2","0 16.0 M 22.0 7.5 L 21.9 -11.6 L 20.3 -10.5 L 12.1 .3 L 12.8 .7 L 25.3 .6","0 16.0 M 23.5 -11.3 L 13.7 -11.0 L 14.1 -8.0 L 14.0 -5.4 L 13.8 -2.1 L 15.9 -3.5 L 18.5 -4.4 L 20.9 -4.1 L 23.0 -2.7 L 24.5 .3 L 24.2 3.2 L 23.3 5.5 L 20.9 7.6 L 17.6 7.7 L 15.3 6.8 L 13.0 4.3","0 16.0 M 23.7 -11.3 L 19.8 -10.9 L 16.1 -8.4 L 13.6 -3.8 L 13.1 .4 L 14.0 4.6 L 16.5 7.4 L 20.6 7.8 L 23.4 5.9 L 24.8 2.7 L 24.1 -1.1 L 21.9 -3.4 L 19.0 -4.0 L 16.8 -3.4 L 15.6 -2.1 L 13.8 -.5","0 13.6 M 12.2 -11.3 L 22.8 -11.2 L 22.7 -10.2 L 15.2 6.7 L 15.2 7.6","0 16.3 M 18.8 -11.7 L 16.1 -11.1 L 14.4 -8.9 L 14.3 -6.8 L 16.2 -4.8 L 22.3 -1.4 L 24.0 .4 L 24.6 3.2 L 23.8 5.5 L 21.9 7.4 L 19.1 8.1 L 16.8 7.6 L 14.6 6.1 L 13.2 3.9 L 13.3 1.4 L 15.0 -.9 L 21.6 -4.8 L 23.5 -6.9 L 23.5 -9.3 L 22.0 -10.9 L 20.9 -11.4 L 18.8 -11.7","0 16.4 M 13.8 7.5 L 16.3 7.5 L 19.6 6.0 L 22.2 3.5 L 23.7 .5 L 24.2 -1.8 L 24.4 -4.5 L 24.0 -7.9 L 22.6 -10.1 L 20.7 -11.5 L 18.1 -11.8 L 15.4 -10.6 L 13.4 -8.1 L 12.9 -4.8 L 13.9 -2.2 L 16.1 -.1 L 19.0 .1 L 21.6 -.8 L 22.9 -2.5 L 24.2 -4.9","0 5.9 M 13.4 -5.3 L 13.6 -4.0 L 14.1 -4.1 L 14.1 -5.2 L 13.4 -5.3 M 13.2 6.4 L 13.1 7.7 L 14.0 7.7 L 14.0 6.3 L 13.2 6.4","0 6.2 M 13.5 -5.5 L 13.3 -4.0 L 14.2 -4.1 L 14.4 -5.4 L 13.5 -5.5 M 13.5 7.4 L 13.6 6.4 L 14.6 6.5 L 14.5 7.7 L 13.9 9.2 L 12.6 11.9","0 15.0 M 23.2 -5.7 L 12.5 -.3 L 23.2 5.4","0 16.6 M 13.3 -1.4 L 24.5 -1.4 M 13.1 2.8 L 24.6 2.8","0 15.0 M 13.4 -5.7 L 24.0 -.6 L 23.9 -.2 L 13.4 5.1","0 12.3 M 12.7 -11.0 L 14.2 -12.4 L 16.6 -13.0 L 18.8 -12.5 L 20.1 -11.1 L 21.0 -9.0 L 21.0 -7.2 L 19.4 -5.0 L 17.3 -2.8 L 16.3 -1.5 L 15.8 -.1 L 15.9 1.5 M 15.4 6.5 L 15.4 7.7 L 16.4 7.6 L 16.3 6.4 L 15.4 6.5","0 28.4 M 29.9 -2.8 L 26.7 -4.8 L 23.7 -4.8 L 20.7 -2.8 L 19.6 .0 L 19.4 2.6 L 20.0 5.0 L 21.9 7.0 L 24.5 7.7 L 27.2 6.3 L 28.8 3.8 L 29.7 1.6 L 29.8 -4.8 L 29.6 4.4 L 30.2 6.5 L 31.6 7.5 L 33.2 7.6 L 35.2 6.5 L 36.5 4.5 L 37.0 2.1 L 36.9 -1.2 L 36.5 -3.4 L 35.4 -5.9 L 33.8 -8.1 L 31.6 -9.9 L 27.8 -11.4 L 24.3 -11.6 L 20.0 -10.3 L 16.3 -7.3 L 14.1 -4.0 L 13.0 .0 L 13.1 4.0 L 13.8 7.1 L 15.8 10.4 L 18.7 13.0 L 22.5 14.1 L 25.9 14.0 L 28.7 13.0 L 30.7 11.7","0 22.9 M 31.2 .5 L 28.1 -.7 L 23.3 -.9 L 19.9 -.7 L 16.7 .3 L 14.4 1.6 L 13.1 3.1 L 12.2 5.0 L 12.4 6.5 L 13.0 7.5 L 14.8 8.0 L 16.8 6.5 L 18.0 3.7 L 23.5 -12.6 L 24.6 -12.6 L 31.4 7.3 L 32.1 7.6","0 20.9 M 12.3 5.0 L 12.6 5.1 L 15.7 6.8 L 19.2 7.7 L 23.3 7.6 L 26.8 6.0 L 28.8 4.0 L 29.4 2.4 L 29.4 .3 L 28.3 -1.9 L 25.9 -3.8 L 22.8 -5.0 L 19.5 -5.3 L 16.7 -5.3 L 14.4 -4.8 L 13.1 -3.8 L 13.1 -2.7 L 14.3 -1.5 L 16.2 -1.3 L 19.1 -1.6 L 22.4 -2.6 L 24.5 -3.8 L 27.1 -6.4 L 27.9 -8.1 L 27.8 -9.4 L 26.7 -11.5 L 24.5 -12.7 L 21.3 -13.1 L 19.2 -12.9 L 17.4 -12.4 L 16.8 -11.7 L 17.1 4.0","0 19.4 M 22.8 -9.3 L 22.1 -7.8 L 22.3 -5.9 L 23.9 -4.7 L 25.9 -4.8 L 27.4 -6.0 L 27.9 -8.1 L 27.1 -10.3 L 26.1 -11.7 L 24.1 -12.8 L 21.5 -13.2 L 18.9 -12.7 L 16.1 -10.8 L 14.0 -7.5 L 13.4 -4.6 L 13.2 -1.3 L 13.8 1.8 L 15.5 4.7 L 18.3 6.9 L 21.8 7.9 L 24.7 7.5 L 26.5 6.6 L 28.0 5.2","0 23.6 M 18.3 2.5 L 18.2 -12.6 L 16.7 -12.1 L 19.5 -12.8 L 23.0 -12.8 L 26.1 -12.0 L 28.8 -10.1 L 30.9 -6.7 L 31.6 -3.0 L 31.1 .8 L 29.3 4.1 L 26.3 6.4 L 23.2 7.5 L 20.1 7.7 L 16.9 7.0 L 14.2 5.0 L 12.9 2.0 L 13.5 -1.0 L 15.6 -3.6 L 17.6 -4.3 L 19.3 -4.3 L 21.0 -4.0 L 23.4 -1.9","0 17.9 M 25.6 -11.1 L 23.0 -12.6 L 19.9 -13.2 L 16.8 -12.0 L 15.3 -10.2 L 14.9 -7.5 L 16.0 -5.2 L 18.0 -3.3 L 20.7 -2.6 L 22.7 -2.8 L 23.5 -3.6 L 23.6 -4.3 L 23.5 -4.9 L 22.4 -5.6 L 20.6 -5.7 L 19.3 -5.6 L 17.6 -4.7 L 15.5 -3.5 L 13.5 -1.1 L 13.0 1.9 L 14.0 4.6 L 16.5 6.9 L 20.6 7.8 L 25.0 6.9 L 27.4 5.0","0 17.9 M 16.5 7.6 L 16.6 -10.7 L 16.0 -12.4 L 15.3 -13.2 L 14.4 -13.8 L 12.9 -13.4 L 12.3 -12.0 L 12.5 -10.8 L 13.5 -10.1 L 15.1 -9.8 L 18.0 -9.5 L 20.9 -9.9 L 23.8 -10.9 L 26.2 -12.0 L 27.9 -13.3 M 14.6 -3.2 L 18.2 -2.5 L 20.4 -2.3 L 24.7 -3.2","0 22.0 M 27.8 -10.4 L 26.1 -11.9 L 23.2 -13.0 L 19.9 -13.0 L 16.5 -11.2 L 13.8 -7.4 L 12.7 -2.9 L 13.3 .8 L 14.6 3.8 L 17.0 6.5 L 20.7 8.0 L 23.7 7.5 L 26.2 6.0 L 28.1 3.4 L 28.8 .9 L 28.9 -.9 L 28.3 -2.3 L 26.3 -3.5 L 22.8 -3.9 L 21.2 -2.9 L 20.7 -1.8 L 21.0 -.7 L 22.6 -.3 L 25.0 -.3 L 27.3 -.7 L 29.9 -1.8 L 31.8 -3.0","0 20.1 M 14.6 -13.0 L 14.6 7.7 M 27.2 -13.1 L 27.2 7.7 M 12.5 -3.4 L 15.6 -2.0 L 19.1 -1.7 L 22.9 -2.2 L 25.3 -3.3 L 26.9 -4.6","0 16.7 M 14.1 -13.1 L 16.5 -12.1 L 20.5 -12.1 L 25.5 -13.1 L 23.5 -12.7 L 23.4 2.0 L 22.9 4.1 L 21.6 6.2 L 19.7 7.5 L 17.3 7.9 L 15.6 7.5 L 13.8 6.3 L 12.6 4.5 L 12.6 2.4 L 13.8 .1 L 16.2 -.5 L 17.6 .0 L 18.5 .5 L 18.8 2.3 L 18.5 3.8","0 16.0 M 13.7 -12.9 L 16.4 -12.1 L 20.1 -12.2 L 25.1 -13.0 L 22.7 -12.5 L 22.9 8.5 L 22.4 10.3 L 21.5 12.0 L 20.2 13.2 L 18.2 14.3 L 16.2 14.4 L 14.3 13.8 L 12.8 12.5 L 12.0 10.4 L 12.0 7.9 L 13.6 5.4 L 15.5 4.6 L 17.1 5.1 L 18.2 6.1 L 18.7 6.7 L 18.7 7.7 L 18.4 8.7 L 18.2 9.1","0 19.9 M 16.2 -13.1 L 16.2 7.7 M 26.8 -12.8 L 26.0 -9.2 L 23.9 -5.4 L 21.8 -2.7 L 19.8 -1.2 L 16.8 -.8 L 15.1 -.9 L 13.5 -1.7 L 12.5 -2.9 L 12.6 -4.4 L 13.4 -5.1 L 14.8 -5.7 L 17.1 -5.9 L 19.0 -5.4 L 20.2 -4.5 L 21.0 -3.6 L 22.8 -.3 L 27.9 8.7 L 28.5 9.4 L 29.5 9.4","0 17.4 M 15.0 -13.0 L 15.6 -5.6 L 15.6 -1.1 L 15.5 3.5 L 15.2 5.0 L 14.8 6.4 L 14.2 7.4 L 13.3 7.5 L 12.7 7.2 L 12.7 6.7 L 13.0 6.3 L 13.9 6.5 L 15.0 6.6 L 18.7 7.6 L 22.6 7.4 L 25.1 6.3 L 26.4 4.6 L 26.6 3.2 L 25.8 1.7 L 24.5 1.1 L 22.9 1.1 L 22.0 1.7 L 21.8 2.9","0 28.1 M 15.4 1.5 L 13.5 1.8 L 12.3 4.1 L 12.9 6.5 L 15.3 7.6 L 17.1 6.7 L 18.4 4.8 L 18.7 3.2 L 18.9 -12.4 L 26.8 3.8 L 34.3 -13.0 L 34.7 5.3 L 35.1 6.4 L 35.4 6.9 L 36.6 7.2","0 24.8 M 15.6 1.6 L 14.5 1.3 L 12.9 2.6 L 12.3 3.9 L 12.3 4.9 L 12.9 6.3 L 14.2 7.2 L 15.8 7.2 L 17.4 6.3 L 18.1 4.6 L 18.7 1.9 L 18.7 -5.4 L 18.2 -12.8 L 30.0 7.4 L 29.9 3.2 L 29.7 -2.5 L 29.6 -7.5 L 30.0 -10.1 L 30.7 -11.8 L 32.0 -12.9 L 33.4 -13.0 L 34.5 -12.1","0 22.9 M 13.7 -6.3 L 13.0 -2.9 L 13.1 .3 L 14.9 3.6 L 17.6 6.4 L 21.4 7.7 L 25.3 7.3 L 28.0 5.7 L 30.4 2.5 L 31.2 -1.1 L 31.1 -4.7 L 30.2 -8.1 L 29.0 -10.7 L 27.2 -12.2 L 24.6 -13.1 L 21.8 -12.7 L 19.1 -10.7 L 17.1 -7.6 L 16.4 -4.4 L 16.5 -1.3 L 17.2 1.1","0 19.4 M 17.0 7.6 L 17.0 -12.0 L 19.8 -12.7 L 23.6 -12.4 L 26.5 -10.8 L 28.3 -8.4 L 28.2 -5.4 L 27.2 -3.0 L 25.6 -1.3 L 23.6 -.2 L 21.1 .3 L 19.1 .6 L 16.8 .4 L 15.1 -.2 L 13.2 -1.7 L 12.3 -3.8 L 12.9 -5.8 L 14.5 -6.9 L 16.3 -7.4 L 17.7 -7.5 L 19.0 -7.2 L 20.3 -6.4 L 21.8 -4.8","0 23.3 M 13.5 -7.1 L 13.1 -1.7 L 14.3 2.6 L 16.8 5.5 L 19.6 7.3 L 23.7 7.7 L 27.1 6.7 L 30.0 3.8 L 31.3 .6 L 31.8 -4.5 L 30.4 -8.6 L 28.1 -11.5 L 25.8 -12.8 L 22.8 -13.0 L 19.9 -11.9 L 17.5 -9.0 L 16.3 -6.0 L 16.3 -2.1 L 17.5 1.2 M 23.7 2.3 L 29.8 11.3","0 20.7 M 16.4 7.5 L 16.4 -12.1 L 18.8 -13.0 L 22.5 -12.9 L 25.8 -11.3 L 27.0 -9.0 L 27.3 -6.3 L 26.4 -4.0 L 24.8 -2.2 L 22.8 -1.0 L 20.2 .1 L 17.8 .1 L 14.6 -.2 L 12.9 -1.4 L 12.7 -3.0 L 13.5 -4.3 L 14.8 -4.9 L 16.8 -5.0 L 19.1 -4.4 L 20.8 -3.1 L 28.0 8.5 L 28.7 9.3 L 30.0 9.3","0 16.0 M 17.2 3.4 L 17.7 2.4 L 17.8 1.3 L 16.9 .3 L 15.4 .1 L 13.4 1.0 L 12.5 3.3 L 13.1 5.2 L 14.9 6.5 L 17.6 7.6 L 20.9 7.4 L 23.4 5.8 L 24.9 3.9 L 24.9 1.0 L 23.2 -1.3 L 21.4 -2.8 L 18.3 -4.4 L 15.7 -6.1 L 14.3 -7.5 L 14.0 -9.8 L 14.9 -11.7 L 17.6 -13.0 L 20.3 -13.1 L 22.0 -12.5 L 23.8 -11.3","0 17.7 M 12.0 -13.0 L 15.2 -11.5 L 18.9 -10.9 L 21.9 -10.6 L 25.1 -11.0 L 26.6 -11.7 L 26.9 -12.7 L 26.8 -13.4 L 25.7 -14.1 L 23.1 -14.1 L 20.7 -13.2 L 19.6 -12.2 L 18.9 -10.7 L 18.6 -2.9 L 18.6 7.6","0 22.3 M 13.5 -7.6 L 12.5 -8.5 L 12.0 -10.0 L 12.7 -12.0 L 14.4 -12.8 L 16.4 -12.7 L 17.3 -11.5 L 17.9 -9.8 L 15.8 2.1 L 16.2 4.2 L 17.6 6.4 L 19.5 7.7 L 21.9 7.8 L 24.0 6.5 L 25.8 3.9 L 27.3 .8 L 28.1 -2.0 L 28.1 -12.6 L 28.8 -12.8 L 28.0 -1.6 L 28.4 1.3 L 29.0 4.0 L 29.3 5.8 L 30.0 7.6 L 31.4 7.7","0 20.6 M 14.0 -8.5 L 12.2 -9.5 L 11.8 -11.4 L 13.4 -13.0 L 15.9 -12.8 L 17.0 -10.8 L 17.3 -8.3 L 17.5 1.5 L 18.1 5.0 L 19.7 7.1 L 21.3 7.9 L 22.8 7.4 L 23.9 5.8 L 24.6 4.4 L 29.8 -12.6","0 30.1 M 14.0 -8.4 L 12.5 -9.5 L 12.1 -11.3 L 13.2 -12.8 L 15.4 -12.9 L 16.9 -12.1 L 17.6 -10.4 L 17.6 1.7 L 18.0 3.7 L 18.9 6.0 L 20.0 7.4 L 21.1 7.6 L 22.3 7.5 L 23.6 6.5 L 24.9 4.7 L 25.9 2.7 L 26.5 -.8 L 26.8 -8.2 L 26.3 -8.5 L 26.6 1.6 L 27.4 3.8 L 28.8 6.4 L 30.4 7.4 L 32.2 7.3 L 33.6 6.0 L 34.6 3.4 L 34.9 1.1 L 34.9 -9.6 L 35.3 -11.7 L 36.8 -13.0 L 38.2 -13.1 L 39.0 -12.8 L 40.0 -12.1","0 21.3 M 14.2 -8.8 L 13.3 -8.9 L 12.4 -10.0 L 12.1 -11.2 L 13.2 -12.8 L 14.9 -13.0 L 16.7 -11.8 L 18.4 -9.4 L 25.2 5.4 L 26.9 7.4 L 29.0 7.8 L 30.0 6.8 L 30.4 5.8 L 30.2 4.3 L 29.3 3.4 L 28.2 3.4 M 27.1 -12.9 L 19.7 -.4 L 14.4 7.2","0 16.2 M 11.7 -13.0 L 13.5 -6.9 L 15.2 -4.0 L 17.1 -2.2 L 18.9 -1.9 L 20.8 -2.6 L 23.1 -5.1 L 24.9 -8.0 L 25.6 -10.7 L 25.8 -12.3 L 24.7 -13.1 L 23.3 -12.8 L 22.2 -11.4 L 20.9 -8.2 L 20.4 -4.4 L 19.7 -.5 L 19.7 5.0 L 20.0 9.7","0 17.4 M 13.1 -13.1 L 16.7 -12.1 L 19.7 -12.4 L 24.5 -13.0 L 24.5 -11.7 L 13.9 6.2 L 13.5 7.3 L 12.5 7.7 L 12.0 7.3 L 12.0 6.6 L 12.9 6.0 L 13.9 6.0 L 15.6 6.6 L 20.4 7.8 L 23.8 7.4 L 26.4 5.8 L 26.7 3.8 L 26.3 2.2 L 25.2 1.2 L 23.3 .9 L 22.0 1.7 L 21.7 3.0 L 21.9 4.2","0 9.5 M 19.1 -12.9 L 13.9 -12.9 L 13.9 13.8 L 19.1 13.8","0 9.7 M 13.0 -13.3 L 18.3 11.9","0 9.2 M 12.0 -12.7 L 17.2 -12.7 L 17.2 13.7 L 11.9 13.7","0 14.3 M 12.5 -3.5 L 17.8 -12.8 L 23.5 -3.3","0 15.8 M 12.4 13.8 L 24.6 13.8","0 7.5 M 13.3 -12.9 L 14.1 -11.4 L 15.8 -9.8","0 15.8 M 23.3 -3.6 L 21.3 -5.0 L 18.6 -6.0 L 15.6 -5.0 L 13.3 -2.0 L 12.7 .5 L 13.1 3.5 L 14.5 6.5 L 17.3 7.5 L 20.3 6.6 L 22.1 4.5 L 23.3 2.1 L 23.4 -5.6 L 23.4 5.9 L 23.7 7.0 L 24.2 7.4 L 24.9 7.4","0 15.3 M 13.4 -13.1 L 13.7 1.5 L 13.3 7.5 L 14.4 -2.2 L 17.1 -5.0 L 20.2 -5.7 L 22.4 -4.6 L 23.7 -1.9 L 23.9 2.1 L 22.9 5.5 L 21.2 6.9 L 17.9 7.6 L 15.6 6.7 L 14.6 5.7 L 14.0 4.1","0 14.2 M 23.3 -4.2 L 21.3 -5.6 L 18.4 -5.9 L 15.9 -5.1 L 13.8 -2.9 L 12.9 -.4 L 13.2 3.4 L 15.1 6.3 L 17.8 7.8 L 20.3 7.8 L 23.4 6.1","0 16.5 M 25.9 7.4 L 24.9 7.3 L 24.1 6.4 L 23.8 4.2 L 23.9 -2.8 L 21.6 -5.0 L 18.8 -5.8 L 16.0 -5.0 L 13.8 -3.1 L 12.8 -.2 L 12.9 2.4 L 13.4 4.5 L 15.3 6.8 L 17.9 7.7 L 20.2 6.9 L 22.2 4.9 L 23.1 3.4 L 23.8 1.3 L 24.2 -12.9","0 15.1 M 11.7 .1 L 15.5 1.1 L 19.5 1.4 L 22.1 .6 L 23.8 -1.6 L 23.4 -3.4 L 21.9 -5.2 L 18.8 -5.9 L 16.2 -5.0 L 14.4 -2.6 L 13.5 -.7 L 13.5 2.4 L 14.3 5.0 L 16.9 7.3 L 19.2 7.8 L 21.4 7.6 L 23.8 6.0","0 8.5 M 12.1 11.3 L 13.9 9.2 L 14.5 8.1 L 14.2 -9.3 L 14.8 -11.5 L 15.8 -12.7 L 16.9 -13.1 L 17.8 -13.0 L 19.4 -12.2 M 11.5 -5.5 L 18.6 -5.5","0 15.5 M 23.5 -3.1 L 20.8 -5.3 L 17.6 -5.7 L 14.9 -4.3 L 13.0 -1.6 L 12.7 2.1 L 13.6 5.3 L 15.1 7.1 L 17.4 7.7 L 19.3 7.1 L 21.1 5.7 L 22.5 3.5 L 23.5 1.0 L 23.5 -5.6 L 23.6 8.2 L 23.0 10.3 L 21.6 12.6 L 19.4 14.0 L 17.3 14.2 L 15.6 13.8 L 13.5 13.0","0 16.1 M 13.5 -12.9 L 13.8 7.6 L 13.3 7.0 L 14.3 -1.1 L 15.9 -3.6 L 17.9 -5.3 L 20.2 -5.9 L 21.9 -5.1 L 23.3 -4.1 L 23.7 -1.2 L 23.6 .3 L 23.6 6.5 L 24.2 7.3 L 25.4 7.5","0 5.6 M 13.7 -5.9 L 13.7 7.7 M 13.0 -12.0 L 13.0 -10.7 L 14.0 -10.6 L 13.9 -12.0 L 13.0 -12.0","0 5.7 M 13.5 -5.9 L 13.5 9.9 L 12.6 11.5 L 11.3 13.0 M 13.1 -11.7 L 13.2 -10.3 L 14.0 -10.5 L 14.1 -11.7 L 13.1 -11.7","0 14.1 M 13.4 -13.0 L 13.7 -5.3 L 13.6 1.3 L 13.4 7.7 L 13.6 -1.3 L 17.3 -4.8 L 20.3 -5.8 L 22.7 -3.9 L 22.4 -1.1 L 20.7 .2 L 19.2 1.3 L 17.7 1.7 L 16.9 1.3 L 16.8 .6 L 17.7 .7 L 18.5 1.6 L 21.6 6.4 L 22.4 7.6 L 23.3 7.5","0 5.9 M 13.7 -12.9 L 13.7 7.7","0 24.6 M 13.5 -5.5 L 13.9 6.8 L 13.6 7.7 L 13.2 7.4 L 13.6 1.4 L 15.2 -3.0 L 18.2 -5.8 L 21.3 -5.3 L 22.9 -2.9 L 23.3 -.9 L 23.6 7.2 L 23.0 8.0 L 22.7 7.7 L 23.6 -1.1 L 25.3 -3.9 L 28.0 -5.7 L 31.0 -4.9 L 32.4 -2.3 L 32.5 2.0 L 32.4 6.3 L 32.9 7.5 L 33.9 7.5","0 16.0 M 13.6 -5.7 L 14.1 7.5 L 13.4 7.7 L 13.2 6.6 L 14.1 -.7 L 16.6 -4.3 L 18.9 -5.7 L 21.7 -5.3 L 23.4 -3.4 L 24.0 -.4 L 23.8 6.5 L 24.3 7.4 L 25.1 7.4","0 15.7 M 18.7 -5.9 L 16.0 -5.4 L 13.5 -2.8 L 12.6 1.2 L 13.6 4.8 L 16.3 7.2 L 19.3 7.9 L 22.5 6.1 L 24.3 2.3 L 24.1 -1.6 L 22.2 -4.7 L 20.5 -5.6 L 18.7 -5.9","0 15.8 M 13.0 -5.4 L 13.6 3.8 L 13.9 13.4 L 12.9 14.0 L 13.6 1.9 L 14.0 -1.6 L 17.2 -5.0 L 20.4 -5.7 L 23.0 -4.3 L 24.5 -.4 L 23.9 3.5 L 22.4 6.4 L 19.7 7.5 L 16.8 7.5 L 13.5 5.5","0 15.2 M 23.1 -5.3 L 23.1 -.1 L 22.1 4.2 L 18.6 7.6 L 14.7 7.2 L 12.1 2.6 L 13.3 -2.8 L 16.4 -5.7 L 20.1 -5.7 L 22.9 -3.3 L 23.2 14.1","0 10.9 M 13.5 -5.4 L 13.5 7.4 L 13.5 -.8 L 16.2 -4.2 L 18.1 -5.7 L 19.6 -5.7 L 20.6 -4.8","0 12.3 M 20.7 -4.5 L 17.7 -5.9 L 15.0 -5.5 L 13.0 -3.3 L 13.7 -1.1 L 17.6 .6 L 20.9 2.4 L 21.4 4.4 L 20.2 6.6 L 16.9 7.7 L 13.7 6.9 L 12.3 5.6","0 9.1 M 14.6 -10.1 L 14.7 6.2 L 15.2 7.4 L 16.6 7.6 L 18.6 6.8 M 11.5 -5.4 L 18.5 -5.3","0 16.5 M 13.6 -5.6 L 13.7 -.6 L 13.7 3.7 L 14.7 6.4 L 17.1 7.7 L 19.4 7.4 L 21.8 5.0 L 23.5 2.3 L 23.4 -5.7 L 23.9 -5.9 L 24.0 -1.3 L 23.6 3.7 L 23.9 6.0 L 24.5 7.6 L 25.5 7.6","0 13.6 M 12.0 -5.8 L 17.1 7.5 L 17.9 7.6 L 23.0 -5.6","0 22.2 M 12.2 -5.7 L 16.6 7.6 L 17.4 7.6 L 21.8 -5.2 L 22.3 -5.1 L 26.4 7.4 L 26.9 7.4 L 31.7 -5.7","0 13.6 M 11.9 -5.7 L 13.2 -5.4 L 21.9 7.1 L 22.9 7.7 M 12.3 7.8 L 22.0 -5.9","0 15.9 M 13.4 -5.5 L 13.6 -4.7 L 13.8 4.4 L 14.7 6.4 L 16.5 7.7 L 18.7 7.7 L 21.4 5.6 L 22.9 3.5 L 23.8 .7 L 24.1 -5.5 L 23.9 -5.8 L 23.4 -5.3 L 23.8 8.6 L 22.9 11.6 L 20.8 13.4 L 18.9 14.2 L 15.9 14.0 L 13.2 12.8","0 13.0 M 12.5 -5.4 L 22.0 -5.4 L 12.3 7.4 L 22.7 7.4","0 8.1 M 16.8 -13.0 L 15.4 -12.4 L 15.2 -11.1 L 15.5 -3.6 L 15.1 -1.8 L 14.0 .4 L 12.5 1.7 L 11.6 1.5 L 11.4 .5 L 12.4 .0 L 13.6 .4 L 14.7 1.8 L 15.2 3.9 L 15.0 10.4 L 15.2 13.2 L 16.6 14.2","0 5.6 M 13.4 -14.4 L 13.4 15.5","0 8.1 M 12.5 -12.9 L 14.1 -12.4 L 14.5 -11.6 L 14.6 -9.5 L 14.3 -3.0 L 14.9 -1.4 L 15.8 .2 L 17.0 1.6 L 18.2 1.3 L 18.1 .2 L 17.0 -.1 L 15.5 .8 L 14.7 2.5 L 14.4 3.6 L 14.7 12.5 L 14.0 13.7 L 12.9 13.9","0 15.3 M 12.9 1.2 L 14.0 .3 L 15.4 -.3 L 17.2 -.2 L 18.9 .3 L 20.7 1.2 L 22.3 1.1 L 24.0 -.1","0 9.0 M 15.0 -11.9 L 13.3 -10.9 L 12.6 -8.4 L 13.1 -5.9 L 15.2 -4.7 L 17.6 -6.1 L 17.9 -8.8 L 17.0 -11.2 L 15.0 -11.9"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 7.5 M 12.6 -13.6 L 13.1 -11.5 L 12.8 -.5 M 12.3 5.4 L 12.1 6.9 L 13.4 6.9 L 13.7 5.4 L 12.3 5.4","0 9.6 M 12.0 -14.1 L 12.3 -13.3 L 12.3 -8.9 M 16.4 -14.1 L 16.4 -10.3 L 15.9 -8.9","0 19.9 M 14.0 3.8 L 15.9 -3.0 L 18.0 -10.6 L 18.4 -13.4 M 25.1 -13.7 L 24.3 -11.5 L 20.0 4.5 M 26.8 -1.3 L 21.7 -1.0 L 16.1 -1.0 L 11.1 -.3 M 11.7 -7.2 L 18.2 -7.7 L 23.8 -7.5 L 26.7 -7.8 L 27.5 -7.8","0 13.0 M 16.3 7.5 L 16.2 -8.6 L 15.9 -10.5 L 15.4 -12.7 L 15.4 -14.7 M 19.3 -8.9 L 19.2 -9.9 L 16.3 -12.2 L 14.8 -12.3 L 13.4 -11.6 L 12.3 -10.4 L 12.0 -8.8 L 12.7 -7.0 L 15.2 -4.4 L 18.2 -1.9 L 19.7 .2 L 19.7 2.1 L 18.2 3.8 L 16.9 4.5 L 15.4 4.7 L 13.8 4.6 L 12.2 3.0 L 11.4 1.6 L 11.5 .6","0 17.9 M 14.5 5.1 L 20.3 -9.0 L 22.0 -12.3 L 18.2 -11.4 L 15.4 -10.7 L 13.6 -10.7 L 12.8 -11.0 L 11.5 -9.9 L 11.0 -7.3 L 11.2 -5.3 L 12.3 -4.0 L 13.5 -4.2 L 14.8 -5.7 L 14.9 -8.1 L 14.7 -9.5 L 14.1 -10.5 M 23.3 -3.5 L 21.9 -2.7 L 21.0 -.7 L 20.6 1.0 L 20.8 3.0 L 21.4 4.1 L 22.8 4.4 L 23.9 3.9 L 25.0 1.9 L 25.4 -.3 L 25.1 -2.1 L 24.7 -2.9 L 23.3 -3.5","0 23.1 M 20.3 -11.8 L 19.9 -10.2 L 19.6 -9.1 L 20.0 -8.6 L 19.0 -10.0 L 17.7 -10.4 L 16.6 -10.1 L 15.6 -9.5 L 15.4 -8.2 L 15.6 -7.3 L 16.4 -6.4 L 18.0 -6.1 L 17.1 -6.5 L 14.6 -5.5 L 12.5 -3.8 L 11.9 -2.1 L 11.6 1.2 L 12.8 4.0 L 15.0 5.6 L 17.3 6.2 L 19.9 6.1 L 22.2 5.1 L 23.8 3.1 L 24.1 1.5 L 23.5 -.1 L 21.9 -2.2 M 16.7 .3 L 17.1 -.9 L 18.3 -1.7 L 20.2 -2.2 L 22.9 -2.6 L 25.1 -3.1 L 28.0 -3.9 L 30.0 -5.2 L 31.0 -6.8 L 30.6 -8.3 L 29.9 -9.0 L 28.8 -9.4 L 27.4 -9.0","0 5.2 M 11.7 -15.5 L 11.7 -8.7","0 9.4 M 17.0 10.0 L 14.5 6.6 L 12.7 2.6 L 11.9 -1.5 L 11.7 -5.7 L 12.2 -9.7 L 13.7 -13.2 L 15.6 -15.2 L 17.5 -16.4","0 9.0 M 11.5 9.2 L 13.5 6.5 L 15.0 3.2 L 15.8 .1 L 15.9 -3.1 L 15.9 -6.9 L 15.0 -10.3 L 13.6 -13.0 L 11.5 -15.9 L 10.4 -17.3","0 13.6 M 16.4 -2.4 L 16.6 -15.3 M 11.4 -4.1 L 20.7 -12.7 M 11.3 -12.7 L 18.9 -5.9 L 20.3 -4.1","0 17.2 M 18.3 4.4 L 18.5 4.4 L 17.7 -9.4 M 11.2 -1.9 L 14.9 -1.9 L 19.8 -2.2 L 22.5 -2.6 L 24.8 -2.9","0 6.7 M 13.0 6.2 L 11.8 6.2 L 12.0 4.7 L 13.4 4.8 L 13.5 7.6 L 12.0 10.0","0 13.1 M 12.2 -.2 L 12.4 -.2 L 15.3 -.8 L 17.3 -.6 L 19.3 -1.1","0 6.4 M 12.0 4.9 L 11.8 6.4 L 13.2 6.4 L 13.4 5.0 L 12.0 4.9","0 9.8 M 11.7 5.3 L 15.2 -6.6 L 16.6 -13.0","0 12.5 M 15.5 -.1 L 17.0 -.1 L 18.9 -1.3 L 20.1 -3.9 L 20.1 -5.6 L 18.4 -8.0 L 16.3 -9.2 L 14.1 -9.2 L 12.7 -7.9 L 12.1 -6.2 L 12.0 -4.0 L 12.7 -2.0 L 13.5 -.8 L 15.6 .0","0 11.4 M 16.9 5.9 L 17.2 -11.6 L 17.5 -10.2 L 15.6 -8.9 L 13.9 -7.8 L 12.2 -7.2 L 10.3 -7.1","0 13.4 M 14.1 -8.8 L 14.6 -7.7 L 14.0 -6.3 L 12.7 -5.8 L 11.6 -6.3 L 11.1 -8.1 L 11.2 -10.6 L 13.0 -13.3 L 15.3 -14.1 L 17.4 -13.4 L 18.7 -11.3 L 18.9 -9.0 L 18.5 -5.9 L 17.2 -1.7 L 15.5 1.8 L 14.0 4.3 L 13.0 6.1 L 21.5 5.2","0 12.9 M 15.1 2.0 L 14.6 .7 L 12.6 .8 L 11.4 1.5 L 10.9 3.4 L 11.3 5.1 L 12.8 6.5 L 14.9 6.7 L 17.4 5.1 L 18.6 2.6 L 18.8 -.1 L 18.1 -3.1 L 17.0 -4.7 L 15.5 -5.6 L 14.1 -5.5 L 13.5 -5.2 L 12.8 -4.4 L 14.8 -6.3 L 18.1 -10.2 L 20.3 -12.6 L 16.6 -12.5 L 13.5 -12.7","0 13.1 M 20.9 2.8 L 10.7 4.8 L 15.1 -6.2 L 17.1 -12.9 M 17.9 -7.7 L 17.9 1.9 L 18.0 6.8 L 17.9 10.1","0 12.3 M 14.3 4.0 L 14.0 3.2 L 13.0 3.2 L 11.9 4.0 L 11.9 5.9 L 13.0 7.5 L 15.4 7.6 L 18.0 5.9 L 19.0 3.6 L 19.3 1.4 L 18.3 -.6 L 16.7 -2.7 L 15.5 -3.0 L 14.0 -2.4 L 13.0 -1.6 L 12.3 -.6 L 12.0 .5 L 12.3 -5.9 L 12.4 -7.4 L 12.1 -11.3 L 15.0 -10.9 L 18.4 -11.3","0 14.5 M 14.6 6.4 L 14.9 3.7 L 16.3 1.6 L 18.0 1.1 L 19.9 2.7 L 20.4 4.8 L 19.6 6.5 L 18.3 7.4 L 16.0 7.4 L 14.0 5.6 L 12.3 2.3 L 12.0 -1.9 L 13.1 -5.9 L 15.4 -8.7 L 17.5 -10.4 L 19.3 -10.6 L 21.0 -10.1 L 22.7 -9.0","0 13.1 M 12.7 8.1 L 18.0 -6.3 L 19.5 -9.4 L 20.5 -10.6 L 21.3 -11.2 L 17.0 -10.8 L 13.0 -10.5 L 10.7 -11.0 M 13.6 -4.4 L 20.4 -3.2","0 14.0 M 15.9 6.5 L 19.0 5.5 L 20.0 4.5 L 20.3 3.6 L 21.2 3.0 L 21.2 1.7 L 21.8 .2 L 20.9 -3.0 L 19.4 -5.2 L 18.3 -6.4 L 17.0 -6.5 L 15.3 -6.5 L 14.4 -7.8 L 14.4 -9.9 L 15.9 -11.6 L 17.6 -11.6 L 19.3 -10.8 L 20.2 -9.4 L 20.3 -7.6 L 19.5 -6.7 L 18.2 -6.2 L 15.2 -6.2 L 13.6 -5.0 L 12.2 -2.7 L 11.9 -.5 L 12.0 2.0 L 12.6 3.9 L 13.7 5.6 L 15.9 6.5","0 13.9 M 11.6 3.8 L 11.8 3.8 L 12.4 5.4 L 14.3 6.2 L 17.0 5.2 L 19.3 2.9 L 20.4 -.8 L 20.1 -5.6 L 18.0 -9.4 L 17.0 -10.6 L 15.7 -11.1 L 13.8 -10.5 L 12.7 -9.0 L 12.1 -7.3 L 12.5 -5.2 L 13.6 -4.0 L 15.2 -3.7 L 16.9 -4.4 L 18.0 -5.5 L 18.9 -7.9","0 7.8 M 12.4 -5.8 L 12.2 -4.3 L 13.6 -4.3 L 13.8 -5.7 L 12.4 -5.8 M 12.6 4.9 L 12.4 6.4 L 13.8 6.4 L 14.0 4.9 L 12.6 4.9","0 8.1 M 13.0 -5.3 L 12.8 -3.9 L 14.1 -3.9 L 14.4 -5.3 L 13.0 -5.3 M 135.2 7.1 L 135.1 8.6 L 136.4 8.6 L 136.6 7.1 L 135.2 7.1 M 13.5 6.3 L 12.3 6.3 L 12.5 4.9 L 13.9 4.9 L 14.0 7.8 L 12.5 10.1","0 17.2 M 23.3 5.4 L 11.4 1.2 L 23.9 -6.4","0 18.7 M 12.2 2.6 L 20.8 2.8 L 24.6 2.6 M 24.3 -3.2 L 20.7 -2.8 L 16.1 -3.0 L 12.6 -3.2","0 18.0 M 12.1 -4.9 L 18.0 -2.5 L 22.7 -1.0 L 25.4 .1 L 20.7 2.3 L 15.4 4.5 L 12.6 5.5","0 12.3 M 13.6 -.6 L 14.1 -8.3 L 14.3 -6.8 L 15.4 -6.6 L 18.0 -8.4 L 19.2 -12.2 L 18.7 -15.4 L 17.3 -17.5 L 15.3 -18.4 L 13.0 -17.3 L 12.1 -16.4 L 11.7 -15.5 L 11.6 -13.6 L 11.2 -12.4 L 11.9 -11.4 L 13.1 -12.1 L 13.3 -13.4","0 21.9 M 25.4 5.8 L 20.6 6.6 L 16.6 5.7 L 13.1 1.6 L 12.4 -4.2 L 14.9 -9.4 L 18.2 -12.3 L 21.7 -13.1 L 25.0 -12.2 L 27.5 -10.1 L 29.4 -7.4 L 29.7 -5.0 L 28.2 -2.0 L 26.6 -.2 L 24.6 .7 L 23.7 .0 L 22.9 -1.5 L 22.9 -3.8 L 23.1 -5.6 L 22.4 -6.8 L 21.3 -7.2 L 20.0 -6.3 L 19.1 -4.3 L 18.6 -2.9 L 18.6 -1.2 L 18.8 .0 L 19.4 .6 L 20.2 .2 L 21.0 -1.1 L 23.0 -4.1","0 18.9 M 9.3 9.8 L 11.8 9.7 L 13.8 10.2 L 11.7 9.7 L 16.4 -9.4 L 18.2 -13.9 L 18.4 -14.7 L 21.6 -5.3 L 24.6 3.1 L 25.1 5.2 L 12.8 5.2 L 25.0 5.1 L 26.6 10.3 L 24.2 10.8 L 28.6 10.1","0 15.6 M 12.5 8.0 L 17.0 6.3 L 20.2 4.1 L 21.0 2.4 L 20.8 .7 L 19.7 -.9 L 18.7 -1.9 L 17.2 -2.3 L 14.0 -1.7 L 17.3 -2.4 L 20.7 -4.6 L 22.4 -7.2 L 22.9 -9.9 L 22.6 -12.6 L 21.6 -14.7 L 19.3 -16.6 L 16.7 -17.5 L 13.5 -17.3 L 9.2 -17.0 L 12.8 -17.0 L 14.3 7.6","0 22.2 M 30.1 2.5 L 28.1 4.8 L 25.3 6.4 L 22.5 6.7 L 19.2 6.3 L 15.8 4.4 L 13.7 1.9 L 12.0 -1.9 L 11.9 -6.0 L 13.6 -10.9 L 16.4 -14.3 L 19.6 -15.6 L 22.8 -16.2 L 25.9 -15.8 L 29.2 -13.7 L 29.6 -15.7 L 29.0 -13.7 L 29.3 -11.6","0 19.6 M 9.7 -17.6 L 13.4 -17.8 L 18.3 -17.3 L 22.1 -15.7 L 24.7 -12.6 L 26.0 -9.2 L 26.5 -5.7 L 25.5 -2.3 L 23.0 .9 L 20.0 3.0 L 17.1 4.5 L 12.9 5.2 L 15.8 4.9 L 14.5 -13.0 L 14.1 -17.7","0 16.1 M 23.8 5.7 L 23.7 8.6 L 23.8 7.4 L 13.1 7.6 L 11.4 8.0 L 13.5 7.6 L 13.3 .3 L 16.6 .1 L 20.1 .3 L 20.7 -1.5 L 20.3 1.6 L 20.1 .4 L 15.7 .0 L 13.3 .1 L 13.5 -8.2 L 13.2 -15.5 L 11.4 -15.7 L 13.7 -15.3 L 18.8 -15.3 L 23.9 -15.3 L 23.8 -13.3 L 24.1 -17.6","0 15.7 M 13.4 8.5 L 15.8 7.8 L 16.6 7.8 L 15.4 7.7 L 14.9 .9 L 21.5 .3 L 21.7 2.0 L 21.5 -.6 L 21.5 .3 L 14.9 .9 L 13.6 -14.6 L 13.6 -14.0 L 10.0 -14.1 L 17.4 -14.2 L 23.2 -14.3 L 23.2 -16.0 L 23.3 -12.0 L 23.5 -11.3","0 16.9 M 23.2 -16.5 L 23.0 -13.5 L 23.1 -14.4 L 23.6 -14.2 L 22.5 -14.7 L 21.1 -15.7 L 18.4 -16.0 L 16.1 -15.0 L 13.8 -12.5 L 12.4 -8.3 L 12.3 -4.1 L 12.5 .1 L 14.4 3.0 L 16.9 4.1 L 20.2 3.2 L 22.1 1.1 L 23.1 -1.9 L 23.3 -7.5 L 24.7 -7.3 L 19.6 -7.5","0 19.2 M 12.1 7.7 L 14.8 6.7 L 13.6 7.2 L 13.2 -1.2 L 11.9 -15.0 L 10.4 -14.7 L 11.9 -14.9 L 13.1 -15.3 M 25.0 8.5 L 24.2 8.7 L 21.5 9.0 L 23.0 8.8 L 24.4 -7.0 L 24.9 -11.9 L 25.8 -16.1 L 27.2 -16.1 L 24.3 -16.3 M 23.7 .6 L 13.4 .4","0 9.2 M 12.4 7.3 L 15.3 6.4 L 17.5 6.3 L 15.2 6.2 L 13.7 -3.8 L 13.2 -13.8 L 14.9 -14.1 L 15.7 -13.9 L 14.7 -14.1 L 10.3 -13.2","0 13.5 M 12.4 6.2 L 11.1 5.8 L 9.4 6.9 L 8.8 8.8 L 10.2 11.3 L 13.0 11.9 L 16.2 11.1 L 18.6 8.8 L 19.8 5.8 L 19.8 2.5 L 18.8 -3.4 L 16.6 -14.8 L 14.1 -14.0 L 19.6 -15.5","0 21.1 M 12.4 9.5 L 15.7 8.6 L 14.3 9.0 L 13.8 -2.4 L 13.3 -6.2 L 13.0 -14.9 L 14.9 -15.2 L 10.4 -14.6 M 28.6 -14.0 L 24.8 -14.4 L 26.6 -14.1 L 22.8 -9.9 L 19.0 -5.2 L 15.6 -2.0 L 14.2 -1.6 L 16.7 -2.4 L 19.1 -2.5 L 20.8 -1.6 L 22.1 .4 L 23.4 2.6 L 25.9 6.2 L 27.8 7.6 L 29.7 7.2 L 30.9 5.9 L 31.1 5.1 L 30.5 3.6 L 29.6 2.8 L 28.7 3.4","0 13.0 M 21.2 5.7 L 20.5 9.6 L 20.8 8.0 L 16.7 7.6 L 12.7 7.6 L 10.6 8.0 L 12.8 7.6 L 12.8 -6.3 L 12.7 -11.2 L 12.9 -16.6 L 11.5 -16.6 L 14.4 -16.7","0 29.2 M 9.3 6.6 L 14.1 6.1 L 12.6 6.2 L 14.5 -10.5 L 15.1 -18.5 L 21.1 .7 L 26.5 -6.7 L 29.3 -11.0 L 31.1 -14.5 L 32.7 -17.8 L 32.9 -19.1 L 32.4 -14.5 L 33.2 -7.8 L 33.9 -1.2 L 34.7 6.2 L 38.3 5.5 L 32.1 6.7","0 17.9 M 10.8 8.2 L 15.8 7.4 L 13.6 7.6 L 13.3 -3.0 L 12.9 -6.6 L 12.9 -14.5 L 17.6 -5.3 L 23.3 3.6 L 23.6 -7.2 L 24.0 -12.6 L 24.9 -16.8 L 27.0 -16.6 L 22.9 -17.0","0 20.6 M 22.0 -14.4 L 20.4 -15.1 L 16.0 -13.7 L 13.2 -10.5 L 11.9 -5.9 L 12.2 -1.4 L 14.2 2.0 L 17.9 3.8 L 21.7 3.6 L 25.5 .8 L 26.9 -1.4 L 27.9 -4.1 L 27.8 -7.3 L 26.7 -10.9 L 25.4 -13.1 L 23.8 -14.3 L 22.1 -14.4","0 14.9 M 12.2 7.3 L 15.9 6.8 L 14.0 7.1 L 14.4 -10.1 L 14.0 -12.3 L 13.6 -14.8 L 12.4 -16.4 L 9.7 -16.4 L 16.9 -16.2 L 19.5 -15.3 L 21.5 -13.1 L 22.5 -10.5 L 22.4 -7.8 L 21.7 -5.5 L 19.2 -3.4 L 16.4 -2.8 L 14.4 -2.8","0 21.1 M 24.2 5.3 L 26.9 2.0 L 27.1 .9 L 27.8 -.3 L 28.1 -2.8 L 27.2 -6.9 L 26.4 -9.1 L 24.2 -11.0 L 23.0 -11.1 L 21.1 -11.9 L 16.1 -10.5 L 13.3 -7.1 L 12.3 -3.9 L 12.0 .2 L 13.1 3.6 L 14.8 5.4 L 17.3 6.9 L 20.4 7.1 L 22.3 6.5 L 24.0 5.1 L 21.5 2.1 L 29.2 10.3 L 31.4 10.7 L 32.5 9.7 L 32.7 8.7 L 32.4 7.6 L 31.6 6.8 L 30.6 6.7 L 30.5 7.3","0 20.0 M 12.6 10.6 L 16.6 9.7 L 14.7 10.2 L 14.4 -1.7 L 14.0 -7.3 L 14.7 -14.9 L 10.1 -14.0 L 17.0 -15.1 L 21.3 -15.0 L 23.3 -13.8 L 24.8 -11.6 L 25.0 -9.2 L 24.6 -6.9 L 22.8 -5.0 L 20.4 -3.8 L 18.3 -3.1 L 14.5 -2.9 L 19.8 -3.1 L 21.3 -2.1 L 22.7 .5 L 24.1 4.4 L 25.3 8.5 L 27.0 11.5 L 28.9 12.4 L 31.0 11.8 L 32.1 10.8 L 32.1 9.3 L 31.7 8.1 L 30.5 7.0 L 29.6 7.4 L 29.3 8.1","0 13.5 M 14.9 3.1 L 14.6 1.6 L 12.8 .8 L 11.0 1.5 L 10.3 3.6 L 10.8 5.4 L 12.2 7.3 L 14.5 8.2 L 17.4 6.9 L 19.5 4.4 L 20.1 2.2 L 19.9 .2 L 17.9 -3.7 L 14.6 -8.8 L 13.5 -11.4 L 13.5 -14.1 L 14.9 -16.2 L 15.8 -16.9 L 17.3 -17.1 L 18.7 -16.4 L 20.7 -14.5 L 21.5 -15.8 L 19.6 -12.1","0 17.8 M 17.0 8.6 L 21.7 8.1 L 19.6 8.3 L 18.5 -13.4 L 25.5 -13.6 L 25.6 -12.5 L 25.5 -13.6 L 26.0 -15.7 L 25.5 -13.6 L 10.8 -12.9 L 11.0 -15.3 L 10.9 -12.7 L 10.6 -10.7","0 18.4 M 10.2 -17.0 L 14.4 -17.6 L 12.2 -17.2 L 13.0 -7.2 L 14.0 .7 L 15.4 3.6 L 17.8 4.4 L 20.1 3.8 L 22.1 2.4 L 23.9 -1.2 L 24.5 -4.5 L 24.4 -16.5 L 22.7 -16.6 L 26.3 -16.8","0 17.7 M 10.8 -14.2 L 13.1 -14.7 L 11.8 -14.5 L 14.9 -5.9 L 16.8 2.1 L 17.7 5.9 L 18.9 2.5 L 19.7 .7 L 21.5 -6.1 L 22.5 -9.4 L 23.7 -12.8 L 25.5 -16.4 L 23.6 -16.7 L 25.4 -16.3 L 27.8 -16.4","0 25.1 M 10.4 -13.8 L 13.0 -14.1 L 14.9 -14.7 L 12.4 -14.0 L 14.0 -6.9 L 14.5 -3.4 L 15.9 2.3 L 16.1 4.8 L 17.3 .6 L 18.5 -2.1 L 20.0 -8.7 L 20.3 -10.5 L 21.0 -11.7 L 21.3 -13.0 L 21.9 -9.6 L 23.5 -3.4 L 26.4 7.1 L 27.5 1.1 L 28.7 -4.1 L 28.7 -5.9 L 29.5 -7.7 L 30.5 -9.9 L 30.7 -13.0 L 31.7 -16.7 L 29.8 -16.6 L 34.4 -16.5","0 19.3 M 9.9 7.9 L 13.7 7.6 L 11.9 7.7 L 21.8 -8.0 L 22.9 -10.4 L 26.8 -16.1 L 28.4 -16.0 L 24.5 -16.4 M 10.2 -15.6 L 15.3 -16.5 L 13.1 -16.1 L 14.1 -11.6 L 16.5 -6.1 L 19.4 -.1 L 21.6 4.5 L 22.2 6.2 L 24.4 8.4 L 25.7 9.0 L 27.6 8.8 L 28.6 7.9 L 28.8 6.2 L 28.0 5.2 L 27.1 5.3","0 18.8 M 10.7 -16.7 L 13.7 -17.4 L 12.1 -17.0 L 14.9 -10.4 L 16.1 -7.7 L 18.5 -4.3 L 18.0 8.9 L 16.4 9.0 L 15.0 9.2 L 18.0 8.9 L 20.3 9.0 M 18.4 -4.4 L 22.8 -10.8 L 24.2 -13.4 L 26.9 -18.0 L 24.8 -18.5 L 28.7 -17.5 L 29.0 -17.3","0 16.4 M 10.3 -10.6 L 10.7 -14.4 L 10.7 -13.7 L 17.2 -14.1 L 24.4 -14.4 L 23.6 -14.4 L 21.7 -12.0 L 17.9 -4.6 L 15.4 -5.2 L 18.0 -4.6 L 20.5 -4.5 L 17.9 -4.5 L 13.9 4.7 L 12.0 8.0 L 23.2 6.6 L 23.3 4.8 L 23.2 8.1","0 10.0 M 18.1 8.8 L 14.3 9.1 L 14.3 3.2 L 13.1 -3.4 L 12.7 -8.7 L 12.7 -15.8 L 17.2 -15.9","0 11.1 M 18.5 4.8 L 14.8 -3.0 L 13.7 -6.9 L 11.6 -11.8","0 8.0 M 11.0 10.5 L 13.1 10.4 L 13.5 10.0 L 13.6 -5.3 L 13.9 -14.9 L 11.2 -14.8","0 12.2 M 11.1 -.9 L 15.2 -14.1 L 17.2 -8.3 L 18.9 -1.7","0 15.6 M 11.0 7.5 L 23.2 7.6","0 6.7 M 10.6 -18.2 L 14.8 -15.0","0 12.3 M 12.0 -4.1 L 11.5 -6.1 L 12.4 -7.6 L 14.4 -8.9 L 17.0 -8.3 L 18.4 -6.1 L 18.8 -3.4 L 18.9 .7 L 18.4 2.3 L 16.4 3.7 L 14.3 4.8 L 12.4 5.1 L 10.9 4.2 L 10.8 2.0 L 11.6 .6 L 13.8 .0 L 16.6 .0 L 17.4 .2 L 18.6 1.5 L 19.0 2.8 L 19.1 4.8 L 19.1 7.0 L 19.2 7.8 L 20.3 8.0 L 20.9 8.0 L 21.6 8.0 L 22.4 7.6","0 15.0 M 9.4 -18.7 L 14.2 -19.1 L 11.9 -18.8 L 13.0 7.3 L 15.9 8.2 L 18.9 7.6 L 21.4 5.2 L 22.3 2.8 L 22.0 .2 L 21.0 -1.7 L 19.2 -2.9 L 16.3 -2.3 L 14.6 -.9 L 13.5 .8 L 12.8 2.6 L 13.2 8.2 L 11.7 8.6 L 11.0 9.0","0 12.5 M 18.8 -2.9 L 19.6 -7.5 L 19.3 -5.8 L 17.5 -7.1 L 15.7 -7.4 L 13.4 -6.2 L 12.0 -3.1 L 11.6 -.1 L 12.4 2.3 L 14.5 4.5 L 17.1 4.8 L 18.7 4.0 L 19.3 3.3","0 14.4 M 22.8 7.1 L 20.4 7.3 L 19.1 7.7 L 20.4 7.2 L 20.4 -.6 L 20.0 -4.0 L 19.1 -5.1 L 17.2 -5.3 L 14.8 -4.6 L 13.1 -2.8 L 11.9 -.1 L 11.7 2.6 L 12.3 4.6 L 13.8 6.0 L 15.3 6.0 L 17.4 4.4 L 18.6 2.7 L 19.6 .2 L 20.2 -3.1 L 20.9 -19.2 L 17.2 -18.9","0 11.0 M 18.5 5.6 L 17.3 7.3 L 15.1 8.0 L 12.8 6.5 L 11.8 2.6 L 12.1 -1.9 L 13.6 -5.8 L 14.7 -6.5 L 16.2 -6.3 L 17.3 -5.2 L 18.7 -1.7 L 15.5 -1.5 L 12.2 -1.4","0 9.2 M 11.5 13.7 L 17.5 12.6 L 14.6 13.0 L 13.7 1.5 L 13.5 -5.7 L 16.7 -5.8 L 17.6 -6.2 L 15.9 -5.8 L 11.5 -5.7 L 11.1 -5.8 L 13.7 -5.7 L 13.9 -12.2 L 14.4 -15.7 L 15.5 -17.6 L 17.6 -18.6 L 19.8 -18.7 L 21.7 -17.4 L 22.5 -16.3 L 22.6 -15.5","0 13.4 M 16.7 .1 L 18.4 -1.4 L 19.4 -4.0 L 19.8 -4.4 L 22.2 -5.3 L 19.5 -4.4 L 18.0 -6.4 L 16.1 -7.8 L 14.9 -7.9 L 12.3 -6.2 L 11.3 -3.2 L 12.0 -.9 L 13.4 .2 L 14.8 .4 L 15.9 .2 L 17.1 -.1 L 17.5 3.4 L 17.5 6.5 L 19.6 8.4 L 20.9 10.1 L 21.5 13.0 L 21.4 14.9 L 19.0 17.3 L 15.4 18.8 L 11.8 18.5 L 9.2 16.7 L 7.9 14.0 L 8.4 10.3 L 9.7 8.0 L 11.1 6.5 L 13.9 5.6 L 15.6 5.7 L 17.5 6.5","0 14.2 M 10.8 8.7 L 15.3 7.4 L 13.1 8.1 L 12.3 -8.6 L 11.9 -19.3 L 12.6 -19.5 L 11.9 -19.1 L 10.0 -19.1 M 12.6 -3.0 L 14.4 -5.3 L 16.9 -6.5 L 18.6 -6.1 L 19.7 -4.6 L 20.3 -1.6 L 20.5 1.0 L 20.6 7.6 L 18.7 8.1 L 22.8 7.2","0 8.2 M 10.5 5.4 L 10.6 5.4 L 15.7 4.8 L 13.3 5.0 L 13.7 -6.8 L 11.5 -6.8 M 12.2 -15.1 L 12.2 -13.9 L 13.5 -13.7 L 13.5 -15.1 L 12.2 -15.1","0 8.4 M 9.7 14.0 L 8.4 13.9 L 7.5 15.2 L 7.9 17.1 L 9.8 18.3 L 12.4 17.7 L 14.9 14.9 L 15.3 11.9 L 14.6 .3 L 14.8 -6.8 L 12.7 -6.1 L 10.3 -5.6 M 13.3 -15.1 L 12.4 -14.5 L 13.7 -13.7 L 15.2 -14.5 L 13.3 -15.1","0 14.6 M 10.7 7.9 L 15.2 7.0 L 13.0 7.4 L 12.4 -10.0 L 12.5 -21.3 L 14.6 -21.8 L 10.3 -21.1 M 22.9 -8.3 L 19.8 -8.5 L 20.9 -7.7 L 18.6 -5.5 L 13.1 -1.7 L 16.3 -3.6 L 19.4 2.4 L 21.3 6.5 L 23.5 9.9 L 25.1 10.4 L 26.8 9.7 L 27.7 8.3 L 27.4 6.6 L 26.4 6.0 L 25.7 6.1 L 25.4 6.7","0 7.1 M 10.9 11.1 L 11.2 11.1 L 15.2 9.5 L 13.1 10.4 L 12.4 -7.5 L 12.8 -17.1 L 14.5 -17.6 L 12.5 -16.8 L 10.7 -16.8","0 23.5 M 11.9 8.3 L 13.8 7.6 L 16.3 7.2 L 13.7 7.6 L 13.6 -1.5 L 12.9 -7.2 L 14.3 -7.6 L 10.5 -6.8 L 13.0 -7.2 L 13.9 -.3 L 15.7 -3.9 L 18.8 -6.2 L 20.3 -6.4 L 21.1 -5.3 L 21.5 -1.2 L 21.5 2.1 L 22.5 -2.3 L 24.6 -5.8 L 26.8 -7.6 L 28.5 -7.8 L 29.3 -5.7 L 29.6 -1.4 L 29.4 5.9 L 27.2 6.7 L 32.1 5.6","0 16.2 M 10.9 8.6 L 15.1 8.0 L 13.3 8.2 L 13.2 1.9 L 13.7 -3.1 L 13.9 -8.7 L 13.0 -9.3 L 10.5 -9.1 M 13.7 -2.5 L 16.8 -6.0 L 19.3 -7.3 L 21.0 -6.1 L 22.2 -4.2 L 22.5 -1.9 L 22.6 3.5 L 21.3 3.8 L 24.4 3.2","0 13.8 M 17.6 -8.0 L 15.7 -8.4 L 13.1 -7.5 L 12.0 -5.4 L 12.1 -2.5 L 13.2 -.6 L 15.8 .7 L 19.2 -.4 L 20.6 -2.9 L 20.7 -5.9 L 19.5 -7.5 L 17.9 -7.5","0 15.8 M 12.2 18.1 L 15.6 17.6 L 16.8 17.2 L 15.0 17.6 L 14.5 10.6 L 13.0 .6 L 12.9 -4.7 L 14.8 -8.1 L 18.5 -10.0 L 21.6 -8.9 L 22.8 -5.7 L 22.3 -2.3 L 20.8 .1 L 17.9 1.1 L 15.7 .5 L 13.7 -1.3 L 12.9 -4.3 L 12.5 -9.0 L 12.5 -12.2 L 13.8 -12.7 L 10.4 -11.6","0 15.3 M 22.3 -11.3 L 21.2 -4.5 L 19.8 -2.3 L 17.9 -.8 L 15.3 -.4 L 13.0 -1.7 L 11.9 -3.9 L 12.1 -7.1 L 14.6 -9.1 L 17.1 -9.4 L 19.6 -7.8 L 20.8 -6.3 L 20.9 -2.6 L 20.8 2.9 L 19.6 15.5 L 20.3 13.1 L 22.8 10.7 L 23.9 8.6","0 13.1 M 11.9 7.8 L 14.2 7.1 L 16.0 6.6 L 13.6 7.3 L 13.0 1.4 L 13.0 -3.8 L 12.6 -8.6 L 10.5 -8.2 L 12.6 -8.5 L 13.4 -3.2 L 15.1 -6.4 L 17.8 -8.6 L 19.7 -9.1 L 20.7 -8.2 L 21.3 -7.1 L 21.0 -5.7 L 20.4 -5.1 L 19.5 -5.1","0 10.8 M 12.1 7.8 L 11.3 6.7 L 10.2 6.7 L 9.3 8.0 L 9.8 10.3 L 11.1 11.7 L 13.5 12.0 L 15.7 10.8 L 17.0 9.0 L 17.2 5.8 L 15.6 1.4 L 13.3 -3.5 L 12.7 -7.3 L 14.1 -10.0 L 16.2 -10.6 L 17.7 -10.1 L 18.5 -9.1 L 19.5 -10.2 L 17.4 -6.9","0 11.1 M 17.4 4.4 L 18.5 3.4 L 19.7 4.0 L 19.9 5.4 L 19.3 7.1 L 17.2 8.1 L 15.4 7.8 L 13.8 5.8 L 13.6 1.8 L 13.2 -7.7 L 10.8 -7.3 L 16.2 -8.0 L 13.2 -7.7 L 13.0 -13.8","0 16.1 M 10.6 -9.3 L 13.9 -9.3 L 12.8 -9.0 L 12.4 -2.4 L 12.4 1.5 L 13.3 3.3 L 14.2 4.4 L 14.9 4.5 L 16.2 2.8 L 17.4 1.4 L 17.7 -.3 L 20.0 -3.8 L 21.2 -6.2 L 21.6 -8.6 L 21.7 .2 L 22.1 5.7 L 20.7 6.2 L 22.2 5.7 L 24.5 5.4","0 15.4 M 10.0 -8.9 L 12.5 -9.7 L 11.7 -9.3 L 16.6 5.4 L 19.7 -.6 L 20.9 -4.4 L 22.8 -9.2 L 21.0 -9.1 L 25.0 -9.1","0 21.5 M 9.4 -9.1 L 11.8 -9.5 L 13.3 -10.1 L 11.4 -9.4 L 14.5 1.7 L 14.9 5.4 L 15.8 1.9 L 16.4 -1.1 L 18.5 -6.1 L 18.9 -7.2 L 19.4 -4.5 L 21.6 2.3 L 22.5 5.4 L 23.0 6.5 L 23.8 6.2 L 25.0 2.0 L 26.7 -3.1 L 27.3 -4.7 L 27.9 -8.0 L 26.5 -8.8 L 28.0 -8.0 L 30.0 -8.2 L 30.7 -8.6","0 15.8 M 9.9 -7.3 L 10.0 -7.5 L 13.0 -8.0 L 11.8 -7.7 L 17.5 2.8 L 20.9 7.7 L 22.6 9.5 L 24.1 9.8 L 25.1 9.2 L 25.4 8.4 L 25.6 7.5 L 25.0 6.3 L 24.1 6.6 M 9.4 10.0 L 9.7 10.0 L 13.3 9.8 L 11.5 9.8 L 16.6 1.0 L 22.6 -9.1 L 20.9 -9.7 L 24.3 -8.7","0 14.5 M 9.8 13.3 L 8.9 12.2 L 7.1 12.2 L 6.0 13.8 L 5.7 15.9 L 7.2 17.7 L 9.7 17.7 L 13.0 16.1 L 15.9 11.1 L 18.7 4.3 L 20.4 -1.4 L 22.3 -5.7 M 18.1 5.5 L 11.7 -5.1 L 12.8 -5.3 L 9.7 -4.8","0 13.5 M 11.2 -4.4 L 11.2 -7.8 L 11.3 -6.6 L 20.5 -8.0 L 18.1 -3.8 L 15.7 1.3 L 13.4 1.0 L 15.7 1.3 L 18.7 1.0 L 15.7 1.4 L 11.9 8.7 L 20.9 9.3 L 21.4 7.3 L 20.8 9.4 L 21.0 11.5","0 10.8 M 18.5 9.8 L 16.5 10.3 L 14.5 9.5 L 13.7 6.8 L 13.9 .6 L 12.7 -2.0 L 11.7 -3.0 L 10.5 -3.4 L 10.1 -3.0 L 11.7 -3.0 L 14.0 -3.8 L 15.2 -6.5 L 15.1 -11.1 L 15.9 -16.0 L 16.6 -17.4 L 18.1 -17.9 L 19.4 -17.7","0 7.2 M 13.0 5.9 L 13.0 -4.3 L 12.7 -11.9 L 12.5 -12.6","0 10.3 M 11.6 10.4 L 12.1 10.5 L 13.5 10.0 L 15.2 8.2 L 15.2 4.6 L 15.6 -.1 L 16.2 -2.0 L 17.6 -2.7 L 18.7 -3.0 L 16.3 -2.5 L 15.0 -3.8 L 14.5 -5.6 L 14.9 -11.6 L 14.2 -15.1 L 13.3 -16.7 L 12.6 -17.3 L 11.2 -17.6 L 10.2 -17.0","0 19.6 M 11.6 -.2 L 13.3 -2.1 L 15.1 -3.0 L 17.5 -2.3 L 20.1 -1.1 L 22.8 -.3 L 24.7 -1.1 L 26.4 -2.4","0 7.6 M 12.4 -12.7 L 11.3 -12.1 L 11.0 -10.8 L 11.6 -9.5 L 12.4 -8.8 L 13.6 -8.7 L 14.4 -9.4 L 14.5 -10.3 L 15.1 -11.1 L 14.7 -12.1 L 13.7 -12.8 L 12.4 -12.7"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 15.3 M 17.9 -16.1 L 17.3 -10.5 L 15.9 -4.1 L 14.9 .3 L 14.0 2.7 M 13.3 5.7 L 12.3 6.7 L 13.2 8.0 L 14.2 6.9 L 13.3 5.7","0 15.1 M 13.9 -16.9 L 12.6 -11.5 M 19.0 -17.1 L 17.9 -11.3","0 23.1 M 16.0 8.9 L 18.5 -9.5 M 23.6 -9.5 L 21.2 9.0 M 26.3 2.8 L 13.1 2.7 M 13.1 -4.4 L 26.9 -4.4","0 14.7 M 17.7 -5.7 L 18.0 -6.1 L 15.3 -6.1 L 15.8 -9.8 L 15.3 -6.3 L 13.1 -5.7 L 11.8 -4.5 L 11.4 -3.1 L 12.5 -1.3 L 13.9 .1 L 15.6 2.2 L 16.7 4.1 L 16.8 5.4 L 16.0 6.6 L 14.6 7.2 L 13.4 7.4 L 12.9 11.7 L 13.4 7.4 L 11.5 7.4 L 10.2 6.7","0 28.1 M 12.6 7.5 L 17.5 1.7 L 23.2 -5.8 L 29.6 -14.7 M 15.9 -14.3 L 13.6 -13.2 L 12.3 -11.1 L 11.9 -9.0 L 12.7 -6.7 L 14.3 -5.4 L 16.3 -5.8 L 18.9 -7.7 L 19.7 -10.0 L 19.6 -12.1 L 18.7 -13.5 L 17.8 -14.2 L 15.9 -14.3 M 27.7 -1.6 L 25.2 -.3 L 23.9 2.1 L 23.7 4.2 L 24.4 6.3 L 26.4 7.3 L 29.0 6.6 L 30.8 4.7 L 31.7 2.3 L 31.1 .0 L 29.7 -1.3 L 27.7 -1.6","0 25.4 M 20.9 4.6 L 18.7 6.7 L 17.2 7.6 L 14.5 6.9 L 12.7 4.4 L 12.0 .6 L 12.5 -3.8 L 14.5 -8.5 L 17.2 -11.7 L 20.4 -13.2 L 22.0 -12.7 L 22.3 -11.2 L 21.3 -9.4 L 19.6 -7.8 L 17.8 -6.6 L 13.5 -4.4 L 16.0 -5.5 L 18.8 -5.8 L 22.9 -5.8 L 26.6 -6.0 L 28.4 -5.8 L 23.6 -5.9 L 22.4 -2.2 L 22.0 .5 L 21.7 3.5 L 22.3 6.0 L 23.5 7.6 L 24.2 8.1 L 26.5 6.2 L 29.1 3.3 L 32.4 -.8","0 10.8 M 14.7 -17.2 L 13.4 -11.4","0 17.1 M 21.0 -15.6 L 17.6 -11.8 L 15.8 -8.4 L 14.4 -3.7 L 14.2 1.4 L 14.8 5.0 L 16.0 7.5 L 18.5 10.3","0 15.9 M 13.9 -15.5 L 16.4 -12.4 L 17.9 -8.7 L 18.3 -4.6 L 17.5 .4 L 15.9 4.8 L 14.0 7.4 L 11.0 10.3","0 18.7 M 16.5 -5.2 L 18.4 -13.9 M 13.1 -7.4 L 21.7 -11.8 M 14.3 -12.6 L 20.3 -7.0","0 22.9 M 12.2 -1.2 L 25.7 -1.2 M 19.0 -8.0 L 19.0 5.7","0 12.7 M 14.1 7.9 L 12.5 6.3 L 13.6 5.1 L 15.1 6.7 L 14.2 8.9 L 12.7 11.2","0 16.3 M 12.0 -1.3 L 16.5 -1.4 L 19.9 -2.1","0 12.7 M 13.9 5.0 L 12.8 6.1 L 14.0 7.4 L 15.1 6.4 L 13.9 5.0","0 17.5 M 21.6 -15.6 L 17.0 -2.7 L 12.1 9.4","0 20.1 M 18.1 -6.6 L 14.6 -5.2 L 12.5 -2.2 L 11.6 .8 L 11.9 4.2 L 13.2 6.9 L 16.1 7.6 L 19.7 6.2 L 22.1 3.3 L 23.1 -.4 L 22.8 -4.0 L 21.3 -6.1 L 19.6 -6.6 L 18.1 -6.6","0 13.9 M 11.8 -3.7 L 15.9 -6.7 L 13.7 7.6","0 17.4 M 11.9 -4.8 L 14.4 -6.0 L 17.1 -6.4 L 19.0 -5.5 L 19.5 -3.1 L 18.6 -.3 L 16.2 2.6 L 13.3 5.3 L 10.5 7.6 L 13.2 7.6 L 17.9 7.4 L 19.2 7.5 L 19.9 7.4 L 21.3 6.5","0 17.0 M 11.7 -4.6 L 14.3 -5.9 L 17.2 -6.1 L 18.5 -4.9 L 19.1 -2.9 L 18.4 -.9 L 16.8 .7 L 14.9 2.0 L 17.0 2.2 L 18.5 3.3 L 19.1 5.1 L 18.9 7.1 L 17.9 8.8 L 16.1 10.4 L 13.6 10.7 L 11.0 10.3 L 9.0 9.5","0 18.0 M 16.8 11.9 L 19.6 -6.6 L 17.1 -3.6 L 14.9 .6 L 11.8 4.3 L 9.8 7.1 L 17.4 7.1 L 20.0 6.9 L 22.2 6.3","0 18.5 M 10.6 10.6 L 14.2 11.8 L 17.2 11.7 L 19.6 10.0 L 20.5 7.0 L 20.4 4.5 L 19.0 2.9 L 16.6 2.3 L 14.8 2.9 L 12.8 3.5 L 14.2 -5.1 L 15.4 -6.1 L 21.4 -6.0","0 19.2 M 14.2 -.7 L 16.2 -1.8 L 18.5 -2.1 L 20.4 -1.3 L 21.2 .3 L 21.4 2.7 L 20.7 4.8 L 19.0 7.0 L 16.5 7.8 L 13.8 7.1 L 12.4 5.6 L 11.6 2.7 L 12.0 -.8 L 13.4 -4.3 L 15.6 -7.3 L 18.4 -9.2 L 21.2 -10.0 L 23.6 -9.8","0 16.9 M 13.9 11.5 L 15.7 5.2 L 18.1 -.2 L 20.0 -3.7 L 21.0 -5.8 L 16.5 -5.7 L 12.0 -6.2","0 18.9 M 16.2 7.4 L 13.4 6.3 L 12.5 5.2 L 12.2 3.2 L 13.6 .2 L 19.1 -4.4 L 21.0 -7.0 L 21.4 -9.3 L 19.8 -10.6 L 17.1 -10.3 L 15.1 -9.1 L 14.1 -7.2 L 15.2 -4.5 L 19.3 -1.0 L 21.2 1.2 L 21.6 3.6 L 20.3 6.0 L 18.5 7.1 L 16.2 7.4","0 19.2 M 11.7 10.6 L 15.1 10.0 L 18.1 8.2 L 20.2 5.9 L 21.1 2.6 L 21.6 -.2 L 21.3 -3.1 L 20.3 -5.2 L 18.0 -6.6 L 14.7 -6.0 L 12.6 -4.1 L 11.5 -1.4 L 11.9 1.2 L 13.5 3.0 L 16.3 3.3 L 17.8 2.9 L 18.9 2.0","0 13.5 M 14.5 -6.1 L 13.3 -4.7 L 14.5 -3.4 L 15.7 -4.6 L 14.5 -6.1 M 13.4 5.3 L 12.2 6.5 L 13.4 7.6 L 14.4 6.6 L 13.4 5.3","0 13.5 M 14.3 -5.8 L 13.2 -4.7 L 14.3 -3.6 L 15.3 -4.6 L 14.3 -5.8 M 13.6 7.9 L 12.1 6.4 L 13.3 5.2 L 14.6 6.6 L 13.9 8.4 L 11.9 11.0","0 24.6 M 25.8 -5.2 L 19.6 -2.7 L 14.2 .5 L 21.1 4.6 L 26.4 7.1","0 22.7 M 12.9 -2.0 L 26.3 -2.0 M 11.7 3.8 L 25.3 3.8","0 23.0 M 12.7 7.0 L 18.5 4.2 L 24.6 .6 L 19.5 -2.5 L 13.2 -5.2","0 17.7 M 14.3 5.5 L 13.2 6.6 L 14.6 8.0 L 15.6 7.0 L 14.3 5.5 M 13.7 2.4 L 13.3 .0 L 14.2 -2.3 L 16.5 -4.7 L 18.9 -6.9 L 20.6 -9.1 L 21.5 -11.9 L 21.1 -14.0 L 19.7 -15.3 L 17.3 -15.2 L 15.4 -14.1","0 27.1 M 31.2 6.1 L 28.2 8.5 L 24.4 9.9 L 19.3 9.4 L 15.0 6.9 L 12.7 3.2 L 12.9 -3.0 L 14.6 -6.7 L 17.5 -9.9 L 21.6 -11.8 L 27.1 -11.9 L 30.6 -10.2 L 32.6 -6.2 L 32.3 -1.7 L 30.1 1.7 L 27.3 3.3 L 24.2 3.6 L 26.1 -5.8 L 24.6 -2.4 L 22.8 .1 L 20.1 2.2 L 18.7 2.9 L 18.7 .0 L 19.6 -3.5 L 21.6 -5.6 L 24.0 -5.9 L 26.1 -5.7","0 24.4 M 8.6 7.7 L 11.3 7.7 L 12.8 7.0 L 14.5 5.4 L 24.7 -13.0 L 19.2 -13.0 L 15.8 -11.7 L 13.8 -9.5 L 13.1 -7.4 L 12.9 -4.9 M 25.1 -13.1 L 24.7 -1.0 L 18.3 -1.0 L 24.7 -1.0 L 24.8 3.9 L 25.2 6.4 L 26.2 7.6 L 27.0 7.8 L 29.1 6.7","0 22.2 M 10.6 -2.9 L 11.2 -6.5 L 12.5 -9.5 L 15.0 -11.7 L 18.0 -12.9 L 21.2 -13.1 L 24.0 -12.8 L 26.6 -11.6 L 27.3 -9.3 L 26.9 -7.6 L 25.7 -5.6 L 24.0 -4.4 L 22.4 -4.0 L 21.8 -4.1 L 24.3 -3.7 L 26.4 -2.5 L 27.4 -.6 L 27.2 2.1 L 26.0 4.3 L 23.8 6.1 L 21.3 7.1 L 14.8 7.2 L 13.9 7.6 L 15.5 5.8 L 16.7 3.5 L 19.6 -12.8","0 18.8 M 25.3 -12.3 L 22.3 -13.2 L 17.7 -11.8 L 14.7 -8.1 L 12.9 -4.4 L 12.1 -1.0 L 12.2 2.2 L 13.8 5.6 L 15.5 7.4 L 18.3 7.8 L 20.1 6.7 L 22.6 4.5","0 22.1 M 11.4 -3.2 L 11.8 -6.9 L 14.1 -10.7 L 17.1 -12.4 L 20.2 -13.2 L 24.0 -13.0 L 27.1 -11.8 L 29.3 -8.5 L 29.6 -4.6 L 28.7 -.5 L 26.9 2.7 L 24.5 5.5 L 21.9 6.7 L 19.7 7.3 L 14.9 7.1 L 14.2 7.4 L 15.5 6.2 L 16.9 3.7 L 19.9 -12.8","0 21.5 M 10.4 -4.8 L 11.1 -9.0 L 12.1 -10.6 L 13.7 -12.1 L 15.9 -12.9 L 27.0 -12.9 L 18.9 -12.9 L 17.8 -8.4 L 17.2 -4.2 L 24.2 -4.2 L 17.1 -4.2 L 16.5 .2 L 15.9 3.4 L 14.8 5.7 L 14.2 6.8 L 13.0 7.7 L 14.4 7.0 L 23.7 7.1 L 25.6 5.9","0 20.5 M 12.1 7.7 L 14.9 7.6 L 16.5 6.6 L 17.6 4.4 L 19.0 -4.1 L 25.5 -4.1 L 19.0 -4.1 L 20.5 -13.1 L 28.5 -13.1 L 19.4 -13.1 L 16.7 -12.7 L 15.0 -11.7 L 13.4 -10.3 L 12.4 -8.0 L 12.4 -6.6 L 12.5 -5.0","0 19.1 M 26.1 -13.0 L 22.2 -13.7 L 18.6 -12.8 L 15.3 -10.2 L 13.3 -7.0 L 11.7 -3.4 L 11.3 .0 L 11.8 4.1 L 13.5 6.6 L 15.8 7.6 L 18.4 7.0 L 20.7 5.1 L 22.1 3.6 M 19.4 -3.7 L 23.6 -3.7 L 22.8 -1.4 L 21.7 5.7 L 20.9 8.3 L 19.7 10.5 L 18.5 12.2 L 17.4 13.3 L 23.7 13.3","0 25.3 M 9.3 -4.7 L 9.2 -7.3 L 10.1 -9.7 L 11.7 -11.7 L 13.6 -12.7 L 15.3 -13.0 L 18.8 -13.1 L 19.4 -13.3 L 18.6 -12.5 L 17.7 -9.3 L 16.8 -2.6 L 16.0 3.4 L 15.0 5.7 L 13.7 7.2 L 12.2 7.8 L 10.1 7.6 M 25.9 -13.1 L 30.3 -13.1 L 29.5 -12.8 L 28.4 -8.5 L 27.9 -4.0 L 17.3 -4.0 L 27.8 -4.0 L 27.3 -.5 L 26.8 2.5 L 26.3 4.2 L 25.9 5.2 L 25.0 6.4 L 23.7 7.6 L 24.4 7.2 L 28.6 7.2 L 30.8 5.7","0 14.5 M 8.9 -4.7 L 8.9 -7.3 L 10.0 -9.9 L 11.8 -11.9 L 14.0 -13.0 L 16.1 -13.1 L 18.8 -13.2 L 18.2 -13.0 L 17.2 -9.1 L 16.1 -3.1 L 15.4 1.8 L 14.9 4.2 L 14.0 5.7 L 12.9 7.0 L 12.0 8.0 L 13.0 7.2 L 18.0 7.3 L 19.8 5.8","0 14.3 M 6.9 11.4 L 9.0 12.8 L 11.7 13.2 L 14.4 11.3 L 15.8 8.2 L 18.8 -10.6 L 19.3 -12.2 L 20.2 -13.4 L 19.7 -13.0 L 15.3 -12.9 L 12.6 -11.5 L 11.1 -9.4 L 10.6 -7.7 L 10.5 -4.8","0 25.0 M 9.6 -4.8 L 9.7 -7.8 L 11.5 -11.3 L 14.1 -13.0 L 16.4 -13.2 L 19.7 -13.2 L 19.2 -12.8 L 17.8 -8.2 L 16.9 -.9 L 15.8 5.0 L 14.9 6.6 L 13.7 7.6 L 12.0 7.9 L 10.2 7.7 M 29.4 -12.5 L 27.6 -12.9 L 25.6 -12.5 L 22.7 -10.5 L 21.0 -7.5 L 20.5 -5.0 L 20.5 -2.8 L 23.8 3.2 L 29.2 10.8","0 17.2 M 22.7 -12.3 L 20.4 -13.4 L 18.2 -12.9 L 15.9 -11.0 L 14.7 -8.8 L 13.6 -.3 L 13.0 4.0 L 12.3 5.3 L 9.8 7.6 L 11.3 7.0 L 13.5 7.3 L 16.3 9.1 L 19.5 11.4 L 23.0 13.0 L 25.6 13.1 L 27.1 11.7","0 31.3 M 10.4 -4.8 L 10.7 -7.9 L 12.1 -10.9 L 14.1 -12.4 L 16.3 -13.0 L 19.2 -13.1 L 22.7 -12.9 M 8.7 7.7 L 11.4 7.7 L 13.8 6.5 L 14.9 5.2 L 22.2 -12.9 L 23.0 -12.7 L 22.8 6.5 L 25.1 1.7 L 27.7 -4.2 L 30.1 -8.8 L 31.4 -11.0 L 33.6 -13.0 L 33.2 -10.6 L 32.6 -3.5 L 32.5 1.7 L 32.9 7.6 L 35.4 6.0","0 23.1 M 10.0 -4.9 L 10.4 -8.0 L 11.6 -10.8 L 13.5 -12.5 L 15.8 -13.1 L 20.1 -13.1 M 11.0 7.2 L 13.5 7.2 L 14.9 6.4 L 16.1 4.6 L 16.6 2.1 L 17.3 -2.0 L 19.2 -13.1 L 20.2 -13.0 L 22.0 -7.8 L 26.3 5.6 L 26.6 6.5 L 26.2 7.7 L 27.3 5.7 L 28.0 3.0 L 30.1 -8.6 L 30.4 -11.0 L 31.3 -13.1 L 31.9 -13.5 L 30.6 -13.1 L 27.1 -13.1","0 16.4 M 15.0 7.3 L 13.4 6.7 L 12.3 5.7 L 10.7 2.7 L 10.5 -1.2 L 11.5 -5.2 L 13.1 -8.1 L 15.1 -10.4 L 16.9 -12.1 L 19.3 -13.0 L 21.3 -11.9 L 23.1 -8.8 L 23.5 -4.6 L 22.9 -1.1 L 21.6 1.9 L 19.3 4.8 L 17.3 6.4 L 15.0 7.3","0 17.4 M 8.6 -3.7 L 9.2 -7.8 L 11.2 -10.5 L 14.4 -12.5 L 17.1 -13.1 L 20.1 -13.2 L 23.1 -12.6 L 25.1 -11.0 L 25.8 -8.4 L 24.8 -5.7 L 22.5 -3.5 L 20.9 -3.1 L 19.7 -3.2 M 17.9 -13.1 L 16.7 -9.7 L 16.0 -4.3 L 14.4 3.8 L 13.9 5.3 L 13.0 6.7 L 11.3 7.9 L 12.3 7.4 L 17.0 7.3 L 18.8 6.3","0 19.3 M 13.1 .6 L 11.5 -.8 L 10.6 -4.2 L 11.5 -7.8 L 13.0 -10.1 L 15.3 -12.1 L 18.0 -12.8 L 20.1 -13.0 L 22.5 -11.6 L 23.8 -9.0 L 24.1 -6.2 L 23.6 -2.5 L 22.3 .1 L 19.6 3.3 L 17.4 5.1 L 15.2 6.3 L 13.0 6.8 L 9.4 6.9 L 10.0 6.6 L 14.3 7.1 L 16.8 8.4 L 19.2 9.7 L 21.2 10.3 L 23.7 9.9 L 25.8 8.8","0 21.7 M 19.3 6.1 L 17.4 7.2 L 13.6 7.0 L 12.7 7.6 L 13.8 6.3 L 15.4 4.1 L 18.0 -10.9 L 18.7 -13.0 M 9.4 -3.3 L 9.6 -6.2 L 11.1 -9.5 L 13.2 -11.6 L 15.7 -12.7 L 18.4 -13.0 L 20.7 -13.1 L 23.8 -12.6 L 25.6 -11.4 L 26.6 -9.1 L 26.3 -7.0 L 24.9 -5.1 L 23.2 -3.9 L 21.7 -3.6 L 19.7 -3.6 L 22.6 1.4 L 26.5 7.3 L 29.4 10.9","0 16.0 M 9.9 6.5 L 12.4 7.6 L 16.4 7.4 L 18.0 6.0 L 19.2 4.1 L 19.7 1.7 L 19.2 -.5 L 14.1 -7.3 L 13.5 -9.4 L 14.1 -11.7 L 15.9 -12.8 L 17.9 -13.4 L 20.2 -13.2 L 22.5 -12.7","0 19.6 M 9.1 -4.9 L 9.1 -7.5 L 10.2 -10.1 L 11.8 -11.9 L 13.7 -12.9 L 26.8 -12.9 L 19.4 -12.9 L 18.5 -9.5 L 17.6 -2.3 L 16.6 3.3 L 15.3 5.9 L 14.5 6.9 L 13.1 7.8 L 14.2 7.4 L 19.0 7.2 L 20.7 6.0","0 25.8 M 9.1 -4.7 L 9.1 -7.4 L 10.1 -9.9 L 11.9 -12.1 L 13.6 -12.9 L 17.5 -13.0 L 19.1 -13.1 L 18.6 -12.9 L 17.3 -8.8 L 16.4 -2.0 L 15.8 3.5 L 16.5 6.3 L 17.6 7.2 L 19.3 7.2 L 21.2 6.0 L 23.3 3.0 L 24.7 .6 L 26.0 -1.8 L 26.5 -2.7 L 28.5 -12.6 L 29.1 -13.1 L 28.5 -12.5 L 26.1 -1.0 L 25.7 3.3 L 26.0 5.4 L 27.0 6.9 L 28.0 7.1 L 29.3 7.2 L 30.5 6.0","0 22.5 M 8.5 -4.7 L 8.9 -7.6 L 10.2 -10.6 L 12.4 -12.3 L 14.8 -13.0 L 16.9 -12.7 L 18.0 -10.7 L 18.8 -7.4 L 19.1 -3.5 L 19.2 .4 L 19.3 4.0 L 19.1 7.3 L 21.6 2.8 L 24.5 -2.6 L 27.6 -8.8 L 28.9 -12.0 L 28.4 -12.8 L 26.3 -12.8","0 30.8 M 9.1 -4.8 L 9.6 -7.7 L 11.1 -10.8 L 13.8 -12.7 L 16.2 -13.1 L 17.8 -12.3 L 19.0 -10.0 L 19.6 -7.0 L 19.6 4.2 L 19.4 7.0 L 21.1 3.9 L 24.0 -1.5 L 26.6 -7.9 L 28.0 -11.2 L 29.4 -12.2 L 28.3 -10.7 L 27.9 -6.9 L 28.0 -1.4 L 29.0 7.1 L 31.8 1.9 L 34.0 -2.5 L 36.0 -7.0 L 37.0 -10.0 L 37.2 -11.8 L 36.7 -12.5 L 34.8 -12.5","0 25.5 M 9.1 7.2 L 12.1 7.3 L 14.0 6.4 L 16.5 4.1 L 19.4 .0 L 23.8 -7.4 L 26.3 -11.3 L 27.6 -12.7 L 28.6 -13.1 L 30.2 -13.1 L 31.6 -12.6 M 11.4 -6.1 L 11.6 -8.3 L 12.6 -10.8 L 14.0 -12.5 L 16.3 -13.1 L 17.8 -13.2 L 18.9 -11.8 L 19.7 -10.3 L 22.4 .8 L 24.5 6.0 L 25.6 7.3 L 26.7 7.8 L 28.2 7.1 L 30.2 5.6","0 22.2 M 9.3 -6.4 L 9.8 -9.3 L 10.9 -11.7 L 12.3 -13.0 L 14.7 -13.1 L 16.0 -11.8 L 17.2 -8.2 L 18.2 -4.8 L 19.4 -.3 L 20.5 3.2 M 25.6 -12.6 L 27.9 -12.5 L 28.3 -11.7 L 27.3 -9.2 L 21.1 2.1 L 18.1 7.4 L 15.2 11.0 L 13.4 12.3 L 11.8 12.4 L 8.5 10.6","0 22.5 M 12.0 -7.5 L 12.0 -9.4 L 13.1 -11.9 L 14.2 -13.2 L 16.8 -13.7 L 18.9 -13.2 L 21.2 -12.6 L 23.3 -12.2 L 25.4 -12.2 L 26.9 -13.0 L 25.0 -11.2 L 20.3 -5.0 L 16.5 -.2 L 13.8 2.8 L 9.9 6.0 L 10.6 5.8 L 13.1 6.0 L 15.4 7.2 L 21.6 11.0 L 24.3 11.7 L 25.9 11.4 L 27.7 9.3","0 17.0 M 22.1 -15.7 L 17.5 -15.7 L 14.0 10.4 L 18.6 10.3","0 18.8 M 12.4 -15.2 L 17.1 -.1 L 20.5 9.4","0 16.8 M 14.4 -15.7 L 18.8 -15.7 L 15.3 10.2 L 10.9 10.4","0 24.5 M 12.4 -1.8 L 20.0 -11.5 L 26.8 -1.7","0 23.2 M 12.4 8.8 L 27.1 8.8","0 16.7 M 13.3 -13.8 L 15.4 -13.0 L 16.7 -11.9 L 18.6 -9.7","0 13.1 M 16.6 -5.5 L 13.1 -5.7 L 10.6 -4.6 L 8.8 -1.4 L 8.1 2.7 L 8.1 5.9 L 8.4 7.5 L 10.3 5.6 L 13.0 1.8 L 14.7 -1.0 L 16.0 -3.7 L 16.6 -5.1 L 15.2 1.1 L 14.5 4.2 L 14.3 5.9 L 14.1 7.6 L 16.1 6.3 L 19.6 2.1 L 21.1 .0","0 12.1 M 16.0 -16.1 L 13.3 -15.8 L 10.8 -13.7 L 9.6 -11.0 L 8.1 2.1 L 7.7 5.0 L 7.5 6.6 L 7.9 7.9 L 9.9 7.6 L 13.1 5.4 L 14.7 1.9 L 15.4 -1.2 L 15.5 -3.9 L 15.3 -6.1 L 12.6 -3.4 L 9.8 .6 L 7.8 4.9","0 9.8 M 15.6 -5.8 L 14.3 -6.5 L 12.2 -6.1 L 9.9 -3.6 L 9.0 -1.6 L 8.2 .5 L 8.1 2.9 L 8.3 5.2 L 9.0 6.9 L 10.4 8.2 L 12.7 6.1 L 15.2 3.4 L 17.8 -.1","0 13.0 M 23.1 -15.9 L 20.7 -15.9 L 18.5 -14.6 L 17.2 -12.4 L 16.5 -9.4 L 16.0 -5.7 L 15.7 -3.7 L 14.2 -.8 L 12.1 2.9 L 10.1 5.7 L 8.0 7.6 L 7.6 3.9 L 8.1 -.5 L 9.3 -3.3 L 10.3 -4.7 L 11.8 -5.5 L 13.4 -5.9 L 15.0 -5.7 L 15.7 -4.9 L 15.3 -1.2 L 14.9 3.2 L 14.0 7.8 L 16.3 6.0 L 19.0 2.7 L 21.1 -.1","0 9.2 M 8.1 1.2 L 10.3 -.2 L 13.0 -2.9 L 14.0 -4.3 L 14.3 -5.8 L 13.7 -6.4 L 12.4 -6.5 L 10.3 -5.1 L 8.7 -2.8 L 7.8 .6 L 7.4 3.3 L 7.9 5.5 L 9.0 7.1 L 10.0 8.1 L 13.4 4.6 L 15.6 2.1 L 17.1 -.1","0 7.4 M 3.7 13.5 L 5.5 13.7 L 7.4 13.0 L 9.2 11.0 L 9.9 8.7 L 11.0 .3 L 11.7 -5.7 L 9.2 -5.7 L 15.9 -6.0 L 11.7 -5.8 L 12.0 -8.7 L 12.6 -11.8 L 14.1 -14.5 L 15.5 -15.8 L 17.3 -16.2 L 18.0 -16.1 L 19.3 -15.8","0 10.6 M 6.0 13.3 L 6.3 13.3 L 9.1 13.4 L 11.2 12.8 L 12.5 11.5 L 13.7 8.6 L 15.5 -5.8 L 12.1 -5.9 L 10.4 -5.0 L 8.8 -3.1 L 8.0 -.3 L 7.5 2.5 L 7.3 3.9 L 7.3 5.4 L 7.5 7.5 L 9.3 6.1 L 11.6 3.0 L 13.4 .4 L 14.6 -2.4 L 15.5 -4.6","0 12.6 M 15.8 -16.1 L 13.7 -16.1 L 11.8 -15.2 L 9.7 -12.4 L 9.2 -9.3 L 8.6 -5.5 L 8.0 -.9 L 7.5 2.8 L 6.7 7.3 L 8.3 3.6 L 10.6 -.4 L 12.9 -3.7 L 14.7 -5.6 L 15.5 -5.8 L 15.8 -4.1 L 14.9 -.1 L 14.1 3.6 L 13.6 5.8 L 13.3 8.0 L 16.2 5.5 L 19.1 2.1 L 20.5 -.1","0 6.2 M 6.9 -4.2 L 8.5 -5.7 L 9.3 -6.1 L 7.9 2.3 L 7.3 5.2 L 7.3 7.6 L 9.7 5.5 L 11.6 3.4 L 14.3 -.1 M 10.1 -12.2 L 10.1 -10.5 L 9.8 -10.2","0 4.1 M .4 13.4 L 3.1 13.3 L 5.1 11.8 L 6.3 9.8 L 7.1 6.6 L 7.9 2.0 L 8.4 -2.3 L 8.9 -6.3 L 7.2 -5.1 L 6.5 -4.3 M 10.3 -12.4 L 10.0 -11.2 L 9.5 -10.7","0 13.2 M 16.1 -16.0 L 13.9 -16.0 L 11.8 -14.9 L 10.2 -13.0 L 9.4 -10.3 L 7.0 7.7 L 8.7 .2 L 10.9 -3.7 L 12.5 -5.6 L 14.4 -6.4 L 15.7 -6.4 L 16.3 -5.7 L 16.2 -4.0 L 14.9 -2.2 L 13.6 -1.0 L 11.4 .3 L 14.3 7.7 L 17.1 5.1 L 19.3 2.6 L 21.2 -.1","0 6.1 M 16.0 -15.9 L 14.5 -16.2 L 12.2 -15.3 L 10.2 -12.9 L 9.5 -9.9 L 7.3 4.6 L 7.0 7.9 L 9.4 5.8 L 12.5 2.1 L 14.1 -.1","0 18.3 M 6.4 -4.5 L 8.9 -6.4 L 8.4 -2.6 L 7.7 1.6 L 7.2 5.2 L 6.9 7.0 L 8.9 2.6 L 10.9 -1.3 L 12.8 -4.1 L 14.4 -5.8 L 15.2 -6.1 L 15.7 -5.5 L 15.0 -2.4 L 13.9 3.0 L 13.0 7.7 L 14.0 4.4 L 15.7 1.0 L 18.0 -2.6 L 19.7 -5.1 L 21.1 -6.2 L 21.8 -5.8 L 20.8 -.7 L 19.8 3.5 L 19.3 6.1 L 19.2 7.9 L 22.0 5.5 L 24.3 2.7 L 26.3 -.1","0 14.2 M 7.9 -4.4 L 9.8 -6.0 L 10.7 -6.6 L 10.2 -4.2 L 9.6 .0 L 9.0 2.9 L 8.6 5.6 L 8.4 7.3 L 8.5 7.8 L 8.4 5.7 L 10.5 2.8 L 12.1 -.3 L 13.9 -2.9 L 15.8 -5.1 L 16.8 -6.3 L 17.3 -6.3 L 17.6 -4.2 L 16.8 -.3 L 16.1 2.7 L 15.5 5.0 L 15.0 7.9 L 16.8 6.4 L 19.4 3.7 L 20.8 1.7 L 22.2 -.1","0 10.0 M 9.7 7.9 L 10.1 7.9 L 11.9 7.0 L 13.6 5.1 L 15.1 2.3 L 15.9 -.6 L 15.7 -3.4 L 14.8 -4.9 L 14.1 -6.3 L 11.1 -4.9 L 9.2 -2.4 L 7.9 .4 L 7.7 2.9 L 8.1 5.4 L 8.7 6.6 L 9.7 7.9","0 9.2 M 6.6 -4.6 L 9.1 -6.4 L 6.5 10.6 L 5.7 13.1 L 2.7 15.2 L 8.3 12.2 M 8.0 2.7 L 8.3 2.5 L 9.2 -.6 L 11.3 -3.5 L 13.2 -5.5 L 14.3 -6.3 L 14.8 -3.5 L 14.7 -.6 L 14.0 2.5 L 13.0 5.2 L 11.8 6.9 L 10.2 7.5 L 8.9 7.3 L 8.1 6.7 L 7.3 5.4","0 9.5 M 17.0 -6.3 L 15.5 -4.1 L 13.9 -.5 L 11.5 3.8 L 10.0 5.8 L 7.9 7.6 L 7.5 3.6 L 8.2 -.9 L 9.2 -3.4 L 10.7 -5.2 L 13.4 -6.0 L 15.3 -6.1 L 16.3 -5.8 L 14.3 5.0 L 13.1 12.1 L 12.5 13.4 L 9.7 15.3 L 15.3 12.4","0 7.3 M 6.4 -4.3 L 8.2 -5.8 L 9.2 -6.5 L 8.2 -1.1 L 7.4 3.8 L 7.3 6.2 L 7.3 7.2 L 8.2 4.0 L 9.6 .9 L 10.8 -2.3 L 12.3 -4.8 L 13.1 -5.8 L 14.2 -6.3 L 15.5 -6.2","0 10.1 M 16.3 -5.8 L 14.4 -6.7 L 12.8 -6.4 L 11.2 -5.2 L 10.6 -3.7 L 11.2 -1.8 L 12.7 .0 L 14.0 1.8 L 14.8 3.6 L 14.7 5.2 L 13.5 6.7 L 11.8 7.7 L 10.4 8.1 L 8.6 7.3","0 5.8 M 8.9 -8.0 L 8.8 -6.1 L 6.5 -5.9 L 8.8 -6.2 L 13.0 -6.3 L 8.8 -6.2 L 8.2 -.7 L 7.6 3.0 L 7.0 5.2 L 6.3 7.9 L 8.6 6.0 L 11.5 2.8 L 13.6 -.1","0 12.5 M 6.5 -4.6 L 8.6 -6.1 L 9.2 -6.5 L 8.3 -2.5 L 7.9 1.3 L 7.6 3.6 L 7.6 6.5 L 7.6 7.6 L 9.3 6.0 L 11.6 3.0 L 13.1 .2 L 14.7 -3.0 L 16.1 -6.2 L 15.1 -2.2 L 14.3 1.9 L 13.8 5.3 L 13.6 7.7 L 16.0 5.7 L 18.3 2.9 L 20.6 -.1","0 8.0 M 5.1 -4.4 L 5.2 -4.4 L 6.5 -5.8 L 7.9 -6.5 L 8.2 4.3 L 8.5 7.0 L 10.0 5.2 L 11.6 2.3 L 13.0 -1.1 L 13.6 -3.0 L 14.0 -6.5","0 13.0 M 4.9 -4.5 L 6.5 -5.9 L 7.7 -6.5 L 8.1 -6.2 L 7.9 3.0 L 8.1 6.6 L 8.2 7.4 L 10.1 5.0 L 11.6 2.1 L 12.8 -1.1 L 13.4 -2.4 L 14.7 -6.5 L 13.9 -5.7 L 14.2 5.0 L 14.4 7.2 L 16.2 5.2 L 17.8 2.2 L 19.1 -.9 L 19.8 -3.3 L 20.1 -5.8 L 19.9 -6.5","0 13.6 M 9.9 -4.5 L 11.5 -5.8 L 12.8 -6.5 L 17.4 7.8 L 19.0 6.9 L 20.0 5.7 M 8.9 7.5 L 10.4 7.3 L 11.2 6.6 L 12.3 5.2 L 16.0 -.7 L 18.2 -4.8 L 19.3 -5.8 L 20.9 -6.1","0 9.0 M 6.4 -4.6 L 6.7 -4.7 L 8.2 -5.8 L 9.2 -6.5 L 8.2 -.9 L 7.6 4.2 L 7.9 7.3 L 10.4 4.6 L 12.5 1.3 L 14.0 -1.5 L 16.0 -6.0 L 15.0 -1.3 L 14.1 5.4 L 13.3 9.8 L 12.4 11.8 L 11.2 12.9 L 9.4 13.5 L 6.1 13.2","0 12.4 M 10.8 -4.4 L 12.9 -5.8 L 14.2 -6.0 L 16.8 -5.7 L 18.6 -5.7 L 9.2 7.8 L 11.2 7.0 L 13.8 7.2 L 16.5 7.7 L 17.6 7.9 L 18.9 6.9","0 15.6 M 20.8 -15.8 L 18.5 -14.8 L 17.2 -12.5 L 16.6 -8.8 L 16.3 -5.5 L 15.7 -3.7 L 15.0 -3.3 L 13.4 -2.8 L 14.6 -2.1 L 16.0 -.6 L 16.0 1.4 L 14.9 5.7 L 14.5 8.5 L 15.0 10.1 L 16.6 11.3","0 12.2 M 13.6 -17.6 L 13.6 13.3","0 15.2 M 14.5 -15.8 L 16.5 -14.7 L 16.9 -13.5 L 16.7 -10.4 L 16.3 -7.6 L 16.2 -5.1 L 16.5 -3.7 L 17.4 -3.1 L 18.4 -2.6 L 16.9 -2.1 L 15.7 -1.1 L 14.9 .8 L 14.6 3.9 L 14.6 6.9 L 14.3 9.0 L 13.3 10.3 L 11.9 11.4 L 11.2 11.5","0 26.2 M 12.7 .4 L 15.1 -.9 L 17.3 -1.4 L 19.7 -.9 L 22.3 -.1 L 24.2 .6 L 26.4 .7 L 28.8 -.4","0 15.8 M 16.1 -5.9 L 13.9 -6.2 L 12.0 -8.2 L 11.8 -10.8 L 13.1 -13.1 L 15.2 -14.0 L 17.6 -13.5 L 19.1 -11.6 L 19.3 -9.3 L 18.3 -7.0 L 16.1 -5.9"]
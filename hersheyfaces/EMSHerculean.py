@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 7.8 M 11.9 -12.9 L 11.9 4.8","0 9.1 M 11.2 -14.5 L 11.2 -10.2 M 14.1 -14.5 L 14.1 -10.2","0 20.6 M 10.8 7.6 L 19.9 -12.9 M 17.0 7.6 L 26.1 -12.9 M 9.5 -5.7 L 27.0 -5.7 M 9.5 -.5 L 27.0 -.5","0 15.9 M 15.7 9.6 L 15.7 -14.6 M 9.9 5.1 L 11.6 6.7 L 13.6 7.7 L 15.3 8.0 L 17.5 7.6 L 19.8 6.2 L 21.3 3.9 L 21.6 1.8 L 21.1 -.8 L 19.6 -2.3 L 17.6 -3.4 L 15.5 -4.5 L 13.5 -5.4 L 11.9 -6.8 L 11.2 -8.3 L 11.5 -10.5 L 12.6 -11.9 L 14.2 -12.9 L 15.9 -13.2 L 17.5 -12.9 L 18.8 -12.3 L 19.8 -11.4","0 20.8 M 10.3 7.6 L 25.8 -13.0 M 13.9 -13.2 L 12.1 -12.8 L 10.7 -11.7 L 9.8 -10.1 L 9.7 -8.5 L 10.2 -7.0 L 11.3 -5.7 L 12.8 -4.9 L 14.6 -4.8 L 16.5 -5.6 L 17.7 -6.9 L 18.1 -8.6 L 18.0 -10.2 L 17.3 -11.5 L 16.3 -12.5 L 15.3 -13.1 L 13.9 -13.2 M 23.1 -.6 L 21.3 -.1 L 19.9 1.0 L 19.0 2.5 L 18.9 4.1 L 19.4 5.6 L 20.5 7.0 L 22.1 7.8 L 23.8 7.9 L 25.7 7.1 L 26.9 5.7 L 27.3 4.1 L 27.2 2.5 L 26.5 1.2 L 25.5 .1 L 24.5 -.4 L 23.1 -.6","0 21.2 M 19.9 -11.6 L 18.8 -12.7 L 17.1 -13.3 L 15.3 -13.0 L 13.9 -12.0 L 12.9 -10.7 L 12.8 -9.1 L 13.2 -7.6 L 14.0 -6.6 L 15.1 -5.9 L 15.8 -5.4 L 16.7 -5.4 L 15.8 -5.4 L 14.1 -4.9 L 12.5 -3.9 L 11.3 -2.5 L 10.4 -.9 L 10.1 .7 L 10.1 2.2 L 10.6 3.8 L 11.6 5.3 L 12.7 6.5 L 14.3 7.5 L 16.0 8.0 L 18.4 7.9 L 20.6 6.9 L 21.8 5.9 L 22.7 4.6 L 23.4 3.5 L 23.7 2.6 L 23.7 7.7 L 23.7 -5.5 L 19.7 -5.5 L 27.8 -5.5","0 6.6 M 11.4 -14.7 L 11.4 -10.4","0 11.0 M 17.2 9.7 L 15.1 7.5 L 13.2 4.5 L 12.2 1.9 L 11.7 -.7 L 11.7 -4.1 L 12.2 -7.0 L 13.8 -10.5 L 15.1 -12.4 L 17.3 -14.5","0 10.7 M 9.4 9.7 L 11.5 7.5 L 13.4 4.5 L 14.4 1.9 L 15.0 -.7 L 14.9 -4.0 L 14.4 -7.0 L 12.8 -10.5 L 11.5 -12.4 L 9.3 -14.4","0 10.4 M 13.2 -12.8 L 13.2 -6.5 M 10.8 -7.3 L 15.6 -12.1 M 9.9 -9.7 L 16.2 -9.6 M 10.7 -12.1 L 15.6 -7.3","0 11.0 M 13.5 .6 L 13.5 -7.4 M 9.4 -3.4 L 17.7 -3.4","0 5.4 M 11.1 7.7 L 10.2 7.7 L 10.2 6.9 L 11.1 6.9 L 11.1 8.0 L 10.7 9.2","0 12.6 M 10.1 -3.4 L 18.3 -3.4","0 5.4 M 11.1 7.7 L 10.2 7.7 L 10.2 6.9 L 11.1 6.9 L 11.1 7.7","0 19.6 M 10.0 7.9 L 25.5 -13.1","0 25.8 M 10.3 -2.9 L 10.9 -6.6 L 12.9 -9.6 L 15.3 -11.7 L 18.7 -13.2 L 22.0 -13.3 L 24.9 -12.6 L 27.5 -11.0 L 29.6 -8.8 L 31.2 -5.6 L 31.4 -1.7 L 30.5 2.0 L 28.7 4.6 L 25.1 7.2 L 21.4 8.1 L 17.2 7.5 L 13.4 5.0 L 11.0 1.3 L 10.2 -1.5 L 10.3 -2.9","0 8.2 M 12.9 7.6 L 12.9 -12.8 L 9.5 -12.8","0 19.3 M 10.0 -5.5 L 10.2 -7.7 L 11.2 -9.7 L 12.8 -11.5 L 14.8 -12.8 L 17.0 -13.1 L 19.1 -13.1 L 21.4 -12.2 L 22.9 -10.9 L 24.5 -8.7 L 25.0 -6.0 L 24.8 -3.9 L 23.8 -1.6 L 22.2 .2 L 20.1 2.0 L 11.0 7.6 L 25.0 7.6","0 18.1 M 10.1 1.2 L 10.3 3.4 L 11.3 5.1 L 12.6 6.6 L 14.5 7.6 L 16.8 7.9 L 19.3 7.5 L 21.6 6.1 L 23.1 4.3 L 23.7 2.1 L 23.6 -.5 L 22.7 -2.5 L 21.3 -4.1 L 20.2 -4.8 L 21.2 -6.0 L 21.8 -7.6 L 21.7 -9.7 L 21.0 -11.3 L 19.8 -12.3 L 18.0 -13.1 L 15.8 -13.2 L 14.3 -12.4 L 13.2 -11.4 L 12.4 -10.3 L 12.0 -9.3 L 12.0 -8.8","0 15.4 M 19.4 7.7 L 19.4 -12.0 L 10.0 4.9 L 22.0 4.9","0 20.0 M 10.5 2.7 L 11.6 4.7 L 13.2 6.4 L 15.2 7.5 L 17.5 7.9 L 20.3 7.6 L 22.7 6.2 L 24.4 4.2 L 25.5 1.4 L 25.4 -1.0 L 24.4 -3.6 L 22.8 -5.6 L 21.0 -6.8 L 18.7 -7.4 L 16.1 -7.3 L 14.0 -6.4 L 12.6 -5.3 L 11.5 -4.1 L 12.3 -12.9 L 23.1 -12.9","0 19.3 M 19.2 -13.1 L 11.4 -4.0 L 10.3 -1.6 L 10.0 .8 L 10.6 3.0 L 11.8 5.1 L 13.3 6.5 L 15.3 7.6 L 17.3 8.0 L 19.6 7.7 L 21.8 6.7 L 23.9 5.0 L 25.1 2.5 L 25.3 .1 L 24.9 -2.3 L 23.6 -4.5 L 22.4 -5.7 L 20.7 -6.8 L 18.4 -7.4 L 15.9 -7.2 L 14.0 -6.4 L 12.7 -5.5","0 16.6 M 12.0 7.7 L 22.7 -12.9 L 9.7 -12.9","0 17.5 M 17.1 8.0 L 18.7 7.7 L 20.6 6.9 L 22.2 5.4 L 23.2 3.5 L 23.6 1.6 L 23.4 -.4 L 22.5 -2.4 L 21.3 -3.8 L 19.6 -4.9 L 17.9 -5.4 L 15.4 -5.5 L 14.3 -6.3 L 13.1 -7.6 L 12.7 -9.0 L 12.9 -10.7 L 13.8 -12.1 L 15.2 -13.0 L 16.6 -13.3 L 18.1 -13.0 L 19.4 -12.1 L 20.3 -11.0 L 20.7 -9.4 L 20.5 -8.2 L 19.9 -7.0 L 18.9 -6.1 L 18.0 -5.6 L 16.9 -5.5 L 15.0 -5.3 L 13.2 -4.6 L 11.8 -3.4 L 10.8 -1.9 L 10.2 -.4 L 10.0 1.1 L 10.2 2.6 L 10.7 4.3 L 11.7 5.7 L 13.1 6.9 L 14.5 7.6 L 16.0 8.0 L 17.1 8.0","0 19.3 M 16.1 7.8 L 23.7 -1.1 L 24.9 -3.3 L 25.2 -5.8 L 24.8 -8.3 L 23.7 -10.3 L 21.7 -12.1 L 19.8 -13.0 L 16.7 -13.2 L 14.0 -12.5 L 12.1 -10.9 L 10.5 -8.7 L 10.0 -6.6 L 10.1 -4.4 L 10.7 -2.5 L 12.0 -.6 L 13.7 1.0 L 16.0 1.9 L 18.1 2.1 L 20.8 1.4 L 22.4 .3 L 23.3 -.6","0 8.2 M 12.5 .1 L 11.6 .1 L 11.6 -.7 L 12.5 -.7 L 12.5 .1 M 12.5 7.7 L 11.6 7.7 L 11.6 6.9 L 12.5 6.9 L 12.5 7.7","0 8.3 M 12.6 7.7 L 11.7 7.7 L 11.7 6.9 L 12.6 6.9 L 12.6 8.0 L 12.2 9.2 M 12.6 .1 L 11.7 .1 L 11.7 -.7 L 12.6 -.7 L 12.6 .1","0 13.1 M 19.6 .9 L 11.0 -4.2 L 19.6 -9.2","0 12.9 M 10.5 -1.9 L 18.7 -1.9 M 10.5 -5.5 L 18.7 -5.5","0 13.2 M 10.9 .9 L 19.5 -4.2 L 10.9 -9.3","0 19.6 M 17.4 5.0 L 17.4 .3 L 19.5 .0 L 21.5 -1.1 L 22.8 -2.4 L 23.9 -4.6 L 24.2 -6.7 L 23.9 -8.8 L 22.7 -10.7 L 21.0 -12.3 L 18.8 -13.1 L 16.1 -13.2 L 13.8 -12.5 L 11.8 -10.9 L 10.9 -9.2 L 10.4 -6.8 M 17.8 7.7 L 16.9 7.7 L 16.9 6.9 L 17.8 6.9 L 17.8 7.7","0 26.4 M 21.1 8.0 L 24.0 7.7 L 26.4 6.6 L 28.5 5.0 L 30.4 2.7 L 31.5 -.2 L 31.8 -2.6 L 31.4 -5.7 L 30.1 -8.4 L 27.9 -10.8 L 24.7 -12.8 L 21.1 -13.3 L 18.1 -12.9 L 15.3 -11.5 L 12.5 -8.7 L 11.1 -6.3 L 10.5 -2.9 L 10.7 -.2 L 12.0 2.7 L 13.9 5.0 L 16.4 6.9 L 18.6 7.8 L 21.1 8.0 M 27.3 3.3 L 27.3 -4.8 L 25.9 -6.8 L 23.4 -8.6 L 21.1 -8.9 L 18.8 -8.5 L 16.8 -7.2 L 15.5 -5.3 L 15.0 -3.3 L 15.0 -1.5 L 15.6 .4 L 17.2 2.2 L 19.1 3.4 L 21.5 3.7 L 24.3 2.9 L 26.2 1.3 L 27.0 -.2 L 27.3 -1.2","0 24.2 M 10.1 7.6 L 20.1 -12.8 L 30.1 7.5 L 26.1 -.6 L 14.1 -.6","0 12.6 M 11.3 7.6 L 11.3 -13.0 L 12.3 -13.0 L 13.6 -12.5 L 14.6 -11.8 L 15.4 -10.8 L 15.6 -9.9 L 15.7 -8.7 L 15.2 -7.5 L 14.3 -6.4 L 13.4 -5.7 L 12.4 -5.5 L 11.3 -5.5 L 12.4 -5.5 L 13.8 -5.2 L 15.0 -4.7 L 16.1 -4.0 L 17.0 -3.0 L 17.8 -1.9 L 18.2 -.7 L 18.5 .7 L 18.3 2.1 L 17.9 3.8 L 17.1 5.0 L 16.0 6.1 L 14.6 7.0 L 13.3 7.5 L 12.0 7.6 L 11.3 7.6","0 21.1 M 26.6 6.3 L 23.8 7.6 L 21.5 7.9 L 17.9 7.5 L 15.2 6.1 L 13.0 4.1 L 11.2 1.4 L 10.4 -1.2 L 10.4 -3.6 L 11.1 -6.8 L 12.3 -8.9 L 13.9 -10.5 L 15.7 -11.9 L 18.1 -13.0 L 20.7 -13.4 L 22.9 -13.2 L 24.9 -12.6 L 26.7 -11.7","0 16.2 M 14.7 7.3 L 17.3 6.2 L 19.4 4.2 L 21.1 1.5 L 21.9 -1.1 L 21.9 -3.6 L 21.2 -6.7 L 20.1 -8.8 L 18.6 -10.5 L 16.8 -11.9 L 14.5 -12.7 L 12.6 -13.0 L 11.3 -12.9 L 11.3 7.6 L 13.1 7.6 L 14.7 7.3","0 11.9 M 18.3 7.5 L 11.3 7.5 L 11.3 -.5 L 17.0 -.5 L 11.3 -.5 L 11.3 -12.9 L 18.2 -12.9","0 11.9 M 11.3 7.6 L 11.3 -.5 L 17.1 -.5 L 11.3 -.5 L 11.3 -12.9 L 18.2 -12.9","0 21.2 M 26.4 -11.8 L 24.9 -12.6 L 22.8 -13.1 L 20.6 -13.4 L 17.9 -12.9 L 15.6 -11.9 L 13.8 -10.5 L 12.2 -8.8 L 11.0 -6.7 L 10.3 -3.6 L 10.3 -1.1 L 11.1 1.5 L 12.8 4.2 L 15.1 6.2 L 17.7 7.5 L 21.4 7.9 L 23.7 7.6 L 26.4 6.4 L 26.4 -.6 L 19.2 -.6","0 22.1 M 11.3 -13.1 L 11.3 7.6 L 11.3 -.5 L 26.8 -.5 L 26.8 7.6 L 26.8 -13.1","0 6.6 M 11.4 7.6 L 11.4 -13.0","0 14.7 M 9.5 6.4 L 10.7 7.3 L 11.8 7.8 L 13.1 8.0 L 14.7 8.0 L 16.5 7.3 L 17.8 6.3 L 18.7 4.9 L 19.2 3.6 L 19.4 2.4 L 19.4 -12.9 L 14.0 -12.9","0 17.8 M 11.3 7.6 L 11.3 -13.0 M 21.0 -13.1 L 11.5 -4.8 L 23.5 7.6","0 11.6 M 11.3 -13.0 L 11.3 7.6 L 18.0 7.6","0 27.4 M 11.3 7.6 L 11.3 -12.9 L 11.9 -12.9 L 21.7 7.3 L 31.8 -12.9 L 32.2 -12.9 L 32.2 7.5","0 22.4 M 11.2 7.5 L 11.2 -12.3 L 27.0 7.2 L 27.0 -12.8","0 26.1 M 26.6 6.4 L 23.9 7.6 L 21.5 8.0 L 17.9 7.5 L 15.3 6.2 L 13.0 4.2 L 11.3 1.5 L 10.5 -1.1 L 10.4 -3.6 L 11.2 -6.7 L 12.3 -8.8 L 13.9 -10.5 L 15.7 -11.9 L 18.1 -12.9 L 20.8 -13.3 L 23.0 -13.1 L 25.0 -12.5 L 26.7 -11.6 L 28.2 -10.6 L 29.7 -8.8 L 31.1 -6.4 L 31.7 -3.8 L 31.5 -.7 L 30.5 2.2 L 29.0 4.4 L 26.6 6.4","0 12.3 M 11.3 7.6 L 11.3 -12.9 L 13.5 -12.8 L 15.4 -11.9 L 16.8 -10.7 L 17.9 -9.0 L 18.4 -6.7 L 18.1 -4.7 L 16.9 -2.5 L 15.1 -.9 L 13.2 -.2 L 11.4 -.2","0 26.1 M 22.5 1.4 L 29.2 8.1 M 26.6 6.4 L 23.8 7.6 L 21.5 8.0 L 17.8 7.5 L 15.2 6.2 L 12.9 4.2 L 11.2 1.5 L 10.4 -1.1 L 10.3 -3.5 L 11.1 -6.7 L 12.3 -8.8 L 13.9 -10.4 L 15.7 -11.9 L 18.0 -12.9 L 20.7 -13.3 L 22.9 -13.1 L 24.9 -12.5 L 26.7 -11.6 L 28.1 -10.6 L 29.6 -8.8 L 31.0 -6.4 L 31.6 -3.8 L 31.5 -.7 L 30.5 2.2 L 28.9 4.4 L 26.6 6.4","0 13.1 M 11.2 7.6 L 11.2 -12.8 L 12.9 -12.8 L 14.8 -12.3 L 16.5 -11.0 L 17.8 -9.3 L 18.4 -7.9 L 18.5 -6.1 L 18.2 -4.6 L 17.3 -3.0 L 16.2 -1.5 L 14.4 -.6 L 12.8 -.1 L 11.2 .0 L 11.4 .4 L 18.5 7.6","0 15.7 M 10.0 5.1 L 11.3 6.5 L 12.6 7.4 L 14.1 8.0 L 15.8 8.0 L 17.7 7.7 L 19.8 6.4 L 21.1 4.3 L 21.2 1.7 L 20.7 -.3 L 19.5 -1.8 L 17.4 -3.3 L 15.0 -4.7 L 13.4 -5.9 L 12.0 -7.3 L 11.3 -8.7 L 11.3 -10.6 L 12.1 -12.0 L 13.6 -13.1 L 15.5 -13.3 L 17.3 -12.9 L 18.5 -12.2 L 19.1 -11.4","0 13.1 M 14.6 7.6 L 14.6 -12.9 L 9.5 -12.9 L 19.6 -12.9","0 18.5 M 11.3 -13.0 L 11.3 2.9 L 11.9 4.9 L 13.1 6.4 L 14.7 7.5 L 16.4 8.0 L 18.3 8.0 L 20.4 7.2 L 22.4 5.1 L 22.9 3.7 L 23.1 2.8 L 23.1 -13.0","0 23.7 M 9.8 -13.1 L 19.9 7.4 L 29.9 -13.0","0 30.4 M 9.9 -13.0 L 18.6 7.2 L 27.6 -13.0 M 18.9 -13.0 L 27.7 7.3 L 36.7 -13.1","0 15.0 M 9.9 7.6 L 20.0 -13.0 M 11.0 -13.0 L 21.1 7.6","0 16.6 M 9.9 -13.0 L 16.3 -.8 L 16.3 7.6 L 16.3 -.8 L 22.4 -13.0","0 13.5 M 9.4 -12.9 L 19.1 -12.9 L 9.7 7.5 L 19.6 7.5","0 7.3 M 14.0 10.0 L 11.1 10.0 L 11.1 -14.7 L 14.1 -14.7","0 19.9 M 10.1 -13.0 L 25.5 7.6","0 7.6 M 9.5 9.9 L 12.4 9.9 L 12.4 -14.8 L 9.4 -14.8","0 10.7 M 9.7 -7.7 L 13.1 -10.9 L 16.5 -7.7","0 11.5 M 9.6 7.6 L 17.9 7.6","0 7.2 M 10.0 -10.1 L 13.3 -7.3","0 17.5 M 22.8 1.3 L 22.7 -.1 L 21.5 -2.1 L 19.6 -3.9 L 17.1 -4.7 L 14.5 -4.4 L 12.4 -3.2 L 10.9 -1.4 L 10.1 .5 L 10.2 2.7 L 11.0 4.9 L 12.4 6.5 L 14.7 7.7 L 16.9 7.9 L 19.8 7.0 L 21.5 5.3 L 22.5 3.6 L 22.9 2.1 L 22.9 -4.5 L 22.9 7.6","0 17.9 M 11.0 1.3 L 11.1 -.1 L 12.2 -2.1 L 14.2 -3.9 L 16.7 -4.8 L 19.2 -4.4 L 21.4 -3.2 L 22.9 -1.4 L 23.6 .5 L 23.6 2.7 L 22.8 4.9 L 21.4 6.5 L 19.1 7.7 L 16.9 7.9 L 14.0 7.0 L 12.3 5.3 L 11.3 3.5 L 10.9 2.1 L 10.9 -12.7 L 10.9 7.6","0 14.7 M 21.3 5.8 L 20.2 6.7 L 18.2 7.8 L 16.1 8.1 L 14.2 7.7 L 11.9 6.3 L 10.7 4.5 L 10.0 1.9 L 10.2 -.2 L 11.7 -2.6 L 13.8 -4.2 L 16.0 -4.7 L 18.3 -4.4 L 20.1 -3.6 L 21.2 -2.5","0 17.8 M 22.6 1.3 L 22.5 -.1 L 21.4 -2.1 L 19.5 -3.9 L 17.0 -4.8 L 14.4 -4.4 L 12.3 -3.2 L 10.8 -1.4 L 10.0 .5 L 10.1 2.7 L 10.8 4.9 L 12.3 6.5 L 14.5 7.7 L 16.8 7.9 L 19.7 7.0 L 21.4 5.3 L 22.4 3.5 L 22.7 2.1 L 22.7 -12.7 L 22.7 7.5","0 15.3 M 12.2 6.0 L 21.1 -2.7 L 19.6 -4.1 L 17.7 -4.7 L 15.5 -4.6 L 13.5 -3.9 L 11.6 -2.4 L 10.5 -.5 L 10.2 1.7 L 10.5 3.6 L 11.3 5.0 L 12.7 6.5 L 14.0 7.4 L 15.2 7.9 L 16.7 8.1 L 18.8 7.6 L 20.5 6.6 L 21.4 5.7","0 8.4 M 10.8 7.6 L 10.8 2.7 L 14.9 2.7 L 10.8 2.7 L 10.8 -5.7 L 11.3 -7.5 L 12.3 -8.7 L 13.5 -9.3 L 14.9 -9.6","0 17.8 M 22.7 1.4 L 22.6 .0 L 21.5 -2.0 L 19.6 -3.9 L 17.1 -4.7 L 14.5 -4.3 L 12.3 -3.1 L 10.9 -1.4 L 10.1 .6 L 10.1 2.8 L 10.9 4.9 L 12.4 6.5 L 14.6 7.8 L 16.8 8.0 L 19.7 7.1 L 21.5 5.4 L 22.5 3.6 L 22.8 2.2 L 22.8 -4.5 L 22.8 7.6 L 22.4 9.5 L 21.7 11.0 L 20.4 12.3 L 18.5 13.3 L 16.4 13.6 L 14.2 13.1 L 12.5 12.1 L 11.3 11.0","0 15.9 M 10.9 -13.0 L 10.9 7.5 L 10.9 -1.0 L 12.3 -3.0 L 14.3 -4.5 L 16.2 -4.8 L 18.1 -4.5 L 19.7 -3.5 L 20.8 -2.1 L 21.5 .0 L 21.5 7.5","0 6.3 M 11.2 7.6 L 11.2 -4.4 M 10.9 -8.3 L 11.0 -9.0 L 11.7 -9.0 L 11.7 -8.3 L 10.9 -8.3","0 8.3 M 12.9 -4.4 L 12.9 10.0 L 12.2 11.4 L 11.4 12.2 L 10.1 13.0 L 8.9 13.2 M 12.6 -8.3 L 12.6 -9.0 L 13.3 -9.0 L 13.3 -8.3 L 12.6 -8.3","0 12.6 M 10.9 7.6 L 10.9 -13.0 M 16.7 -4.6 L 11.1 .3 L 18.0 7.6","0 8.4 M 10.8 -13.0 L 10.8 4.1 L 11.1 5.4 L 12.1 6.5 L 12.9 7.3 L 14.0 7.8 L 14.8 7.8","0 22.7 M 10.8 7.5 L 10.8 -4.5 L 10.8 -2.0 L 12.1 -3.4 L 13.7 -4.5 L 15.3 -4.9 L 16.8 -4.5 L 18.2 -3.4 L 18.9 -2.3 L 19.3 -1.2 L 19.3 7.6 L 19.3 -1.4 L 19.9 -2.8 L 21.2 -4.1 L 23.4 -4.8 L 25.2 -4.6 L 26.7 -3.5 L 27.6 -1.8 L 27.6 7.5","0 16.2 M 10.5 7.6 L 10.5 -4.5 L 10.5 -1.0 L 11.6 -2.7 L 13.2 -4.1 L 15.0 -4.7 L 16.7 -4.8 L 18.4 -4.2 L 19.7 -2.9 L 20.8 -1.4 L 21.1 .2 L 21.1 7.6","0 16.9 M 10.1 1.4 L 10.7 -1.0 L 12.2 -3.1 L 14.1 -4.3 L 15.9 -4.7 L 17.9 -4.6 L 19.7 -3.8 L 21.5 -2.4 L 22.6 -.2 L 22.7 2.4 L 22.2 4.5 L 20.7 6.3 L 18.6 7.7 L 16.7 8.0 L 14.7 7.7 L 12.8 6.7 L 11.2 5.1 L 10.2 3.0 L 10.1 1.4","0 17.5 M 10.9 2.0 L 11.0 3.4 L 12.1 5.4 L 14.1 7.2 L 16.6 8.0 L 19.1 7.6 L 21.3 6.5 L 22.8 4.7 L 23.5 2.7 L 23.5 .6 L 22.7 -1.6 L 21.3 -3.2 L 19.0 -4.4 L 16.8 -4.7 L 13.9 -3.7 L 12.2 -2.0 L 11.2 -.3 L 10.8 1.2 L 10.8 13.3 L 10.8 -4.3","0 17.4 M 22.6 1.9 L 22.5 3.3 L 21.4 5.3 L 19.5 7.1 L 17.0 8.0 L 14.4 7.6 L 12.3 6.4 L 10.8 4.6 L 10.0 2.7 L 10.1 .5 L 10.8 -1.7 L 12.3 -3.3 L 14.5 -4.5 L 16.8 -4.7 L 19.7 -3.8 L 21.4 -2.1 L 22.4 -.3 L 22.7 1.1 L 22.7 13.2 L 22.7 -4.3","0 11.3 M 10.8 7.6 L 10.8 -4.4 L 10.8 -2.0 L 11.9 -3.3 L 12.9 -4.1 L 14.3 -4.7 L 15.5 -4.7 L 16.6 -4.5 L 17.4 -4.1 L 17.8 -3.8","0 11.2 M 9.7 6.2 L 10.7 7.2 L 12.1 7.9 L 13.3 8.0 L 14.8 7.6 L 16.0 6.7 L 16.8 5.5 L 17.0 4.4 L 16.7 3.0 L 15.9 1.9 L 14.6 1.1 L 13.1 .1 L 11.6 -.9 L 10.9 -2.0 L 10.9 -3.4 L 11.7 -4.5 L 12.9 -4.8 L 14.0 -4.7 L 14.7 -4.4 L 15.2 -3.9","0 8.2 M 14.6 7.8 L 13.4 7.6 L 12.2 6.9 L 11.2 5.9 L 10.6 4.6 L 10.5 3.2 L 10.5 -4.3 L 14.5 -4.3 L 10.5 -4.3 L 10.5 -9.5","0 15.6 M 21.2 -4.6 L 21.2 7.6 L 21.2 4.0 L 20.2 5.7 L 18.5 7.2 L 16.4 8.0 L 14.0 7.7 L 12.1 6.4 L 11.1 5.0 L 10.6 3.3 L 10.6 2.1 L 10.6 -4.4","0 15.6 M 10.1 -4.5 L 15.8 7.3 L 21.5 -4.6","0 20.8 M 10.0 -4.5 L 15.6 7.4 L 21.2 -4.5 M 15.8 -4.6 L 21.4 7.4 L 26.8 -4.4","0 13.4 M 9.7 7.6 L 17.8 -4.6 M 11.2 -4.6 L 19.3 7.6","0 15.9 M 10.5 -4.5 L 10.5 2.9 L 10.8 4.3 L 11.8 6.1 L 13.6 7.5 L 15.5 8.0 L 17.3 7.9 L 19.2 6.7 L 20.5 5.2 L 21.2 3.7 L 21.2 -4.5 L 21.2 8.2 L 20.6 10.1 L 19.5 11.6 L 18.0 12.7 L 16.3 13.3 L 14.6 13.3 L 12.7 12.5 L 11.6 11.7 L 11.0 11.0","0 11.6 M 10.5 -4.4 L 17.4 -4.4 L 10.2 7.6 L 18.0 7.6","0 8.5 M 15.2 9.6 L 14.1 8.7 L 13.3 7.6 L 12.7 6.0 L 12.7 .1 L 12.3 -1.3 L 11.4 -2.3 L 10.6 -2.6 L 11.9 -3.5 L 12.7 -4.6 L 12.9 -5.7 L 12.9 -11.3 L 13.1 -12.3 L 13.8 -13.4 L 14.5 -14.2 L 15.1 -14.7","0 6.6 M 11.3 7.6 L 11.3 -12.9","0 8.8 M 9.4 9.6 L 10.6 8.7 L 11.3 7.6 L 11.9 6.1 L 11.9 .1 L 12.3 -1.2 L 13.3 -2.2 L 14.0 -2.6 L 12.7 -3.4 L 12.0 -4.6 L 11.8 -5.6 L 11.8 -11.2 L 11.5 -12.2 L 10.9 -13.4 L 10.1 -14.2 L 9.5 -14.6","0 16.7 M 11.2 -2.1 L 12.2 -3.1 L 13.4 -3.5 L 14.7 -3.3 L 16.2 -2.6 L 17.4 -1.9 L 18.8 -1.4 L 20.0 -1.3 L 21.0 -2.0 L 21.5 -2.6","0 6.7 M 9.6 -11.1 L 9.9 -12.2 L 10.9 -13.0 L 12.0 -13.0 L 12.9 -12.2 L 13.2 -11.1 L 12.9 -10.0 L 11.8 -9.3 L 10.6 -9.5 L 10.0 -10.1 L 9.6 -11.1"]
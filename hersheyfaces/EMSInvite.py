@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.1 M 22.4 -15.6 L 15.2 2.0 M 14.2 5.6 L 13.1 7.2","0 10.3 M 16.2 -10.0 L 12.3 -4.5 M 20.5 -9.8 L 16.7 -4.6","0 13.4 M 17.7 -5.9 L 16.2 -4.0 L 14.6 -.4 L 11.7 7.8 M 22.5 -5.9 L 20.6 -3.5 L 19.0 -.9 L 15.7 7.6 M 12.7 -2.2 L 22.9 -2.5 M 10.9 2.6 L 20.6 2.5","0 13.1 M 20.7 -2.8 L 21.1 -4.3 L 20.4 -5.0 L 18.7 -5.7 L 16.5 -5.3 L 15.2 -4.1 L 15.0 -2.4 L 15.8 -.6 L 17.5 1.3 L 18.5 3.0 L 18.8 4.2 L 18.4 5.8 L 17.1 7.1 L 15.2 7.7 L 13.8 7.7 L 12.1 7.4 L 11.1 6.5 L 10.8 5.8 L 12.0 3.7 M 20.7 -8.7 L 12.3 10.7","0 17.7 M 11.1 10.7 L 25.0 -8.5 M 14.9 -5.4 L 12.9 -4.8 L 11.3 -3.1 L 10.7 -1.2 L 10.6 .5 L 11.7 1.9 L 13.4 1.9 L 15.3 .6 L 16.3 -1.2 L 16.8 -3.1 L 16.5 -4.6 L 16.1 -5.1 L 14.9 -5.4 M 23.4 .2 L 21.9 .4 L 20.3 1.7 L 19.5 3.2 L 19.3 5.1 L 19.6 6.7 L 20.8 7.6 L 22.1 7.4 L 23.4 6.5 L 24.7 4.8 L 25.4 2.3 L 25.0 .7 L 24.5 .3 L 23.4 .2","0 23.6 M 31.4 5.7 L 29.8 7.1 L 26.9 7.5 L 24.1 6.6 L 21.3 4.4 L 19.4 1.7 L 18.2 -1.6 L 17.2 -6.0 L 17.3 -9.3 L 18.7 -11.9 L 20.3 -12.8 L 21.7 -12.7 L 22.4 -11.9 L 22.6 -10.2 L 22.3 -8.7 L 21.7 -7.3 L 20.6 -5.8 L 19.5 -4.8 L 16.5 -3.0 L 14.5 -1.8 L 12.4 .2 L 11.4 2.4 L 11.8 4.4 L 12.7 6.1 L 15.1 7.3 L 18.1 7.4 L 20.4 6.3 L 23.0 3.8 L 24.9 .8 L 27.1 -1.6 L 28.9 -2.6 L 30.8 -2.8 L 31.6 -2.2 L 32.1 -1.3","0 6.1 M 16.4 -10.0 L 12.4 -4.6","0 12.1 M 24.0 -20.5 L 20.0 -15.6 L 16.8 -8.8 L 15.2 -2.6 L 14.6 3.7 L 14.8 8.4 L 15.8 12.2","0 13.1 M 19.5 -20.2 L 20.6 -14.6 L 20.3 -7.4 L 18.9 -.6 L 16.4 5.5 L 14.1 9.1 L 11.1 12.2","0 9.1 M 15.5 -10.0 L 14.3 -6.4 L 18.1 -7.5 M 11.5 -7.3 L 14.3 -6.6 L 12.0 -3.4 M 16.4 -3.4 L 14.2 -6.6","0 14.0 M 18.1 -3.0 L 15.0 6.1 M 12.3 1.6 L 21.1 1.4","0 5.9 M 11.9 6.3 L 13.0 5.8 L 12.8 7.8 L 11.4 10.2 L 10.4 11.3","0 11.7 M 11.5 1.3 L 18.6 .8","0 5.6 M 12.2 6.1 L 11.5 7.1","0 10.0 M 26.0 -20.2 L 9.1 9.3","0 16.5 M 20.6 -5.4 L 16.7 -4.3 L 14.1 -1.9 L 12.9 1.9 L 13.2 4.6 L 14.5 6.7 L 16.7 7.4 L 19.5 6.8 L 21.5 5.4 L 23.8 2.0 L 24.3 -1.5 L 23.7 -3.5 L 22.3 -4.9 L 20.6 -5.4","0 9.0 M 12.9 -3.7 L 15.1 -4.1 L 17.4 -5.1 L 19.3 -6.6 L 17.3 -4.3 L 13.7 3.4 L 12.2 7.8","0 13.0 M 13.3 -1.7 L 14.3 -3.7 L 16.4 -5.2 L 18.5 -5.4 L 19.8 -4.9 L 20.8 -3.4 L 20.8 -1.8 L 20.1 .0 L 18.4 2.0 L 16.9 3.2 L 10.2 7.6 L 11.8 6.4 L 13.0 6.3 L 15.0 7.0 L 17.0 7.3 L 18.9 7.1 L 20.1 6.5 L 20.6 5.9","0 12.2 M 13.6 -3.8 L 15.6 -5.3 L 18.4 -5.5 L 20.2 -4.1 L 20.6 -1.5 L 19.2 .3 L 17.1 1.7 L 12.8 3.3 L 15.1 2.9 L 17.3 3.6 L 18.8 5.2 L 19.2 7.5 L 18.8 10.2 L 17.4 12.0 L 14.5 14.1 L 11.0 15.0 L 8.8 14.7 L 7.8 13.9 L 7.5 13.0","0 17.0 M 18.5 7.9 L 21.3 -1.0 L 24.5 -7.5 L 26.1 -10.8 L 29.2 -14.2 L 21.9 -8.8 L 16.4 -3.8 L 11.9 .9 L 13.7 .6 L 16.5 1.0 L 20.5 1.5 L 22.8 1.8 L 25.4 1.1 L 26.3 .0","0 11.9 M 6.5 12.7 L 8.1 14.2 L 10.6 14.5 L 13.6 13.4 L 15.7 11.9 L 17.3 9.4 L 17.8 7.2 L 17.6 4.8 L 16.7 3.3 L 15.3 2.2 L 13.4 1.0 L 13.5 -.4 L 14.3 -3.0 L 15.4 -5.2 L 20.6 -5.2 L 21.0 -5.2 L 21.8 -5.8","0 13.7 M 29.0 -11.4 L 27.4 -13.4 L 24.6 -13.6 L 21.3 -12.3 L 18.4 -10.0 L 16.1 -7.0 L 14.4 -3.7 L 13.2 -.3 L 12.7 2.9 L 13.1 5.6 L 14.5 7.2 L 16.5 7.4 L 19.7 5.2 L 21.3 2.8 L 22.0 -.5 L 21.5 -2.8 L 20.1 -4.2 L 17.7 -4.3 L 15.8 -3.2 L 14.6 -1.9 L 13.1 1.2","0 15.7 M 13.2 -.7 L 14.3 -3.3 L 15.2 -4.7 L 17.1 -5.2 L 20.7 -5.0 L 23.0 -4.6 L 24.4 -4.4 L 25.9 -5.3 L 22.4 .2 L 17.8 5.8 L 13.3 11.3 L 10.8 14.5 L 9.9 15.2","0 14.1 M 16.3 7.4 L 18.5 6.9 L 20.7 5.4 L 22.0 3.1 L 22.1 .6 L 21.2 -1.4 L 19.8 -3.2 L 17.3 -6.4 L 16.6 -8.3 L 17.0 -10.7 L 17.9 -12.1 L 19.8 -12.8 L 22.3 -12.7 L 24.1 -11.3 L 24.5 -8.8 L 23.8 -6.9 L 21.8 -5.4 L 15.6 -2.5 L 12.9 -.4 L 11.6 2.7 L 12.2 5.6 L 14.1 7.4 L 16.3 7.4","0 14.3 M 7.9 13.2 L 9.6 14.4 L 12.7 14.2 L 15.3 12.8 L 18.6 9.6 L 20.6 5.5 L 21.4 2.2 L 21.7 -1.1 L 21.5 -3.4 L 20.3 -4.8 L 17.4 -5.3 L 15.3 -4.5 L 13.5 -2.3 L 12.3 .6 L 12.2 3.9 L 13.6 6.2 L 15.8 6.7 L 18.2 5.7 L 20.1 3.3 L 21.5 .2","0 7.3 M 14.6 -2.6 L 13.4 -1.2 L 15.0 -2.1 M 11.8 5.7 L 10.7 7.4 L 12.3 6.1","0 7.7 M 15.3 -2.8 L 13.9 -1.4 L 15.2 -1.9 M 12.2 6.0 L 12.7 5.9 L 12.5 8.1 L 11.8 9.7 L 9.9 11.5","0 14.3 M 22.4 -1.8 L 12.9 1.7 L 20.2 5.3","0 13.8 M 12.7 -.3 L 22.0 -.3 M 11.4 3.2 L 20.5 3.3","0 14.3 M 13.8 -1.9 L 21.1 1.5 L 11.4 4.9","0 13.3 M 13.4 5.8 L 12.7 7.5 L 14.1 6.2 M 16.9 2.1 L 15.6 2.2 L 15.2 1.4 L 15.7 -.2 L 17.0 -1.8 L 20.8 -4.2 L 24.1 -6.3 L 25.9 -9.0 L 26.2 -11.4 L 25.5 -13.5 L 23.8 -14.6 L 21.1 -14.6 L 18.7 -13.5 L 17.3 -11.3","0 22.6 M 28.1 7.2 L 26.5 9.1 L 24.1 10.6 L 20.5 11.2 L 17.8 10.5 L 15.0 9.1 L 13.0 6.0 L 12.5 1.0 L 13.8 -3.2 L 16.1 -5.8 L 18.3 -7.2 L 22.0 -8.2 L 25.1 -7.8 L 27.3 -6.6 L 29.4 -3.1 L 29.5 -.1 L 28.4 3.3 L 26.6 4.9 L 24.3 5.8 L 23.2 5.5 L 22.6 4.5 L 22.7 2.5 L 22.9 .9 L 25.6 -3.1 L 24.5 -1.7 L 23.5 -2.7 L 22.4 -2.9 L 21.1 -2.7 L 19.6 -2.1 L 18.1 -.1 L 17.4 2.3 L 17.5 4.1 L 18.6 5.2 L 20.2 4.4 L 24.2 -1.3","0 45.9 M 14.1 -2.5 L 12.7 .3 L 12.9 3.3 L 15.1 6.2 L 18.5 7.2 L 23.3 6.7 L 27.6 4.9 L 31.9 2.3 L 35.2 -.7 L 42.7 -8.5 L 47.8 -13.5 L 51.4 -16.5 L 54.1 -18.0 L 53.4 -16.6 L 51.5 -13.7 L 49.9 -10.7 L 48.5 -5.6 L 47.8 -.9 L 47.5 3.4 L 48.6 6.3 L 49.7 6.9 L 51.3 6.8 L 53.1 5.5 L 54.3 4.1 M 30.9 -11.9 L 31.9 -15.4 L 34.2 -18.3 L 37.2 -20.1 L 42.2 -20.2 L 47.8 -19.4 L 53.6 -17.7 M 33.5 -4.4 L 48.4 -4.8","0 29.1 M 17.9 -14.2 L 20.6 -17.7 L 25.1 -19.9 L 30.2 -20.4 L 34.0 -19.7 L 36.7 -17.5 L 38.0 -14.0 L 37.0 -10.8 L 35.4 -9.4 L 33.2 -8.5 L 29.6 -8.6 L 33.1 -7.3 L 36.0 -4.4 L 36.7 -1.0 L 36.1 2.8 L 33.9 5.8 L 29.8 7.5 L 25.5 7.6 L 21.1 7.1 L 16.6 5.3 L 11.9 2.1 L 14.5 3.1 L 17.3 2.7 L 19.8 1.2 L 22.2 -2.3 L 26.3 -14.6 L 28.7 -18.5 L 30.3 -20.0 L 31.4 -20.9 L 34.4 -22.3","0 25.7 M 36.8 -15.4 L 37.5 -17.9 L 37.1 -19.0 L 34.7 -20.0 L 30.6 -20.7 L 23.7 -19.2 L 19.7 -17.0 L 16.4 -13.2 L 14.3 -7.8 L 13.8 -3.0 L 15.1 2.6 L 18.8 6.2 L 22.1 7.5 L 26.1 7.8 L 29.3 7.3 L 31.3 6.8 L 32.7 4.5 L 34.2 .1","0 36.6 M 17.1 -12.9 L 18.3 -16.4 L 21.9 -19.4 L 26.5 -20.5 L 32.0 -19.6 L 36.0 -17.9 L 40.1 -14.2 L 43.2 -9.4 L 44.7 -4.4 L 44.4 .7 L 42.1 4.5 L 39.3 6.4 L 34.9 7.5 L 29.0 6.8 L 24.3 5.4 L 19.1 3.9 L 16.5 3.4 L 13.8 3.9 L 12.1 5.4 L 11.8 6.8 L 14.8 7.6 L 19.2 6.8 L 21.2 5.8 L 23.8 3.9 L 26.1 .2 L 28.5 -4.6 L 30.6 -11.9 L 33.1 -16.3 L 35.3 -19.0 L 37.2 -20.2 L 39.9 -21.3","0 23.2 M 33.2 -15.7 L 33.7 -17.5 L 33.4 -19.2 L 31.7 -20.0 L 27.7 -20.5 L 24.0 -19.7 L 21.2 -16.4 L 21.3 -12.8 L 23.6 -11.0 L 25.7 -10.3 L 22.4 -9.8 L 17.4 -8.0 L 14.7 -4.8 L 13.4 .2 L 14.7 4.8 L 18.1 7.5 L 22.9 7.6 L 26.9 6.6 L 28.4 6.0 L 29.5 4.7 L 30.8 .5","0 28.8 M 14.4 -2.7 L 12.3 .2 L 12.4 3.5 L 14.7 6.6 L 17.7 7.4 L 21.9 7.1 L 24.8 6.2 L 27.7 4.1 L 30.7 .4 L 32.8 -4.0 L 35.0 -11.1 L 36.3 -14.7 L 37.5 -16.7 L 39.0 -18.2 L 41.0 -19.4 L 46.0 -18.9 L 36.2 -20.0 L 30.2 -20.1 L 25.3 -18.7 L 22.8 -16.5 L 21.7 -14.1 M 24.6 -5.8 L 24.8 -5.8 L 29.6 -6.5 L 32.5 -6.7 L 38.9 -6.7","0 26.0 M 11.1 3.8 L 9.0 6.2 L 8.3 9.5 L 9.3 13.1 L 12.6 15.4 L 17.2 16.0 L 23.4 13.9 L 27.7 10.3 L 30.9 4.8 L 33.2 -2.2 L 31.0 1.2 L 28.5 3.0 L 25.1 3.8 L 22.0 3.4 L 19.4 1.1 L 18.9 -3.8 L 20.9 -10.3 L 23.6 -14.6 L 28.4 -18.6 L 32.8 -20.5 L 37.5 -20.5 L 39.6 -19.0 L 39.8 -16.9 L 38.2 -13.6","0 39.6 M 22.6 -11.7 L 22.4 -15.1 L 24.0 -18.2 L 27.2 -19.9 L 31.5 -20.4 L 34.9 -20.0 L 37.7 -19.3 L 35.1 -17.2 L 33.9 -15.2 L 32.0 -9.8 L 29.4 -1.8 L 26.6 3.1 L 23.1 6.3 L 19.5 7.5 L 16.0 7.8 L 13.3 6.3 L 12.3 4.1 L 13.0 1.3 L 15.9 -1.8 L 19.6 -3.5 L 24.4 -4.3 L 28.0 -4.4 L 34.5 -4.4 L 41.7 -3.0 L 46.4 -1.9 M 61.0 -18.9 L 61.4 -20.4 L 60.5 -21.7 L 58.3 -21.8 L 55.8 -21.0 L 52.7 -18.9 L 49.9 -15.7 L 46.6 -10.1 L 44.4 -4.7 L 42.8 1.0 L 42.2 5.1 L 42.7 7.1 L 44.3 7.3 L 46.2 5.9 L 48.0 3.7","0 25.7 M 15.7 -.8 L 12.9 2.2 L 12.8 4.7 L 15.0 6.6 L 19.0 7.4 L 23.4 6.7 L 26.9 4.9 L 30.1 2.0 L 32.5 -1.9 L 34.6 -7.4 L 35.7 -11.6 L 36.9 -15.1 L 38.7 -17.8 L 42.2 -20.5 L 37.5 -19.6 L 32.4 -16.9 L 28.7 -13.2 L 26.4 -8.9 L 26.2 -4.3 L 27.7 -1.0 L 30.7 .2 L 32.9 .2 L 33.6 -.5","0 29.2 M 21.5 -.3 L 16.5 1.7 L 12.6 4.6 L 10.3 8.4 L 10.1 11.8 L 11.2 14.4 L 14.1 15.7 L 17.8 15.8 L 22.2 14.9 L 26.6 12.3 L 30.9 7.8 L 34.0 3.1 L 37.4 -4.9 L 39.3 -12.0 L 40.3 -15.4 L 41.6 -17.3 L 45.5 -20.2 L 39.3 -19.1 L 35.6 -16.8 L 32.1 -13.4 L 30.0 -9.4 L 29.5 -5.5 L 30.5 -1.8 L 32.5 -.2 L 36.2 .1 L 37.8 -.7","0 42.8 M 15.1 -2.6 L 13.0 -.6 L 12.2 2.6 L 13.0 5.3 L 15.9 7.2 L 21.0 7.3 L 25.6 5.8 L 28.3 3.7 L 30.6 .5 L 32.0 -2.4 L 34.2 -11.9 L 35.7 -15.7 L 37.1 -17.6 L 39.5 -19.4 L 33.4 -20.6 L 28.0 -20.0 L 23.2 -16.8 L 21.2 -13.6 L 20.7 -11.0 L 21.1 -7.3 M 53.4 -16.7 L 53.6 -16.9 L 53.3 -19.6 L 51.9 -20.2 L 49.7 -19.6 L 45.7 -17.6 L 41.3 -13.9 L 38.8 -11.1 L 36.3 -8.0 L 37.7 -3.2 L 39.5 1.8 L 42.4 5.7 L 46.4 7.5 L 48.8 7.0 L 50.4 5.3","0 29.9 M 40.8 -14.5 L 41.3 -17.6 L 40.6 -19.4 L 38.2 -20.4 L 35.7 -19.6 L 32.9 -18.0 L 30.3 -14.6 L 28.3 -10.4 L 26.8 -5.4 L 24.6 1.1 L 22.7 3.6 L 19.8 6.7 L 14.9 7.7 L 12.2 7.0 L 11.1 6.0 L 11.5 3.9 L 14.1 2.5 L 16.7 2.4 L 19.9 3.6 L 23.7 5.6 L 27.5 7.2 L 30.9 7.6 L 34.6 6.7 L 36.7 5.4 L 38.0 3.4","0 55.6 M 15.7 -6.1 L 13.1 -2.8 L 13.0 1.9 L 15.6 5.1 L 19.7 7.2 L 25.2 6.8 L 29.2 5.1 L 33.8 2.1 L 38.8 -2.8 L 42.8 -7.5 L 50.1 -17.7 M 50.8 -17.8 L 50.8 -17.8 M 64.2 3.9 L 61.7 6.5 L 59.5 7.3 L 58.0 5.9 L 57.6 3.9 L 57.4 -1.6 L 59.3 -9.0 L 61.7 -13.7 L 64.1 -17.6 L 67.5 -21.3 L 61.4 -16.3 L 55.4 -10.5 L 47.7 -.9 L 43.0 6.9 L 44.6 -1.6 L 46.8 -9.2 L 50.0 -17.6 M 27.5 -12.2 L 28.7 -16.5 L 31.9 -19.4 L 35.9 -20.3 L 39.2 -20.4 L 43.7 -19.6 L 46.8 -18.8 L 50.2 -17.7","0 45.5 M 14.5 -4.4 L 13.2 -2.0 L 12.7 1.8 L 14.0 4.4 L 16.4 6.2 L 21.2 7.1 L 25.6 6.1 L 29.3 3.7 L 31.9 .7 L 34.6 -3.0 L 36.2 -7.5 L 37.6 -11.3 L 39.0 -19.3 M 24.0 -16.5 L 26.6 -19.4 L 29.7 -20.3 L 33.9 -19.7 L 36.8 -18.3 L 39.8 -15.9 L 42.2 -12.8 L 44.9 -8.8 L 46.6 -5.5 L 48.9 -.1 L 50.0 3.4 L 50.7 6.7 L 51.5 1.3 L 53.2 -5.8 L 55.9 -12.0 L 59.1 -17.1 L 62.0 -20.0 L 64.6 -20.7 L 66.3 -19.9 L 66.8 -18.5 L 67.1 -17.0","0 27.9 M 17.7 5.9 L 17.9 5.9 L 23.1 7.5 L 27.8 6.7 L 32.5 4.0 L 36.2 -1.2 L 37.9 -6.2 L 38.4 -10.7 L 37.3 -15.6 L 34.0 -18.9 L 29.8 -20.2 L 24.3 -19.1 L 20.2 -17.1 L 16.7 -13.0 L 14.5 -8.6 L 13.5 -4.1 L 13.8 -.1 L 15.2 3.4 L 17.7 5.9","0 35.8 M 15.2 -4.0 L 12.8 -1.7 L 12.7 2.1 L 13.8 5.1 L 16.9 7.1 L 21.3 7.4 L 25.6 6.1 L 29.4 2.5 L 31.6 -1.5 L 33.7 -6.4 L 35.4 -12.3 L 36.7 -15.6 L 39.2 -19.7 L 40.2 -20.7 L 43.4 -22.4 M 24.7 -11.4 L 25.0 -11.4 L 25.9 -14.0 L 27.5 -16.4 L 30.1 -18.4 L 34.8 -20.1 L 39.0 -20.3 L 42.8 -19.9 L 46.0 -17.4 L 47.9 -14.0 L 48.0 -9.6 L 46.2 -5.7 L 43.2 -3.2 L 39.2 -2.6 L 35.2 -3.2 L 32.1 -5.1 L 30.9 -8.0","0 26.1 M 22.0 .8 L 21.7 .9 L 19.5 1.5 L 16.8 .1 L 14.9 -3.5 L 15.2 -8.0 L 16.1 -12.0 L 18.6 -16.0 L 21.4 -18.5 L 24.1 -19.9 L 28.5 -20.7 L 32.1 -19.6 L 35.1 -16.5 L 36.1 -13.0 L 36.1 -8.0 L 34.5 -3.5 L 31.9 .3 L 28.1 3.5 L 23.9 5.6 L 20.1 6.6 L 13.2 6.4 L 14.2 5.9 L 20.3 8.4 L 25.5 11.1 L 31.5 13.9 L 36.6 15.0 L 39.3 14.6 L 41.5 13.5 L 43.3 12.0","0 39.1 M 15.1 -2.6 L 12.8 -.2 L 12.3 3.6 L 14.1 6.5 L 16.4 7.4 L 18.5 7.5 L 23.3 6.3 L 26.8 3.7 L 29.3 -.3 L 31.8 -5.4 L 32.9 -9.1 L 34.3 -13.9 L 36.5 -18.8 L 38.1 -20.2 L 39.0 -21.1 L 41.5 -22.4 M 24.1 -14.0 L 24.4 -14.2 L 26.9 -16.9 L 30.6 -19.0 L 35.4 -20.4 L 40.2 -20.4 L 43.7 -18.7 L 45.6 -14.3 L 45.4 -10.8 L 42.9 -7.7 L 41.0 -6.7 L 38.8 -6.2 L 35.8 -6.4 L 37.1 -.1 L 39.5 5.2 L 42.9 7.3 L 45.4 7.4 L 46.8 6.6 L 48.4 4.9","0 22.2 M 14.4 -1.9 L 12.8 -.1 L 12.2 3.1 L 13.9 6.2 L 17.4 7.5 L 21.6 7.7 L 25.3 6.6 L 27.7 5.0 L 29.3 2.0 L 29.2 -2.1 L 27.5 -5.4 L 23.3 -11.7 L 22.4 -14.6 L 23.0 -17.5 L 25.5 -19.7 L 28.9 -20.5 L 31.5 -19.4 L 32.2 -17.0 L 31.7 -14.6","0 26.6 M 13.7 -.9 L 12.3 .8 L 12.3 4.0 L 13.4 5.9 L 16.6 7.3 L 21.0 7.2 L 24.8 5.9 L 27.8 3.7 L 30.6 .1 L 32.5 -4.8 L 34.2 -9.7 L 35.5 -12.3 L 37.4 -15.1 L 39.2 -16.8 L 40.3 -17.4 L 41.4 -18.0 L 42.2 -18.6 L 45.0 -17.7 L 35.8 -19.9 L 29.8 -20.3 L 24.5 -19.6 L 20.4 -16.8 L 18.5 -14.3 L 17.9 -11.5 L 17.9 -9.7","0 34.6 M 13.5 -6.3 L 13.2 -10.9 L 14.8 -15.2 L 16.5 -17.6 L 19.8 -19.4 L 24.4 -20.3 L 27.9 -19.9 L 31.1 -19.1 L 26.8 -14.6 L 23.0 -9.1 L 21.0 -3.7 L 20.3 2.1 L 21.7 6.4 L 24.8 7.6 L 29.7 5.5 L 34.3 1.0 L 38.7 -5.8 L 44.0 -16.0 L 45.5 -19.6 L 46.6 -19.9 L 43.5 -14.0 L 40.9 -8.1 L 39.2 -2.6 L 38.5 1.7 L 38.3 4.7 L 39.1 7.0 L 41.3 6.8 L 42.4 6.1 L 44.3 4.3","0 30.6 M 12.9 -9.7 L 14.3 -14.1 L 16.3 -17.3 L 19.5 -19.7 L 22.9 -20.2 L 26.4 -18.6 L 28.2 -15.6 L 29.4 -11.8 L 29.5 -7.3 L 29.3 -2.3 L 28.6 1.9 L 26.7 7.1 L 37.6 -3.4 L 41.4 -8.5 L 42.9 -12.2 L 42.9 -15.9 L 42.3 -18.2 L 40.9 -19.7 L 39.5 -20.2 L 37.8 -19.7 L 36.4 -18.0","0 37.6 M 12.8 -11.2 L 14.0 -16.3 L 16.5 -19.3 L 20.4 -20.8 L 23.8 -19.9 L 26.4 -17.1 L 27.3 -13.0 L 27.3 -8.3 L 26.7 -4.4 L 25.9 -.3 L 25.2 2.3 L 23.5 7.0 L 27.4 -1.2 L 32.1 -9.3 L 35.7 -14.2 L 39.3 -18.1 L 36.0 -14.3 L 35.5 -12.6 L 35.7 -4.5 L 36.1 .9 L 35.9 6.9 L 38.0 4.7 L 42.3 -.5 L 46.7 -5.9 L 49.6 -10.8 L 50.5 -14.5 L 50.5 -18.4 L 50.1 -19.5 L 49.2 -20.1 L 47.7 -20.0 L 46.5 -17.7","0 37.2 M 14.7 .2 L 13.2 2.9 L 12.6 5.3 L 14.7 7.1 L 18.9 7.2 L 22.2 5.2 L 25.3 2.4 L 28.0 -1.2 L 34.0 -11.1 L 38.1 -16.3 L 41.6 -18.8 L 44.3 -20.0 L 46.0 -20.4 L 47.3 -19.8 L 47.4 -18.2 L 46.9 -14.9 M 23.8 -15.4 L 25.9 -18.9 L 27.6 -19.9 L 29.0 -19.5 L 29.7 -17.7 L 30.3 -14.3 L 31.1 -8.9 L 33.1 -1.4 L 35.9 3.9 L 39.1 6.9 L 42.4 7.4 L 44.7 5.4 L 45.9 3.7","0 30.5 M 23.9 -17.4 L 26.6 -19.7 L 28.3 -20.2 L 30.0 -19.2 L 29.8 -16.5 L 28.9 -13.6 L 27.6 -9.7 L 26.8 -6.1 L 26.1 -3.0 L 26.5 -.6 L 28.3 1.3 L 31.8 .6 L 34.8 -1.4 L 38.5 -5.7 L 41.7 -9.5 L 47.5 -20.0 L 48.3 -20.0 L 40.2 -5.1 L 36.1 1.7 L 33.0 5.6 L 28.8 9.5 L 23.1 12.4 L 16.0 12.5 L 12.3 10.0 L 10.9 6.7 L 11.4 1.9 L 13.8 -1.5 L 16.5 -3.3 L 19.2 -3.6","0 28.8 M 21.6 -13.7 L 22.9 -17.2 L 24.6 -19.1 L 27.5 -20.0 L 29.2 -20.0 L 33.5 -19.6 L 39.4 -18.1 L 40.8 -19.4 L 13.0 7.5 L 15.3 5.5 L 16.5 5.3 L 20.4 6.5 L 25.5 7.6 L 29.2 7.7 L 32.2 6.9 L 35.2 4.5 L 37.2 1.3","0 15.1 M 28.2 -19.7 L 21.9 -19.6 L 14.6 11.9 L 20.0 11.9","0 9.9 M 11.0 -20.0 L 16.8 9.5","0 15.9 M 19.2 -19.4 L 25.0 -19.6 L 17.5 11.8 L 11.1 11.9","0 12.9 M 12.3 -.5 L 17.9 -7.7 L 20.7 -.6","0 16.3 M 9.0 10.3 L 14.3 9.7 L 22.9 9.6","0 7.4 M 11.5 -9.1 L 14.8 -7.1","0 13.7 M 21.0 -2.0 L 18.5 -2.9 L 15.9 -2.4 L 13.4 -.2 L 11.9 2.5 L 11.6 4.6 L 12.0 6.2 L 13.0 7.2 L 14.0 7.0 L 15.6 5.8 L 17.5 3.7 L 21.0 -1.7 L 22.0 -2.9 L 19.9 .5 L 18.8 2.9 L 18.5 5.5 L 18.7 7.1 L 19.2 7.5 L 20.4 7.1 L 21.7 5.7","0 12.3 M 12.7 1.9 L 14.9 -.9 L 17.2 -2.4 L 18.7 -2.6 L 19.8 -1.0 L 19.9 1.5 L 18.9 3.7 L 17.1 5.6 L 14.9 7.3 L 13.4 7.4 L 12.5 7.1 L 12.0 5.6 L 12.3 3.2 L 14.9 -5.8 L 18.8 -14.7 L 21.2 -19.5 L 24.9 -23.4 L 28.0 -25.0 L 29.9 -25.6 L 31.2 -25.4 L 32.8 -24.7 L 33.2 -22.8","0 9.5 M 17.5 -.9 L 17.8 -1.0 L 18.0 -2.1 L 17.2 -2.9 L 15.1 -3.2 L 13.2 -.9 L 11.7 1.9 L 11.5 5.5 L 12.4 7.1 L 14.0 7.3 L 15.6 6.5 L 17.4 4.8","0 13.6 M 37.9 -23.9 L 37.9 -24.7 L 37.3 -25.4 L 35.5 -25.4 L 33.9 -24.8 L 31.5 -22.9 L 29.1 -20.5 L 26.1 -15.4 L 21.8 -6.3 L 19.3 1.3 L 17.8 3.6 L 16.2 5.6 L 14.6 6.9 L 12.5 7.1 L 11.9 5.3 L 12.1 3.0 L 12.8 .3 L 15.3 -2.2 L 18.5 -3.2 L 19.9 -2.2 L 19.8 .1 L 18.8 3.9 L 18.5 6.4 L 19.3 7.5 L 20.4 7.1 L 22.0 5.7","0 10.1 M 12.8 1.7 L 13.5 1.8 L 16.5 .7 L 18.1 -.4 L 18.6 -1.8 L 17.7 -2.9 L 16.4 -2.9 L 14.3 -2.0 L 12.9 .3 L 11.9 3.7 L 12.0 6.3 L 13.3 7.5 L 15.6 7.2 L 18.0 5.8","0 7.8 M -2.9 15.8 L -2.8 17.4 L .3 18.6 L 3.7 17.7 L 7.5 14.6 L 10.2 10.2 L 12.2 5.9 L 14.1 .2 L 16.2 -6.1 L 18.2 -11.4 L 20.7 -16.3 L 23.3 -20.4 L 25.8 -22.8 L 28.0 -23.8 L 29.2 -24.2 L 31.0 -24.3 L 32.1 -23.8 L 32.7 -23.0 L 32.9 -21.8 M 11.5 -2.5 L 12.1 -2.6 L 13.7 -3.0 L 20.2 -3.0","0 10.3 M 14.9 -2.6 L 12.4 -.6 L 11.5 1.7 L 11.5 3.7 L 12.9 5.3 L 14.7 5.0 L 16.0 4.0 L 17.0 2.5 L 17.8 .2 L 17.6 -1.4 L 16.9 -2.3 L 15.5 -2.6 L 17.5 -2.7 L 18.6 -3.0 L 19.4 -3.5 L 18.6 -2.9 L 16.8 -2.7 L 17.6 -.1 L 16.9 2.4 L 16.1 4.0 L 14.8 7.0 L 14.8 8.9 L 16.2 10.9 L 17.2 14.0 L 16.3 16.3 L 15.2 17.7 L 12.9 18.7 L 9.8 18.7 L 6.9 17.2 L 5.3 14.9 L 5.4 13.0 L 6.1 11.5 L 7.9 10.1","0 13.9 M 34.0 -22.5 L 33.8 -24.4 L 32.8 -25.3 L 30.4 -25.3 L 26.5 -23.4 L 22.8 -19.4 L 19.0 -13.6 L 17.0 -9.1 L 13.7 -.1 L 11.6 7.3 L 14.0 3.3 L 17.0 -.7 L 19.4 -2.4 L 20.5 -2.9 L 21.7 -2.7 L 21.1 -.9 L 20.4 .3 L 19.2 3.2 L 18.5 5.7 L 18.7 6.9 L 19.6 7.5 L 21.0 7.1 L 21.9 6.0","0 7.3 M 11.8 -.7 L 14.8 -2.6 L 12.9 1.2 L 11.7 4.7 L 11.5 6.7 L 12.6 7.4 L 13.3 7.1 L 14.9 5.7 M 18.4 -9.4 L 15.7 -6.1","0 6.6 M 11.2 -1.2 L 14.1 -2.6 L 12.0 4.8 L 9.2 11.0 L 6.1 15.2 L 2.6 17.7 L -.8 18.6 L -2.8 18.2 L -3.6 17.2 L -4.0 15.3 M 17.6 -9.2 L 15.2 -6.1","0 12.6 M 11.9 7.0 L 14.1 -2.1 L 17.1 -10.8 L 20.0 -16.3 L 22.9 -20.4 L 26.0 -23.4 L 28.8 -25.3 L 31.0 -25.9 L 33.4 -25.3 L 33.9 -24.3 L 33.9 -22.6 M 12.7 4.1 L 14.6 .1 L 16.7 -2.1 L 18.8 -2.9 L 20.1 -2.1 L 20.6 -.7 L 19.8 .3 L 18.6 1.4 L 15.6 1.9 L 16.0 4.2 L 16.7 5.9 L 17.7 7.2 L 19.2 7.7 L 20.4 7.3 L 21.2 6.3","0 6.4 M 15.4 5.5 L 14.1 6.8 L 12.5 7.3 L 11.5 6.9 L 11.4 5.0 L 12.7 -.4 L 14.2 -5.7 L 16.7 -11.2 L 19.7 -17.0 L 23.6 -21.9 L 25.9 -24.1 L 27.9 -24.9 L 29.4 -25.0 L 29.8 -24.8 L 30.5 -23.8 L 30.5 -22.8","0 19.0 M 11.8 -1.0 L 12.9 -2.4 L 14.2 -2.8 L 14.6 -2.6 L 14.4 -1.3 L 11.6 7.1 L 15.1 .8 L 17.2 -2.0 L 18.7 -2.8 L 20.2 -2.7 L 20.4 -1.2 L 20.1 .8 L 18.0 7.2 L 20.0 2.4 L 22.2 -.8 L 23.4 -2.2 L 25.0 -2.9 L 26.0 -2.8 L 26.6 -2.2 L 26.6 -1.1 L 24.5 4.8 L 24.5 6.7 L 25.3 7.5 L 26.3 6.8 L 27.7 5.8","0 14.0 M 11.8 -1.5 L 13.1 -2.6 L 14.1 -2.9 L 14.8 -2.3 L 14.2 -.1 L 13.1 3.1 L 11.6 7.3 L 14.5 2.4 L 16.2 -.4 L 17.7 -1.9 L 20.0 -2.7 L 21.3 -2.6 L 20.9 -.8 L 19.8 1.3 L 19.0 4.1 L 18.8 6.5 L 19.9 7.3 L 21.2 6.8 L 22.2 5.6","0 10.9 M 14.8 -2.1 L 12.6 .5 L 11.9 3.8 L 12.2 6.5 L 13.8 7.6 L 16.5 6.2 L 17.9 4.1 L 18.9 .7 L 18.7 -1.7 L 17.8 -2.6 L 16.1 -2.6 L 14.8 -2.1","0 12.6 M 13.0 -2.7 L 15.2 -4.2 L 15.9 -3.8 L 13.9 .9 L 10.9 8.6 L 9.5 13.1 L 8.9 17.5 L 9.5 18.7 L 11.5 18.1 M 13.0 2.2 L 16.1 -1.0 L 18.3 -2.4 L 19.2 -2.5 L 20.4 -1.2 L 20.2 2.4 L 19.4 4.3 L 17.7 6.2 L 15.6 7.6 L 13.0 7.5 L 11.2 6.1","0 12.6 M 20.4 -1.8 L 19.7 -2.8 L 16.9 -2.9 L 13.9 -1.2 L 11.8 1.6 L 10.9 4.1 L 11.2 6.4 L 11.9 7.4 L 13.1 7.1 L 15.0 5.8 L 17.5 3.4 L 20.2 -1.0 L 21.6 -2.4 L 17.4 4.8 L 15.2 11.0 L 13.9 16.8 L 13.9 18.0 L 14.7 18.3 L 16.6 18.3","0 9.6 M 11.5 -1.4 L 13.2 -2.6 L 14.3 -2.7 L 14.4 -1.8 L 14.4 -.3 L 11.9 7.5 L 14.5 1.8 L 16.3 -1.4 L 17.5 -2.3 L 18.6 -2.8 L 19.8 -2.3","0 9.0 M 10.2 4.8 L 9.8 6.1 L 10.8 7.3 L 13.7 7.8 L 15.2 6.4 L 15.6 4.5 L 14.8 2.5 L 13.2 .4 L 13.1 -1.3 L 14.3 -2.8 L 16.2 -3.0 L 17.1 -2.5 L 17.3 -1.0","0 8.3 M 17.2 -8.6 L 14.5 -2.9 L 12.3 3.0 L 12.0 5.7 L 12.7 7.3 L 14.6 7.3 L 16.5 5.2 M 11.7 -2.8 L 13.1 -3.1 L 18.3 -3.0","0 13.9 M 12.2 -.9 L 15.4 -3.1 L 12.8 1.8 L 11.6 5.5 L 12.0 6.7 L 13.1 7.3 L 15.3 6.4 L 19.4 1.0 L 21.0 -2.5 L 21.4 -2.7 L 19.0 3.0 L 19.2 6.5 L 19.9 7.5 L 21.1 7.4 L 22.1 6.3","0 12.9 M 11.5 -1.4 L 12.9 -2.5 L 14.5 -2.2 L 14.2 -.4 L 13.7 3.2 L 12.6 7.2 L 16.6 5.8 L 19.3 3.6 L 20.7 .9 L 21.0 -1.9 L 20.3 -2.7 L 18.7 -2.2","0 17.3 M 10.8 -2.0 L 12.7 -2.9 L 13.7 -2.0 L 14.1 .2 L 13.3 6.8 L 19.6 -1.8 L 18.8 -1.6 L 18.0 2.9 L 18.1 5.9 L 18.8 7.3 L 20.7 7.3 L 22.5 5.8 L 24.2 3.9 L 25.2 1.8 L 25.3 -.4 L 24.8 -2.0 L 24.2 -2.7 L 23.3 -2.6 L 22.8 -1.9","0 12.2 M 12.1 -1.0 L 13.2 -2.7 L 14.1 -3.0 L 14.5 -1.9 L 14.6 2.2 L 16.0 5.4 L 17.4 7.3 L 18.8 7.5 L 19.4 6.8 L 20.3 5.8 M 21.1 -.6 L 21.2 -2.3 L 20.5 -2.9 L 19.0 -2.6 L 17.8 -1.6 L 16.6 -.3 L 13.5 4.8 L 12.4 6.4 L 10.6 7.3 L 9.6 7.1 L 9.6 5.6","0 13.3 M 12.2 -.7 L 15.2 -2.7 L 12.8 1.7 L 11.9 5.3 L 12.2 7.0 L 13.6 7.4 L 16.0 5.7 L 18.3 2.5 L 21.0 -2.0 L 21.5 -2.6 L 18.8 5.0 L 15.9 11.6 L 14.2 15.0 L 11.4 17.4 L 9.6 18.5 L 5.6 18.7 L 3.8 17.9 L 2.6 16.4 L 2.2 14.3 L 2.5 13.2 L 3.2 12.2","0 11.2 M 12.3 -1.2 L 13.6 -2.5 L 14.3 -3.0 L 16.5 -2.6 L 18.2 -2.3 L 20.2 -2.8 L 9.8 7.5 L 11.4 6.5 L 12.4 6.5 L 14.4 7.4 L 15.5 7.6 L 17.6 7.1 L 19.3 4.7","0 13.9 M 26.5 -19.6 L 23.2 -19.3 L 20.8 -17.0 L 19.7 -13.4 L 19.4 -9.2 L 18.6 -6.5 L 17.2 -5.1 L 14.6 -4.1 L 16.8 -3.2 L 17.6 -1.7 L 17.1 .7 L 15.1 5.3 L 14.4 7.7 L 14.8 10.4 L 15.7 11.5 L 18.5 11.9","0 7.9 M 13.4 -20.2 L 13.5 18.3","0 13.5 M 18.0 -19.6 L 20.2 -19.4 L 22.0 -18.0 L 22.6 -16.4 L 21.7 -12.9 L 20.0 -9.0 L 19.4 -7.1 L 19.5 -5.2 L 20.5 -4.3 L 21.9 -3.8 L 20.0 -2.8 L 18.0 -1.0 L 17.0 1.4 L 17.0 4.0 L 16.7 6.7 L 16.3 8.4 L 15.3 10.3 L 13.3 11.7 L 10.8 11.8 L 10.1 11.8","0 17.9 M 12.2 1.6 L 14.2 .1 L 15.4 -.6 L 16.6 -.6 L 18.5 .2 L 19.7 1.1 L 21.6 1.7 L 23.7 .7 L 25.3 -.8","0 5.5 M 15.6 -9.2 L 14.1 -8.6 L 13.4 -8.0 L 13.1 -6.4 L 14.5 -5.2 L 16.4 -5.6 L 17.5 -6.7 L 17.6 -8.5 L 17.0 -9.1 L 15.6 -9.2"]
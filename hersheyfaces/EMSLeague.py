@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 15.3 M 23.2 -12.1 L 20.4 -8.4 L 17.6 -4.3 L 15.2 -.5 L 13.3 3.8 M 11.6 6.2 L 10.9 7.3 L 11.8 8.0 L 12.5 7.1 L 11.6 6.2","0 10.7 M 13.4 -10.4 L 13.3 -8.6 L 12.7 -6.8 L 11.4 -5.3 L 10.1 -4.2 M 15.9 -10.4 L 15.8 -8.4 L 15.3 -7.0 L 14.2 -5.7 L 12.6 -4.1","0 23.3 M 23.3 -11.9 L 9.6 9.3 M 30.2 -11.8 L 16.5 9.4 M 11.2 2.2 L 24.9 2.4 M 15.0 -5.4 L 29.2 -5.4","0 22.8 M 27.1 -8.0 L 28.8 -9.0 L 29.9 -10.2 L 30.6 -11.9 L 30.5 -13.4 L 29.7 -14.6 L 28.6 -15.3 L 27.2 -15.6 L 25.4 -15.3 L 23.3 -14.2 L 21.9 -11.9 L 21.3 -9.4 L 21.5 -7.5 L 21.6 -5.1 L 22.2 -1.8 L 22.3 1.3 L 21.8 4.2 L 20.2 7.4 L 18.0 9.0 L 15.1 10.0 L 12.6 9.8 L 10.4 8.5 L 9.4 6.0 L 9.8 3.9 L 11.8 1.9 M 30.2 -17.6 L 11.3 11.9","0 20.7 M 17.8 -12.5 L 16.2 -11.8 L 16.0 -10.5 L 16.7 -9.3 L 18.6 -9.0 L 19.6 -10.4 L 19.3 -11.7 L 18.0 -12.5 L 17.8 -12.5 M 17.9 4.8 L 16.3 5.5 L 16.1 6.8 L 16.7 8.0 L 18.7 8.3 L 19.7 6.9 L 19.4 5.5 L 18.1 4.8 L 17.9 4.8 M 24.6 -12.8 L 11.1 8.5","0 28.0 M 30.7 6.6 L 28.5 9.1 L 25.8 10.5 L 24.1 10.9 L 22.7 10.7 L 20.8 9.6 L 20.1 7.5 L 20.3 5.1 L 21.5 1.8 L 22.9 -1.2 L 24.9 -4.6 L 27.2 -8.2 L 29.2 -11.1 L 31.3 -12.9 L 32.8 -13.3 L 34.1 -12.8 L 34.3 -12.0 L 34.0 -10.7 L 32.9 -9.6 L 31.0 -8.5 L 28.3 -7.7 L 24.2 -6.4 L 19.4 -5.0 L 15.8 -3.1 L 12.7 -.1 L 11.3 2.7 L 10.9 5.8 L 11.8 8.5 L 13.8 10.2 L 16.4 10.9 L 18.8 10.9 L 22.4 9.7 L 25.2 7.6 L 27.0 5.7 L 28.9 3.0","0 6.3 M 17.7 -11.8 L 14.7 -5.6","0 9.7 M 26.4 -15.0 L 23.6 -12.7 L 20.6 -10.2 L 17.5 -6.7 L 15.2 -3.9 L 13.4 -.8 L 11.9 3.4 L 11.3 6.3 L 11.2 8.7 L 11.3 11.2","0 14.9 M 20.1 -14.0 L 20.1 -8.8 L 18.9 -3.9 L 16.8 -.2 L 14.5 3.2 L 11.6 6.6 L 8.7 9.3 L 5.1 12.1","0 11.0 M 13.7 -11.9 L 13.8 -4.9 M 11.2 -10.7 L 16.1 -5.9 M 10.4 -8.3 L 10.6 -8.3 L 16.9 -8.2 M 11.3 -5.8 L 16.0 -10.5","0 20.2 M 21.6 -7.0 L 13.0 6.3 M 11.0 -.9 L 24.7 -.8","0 5.4 M 12.3 6.7 L 11.3 7.7 L 10.6 6.7 L 11.4 5.8 L 12.3 6.7 M 11.8 7.1 L 12.1 7.6 L 11.5 8.5 L 10.1 9.0","0 17.7 M 9.7 .7 L 24.0 .8","0 6.5 M 11.5 6.1 L 10.7 7.1 L 11.7 8.0 L 12.7 7.1 L 11.5 6.1","0 23.8 M 31.6 -16.8 L 12.6 13.0","0 19.0 M 25.0 -14.6 L 22.3 -14.6 L 19.8 -13.6 L 17.0 -11.6 L 13.9 -8.1 L 12.0 -5.2 L 10.7 -1.5 L 10.0 1.1 L 9.9 4.5 L 10.7 6.6 L 12.1 7.7 L 14.0 8.3 L 16.2 8.0 L 18.7 6.5 L 20.9 4.3 L 23.1 1.2 L 24.4 -1.7 L 25.5 -4.4 L 25.9 -6.3 L 26.3 -8.4 L 25.7 -11.0 L 25.1 -12.2 L 24.0 -12.9 L 22.8 -13.3 L 21.8 -13.3 L 20.8 -12.8 L 20.0 -11.6 L 20.1 -10.7 L 21.0 -9.7 L 21.8 -9.4 L 22.8 -9.3","0 14.2 M 11.7 -9.3 L 14.8 -9.4 L 17.8 -9.9 L 21.3 -11.0 L 24.0 -12.5 L 25.6 -13.6 L 27.1 -14.9 L 10.7 7.8","0 19.9 M 23.9 -11.3 L 22.9 -8.9 L 21.5 -7.8 L 19.7 -7.6 L 18.7 -8.3 L 18.5 -9.2 L 19.4 -11.6 L 21.7 -13.6 L 23.9 -14.3 L 25.7 -14.5 L 27.9 -14.4 L 29.8 -13.0 L 30.5 -11.1 L 29.9 -8.5 L 28.6 -6.7 L 27.1 -5.4 L 23.0 -2.9 L 17.8 .4 L 12.9 4.2 L 10.5 6.6 L 9.7 7.3 L 9.9 8.0 L 10.5 8.3 L 13.2 7.3 L 14.9 6.6 L 16.1 6.4 L 17.5 6.4 L 19.0 6.9 L 20.8 7.8 L 22.1 8.6 L 23.4 8.6 L 24.1 8.5 L 24.7 7.8","0 20.3 M 21.8 -12.8 L 23.6 -13.9 L 25.7 -14.2 L 27.1 -14.0 L 28.6 -12.9 L 29.4 -11.2 L 29.2 -9.3 L 28.5 -7.3 L 26.9 -6.0 L 25.7 -5.4 L 24.6 -5.1 L 23.0 -4.9 L 21.6 -5.0 L 20.3 -5.4 L 19.5 -6.0 L 19.7 -6.6 L 20.1 -7.2 L 21.5 -7.1 L 22.7 -6.4 L 23.6 -5.7 L 24.8 -3.9 L 25.5 -2.1 L 25.4 1.0 L 24.4 3.5 L 22.8 5.7 L 20.9 7.6 L 18.2 9.2 L 15.9 9.8 L 13.6 9.9 L 11.3 9.5 L 9.4 8.0 L 9.1 5.2 L 9.3 3.5 L 10.6 1.9 L 11.6 1.3 L 12.6 1.2 L 13.8 1.9 L 14.1 3.4 L 13.5 4.4 L 12.6 5.0","0 20.4 M 15.7 8.1 L 33.2 -14.1 L 27.9 -10.3 L 22.6 -6.6 L 17.1 -4.0 L 11.5 -1.5 L 14.7 -1.9 L 20.6 -1.7 L 22.9 -1.4 L 25.2 -.8 L 26.3 -.1 L 27.2 .8 L 27.7 1.5","0 20.8 M 30.9 -13.3 L 28.2 -12.4 L 25.6 -12.3 L 24.1 -12.3 L 21.4 -12.9 L 15.8 -5.5 L 18.4 -6.9 L 21.2 -7.6 L 23.5 -6.9 L 24.8 -5.5 L 25.3 -3.7 L 24.9 -.9 L 23.5 1.9 L 21.4 5.1 L 19.6 7.1 L 17.3 8.4 L 14.1 9.2 L 12.1 8.7 L 10.3 7.7 L 9.6 5.9 L 9.8 4.0 L 10.5 3.0 L 11.6 1.6","0 17.4 M 26.0 -9.0 L 26.8 -10.3 L 26.7 -11.5 L 26.5 -12.8 L 25.7 -13.6 L 24.2 -13.8 L 22.1 -13.0 L 19.4 -11.0 L 16.4 -8.1 L 14.4 -4.9 L 12.5 -1.7 L 11.2 1.5 L 10.5 4.9 L 10.7 7.5 L 12.2 9.2 L 14.2 9.7 L 16.1 9.5 L 18.6 8.3 L 21.1 5.7 L 23.4 1.6 L 24.0 -1.0 L 24.1 -2.3 L 23.5 -3.9 L 22.0 -5.2 L 20.1 -5.5 L 17.8 -4.8 L 16.1 -3.8 L 15.1 -2.8 L 14.2 -1.7","0 12.2 M 13.6 -12.9 L 18.9 -11.9 L 21.7 -11.9 L 24.0 -12.1 L 26.0 -12.7 L 26.8 -12.9 L 26.9 -12.2 L 25.4 -9.6 L 22.0 -4.8 L 17.2 1.3 L 13.5 5.8 L 9.6 10.2","0 24.1 M 29.2 -7.7 L 29.2 -10.0 L 28.8 -11.1 L 27.4 -12.5 L 25.2 -13.4 L 22.7 -12.8 L 20.9 -11.3 L 20.1 -9.7 L 19.9 -7.6 L 20.7 -5.5 L 21.7 -3.3 L 22.7 -.7 L 22.8 1.4 L 22.2 4.1 L 21.3 6.5 L 19.1 8.7 L 15.9 10.3 L 14.1 10.7 L 12.1 10.9 L 9.3 9.7 L 8.2 8.0 L 8.5 5.7 L 9.6 3.2 L 11.3 .9 L 13.0 -.7 L 15.7 -2.1 L 19.7 -3.7 L 23.5 -5.1 L 26.0 -6.6 L 27.3 -8.3 L 27.9 -9.6 L 28.1 -11.2 L 28.0 -12.7 L 27.6 -14.3 L 26.5 -15.9","0 13.9 M 25.9 -13.3 L 22.5 -14.1 L 19.3 -14.0 L 17.1 -13.3 L 13.9 -11.5 L 11.6 -9.0 L 11.0 -7.6 L 11.0 -6.0 L 11.7 -4.7 L 13.2 -3.4 L 15.2 -3.1 L 17.7 -3.9 L 20.3 -5.4 L 22.4 -7.3 L 24.3 -9.1 L 27.6 -12.6 L 11.9 8.9","0 8.5 M 14.0 -1.7 L 13.1 -.6 L 14.0 .3 L 14.8 -.6 L 14.0 -1.7 M 12.5 4.3 L 11.5 5.4 L 12.4 6.4 L 13.3 5.5 L 12.5 4.3","0 9.0 M 11.6 5.7 L 10.6 6.8 L 11.6 7.7 L 12.4 6.8 L 11.6 5.7 M 14.3 -1.8 L 13.4 -.7 L 14.3 .2 L 15.1 -.7 L 14.3 -1.8 M 12.1 7.2 L 12.0 8.0 L 11.0 8.9 L 10.2 9.1","0 20.4 M 24.3 -7.1 L 22.1 -5.2 L 19.5 -3.5 L 17.1 -2.4 L 15.1 -1.8 L 13.9 -1.6 L 11.1 -1.4 L 13.1 .4 L 15.0 2.0 L 16.4 3.6 L 17.2 5.4","0 20.5 M 12.4 -2.8 L 26.5 -2.8 M 9.7 2.1 L 23.5 2.1","0 20.4 M 18.0 -7.9 L 18.8 -5.9 L 20.3 -4.1 L 21.9 -2.4 L 23.3 -1.4 L 24.4 -.7 L 21.9 -.8 L 18.7 .0 L 16.0 1.3 L 13.6 2.8 L 11.9 4.0 L 10.8 4.9","0 20.9 M 15.4 -6.8 L 16.9 -9.6 L 19.0 -11.3 L 21.2 -12.2 L 23.1 -12.4 L 25.0 -12.1 L 26.5 -11.1 L 27.2 -9.3 L 26.7 -7.3 L 25.2 -5.0 L 23.1 -3.2 L 21.4 -2.1 L 18.9 -1.3 L 16.4 -1.4 L 13.1 3.7 M 11.3 6.1 L 10.3 7.2 L 11.3 8.1 L 12.3 7.3 L 11.3 6.1","0 27.5 M 30.7 -3.1 L 23.3 2.2 L 20.1 4.2 L 18.0 4.8 L 16.1 4.3 L 14.9 3.2 L 14.7 1.4 L 15.9 -1.0 L 18.0 -3.1 L 21.2 -5.4 L 23.8 -6.2 L 26.1 -6.3 L 27.7 -5.8 L 28.7 -4.8 L 28.4 -3.3 L 27.4 -1.7 L 24.1 2.1 L 23.7 2.7 L 23.9 3.8 L 25.6 4.4 L 27.5 3.7 L 30.6 1.4 L 33.2 -1.7 L 33.9 -3.5 L 33.8 -5.8 L 32.4 -7.8 L 30.1 -9.1 L 27.5 -9.6 L 24.4 -9.6 L 21.3 -8.9 L 16.8 -6.9 L 13.5 -4.5 L 11.3 -2.2 L 10.1 .1 L 9.6 1.6 L 9.6 4.1 L 10.4 6.0 L 12.0 7.6 L 14.5 8.7 L 17.2 9.2 L 19.8 8.9 L 22.8 8.4 L 25.6 7.3 L 28.4 5.2","0 29.6 M 9.4 5.2 L 9.9 7.4 L 11.2 8.6 L 12.3 9.1 L 13.8 9.1 L 14.9 8.7 L 16.8 7.4 L 18.5 5.4 L 20.6 2.2 L 23.5 -2.5 L 26.2 -6.4 L 29.2 -9.8 L 32.6 -12.9 L 35.4 -14.8 L 38.3 -15.6 L 40.8 -15.9 L 42.1 -15.9 L 42.8 -15.7 L 44.6 -14.7 L 42.6 -15.7 L 41.2 -15.8 L 39.8 -15.0 L 36.6 -12.2 L 34.3 -8.8 L 32.3 -5.0 L 31.3 -2.0 L 30.6 .7 L 30.3 2.8 L 30.1 7.9 L 29.6 4.6 L 28.9 2.2 L 28.0 -.2 L 26.3 -2.1 L 25.0 -3.0 L 23.5 -3.6 L 21.3 -3.6 L 19.6 -2.9 L 19.2 -1.5 L 19.8 .0 L 21.1 .9 L 23.2 1.5 L 26.0 1.6 L 29.8 1.4 L 32.3 .8 L 34.7 -.5","0 24.3 M 33.2 -14.2 L 31.6 -15.7 L 29.3 -15.9 L 27.5 -15.6 L 24.7 -14.2 L 23.1 -12.9 L 21.0 -10.0 L 12.5 4.3 L 10.9 6.5 L 9.5 8.2 L 7.3 9.2 L 5.8 9.1 L 4.9 8.6 L 3.9 7.4 M 13.8 -9.2 L 16.0 -11.1 L 18.4 -12.3 L 20.5 -13.0 L 22.3 -13.3 L 25.2 -13.0 L 27.5 -12.4 L 29.7 -10.9 L 30.5 -9.0 L 30.3 -6.9 L 29.8 -5.4 L 28.5 -4.4 L 26.7 -3.8 L 24.6 -3.5 L 22.0 -3.8 L 21.7 -4.4 L 21.7 -5.1 L 22.4 -5.5 L 23.8 -5.3 L 25.2 -4.6 L 26.3 -3.9 L 28.0 -2.3 L 28.8 -.5 L 29.1 1.9 L 28.1 4.7 L 26.5 6.6 L 24.6 7.9 L 22.9 8.3 L 19.9 8.3 L 18.7 7.8 L 17.2 7.0 L 16.1 5.8 L 15.6 4.5 L 15.6 2.8","0 18.3 M 17.6 -12.7 L 17.7 -12.6 L 18.4 -10.7 L 19.9 -9.2 L 22.5 -7.7 L 25.7 -7.8 L 27.5 -8.7 L 28.7 -9.7 L 29.4 -11.7 L 29.4 -12.9 L 29.1 -13.3 L 28.2 -13.9 L 26.2 -13.9 L 24.2 -13.2 L 20.7 -11.5 L 19.3 -10.6 L 16.6 -8.3 L 13.2 -5.0 L 10.4 -.8 L 9.3 2.3 L 9.3 4.4 L 9.8 6.5 L 11.4 7.9 L 12.6 8.6 L 16.0 8.6 L 17.8 7.7 L 19.1 7.0 L 20.4 5.6 L 22.6 2.9","0 24.3 M 26.2 -9.0 L 24.5 -7.5 L 22.2 -6.3 L 20.9 -6.2 L 19.0 -6.3 L 16.9 -7.3 L 16.1 -8.9 L 16.2 -10.4 L 17.7 -12.4 L 19.9 -13.2 L 22.8 -13.0 L 24.5 -12.7 L 26.8 -11.7 L 28.9 -9.8 L 30.2 -7.1 L 30.4 -3.6 L 30.0 -.2 L 28.8 3.1 L 27.1 5.5 L 24.5 7.5 L 22.3 8.3 L 20.2 8.0 L 18.2 7.3 L 16.8 5.7 L 16.7 3.6 L 17.4 2.3 L 18.2 1.8 L 19.1 1.6 L 20.2 1.6 L 21.7 2.2 L 22.2 2.4 M 5.3 7.1 L 5.9 8.5 L 7.6 9.1 L 9.4 8.8 L 10.9 7.7 L 12.3 6.2 L 14.2 3.2 L 18.8 -4.8 L 21.3 -8.5 L 24.8 -12.0 L 26.8 -13.5 L 29.2 -14.6 L 31.8 -14.6 L 33.6 -14.3 L 34.5 -13.9 L 35.8 -12.4","0 20.7 M 15.9 -12.9 L 16.6 -11.0 L 17.7 -9.7 L 19.6 -8.4 L 21.7 -7.6 L 23.9 -7.7 L 25.9 -8.7 L 27.3 -9.9 L 27.7 -11.2 L 27.8 -12.6 L 27.2 -13.6 L 26.1 -14.3 L 24.6 -14.5 L 23.0 -14.2 L 20.6 -13.1 L 18.4 -11.0 L 17.4 -8.6 L 17.3 -6.4 L 17.5 -4.9 L 18.8 -3.6 L 20.2 -3.1 L 21.1 -3.3 L 21.5 -3.5 L 21.7 -4.0 L 21.4 -4.7 L 20.3 -5.2 L 18.8 -5.3 L 17.4 -5.0 L 15.1 -4.1 L 12.7 -2.0 L 11.4 .7 L 11.3 3.9 L 12.1 5.7 L 13.6 7.4 L 15.5 8.0 L 18.8 8.2 L 21.1 7.4 L 22.9 6.5 L 24.1 5.5 L 25.8 3.1","0 19.7 M 7.1 5.3 L 7.3 7.1 L 8.1 8.3 L 10.3 8.8 L 12.5 7.9 L 14.4 6.2 L 15.8 4.5 L 17.5 2.3 L 20.3 -1.4 L 23.3 -5.4 L 28.2 -10.8 L 32.3 -13.4 L 35.8 -14.2 L 37.4 -14.2 L 39.0 -13.6 L 39.6 -12.2 L 38.6 -10.7 L 37.3 -10.0 L 36.2 -9.8 L 33.9 -9.8 L 32.8 -9.8 L 30.6 -10.3 L 27.2 -11.1 L 23.0 -12.4 L 20.2 -13.3 L 18.0 -13.0 L 15.7 -12.5 L 13.2 -10.7 M 25.2 -3.2 L 23.6 -2.4 L 22.3 -2.4 L 20.6 -2.9 L 19.0 -3.5 L 17.1 -3.7 L 15.4 -3.2 L 14.8 -2.4 L 15.4 -1.3 L 17.3 -.9 L 19.4 -1.1 L 20.6 -1.7","0 24.2 M 23.3 -13.5 L 24.2 -11.0 L 25.9 -9.3 L 28.9 -7.9 L 31.7 -7.9 L 34.4 -9.3 L 35.8 -10.9 L 35.9 -12.3 L 35.5 -13.9 L 34.0 -14.7 L 32.1 -14.6 L 29.2 -13.4 L 26.8 -12.3 L 23.1 -9.7 L 20.3 -6.9 L 17.2 -3.1 L 14.8 1.5 L 14.3 4.6 L 15.4 6.9 L 17.1 8.6 L 19.6 9.1 L 22.7 8.5 L 25.8 6.5 L 27.5 4.8 L 28.8 2.6 L 26.4 9.5 L 24.0 14.2 L 21.4 17.1 L 18.2 18.9 L 16.2 18.6 L 14.7 17.2 L 14.9 14.8 L 16.2 13.0 L 18.7 11.7 L 22.9 10.1 L 25.6 9.7 L 27.8 9.5 L 31.3 9.4","0 22.6 M 21.3 -17.4 L 24.3 -15.1 L 26.5 -14.9 L 28.5 -15.8 L 29.1 -16.7 L 29.1 -17.2 L 28.3 -17.7 L 27.5 -17.7 L 26.2 -17.1 L 25.1 -16.4 L 23.4 -13.3 L 21.7 -10.1 L 20.2 -5.0 L 18.6 -.6 L 16.9 4.3 L 15.8 7.6 L 14.5 10.0 L 13.5 12.1 L 12.6 12.9 L 11.6 13.5 L 10.3 13.5 L 8.8 12.4 L 8.3 9.8 L 8.6 7.5 L 10.8 4.3 L 13.5 2.1 L 16.3 .2 L 23.3 -2.9 L 29.1 -5.1 L 33.0 -7.5 L 36.2 -10.2 L 37.8 -11.7 L 37.6 -13.8 L 37.0 -14.3 L 35.6 -14.5 L 34.3 -13.7 L 31.4 -10.1 L 28.6 -5.8 L 26.2 -1.4 L 24.6 2.1 L 24.0 5.5 L 24.8 8.4 L 25.8 9.9 L 28.3 11.3","0 20.6 M 7.9 6.9 L 8.1 9.0 L 10.0 10.3 L 11.8 10.4 L 13.9 9.5 L 16.5 7.0 L 20.1 2.4 L 24.1 -3.2 L 27.4 -7.6 L 30.9 -11.0 L 34.2 -12.9 L 36.2 -13.5 L 37.9 -13.5 L 38.9 -12.7 L 39.4 -11.9 L 38.9 -10.8 L 38.0 -10.0 L 36.8 -9.7 L 35.7 -9.8 L 33.5 -10.2 L 30.9 -11.0 L 29.2 -11.8 L 27.4 -12.0 L 25.4 -11.8","0 12.6 M 16.0 3.0 L 14.9 5.3 L 12.9 6.8 L 9.6 7.5 L 6.7 8.0 L 3.1 8.2 L -.8 9.1 L -4.3 10.6 L -6.3 13.0 L -6.7 14.0 L -6.9 15.4 L -6.3 16.7 L -4.3 17.0 L -3.0 16.6 L .1 15.5 L 3.3 12.9 L 6.8 9.5 L 11.6 3.8 L 17.7 -3.9 L 22.3 -9.3 L 26.3 -12.6 L 29.4 -14.2 L 32.2 -14.9 L 34.4 -14.8 L 35.7 -14.3 L 36.2 -13.6 L 36.5 -12.4 L 36.1 -11.7 L 34.7 -10.6 L 33.0 -10.4 L 31.7 -10.3 L 29.7 -10.7 L 26.5 -11.6 L 21.8 -12.9 L 19.4 -13.1 L 17.5 -12.7 L 16.7 -12.5","0 21.8 M 1.6 4.5 L 1.8 6.2 L 2.5 7.3 L 3.9 8.0 L 5.0 8.1 L 6.2 7.4 L 8.8 5.6 L 11.9 1.8 L 15.5 -3.0 L 17.9 -6.6 L 21.3 -10.4 L 23.9 -12.7 L 25.8 -14.1 L 27.6 -14.5 L 29.2 -14.6 L 29.9 -14.4 L 30.4 -13.0 L 29.8 -12.0 L 28.7 -11.4 L 27.7 -11.5 L 24.5 -12.0 L 21.1 -12.9 L 17.8 -13.7 L 15.6 -13.9 L 13.8 -14.2 L 12.2 -13.7 L 11.3 -13.4 L 11.0 -12.5 M 37.4 -9.5 L 37.4 -10.7 L 36.5 -11.5 L 35.5 -11.7 L 34.3 -11.4 L 31.8 -9.2 L 29.8 -7.3 L 27.5 -5.8 L 25.7 -4.7 L 23.2 -3.6 L 21.3 -3.0 L 19.0 -2.8 L 17.0 -2.7 L 15.9 -3.0 L 14.4 -3.9 L 14.4 -5.2 L 15.4 -5.8 L 16.5 -5.8 L 19.0 -4.4 L 20.0 -3.2 L 21.3 -1.3 L 22.0 .8 L 22.1 3.5 L 21.8 6.5 L 22.3 8.3 L 23.8 8.7 L 26.3 7.5","0 20.8 M 25.5 -11.9 L 28.7 -12.8 L 31.5 -12.3 L 33.5 -11.5 L 36.4 -10.4 L 38.3 -10.8 L 39.4 -11.5 L 39.7 -12.4 L 39.1 -13.2 L 37.3 -13.9 L 34.6 -13.1 L 33.0 -12.1 L 30.9 -10.1 L 28.5 -7.5 L 25.7 -3.2 L 21.2 2.6 L 18.6 5.6 L 15.1 8.3 L 13.5 9.2 L 12.2 9.2 L 9.8 8.5 L 8.9 7.0 L 9.3 5.9 L 10.8 5.1 L 13.1 5.4 L 15.3 6.8 L 17.3 9.0 L 20.7 11.8 L 23.6 13.2 L 26.0 13.4 L 27.6 12.9 L 28.8 12.0 L 28.9 10.7 L 28.8 10.1 L 27.8 8.9","0 28.6 M -3.9 3.8 L -4.7 5.3 L -4.4 7.3 L -3.3 9.0 L -1.4 9.5 L .1 9.4 L 2.6 8.6 L 5.0 6.7 L 8.2 3.2 L 12.1 -1.8 L 16.5 -7.5 L 19.3 -10.4 L 21.7 -12.6 L 23.1 -13.1 L 24.6 -13.4 L 25.2 -13.1 L 25.4 -12.0 L 23.5 -7.9 L 21.9 -3.5 L 21.3 .1 L 21.0 3.2 L 21.0 6.8 L 20.6 8.6 L 19.3 9.1 L 18.3 9.0 L 17.9 8.3 L 17.9 6.9 L 18.2 5.5 L 20.2 2.1 L 23.5 -2.0 L 28.4 -7.8 L 32.7 -11.0 L 35.3 -12.6 L 37.2 -13.2 L 37.8 -13.2 L 38.6 -12.6 L 38.6 -11.7 L 37.4 -9.9 L 34.3 -4.2 L 32.3 .1 L 31.4 4.1 L 31.1 7.7 L 31.0 9.5 L 32.4 12.0 L 34.3 12.7 L 37.1 11.8 L 38.5 10.6","0 22.4 M 1.0 3.4 L 1.0 3.6 L .3 5.9 L 1.3 8.3 L 3.1 9.1 L 5.0 9.1 L 7.7 8.0 L 10.5 5.8 L 13.1 2.7 L 16.7 -1.6 L 21.9 -7.6 L 24.7 -11.1 L 26.5 -12.4 L 27.8 -13.3 L 28.7 -13.5 L 29.4 -13.4 L 29.7 -12.4 L 29.2 -11.4 L 27.5 -8.4 L 24.3 -1.9 L 22.4 4.1 L 22.4 5.7 L 22.5 7.5 L 23.0 8.3 L 24.2 7.8 L 24.7 6.8 L 28.9 -.4 L 31.2 -3.9 L 35.7 -9.0 L 39.2 -11.8 L 41.9 -13.5 L 44.1 -14.1 L 46.3 -14.0 L 47.6 -13.1 L 47.4 -11.4 L 45.1 -10.7 L 44.3 -10.7 L 42.8 -11.2 L 41.1 -12.0 L 39.5 -14.3","0 22.7 M 27.2 -12.9 L 23.6 -13.1 L 19.7 -11.7 L 15.8 -8.9 L 12.9 -6.4 L 10.2 -2.4 L 9.0 1.0 L 8.9 3.2 L 9.4 5.6 L 11.7 7.8 L 13.9 8.6 L 18.3 8.2 L 22.4 6.6 L 28.1 2.2 L 30.9 -1.7 L 32.1 -4.5 L 32.6 -7.6 L 32.5 -9.6 L 31.1 -12.0 L 30.0 -12.9 L 28.1 -13.4 L 26.7 -13.1 L 24.4 -11.8 L 23.3 -9.6 L 23.6 -7.2 L 25.0 -5.5 L 27.0 -3.9 L 30.0 -3.1 L 32.3 -3.1 L 35.2 -4.7 L 35.8 -6.2 L 35.3 -8.0 L 34.1 -9.1 L 33.8 -9.3 L 30.7 -9.6 L 27.3 -8.3 L 25.5 -7.3 L 23.8 -5.9 L 22.3 -3.6","0 29.1 M 8.4 8.7 L 9.5 10.1 L 11.8 10.3 L 14.3 8.9 L 16.2 6.3 L 20.1 -.8 L 23.0 -5.7 L 28.1 -10.8 L 31.4 -12.8 L 34.2 -13.5 L 36.4 -13.1 L 37.6 -12.6 L 38.7 -11.2 M 17.8 -14.0 L 20.2 -12.7 L 21.4 -10.7 L 21.6 -9.2 L 21.1 -6.6 L 19.5 -6.2 L 18.2 -7.5 L 18.7 -9.9 L 20.5 -11.7 L 22.0 -12.7 L 24.4 -13.5 L 27.4 -13.8 L 29.8 -13.5 L 32.7 -12.5 L 35.0 -11.1 L 36.7 -9.1 L 37.5 -6.8 L 37.4 -3.9 L 36.4 -1.2 L 34.0 .9 L 30.5 2.1 L 27.9 2.0 L 25.0 .7 L 23.4 -1.0","0 24.8 M 20.2 -5.1 L 21.6 -5.9 L 23.5 -6.0 L 25.3 -5.4 L 26.6 -3.7 L 26.9 -1.1 L 26.1 1.3 L 24.6 2.9 L 22.8 4.1 L 21.1 4.5 L 19.2 4.7 L 17.4 4.4 L 15.3 3.4 L 13.7 1.7 L 12.9 -.1 L 12.9 -2.9 L 14.2 -5.9 L 16.0 -8.4 L 18.4 -10.3 L 20.7 -11.6 L 22.2 -12.1 L 24.8 -12.3 L 28.3 -11.7 L 30.2 -10.1 L 31.2 -7.8 L 31.2 -4.6 L 30.2 -1.4 L 28.9 1.0 L 27.3 2.8 L 25.4 4.9 L 22.9 7.0 L 21.0 8.1 L 18.2 9.3 L 15.3 10.0 L 12.6 9.9 L 10.4 9.4 L 9.3 7.9 L 9.8 6.4 L 11.6 5.8 L 15.2 6.2 L 17.4 7.1 L 19.0 8.0 L 21.7 10.7 L 23.1 12.2 L 25.0 14.0 L 27.4 14.9 L 30.3 15.1 L 32.1 14.0 L 32.4 12.7 L 32.4 11.6 L 31.2 10.4 L 29.1 10.4","0 27.9 M 6.1 9.5 L 7.1 10.8 L 8.2 11.4 L 9.6 11.3 L 11.7 10.2 L 13.6 7.9 L 16.9 2.2 L 20.6 -3.9 L 24.3 -8.7 L 27.2 -11.0 L 30.2 -12.3 L 32.8 -12.6 L 34.4 -12.1 L 35.4 -11.7 L 36.5 -10.3 M 16.0 -12.9 L 18.0 -12.0 L 19.6 -9.4 L 19.4 -7.4 L 18.9 -5.7 L 17.7 -5.3 L 17.0 -5.6 L 16.2 -6.8 L 16.9 -9.3 L 17.6 -10.2 L 19.5 -11.9 L 21.6 -12.7 L 24.8 -12.8 L 27.9 -12.5 L 30.5 -11.8 L 33.0 -10.2 L 34.8 -7.6 L 35.2 -5.5 L 35.0 -3.8 L 34.1 -1.8 L 32.1 .5 L 29.4 1.8 L 26.9 2.1 L 23.5 1.9 L 20.6 1.0 L 18.6 -.1 L 17.4 -1.6 L 17.7 -3.1 L 19.5 -3.3 L 21.6 -2.4 L 23.5 -.8 L 24.6 1.1 L 25.1 2.6 L 24.7 6.9 L 24.7 9.1 L 25.7 10.8 L 27.4 11.0 L 29.7 9.2","0 22.7 M 3.2 8.6 L 6.5 8.5 L 8.3 7.8 L 10.8 5.3 L 11.9 3.1 L 12.2 .9 L 11.1 -.6 L 9.6 -1.3 L 7.9 -.6 L 6.7 1.6 L 6.3 4.8 L 7.1 6.9 L 9.8 9.0 L 13.0 10.0 L 16.9 9.6 L 20.4 7.7 L 22.8 4.7 L 24.0 1.0 L 24.4 -7.5 L 24.8 -9.9 L 25.6 -12.1 L 26.9 -14.3 L 29.4 -15.9 L 31.8 -15.4 L 32.6 -14.3 L 32.2 -11.6 L 30.1 -9.5 L 28.1 -8.2 L 26.0 -7.8 L 23.0 -7.7 L 20.8 -8.7","0 19.8 M 6.4 6.5 L 6.2 8.3 L 7.1 9.5 L 8.6 10.1 L 10.0 10.0 L 11.8 9.1 L 13.4 7.7 L 15.9 4.6 L 22.6 -3.9 L 25.7 -7.1 L 27.7 -9.3 L 30.7 -11.2 L 33.4 -12.3 L 35.8 -12.4 L 38.3 -11.8 L 38.7 -10.9 L 38.7 -10.0 L 38.1 -9.0 L 36.4 -8.3 L 34.3 -8.0 L 31.7 -8.1 L 28.1 -8.7 L 20.8 -11.1 L 17.7 -11.2 L 15.6 -11.1 L 14.4 -10.5 L 12.3 -9.0","0 22.0 M 7.2 -8.4 L 5.7 -8.9 L 4.8 -9.7 L 4.5 -10.7 L 5.0 -11.9 L 6.2 -13.0 L 7.9 -13.3 L 10.4 -13.3 L 12.9 -12.5 L 15.3 -11.6 L 18.3 -10.7 L 20.8 -10.0 L 23.5 -10.2 L 25.0 -10.6 L 25.5 -11.7 L 25.2 -12.4 L 24.3 -12.9 L 22.9 -12.5 L 21.3 -11.0 L 17.7 -7.8 L 12.2 -1.6 L 9.9 3.0 L 9.4 4.9 L 9.7 6.8 L 11.2 8.9 L 13.7 10.0 L 16.9 9.6 L 19.0 8.4 L 20.8 7.1 L 22.0 5.6 L 24.3 .8 L 25.6 -1.7 L 27.2 -3.9 L 29.4 -6.2 L 33.1 -9.3 L 36.7 -11.1 L 32.6 -9.0 L 30.1 -6.9 L 26.2 -2.3 L 23.6 2.1 L 22.2 5.2 L 21.5 7.9 L 21.7 10.8 L 23.2 11.8 L 25.9 10.8 L 27.1 9.4 L 27.4 7.1","0 27.7 M 9.4 -7.7 L 7.8 -8.5 L 7.0 -9.8 L 7.3 -11.7 L 9.0 -12.9 L 11.1 -13.2 L 12.9 -12.9 L 15.0 -12.2 L 19.0 -10.4 L 21.0 -9.8 L 23.3 -9.5 L 25.7 -9.7 L 27.0 -10.3 L 27.7 -11.3 L 27.6 -11.8 L 26.8 -12.4 L 25.6 -12.3 L 24.2 -11.3 L 20.8 -8.4 L 17.3 -4.7 L 14.5 -.8 L 12.0 3.4 L 10.3 7.1 L 9.3 9.7 L 8.3 10.7 L 7.2 11.1 L 6.0 11.3 L 4.7 10.7 L 4.4 9.8 L 5.7 8.5 L 7.5 8.1 L 8.4 8.1 L 11.7 8.9 L 15.1 9.3 L 18.2 9.5 L 21.8 8.6 L 26.1 6.3 L 28.9 3.6 L 31.4 -.2 L 33.2 -4.1 L 34.3 -7.8 L 35.4 -13.5","0 37.4 M 11.8 -7.8 L 10.3 -8.4 L 9.4 -9.2 L 9.4 -10.5 L 10.1 -12.1 L 11.8 -12.9 L 14.6 -12.8 L 16.9 -12.3 L 18.5 -11.7 L 23.0 -10.0 L 25.3 -9.8 L 28.5 -9.8 L 29.5 -10.3 L 30.0 -10.8 L 30.0 -11.5 L 29.7 -12.1 L 29.1 -12.4 L 27.6 -12.2 L 26.3 -11.4 L 23.5 -8.7 L 19.5 -4.5 L 16.5 -.3 L 14.0 4.0 L 12.2 8.0 L 11.5 9.9 L 9.7 11.1 L 8.2 11.3 L 6.9 10.5 L 6.6 9.5 L 7.8 8.6 L 9.2 8.1 L 17.4 8.6 L 20.0 8.2 L 22.7 7.4 L 24.8 6.4 L 27.6 3.9 L 30.4 .6 L 32.2 -4.0 L 33.1 -7.5 L 33.4 -10.5 L 33.1 -10.9 L 32.5 -10.9 L 31.9 -10.1 L 31.0 -6.7 L 30.6 -1.6 L 29.9 3.4 L 29.4 5.7 L 28.1 8.2 L 26.6 10.6 L 25.4 11.7 L 24.3 12.2 L 23.4 12.2 L 22.7 11.3 L 22.8 10.7 L 23.3 10.1 L 24.4 9.9 L 30.4 9.8 L 33.0 9.1 L 36.0 7.6 L 39.1 4.4 L 41.5 .6 L 42.9 -3.5 L 43.7 -7.0 L 43.8 -10.8","0 23.9 M 9.1 .3 L 6.7 .4 L 4.8 1.1 L 2.7 2.8 L 2.1 5.0 L 2.1 6.0 L 2.9 7.9 L 4.8 9.2 L 6.9 9.6 L 9.0 9.6 L 12.1 8.9 L 15.1 7.4 L 18.2 4.8 L 20.7 1.9 L 22.8 -1.2 L 24.4 -3.7 L 27.2 -6.8 L 30.3 -9.4 L 32.7 -10.8 L 35.2 -11.5 L 37.3 -11.5 L 38.5 -10.9 L 39.6 -10.0 L 39.7 -8.5 M 20.2 -6.0 L 19.2 -4.4 L 17.8 -3.6 L 16.1 -3.6 L 15.0 -3.9 L 13.7 -5.1 L 13.3 -6.3 L 13.1 -8.5 L 14.0 -10.5 L 15.3 -11.8 L 17.5 -12.7 L 21.2 -12.8 L 23.1 -12.0 L 24.2 -11.0 L 25.0 -9.2 L 24.8 -6.3 L 24.2 -4.2 L 20.7 2.9 L 20.2 5.4 L 20.3 7.7 L 21.6 9.5 L 23.9 10.6 L 26.6 9.9 L 28.2 8.1 L 28.5 6.5 L 28.4 5.2 L 26.9 3.7 L 25.4 3.7 L 24.2 4.6","0 21.8 M 9.9 -9.1 L 8.5 -9.8 L 7.6 -11.5 L 7.9 -13.1 L 8.8 -14.0 L 9.8 -14.5 L 12.5 -14.5 L 14.9 -13.8 L 17.9 -12.5 L 21.6 -11.3 L 24.6 -11.0 L 26.3 -10.9 L 27.4 -11.3 L 28.2 -12.3 L 28.0 -13.3 L 27.0 -13.7 L 25.7 -13.3 L 24.4 -12.3 L 23.4 -11.5 L 19.8 -8.1 L 17.1 -4.9 L 14.9 -.9 L 14.4 1.9 L 15.0 4.1 L 16.7 5.5 L 20.7 5.8 L 22.0 5.0 L 24.1 3.6 L 25.6 1.7 L 31.5 -6.6 L 34.9 -9.7 L 37.5 -11.1 L 39.7 -11.9 L 36.4 -10.8 L 32.8 -7.8 L 28.4 -2.3 L 24.8 2.8 L 22.3 6.8 L 20.4 9.7 L 18.0 11.6 L 16.0 12.5 L 12.7 12.5 L 10.7 11.8 L 9.6 10.9 L 8.2 8.7 L 7.9 7.3 L 8.6 5.5 L 9.1 4.9 L 10.5 4.9 L 10.4 7.2 L 9.7 8.7 L 7.9 10.5 L 6.4 11.3","0 28.1 M 14.2 -7.0 L 13.4 -8.5 L 13.3 -10.4 L 14.2 -12.1 L 15.5 -12.9 L 16.7 -13.0 L 19.5 -12.0 L 22.1 -11.1 L 24.7 -10.4 L 27.1 -9.9 L 29.6 -9.5 L 31.4 -9.2 L 34.8 -9.4 L 37.1 -10.2 L 38.1 -10.9 L 37.9 -12.2 L 37.3 -12.7 L 35.5 -12.8 L 33.7 -12.6 L 31.6 -11.7 L 29.6 -10.3 L 27.5 -8.2 L 23.8 -2.9 L 21.5 .0 L 19.0 2.5 L 14.4 7.2 L 12.2 8.9 L 9.7 9.4 L 7.5 9.1 L 6.9 8.6 L 6.7 7.7 L 7.3 5.9 L 9.1 5.2 L 11.5 5.3 L 14.2 5.8 L 17.9 7.0 L 25.1 9.6 L 28.5 10.2 L 31.9 10.0 L 33.8 8.7 L 34.0 7.5 L 34.1 6.1 L 34.0 5.8","0 13.2 M 29.8 -13.3 L 26.3 -13.2 L 9.4 12.9 L 13.1 12.9","0 12.5 M 10.7 -16.0 L 16.3 13.1","0 20.3 M 22.2 -14.2 L 26.1 -14.1 L 9.1 12.4 L 5.6 12.7","0 20.0 M 10.1 -5.4 L 14.1 -6.3 L 18.7 -8.0 L 23.3 -10.8 L 24.9 -11.7 L 24.3 -8.9 L 24.3 -6.9 L 25.1 -5.6 L 25.9 -5.3","0 16.5 M 8.8 7.7 L 23.5 7.7","0 10.7 M 8.7 -16.6 L 9.6 -14.2 L 11.3 -12.6 L 13.9 -11.8 L 17.0 -11.7","0 20.1 M 25.4 -.5 L 21.1 2.3 L 17.4 5.0 L 14.8 6.9 L 12.6 8.0 L 11.3 8.2 L 10.0 8.1 L 8.5 7.3 L 7.7 6.1 L 7.8 3.3 L 9.3 1.2 L 13.9 -2.3 L 17.0 -3.6 L 19.4 -4.0 L 22.1 -3.6 L 23.3 -2.2 L 22.9 -.3 L 21.5 1.6 L 17.9 5.2 L 17.5 6.2 L 17.8 7.1 L 20.0 7.8 L 22.4 7.3 L 25.8 5.5 L 28.1 3.0","0 16.1 M 8.0 3.1 L 10.8 1.1 L 12.3 -.5 L 18.9 -7.6 L 22.9 -12.7 L 23.7 -13.9 L 23.7 -14.5 L 23.4 -15.3 L 22.4 -15.6 L 21.6 -15.3 L 18.5 -12.3 L 13.3 -6.3 L 10.2 -1.9 L 8.7 .7 L 8.1 2.1 L 7.9 4.3 L 7.9 5.9 L 8.9 7.1 L 10.0 7.9 L 11.0 8.3 L 12.5 8.3 L 14.9 7.3 L 17.3 5.2 L 18.9 2.8 L 19.3 .9 L 19.4 -.7 L 19.4 -1.7 L 19.0 -2.3 L 17.7 -2.3 L 17.4 -1.0 L 18.3 .6 L 20.3 2.7 L 21.7 3.6 L 23.1 3.6 L 24.1 3.0","0 16.1 M 19.1 -1.5 L 19.1 -2.3 L 18.3 -3.4 L 16.0 -3.7 L 13.3 -2.5 L 10.1 .1 L 8.4 2.1 L 7.5 4.1 L 7.6 6.0 L 9.2 7.5 L 12.3 7.9 L 16.4 7.0 L 19.9 5.3 L 24.1 3.0","0 20.2 M 22.5 .3 L 23.1 -1.7 L 22.3 -3.5 L 19.7 -4.2 L 15.8 -3.4 L 11.6 -.9 L 9.4 1.1 L 7.9 3.1 L 7.3 4.9 L 7.7 6.3 L 8.9 7.7 L 11.5 8.4 L 13.9 7.6 L 17.6 5.2 L 21.0 1.7 L 24.6 -2.1 L 28.5 -5.5 L 32.3 -9.6 L 33.5 -11.3 L 33.7 -12.1 L 33.4 -12.7 L 32.8 -12.8 L 31.6 -12.2 L 29.2 -9.0 L 26.5 -5.7 L 24.8 -3.3 L 20.1 3.6 L 19.1 5.4 L 18.9 6.7 L 19.1 7.4 L 19.8 7.9 L 21.0 7.7 L 23.6 6.7 L 25.7 5.4 L 28.2 3.0","0 15.8 M 9.1 -.8 L 12.8 1.0 L 15.9 1.3 L 18.1 1.0 L 19.8 .1 L 21.0 -1.1 L 21.4 -2.5 L 21.3 -3.2 L 20.0 -4.5 L 17.8 -5.0 L 14.6 -4.0 L 11.2 -1.6 L 8.8 1.3 L 7.7 3.6 L 7.6 5.9 L 8.4 7.1 L 9.7 8.0 L 10.6 8.2 L 13.7 8.2 L 17.0 7.2 L 20.6 5.4 L 23.8 3.0","0 11.4 M 8.1 2.7 L 12.5 .6 L 18.0 -3.4 L 21.6 -6.7 L 24.1 -10.1 L 25.2 -12.4 L 25.1 -14.4 L 24.4 -15.3 L 23.5 -15.5 L 21.9 -13.9 L 11.4 -1.5 L 1.8 11.1 L -1.4 15.9 L -2.8 18.8 L -3.2 20.3 L -2.6 21.6 L -.8 21.0 L .8 20.0 L 3.3 16.5 L 5.2 12.8 L 6.0 9.5 L 5.9 6.0 L 8.5 7.3 L 11.5 7.2 L 12.9 7.1 L 15.8 6.0 L 17.7 4.8 L 19.4 3.0","0 17.3 M 25.0 -.4 L 19.9 2.9 L 15.9 6.2 L 12.3 8.2 L 10.4 8.0 L 8.1 7.0 L 7.4 4.4 L 8.5 1.9 L 11.1 -.5 L 13.2 -2.0 L 16.0 -3.6 L 18.1 -3.9 L 20.7 -3.8 L 22.0 -3.5 L 22.9 -2.5 L 23.0 -1.2 L 22.5 .0 L 21.8 1.3 L 17.7 5.5 L 15.7 8.2 L 13.2 11.7 L 10.6 15.0 L 7.8 18.2 L 5.5 20.3 L 3.7 21.6 L 2.4 21.8 L 1.8 21.4 L 1.4 20.0 L 1.8 18.6 L 4.6 15.8 L 9.3 12.3 L 13.3 9.8 L 18.9 7.0 L 22.2 5.2 L 25.3 3.0","0 18.3 M 11.6 -2.8 L 15.9 -5.5 L 19.7 -8.5 L 23.4 -11.8 L 25.0 -13.5 L 25.4 -14.8 L 25.1 -15.8 L 24.6 -16.3 L 23.5 -16.5 L 21.3 -14.4 L 16.7 -9.4 L 13.6 -5.6 L 10.5 -1.1 L 8.3 2.4 L 5.9 7.4 L 9.8 2.2 L 14.1 -2.3 L 16.9 -4.1 L 20.4 -4.3 L 21.6 -3.4 L 22.0 -1.4 L 21.1 .6 L 18.4 3.7 L 16.9 5.8 L 17.0 7.5 L 17.6 7.7 L 19.1 7.3 L 21.4 6.4 L 23.9 5.1 L 26.3 3.0","0 9.7 M 13.1 -4.1 L 8.8 1.6 L 7.2 4.4 L 6.8 5.7 L 6.9 6.5 L 7.2 7.2 L 7.7 7.7 L 8.9 7.8 L 10.4 7.5 L 12.3 6.9 L 14.8 5.5 L 17.7 3.0 M 15.2 -8.4 L 14.5 -7.5 L 15.4 -6.8 L 16.2 -7.7 L 15.2 -8.4","0 7.1 M 12.1 -4.1 L 6.4 5.7 L 1.5 13.8 L -3.4 20.0 L -5.3 21.6 L -6.5 21.9 L -7.6 20.8 L -7.4 19.6 L -6.4 18.0 L -3.0 15.0 L 5.2 9.9 L 11.2 6.1 L 15.1 3.0 M 13.6 -8.4 L 12.8 -7.4 L 13.9 -6.6 L 14.7 -7.6 L 13.6 -8.4","0 15.0 M 5.6 7.9 L 8.5 1.9 L 12.2 -4.0 L 16.4 -10.1 L 20.3 -15.0 L 22.4 -16.3 L 23.6 -16.1 L 24.2 -15.0 L 23.6 -12.8 L 20.6 -9.2 L 17.2 -6.0 L 13.0 -2.6 L 11.1 -1.1 L 8.9 1.4 L 12.0 -2.0 L 15.0 -3.6 L 17.2 -4.1 L 20.1 -4.0 L 21.2 -3.2 L 21.4 -1.7 L 21.0 -.5 L 19.0 1.0 L 17.4 1.4 L 14.3 1.5 L 13.1 1.2 L 11.3 .6 L 11.0 4.9 L 11.4 6.6 L 12.6 7.8 L 13.9 8.4 L 15.9 8.4 L 18.6 7.0 L 20.5 5.9 L 21.8 4.7 L 23.0 3.0","0 12.5 M 8.9 1.4 L 9.2 1.4 L 16.1 -3.5 L 21.2 -8.3 L 23.4 -11.6 L 24.1 -13.7 L 23.5 -15.3 L 22.1 -15.6 L 18.8 -13.3 L 14.1 -7.2 L 10.4 -1.4 L 7.8 3.3 L 7.5 5.9 L 8.9 7.7 L 12.0 7.5 L 15.7 6.0 L 20.5 3.0","0 29.1 M 11.8 -3.8 L 12.4 -3.0 L 11.6 -1.5 L 9.5 1.4 L 6.1 4.8 L 3.0 8.1 L 10.6 .9 L 15.0 -2.3 L 18.3 -3.8 L 20.0 -4.1 L 21.0 -4.0 L 21.8 -2.9 L 21.7 -1.1 L 21.0 1.1 L 16.2 7.5 L 21.1 1.6 L 25.3 -1.9 L 28.2 -3.6 L 30.7 -3.7 L 31.9 -3.1 L 32.0 -1.6 L 31.1 .4 L 27.8 4.6 L 27.1 5.9 L 27.4 7.0 L 28.7 7.8 L 31.2 7.3 L 34.0 5.7 L 37.1 3.0","0 20.3 M 11.2 -3.5 L 11.1 -2.0 L 9.9 -.1 L 8.0 3.1 L 4.8 7.5 L 9.1 2.3 L 12.0 -.4 L 14.9 -2.4 L 17.3 -3.5 L 20.2 -3.8 L 21.6 -3.5 L 22.6 -2.6 L 22.7 -1.4 L 21.9 .0 L 19.8 3.1 L 18.6 5.1 L 18.1 6.3 L 18.4 7.2 L 19.2 7.8 L 20.6 7.9 L 22.8 7.1 L 24.9 5.8 L 26.2 4.8 L 28.3 3.0","0 19.7 M 21.7 -2.7 L 20.7 -3.9 L 17.5 -4.3 L 13.9 -3.2 L 10.5 -.7 L 8.3 2.0 L 7.6 4.4 L 7.8 6.2 L 8.9 7.7 L 11.0 8.4 L 13.0 7.8 L 16.6 5.9 L 18.6 4.0 L 20.3 2.1 L 21.6 .1 L 22.1 -.8 L 22.1 -2.1 L 21.4 -2.8 L 20.4 -2.6 L 18.8 -.5 L 18.8 1.3 L 19.3 3.1 L 20.4 4.2 L 22.8 5.0 L 24.8 4.8 L 27.7 3.0","0 20.7 M 16.2 -6.1 L 12.4 1.1 L 7.7 8.9 L 3.7 15.0 L .7 18.9 L -.8 20.3 L -1.7 20.7 L -2.8 20.6 L -3.1 20.0 L -2.3 17.1 L .2 13.1 L 3.0 8.7 L 7.2 3.9 L 11.4 -.5 L 14.7 -3.1 L 17.5 -4.6 L 21.0 -5.1 L 23.5 -4.3 L 25.0 -2.4 L 24.5 .5 L 22.6 3.4 L 20.5 5.2 L 17.4 6.6 L 15.7 7.2 L 13.4 7.2 L 12.1 6.9 L 9.7 6.0 L 15.7 8.2 L 18.6 8.2 L 21.0 7.5 L 24.4 6.1 L 26.9 4.5 L 28.7 3.0","0 17.7 M 18.0 4.4 L 17.4 9.0 L 16.0 12.7 L 14.3 16.0 L 11.7 19.4 L 9.8 21.1 L 8.4 21.4 L 7.6 20.8 L 7.4 19.5 L 8.3 17.6 L 11.8 12.6 L 14.4 9.0 L 17.2 5.5 L 18.9 3.5 L 21.6 1.1 L 22.9 -1.0 L 22.7 -3.2 L 21.9 -4.0 L 19.0 -4.6 L 15.9 -3.8 L 12.2 -1.9 L 8.5 2.0 L 7.4 4.3 L 8.1 6.3 L 10.2 7.8 L 12.7 7.5 L 15.6 5.8 L 19.7 3.0 L 18.7 4.9 L 18.9 6.2 L 19.7 6.9 L 20.9 6.6 L 22.3 5.6 L 25.7 3.0","0 15.3 M 8.0 3.0 L 9.9 1.5 L 12.0 -1.0 L 13.2 -3.2 L 13.8 -3.8 L 14.2 -4.8 L 14.0 -5.6 L 13.3 -5.9 L 12.7 -5.4 L 12.7 -4.7 L 13.6 -3.7 L 15.5 -3.1 L 16.7 -3.0 L 17.7 -2.8 L 18.0 -2.2 L 17.6 -1.3 L 13.6 4.2 L 12.8 6.2 L 13.2 8.0 L 14.5 8.7 L 15.8 8.6 L 18.0 7.3 L 23.3 3.0","0 13.4 M 7.9 3.1 L 10.3 1.2 L 12.6 -1.0 L 14.7 -2.6 L 16.3 -4.0 L 16.6 -5.0 L 16.5 -5.5 L 15.8 -5.9 L 15.0 -5.4 L 14.4 -4.5 L 14.5 -2.8 L 14.6 4.2 L 14.3 6.5 L 13.5 7.8 L 12.8 8.2 L 11.2 8.2 L 10.4 7.6 L 10.1 6.9 L 10.1 6.0 L 10.8 4.9 L 12.7 3.7 L 14.8 2.6 L 17.4 1.7 L 19.6 1.0 L 21.9 1.3","0 15.6 M 8.0 3.0 L 15.6 -3.2 L 20.4 -8.1 L 23.4 -12.4 L 24.8 -15.5 L 25.2 -16.5 L 24.7 -17.2 L 23.7 -16.6 L 21.7 -12.9 L 19.2 -8.4 L 14.8 -.3 L 11.8 5.8 L 11.7 6.9 L 12.2 7.8 L 13.5 8.3 L 15.1 8.3 L 17.9 7.3 L 21.5 5.2 L 23.6 3.0 M 11.6 -4.9 L 11.8 -5.0 L 22.6 -4.5","0 19.3 M 13.1 -4.4 L 9.5 .6 L 7.6 3.6 L 7.0 5.4 L 7.1 6.6 L 8.3 7.4 L 10.0 7.5 L 12.0 6.8 L 14.6 5.4 L 17.8 3.0 L 20.4 .3 L 24.4 -4.4 L 19.1 1.9 L 17.7 4.6 L 17.3 6.5 L 17.5 7.4 L 18.2 7.9 L 19.5 7.8 L 21.5 7.3 L 24.5 5.6 L 27.3 3.0","0 20.0 M 8.0 -2.9 L 9.2 -3.9 L 10.3 -4.4 L 11.0 -4.0 L 10.6 -2.0 L 9.4 .3 L 8.1 2.7 L 7.2 4.7 L 6.8 5.9 L 7.1 6.8 L 8.1 7.7 L 10.2 7.8 L 14.1 6.0 L 16.6 3.7 L 18.9 1.0 L 19.9 -.7 L 20.9 -2.6 L 21.2 -4.5 L 20.7 -5.2 L 19.5 -5.2 L 19.2 -4.0 L 19.7 -2.6 L 21.4 -1.4 L 24.1 -1.1 L 25.9 -1.6 L 28.1 -3.2","0 23.0 M 11.8 -3.6 L 9.2 .5 L 7.2 4.8 L 7.0 6.9 L 8.7 8.2 L 11.0 7.5 L 13.9 5.5 L 16.3 3.0 L 18.3 .4 L 20.4 -3.4 L 16.9 4.5 L 16.7 6.9 L 18.1 8.0 L 20.0 7.9 L 21.9 7.1 L 24.5 4.3 L 26.5 1.2 L 27.8 -1.1 L 28.4 -3.2 L 27.9 -4.2 L 26.9 -4.2 L 26.5 -2.7 L 26.2 -.8 L 26.6 .3 L 27.5 2.0 L 28.7 3.7 L 29.9 3.6 L 31.0 3.0","0 18.1 M 8.3 -.6 L 11.6 -2.3 L 14.2 -3.4 L 15.6 -3.7 L 16.4 -2.9 L 15.1 2.7 L 14.7 7.1 L 16.8 8.3 L 19.8 7.6 L 23.3 5.7 L 26.1 3.0 M 6.3 9.0 L 11.6 4.5 L 17.1 .4 L 21.5 -2.2 L 24.6 -3.7","0 17.6 M 15.6 -4.1 L 13.5 -3.1 L 11.0 -1.0 L 8.3 2.1 L 7.5 4.4 L 7.3 5.7 L 7.4 6.8 L 9.4 8.2 L 11.0 8.2 L 14.2 6.9 L 18.0 4.6 L 21.2 1.8 L 23.3 -1.0 L 24.5 -2.9 L 23.8 -3.9 L 22.5 -3.7 L 20.9 -.6 L 17.9 4.8 L 14.3 11.3 L 11.5 15.6 L 8.7 18.8 L 5.8 21.0 L 4.0 21.7 L 2.9 21.5 L 2.6 21.0 L 2.5 19.6 L 4.3 17.3 L 9.0 13.4 L 12.0 11.3 L 16.8 8.8 L 21.4 6.2 L 24.2 4.3 L 25.6 3.0","0 16.1 M 10.8 -1.1 L 13.7 -3.1 L 15.5 -3.8 L 17.0 -4.2 L 18.3 -3.7 L 19.4 -2.0 L 19.3 .5 L 17.4 2.9 L 14.6 4.9 L 11.8 6.4 L 13.7 7.3 L 15.1 8.8 L 14.3 12.4 L 12.0 15.4 L 9.4 18.3 L 7.1 20.5 L 5.4 21.5 L 4.2 21.8 L 3.2 21.4 L 2.8 20.1 L 3.9 18.3 L 6.3 15.6 L 11.5 11.8 L 15.2 9.4 L 19.8 7.0 L 21.7 5.3 L 24.1 3.0","0 11.7 M 25.9 -15.0 L 23.5 -14.6 L 21.1 -12.8 L 19.7 -10.1 L 18.7 -6.4 L 17.5 -4.0 L 16.3 -3.0 L 14.3 -2.1 L 16.1 -.3 L 16.1 1.0 L 15.7 2.7 L 14.1 4.9 L 11.8 6.5 L 10.4 8.0 L 10.3 9.8 L 10.5 10.4 L 11.4 11.7","0 20.3 M 27.9 -16.7 L 9.2 12.8","0 16.9 M 21.9 -15.8 L 23.0 -14.9 L 23.4 -13.3 L 22.6 -11.7 L 20.4 -9.8 L 18.6 -7.8 L 17.6 -5.4 L 17.6 -4.1 L 18.0 -3.0 L 19.5 -2.0 L 17.3 -1.1 L 15.7 .4 L 14.5 3.4 L 13.6 6.7 L 11.6 9.6 L 10.0 10.9 L 7.9 11.3","0 11.7 M 9.7 -12.8 L 9.7 -11.2 L 11.4 -10.7 L 13.1 -11.6 L 14.6 -12.8 L 16.1 -12.9 L 17.3 -12.4 L 17.8 -10.8","-1 16 M 9.59 -9.17 L 9.53 2.67 L 21.57 2.67 L 21.57 -9.37 L 9.59 -9.17"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 7.9 M 11.6 -19.1 L 11.2 -.1 M 11.1 4.9 L 10.1 6.0 L 11.1 7.4 L 12.3 6.2 L 11.1 4.9","0 11.9 M 11.1 -15.0 L 11.3 -14.1 L 11.4 -4.5 L 10.9 -5.1 M 16.5 -15.2 L 17.1 -14.4 L 17.3 -3.9 L 16.8 -4.6","0 19.9 M 10.2 -4.2 L 12.2 -5.2 L 14.7 -5.6 L 17.4 -5.6 L 20.3 -5.3 L 23.1 -5.3 L 25.1 -5.4 L 26.5 -5.9 M 10.2 -9.2 L 12.2 -10.4 L 14.2 -10.9 L 16.5 -11.0 L 18.7 -10.9 L 21.5 -10.5 L 24.3 -10.7 L 26.2 -11.1 L 27.6 -11.6 M 18.3 -15.1 L 17.4 -11.6 L 16.2 -8.4 L 14.4 -4.8 L 12.8 -2.0 M 24.2 -15.5 L 23.3 -13.8 L 21.7 -8.8 L 19.6 -3.3 L 19.1 -1.6 L 18.5 -.8","0 17.7 M 15.6 4.2 L 15.3 3.0 L 14.3 2.2 L 13.3 2.2 L 11.0 3.6 L 9.5 6.0 L 9.5 9.1 L 11.5 11.7 L 14.7 12.2 L 17.4 11.7 L 20.6 9.8 L 22.6 7.2 L 23.0 5.0 L 21.4 1.2 L 18.2 -2.3 L 14.3 -6.4 L 12.3 -9.4 L 12.3 -12.0 L 14.0 -14.1 L 16.3 -14.6 L 18.9 -14.3 L 21.1 -13.0 L 22.7 -11.2 L 22.6 -9.5 L 21.3 -7.6 M 17.1 -14.8 L 17.4 -19.4 L 16.9 -19.0 M 16.3 12.3 L 16.0 16.2","0 21.3 M 12.8 -12.7 L 9.9 -10.9 L 9.2 -8.3 L 9.7 -6.8 L 11.5 -6.2 L 13.7 -6.7 L 15.3 -7.8 L 15.1 -10.3 L 13.9 -11.5 L 13.1 -12.1 L 15.7 -11.2 L 18.4 -11.3 L 21.2 -12.0 L 23.6 -12.4 L 26.0 -12.9 L 28.0 -13.8 L 26.7 -13.7 L 23.6 -10.9 L 19.9 -6.3 L 15.7 -.5 L 13.0 4.0 L 11.3 8.1 L 10.8 11.4 L 11.8 13.4 L 13.1 14.5 M 24.5 -1.0 L 22.0 .4 L 20.6 3.4 L 20.8 5.4 L 23.3 5.6 L 26.2 3.8 L 27.5 1.6 L 26.5 -.9 L 24.5 -1.0","0 26.8 M 28.9 -17.0 L 26.4 -15.4 L 25.2 -17.0 L 22.6 -17.9 L 20.5 -17.5 L 19.1 -16.5 L 17.8 -15.2 L 17.8 -13.7 L 19.4 -12.6 L 22.2 -11.8 L 24.0 -12.3 L 23.5 -12.8 L 21.4 -12.7 L 17.8 -11.4 L 14.3 -8.5 L 12.3 -5.5 L 11.5 -1.5 L 12.1 1.8 L 14.5 4.6 L 18.3 6.3 L 22.0 5.9 L 25.4 4.4 L 28.6 2.1 L 30.6 -1.1 L 31.1 -3.9 L 29.7 -7.1 L 27.7 -8.8 L 25.9 -9.4 M 21.4 .1 L 19.3 -.3 L 17.9 -2.1 L 18.1 -5.0 L 20.0 -7.1 L 22.2 -8.5 L 25.1 -9.3 L 28.6 -10.4 L 33.6 -12.3 L 35.8 -14.7 L 35.8 -17.0 L 34.4 -18.3 L 33.1 -18.7","0 6.5 M 11.1 -14.9 L 11.4 -14.1 L 11.6 -4.1 L 10.8 -4.8","0 10.7 M 19.6 -20.0 L 18.5 -20.1 L 15.0 -18.4 L 13.6 -14.4 L 12.8 -6.4 L 12.6 2.6 L 13.1 11.2 L 13.9 15.5 L 15.1 17.3 L 16.2 18.2 L 17.5 18.6 L 18.9 18.6","0 10.3 M 6.7 18.2 L 7.0 18.2 L 9.8 17.5 L 12.6 14.3 L 13.5 9.4 L 13.7 2.7 L 13.8 -7.2 L 13.3 -14.0 L 12.7 -18.3 L 11.6 -20.2 L 9.7 -20.8 L 8.3 -20.6 L 6.8 -20.1","0 13.6 M 15.8 -1.4 L 15.6 -18.9 M 11.7 -5.8 L 20.3 -15.7 M 10.1 -10.4 L 19.3 -10.8 L 20.8 -11.0 L 21.7 -11.4","0 18.0 M 17.3 2.3 L 17.2 -4.9 M 10.4 -.8 L 23.4 -.5","0 5.1 M 9.8 8.0 L 8.9 6.6 L 10.5 5.6 L 10.2 8.3 L 8.9 10.6","0 19.0 M 10.6 -1.3 L 25.1 -1.1","0 6.7 M 9.6 6.4 L 10.6 5.3 L 11.9 6.2 L 11.2 7.0 L 9.6 6.4","0 14.7 M 9.1 16.4 L 8.7 13.0 L 9.7 8.8 L 12.2 2.7 L 16.5 -5.2 L 22.1 -14.2 L 25.7 -18.9","0 24.3 M 17.3 -10.6 L 13.9 -8.5 L 11.6 -4.5 L 11.1 .3 L 12.6 5.4 L 16.9 8.6 L 20.9 9.6 L 25.0 8.3 L 28.6 3.4 L 29.7 -2.5 L 28.4 -7.1 L 25.5 -10.7 L 22.1 -11.6 L 17.3 -10.6","0 13.2 M 15.6 13.1 L 16.4 -3.9 L 16.1 -14.8 L 14.3 -12.5 L 12.4 -11.1 L 10.0 -10.2","0 20.8 M 16.4 -4.1 L 14.3 -3.9 L 12.5 -5.1 L 12.0 -9.0 L 12.8 -12.3 L 15.3 -14.8 L 18.4 -15.8 L 21.1 -14.9 L 24.1 -11.6 L 24.9 -6.8 L 23.7 -2.0 L 21.9 2.1 L 18.9 5.2 L 15.1 8.3 L 13.1 9.8 L 11.7 9.7 L 9.0 10.4 L 13.3 9.8 L 16.7 11.3 L 20.1 12.7 L 24.4 13.2 L 26.0 12.6 L 27.4 11.5","0 23.4 M 18.8 5.6 L 19.9 4.4 L 19.7 2.6 L 18.3 1.8 L 15.6 1.9 L 12.2 3.6 L 9.9 7.5 L 10.2 11.3 L 13.3 13.5 L 18.1 13.7 L 23.3 11.9 L 27.0 9.1 L 28.4 5.0 L 27.6 -.1 L 24.6 -2.8 L 21.5 -3.6 L 19.3 -3.6 L 17.4 -2.5 L 21.7 -5.1 L 24.8 -8.4 L 25.4 -12.2 L 23.3 -15.5 L 19.3 -16.3 L 15.2 -14.8 L 13.3 -11.4 L 12.9 -8.2 L 14.7 -6.4","0 24.2 M 24.8 15.3 L 24.4 14.7 L 25.1 -3.6 L 24.1 -7.4 M 21.6 -17.5 L 21.6 -12.8 L 20.1 -8.1 L 17.3 -3.9 L 15.4 -1.8 L 12.8 -.2 L 11.1 .7 L 7.9 .9 L 11.7 1.1 L 15.0 2.0 L 19.9 3.3 L 23.8 3.7 L 28.1 3.2 L 31.3 1.8 L 33.0 .1","0 22.4 M 28.1 -16.4 L 25.3 -14.9 L 20.3 -14.8 L 16.1 -14.8 L 12.4 -13.8 L 9.0 -12.0 L 12.3 -13.8 L 12.3 -1.7 L 15.5 -4.7 L 18.9 -7.1 L 22.0 -7.6 L 24.5 -6.8 L 27.1 -4.3 L 27.7 -.8 L 27.5 4.0 L 25.7 8.0 L 23.4 10.4 L 20.3 12.6 L 16.8 13.9 L 13.0 12.8 L 11.8 9.3 L 13.1 5.8 L 14.8 3.9 L 17.2 3.2 L 19.0 3.7","0 24.7 M 17.0 7.8 L 15.4 6.6 L 15.1 3.6 L 16.8 1.0 L 20.6 -1.2 L 25.2 -1.3 L 27.7 .8 L 29.0 4.2 L 28.4 7.7 L 25.7 10.4 L 21.8 12.3 L 18.2 12.2 L 14.1 10.0 L 11.6 6.4 L 11.2 .7 L 12.2 -5.6 L 14.9 -10.0 L 19.0 -13.2 L 23.4 -14.5 L 27.1 -14.7 L 29.2 -13.4 L 30.4 -12.1","0 21.3 M 16.4 14.3 L 15.9 10.6 L 17.5 4.8 L 19.7 -1.6 L 23.2 -7.9 L 25.6 -11.5 L 27.8 -13.7 L 32.5 -15.1 L 27.4 -13.7 L 23.5 -14.2 L 18.2 -15.3 L 14.4 -14.6 L 11.5 -12.6 L 10.1 -10.0 L 10.7 -6.9","0 21.0 M 9.8 7.6 L 10.6 11.3 L 13.6 13.3 L 17.7 13.3 L 21.7 11.4 L 24.3 8.2 L 24.7 4.2 L 22.4 1.0 L 17.5 -3.1 L 14.1 -6.1 L 12.3 -8.8 L 12.6 -12.4 L 15.3 -14.9 L 18.8 -16.1 L 22.4 -15.4 L 24.8 -12.9 L 25.5 -9.2 L 24.1 -6.4 L 20.6 -3.5 L 13.3 1.4 L 10.5 4.4 L 9.8 7.6","0 23.1 M 10.8 11.1 L 11.2 11.4 L 13.5 13.3 L 17.5 13.5 L 22.4 10.8 L 26.1 6.2 L 27.7 1.5 L 27.8 -3.1 L 27.2 -8.4 L 25.4 -13.0 L 22.0 -15.9 L 18.9 -16.0 L 14.9 -13.6 L 13.1 -10.5 L 11.9 -6.3 L 12.2 -1.7 L 14.3 1.3 L 18.5 2.3 L 22.2 1.5 L 25.6 -.9 L 27.7 -4.1","0 7.1 M 10.2 -5.5 L 11.3 -6.5 L 12.7 -5.8 L 11.8 -4.9 L 10.2 -5.5 M 9.7 6.3 L 11.1 5.3 L 12.3 6.0 L 11.5 7.1 L 9.7 6.3","0 6.7 M 9.4 -6.0 L 10.5 -7.1 L 11.8 -6.0 L 10.9 -5.0 L 9.4 -6.0 M 11.1 7.7 L 10.6 6.6 L 11.8 5.8 L 11.4 8.8 L 10.8 10.1 L 9.6 11.0","0 14.5 M 19.5 7.3 L 10.7 -1.4 L 19.1 -9.8","0 19.9 M 11.0 -4.6 L 25.1 -4.2 M 11.0 1.6 L 24.7 1.9","0 16.9 M 12.9 7.4 L 21.7 -2.5 L 11.0 -9.9","0 16.6 M 13.8 6.2 L 14.9 5.2 L 18.1 6.6 L 17.4 7.5 L 13.8 6.2 M 15.5 1.5 L 13.9 1.1 L 13.2 -1.1 L 14.6 -3.9 L 17.3 -6.2 L 21.8 -8.9 L 24.0 -12.0 L 24.5 -16.1 L 22.1 -18.7 L 18.5 -20.4 L 14.2 -19.5 L 11.0 -16.2 L 9.8 -12.8 L 10.2 -8.9 L 11.6 -7.0 L 12.8 -7.1 L 14.7 -8.6","0 30.4 M 27.2 -6.9 L 24.7 -3.7 L 21.7 -.3 L 19.5 .3 L 18.5 -.8 L 19.5 -4.3 L 21.6 -6.9 L 23.7 -8.2 L 25.5 -8.1 L 26.3 -7.2 L 26.3 -4.7 L 26.5 -.3 L 28.3 .9 L 31.3 .4 L 34.0 -1.7 L 35.6 -5.5 L 35.7 -8.6 L 33.2 -12.3 L 29.3 -14.9 L 24.9 -15.6 L 20.1 -14.7 L 15.7 -12.3 L 11.9 -8.0 L 10.9 -2.9 L 11.9 .9 L 14.6 3.8 L 18.0 5.6 L 22.0 6.6 L 26.3 6.4 L 29.1 5.9 L 31.1 5.1","0 24.4 M 10.5 11.5 L 9.7 9.6 L 7.9 8.9 L 5.3 9.7 L 3.8 12.0 L 3.5 15.4 L 5.3 17.4 L 8.3 17.7 L 11.7 15.9 L 15.1 11.3 L 17.5 4.8 L 20.0 -4.3 L 22.0 -11.6 L 24.7 -16.5 L 26.8 -18.6 L 28.5 -19.7 L 30.5 -19.7 L 30.9 -18.7 L 29.1 -18.5 L 25.7 -17.5 L 23.7 -16.9 L 18.3 -17.2 L 13.5 -16.7 L 9.7 -15.4 L 6.4 -12.2 L 5.7 -8.7 L 7.2 -6.4 L 10.3 -5.7 M 29.8 -17.9 L 27.9 -6.7 L 26.9 3.4 L 18.5 3.3 L 26.9 3.3 L 26.9 9.2 L 27.9 15.7 L 29.9 20.7 L 32.0 23.8 L 33.7 24.9 L 35.5 25.3 L 37.5 25.1 L 39.8 23.9","0 29.8 M 14.2 8.8 L 12.7 8.6 L 10.9 9.3 L 10.0 11.0 L 9.5 13.6 L 10.8 16.2 L 14.3 17.8 L 17.2 17.1 L 20.1 14.7 L 21.1 11.2 L 20.4 7.3 L 18.5 3.0 L 17.3 -2.1 L 17.5 -6.2 L 19.6 -9.9 L 22.2 -12.0 M 13.5 -3.0 L 10.9 -4.6 L 10.6 -8.5 L 12.6 -13.8 L 17.2 -18.2 L 21.7 -19.7 L 26.6 -19.3 L 31.3 -17.1 L 35.4 -13.2 L 36.3 -7.4 L 34.5 -2.4 L 31.1 1.4 L 29.2 2.8 L 25.5 4.0 L 24.0 4.4 L 24.6 3.6 L 30.7 4.5 L 33.2 7.7 L 33.2 10.9 L 31.6 13.6 L 29.6 14.9 L 26.7 15.1 L 25.6 14.1 L 24.9 12.3","0 31.4 M 29.5 -7.2 L 29.2 -5.9 L 30.9 -4.2 L 33.8 -4.4 L 37.4 -6.7 L 38.9 -10.2 L 38.8 -13.2 L 36.3 -16.8 L 32.5 -18.9 L 27.0 -19.1 L 21.0 -17.2 L 14.6 -12.3 L 11.1 -7.3 L 10.1 -1.5 L 10.8 3.8 L 12.6 8.6 L 16.5 12.5 L 20.4 15.4 L 24.5 16.9 L 30.1 16.5 L 34.3 14.8 L 37.1 12.5","0 36.9 M 16.0 1.2 L 13.0 .7 L 11.2 -2.2 L 10.9 -7.1 L 12.3 -11.3 L 15.8 -15.1 L 20.0 -17.2 L 25.5 -18.6 L 31.1 -17.9 L 35.6 -15.5 L 39.0 -10.2 L 40.8 -3.3 L 41.0 3.9 L 38.9 8.6 L 34.9 12.4 L 29.0 14.7 L 24.5 15.2 L 19.8 13.9 L 14.3 12.8 L 11.6 14.3 L 11.5 16.3 L 13.9 17.7 L 18.1 15.8 L 21.6 12.4 L 22.4 7.9 L 21.5 2.1 L 20.5 -4.8 L 21.4 -10.8 L 22.9 -13.3 L 27.0 -15.5","0 30.7 M 24.5 7.2 L 21.8 7.4 L 19.3 5.1 L 20.3 1.1 L 24.1 -2.4 L 28.7 -3.4 L 33.2 -1.5 L 35.9 2.7 L 35.2 8.0 L 32.0 13.3 L 25.5 16.6 L 19.4 17.0 L 13.0 13.3 L 10.2 6.2 L 12.0 -1.3 L 16.3 -6.4 L 21.6 -9.7 L 24.6 -10.5 L 27.7 -10.5 L 26.1 -9.5 L 23.7 -9.6 L 21.1 -11.6 L 20.3 -14.2 L 22.8 -17.5 L 26.6 -19.3 L 30.4 -19.1 L 33.3 -16.8 L 34.1 -14.8 L 32.6 -12.2","0 22.1 M 16.3 7.4 L 13.9 6.2 L 11.3 7.1 L 9.7 10.8 L 11.1 16.3 L 16.2 18.2 L 20.3 16.0 L 23.4 11.6 L 24.0 6.0 L 23.1 -11.8 L 24.3 -17.0 L 28.2 -20.8 L 32.0 -21.1 L 33.2 -19.5 L 32.0 -17.4 L 29.6 -16.2 L 25.2 -15.7 L 18.3 -16.2 L 10.8 -17.1 L 7.8 -16.1 L 5.8 -14.4 L 5.2 -11.7 L 5.4 -9.1 L 6.6 -7.7 L 7.7 -7.7 M 17.6 -5.6 L 28.0 -8.5 L 27.0 -7.4","0 34.9 M 11.0 -14.8 L 8.4 -11.6 L 7.6 -7.4 L 9.2 -2.9 L 13.6 -1.2 L 18.8 -1.3 L 24.9 -3.5 L 30.8 -6.9 L 35.6 -10.9 L 38.8 -14.2 L 38.3 -17.8 L 36.2 -19.9 L 31.1 -19.5 L 26.2 -17.3 L 21.3 -12.8 L 17.3 -7.0 L 15.3 -3.1 L 13.9 2.4 L 14.7 7.7 L 18.3 12.3 L 24.7 12.4 L 30.3 9.7 L 35.6 4.8 L 39.4 -.9 L 38.5 2.4 L 39.2 8.9 L 39.4 14.9 L 38.0 17.4 L 35.8 19.2 L 32.8 19.4","0 30.3 M 15.7 -3.5 L 13.2 -2.6 L 10.0 -4.7 L 9.5 -9.5 L 11.0 -13.7 L 17.1 -20.6 L 24.1 -2.1 L 25.3 6.1 L 24.1 12.0 L 21.2 15.0 L 16.6 17.4 L 13.4 16.4 L 10.2 13.0 L 9.5 8.6 L 11.5 4.4 L 13.6 2.7 L 16.0 2.9 L 18.2 5.9 M 45.3 -16.7 L 42.3 -18.2 L 38.4 -16.7 L 35.3 -13.6 L 33.1 -7.8 L 32.6 -1.1 L 32.4 3.4 L 25.4 4.6 L 32.2 3.6 L 33.0 7.9 L 34.6 14.0 L 34.9 16.5 L 37.6 14.6","0 20.8 M 12.5 12.9 L 12.1 15.1 L 14.8 17.1 L 18.9 16.9 L 23.1 13.4 L 24.5 7.3 L 24.1 -.9 L 22.1 -11.0 L 20.4 -19.5 L 16.7 -14.4 L 13.4 -8.5 L 11.6 -3.0 L 11.3 2.1 L 14.0 5.7 L 16.1 6.3 L 18.9 6.3","0 21.1 M 25.6 5.8 L 20.4 7.8 L 16.3 7.9 L 12.2 5.2 L 10.5 -.6 L 12.3 -6.3 L 16.7 -11.9 L 21.3 -15.9 L 29.0 -20.6 L 32.9 -23.1 L 33.8 -24.9 L 32.2 -26.0 L 28.3 -25.4 L 24.8 -22.4 L 23.0 -19.1 L 21.5 -10.9 L 21.4 -2.5 L 23.3 8.8 L 24.0 14.4 L 22.6 18.5 L 19.7 21.7 L 15.9 24.2 L 12.5 25.1 L 8.3 23.9 L 7.0 19.6 L 8.8 15.7 L 14.5 12.3 L 19.3 11.3 L 23.0 11.5 L 26.4 12.7 L 30.0 17.0 L 30.0 19.2 L 28.3 21.3","0 33.6 M 16.6 9.5 L 18.0 7.3 L 16.4 4.5 L 13.7 4.0 L 10.3 5.9 L 9.4 10.1 L 10.9 14.6 L 14.8 16.6 L 18.8 16.1 L 23.6 12.3 L 24.5 7.1 L 23.9 -4.6 L 22.9 -15.6 L 23.1 -20.1 L 16.4 -17.0 L 11.8 -12.9 L 10.3 -7.9 L 12.2 -4.3 L 14.1 -3.5 L 16.4 -4.0 M 45.5 -18.6 L 41.6 -18.2 L 37.8 -15.2 L 35.4 -10.7 L 33.4 -6.5 L 30.6 -3.9 L 27.5 -2.7 L 24.9 -2.3 L 30.1 -2.2 L 33.6 .5 L 36.6 6.2 L 38.8 13.6 L 41.2 18.7 L 43.6 20.9 L 46.4 21.9 L 48.3 21.3","0 23.6 M 11.2 -3.2 L 11.4 -1.6 L 15.0 .3 L 20.8 -.2 L 25.6 -3.1 L 31.5 -8.6 L 34.2 -13.9 L 34.9 -19.2 L 33.1 -22.1 L 29.8 -22.6 L 25.9 -20.0 L 23.3 -15.2 L 22.0 -7.1 L 21.5 .0 L 21.0 6.2 L 19.5 9.7 L 16.6 13.1 L 12.3 15.4 L 7.7 14.9 L 6.3 13.8 L 5.3 9.6 L 9.4 6.6 L 15.1 8.2 L 20.0 12.2 L 24.3 17.1 L 27.9 20.0 L 31.9 20.7 L 34.1 19.4","0 31.1 M 6.1 13.1 L 6.7 13.1 L 10.3 11.5 L 14.3 7.1 L 18.0 1.6 L 21.9 -7.8 L 24.3 -14.0 L 25.2 -18.3 L 23.8 -8.7 L 23.1 8.1 L 26.3 1.5 L 30.8 -8.3 L 36.5 -17.5 L 38.5 -21.6 L 38.7 -23.2 L 37.3 -24.3 L 35.7 -22.4 L 33.5 -16.1 L 32.1 -8.0 L 32.8 2.3 L 36.4 13.6 L 39.5 19.2 L 44.7 22.3 L 49.3 20.8 L 52.8 17.0 L 53.1 13.6 L 50.8 10.2 L 47.6 10.1 L 45.5 11.8 L 44.3 15.0 M 12.4 -12.1 L 10.5 -14.8 L 11.2 -17.9 L 14.0 -20.2 L 17.9 -20.3 L 22.7 -18.9 L 23.8 -18.6 L 25.8 -18.4 L 27.5 -19.4","0 23.2 M 9.9 8.4 L 10.2 6.8 L 7.4 5.3 L 4.6 6.6 L 3.0 9.9 L 3.6 12.7 L 6.3 15.5 L 10.4 16.3 L 14.9 13.2 L 16.7 8.7 L 16.8 .2 L 16.4 -6.1 L 15.1 -11.9 L 13.8 -17.5 L 18.1 -8.1 L 23.2 2.7 L 26.4 10.5 L 28.7 16.1 L 26.9 8.3 L 26.1 -1.1 L 28.0 -12.6 L 31.9 -21.7 L 36.4 -24.9 L 39.1 -24.7 L 40.5 -22.4 L 40.1 -20.5 L 39.1 -18.9 L 37.6 -18.5","0 30.1 M 22.7 -14.5 L 17.7 -13.2 L 14.2 -9.8 L 11.5 -4.2 L 11.0 1.0 L 12.2 6.7 L 16.6 10.8 L 21.4 11.8 L 26.3 11.0 L 31.6 7.3 L 34.2 1.3 L 34.5 -5.2 L 32.0 -10.7 L 28.8 -13.8 L 24.9 -14.5 L 21.9 -13.0 L 20.1 -9.6 L 20.6 -6.4 L 22.4 -5.2 L 25.0 -5.4","0 29.4 M 16.7 9.5 L 15.7 7.8 L 13.1 7.7 L 10.7 9.5 L 9.7 13.6 L 11.7 17.4 L 16.0 18.4 L 20.2 17.1 L 22.6 13.6 L 22.6 10.0 L 20.3 3.4 L 18.3 -2.3 L 17.8 -10.1 L 19.3 -14.0 L 21.7 -16.2 M 14.2 -5.7 L 12.9 -5.7 L 10.9 -8.5 L 11.1 -13.3 L 14.7 -18.9 L 19.1 -21.0 L 24.7 -21.9 L 31.2 -20.2 L 35.2 -16.7 L 37.8 -11.1 L 37.3 -5.5 L 33.8 -1.9 L 30.0 -.1 L 26.2 .7 L 23.8 -.1 L 21.7 -2.5 L 22.2 -4.1 L 23.9 -5.8","0 33.8 M 24.1 -1.7 L 26.2 2.1 L 26.4 6.2 L 25.1 8.2 L 21.5 10.3 L 17.0 9.1 L 13.5 4.9 L 11.5 -1.5 L 12.6 -8.9 L 16.1 -15.8 L 20.7 -19.8 L 26.5 -20.5 L 30.9 -18.5 L 34.8 -13.2 L 36.7 -6.8 L 36.7 -1.5 L 34.7 4.3 L 31.3 9.2 L 26.6 12.3 L 21.6 13.3 L 15.4 13.0 L 22.4 13.9 L 26.8 15.6 L 31.9 17.7 L 36.4 19.5 L 41.7 21.0 L 46.2 19.4 L 47.0 16.5 L 45.9 14.3 L 44.1 13.0 L 41.5 12.5 L 40.6 14.3","0 29.5 M 14.0 12.4 L 14.1 10.4 L 11.6 9.5 L 9.0 10.4 L 6.9 13.6 L 7.8 17.5 L 10.8 19.3 L 14.5 18.6 L 18.1 16.1 L 19.8 12.6 L 19.9 7.7 L 18.5 -1.1 L 19.0 -6.7 L 20.6 -9.8 L 22.1 -11.3 L 24.4 -12.9 L 25.6 -13.2 M 13.3 -.8 L 10.4 -2.7 L 9.1 -7.4 L 10.4 -12.5 L 14.7 -17.2 L 19.5 -19.9 L 24.9 -20.9 L 30.2 -19.9 L 34.9 -16.2 L 36.7 -11.4 L 35.5 -6.7 L 32.3 -2.3 L 28.1 .3 L 25.4 1.6 L 22.4 2.3 L 25.5 1.8 L 28.8 3.6 L 31.5 8.9 L 34.8 16.8 L 36.8 21.6 L 39.2 23.3 L 42.9 23.2","0 21.7 M 13.3 5.8 L 10.3 8.9 L 9.1 11.8 L 10.1 16.1 L 13.6 17.7 L 18.1 17.7 L 22.8 14.7 L 26.3 11.7 L 26.7 7.3 L 24.8 3.8 L 14.6 -11.3 L 13.9 -14.5 L 14.4 -16.7 L 17.3 -19.5 L 20.1 -20.8 L 23.3 -21.0 L 26.7 -18.8 L 27.6 -15.1 L 25.5 -12.1","0 23.9 M 21.0 9.7 L 19.6 8.0 L 17.0 8.6 L 15.0 10.8 L 14.9 13.9 L 16.6 17.1 L 19.8 17.9 L 23.5 16.6 L 26.1 12.9 L 25.4 6.7 L 24.1 -3.4 L 24.2 -8.0 L 24.7 -10.5 L 26.2 -13.7 M 11.0 -17.5 L 12.1 -17.6 L 13.8 -17.0 L 15.7 -13.7 L 16.0 -9.5 L 14.6 -4.8 L 12.6 -2.0 L 9.5 -.4 L 7.5 -.8 L 7.1 -3.4 L 9.3 -8.2 L 12.8 -11.0 L 17.2 -12.5 L 22.6 -13.2 L 28.2 -14.0 L 33.4 -15.4 L 36.9 -17.1 L 38.8 -19.1 L 39.1 -21.0","0 26.4 M 11.2 -11.9 L 8.8 -11.0 L 6.8 -12.5 L 6.6 -15.1 L 8.3 -18.5 L 11.2 -20.5 L 13.9 -20.8 L 17.1 -18.5 L 17.4 -13.1 L 16.4 -7.4 L 14.2 -1.8 L 12.5 4.8 L 11.6 9.5 L 11.8 12.7 L 12.9 14.8 L 14.7 15.1 L 17.0 14.4 L 20.9 10.2 L 25.5 2.8 L 28.9 -3.9 L 32.1 -12.1 L 27.6 2.1 L 27.2 9.6 L 27.6 14.2 L 28.4 16.2 L 29.4 17.4 L 31.5 17.7 L 33.5 17.0","0 25.5 M 12.7 -8.6 L 13.6 -6.5 L 13.0 -4.5 L 10.7 -3.0 L 8.7 -3.8 L 6.7 -6.7 L 6.8 -9.8 L 8.6 -13.9 L 11.4 -15.8 L 13.9 -16.2 L 17.2 -13.0 L 19.9 -4.7 L 23.1 8.3 L 24.5 18.7 L 24.1 11.8 L 26.0 4.3 L 29.5 -5.6 L 33.2 -13.3 L 36.9 -18.9 L 39.9 -22.0 L 42.3 -22.9 L 44.7 -22.3","0 45.8 M 8.0 -6.7 L 8.5 -10.9 L 11.5 -13.6 L 15.4 -14.4 L 18.0 -15.0 L 21.2 -16.3 L 17.4 -12.0 L 14.7 -6.0 L 13.7 -.9 L 14.3 3.6 L 17.8 5.9 L 21.3 4.9 L 27.1 .5 L 30.0 -3.6 L 30.0 -5.5 L 28.0 -5.3 L 24.8 -2.5 L 23.6 1.1 L 23.2 6.9 L 25.8 13.0 L 29.8 16.0 L 35.7 17.2 L 40.8 15.7 L 46.4 10.5 L 48.7 4.9 L 49.8 -2.0 L 48.7 -8.5 L 45.7 -13.7 L 43.4 -15.0 L 39.9 -14.4 L 37.9 -12.5","0 22.0 M 10.6 8.1 L 10.9 6.7 L 9.3 5.2 L 6.2 6.2 L 4.6 9.0 L 4.8 12.6 L 7.0 15.1 L 9.7 14.9 L 13.7 12.5 L 17.6 7.7 L 20.4 2.9 L 24.8 -5.9 L 28.7 -13.6 L 32.6 -18.0 L 36.4 -20.7 L 39.9 -21.0 M 10.1 -14.1 L 8.6 -13.4 L 6.8 -14.4 L 6.8 -17.4 L 9.0 -20.7 L 11.9 -21.4 L 14.0 -20.1 L 16.3 -14.4 L 19.2 -2.0 L 22.1 8.4 L 26.5 20.0 L 28.8 23.0 L 30.9 24.5 L 33.4 25.1 L 37.3 24.3 L 39.1 21.9 L 39.1 18.9 L 37.3 17.5 L 35.6 18.3","0 24.7 M 8.9 -12.8 L 6.8 -12.4 L 5.2 -13.6 L 5.4 -16.2 L 6.8 -18.7 L 9.0 -20.6 L 12.4 -21.3 L 14.6 -19.7 L 15.5 -16.0 L 14.3 -11.4 L 12.1 -4.9 L 11.1 .8 L 12.0 4.1 L 15.6 5.5 L 18.7 4.2 L 22.4 1.5 L 25.5 -2.9 L 30.0 -9.6 L 32.1 -14.0 L 32.8 -17.5 L 32.2 -18.9 L 29.9 -18.8 L 27.0 -14.9 L 25.5 -8.9 L 25.9 -2.1 L 27.9 5.2 L 29.5 12.3 L 29.5 18.1 L 28.1 21.3 L 25.6 24.4 L 21.3 26.7 L 17.9 27.1 L 15.5 25.8 L 15.5 21.6 L 18.0 17.8 L 22.2 13.7 L 25.5 11.3 L 27.6 10.9 L 31.6 9.8 L 34.1 10.1 L 35.0 11.1 L 34.1 13.0","0 23.1 M 11.9 -19.0 L 13.8 -19.7 L 15.6 -17.8 L 17.1 -12.8 L 16.7 -7.3 L 16.1 -5.5 L 14.2 -4.0 L 12.9 -4.7 L 12.0 -8.7 L 13.6 -12.7 L 17.1 -16.1 L 21.5 -18.1 L 27.7 -18.5 L 33.2 -18.3 L 39.6 -20.4 L 42.2 -21.6 L 42.3 -23.8 L 40.7 -24.3 L 36.7 -22.8 L 34.3 -20.4 L 30.8 -14.5 L 26.8 -5.6 L 22.4 3.0 L 18.5 8.1 L 14.9 10.8 L 12.4 13.1 L 10.1 14.3 L 7.7 14.7 L 6.3 14.2 L 6.0 12.0 L 9.1 9.6 L 11.8 9.3 L 14.4 10.3 L 19.7 14.6 L 24.8 19.5 L 28.0 22.0 L 30.7 23.1 L 33.5 23.4 L 36.4 22.4 L 38.6 20.9","0 8.2 M 16.2 18.9 L 11.4 18.8 L 11.4 -21.1 L 15.8 -21.2","0 17.5 M 8.3 -18.4 L 10.9 -10.0 L 14.7 -.4 L 18.4 7.0 L 22.4 12.7 L 25.2 15.4 L 26.8 16.0","0 9.1 M 9.1 19.3 L 12.8 19.1 L 13.2 -2.9 L 12.6 -21.1 L 8.4 -21.3","0 18.2 M 10.8 -7.6 L 16.3 -14.0 L 17.2 -15.0 L 23.7 -7.4","0 24.4 M 9.8 12.7 L 19.4 12.1 L 26.9 12.4 L 30.6 11.8","0 28.9 M 21.6 -16.6 L 21.2 -17.5 L 19.9 -16.8 L 21.7 -15.4 L 24.1 -14.4 L 25.7 -14.1","0 15.0 M 18.8 -2.7 L 16.5 .7 L 14.5 3.4 L 12.2 5.4 L 10.8 5.5 L 9.8 4.8 L 10.3 1.9 L 11.5 -.9 L 14.3 -3.0 L 16.1 -3.2 L 17.7 -1.6 L 18.5 6.6 L 19.1 7.6 L 20.5 7.3 L 21.6 6.7","0 17.3 M 12.3 14.4 L 16.8 12.3 L 20.1 8.8 L 21.7 4.3 L 21.4 1.0 L 19.9 -.4 L 17.1 .3 L 15.1 2.7 L 14.1 5.5 L 13.2 8.3 L 13.1 13.3 L 11.5 5.8 L 10.8 -1.2 L 11.8 -9.1 L 13.7 -14.2 L 16.1 -16.9 L 19.6 -18.3 L 22.1 -18.6 L 23.6 -18.2 L 24.5 -17.5","0 13.7 M 17.2 -2.0 L 18.6 -3.1 L 18.2 -4.9 L 16.4 -6.0 L 14.0 -5.6 L 12.2 -4.4 L 10.4 -2.3 L 9.8 1.1 L 10.9 4.3 L 13.7 5.7 L 16.2 6.0 L 18.9 5.0 L 19.8 4.0","0 17.6 M 21.3 -1.1 L 17.8 -2.9 L 14.2 -2.7 L 11.3 -.4 L 10.1 2.8 L 10.3 5.4 L 11.8 7.0 L 15.1 6.6 L 18.2 4.8 L 20.2 1.5 L 21.4 -1.3 M 15.7 -18.2 L 17.5 -18.6 L 19.2 -16.9 L 19.9 -12.8 L 19.9 .3 L 20.4 7.1 L 21.0 9.7 L 22.4 11.2 L 24.0 11.5 L 26.2 11.0","0 14.2 M 10.8 -1.1 L 13.4 .1 L 15.8 -.2 L 17.8 -1.8 L 18.1 -3.9 L 16.9 -5.2 L 14.5 -5.1 L 12.1 -3.6 L 10.5 -.6 L 10.1 2.8 L 12.1 5.7 L 15.0 6.6 L 17.1 6.0 L 20.3 3.2","0 10.4 M 1.9 17.8 L 3.0 19.5 L 6.2 20.0 L 11.2 17.3 L 13.3 14.1 L 14.0 10.2 L 13.9 5.5 L 12.3 -2.9 L 11.6 -8.1 L 11.8 -13.6 L 12.9 -17.8 L 15.0 -19.7 L 16.9 -20.1 L 18.5 -20.1 L 20.0 -18.9 M 7.3 -7.4 L 8.9 -8.1 L 15.0 -8.7 L 16.7 -9.2","0 15.1 M 18.9 -5.6 L 17.4 -2.2 L 15.9 .2 L 13.7 1.5 L 11.3 1.4 L 9.9 -.2 L 10.0 -3.2 L 12.3 -6.2 L 14.7 -7.2 L 18.3 -7.3 L 17.8 -7.3 L 18.1 6.6 L 17.7 12.3 L 16.8 17.1 L 15.0 20.1 L 12.4 22.7 L 9.4 24.1 L 7.0 24.1 L 4.0 22.7 L 3.1 20.8","0 19.2 M 23.7 -23.1 L 20.2 -23.3 L 16.6 -21.3 L 13.9 -16.3 L 12.4 -11.1 L 11.3 -5.4 L 10.9 .5 L 11.0 6.4 L 12.1 2.6 L 13.9 -2.1 L 15.4 -4.2 L 17.1 -5.5 L 18.4 -5.5 L 19.2 -4.3 L 20.4 .8 L 22.0 6.6 L 23.3 10.6 L 24.7 12.6 L 25.7 13.4 L 27.3 13.3 L 28.5 12.2","0 8.9 M 13.9 7.0 L 12.2 7.3 L 11.2 6.9 L 11.6 -2.9 L 11.5 -3.5 L 10.1 -3.3 L 8.9 -2.5 M 9.8 -9.4 L 10.7 -10.2 L 13.2 -8.5 L 12.0 -7.4 L 9.8 -9.4","0 9.5 M 18.0 18.5 L 19.2 16.3 L 19.2 14.5 L 17.0 12.8 L 12.4 12.6 L 6.7 14.4 L 2.6 17.4 L .9 20.7 L .2 24.1 L 1.4 25.4 L 3.5 25.8 L 6.8 24.6 L 10.5 21.6 L 12.7 18.1 L 13.8 14.0 L 13.9 8.6 L 11.8 -4.7 L 9.3 -3.1 M 11.5 -10.8 L 10.6 -11.7 L 9.7 -10.9 L 11.7 -9.2 L 12.6 -10.5","0 15.5 M 11.5 14.3 L 11.4 -3.0 L 12.6 -13.2 L 14.2 -17.9 L 16.6 -20.5 L 18.1 -21.3 L 20.3 -21.6 L 21.2 -21.1 M 10.1 6.3 L 13.2 .9 L 15.1 -1.7 L 17.5 -2.9 L 18.9 -2.1 L 18.7 -.4 L 16.0 2.7 L 11.8 5.9 L 13.1 4.9 L 17.1 7.7 L 19.7 9.0 L 21.6 8.8 L 23.5 7.4","0 8.4 M 14.4 11.5 L 12.3 11.5 L 10.6 9.8 L 10.6 3.6 L 11.5 -10.6 L 11.5 -18.5 L 11.1 -20.0 L 9.8 -20.3 L 8.3 -19.7 L 6.9 -18.7","0 25.3 M 7.4 -3.3 L 9.4 -4.5 L 11.2 -4.5 L 12.1 -3.1 L 12.4 .6 L 12.8 7.5 L 13.2 2.3 L 15.0 -1.4 L 16.4 -3.6 L 18.0 -4.7 L 20.0 -4.6 L 21.0 -2.8 L 21.4 -.1 L 21.6 4.8 L 22.2 .6 L 23.8 -3.1 L 25.2 -5.1 L 26.8 -6.1 L 28.3 -5.8 L 29.0 -3.7 L 29.2 2.6 L 29.7 8.6 L 30.2 11.0 L 30.9 11.9 L 32.3 12.3 L 33.8 12.5 L 35.1 11.6","0 16.9 M 8.6 -1.9 L 11.3 -3.6 L 12.0 -.1 L 12.6 3.9 L 12.6 8.7 L 13.4 3.9 L 15.3 -.1 L 16.7 -2.1 L 18.0 -3.1 L 19.3 -3.2 L 19.9 -2.1 L 20.6 3.4 L 20.9 8.6 L 22.0 10.4 L 23.3 10.5 L 25.0 9.9","0 13.0 M 14.6 -4.6 L 12.6 -3.9 L 10.8 -2.1 L 10.0 .9 L 10.2 2.8 L 11.9 4.3 L 14.4 4.5 L 16.8 2.8 L 17.8 1.3 L 18.4 -1.3 L 18.1 -2.9 L 16.7 -3.9 L 14.6 -4.6","0 14.8 M 4.0 20.8 L 4.2 20.8 L 7.4 19.4 L 11.0 16.4 L 12.6 13.2 L 12.5 7.4 L 11.7 -2.4 L 13.1 -4.9 L 15.5 -7.7 L 17.8 -8.8 L 20.2 -8.1 L 20.9 -5.7 L 20.6 -1.9 L 18.9 .7 L 17.3 2.2 L 15.1 2.3 L 12.7 1.4 L 11.5 -2.5 L 11.2 -9.2 L 7.8 -7.9","0 15.3 M 24.9 17.7 L 22.4 18.7 L 20.0 18.2 L 18.5 15.5 L 17.9 8.8 L 18.1 1.1 L 18.6 -4.5 L 17.2 -6.1 L 13.9 -6.5 L 12.1 -5.7 L 10.3 -3.5 L 9.8 -.1 L 10.5 2.2 L 12.0 3.0 L 14.2 2.2 L 16.9 .0 L 18.7 -4.0 L 19.7 -8.2","0 12.6 M 8.0 -4.5 L 9.4 -5.5 L 10.7 -5.5 L 11.6 -3.6 L 12.8 8.8 L 13.0 1.1 L 13.6 -1.7 L 15.7 -5.6 L 18.4 -8.5 L 19.6 -9.2 L 21.3 -9.3 L 22.5 -8.5 L 22.2 -7.3 L 21.4 -6.0 L 19.5 -3.8","0 12.3 M 9.8 4.0 L 8.6 6.2 L 9.0 8.8 L 11.6 9.8 L 14.4 9.0 L 16.4 6.7 L 17.3 4.3 L 16.6 2.5 L 10.8 -6.2 L 10.6 -7.4 L 11.2 -9.0 L 12.8 -10.2 L 14.8 -10.6 L 16.7 -10.2 L 17.5 -8.5 L 16.5 -6.9","0 9.9 M 16.7 7.3 L 15.0 8.0 L 13.2 8.0 L 11.9 6.6 L 11.5 3.4 L 12.3 -7.4 L 12.2 -10.2 L 17.1 -11.0 L 9.3 -9.6 L 12.3 -10.2 L 12.4 -12.0 L 12.0 -13.4 L 11.6 -14.0 L 10.4 -14.2 L 9.2 -13.6","0 14.2 M 8.4 -2.7 L 8.7 -2.9 L 10.9 -3.9 L 11.3 -3.3 L 11.2 4.7 L 11.2 5.2 L 12.6 4.7 L 14.7 2.6 L 16.5 -.1 L 18.0 -2.5 L 18.6 -3.3 L 18.1 6.6 L 18.5 8.3 L 19.7 8.3 L 20.9 8.3 L 22.4 7.7","0 15.3 M 8.3 -3.1 L 9.8 -4.4 L 11.4 -3.6 L 12.4 -1.3 L 15.0 7.2 L 18.2 2.0 L 21.1 -3.3 L 22.7 -8.0 L 21.9 -12.5 L 20.0 -15.5 L 17.6 -15.9 L 16.3 -15.5 L 15.1 -14.5","0 19.6 M 7.3 -5.6 L 9.5 -6.3 L 10.7 -5.0 L 12.8 4.5 L 14.1 3.8 L 17.4 -4.1 L 17.8 -4.7 L 19.0 .7 L 21.3 6.3 L 21.8 6.2 L 22.8 .7 L 24.7 -4.7 L 27.5 -9.5 L 30.2 -12.0 L 32.2 -12.7 L 33.4 -12.8 L 34.4 -12.2","0 13.5 M 9.0 7.8 L 20.4 -6.8 M 7.6 -5.1 L 7.9 -5.0 L 10.0 -5.6 L 11.5 -4.1 L 16.8 7.3 L 18.5 9.2 L 20.6 9.6 L 22.1 9.1 L 23.8 8.0","0 17.2 M 7.9 -4.9 L 8.3 -4.9 L 9.9 -5.2 L 11.4 -4.1 L 12.0 .4 L 12.2 3.8 L 13.8 3.9 L 17.1 .5 L 19.4 -2.8 L 20.8 -5.4 L 21.0 -2.3 L 21.3 4.2 L 21.5 10.2 L 20.2 15.9 L 19.0 18.1 L 16.6 19.7 L 13.3 20.8 L 10.1 20.0 L 8.3 19.0 L 7.2 17.1 L 7.7 15.0 L 9.7 12.8","0 15.7 M 9.2 -3.7 L 11.8 -5.9 L 13.8 -6.3 L 18.3 -5.7 L 22.9 -6.3 L 19.3 -1.6 L 16.1 1.7 L 13.2 4.2 L 11.0 5.6 L 9.5 6.2 L 8.2 6.4 L 9.4 5.4 L 11.3 5.4 L 14.3 6.8 L 20.1 10.1 L 22.2 11.3 L 24.5 11.2 L 26.6 10.0 L 28.3 8.4","0 15.3 M 21.6 18.9 L 19.5 18.5 L 17.6 16.8 L 17.4 8.9 L 16.4 3.8 L 15.0 1.5 L 13.5 .5 L 10.7 .7 L 13.2 .5 L 15.1 -.4 L 17.3 -2.9 L 18.5 -5.7 L 18.7 -11.7 L 19.1 -16.5 L 21.0 -20.4 L 23.1 -21.3 L 25.0 -21.0","0 9.0 M 13.0 16.7 L 12.4 -17.7 L 12.1 -18.3","0 13.9 M 6.7 19.2 L 10.5 18.6 L 13.0 16.8 L 14.2 13.3 L 14.3 4.6 L 15.1 2.1 L 16.8 .9 L 17.6 .3 L 19.6 .3 L 16.6 .3 L 14.3 -1.4 L 13.5 -4.7 L 13.7 -10.3 L 13.5 -15.4 L 12.6 -18.9 L 10.2 -21.2 L 6.9 -21.1","0 20.2 M 10.3 .9 L 12.0 -2.1 L 13.6 -3.4 L 15.8 -3.6 L 19.2 -2.5 L 21.8 -1.6 L 23.5 -1.4 L 25.8 -2.9","0 7.2 M 12.1 -15.0 L 10.2 -14.2 L 9.0 -12.6 L 9.9 -11.2 L 11.9 -11.0 L 13.6 -11.7 L 14.5 -13.4 L 13.8 -14.7 L 12.1 -15.0"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 7.5 M 11.3 -.4 L 10.8 -.5 L 10.5 -6.7 L 10.0 -10.7 L 10.0 -13.4 L 10.7 -13.9 L 12.6 -13.9 L 13.3 -13.3 L 13.1 -8.4 L 12.5 -5.0 L 12.4 -.3 M 11.5 2.4 L 9.9 3.0 L 9.6 4.8 L 10.4 6.2 L 11.7 6.6 L 13.2 5.9 L 13.8 4.5 L 13.2 2.8 L 11.5 2.4","0 8.5 M 13.1 -8.7 L 13.4 -14.5 L 14.9 -14.5 L 15.2 -14.0 L 14.9 -8.6 L 14.0 -8.6 M 9.3 -8.7 L 9.7 -14.5 L 11.1 -14.5 L 11.4 -14.1 L 11.1 -8.6 L 10.3 -8.6","0 19.4 M 12.5 -6.0 L 10.2 -6.0 L 10.2 -7.7 L 14.0 -7.7 L 14.6 -13.4 L 16.4 -13.4 L 15.7 -7.7 L 20.1 -7.7 L 20.6 -13.4 L 22.4 -13.4 L 21.8 -7.6 L 25.7 -7.6 L 25.7 -6.1 L 21.6 -6.1 L 21.2 -1.0 L 25.1 -1.0 L 25.1 .8 L 20.8 .8 L 20.5 6.6 L 18.7 6.6 L 19.2 .7 L 14.8 .7 L 14.3 6.4 L 12.7 6.4 L 13.2 .9 L 9.5 .9 L 9.5 -1.0 L 13.5 -1.0 L 14.0 -6.0 M 18.0 -6.0 L 15.5 -6.0 L 15.1 -.9 L 19.4 -.9 L 19.8 -6.0","0 18.3 M 23.2 -14.7 L 23.7 -6.5 M 21.8 -14.6 L 22.0 -12.0 M 22.2 -6.7 L 22.0 -8.9 L 21.5 -10.0 L 20.3 -11.1 L 18.5 -12.1 L 17.3 -11.9 L 17.3 -7.1 M 17.3 -13.7 L 18.8 -13.6 L 20.1 -13.3 M 17.4 -14.4 L 17.4 -16.1 M 15.9 -16.0 L 15.9 -13.6 M 15.9 -12.0 L 15.9 -7.8 M 15.9 -13.7 L 13.6 -13.3 L 11.6 -12.1 L 10.4 -10.5 L 10.1 -8.6 L 10.7 -6.8 L 12.0 -5.1 L 14.0 -3.7 L 15.9 -2.7 L 17.8 -1.8 L 19.8 -.6 L 21.3 .7 L 21.7 1.7 L 21.7 2.9 L 20.7 4.3 L 19.2 5.0 L 18.1 5.1 M 23.2 2.9 L 23.6 1.3 L 22.6 -.5 L 20.4 -2.2 L 16.4 -4.4 L 13.9 -6.0 L 12.7 -7.1 L 12.2 -8.0 L 11.8 -8.8 L 11.8 -9.4 M 14.9 -11.9 L 13.8 -11.3 L 13.3 -10.5 L 13.2 -9.4 L 14.4 -7.8 L 16.4 -6.4 L 19.0 -4.9 L 21.7 -3.4 L 24.0 -1.6 L 25.2 .5 L 25.0 3.1 L 23.5 5.0 L 21.1 6.1 L 19.1 6.7 L 17.3 6.8 L 17.3 9.4 L 17.3 -.9 M 16.1 -1.3 L 16.1 4.3 M 16.1 5.2 L 14.4 4.6 L 13.3 4.1 L 11.9 2.8 L 11.1 1.5 L 10.9 .5 L 10.9 -1.0 M 9.3 -1.0 L 9.6 7.7 M 11.0 7.6 L 10.9 4.7 M 12.6 5.8 L 16.1 6.7 L 16.1 9.7","0 21.4 M 14.0 -11.7 L 12.5 -11.5 L 11.5 -10.2 L 11.4 -8.5 L 11.5 -7.0 L 12.3 -5.9 L 13.7 -5.2 L 15.2 -5.4 L 16.0 -6.9 L 15.9 -9.7 L 15.2 -11.1 L 14.0 -11.7 M 13.7 -3.8 L 16.1 -4.3 L 17.5 -5.5 L 18.4 -7.3 L 18.5 -9.3 L 17.8 -11.1 L 16.6 -12.4 L 15.0 -13.1 L 12.9 -13.2 L 11.0 -12.4 L 9.3 -10.4 L 9.1 -8.2 L 9.5 -6.2 L 10.8 -4.7 L 12.1 -3.9 L 13.7 -3.8 M 27.0 -12.7 L 9.4 5.2 L 10.6 6.4 L 28.1 -11.6 M 23.7 -2.1 L 21.6 -1.8 L 19.9 -.8 L 18.9 1.0 L 18.9 3.8 L 19.9 5.8 L 21.3 6.8 L 23.1 7.2 L 24.7 7.1 L 26.5 6.4 L 27.8 4.9 L 28.3 3.1 L 28.0 .8 L 27.1 -.9 L 25.7 -1.7 L 23.7 -2.1 M 22.6 -.7 L 21.7 .0 L 21.2 1.1 L 21.2 4.2 L 22.0 5.3 L 22.8 5.8 L 24.4 5.8 L 25.3 5.3 L 25.7 4.4 L 25.8 3.1 L 25.7 .9 L 24.7 -.4 L 24.1 -.7 L 22.6 -.7","0 26.5 M 21.6 5.1 L 20.1 6.3 L 17.9 6.8 L 14.6 6.5 L 11.7 5.4 L 9.8 3.5 L 8.9 .9 L 9.1 -2.1 L 10.8 -4.7 L 12.6 -5.8 M 11.4 -3.3 L 10.6 -1.2 L 10.6 .4 L 11.0 2.0 L 11.8 3.5 M 20.2 -5.0 L 15.8 -5.0 L 14.4 -4.3 L 13.2 -3.3 L 12.7 -2.0 L 12.5 -.9 L 12.5 .8 L 12.9 2.5 L 14.1 4.2 L 15.8 5.0 L 17.8 5.0 L 19.6 4.2 L 20.7 2.8 L 21.1 1.8 L 21.3 .7 L 21.3 -5.0 M 23.0 -4.9 L 23.0 2.2 M 22.4 4.3 L 24.4 6.0 L 27.2 6.8 L 29.9 6.4 L 31.8 5.2 L 33.0 3.8 L 33.8 1.8 M 32.1 1.5 L 31.3 3.3 L 29.4 4.8 L 26.6 5.2 L 25.4 4.1 L 24.7 3.0 L 24.7 -5.0 L 31.9 -5.0 M 31.9 -6.7 L 24.6 -6.7 M 24.6 -8.1 L 24.9 -16.9 M 23.3 -16.9 L 23.2 -11.5 M 21.8 -12.9 L 19.6 -13.8 L 17.1 -13.8 L 14.5 -13.2 L 12.4 -11.1 L 12.2 -8.7 L 13.1 -7.2 L 14.4 -6.2 L 14.6 -6.2 M 22.0 -10.1 L 21.1 -11.3 L 19.8 -12.0 L 17.5 -12.1 L 16.2 -11.3 L 15.5 -10.2 L 15.3 -9.0 L 16.0 -7.5 L 17.1 -6.6 L 18.9 -6.6 L 21.0 -6.6 L 21.6 -6.8 L 22.1 -7.3 L 22.4 -8.1 M 14.1 -10.9 L 13.8 -9.4 L 14.1 -8.3","0 4.8 M 9.4 -8.7 L 10.1 -14.6 L 11.7 -14.6 L 11.3 -8.6 L 10.6 -8.6","0 11.5 M 15.9 7.1 L 13.5 5.2 L 11.7 2.8 L 10.3 -.4 L 9.7 -3.6 L 10.2 -6.0 L 11.2 -8.8 L 12.8 -11.1 L 14.8 -13.4 L 17.1 -15.0 L 18.0 -14.0 L 16.3 -12.7 L 14.5 -9.9 L 13.5 -6.7 L 13.2 -3.1 L 13.5 -.3 L 14.1 2.2 L 15.2 4.5 L 16.8 6.0 L 17.8 6.9 L 17.1 8.2 M 12.3 .8 L 11.5 -2.5 L 11.5 -4.8 L 12.1 -7.2","0 11.8 M 12.2 7.1 L 14.6 5.2 L 16.4 2.8 L 17.9 -.4 L 18.4 -3.6 L 17.9 -6.0 L 16.9 -8.8 L 15.4 -11.1 L 13.3 -13.4 L 11.0 -15.0 L 10.2 -14.0 L 11.8 -12.7 L 13.6 -9.9 L 14.6 -6.7 L 14.9 -3.1 L 14.6 -.3 L 14.0 2.2 L 12.9 4.5 L 11.4 6.0 L 10.3 6.9 L 11.1 8.2 M 15.9 .8 L 16.6 -2.5 L 16.6 -4.8 L 16.1 -7.2","0 16.2 M 13.5 -6.2 L 10.7 -7.8 L 9.7 -6.0 L 14.0 -3.6 L 9.6 -1.1 L 9.9 -.4 M 10.5 .8 L 14.9 -1.7 L 14.9 3.1 L 17.1 3.1 L 17.2 -1.6 L 21.4 .7 L 22.2 -1.0 L 18.1 -3.5 L 22.6 -6.0 L 22.2 -6.8 M 21.7 -7.7 L 17.0 -5.1 L 17.0 -10.4 L 15.1 -10.4 L 14.9 -5.4 M 15.5 -3.6 L 16.1 -4.1 L 16.6 -3.5 L 16.0 -2.9 L 15.5 -3.6","0 16.7 M 9.0 -3.9 L 15.7 -3.9 L 15.7 -10.5 L 17.4 -10.5 L 17.4 -4.0 L 23.8 -4.0 L 23.8 -3.3 M 23.8 -2.3 L 17.4 -2.3 L 17.4 4.1 M 16.3 4.0 L 15.7 4.0 L 15.7 -2.3 M 14.5 -2.3 L 9.0 -2.3 L 9.0 -3.0","0 7.2 M 9.6 7.5 L 10.5 7.5 L 11.4 7.1 L 12.0 6.6 L 12.0 6.0 L 10.5 5.9 L 9.7 4.4 L 10.0 2.7 L 11.6 2.0 L 13.3 2.5 L 13.7 4.2 L 13.6 5.6 L 13.3 6.9 L 12.6 7.8 L 11.5 8.5 L 10.5 8.6 L 9.6 8.5 M 11.7 3.4 L 11.3 4.0 L 11.8 4.4 L 12.1 3.9 L 11.7 3.4 M 9.5 7.4 L 10.4 7.4 L 11.3 7.0 L 11.8 6.5 L 11.8 6.0 L 10.4 5.8 L 9.6 4.4 L 9.9 2.6 L 11.5 2.0 L 13.2 2.4 L 13.6 4.1 L 13.5 5.6 L 13.2 6.8 L 12.5 7.8 L 11.4 8.4 L 10.4 8.5 L 9.5 8.4 M 11.6 3.3 L 11.1 4.0 L 11.7 4.3 L 12.0 3.8 L 11.6 3.3","0 12.2 M 19.5 -3.4 L 19.5 -4.1 L 8.9 -4.1 M 9.0 -3.1 L 9.0 -2.3 L 19.5 -2.3","0 7.3 M 11.6 2.0 L 10.0 2.7 L 9.7 4.4 L 10.5 5.8 L 11.8 6.3 L 13.2 5.6 L 13.9 4.1 L 13.3 2.5 L 11.6 2.0 M 11.7 3.3 L 11.2 4.0 L 11.8 4.4 L 12.1 3.9 L 11.7 3.3 M 11.5 2.0 L 9.9 2.7 L 9.6 4.4 L 10.4 5.9 L 11.7 6.3 L 13.2 5.6 L 13.8 4.2 L 13.2 2.5 L 11.5 2.0 M 11.6 3.4 L 11.1 4.0 L 11.7 4.4 L 12.0 3.9 L 11.6 3.4","0 21.0 M 26.0 -15.0 L 9.5 6.4 L 10.8 7.6 L 27.4 -13.9","0 18.2 M 10.7 -10.4 L 12.7 -12.5 L 15.4 -13.7 L 17.8 -13.8 L 20.4 -13.1 L 22.8 -11.3 L 24.7 -7.9 L 24.9 -5.1 L 25.2 -1.6 L 24.3 1.4 L 22.9 4.1 L 20.6 5.9 L 17.6 6.8 L 15.8 6.8 L 13.3 5.9 L 10.8 3.7 L 9.5 .8 L 9.0 -3.6 L 9.2 -7.0 L 9.9 -9.0 L 10.7 -10.4 M 13.0 -9.1 L 13.7 -10.6 L 14.9 -11.6 L 16.6 -12.1 L 18.6 -11.8 L 20.0 -10.4 L 21.2 -6.9 L 21.5 -3.8 L 21.4 -.3 L 20.9 2.1 L 20.1 3.7 L 18.0 5.1 L 16.6 5.0 L 15.2 4.6 L 13.9 3.4 L 12.9 .8 L 12.4 -1.5 L 12.3 -5.3 M 11.3 -8.6 L 10.7 -5.0 L 10.6 -2.3 L 11.0 .2 L 11.8 2.2 L 12.4 3.0 M 22.5 1.7 L 23.2 -1.1 L 23.3 -3.6 L 23.1 -5.8 L 22.4 -8.7 L 21.7 -10.2","0 11.2 M 8.9 -7.1 L 13.8 -13.4 L 14.6 -13.4 M 15.5 -13.5 L 15.5 4.7 L 18.8 4.7 M 18.9 6.2 L 8.2 6.2 M 8.3 4.8 L 12.0 4.8 L 12.0 -8.2 L 10.4 -6.2 M 13.9 -10.5 L 13.9 4.6","0 17.5 M 10.0 -14.0 L 10.0 -5.5 M 11.3 -14.0 L 11.3 -11.9 L 12.9 -12.9 L 15.1 -13.7 L 17.3 -13.8 L 19.4 -13.6 L 21.1 -12.8 L 22.6 -11.6 L 23.3 -10.5 L 23.8 -9.1 L 23.7 -7.3 L 23.2 -5.8 L 21.7 -4.1 L 19.4 -2.1 L 12.0 3.2 M 13.7 3.2 L 23.5 3.2 L 23.5 .0 M 25.1 .0 L 25.1 6.4 M 23.3 4.5 L 11.2 4.5 M 23.4 6.4 L 9.2 6.4 L 9.2 4.4 M 10.0 3.0 L 19.5 -5.8 L 20.4 -7.6 L 20.4 -9.7 L 19.2 -11.6 L 17.6 -12.1 L 15.0 -12.1 L 13.0 -11.0 L 11.8 -9.3 L 11.2 -7.0 L 11.2 -5.4 M 21.3 -10.6 L 22.1 -9.2 L 22.1 -7.5 L 21.6 -6.3 L 20.6 -5.0","0 16.4 M 9.2 .1 L 9.2 4.3 L 11.0 5.8 L 14.3 6.9 L 18.0 6.6 L 20.7 5.5 L 22.4 3.8 L 23.2 2.2 L 23.3 -.5 L 22.4 -2.3 L 21.4 -3.6 L 20.1 -4.4 L 19.6 -4.7 M 18.6 -5.3 L 19.5 -5.7 L 20.8 -6.7 L 21.7 -8.1 L 21.9 -9.3 L 21.4 -11.3 L 20.1 -12.6 L 18.0 -13.6 L 15.2 -13.8 L 13.5 -13.6 L 12.2 -13.2 L 11.2 -12.6 L 11.2 -14.1 M 9.8 -14.3 L 9.8 -7.6 M 11.4 -7.7 L 11.4 -9.6 L 12.2 -10.9 L 13.2 -11.7 L 14.8 -12.1 L 16.9 -12.1 L 18.5 -11.2 L 19.1 -10.0 L 19.1 -8.5 L 18.6 -7.2 L 17.8 -6.2 L 16.5 -5.8 L 14.9 -5.8 M 20.3 -8.4 L 20.5 -9.3 L 20.3 -10.1 M 14.9 -5.0 L 15.0 -4.3 L 16.7 -4.3 L 18.2 -3.6 L 19.3 -2.3 L 20.0 -.4 L 19.7 1.9 L 19.2 3.7 L 17.8 4.8 L 16.2 5.2 L 14.3 5.0 L 13.3 4.6 L 12.6 4.3 L 11.5 3.3 L 11.1 2.7 L 10.6 1.7 L 10.6 .0 M 20.8 3.5 L 21.5 1.7 L 21.6 .7 L 21.5 -.2 L 21.2 -1.6","0 19.4 M 18.8 -13.4 L 16.3 -13.4 L 14.8 -8.6 L 13.1 -5.3 L 11.3 -2.3 L 9.0 .9 L 9.0 2.4 L 18.9 2.4 M 19.8 2.3 L 19.8 3.8 L 19.5 4.6 L 15.5 4.6 M 15.5 6.0 L 27.3 6.0 M 27.1 4.6 L 24.1 4.6 L 23.6 4.3 L 23.3 3.8 L 23.3 2.5 L 25.5 2.5 M 25.5 1.5 L 25.5 .5 L 23.3 .5 L 23.3 -5.1 M 21.5 -3.6 L 21.5 4.6 M 22.0 -5.1 L 20.0 -5.1 L 20.0 .5 L 11.2 .5 L 20.3 -13.3 M 17.2 -12.3 L 16.6 -9.9 L 18.1 -12.3 L 17.2 -12.3","0 16.7 M 9.6 .5 L 9.6 4.3 L 11.3 5.5 L 13.7 6.3 L 16.5 6.7 L 19.9 5.9 L 22.2 4.1 L 23.8 1.5 L 23.9 -1.4 L 22.7 -4.3 L 21.7 -5.5 L 19.8 -6.4 M 10.7 .6 L 10.7 2.3 L 11.3 3.3 L 12.8 4.5 L 14.9 5.3 L 17.1 5.2 L 19.5 3.7 L 20.3 1.7 L 20.5 -1.3 L 20.1 -3.3 L 18.5 -4.9 L 16.8 -5.6 L 14.8 -5.7 L 12.8 -5.3 L 11.7 -4.5 M 21.2 3.0 L 22.0 1.2 L 22.2 -.5 L 22.1 -2.0 L 21.4 -3.7 M 10.7 -4.5 L 10.0 -4.6 L 10.8 -13.0 L 21.4 -13.0 L 21.4 -15.3 M 22.8 -15.4 L 22.8 -9.9 M 21.0 -10.3 L 11.9 -10.3 L 11.9 -6.4 L 13.1 -7.0 L 14.3 -7.3 L 16.5 -7.2 M 12.1 -11.5 L 21.0 -11.6","0 17.6 M 22.7 -8.5 L 22.7 -11.9 M 21.6 -12.6 L 19.6 -13.7 L 16.1 -13.6 L 13.3 -12.3 L 10.8 -8.8 L 9.8 -6.0 L 9.6 -2.2 L 10.0 1.2 L 11.3 4.0 L 13.9 6.2 L 16.8 6.8 M 19.5 6.4 L 22.1 5.2 L 24.2 2.4 L 24.6 -.1 L 24.4 -2.3 L 23.6 -4.7 L 22.2 -6.3 L 19.9 -7.3 L 17.9 -7.7 L 15.1 -7.1 L 13.2 -5.4 M 12.5 -4.6 L 13.1 -8.1 L 14.4 -10.5 L 15.8 -11.8 L 17.5 -12.1 L 19.5 -11.9 L 20.9 -10.7 L 21.6 -9.4 L 21.5 -8.5 M 12.8 -.8 L 13.4 -3.4 L 15.1 -5.2 L 17.2 -6.1 L 19.1 -5.7 L 20.8 -4.1 L 21.6 -1.2 L 21.2 1.7 L 20.4 3.8 L 18.5 5.1 L 16.4 5.1 L 14.4 4.1 L 13.7 2.9 L 13.2 1.4 M 11.9 2.0 L 11.3 .5 L 11.1 -2.1 L 11.3 -5.3 L 11.6 -7.3 M 22.3 -4.0 L 23.1 -1.8 L 23.1 .1 L 22.7 2.0 L 22.1 3.3","0 16.6 M 15.7 6.1 L 13.7 6.1 L 13.8 3.0 L 14.2 .9 L 15.1 -2.0 L 16.7 -5.0 L 18.2 -7.1 L 19.5 -8.8 L 20.9 -10.1 M 19.7 -10.3 L 10.3 -10.3 L 10.3 -7.6 M 8.8 -7.6 L 8.8 -13.2 M 10.4 -13.0 L 24.1 -13.0 M 10.5 -11.5 L 20.8 -11.5 M 24.0 -11.8 L 24.0 -10.8 L 21.4 -9.2 L 19.1 -6.1 L 17.9 -3.3 L 17.2 -.2 L 17.2 6.2 M 14.9 4.7 L 15.7 .2 L 15.8 4.6 L 14.9 4.7","0 18.6 M 13.2 -5.8 L 11.7 -7.1 L 10.9 -9.3 L 12.0 -11.9 L 13.9 -13.1 L 16.6 -13.7 L 19.3 -13.5 L 22.0 -12.8 L 23.6 -11.2 L 24.3 -9.1 L 23.7 -7.2 L 22.4 -5.9 L 21.3 -5.3 M 14.0 -7.3 L 15.7 -6.1 L 18.3 -5.7 L 20.6 -6.8 L 21.2 -8.1 L 21.3 -10.0 L 20.3 -11.3 L 18.6 -12.0 L 16.1 -12.0 L 14.0 -10.9 L 13.7 -9.1 M 12.7 -10.2 L 12.4 -9.4 L 12.7 -8.4 M 22.5 -10.3 L 22.8 -9.1 L 22.4 -8.2 M 21.6 -4.7 L 23.6 -3.6 L 25.0 -1.9 L 25.8 .3 L 25.4 2.5 L 24.1 4.7 L 21.0 6.4 L 17.3 6.9 L 14.7 6.5 L 11.5 5.0 L 9.6 2.5 L 9.5 -1.1 L 11.1 -3.5 L 13.0 -4.8 L 14.7 -5.1 M 15.7 -4.1 L 18.3 -4.2 L 20.3 -3.5 L 21.9 -1.5 L 22.3 .7 L 21.9 2.7 L 20.4 4.6 L 17.8 5.0 L 14.7 4.5 L 13.4 3.1 L 12.8 .4 L 13.3 -2.1 L 14.2 -3.3 L 15.7 -4.1 M 11.8 -1.9 L 11.2 .2 L 11.2 .9 L 11.9 3.0 M 23.4 -1.8 L 23.9 -.2 L 23.9 1.0 L 23.6 2.1 L 23.1 3.0","0 17.0 M 10.7 1.6 L 10.7 5.0 M 12.0 5.8 L 14.6 6.8 L 17.7 6.7 L 20.7 4.8 L 22.9 1.3 L 23.7 -.9 L 24.0 -5.2 L 23.6 -8.0 L 22.8 -10.0 L 20.8 -12.2 L 18.3 -13.6 L 15.2 -13.6 L 12.3 -12.9 L 10.5 -11.0 L 9.1 -8.6 L 9.1 -4.8 L 10.3 -1.6 L 12.4 .0 L 15.0 .8 L 17.1 .8 L 19.2 -.4 L 20.0 -1.2 M 20.8 -6.1 L 20.2 -3.9 L 18.9 -2.2 L 16.4 -.9 L 14.3 -1.3 L 12.8 -3.1 L 11.9 -6.5 L 12.3 -8.8 L 14.0 -11.5 L 16.1 -12.1 L 18.0 -12.0 L 19.4 -10.5 L 20.4 -8.2 M 21.5 -9.2 L 22.4 -6.7 L 22.3 -4.4 L 22.3 -2.2 L 22.1 -.3 M 11.6 -10.2 L 10.6 -8.6 L 10.4 -6.3 L 10.7 -4.6 L 11.4 -3.1 M 21.1 -2.5 L 20.5 1.1 L 18.8 4.0 L 17.2 5.3 L 14.8 5.2 L 13.0 4.1 L 12.3 3.0 L 12.3 1.8","0 7.2 M 11.5 2.0 L 9.9 2.7 L 9.6 4.4 L 10.4 5.9 L 11.8 6.3 L 13.2 5.6 L 13.9 4.2 L 13.3 2.5 L 11.5 2.0 M 11.7 3.4 L 11.2 4.0 L 11.8 4.4 L 12.0 3.9 L 11.7 3.4 M 11.4 -10.2 L 9.8 -9.5 L 9.5 -7.8 L 10.3 -6.4 L 11.6 -5.9 L 13.1 -6.6 L 13.7 -8.1 L 13.1 -9.7 L 11.4 -10.2 M 11.7 -8.9 L 11.2 -8.2 L 11.8 -7.8 L 12.0 -8.3 L 11.7 -8.9","0 7.6 M 9.7 7.4 L 10.6 7.4 L 11.5 7.0 L 12.1 6.5 L 12.1 5.9 L 10.6 5.8 L 9.8 4.3 L 10.1 2.6 L 11.7 1.9 L 13.4 2.4 L 13.8 4.1 L 13.7 5.5 L 13.4 6.8 L 12.7 7.7 L 11.6 8.3 L 10.6 8.5 L 9.7 8.4 M 11.8 3.3 L 11.4 3.9 L 12.0 4.3 L 12.2 3.8 L 11.8 3.3 M 11.7 -10.2 L 10.1 -9.5 L 9.8 -7.8 L 10.6 -6.3 L 11.9 -5.9 L 13.4 -6.6 L 14.1 -8.0 L 13.4 -9.7 L 11.7 -10.2 M 11.8 -8.8 L 11.3 -8.2 L 11.9 -7.8 L 12.2 -8.3 L 11.8 -8.8","0 17.2 M 20.2 -12.2 L 9.0 -3.5 L 21.4 6.4 L 23.1 4.7 L 12.8 -2.5 M 11.5 -3.5 L 23.2 -11.4 L 21.5 -13.2","0 18.9 M 9.3 -7.6 L 26.0 -7.6 L 26.0 -6.8 M 25.9 -5.4 L 9.2 -5.4 L 9.2 -6.1 M 9.3 -1.9 L 26.0 -1.9 L 26.0 -1.2 M 25.9 .2 L 9.2 .2 L 9.2 -.5","0 17.0 M 11.9 -13.3 L 10.2 -11.7 L 21.8 -3.6 M 20.4 -2.5 L 10.3 4.5 L 11.9 6.6 L 24.3 -3.5 L 13.1 -12.5","0 15.5 M 13.9 .1 L 13.9 -2.4 L 14.7 -3.9 L 16.0 -5.1 L 17.4 -6.3 L 18.3 -7.4 L 18.6 -8.6 L 18.5 -9.6 L 17.6 -11.2 L 15.9 -12.0 L 14.4 -12.1 L 12.2 -11.4 L 11.1 -10.0 L 11.2 -8.3 M 9.6 -8.4 L 9.6 -13.7 M 10.9 -13.7 L 10.9 -12.6 L 11.7 -13.3 L 13.2 -13.8 L 16.2 -13.9 L 18.2 -13.5 L 19.7 -12.7 L 21.6 -11.2 L 22.3 -9.1 L 22.1 -7.3 L 20.9 -5.4 L 19.5 -4.4 L 18.1 -3.8 L 16.6 -2.9 L 15.9 -2.2 L 15.9 -1.7 L 15.9 .0 M 19.3 -6.3 L 20.4 -8.1 L 20.4 -9.3 L 19.8 -10.8 M 14.6 2.3 L 13.0 3.0 L 12.7 4.7 L 13.5 6.2 L 14.8 6.6 L 16.3 5.9 L 17.0 4.4 L 16.3 2.8 L 14.6 2.3 M 14.7 3.6 L 14.2 4.3 L 14.8 4.7 L 15.1 4.2 L 14.7 3.6","0 34.4 M 33.5 10.8 L 28.9 12.7 L 23.2 12.8 L 17.2 11.1 L 12.1 6.7 L 9.6 .6 L 9.5 -4.6 L 10.5 -9.9 L 13.3 -14.4 L 16.8 -17.6 L 21.8 -19.5 L 27.9 -20.0 L 32.9 -18.7 L 37.5 -15.8 L 40.2 -11.4 L 41.2 -7.6 L 40.8 -2.4 L 38.6 2.7 L 35.2 5.1 L 31.8 5.2 L 29.7 3.0 L 29.1 1.2 M 27.7 2.7 L 25.6 4.8 L 22.2 5.2 L 19.1 4.3 L 16.9 1.1 L 16.0 -3.2 L 16.7 -6.6 L 17.9 -9.4 L 20.7 -12.3 L 24.3 -13.7 L 27.9 -13.8 L 30.6 -12.6 L 31.8 -13.5 M 29.4 -11.1 L 25.2 -11.6 L 21.8 -9.1 L 20.0 -4.6 L 19.8 -.9 L 20.1 1.4 L 21.4 3.4 L 23.3 4.0 L 25.8 3.2 L 27.3 1.1 L 28.6 -1.5 L 29.3 -9.3 M 21.3 -11.0 L 18.8 -7.6 L 17.9 -4.1 L 18.0 -1.3 L 18.5 1.0 M 31.2 -10.9 L 30.3 -.3 M 32.9 -14.1 L 31.8 -.1 L 31.9 2.5 L 33.0 3.7 L 34.6 3.6 L 36.5 2.5 L 38.0 .3 L 39.1 -2.1 L 39.6 -6.4 L 38.8 -10.4 L 37.4 -13.4 L 35.0 -15.6 L 31.3 -17.5 L 27.1 -18.3 L 23.5 -18.2 L 18.9 -16.6 L 15.6 -14.1 L 12.7 -10.3 L 11.3 -6.6 L 11.1 -2.8 L 12.0 2.8 L 15.4 7.2 L 18.9 9.7 L 23.4 11.1 L 28.2 11.0 L 32.6 9.4","0 22.9 M 8.1 5.9 L 8.4 5.9 L 17.6 5.9 M 20.7 5.9 L 30.8 5.9 M 30.8 4.7 L 27.9 4.7 L 21.3 -11.5 L 21.3 -13.6 M 19.9 -13.5 L 18.8 -13.5 L 11.4 4.3 L 11.2 4.6 L 8.2 4.6 M 17.5 4.8 L 13.8 4.7 L 13.4 4.1 L 14.6 .9 L 22.6 .9 M 23.0 2.3 L 24.3 4.6 L 20.6 4.6 M 25.5 4.0 L 20.0 -10.5 M 18.9 -9.8 L 18.8 -8.9 L 21.9 -.5 L 15.3 -.5 L 17.6 -6.2","0 22.1 M 9.0 6.0 L 22.7 6.0 L 25.2 5.4 L 27.3 4.4 L 29.0 2.9 L 29.5 1.1 L 29.4 -.7 L 28.5 -2.6 L 26.7 -3.7 L 24.9 -4.3 M 21.9 -5.0 L 24.4 -5.8 L 26.2 -7.2 L 26.7 -9.1 L 26.3 -10.3 L 25.0 -11.6 L 23.0 -12.4 L 20.8 -12.9 L 17.2 -13.0 L 9.1 -13.0 M 8.9 -11.8 L 11.7 -11.8 L 12.5 -11.8 L 13.2 -11.2 L 13.2 4.2 L 12.9 4.7 L 8.9 4.7 M 16.0 4.6 L 22.4 4.6 L 24.4 3.4 L 25.6 2.0 L 25.9 .2 L 25.3 -1.5 L 24.0 -2.8 L 22.3 -3.5 L 20.0 -4.0 L 16.6 -4.0 L 16.6 2.4 M 14.9 4.1 L 14.9 -11.4 M 15.9 -11.6 L 19.5 -11.3 L 21.4 -10.8 L 22.8 -9.2 L 22.8 -7.8 L 22.0 -6.6 L 20.4 -5.7 L 18.3 -5.4 L 16.5 -5.4 L 16.5 -9.5 M 24.1 -10.2 L 24.6 -9.0 L 24.5 -7.9 L 23.9 -7.3 M 26.5 -2.1 L 27.4 -.9 L 27.6 .3 L 27.5 1.5 L 26.7 3.0","0 20.3 M 24.2 -6.4 L 23.7 -9.3 L 22.0 -11.4 L 19.3 -12.1 L 16.1 -11.5 L 13.9 -9.4 L 12.7 -5.6 L 13.1 -.8 L 14.1 1.8 L 16.6 4.4 L 20.3 4.9 L 23.2 3.9 L 24.5 2.8 L 25.4 1.5 M 13.0 2.8 L 11.8 .9 L 11.2 -1.0 L 11.0 -4.3 L 11.4 -6.5 L 12.1 -8.8 M 27.0 1.8 L 25.7 4.2 L 23.0 6.2 L 19.9 6.8 L 16.9 6.7 L 13.4 5.4 L 10.6 2.3 L 9.3 -1.0 L 9.3 -6.2 L 11.1 -10.4 L 14.3 -12.7 L 17.9 -13.9 L 19.7 -13.8 L 22.0 -13.2 M 23.8 -15.1 L 24.0 -11.9 M 25.2 -15.0 L 25.8 -6.5","0 22.6 M 8.7 5.8 L 21.4 5.8 L 24.9 4.8 L 26.8 3.4 L 28.5 .9 L 29.3 -1.2 L 29.4 -3.7 L 29.3 -4.6 L 29.1 -6.6 L 27.6 -9.4 L 26.2 -10.9 L 24.3 -12.0 L 22.8 -12.6 L 21.3 -13.0 L 8.5 -13.0 M 8.6 -11.6 L 12.2 -11.6 L 12.8 -11.0 L 12.8 4.2 L 12.4 4.9 L 8.5 4.9 M 15.6 4.5 L 20.5 4.5 L 22.5 3.8 L 23.9 2.7 L 25.1 1.0 L 25.7 -1.6 L 25.8 -4.3 L 25.5 -6.7 L 24.6 -8.8 L 23.2 -10.5 L 21.7 -11.2 L 19.6 -11.5 L 15.5 -11.5 M 16.1 -9.8 L 16.1 2.5 M 14.5 4.4 L 14.5 -11.5 M 26.2 -8.8 L 27.2 -6.4 L 27.5 -4.6 L 27.6 -2.5 L 27.3 -.6 L 26.8 .9 L 26.3 1.8","0 21.4 M 9.1 5.8 L 27.0 5.8 L 27.0 8.9 M 28.5 8.9 L 28.5 -.2 M 27.3 1.7 L 27.1 3.4 L 26.3 4.1 L 16.0 4.1 L 16.5 3.6 L 16.5 -1.9 M 16.5 -2.9 L 18.7 -2.9 L 19.9 -2.5 L 20.3 -1.4 L 20.3 1.1 L 21.5 1.1 L 21.5 -8.7 M 20.3 -7.3 L 20.3 -5.7 L 19.9 -4.9 L 19.2 -4.5 L 16.6 -4.5 L 16.6 -9.4 M 15.8 -11.6 L 23.8 -11.6 L 24.7 -10.9 L 25.2 -9.7 L 25.3 -6.9 M 26.6 -7.1 L 26.0 -15.4 M 25.1 -13.1 L 9.0 -13.1 M 8.9 -11.8 L 12.1 -11.8 L 12.8 -11.5 L 13.2 -10.8 L 13.2 3.9 L 12.7 4.8 L 8.8 4.8 M 14.8 3.8 L 14.8 -10.9","0 19.8 M 8.6 5.9 L 20.5 5.9 M 20.5 4.7 L 16.9 4.7 L 16.2 4.2 L 16.2 -2.2 M 16.0 -3.2 L 19.6 -3.2 L 20.4 -2.7 L 20.4 .7 L 21.8 .7 L 21.8 -9.0 M 20.6 -7.4 L 20.6 -5.7 L 19.8 -4.9 L 16.1 -4.9 L 16.0 -9.3 M 15.4 -11.4 L 24.6 -11.4 L 25.8 -10.2 L 25.8 -6.8 M 27.3 -7.0 L 26.5 -15.6 M 25.5 -13.2 L 8.8 -13.2 M 8.6 -11.9 L 11.9 -11.9 L 12.8 -11.0 L 12.8 4.0 L 12.3 4.8 L 8.7 4.8 M 14.5 -10.8 L 14.5 4.3","0 22.9 M 18.0 -1.8 L 23.7 -1.8 L 24.3 -1.3 L 24.3 2.3 L 23.1 3.8 L 21.2 5.0 L 18.0 5.1 L 14.8 3.4 L 13.3 .5 L 12.6 -3.3 L 12.9 -6.7 L 14.3 -10.2 L 16.6 -12.0 L 18.9 -12.3 L 21.0 -12.0 L 22.5 -10.9 L 23.6 -9.4 L 24.1 -8.0 L 24.1 -6.3 M 25.9 -6.3 L 25.2 -15.3 M 23.9 -15.2 L 24.1 -11.9 M 21.8 -13.1 L 19.5 -13.9 L 15.4 -13.3 L 12.4 -11.6 L 10.2 -8.8 L 9.1 -5.4 L 9.1 -1.9 L 10.4 2.2 L 12.8 4.9 L 15.8 6.3 L 20.1 6.9 L 23.2 5.8 L 24.8 4.5 M 12.2 -9.1 L 11.1 -6.0 L 10.8 -3.0 L 11.5 .5 L 12.7 2.4 M 25.8 -1.6 L 25.8 2.9 M 26.4 5.1 L 26.4 7.9 M 27.5 8.0 L 27.5 -1.4 L 28.1 -1.9 L 30.6 -1.9 M 30.7 -3.2 L 18.2 -3.2","0 24.9 M 8.6 6.3 L 20.1 6.3 M 21.1 6.3 L 32.7 6.3 M 32.5 4.9 L 29.0 4.9 L 28.4 4.4 L 28.4 -11.1 L 29.0 -11.7 L 32.7 -11.7 M 32.7 -13.0 L 21.4 -13.0 M 20.1 -13.0 L 8.6 -13.0 M 8.7 -11.7 L 12.2 -11.7 L 12.7 -10.9 L 12.7 4.2 L 12.1 4.7 L 8.5 4.7 M 20.0 4.8 L 16.9 4.8 L 16.3 4.2 L 16.3 -3.6 L 24.9 -3.6 M 25.0 -1.6 L 25.0 4.1 L 24.3 4.8 L 21.3 4.8 M 26.7 4.4 L 26.7 -11.7 M 21.5 -11.8 L 24.2 -11.8 L 25.0 -11.0 L 25.0 -5.7 L 24.4 -5.1 L 16.3 -5.1 M 16.2 -7.1 L 16.2 -11.2 L 16.7 -11.7 L 20.1 -11.7 M 14.5 -11.7 L 14.5 4.6","0 13.1 M 9.0 6.2 L 20.8 6.2 M 20.7 4.8 L 17.2 4.8 L 16.6 4.2 L 16.6 -11.0 L 17.4 -11.8 L 20.9 -11.8 M 20.9 -13.1 L 8.8 -13.1 M 8.8 -11.9 L 12.6 -11.9 L 13.2 -11.3 L 13.2 4.1 L 12.5 4.8 L 9.0 4.8 M 14.9 4.5 L 14.9 -11.7","0 15.5 M 8.3 6.0 L 10.1 6.5 L 12.7 6.7 L 15.7 5.6 L 17.5 4.0 L 18.3 2.4 L 18.7 .9 L 18.7 -11.0 L 19.4 -11.8 L 22.7 -11.8 M 22.8 -13.2 L 9.3 -13.2 M 9.2 -11.7 L 15.6 -11.7 M 15.2 -10.7 L 15.2 1.7 L 15.0 3.2 L 14.1 4.4 L 12.7 5.2 L 10.9 5.0 L 9.1 4.4 M 17.0 -11.3 L 17.0 2.2","0 22.9 M 8.9 5.9 L 19.4 5.9 M 19.3 4.8 L 16.6 4.8 L 16.6 -.9 L 18.1 -3.0 L 27.1 8.9 L 30.6 11.7 L 34.7 13.0 L 37.4 12.8 L 39.4 12.1 L 40.7 11.3 M 39.4 10.1 L 37.7 11.0 L 35.2 11.0 L 33.7 10.5 L 32.1 9.4 L 30.6 8.0 L 23.0 -2.3 L 22.0 -3.3 L 20.8 -4.2 M 19.5 -4.7 L 23.8 -10.3 L 25.3 -11.4 L 26.4 -11.7 L 29.5 -11.7 M 29.6 -13.2 L 21.8 -13.2 M 19.8 -13.1 L 9.0 -13.1 M 9.0 -11.7 L 12.4 -11.7 L 12.9 -11.2 L 12.9 4.2 L 12.3 4.8 L 8.9 4.8 M 14.8 4.4 L 14.8 -11.7 M 16.5 -5.4 L 16.5 -11.2 L 17.1 -11.8 L 19.7 -11.8 M 21.8 -11.7 L 23.0 -11.7 L 16.5 -3.4 M 20.5 -2.6 L 22.8 .4 L 25.4 4.2 L 27.9 7.3 L 29.2 8.8 L 30.3 9.7","0 20.3 M 8.7 6.2 L 25.6 6.2 L 25.6 8.6 M 27.1 8.6 L 27.1 -.3 M 26.1 1.6 L 26.1 3.0 L 25.0 4.1 L 15.5 4.1 M 16.4 2.7 L 16.4 -11.0 L 17.1 -11.7 L 20.8 -11.7 M 20.9 -13.1 L 8.6 -13.1 M 8.5 -11.7 L 12.4 -11.7 L 13.0 -11.1 L 13.0 4.2 L 12.4 4.7 L 8.7 4.7 M 14.6 -10.6 L 14.6 3.4","0 29.7 M 8.4 6.0 L 17.7 6.0 M 17.8 4.8 L 14.5 4.8 L 13.9 4.2 L 14.7 -7.1 M 15.4 -5.9 L 21.7 6.2 L 22.6 6.3 L 29.7 -7.7 M 29.7 -5.2 L 30.7 3.8 L 30.3 4.6 L 26.9 4.6 M 27.0 6.0 L 37.6 6.0 M 37.5 4.7 L 34.9 4.7 L 34.3 4.0 L 32.7 -10.9 L 33.3 -11.7 L 35.9 -11.7 M 35.9 -13.1 L 31.1 -13.1 L 23.2 2.2 M 22.6 .6 L 15.6 -13.1 L 10.1 -13.1 M 10.1 -11.9 L 13.5 -11.9 L 13.8 -11.4 L 12.3 4.0 L 11.5 4.7 L 8.3 4.7 M 15.2 -10.3 L 21.8 2.6 M 32.5 4.5 L 30.9 -10.0","0 23.4 M 8.6 6.0 L 18.3 6.0 M 18.2 4.7 L 14.7 4.7 L 14.2 4.2 L 14.2 -9.0 M 15.2 -7.4 L 25.3 6.4 L 25.9 6.4 M 27.0 6.4 L 27.0 -11.1 L 27.5 -11.7 L 30.7 -11.7 M 30.9 -13.2 L 21.1 -13.2 M 21.2 -11.8 L 24.5 -11.8 L 25.2 -11.1 L 25.2 .9 M 23.8 -1.3 L 15.3 -13.0 L 8.6 -13.0 M 8.5 -11.7 L 11.8 -11.7 L 12.6 -10.9 L 12.6 4.0 L 11.9 4.7 L 8.6 4.7 M 15.0 -10.6 L 24.6 2.4","0 20.6 M 9.8 -7.4 L 9.3 -3.8 L 9.5 -1.0 L 11.1 3.4 L 13.7 5.7 L 17.8 7.1 L 21.4 6.5 L 24.9 4.4 L 27.1 .9 L 27.8 -2.7 L 27.4 -7.1 L 25.5 -10.6 L 21.8 -13.2 L 17.6 -13.8 L 14.6 -13.0 L 12.7 -11.7 M 13.8 -10.0 L 12.8 -7.9 L 12.6 -4.9 L 13.0 -.9 L 14.0 2.3 L 16.0 4.5 L 19.4 5.1 L 22.4 3.6 L 23.7 .9 L 24.1 -3.1 L 23.7 -6.6 L 22.6 -9.6 L 20.8 -11.6 L 18.7 -12.1 M 11.5 -8.4 L 11.1 -5.1 L 11.0 -2.3 L 11.5 -.1 L 12.0 1.5 L 12.9 3.0 M 25.2 1.0 L 25.8 -1.7 L 25.8 -4.9 L 25.1 -8.0 L 24.0 -10.1","0 22.6 M 8.9 6.2 L 21.0 6.2 M 21.0 4.8 L 17.1 4.8 L 16.5 4.2 L 16.5 1.0 M 16.5 -.4 L 21.8 -.4 L 24.6 -.8 L 27.5 -2.2 L 29.1 -4.5 L 29.6 -7.0 L 29.1 -9.0 L 26.9 -11.4 L 24.2 -12.7 L 22.2 -13.0 L 8.9 -13.0 M 8.9 -11.7 L 12.4 -11.7 L 13.1 -11.0 L 13.1 4.1 L 12.4 4.8 L 8.9 4.8 M 16.6 -9.3 L 16.6 -2.0 L 22.0 -2.0 L 23.8 -2.7 L 25.1 -4.0 L 25.8 -5.5 L 25.7 -8.2 L 24.9 -9.9 L 23.0 -11.1 L 21.0 -11.6 L 16.0 -11.6 M 15.0 -10.5 L 15.0 4.7 M 26.4 -10.0 L 27.2 -8.5 L 27.7 -7.3 L 27.7 -6.2 L 27.2 -4.7 L 26.3 -3.5","0 20.6 M 14.0 13.6 L 12.5 13.4 L 11.6 12.2 L 11.3 10.0 L 11.8 8.1 L 13.7 6.7 L 18.5 4.8 L 21.2 3.0 L 23.2 -.1 L 23.8 -2.7 L 23.6 -5.7 L 23.0 -8.5 L 22.1 -10.2 L 20.5 -11.6 L 18.3 -12.2 M 13.4 -10.0 L 12.3 -7.2 L 12.2 -3.7 L 12.5 -.6 L 13.1 2.2 L 15.3 4.0 M 13.9 5.3 L 11.7 3.7 L 9.7 .7 L 9.0 -2.1 L 9.1 -5.7 L 10.3 -9.4 L 12.4 -11.8 L 16.0 -13.5 L 19.4 -13.5 L 22.2 -12.8 L 24.8 -11.0 L 26.7 -8.2 L 27.4 -4.9 L 27.0 -.9 L 25.8 1.7 L 23.7 4.0 L 21.1 5.4 L 14.4 8.0 M 15.7 8.3 L 19.9 8.8 L 23.4 9.6 L 26.5 10.3 L 30.6 11.4 L 33.5 11.8 L 36.2 11.4 L 37.3 10.7 L 37.9 9.6 L 37.9 8.6 M 39.8 8.6 L 39.8 9.9 L 38.9 12.0 L 37.3 13.7 L 34.0 14.6 L 32.0 14.7 L 28.4 13.9 L 23.0 12.3 L 18.6 10.7 L 15.5 9.8 L 13.8 9.9 L 13.1 10.5 L 13.0 11.4 L 13.6 12.0 L 14.2 11.9 M 11.4 .6 L 10.7 -1.4 L 10.6 -4.5 L 11.0 -7.0 L 11.4 -8.4 M 23.9 -9.7 L 25.2 -6.9 L 25.4 -4.0 L 25.3 -1.7 L 24.4 .8 M 21.2 10.2 L 26.6 11.7 L 30.0 12.7 L 32.9 13.2 L 35.3 13.1 L 37.2 12.2","0 23.3 M 8.6 5.9 L 20.0 5.9 M 20.0 4.7 L 16.6 4.7 L 16.1 4.2 L 16.1 -1.3 M 17.3 -1.4 L 19.6 -1.4 L 20.6 -.8 L 21.3 .0 L 28.2 9.0 L 29.9 10.6 L 31.5 11.8 L 33.3 12.5 L 35.4 12.9 L 38.2 12.7 L 40.1 11.9 L 41.1 11.2 M 40.4 10.1 L 38.3 11.1 L 35.6 10.9 L 34.2 10.4 L 31.5 8.2 L 25.3 .0 L 24.7 -.7 L 24.2 -1.1 M 23.3 .2 L 25.1 2.4 L 26.6 4.5 L 28.3 6.8 L 30.1 8.8 L 31.2 9.9 M 23.0 -1.7 L 26.0 -2.7 L 27.8 -4.2 L 28.9 -6.1 L 28.8 -8.3 L 28.0 -10.2 L 25.5 -11.8 L 23.6 -12.7 L 20.4 -13.1 L 8.5 -13.1 M 8.4 -11.7 L 12.1 -11.7 L 12.6 -11.2 L 12.6 4.0 L 11.9 4.7 L 8.7 4.7 M 14.3 4.5 L 14.3 -10.8 M 15.3 -11.5 L 20.3 -11.5 L 21.8 -11.3 L 22.9 -10.9 L 24.0 -10.2 L 24.9 -9.1 L 25.1 -7.3 L 24.9 -5.5 L 23.5 -4.0 L 21.8 -3.3 L 20.0 -3.2 L 16.1 -3.2 L 16.1 -9.3 M 26.1 -9.6 L 27.0 -7.8 L 27.0 -6.4 L 26.4 -4.8 L 25.9 -4.2","0 17.9 M 10.4 7.3 L 10.4 4.3 M 9.0 7.4 L 9.0 -1.7 M 10.5 -1.7 L 10.5 .3 L 11.1 2.0 L 12.3 3.2 L 14.5 4.4 L 17.8 4.8 L 20.3 3.9 L 21.4 2.7 L 21.4 1.4 L 21.0 .2 L 19.6 -.7 L 15.7 -2.5 L 12.4 -4.4 L 10.4 -6.6 L 9.7 -8.5 L 10.1 -10.3 L 11.9 -12.3 L 13.7 -13.0 L 16.5 -13.4 L 17.9 -13.4 L 19.6 -12.9 M 21.6 -14.4 L 21.6 -11.6 M 23.1 -14.4 L 23.3 -6.5 M 21.8 -6.6 L 21.8 -8.5 L 21.0 -9.9 L 19.9 -11.1 L 18.5 -11.6 L 16.8 -11.9 L 15.2 -11.7 L 13.4 -10.9 L 12.8 -9.5 L 13.8 -7.7 L 15.2 -6.7 L 20.1 -4.2 L 21.9 -3.3 L 23.9 -1.5 L 24.9 .8 L 24.3 3.3 L 22.9 4.7 L 21.0 5.7 L 18.6 6.3 L 15.3 6.3 L 12.5 5.5 M 22.7 2.8 L 23.2 1.5 L 23.0 .2 L 22.0 -1.0 L 20.4 -2.1 L 15.0 -4.9 L 13.3 -5.9 L 12.1 -7.2 L 11.5 -8.6 L 11.6 -9.1","0 20.7 M 12.3 6.2 L 24.9 6.2 M 24.8 4.8 L 20.9 4.8 L 20.5 4.4 L 20.5 -9.3 M 20.3 -11.5 L 25.8 -11.5 L 26.8 -10.4 L 27.2 -6.2 M 28.6 -6.2 L 27.7 -14.7 M 26.8 -13.1 L 12.1 -13.1 M 9.7 -14.8 L 8.8 -6.0 M 10.4 -8.2 L 10.6 -9.9 L 11.2 -10.9 L 12.1 -11.2 L 16.9 -11.2 L 16.9 4.2 L 16.6 4.8 L 12.3 4.8 M 18.7 4.4 L 18.7 -11.3","0 23.7 M 8.7 -11.8 L 11.9 -11.8 L 12.3 -11.1 L 12.3 .9 L 13.0 2.9 L 14.2 4.5 L 15.5 5.6 L 17.0 6.3 L 18.8 6.7 L 20.9 6.7 L 23.4 6.1 L 25.0 5.0 L 26.3 3.3 L 26.9 2.1 L 27.2 .4 L 27.2 -11.0 L 27.8 -11.6 L 31.1 -11.6 M 31.2 -13.2 L 21.6 -13.2 M 21.5 -11.8 L 24.6 -11.8 L 25.4 -11.3 L 25.4 1.0 L 24.8 2.3 L 23.8 3.7 L 22.4 4.7 L 20.7 5.2 L 19.0 5.2 L 17.4 4.6 L 16.5 3.8 L 15.9 2.5 M 14.5 2.3 L 13.9 1.0 L 14.0 -.8 L 14.0 -11.5 M 8.6 -13.1 L 19.8 -13.1 M 19.8 -11.6 L 16.3 -11.6 L 15.8 -11.2 L 15.8 -1.5","0 23.0 M 8.5 -11.8 L 11.3 -11.8 L 18.7 6.5 L 20.4 6.5 L 27.4 -11.1 L 28.1 -11.7 L 30.7 -11.8 M 30.7 -13.2 L 20.9 -13.2 M 21.0 -11.7 L 25.1 -11.7 L 25.6 -11.2 L 20.5 2.0 M 19.8 .2 L 15.0 -11.8 L 17.5 -11.8 M 17.5 -13.1 L 8.1 -13.1 M 13.5 -10.9 L 19.4 3.5","0 35.0 M 8.4 -11.8 L 11.2 -11.8 L 18.7 6.5 L 20.4 6.5 L 25.1 -5.0 M 25.6 -6.9 L 30.9 6.4 L 32.5 6.4 L 39.7 -11.2 L 40.1 -11.7 L 42.9 -11.7 M 42.9 -13.2 L 33.2 -13.2 M 33.4 -11.7 L 36.9 -11.7 L 37.6 -11.7 L 37.8 -10.9 L 32.6 1.9 M 32.0 .1 L 27.1 -11.8 L 30.7 -11.8 M 30.8 -13.1 L 20.6 -13.1 M 20.6 -11.7 L 23.4 -11.7 L 24.8 -8.7 L 20.3 2.1 M 19.8 .2 L 14.9 -11.7 L 16.2 -11.7 M 16.4 -13.1 L 8.4 -13.1 M 13.5 -10.8 L 19.1 2.9 M 25.7 -10.9 L 31.2 2.8","0 23.0 M 8.6 6.2 L 18.3 6.2 M 19.4 6.1 L 30.9 6.1 M 30.8 4.8 L 27.8 4.8 L 21.7 -4.6 L 26.3 -11.5 L 27.1 -11.9 L 29.7 -11.8 M 29.7 -13.2 L 19.9 -13.2 M 20.0 -11.8 L 23.4 -11.8 L 23.7 -11.3 L 20.6 -6.2 M 19.7 -7.4 L 16.6 -11.8 L 18.4 -11.8 M 18.5 -13.2 L 9.7 -13.2 M 9.7 -11.8 L 12.5 -11.8 L 18.0 -4.0 L 12.0 4.7 L 8.5 4.7 M 18.9 -2.6 L 15.0 3.5 L 14.8 4.2 L 15.1 4.7 L 18.1 4.7 M 19.6 4.7 L 22.7 4.7 L 23.1 4.1 L 19.6 -1.3 M 15.6 -10.6 L 25.5 4.6 L 24.9 4.6 L 24.9 3.4","0 22.2 M 12.9 6.2 L 25.8 6.2 M 25.8 4.8 L 21.4 4.8 L 21.0 4.4 L 21.0 -.5 L 26.6 -11.3 L 27.3 -11.7 L 30.1 -11.7 M 30.0 -13.2 L 20.3 -13.2 M 20.3 -11.7 L 23.9 -11.7 L 24.5 -11.1 L 20.0 -2.3 M 18.9 -4.8 L 15.3 -11.8 L 17.8 -11.8 M 17.9 -13.3 L 8.2 -13.3 M 8.2 -11.8 L 11.5 -11.8 L 12.0 -11.0 L 17.7 .1 L 17.7 4.3 L 17.2 4.8 L 12.8 4.8 M 19.4 4.6 L 19.4 -.1 L 14.0 -11.0","0 21.8 M 8.6 5.9 L 27.0 5.9 L 27.0 8.7 M 28.4 8.7 L 28.7 -.1 M 27.3 1.6 L 27.0 3.2 L 26.7 3.9 L 26.0 4.2 L 14.5 4.2 M 16.3 1.9 L 27.2 -11.6 L 28.7 -11.6 M 28.7 -13.0 L 11.4 -13.0 L 11.4 -15.0 M 9.8 -14.8 L 9.3 -6.1 M 10.8 -8.2 L 11.2 -9.9 L 12.5 -11.2 L 22.8 -11.2 M 21.0 -9.0 L 10.0 4.6 L 8.8 4.6 M 12.4 4.3 L 24.9 -11.4","0 10.1 M 17.8 11.3 L 9.7 11.3 L 9.7 -17.0 M 9.5 -18.3 L 17.8 -18.3 M 17.8 -17.0 L 12.8 -17.0 L 13.3 -15.9 L 13.3 8.3 L 12.6 9.4 M 11.3 9.2 L 11.3 -16.1 M 13.1 10.0 L 18.0 10.0","0 21.0 M 9.9 -13.8 L 26.0 7.3 L 27.4 6.3 L 10.9 -15.0","0 10.0 M 8.4 11.3 L 16.5 11.3 L 16.5 -17.1 M 16.7 -18.3 L 8.4 -18.3 M 8.4 -17.1 L 13.5 -17.1 L 12.9 -16.0 L 12.9 8.2 L 13.6 9.4 M 14.9 9.1 L 14.9 -16.1 M 13.1 9.9 L 8.2 9.9","0 16.7 M 16.3 -12.9 L 11.1 -7.4 L 9.7 -9.0 L 16.3 -15.3 L 23.4 -9.0 L 22.0 -7.3 L 17.7 -12.0","0 11.3 M 8.2 10.6 L 19.2 10.6","0 9.6 M 14.1 -15.8 L 11.1 -18.2 L 9.9 -19.3 L 9.9 -20.0 L 11.0 -21.1 L 12.0 -21.0 L 16.1 -16.0 L 15.5 -15.4","0 23.0 M 8.1 5.9 L 8.4 5.9 L 17.6 5.9 M 20.7 5.9 L 30.8 5.9 M 30.8 4.7 L 27.9 4.7 L 21.3 -11.5 L 21.3 -13.6 M 19.9 -13.5 L 18.8 -13.5 L 11.4 4.3 L 11.2 4.6 L 8.2 4.6 M 17.5 4.8 L 13.8 4.7 L 13.4 4.1 L 14.6 .9 L 22.6 .9 M 23.0 2.3 L 24.3 4.6 L 20.6 4.6 M 25.5 4.0 L 20.0 -10.5 M 18.9 -9.9 L 18.8 -8.9 L 21.9 -.5 L 15.4 -.5 L 17.6 -6.2","0 22.1 M 9.0 6.0 L 22.7 6.0 L 25.2 5.4 L 27.3 4.4 L 29.0 2.9 L 29.5 1.1 L 29.4 -.7 L 28.5 -2.6 L 26.7 -3.7 L 24.9 -4.3 M 21.9 -5.0 L 24.4 -5.8 L 26.1 -7.2 L 26.7 -9.1 L 26.2 -10.3 L 24.9 -11.6 L 23.0 -12.4 L 20.8 -13.0 L 17.2 -13.0 L 9.1 -13.0 M 8.9 -11.8 L 11.7 -11.8 L 12.5 -11.8 L 13.2 -11.2 L 13.2 4.2 L 12.9 4.7 L 8.9 4.7 M 16.0 4.6 L 22.4 4.6 L 24.4 3.4 L 25.6 2.0 L 25.9 .2 L 25.3 -1.5 L 24.0 -2.8 L 22.3 -3.5 L 19.9 -4.0 L 16.6 -4.0 L 16.6 2.4 M 14.9 4.1 L 14.9 -11.4 M 15.9 -11.6 L 19.4 -11.3 L 21.4 -10.8 L 22.8 -9.2 L 22.8 -7.8 L 21.9 -6.6 L 20.4 -5.7 L 18.3 -5.4 L 16.5 -5.4 L 16.5 -9.5 M 24.1 -10.2 L 24.6 -9.0 L 24.4 -8.0 L 23.9 -7.3 M 26.5 -2.1 L 27.4 -.9 L 27.6 .3 L 27.5 1.5 L 26.7 3.0","0 20.1 M 24.2 -6.4 L 23.7 -9.3 L 21.9 -11.4 L 19.2 -12.1 L 16.0 -11.5 L 13.8 -9.4 L 12.7 -5.6 L 13.1 -.8 L 14.1 1.8 L 16.6 4.4 L 20.3 4.9 L 23.2 3.9 L 24.4 2.8 L 25.4 1.5 M 12.9 2.8 L 11.8 .9 L 11.2 -1.0 L 11.0 -4.3 L 11.3 -6.5 L 12.1 -8.8 M 27.0 1.8 L 25.7 4.2 L 23.0 6.1 L 19.8 6.8 L 16.8 6.7 L 13.4 5.4 L 10.5 2.3 L 9.2 -1.0 L 9.2 -6.2 L 11.0 -10.5 L 14.2 -12.7 L 17.9 -13.9 L 19.7 -13.8 L 22.0 -13.2 M 23.8 -15.1 L 23.9 -11.9 M 25.1 -15.0 L 25.8 -6.5","0 22.5 M 8.6 5.8 L 21.4 5.8 L 24.8 4.8 L 26.7 3.4 L 28.5 .9 L 29.3 -1.2 L 29.4 -3.7 L 29.3 -4.6 L 29.1 -6.6 L 27.6 -9.4 L 26.1 -10.9 L 24.3 -12.0 L 22.8 -12.6 L 21.2 -13.0 L 8.5 -13.0 M 8.5 -11.6 L 12.2 -11.6 L 12.8 -11.0 L 12.8 4.2 L 12.4 4.9 L 8.5 4.9 M 15.5 4.5 L 20.4 4.5 L 22.4 3.8 L 23.8 2.7 L 25.1 1.0 L 25.7 -1.7 L 25.7 -4.3 L 25.4 -6.7 L 24.5 -8.8 L 23.2 -10.5 L 21.6 -11.2 L 19.6 -11.5 L 15.5 -11.5 M 16.1 -9.8 L 16.1 2.5 M 14.5 4.4 L 14.5 -11.5 M 26.1 -8.8 L 27.2 -6.4 L 27.5 -4.6 L 27.6 -2.5 L 27.2 -.6 L 26.8 .9 L 26.3 1.8","0 21.3 M 9.1 5.8 L 26.9 5.8 L 26.9 8.8 M 28.5 8.8 L 28.5 -.2 M 27.3 1.7 L 27.1 3.4 L 26.3 4.1 L 16.0 4.1 L 16.5 3.6 L 16.5 -1.9 M 16.5 -2.9 L 18.7 -2.9 L 19.9 -2.5 L 20.3 -1.4 L 20.3 1.1 L 21.5 1.1 L 21.5 -8.7 M 20.3 -7.3 L 20.3 -5.7 L 19.9 -4.9 L 19.2 -4.5 L 16.6 -4.5 L 16.6 -9.4 M 15.8 -11.6 L 23.8 -11.6 L 24.7 -10.9 L 25.2 -9.7 L 25.3 -6.9 M 25.1 -13.1 L 8.9 -13.1 M 8.8 -11.8 L 12.0 -11.8 L 12.8 -11.5 L 13.2 -10.8 L 13.2 3.8 L 12.6 4.8 L 8.8 4.8 M 14.8 3.8 L 14.8 -10.9 M 26.6 -7.2 L 25.9 -15.5","0 20.2 M 8.6 5.9 L 20.5 5.9 M 20.5 4.7 L 16.9 4.7 L 16.2 4.2 L 16.2 -2.2 M 16.0 -3.2 L 19.6 -3.2 L 20.5 -2.7 L 20.5 .7 L 21.9 .7 L 21.9 -9.0 M 20.6 -7.4 L 20.6 -5.7 L 19.8 -4.9 L 16.1 -4.9 L 16.1 -9.3 M 15.4 -11.4 L 24.7 -11.4 L 25.8 -10.2 L 25.8 -6.8 M 27.3 -7.0 L 26.6 -15.6 M 25.5 -13.2 L 8.8 -13.2 M 8.6 -11.9 L 11.9 -11.9 L 12.9 -11.0 L 12.9 4.0 L 12.3 4.8 L 8.8 4.8 M 14.5 -10.8 L 14.5 4.3","0 22.5 M 17.6 -1.8 L 23.3 -1.8 L 23.9 -1.3 L 23.9 2.3 L 22.7 3.8 L 20.8 5.0 L 17.6 5.1 L 14.4 3.4 L 12.9 .5 L 12.1 -3.3 L 12.5 -6.7 L 13.9 -10.2 L 16.2 -12.0 L 18.4 -12.3 L 20.6 -12.0 L 22.1 -10.9 L 23.2 -9.4 L 23.7 -8.0 L 23.7 -6.3 M 25.5 -6.3 L 24.7 -15.3 M 23.4 -15.2 L 23.6 -11.9 M 21.4 -13.1 L 19.0 -13.9 L 15.0 -13.3 L 12.0 -11.6 L 9.7 -8.8 L 8.7 -5.4 L 8.7 -1.9 L 10.0 2.2 L 12.4 4.9 L 15.4 6.3 L 19.6 6.9 L 22.8 5.8 L 24.4 4.5 M 11.8 -9.1 L 10.7 -6.0 L 10.4 -3.1 L 11.1 .5 L 12.3 2.4 M 25.4 -1.6 L 25.4 2.9 M 25.9 5.1 L 25.9 7.9 M 27.1 8.0 L 27.1 -1.4 L 27.6 -1.9 L 30.2 -1.9 M 30.3 -3.2 L 17.7 -3.2","0 25.3 M 8.6 6.3 L 20.1 6.3 M 21.2 6.3 L 32.6 6.3 M 32.5 4.9 L 28.9 4.9 L 28.4 4.3 L 28.4 -11.1 L 29.0 -11.7 L 32.6 -11.7 M 32.6 -13.0 L 21.4 -13.0 M 20.0 -13.0 L 8.5 -13.0 M 8.7 -11.7 L 12.2 -11.7 L 12.6 -10.9 L 12.6 4.2 L 12.0 4.7 L 8.5 4.7 M 19.9 4.8 L 16.9 4.8 L 16.3 4.2 L 16.3 -3.6 L 24.9 -3.6 M 24.9 -1.6 L 24.9 4.1 L 24.2 4.8 L 21.2 4.8 M 26.6 4.4 L 26.6 -11.7 M 21.4 -11.8 L 24.2 -11.8 L 25.0 -11.0 L 25.0 -5.7 L 24.4 -5.1 L 16.3 -5.1 M 16.1 -7.1 L 16.1 -11.2 L 16.7 -11.7 L 20.1 -11.7 M 14.5 -11.7 L 14.5 4.6","0 13.2 M 8.7 6.2 L 20.5 6.2 M 20.4 4.8 L 16.9 4.8 L 16.3 4.2 L 16.3 -11.0 L 17.1 -11.8 L 20.6 -11.8 M 20.6 -13.1 L 8.5 -13.1 M 8.5 -11.9 L 12.3 -11.9 L 12.9 -11.3 L 12.9 4.1 L 12.2 4.8 L 8.7 4.8 M 14.6 4.5 L 14.6 -11.7","0 15.5 M 8.0 6.0 L 9.8 6.5 L 12.4 6.7 L 15.4 5.6 L 17.2 4.0 L 18.0 2.3 L 18.4 .9 L 18.4 -11.0 L 19.1 -11.8 L 22.4 -11.8 M 22.5 -13.2 L 9.0 -13.2 M 8.8 -11.7 L 15.3 -11.7 M 14.9 -10.7 L 14.9 1.7 L 14.7 3.2 L 13.8 4.4 L 12.4 5.2 L 10.6 5.0 L 8.8 4.3 M 16.7 -11.3 L 16.7 2.2","0 23.3 M 8.6 5.9 L 19.1 5.9 M 19.0 4.8 L 16.3 4.8 L 16.3 -.9 L 17.8 -3.0 L 24.7 6.1 L 25.6 6.7 L 26.7 6.8 L 27.9 6.7 L 31.0 5.8 M 20.5 -4.2 L 21.7 -3.3 L 22.7 -2.3 L 27.6 4.4 L 28.0 4.7 L 31.0 4.7 M 19.2 -4.7 L 23.5 -10.3 L 25.0 -11.4 L 26.1 -11.7 L 29.2 -11.7 M 29.3 -13.2 L 21.5 -13.2 M 19.5 -13.1 L 8.7 -13.1 M 8.7 -11.7 L 12.1 -11.7 L 12.6 -11.2 L 12.6 4.2 L 12.0 4.8 L 8.6 4.8 M 14.5 4.4 L 14.5 -11.7 M 16.2 -5.4 L 16.2 -11.2 L 16.8 -11.8 L 19.3 -11.8 M 21.5 -11.7 L 22.6 -11.7 L 16.2 -3.4 M 20.2 -2.6 L 22.5 .4 L 25.1 4.2 L 26.2 5.1","0 20.1 M 8.8 6.2 L 25.7 6.2 L 25.7 8.6 M 27.2 8.6 L 27.2 -.3 M 26.2 1.6 L 26.2 3.0 L 25.0 4.1 L 15.6 4.1 M 16.5 2.7 L 16.5 -11.0 L 17.2 -11.7 L 20.9 -11.7 M 21.0 -13.1 L 8.7 -13.1 M 8.6 -11.7 L 12.5 -11.7 L 13.1 -11.1 L 13.1 4.2 L 12.5 4.7 L 8.8 4.7 M 14.7 -10.6 L 14.7 3.4","0 30.0 M 8.8 6.0 L 18.1 6.0 M 18.2 4.8 L 14.9 4.8 L 14.3 4.2 L 15.1 -7.1 M 15.8 -5.9 L 22.1 6.2 L 23.0 6.3 L 30.1 -7.7 M 30.1 -5.3 L 31.1 3.8 L 30.7 4.6 L 27.3 4.6 M 27.4 6.0 L 38.0 6.0 M 37.9 4.7 L 35.3 4.7 L 34.7 4.0 L 33.1 -10.9 L 33.7 -11.7 L 36.3 -11.7 M 36.2 -13.1 L 31.4 -13.1 L 23.6 2.2 M 23.0 .6 L 16.0 -13.1 L 10.5 -13.1 M 10.5 -11.9 L 13.9 -11.9 L 14.2 -11.4 L 12.7 4.0 L 11.9 4.7 L 8.7 4.7 M 15.6 -10.3 L 22.2 2.6 M 32.9 4.5 L 31.3 -10.0","0 23.5 M 8.8 6.0 L 18.5 6.0 M 18.4 4.7 L 14.9 4.7 L 14.4 4.2 L 14.4 -9.0 M 15.4 -7.4 L 25.4 6.4 L 26.0 6.4 M 27.1 6.4 L 27.1 -11.1 L 27.7 -11.7 L 30.9 -11.7 M 31.0 -13.2 L 21.3 -13.2 M 21.3 -11.8 L 24.6 -11.8 L 25.3 -11.1 L 25.3 .9 M 23.9 -1.3 L 15.5 -13.0 L 8.7 -13.0 M 8.6 -11.7 L 12.0 -11.7 L 12.8 -11.0 L 12.8 4.0 L 12.1 4.7 L 8.8 4.7 M 15.2 -10.6 L 24.8 2.3","0 20.7 M 9.7 -7.4 L 9.2 -3.8 L 9.4 -1.0 L 11.0 3.3 L 13.5 5.7 L 17.7 7.1 L 21.2 6.5 L 24.8 4.4 L 26.9 .9 L 27.7 -2.7 L 27.3 -7.1 L 25.4 -10.6 L 21.7 -13.2 L 17.5 -13.8 L 14.4 -13.0 L 12.6 -11.7 M 13.7 -10.1 L 12.6 -7.9 L 12.4 -4.9 L 12.8 -1.0 L 13.9 2.3 L 15.9 4.5 L 19.3 5.1 L 22.3 3.6 L 23.6 .9 L 23.9 -3.1 L 23.6 -6.6 L 22.5 -9.6 L 20.7 -11.6 L 18.5 -12.1 M 11.4 -8.4 L 10.9 -5.1 L 10.9 -2.3 L 11.4 -.1 L 11.9 1.5 L 12.7 3.0 M 25.0 1.0 L 25.7 -1.7 L 25.7 -4.9 L 25.0 -8.0 L 23.9 -10.1","0 22.1 M 8.6 6.1 L 20.8 6.1 M 20.8 4.8 L 16.9 4.8 L 16.3 4.2 L 16.3 1.0 M 16.2 -.4 L 21.6 -.4 L 24.3 -.8 L 27.3 -2.2 L 28.9 -4.5 L 29.4 -7.0 L 28.8 -9.1 L 26.7 -11.4 L 24.0 -12.7 L 22.0 -13.0 L 8.6 -13.0 M 8.7 -11.7 L 12.2 -11.7 L 12.9 -11.0 L 12.9 4.1 L 12.2 4.7 L 8.6 4.7 M 16.4 -9.3 L 16.4 -2.0 L 21.8 -2.0 L 23.5 -2.7 L 24.9 -4.0 L 25.6 -5.5 L 25.5 -8.2 L 24.6 -9.9 L 22.8 -11.1 L 20.7 -11.6 L 15.8 -11.6 M 14.8 -10.5 L 14.8 4.7 M 26.1 -10.0 L 27.0 -8.6 L 27.5 -7.3 L 27.5 -6.2 L 27.0 -4.7 L 26.1 -3.5","0 20.6 M 14.5 13.6 L 13.0 13.4 L 12.1 12.2 L 11.8 10.0 L 12.3 8.1 L 14.2 6.7 L 19.0 4.8 L 21.7 3.0 L 23.6 -.1 L 24.3 -2.7 L 24.1 -5.8 L 23.5 -8.5 L 22.6 -10.2 L 21.0 -11.6 L 18.7 -12.2 M 13.9 -10.1 L 12.8 -7.2 L 12.6 -3.7 L 13.0 -.6 L 13.6 2.2 L 15.7 4.0 M 14.4 5.3 L 12.2 3.7 L 10.1 .7 L 9.5 -2.1 L 9.6 -5.8 L 10.8 -9.4 L 12.9 -11.9 L 16.5 -13.5 L 19.8 -13.5 L 22.7 -12.8 L 25.3 -11.0 L 27.2 -8.2 L 27.9 -4.9 L 27.5 -1.0 L 26.3 1.7 L 24.1 4.0 L 21.6 5.4 L 14.9 8.0 M 11.9 .6 L 11.2 -1.5 L 11.1 -4.5 L 11.5 -7.0 L 11.9 -8.4 M 24.4 -9.7 L 25.7 -6.9 L 25.9 -4.0 L 25.8 -1.7 L 24.9 .8 M 14.4 12.0 L 13.6 11.7 L 13.3 10.9 L 13.5 10.2 L 13.9 9.8 L 14.8 9.9 L 16.1 10.8 L 17.5 11.9 L 18.8 12.7 L 20.6 13.8 L 21.6 13.9 L 22.7 13.8 L 24.4 13.1 L 25.5 11.7 L 26.1 10.0 L 26.2 9.5 L 26.2 7.2 M 24.7 7.2 L 24.7 9.2 L 24.2 10.3 L 23.6 10.7 L 22.7 11.1 L 21.8 11.0 L 20.5 10.4 L 17.1 8.6 L 16.3 8.5 M 18.8 11.0 L 20.7 12.0 L 22.0 12.4 L 23.2 12.2","0 23.8 M 9.3 5.9 L 20.7 5.9 M 20.7 4.7 L 17.3 4.7 L 16.8 4.2 L 16.8 -1.3 M 23.7 -1.7 L 26.7 -2.7 L 28.5 -4.2 L 29.6 -6.1 L 29.5 -8.3 L 28.7 -10.2 L 26.2 -11.9 L 24.3 -12.7 L 21.1 -13.1 L 9.2 -13.1 M 9.1 -11.7 L 12.8 -11.7 L 13.2 -11.2 L 13.2 4.0 L 12.6 4.7 L 9.4 4.7 M 15.0 4.5 L 15.0 -10.8 M 16.0 -11.5 L 21.0 -11.5 L 22.5 -11.3 L 23.6 -10.9 L 24.7 -10.2 L 25.6 -9.1 L 25.8 -7.3 L 25.6 -5.5 L 24.2 -4.0 L 22.5 -3.3 L 20.7 -3.2 L 16.8 -3.2 L 16.8 -9.3 M 26.8 -9.6 L 27.7 -7.8 L 27.7 -6.4 L 27.1 -4.8 L 26.6 -4.2 M 17.7 -1.5 L 20.1 -1.5 L 21.0 -1.0 L 21.6 -.3 L 22.6 .9 L 25.4 5.0 L 26.4 5.9 L 27.1 6.3 L 28.6 6.3 L 30.1 6.0 L 31.8 5.7 M 31.9 4.4 L 30.2 4.8 L 29.6 4.8 L 28.3 3.4 L 26.0 .0 L 25.3 -.8 L 24.8 -1.0 M 23.9 .2 L 25.1 1.5 L 26.4 3.7 L 27.0 4.5 L 27.4 4.8","0 18.3 M 10.8 7.3 L 10.8 4.3 M 9.4 7.4 L 9.4 -1.7 M 10.9 -1.7 L 10.9 .3 L 11.5 2.0 L 12.7 3.2 L 14.8 4.4 L 18.1 4.8 L 20.6 3.9 L 21.7 2.7 L 21.8 1.4 L 21.4 .2 L 20.0 -.7 L 16.1 -2.5 L 12.8 -4.4 L 10.8 -6.6 L 10.1 -8.5 L 10.5 -10.3 L 12.3 -12.3 L 14.1 -13.0 L 16.8 -13.4 L 18.3 -13.4 L 20.0 -12.9 M 22.0 -14.4 L 22.0 -11.6 M 23.5 -14.4 L 23.7 -6.5 M 22.1 -6.6 L 22.1 -8.6 L 21.4 -9.9 L 20.3 -11.1 L 18.9 -11.6 L 17.2 -11.9 L 15.6 -11.7 L 13.8 -10.9 L 13.2 -9.6 L 14.1 -7.7 L 15.6 -6.7 L 20.4 -4.3 L 22.3 -3.3 L 24.3 -1.5 L 25.2 .8 L 24.7 3.3 L 23.2 4.7 L 21.4 5.7 L 19.0 6.3 L 15.7 6.3 L 12.8 5.5 M 23.1 2.8 L 23.6 1.5 L 23.4 .2 L 22.4 -1.0 L 20.8 -2.1 L 15.3 -4.9 L 13.7 -5.9 L 12.5 -7.2 L 11.9 -8.6 L 12.0 -9.1","0 20.3 M 11.9 6.2 L 24.5 6.2 M 24.5 4.8 L 20.6 4.8 L 20.1 4.4 L 20.1 -9.3 M 20.0 -11.5 L 25.5 -11.5 L 26.5 -10.4 L 26.8 -6.2 M 28.2 -6.2 L 27.4 -14.7 M 26.5 -13.1 L 11.8 -13.1 M 9.4 -14.8 L 8.5 -6.0 M 10.0 -8.2 L 10.3 -9.9 L 10.9 -10.9 L 11.7 -11.2 L 16.6 -11.2 L 16.6 4.2 L 16.2 4.8 L 12.0 4.8 M 18.4 4.4 L 18.4 -11.3","0 23.8 M 9.3 -11.8 L 12.5 -11.8 L 12.9 -11.1 L 12.9 .9 L 13.6 2.9 L 14.8 4.5 L 16.1 5.6 L 17.6 6.3 L 19.4 6.7 L 21.5 6.7 L 24.0 6.1 L 25.6 5.0 L 26.9 3.3 L 27.5 2.1 L 27.8 .4 L 27.8 -11.0 L 28.4 -11.6 L 31.7 -11.6 M 31.8 -13.2 L 22.2 -13.2 M 22.1 -11.8 L 25.2 -11.8 L 26.0 -11.3 L 26.0 1.0 L 25.4 2.3 L 24.3 3.7 L 23.0 4.7 L 21.3 5.2 L 19.6 5.2 L 18.0 4.6 L 17.1 3.8 L 16.5 2.5 M 15.1 2.3 L 14.5 1.0 L 14.6 -.8 L 14.6 -11.5 M 9.2 -13.1 L 20.4 -13.1 M 20.4 -11.6 L 16.9 -11.6 L 16.4 -11.2 L 16.4 -1.5","0 23.3 M 8.8 -11.8 L 11.7 -11.8 L 19.1 6.5 L 20.7 6.5 L 27.8 -11.1 L 28.5 -11.7 L 31.1 -11.8 M 31.1 -13.2 L 21.3 -13.2 M 21.3 -11.7 L 25.5 -11.7 L 26.0 -11.2 L 20.8 2.0 M 20.1 .2 L 15.3 -11.8 L 17.9 -11.8 M 17.9 -13.1 L 8.5 -13.1 M 13.9 -10.9 L 19.8 3.5","0 35.1 M 8.4 -11.8 L 11.1 -11.8 L 18.7 6.5 L 20.4 6.5 L 25.1 -5.0 M 25.5 -6.9 L 30.9 6.4 L 32.5 6.4 L 39.7 -11.2 L 40.1 -11.7 L 42.9 -11.7 M 42.9 -13.2 L 33.2 -13.2 M 33.4 -11.7 L 36.9 -11.7 L 37.6 -11.7 L 37.7 -10.9 L 32.6 1.9 M 32.0 .1 L 27.1 -11.9 L 30.7 -11.9 M 30.8 -13.1 L 20.6 -13.1 M 20.6 -11.7 L 23.4 -11.7 L 24.7 -8.7 L 20.3 2.1 M 19.8 .2 L 14.9 -11.7 L 16.2 -11.7 M 16.4 -13.1 L 8.4 -13.1 M 13.5 -10.8 L 19.1 2.9 M 25.7 -10.9 L 31.2 2.8","0 22.6 M 8.2 6.2 L 17.9 6.2 M 19.0 6.1 L 30.5 6.1 M 30.4 4.8 L 27.4 4.8 L 21.3 -4.6 L 25.9 -11.5 L 26.7 -11.9 L 29.3 -11.9 M 29.3 -13.2 L 19.5 -13.2 M 19.6 -11.8 L 23.0 -11.8 L 23.3 -11.3 L 20.2 -6.2 M 19.3 -7.4 L 16.2 -11.8 L 18.0 -11.8 M 18.1 -13.2 L 9.3 -13.2 M 9.3 -11.8 L 12.1 -11.8 L 17.6 -4.0 L 11.6 4.7 L 8.1 4.7 M 18.5 -2.6 L 14.6 3.5 L 14.4 4.2 L 14.7 4.7 L 17.7 4.7 M 19.2 4.7 L 22.3 4.7 L 22.7 4.1 L 19.2 -1.3 M 15.2 -10.6 L 25.2 4.6 L 24.5 4.6 L 24.5 3.3","0 22.6 M 13.3 6.1 L 26.2 6.1 M 26.2 4.8 L 21.8 4.8 L 21.4 4.4 L 21.4 -.5 L 27.0 -11.3 L 27.7 -11.7 L 30.5 -11.7 M 30.3 -13.2 L 20.7 -13.2 M 20.7 -11.7 L 24.3 -11.7 L 24.9 -11.1 L 20.4 -2.3 M 19.3 -4.8 L 15.7 -11.8 L 18.2 -11.8 M 18.3 -13.3 L 8.5 -13.3 M 8.5 -11.8 L 11.9 -11.8 L 12.3 -11.0 L 18.1 .1 L 18.1 4.3 L 17.6 4.8 L 13.2 4.8 M 19.7 4.6 L 19.7 -.1 L 14.3 -11.0","0 21.4 M 8.5 5.9 L 26.8 5.9 L 26.8 8.7 M 28.3 8.7 L 28.5 -.1 M 27.2 1.6 L 26.9 3.2 L 26.5 3.9 L 25.8 4.2 L 14.4 4.2 M 16.2 1.9 L 27.1 -11.6 L 28.6 -11.6 M 28.6 -13.0 L 11.3 -13.0 L 11.3 -15.0 M 9.7 -14.8 L 9.2 -6.1 M 10.7 -8.2 L 11.0 -9.9 L 12.4 -11.2 L 22.7 -11.2 M 20.9 -9.1 L 9.9 4.6 L 8.7 4.6 M 12.3 4.3 L 24.7 -11.4","0 10.6 M 19.3 11.2 L 13.8 11.2 L 12.5 10.6 L 11.1 9.3 L 10.4 7.1 L 11.0 4.1 L 12.4 .2 L 9.2 -2.8 M 8.3 -3.5 L 12.1 -6.5 L 12.2 -7.1 L 11.1 -11.5 L 10.7 -13.5 L 10.9 -15.3 L 11.9 -17.0 L 14.0 -18.0 L 18.9 -18.1 M 18.7 -16.7 L 15.8 -16.7 L 14.6 -16.7 L 13.9 -16.0 L 13.5 -14.9 L 13.8 -13.2 L 15.5 -7.9 L 15.4 -7.1 L 10.8 -3.5 L 14.9 -.3 L 15.3 .2 L 15.4 1.3 L 13.6 6.6 L 13.4 7.7 L 13.9 8.9 L 14.5 9.6 L 15.6 9.9 L 19.3 9.9 M 12.2 7.6 L 12.1 6.2 L 13.6 1.1 L 13.6 .6 M 13.8 -7.6 L 13.7 -8.2 L 12.0 -13.9 M 19.1 11.1 L 13.6 11.1 L 12.3 10.5 L 10.9 9.3 L 10.2 7.0 L 10.8 4.0 L 12.2 .1 L 9.0 -2.9 M 8.1 -3.5 L 11.9 -6.6 L 12.0 -7.1 L 10.9 -11.5 L 10.5 -13.5 L 10.7 -15.3 L 11.8 -17.1 L 13.8 -18.0 L 18.7 -18.1 M 18.5 -16.7 L 15.6 -16.7 L 14.4 -16.8 L 13.7 -16.0 L 13.3 -15.0 L 13.6 -13.2 L 15.3 -8.0 L 15.2 -7.2 L 10.6 -3.5 L 14.7 -.4 L 15.1 .1 L 15.2 1.3 L 13.5 6.6 L 13.2 7.7 L 13.8 8.9 L 14.3 9.6 L 15.4 9.9 L 19.1 9.9 M 12.0 7.6 L 11.9 6.2 L 13.5 1.1 L 13.5 .5 M 13.6 -7.6 L 13.5 -8.2 L 11.8 -14.0","0 5.5 M 9.9 -17.7 L 9.9 10.5 M 10.7 10.5 L 11.2 10.5 L 11.2 -17.6","0 10.8 M 8.2 11.1 L 13.8 11.1 L 15.1 10.5 L 16.4 9.3 L 17.1 7.0 L 16.5 4.0 L 15.2 .1 L 18.4 -2.9 M 19.2 -3.5 L 15.4 -6.6 L 15.4 -7.1 L 16.5 -11.5 L 16.8 -13.5 L 16.7 -15.3 L 15.6 -17.1 L 13.6 -18.0 L 8.6 -18.1 M 8.8 -16.7 L 11.7 -16.7 L 12.9 -16.8 L 13.7 -16.0 L 14.0 -15.0 L 13.7 -13.2 L 12.1 -8.0 L 12.1 -7.2 L 16.7 -3.5 L 12.7 -.4 L 12.3 .1 L 12.1 1.3 L 13.9 6.6 L 14.2 7.7 L 13.6 8.9 L 13.1 9.6 L 12.0 9.9 L 8.2 9.9 M 15.3 7.6 L 15.4 6.2 L 13.9 1.1 L 13.9 .5 M 13.8 -7.6 L 13.8 -8.2 L 15.5 -14.0 M 8.2 11.1 L 13.8 11.1 L 15.1 10.5 L 16.4 9.3 L 17.1 7.0 L 16.5 4.0 L 15.2 .1 L 18.4 -2.9 M 19.2 -3.5 L 15.4 -6.6 L 15.4 -7.1 L 16.5 -11.5 L 16.8 -13.5 L 16.7 -15.3 L 15.6 -17.1 L 13.6 -18.0 L 8.6 -18.1 M 8.8 -16.7 L 11.7 -16.7 L 12.9 -16.8 L 13.7 -16.0 L 14.0 -15.0 L 13.7 -13.2 L 12.1 -8.0 L 12.1 -7.2 L 16.7 -3.5 L 12.7 -.4 L 12.3 .1 L 12.1 1.3 L 13.9 6.6 L 14.2 7.7 L 13.6 8.9 L 13.1 9.6 L 12.0 9.9 L 8.2 9.9 M 15.3 7.6 L 15.4 6.2 L 13.9 1.1 L 13.9 .5 M 13.8 -7.6 L 13.8 -8.2 L 15.5 -14.0","0 18.8 M 9.6 -2.6 L 10.6 -5.7 L 11.6 -6.8 L 13.0 -7.0 L 15.4 -6.1 L 18.0 -4.7 L 21.2 -3.1 L 22.0 -2.9 L 22.5 -3.1 L 23.5 -5.6 M 25.0 -5.2 L 24.1 -2.1 L 22.9 -.9 L 21.8 -.5 L 20.2 -.8 L 15.6 -3.2 L 13.4 -4.5 L 12.3 -4.6 L 11.7 -4.0 L 11.4 -3.0 L 11.2 -2.1 M 12.4 -5.8 L 12.6 -5.8 L 14.1 -5.4 L 16.4 -4.3 L 19.2 -2.7 L 21.1 -1.9 L 22.3 -1.9","0 9.2 M 12.7 -7.4 L 12.8 -7.3 L 14.4 -7.7 L 15.7 -8.9 L 16.2 -10.7 L 16.0 -12.6 L 14.7 -14.4 L 12.9 -15.0 L 10.4 -14.5 L 9.0 -12.6 L 8.8 -10.2 L 9.8 -8.3 L 11.1 -7.2 L 12.7 -7.4 M 12.6 -8.5 L 13.8 -9.6 L 13.9 -11.8 L 13.3 -13.0 L 12.5 -13.4 L 11.7 -13.2 L 11.1 -12.2 L 11.1 -9.5 L 11.9 -8.8 L 12.6 -8.5"]
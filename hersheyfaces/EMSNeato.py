@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 10.5 M 16.5 -27.8 L 15.2 -17.6 L 13.4 -6.3 L 11.4 1.8 M 11.4 6.7 L 10.5 8.1 L 11.8 8.3 L 11.4 6.7","0 8.7 M 13.8 -24.2 L 12.4 -20.2 L 12.3 -19.4 M 17.0 -24.0 L 15.5 -20.3 L 15.5 -19.9","0 22.8 M 17.7 -19.0 L 16.9 -16.7 L 17.0 -14.3 L 15.8 -8.6 L 14.2 -3.1 L 12.4 5.0 M 24.4 -18.6 L 23.0 -14.4 L 21.8 -9.0 L 21.0 -2.6 L 19.3 5.0 M 9.9 -10.2 L 13.4 -11.2 L 17.1 -11.5 L 30.6 -11.1 M 8.5 -3.8 L 15.7 -4.8 L 27.8 -5.0","0 22.2 M 26.7 -19.2 L 25.0 -22.2 L 21.8 -23.6 L 18.9 -21.9 L 17.9 -17.7 L 19.0 -13.2 L 21.4 -7.6 L 23.4 -2.1 L 22.6 3.8 L 20.1 6.4 L 16.9 7.5 L 13.2 7.1 L 9.4 4.7 L 8.4 1.6 L 9.2 -1.8 L 12.0 -5.1 M 24.2 -26.0 L 20.4 -13.1 L 13.9 9.5","0 16.7 M 11.6 -22.7 L 9.7 -20.3 L 10.6 -17.3 L 13.4 -16.8 L 15.7 -18.6 L 15.7 -21.6 L 13.7 -23.0 L 11.6 -22.7 M 18.9 1.3 L 17.0 3.7 L 18.0 6.7 L 20.7 7.1 L 23.0 5.4 L 23.0 2.4 L 21.0 1.0 L 18.9 1.3 M 21.9 -23.0 L 10.5 8.9","0 25.0 M 26.5 -20.3 L 24.4 -22.5 L 20.7 -23.5 L 17.3 -23.0 L 15.0 -21.3 L 14.2 -19.0 L 15.1 -16.1 L 17.3 -13.9 L 19.3 -12.9 L 20.6 -12.8 L 20.7 -13.1 L 19.5 -13.7 L 16.0 -13.1 L 12.3 -10.1 L 10.6 -6.7 L 10.5 -1.4 L 12.1 3.1 L 15.5 6.2 L 20.0 7.6 L 25.1 6.6 L 29.5 3.0 L 31.3 -.2 L 31.4 -3.7 L 30.2 -6.1 L 29.0 -7.3 L 27.3 -8.4 M 23.0 .5 L 22.2 -1.5 L 23.1 -5.3 L 25.3 -7.5 L 28.7 -9.2 L 31.8 -10.2 L 33.4 -12.0 L 34.0 -13.7 L 33.7 -16.5","0 4.6 M 13.1 -24.7 L 12.4 -21.5 L 12.4 -19.2","0 9.5 M 21.6 -23.8 L 17.0 -19.0 L 13.4 -12.2 L 11.4 -6.1 L 10.6 .4 L 10.8 7.1 L 11.8 12.2 L 14.4 16.9","0 8.8 M 13.8 -23.2 L 15.5 -16.6 L 16.1 -10.9 L 14.9 -4.2 L 12.4 2.8 L 9.7 8.1 L 6.3 11.9 L 2.0 15.8","0 11.5 M 12.5 -19.5 L 15.2 -14.7 L 17.3 -12.1 M 10.7 -14.6 L 12.4 -15.6 L 14.8 -16.4 L 18.3 -16.4 M 12.4 -12.3 L 16.9 -19.5","0 14.1 M 15.6 -8.3 L 15.2 -4.0 L 14.3 .4 L 14.3 2.0 M 9.9 -2.5 L 12.3 -3.3 L 16.3 -3.4 L 18.3 -3.1 L 20.1 -3.2","0 5.5 M 9.2 7.3 L 9.7 6.3 L 10.4 8.0 L 8.7 11.6 L 7.7 13.1","0 14.0 M 10.1 -1.7 L 12.4 -1.9 L 15.6 -1.1 L 17.2 -1.4 L 19.4 -2.3","0 4.8 M 10.1 6.4 L 9.5 7.7 L 11.0 7.7 L 10.4 6.6","0 13.0 M 23.9 -25.0 L 22.8 -23.9 L 22.4 -21.5 L 22.0 -19.2 L 5.0 22.0","0 15.1 M 20.6 -6.8 L 19.5 -7.4 L 18.1 -8.6 L 14.6 -8.1 L 12.0 -5.5 L 10.7 -1.9 L 10.5 2.3 L 11.6 6.5 L 14.7 7.6 L 17.7 6.1 L 19.9 2.8 L 20.7 -.5 L 20.9 -3.0 L 20.3 -5.4","0 11.8 M 9.3 .4 L 11.9 -2.4 L 13.4 -4.6 L 15.1 -7.8 L 13.2 -.5 L 12.4 4.2 L 12.2 7.2 M 7.3 7.3 L 17.9 7.2","0 16.9 M 10.5 -4.6 L 11.7 -6.6 L 14.0 -8.0 L 16.4 -8.4 L 18.5 -8.2 L 20.4 -6.3 L 19.6 -2.2 L 16.6 2.1 L 14.0 4.8 L 12.6 6.5 L 10.0 7.4 L 8.3 6.9 L 7.8 5.7 L 9.2 3.6 L 11.8 4.2 L 13.9 5.0 L 17.5 6.8 L 19.8 7.3 L 21.2 6.4 L 21.8 4.8 L 22.2 2.6","0 15.0 M 10.2 -4.9 L 12.0 -6.9 L 15.6 -8.3 L 18.7 -8.0 L 20.5 -5.7 L 19.5 -2.5 L 17.7 -.3 L 15.6 1.6 L 12.0 3.2 L 15.3 2.4 L 17.9 2.9 L 20.0 5.3 L 21.6 9.1 L 20.8 13.8 L 18.7 17.9 L 14.1 20.4 L 8.9 20.4 L 4.5 18.7 L 2.3 16.1 L 2.1 12.2","0 16.8 M 23.2 7.1 L 22.0 7.4 L 9.7 7.6 L 14.0 2.2 L 17.3 -1.3 L 18.9 -3.8 L 21.6 -8.0 L 21.0 -6.5 L 20.5 .1 L 19.1 8.6 L 18.0 14.6 L 17.1 20.6","0 21.3 M 29.1 -8.5 L 26.7 -6.8 L 20.2 -6.8 L 19.4 -6.9 L 17.2 -7.9 L 16.9 -5.1 L 15.5 -.8 L 13.6 3.4 L 12.0 5.7 L 15.5 3.6 L 18.7 3.2 L 21.7 3.5 L 24.9 5.4 L 26.7 8.3 L 27.5 12.4 L 26.2 16.7 L 23.2 19.7 L 19.2 20.8 L 13.4 20.1 L 9.6 16.9 L 8.5 14.3 L 8.7 12.2","0 18.1 M 26.3 -19.0 L 25.1 -21.5 L 22.8 -23.3 L 19.9 -23.6 L 16.4 -21.1 L 13.6 -15.8 L 11.5 -9.2 L 10.4 -2.3 L 10.4 2.7 L 11.8 5.9 L 15.9 7.7 L 19.6 5.9 L 21.9 2.4 L 22.7 -2.3 L 22.5 -5.5 L 20.7 -8.0 L 17.9 -9.0 L 14.9 -8.0 L 13.2 -6.2 L 11.4 -4.1 L 10.4 -1.1","0 15.3 M 9.5 -7.7 L 12.2 -8.2 L 20.9 -7.8 L 21.5 -7.1 L 18.1 -1.2 L 15.3 6.3 L 10.5 20.2 L 10.1 20.9 M 9.1 7.1 L 20.2 7.2","0 16.6 M 18.7 -23.3 L 16.0 -22.5 L 14.4 -20.5 L 14.1 -17.3 L 14.8 -14.3 L 16.2 -11.8 L 19.3 -6.8 L 20.4 -4.3 L 21.7 -.3 L 21.7 3.4 L 19.7 6.1 L 16.7 7.6 L 14.0 7.5 L 11.2 5.9 L 9.7 3.0 L 9.7 .0 L 10.9 -3.5 L 14.9 -7.7 L 21.6 -14.1 L 22.8 -16.6 L 22.7 -19.2 L 22.0 -21.5 L 21.1 -22.9 L 20.0 -23.1 L 18.7 -23.3","0 15.2 M 22.5 -6.7 L 19.3 -8.2 L 13.9 -6.9 L 11.0 -3.7 L 9.6 -.3 L 9.7 3.6 L 11.3 6.5 L 13.9 7.1 L 16.9 5.9 L 19.9 3.0 L 21.6 -.5 L 22.5 -4.2 L 22.6 -6.0 L 21.9 -5.6 L 19.7 4.7 L 18.7 10.6 L 17.0 15.5 L 14.1 19.7 L 11.4 21.2 L 7.6 21.2 L 5.4 19.5 L 3.5 16.7","0 7.7 M 12.0 -5.9 L 11.8 -4.5 L 13.4 -4.6 L 13.4 -6.0 L 12.0 -5.9 M 9.0 5.9 L 9.1 7.3 L 10.5 7.1 L 10.6 5.8 L 9.0 5.9","0 8.3 M 11.9 -6.2 L 11.8 -4.6 L 13.3 -4.6 L 13.5 -6.1 L 11.9 -6.2 M 9.2 7.0 L 9.3 5.9 L 10.6 6.3 L 10.5 8.3 L 8.8 11.2 L 7.8 12.0","0 15.3 M 20.7 -7.9 L 16.8 -4.0 L 14.1 -2.1 L 13.3 -1.1 L 13.3 .4 L 17.0 5.3","0 14.7 M 9.9 -3.7 L 11.3 -4.5 L 16.1 -4.5 L 18.8 -4.5 M 10.5 .5 L 12.3 -.5 L 15.1 -.7 L 20.3 -.6","0 14.8 M 16.1 -5.8 L 18.3 -2.5 L 19.6 -1.3 L 20.6 -.5 L 15.8 4.3 L 13.8 5.5","0 14.8 M 10.0 -16.3 L 9.6 -18.2 L 10.3 -20.8 L 12.0 -22.5 L 14.5 -23.4 L 17.5 -23.7 L 19.8 -22.5 L 21.5 -19.7 L 21.4 -15.6 L 20.4 -12.5 L 18.3 -10.0 L 16.7 -7.2 L 15.3 -5.2 L 14.3 -1.1 L 13.9 2.1 M 12.9 6.1 L 12.6 7.3 L 13.7 7.5 L 13.9 6.2 L 12.9 6.1","0 27.9 M 25.0 -13.7 L 23.4 -14.5 L 21.9 -14.3 L 19.9 -12.3 L 18.2 -7.8 L 17.6 -3.4 L 17.5 .3 L 18.2 2.0 L 19.7 2.2 L 21.7 .3 L 23.4 -3.5 L 25.4 -9.0 L 25.9 -9.3 L 25.9 -3.3 L 26.8 .2 L 28.8 .8 L 32.1 -.9 L 34.7 -4.6 L 35.1 -8.3 L 34.6 -12.8 L 33.0 -17.0 L 29.5 -20.7 L 25.3 -22.3 L 21.2 -22.1 L 15.4 -19.9 L 10.9 -14.6 L 9.3 -8.9 L 9.1 -3.6 L 10.6 2.4 L 13.9 6.9 L 18.9 9.5 L 25.0 9.6 L 28.9 7.9 L 32.1 5.1 L 34.9 1.6","0 23.2 M 6.5 7.2 L 10.5 5.2 L 14.0 1.6 L 17.5 -3.7 L 23.6 -14.6 L 26.6 -20.4 L 27.4 -23.1 L 26.2 -16.1 L 25.5 -10.1 L 25.7 -3.7 L 26.2 2.2 L 27.4 7.2 M 11.7 -1.9 L 17.3 -1.5 L 23.6 -1.7 L 28.1 -1.1","0 17.7 M 8.9 9.1 L 16.0 -23.3 M 13.1 -21.6 L 14.9 -22.9 L 18.3 -23.1 L 20.5 -21.9 L 22.8 -18.8 L 23.1 -14.9 L 21.8 -12.3 L 19.1 -9.9 L 16.7 -8.9 L 14.3 -8.4 L 11.3 -8.2 L 17.1 -8.1 L 19.9 -7.1 L 22.3 -4.3 L 23.4 -1.9 L 23.3 1.4 L 21.5 3.8 L 18.3 6.1 L 14.2 7.2 L 10.8 7.3 L 8.0 7.0 L 6.2 6.1","0 17.3 M 26.4 -17.6 L 26.1 -20.1 L 23.8 -23.0 L 21.1 -23.7 L 18.7 -23.1 L 15.6 -19.4 L 12.8 -14.4 L 11.0 -8.5 L 9.7 -3.0 L 10.3 2.6 L 12.3 6.1 L 15.0 7.6 L 17.9 7.2 L 22.2 4.4","0 22.9 M 9.7 8.9 L 13.4 -8.9 L 17.6 -23.0 M 12.5 -20.7 L 15.2 -22.5 L 18.8 -23.3 L 22.6 -23.2 L 25.5 -22.1 L 28.2 -19.0 L 29.3 -13.0 L 28.8 -8.2 L 27.4 -2.9 L 24.9 1.5 L 20.1 5.4 L 15.4 7.1 L 11.9 7.5 L 9.0 7.3 L 6.6 6.7","0 18.6 M 8.6 7.3 L 10.2 2.4 L 15.7 -23.2 M 14.5 -21.9 L 18.8 -23.2 L 23.9 -23.5 L 27.8 -23.2 M 12.9 -8.5 L 22.5 -8.5 M 8.8 7.3 L 24.6 7.5","0 16.1 M 11.0 7.9 L 13.3 -3.0 L 16.6 -23.2 M 8.1 -17.6 L 14.0 -20.3 L 20.1 -21.7 L 26.5 -22.5 L 34.6 -23.1 M 11.2 -9.0 L 11.5 -9.0 L 15.5 -9.2 L 18.7 -9.7 L 24.4 -9.6","0 22.1 M 27.6 -17.4 L 26.5 -20.4 L 24.5 -22.5 L 21.5 -23.3 L 18.3 -21.9 L 15.1 -18.4 L 11.9 -12.5 L 10.5 -7.5 L 9.6 -2.3 L 10.0 2.7 L 13.1 6.9 L 18.8 7.6 L 23.4 5.8 L 25.1 4.4 L 26.4 .3 L 21.4 -4.4 L 19.7 -5.0 L 17.4 -4.2 L 16.5 -3.4 L 19.1 -3.7 L 30.3 -6.6 L 26.5 .0 L 24.1 7.9 L 22.0 15.9 L 21.2 22.0","0 23.6 M 16.0 -23.4 L 16.0 -23.1 L 15.0 -13.7 L 13.0 -4.1 L 9.5 8.3 M 30.4 -23.6 L 28.4 -12.7 L 26.9 -2.1 L 25.7 4.0 L 25.3 7.6 M 4.0 -1.5 L 4.4 -2.9 L 7.7 -5.8 L 10.9 -7.1 L 16.1 -8.7 L 21.6 -9.6 L 29.9 -10.2 L 36.1 -10.2","0 12.2 M 9.9 7.1 L 16.5 7.3 M 12.9 7.3 L 19.8 -23.1 M 16.2 -23.2 L 23.0 -23.1","0 16.9 M 6.5 1.3 L 8.5 5.6 L 11.1 7.7 L 14.7 7.5 L 17.7 5.2 L 19.6 1.2 L 21.1 -4.5 L 24.9 -22.9 L 24.1 -23.1 L 22.9 -22.4 L 21.5 -22.3 L 16.3 -23.5","0 20.9 M 8.7 7.5 L 15.6 -23.6 M 28.0 -23.3 L 11.4 -4.8 L 13.6 -7.1 L 14.7 -1.1 L 16.6 3.1 L 19.6 6.1 L 22.6 7.4 L 25.0 7.3 L 26.8 5.6","0 15.1 M 15.9 -22.9 L 13.5 -11.4 L 11.6 -2.5 L 10.2 4.1 L 8.8 6.8 L 16.7 7.5 L 21.3 7.2","0 28.5 M 8.8 7.3 L 15.7 -22.9 L 21.4 1.9 L 34.0 -23.1 L 33.0 7.5","0 21.9 M 9.0 7.4 L 15.5 -22.8 L 23.7 7.3 L 29.8 -23.3","0 20.2 M 22.7 -19.4 L 19.8 -20.7 L 16.2 -20.0 L 12.6 -15.2 L 10.8 -10.9 L 9.8 -4.3 L 9.6 .1 L 10.8 5.1 L 13.6 7.9 L 16.8 7.5 L 20.8 5.3 L 23.7 .8 L 25.8 -4.0 L 27.1 -11.3 L 27.1 -17.3 L 25.9 -20.5 L 24.5 -22.4 L 23.4 -23.3 L 20.5 -23.7","0 17.8 M 10.5 7.0 L 17.2 -23.8 M 13.2 -21.1 L 14.8 -22.9 L 17.1 -23.5 L 19.7 -23.3 L 22.5 -21.9 L 24.7 -18.8 L 25.2 -14.2 L 23.7 -9.5 L 21.5 -6.9 L 18.1 -5.2 L 14.6 -5.3 L 10.3 -6.8","0 21.5 M 19.3 -23.5 L 22.2 -23.9 L 25.9 -21.9 L 27.9 -17.1 L 27.9 -9.8 L 24.9 -.3 L 22.1 4.2 L 18.2 7.4 L 15.9 7.9 L 13.0 7.7 L 10.9 5.0 L 9.7 -2.5 L 10.3 -9.9 L 12.5 -15.6 L 15.6 -19.9 L 18.2 -21.0 L 19.9 -21.3 L 22.0 -21.0 M 13.2 7.9 L 17.3 12.5 L 23.4 16.6 L 29.2 18.7 L 34.8 19.1 L 44.4 17.5","0 15.5 M 9.0 7.2 L 15.9 -24.3 M 12.1 -20.7 L 14.2 -22.6 L 17.7 -23.5 L 21.0 -22.7 L 23.1 -20.4 L 24.0 -16.2 L 23.5 -12.8 L 22.2 -9.9 L 19.8 -7.7 L 17.4 -6.8 L 16.5 -6.6 L 14.2 -7.2 L 14.9 .6 L 17.2 7.5 L 20.1 12.1 L 24.5 15.1 L 29.9 16.8 L 35.6 16.1 L 39.7 14.0 L 42.6 11.4","0 18.4 M 11.7 -5.1 L 9.2 -1.7 L 8.4 2.9 L 12.0 7.1 L 18.2 7.5 L 21.2 5.5 L 23.4 1.8 L 23.2 -2.7 L 22.3 -5.6 L 18.2 -16.0 L 18.0 -20.1 L 19.4 -22.7 L 22.0 -23.5 L 24.3 -22.8 L 25.6 -21.5 L 26.3 -19.2","0 19.4 M 14.4 8.3 L 14.5 8.0 L 17.2 -6.7 L 21.1 -24.3 M 11.6 -22.8 L 25.1 -23.0 L 30.5 -23.5","0 21.2 M 15.2 -23.2 L 11.8 -6.6 L 10.5 .4 L 10.3 3.5 L 12.1 6.3 L 15.6 7.5 L 19.2 6.6 L 21.7 4.9 L 23.3 1.4 L 29.4 -23.0","0 17.9 M 11.5 -23.1 L 16.0 7.3 L 18.9 2.8 L 22.2 -3.1 L 25.2 -9.8 L 26.6 -14.3 L 26.8 -18.5 L 26.7 -20.8 L 26.3 -24.5","0 25.6 M 10.9 -23.0 L 10.9 -16.9 L 12.0 -8.6 L 12.8 -1.5 L 13.3 7.3 L 15.8 3.4 L 18.1 -2.0 L 21.6 -12.1 L 23.0 -17.5 L 23.2 -20.5 L 22.9 -22.3 L 22.0 -21.9 L 22.2 -16.9 L 22.4 -7.4 L 22.8 .1 L 23.4 3.0 L 25.6 7.1 L 29.5 -.9 L 32.6 -8.9 L 33.6 -14.8 L 33.8 -19.6 L 32.8 -23.6 L 31.1 -27.2 L 28.6 -30.2 L 25.3 -32.0 L 23.1 -32.2 L 21.5 -31.1 L 21.0 -29.5","0 20.9 M 7.0 7.9 L 19.2 -9.4 L 30.0 -23.3 M 14.9 -23.7 L 22.0 .4 L 24.8 7.7","0 14.8 M 14.2 6.4 L 16.1 -2.7 L 19.2 -11.3 L 22.6 -18.7 L 24.0 -21.3 L 25.7 -23.3 M 11.8 -23.2 L 12.6 -15.2 L 14.1 -8.5 L 15.3 -4.7 L 16.1 -3.3 M 10.2 8.6 L 13.1 7.5 L 16.5 7.2 L 19.1 7.5","0 15.8 M 11.0 -23.1 L 16.7 -22.9 L 23.2 -23.5 L 27.5 -23.5 L 19.5 -11.0 L 11.6 -.2 L 7.1 6.7 L 9.8 5.9 L 12.0 6.7 L 15.1 9.7 L 19.2 12.9 L 22.6 14.6 L 26.1 15.4 L 29.5 14.9 L 32.6 13.6 L 35.1 11.4","0 9.2 M 20.2 -22.8 L 16.2 -23.2 L 8.2 17.1 L 10.2 17.5 L 14.9 16.2","0 13.4 M 5.0 -25.0 L 22.2 16.3 L 22.5 18.3 L 22.7 20.4 L 23.9 22.0","0 10.9 M 6.3 15.6 L 11.7 16.7 L 14.4 16.5 L 22.5 -23.9 L 16.8 -23.4","0 16.8 M 11.8 -23.6 L 14.5 -25.2 L 21.8 -33.1 L 21.2 -31.7 L 22.6 -26.6 L 24.1 -24.3 L 26.2 -22.5","0 22.9 M 8.4 8.4 L 30.6 8.3","0 9.2 M 10.6 -32.7 L 11.1 -31.1 L 13.8 -27.0","0 15.0 M 19.7 -4.5 L 19.7 -6.9 L 18.8 -8.0 L 16.7 -7.5 L 13.6 -4.6 L 11.5 -1.1 L 9.7 2.8 L 9.1 5.8 L 9.9 7.0 L 11.0 7.1 L 13.7 4.8 L 16.7 .6 L 20.4 -5.6 L 18.9 .6 L 18.5 4.9 L 18.4 6.0 L 19.6 7.3","0 13.4 M 11.5 .2 L 13.3 -4.4 L 15.9 -7.6 L 18.0 -8.0 L 19.2 -5.2 L 18.0 1.7 L 16.6 5.0 L 14.7 7.2 L 13.0 7.4 L 11.6 6.1 L 10.9 3.6 L 12.2 -4.8 L 15.7 -22.9","0 11.0 M 16.0 5.3 L 14.1 7.3 L 11.4 7.5 L 9.7 5.3 L 10.2 -.3 L 12.0 -4.8 L 14.1 -7.4 L 15.8 -8.4 L 17.4 -8.4 L 18.0 -7.3 L 18.3 -6.1","0 14.5 M 18.4 -1.1 L 18.9 -4.7 L 18.5 -7.2 L 17.4 -8.1 L 14.0 -7.5 L 11.3 -4.2 L 9.7 .4 L 9.7 5.1 L 11.4 7.6 L 14.0 7.5 L 16.3 4.4 L 17.9 .4 L 20.0 -8.4 L 23.2 -22.8 L 17.3 4.1 L 17.3 6.2 L 17.5 7.5","0 11.0 M 10.6 .4 L 13.8 -.7 L 16.8 -2.8 L 17.5 -5.6 L 17.5 -7.1 L 16.4 -8.2 L 14.2 -7.9 L 11.5 -4.7 L 10.2 -.4 L 9.7 3.6 L 10.3 6.3 L 11.9 7.6 L 13.4 7.3 L 16.0 6.0","0 10.9 M -4.8 18.5 L -1.2 20.6 L 3.6 20.6 L 6.5 18.6 L 9.3 14.0 L 10.7 7.7 L 12.9 -6.9 L 14.0 -12.8 L 15.8 -17.0 L 18.7 -19.4 L 20.6 -19.6 L 22.4 -19.3 M 9.1 -7.8 L 18.1 -8.0","0 12.5 M 17.2 -1.1 L 15.8 3.2 L 13.6 6.5 L 11.9 7.5 L 10.6 7.0 L 9.5 5.0 L 9.7 2.7 L 10.7 -1.1 L 12.6 -5.0 L 14.8 -7.7 L 17.2 -8.4 L 18.7 -8.3 L 19.4 -7.6 L 19.6 -8.0 L 16.8 2.0 L 15.3 9.9 L 14.2 16.0 L 13.0 18.9 L 11.7 20.4 L 9.7 20.5 L 7.7 19.7 L 7.1 17.3 L 7.9 14.8 L 11.7 11.4 L 19.5 5.4","0 15.8 M 10.2 7.3 L 13.4 -8.4 L 15.5 -17.5 L 16.5 -22.7 L 11.0 3.3 L 14.3 -3.1 L 16.1 -6.2 L 18.9 -7.8 L 20.9 -7.0 L 20.8 -3.4 L 19.9 .2 L 18.9 7.1","0 6.8 M 11.9 6.6 L 10.6 7.5 L 9.6 7.0 L 12.7 -6.5 L 12.4 -8.6 M 13.4 -13.5 L 13.4 -12.5 L 14.3 -12.5 L 14.7 -13.6 L 13.4 -13.5","0 6.6 M -2.4 20.2 L 1.1 20.6 L 5.3 19.1 L 7.7 16.4 L 9.2 12.2 L 10.1 7.8 L 12.7 -8.3 M 13.3 -13.3 L 13.1 -12.7 L 13.9 -12.6 L 14.0 -13.3 L 13.3 -13.3","0 14.3 M 9.7 7.7 L 16.4 -22.9 L 12.1 -2.5 L 13.4 -6.0 L 15.1 -7.8 L 17.0 -8.4 L 18.3 -6.8 L 18.1 -4.8 L 17.0 -3.1 L 15.1 -1.4 L 13.3 -.3 L 11.7 .8 L 11.8 -.9 L 13.6 2.7 L 15.4 5.7 L 17.0 7.1 L 19.0 7.7 L 20.2 7.0 L 21.5 5.7","0 8.6 M 15.8 -23.3 L 10.1 5.6 L 10.6 6.9 L 12.0 7.3 L 13.7 7.1 L 14.4 6.7","0 20.7 M 13.3 -8.4 L 12.3 -2.3 L 11.0 4.2 L 10.0 7.3 L 13.0 .3 L 15.7 -5.2 L 17.0 -6.9 L 18.6 -8.0 L 20.3 -8.3 L 21.4 -6.8 L 21.1 -4.0 L 18.8 1.4 L 17.5 5.5 L 17.4 7.3 L 21.0 -3.5 L 23.6 -6.8 L 26.0 -8.2 L 27.8 -8.1 L 28.0 -6.1 L 26.4 -.3 L 25.1 3.6 L 24.5 5.5 L 24.7 7.3","0 14.4 M 12.9 -8.0 L 10.0 6.8 L 13.6 -.5 L 15.9 -5.5 L 17.2 -7.4 L 18.5 -7.9 L 19.6 -7.5 L 20.4 -6.2 L 19.1 1.3 L 18.0 7.6","0 10.7 M 16.4 -8.1 L 13.5 -6.9 L 11.0 -3.1 L 9.8 .6 L 9.8 5.5 L 12.0 7.3 L 14.3 6.9 L 17.1 3.3 L 18.4 -.8 L 18.8 -4.3 L 18.6 -6.8 L 17.9 -7.6 L 16.4 -8.1","0 13.4 M 7.3 20.6 L 13.3 -8.5 L 11.3 1.4 L 13.6 -3.7 L 15.8 -7.0 L 18.0 -8.3 L 20.1 -7.7 L 20.5 -4.7 L 19.9 -.8 L 18.8 2.5 L 16.4 6.5 L 14.3 7.5 L 12.5 7.2 L 11.4 6.1 L 11.1 2.7","0 12.4 M 18.0 -2.9 L 15.6 1.9 L 13.3 6.3 L 11.3 7.4 L 9.8 6.6 L 9.8 2.0 L 10.7 -3.0 L 12.5 -6.7 L 14.7 -8.2 L 16.1 -8.3 L 17.6 -7.3 L 18.0 -5.2 L 17.4 -1.1 L 15.8 8.4 L 12.9 20.8","0 9.9 M 13.1 -8.2 L 10.0 7.5 L 12.3 -1.1 L 15.0 -5.6 L 17.1 -7.7 L 18.2 -8.3 L 19.6 -7.8","0 10.1 M 9.4 5.3 L 10.9 6.7 L 12.8 6.9 L 14.3 5.8 L 15.3 4.0 L 14.3 .9 L 12.7 -2.1 L 11.7 -4.8 L 11.7 -6.6 L 12.5 -8.2 L 14.2 -8.6 L 15.2 -8.5 L 16.5 -7.1","0 10.7 M 15.2 5.2 L 14.2 6.4 L 13.4 6.9 L 12.0 7.1 L 10.3 5.7 L 11.0 2.4 L 14.5 -12.7 M 10.0 -8.0 L 17.5 -8.0","0 13.7 M 12.0 -8.3 L 10.7 -2.5 L 10.0 1.8 L 9.9 4.5 L 10.2 6.1 L 10.9 7.3 L 12.3 6.6 L 13.6 4.8 L 18.5 -4.2 L 20.3 -7.2 L 18.3 -2.2 L 17.6 3.3 L 17.1 6.3 L 17.0 7.2 L 17.4 7.8","0 11.5 M 10.2 -8.6 L 12.2 7.1 L 15.8 2.2 L 18.1 -3.8 L 18.7 -8.6 L 18.7 -10.9 L 17.4 -12.7 L 16.9 -13.3 L 14.7 -13.7","0 18.7 M 10.1 -7.8 L 12.5 6.7 L 17.9 -7.6 L 20.0 6.7 L 23.1 1.9 L 25.4 -2.7 L 26.4 -6.5 L 26.1 -9.2 L 25.7 -10.8 L 24.8 -11.9 L 22.5 -13.4","0 12.3 M 8.1 7.9 L 14.3 -1.4 L 19.0 -8.0 M 11.4 -8.8 L 14.1 -.1 L 17.3 7.1","0 14.1 M 12.4 -8.3 L 10.5 1.1 L 10.1 5.0 L 10.8 6.9 L 12.7 7.3 L 14.8 5.7 L 16.1 3.8 L 17.1 1.6 L 19.9 -8.1 L 16.9 6.3 L 15.6 12.5 L 14.0 17.8 L 12.8 19.8 L 10.5 21.0 L 9.0 20.2 L 7.9 18.6 L 7.9 16.4 L 8.8 14.4 L 10.8 12.5 L 20.0 5.5","0 13.3 M 11.3 -8.1 L 20.2 -8.0 L 8.4 7.5 L 10.4 6.3 L 12.5 6.8 L 14.8 7.5 L 17.0 7.3 L 18.7 6.2 L 19.0 4.7 L 18.5 3.2","0 9.3 M 18.4 -23.3 L 16.3 -22.4 L 14.3 -18.7 L 14.1 -13.1 L 13.9 -7.5 L 13.1 -5.4 L 10.7 -3.3 L 10.7 -3.7 L 12.5 -3.1 L 12.0 .3 L 10.0 7.5 L 9.2 11.7 L 9.6 15.3 L 10.4 16.9 L 12.4 16.3","0 9.6 M 17.2 -31.0 L 9.0 11.9","0 10.8 M 13.6 -22.5 L 15.4 -23.2 L 16.8 -22.1 L 17.2 -19.4 L 16.6 -15.4 L 15.0 -9.4 L 13.3 -5.2 L 12.9 -1.3 L 12.9 .4 L 14.4 .7 L 12.4 2.6 L 11.5 6.9 L 10.7 13.2 L 9.6 18.2 L 8.5 21.2 L 6.2 23.7 L 3.6 23.8 L .4 22.0","0 20.1 M 9.5 1.0 L 10.7 -1.6 L 13.4 -3.6 L 15.4 -3.5 L 17.7 -2.4 L 22.1 .1 L 23.7 .2 L 24.4 -.3 L 25.8 -2.8","0 7.6 M 16.3 -25.4 L 15.7 -26.1 L 13.3 -26.0 L 11.6 -23.0 L 12.1 -20.7 L 14.1 -19.5 L 16.2 -19.7 L 18.4 -21.1 L 19.0 -22.3 L 19.1 -23.8 L 18.2 -24.8 L 16.3 -25.4"]
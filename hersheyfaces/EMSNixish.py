@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.2 M 13.6 -12.9 L 13.6 2.6 M 13.7 6.0 L 12.9 6.5 L 12.5 7.5 L 13.0 8.1 L 13.6 8.3 L 14.3 8.2 L 14.8 7.5 L 14.8 6.6 L 14.4 6.2 L 13.7 6.0","0 10.7 M 12.5 -13.0 L 12.5 -6.7 M 16.6 -12.9 L 16.6 -6.7","0 24.2 M 14.6 7.9 L 19.7 -12.8 M 28.1 -13.0 L 23.0 7.9 M 29.5 2.0 L 11.1 2.0 M 13.2 -6.8 L 31.8 -6.8","0 20.2 M 12.0 7.9 L 12.0 1.9 L 12.0 4.7 L 13.6 5.9 L 15.4 7.1 L 17.6 8.0 L 19.9 8.2 L 22.4 8.0 L 24.4 7.3 L 26.2 5.9 L 26.9 4.3 L 27.2 2.7 L 27.1 1.4 L 26.0 -.1 L 23.7 -1.4 L 21.4 -2.1 L 19.2 -2.7 L 17.1 -3.3 L 15.2 -4.0 L 13.6 -4.9 L 12.4 -6.5 L 12.0 -8.1 L 12.4 -10.1 L 13.9 -12.0 L 16.0 -12.9 L 17.9 -13.1 L 20.6 -13.0 L 22.6 -12.3 L 24.2 -11.4 L 25.5 -10.4 L 26.4 -9.5 L 26.4 -6.7 L 26.4 -12.9 M 19.2 -15.3 L 19.2 10.3","0 25.2 M 15.8 -3.5 L 17.0 -3.5 L 18.4 -4.3 L 19.4 -5.1 L 20.1 -6.1 L 20.5 -7.3 L 20.6 -8.7 L 20.4 -9.9 L 19.7 -11.2 L 18.6 -12.3 L 17.2 -13.0 L 15.9 -13.1 L 14.2 -12.8 L 12.5 -11.8 L 11.6 -10.2 L 11.3 -8.5 L 11.3 -6.9 L 12.2 -5.4 L 13.4 -4.1 L 14.5 -3.7 L 15.8 -3.5 M 27.5 8.3 L 28.7 8.3 L 30.1 7.5 L 31.1 6.7 L 31.8 5.7 L 32.2 4.5 L 32.3 3.1 L 32.1 1.9 L 31.4 .6 L 30.3 -.4 L 28.9 -1.1 L 27.6 -1.3 L 25.9 -1.0 L 24.2 .0 L 23.3 1.6 L 23.0 3.3 L 23.0 4.9 L 23.9 6.4 L 25.1 7.7 L 26.2 8.1 L 27.5 8.3 M 14.8 7.9 L 28.4 -12.9","0 22.4 M 25.2 -10.4 L 23.6 -11.8 L 21.8 -13.0 L 20.5 -13.1 L 19.0 -13.1 L 17.1 -12.6 L 15.6 -11.3 L 15.0 -9.6 L 15.1 -7.6 L 16.2 -5.7 L 28.3 8.0 L 30.5 8.0 M 18.5 -2.9 L 16.3 -2.4 L 13.9 -1.4 L 12.0 .7 L 11.4 2.5 L 11.7 4.6 L 12.6 6.6 L 14.6 8.2 L 17.2 8.7 L 19.8 8.2 L 22.2 6.8 L 24.0 5.2 L 25.5 3.0 L 28.9 -2.0","0 6.6 M 12.5 -12.9 L 12.5 -6.3","0 9.4 M 16.3 12.8 L 14.5 10.1 L 13.2 7.0 L 12.4 3.6 L 12.3 -1.0 L 12.5 -5.4 L 13.4 -9.5 L 14.5 -12.6 L 16.3 -15.3","0 9.3 M 11.6 12.9 L 13.4 10.1 L 14.7 7.1 L 15.5 3.7 L 15.6 -.9 L 15.4 -5.4 L 14.5 -9.5 L 13.4 -12.5 L 11.6 -15.2","0 14.8 M 16.6 -3.6 L 16.6 -12.9 M 12.2 -10.8 L 21.1 -5.7 M 12.1 -5.7 L 20.9 -10.8","0 16.2 M 17.1 4.8 L 17.1 -7.4 M 11.1 -1.5 L 23.3 -1.5","0 8.3 M 14.1 8.2 L 13.5 8.3 L 12.9 8.1 L 12.4 7.5 L 12.7 6.5 L 13.6 6.0 L 14.3 6.2 L 14.6 6.6 L 14.6 7.5 L 14.6 8.7 L 14.5 9.8 L 14.1 10.5 L 13.6 11.2 L 12.6 11.9","0 18.5 M 12.4 -1.5 L 24.7 -1.5","0 8.3 M 13.3 6.0 L 12.5 6.5 L 12.2 7.5 L 12.6 8.1 L 13.3 8.3 L 13.9 8.2 L 14.4 7.5 L 14.4 6.6 L 14.0 6.2 L 13.3 6.0","0 16.8 M 10.9 7.9 L 24.4 -12.9","0 21.0 M 19.7 8.2 L 21.6 8.0 L 23.9 6.8 L 25.5 5.1 L 26.7 2.8 L 27.4 .9 L 27.5 -1.2 L 27.5 -3.4 L 27.4 -5.4 L 27.3 -6.8 L 26.4 -8.8 L 24.9 -10.7 L 22.9 -12.3 L 20.9 -13.1 L 19.2 -13.1 L 16.7 -12.5 L 14.6 -10.9 L 13.2 -8.7 L 12.2 -6.4 L 12.0 -3.8 L 12.0 -.8 L 12.4 1.5 L 12.9 3.4 L 14.1 5.4 L 15.5 6.8 L 17.5 8.0 L 19.7 8.2","0 11.6 M 12.5 8.0 L 19.0 8.0 L 15.7 8.0 L 15.7 -13.0 L 11.0 -9.0","0 19.2 M 11.7 -10.1 L 13.2 -11.5 L 15.2 -12.5 L 17.3 -13.1 L 19.5 -13.1 L 21.5 -12.8 L 23.2 -12.0 L 24.7 -10.7 L 25.7 -8.4 L 25.6 -6.7 L 24.9 -5.1 L 22.9 -3.0 L 20.1 -1.3 L 17.2 .2 L 14.9 1.7 L 13.4 2.9 L 12.2 4.7 L 11.9 5.9 L 11.9 8.0 L 25.6 8.0 L 25.6 3.5","0 19.3 M 11.8 5.2 L 13.4 6.6 L 15.4 7.7 L 17.6 8.2 L 19.3 8.2 L 21.4 7.9 L 23.5 7.0 L 24.8 5.7 L 25.6 4.0 L 25.8 1.8 L 25.3 -.2 L 23.8 -1.8 L 22.1 -2.5 L 19.9 -2.9 L 16.7 -2.9 L 20.6 -2.9 L 22.2 -3.4 L 23.7 -4.4 L 24.8 -5.9 L 25.2 -7.7 L 25.0 -9.3 L 24.0 -11.1 L 22.9 -12.2 L 21.0 -12.9 L 18.9 -13.0 L 16.8 -12.9 L 14.3 -12.0 L 12.2 -10.5","0 18.8 M 16.5 -13.6 L 16.4 -11.6 L 16.1 -9.2 L 15.8 -7.2 L 15.0 -5.0 L 14.0 -2.9 L 12.8 -.6 L 10.7 2.6 L 26.7 2.6 L 23.3 2.6 L 23.3 8.2 L 23.3 -7.1","0 18.5 M 12.2 8.9 L 14.4 8.7 L 17.2 8.4 L 19.9 7.6 L 22.4 6.4 L 24.2 4.7 L 25.3 2.9 L 25.4 .9 L 25.3 -.8 L 24.5 -2.5 L 23.3 -3.7 L 21.4 -4.6 L 18.8 -5.1 L 15.8 -4.8 L 13.7 -4.0 L 12.3 -3.1 L 12.3 -12.8 L 24.5 -12.8","0 19.3 M 12.6 -5.3 L 20.5 -5.3 L 22.5 -4.6 L 24.2 -3.6 L 25.6 -2.0 L 26.3 -.4 L 26.4 1.7 L 26.2 3.8 L 24.9 5.7 L 23.6 7.1 L 21.5 8.1 L 19.1 8.2 L 17.1 7.9 L 15.1 6.8 L 13.2 4.9 L 12.0 2.2 L 11.8 -.4 L 12.0 -3.3 L 12.4 -4.9 L 13.1 -7.2 L 14.6 -9.5 L 16.7 -11.4 L 19.0 -12.9 L 21.5 -13.8 L 24.0 -13.7","0 15.3 M 10.1 -8.4 L 10.1 -12.8 L 23.5 -12.8 L 21.2 -8.6 L 19.3 -5.2 L 17.8 -1.6 L 16.8 .9 L 16.2 3.0 L 15.8 5.1 L 15.7 7.9","0 20.6 M 19.5 8.2 L 22.0 8.0 L 24.6 7.1 L 26.6 5.4 L 27.4 3.5 L 27.1 1.7 L 26.1 .2 L 24.6 -.9 L 22.9 -1.6 L 19.9 -2.7 L 17.3 -3.6 L 14.9 -4.7 L 13.6 -6.1 L 12.8 -8.2 L 13.1 -10.1 L 14.7 -12.0 L 17.1 -12.9 L 19.6 -13.2 L 21.5 -13.0 L 24.1 -12.2 L 25.8 -10.6 L 26.4 -8.9 L 26.4 -7.0 L 25.0 -5.2 L 23.1 -4.1 L 20.6 -3.2 L 17.0 -2.0 L 14.6 -1.0 L 13.0 .3 L 12.1 1.5 L 11.9 4.0 L 12.8 5.8 L 14.3 7.1 L 16.2 7.9 L 18.1 8.2 L 19.5 8.2","0 19.2 M 13.8 8.9 L 15.9 8.8 L 18.1 8.0 L 20.1 7.0 L 22.0 5.7 L 23.6 3.6 L 24.9 1.4 L 25.5 -1.1 L 25.9 -3.6 L 25.7 -5.9 L 25.2 -8.5 L 23.6 -10.8 L 21.5 -12.5 L 19.7 -13.1 L 17.6 -13.1 L 15.2 -12.6 L 13.0 -11.1 L 11.9 -9.6 L 11.4 -7.4 L 11.3 -5.3 L 12.0 -2.9 L 13.0 -1.6 L 14.3 -.6 L 16.6 .3 L 18.8 .5 L 25.1 .5","0 8.8 M 13.6 -6.9 L 12.7 -6.5 L 12.4 -5.5 L 12.9 -4.8 L 13.5 -4.6 L 14.1 -4.8 L 14.6 -5.4 L 14.6 -6.3 L 14.3 -6.7 L 13.6 -6.9 M 13.6 5.9 L 12.7 6.4 L 12.4 7.4 L 12.9 8.0 L 13.5 8.2 L 14.1 8.1 L 14.6 7.4 L 14.6 6.5 L 14.3 6.1 L 13.6 5.9","0 8.5 M 13.6 -6.9 L 12.8 -6.5 L 12.5 -5.5 L 12.9 -4.9 L 13.6 -4.7 L 14.2 -4.8 L 14.7 -5.5 L 14.7 -6.4 L 14.3 -6.7 L 13.6 -6.9 M 14.1 8.1 L 13.5 8.2 L 12.9 8.0 L 12.4 7.4 L 12.7 6.4 L 13.6 6.0 L 14.3 6.2 L 14.6 6.6 L 14.6 7.5 L 14.6 8.7 L 14.5 9.7 L 14.1 10.4 L 13.6 11.1 L 12.6 11.9","0 16.3 M 22.9 -6.2 L 11.2 .5 L 22.9 7.3","0 18.6 M 12.3 -4.7 L 24.9 -4.7 M 12.2 1.6 L 24.8 1.6","0 16.3 M 11.8 7.6 L 23.6 .8 L 11.8 -6.1","0 17.7 M 17.9 6.0 L 17.1 6.4 L 16.7 7.4 L 17.2 8.0 L 17.8 8.2 L 18.5 8.1 L 19.0 7.5 L 19.0 6.6 L 18.6 6.2 L 17.9 6.0 M 17.8 2.7 L 17.9 1.3 L 18.3 .2 L 19.2 -.8 L 20.7 -2.0 L 22.2 -3.2 L 23.4 -4.4 L 24.3 -5.7 L 24.6 -6.9 L 24.4 -8.5 L 23.7 -10.3 L 22.4 -11.8 L 20.9 -12.7 L 19.0 -13.2 L 17.0 -13.1 L 15.5 -12.8 L 14.1 -12.3 L 12.7 -11.4 L 11.7 -10.1 L 11.2 -8.8 L 11.1 -7.3","0 29.4 M 29.4 -6.4 L 29.4 4.4 L 27.7 6.4 L 25.3 7.9 L 22.2 8.2 L 19.4 6.8 L 17.9 4.9 L 17.2 1.8 L 17.2 -1.8 L 18.9 -4.9 L 21.2 -6.6 L 23.5 -7.1 L 26.2 -6.3 L 27.9 -4.7 L 28.9 -3.5 L 29.5 -2.1 L 29.5 5.8 L 30.4 7.5 L 32.2 8.3 L 33.9 7.9 L 35.3 6.2 L 36.1 4.5 L 36.5 2.1 L 36.5 -1.5 L 36.0 -3.9 L 35.1 -6.5 L 33.5 -8.8 L 31.8 -10.4 L 29.8 -11.8 L 27.6 -12.7 L 25.8 -13.0 L 23.6 -13.2 L 21.2 -12.8 L 18.7 -12.0 L 16.1 -10.2 L 14.3 -8.3 L 12.8 -5.7 L 12.1 -3.1 L 11.7 -.3 L 12.0 2.9 L 12.8 6.0 L 14.1 8.4 L 15.7 10.3 L 18.3 12.2 L 21.4 13.6 L 24.1 13.7 L 27.1 13.6 L 29.5 12.9 L 30.9 12.0 L 32.1 11.0","0 23.1 M 9.7 7.9 L 15.7 7.9 L 12.5 7.9 L 20.7 -13.0 L 26.0 .3 L 15.5 .3 L 26.1 .3 L 29.1 8.0 L 25.9 8.0 L 32.0 8.0","0 21.0 M 11.0 -12.9 L 21.6 -12.9 L 23.3 -12.4 L 24.7 -11.5 L 25.8 -10.0 L 26.0 -8.5 L 26.0 -6.9 L 25.5 -5.6 L 24.5 -4.5 L 23.5 -3.6 L 22.4 -3.1 L 21.3 -2.8 L 14.5 -2.8 L 21.5 -2.8 L 22.7 -2.8 L 24.5 -2.5 L 26.1 -1.6 L 27.1 -.1 L 27.6 1.6 L 27.6 3.5 L 27.1 5.1 L 26.1 6.6 L 24.8 7.5 L 23.3 7.8 L 22.3 8.0 L 11.5 8.0 L 14.4 8.0 L 14.4 -12.8","0 22.2 M 28.9 -13.1 L 28.9 -6.8 L 28.9 -9.8 L 27.0 -11.0 L 25.3 -12.1 L 23.5 -12.9 L 21.4 -13.1 L 19.4 -13.0 L 17.2 -12.3 L 15.0 -10.9 L 13.3 -8.6 L 12.2 -6.2 L 11.9 -3.7 L 12.0 -.5 L 12.7 2.2 L 14.0 4.6 L 16.4 6.8 L 19.3 8.0 L 23.8 8.1 L 26.2 7.4 L 27.8 6.4 L 29.0 5.3","0 23.5 M 11.2 7.9 L 21.2 7.9 L 23.6 7.3 L 25.7 6.2 L 27.8 4.1 L 29.2 2.0 L 29.9 -.4 L 29.9 -3.9 L 29.3 -6.5 L 27.8 -9.1 L 26.3 -10.9 L 23.9 -12.3 L 21.4 -13.0 L 11.2 -13.0 L 14.4 -13.0 L 14.4 7.8","0 19.7 M 26.3 3.3 L 26.3 7.9 L 11.0 7.9 L 14.3 7.9 L 14.3 -2.6 L 23.2 -2.6 L 23.2 -5.2 L 23.2 .0 L 23.2 -2.6 L 14.2 -2.6 L 14.2 -12.8 L 11.3 -12.8 L 26.1 -12.8 L 26.1 -8.4","0 18.7 M 11.2 8.0 L 18.0 8.0 L 14.5 8.0 L 14.5 -2.6 L 23.6 -2.6 L 23.6 .0 L 23.6 -5.2 L 23.6 -2.7 L 14.5 -2.7 L 14.5 -12.9 L 11.4 -12.9 L 25.9 -12.9 L 25.9 -8.4","0 24.5 M 26.0 -2.7 L 32.3 -2.7 L 29.0 -2.7 L 29.0 8.1 L 29.0 4.7 L 27.1 6.3 L 25.1 7.5 L 22.8 8.2 L 20.7 8.2 L 19.0 8.0 L 16.6 7.1 L 14.8 5.4 L 12.9 2.8 L 12.0 -.9 L 11.9 -4.1 L 12.9 -7.6 L 14.9 -10.4 L 17.5 -12.5 L 20.1 -13.2 L 23.0 -13.0 L 25.8 -12.0 L 27.8 -10.6 L 28.8 -9.1 L 28.8 -6.9 L 28.8 -13.0","0 25.0 M 11.3 8.0 L 17.5 8.0 L 14.6 8.0 L 14.6 -12.8 L 11.2 -12.8 L 17.5 -12.8 L 14.6 -12.8 L 14.6 -2.6 L 28.7 -2.6 L 28.7 -12.9 L 25.8 -12.9 L 31.9 -12.9 L 28.8 -12.9 L 28.8 8.0 L 31.9 8.0 L 26.0 8.0","0 10.8 M 11.1 8.0 L 17.7 8.0 L 14.5 8.0 L 14.5 -13.0 L 17.8 -13.0 L 11.3 -13.0","0 16.5 M 10.6 5.5 L 12.0 7.1 L 13.8 8.1 L 15.5 8.2 L 17.3 8.0 L 19.1 7.1 L 20.3 5.7 L 20.6 4.1 L 20.8 2.5 L 20.8 -12.8 L 17.5 -12.8 L 23.9 -12.8","0 22.2 M 11.2 -12.8 L 17.5 -12.8 L 14.4 -12.8 L 14.4 8.0 L 11.3 8.0 L 17.3 8.0 L 14.4 8.0 L 14.4 .5 L 26.9 -12.8 L 29.7 -12.8 L 23.0 -12.8 L 26.9 -12.8 L 18.8 -4.2 L 27.8 8.0 L 30.6 8.0 L 24.3 8.0","0 18.6 M 11.2 -13.0 L 18.3 -13.0 L 14.5 -13.0 L 14.5 7.9 L 11.3 7.9 L 26.2 7.9 L 26.2 3.5","0 31.0 M 11.2 8.0 L 17.4 8.0 L 14.5 8.0 L 14.5 -12.8 L 11.3 -12.8 L 15.2 -12.8 L 24.6 7.8 L 34.2 -12.9 L 37.9 -12.9 L 34.6 -12.9 L 34.6 8.0 L 31.9 8.0 L 37.9 8.0","0 25.2 M 11.3 7.9 L 17.3 7.9 L 14.5 7.9 L 14.5 -12.8 L 11.2 -12.8 L 14.9 -12.8 L 28.5 8.0 L 32.2 8.0 L 29.0 8.0 L 29.0 -12.9 L 26.2 -12.9 L 32.2 -12.9","0 24.9 M 21.8 8.2 L 23.7 8.2 L 26.8 7.0 L 28.8 5.2 L 30.5 2.9 L 31.4 .3 L 31.7 -2.9 L 31.0 -6.5 L 29.9 -8.8 L 28.4 -10.7 L 26.2 -12.1 L 24.1 -12.8 L 21.8 -13.1 L 19.1 -12.8 L 16.3 -11.7 L 14.4 -10.0 L 12.7 -7.4 L 11.9 -4.9 L 11.7 -2.3 L 12.0 .4 L 12.7 2.6 L 13.8 4.3 L 15.4 6.1 L 17.3 7.3 L 19.7 8.0 L 21.8 8.2","0 20.6 M 11.3 8.0 L 18.1 8.0 L 14.6 8.0 L 14.6 -12.8 L 11.4 -12.8 L 22.5 -12.8 L 24.1 -12.5 L 25.7 -11.6 L 26.9 -10.4 L 27.6 -8.6 L 27.6 -6.3 L 27.2 -3.8 L 26.1 -2.0 L 24.4 -1.0 L 22.4 -.7 L 14.7 -.7","0 25.2 M 19.1 7.9 L 16.7 7.1 L 14.4 5.2 L 12.6 2.4 L 12.0 -.3 L 11.7 -3.2 L 12.5 -7.1 L 14.1 -9.9 L 16.9 -12.2 L 20.1 -13.1 L 23.3 -13.1 L 26.3 -12.2 L 28.2 -10.8 L 29.8 -9.1 L 31.0 -6.5 L 31.5 -3.9 L 31.6 -.8 L 30.9 1.9 L 29.5 4.4 L 27.6 6.4 L 25.5 7.6 L 23.3 8.1 L 21.0 8.2 L 19.4 7.9 L 19.1 7.5 L 20.0 5.7 L 21.8 5.0 L 23.1 5.4 L 23.9 6.5 L 24.4 8.7 L 25.1 10.0 L 26.3 10.8 L 27.7 10.6 L 28.8 10.0","0 22.1 M 11.5 7.9 L 17.8 7.9 L 14.6 7.9 L 14.6 -12.8 L 11.5 -12.8 L 22.6 -12.8 L 24.5 -12.4 L 26.0 -11.6 L 27.3 -10.0 L 27.7 -8.2 L 27.6 -6.6 L 27.1 -4.6 L 26.2 -3.5 L 24.9 -2.5 L 23.2 -2.1 L 14.6 -2.1 L 20.3 -2.1 L 27.6 8.0 L 24.1 8.0 L 30.2 8.0","0 21.1 M 12.5 8.0 L 12.5 1.9 L 12.5 4.9 L 13.8 5.9 L 16.1 7.3 L 18.8 8.1 L 21.9 8.2 L 24.5 7.5 L 26.5 6.0 L 27.4 4.2 L 27.6 1.7 L 26.5 -.2 L 24.4 -1.4 L 21.8 -2.2 L 17.7 -3.4 L 14.5 -4.6 L 13.1 -5.8 L 12.3 -7.4 L 12.5 -9.7 L 13.6 -11.5 L 15.3 -12.6 L 17.7 -13.0 L 20.8 -13.0 L 22.9 -12.3 L 24.5 -11.3 L 25.8 -10.3 L 26.8 -9.3 L 26.8 -6.8 L 26.8 -13.0","0 20.0 M 16.1 8.0 L 22.7 8.0 L 19.2 8.0 L 19.2 -12.8 L 11.0 -12.8 L 11.0 -8.1 L 11.0 -12.8 L 27.6 -12.8 L 27.6 -8.1","0 24.7 M 10.7 -12.9 L 16.7 -12.9 L 14.0 -12.9 L 14.0 2.4 L 14.5 4.0 L 15.5 5.5 L 17.0 6.8 L 18.7 7.8 L 20.6 8.2 L 22.8 8.2 L 24.9 7.4 L 26.7 6.2 L 28.1 4.8 L 28.8 3.3 L 29.0 1.8 L 29.0 -12.8 L 26.0 -12.8 L 32.2 -12.8","0 23.3 M 9.9 -12.9 L 15.9 -12.9 L 12.6 -12.9 L 20.8 8.0 L 28.9 -12.8 L 25.8 -12.8 L 32.0 -12.8","0 32.1 M 9.9 -13.0 L 15.8 -13.0 L 12.7 -13.0 L 19.2 8.1 L 25.2 -13.0 L 31.3 8.1 L 38.0 -12.9 L 34.9 -12.9 L 40.6 -12.9","0 21.2 M 10.2 7.9 L 16.3 7.9 L 12.9 7.9 L 26.6 -12.8 L 29.2 -12.8 L 23.1 -12.8 M 10.3 -12.9 L 16.5 -12.9 L 13.4 -12.9 L 27.0 7.9 L 29.5 7.9 L 23.6 7.9","0 20.6 M 16.5 8.0 L 22.7 8.0 L 19.3 8.0 L 19.3 -1.2 L 12.6 -12.8 L 9.9 -12.8 L 15.9 -12.8 L 12.6 -12.8 L 19.3 -1.1 L 26.1 -12.9 L 23.2 -12.9 L 29.1 -12.9","0 20.1 M 12.0 -8.4 L 12.0 -13.0 L 26.9 -13.0 L 11.7 7.9 L 26.4 7.9 L 26.4 3.6","0 10.0 M 17.7 12.8 L 13.3 12.8 L 13.3 -15.1 L 17.5 -15.1","0 16.8 M 10.8 -13.0 L 24.3 8.0","0 9.8 M 10.6 12.7 L 14.8 12.7 L 14.8 -15.1 L 10.7 -15.1","0 15.4 M 10.9 -5.8 L 17.0 -13.9 L 23.2 -5.8","0 22.9 M 15.8 10.3 L 25.4 10.3","0 8.3 M 11.7 -13.5 L 14.8 -9.3","0 18.7 M 12.4 -5.2 L 14.1 -6.5 L 16.4 -7.1 L 19.1 -6.9 L 21.0 -6.3 L 22.6 -4.5 L 23.1 -2.9 L 23.1 4.0 L 21.8 5.7 L 19.6 7.4 L 17.4 8.2 L 14.5 8.0 L 12.3 6.8 L 11.3 5.2 L 11.3 3.4 L 12.2 1.5 L 14.5 .1 L 17.2 -.2 L 23.1 -.2 L 23.1 7.9 L 26.2 7.9","0 19.4 M 9.8 -12.9 L 13.0 -12.9 L 13.0 8.0 L 13.0 3.8 L 14.3 5.3 L 16.0 7.0 L 17.4 7.8 L 19.7 8.3 L 21.8 8.0 L 23.8 6.8 L 25.4 4.6 L 26.1 2.2 L 26.1 -.8 L 25.5 -2.8 L 24.4 -4.6 L 22.6 -5.8 L 20.5 -6.5 L 18.4 -6.6 L 13.1 -6.6","0 17.8 M 24.5 -6.8 L 24.5 -1.7 L 24.5 -3.7 L 22.4 -5.5 L 19.4 -6.8 L 17.1 -6.8 L 15.1 -6.2 L 13.4 -4.9 L 12.2 -2.9 L 11.7 -.6 L 11.7 2.1 L 12.4 4.4 L 14.0 6.7 L 16.3 8.0 L 18.0 8.2 L 19.9 8.2 L 22.7 7.3 L 24.4 5.9","0 20.4 M 21.2 -12.9 L 24.8 -12.9 L 24.8 4.1 L 22.7 6.0 L 20.9 7.5 L 18.5 8.2 L 17.1 8.1 L 14.3 7.1 L 12.5 5.0 L 11.5 2.2 L 11.7 -1.0 L 12.7 -3.7 L 15.1 -5.8 L 17.5 -6.6 L 19.9 -6.7 L 24.8 -6.7 L 24.8 8.0 L 27.8 8.0","0 18.4 M 11.9 .4 L 25.2 .4 L 25.2 -1.8 L 24.5 -3.7 L 23.5 -5.0 L 21.8 -6.3 L 19.6 -6.9 L 17.3 -7.0 L 15.0 -6.1 L 13.1 -4.4 L 12.2 -2.4 L 11.8 -.2 L 11.8 2.2 L 12.3 4.1 L 13.9 6.4 L 15.9 7.7 L 17.5 8.2 L 19.9 8.2 L 22.5 7.4 L 24.5 6.0","0 13.8 M 11.2 7.9 L 17.9 7.9 L 14.3 7.9 L 14.3 -6.7 L 11.2 -6.7 L 20.1 -6.7 L 14.2 -6.7 L 14.2 -8.5 L 14.5 -10.3 L 15.7 -12.1 L 17.3 -13.0 L 19.2 -13.2 L 21.3 -12.5 L 22.7 -11.3","0 19.6 M 14.6 5.9 L 12.6 6.8 L 11.2 8.2 L 10.9 9.9 L 11.1 11.9 L 13.1 13.6 L 15.5 14.1 L 18.3 14.3 L 21.2 14.2 L 23.6 13.5 L 25.1 12.4 L 26.0 11.0 L 26.0 9.0 L 25.1 7.3 L 23.2 6.3 L 20.8 5.7 L 18.9 5.7 L 17.0 5.8 L 15.0 5.9 L 13.5 5.6 L 11.9 5.0 L 11.6 3.9 L 12.2 2.8 L 13.8 1.8 L 15.1 2.5 L 17.3 3.0 L 19.5 3.0 L 21.8 2.4 L 23.9 1.0 L 24.6 -.7 L 24.7 -3.2 L 24.1 -4.7 L 23.2 -5.8 L 24.6 -6.8 L 27.6 -6.8 L 27.6 -3.1 L 27.6 -6.8 L 24.8 -6.8 L 23.2 -5.8 L 21.5 -6.6 L 18.5 -7.0 L 15.7 -6.6 L 12.9 -5.0 L 12.1 -2.7 L 12.2 -.6 L 13.1 1.1 L 13.8 1.9","0 21.0 M 10.9 -12.9 L 13.9 -12.9 L 13.9 7.9 L 10.9 7.9 L 16.7 7.9 L 13.9 7.9 L 13.9 -2.9 L 15.7 -4.8 L 17.4 -6.3 L 19.7 -7.0 L 21.5 -7.0 L 23.4 -6.4 L 24.6 -5.5 L 25.7 -3.9 L 25.9 -1.9 L 25.9 8.0 L 23.1 8.0 L 29.0 8.0","0 9.8 M 11.2 8.0 L 17.8 8.0 L 14.4 8.0 L 14.4 -6.8 L 11.2 -6.8 M 14.2 -9.9 L 15.1 -10.4 L 15.1 -11.2 L 14.5 -11.7 L 13.7 -11.5 L 13.4 -10.7 L 13.6 -10.3 L 14.2 -9.9","0 8.4 M 5.6 12.6 L 6.8 13.6 L 8.3 14.3 L 10.3 14.3 L 11.9 13.6 L 13.2 12.4 L 13.6 9.9 L 13.6 -6.5 L 10.5 -6.5 M 13.6 -9.9 L 14.2 -10.3 L 14.4 -11.2 L 13.9 -11.7 L 12.9 -11.6 L 12.7 -10.7 L 12.8 -10.2 L 13.6 -9.9","0 19.0 M 10.6 -13.0 L 13.9 -13.0 L 13.9 7.9 L 10.7 7.9 L 16.8 7.9 L 14.0 7.9 L 14.0 3.6 L 23.4 -6.7 L 26.1 -6.7 L 19.9 -6.7 L 23.4 -6.7 L 18.0 -.9 L 24.3 8.0 L 27.0 8.0 L 21.0 8.0","0 9.3 M 10.8 8.0 L 17.0 8.0 L 13.8 8.0 L 13.8 -13.0 L 10.8 -13.0","0 30.6 M 11.2 8.0 L 17.2 8.0 L 14.4 8.0 L 14.4 -6.8 L 11.3 -6.8 L 14.3 -6.8 L 14.3 -3.0 L 16.0 -5.0 L 18.2 -6.6 L 20.3 -6.9 L 22.3 -6.6 L 23.4 -5.6 L 24.6 -3.7 L 24.8 -2.0 L 24.8 7.9 L 22.0 7.9 L 27.6 7.9 L 24.9 7.9 L 24.9 -2.2 L 25.3 -3.2 L 26.7 -5.0 L 28.5 -6.5 L 30.4 -6.9 L 32.3 -6.7 L 33.7 -5.9 L 34.9 -4.4 L 35.4 -2.6 L 35.4 -.7 L 35.4 7.9 L 32.5 7.9 L 38.3 7.9","0 21.6 M 11.4 8.0 L 17.1 8.0 L 14.5 8.0 L 14.5 -6.7 L 11.4 -6.7 L 14.4 -6.7 L 14.4 -2.6 L 16.1 -4.8 L 17.6 -6.0 L 19.4 -6.9 L 21.1 -7.0 L 23.0 -6.7 L 24.8 -5.9 L 26.0 -4.4 L 26.4 -3.1 L 26.4 -1.5 L 26.4 7.8 L 23.6 7.8 L 29.7 7.8","0 19.1 M 18.9 8.2 L 21.0 8.0 L 23.3 6.8 L 25.0 4.9 L 25.8 2.5 L 26.0 -.1 L 25.6 -2.3 L 24.4 -4.4 L 22.8 -5.8 L 20.6 -6.8 L 18.9 -7.0 L 16.2 -6.7 L 13.7 -4.9 L 12.2 -2.7 L 11.7 .1 L 11.8 2.8 L 12.9 5.2 L 14.7 7.1 L 17.1 8.1 L 18.9 8.2","0 20.3 M 10.6 14.2 L 17.6 14.2 L 13.6 14.2 L 13.6 -6.7 L 10.8 -6.7 L 13.6 -6.7 L 13.6 -2.9 L 15.6 -4.8 L 18.4 -6.8 L 21.3 -7.1 L 24.1 -6.0 L 26.0 -3.7 L 26.7 -.7 L 26.6 2.2 L 26.0 4.6 L 24.5 6.3 L 22.5 7.4 L 20.6 7.8 L 19.0 8.0 L 13.8 8.0","0 20.0 M 21.2 14.1 L 27.9 14.1 L 24.6 14.1 L 24.6 -6.8 L 24.6 -3.0 L 23.4 -4.4 L 21.8 -5.7 L 19.8 -6.7 L 17.7 -7.1 L 15.7 -6.6 L 13.6 -5.2 L 12.4 -3.4 L 11.8 -1.6 L 11.6 .5 L 11.8 2.6 L 12.5 4.5 L 14.2 6.4 L 16.6 7.6 L 19.4 7.9 L 24.6 7.9","0 16.6 M 18.0 8.0 L 11.0 8.0 L 14.2 8.0 L 14.2 -6.7 L 11.3 -6.7 L 14.2 -6.7 L 14.2 -2.1 L 15.6 -3.7 L 16.9 -5.0 L 18.5 -6.0 L 19.9 -6.7 L 21.6 -6.9 L 24.0 -6.9 L 24.0 -3.0","0 17.9 M 12.0 8.0 L 12.0 2.8 L 12.0 5.0 L 13.3 6.2 L 14.8 7.3 L 16.8 8.1 L 18.7 8.3 L 21.1 8.0 L 23.2 7.1 L 24.3 5.8 L 24.6 4.4 L 24.3 2.8 L 22.9 1.7 L 21.2 1.1 L 18.2 .6 L 15.4 .1 L 13.6 -.6 L 12.4 -1.6 L 12.0 -2.8 L 12.0 -4.1 L 12.7 -5.4 L 14.5 -6.6 L 16.2 -6.9 L 18.8 -6.9 L 20.5 -6.4 L 21.8 -5.6 L 23.0 -4.5 L 23.9 -3.7 L 23.9 -1.6 L 23.9 -6.7","0 12.9 M 13.6 -12.9 L 13.6 -6.7 L 10.6 -6.7 L 19.7 -6.7 L 13.6 -6.7 L 13.6 4.4 L 14.0 6.0 L 14.8 7.2 L 16.1 8.0 L 17.4 8.2 L 19.0 8.0 L 20.6 7.3 L 21.5 6.5","0 21.1 M 10.3 -6.7 L 13.7 -6.7 L 13.7 3.6 L 13.8 4.9 L 14.6 6.2 L 15.5 7.2 L 16.8 8.0 L 18.7 8.3 L 20.6 8.0 L 22.7 7.2 L 24.2 5.7 L 25.6 4.0 L 25.6 8.0 L 28.8 8.0 L 25.6 8.0 L 25.6 -6.8 L 22.4 -6.8","0 20.0 M 9.8 -6.7 L 16.1 -6.7 L 12.9 -6.7 L 19.2 8.1 L 25.7 -6.7 L 28.3 -6.7 L 22.5 -6.7","0 27.7 M 10.0 -6.7 L 16.1 -6.7 L 13.0 -6.7 L 18.3 8.0 L 23.1 -6.7 L 27.9 8.1 L 33.2 -6.8 L 36.2 -6.8 L 30.0 -6.8","0 18.7 M 10.6 8.0 L 16.8 8.0 L 13.3 8.0 L 23.9 -6.7 L 26.2 -6.7 L 20.3 -6.7 M 16.9 -6.7 L 10.8 -6.7 L 13.4 -6.7 L 23.9 8.0 L 26.4 8.0 L 20.4 8.0","0 20.2 M 11.0 12.7 L 11.9 13.5 L 13.1 14.4 L 14.3 14.4 L 15.6 14.4 L 17.0 13.6 L 18.3 12.0 L 19.5 9.2 L 25.7 -6.6 L 28.3 -6.6 L 22.5 -6.6 M 10.2 -6.7 L 15.9 -6.7 L 13.0 -6.7 L 19.9 8.0","0 17.5 M 11.7 -2.7 L 11.7 -6.6 L 24.1 -6.6 L 11.3 8.0 L 24.1 8.0 L 24.1 4.0","0 10.9 M 18.6 12.7 L 16.5 12.7 L 15.7 12.2 L 15.0 11.4 L 14.5 10.5 L 14.3 9.3 L 14.3 1.2 L 13.7 -.1 L 12.7 -.8 L 11.9 -1.2 L 10.6 -1.2 L 12.0 -1.2 L 13.3 -2.0 L 14.1 -2.8 L 14.4 -3.9 L 14.4 -12.9 L 14.8 -13.7 L 15.8 -14.8 L 17.0 -15.3 L 18.6 -15.3","0 8.8 M 13.5 14.4 L 13.5 -12.9","0 10.7 M 10.6 12.8 L 12.2 12.8 L 13.4 12.4 L 14.1 11.6 L 14.7 10.8 L 14.7 9.6 L 14.7 1.4 L 15.2 .2 L 16.2 -.8 L 17.3 -1.2 L 18.4 -1.2 L 17.3 -1.2 L 16.0 -1.8 L 15.2 -2.8 L 14.8 -3.8 L 14.8 -5.1 L 14.8 -12.9 L 14.3 -13.9 L 13.6 -14.6 L 12.4 -15.2 L 10.9 -15.2","0 17.3 M 12.7 -.2 L 12.8 -1.3 L 13.5 -2.5 L 14.6 -3.0 L 15.9 -2.9 L 17.2 -2.3 L 18.2 -1.2 L 19.4 -.3 L 21.0 .1 L 22.4 -.5 L 23.0 -1.3 L 23.1 -2.6","0 14.7 M 16.4 -3.4 L 17.7 -3.4 L 19.0 -4.2 L 20.0 -5.0 L 20.7 -6.0 L 21.2 -7.2 L 21.2 -8.6 L 21.0 -9.8 L 20.4 -11.1 L 19.2 -12.2 L 17.8 -12.9 L 16.5 -13.0 L 14.8 -12.7 L 13.2 -11.7 L 12.2 -10.1 L 11.9 -8.4 L 12.0 -6.9 L 12.8 -5.3 L 14.0 -4.1 L 15.2 -3.6 L 16.4 -3.4"]
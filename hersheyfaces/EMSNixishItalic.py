@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.2 M 16.7 -12.9 L 14.0 2.6 M 13.4 6.0 L 12.5 6.5 L 12.0 7.5 L 12.4 8.1 L 13.0 8.3 L 13.6 8.2 L 14.2 7.5 L 14.4 6.6 L 14.1 6.2 L 13.4 6.0","0 10.7 M 15.6 -13.0 L 14.5 -6.7 M 19.7 -12.9 L 18.6 -6.7","0 24.2 M 14.0 7.9 L 22.7 -12.8 M 31.2 -13.0 L 22.4 7.9 M 29.9 2.0 L 11.5 2.0 M 15.2 -6.8 L 33.8 -6.8","0 20.2 M 11.4 7.9 L 12.5 1.9 L 12.0 4.7 L 13.3 5.9 L 14.9 7.1 L 17.0 8.0 L 19.3 8.2 L 21.8 8.0 L 23.9 7.3 L 25.9 5.9 L 27.0 4.3 L 27.5 2.7 L 27.7 1.4 L 26.8 -.1 L 24.8 -1.4 L 22.6 -2.1 L 20.5 -2.7 L 18.4 -3.3 L 16.7 -4.0 L 15.2 -4.9 L 14.3 -6.5 L 14.2 -8.1 L 15.0 -10.1 L 16.8 -12.0 L 19.1 -12.9 L 21.0 -13.1 L 23.7 -13.0 L 25.6 -12.3 L 27.0 -11.4 L 28.1 -10.4 L 28.9 -9.5 L 28.4 -6.7 L 29.5 -12.9 M 22.7 -15.3 L 18.2 10.3","0 25.2 M 17.2 -3.5 L 18.4 -3.5 L 19.9 -4.3 L 21.1 -5.1 L 21.9 -6.1 L 22.6 -7.3 L 22.9 -8.7 L 22.9 -9.9 L 22.5 -11.2 L 21.5 -12.3 L 20.3 -13.0 L 19.0 -13.1 L 17.2 -12.8 L 15.4 -11.8 L 14.2 -10.2 L 13.5 -8.5 L 13.4 -6.9 L 13.9 -5.4 L 14.9 -4.1 L 15.9 -3.7 L 17.2 -3.5 M 26.8 8.3 L 28.1 8.3 L 29.5 7.5 L 30.7 6.7 L 31.6 5.7 L 32.2 4.5 L 32.5 3.1 L 32.5 1.9 L 32.1 .6 L 31.2 -.4 L 29.9 -1.1 L 28.6 -1.3 L 26.8 -1.0 L 25.0 .0 L 23.8 1.6 L 23.2 3.3 L 23.0 4.9 L 23.5 6.4 L 24.5 7.7 L 25.6 8.1 L 26.8 8.3 M 14.2 7.9 L 31.5 -12.9","0 22.4 M 27.8 -10.4 L 26.5 -11.8 L 24.9 -13.0 L 23.6 -13.1 L 22.1 -13.1 L 20.1 -12.6 L 18.4 -11.3 L 17.5 -9.6 L 17.2 -7.6 L 18.0 -5.7 L 27.7 8.0 L 29.9 8.0 M 19.8 -2.9 L 17.5 -2.4 L 14.9 -1.4 L 12.6 .7 L 11.8 2.5 L 11.6 4.6 L 12.2 6.6 L 14.0 8.2 L 16.5 8.7 L 19.1 8.2 L 21.8 6.8 L 23.8 5.2 L 25.8 3.0 L 30.0 -2.0","0 6.6 M 15.6 -12.9 L 14.4 -6.3","0 9.4 M 14.9 12.8 L 13.5 10.1 L 12.8 7.0 L 12.6 3.6 L 13.2 -1.0 L 14.2 -5.4 L 15.8 -9.5 L 17.6 -12.6 L 19.8 -15.3","0 9.3 M 10.1 12.9 L 12.4 10.1 L 14.2 7.1 L 15.6 3.7 L 16.6 -.9 L 17.2 -5.4 L 17.0 -9.5 L 16.4 -12.5 L 15.1 -15.2","0 14.8 M 18.0 -3.6 L 19.6 -12.9 M 14.9 -10.8 L 22.8 -5.7 M 13.9 -5.7 L 23.6 -10.8","0 16.2 M 17.0 4.8 L 19.2 -7.4 M 12.2 -1.5 L 24.4 -1.5","0 8.3 M 13.5 8.2 L 12.8 8.3 L 12.2 8.1 L 11.9 7.5 L 12.4 6.5 L 13.3 6.0 L 14.0 6.2 L 14.3 6.6 L 14.1 7.5 L 13.9 8.7 L 13.5 9.8 L 13.0 10.5 L 12.4 11.2 L 11.3 11.9","0 18.5 M 13.4 -1.5 L 25.8 -1.5","0 8.3 M 13.0 6.0 L 12.1 6.5 L 11.6 7.5 L 12.0 8.1 L 12.6 8.3 L 13.2 8.2 L 13.9 7.5 L 14.0 6.6 L 13.7 6.2 L 13.0 6.0","0 16.8 M 10.3 7.9 L 27.5 -12.9","0 21.0 M 19.0 8.2 L 21.0 8.0 L 23.5 6.8 L 25.4 5.1 L 27.0 2.8 L 28.0 .9 L 28.5 -1.2 L 28.9 -3.4 L 29.1 -5.4 L 29.3 -6.8 L 28.7 -8.8 L 27.6 -10.7 L 25.9 -12.3 L 24.0 -13.1 L 22.3 -13.1 L 19.7 -12.5 L 17.4 -10.9 L 15.5 -8.7 L 14.2 -6.4 L 13.5 -3.8 L 13.0 -.8 L 12.9 1.5 L 13.1 3.4 L 14.0 5.4 L 15.1 6.8 L 16.9 8.0 L 19.0 8.2","0 11.6 M 11.9 8.0 L 18.3 8.0 L 15.1 8.0 L 18.8 -13.0 L 13.4 -9.0","0 19.2 M 14.3 -10.1 L 16.0 -11.5 L 18.2 -12.5 L 20.4 -13.1 L 22.6 -13.1 L 24.5 -12.8 L 26.1 -12.0 L 27.3 -10.7 L 28.0 -8.4 L 27.6 -6.7 L 26.6 -5.1 L 24.3 -3.0 L 21.1 -1.3 L 17.9 .2 L 15.4 1.7 L 13.6 2.9 L 12.1 4.7 L 11.6 5.9 L 11.3 8.0 L 25.0 8.0 L 25.8 3.5","0 19.3 M 11.7 5.2 L 13.0 6.6 L 14.9 7.7 L 16.9 8.2 L 18.6 8.2 L 20.8 7.9 L 23.0 7.0 L 24.6 5.7 L 25.7 4.0 L 26.3 1.8 L 26.1 -.2 L 24.9 -1.8 L 23.3 -2.5 L 21.2 -2.9 L 18.0 -2.9 L 21.9 -2.9 L 23.6 -3.4 L 25.3 -4.4 L 26.7 -5.9 L 27.3 -7.7 L 27.4 -9.3 L 26.8 -11.1 L 25.8 -12.2 L 24.0 -12.9 L 22.0 -13.0 L 19.9 -12.9 L 17.3 -12.0 L 14.8 -10.5","0 18.8 M 19.7 -13.6 L 19.3 -11.6 L 18.5 -9.2 L 17.8 -7.2 L 16.7 -5.0 L 15.3 -2.9 L 13.7 -.6 L 11.0 2.6 L 27.0 2.6 L 23.7 2.6 L 22.7 8.2 L 25.4 -7.1","0 18.5 M 11.4 8.9 L 13.6 8.7 L 16.5 8.4 L 19.4 7.6 L 22.0 6.4 L 24.2 4.7 L 25.6 2.9 L 26.0 .9 L 26.2 -.8 L 25.7 -2.5 L 24.8 -3.7 L 23.0 -4.6 L 20.5 -5.1 L 17.5 -4.8 L 15.2 -4.0 L 13.6 -3.1 L 15.3 -12.8 L 27.6 -12.8","0 19.3 M 14.3 -5.3 L 22.2 -5.3 L 24.1 -4.6 L 25.6 -3.6 L 26.8 -2.0 L 27.1 -.4 L 26.9 1.7 L 26.3 3.8 L 24.7 5.7 L 23.1 7.1 L 20.9 8.1 L 18.4 8.2 L 16.5 7.9 L 14.7 6.8 L 13.1 4.9 L 12.4 2.2 L 12.7 -.4 L 13.3 -3.3 L 14.0 -4.9 L 15.2 -7.2 L 17.0 -9.5 L 19.5 -11.4 L 22.1 -12.9 L 24.7 -13.8 L 27.2 -13.7","0 15.3 M 12.4 -8.4 L 13.2 -12.8 L 26.6 -12.8 L 23.5 -8.6 L 21.0 -5.2 L 18.9 -1.6 L 17.4 .9 L 16.5 3.0 L 15.7 5.1 L 15.1 7.9","0 20.6 M 18.8 8.2 L 21.4 8.0 L 24.2 7.1 L 26.5 5.4 L 27.5 3.5 L 27.6 1.7 L 26.9 .2 L 25.6 -.9 L 24.0 -1.6 L 21.2 -2.7 L 18.7 -3.6 L 16.5 -4.7 L 15.4 -6.1 L 15.0 -8.2 L 15.6 -10.1 L 17.6 -12.0 L 20.2 -12.9 L 22.7 -13.2 L 24.6 -13.0 L 27.1 -12.2 L 28.5 -10.6 L 28.8 -8.9 L 28.4 -7.0 L 26.8 -5.2 L 24.6 -4.1 L 21.9 -3.2 L 18.2 -2.0 L 15.6 -1.0 L 13.7 .3 L 12.6 1.5 L 12.0 4.0 L 12.6 5.8 L 13.8 7.1 L 15.6 7.9 L 17.5 8.2 L 18.8 8.2","0 19.2 M 13.0 8.9 L 15.1 8.8 L 17.5 8.0 L 19.7 7.0 L 21.8 5.7 L 23.7 3.6 L 25.4 1.4 L 26.4 -1.1 L 27.3 -3.6 L 27.6 -5.9 L 27.5 -8.5 L 26.3 -10.8 L 24.5 -12.5 L 22.8 -13.1 L 20.7 -13.1 L 18.2 -12.6 L 15.8 -11.1 L 14.4 -9.6 L 13.5 -7.4 L 13.0 -5.3 L 13.3 -2.9 L 14.1 -1.6 L 15.2 -.6 L 17.3 .3 L 19.5 .5 L 25.8 .5","0 8.8 M 15.6 -6.9 L 14.7 -6.5 L 14.2 -5.5 L 14.5 -4.8 L 15.1 -4.6 L 15.8 -4.8 L 16.4 -5.4 L 16.5 -6.3 L 16.2 -6.7 L 15.6 -6.9 M 13.3 5.9 L 12.4 6.4 L 11.9 7.4 L 12.2 8.0 L 12.9 8.2 L 13.5 8.1 L 14.1 7.4 L 14.3 6.5 L 14.0 6.1 L 13.3 5.9","0 8.5 M 15.7 -6.9 L 14.8 -6.5 L 14.3 -5.5 L 14.6 -4.9 L 15.2 -4.7 L 15.9 -4.8 L 16.5 -5.5 L 16.6 -6.4 L 16.3 -6.7 L 15.7 -6.9 M 13.5 8.1 L 12.9 8.2 L 12.2 8.0 L 11.9 7.4 L 12.4 6.4 L 13.3 6.0 L 14.0 6.2 L 14.3 6.6 L 14.1 7.5 L 13.9 8.7 L 13.5 9.7 L 13.0 10.4 L 12.4 11.1 L 11.3 11.9","0 16.3 M 24.8 -6.2 L 11.9 .5 L 22.4 7.3","0 18.6 M 13.9 -4.7 L 26.5 -4.7 M 12.7 1.6 L 25.3 1.6","0 16.3 M 11.2 7.6 L 24.3 .8 L 13.6 -6.1","0 17.7 M 17.6 6.0 L 16.7 6.4 L 16.2 7.4 L 16.6 8.0 L 17.2 8.2 L 17.8 8.1 L 18.4 7.5 L 18.6 6.6 L 18.3 6.2 L 17.6 6.0 M 18.2 2.7 L 18.4 1.3 L 19.1 .2 L 20.1 -.8 L 21.9 -2.0 L 23.6 -3.2 L 24.9 -4.4 L 26.1 -5.7 L 26.6 -6.9 L 26.7 -8.5 L 26.3 -10.3 L 25.3 -11.8 L 23.9 -12.7 L 22.1 -13.2 L 20.1 -13.1 L 18.5 -12.8 L 17.0 -12.3 L 15.5 -11.4 L 14.2 -10.1 L 13.6 -8.8 L 13.2 -7.3","0 29.4 M 31.3 -6.4 L 29.4 4.4 L 27.4 6.4 L 24.7 7.9 L 21.6 8.2 L 19.0 6.8 L 17.9 4.9 L 17.7 1.8 L 18.3 -1.8 L 20.6 -4.9 L 23.2 -6.6 L 25.5 -7.1 L 28.1 -6.3 L 29.5 -4.7 L 30.3 -3.5 L 30.6 -2.1 L 29.2 5.8 L 29.9 7.5 L 31.5 8.3 L 33.3 7.9 L 35.0 6.2 L 36.1 4.5 L 37.0 2.1 L 37.6 -1.5 L 37.5 -3.9 L 37.0 -6.5 L 35.8 -8.8 L 34.4 -10.4 L 32.7 -11.8 L 30.7 -12.7 L 28.9 -13.0 L 26.8 -13.2 L 24.3 -12.8 L 21.7 -12.0 L 18.7 -10.2 L 16.6 -8.3 L 14.6 -5.7 L 13.4 -3.1 L 12.6 -.3 L 12.2 2.9 L 12.5 6.0 L 13.4 8.4 L 14.6 10.3 L 16.9 12.2 L 19.8 13.6 L 22.4 13.7 L 25.5 13.6 L 28.0 12.9 L 29.6 12.0 L 30.9 11.0","0 23.1 M 9.1 7.9 L 15.1 7.9 L 11.9 7.9 L 23.8 -13.0 L 26.8 .3 L 16.2 .3 L 26.8 .3 L 28.5 8.0 L 25.3 8.0 L 31.4 8.0","0 21.0 M 14.1 -12.9 L 24.7 -12.9 L 26.3 -12.4 L 27.5 -11.5 L 28.3 -10.0 L 28.2 -8.5 L 28.0 -6.9 L 27.2 -5.6 L 26.1 -4.5 L 25.0 -3.6 L 23.7 -3.1 L 22.6 -2.8 L 15.8 -2.8 L 22.8 -2.8 L 24.0 -2.8 L 25.7 -2.5 L 27.2 -1.6 L 27.9 -.1 L 28.1 1.6 L 27.7 3.5 L 27.0 5.1 L 25.7 6.6 L 24.2 7.5 L 22.7 7.8 L 21.7 8.0 L 10.9 8.0 L 13.8 8.0 L 17.4 -12.8","0 22.2 M 32.0 -13.1 L 30.9 -6.8 L 31.4 -9.8 L 29.7 -11.0 L 28.2 -12.1 L 26.6 -12.9 L 24.5 -13.1 L 22.5 -13.0 L 20.2 -12.3 L 17.7 -10.9 L 15.6 -8.6 L 14.1 -6.2 L 13.3 -3.7 L 12.8 -.5 L 13.1 2.2 L 13.9 4.6 L 15.9 6.8 L 18.7 8.0 L 23.2 8.1 L 25.7 7.4 L 27.5 6.4 L 28.8 5.3","0 23.5 M 10.6 7.9 L 20.6 7.9 L 23.1 7.3 L 25.4 6.2 L 27.9 4.1 L 29.6 2.0 L 30.8 -.4 L 31.4 -3.9 L 31.3 -6.5 L 30.3 -9.1 L 29.0 -10.9 L 26.8 -12.3 L 24.5 -13.0 L 14.3 -13.0 L 17.5 -13.0 L 13.8 7.8","0 19.7 M 26.5 3.3 L 25.7 7.9 L 10.4 7.9 L 13.7 7.9 L 15.5 -2.6 L 24.5 -2.6 L 24.9 -5.2 L 24.0 .0 L 24.5 -2.6 L 15.5 -2.6 L 17.3 -12.8 L 14.4 -12.8 L 29.1 -12.8 L 28.4 -8.4","0 18.7 M 10.6 8.0 L 17.3 8.0 L 13.9 8.0 L 15.8 -2.6 L 24.9 -2.6 L 24.4 .0 L 25.3 -5.2 L 24.9 -2.7 L 15.7 -2.7 L 17.5 -12.9 L 14.4 -12.9 L 28.9 -12.9 L 28.2 -8.4","0 24.5 M 27.2 -2.7 L 33.5 -2.7 L 30.2 -2.7 L 28.3 8.1 L 28.9 4.7 L 26.8 6.3 L 24.6 7.5 L 22.1 8.2 L 20.1 8.2 L 18.4 8.0 L 16.1 7.1 L 14.7 5.4 L 13.2 2.8 L 13.0 -.9 L 13.4 -4.1 L 15.1 -7.6 L 17.5 -10.4 L 20.5 -12.5 L 23.3 -13.2 L 26.1 -13.0 L 28.7 -12.0 L 30.5 -10.6 L 31.2 -9.1 L 30.8 -6.9 L 31.9 -13.0","0 25.0 M 10.7 8.0 L 16.9 8.0 L 14.0 8.0 L 17.7 -12.8 L 14.3 -12.8 L 20.5 -12.8 L 17.7 -12.8 L 15.9 -2.6 L 30.0 -2.6 L 31.8 -12.9 L 28.9 -12.9 L 34.9 -12.9 L 31.8 -12.9 L 28.1 8.0 L 31.3 8.0 L 25.3 8.0","0 10.8 M 10.5 8.0 L 17.1 8.0 L 13.9 8.0 L 17.6 -13.0 L 20.9 -13.0 L 14.4 -13.0","0 16.5 M 10.4 5.5 L 11.5 7.1 L 13.2 8.1 L 14.8 8.2 L 16.7 8.0 L 18.6 7.1 L 20.1 5.7 L 20.7 4.1 L 21.2 2.5 L 23.9 -12.8 L 20.6 -12.8 L 27.0 -12.8","0 22.2 M 14.2 -12.8 L 20.6 -12.8 L 17.5 -12.8 L 13.8 8.0 L 10.7 8.0 L 16.7 8.0 L 13.8 8.0 L 15.1 .5 L 29.9 -12.8 L 32.8 -12.8 L 26.1 -12.8 L 29.9 -12.8 L 20.4 -4.2 L 27.2 8.0 L 30.0 8.0 L 23.7 8.0","0 18.6 M 14.2 -13.0 L 21.4 -13.0 L 17.6 -13.0 L 13.9 7.9 L 10.7 7.9 L 25.6 7.9 L 26.4 3.5","0 31.0 M 10.6 8.0 L 16.8 8.0 L 13.9 8.0 L 17.6 -12.8 L 14.4 -12.8 L 18.2 -12.8 L 24.0 7.8 L 37.3 -12.9 L 41.0 -12.9 L 37.7 -12.9 L 34.0 8.0 L 31.3 8.0 L 37.2 8.0","0 25.2 M 10.7 7.9 L 16.8 7.9 L 13.9 7.9 L 17.6 -12.8 L 14.3 -12.8 L 17.9 -12.8 L 27.9 8.0 L 31.6 8.0 L 28.4 8.0 L 32.1 -12.9 L 29.2 -12.9 L 35.3 -12.9","0 24.9 M 21.1 8.2 L 23.1 8.2 L 26.4 7.0 L 28.7 5.2 L 30.8 2.9 L 32.1 .3 L 33.0 -2.9 L 32.9 -6.5 L 32.2 -8.8 L 31.1 -10.7 L 29.2 -12.1 L 27.2 -12.8 L 24.9 -13.1 L 22.2 -12.8 L 19.2 -11.7 L 16.9 -10.0 L 14.7 -7.4 L 13.6 -4.9 L 12.9 -2.3 L 12.8 .4 L 13.1 2.6 L 13.8 4.3 L 15.1 6.1 L 16.9 7.3 L 19.1 8.0 L 21.1 8.2","0 20.6 M 10.7 8.0 L 17.5 8.0 L 14.0 8.0 L 17.6 -12.8 L 14.5 -12.8 L 25.6 -12.8 L 27.1 -12.5 L 28.6 -11.6 L 29.6 -10.4 L 29.9 -8.6 L 29.5 -6.3 L 28.7 -3.8 L 27.2 -2.0 L 25.4 -1.0 L 23.3 -.7 L 15.6 -.7","0 25.2 M 18.5 7.9 L 16.2 7.1 L 14.3 5.2 L 12.9 2.4 L 12.8 -.3 L 13.1 -3.2 L 14.5 -7.1 L 16.6 -9.9 L 19.9 -12.2 L 23.2 -13.1 L 26.4 -13.1 L 29.2 -12.2 L 30.9 -10.8 L 32.2 -9.1 L 32.9 -6.5 L 33.0 -3.9 L 32.5 -.8 L 31.3 1.9 L 29.5 4.4 L 27.3 6.4 L 24.9 7.6 L 22.7 8.1 L 20.3 8.2 L 18.8 7.9 L 18.5 7.5 L 19.8 5.7 L 21.7 5.0 L 22.9 5.4 L 23.5 6.5 L 23.7 8.7 L 24.1 10.0 L 25.2 10.8 L 26.6 10.6 L 27.8 10.0","0 22.1 M 10.9 7.9 L 17.2 7.9 L 14.0 7.9 L 17.6 -12.8 L 14.6 -12.8 L 25.6 -12.8 L 27.5 -12.4 L 28.8 -11.6 L 29.9 -10.0 L 30.0 -8.2 L 29.6 -6.6 L 28.7 -4.6 L 27.6 -3.5 L 26.1 -2.5 L 24.3 -2.1 L 15.7 -2.1 L 21.4 -2.1 L 26.9 8.0 L 23.4 8.0 L 29.6 8.0","0 21.1 M 11.9 8.0 L 12.9 1.9 L 12.4 4.9 L 13.6 5.9 L 15.6 7.3 L 18.1 8.1 L 21.3 8.2 L 23.9 7.5 L 26.2 6.0 L 27.5 4.2 L 28.1 1.7 L 27.3 -.2 L 25.4 -1.4 L 23.0 -2.2 L 19.1 -3.4 L 16.1 -4.6 L 14.9 -5.8 L 14.4 -7.4 L 15.0 -9.7 L 16.4 -11.5 L 18.3 -12.6 L 20.8 -13.0 L 23.9 -13.0 L 25.8 -12.3 L 27.3 -11.3 L 28.4 -10.3 L 29.2 -9.3 L 28.8 -6.8 L 29.9 -13.0","0 20.0 M 15.5 8.0 L 22.0 8.0 L 18.6 8.0 L 22.2 -12.8 L 14.0 -12.8 L 13.2 -8.1 L 14.0 -12.8 L 30.6 -12.8 L 29.8 -8.1","0 24.7 M 13.7 -12.9 L 19.8 -12.9 L 17.0 -12.9 L 14.3 2.4 L 14.6 4.0 L 15.4 5.5 L 16.6 6.8 L 18.1 7.8 L 19.9 8.2 L 22.2 8.2 L 24.4 7.4 L 26.4 6.2 L 28.0 4.8 L 29.0 3.3 L 29.4 1.8 L 32.0 -12.8 L 29.1 -12.8 L 35.3 -12.8","0 23.3 M 12.9 -12.9 L 19.0 -12.9 L 15.7 -12.9 L 20.2 8.0 L 32.0 -12.8 L 28.9 -12.8 L 35.0 -12.8","0 32.1 M 12.9 -13.0 L 18.9 -13.0 L 15.8 -13.0 L 18.6 8.1 L 28.2 -13.0 L 30.7 8.1 L 41.0 -12.9 L 38.0 -12.9 L 43.7 -12.9","0 21.2 M 9.6 7.9 L 15.7 7.9 L 12.3 7.9 L 29.6 -12.8 L 32.2 -12.8 L 26.2 -12.8 M 13.4 -12.9 L 19.6 -12.9 L 16.4 -12.9 L 26.4 7.9 L 28.9 7.9 L 23.1 7.9","0 20.6 M 15.9 8.0 L 22.0 8.0 L 18.7 8.0 L 20.3 -1.2 L 15.7 -12.8 L 12.9 -12.8 L 18.9 -12.8 L 15.6 -12.8 L 20.3 -1.1 L 29.1 -12.9 L 26.3 -12.9 L 32.2 -12.9","0 20.1 M 14.3 -8.4 L 15.1 -13.0 L 30.0 -13.0 L 11.1 7.9 L 25.8 7.9 L 26.6 3.6","0 10.0 M 16.2 12.8 L 11.9 12.8 L 16.8 -15.1 L 21.0 -15.1","0 16.8 M 13.8 -13.0 L 23.7 8.0","0 9.8 M 9.1 12.7 L 13.3 12.7 L 18.2 -15.1 L 14.2 -15.1","0 15.4 M 12.7 -5.8 L 20.3 -13.9 L 25.0 -5.8","0 22.9 M 14.8 10.3 L 24.3 10.3","0 8.3 M 14.9 -13.5 L 17.2 -9.3","0 18.7 M 14.1 -5.2 L 16.0 -6.5 L 18.5 -7.1 L 21.1 -6.9 L 22.9 -6.3 L 24.2 -4.5 L 24.4 -2.9 L 23.2 4.0 L 21.5 5.7 L 19.1 7.4 L 16.8 8.2 L 13.9 8.0 L 11.9 6.8 L 11.2 5.2 L 11.5 3.4 L 12.7 1.5 L 15.3 .1 L 18.1 -.2 L 23.9 -.2 L 22.5 7.9 L 25.6 7.9","0 19.4 M 12.9 -12.9 L 16.1 -12.9 L 12.4 8.0 L 13.1 3.8 L 14.1 5.3 L 15.6 7.0 L 16.8 7.8 L 19.0 8.3 L 21.2 8.0 L 23.4 6.8 L 25.4 4.6 L 26.5 2.2 L 27.0 -.8 L 26.8 -2.8 L 26.0 -4.6 L 24.4 -5.8 L 22.4 -6.5 L 20.3 -6.6 L 15.0 -6.6","0 17.8 M 26.5 -6.8 L 25.6 -1.7 L 25.9 -3.7 L 24.1 -5.5 L 21.4 -6.8 L 19.1 -6.8 L 17.0 -6.2 L 15.1 -4.9 L 13.5 -2.9 L 12.6 -.6 L 12.1 2.1 L 12.4 4.4 L 13.6 6.7 L 15.7 8.0 L 17.4 8.2 L 19.3 8.2 L 22.3 7.3 L 24.2 5.9","0 20.4 M 24.2 -12.9 L 27.9 -12.9 L 24.9 4.1 L 22.5 6.0 L 20.4 7.5 L 17.9 8.2 L 16.4 8.1 L 13.8 7.1 L 12.4 5.0 L 12.0 2.2 L 12.6 -1.0 L 14.2 -3.7 L 16.9 -5.8 L 19.4 -6.6 L 21.8 -6.7 L 26.8 -6.7 L 24.2 8.0 L 27.2 8.0","0 18.4 M 12.6 .4 L 25.9 .4 L 26.3 -1.8 L 26.0 -3.7 L 25.2 -5.0 L 23.7 -6.3 L 21.6 -6.9 L 19.3 -7.0 L 16.9 -6.1 L 14.7 -4.4 L 13.4 -2.4 L 12.7 -.2 L 12.2 2.2 L 12.4 4.1 L 13.6 6.4 L 15.3 7.7 L 16.8 8.2 L 19.3 8.2 L 22.0 7.4 L 24.3 6.0","0 13.8 M 10.6 7.9 L 17.3 7.9 L 13.7 7.9 L 16.2 -6.7 L 13.2 -6.7 L 22.0 -6.7 L 16.2 -6.7 L 16.5 -8.5 L 17.2 -10.3 L 18.6 -12.1 L 20.4 -13.0 L 22.4 -13.2 L 24.3 -12.5 L 25.5 -11.3","0 19.6 M 14.4 5.9 L 12.2 6.8 L 10.6 8.2 L 9.9 9.9 L 9.8 11.9 L 11.5 13.6 L 13.8 14.1 L 16.6 14.3 L 19.5 14.2 L 22.0 13.5 L 23.7 12.4 L 24.8 11.0 L 25.2 9.0 L 24.6 7.3 L 22.9 6.3 L 20.6 5.7 L 18.7 5.7 L 16.7 5.8 L 14.8 5.9 L 13.3 5.6 L 11.8 5.0 L 11.7 3.9 L 12.5 2.8 L 14.2 1.8 L 15.5 2.5 L 17.5 3.0 L 19.8 3.0 L 22.2 2.4 L 24.5 1.0 L 25.5 -.7 L 26.0 -3.2 L 25.7 -4.7 L 25.0 -5.8 L 26.6 -6.8 L 29.6 -6.8 L 28.9 -3.1 L 29.6 -6.8 L 26.8 -6.8 L 25.0 -5.8 L 23.4 -6.6 L 20.6 -7.0 L 17.7 -6.6 L 14.5 -5.0 L 13.3 -2.7 L 13.1 -.6 L 13.7 1.1 L 14.3 1.9","0 21.0 M 13.9 -12.9 L 17.0 -12.9 L 13.3 7.9 L 10.3 7.9 L 16.1 7.9 L 13.3 7.9 L 15.2 -2.9 L 17.3 -4.8 L 19.3 -6.3 L 21.7 -7.0 L 23.5 -7.0 L 25.3 -6.4 L 26.4 -5.5 L 27.2 -3.9 L 27.0 -1.9 L 25.3 8.0 L 22.5 8.0 L 28.3 8.0","0 9.8 M 10.6 8.0 L 17.2 8.0 L 13.8 8.0 L 16.4 -6.8 L 13.2 -6.8 M 16.8 -9.9 L 17.7 -10.4 L 17.9 -11.2 L 17.4 -11.7 L 16.5 -11.5 L 16.1 -10.7 L 16.2 -10.3 L 16.8 -9.9","0 8.4 M 4.2 12.6 L 5.2 13.6 L 6.6 14.3 L 8.5 14.3 L 10.3 13.6 L 11.8 12.4 L 12.7 9.9 L 15.6 -6.5 L 12.5 -6.5 M 16.1 -9.9 L 16.8 -10.3 L 17.2 -11.2 L 16.7 -11.7 L 15.8 -11.6 L 15.3 -10.7 L 15.4 -10.2 L 16.1 -9.9","0 19.0 M 13.7 -13.0 L 17.0 -13.0 L 13.3 7.9 L 10.1 7.9 L 16.2 7.9 L 13.4 7.9 L 14.1 3.6 L 25.3 -6.7 L 28.0 -6.7 L 21.8 -6.7 L 25.3 -6.7 L 18.9 -.9 L 23.7 8.0 L 26.4 8.0 L 20.4 8.0","0 9.3 M 10.2 8.0 L 16.4 8.0 L 13.2 8.0 L 16.8 -13.0 L 13.8 -13.0","0 30.6 M 10.6 8.0 L 16.6 8.0 L 13.8 8.0 L 16.4 -6.8 L 13.3 -6.8 L 16.3 -6.8 L 15.7 -3.0 L 17.7 -5.0 L 20.1 -6.6 L 22.3 -6.9 L 24.2 -6.6 L 25.2 -5.6 L 26.0 -3.7 L 26.0 -2.0 L 24.2 7.9 L 21.4 7.9 L 27.0 7.9 L 24.3 7.9 L 26.1 -2.2 L 26.6 -3.2 L 28.3 -5.0 L 30.5 -6.5 L 32.5 -6.9 L 34.2 -6.7 L 35.5 -5.9 L 36.5 -4.4 L 36.6 -2.6 L 36.3 -.7 L 34.8 7.9 L 31.9 7.9 L 37.7 7.9","0 21.6 M 10.8 8.0 L 16.5 8.0 L 13.8 8.0 L 16.4 -6.7 L 13.4 -6.7 L 16.4 -6.7 L 15.7 -2.6 L 17.7 -4.8 L 19.5 -6.0 L 21.4 -6.9 L 23.1 -7.0 L 25.0 -6.7 L 26.6 -5.9 L 27.5 -4.4 L 27.7 -3.1 L 27.5 -1.5 L 25.8 7.8 L 23.0 7.8 L 29.1 7.8","0 19.1 M 18.2 8.2 L 20.4 8.0 L 22.9 6.8 L 25.0 4.9 L 26.2 2.5 L 26.8 -.1 L 26.8 -2.3 L 26.0 -4.4 L 24.6 -5.8 L 22.6 -6.8 L 20.9 -7.0 L 18.2 -6.7 L 15.3 -4.9 L 13.5 -2.7 L 12.4 .1 L 12.1 2.8 L 12.8 5.2 L 14.2 7.1 L 16.4 8.1 L 18.2 8.2","0 20.3 M 8.8 14.2 L 15.8 14.2 L 11.9 14.2 L 15.6 -6.7 L 12.8 -6.7 L 15.6 -6.7 L 14.9 -2.9 L 17.3 -4.8 L 20.4 -6.8 L 23.3 -7.1 L 26.0 -6.0 L 27.4 -3.7 L 27.6 -.7 L 27.0 2.2 L 26.0 4.6 L 24.2 6.3 L 22.0 7.4 L 20.0 7.8 L 18.4 8.0 L 13.1 8.0","0 20.0 M 19.5 14.1 L 26.2 14.1 L 22.9 14.1 L 26.6 -6.8 L 25.9 -3.0 L 24.9 -4.4 L 23.6 -5.7 L 21.8 -6.7 L 19.8 -7.1 L 17.7 -6.6 L 15.3 -5.2 L 13.8 -3.4 L 12.9 -1.6 L 12.3 .5 L 12.2 2.6 L 12.5 4.5 L 13.9 6.4 L 16.0 7.6 L 18.8 7.9 L 24.0 7.9","0 16.6 M 17.4 8.0 L 10.4 8.0 L 13.6 8.0 L 16.2 -6.7 L 13.3 -6.7 L 16.2 -6.7 L 15.3 -2.1 L 17.0 -3.7 L 18.6 -5.0 L 20.3 -6.0 L 21.9 -6.7 L 23.6 -6.9 L 26.0 -6.9 L 25.3 -3.0","0 17.9 M 11.4 8.0 L 12.3 2.8 L 11.9 5.0 L 13.0 6.2 L 14.3 7.3 L 16.2 8.1 L 18.0 8.3 L 20.4 8.0 L 22.8 7.1 L 24.1 5.8 L 24.6 4.4 L 24.6 2.8 L 23.4 1.7 L 21.8 1.1 L 18.9 .6 L 16.1 .1 L 14.5 -.6 L 13.4 -1.6 L 13.2 -2.8 L 13.5 -4.1 L 14.5 -5.4 L 16.4 -6.6 L 18.2 -6.9 L 20.8 -6.9 L 22.4 -6.4 L 23.6 -5.6 L 24.6 -4.5 L 25.3 -3.7 L 25.0 -1.6 L 25.9 -6.7","0 12.9 M 16.7 -12.9 L 15.6 -6.7 L 12.5 -6.7 L 21.7 -6.7 L 15.6 -6.7 L 13.6 4.4 L 13.7 6.0 L 14.4 7.2 L 15.5 8.0 L 16.8 8.2 L 18.4 8.0 L 20.1 7.3 L 21.2 6.5","0 21.1 M 12.3 -6.7 L 15.7 -6.7 L 13.9 3.6 L 13.8 4.9 L 14.3 6.2 L 15.1 7.2 L 16.2 8.0 L 18.0 8.3 L 20.0 8.0 L 22.2 7.2 L 24.0 5.7 L 25.7 4.0 L 25.0 8.0 L 28.2 8.0 L 25.0 8.0 L 27.6 -6.8 L 24.4 -6.8","0 20.0 M 11.7 -6.7 L 18.0 -6.7 L 14.8 -6.7 L 18.6 8.1 L 27.7 -6.7 L 30.3 -6.7 L 24.5 -6.7","0 27.7 M 12.0 -6.7 L 18.1 -6.7 L 15.0 -6.7 L 17.7 8.0 L 25.1 -6.7 L 27.3 8.1 L 35.2 -6.8 L 38.2 -6.8 L 32.0 -6.8","0 18.7 M 10.0 8.0 L 16.2 8.0 L 12.7 8.0 L 25.8 -6.7 L 28.1 -6.7 L 22.3 -6.7 M 18.9 -6.7 L 12.7 -6.7 L 15.4 -6.7 L 23.3 8.0 L 25.8 8.0 L 19.8 8.0","0 20.2 M 9.6 12.7 L 10.3 13.5 L 11.3 14.4 L 12.6 14.4 L 13.9 14.4 L 15.4 13.6 L 17.0 12.0 L 18.7 9.2 L 27.6 -6.6 L 30.2 -6.6 L 24.5 -6.6 M 12.2 -6.7 L 17.9 -6.7 L 15.0 -6.7 L 19.3 8.0","0 17.5 M 13.0 -2.7 L 13.7 -6.6 L 26.1 -6.6 L 10.7 8.0 L 23.5 8.0 L 24.2 4.0","0 10.9 M 17.2 12.7 L 15.1 12.7 L 14.3 12.2 L 13.7 11.4 L 13.4 10.5 L 13.5 9.3 L 14.9 1.2 L 14.5 -.1 L 13.6 -.8 L 12.9 -1.2 L 11.6 -1.2 L 13.0 -1.2 L 14.4 -2.0 L 15.4 -2.8 L 15.9 -3.9 L 17.5 -12.9 L 18.1 -13.7 L 19.2 -14.8 L 20.5 -15.3 L 22.1 -15.3","0 8.8 M 11.7 14.4 L 16.5 -12.9","0 10.7 M 9.1 12.8 L 10.8 12.8 L 12.0 12.4 L 12.8 11.6 L 13.6 10.8 L 13.8 9.6 L 15.3 1.4 L 16.0 .2 L 17.1 -.8 L 18.3 -1.2 L 19.4 -1.2 L 18.4 -1.2 L 17.1 -1.8 L 16.5 -2.8 L 16.3 -3.8 L 16.5 -5.1 L 17.9 -12.9 L 17.5 -13.9 L 17.0 -14.6 L 15.9 -15.2 L 14.4 -15.2","0 17.3 M 13.5 -.2 L 13.8 -1.3 L 14.8 -2.5 L 15.9 -3.0 L 17.2 -2.9 L 18.4 -2.3 L 19.2 -1.2 L 20.2 -.3 L 21.8 .1 L 23.3 -.5 L 24.1 -1.3 L 24.4 -2.6","0 14.7 M 17.8 -3.4 L 19.1 -3.4 L 20.6 -4.2 L 21.7 -5.0 L 22.6 -6.0 L 23.2 -7.2 L 23.5 -8.6 L 23.5 -9.8 L 23.1 -11.1 L 22.2 -12.2 L 20.9 -12.9 L 19.6 -13.0 L 17.9 -12.7 L 16.1 -11.7 L 14.8 -10.1 L 14.2 -8.4 L 14.0 -6.9 L 14.5 -5.3 L 15.5 -4.1 L 16.6 -3.6 L 17.8 -3.4"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 5.5 M 13.2 -13.0 L 13.2 1.8 M 12.6 6.3 L 12.6 7.4 L 13.8 7.4 L 13.7 6.3 L 12.6 6.3","0 10.5 M 13.0 -12.8 L 13.0 -9.4 M 17.6 -12.8 L 17.6 -9.4","0 22.5 M 20.5 -12.8 L 13.8 7.8 M 30.6 -12.9 L 23.8 7.7 M 12.4 -7.4 L 32.9 -7.4 M 11.6 1.8 L 31.9 1.8","0 22.4 M 12.5 3.8 L 12.5 5.2 L 14.1 6.8 L 29.7 6.8 L 31.4 5.0 L 31.4 -1.1 L 29.6 -2.9 L 14.2 -2.9 L 12.6 -4.5 L 12.6 -10.4 L 14.2 -12.0 L 30.0 -12.0 L 31.4 -10.5 L 31.4 -9.1 M 22.2 -16.2 L 22.2 11.2","0 27.6 M 13.0 -10.7 L 13.0 -6.3 L 14.5 -4.8 L 19.2 -4.8 L 20.8 -6.4 L 20.8 -10.6 L 19.3 -12.2 L 14.6 -12.2 L 13.0 -10.7 M 35.6 -11.5 L 14.6 6.1 M 28.9 1.0 L 28.9 5.4 L 30.5 6.9 L 35.1 6.9 L 36.7 5.3 L 36.7 1.0 L 35.2 -.5 L 30.5 -.5 L 28.9 1.0","0 27.1 M 31.8 -1.5 L 31.8 5.2 L 30.3 6.7 L 14.8 6.7 L 13.3 5.2 L 13.3 -2.5 L 16.1 -4.1 M 31.1 -8.8 L 31.1 -10.4 L 29.4 -12.0 L 16.1 -12.0 L 14.4 -10.3 L 14.4 -5.1 L 36.6 5.9","0 5.9 M 13.1 -12.9 L 13.1 -9.4","0 7.1 M 16.2 -12.0 L 14.9 -12.0 L 13.2 -10.3 L 13.2 5.2 L 14.8 6.8 L 16.2 6.8","0 7.6 M 12.2 -11.9 L 13.6 -11.9 L 15.4 -10.1 L 15.4 5.1 L 13.8 6.7 L 12.3 6.7","0 13.3 M 13.7 -2.4 L 17.2 -6.8 L 11.7 -8.7 M 17.0 -12.5 L 17.1 -6.8 L 22.5 -8.7 M 17.1 -6.8 L 20.5 -2.2","0 12.1 M 16.9 4.9 L 16.9 -6.0 M 11.5 -.6 L 22.4 -.6","0 4.6 M 12.3 6.3 L 12.3 11.0 L 13.6 9.7 L 13.6 6.4 L 12.3 6.3","0 14.4 M 12.1 -.7 L 23.2 -.7","0 5.3 M 12.3 6.3 L 12.3 7.4 L 13.8 7.4 L 13.8 6.3 L 12.3 6.3","0 14.4 M 10.5 6.0 L 25.2 -11.2","0 24.2 M 13.1 -10.0 L 13.1 5.1 L 14.9 6.8 L 30.7 6.8 L 32.6 5.0 L 32.6 -10.4 L 31.0 -12.0 L 15.1 -12.0 L 13.1 -10.0 M 13.3 5.0 L 32.4 -10.5","0 10.6 M 12.6 -7.1 L 17.5 -12.8 L 18.2 -12.8 L 18.2 7.7","0 23.5 M 13.1 -9.0 L 13.1 -10.2 L 15.1 -12.2 L 30.7 -12.2 L 32.5 -10.3 L 32.5 -4.2 L 30.7 -2.4 L 15.0 -2.4 L 13.1 -.5 L 13.1 6.7 L 33.3 6.7","0 23.5 M 12.9 -9.0 L 12.9 -10.7 L 14.1 -11.9 L 29.4 -11.9 L 31.2 -10.1 L 31.2 -4.3 L 29.9 -3.0 L 16.1 -3.0 L 29.9 -3.0 L 31.8 -1.1 L 31.8 4.9 L 30.0 6.7 L 14.4 6.7 L 13.0 5.2 L 13.0 4.4","0 20.7 M 26.7 7.7 L 26.7 -12.5 L 11.0 .9 L 31.1 .9","0 24.1 M 13.6 3.9 L 13.6 5.0 L 15.3 6.7 L 31.3 6.7 L 33.1 4.9 L 33.1 -1.1 L 31.4 -2.8 L 13.5 -2.8 L 13.5 -11.9 L 34.0 -11.9","0 22.9 M 29.5 -12.0 L 14.8 -12.0 L 13.2 -10.4 L 13.2 5.0 L 15.1 6.9 L 30.7 6.9 L 32.5 5.1 L 32.5 -1.2 L 30.7 -2.9 L 14.2 -2.9 L 13.1 -3.9","0 19.0 M 10.5 -11.9 L 24.9 -11.9 L 26.7 -10.2 L 26.7 7.8","0 23.5 M 15.2 6.7 L 30.8 6.7 L 32.5 5.0 L 32.5 -1.3 L 30.7 -3.1 L 14.4 -3.1 L 13.0 -4.5 L 13.0 -10.3 L 14.8 -12.1 L 30.6 -12.1 L 32.4 -10.3 L 32.4 -4.5 L 30.9 -2.9 L 14.4 -2.9 L 12.9 -1.5 L 12.9 5.1 L 15.2 6.7","0 23.5 M 13.5 6.8 L 30.3 6.8 L 32.2 5.0 L 32.2 -10.3 L 30.3 -12.2 L 15.1 -12.2 L 13.1 -10.1 L 13.1 -4.1 L 14.9 -2.3 L 32.0 -2.3","0 5.2 M 12.2 -8.7 L 12.2 -7.4 L 13.8 -7.4 L 13.8 -8.7 L 12.2 -8.7 M 12.1 6.3 L 12.1 7.6 L 13.6 7.6 L 13.6 6.3 L 12.1 6.3","0 5.2 M 12.9 -8.7 L 12.9 -7.3 L 14.3 -7.3 L 14.3 -8.7 L 12.9 -8.7 M 13.0 6.5 L 13.0 10.9 L 14.2 9.7 L 14.2 6.5 L 13.0 6.5","0 12.6 M 21.9 -7.5 L 10.9 -.9 L 22.1 5.6","0 17.7 M 12.0 -3.6 L 27.0 -3.6 M 11.8 2.4 L 27.1 2.4","0 13.2 M 12.0 -7.9 L 23.8 -.8 L 12.1 5.8","0 19.0 M 11.6 -12.0 L 27.3 -12.0 L 29.2 -10.1 L 29.2 -3.6 L 27.3 -1.7 L 18.0 -1.7 L 16.0 .3 L 16.0 1.7 M 15.3 6.3 L 15.3 7.5 L 16.5 7.5 L 16.5 6.4 L 15.3 6.3","0 24.1 M 27.6 1.0 L 27.6 -4.8 L 25.8 -6.6 L 20.9 -6.6 L 19.0 -4.8 L 19.0 -.2 L 20.6 1.4 L 33.0 1.4 L 33.0 -10.1 L 31.1 -12.0 L 15.4 -12.0 L 13.6 -10.2 L 13.6 5.2 L 15.2 6.8 L 32.9 6.8","0 23.4 M 13.0 7.8 L 13.0 -10.2 L 14.9 -12.1 L 30.0 -12.1 L 31.8 -10.2 L 31.8 -1.2 L 12.9 -1.2 L 31.8 -1.2 L 31.8 7.7","0 24.0 M 13.1 -11.9 L 29.3 -11.9 L 31.4 -9.8 L 31.4 -4.8 L 30.2 -3.0 L 14.4 -3.0 L 13.3 -4.1 L 13.3 -2.0 L 14.4 -3.0 L 30.2 -3.0 L 32.0 -1.3 L 32.0 5.1 L 30.2 6.9 L 13.0 6.9 L 13.1 -11.9","0 22.8 M 32.8 -12.1 L 14.9 -12.1 L 13.0 -10.2 L 13.0 5.0 L 14.9 6.9 L 32.9 6.9","0 24.0 M 13.0 -12.0 L 13.0 6.8 L 30.0 6.8 L 31.9 4.9 L 31.9 -10.2 L 30.1 -12.0 L 13.0 -12.0","0 21.8 M 31.1 6.8 L 13.1 6.8 L 13.1 -2.9 L 27.5 -2.9 L 13.1 -2.9 L 13.1 -12.0 L 31.0 -12.0","0 19.9 M 13.0 7.7 L 13.0 -2.9 L 27.6 -2.9 L 13.0 -2.9 L 13.0 -12.1 L 31.0 -12.1","0 24.0 M 25.9 -2.3 L 31.8 -2.3 L 31.8 4.6 L 29.6 6.8 L 14.9 6.8 L 13.0 4.9 L 13.0 -10.1 L 15.2 -12.3 L 30.2 -12.3 L 31.8 -10.7 L 31.8 -9.1","0 24.1 M 13.1 -12.8 L 13.1 7.7 L 13.1 -2.8 L 32.4 -2.8 L 32.4 -12.8 L 32.4 7.5","0 5.1 M 13.0 -12.8 L 13.0 7.8","0 22.3 M 30.6 -12.9 L 30.6 5.5 L 29.2 6.9 L 13.1 6.9 L 11.3 5.0 L 11.3 3.2","0 22.3 M 13.0 -12.9 L 13.0 7.6 L 13.0 -2.9 L 21.9 -2.9 L 30.4 7.5 L 21.8 -2.9 L 30.5 -12.9","0 22.4 M 13.7 -12.7 L 13.7 6.7 L 33.5 6.7","0 26.3 M 13.1 7.5 L 13.1 -12.6 L 14.1 -12.5 L 24.0 -.9 L 33.8 -12.6 L 34.7 -12.6 L 34.7 7.7","0 24.1 M 12.9 7.5 L 12.9 -12.4 L 14.3 -12.4 L 31.1 7.4 L 31.9 7.4 L 31.8 -12.6","0 23.4 M 13.0 -10.2 L 13.0 5.1 L 14.7 6.7 L 30.3 6.7 L 31.9 5.1 L 31.9 -10.5 L 30.3 -11.9 L 14.6 -12.0 L 13.0 -10.2","0 22.4 M 12.9 7.7 L 12.9 -11.9 L 30.4 -11.9 L 31.9 -10.4 L 31.9 -2.6 L 30.3 -1.0 L 14.4 -1.0 L 12.9 -2.5","0 25.2 M 35.7 6.7 L 14.7 6.7 L 13.0 5.0 L 13.0 -10.4 L 14.7 -12.1 L 30.1 -12.1 L 32.0 -10.2 L 32.0 5.2 L 30.4 6.7","0 23.4 M 12.9 7.7 L 12.9 -12.0 L 30.2 -12.0 L 31.9 -10.3 L 31.9 -2.9 L 30.1 -1.2 L 14.3 -1.2 L 12.8 -2.7 L 14.3 -1.2 L 23.8 -1.2 L 31.1 7.7","0 23.5 M 13.0 3.9 L 13.0 5.4 L 14.3 6.7 L 30.2 6.7 L 31.7 5.2 L 31.7 -1.3 L 30.2 -2.8 L 14.5 -2.8 L 13.0 -4.4 L 13.0 -10.4 L 14.8 -12.2 L 30.4 -12.2 L 31.9 -10.7 L 31.9 -9.1","0 21.3 M 21.5 7.7 L 21.5 -12.0 L 11.3 -12.0 L 31.6 -12.0","0 23.6 M 13.0 -12.7 L 13.0 5.1 L 14.6 6.8 L 30.3 6.8 L 31.9 5.1 L 31.9 -12.9","0 29.1 M 12.9 -12.7 L 24.8 7.6 L 37.0 -12.8","0 33.9 M 12.7 -12.7 L 20.2 7.5 L 27.7 -12.9 L 35.8 7.8 L 43.3 -13.0","0 22.9 M 13.5 7.5 L 30.8 -12.8 L 22.2 -2.6 L 13.5 -12.7 L 30.9 7.7","0 23.0 M 12.3 -12.7 L 21.6 -1.3 L 21.6 7.7 L 21.6 -1.3 L 30.9 -12.7","0 23.4 M 12.0 -12.0 L 31.8 -12.0 L 31.8 -10.4 L 13.3 5.1 L 13.3 6.7 L 31.9 6.7","0 7.0 M 16.2 6.8 L 13.1 6.8 L 13.1 -11.9 L 16.2 -11.9","0 14.4 M 10.3 -12.0 L 25.0 5.9","0 7.4 M 12.0 -12.0 L 14.8 -12.0 L 14.8 6.6 L 12.0 6.6","0 17.9 M 28.3 -2.2 L 19.6 -12.4 L 11.0 -2.2","0 23.0 M 11.9 9.2 L 33.1 9.2","0 5.2 M 12.3 -21.5 L 13.2 -17.9","0 19.4 M 12.2 -8.1 L 26.3 -8.1 L 28.0 -6.5 L 28.0 6.8 L 14.5 6.8 L 12.9 5.2 L 12.9 -.5 L 27.8 -.5","0 18.8 M 12.9 -14.5 L 12.9 6.7 L 26.3 6.7 L 27.9 5.0 L 27.9 -6.4 L 26.2 -8.1 L 14.2 -8.1 L 13.1 -7.0","0 19.6 M 28.9 6.8 L 14.7 6.8 L 13.0 5.0 L 13.0 -6.5 L 14.7 -8.2 L 28.9 -8.2","0 18.9 M 27.4 -14.4 L 27.4 6.8 L 13.7 6.8 L 11.9 4.9 L 11.9 -6.2 L 13.6 -7.9 L 25.8 -7.9 L 27.3 -6.5","0 19.6 M 28.8 6.9 L 14.6 6.9 L 13.0 5.2 L 13.0 -6.4 L 14.7 -8.2 L 26.3 -8.2 L 28.0 -6.5 L 28.0 -.7 L 12.9 -.7","0 10.9 M 12.9 7.6 L 12.9 -8.0 L 21.3 -8.0 L 12.9 -8.0 L 12.9 -12.1 L 14.6 -13.8 L 21.4 -13.8","0 19.5 M 14.9 13.7 L 26.1 13.7 L 27.9 11.9 L 27.9 -6.6 L 26.1 -8.4 L 14.2 -8.4 L 12.4 -6.6 L 12.4 5.4 L 13.9 6.9 L 26.0 6.9 L 27.8 5.1","0 19.1 M 13.0 7.6 L 13.0 -14.5 L 13.0 -8.1 L 26.3 -8.1 L 28.1 -6.4 L 28.1 7.7","0 4.6 M 13.0 7.7 L 12.9 7.5 L 12.9 -8.7 M 12.4 -13.1 L 12.4 -14.4 L 13.7 -14.4 L 13.7 -13.1 L 12.4 -13.1","0 6.4 M 5.0 13.8 L 12.6 13.8 L 14.3 12.0 L 14.3 -8.9 M 13.6 -12.9 L 13.6 -14.4 L 15.0 -14.4 L 15.0 -12.9 L 13.6 -12.9","0 18.2 M 13.0 -14.4 L 13.0 7.8 L 13.0 -.6 L 19.6 -.6 L 27.0 -8.9 L 19.6 -.6 L 27.1 7.7","0 7.4 M 12.8 -14.5 L 12.8 5.0 L 14.6 6.8 L 17.8 6.8","0 28.1 M 12.9 7.5 L 12.9 -8.0 L 23.6 -8.0 L 25.1 -6.6 L 25.1 7.8 L 25.1 -6.6 L 26.5 -8.0 L 35.5 -8.0 L 37.1 -6.4 L 37.1 7.7","0 19.4 M 12.9 7.7 L 12.9 -7.8 L 26.5 -7.8 L 28.0 -6.3 L 28.0 7.8","0 20.1 M 13.6 -6.1 L 13.6 5.0 L 15.3 6.8 L 26.9 6.8 L 28.5 5.2 L 28.5 -6.8 L 27.1 -8.3 L 15.6 -8.3 L 13.6 -6.1","0 18.6 M 13.1 14.7 L 13.1 -7.9 L 26.7 -7.9 L 28.1 -6.6 L 28.1 5.7 L 26.8 7.0 L 14.7 7.0 L 13.3 5.6","0 19.0 M 27.2 14.5 L 27.2 -8.0 L 13.4 -8.0 L 11.8 -6.5 L 11.8 5.1 L 13.5 6.8 L 25.3 6.8 L 27.0 5.2","0 13.9 M 13.0 7.8 L 13.0 -6.5 L 14.7 -8.3 L 24.8 -8.3","0 19.6 M 13.0 4.4 L 13.0 5.4 L 14.4 6.8 L 26.4 6.8 L 27.9 5.2 L 27.9 .9 L 26.5 -.5 L 14.8 -.5 L 13.2 -2.1 L 13.2 -6.6 L 14.9 -8.2 L 26.2 -8.2 L 27.8 -6.6 L 27.8 -5.7","0 11.0 M 13.0 -14.6 L 13.0 -8.0 L 21.3 -8.0 L 13.0 -8.0 L 13.0 5.4 L 14.1 6.6 L 21.3 6.6","0 20.0 M 13.5 -8.8 L 13.5 5.3 L 14.9 6.7 L 26.8 6.7 L 28.5 4.9 L 28.5 -9.0","0 22.4 M 12.5 -8.8 L 21.6 7.7 L 31.2 -9.0","0 30.9 M 12.8 -8.6 L 19.3 6.9 L 26.2 -8.7 L 33.7 6.7 L 39.8 -8.9","0 19.5 M 13.3 7.7 L 27.1 -8.8 L 20.2 -.6 L 13.3 -8.9 L 27.2 7.6","0 18.9 M 14.9 13.7 L 26.1 13.7 L 27.9 11.9 L 27.9 -8.9 L 27.9 5.7 L 26.7 6.8 L 14.0 6.8 L 12.3 5.1 L 12.3 -8.8","0 20.1 M 12.3 -8.1 L 28.3 -8.1 L 28.3 -6.9 L 12.5 5.7 L 12.5 6.7 L 28.2 6.7","0 7.6 M 16.8 6.7 L 15.2 6.7 L 13.8 5.3 L 13.8 -.3 L 11.4 -2.7 L 13.8 -5.1 L 13.8 -10.3 L 15.4 -12.0 L 16.8 -12.0","0 5.1 M 12.9 -16.8 L 12.9 11.1","0 7.6 M 12.4 6.7 L 13.9 6.7 L 15.3 5.3 L 15.3 -.3 L 17.8 -2.7 L 15.4 -5.1 L 15.4 -10.3 L 13.7 -12.0 L 12.4 -12.0","0 10.8 M 11.2 -1.3 L 14.0 -1.7 L 18.3 .2 L 20.6 -.4","0 12.0 M 12.3 -11.3 L 12.3 -6.2 L 13.6 -4.9 L 19.2 -4.9 L 20.5 -6.3 L 20.5 -11.4 L 19.0 -12.9 L 13.9 -12.9 L 12.3 -11.3"]
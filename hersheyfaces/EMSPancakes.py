@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 9.0 M 12.9 -13.9 L 13.0 -7.6 L 12.3 1.1 M 11.2 5.4 L 12.7 5.4 L 12.8 7.4 L 11.0 7.2 L 11.2 5.4","0 12.6 M 11.2 -12.8 L 11.3 -6.7 M 16.9 -13.4 L 17.4 -6.2","0 24.7 M 17.4 6.0 L 16.6 -4.4 L 16.9 -9.2 M 23.7 -14.6 L 24.4 -3.2 L 24.5 4.1 M 11.5 .0 L 13.5 .2 L 22.7 -.7 L 26.2 -1.0 L 29.1 -.7 M 10.1 -6.5 L 15.3 -6.3 L 21.4 -7.0 L 28.8 -7.8","0 19.5 M 17.7 9.0 L 17.3 -14.3 M 22.7 -6.8 L 21.6 -9.4 L 19.5 -10.6 L 16.0 -10.7 L 13.1 -9.2 L 11.3 -6.2 L 12.0 -3.6 L 15.1 -2.3 L 18.9 -1.8 L 22.3 -.4 L 23.9 1.5 L 23.9 3.7 L 22.0 5.1 L 16.6 5.3 L 13.0 4.6 L 11.2 2.5","0 26.0 M 12.3 -13.3 L 10.7 -10.5 L 11.1 -7.7 L 13.6 -6.6 L 16.1 -8.6 L 16.4 -10.9 L 15.3 -12.4 L 12.9 -12.3 M 29.2 -14.5 L 21.2 -5.1 L 16.2 2.4 L 11.4 8.8 M 25.4 .4 L 24.0 2.7 L 24.2 5.2 L 26.4 6.7 L 29.2 6.1 L 30.8 3.2 L 29.9 .4 L 28.1 -.4 L 25.4 .4","0 18.5 M 21.1 7.2 L 16.9 2.6 L 14.1 -2.5 L 12.9 -6.3 L 13.8 -8.2 L 15.0 -8.2 L 15.2 -6.6 L 14.5 -4.9 L 12.6 -1.7 L 11.2 2.1 L 11.2 5.6 L 13.4 7.1 L 16.7 5.9 L 20.4 3.3 L 22.6 .8 L 23.2 -1.0","0 6.4 M 10.7 -12.9 L 10.8 -5.9","0 10.0 M 16.3 9.3 L 13.0 5.5 L 11.3 .7 L 11.5 -6.0 L 13.5 -10.7 L 15.7 -13.5","0 9.9 M 9.5 9.0 L 12.4 5.4 L 14.0 .0 L 13.8 -5.6 L 12.0 -10.7 L 9.7 -13.4","0 16.6 M 13.5 -.8 L 15.7 -7.1 L 17.2 -12.5 M 9.9 -9.8 L 15.7 -6.9 L 21.1 -5.2 M 10.1 -4.4 L 21.5 -9.8","0 18.0 M 16.8 4.6 L 17.0 -7.4 M 10.3 -1.5 L 22.6 -1.9","0 8.2 M 9.3 11.1 L 13.7 5.1","0 14.5 M 10.6 -1.4 L 19.0 -1.6","0 6.6 M 10.5 5.5 L 12.2 5.7 L 12.1 7.0 L 10.7 7.2 L 10.5 5.5","0 12.5 M 10.9 9.7 L 16.2 -8.8 L 19.1 -16.6","0 22.3 M 10.9 -2.7 L 11.9 -7.5 L 15.1 -10.7 L 19.6 -11.8 L 23.4 -10.8 L 26.0 -8.2 L 27.5 -4.0 L 27.3 .7 L 24.8 4.9 L 20.8 6.7 L 16.0 6.3 L 12.0 2.3 L 10.9 -2.7","0 8.4 M 12.3 6.5 L 11.9 4.7 L 12.7 -10.9 L 12.2 -11.7","0 18.2 M 10.9 -8.9 L 12.5 -11.4 L 16.2 -11.7 L 19.0 -10.8 L 19.9 -7.8 L 18.8 -3.9 L 15.8 1.4 L 12.6 6.6 L 22.4 6.2","0 18.1 M 10.5 6.3 L 10.8 6.3 L 15.5 6.4 L 20.2 5.2 L 22.4 2.1 L 22.3 -.4 L 20.0 -2.3 L 16.1 -2.5 L 14.5 -2.0 L 18.8 -4.2 L 21.9 -7.3 L 22.6 -10.3 L 21.0 -12.0 L 17.0 -11.6 L 13.7 -10.0","0 16.7 M 20.5 7.0 L 20.6 -12.6 M 21.3 -.4 L 13.7 -.5 L 11.8 -1.4 L 10.5 -2.9 L 10.0 -4.9 L 10.2 -9.2","0 19.0 M 11.3 5.8 L 14.6 7.1 L 19.5 6.5 L 22.3 4.6 L 22.9 1.5 L 22.0 -1.4 L 20.0 -3.0 L 17.1 -3.5 L 13.2 -2.1 L 13.2 -11.2 L 14.5 -11.8 L 24.0 -11.6 L 24.3 -11.3","0 20.2 M 18.1 6.3 L 18.0 3.7 L 19.2 .0 L 21.9 -1.9 L 24.6 -2.3 L 25.7 -1.3 L 25.6 .8 L 24.6 3.5 L 21.6 5.8 L 18.7 6.4 L 16.2 6.4 L 12.1 4.5 L 10.5 -.2 L 11.6 -6.3 L 14.7 -11.8","0 15.4 M 9.4 -11.4 L 21.0 -11.2 L 13.9 5.0 L 13.8 6.2","0 16.2 M 22.1 -8.1 L 21.7 -10.6 L 19.1 -12.2 L 15.5 -11.5 L 13.3 -9.9 L 12.1 -8.2 L 13.3 -5.6 L 16.1 -2.3 L 17.7 .3 L 18.5 3.0 L 18.3 5.5 L 16.3 6.9 L 13.3 6.7 L 11.2 5.5 L 11.3 1.5 L 13.2 -1.1 L 17.7 -4.6 L 21.6 -8.0","0 19.0 M 22.1 7.3 L 22.8 .7 L 23.2 -5.6 L 20.8 -4.0 L 17.4 -3.1 L 13.7 -4.0 L 11.1 -5.9 L 10.7 -8.8 L 12.4 -11.1 L 16.6 -12.4 L 20.1 -11.7 L 22.0 -9.5 L 22.4 -5.5","0 7.0 M 10.4 -4.5 L 10.3 -2.7 L 12.0 -2.8 L 12.2 -4.4 L 10.4 -4.5 M 10.2 4.2 L 10.0 6.0 L 12.0 6.2 L 12.0 4.3 L 10.2 4.2","0 6.6 M 10.1 -4.2 L 10.1 -2.4 L 12.1 -2.2 L 12.2 -4.4 L 10.1 -4.2 M 11.2 4.8 L 11.2 5.6 L 9.0 9.6","0 16.6 M 21.8 5.3 L 15.5 2.1 L 10.5 .0 L 16.1 -3.8 L 21.0 -6.3","0 16.2 M 11.2 -5.4 L 18.2 -5.7 L 19.8 -5.6 M 11.4 .0 L 13.9 .4 L 19.3 -.1 L 20.8 .0","0 17.0 M 11.5 4.7 L 17.1 1.5 L 21.3 -1.2 L 21.6 -1.8 L 16.9 -3.8 L 11.1 -6.8","0 15.7 M 12.0 5.5 L 12.0 7.0 L 13.7 7.3 L 13.9 5.6 L 12.0 5.5 M 13.9 1.3 L 12.8 .0 L 14.0 -1.8 L 18.5 -3.9 L 21.6 -6.9 L 21.6 -11.1 L 19.9 -13.6 L 16.9 -14.3 L 13.5 -14.0 L 11.3 -12.2","0 27.8 M 25.4 2.4 L 23.6 3.8 L 20.5 4.6 L 18.2 3.2 L 18.1 .0 L 19.6 -3.4 L 22.9 -4.3 L 25.0 -3.1 L 25.8 -.1 L 25.4 3.2 L 26.5 4.7 L 29.0 5.3 L 30.8 4.6 L 32.0 1.7 L 31.7 -3.9 L 29.1 -7.8 L 24.8 -10.1 L 18.8 -9.6 L 13.7 -6.8 L 10.9 -1.9 L 10.3 2.6 L 12.6 7.7 L 16.2 9.9 L 20.6 10.9 L 26.7 10.5 L 32.4 8.8","0 22.3 M 10.0 6.4 L 18.8 -12.2 L 24.5 -.8 L 26.5 3.6 L 27.5 6.5 L 28.5 8.0 M 12.4 -1.0 L 25.0 -.9","0 19.1 M 12.0 6.2 L 12.0 -11.0 L 14.1 -12.0 L 17.3 -12.5 L 20.2 -12.0 L 21.2 -10.7 L 21.0 -8.8 L 19.3 -7.5 L 14.9 -5.0 L 13.0 -5.0 L 15.0 -6.3 L 20.0 -6.2 L 22.9 -4.9 L 25.0 -2.2 L 25.1 2.0 L 22.5 5.0 L 16.6 6.3 L 12.0 6.2","0 20.2 M 24.4 -6.8 L 24.4 -8.8 L 22.4 -11.2 L 19.2 -12.5 L 15.2 -11.5 L 12.4 -8.7 L 10.7 -4.6 L 10.3 -.1 L 11.5 3.7 L 14.5 6.4 L 18.9 7.0 L 23.5 6.4 L 26.3 5.3 L 26.5 5.1","0 22.1 M 11.2 6.9 L 11.2 -11.5 L 15.3 -12.0 L 19.6 -11.2 L 24.0 -8.6 L 26.8 -4.8 L 27.1 .0 L 24.4 4.3 L 19.5 6.3 L 15.5 6.5 L 11.5 6.3","0 18.2 M 24.1 6.7 L 19.3 5.9 L 11.5 6.4 L 11.4 -3.2 L 20.6 -3.3 L 11.4 -3.1 L 11.3 -11.7 L 11.3 -11.2 L 25.3 -11.1","0 17.6 M 11.1 6.5 L 11.5 -2.5 L 21.5 -3.6 L 11.5 -2.5 L 11.6 -11.3 L 24.0 -11.2 L 24.6 -11.0","0 20.6 M 25.2 -9.4 L 21.9 -11.7 L 16.8 -11.5 L 13.4 -9.0 L 11.2 -5.6 L 10.3 -2.3 L 11.1 1.6 L 13.5 5.1 L 17.2 6.4 L 21.1 6.4 L 24.3 5.0 L 25.5 3.4 L 25.6 6.3 L 25.1 -1.9 L 26.3 -2.0 L 20.5 -1.9","0 20.0 M 10.9 -11.7 L 11.3 6.6 M 11.1 -2.9 L 25.2 -2.9 M 25.1 6.9 L 24.4 -12.1","0 12.2 M 11.1 6.3 L 18.1 6.4 L 14.4 6.2 L 14.3 -11.8 L 11.1 -11.6 L 14.3 -12.0 L 19.1 -11.8","0 14.2 M 9.6 5.2 L 12.4 6.9 L 16.5 5.7 L 19.1 2.8 L 19.6 .2 L 19.2 -11.8","0 19.2 M 12.4 6.9 L 12.2 -12.3 M 22.5 -11.8 L 12.6 -1.2 L 17.6 -6.4 L 25.8 8.4","0 16.1 M 11.1 -11.9 L 11.3 6.5 L 22.9 6.5","0 24.1 M 11.2 6.0 L 11.0 4.9 L 11.1 -6.8 L 11.8 -11.7 L 13.4 -7.0 L 17.6 .9 L 19.1 3.2 L 21.2 .8 L 25.6 -6.4 L 28.7 -11.7 L 28.6 5.2 L 28.2 6.7","0 19.7 M 11.4 6.0 L 11.5 -11.0 L 13.8 -5.8 L 16.4 -1.0 L 18.9 2.5 L 21.9 6.1 L 23.7 7.3 L 24.2 3.0 L 24.7 -12.9","0 23.6 M 10.4 -3.8 L 11.1 .6 L 13.3 3.9 L 16.6 6.2 L 20.4 7.4 L 24.7 5.8 L 28.1 2.6 L 29.3 -2.3 L 28.4 -7.3 L 25.6 -10.9 L 21.6 -12.2 L 17.0 -11.8 L 12.9 -9.5 L 11.2 -6.6 L 10.4 -3.8","0 18.1 M 11.8 6.5 L 11.6 -9.5 L 14.5 -11.5 L 18.7 -12.2 L 22.6 -11.0 L 24.3 -8.2 L 23.7 -4.4 L 20.8 -2.1 L 17.2 -.7 L 14.1 -.8 L 11.1 -.8","0 23.8 M 26.1 4.2 L 23.6 6.1 L 17.7 6.9 L 12.6 4.3 L 10.4 .2 L 10.3 -5.2 L 12.2 -9.4 L 16.2 -11.8 L 21.1 -12.5 L 24.8 -10.3 L 27.8 -6.5 L 28.9 -2.6 L 28.1 .9 L 26.1 4.2 M 21.5 .4 L 25.0 3.2 L 27.4 6.2 L 29.0 8.1","0 19.7 M 12.5 5.9 L 11.4 -6.1 L 11.6 -8.8 L 15.5 -11.7 L 19.1 -12.4 L 22.5 -10.9 L 23.5 -8.1 L 21.9 -6.0 L 19.6 -4.8 L 12.0 -2.5 L 16.7 -3.2 L 19.5 -3.4 L 22.7 -2.5 L 24.6 -1.3 L 25.6 1.4 L 25.7 7.8","0 17.4 M 11.7 4.0 L 12.8 5.9 L 15.9 7.0 L 20.9 5.6 L 23.4 3.1 L 23.7 1.4 L 22.5 -.1 L 20.0 -1.3 L 15.9 -2.3 L 12.6 -3.3 L 10.7 -5.4 L 11.2 -8.4 L 13.6 -10.7 L 16.9 -12.1 L 19.4 -12.3 L 21.4 -11.2 L 21.9 -9.9 L 22.0 -8.0","0 17.6 M 17.5 6.5 L 17.1 .1 L 16.7 -11.4 L 10.7 -11.1 L 22.9 -11.9 L 23.5 -11.7","0 19.1 M 11.5 -11.3 L 10.7 -5.4 L 10.7 -.3 L 12.6 4.9 L 15.4 7.0 L 19.0 6.9 L 21.1 5.5 L 23.5 3.0 L 23.6 5.5 L 23.6 -4.2 L 23.8 -8.0 L 24.6 -11.7","0 19.1 M 9.6 -10.4 L 11.6 -2.9 L 15.4 6.5 L 21.0 -3.1 L 26.4 -11.7","0 25.9 M 10.2 -12.4 L 12.4 -4.4 L 14.5 4.8 L 14.9 6.4 L 15.6 5.9 L 18.6 -3.1 L 21.3 -9.1 L 22.5 -1.8 L 24.9 6.2 L 26.7 2.0 L 28.4 -5.0 L 30.5 -10.8 L 32.4 -14.0","0 14.0 M 10.1 5.8 L 10.6 4.2 L 14.4 -3.8 L 20.5 -13.7 M 9.4 -11.3 L 14.9 -.7 L 17.3 3.7 L 18.8 6.3 L 20.0 7.2","0 15.6 M 12.6 8.1 L 16.4 -.2 L 24.0 -12.4 M 8.7 -11.0 L 16.1 -.1","0 19.2 M 10.5 -11.6 L 22.5 -11.8 L 12.9 2.4 L 11.7 4.8 L 11.5 6.2 L 26.1 6.0","0 9.3 M 14.2 9.3 L 11.0 9.3 L 11.2 -13.2 L 14.4 -13.4","0 12.1 M 17.2 10.0 L 12.2 -9.4 L 9.3 -16.3","0 9.5 M 10.9 9.3 L 13.8 9.1 L 14.0 -13.4 L 11.1 -13.4","0 17.5 M 10.5 .9 L 13.2 -4.4 L 15.6 -10.9 L 18.5 -7.4 L 21.6 -1.7 L 23.1 .4","0 22.0 M 8.9 11.2 L 29.2 11.2","0 8.2 M 8.8 -16.3 L 13.6 -11.3","0 21.7 M 24.6 1.3 L 25.4 -1.9 L 23.9 -5.4 L 20.2 -7.5 L 15.8 -7.2 L 12.8 -4.9 L 10.7 -1.3 L 10.2 2.4 L 12.3 5.3 L 16.1 7.0 L 20.0 6.4 L 23.2 4.1 L 24.4 1.9 L 24.6 5.1 L 25.4 6.7 L 27.4 7.3 L 28.9 6.0","0 18.7 M 11.2 6.8 L 11.2 -13.8 L 11.2 -4.7 L 14.0 -6.6 L 16.6 -7.4 L 19.2 -7.5 L 21.7 -6.4 L 23.3 -4.3 L 23.8 -.9 L 23.3 2.7 L 21.3 5.0 L 18.3 6.5 L 15.2 6.7 L 11.4 5.9","0 17.3 M 22.7 5.9 L 22.0 6.4 L 17.5 6.6 L 13.5 6.1 L 11.2 4.5 L 10.3 .7 L 11.2 -3.4 L 13.6 -6.5 L 17.3 -7.6 L 20.3 -7.2 L 22.1 -5.6 L 22.7 -3.8","0 20.2 M 24.4 6.7 L 24.4 -4.0 L 22.3 -6.3 L 18.8 -7.6 L 14.7 -7.0 L 11.5 -4.6 L 10.3 -1.6 L 10.3 2.0 L 12.0 5.2 L 15.1 7.0 L 18.8 6.9 L 22.5 5.3 L 24.4 3.1 L 24.4 -13.6","0 18.7 M 24.2 5.7 L 21.2 6.7 L 17.5 7.1 L 13.8 6.2 L 10.9 4.3 L 9.8 .8 L 10.3 -3.3 L 13.0 -6.8 L 17.3 -8.0 L 21.2 -7.3 L 23.0 -5.9 L 23.9 -3.4 L 10.1 .9","0 15.1 M 13.9 6.7 L 13.4 -1.7 L 13.6 -6.8 L 9.3 -6.8 L 21.6 -6.8 L 13.5 -6.8 L 13.9 -10.2 L 15.1 -13.1 L 17.8 -14.6 L 20.2 -14.9 L 21.6 -14.2 L 22.8 -13.4","0 18.5 M 15.0 14.4 L 17.7 15.4 L 20.4 15.3 L 22.3 14.1 L 23.2 11.2 L 23.7 5.3 L 23.8 -1.6 L 22.8 2.9 L 20.6 5.9 L 16.8 7.2 L 13.7 6.5 L 10.6 3.7 L 10.0 -.7 L 11.2 -4.8 L 14.3 -7.6 L 18.9 -7.6 L 21.9 -5.2 L 23.5 -1.6","0 19.7 M 10.9 6.8 L 10.9 -13.5 L 10.9 -4.0 L 13.6 -6.3 L 16.7 -7.6 L 19.8 -7.2 L 22.7 -5.8 L 24.5 -3.5 L 24.8 .2 L 24.5 7.2","0 7.7 M 11.2 -15.1 L 10.5 -14.3 L 12.1 -13.0 L 12.7 -14.1 L 11.2 -15.1 M 12.1 -7.7 L 11.6 -3.3 L 11.4 .4 L 11.8 3.6 L 12.1 7.2","0 7.6 M 2.9 15.1 L 6.5 15.1 L 8.8 14.4 L 10.8 13.1 L 11.6 10.8 L 11.9 8.1 L 12.0 -7.7 M 11.8 -12.6 L 12.6 -13.6 L 11.4 -14.9 L 10.3 -14.3 L 11.8 -12.6","0 17.1 M 12.3 -13.9 L 11.6 7.0 L 11.8 1.8 L 22.9 -9.0 L 17.6 -3.8 L 22.9 7.3 L 23.1 8.8","0 9.0 M 11.6 -13.7 L 11.6 4.6 L 12.3 5.8 L 13.7 6.6 L 15.0 6.5 L 16.2 5.5","0 29.8 M 11.2 6.1 L 10.5 2.1 L 10.9 -7.2 L 10.9 -4.4 L 12.8 -6.7 L 16.2 -7.7 L 18.8 -7.1 L 20.5 -5.7 L 21.6 -3.5 L 22.0 -.4 L 21.8 6.2 L 22.0 -2.6 L 23.3 -5.0 L 26.6 -6.7 L 30.2 -6.7 L 32.7 -5.5 L 34.4 -2.3 L 35.0 2.1 L 34.6 6.1 L 34.0 7.6","0 19.6 M 11.5 7.0 L 10.8 -.8 L 10.9 -7.8 L 10.9 -3.3 L 14.0 -6.1 L 18.3 -7.7 L 21.6 -7.1 L 23.3 -5.4 L 24.8 -2.6 L 25.2 1.1 L 24.6 4.6 L 24.1 7.4","0 19.1 M 17.1 7.2 L 20.8 6.1 L 23.5 3.4 L 24.8 -.4 L 23.8 -4.3 L 21.6 -6.9 L 18.3 -7.9 L 14.7 -7.3 L 11.5 -5.2 L 10.0 -1.5 L 10.6 2.3 L 13.3 5.6 L 17.1 7.2","0 19.5 M 11.3 14.4 L 10.9 -5.1 L 14.0 -7.1 L 18.5 -7.4 L 22.5 -5.9 L 24.6 -2.8 L 24.6 1.3 L 22.2 4.8 L 17.7 6.5 L 15.3 6.5 L 11.5 6.0","0 19.7 M 24.3 14.3 L 24.5 -1.2 L 23.8 2.1 L 21.7 4.8 L 18.5 6.5 L 14.4 5.7 L 11.5 3.2 L 10.6 -1.0 L 11.7 -4.7 L 14.9 -7.2 L 18.2 -7.7 L 21.9 -6.4 L 24.2 -4.3 L 24.4 -1.0","0 15.7 M 11.2 6.7 L 11.5 -7.5 L 11.5 -4.3 L 13.5 -6.5 L 16.4 -7.6 L 19.3 -8.0 L 21.6 -7.8 L 22.6 -6.9 L 22.9 -6.5","0 18.7 M 11.8 5.5 L 14.1 7.0 L 17.4 7.0 L 21.8 5.7 L 23.2 4.3 L 23.4 2.8 L 21.7 1.4 L 17.8 .5 L 14.4 .1 L 11.3 -1.5 L 11.0 -4.2 L 12.6 -6.7 L 15.8 -8.0 L 18.5 -8.2 L 21.2 -7.3 L 21.9 -6.1 L 21.9 -4.8","0 15.6 M 21.8 -6.1 L 8.6 -6.1 L 13.7 -6.1 L 14.2 -12.0 L 13.6 .3 L 14.4 4.0 L 15.8 6.4 L 17.5 6.8 L 19.5 6.1 L 21.0 5.2","0 18.7 M 11.5 -7.7 L 10.5 -3.1 L 10.3 .1 L 11.4 4.0 L 13.1 6.4 L 15.3 7.3 L 17.7 7.2 L 19.6 6.1 L 21.4 4.4 L 22.5 2.4 L 23.5 .5 L 23.3 6.8 L 23.4 -7.6","0 17.6 M 9.3 -7.3 L 13.5 3.4 L 15.5 7.1 L 17.5 5.0 L 24.4 -7.9","0 28.3 M 11.6 -7.0 L 11.2 -2.8 L 11.5 1.0 L 12.6 4.7 L 14.2 6.9 L 16.1 7.6 L 17.9 7.0 L 20.3 4.5 L 21.6 1.3 L 22.1 -1.0 L 21.8 -6.2 L 22.5 2.8 L 23.3 5.1 L 24.9 6.8 L 27.0 7.0 L 29.6 5.6 L 32.1 3.0 L 33.7 .0 L 34.0 -3.8 L 33.6 -6.7 L 32.8 -9.5","0 15.5 M 10.3 6.9 L 10.3 6.1 L 17.1 -2.6 L 20.4 -6.8 L 22.1 -8.0 M 10.7 -8.1 L 17.9 4.1 L 20.5 6.7 L 22.1 7.0","0 16.7 M 12.0 14.2 L 12.4 12.0 L 16.7 4.3 L 20.5 -2.6 L 24.1 -8.0 M 9.5 -6.9 L 15.5 5.3","0 15.2 M 9.1 -7.3 L 18.5 -7.4 L 18.8 -5.6 L 10.9 6.3 L 19.0 6.6 L 21.3 6.2","0 11.7 M 16.9 9.6 L 14.6 9.2 L 13.4 8.7 L 13.7 6.4 L 14.7 1.9 L 14.2 .3 L 10.9 -2.0 L 10.2 -2.2 L 13.8 -4.8 L 14.4 -6.5 L 13.5 -11.8 L 14.2 -13.2 L 16.8 -13.8","0 11.5 M 13.9 14.5 L 13.3 -1.0 L 13.7 -10.2 L 14.1 -16.4","0 11.7 M 10.8 9.8 L 12.8 9.5 L 14.2 8.4 L 14.4 6.6 L 13.5 3.3 L 13.2 .6 L 14.6 -1.1 L 16.3 -2.2 L 17.7 -2.8 L 16.5 -3.6 L 14.7 -4.6 L 13.5 -5.9 L 13.9 -10.1 L 13.9 -12.3 L 12.9 -13.5 L 10.8 -13.8","0 18.1 M 11.0 -1.5 L 12.7 -3.1 L 15.1 -3.9 L 17.2 -2.9 L 18.7 -1.7 L 20.8 -1.6 L 23.4 -2.5","0 10.6 M 10.6 -8.4 L 11.4 -6.0 L 13.3 -4.9 L 16.0 -5.5 L 17.2 -7.9 L 17.4 -9.9 L 16.1 -11.6 L 13.6 -12.2 L 11.4 -10.8 L 10.6 -8.4"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 6.9 M 12.4 -12.9 L 11.5 -5.1 L 11.7 2.1 M 10.8 6.2 L 10.8 7.2 L 12.0 7.2 L 12.0 6.3 L 10.8 6.2","0 9.1 M 9.0 -17.2 L 8.9 -10.6 M 13.2 -17.0 L 13.5 -10.5","0 17.4 M 16.3 -5.2 L 12.9 -.2 L 9.6 7.0 M 16.0 6.2 L 21.3 -5.1 M 22.1 -1.8 L 12.8 -1.8 L 8.6 -2.4 M 8.7 3.9 L 13.6 2.9 L 16.0 2.8 L 21.4 3.4","0 16.5 M 20.4 -9.2 L 18.5 -10.8 L 15.9 -11.3 L 12.7 -11.0 L 9.9 -9.3 L 8.7 -6.9 L 9.2 -4.4 L 11.5 -2.7 L 14.9 -1.6 L 17.8 -.2 L 19.7 1.1 L 20.9 3.2 L 21.1 5.5 L 19.5 6.6 L 16.3 6.9 L 12.4 6.7 L 8.6 5.9 M 13.5 11.1 L 15.5 -14.8","0 30.2 M 9.9 -11.2 L 8.4 -9.8 L 8.2 -7.2 L 10.1 -5.6 L 12.8 -5.7 L 15.2 -7.6 L 15.8 -10.2 L 14.7 -11.8 L 12.4 -12.4 M 29.9 1.8 L 28.4 3.3 L 28.1 5.9 L 30.1 7.5 L 32.7 7.4 L 35.2 5.5 L 35.7 2.9 L 34.6 1.3 L 32.3 .7 M 26.7 -16.8 L 20.3 -.7 L 18.1 6.2 L 17.6 9.8","0 16.4 M 21.1 -1.6 L 19.4 2.2 L 16.6 5.6 L 13.6 7.0 L 10.5 6.4 L 9.2 4.2 L 9.5 2.3 L 12.3 -.1 L 16.4 -3.3 L 17.5 -5.7 L 17.9 -8.3 L 17.1 -10.6 L 15.4 -12.2 L 13.1 -12.1 L 11.2 -10.4 L 10.3 -7.7 L 10.2 -5.2 L 11.3 -2.2 L 13.0 1.1 L 15.3 3.9 L 19.1 6.6 L 21.0 6.8","0 4.5 M 9.2 -17.1 L 8.5 -13.7 L 8.5 -10.8","0 10.2 M 14.6 -17.1 L 11.4 -9.1 L 9.4 -1.9 L 9.0 5.0 L 10.9 12.1 L 15.3 20.3","0 10.7 M 8.3 -17.2 L 13.2 -11.8 L 15.3 -5.1 L 16.2 1.4 L 15.5 9.8 L 12.6 20.0","0 16.4 M 15.0 8.7 L 15.9 -5.9 M 10.6 6.9 L 15.8 .3 L 17.1 -1.7 L 20.1 -3.8 M 9.0 1.6 L 21.9 1.0 M 11.1 -3.4 L 18.6 5.0 L 20.9 6.9","0 12.8 M 13.3 -4.2 L 13.6 2.0 L 14.3 5.4 M 9.0 1.6 L 13.1 1.4 L 18.4 .3","0 6.7 M 12.0 8.1 L 11.4 10.5 L 8.8 14.6","0 10.6 M 8.5 1.6 L 16.0 1.5","0 6.8 M 10.9 6.4 L 10.9 7.4 L 12.1 7.4 L 12.1 6.5 L 10.9 6.4","0 12.7 M 18.1 -10.8 L 12.3 3.2 L 9.9 9.8 L 8.9 13.3 L 8.6 15.8","0 16.3 M 10.5 -6.2 L 8.5 -3.2 L 8.5 1.3 L 11.0 4.4 L 15.4 5.0 L 20.1 2.5 L 22.6 -.9 L 23.4 -5.1 L 21.4 -8.6 L 16.8 -10.7 L 14.4 -10.1 L 12.5 -8.9","0 7.8 M 10.4 -12.7 L 10.4 6.9","0 16.4 M 11.7 -8.1 L 11.7 -10.1 L 12.7 -11.8 L 14.9 -12.3 L 17.2 -11.2 L 17.4 -8.7 L 15.0 -4.9 L 11.6 -.1 L 10.1 2.4 L 10.1 4.4 L 11.7 6.2 L 14.8 6.6 L 19.1 6.7","0 16.4 M 9.6 6.9 L 13.9 6.3 L 16.8 4.8 L 19.3 3.2 L 19.7 1.5 L 19.2 .2 L 15.6 -1.9 L 14.4 -3.1 L 14.4 -4.3 L 15.1 -5.5 L 17.2 -7.0 L 18.8 -9.3 L 18.5 -10.8 L 16.8 -12.4 L 13.9 -12.7 L 11.7 -12.1 L 10.0 -11.7","0 16.4 M 12.6 -12.5 L 10.8 -9.0 L 10.1 -5.3 L 10.4 -2.8 L 12.5 -.1 L 14.8 .8 L 16.9 .3 L 18.5 -.5 L 19.6 -1.5 L 18.8 1.3 L 18.7 4.0 L 19.4 6.4 L 20.0 7.0","0 16.6 M 11.0 -11.6 L 10.9 -8.3 L 12.2 -5.7 L 15.7 -2.1 L 18.4 1.1 L 18.4 4.0 L 16.1 6.3 L 13.0 6.7 L 11.1 6.5 L 8.5 5.1 M 14.7 -10.4 L 18.8 -11.8 L 21.4 -12.5","0 16.3 M 20.9 -12.6 L 14.5 -8.2 L 10.7 -3.9 L 8.8 .3 L 8.9 4.3 L 11.1 6.6 L 15.6 6.5 L 18.6 4.6 L 20.3 1.5 L 20.0 -1.5 L 18.1 -3.0 L 15.2 -2.9 L 13.3 -1.4","0 16.4 M 9.8 -10.9 L 13.1 -11.3 L 18.4 -12.4 L 19.6 -12.2 L 20.6 -10.7 L 20.5 -8.8 L 19.3 -6.4 L 15.9 .7 L 14.5 6.8","0 16.2 M 11.5 -9.3 L 10.3 -7.4 L 11.2 -4.5 L 13.1 -2.5 L 16.2 .1 L 17.8 2.3 L 18.3 4.3 L 17.6 5.9 L 15.5 6.8 L 12.6 6.4 L 10.5 4.4 L 10.4 2.2 L 11.6 .3 L 12.9 -.9 L 18.9 -6.0 L 19.8 -8.7 L 18.7 -11.1 L 16.9 -12.2 L 15.2 -12.5 L 13.5 -11.5","0 16.3 M 15.8 6.8 L 18.5 3.6 L 19.7 -.1 L 20.0 -3.9 L 19.6 -7.0 L 19.1 -9.4 L 19.7 -6.1 L 17.5 -4.2 L 13.7 -3.3 L 11.3 -4.1 L 9.9 -6.8 L 10.8 -10.3 L 13.0 -12.3 L 15.8 -12.5 L 17.0 -11.8","0 7.3 M 11.1 -2.7 L 11.1 -1.7 L 12.4 -1.7 L 12.4 -2.6 L 11.1 -2.7 M 11.0 6.0 L 11.0 7.0 L 12.2 7.0 L 12.2 6.1 L 11.0 6.0","0 7.3 M 11.3 -2.8 L 11.3 -1.8 L 12.5 -1.8 L 12.5 -2.7 L 11.3 -2.8 M 11.9 6.2 L 11.4 9.0 L 9.8 11.7 L 8.3 13.4","0 15.7 M 20.8 -11.3 L 15.1 -6.3 L 9.8 -2.5 L 8.5 -1.4 L 8.1 .3 L 9.3 1.7 L 12.8 2.7 L 15.9 4.2 L 20.1 6.9","0 16.8 M 8.6 -1.4 L 13.4 -2.0 L 16.2 -1.9 L 21.5 -1.3 M 9.1 5.4 L 15.1 4.8 L 22.1 4.8","0 16.8 M 8.4 -12.5 L 15.5 -6.5 L 19.2 -4.0 L 20.7 -2.4 L 21.0 -.7 L 20.4 .2 L 18.8 1.3 L 9.4 6.7","0 11.7 M 10.8 6.3 L 10.8 7.3 L 12.1 7.3 L 12.1 6.4 L 10.8 6.3 M 11.6 1.2 L 11.8 -1.1 L 15.9 -8.7 L 16.5 -12.3 L 16.0 -14.8 L 13.8 -16.6 L 10.8 -16.6 L 9.0 -15.0 L 8.1 -12.9 L 9.0 -11.3","0 22.5 M 22.1 -3.5 L 21.3 .5 L 18.9 4.3 L 16.4 5.9 L 14.0 5.1 L 13.3 1.6 L 14.8 -1.0 L 16.8 -1.5 L 18.7 -.1 L 20.2 2.8 L 22.1 4.2 L 24.6 3.2 L 26.9 .6 L 28.0 -2.7 L 27.6 -6.0 L 25.4 -8.4 L 22.2 -9.3 L 17.0 -8.0 L 12.6 -4.8 L 9.7 -.3 L 9.1 5.0 L 10.3 9.7 L 13.9 12.4 L 19.7 11.4 L 23.2 9.8 L 25.8 8.1","0 17.7 M 8.5 6.9 L 10.6 -4.0 L 12.6 -9.5 L 14.1 -11.9 L 15.7 -12.5 L 16.4 -12.3 L 17.5 -10.5 L 18.8 -6.2 L 19.8 -.1 L 20.1 3.8 L 20.1 5.2 L 19.4 6.6 L 18.3 7.0 L 17.2 6.7 L 16.1 5.9 L 14.1 2.3 L 14.3 .7 L 15.2 -.6 L 16.8 -1.7 L 19.6 -2.6 L 22.6 -3.1","0 16.8 M 9.8 2.3 L 9.0 .1 L 8.5 -3.2 L 8.8 -6.6 L 9.5 -9.0 L 10.5 -10.7 L 11.9 -12.1 L 13.3 -12.4 L 14.7 -12.1 L 15.6 -10.4 L 15.5 -8.4 L 14.6 -5.8 L 14.4 -3.9 L 14.9 -2.3 L 16.2 -1.9 L 18.4 -1.6 L 21.0 -.8 L 22.2 .7 L 21.8 3.2 L 19.8 5.1 L 16.8 6.6 L 14.6 6.9 L 13.0 6.6 L 11.8 5.8","0 15.9 M 20.3 -11.5 L 18.3 -12.4 L 14.9 -12.1 L 11.9 -9.9 L 10.0 -7.3 L 9.0 -4.2 L 8.7 -.7 L 9.3 2.6 L 11.1 5.4 L 14.2 6.9 L 18.1 6.6 L 21.0 4.8","0 16.8 M 8.7 3.5 L 8.3 -1.5 L 8.4 -5.5 L 8.9 -8.9 L 10.2 -11.4 L 12.7 -12.4 L 15.6 -12.5 L 18.5 -11.2 L 20.9 -8.9 L 21.6 -5.8 L 21.3 -3.1 L 19.0 -.4 L 9.4 8.1","0 16.4 M 21.3 -12.5 L 15.4 -12.3 L 10.0 -11.2 L 9.0 -7.4 L 8.5 -3.2 L 12.4 -3.7 L 15.8 -3.9 L 18.7 -3.4 L 15.8 -3.9 L 12.6 -3.7 L 8.5 -3.2 L 8.2 1.6 L 8.5 4.0 L 9.8 5.9 L 11.7 6.8 L 15.4 6.8 L 18.6 6.0 L 21.3 4.7","0 16.4 M 22.5 -12.1 L 18.4 -12.7 L 13.5 -12.1 L 9.7 -10.5 L 8.2 -8.9 L 8.2 -5.2 L 9.1 -.3 L 11.3 4.6 L 13.2 7.0 L 12.4 -.7 L 12.6 -6.6 L 12.5 -2.9 L 16.8 -2.6 L 19.6 -3.1","0 16.8 M 20.0 -8.0 L 20.5 -9.5 L 20.0 -11.5 L 18.4 -12.5 L 15.1 -12.5 L 11.8 -9.7 L 9.6 -6.4 L 8.0 -2.4 L 8.0 1.3 L 9.7 4.8 L 12.5 6.9 L 15.4 6.6 L 17.4 5.1 L 18.1 3.8 L 18.3 1.5 L 17.9 .0 L 17.9 -1.5 L 18.9 -2.6 L 20.2 -2.9 L 21.9 -2.9","0 18.3 M 11.8 -12.6 L 12.4 -6.6 L 13.6 -1.1 L 14.2 2.2 L 14.3 5.4 L 13.2 6.6 L 11.8 6.8 L 9.7 6.2 L 8.5 4.8 L 7.9 2.8 L 8.2 1.1 L 9.3 .2 L 12.9 -1.5 L 16.2 -3.3 L 18.7 -5.2 L 20.5 -7.2 L 21.2 -8.6 L 21.6 -11.9 L 21.5 -5.2 L 22.0 1.1 L 23.2 6.8","0 7.3 M 10.1 -11.4 L 10.0 2.8 L 10.8 6.9","0 17.1 M 10.0 1.1 L 8.7 2.6 L 8.2 4.1 L 9.0 5.9 L 11.4 6.9 L 15.1 6.9 L 18.6 5.6 L 20.8 3.6 L 21.6 1.6 L 21.0 -3.4 L 20.7 -8.4 L 20.9 -10.7 L 21.3 -12.4","0 17.9 M 8.9 -10.3 L 8.3 3.4 L 9.1 6.0 L 10.4 7.0 L 12.2 6.7 L 13.2 4.8 L 19.4 -8.0 L 22.8 -12.5 L 19.4 -8.0 L 17.0 -2.9 L 18.8 .4 L 21.0 4.6 L 22.8 6.8","0 13.9 M 9.6 -12.6 L 9.7 -6.6 L 8.6 1.7 L 8.8 4.3 L 10.4 5.7 L 13.2 6.4 L 18.8 6.6","0 21.2 M 9.7 6.8 L 8.7 4.8 L 8.7 .3 L 8.9 -5.0 L 10.2 -10.4 L 11.1 -8.1 L 12.1 -5.8 L 13.0 -4.3 L 14.6 -3.1 L 16.4 -3.4 L 18.9 -4.9 L 21.0 -7.1 L 22.8 -9.4 L 24.0 -11.9 L 23.8 -7.2 L 24.4 -1.1 L 25.1 3.6 L 26.3 6.9","0 20.9 M 9.3 7.9 L 12.3 -12.3 L 12.9 -10.9 L 13.8 -7.2 L 15.0 -1.7 L 16.1 2.0 L 17.8 5.8 L 19.0 6.9 L 20.7 6.7 L 22.1 5.0 L 23.1 2.4 L 25.8 -12.6","0 19.7 M 11.3 -6.7 L 9.0 -4.3 L 8.2 -1.1 L 8.4 1.9 L 9.9 4.7 L 12.5 6.6 L 16.7 7.1 L 19.6 5.8 L 22.6 2.8 L 24.3 -.8 L 24.2 -5.2 L 23.1 -9.3 L 20.1 -11.7 L 16.1 -12.6 L 12.8 -11.3","0 16.5 M 10.6 8.1 L 10.6 6.1 L 8.1 -2.8 L 8.5 -7.1 L 10.6 -10.3 L 14.4 -12.1 L 18.4 -12.3 L 20.8 -10.2 L 21.5 -7.1 L 20.4 -4.4 L 18.3 -3.0 L 13.4 -1.0","0 21.4 M 18.3 -6.6 L 15.8 -7.8 L 13.6 -7.5 L 10.4 -5.4 L 8.8 -1.9 L 8.4 1.7 L 10.2 4.9 L 13.2 6.4 L 18.3 6.7 L 22.2 5.0 L 25.3 1.7 L 26.7 -2.7 L 26.5 -7.0 L 24.6 -10.1 L 21.0 -12.2 L 17.4 -12.3 L 15.0 -10.8 L 13.6 -9.4 L 12.8 -6.7 L 12.8 -4.4 L 14.5 -1.6 L 16.9 -.1 L 19.9 1.3 L 22.6 2.9 L 24.6 4.7 L 26.9 9.3","0 20.2 M 9.6 6.9 L 8.5 2.6 L 8.8 -2.9 L 11.3 -7.6 L 14.3 -10.6 L 18.4 -12.1 L 22.2 -12.4 L 24.6 -11.1 L 25.7 -9.1 L 25.4 -7.2 L 22.8 -4.4 L 19.0 -2.1 L 17.0 -.3 L 16.5 1.9 L 17.6 3.9 L 19.8 5.2 L 22.9 6.6 L 25.2 6.8","0 19.5 M 8.7 6.9 L 13.9 7.0 L 19.3 6.2 L 23.0 5.4 L 24.4 3.6 L 23.9 1.3 L 21.6 -.3 L 18.3 -1.3 L 14.7 -3.1 L 12.8 -4.5 L 11.8 -6.5 L 12.8 -9.1 L 15.1 -11.3 L 18.7 -12.3 L 21.8 -12.2 L 23.4 -10.1 L 23.2 -8.0 L 21.9 -6.4","0 15.8 M 8.4 -12.0 L 13.1 -12.5 L 17.6 -12.3 L 20.0 -11.4 L 22.1 -10.7 L 22.5 -10.1 L 22.0 -9.8 L 20.3 -9.8 L 17.9 -8.9 L 14.7 -5.5 L 13.7 -1.5 L 13.7 2.3 L 15.1 7.0","0 16.7 M 9.6 -9.4 L 8.7 -5.2 L 8.5 -1.4 L 9.2 2.9 L 11.5 6.0 L 14.3 6.9 L 17.5 5.8 L 20.0 2.5 L 21.3 -1.8 L 21.5 -6.8 L 21.4 -10.3 L 21.1 -12.5","0 18.3 M 8.2 -12.5 L 8.6 -5.7 L 9.6 -.9 L 11.0 3.7 L 11.9 5.5 L 13.1 6.7 L 14.3 6.9 L 15.7 6.1 L 16.4 4.6 L 17.3 .7 L 18.5 -5.2 L 20.1 -9.3 L 21.0 -11.1 L 22.2 -12.2 L 23.5 -12.5","0 29.8 M 8.7 -9.3 L 8.8 -4.5 L 9.4 -.1 L 10.8 3.4 L 12.4 6.1 L 14.0 6.9 L 15.2 6.2 L 19.7 -5.9 L 20.6 -7.2 L 21.5 -7.7 L 23.0 -7.6 L 23.6 -6.0 L 25.4 4.4 L 25.9 5.4 L 26.9 6.0 L 27.8 5.7 L 28.6 4.3 L 31.3 -3.8 L 33.2 -8.8 L 35.0 -12.3","0 19.3 M 9.3 6.7 L 13.0 1.6 L 17.7 -4.4 L 21.3 -8.4 L 23.2 -9.8 M 9.3 -12.5 L 12.0 -10.0 L 16.2 -2.3 L 18.9 2.5 L 20.9 5.1 L 22.6 6.4 L 23.9 6.7","0 16.8 M 8.6 -12.5 L 9.7 -9.2 L 12.1 -6.9 L 15.3 -6.0 L 17.6 -6.6 L 19.6 -8.0 L 21.1 -9.2 L 22.2 -10.9 L 21.7 -8.5 L 20.8 -5.6 L 18.0 -.2 L 16.1 3.9 L 15.4 6.9","0 17.4 M 8.5 -10.4 L 13.4 -11.6 L 17.1 -12.3 L 20.0 -12.3 L 21.8 -11.3 L 22.1 -10.0 L 21.8 -7.8 L 18.9 -5.1 L 12.9 -.8 L 10.7 .8 L 9.7 2.6 L 9.6 4.0 L 10.1 5.5 L 12.1 6.4 L 14.8 6.9 L 21.2 6.6 L 22.4 6.0","0 14.5 M 17.1 -15.4 L 15.5 -16.6 L 14.6 -16.9 L 10.1 -15.4 L 9.3 -14.4 L 9.6 -10.9 L 10.1 -4.2 L 9.6 6.4 L 9.1 14.0 L 9.9 16.3 L 12.8 17.4 L 15.9 17.2 L 18.9 16.2","0 13.1 M 8.4 -10.2 L 12.1 2.1 L 18.1 16.0","0 13.6 M 9.4 -16.2 L 13.0 -16.8 L 15.5 -15.9 L 17.3 -13.9 L 17.6 -10.9 L 16.3 6.1 L 17.4 8.3 L 18.6 11.8 L 19.1 14.6 L 18.2 16.6 L 16.3 17.5 L 8.6 16.4","0 12.7 M 8.5 -8.5 L 12.9 -13.8 L 13.9 -14.0 L 14.5 -13.4 L 17.6 -8.4","0 19.8 M 9.3 6.7 L 13.7 6.0 L 18.6 6.6 L 22.1 6.8 L 27.1 6.6","0 8.2 M 8.0 -14.7 L 11.0 -10.5 L 13.2 -8.4","0 14.4 M 17.7 -1.6 L 16.6 -3.3 L 13.5 -3.7 L 10.0 -1.5 L 8.1 2.0 L 8.0 4.9 L 10.2 7.3 L 14.5 5.8 L 16.3 4.4 L 18.7 2.2 L 18.8 4.8 L 19.6 6.6 L 20.5 6.9 L 21.4 6.3 L 22.4 4.5","0 15.1 M 11.8 -17.0 L 9.7 -9.6 L 8.7 -2.3 L 9.0 2.2 L 12.1 -1.6 L 15.6 -3.7 L 18.4 -3.2 L 19.3 .1 L 17.7 4.4 L 14.6 6.8 L 11.0 6.4","0 9.9 M 15.4 -3.3 L 12.3 -3.7 L 9.5 -2.0 L 7.2 1.5 L 8.3 5.8 L 12.1 7.2 L 15.1 6.4 L 17.9 4.6","0 16.5 M 17.9 -2.3 L 14.7 -3.8 L 11.5 -2.8 L 8.8 .0 L 7.6 3.3 L 8.6 6.3 L 12.0 6.8 L 15.3 4.1 L 17.1 .4 L 19.4 -8.1 L 20.5 -16.8 L 19.1 2.2 L 19.6 4.8 L 21.6 6.9 L 22.5 7.0 L 23.3 6.6 L 24.5 4.5","0 10.1 M 8.2 4.6 L 11.9 3.7 L 14.6 1.0 L 14.9 -1.5 L 14.1 -3.2 L 11.2 -3.9 L 7.8 -1.6 L 7.1 2.0 L 7.6 4.1 L 10.3 6.6 L 13.9 6.9 L 17.5 5.6 M 17.6 5.5 L 18.2 4.5","0 13.5 M 14.1 20.1 L 12.7 15.6 L 11.6 5.6 L 11.5 -4.2 L 12.7 -11.7 L 14.7 -15.3 L 17.2 -16.0 L 18.7 -14.2 L 19.5 -10.2 L 17.7 -5.2 L 15.0 -1.7 M 9.1 9.5 L 12.8 7.3 L 15.2 6.6 L 18.7 6.2","0 10.7 M 16.8 -2.5 L 14.6 -3.9 L 11.4 -3.3 L 8.8 -.9 L 8.8 2.4 L 12.0 6.6 L 14.8 9.8 L 16.7 13.4 L 16.5 18.3 L 14.0 20.3 L 11.3 19.6 L 10.3 16.8 L 11.8 12.8 L 18.0 5.9 L 18.7 4.5","0 16.3 M 9.9 -16.8 L 8.5 -4.9 L 7.9 1.0 L 7.8 4.1 L 8.5 6.4 L 9.6 6.8 L 10.8 6.3 L 13.6 .9 L 15.1 -2.3 L 17.4 -3.7 L 19.2 -3.8 L 20.2 -1.4 L 20.2 4.8 L 20.7 6.7 L 21.4 7.3 L 22.1 7.3 L 23.0 6.8 L 24.3 4.5","0 7.3 M 8.6 -3.9 L 7.7 .9 L 8.0 4.7 L 10.3 6.9 L 13.5 6.4 L 14.5 5.9 L 15.3 4.5 M 10.0 -11.6 L 11.0 -10.0","0 9.3 M 12.2 -3.8 L 12.2 .3 L 13.4 5.3 L 14.3 9.9 L 14.7 15.4 L 12.9 19.4 L 9.5 20.3 L 7.9 18.0 L 8.9 15.2 L 12.1 9.8 L 16.6 5.8 L 17.3 4.5 M 12.0 -11.1 L 12.2 -9.3","0 13.6 M 8.8 -16.7 L 7.7 -9.7 L 7.7 -3.6 L 7.7 .7 L 8.0 4.9 L 9.0 4.9 L 9.2 4.2 L 9.9 .7 L 12.9 -2.3 L 15.2 -3.4 L 17.5 -3.9 M 13.3 1.5 L 15.4 5.4 L 17.7 7.0 L 19.5 6.7 L 20.8 6.0 L 21.6 4.6","0 8.6 M 10.0 -1.7 L 12.7 -4.7 L 14.5 -9.3 L 14.3 -13.7 L 12.2 -15.8 L 9.1 -15.0 L 7.4 -10.9 L 6.8 -5.2 L 6.9 1.3 L 8.3 5.4 L 11.8 7.0 L 15.9 5.8 L 16.6 4.5","0 34.6 M 42.6 4.5 L 42.0 5.5 L 39.9 6.9 L 38.6 6.9 L 37.3 5.8 L 37.1 1.7 L 36.8 -.5 L 34.7 -1.8 L 33.6 -.9 L 31.8 1.0 L 29.4 5.1 L 27.3 6.8 L 25.5 6.6 L 24.8 4.9 L 24.8 .9 L 24.4 -1.7 L 22.7 -2.9 L 21.3 -2.5 L 20.0 -1.1 L 16.1 5.1 L 14.2 5.8 L 12.7 5.3 L 12.3 3.4 L 12.1 -2.4 L 11.3 -3.1 L 10.8 -1.4 L 9.6 1.7 L 8.8 3.0 L 7.9 4.6","0 19.4 M 24.2 6.9 L 23.1 5.8 L 22.4 3.0 L 22.4 -.7 L 21.6 -2.4 L 19.9 -2.8 L 17.9 -1.7 L 15.4 1.6 L 13.0 6.6 L 12.5 3.4 L 12.0 -.7 L 10.7 -3.1 L 10.1 -2.7 L 9.6 -.7 L 9.1 2.2 L 8.0 4.5 M 24.2 7.0 L 25.3 7.0 L 26.5 6.3 L 27.5 4.5","0 12.7 M 9.3 -1.8 L 8.1 .5 L 8.5 3.9 L 9.9 6.1 L 14.0 7.0 L 17.8 5.0 L 19.8 1.4 L 19.3 -1.6 L 16.8 -3.6 L 13.8 -3.7 L 12.6 -3.0","0 20.6 M 19.8 6.3 L 21.8 6.9 L 23.6 6.6 L 25.0 4.8 L 26.0 .8 L 24.8 -2.6 L 21.8 -4.0 L 18.6 -2.6 L 16.4 -.1 L 14.3 5.4 L 12.5 20.2 L 12.3 8.7 L 12.1 3.2 L 11.1 1.1 L 9.9 .5 L 9.0 1.0 L 8.5 2.3 L 8.0 4.5","0 14.8 M 19.1 -1.8 L 17.5 -3.3 L 14.9 -3.8 L 11.1 -2.1 L 9.5 .3 L 8.8 3.7 L 10.0 6.7 L 13.4 6.6 L 16.3 4.9 L 19.4 1.6 L 18.7 10.1 L 18.9 15.5 L 19.4 20.0","0 16.2 M 8.6 .4 L 8.1 -1.9 L 10.2 -3.5 L 14.0 -3.9 L 16.8 -2.9 L 17.7 .5 L 18.9 4.8 L 20.2 6.6 L 22.5 6.7 L 23.2 6.2 L 24.2 4.5","0 17.3 M 8.0 4.6 L 9.5 2.2 L 13.2 -1.6 L 16.1 -3.5 L 18.1 -4.0 L 20.4 -3.3 L 22.4 -1.0 L 22.7 2.4 L 21.1 5.5 L 17.5 6.9 L 15.5 6.6 L 14.6 5.7","0 11.9 M 12.6 -14.5 L 12.0 1.1 L 12.9 4.6 L 15.0 6.9 L 17.5 6.5 L 19.3 5.6 L 19.9 4.5 M 8.5 -3.9 L 13.0 -3.8 L 17.4 -4.5","0 20.7 M 12.0 -1.7 L 11.6 2.4 L 12.8 5.6 L 15.6 7.1 L 19.0 5.7 L 21.0 3.0 L 22.1 -2.7 L 22.7 3.8 L 24.5 6.6 L 26.6 6.7 L 28.1 5.6 L 28.7 4.5","0 19.3 M 10.9 -1.6 L 11.3 2.2 L 12.8 5.8 L 14.8 6.8 L 17.5 6.0 L 19.3 2.8 L 21.8 -2.5 L 23.4 -3.8 L 25.0 -3.8 L 25.9 -2.3","0 30.2 M 12.9 -2.8 L 12.6 3.0 L 13.5 5.6 L 15.9 6.9 L 18.8 5.6 L 21.4 2.5 L 24.4 -2.9 L 24.6 1.2 L 25.7 4.4 L 27.3 4.9 L 30.4 3.6 L 33.5 .9 L 35.6 -1.9 L 36.1 -4.2 L 36.3 -.5 L 37.5 1.1","0 20.9 M 11.8 -3.6 L 18.2 4.3 L 20.9 5.8 L 24.5 5.8 L 26.2 2.8 L 25.7 -.8 L 23.4 -2.7 L 20.3 -2.7 L 17.8 -.3 L 15.3 5.1 L 13.3 11.5","0 16.5 M 8.7 -2.6 L 8.5 .7 L 9.0 4.0 L 12.2 6.0 L 16.0 4.3 L 18.0 1.3 L 18.7 -.8 L 18.7 -3.3 L 21.5 9.5 L 21.7 13.4 L 21.4 17.2 L 19.7 20.1 L 17.4 20.1 L 16.0 18.2 L 16.6 14.6 L 19.4 10.4 L 22.1 7.6 L 23.0 6.7 L 23.9 5.6 L 24.5 4.5","0 16.0 M 9.3 .7 L 8.6 -1.0 L 9.7 -3.3 L 13.2 -4.0 L 16.0 -3.8 L 17.8 -1.7 L 17.6 1.3 L 16.7 5.2 L 17.5 7.5 L 19.8 11.5 L 20.7 14.9 L 19.1 18.8 L 16.6 20.5 L 14.0 18.5 L 15.0 15.1 L 17.1 12.0 L 22.8 6.6 L 24.0 4.5","0 13.4 M 15.2 -13.5 L 15.4 -9.0 L 13.5 -3.2 L 10.3 2.1 L 12.3 2.8 L 13.6 4.4 L 13.3 8.8 L 14.5 13.4 L 16.8 15.2 L 18.6 15.9","0 7.8 M 12.8 -15.6 L 11.9 -4.3 L 11.6 11.3","0 11.1 M 8.6 -16.2 L 10.6 -16.8 L 12.4 -16.2 L 13.3 -14.2 L 12.5 -10.8 L 11.9 -4.4 L 13.1 -1.5 L 14.7 -.6 L 16.7 -.4 L 14.5 1.5 L 13.2 4.5 L 12.9 9.2 L 13.9 12.8 L 14.8 14.4","0 14.1 M 8.4 -.3 L 9.5 -2.1 L 10.9 -2.6 L 13.0 -1.5 L 14.8 .1 L 16.8 .1 L 18.7 -1.8","0 9.7 M 9.0 -16.1 L 7.8 -14.2 L 8.7 -11.6 L 11.9 -10.4 L 14.6 -12.2 L 15.2 -14.7 L 13.7 -16.8 L 11.5 -16.8"]
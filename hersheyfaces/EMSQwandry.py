@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 10.1 M 20.9 -10.4 L 14.6 1.8 L 13.8 4.5 M 12.6 7.4 L 11.5 9.5 L 13.6 7.6 L 12.6 7.4","0 8.5 M 11.0 -5.9 L 10.5 -6.6 L 11.5 -6.8 L 12.0 -5.5 L 10.2 -2.7 M 14.3 -5.9 L 13.8 -6.6 L 14.9 -6.8 L 15.3 -5.5 L 13.5 -2.7","0 32.6 M 25.2 -13.0 L 17.8 7.1 M 33.7 -12.7 L 26.4 7.2 M 12.9 1.0 L 35.7 1.0 M 15.9 -6.9 L 38.7 -6.9","0 21.2 M 25.0 -10.3 L 26.6 -11.3 L 26.9 -12.6 L 25.9 -13.2 L 21.3 -12.5 L 18.2 -10.9 L 16.6 -8.9 L 16.3 -7.1 L 21.1 -1.4 L 21.7 .1 L 20.7 1.7 L 19.0 2.2 L 16.8 2.2 L 15.7 2.1 L 14.2 1.1 M 17.4 2.4 L 16.0 4.6 L 15.8 6.5 M 23.4 -13.0 L 24.6 -14.7 L 25.0 -16.6","0 27.8 M 22.0 -14.9 L 20.0 -13.9 L 17.3 -11.0 L 15.1 -7.5 L 15.3 -5.5 L 16.2 -4.4 L 17.8 -4.7 L 22.2 -9.3 L 23.1 -10.5 L 23.4 -13.3 L 23.0 -15.2 L 21.9 -15.4 L 21.0 -14.6 L 22.1 -12.8 L 24.7 -12.2 L 29.5 -13.4 L 33.2 -14.7 L 34.0 -14.0 L 22.5 -.4 L 17.6 6.5 L 15.6 10.0 L 15.3 11.8 L 15.4 13.0 M 29.5 1.5 L 28.0 1.5 L 25.3 3.7 L 22.7 7.3 L 21.9 9.8 L 22.5 11.4 L 24.4 11.8 L 26.6 9.9 L 28.9 7.4 L 30.1 5.5 L 30.6 2.9 L 30.2 1.1 L 28.6 1.0 L 29.1 3.1 L 31.1 3.4","0 24.3 M 29.9 -9.3 L 26.3 -9.7 L 22.3 -8.0 L 19.9 -6.2 L 19.3 -5.1 L 19.3 -4.2 L 20.6 -3.3 L 25.6 -3.4 L 21.2 -3.3 L 17.5 -2.0 L 13.9 1.1 L 12.4 3.8 L 13.2 7.2 L 15.0 8.8 L 18.2 9.3 L 22.6 8.5 L 25.9 6.6 L 27.4 4.3 L 27.7 2.1 L 27.3 .8 L 25.8 -.3 L 23.1 -.6 L 20.0 .3 L 18.6 1.6 M 32.3 -11.4 L 29.3 -8.6 L 28.3 -7.0 L 28.2 -5.8 M 32.1 -6.0 L 32.7 -4.8 L 31.5 -3.8 L 27.9 -1.6 L 22.6 1.0 L 18.2 4.1 L 16.6 6.2 L 16.7 9.4 L 18.6 11.8 L 21.0 12.7 L 22.2 12.6","0 7.8 M 14.5 -10.4 L 14.5 -11.0 L 15.6 -10.3 L 14.6 -7.9 L 13.2 -6.4","0 14.2 M 30.1 -17.1 L 22.7 -15.2 L 15.9 -10.4 L 11.9 -5.9 L 9.9 -1.5 L 9.3 2.3 L 10.2 6.7 L 12.1 8.8 L 14.2 9.8 L 15.8 9.9","0 23.7 M 23.6 -17.1 L 26.9 -16.3 L 29.4 -13.9 L 30.5 -11.1 L 30.2 -6.7 L 28.3 -1.7 L 24.4 2.8 L 19.8 6.5 L 13.0 9.6 L 9.2 10.0","0 13.7 M 14.3 1.0 L 16.1 -7.3 M 11.7 -.6 L 18.6 -5.8 M 10.4 -3.2 L 19.4 -3.1 M 12.5 -6.5 L 18.3 .4","0 15.5 M 16.9 -5.4 L 16.0 -.1 L 15.3 3.2 L 14.2 6.1 M 10.4 1.1 L 16.6 .9 L 21.6 .3","0 7.6 M 12.6 8.3 L 12.4 7.8 L 13.3 7.6 L 13.7 8.7 L 13.3 10.1 L 11.8 11.7","0 11.5 M 10.0 1.2 L 14.1 1.0 L 17.7 .4","0 8.9 M 12.2 7.7 L 12.2 8.6 L 13.6 8.5 L 13.6 7.7 L 12.2 7.7","0 22.6 M 29.1 -14.6 L 20.1 -3.7 L 12.9 6.0 L 11.3 8.6 L 10.2 10.2 L 10.3 11.2 L 10.6 12.1","0 21.7 M 18.2 -5.9 L 16.9 -6.1 L 13.9 -3.1 L 10.9 1.9 L 9.9 4.6 L 10.4 7.3 L 12.2 8.7 L 15.0 8.8 L 19.4 7.0 L 24.5 2.4 L 27.7 -2.0 L 28.5 -5.8 L 27.2 -7.8 L 24.2 -9.3 L 18.7 -9.5 L 16.5 -9.2 L 14.0 -8.2","0 9.5 M 11.5 -4.7 L 15.7 -9.7 L 16.9 -9.5 L 12.7 -1.4 L 10.5 4.7 L 10.4 6.8 L 10.8 9.3","0 20.1 M 15.2 -4.5 L 14.6 -5.8 L 16.4 -7.2 L 21.8 -9.2 L 25.7 -9.5 L 27.5 -9.1 L 27.8 -6.9 L 22.9 -.8 L 15.9 4.7 L 10.4 8.2 L 16.4 7.5 L 21.2 7.2 L 23.1 7.3 L 24.0 7.7 L 24.5 8.8","0 20.4 M 15.9 -6.4 L 15.9 -7.6 L 16.6 -8.6 L 19.7 -9.6 L 23.0 -9.7 L 25.9 -9.1 L 27.7 -8.0 L 28.1 -6.6 L 25.9 -4.4 L 21.1 -2.4 L 16.5 -1.3 L 20.2 -1.5 L 22.9 -.9 L 24.1 -.1 L 25.2 1.5 L 24.9 3.8 L 21.1 7.3 L 16.4 9.2 L 13.2 9.1 L 10.6 7.7 L 9.8 5.5 L 10.1 3.3","0 18.5 M 20.9 -9.3 L 20.8 -8.4 L 13.4 -3.1 L 9.9 .5 L 10.0 1.9 L 14.7 .7 L 19.8 .4 L 23.7 .7 L 25.0 .9 L 25.5 1.5 L 25.0 2.6 M 24.7 -9.9 L 25.4 -8.8 L 24.7 -6.2 L 20.7 2.6 L 19.8 7.0 L 20.0 9.4 L 20.5 11.0","0 17.4 M 24.9 -9.6 L 21.5 -8.7 L 17.8 -8.6 L 15.2 -9.1 L 10.7 -1.2 L 11.1 -1.1 L 14.1 -3.1 L 17.6 -3.9 L 20.6 -3.6 L 22.4 -2.9 L 23.5 -.3 L 22.3 3.1 L 18.1 7.3 L 13.6 9.8 L 8.9 10.6 L 5.1 10.1 L 3.5 9.2 L 2.1 7.4","0 18.2 M 26.6 -10.8 L 25.5 -11.3 L 23.5 -11.1 L 19.7 -8.6 L 14.2 -3.0 L 10.6 2.5 L 9.5 5.5 L 9.4 7.0 L 10.3 8.8 L 12.7 9.6 L 15.7 9.1 L 19.8 7.0 L 23.5 3.3 L 24.2 1.0 L 23.7 -.6 L 22.2 -1.4 L 19.7 -1.2 L 17.3 -.2 L 14.6 1.6 L 13.7 3.0 L 13.3 3.9","0 16.4 M 10.5 -5.5 L 10.6 -6.7 L 11.5 -7.6 L 15.0 -8.6 L 19.3 -9.0 L 22.7 -8.9 L 24.6 -8.4 L 25.5 -8.1 L 24.7 -7.2 L 20.0 -4.3 L 14.9 .5 L 11.7 4.5 L 10.1 7.4 L 10.0 9.5 L 10.5 10.8","0 22.7 M 27.1 -9.5 L 25.0 -9.9 L 20.4 -8.2 L 17.1 -6.9 L 15.0 -5.4 L 14.4 -4.6 L 14.3 -3.1 L 19.3 1.3 L 21.2 3.3 L 21.3 5.7 L 19.5 7.8 L 16.4 8.7 L 13.4 8.8 L 11.2 8.5 L 10.3 7.3 L 11.8 4.2 L 14.4 2.2 L 26.5 -6.4 L 29.8 -9.7 L 31.0 -12.0","0 15.2 M 20.5 -7.7 L 19.9 -9.2 L 18.5 -10.3 L 16.2 -10.0 L 13.3 -8.5 L 10.5 -5.8 L 9.2 -3.8 L 9.5 -1.9 L 11.4 -.5 L 14.6 -1.1 L 16.7 -2.0 L 19.1 -3.4 L 21.8 -5.5 L 22.0 -5.5 L 18.2 .8 L 15.6 6.6 L 15.2 9.6 L 15.2 11.4 L 15.8 12.3 L 16.7 12.4","0 8.9 M 13.8 .7 L 13.8 1.9 L 14.9 1.9 L 14.9 .9 L 13.8 .7 M 12.4 7.6 L 12.3 8.5 L 13.6 8.5 L 13.6 7.5 L 12.4 7.6","0 8.9 M 13.6 .6 L 13.7 1.8 L 14.8 1.9 L 14.9 .8 L 13.6 .6 M 13.0 8.5 L 12.4 7.9 L 13.2 7.5 L 14.0 8.5 L 13.2 10.4 L 11.8 11.8","0 12.5 M 16.5 -5.9 L 12.6 -.2 L 16.4 4.0","0 15.2 M 11.1 -3.5 L 15.2 -3.1 L 18.3 -3.4 L 22.4 -3.9 M 10.2 .8 L 14.3 1.2 L 17.3 .9 L 21.4 .4","0 12.3 M 12.1 -5.4 L 15.8 -1.6 L 12.0 4.1","0 15.2 M 13.2 -6.4 L 12.6 -7.8 L 13.2 -8.9 L 15.2 -9.6 L 18.2 -10.0 L 21.8 -9.5 L 24.0 -8.6 L 24.8 -7.0 L 24.2 -5.6 L 20.4 -3.8 L 16.5 -2.0 L 14.1 -.6 L 12.7 .8 L 12.8 2.7 L 13.4 3.8 L 14.6 4.5 L 15.4 4.5 M 13.1 7.4 L 11.7 8.2 L 11.5 9.6 L 12.9 8.1","0 34.6 M 32.3 -9.3 L 31.6 -10.5 L 28.0 -11.1 L 24.9 -9.1 L 21.8 -5.9 L 20.0 -2.5 L 19.3 .7 L 20.3 2.2 L 21.9 2.2 L 24.7 -.4 L 27.9 -4.8 L 30.2 -7.4 L 30.6 -7.1 L 28.7 -3.0 L 28.8 .2 L 29.4 2.0 L 30.8 2.6 L 32.6 1.6 L 35.9 -2.5 L 38.1 -5.8 L 40.3 -9.4 L 40.6 -12.4 L 37.6 -15.2 L 32.1 -15.5 L 26.8 -14.0 L 21.3 -10.6 L 16.5 -5.7 L 14.1 -1.2 L 13.9 3.3 L 15.5 6.6 L 20.2 8.1 L 27.3 6.8 L 32.4 4.3 L 36.8 .4 L 38.8 -2.5 L 39.5 -5.0 L 39.0 -9.5","0 28.1 M 10.3 8.5 L 13.6 8.6 L 17.2 6.8 L 22.7 2.7 L 27.1 -1.2 L 30.4 -4.5 L 32.4 -6.9 L 33.5 -8.4 L 34.1 -9.9 M 40.4 -13.8 L 35.7 -5.3 L 32.9 -.3 L 31.0 4.8 L 30.2 8.2 L 30.2 10.7 L 31.0 12.8 M 17.0 1.6 L 19.1 2.0 L 25.8 1.6 L 32.3 .8","0 25.7 M 21.1 -10.5 L 16.3 -2.5 L 13.7 3.7 L 12.2 8.3 L 12.0 11.8 L 13.0 13.4 M 17.8 8.9 L 21.5 10.2 L 26.9 9.3 L 30.0 6.8 L 31.4 3.9 L 30.4 1.5 L 27.6 -.3 L 25.1 -.7 L 22.8 -1.2 L 20.3 -1.1 L 20.3 -.7 L 26.2 -2.5 L 31.9 -5.7 L 33.9 -8.1 L 34.3 -11.0 L 32.8 -12.8 L 28.0 -13.9 L 22.5 -13.8 L 17.1 -12.5 L 9.7 -10.1","0 24.9 M 34.8 -11.9 L 31.3 -13.3 L 25.2 -12.8 L 19.5 -10.0 L 15.1 -6.1 L 11.8 -1.7 L 10.7 2.6 L 10.9 6.0 L 13.3 9.3 L 17.0 11.0 L 21.6 10.7 L 26.2 9.2 L 29.0 7.6 L 31.6 5.2 M 32.1 -5.6 L 32.6 -7.5 L 34.0 -10.5 L 35.3 -12.7 L 36.7 -14.3","0 33.4 M 13.9 12.2 L 12.7 10.0 L 14.1 4.8 L 16.6 -1.4 L 21.8 -10.5 M 10.0 -9.7 L 16.0 -11.8 L 21.5 -12.9 L 27.0 -13.7 L 31.9 -13.2 L 35.8 -11.7 L 39.1 -8.8 L 39.8 -3.4 L 36.9 2.4 L 32.9 6.1 L 27.5 8.5 L 21.6 10.1 L 15.9 9.8","0 23.9 M 9.7 .2 L 13.5 1.0 L 19.3 .3 L 23.8 .0 L 26.9 -.8 M 30.0 -8.5 L 30.3 -10.5 L 31.3 -12.6 L 32.9 -15.0 M 31.8 -13.0 L 28.8 -13.6 L 22.6 -12.1 L 17.1 -8.4 L 13.3 -4.0 L 11.3 -.3 L 10.3 3.5 L 11.8 8.2 L 15.5 10.8 L 21.0 10.9 L 25.7 9.3 L 29.0 7.3 L 31.4 5.1","0 23.3 M 10.4 -8.3 L 15.6 -11.9 L 20.6 -13.8 L 24.1 -14.9 L 27.8 -15.0 L 30.6 -13.6 L 31.3 -10.5 L 30.5 -7.0 L 25.7 1.9 L 22.8 7.9 L 22.0 10.6 L 22.2 12.1 L 22.6 13.5 M 13.8 .7 L 17.5 .6 L 22.0 .1 L 31.0 -1.3","0 29.0 M 21.0 18.9 L 23.3 18.4 L 26.3 14.9 L 29.3 10.2 L 31.9 4.6 L 34.6 -1.2 L 30.0 4.8 L 26.6 7.7 L 22.2 10.3 L 18.4 11.0 L 13.9 9.9 L 11.3 7.5 L 10.3 3.3 L 11.2 -1.0 L 15.0 -6.5 L 21.0 -11.1 L 27.3 -13.3 L 31.6 -13.2 L 34.4 -12.1 L 35.8 -10.4 L 33.9 -8.3 L 32.5 -6.3 L 33.0 -10.0 L 34.3 -12.7 L 36.1 -14.8 M 22.9 .4 L 32.4 -.5 L 36.3 -1.3","0 26.4 M 23.7 -12.9 L 18.6 -3.7 L 15.3 3.7 L 13.5 9.7 L 13.4 12.6 L 13.5 13.8 L 14.1 14.7 M 10.0 .7 L 21.2 .3 L 27.0 -.3 L 31.6 -1.3 M 37.9 -11.4 L 33.4 -4.4 L 30.3 1.2 L 29.4 5.1 L 29.6 7.2 L 31.0 8.5 L 32.5 8.2","0 17.3 M 8.7 9.5 L 14.9 9.5 L 19.4 8.8 L 22.3 8.2 M 17.7 10.6 L 16.0 10.8 L 15.0 10.4 L 14.4 9.0 L 14.3 7.0 L 16.6 2.1 L 20.7 -4.7 L 28.1 -13.8 M 27.1 -12.3 L 22.7 -12.5 L 17.9 -11.3 L 15.4 -10.0 L 14.2 -8.6 L 14.1 -7.5","0 30.8 M 10.7 1.0 L 9.6 -.3 L 10.0 -2.9 L 14.2 -6.2 L 18.1 -8.6 L 25.4 -11.9 L 30.1 -13.3 L 34.4 -13.8 L 36.9 -13.5 L 39.7 -11.6 L 40.2 -8.6 L 38.4 -3.1 L 34.4 2.7 L 28.4 8.4 L 23.5 11.9 L 18.8 14.0 L 15.2 14.0 L 13.5 12.1 L 14.2 9.8 L 16.5 6.5 L 21.0 2.9 L 26.4 -.3 L 33.7 -3.9","0 22.3 M 18.5 -10.6 L 14.1 -2.8 L 11.1 3.5 L 9.8 7.9 L 9.9 10.7 L 10.2 12.0 L 10.7 12.4 M 35.4 -11.6 L 31.5 -11.7 L 27.8 -9.8 L 22.5 -5.5 L 19.1 -2.5 L 14.9 .2 L 16.7 3.6 L 18.4 6.6 L 20.9 9.5 L 23.4 12.0 L 26.1 13.3 L 28.6 13.6 L 29.9 12.7 L 30.5 11.0 L 29.5 9.2 L 27.7 7.0","0 22.9 M 17.1 1.5 L 17.7 1.3 L 21.9 -4.4 L 24.6 -8.9 L 27.0 -12.7 L 27.2 -14.5 L 26.6 -15.6 L 24.6 -16.1 L 22.7 -14.4 L 18.8 -8.0 L 15.9 -2.2 L 13.6 3.4 L 12.9 6.8 L 12.4 8.7 L 12.2 11.0 L 13.0 12.9 M 9.2 9.8 L 14.8 8.2 L 19.6 7.5 L 24.7 7.1 L 28.4 8.0 L 29.6 9.2 L 29.1 10.9 L 28.4 12.0","0 33.5 M 20.8 -13.4 L 13.9 -1.5 L 11.6 3.7 L 10.6 7.1 L 10.4 9.3 L 10.6 11.3 L 11.2 12.8 L 10.4 9.3 L 11.4 4.6 L 13.4 .4 L 16.9 -3.3 L 20.9 -7.8 L 23.8 -9.9 L 26.3 -10.9 L 28.4 -10.8 L 29.3 -9.6 L 28.7 -5.9 L 25.8 1.4 L 22.1 7.9 L 25.4 4.3 L 37.9 -8.3 L 40.1 -9.2 L 40.5 -9.4 L 38.1 -5.5 L 36.2 -.1 L 35.1 4.8 L 35.0 8.4 L 35.5 10.3 L 36.6 11.1 L 38.4 10.6 L 39.6 8.4 L 40.6 5.9","0 23.1 M 20.4 -13.7 L 15.3 -5.2 L 12.3 .7 L 11.3 4.0 L 10.9 7.9 L 11.0 10.1 L 11.3 11.5 L 10.8 9.3 L 11.5 6.7 L 14.1 3.7 L 19.1 -1.9 L 31.1 -12.5 L 28.4 -7.7 L 25.7 -.5 L 24.8 4.1 L 24.7 8.1 L 25.0 9.8 L 26.5 11.0 L 27.7 10.6 L 28.8 8.9 L 30.3 6.3","0 28.4 M 29.2 1.6 L 33.1 -1.2 L 36.0 -4.6 L 37.3 -8.1 L 36.6 -10.8 L 34.2 -12.2 L 31.3 -12.7 L 26.2 -12.2 L 20.1 -9.8 L 15.1 -5.9 L 12.1 -1.8 L 10.7 2.1 L 11.0 6.0 L 12.7 9.0 L 15.5 10.7 L 21.8 10.4 L 27.8 7.9 L 32.1 4.3 L 35.0 .7 L 35.9 -2.2 L 36.1 -4.0 L 35.0 -6.7 L 32.1 -8.9 L 29.5 -9.9 L 28.0 -9.9 L 25.4 -9.7","0 30.3 M 9.3 -7.9 L 14.2 -10.3 L 18.6 -11.8 L 24.0 -12.7 L 28.6 -12.8 L 33.0 -12.8 L 36.7 -11.7 L 39.5 -10.2 L 40.2 -8.3 L 39.6 -5.1 L 35.2 -2.0 L 30.3 .0 L 25.8 .5 L 21.2 -.4 M 28.2 -11.6 L 23.0 -4.2 L 19.3 2.3 L 17.4 7.4 L 16.8 10.3 L 17.2 12.4","0 28.9 M 10.4 -3.6 L 14.5 -7.9 L 19.7 -11.2 L 24.7 -12.6 L 28.7 -13.0 L 31.8 -12.2 L 34.5 -10.4 L 36.6 -6.7 L 36.3 -2.5 L 34.0 1.9 L 29.3 6.5 L 25.4 9.2 L 20.5 10.9 L 16.1 10.9 L 13.0 8.5 L 11.7 4.8 L 12.3 .9 L 15.4 -3.6 L 19.3 -6.8 L 22.3 -8.3 L 24.3 -8.7 L 27.0 -8.6 M 13.5 5.6 L 16.5 4.9 L 19.5 5.9 L 22.9 7.7 L 27.4 11.0 L 32.2 14.4 L 37.8 17.2 L 42.2 17.6 L 43.9 16.6 L 44.1 14.5 L 43.3 11.8 L 40.9 9.6 L 38.6 8.5 L 36.4 7.7 L 34.7 7.6","0 28.1 M 9.4 -8.0 L 14.4 -10.8 L 20.4 -12.4 L 24.7 -12.8 L 29.3 -13.0 L 34.6 -12.5 L 38.3 -11.1 L 40.2 -9.1 L 39.8 -6.1 L 37.0 -3.2 L 32.2 -.8 L 28.4 .4 L 25.0 .6 L 23.0 .4 L 19.2 .0 M 28.1 -11.0 L 22.9 -5.9 L 19.5 -1.1 L 17.6 2.7 L 16.4 6.3 L 16.2 8.7 L 16.3 10.1 L 16.9 10.7 M 19.0 -3.7 L 23.7 3.8 L 27.0 8.0 L 29.3 9.9 L 31.6 10.1 L 33.0 9.2 L 33.1 7.3","0 15.9 M 25.5 -9.1 L 28.7 -10.8 L 29.6 -11.6 L 29.7 -12.2 L 28.9 -13.6 L 27.6 -14.0 L 25.0 -13.7 L 22.1 -12.9 L 16.2 -10.6 L 14.0 -8.3 L 13.4 -5.8 L 14.2 -2.8 L 16.9 -.1 L 20.6 4.5 L 21.2 6.5 L 20.2 8.5 L 17.0 9.5 L 14.6 9.6 L 11.9 9.3 L 9.9 8.2","0 24.1 M 19.0 -7.5 L 15.1 -8.0 L 11.8 -9.7 L 9.9 -11.7 L 9.8 -13.2 L 10.5 -14.6 L 12.7 -15.0 L 16.1 -14.2 L 23.2 -12.6 L 30.7 -11.3 L 35.2 -10.6 L 39.1 -10.7 L 40.6 -11.7 L 40.7 -13.0 L 40.2 -13.8 L 37.7 -15.7 L 36.1 -16.2 M 30.6 -9.5 L 27.2 -6.6 L 23.7 -1.4 L 21.2 3.5 L 20.0 7.0 L 20.1 9.5 L 20.6 10.9 L 22.0 11.5 L 23.8 11.2 L 24.9 10.3","0 18.6 M 9.1 -4.7 L 13.4 -7.8 L 16.8 -10.0 L 18.5 -10.6 L 19.7 -10.1 L 19.8 -9.2 L 17.8 -5.5 L 14.0 .1 L 12.6 4.0 L 11.9 6.4 L 12.6 8.0 L 14.3 9.1 L 16.4 8.1 L 26.3 -.9 L 33.9 -9.7 L 35.2 -11.9 L 35.5 -13.0 L 34.7 -13.3 L 32.5 -12.2 L 28.9 -8.3 L 25.9 -4.0 L 24.1 -.3 L 22.2 4.8 L 21.6 9.5 L 22.0 12.9 L 22.5 15.6 L 23.1 16.9 L 24.0 18.3","0 24.6 M 10.8 -5.9 L 14.1 -10.5 L 17.8 -13.4 L 20.9 -14.1 L 23.3 -12.4 L 23.9 -8.3 L 23.2 -2.8 L 19.4 9.6 L 20.1 9.7 L 25.1 2.1 L 32.3 -7.3 L 37.6 -11.9 L 40.3 -13.7 L 42.1 -14.2 L 44.1 -14.1 L 44.9 -13.6 L 45.3 -12.9","0 36.0 M 28.4 -13.0 L 22.0 -8.9 L 15.5 -2.2 L 11.5 3.5 L 9.8 7.8 L 10.0 10.6 L 11.1 12.1 L 13.6 12.1 L 16.9 10.3 L 20.5 6.9 L 27.3 -.6 L 32.6 -5.8 L 32.2 .7 L 32.2 5.4 L 33.2 8.3 L 35.0 9.7 L 37.1 9.4 L 39.0 6.9 L 41.0 2.5 L 41.5 -5.0 L 40.9 -7.4 L 40.2 -8.4 L 39.4 -9.3 L 38.4 -9.5","0 23.5 M 15.6 -9.0 L 15.7 -11.8 L 16.5 -12.4 L 16.8 -11.7 L 20.3 -2.9 L 22.8 3.6 L 25.0 8.2 L 26.7 9.0 L 28.5 8.9 L 29.2 7.8 L 29.9 6.0 L 30.2 4.7 M 34.5 -14.1 L 23.4 -4.5 L 17.5 .7 L 13.9 4.4 L 11.0 8.1 L 9.1 11.6","0 26.3 M 9.6 -9.0 L 13.4 -12.7 L 16.6 -14.9 L 19.5 -15.0 L 20.6 -12.5 L 19.5 -6.4 L 17.9 -.9 L 15.7 3.9 L 14.3 7.1 L 16.7 4.5 L 21.1 -1.4 L 25.8 -7.8 L 28.5 -11.1 L 30.2 -12.8 L 31.7 -13.4 L 32.4 -13.0 L 33.4 -11.6 L 33.3 -8.0 L 30.2 -.6 L 25.8 6.5 L 20.5 13.8 L 16.7 17.8 L 14.0 19.1 L 12.9 18.4 L 13.2 16.4 L 14.7 13.4 L 18.1 8.4 L 23.7 2.7 L 29.4 -2.8 L 32.5 -5.5 L 34.9 -7.0","0 32.3 M 17.8 -11.4 L 18.4 -10.9 L 28.9 -11.8 L 33.7 -11.9 L 36.0 -11.1 L 37.1 -10.4 L 37.4 -9.0 L 37.7 -7.5 L 25.0 -1.2 L 18.3 3.0 L 14.3 5.6 L 11.6 7.7 L 10.2 9.0 L 17.5 7.5 L 25.9 6.3 L 33.6 6.6 L 37.1 7.3 L 39.2 8.5 L 39.7 9.7 L 38.9 12.8 L 37.4 14.3 L 36.0 15.3","0 21.8 M 28.4 -15.4 L 23.2 -15.4 L 20.8 -13.2 L 15.0 -4.2 L 11.3 3.3 L 10.4 7.9 L 10.8 8.8 L 12.1 9.3 L 17.7 9.6","0 20.4 M 10.2 -15.8 L 14.3 -10.5 L 19.3 -4.2 L 23.0 1.7 L 25.5 7.1 L 26.7 11.1 L 26.6 12.9","0 20.5 M 20.8 -15.2 L 25.6 -15.4 L 27.8 -14.8 L 27.0 -10.2 L 23.5 -1.9 L 19.5 4.4 L 15.9 8.7 L 14.6 9.3 L 9.8 9.2","0 14.0 M 11.2 -2.8 L 15.4 -5.9 L 17.8 -3.8 L 20.0 -2.6","0 28.8 M 8.3 10.8 L 36.7 10.7","0 8.7 M 9.8 -6.1 L 15.5 -2.0","0 14.2 M 22.7 -2.4 L 21.4 -3.9 L 18.8 -4.3 L 15.9 -2.8 L 12.3 .9 L 10.1 4.6 L 9.5 7.3 L 10.3 8.9 L 12.1 8.9 L 13.5 7.6 L 20.4 -.6 L 20.5 -.4 L 19.0 4.3 L 19.0 7.8 L 19.5 9.3 L 20.9 9.5","0 14.5 M 9.0 9.1 L 11.5 10.3 L 15.3 8.9 L 18.4 5.7 L 20.1 2.2 L 21.0 -1.1 L 20.7 -2.8 L 19.3 -3.9 L 16.9 -3.6 L 14.9 -1.7 L 12.3 1.9 L 10.9 5.0 L 11.0 7.8 L 11.0 4.8 L 18.2 -12.1 L 18.3 -13.6 L 17.4 -14.6 L 15.6 -14.9 L 14.6 -14.6","0 12.4 M 18.3 -.8 L 19.0 -1.9 L 18.8 -3.2 L 18.3 -4.0 L 16.5 -4.2 L 12.9 -1.6 L 10.0 2.8 L 9.2 6.4 L 9.8 8.2 L 11.5 9.3 L 13.6 9.3 L 15.5 7.8 L 17.9 5.4 L 20.3 2.5","0 15.2 M 18.8 -3.9 L 17.6 -4.3 L 16.3 -3.9 L 12.5 -.3 L 10.0 3.6 L 9.3 6.1 L 9.5 7.8 L 10.9 9.1 L 12.9 8.3 L 16.0 4.3 L 18.5 .9 L 20.5 -1.4 L 22.2 -6.4 L 24.1 -11.3 L 24.7 -13.6 L 23.3 -14.5 L 22.4 -14.6 L 25.6 -13.9 L 26.0 -13.0 L 25.6 -11.8 L 18.8 2.7 L 18.3 6.0 L 17.8 8.5 L 18.3 10.3 L 19.1 11.0 L 20.1 10.9","0 11.8 M 13.2 2.6 L 15.7 1.9 L 18.1 -.2 L 18.8 -1.7 L 18.8 -3.2 L 17.9 -4.0 L 16.5 -4.2 L 14.2 -3.0 L 11.5 .3 L 9.5 3.9 L 9.1 6.3 L 9.3 7.9 L 10.6 9.2 L 13.1 9.3 L 15.3 8.0 L 17.2 6.1 L 18.7 4.3 L 19.9 2.6","0 11.4 M -4.9 18.7 L -4.2 20.6 L -2.4 22.2 L .7 23.0 L 3.7 21.8 L 6.5 18.8 L 8.9 14.7 L 12.0 7.3 L 15.2 -2.8 L 18.0 -10.8 L 20.1 -14.7 L 21.3 -15.8 L 23.4 -15.7 L 24.5 -14.6 L 24.0 -12.4 M 12.6 -4.0 L 14.5 -3.3 L 16.8 -3.3 L 19.9 -3.9 L 22.4 -4.5","0 12.1 M 21.7 -.1 L 21.7 -1.5 L 19.7 -2.6 L 16.6 -2.7 L 13.5 -1.4 L 11.1 1.6 L 9.7 4.8 L 10.0 7.1 L 11.5 8.7 L 14.4 8.5 L 17.3 5.2 L 18.7 1.0 L 18.3 -2.6 L 17.1 -4.7 L 15.6 -5.8 L 14.2 -6.0 L 13.3 -5.2 L 13.0 -3.1 L 13.5 .5 L 16.1 6.0 L 16.8 8.8 L 16.1 14.3 L 14.3 19.1 L 9.5 24.6 L 3.1 28.6 L -2.9 29.8 L -8.8 27.8 L -10.4 25.2 L -10.2 22.2 L -8.3 18.9 L -4.9 15.9 L -.2 13.6 L 4.1 12.0 L 8.3 11.2 L 10.8 11.0 L 15.3 11.2 L 19.7 12.8 L 21.5 14.8 L 21.7 16.7","0 13.0 M 14.5 -14.7 L 14.9 -14.7 L 16.9 -15.0 L 18.1 -14.1 L 18.3 -12.7 L 16.3 -8.0 L 10.8 4.2 L 10.0 7.3 L 10.0 10.8 L 7.6 8.1 L 10.9 5.9 L 15.1 2.1 L 18.4 -1.7 L 19.7 -4.0 L 20.2 -4.0 L 19.5 -2.6 L 18.0 .6 L 16.9 4.5 L 17.0 7.4 L 17.6 9.0 L 19.0 9.6 L 19.7 9.2","0 8.5 M 14.0 -3.7 L 12.0 .6 L 10.9 4.7 L 10.5 8.6 L 11.2 9.7 L 12.5 9.4 L 14.1 8.2 M 15.0 -7.5 L 17.4 -9.6 L 16.6 -7.5 L 15.0 -7.5","0 8.6 M 8.3 9.0 L 1.9 13.9 L -2.4 18.3 L -6.1 23.1 L -8.1 26.7 L -7.9 29.7 L -6.5 31.2 L -3.0 30.5 L 1.4 26.2 L 6.4 19.1 L 9.7 12.6 L 12.5 4.8 L 13.0 1.0 L 13.2 -3.7 M 15.4 -8.8 L 13.8 -7.0 L 14.9 -6.7 L 15.4 -8.8","0 13.9 M 14.2 -14.8 L 16.5 -15.0 L 17.7 -13.3 L 16.9 -10.2 L 11.4 2.7 L 10.6 4.6 L 10.2 6.8 L 10.0 9.1 L 11.1 6.6 L 13.7 3.2 L 16.5 -.6 L 20.0 -3.7 L 23.0 -5.6 L 22.8 -3.3 L 21.3 -.6 L 19.6 .7 L 18.3 1.6 L 15.5 .8 L 14.8 .1 L 14.1 .8 L 16.6 3.2 L 17.8 5.2 L 18.7 8.2 L 18.9 10.4 L 18.5 12.5","0 9.1 M 11.2 .5 L 14.1 -2.1 L 17.4 -6.9 L 20.2 -10.7 L 21.5 -14.0 L 20.6 -15.5 L 19.4 -15.8 L 17.7 -15.0 L 13.6 -7.3 L 11.8 -1.7 L 10.5 3.7 L 10.4 6.6 L 10.4 8.4 L 11.4 9.3 L 13.0 9.4","0 22.0 M 12.0 -5.3 L 12.4 -5.3 L 13.7 -4.8 L 14.2 -3.7 L 13.8 -1.5 L 10.5 8.2 L 15.2 .2 L 17.6 -3.1 L 19.8 -4.0 L 21.0 -3.0 L 21.1 -.5 L 18.8 8.2 L 21.5 5.2 L 26.9 -1.0 L 28.2 -1.4 L 27.1 2.4 L 26.6 6.7 L 27.2 8.8 L 28.1 8.9","0 15.2 M 11.7 -5.3 L 13.4 -5.0 L 14.0 -3.9 L 13.2 .2 L 11.5 5.4 L 10.8 8.3 L 13.1 4.5 L 16.1 .5 L 18.2 -2.4 L 19.0 -2.9 L 20.5 -3.3 L 20.5 -3.3 L 21.1 -4.2 L 21.9 -4.1 L 20.3 -1.6 L 18.7 3.5 L 18.5 6.9 L 19.2 9.0 L 20.5 9.6 L 21.1 9.5 L 21.7 8.9","0 12.2 M 14.1 .8 L 12.4 -.3 L 11.4 -1.7 L 11.5 -4.3 L 13.4 -5.9 L 15.7 -6.0 L 17.2 -5.0 L 18.3 -3.0 L 18.7 -.3 L 18.3 3.0 L 16.6 6.6 L 14.5 8.6 L 13.4 8.9 L 11.3 8.8 L 9.8 7.1 L 9.7 4.4 L 10.6 1.6 L 11.8 .1 L 13.5 -1.3 L 14.9 -2.2 L 16.5 -2.8 L 18.9 -2.8 L 20.4 -2.5","0 17.1 M 12.5 -5.0 L 14.2 -5.3 L 15.7 -4.8 L 16.1 -3.5 L 15.4 -1.1 L 11.8 6.8 L 9.6 11.8 L 8.4 16.6 L 8.5 18.6 L 9.0 19.8 L 9.7 20.4 L 10.9 19.8 M 12.1 6.3 L 14.7 2.0 L 17.6 -1.3 L 20.3 -3.7 L 22.4 -4.4 L 23.4 -3.6 L 23.7 -1.7 L 23.0 1.4 L 21.2 4.2 L 19.1 6.8 L 16.9 8.4 L 15.2 8.7 L 13.6 8.6 L 11.4 7.9","0 13.8 M 21.2 -2.8 L 20.1 -4.1 L 17.7 -4.1 L 14.3 -1.5 L 12.3 1.3 L 10.5 4.2 L 9.6 6.5 L 9.5 8.1 L 10.2 8.6 L 11.4 8.7 L 13.5 7.3 L 16.9 3.3 L 20.5 -1.2 L 21.1 -1.3 L 16.8 6.4 L 14.5 13.1 L 13.1 17.8 L 12.9 19.0 L 13.2 20.7 L 14.2 21.2 L 15.3 20.8 L 16.9 18.6 L 18.4 15.3 L 19.2 11.5 L 19.2 8.4 L 18.8 7.2 L 17.3 5.6","0 13.3 M 12.3 -5.3 L 13.2 -4.8 L 13.7 -4.0 L 13.6 -2.5 L 10.5 8.4 L 12.8 3.3 L 14.7 1.0 L 17.0 -1.5 L 19.6 -3.2 L 21.6 -4.4 L 20.2 -4.4 L 19.3 -1.5 L 19.4 .0 L 20.0 .7 L 21.2 1.1","0 10.5 M 9.2 9.5 L 11.3 9.5 L 13.7 8.7 L 14.6 7.8 L 14.7 6.3 L 11.4 2.7 L 10.9 1.1 L 11.1 -.6 L 12.9 -2.7 L 15.0 -3.9 L 16.6 -4.4 L 18.5 -4.2","0 9.1 M 12.0 9.6 L 10.9 9.9 L 9.9 9.5 L 9.6 7.8 L 10.3 5.2 L 15.0 -5.4 L 15.4 -7.5 L 15.4 -9.3 L 14.8 -9.8 L 13.7 -9.6 M 11.3 -3.8 L 14.2 -3.0 L 16.9 -3.2 L 18.9 -3.7 L 20.6 -4.4","0 15.5 M 13.9 -4.0 L 13.9 -3.2 L 11.6 1.8 L 10.0 5.7 L 9.9 7.5 L 11.0 9.1 L 12.5 9.2 L 14.2 7.3 L 18.7 .7 L 21.4 -3.7 L 22.1 -3.9 L 19.9 1.4 L 19.1 5.4 L 19.6 8.4 L 20.7 9.7 L 21.9 9.4 L 22.2 9.2","0 11.4 M 9.5 -3.4 L 10.9 -4.0 L 12.1 -3.1 L 12.4 -1.0 L 11.8 9.1 L 13.5 4.9 L 16.2 1.3 L 18.5 -1.6 L 20.7 -3.9 L 23.3 -6.0","0 22.2 M 15.4 -3.0 L 11.7 2.5 L 9.9 6.2 L 9.7 7.9 L 10.6 9.0 L 12.1 8.7 L 13.4 7.5 L 16.6 3.5 L 20.0 -1.3 L 20.7 -1.4 L 20.6 1.7 L 20.9 4.9 L 21.6 7.2 L 22.6 8.6 L 24.0 8.9 L 26.0 7.7 L 28.1 4.4 L 28.8 1.3 L 28.8 -.9 L 28.4 -2.5 L 27.4 -4.0","0 14.5 M 12.9 -3.7 L 14.3 -3.4 L 14.4 -2.7 L 15.0 2.0 L 15.9 6.2 L 17.0 8.7 L 18.2 9.6 L 19.6 9.4 L 20.6 8.9 M 24.0 -4.7 L 18.5 .0 L 14.2 4.0 L 9.8 8.9 L 7.2 12.2","0 14.8 M 12.2 -5.3 L 13.4 -5.1 L 13.9 -4.3 L 13.9 -3.1 L 12.4 1.0 L 9.7 8.5 L 12.4 4.7 L 15.6 .9 L 18.1 -1.6 L 19.7 -3.6 L 20.5 -4.2 L 22.1 -3.0 L 21.3 3.6 L 17.9 12.9 L 14.8 19.1 L 11.0 24.3 L 7.3 28.1 L 5.4 29.7 L 2.5 29.9 L 1.0 29.1 L .4 26.7 L 2.5 22.1 L 6.4 17.2 L 10.9 12.9 L 14.2 10.3 L 16.3 8.5","0 16.5 M 13.0 -2.8 L 16.6 -3.3 L 19.4 -3.7 L 21.5 -3.7 L 22.6 -3.5 L 23.7 -1.9 L 22.8 -.6 L 11.5 7.2 L 10.0 8.6 L 12.7 7.5 L 16.8 7.1 L 20.4 7.1 L 22.4 7.6 L 23.5 8.7 L 23.4 10.3 L 22.9 11.2","0 12.8 M 22.4 -12.9 L 18.0 -11.7 L 16.5 -8.1 L 16.1 -5.1 L 14.9 -2.6 L 13.9 -1.2 L 12.3 -.6 L 10.3 .0 L 12.4 .6 L 14.2 2.4 L 14.3 4.1 L 13.0 10.1 L 13.1 11.6 L 14.1 12.8 L 15.0 13.0 L 16.6 13.1","0 8.6 M 13.0 -12.2 L 13.5 -8.6 L 13.1 -3.1 L 12.5 3.1 L 11.8 8.1 L 10.7 12.3","0 15.9 M 15.7 -13.2 L 18.0 -13.1 L 19.7 -11.9 L 19.8 -9.5 L 18.8 -2.6 L 19.3 -1.4 L 20.3 -.6 L 21.5 -.3 L 22.6 .1 L 20.4 .5 L 18.3 1.5 L 17.1 3.9 L 16.3 7.5 L 15.4 10.7 L 13.9 12.1 L 12.2 12.8 L 10.2 12.8","0 15.1 M 13.9 -5.2 L 14.6 -5.8 L 15.8 -6.1 L 17.0 -5.8 L 18.4 -5.3 L 18.9 -5.1 L 19.8 -5.5 L 20.6 -6.1","0 11.2 M 12.7 -7.5 L 11.1 -6.0 L 11.3 -3.7 L 13.5 -2.3 L 16.3 -3.1 L 17.1 -5.4 L 15.6 -7.7 L 13.9 -8.3 L 12.7 -7.5"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 8.9 M 12.4 -13.4 L 12.4 1.9 M 11.7 5.8 L 11.7 7.4 L 13.2 7.4 L 13.2 5.8 L 11.7 5.8","0 12.1 M 11.7 -14.0 L 11.8 -7.6 M 16.1 -14.0 L 16.3 -7.6","0 15.9 M 14.4 -12.6 L 11.9 7.5 M 20.1 -12.6 L 17.6 7.5 M 10.3 -6.2 L 22.3 -6.2 M 9.7 .2 L 21.6 .2","0 15.9 M 20.4 -10.4 L 18.8 -11.8 L 17.1 -12.2 L 16.1 -12.3 L 16.1 -15.7 L 16.1 -12.3 L 14.0 -11.9 L 12.4 -10.4 L 11.8 -8.7 L 11.9 -6.6 L 12.7 -5.1 L 14.3 -3.9 L 17.8 -2.1 L 19.2 -1.0 L 20.3 .1 L 20.9 1.9 L 20.9 3.4 L 20.4 5.3 L 18.7 6.7 L 16.6 7.4 L 16.1 7.4 L 16.1 10.7 L 16.1 7.4 L 14.5 7.2 L 12.5 6.4 L 11.0 5.2","0 26.3 M 14.1 -1.0 L 15.6 -1.3 L 16.8 -2.3 L 17.6 -3.9 L 18.0 -6.1 L 18.1 -7.7 L 17.6 -9.9 L 16.8 -11.6 L 15.8 -12.6 L 14.6 -13.1 L 13.3 -13.0 L 11.8 -12.1 L 10.9 -10.7 L 10.5 -9.0 L 10.4 -5.6 L 10.7 -3.8 L 11.4 -2.4 L 12.4 -1.5 L 13.2 -1.1 L 14.1 -1.0 M 28.1 7.6 L 29.6 7.3 L 30.7 6.2 L 31.6 4.7 L 31.9 2.5 L 32.0 .9 L 31.6 -1.4 L 30.8 -3.1 L 29.8 -4.1 L 28.5 -4.6 L 27.2 -4.4 L 25.8 -3.6 L 24.8 -2.2 L 24.5 -.5 L 24.3 2.9 L 24.7 4.8 L 25.4 6.1 L 26.3 7.0 L 27.2 7.5 L 28.1 7.6 M 15.4 7.7 L 26.8 -13.3","0 19.0 M 25.7 7.3 L 23.4 6.3 L 20.9 4.2 L 18.3 1.7 L 16.6 -.4 L 14.5 -3.7 L 13.5 -6.1 L 13.2 -9.2 L 13.5 -11.0 L 14.6 -12.4 L 16.2 -13.0 L 18.1 -12.7 L 19.2 -11.7 L 19.7 -10.1 L 19.4 -8.4 L 18.4 -6.7 L 17.1 -5.6 L 13.3 -2.7 L 12.0 -1.5 L 10.8 .1 L 10.2 1.8 L 10.5 3.7 L 11.5 5.8 L 13.5 7.0 L 16.0 7.5 L 17.9 7.0 L 20.1 5.7 L 21.7 3.8 L 23.1 1.9 L 24.2 -.6 L 25.0 -2.8","0 7.9 M 11.7 -14.0 L 11.9 -7.6","0 9.6 M 15.6 12.7 L 14.0 9.7 L 12.6 5.8 L 12.1 3.4 L 11.8 -.1 L 11.8 -3.4 L 12.3 -6.3 L 13.0 -9.1 L 14.1 -12.1 L 15.0 -13.8 L 15.7 -14.8","0 9.6 M 10.0 12.8 L 11.7 9.6 L 13.0 6.2 L 13.6 2.9 L 14.0 -1.2 L 13.5 -5.2 L 13.1 -7.8 L 12.4 -10.2 L 11.2 -12.6 L 10.0 -14.9","0 13.4 M 12.4 -7.5 L 14.6 -10.7 L 18.2 -11.9 L 14.6 -10.7 L 14.6 -14.5 L 14.6 -10.7 L 11.0 -11.9 L 14.6 -10.7 L 17.1 -7.4","0 15.9 M 15.9 -9.6 L 15.9 4.1 M 9.8 -2.8 L 22.3 -2.8","0 7.9 M 12.5 7.2 L 11.3 7.2 L 11.3 5.6 L 12.5 5.6 L 13.0 7.4 L 12.9 8.9 L 12.3 10.2 L 11.5 11.0 L 10.6 11.8","0 10.4 M 9.8 -.3 L 16.3 -.3","0 7.9 M 11.1 5.7 L 11.1 7.3 L 12.7 7.3 L 12.7 5.7 L 11.1 5.7","0 12.1 M 9.4 12.5 L 18.9 -14.5","0 15.9 M 15.8 7.4 L 17.7 7.0 L 19.7 5.0 L 20.6 2.9 L 21.0 .5 L 21.2 -2.8 L 21.0 -5.9 L 20.3 -8.9 L 19.3 -10.8 L 17.7 -12.0 L 16.3 -12.5 L 15.1 -12.4 L 13.2 -11.3 L 11.9 -9.5 L 11.0 -6.6 L 10.7 -3.6 L 10.6 -.6 L 11.0 2.2 L 12.0 5.0 L 13.2 6.3 L 14.4 7.3 L 15.8 7.4","0 16.0 M 16.4 -11.0 L 13.1 -10.9 L 16.5 -12.2 L 16.5 7.0 L 11.5 7.0 L 21.4 7.0","0 16.0 M 10.4 -9.7 L 11.7 -11.0 L 13.3 -12.0 L 15.3 -12.5 L 17.0 -12.2 L 18.8 -11.3 L 19.9 -9.8 L 20.4 -7.6 L 20.3 -5.7 L 19.3 -3.4 L 17.5 -.8 L 15.3 1.9 L 13.3 4.0 L 11.5 6.0 L 10.6 7.0 L 21.9 7.0","0 15.8 M 10.8 -10.3 L 12.4 -11.5 L 14.5 -12.4 L 16.2 -12.4 L 18.0 -11.9 L 19.5 -10.7 L 20.2 -9.1 L 20.5 -7.2 L 20.0 -5.5 L 18.3 -4.2 L 16.4 -3.2 L 14.8 -2.9 L 13.6 -2.9 L 15.1 -2.9 L 16.7 -2.7 L 18.3 -2.1 L 20.0 -.8 L 20.8 .4 L 21.1 1.8 L 21.0 3.3 L 20.7 4.5 L 19.7 5.9 L 18.3 6.8 L 16.5 7.3 L 14.6 7.3 L 12.8 6.8 L 11.0 5.8 L 9.9 4.8","0 16.0 M 18.8 7.5 L 18.8 -12.0 L 9.5 1.0 L 22.1 1.0","0 15.9 M 9.9 4.9 L 11.2 6.0 L 12.6 6.8 L 14.2 7.4 L 15.7 7.5 L 18.0 6.9 L 19.6 5.6 L 20.9 3.7 L 21.4 1.5 L 21.1 -1.1 L 20.0 -3.1 L 17.7 -4.4 L 15.4 -4.6 L 13.7 -4.2 L 12.0 -3.3 L 11.8 -3.6 L 12.4 -12.0 L 20.6 -12.0","0 15.8 M 10.7 -.4 L 12.2 -2.0 L 14.0 -3.4 L 15.8 -4.0 L 17.8 -4.0 L 19.3 -3.3 L 20.4 -2.3 L 21.2 -.4 L 21.5 1.8 L 21.0 4.1 L 19.9 6.0 L 18.2 7.2 L 16.2 7.5 L 14.4 6.9 L 12.8 5.7 L 11.5 3.7 L 10.9 .9 L 10.7 -2.1 L 11.1 -5.9 L 11.8 -8.2 L 12.7 -10.0 L 14.2 -11.5 L 16.1 -12.3 L 18.0 -12.4 L 19.8 -11.8 L 21.1 -10.7","0 16.0 M 15.1 7.4 L 15.5 2.1 L 16.3 -1.7 L 17.4 -5.0 L 18.8 -7.6 L 20.3 -10.0 L 21.8 -12.1 L 10.3 -12.1","0 15.9 M 17.4 -2.2 L 19.4 -3.8 L 20.6 -5.6 L 20.9 -7.3 L 20.8 -9.1 L 19.5 -11.2 L 17.5 -12.3 L 15.9 -12.4 L 13.5 -11.7 L 11.9 -10.1 L 11.5 -8.3 L 12.0 -5.8 L 13.6 -4.3 L 16.4 -2.8 L 19.0 -1.4 L 20.7 -.1 L 21.5 1.7 L 21.3 3.9 L 20.7 5.5 L 18.8 7.0 L 16.4 7.5 L 14.5 7.2 L 12.5 6.3 L 11.0 4.7 L 10.5 3.0 L 10.7 .5 L 12.3 -1.7 L 13.6 -2.6 L 15.3 -3.4","0 15.9 M 10.8 5.6 L 11.9 6.7 L 13.7 7.3 L 15.6 7.5 L 17.6 6.5 L 19.5 4.6 L 20.6 1.7 L 21.1 -1.8 L 21.1 -5.1 L 20.4 -8.2 L 19.2 -10.6 L 17.3 -12.0 L 15.1 -12.4 L 12.8 -11.6 L 11.4 -10.2 L 10.6 -8.4 L 10.4 -6.6 L 10.5 -4.6 L 11.6 -2.5 L 13.6 -1.2 L 16.0 -.9 L 18.6 -2.0 L 20.2 -3.5 L 21.2 -4.8","0 7.9 M 11.1 -6.4 L 11.1 -4.9 L 12.6 -4.9 L 12.6 -6.4 L 11.1 -6.4 M 11.1 5.7 L 11.1 7.2 L 12.6 7.2 L 12.6 5.7 L 11.1 5.7","0 7.8 M 11.1 -6.4 L 11.1 -4.8 L 12.7 -4.8 L 12.7 -6.4 L 11.1 -6.4 M 12.5 7.2 L 11.3 7.2 L 11.3 5.6 L 12.5 5.6 L 13.0 7.4 L 12.9 8.9 L 12.4 10.2 L 11.5 11.0 L 10.6 11.8","0 16.0 M 22.3 2.2 L 9.7 -2.9 L 22.3 -8.0","0 16.0 M 9.6 -6.0 L 22.3 -6.0 M 9.6 .4 L 22.3 .4","0 15.8 M 9.8 2.2 L 22.3 -3.0 L 9.8 -8.0","0 13.6 M 13.4 5.7 L 13.4 7.3 L 15.0 7.3 L 15.0 5.7 L 13.4 5.7 M 14.0 1.6 L 14.2 -.3 L 15.0 -2.3 L 17.2 -5.3 L 18.5 -7.4 L 18.8 -9.2 L 18.4 -11.0 L 17.4 -12.4 L 16.2 -13.2 L 14.5 -13.4 L 12.8 -13.1 L 11.4 -12.4 L 10.2 -11.3","0 26.4 M 25.3 -5.1 L 24.0 2.5 L 22.4 4.1 L 20.8 4.9 L 18.9 5.0 L 17.2 3.7 L 16.7 1.6 L 17.3 -1.6 L 19.0 -4.1 L 21.3 -5.3 L 23.3 -4.9 L 24.3 -4.0 L 24.9 -2.8 L 24.0 2.7 L 24.2 3.9 L 25.9 5.2 L 28.2 5.0 L 30.1 3.4 L 31.4 1.3 L 31.8 -1.3 L 31.7 -4.0 L 30.9 -6.9 L 29.5 -9.0 L 27.7 -10.6 L 24.8 -11.6 L 21.7 -11.8 L 19.0 -11.3 L 15.9 -9.7 L 13.7 -7.6 L 12.2 -5.3 L 11.0 -2.3 L 10.6 .3 L 10.6 2.5 L 11.3 5.5 L 12.5 7.9 L 15.0 10.1 L 17.2 11.1 L 20.3 11.7 L 23.2 11.6 L 25.9 10.2","0 17.4 M 9.3 7.5 L 16.8 -13.0 L 21.2 -.1 L 12.2 -.1 L 21.2 -.1 L 23.9 7.5","0 19.1 M 12.1 7.1 L 12.1 -12.5 L 17.9 -12.5 L 19.6 -12.4 L 21.3 -11.7 L 22.7 -10.4 L 23.1 -8.9 L 23.1 -7.1 L 22.4 -5.5 L 20.9 -4.4 L 19.6 -3.8 L 17.8 -3.5 L 12.3 -3.5 L 17.9 -3.5 L 19.6 -3.2 L 21.6 -2.7 L 23.2 -1.6 L 24.1 -.6 L 24.4 .8 L 24.4 2.8 L 23.6 4.7 L 22.2 5.9 L 19.7 6.9 L 17.9 7.1 L 12.3 7.1","0 18.7 M 24.5 4.9 L 22.4 6.5 L 19.6 7.5 L 16.8 7.1 L 14.2 5.7 L 12.2 3.3 L 11.2 .8 L 10.9 -3.0 L 11.2 -6.5 L 12.5 -9.4 L 14.5 -11.6 L 16.8 -12.7 L 19.4 -12.9 L 21.7 -12.4 L 23.3 -11.4 L 23.8 -10.8","0 19.9 M 12.2 7.0 L 12.2 -12.5 L 17.8 -12.5 L 20.1 -11.9 L 21.8 -11.0 L 23.0 -9.8 L 24.4 -7.5 L 24.9 -4.9 L 24.9 -3.3 L 24.8 -1.2 L 24.5 1.2 L 23.7 2.9 L 22.3 5.0 L 20.1 6.3 L 18.0 6.9 L 16.4 7.0 L 12.3 7.0","0 17.1 M 22.8 7.0 L 12.2 7.0 L 12.2 -3.3 L 21.0 -3.3 L 12.2 -3.3 L 12.2 -12.4 L 22.4 -12.4","0 15.9 M 12.2 7.4 L 12.2 -3.0 L 21.1 -3.0 L 12.2 -3.0 L 12.2 -12.4 L 22.4 -12.4","0 19.8 M 19.0 -2.0 L 24.5 -2.0 L 24.5 5.4 L 23.2 6.3 L 20.4 7.3 L 18.4 7.4 L 16.4 7.0 L 14.6 6.0 L 12.5 3.6 L 11.1 .6 L 10.8 -2.9 L 11.2 -6.3 L 12.5 -9.3 L 14.6 -11.6 L 16.7 -12.6 L 19.1 -13.0 L 21.7 -12.6 L 23.3 -11.7 L 24.4 -10.8","0 21.2 M 12.2 7.3 L 12.2 -12.7 L 12.2 -3.4 L 24.9 -3.4 L 24.9 -12.6 L 24.9 7.3","0 8.5 M 12.2 7.4 L 12.2 -12.7","0 15.5 M 10.5 4.8 L 11.5 6.0 L 12.7 6.9 L 14.3 7.5 L 16.3 7.2 L 18.2 5.9 L 19.1 4.0 L 19.3 2.5 L 19.3 -12.8","0 18.5 M 12.2 7.4 L 12.2 -12.8 M 23.6 -12.6 L 12.5 -.1 M 17.3 -5.5 L 24.8 7.4","0 15.6 M 12.2 -12.8 L 12.2 7.0 L 22.2 7.0","0 23.2 M 12.1 7.5 L 12.1 -12.8 L 13.1 -12.8 L 19.6 4.9 L 26.1 -12.7 L 26.8 -12.7 L 26.8 7.4","0 20.8 M 12.0 7.3 L 12.0 -12.6 L 12.7 -12.6 L 24.6 7.3 L 24.6 -12.7","0 21.5 M 18.6 7.3 L 21.2 6.9 L 23.8 5.2 L 25.6 2.5 L 26.5 -1.0 L 26.5 -4.3 L 26.0 -7.0 L 25.0 -9.2 L 23.4 -11.3 L 21.2 -12.6 L 19.0 -13.0 L 17.1 -12.7 L 15.0 -11.9 L 13.0 -10.2 L 11.5 -7.3 L 11.0 -5.0 L 10.9 -1.6 L 11.3 1.0 L 12.3 3.4 L 13.7 5.3 L 15.3 6.6 L 17.0 7.2 L 18.6 7.3","0 18.4 M 12.3 7.5 L 12.3 -12.6 L 19.4 -12.6 L 21.2 -12.1 L 22.5 -11.1 L 23.5 -9.8 L 23.9 -7.8 L 23.8 -6.0 L 23.0 -4.0 L 21.5 -2.8 L 19.4 -2.0 L 17.0 -1.9 L 12.2 -1.9","0 21.4 M 18.5 7.5 L 20.7 7.0 L 23.0 5.8 L 24.9 3.8 L 26.0 1.0 L 26.4 -1.4 L 26.4 -4.2 L 26.0 -7.1 L 25.2 -9.1 L 23.4 -11.3 L 21.1 -12.6 L 19.0 -13.1 L 16.8 -12.7 L 14.7 -11.8 L 12.9 -10.0 L 11.8 -8.1 L 11.1 -5.1 L 10.8 -2.8 L 11.0 -.6 L 11.7 2.0 L 12.8 4.2 L 14.2 5.7 L 15.9 6.8 L 17.6 7.3 L 18.5 7.4 L 19.4 9.2 L 20.7 10.5 L 22.1 11.3 L 23.9 11.8 L 25.5 11.9 L 27.0 11.6","0 18.4 M 12.1 7.4 L 12.1 -12.6 L 18.8 -12.6 L 20.4 -12.1 L 22.2 -11.2 L 23.5 -9.2 L 23.5 -7.5 L 23.2 -5.6 L 22.0 -3.9 L 20.5 -3.0 L 18.1 -2.4 L 12.2 -2.4 L 17.9 -2.4 L 23.7 7.4","0 17.3 M 10.5 4.6 L 12.2 6.0 L 13.8 6.8 L 15.8 7.2 L 18.1 7.3 L 20.6 6.3 L 22.3 4.8 L 22.9 2.8 L 22.8 1.0 L 21.7 -.8 L 19.4 -2.3 L 15.3 -4.1 L 13.0 -5.6 L 11.8 -7.2 L 11.7 -9.2 L 12.5 -11.3 L 14.8 -12.7 L 17.0 -13.0 L 19.1 -12.8 L 20.7 -12.0 L 22.2 -10.9","0 17.4 M 16.7 7.3 L 16.7 -12.6 L 9.8 -12.6 L 23.7 -12.6","0 21.0 M 12.3 -12.8 L 12.3 1.1 L 12.6 2.9 L 13.5 4.8 L 14.7 6.1 L 16.5 7.1 L 18.2 7.5 L 20.3 7.2 L 22.4 6.1 L 23.9 4.3 L 24.6 2.7 L 24.8 .5 L 24.8 -12.7","0 16.3 M 9.4 -12.8 L 16.1 7.4 L 22.8 -12.7","0 25.1 M 10.1 -12.8 L 14.8 7.4 L 15.2 7.3 L 20.4 -12.7 L 20.8 -12.7 L 26.1 7.4 L 26.5 7.4 L 31.0 -12.8","0 16.1 M 9.8 7.4 L 21.8 -12.8 M 10.4 -12.9 L 22.2 7.4","0 15.0 M 9.4 -12.8 L 15.5 -.7 L 15.5 7.3 L 15.5 -.8 L 21.5 -12.7","0 17.8 M 11.2 -12.6 L 23.2 -12.6 L 10.5 7.1 L 23.6 7.1","0 9.7 M 16.3 11.9 L 12.1 11.9 L 12.1 -14.2 L 16.3 -14.2","0 12.2 M 9.3 -14.4 L 18.8 12.5","0 9.7 M 9.4 11.8 L 13.6 11.8 L 13.6 -14.3 L 9.4 -14.3","0 16.0 M 11.2 -1.9 L 15.9 -13.4 L 20.7 -1.6","0 16.8 M 8.9 10.6 L 23.9 10.6","0 17.7 M 15.0 -14.5 L 17.9 -10.6","0 16.5 M 11.7 -5.6 L 13.8 -6.8 L 15.6 -7.3 L 17.4 -7.5 L 18.8 -7.0 L 20.0 -5.9 L 20.8 -4.3 L 20.9 -2.1 L 20.9 4.6 L 20.9 7.3 L 20.8 4.6 L 19.5 5.5 L 18.1 6.5 L 16.5 7.2 L 14.7 7.5 L 13.2 7.0 L 12.0 6.2 L 11.1 4.9 L 11.1 3.0 L 11.8 1.5 L 13.4 .2 L 15.0 -.4 L 16.9 -1.0 L 18.7 -1.3 L 19.8 -1.4 L 20.7 -1.4","0 17.9 M 11.9 -14.8 L 11.9 7.5 L 11.9 4.8 L 13.0 5.7 L 14.7 6.8 L 16.5 7.3 L 18.3 7.4 L 20.4 6.2 L 21.7 4.8 L 22.7 2.8 L 23.1 .3 L 23.0 -2.2 L 22.5 -4.5 L 21.0 -6.4 L 19.7 -7.1 L 17.9 -7.5 L 16.0 -7.1 L 14.1 -6.1 L 12.1 -4.5","0 15.0 M 21.1 5.7 L 19.5 6.9 L 17.1 7.4 L 14.9 7.1 L 12.6 5.6 L 11.3 3.5 L 10.8 1.0 L 10.8 -1.6 L 11.6 -4.0 L 13.2 -5.9 L 15.1 -7.0 L 17.2 -7.3 L 19.0 -7.0 L 20.2 -6.4 L 20.7 -5.8","0 18.0 M 21.9 -14.7 L 21.9 7.3 L 21.9 4.3 L 20.5 5.7 L 18.6 7.0 L 16.7 7.5 L 15.1 7.2 L 13.5 6.5 L 11.9 4.8 L 10.9 2.5 L 10.7 -.3 L 11.4 -3.6 L 13.1 -6.1 L 15.5 -7.3 L 17.4 -7.5 L 19.4 -6.8 L 20.7 -6.0 L 22.0 -4.8","0 16.0 M 10.8 -.4 L 21.8 -.4 L 21.8 -2.2 L 21.3 -4.5 L 19.8 -6.3 L 18.3 -7.3 L 16.2 -7.4 L 14.1 -6.8 L 12.3 -5.3 L 11.6 -3.8 L 10.8 -1.9 L 10.6 .1 L 11.1 2.5 L 12.0 4.7 L 13.8 6.5 L 15.5 7.3 L 17.6 7.5 L 19.4 7.0 L 21.1 6.1","0 9.2 M 12.3 7.4 L 12.3 -7.0 L 9.9 -7.0 L 16.1 -7.0 L 12.2 -7.0 L 12.2 -11.4 L 12.5 -12.9 L 13.5 -14.4 L 15.0 -15.0 L 16.3 -14.8 L 17.2 -14.4","0 16.2 M 13.4 6.7 L 11.9 8.1 L 10.9 9.8 L 10.7 11.6 L 12.1 13.1 L 14.4 14.1 L 17.1 14.4 L 19.5 13.8 L 21.9 12.2 L 22.8 10.7 L 22.7 9.0 L 21.8 7.4 L 19.6 6.8 L 13.5 6.8 L 12.2 5.9 L 11.6 4.5 L 11.9 3.2 L 13.6 1.3 L 14.7 2.0 L 16.4 2.3 L 18.5 1.6 L 20.0 .2 L 20.7 -1.5 L 20.7 -3.5 L 19.9 -5.3 L 19.3 -6.1 L 17.9 -7.0 L 22.7 -7.0 L 17.9 -7.0 L 16.4 -7.3 L 14.1 -7.1 L 12.5 -5.8 L 11.6 -4.0 L 11.5 -2.0 L 11.9 -.4 L 12.7 .6 L 13.6 1.4","0 17.6 M 12.0 7.3 L 12.0 -14.7 L 12.0 -3.6 L 13.5 -5.2 L 14.8 -6.4 L 16.7 -7.2 L 18.6 -7.4 L 20.8 -6.2 L 21.6 -4.8 L 22.0 -2.5 L 22.0 7.4","0 8.0 M 12.0 7.5 L 12.0 -7.2 M 11.1 -13.3 L 11.1 -11.7 L 12.7 -11.7 L 12.7 -13.3 L 11.1 -13.3","0 8.3 M 7.7 13.9 L 7.9 13.9 L 9.0 14.2 L 10.5 14.1 L 11.8 13.2 L 12.2 11.6 L 12.2 -7.3 M 11.3 -13.2 L 11.3 -11.7 L 12.9 -11.7 L 12.9 -13.2 L 11.3 -13.2","0 15.4 M 11.9 7.5 L 11.9 -14.8 M 20.7 -7.2 L 12.0 3.3 M 16.1 -1.7 L 21.8 7.5","0 8.4 M 12.1 -14.7 L 12.1 6.0 L 12.3 6.7 L 12.6 7.1 L 13.1 7.4 L 13.8 7.4","0 26.5 M 11.9 7.5 L 11.9 -7.2 L 11.9 -3.9 L 13.3 -5.1 L 14.6 -6.2 L 15.8 -7.0 L 17.3 -7.4 L 18.6 -7.2 L 19.5 -6.8 L 20.5 -5.8 L 21.2 -4.1 L 21.4 -2.0 L 21.4 7.5 L 21.4 -3.6 L 21.8 -4.4 L 23.9 -6.3 L 25.5 -7.1 L 26.8 -7.5 L 28.2 -7.1 L 29.1 -6.6 L 30.2 -5.3 L 30.7 -2.7 L 30.7 7.4","0 17.7 M 12.0 7.5 L 12.0 -7.3 L 12.0 -3.7 L 13.4 -5.1 L 14.7 -6.3 L 15.7 -6.9 L 17.2 -7.3 L 18.2 -7.4 L 19.7 -7.0 L 20.6 -6.4 L 21.3 -5.4 L 21.9 -4.0 L 21.9 7.5","0 17.8 M 17.1 7.4 L 17.2 7.4 L 19.2 6.9 L 21.1 5.6 L 22.3 3.6 L 22.8 1.4 L 22.9 -.7 L 22.6 -2.6 L 21.9 -4.3 L 20.9 -5.6 L 19.5 -6.8 L 18.0 -7.3 L 16.6 -7.4 L 15.0 -7.1 L 13.5 -6.2 L 12.2 -4.7 L 11.5 -3.3 L 10.9 -1.2 L 10.9 .4 L 11.1 2.3 L 11.6 4.0 L 12.8 5.6 L 14.2 6.7 L 15.7 7.3 L 17.1 7.4","0 18.0 M 11.9 14.2 L 11.9 -7.3 L 11.9 -4.1 L 13.6 -5.8 L 15.6 -6.9 L 17.3 -7.2 L 19.4 -7.2 L 21.0 -6.3 L 22.4 -4.3 L 23.1 -2.0 L 23.1 .6 L 22.8 2.8 L 21.7 5.1 L 20.1 6.6 L 18.9 7.2 L 17.0 7.3 L 15.5 7.0 L 13.8 6.1 L 12.2 5.0","0 17.7 M 21.9 14.1 L 21.9 -7.2 L 21.9 -5.0 L 20.1 -6.3 L 18.2 -7.1 L 15.8 -7.3 L 13.6 -6.4 L 12.1 -4.6 L 11.1 -2.4 L 10.7 -.6 L 10.8 1.2 L 11.0 3.1 L 11.8 5.0 L 13.1 6.3 L 14.5 7.1 L 16.4 7.5 L 18.5 6.9 L 20.4 5.7 L 21.8 4.5","0 10.8 M 12.1 7.4 L 12.1 -7.3 L 12.1 -2.8 L 13.0 -4.6 L 14.4 -6.4 L 15.9 -7.1 L 17.3 -7.3 L 18.2 -7.2","0 13.6 M 10.1 5.5 L 11.9 6.7 L 13.9 7.3 L 15.5 7.5 L 17.5 6.8 L 19.0 5.6 L 19.5 3.8 L 19.1 2.0 L 17.3 .5 L 14.8 -.5 L 12.5 -1.5 L 11.2 -2.8 L 10.9 -4.3 L 11.4 -5.7 L 13.0 -7.1 L 15.0 -7.4 L 17.0 -7.0 L 18.7 -6.0","0 10.6 M 17.5 6.8 L 16.4 7.3 L 15.0 7.3 L 13.7 6.9 L 12.6 5.6 L 12.4 3.4 L 12.4 -6.9 L 9.5 -6.9 L 17.2 -6.9 L 12.4 -6.9 L 12.4 -11.4","0 17.6 M 21.5 -7.1 L 21.5 7.4 L 21.5 3.6 L 20.4 4.9 L 19.1 6.2 L 17.3 7.2 L 15.6 7.5 L 13.8 7.0 L 12.6 6.0 L 11.9 4.7 L 11.8 2.2 L 11.8 -7.1","0 14.6 M 9.7 -7.4 L 15.2 7.5 L 15.6 7.5 L 21.1 -7.4","0 22.3 M 9.9 -7.3 L 14.3 7.7 L 14.7 7.7 L 18.9 -7.3 L 19.5 -7.3 L 23.7 7.7 L 24.1 7.7 L 28.4 -7.3","0 13.8 M 9.6 7.7 L 19.6 -7.4 M 10.2 -7.4 L 20.3 7.7","0 14.6 M 9.7 -7.2 L 15.7 7.9 M 20.9 -7.1 L 14.7 10.5 L 14.0 12.0 L 13.0 13.1 L 11.8 13.8 L 9.7 13.8","0 13.5 M 10.5 -6.8 L 19.4 -6.8 L 10.0 7.0 L 20.1 7.0","0 9.8 M 16.4 11.9 L 14.9 12.0 L 13.3 11.2 L 12.6 9.6 L 13.0 1.2 L 12.6 .1 L 11.8 -.7 L 11.1 -1.0 L 9.8 -1.1 L 11.4 -1.5 L 12.6 -2.2 L 12.8 -3.5 L 12.7 -11.9 L 13.0 -13.3 L 14.4 -14.2 L 16.4 -14.2","0 8.1 M 11.8 15.0 L 11.8 -15.5","0 9.8 M 9.4 11.9 L 11.3 11.8 L 12.7 11.1 L 13.1 9.2 L 12.9 1.4 L 13.3 -.1 L 14.1 -.8 L 15.3 -1.2 L 15.8 -1.2 L 14.6 -1.6 L 13.5 -2.0 L 13.0 -3.1 L 13.0 -6.0 L 13.3 -12.0 L 12.4 -13.7 L 11.1 -14.3 L 9.5 -14.3","0 16.0 M 10.4 -2.3 L 11.5 -3.6 L 12.8 -4.2 L 14.4 -4.2 L 15.9 -2.9 L 17.6 -1.6 L 18.6 -1.2 L 19.8 -1.4 L 20.7 -2.2 L 21.6 -3.1","0 10.8 M 13.7 -7.0 L 15.3 -7.5 L 16.4 -9.2 L 16.6 -11.0 L 15.6 -12.6 L 14.4 -13.4 L 12.6 -13.5 L 11.0 -12.3 L 10.3 -10.9 L 10.4 -9.1 L 11.2 -8.0 L 12.5 -7.1 L 13.7 -7.0"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 8.9 M 16.7 -13.4 L 14.0 1.9 M 12.5 5.8 L 12.3 7.4 L 13.8 7.4 L 14.1 5.8 L 12.5 5.8","0 12.1 M 16.1 -14.0 L 15.1 -7.6 M 20.5 -14.0 L 19.6 -7.6","0 15.9 M 18.5 -12.6 L 12.5 7.5 M 24.3 -12.6 L 18.2 7.5 M 13.3 -6.2 L 25.3 -6.2 M 11.6 .2 L 23.5 .2","0 15.9 M 24.2 -10.4 L 22.8 -11.8 L 21.2 -12.2 L 20.2 -12.3 L 20.8 -15.7 L 20.2 -12.3 L 18.1 -11.9 L 16.2 -10.4 L 15.2 -8.7 L 15.0 -6.6 L 15.6 -5.1 L 16.9 -3.9 L 20.1 -2.1 L 21.3 -1.0 L 22.1 .1 L 22.4 1.9 L 22.2 3.4 L 21.4 5.3 L 19.4 6.7 L 17.2 7.4 L 16.7 7.4 L 16.1 10.7 L 16.7 7.4 L 15.1 7.2 L 13.3 6.4 L 11.9 5.2","0 26.3 M 16.2 -1.0 L 17.8 -1.3 L 19.1 -2.3 L 20.2 -3.9 L 21.0 -6.1 L 21.4 -7.7 L 21.3 -9.9 L 20.8 -11.6 L 20.0 -12.6 L 18.8 -13.1 L 17.5 -13.0 L 15.9 -12.1 L 14.7 -10.7 L 14.0 -9.0 L 13.3 -5.6 L 13.3 -3.8 L 13.8 -2.4 L 14.5 -1.5 L 15.3 -1.1 L 16.2 -1.0 M 28.6 7.6 L 30.2 7.3 L 31.5 6.2 L 32.6 4.7 L 33.4 2.5 L 33.8 .9 L 33.8 -1.4 L 33.3 -3.1 L 32.4 -4.1 L 31.2 -4.6 L 29.9 -4.4 L 28.3 -3.6 L 27.1 -2.2 L 26.5 -.5 L 25.7 2.9 L 25.7 4.8 L 26.2 6.1 L 27.0 7.0 L 27.7 7.5 L 28.6 7.6 M 16.0 7.7 L 31.1 -13.3","0 19.0 M 26.3 7.3 L 24.2 6.3 L 22.0 4.2 L 19.9 1.7 L 18.6 -.4 L 17.1 -3.7 L 16.5 -6.1 L 16.8 -9.2 L 17.4 -11.0 L 18.7 -12.4 L 20.4 -13.0 L 22.2 -12.7 L 23.2 -11.7 L 23.4 -10.1 L 22.8 -8.4 L 21.5 -6.7 L 20.0 -5.6 L 15.7 -2.7 L 14.1 -1.5 L 12.7 .1 L 11.8 1.8 L 11.7 3.7 L 12.4 5.8 L 14.2 7.0 L 16.6 7.5 L 18.6 7.0 L 20.9 5.7 L 22.9 3.8 L 24.6 1.9 L 26.2 -.6 L 27.4 -2.8","0 7.9 M 16.1 -14.0 L 15.1 -7.6","0 9.6 M 15.3 12.7 L 14.2 9.7 L 13.5 5.8 L 13.4 3.4 L 13.7 -.1 L 14.4 -3.4 L 15.4 -6.3 L 16.6 -9.1 L 18.2 -12.1 L 19.4 -13.8 L 20.2 -14.8","0 9.6 M 9.6 12.8 L 11.9 9.6 L 13.8 6.2 L 15.0 2.9 L 16.2 -1.2 L 16.4 -5.2 L 16.4 -7.8 L 16.1 -10.2 L 15.4 -12.6 L 14.6 -14.9","0 13.4 M 15.6 -7.5 L 18.4 -10.7 L 22.3 -11.9 L 18.4 -10.7 L 19.1 -14.5 L 18.4 -10.7 L 15.0 -11.9 L 18.4 -10.7 L 20.3 -7.4","0 15.9 M 19.5 -9.6 L 17.1 4.1 M 12.2 -2.8 L 24.7 -2.8","0 7.9 M 13.1 7.2 L 11.9 7.2 L 12.2 5.6 L 13.4 5.6 L 13.6 7.4 L 13.2 8.9 L 12.4 10.2 L 11.4 11.0 L 10.4 11.8","0 10.4 M 11.8 -.3 L 18.3 -.3","0 7.9 M 12.0 5.7 L 11.8 7.3 L 13.3 7.3 L 13.6 5.7 L 12.0 5.7","0 12.1 M 9.1 12.5 L 23.4 -14.5","0 15.9 M 16.4 7.4 L 18.4 7.0 L 20.7 5.0 L 22.0 2.9 L 22.9 .5 L 23.6 -2.8 L 24.0 -5.9 L 23.8 -8.9 L 23.1 -10.8 L 21.8 -12.0 L 20.4 -12.5 L 19.2 -12.4 L 17.2 -11.3 L 15.5 -9.5 L 14.0 -6.6 L 13.2 -3.6 L 12.7 -.6 L 12.5 2.2 L 13.0 5.0 L 13.9 6.3 L 15.0 7.3 L 16.4 7.4","0 16.0 M 20.3 -11.0 L 17.0 -10.9 L 20.6 -12.2 L 17.2 7.0 L 12.2 7.0 L 22.1 7.0","0 16.0 M 14.0 -9.7 L 15.6 -11.0 L 17.4 -12.0 L 19.4 -12.5 L 21.1 -12.2 L 22.8 -11.3 L 23.5 -9.8 L 23.6 -7.6 L 23.3 -5.7 L 21.8 -3.4 L 19.5 -.8 L 16.9 1.9 L 14.5 4.0 L 12.3 6.0 L 11.3 7.0 L 22.6 7.0","0 15.8 M 14.5 -10.3 L 16.4 -11.5 L 18.6 -12.4 L 20.3 -12.4 L 22.0 -11.9 L 23.3 -10.7 L 23.8 -9.1 L 23.7 -7.2 L 22.9 -5.5 L 21.0 -4.2 L 18.9 -3.2 L 17.3 -2.9 L 16.0 -2.9 L 17.5 -2.9 L 19.0 -2.7 L 20.6 -2.1 L 22.0 -.8 L 22.6 .4 L 22.7 1.8 L 22.3 3.3 L 21.8 4.5 L 20.6 5.9 L 19.0 6.8 L 17.1 7.3 L 15.3 7.3 L 13.5 6.8 L 11.9 5.8 L 10.9 4.8","0 16.0 M 19.4 7.5 L 22.9 -12.0 L 11.2 1.0 L 23.8 1.0","0 15.9 M 11.0 4.9 L 12.0 6.0 L 13.3 6.8 L 14.8 7.4 L 16.3 7.5 L 18.6 6.9 L 20.5 5.6 L 22.1 3.7 L 23.0 1.5 L 23.2 -1.1 L 22.4 -3.1 L 20.4 -4.4 L 18.1 -4.6 L 16.3 -4.2 L 14.5 -3.3 L 14.3 -3.6 L 16.5 -12.0 L 24.7 -12.0","0 15.8 M 12.7 -.4 L 14.5 -2.0 L 16.5 -3.4 L 18.4 -4.0 L 20.4 -4.0 L 21.8 -3.3 L 22.8 -2.3 L 23.2 -.4 L 23.0 1.8 L 22.2 4.1 L 20.7 6.0 L 18.9 7.2 L 16.8 7.5 L 15.1 6.9 L 13.7 5.7 L 12.7 3.7 L 12.6 .9 L 13.0 -2.1 L 14.0 -5.9 L 15.1 -8.2 L 16.4 -10.0 L 18.2 -11.5 L 20.2 -12.3 L 22.1 -12.4 L 23.8 -11.8 L 24.9 -10.7","0 16.0 M 15.7 7.4 L 17.1 2.1 L 18.5 -1.7 L 20.3 -5.0 L 22.0 -7.6 L 23.9 -10.0 L 25.8 -12.1 L 14.3 -12.1","0 15.9 M 19.8 -2.2 L 22.0 -3.8 L 23.5 -5.6 L 24.1 -7.3 L 24.4 -9.1 L 23.4 -11.2 L 21.6 -12.3 L 20.0 -12.4 L 17.5 -11.7 L 15.7 -10.1 L 14.9 -8.3 L 15.0 -5.8 L 16.3 -4.3 L 18.8 -2.8 L 21.1 -1.4 L 22.6 -.1 L 23.1 1.7 L 22.5 3.9 L 21.6 5.5 L 19.4 7.0 L 17.0 7.5 L 15.1 7.2 L 13.2 6.3 L 12.1 4.7 L 11.9 3.0 L 12.5 .5 L 14.5 -1.7 L 16.0 -2.6 L 17.8 -3.4","0 15.9 M 11.7 5.6 L 12.7 6.7 L 14.3 7.3 L 16.2 7.5 L 18.4 6.5 L 20.6 4.6 L 22.2 1.7 L 23.3 -1.8 L 23.9 -5.1 L 23.8 -8.2 L 23.0 -10.6 L 21.4 -12.0 L 19.2 -12.4 L 16.8 -11.6 L 15.2 -10.2 L 14.0 -8.4 L 13.4 -6.6 L 13.2 -4.6 L 13.9 -2.5 L 15.7 -1.2 L 18.0 -.9 L 20.9 -2.0 L 22.7 -3.5 L 23.9 -4.8","0 7.9 M 14.1 -6.4 L 13.9 -4.9 L 15.4 -4.9 L 15.7 -6.4 L 14.1 -6.4 M 12.0 5.7 L 11.7 7.2 L 13.3 7.2 L 13.5 5.7 L 12.0 5.7","0 7.8 M 14.2 -6.4 L 13.9 -4.8 L 15.5 -4.8 L 15.8 -6.4 L 14.2 -6.4 M 13.1 7.2 L 11.9 7.2 L 12.2 5.6 L 13.4 5.6 L 13.6 7.4 L 13.2 8.9 L 12.5 10.2 L 11.4 11.0 L 10.4 11.8","0 16.0 M 23.8 2.2 L 12.1 -2.9 L 25.6 -8.0","0 16.0 M 12.5 -6.0 L 25.3 -6.0 M 11.4 .4 L 24.1 .4","0 15.8 M 11.3 2.2 L 24.8 -3.0 L 13.1 -8.0","0 13.6 M 14.3 5.7 L 14.0 7.3 L 15.6 7.3 L 15.9 5.7 L 14.3 5.7 M 15.6 1.6 L 16.1 -.3 L 17.3 -2.3 L 20.1 -5.3 L 21.7 -7.4 L 22.4 -9.2 L 22.3 -11.0 L 21.5 -12.4 L 20.4 -13.2 L 18.7 -13.4 L 17.1 -13.1 L 15.6 -12.4 L 14.1 -11.3","0 26.4 M 28.2 -5.1 L 25.5 2.5 L 23.5 4.1 L 21.9 4.9 L 19.9 5.0 L 18.4 3.7 L 18.3 1.6 L 19.4 -1.6 L 21.6 -4.1 L 24.2 -5.3 L 26.1 -4.9 L 26.9 -4.0 L 27.3 -2.8 L 25.4 2.7 L 25.4 3.9 L 26.9 5.2 L 29.3 5.0 L 31.4 3.4 L 33.1 1.3 L 34.0 -1.3 L 34.4 -4.0 L 34.0 -6.9 L 33.0 -9.0 L 31.5 -10.6 L 28.7 -11.6 L 25.8 -11.8 L 22.9 -11.3 L 19.5 -9.7 L 17.0 -7.6 L 15.0 -5.3 L 13.3 -2.3 L 12.5 .3 L 12.1 2.5 L 12.3 5.5 L 13.0 7.9 L 15.1 10.1 L 17.1 11.1 L 20.1 11.7 L 23.1 11.6 L 26.0 10.2","0 17.4 M 9.9 7.5 L 21.0 -13.0 L 23.1 -.1 L 14.1 -.1 L 23.1 -.1 L 24.4 7.5","0 19.1 M 12.7 7.1 L 16.2 -12.5 L 22.0 -12.5 L 23.7 -12.4 L 25.3 -11.7 L 26.5 -10.4 L 26.6 -8.9 L 26.2 -7.1 L 25.3 -5.5 L 23.6 -4.4 L 22.2 -3.8 L 20.4 -3.5 L 14.8 -3.5 L 20.5 -3.5 L 22.1 -3.2 L 24.0 -2.7 L 25.4 -1.6 L 26.1 -.6 L 26.2 .8 L 25.8 2.8 L 24.7 4.7 L 23.0 5.9 L 20.4 6.9 L 18.5 7.1 L 13.0 7.1","0 18.7 M 25.5 4.9 L 23.1 6.5 L 20.2 7.5 L 17.4 7.1 L 15.1 5.7 L 13.5 3.3 L 12.9 .8 L 13.3 -3.0 L 14.2 -6.5 L 16.0 -9.4 L 18.4 -11.6 L 20.9 -12.7 L 23.6 -12.9 L 25.9 -12.4 L 27.2 -11.4 L 27.6 -10.8","0 19.9 M 12.9 7.0 L 16.4 -12.5 L 22.0 -12.5 L 24.2 -11.9 L 25.6 -11.0 L 26.7 -9.8 L 27.6 -7.5 L 27.7 -4.9 L 27.4 -3.3 L 27.0 -1.2 L 26.2 1.2 L 25.1 2.9 L 23.4 5.0 L 20.8 6.3 L 18.7 6.9 L 17.1 7.0 L 12.9 7.0","0 17.1 M 23.5 7.0 L 12.9 7.0 L 14.7 -3.3 L 23.5 -3.3 L 14.7 -3.3 L 16.3 -12.4 L 26.6 -12.4","0 15.9 M 12.8 7.4 L 14.6 -3.0 L 23.5 -3.0 L 14.6 -3.0 L 16.3 -12.4 L 26.5 -12.4","0 19.8 M 21.3 -2.0 L 26.8 -2.0 L 25.5 5.4 L 24.0 6.3 L 21.1 7.3 L 19.0 7.4 L 17.1 7.0 L 15.4 6.0 L 13.7 3.6 L 12.9 .6 L 13.2 -2.9 L 14.2 -6.3 L 16.1 -9.3 L 18.5 -11.6 L 20.9 -12.6 L 23.4 -13.0 L 25.9 -12.6 L 27.3 -11.7 L 28.2 -10.8","0 21.2 M 12.8 7.3 L 16.4 -12.7 L 14.7 -3.4 L 27.4 -3.4 L 29.1 -12.6 L 25.5 7.3","0 8.5 M 12.8 7.4 L 16.3 -12.7","0 15.5 M 11.6 4.8 L 12.3 6.0 L 13.4 6.9 L 14.9 7.5 L 17.0 7.2 L 19.1 5.9 L 20.3 4.0 L 20.8 2.5 L 23.5 -12.8","0 18.5 M 12.8 7.4 L 16.4 -12.8 M 27.7 -12.6 L 14.4 -.1 M 20.2 -5.5 L 25.4 7.4","0 15.6 M 16.4 -12.8 L 12.9 7.0 L 22.9 7.0","0 23.2 M 12.7 7.5 L 16.3 -12.8 L 17.3 -12.8 L 20.6 4.9 L 30.3 -12.7 L 30.9 -12.7 L 27.4 7.4","0 20.8 M 12.6 7.3 L 16.2 -12.6 L 16.9 -12.6 L 25.2 7.3 L 28.8 -12.7","0 21.5 M 19.2 7.3 L 21.9 6.9 L 24.8 5.2 L 27.1 2.5 L 28.6 -1.0 L 29.2 -4.3 L 29.2 -7.0 L 28.6 -9.2 L 27.3 -11.3 L 25.3 -12.6 L 23.3 -13.0 L 21.3 -12.7 L 19.0 -11.9 L 16.7 -10.2 L 14.7 -7.3 L 13.8 -5.0 L 13.1 -1.6 L 13.0 1.0 L 13.6 3.4 L 14.7 5.3 L 16.1 6.6 L 17.7 7.2 L 19.2 7.3","0 18.4 M 12.8 7.5 L 16.4 -12.6 L 23.6 -12.6 L 25.3 -12.1 L 26.4 -11.1 L 27.2 -9.8 L 27.2 -7.8 L 26.8 -6.0 L 25.6 -4.0 L 23.9 -2.8 L 21.7 -2.0 L 19.3 -1.9 L 14.5 -1.9","0 21.4 M 19.1 7.5 L 21.4 7.0 L 23.9 5.8 L 26.1 3.8 L 27.7 1.0 L 28.6 -1.4 L 29.0 -4.2 L 29.2 -7.1 L 28.7 -9.1 L 27.3 -11.3 L 25.2 -12.6 L 23.2 -13.1 L 21.0 -12.7 L 18.7 -11.8 L 16.6 -10.0 L 15.2 -8.1 L 13.9 -5.1 L 13.2 -2.8 L 13.0 -.6 L 13.2 2.0 L 14.0 4.2 L 15.1 5.7 L 16.6 6.8 L 18.2 7.3 L 19.1 7.4 L 19.6 9.2 L 20.7 10.5 L 22.0 11.3 L 23.7 11.8 L 25.3 11.9 L 26.8 11.6","0 18.4 M 12.7 7.4 L 16.3 -12.6 L 22.9 -12.6 L 24.5 -12.1 L 26.1 -11.2 L 27.0 -9.2 L 26.7 -7.5 L 26.1 -5.6 L 24.6 -3.9 L 22.9 -3.0 L 20.5 -2.4 L 14.6 -2.4 L 20.2 -2.4 L 24.3 7.4","0 17.3 M 11.6 4.6 L 13.1 6.0 L 14.5 6.8 L 16.4 7.2 L 18.7 7.3 L 21.4 6.3 L 23.3 4.8 L 24.3 2.8 L 24.5 1.0 L 23.8 -.8 L 21.7 -2.3 L 18.0 -4.1 L 15.9 -5.6 L 14.9 -7.2 L 15.3 -9.2 L 16.5 -11.3 L 18.9 -12.7 L 21.2 -13.0 L 23.3 -12.8 L 24.7 -12.0 L 26.0 -10.9","0 17.4 M 17.3 7.3 L 20.8 -12.6 L 13.9 -12.6 L 27.9 -12.6","0 21.0 M 16.5 -12.8 L 14.0 1.1 L 14.0 2.9 L 14.6 4.8 L 15.5 6.1 L 17.1 7.1 L 18.8 7.5 L 20.9 7.2 L 23.2 6.1 L 25.0 4.3 L 26.1 2.7 L 26.7 .5 L 29.0 -12.7","0 16.3 M 13.6 -12.8 L 16.6 7.4 L 27.0 -12.7","0 25.1 M 14.3 -12.8 L 15.4 7.4 L 15.8 7.3 L 24.6 -12.7 L 25.0 -12.7 L 26.7 7.4 L 27.1 7.4 L 35.2 -12.8","0 16.1 M 10.4 7.4 L 26.0 -12.8 M 14.6 -12.9 L 22.8 7.4","0 15.0 M 13.6 -12.8 L 17.5 -.7 L 16.1 7.3 L 17.5 -.8 L 25.6 -12.7","0 17.8 M 15.4 -12.6 L 27.3 -12.6 L 11.1 7.1 L 24.3 7.1","0 9.7 M 16.1 11.9 L 11.9 11.9 L 16.5 -14.2 L 20.8 -14.2","0 12.2 M 13.8 -14.4 L 18.5 12.5","0 9.7 M 9.2 11.8 L 13.4 11.8 L 18.1 -14.3 L 13.8 -14.3","0 16.0 M 13.5 -1.9 L 20.1 -13.4 L 22.9 -1.6","0 16.8 M 8.9 10.6 L 23.9 10.6","0 17.7 M 19.5 -14.5 L 21.7 -10.6","0 16.5 M 14.6 -5.6 L 16.9 -6.8 L 18.8 -7.3 L 20.7 -7.5 L 22.0 -7.0 L 23.0 -5.9 L 23.4 -4.3 L 23.1 -2.1 L 21.9 4.6 L 21.5 7.3 L 21.9 4.6 L 20.4 5.5 L 18.8 6.5 L 17.1 7.2 L 15.3 7.5 L 13.8 7.0 L 12.8 6.2 L 12.1 4.9 L 12.4 3.0 L 13.5 1.5 L 15.3 .2 L 17.0 -.4 L 19.0 -1.0 L 20.8 -1.3 L 22.0 -1.4 L 22.9 -1.4","0 17.9 M 16.5 -14.8 L 12.5 7.5 L 13.0 4.8 L 13.8 5.7 L 15.4 6.8 L 17.1 7.3 L 18.9 7.4 L 21.2 6.2 L 22.8 4.8 L 24.1 2.8 L 25.0 .3 L 25.3 -2.2 L 25.2 -4.5 L 24.1 -6.4 L 22.9 -7.1 L 21.1 -7.5 L 19.1 -7.1 L 17.1 -6.1 L 14.8 -4.5","0 15.0 M 22.0 5.7 L 20.1 6.9 L 17.7 7.4 L 15.6 7.1 L 13.6 5.6 L 12.6 3.5 L 12.5 1.0 L 13.0 -1.6 L 14.2 -4.0 L 16.1 -5.9 L 18.2 -7.0 L 20.4 -7.3 L 22.1 -7.0 L 23.3 -6.4 L 23.6 -5.8","0 18.0 M 26.5 -14.7 L 22.5 7.3 L 23.1 4.3 L 21.4 5.7 L 19.3 7.0 L 17.3 7.5 L 15.7 7.2 L 14.3 6.5 L 12.9 4.8 L 12.4 2.5 L 12.7 -.3 L 14.0 -3.6 L 16.0 -6.1 L 18.7 -7.3 L 20.7 -7.5 L 22.5 -6.8 L 23.7 -6.0 L 24.7 -4.8","0 16.0 M 12.8 -.4 L 23.8 -.4 L 24.1 -2.2 L 24.0 -4.5 L 22.9 -6.3 L 21.5 -7.3 L 19.4 -7.4 L 17.2 -6.8 L 15.2 -5.3 L 14.1 -3.8 L 13.0 -1.9 L 12.5 .1 L 12.5 2.5 L 13.0 4.7 L 14.5 6.5 L 16.1 7.3 L 18.2 7.5 L 20.0 7.0 L 22.0 6.1","0 9.2 M 12.9 7.4 L 15.4 -7.0 L 13.1 -7.0 L 19.2 -7.0 L 15.4 -7.0 L 16.2 -11.4 L 16.7 -12.9 L 17.9 -14.4 L 19.6 -15.0 L 20.9 -14.8 L 21.7 -14.4","0 16.2 M 14.1 6.7 L 12.3 8.1 L 11.1 9.8 L 10.6 11.6 L 11.6 13.1 L 13.8 14.1 L 16.4 14.4 L 19.0 13.8 L 21.6 12.2 L 22.8 10.7 L 23.0 9.0 L 22.4 7.4 L 20.3 6.8 L 14.2 6.8 L 13.1 5.9 L 12.7 4.5 L 13.2 3.2 L 15.3 1.3 L 16.3 2.0 L 17.9 2.3 L 20.1 1.6 L 21.8 .2 L 22.9 -1.5 L 23.2 -3.5 L 22.8 -5.3 L 22.3 -6.1 L 21.1 -7.0 L 25.9 -7.0 L 21.0 -7.0 L 19.6 -7.3 L 17.3 -7.1 L 15.5 -5.8 L 14.2 -4.0 L 13.7 -2.0 L 13.9 -.4 L 14.5 .6 L 15.2 1.4","0 17.6 M 12.6 7.3 L 16.6 -14.7 L 14.6 -3.6 L 16.3 -5.2 L 17.8 -6.4 L 19.9 -7.2 L 21.8 -7.4 L 23.8 -6.2 L 24.4 -4.8 L 24.3 -2.5 L 22.6 7.4","0 8.0 M 12.6 7.5 L 15.2 -7.2 M 15.4 -13.3 L 15.1 -11.7 L 16.7 -11.7 L 17.0 -13.3 L 15.4 -13.3","0 8.3 M 7.2 13.9 L 7.4 13.9 L 8.3 14.2 L 9.8 14.1 L 11.3 13.2 L 12.0 11.6 L 15.4 -7.3 M 15.6 -13.2 L 15.3 -11.7 L 16.9 -11.7 L 17.2 -13.2 L 15.6 -13.2","0 15.4 M 12.5 7.5 L 16.5 -14.8 M 23.9 -7.2 L 13.4 3.3 M 18.3 -1.7 L 22.4 7.5","0 8.4 M 16.6 -14.7 L 13.0 6.0 L 13.0 6.7 L 13.2 7.1 L 13.7 7.4 L 14.3 7.4","0 26.5 M 12.5 7.5 L 15.1 -7.2 L 14.5 -3.9 L 16.1 -5.1 L 17.6 -6.2 L 19.0 -7.0 L 20.5 -7.4 L 21.8 -7.2 L 22.6 -6.8 L 23.5 -5.8 L 23.8 -4.1 L 23.6 -2.0 L 21.9 7.5 L 23.9 -3.6 L 24.5 -4.4 L 26.9 -6.3 L 28.7 -7.1 L 30.0 -7.5 L 31.3 -7.1 L 32.2 -6.6 L 33.0 -5.3 L 33.0 -2.7 L 31.2 7.4","0 17.7 M 12.6 7.5 L 15.2 -7.3 L 14.6 -3.7 L 16.2 -5.1 L 17.7 -6.3 L 18.8 -6.9 L 20.4 -7.3 L 21.4 -7.4 L 22.9 -7.0 L 23.6 -6.4 L 24.2 -5.4 L 24.5 -4.0 L 22.4 7.5","0 17.8 M 17.7 7.4 L 17.8 7.4 L 19.9 6.9 L 22.0 5.6 L 23.5 3.6 L 24.5 1.4 L 24.9 -.7 L 24.9 -2.6 L 24.6 -4.3 L 23.9 -5.6 L 22.6 -6.8 L 21.2 -7.3 L 19.9 -7.4 L 18.2 -7.1 L 16.5 -6.2 L 15.0 -4.7 L 14.0 -3.3 L 13.0 -1.2 L 12.8 .4 L 12.6 2.3 L 12.8 4.0 L 13.7 5.6 L 14.9 6.7 L 16.3 7.3 L 17.7 7.4","0 18.0 M 11.3 14.2 L 15.1 -7.3 L 14.6 -4.1 L 16.5 -5.8 L 18.7 -6.9 L 20.5 -7.2 L 22.6 -7.2 L 24.1 -6.3 L 25.1 -4.3 L 25.4 -2.0 L 25.0 .6 L 24.2 2.8 L 22.7 5.1 L 20.8 6.6 L 19.5 7.2 L 17.6 7.3 L 16.1 7.0 L 14.6 6.1 L 13.2 5.0","0 17.7 M 21.3 14.1 L 25.1 -7.2 L 24.7 -5.0 L 23.1 -6.3 L 21.4 -7.1 L 19.0 -7.3 L 16.6 -6.4 L 14.8 -4.6 L 13.5 -2.4 L 12.8 -.6 L 12.5 1.2 L 12.4 3.1 L 12.8 5.0 L 13.8 6.3 L 15.1 7.1 L 17.0 7.5 L 19.2 6.9 L 21.3 5.7 L 22.9 4.5","0 10.8 M 12.7 7.4 L 15.3 -7.3 L 14.5 -2.8 L 15.7 -4.6 L 17.4 -6.4 L 19.0 -7.1 L 20.5 -7.3 L 21.4 -7.2","0 13.6 M 11.1 5.5 L 12.7 6.7 L 14.5 7.3 L 16.1 7.5 L 18.2 6.8 L 20.0 5.6 L 20.7 3.8 L 20.6 2.0 L 19.1 .5 L 16.8 -.5 L 14.7 -1.5 L 13.6 -2.8 L 13.6 -4.3 L 14.4 -5.7 L 16.2 -7.1 L 18.3 -7.4 L 20.2 -7.0 L 21.7 -6.0","0 10.6 M 18.2 6.8 L 17.0 7.3 L 15.6 7.3 L 14.3 6.9 L 13.5 5.6 L 13.7 3.4 L 15.6 -6.9 L 12.6 -6.9 L 20.3 -6.9 L 15.6 -6.9 L 16.4 -11.4","0 17.6 M 24.7 -7.1 L 22.1 7.4 L 22.8 3.6 L 21.4 4.9 L 19.9 6.2 L 17.9 7.2 L 16.2 7.5 L 14.5 7.0 L 13.4 6.0 L 13.0 4.7 L 13.3 2.2 L 14.9 -7.1","0 14.6 M 12.9 -7.4 L 15.8 7.5 L 16.2 7.5 L 24.4 -7.4","0 22.3 M 13.2 -7.3 L 14.8 7.7 L 15.2 7.7 L 22.1 -7.3 L 22.7 -7.3 L 24.3 7.7 L 24.7 7.7 L 31.6 -7.3","0 13.8 M 10.1 7.7 L 22.9 -7.4 M 13.4 -7.4 L 20.9 7.7","0 14.6 M 12.9 -7.2 L 16.2 7.9 M 24.1 -7.1 L 14.8 10.5 L 13.8 12.0 L 12.5 13.1 L 11.2 13.8 L 9.1 13.8","0 13.5 M 13.6 -6.8 L 22.5 -6.8 L 10.6 7.0 L 20.8 7.0","0 9.8 M 16.2 11.9 L 14.6 12.0 L 13.3 11.2 L 12.7 9.6 L 14.7 1.2 L 14.5 .1 L 13.8 -.7 L 13.1 -1.0 L 11.9 -1.1 L 13.6 -1.5 L 14.9 -2.2 L 15.4 -3.5 L 16.8 -11.9 L 17.3 -13.3 L 18.9 -14.2 L 20.8 -14.2","0 8.1 M 11.1 15.0 L 16.5 -15.5","0 9.8 M 9.2 11.9 L 11.1 11.8 L 12.6 11.1 L 13.4 9.2 L 14.6 1.4 L 15.3 -.1 L 16.1 -.8 L 17.5 -1.2 L 17.9 -1.2 L 16.8 -1.6 L 15.8 -2.0 L 15.5 -3.1 L 16.0 -6.0 L 17.3 -12.0 L 16.8 -13.7 L 15.6 -14.3 L 14.0 -14.3","0 16.0 M 12.7 -2.3 L 14.1 -3.6 L 15.5 -4.2 L 17.1 -4.2 L 18.4 -2.9 L 19.8 -1.6 L 20.7 -1.2 L 22.0 -1.4 L 23.0 -2.2 L 24.0 -3.1","0 10.8 M 16.8 -7.0 L 18.5 -7.5 L 20.0 -9.2 L 20.4 -11.0 L 19.7 -12.6 L 18.7 -13.4 L 16.9 -13.5 L 15.1 -12.3 L 14.2 -10.9 L 13.9 -9.1 L 14.5 -8.0 L 15.6 -7.1 L 16.8 -7.0"]
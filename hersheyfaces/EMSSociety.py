@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 21.8 M 33.5 -19.6 L 18.8 3.6 M 17.1 6.7 L 16.3 8.0","0 19.2 M 24.0 -16.9 L 20.4 -11.9 M 26.9 -16.8 L 23.1 -11.7","0 29.0 M 25.3 -4.2 L 20.7 9.0 M 29.3 -4.0 L 24.7 8.9 M 19.1 .8 L 32.9 .6 M 17.4 4.3 L 31.7 4.1","0 37.1 M 40.2 -27.1 L 36.9 -21.7 L 32.9 -14.2 L 28.6 -5.0 L 24.7 3.6 L 21.3 12.4 M 33.5 -18.8 L 35.8 -18.2 L 38.5 -18.8 L 41.4 -19.8 L 42.5 -21.2 L 42.2 -22.4 L 40.9 -23.3 L 39.8 -23.8 L 37.2 -24.4 L 33.1 -24.1 L 28.9 -22.8 L 26.7 -20.6 L 26.2 -18.8 L 27.0 -16.3 L 28.4 -14.6 L 30.1 -12.7 L 33.9 -9.9 L 37.1 -6.6 L 39.0 -3.4 L 38.9 .3 L 37.3 3.3 L 34.0 6.5 L 30.5 8.1 L 26.4 8.9 L 24.2 8.7 L 20.3 8.1 L 18.2 6.9 L 16.8 5.1 L 16.2 2.0 L 17.8 -1.3 L 21.0 -3.2 L 24.6 -3.8 L 26.8 -3.4 L 29.6 -2.3 L 30.4 -1.0 L 30.7 .9","0 46.9 M 27.3 -19.0 L 30.0 -21.0 L 31.6 -22.8 L 31.2 -24.6 L 28.4 -25.0 L 25.2 -23.3 L 20.9 -19.4 L 18.4 -15.1 L 16.8 -11.2 L 16.5 -8.5 L 16.8 -6.3 L 18.0 -4.8 L 20.5 -4.3 L 25.4 -6.3 L 30.0 -11.4 L 32.3 -15.8 L 33.1 -18.9 L 33.1 -20.4 L 32.9 -20.9 L 32.4 -21.5 L 30.6 -22.0 L 28.2 -20.4 L 27.3 -19.8 L 27.0 -18.2 M 44.1 -6.9 L 46.8 -8.8 L 48.4 -10.6 L 48.0 -12.4 L 45.2 -12.8 L 42.0 -11.2 L 37.7 -7.2 L 35.2 -2.9 L 33.6 .9 L 33.3 3.7 L 33.6 5.9 L 34.8 7.3 L 37.3 7.9 L 42.2 5.9 L 46.8 .8 L 49.1 -3.7 L 49.9 -6.7 L 49.9 -8.2 L 49.7 -8.8 L 49.2 -9.3 L 47.4 -9.9 L 45.0 -8.2 L 44.1 -7.7 L 43.8 -6.0 M 45.4 -27.8 L 37.2 -16.0 L 32.1 -7.9 L 28.3 -1.8 L 25.2 4.5 L 22.6 10.7","0 35.0 M 25.3 -3.5 L 25.5 1.1 L 26.2 -1.3 L 27.8 -3.0 L 29.8 -4.5 L 32.2 -5.9 L 35.0 -6.7 L 37.4 -6.6 L 39.0 -5.5 L 39.2 -3.5 L 38.0 -.7 L 35.1 2.7 L 32.4 5.0 L 28.7 7.1 L 24.7 8.3 L 20.7 8.6 L 17.8 7.7 L 15.9 5.5 L 15.7 2.0 L 16.6 -1.4 L 19.0 -4.9 L 21.8 -7.9 L 26.4 -12.0 L 30.8 -15.3 L 33.5 -17.4 L 36.0 -19.9 L 37.1 -21.3 L 37.3 -22.5 L 36.8 -23.0 L 35.6 -23.2 L 33.9 -22.3 L 31.2 -19.5 L 30.1 -17.4 L 28.8 -12.7 L 28.7 -9.1 L 28.6 -5.7 L 29.1 -1.7 L 30.6 2.8 L 33.0 7.2 L 35.3 9.2 L 38.1 10.2 L 40.1 10.1 L 41.3 9.9 L 42.3 9.5 L 43.3 9.0 L 44.5 8.2","0 16.3 M 24.3 -16.8 L 20.7 -11.9","0 21.0 M 36.6 -25.2 L 28.7 -19.8 L 23.2 -13.9 L 20.5 -9.1 L 18.5 -3.7 L 17.4 1.7 L 17.3 6.2 L 18.1 10.1 L 20.7 14.5","0 21.1 M 26.5 -24.9 L 29.2 -19.8 L 29.7 -15.0 L 28.9 -7.7 L 26.7 -1.3 L 22.8 5.1 L 18.5 9.5 L 15.0 12.2 L 10.7 14.5","0 29.3 M 21.8 -5.1 L 25.2 .0 M 19.7 -2.8 L 26.9 -2.8 M 20.2 -.5 L 26.7 -5.1 M 22.3 .6 L 24.5 -6.0","0 22.8 M 22.5 -11.1 L 18.5 .4 M 14.7 -5.4 L 27.0 -5.4","0 16.2 M 16.6 8.1 L 16.3 7.0 L 17.3 6.8 L 17.3 7.8 L 16.1 8.9 L 14.4 10.2 L 12.8 10.7 L 12.4 10.8","0 30.6 M 18.9 3.4 L 19.1 3.4 L 31.2 3.6","0 17.5 M 17.9 7.0 L 16.8 8.5","0 24.6 M 35.8 -28.7 L 30.5 -19.6 L 26.7 -11.7 L 21.4 -.8 L 18.5 7.0 L 16.9 11.0","0 34.1 M 30.7 -13.4 L 31.1 -15.2 L 32.8 -16.7 L 36.1 -18.8 L 37.4 -20.6 L 37.5 -22.5 L 36.4 -23.9 L 33.2 -24.1 L 29.1 -22.5 L 23.6 -18.2 L 18.8 -12.1 L 15.5 -5.9 L 14.3 -.8 L 13.9 3.5 L 15.0 6.5 L 18.2 8.6 L 23.1 7.8 L 27.0 5.9 L 31.9 1.2 L 35.5 -3.7 L 38.1 -9.6 L 39.2 -13.8 L 39.1 -16.9 L 38.4 -18.8 L 36.2 -19.8 L 34.2 -20.1 L 31.9 -19.8 L 30.1 -19.3 L 28.6 -18.5","0 20.4 M 19.8 -17.9 L 18.7 -16.5 L 18.3 -17.0 L 21.4 -18.6 L 23.8 -19.8 L 29.3 -20.9 L 32.9 -22.2 L 34.5 -23.2 L 34.7 -23.9 L 34.1 -24.4 L 32.1 -24.3 L 29.0 -22.4 L 27.4 -21.2 L 23.9 -16.8 L 20.1 -11.1 L 17.2 -5.4 L 14.1 1.6 L 12.9 5.4 L 12.5 7.7 L 12.6 9.0","0 30.6 M 28.5 -18.4 L 27.6 -15.7 L 25.8 -13.1 L 23.0 -11.2 L 18.8 -10.9 L 16.9 -12.1 L 16.6 -14.2 L 17.9 -17.1 L 20.6 -20.1 L 24.2 -22.1 L 27.9 -23.2 L 31.2 -23.5 L 33.9 -22.6 L 35.0 -20.2 L 34.8 -17.4 L 33.0 -13.1 L 29.5 -7.2 L 25.8 -2.5 L 21.8 1.9 L 18.6 5.4 L 15.2 7.9 L 12.2 8.9 L 11.1 7.8 L 11.3 5.7 L 13.7 3.0 L 17.0 1.6 L 18.6 1.4 L 21.0 2.2 L 25.3 5.2 L 28.0 7.0 L 30.8 7.7 L 33.7 7.0 L 36.0 5.9","0 29.4 M 28.3 -19.3 L 26.6 -16.1 L 24.2 -14.2 L 20.7 -13.4 L 19.0 -14.7 L 18.8 -17.4 L 20.8 -20.5 L 23.3 -22.6 L 26.3 -23.9 L 29.5 -24.7 L 32.3 -24.8 L 35.3 -23.7 L 36.3 -22.1 L 36.2 -20.0 L 35.1 -18.1 L 32.6 -15.4 L 29.0 -12.8 L 25.2 -10.7 L 20.4 -8.0 L 22.4 -8.8 L 24.0 -9.3 L 28.4 -9.0 L 30.1 -7.5 L 30.9 -5.7 L 30.7 -3.5 L 29.3 -.5 L 27.3 2.1 L 23.7 5.5 L 20.4 7.3 L 17.5 8.3 L 12.9 8.4 L 10.5 7.3 L 10.4 6.1 L 11.6 5.3 L 13.8 5.1 L 17.5 6.1 L 21.0 8.5 L 22.6 9.5 L 24.4 9.6","0 32.8 M 33.1 -17.9 L 29.2 -9.8 L 25.7 -2.1 L 24.1 2.7 L 22.9 6.5 L 22.6 8.9 M 36.0 -19.4 L 38.3 -21.2 L 39.1 -22.8 L 38.9 -24.4 L 36.7 -25.1 L 33.2 -24.6 L 28.2 -22.2 L 23.5 -18.1 L 19.7 -14.2 L 16.6 -9.4 L 14.6 -5.8 L 13.9 -2.5 L 14.6 .5 L 16.6 1.2 L 19.1 1.4 L 22.1 1.0 L 29.6 -.6 L 31.7 -.8 L 33.9 -.5 L 35.2 -.1 L 36.4 .3","0 30.5 M 32.0 -17.4 L 31.0 -18.4 L 30.9 -20.2 L 31.6 -21.8 L 32.7 -23.2 L 35.5 -24.8 L 37.9 -24.9 L 38.8 -24.3 L 38.5 -23.4 L 37.0 -22.2 L 35.7 -21.5 L 34.0 -21.2 L 31.7 -21.3 L 29.6 -21.3 L 26.7 -21.7 L 22.6 -22.7 L 21.3 -19.0 L 19.7 -14.4 L 18.3 -11.8 L 16.2 -8.2 L 19.5 -9.6 L 23.4 -10.2 L 27.5 -10.2 L 29.8 -8.6 L 30.5 -5.7 L 29.2 -2.7 L 26.5 1.7 L 23.6 4.8 L 20.0 7.2 L 16.0 8.9 L 11.7 8.8 L 9.7 8.0 L 9.0 7.0 L 9.3 5.8 L 10.9 5.5 L 29.4 5.7","0 33.3 M 40.6 -22.3 L 37.3 -23.9 L 33.9 -24.3 L 29.0 -22.2 L 23.6 -18.5 L 17.7 -9.9 L 15.3 -4.3 L 14.2 .7 L 14.5 4.2 L 16.1 6.9 L 18.4 8.1 L 22.0 8.4 L 25.2 7.2 L 27.4 5.8 L 30.0 3.3 L 32.9 -.6 L 34.6 -5.4 L 34.6 -8.0 L 33.3 -10.1 L 32.0 -10.7 L 28.6 -10.7 L 25.7 -9.6 L 23.1 -7.0 L 22.0 -4.8 L 22.0 -1.3 L 22.9 .6 L 24.2 2.4 L 27.3 3.7 L 31.5 4.2 L 34.4 3.4 L 36.3 1.4","0 31.6 M 25.3 -19.0 L 24.5 -17.0 L 22.6 -15.7 L 20.4 -15.5 L 18.6 -15.8 L 16.9 -17.5 L 16.7 -20.2 L 17.9 -22.8 L 21.2 -24.3 L 23.7 -24.4 L 26.5 -24.1 L 30.3 -22.5 L 35.6 -20.7 L 38.5 -20.0 L 41.6 -19.8 L 44.0 -21.0 L 44.9 -22.0 L 44.8 -23.9 L 42.9 -24.4 L 40.6 -24.2 L 38.2 -23.3 L 36.5 -22.0 L 33.7 -19.7 L 30.3 -15.3 L 27.4 -11.1 L 25.0 -7.1 L 22.5 -1.8 L 20.6 3.6 L 19.8 6.4 L 19.9 9.2 M 19.6 -9.3 L 33.6 -9.3","0 35.4 M 24.1 -10.2 L 28.4 -10.8 L 32.2 -12.3 M 32.2 -12.3 L 37.8 -16.1 L 40.3 -19.2 L 40.7 -20.9 L 39.7 -22.8 L 37.0 -24.2 L 34.1 -24.4 L 29.8 -23.9 L 26.6 -22.5 L 24.8 -20.2 L 24.7 -17.5 L 26.0 -14.9 L 32.2 -9.6 L 35.6 -6.1 L 37.1 -3.6 L 37.1 .1 L 35.1 3.9 L 32.3 6.4 L 27.9 8.5 L 22.0 8.9 L 17.3 6.7 L 14.7 3.2 L 14.5 -1.3 L 16.5 -5.1 L 19.4 -6.8 L 23.4 -7.8 L 25.7 -7.4 L 27.8 -6.5 L 28.8 -5.1 L 29.1 -3.4","0 35.2 M 31.5 -11.5 L 30.8 -9.2 L 28.6 -6.4 L 27.2 -5.1 L 23.0 -4.4 L 20.4 -4.9 L 19.4 -7.1 L 19.5 -10.6 L 21.7 -15.0 L 23.8 -18.5 L 26.7 -21.0 L 30.2 -22.9 L 35.1 -23.7 L 37.7 -22.2 L 39.4 -19.6 L 39.3 -15.6 L 38.4 -10.8 L 36.5 -6.7 L 33.5 -1.2 L 30.4 2.7 L 27.3 5.4 L 23.5 7.5 L 20.3 8.3 L 16.3 7.8 L 13.3 5.8","0 18.0 M 21.2 .5 L 20.7 1.7 M 17.8 7.1 L 17.2 8.1","0 16.5 M 21.1 .6 L 20.4 1.6 M 16.6 7.8 L 16.2 6.7 L 17.5 6.7 L 17.3 8.0 L 16.0 9.2 L 14.3 10.5 L 13.1 10.7 L 12.6 10.8","0 27.0 M 28.5 -7.0 L 27.0 -6.0 L 23.4 -5.3 L 20.6 -5.0 L 16.6 -4.7 L 19.5 -2.7 L 23.5 -.7 L 25.7 .6 L 26.3 1.1 L 26.6 1.7","0 23.9 M 15.5 -7.2 L 27.6 -7.2 M 14.8 -4.3 L 26.9 -4.5","0 27.0 M 16.5 -7.8 L 17.2 -6.7 L 20.3 -4.8 L 26.3 -1.6 L 23.8 -1.1 L 19.5 -.8 L 16.9 -.1 L 14.6 1.0","0 30.7 M 29.0 -18.2 L 28.3 -15.7 L 26.9 -13.8 L 24.8 -11.6 L 22.9 -10.7 L 19.2 -10.5 L 17.5 -11.5 L 17.1 -13.2 L 18.0 -16.5 L 20.9 -19.5 L 25.5 -22.0 L 31.0 -22.8 L 34.3 -22.1 L 35.7 -19.5 L 35.4 -15.4 L 33.2 -11.3 L 29.9 -7.7 L 26.8 -5.4 L 23.6 -3.3 L 21.1 -1.1 L 19.9 .6 L 19.6 2.3 L 19.6 3.3 L 20.3 4.1 L 21.8 4.4 L 22.1 4.3 M 18.1 7.0 L 17.2 8.4","0 31.3 M 27.3 2.2 L 28.8 1.0 L 29.4 -.3 L 28.9 -1.2 L 26.2 -1.1 L 22.8 1.1 L 21.0 2.7 L 19.2 4.7 L 18.4 6.5 L 18.7 7.4 L 19.8 7.6 L 21.1 6.9 L 25.3 3.5 L 25.7 3.4 L 23.7 5.8 L 23.6 7.7 L 26.4 8.1 L 30.2 6.9 L 33.1 5.1 L 35.6 2.3 L 36.8 -.5 L 36.7 -2.3 L 35.4 -3.9 L 32.3 -5.1 L 28.6 -5.1 L 24.9 -3.9 L 21.6 -2.2 L 16.8 1.3 L 14.4 4.2 L 13.1 6.5 L 12.9 9.0 L 13.5 10.9 L 15.6 12.3 L 19.4 12.8 L 21.9 12.7 L 24.5 11.9 L 27.1 10.7 L 28.7 9.9","0 42.5 M 8.0 7.2 L 11.5 8.1 L 15.2 8.1 L 19.1 7.2 L 23.0 5.4 L 26.1 3.3 L 30.4 -1.1 L 35.5 -6.9 L 39.4 -12.5 L 43.2 -17.9 L 46.7 -21.4 L 48.0 -22.2 L 49.3 -22.3 L 50.4 -21.3 L 48.2 -16.1 L 43.6 -5.7 L 39.6 2.8 L 36.7 7.5 L 35.9 8.3 L 34.5 8.3 L 32.2 4.3 L 31.0 2.4 L 27.2 -1.9 L 24.0 -3.8 L 20.3 -5.1 L 18.4 -5.1 L 17.1 -4.7 L 16.9 -3.9 L 18.3 -2.3 L 21.9 -1.0 L 30.5 .0 L 43.4 -.2 L 46.9 -.2 L 49.4 -.5 L 50.9 -.8","0 41.5 M 25.7 -11.2 L 24.1 -12.8 L 20.9 -13.7 L 18.0 -13.9 L 16.1 -14.8 L 14.0 -16.1 L 13.7 -17.4 L 13.9 -19.3 L 16.7 -21.2 L 22.0 -22.0 L 25.9 -22.1 L 30.3 -21.4 L 32.7 -20.0 L 33.8 -18.1 L 33.8 -16.3 L 32.6 -13.2 L 29.6 -6.8 L 25.5 .2 L 21.5 5.9 L 17.7 10.5 L 16.1 12.3 L 14.7 13.2 L 13.9 13.7 L 13.1 13.4 L 12.8 12.4 L 12.6 11.3 L 13.9 8.6 L 16.9 3.7 L 21.9 -2.7 L 28.4 -9.4 L 34.6 -15.3 L 38.8 -18.2 L 43.1 -20.7 L 46.2 -21.7 L 48.9 -22.0 L 50.1 -21.3 L 50.2 -20.2 L 48.8 -17.6 L 45.4 -14.7 L 41.1 -11.8 L 38.7 -10.2 L 33.8 -7.5 L 37.3 -8.7 L 40.3 -8.7 L 42.9 -8.1 L 44.3 -5.6 L 44.1 -2.8 L 41.9 1.2 L 39.0 4.5 L 35.9 6.9 L 31.8 8.6 L 28.4 9.1 L 26.0 8.7 L 24.1 7.8 L 23.7 7.1 L 23.9 6.0 L 25.2 5.6 L 43.9 5.6","0 25.7 M 14.6 -7.5 L 19.1 -7.8 L 23.4 -9.3 L 28.3 -11.5 L 32.8 -13.9 L 36.5 -16.1 L 39.9 -19.0 L 41.0 -20.3 L 41.2 -21.7 L 39.7 -22.2 L 36.9 -21.8 L 30.9 -18.2 L 25.3 -13.7 L 21.7 -9.7 L 18.0 -5.4 L 14.3 .1 L 12.6 4.6 L 13.0 8.0 L 15.0 9.9 L 17.9 10.2 L 21.4 9.2 L 25.4 7.8 L 29.0 5.0 L 33.7 .8","0 41.6 M 43.3 -23.1 L 40.4 -21.3 L 35.6 -15.6 L 30.7 -9.1 L 25.3 -.8 L 20.9 5.4 L 19.0 7.9 L 16.7 10.1 L 15.0 10.9 L 13.1 11.0 L 12.5 10.1 L 13.5 8.3 L 18.4 2.4 L 23.4 -1.5 L 26.0 -2.9 L 28.9 -4.3 L 30.9 -4.4 L 32.4 -3.2 L 32.6 -1.3 L 32.1 6.6 L 33.3 7.9 L 35.2 7.9 L 37.6 6.4 L 40.7 3.2 L 45.9 -3.9 L 50.7 -11.3 L 52.6 -16.3 L 53.6 -19.3 L 53.4 -22.2 L 52.1 -23.1 L 50.1 -23.3 L 46.7 -22.2 L 42.2 -18.7 L 38.6 -13.9 L 36.6 -10.2 L 35.6 -6.1 L 35.8 -3.5 L 37.3 -1.3 L 40.5 -.4 L 43.8 -.7 L 47.6 -2.6 L 51.3 -4.5 L 54.3 -6.2 L 55.2 -6.9 L 56.8 -7.1","0 36.7 M 13.7 -22.0 L 23.9 -21.2 L 31.7 -20.9 L 38.0 -21.1 L 44.1 -21.3 L 47.7 -22.2 L 49.0 -23.1 L 47.0 -23.6 L 43.1 -23.0 L 40.3 -22.7 L 36.1 -21.4 L 31.5 -20.0 L 24.5 -16.8 L 20.4 -14.3 L 18.7 -12.6 L 17.9 -11.0 L 18.3 -9.9 L 19.8 -9.6 L 24.7 -9.6 L 33.2 -10.7 L 34.8 -11.0 L 36.3 -10.8 L 36.5 -10.1 L 36.0 -9.1 L 33.3 -7.2 L 22.1 -1.9 L 16.5 1.9 L 14.6 4.5 L 14.4 7.0 L 16.5 8.1 L 22.4 7.8 L 30.2 7.0 L 33.4 7.1 L 35.3 7.3 L 36.3 7.9 L 37.6 9.0","0 25.0 M 13.3 -18.5 L 11.9 -19.4 L 11.8 -20.0 L 21.2 -19.6 L 29.9 -19.8 L 36.3 -20.4 L 43.9 -21.6 L 47.3 -22.8 L 49.3 -23.9 L 49.4 -24.7 L 46.4 -24.9 L 42.1 -23.3 L 39.9 -21.6 L 37.4 -19.3 L 32.6 -13.4 L 28.3 -7.8 L 24.2 -1.5 L 20.8 3.8 L 17.5 7.0 L 15.0 8.2 L 13.8 8.7 L 13.0 8.1 L 13.0 7.0 M 17.5 -5.3 L 34.4 -5.6 L 32.4 -4.5 L 31.5 -3.6 L 31.5 -3.1","0 27.1 M 12.6 -13.9 L 15.6 -13.5 L 20.2 -14.4 L 24.3 -16.3 L 27.7 -18.2 L 29.7 -19.9 L 30.9 -21.3 L 31.3 -22.1 L 31.1 -22.8 L 30.1 -23.3 L 27.0 -22.7 L 23.0 -20.7 L 19.8 -18.2 L 16.7 -15.2 L 14.7 -12.7 L 13.8 -10.3 L 14.2 -8.4 L 15.2 -7.2 L 17.2 -6.8 L 20.0 -6.7 L 23.4 -7.4 L 28.1 -9.4 L 33.8 -12.6 L 37.9 -15.6 L 45.1 -21.4 L 37.4 -14.5 L 33.7 -10.0 L 29.7 -4.5 L 25.7 .9 L 22.9 4.6 L 20.9 7.3 L 18.8 9.1 L 16.8 10.3 L 15.5 10.4 L 14.9 10.2 L 13.9 9.0 L 13.2 6.7 L 13.7 4.4 L 15.3 5.7 L 18.6 6.0 L 22.8 5.7 L 25.7 4.8 L 28.6 3.8 L 35.1 .8","0 35.8 M 27.6 -12.6 L 26.4 -13.9 L 23.1 -14.9 L 18.8 -16.1 L 15.9 -17.6 L 15.3 -19.2 L 15.9 -20.9 L 18.6 -22.6 L 22.6 -23.5 L 28.8 -23.5 L 31.7 -23.0 L 33.3 -22.0 L 34.7 -20.1 L 34.7 -17.1 L 32.1 -12.1 L 24.2 .9 L 20.9 5.3 L 17.2 9.4 L 13.9 12.4 L 11.7 13.7 L 10.6 13.7 L 10.8 12.4 L 12.7 8.9 L 17.4 4.8 L 28.0 -2.8 L 43.7 -13.0 L 50.5 -18.0 L 53.7 -21.1 L 55.3 -23.1 L 54.8 -24.4 L 53.4 -24.1 L 50.5 -22.5 L 46.7 -18.9 L 43.4 -14.5 L 40.3 -10.8 L 37.2 -6.4 L 32.9 .8 L 31.2 4.6 L 31.1 7.3 L 32.4 8.3 L 34.2 8.3 L 36.6 7.0 L 39.0 5.0 L 43.8 .8","0 21.7 M 36.1 -20.1 L 33.3 -17.0 L 26.7 -7.7 L 21.0 .8 L 16.0 7.2 L 15.1 8.3 L 13.8 8.3 L 13.8 7.2 M 37.6 -18.3 L 39.6 -20.1 L 40.5 -22.2 L 39.6 -23.6 L 35.8 -23.9 L 31.2 -22.6 L 25.3 -19.8 L 20.2 -16.5 L 15.9 -13.1 L 13.4 -9.8 L 12.7 -8.0 L 13.0 -6.6 L 14.6 -5.5 L 17.4 -5.2 L 21.9 -5.5 L 30.0 -6.8 L 32.9 -7.2 L 34.5 -7.5 L 36.1 -7.0 L 38.4 -6.3","0 32.0 M 50.5 -25.1 L 49.1 -24.1 L 46.6 -21.3 L 42.9 -16.8 L 39.9 -12.2 L 35.5 -5.0 L 32.7 -.1 L 29.1 6.5 L 25.3 12.9 L 22.2 17.7 L 19.3 20.8 L 17.3 22.9 L 15.7 23.6 L 12.8 23.9 L 11.6 22.1 L 10.5 19.5 L 11.3 14.8 L 12.4 11.8 L 15.9 7.3 L 20.2 3.0 L 24.9 -.1 L 32.6 -5.1 L 40.2 -9.5 L 46.0 -13.3 L 49.5 -16.9 L 50.3 -18.9 L 49.8 -20.9 L 49.0 -21.6 L 47.8 -21.8 L 44.7 -21.7 L 38.7 -20.4 L 31.6 -17.1 L 26.1 -12.8 L 22.7 -8.8 L 21.0 -4.0 L 21.6 -.5 L 23.2 1.6 L 26.6 3.0 L 29.5 3.3 L 33.7 2.9 L 37.0 2.0 L 39.9 .8","0 37.5 M 24.6 -12.9 L 23.9 -13.9 L 22.9 -14.5 L 18.9 -15.1 L 15.2 -15.7 L 12.3 -16.7 L 11.1 -17.4 L 11.0 -19.3 L 12.2 -20.9 L 15.2 -22.1 L 19.8 -23.0 L 27.3 -22.9 L 30.0 -22.0 L 31.3 -20.4 L 31.5 -17.7 L 30.2 -14.0 L 27.2 -7.8 L 22.8 -1.6 L 18.1 4.6 L 15.8 7.2 L 14.2 8.9 L 13.1 9.1 L 13.3 8.0 L 13.9 7.0 M 56.7 -26.1 L 54.9 -25.9 L 52.3 -24.2 L 49.0 -21.9 L 44.7 -18.2 L 41.2 -15.0 L 37.6 -11.9 L 35.0 -10.1 L 32.9 -8.6 L 31.1 -8.3 L 30.5 -8.6 L 30.8 -9.8 L 31.9 -11.7 L 34.8 -14.0 L 36.4 -14.3 L 37.7 -13.7 L 37.5 -12.3 L 36.2 -8.7 L 33.9 -2.3 L 32.6 2.7 L 32.2 5.9 L 32.9 8.0 L 35.1 8.6 L 37.3 8.1 L 39.1 7.6 L 40.5 6.6 L 42.4 4.8 L 45.4 .8","0 42.6 M 16.4 -12.8 L 23.6 -12.6 L 30.1 -13.7 L 36.3 -15.2 L 40.9 -16.6 L 46.1 -18.9 L 49.8 -21.1 L 51.5 -22.8 L 51.2 -23.8 L 49.6 -24.0 L 47.1 -23.6 L 43.9 -22.0 L 41.4 -20.1 L 38.1 -16.3 L 33.7 -11.1 L 25.8 -.8 L 20.4 6.1 L 18.0 8.5 L 15.2 10.1 L 14.3 11.0 L 12.8 10.8 L 12.3 9.9 L 13.3 7.3 L 16.5 4.6 L 19.4 2.4 L 21.3 1.4 L 22.8 .9 L 26.1 .8 L 29.7 1.8 L 31.9 3.6 L 35.2 6.2 L 37.6 7.7 L 40.8 8.1 L 43.2 7.8 L 45.9 6.3","0 42.0 M 24.6 -13.9 L 22.2 -10.6 L 19.3 -8.0 L 16.7 -6.4 L 13.6 -6.1 L 12.2 -7.7 L 13.0 -10.4 L 15.7 -13.9 L 20.6 -18.8 L 24.1 -21.1 L 26.9 -22.5 L 30.2 -22.9 L 31.8 -21.9 L 32.6 -19.6 L 31.9 -16.6 L 29.5 -10.2 L 26.0 -5.1 L 22.5 .0 L 19.4 4.0 L 16.7 7.0 L 15.2 8.1 L 14.6 8.1 L 13.9 7.8 L 13.8 6.7 L 15.7 2.9 L 20.9 -3.2 L 24.8 -7.8 L 27.4 -10.2 L 31.7 -13.6 L 35.4 -15.9 L 36.9 -16.6 L 39.1 -16.7 L 39.6 -15.8 L 39.1 -13.9 L 35.8 -8.1 L 31.3 -1.3 L 26.8 4.2 L 24.9 6.5 L 24.6 7.7 L 27.0 5.5 L 33.8 -.5 L 40.1 -6.1 L 44.2 -9.4 L 46.0 -10.3 L 47.0 -10.3 L 47.1 -9.0 L 46.4 -7.9 L 41.2 -1.0 L 38.1 3.2 L 36.9 6.2 L 36.7 7.8 L 37.9 8.8 L 39.5 8.7 L 41.7 7.7 L 44.5 6.1 L 50.0 .8","0 33.0 M 23.4 -9.1 L 24.0 -11.8 L 25.2 -14.5 L 26.4 -15.1 L 25.4 -12.1 L 24.3 -10.9 L 20.8 -7.8 L 17.8 -5.9 L 14.7 -5.4 L 12.8 -6.1 L 12.5 -8.4 L 15.3 -13.1 L 19.4 -17.3 L 23.9 -20.4 L 28.6 -22.0 L 31.0 -22.0 L 32.9 -20.9 L 33.7 -18.5 L 32.8 -15.0 L 30.4 -9.2 L 28.3 -6.1 L 24.9 -1.1 L 21.6 3.4 L 18.3 6.7 L 16.9 8.3 L 15.6 8.9 L 14.3 8.5 L 14.6 6.8 L 15.9 4.8 L 21.0 -1.9 L 27.3 -8.2 L 33.2 -12.9 L 38.1 -15.9 L 40.4 -16.9 L 41.9 -16.9 L 42.1 -16.1 L 41.6 -14.6 L 33.4 -3.3 L 30.9 .0 L 28.9 3.5 L 27.8 6.5 L 28.4 7.8 L 30.0 8.3 L 32.4 7.0 L 34.8 5.7 L 40.9 .8","0 30.3 M 30.8 -13.6 L 30.9 -14.8 L 31.8 -16.3 L 35.4 -18.6 L 36.8 -19.8 L 37.8 -21.2 L 37.7 -23.1 L 36.6 -24.2 L 33.9 -24.5 L 30.0 -23.3 L 25.2 -20.1 L 19.6 -14.0 L 15.6 -7.8 L 13.6 -3.2 L 12.9 .8 L 13.0 4.8 L 14.3 7.1 L 17.0 8.3 L 20.2 8.1 L 23.4 6.8 L 25.5 5.6 L 29.8 1.8 L 33.9 -3.1 L 37.2 -8.8 L 38.6 -12.9 L 39.3 -16.7 L 39.0 -18.5 L 38.2 -19.4 L 35.7 -20.5 L 31.9 -20.0 L 26.9 -17.2 L 23.1 -13.6 L 20.4 -8.7 L 19.1 -4.7 L 19.1 -.5 L 21.5 3.3 L 25.3 4.4 L 29.2 4.8 L 32.9 3.7 L 38.2 .9","0 24.2 M 24.7 -10.2 L 24.4 -12.0 L 22.4 -14.2 L 19.3 -15.9 L 17.1 -17.2 L 15.3 -18.5 L 14.3 -20.4 L 14.8 -21.7 L 16.7 -23.1 L 19.5 -23.8 L 23.4 -23.8 L 27.0 -23.2 L 30.3 -22.0 L 32.2 -20.5 L 33.0 -17.7 L 32.7 -14.9 L 30.8 -10.6 L 27.1 -4.2 L 23.9 .2 L 19.7 5.4 L 17.4 7.8 L 14.8 9.8 L 12.6 10.5 L 12.4 10.5 L 12.4 9.2 L 14.7 5.1 L 19.2 -.8 L 25.0 -7.3 L 28.7 -11.1 L 33.3 -15.2 L 39.7 -19.9 L 44.2 -22.5 L 47.2 -23.2 L 48.3 -23.1 L 49.1 -22.5 L 49.4 -21.5 L 47.8 -18.2 L 44.8 -13.5 L 41.9 -10.9 L 39.1 -8.8 L 37.4 -8.2 L 36.0 -8.0 L 34.8 -8.6 L 33.8 -9.3 L 33.3 -10.5","0 45.3 M 37.1 -16.0 L 34.2 -12.5 L 30.6 -9.6 L 25.8 -7.2 L 21.5 -6.5 L 19.7 -7.4 L 19.6 -9.5 L 21.4 -13.2 L 26.2 -17.8 L 32.4 -21.2 L 37.8 -23.3 L 41.7 -23.6 L 45.2 -23.1 L 46.6 -21.2 L 47.0 -18.8 L 46.1 -16.1 L 43.4 -11.6 L 38.7 -6.6 L 33.4 -1.0 L 25.9 5.1 L 21.5 8.6 L 17.1 11.0 L 14.4 12.0 L 12.9 11.6 L 12.4 10.6 L 13.4 8.2 L 16.6 5.4 L 21.5 2.8 L 24.4 1.4 L 26.1 1.2 L 28.8 1.4 L 31.5 2.8 L 35.6 5.2 L 38.4 6.9 L 41.5 7.9 L 44.5 7.5 L 46.0 7.2 L 48.9 5.7","0 41.6 M 25.8 -12.1 L 25.0 -14.2 L 23.0 -15.6 L 18.0 -17.1 L 15.1 -19.1 L 14.6 -20.8 L 15.9 -22.2 L 18.6 -23.2 L 23.9 -23.4 L 27.7 -22.8 L 30.9 -21.4 L 32.8 -19.0 L 32.8 -16.6 L 32.3 -13.4 L 30.1 -9.0 L 27.6 -4.6 L 22.7 1.9 L 17.8 7.3 L 15.3 9.4 L 14.3 10.1 L 13.2 10.5 L 12.6 9.7 L 13.1 7.8 L 15.4 4.0 L 20.2 -2.0 L 26.8 -9.0 L 31.4 -13.3 L 37.5 -17.8 L 42.8 -20.9 L 46.9 -22.6 L 49.9 -23.0 L 51.1 -22.5 L 51.4 -22.1 L 51.3 -20.5 L 50.0 -18.2 L 47.3 -14.8 L 43.8 -11.3 L 41.1 -9.2 L 40.0 -8.5 L 38.0 -7.8 L 37.0 -7.9 L 35.3 -8.3 L 34.0 -9.0 L 33.4 -9.9 L 32.7 -11.3 L 33.7 -11.4 L 33.5 -2.4 L 34.0 1.4 L 36.0 6.2 L 38.1 8.1 L 40.6 8.1 L 44.7 5.5 L 49.5 .6","0 42.1 M 14.0 8.7 L 16.9 8.1 L 21.2 6.3 L 28.7 2.8 L 36.0 -1.6 L 47.8 -8.8 L 54.3 -14.2 L 58.6 -18.3 L 59.7 -20.0 L 60.5 -21.4 L 60.6 -22.5 L 60.2 -23.1 L 59.3 -23.2 L 57.5 -22.8 L 54.0 -20.4 L 51.8 -17.7 L 48.8 -13.4 L 46.5 -9.3 L 43.8 -4.3 L 40.3 2.0 L 37.6 5.5 L 34.5 7.7 L 32.0 7.7 L 29.1 6.1 L 26.6 3.2 L 24.0 -.5 L 21.7 -3.3 L 18.5 -5.7 L 16.2 -6.4 L 13.8 -6.1 L 12.8 -4.9 L 14.1 -3.0 L 18.4 -1.6 L 28.9 -.4 L 39.1 -.4 L 46.5 -1.1 L 51.6 -2.1","0 24.6 M 12.8 -18.5 L 10.9 -19.3 L 10.9 -20.0 L 16.1 -18.8 L 23.7 -18.8 L 32.9 -18.8 L 40.7 -19.6 L 46.5 -20.9 L 50.7 -22.2 L 52.0 -23.2 L 52.3 -24.3 L 50.9 -24.9 L 47.2 -24.4 L 43.7 -23.0 L 40.5 -20.7 L 36.0 -16.2 L 31.2 -9.5 L 27.4 -3.7 L 24.3 1.4 L 21.7 5.1 L 20.2 6.7 L 18.3 8.3 L 17.8 8.9 L 16.0 9.1 L 16.1 8.1 L 16.8 6.7","0 35.7 M 24.1 -11.6 L 24.4 -11.6 L 26.0 -15.3 L 26.4 -16.4 L 27.2 -16.1 L 24.4 -12.6 L 22.0 -10.3 L 19.2 -8.5 L 15.4 -7.4 L 13.4 -7.8 L 12.6 -9.4 L 13.1 -11.5 L 15.8 -15.6 L 19.8 -19.1 L 24.6 -22.0 L 28.4 -23.5 L 30.7 -24.1 L 33.9 -23.6 L 35.2 -21.9 L 35.0 -20.0 L 33.7 -16.6 L 30.3 -11.8 L 25.7 -5.7 L 19.9 2.2 L 18.8 4.1 L 18.4 5.9 L 19.5 7.3 L 21.4 7.5 L 24.7 6.2 L 28.7 3.7 L 33.8 -.7 L 39.2 -5.8 L 44.3 -11.6 L 47.2 -15.5 L 47.8 -17.1 L 47.5 -17.9 L 47.0 -17.9 L 44.3 -16.3 L 40.7 -12.5 L 36.5 -7.1 L 33.8 -2.8 L 32.2 .1 L 30.9 3.3 L 31.0 6.8 L 32.5 8.3 L 35.2 8.4 L 36.8 7.7 L 39.5 6.0 L 43.6 .8","0 23.9 M 24.7 -12.2 L 23.9 -13.7 L 21.2 -15.0 L 17.5 -15.6 L 13.5 -16.4 L 11.7 -17.3 L 10.9 -18.8 L 11.3 -20.7 L 13.7 -22.2 L 16.3 -22.8 L 20.8 -23.2 L 25.0 -23.0 L 28.6 -22.4 L 31.1 -21.0 L 31.8 -19.0 L 31.6 -15.5 L 30.1 -12.1 L 26.4 -4.3 L 23.4 .5 L 20.7 4.3 L 18.9 7.1 L 17.8 8.1 L 17.2 8.9 L 15.9 8.9 L 15.6 8.1 L 16.1 6.0 L 17.4 4.1 L 19.3 1.6 L 21.8 -1.1 L 25.0 -4.1 L 31.4 -9.6 L 41.3 -16.9 L 44.6 -19.1 L 49.7 -21.7","0 37.5 M 23.8 -10.6 L 24.1 -11.9 L 23.5 -12.9 L 20.9 -14.2 L 17.6 -14.9 L 14.6 -15.8 L 12.5 -16.6 L 11.3 -17.2 L 10.1 -19.0 L 10.1 -20.5 L 11.2 -21.8 L 15.0 -23.3 L 19.6 -23.7 L 25.3 -23.3 L 29.6 -21.7 L 31.6 -19.0 L 32.1 -15.5 L 31.4 -11.2 L 28.5 -4.9 L 25.1 .9 L 21.7 5.4 L 18.4 8.9 L 17.0 9.9 L 15.6 10.1 L 15.2 9.3 L 15.7 7.5 L 19.2 2.7 L 24.3 -2.9 L 27.4 -6.0 L 34.5 -11.9 L 38.2 -14.3 L 39.4 -14.9 L 40.6 -15.2 L 41.2 -15.1 L 41.4 -14.0 L 41.1 -12.9 L 33.4 3.6 L 32.4 6.0 L 32.3 6.9 L 33.9 5.0 L 36.2 2.7 L 40.0 -2.1 L 44.2 -6.5 L 49.0 -11.0 L 54.0 -15.1 L 58.4 -18.1 L 61.6 -19.8 L 64.5 -21.2 L 61.2 -18.6","0 38.5 M 25.3 -10.7 L 28.3 -15.7 L 28.6 -15.3 L 25.2 -11.7 L 22.1 -8.8 L 17.4 -6.4 L 14.8 -6.0 L 13.6 -6.4 L 12.7 -8.0 L 13.5 -11.1 L 15.4 -14.4 L 19.4 -18.7 L 23.4 -21.4 L 28.5 -23.6 L 32.1 -24.1 L 34.7 -22.7 L 35.6 -19.4 L 35.0 -15.4 L 30.0 1.2 L 29.6 5.0 L 30.1 7.0 L 32.5 8.3 L 35.2 8.5 L 37.9 7.7 L 39.8 6.5 L 42.6 4.5 L 46.5 .7 M 53.5 -20.4 L 55.9 -22.7 L 56.1 -23.6 L 40.1 -12.3 L 26.8 -1.7 L 21.2 3.4 L 16.3 8.3","0 38.2 M 28.2 -13.9 L 25.5 -11.1 L 22.6 -8.3 L 19.8 -6.6 L 16.2 -5.8 L 14.0 -6.6 L 13.6 -10.1 L 16.5 -15.0 L 22.1 -19.1 L 26.8 -21.7 L 32.3 -22.9 L 35.7 -21.6 L 36.4 -18.8 L 34.9 -15.1 L 31.8 -10.1 L 23.3 -.5 L 20.2 4.4 L 19.5 7.4 L 20.6 8.7 L 24.1 8.0 L 29.3 4.7 L 39.5 -4.5 L 46.3 -11.1 L 48.4 -14.5 L 48.9 -16.4 M 49.3 -16.4 L 47.7 -16.4 L 42.3 -11.7 L 38.0 -5.8 L 34.0 -.9 L 27.2 7.9 L 20.4 17.3 L 13.2 28.4 L 11.4 32.2 L 11.2 33.7 L 13.3 34.5 L 16.7 32.3 L 21.7 26.7 L 23.8 23.2 L 24.3 20.2 L 23.4 18.3 L 21.0 17.0 L 18.0 16.9 L 16.5 17.1 L 26.5 13.3 L 33.8 9.1 L 39.7 5.6 L 43.2 3.0 L 46.2 .8","0 50.0 M 44.0 -10.7 L 43.9 -12.0 L 42.8 -13.4 L 39.1 -14.6 L 33.5 -15.3 L 28.4 -16.0 L 26.0 -17.1 L 24.7 -19.0 L 26.3 -22.2 L 30.1 -23.9 L 36.3 -24.4 L 41.2 -24.2 L 46.7 -23.1 L 50.6 -21.4 L 53.5 -19.0 L 54.5 -16.6 L 54.4 -14.1 L 52.4 -11.3 L 47.6 -7.0 L 40.0 -1.6 L 33.5 2.2 L 25.3 7.0 L 16.7 10.8 L 14.1 11.4 L 12.8 10.9 L 12.9 9.8 L 15.4 7.6 L 19.9 5.1 L 23.2 3.6 L 25.9 3.4 L 28.3 3.8 L 30.8 4.4 L 34.4 6.2 L 40.2 8.4 L 43.3 8.4 L 47.0 7.9 L 49.5 7.0 L 53.2 4.7","0 25.2 M 36.3 -26.7 L 26.0 -26.6 L 19.7 -4.2 L 14.3 15.2 L 24.7 15.4","0 22.0 M 19.8 -30.8 L 20.6 -22.2 L 21.3 -11.4 L 20.9 -2.2 L 20.8 5.7 L 20.4 13.1","0 25.2 M 25.2 -26.7 L 36.0 -26.6 L 24.3 15.2 L 14.5 15.2","0 21.6 M 17.7 4.3 L 20.1 3.2 L 21.5 2.2 L 22.3 1.4 L 22.8 2.4 L 23.1 3.5 L 24.0 4.6","0 27.7 M 15.6 8.6 L 28.2 8.9","0 21.4 M 16.4 -5.8 L 18.4 -4.1 L 21.1 -3.0","0 12.5 M 11.8 2.4 L 12.1 2.4 L 13.2 1.5 L 14.0 .4 L 14.2 -.3 L 13.7 -1.0 L 12.8 -1.2 L 11.0 -1.1 L 8.4 .5 L 6.0 2.6 L 4.0 4.7 L 3.3 6.2 L 3.4 7.4 L 4.7 7.4 L 5.8 6.9 L 7.8 5.4 L 10.0 3.7 L 10.4 3.5 L 8.5 6.0 L 8.4 7.4 L 9.1 8.3 L 10.4 7.9 L 13.5 6.0 L 16.6 3.9 L 20.5 .8","0 13.1 M 25.2 -18.3 L 18.2 -8.8 L 13.7 -2.4 L 11.0 2.0 L 9.4 4.8 L 9.0 6.6 L 9.4 7.6 L 10.4 7.4 L 11.6 6.6 L 13.0 5.4 L 13.9 3.8 L 14.3 2.0 L 14.3 .6 L 13.8 -.7 L 12.6 -1.7 L 10.1 -2.3 L 8.7 -1.6 L 7.9 -.3 L 8.0 .8 L 8.5 2.1 L 9.5 3.3 L 11.4 4.5 L 12.7 4.8 L 15.1 4.7 L 17.1 3.8 L 21.1 .8","0 10.3 M 11.5 1.6 L 12.4 .7 L 12.9 .0 L 12.8 -.5 L 12.6 -.8 L 11.8 -1.0 L 10.4 -.7 L 7.7 1.0 L 5.8 3.0 L 4.6 5.4 L 4.9 7.3 L 5.6 8.0 L 7.6 8.1 L 10.5 6.7 L 13.7 4.6 L 18.3 .8","0 11.8 M 25.3 -17.7 L 22.8 -13.9 L 18.9 -8.8 L 14.9 -3.4 L 10.4 3.2 L 9.1 4.2 L 7.1 5.8 L 4.6 7.3 L 3.1 7.8 L 2.8 6.6 L 3.7 4.9 L 6.0 2.5 L 8.1 .7 L 10.2 -.5 L 11.7 -.6 L 12.2 .6 L 10.1 4.6 L 9.9 6.7 L 10.4 7.3 L 12.5 6.5 L 16.5 3.9 L 19.8 .8","0 11.0 M 6.3 4.9 L 8.8 3.4 L 11.2 1.5 L 12.7 -.4 L 12.7 -1.3 L 11.5 -1.7 L 9.6 -.7 L 8.0 .8 L 6.4 2.9 L 5.9 4.4 L 5.6 5.9 L 5.8 6.9 L 7.2 7.9 L 9.0 7.8 L 11.6 6.5 L 14.5 4.5 L 19.0 .8","0 9.8 M 8.0 .8 L 13.8 -5.6 L 16.5 -8.6 L 21.0 -13.3 L 21.7 -14.3 L 22.2 -14.2 L 19.1 -9.1 L 14.6 -2.4 L 4.8 10.6 L -2.2 21.5 L -3.9 24.2 L -4.6 25.6 L -3.9 26.6 L -3.2 26.6 L .3 25.0 L 4.6 19.9 L 6.7 15.8 L 8.0 11.6 L 8.2 8.3 L 7.2 5.9 L 5.1 4.3 L 3.5 4.0 L 1.6 4.3 L .2 5.1 L -.1 5.9 L .2 6.9 L 2.2 8.3 L 5.3 8.9 L 8.7 8.0 L 12.0 6.2 L 14.3 4.3 L 17.8 .8","0 12.4 M 13.2 1.6 L 14.9 -.1 L 15.6 -1.4 L 14.2 -2.1 L 12.1 -1.9 L 9.7 -.4 L 6.0 2.3 L 3.4 5.4 L 3.5 7.0 L 5.4 7.3 L 6.9 6.4 L 9.8 4.3 L 11.6 2.7 L 11.1 2.4 L 5.6 11.0 L -1.5 21.1 L -3.7 24.2 L -4.5 25.5 L -4.8 24.8 L -3.0 21.5 L -.1 17.7 L 3.0 13.9 L 6.2 11.0 L 7.9 9.7 L 13.0 6.6 L 15.9 4.5 L 20.4 .8","0 13.6 M 19.4 -16.5 L 9.2 -1.0 L 3.6 7.6 L 7.3 4.2 L 10.1 1.8 L 11.7 .7 L 13.0 .1 L 13.9 .0 L 14.3 .0 L 14.2 1.0 L 11.8 4.3 L 10.7 6.2 L 10.6 7.4 L 11.7 8.1 L 12.9 7.6 L 15.0 6.4 L 17.6 4.5 L 21.6 .9","0 7.7 M 8.6 .0 L 6.2 3.3 L 5.0 5.5 L 4.6 6.5 L 4.6 7.3 L 4.9 7.9 L 5.8 7.8 L 8.9 5.9 L 13.5 2.6 L 15.7 .8 M 11.7 -4.4 L 11.0 -3.2","0 7.6 M 8.0 .8 L 11.6 -2.0 L 12.1 -1.4 L 7.7 5.0 L 2.0 13.2 L -1.5 17.9 L -4.6 22.5 L -6.4 25.1 L -6.6 26.3 L -5.6 26.8 L -3.7 26.1 L -.5 22.9 L 1.9 19.1 L 2.2 16.4 L 1.6 14.8 L .6 13.5 L -.6 12.9 L -2.5 12.5 L 1.0 12.2 L 3.6 11.7 L 6.3 10.0 L 10.9 5.9 L 15.6 .8 M 14.2 -5.9 L 13.2 -4.5","0 16.1 M 8.0 .8 L 10.9 -1.9 L 13.2 -4.3 L 16.4 -7.4 L 20.7 -11.4 L 22.8 -14.5 L 23.4 -16.5 L 22.9 -16.8 L 17.6 -10.2 L 14.0 -4.8 L 10.7 .0 L 9.1 2.1 L 5.7 6.8 L 5.7 7.5 L 8.8 3.5 L 11.7 .6 L 14.8 -2.1 L 17.8 -4.4 L 19.8 -5.3 L 20.9 -5.2 L 21.2 -4.1 L 20.3 -2.9 L 18.2 -.7 L 15.8 1.2 L 14.6 1.8 L 13.6 1.6 L 12.1 1.8 L 10.8 1.1 L 12.3 .5 L 12.9 .7 L 11.6 3.4 L 11.5 5.7 L 13.1 7.4 L 15.1 7.4 L 18.3 5.5 L 24.1 .8","0 10.5 M 8.2 .9 L 8.4 .9 L 11.1 -1.0 L 15.8 -5.1 L 20.0 -9.0 L 22.9 -12.1 L 24.6 -14.6 L 25.0 -15.9 L 24.7 -16.5 L 24.1 -16.7 L 22.7 -16.3 L 19.6 -14.0 L 15.8 -10.4 L 12.3 -5.8 L 9.3 -1.5 L 6.8 3.1 L 6.1 5.3 L 6.0 6.5 L 6.3 7.4 L 7.1 8.1 L 8.6 7.7 L 10.7 6.9 L 13.6 4.8 L 18.5 .9","0 20.1 M 28.1 .8 L 24.7 3.9 L 22.5 5.6 L 19.7 7.3 L 17.8 8.0 L 17.0 7.8 L 16.9 6.9 L 17.8 5.3 L 19.7 3.0 L 20.6 2.1 L 21.1 1.3 L 21.1 .8 L 20.3 1.1 L 18.7 2.3 L 15.5 4.7 L 12.9 6.6 L 11.5 7.2 L 10.7 7.3 L 10.9 6.5 L 11.3 5.9 L 12.2 4.8 L 13.4 3.2 L 15.2 1.1 L 15.3 .2 L 14.4 .1 L 13.3 1.0 L 11.3 2.4 L 7.3 5.6 L 4.1 7.5 L 7.0 3.4 L 9.3 .4 L 9.9 -.3 L 8.0 .8","0 16.2 M 8.0 .8 L 8.7 .2 L 10.1 -1.0 L 10.8 -1.1 L 11.0 -.7 L 10.7 .1 L 6.1 6.2 L 5.4 7.3 L 5.6 7.7 L 6.3 7.7 L 8.6 5.8 L 12.3 3.2 L 14.7 1.2 L 17.3 -.2 L 17.7 -.3 L 17.9 .2 L 15.8 2.9 L 13.7 5.5 L 13.3 6.7 L 13.3 7.9 L 14.4 8.0 L 16.4 6.8 L 20.1 4.3 L 24.2 .9","0 11.4 M 9.9 -.9 L 8.1 .7 L 6.3 3.3 L 5.6 6.9 L 5.9 8.3 L 7.9 8.5 L 11.0 6.0 L 13.1 2.8 L 14.0 .0 L 14.5 -2.3 L 14.3 -4.4 L 12.7 -6.3 L 11.0 -6.2 L 9.6 -5.3 L 9.1 -3.9 L 9.3 -1.8 L 10.2 .9 L 11.3 2.3 L 12.8 3.8 L 14.5 3.8 L 16.2 2.9 L 17.7 2.1 L 19.4 .8","0 14.9 M 23.0 .8 L 18.7 4.3 L 16.5 6.0 L 13.6 7.8 L 12.4 8.0 L 11.7 7.4 L 11.9 6.4 L 13.3 4.9 L 15.6 2.0 L 17.0 .5 L 16.9 -.3 L 16.4 -.5 L 14.6 -.3 L 12.9 .6 L 10.2 2.3 L 7.7 4.3 L 4.8 6.6 L 1.1 10.4 L -3.0 15.0 L -5.7 18.4 L -7.9 21.5 L -8.9 23.6 L -8.8 25.1 L -8.6 25.8 L -7.5 25.7 L -6.8 25.0 L -5.8 24.0 L -4.2 21.8 L -.3 17.1 L 4.6 10.4 L 9.4 3.4 L 12.6 -1.1 L 17.2 -7.0 L 18.5 -9.4 L 17.7 -8.7 L 15.9 -6.6 L 13.6 -4.0 L 8.0 .8","0 13.1 M 13.5 1.4 L 15.2 -.2 L 15.7 -1.6 L 15.1 -2.5 L 12.3 -2.0 L 9.1 -.1 L 6.6 1.9 L 4.6 4.1 L 3.7 6.0 L 3.6 7.0 L 5.6 7.4 L 7.5 6.2 L 9.5 4.8 L 11.2 3.3 L 11.5 3.3 L 5.5 10.7 L .9 16.7 L -2.8 22.0 L -4.1 24.4 L -4.5 25.6 L -3.5 26.1 L -2.5 25.9 L -.7 24.3 L 1.9 21.7 L 4.1 18.4 L 6.0 15.1 L 6.8 13.3 L 7.6 11.2 L 7.7 10.2 L 7.6 8.0 L 9.3 8.2 L 11.8 7.5 L 15.6 5.1 L 21.1 .8","0 11.5 M 8.0 .8 L 10.8 -1.4 L 12.3 -3.1 L 13.4 -4.4 L 13.7 -5.3 L 12.8 -5.4 L 11.5 -4.0 L 11.2 -3.2 L 11.4 -1.9 L 12.1 -.8 L 13.0 .1 L 9.9 3.9 L 8.7 5.6 L 8.4 7.1 L 9.0 7.6 L 10.3 7.4 L 14.2 5.0 L 19.5 .8","0 10.6 M 8.0 .8 L 9.1 .1 L 10.4 -.9 L 11.3 -2.7 L 11.8 -2.8 L 11.2 .0 L 10.8 2.0 L 10.5 4.7 L 10.3 6.2 L 9.6 7.3 L 9.1 8.0 L 8.2 8.5 L 7.0 8.2 L 6.3 7.1 L 7.8 8.5 L 10.1 7.7 L 11.3 7.0 L 14.7 4.8 L 18.6 .8","0 7.9 M 16.8 -9.6 L 12.0 -4.1 L 8.1 .6 L 5.6 4.0 L 5.0 6.6 L 5.4 7.9 L 6.6 7.7 L 10.4 5.2 L 15.9 .8 M 7.2 -8.6 L 6.3 -8.9 L 5.5 -9.5 L 8.7 -10.2 L 15.0 -11.0 L 21.2 -11.2 L 26.8 -11.4 L 31.2 -10.9","0 12.6 M 8.5 .4 L 6.1 2.7 L 4.4 4.8 L 3.3 6.8 L 3.7 7.5 L 4.8 7.5 L 8.4 5.0 L 12.3 1.8 L 13.6 .5 L 14.2 .4 L 10.8 4.4 L 9.8 5.9 L 9.4 7.0 L 9.7 7.7 L 10.7 7.9 L 13.0 6.7 L 16.0 4.4 L 20.6 .8","0 10.4 M 6.7 1.6 L 8.6 .5 L 9.3 1.0 L 8.0 3.2 L 5.6 7.8 L 6.6 7.2 L 10.1 4.5 L 14.2 1.2 L 16.7 -.5 L 17.7 -1.3 L 18.8 -1.3 L 19.2 -.7 L 18.4 .8","0 14.4 M 9.6 -.7 L 7.2 1.6 L 5.3 4.0 L 4.6 6.0 L 4.7 6.8 L 5.6 7.2 L 6.7 7.0 L 9.8 4.9 L 13.1 2.4 L 15.7 -.1 L 12.9 3.4 L 12.0 5.2 L 11.4 7.1 L 11.7 8.1 L 12.4 8.4 L 14.5 7.8 L 16.0 6.6 L 17.7 4.9 L 18.6 3.4 L 18.8 2.1 L 18.5 .7","0 12.3 M 7.9 .8 L 10.0 -.6 L 9.3 2.4 L 8.8 5.1 L 8.8 6.8 L 9.8 7.8 L 11.2 7.4 L 14.7 5.3 L 20.3 .8 M 16.3 -1.3 L 13.7 .2 L 11.4 1.7 L 9.0 3.4 L 6.9 5.4 L 4.4 7.7","0 14.1 M 9.0 -.4 L 6.4 2.8 L 5.2 4.5 L 4.8 6.1 L 5.6 6.6 L 6.9 6.1 L 9.5 4.4 L 11.9 2.4 L 14.1 .9 L 15.3 .1 L 15.4 .5 L 11.1 6.6 L 5.7 13.1 L 1.9 17.7 L -1.2 21.8 L -2.2 23.7 L -2.3 25.0 L -1.4 25.2 L 1.2 23.7 L 3.9 20.8 L 5.5 18.4 L 6.1 16.1 L 5.7 14.6 L 4.8 13.2 L 3.6 12.6 L 2.4 12.2 L 6.0 11.0 L 11.2 8.5 L 16.4 5.4 L 22.1 .8","0 8.8 M 6.1 2.3 L 9.1 .1 L 11.0 -1.1 L 12.1 -1.5 L 12.9 -1.1 L 13.2 -.3 L 12.9 .4 L 11.7 1.8 L 9.9 3.3 L 7.9 4.8 L 4.2 6.9 L 6.4 7.8 L 7.6 8.7 L 7.9 10.0 L 7.6 12.3 L 6.5 15.2 L 5.1 17.1 L 3.1 19.5 L .2 22.7 L -2.2 25.0 L -3.3 25.6 L -4.6 25.6 L -5.3 25.0 L -5.3 23.5 L -4.5 21.9 L -3.8 20.2 L -.6 16.5 L 2.5 13.5 L 6.0 11.0 L 8.0 9.7 L 11.8 7.8","0 25.0 M 34.1 -23.9 L 32.4 -24.6 L 29.4 -25.0 L 27.4 -24.4 L 25.9 -22.1 L 25.5 -18.7 L 24.8 -13.7 L 24.2 -10.3 L 23.3 -8.6 L 21.9 -7.0 L 19.8 -6.2 L 21.5 -5.4 L 22.3 -3.8 L 21.7 -2.0 L 19.3 3.8 L 18.0 7.0 L 17.6 9.0 L 17.4 10.7 L 18.2 12.2 L 19.7 13.6 L 22.9 15.0","0 22.4 M 29.7 -29.3 L 26.4 -16.7 L 23.4 -8.4 L 20.5 -1.0 L 17.3 7.3 L 15.1 12.1","0 27.0 M 26.0 -25.2 L 28.4 -24.5 L 30.3 -22.8 L 31.4 -20.9 L 31.6 -18.8 L 30.4 -15.1 L 28.3 -10.7 L 27.4 -8.3 L 26.9 -6.9 L 27.5 -5.2 L 28.0 -4.3 L 29.2 -4.0 L 27.6 -3.1 L 26.0 -2.1 L 24.9 .8 L 24.4 4.5 L 23.9 9.5 L 22.7 13.4 L 20.9 14.6 L 18.7 14.8 L 16.7 14.6 L 15.1 13.9","0 25.2 M 19.2 2.4 L 21.3 4.0 L 23.2 3.5 L 25.9 3.3 L 26.5 3.7 L 27.5 4.6","0 22.6 M 20.7 -20.8 L 18.4 -18.8 L 18.0 -16.4 L 19.4 -15.0 L 22.6 -15.5 L 24.2 -17.3 L 25.0 -18.7 L 24.7 -20.1 L 23.9 -21.0 L 22.7 -21.2 L 20.7 -20.8"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 15.4 M 26.5 -19.0 L 17.4 1.1 M 15.0 6.9 L 14.3 7.5 L 15.2 8.1 L 15.9 7.5","0 8.8 M 16.8 -21.6 L 13.8 -14.2 M 22.3 -21.7 L 19.4 -14.2","0 34.2 M 31.1 -16.7 L 26.8 -11.3 L 23.1 -6.0 L 19.3 .2 L 16.1 5.8 M 40.3 -16.7 L 36.0 -11.3 L 32.3 -6.0 L 28.6 .2 L 25.3 5.8 M 17.2 -8.6 L 40.8 -8.5 M 14.0 -2.4 L 37.3 -2.2","0 19.9 M 28.6 -8.9 L 29.4 -11.0 L 29.5 -12.6 L 29.0 -13.6 L 27.9 -14.3 L 26.8 -14.6 L 24.9 -14.6 L 22.9 -13.4 L 21.9 -12.2 L 21.1 -10.5 L 21.3 -8.8 L 22.2 -7.6 L 23.1 -6.3 L 24.7 -4.5 L 25.8 -2.7 L 26.3 -1.0 L 26.1 .8 L 25.3 2.5 L 23.1 4.2 L 21.0 4.7 L 19.4 4.7 L 17.3 4.0 L 15.9 2.7 L 15.3 1.5 L 15.2 -.2 L 15.4 -1.3 L 15.9 -2.0 L 16.4 -2.7 M 28.1 -17.8 L 17.3 10.7","0 32.5 M 21.8 -19.2 L 18.3 -15.0 L 16.1 -11.5 L 15.4 -9.0 L 15.8 -7.4 L 16.4 -7.0 L 17.6 -6.9 L 19.6 -7.7 L 21.9 -9.5 L 24.7 -13.0 L 26.1 -15.3 L 26.9 -17.4 L 26.8 -18.8 L 26.3 -19.8 L 24.9 -20.9 L 29.2 -20.0 L 33.0 -19.8 L 36.2 -19.9 L 39.7 -20.3 L 42.5 -20.9 L 44.8 -21.4 L 40.9 -19.0 L 33.5 -12.4 L 26.9 -6.3 L 20.0 1.1 L 16.3 5.4 L 12.4 10.0 M 34.3 -3.8 L 31.4 -.6 L 28.9 3.2 L 27.9 6.1 L 28.1 7.7 L 28.7 8.7 L 29.8 8.7 L 32.2 7.8 L 35.0 5.2 L 36.6 2.8 L 38.4 .2 L 39.0 -1.8 L 39.0 -3.1 L 38.5 -4.2 L 37.9 -4.8 L 37.2 -5.3 L 36.5 -5.5","0 31.3 M 35.5 -1.5 L 34.5 1.2 L 32.9 3.6 L 30.5 6.2 L 25.5 8.9 L 22.1 9.4 L 19.1 8.9 L 16.2 6.9 L 15.6 4.8 L 16.0 1.3 L 18.1 -1.7 L 21.1 -3.8 L 23.4 -5.2 L 26.4 -7.0 L 29.2 -8.8 L 31.5 -10.9 L 32.8 -12.7 L 33.0 -14.5 L 31.8 -15.8 L 29.4 -16.0 L 27.7 -14.4 L 26.9 -12.6 L 27.0 -10.0 L 28.8 -4.7 L 35.9 8.3 L 38.8 11.7 L 40.8 13.0 L 42.7 13.3 L 44.3 12.7 L 46.1 11.4 L 48.0 9.8 L 48.7 8.4 M 23.9 3.3 L 22.7 1.2 L 22.9 -.2 L 24.4 -1.2 L 26.2 -1.7 L 32.3 -1.8 L 37.5 -1.5 L 39.4 -1.4 L 39.9 -1.5","0 5.7 M 17.5 -22.4 L 14.2 -14.1","0 14.1 M 38.3 -24.5 L 32.6 -22.9 L 26.8 -20.0 L 22.0 -16.5 L 17.4 -11.7 L 14.4 -6.9 L 13.0 -3.4 L 11.9 2.4 L 12.3 7.3 L 14.1 9.6 L 16.1 10.5 L 18.0 10.6 L 19.5 10.1","0 26.3 M 25.8 -24.4 L 28.3 -24.7 L 30.6 -23.9 L 32.2 -21.8 L 32.8 -17.7 L 31.7 -11.4 L 29.0 -4.7 L 24.8 .6 L 21.1 3.9 L 17.2 6.3 L 13.1 8.5 L 9.3 9.7 L 6.4 10.3","0 26.1 M 25.1 -22.4 L 19.8 -4.2 M 15.6 -17.8 L 29.8 -8.7 M 12.6 -8.7 L 32.4 -17.9","0 17.0 M 24.5 -9.3 L 18.4 5.7 M 13.5 -2.5 L 30.1 -2.3","0 6.6 M 12.5 6.4 L 13.1 7.8 L 13.0 8.9 L 12.0 10.7 L 10.5 12.3","0 12.9 M 12.8 .2 L 19.9 .3","0 7.9 M 11.7 6.8 L 11.0 7.3 L 11.8 7.9 L 12.6 7.3","0 19.4 M 35.7 -23.1 L 23.2 -7.8 L 11.5 6.6 L 9.4 9.7","0 19.1 M 19.6 -11.8 L 16.2 -8.5 L 14.0 -4.8 L 12.7 -.3 L 12.3 3.0 L 13.2 5.9 L 14.9 7.5 L 16.8 8.1 L 18.8 7.6 L 21.0 6.2 L 23.7 3.5 L 25.6 .5 L 27.0 -3.4 L 27.8 -7.4 L 27.4 -10.0 L 26.3 -12.3 L 25.1 -13.0 L 23.5 -13.2 L 22.3 -13.2 L 20.9 -12.6 L 19.6 -11.8","0 12.7 M 15.3 -9.6 L 22.5 -13.8 L 20.5 -11.9 L 15.1 6.3 L 13.5 7.6 L 9.7 8.0 L 19.2 8.1 L 17.4 8.0 L 15.3 6.1","0 16.9 M 17.1 -8.0 L 17.8 -12.1 L 20.6 -13.5 L 24.2 -13.9 L 26.3 -13.4 L 27.4 -12.2 L 27.9 -10.1 L 27.4 -7.8 L 25.3 -5.2 L 21.6 -1.5 L 17.7 1.9 L 10.7 8.1 L 12.0 7.6 L 14.9 7.5 L 18.2 7.6 L 21.0 7.6 L 22.8 6.8 L 24.1 5.5 L 25.7 3.1","0 16.5 M 16.1 -8.0 L 16.4 -8.2 L 17.3 -12.1 L 19.2 -13.2 L 22.7 -13.7 L 24.7 -13.3 L 26.6 -12.4 L 27.0 -10.3 L 26.6 -8.6 L 25.2 -6.9 L 23.1 -5.6 L 20.8 -4.5 L 17.7 -4.0 L 21.1 -3.6 L 23.2 -3.0 L 24.4 -1.8 L 24.6 .6 L 23.5 3.5 L 21.9 5.9 L 19.8 7.4 L 17.7 8.1 L 15.0 8.4 L 12.7 8.2 L 11.6 7.3 L 11.1 6.5 L 11.9 3.1","0 20.8 M 29.5 -3.0 L 26.3 .7 L 18.4 1.0 L 12.2 1.1 L 20.8 -8.1 L 24.5 -11.9 L 26.9 -13.0 L 20.5 6.5 L 17.8 7.6 L 15.2 8.0 L 24.9 8.1 L 22.2 7.2 L 20.7 6.5","0 17.4 M 27.5 -8.7 L 29.7 -13.1 L 19.4 -13.1 L 15.4 -3.9 L 18.0 -4.5 L 21.0 -4.6 L 23.7 -3.7 L 25.1 -1.9 L 25.0 1.2 L 23.6 4.0 L 21.5 6.1 L 20.1 7.4 L 17.5 8.3 L 14.9 8.4 L 13.0 8.2 L 11.6 7.5 L 11.2 6.5 L 11.9 3.5","0 17.2 M 27.6 -10.0 L 28.4 -12.0 L 28.2 -13.1 L 24.8 -14.2 L 20.6 -12.7 L 17.5 -10.1 L 15.5 -7.3 L 14.0 -3.9 L 12.8 -.4 L 12.2 3.0 L 12.7 6.4 L 15.0 7.9 L 17.4 8.0 L 20.0 7.3 L 22.7 5.2 L 24.0 3.6 L 24.9 1.0 L 25.0 -1.6 L 24.0 -3.4 L 22.7 -4.6 L 20.7 -5.0 L 17.9 -4.4 L 16.4 -3.5 L 15.2 -2.7 L 14.4 -1.6 L 12.8 .8","0 15.7 M 15.2 -8.9 L 15.3 -9.2 L 17.2 -12.9 L 27.7 -12.7 L 28.9 -13.1 L 25.2 -8.5 L 21.7 -4.5 L 18.0 -.2 L 14.9 4.1 L 12.4 7.9","0 18.0 M 23.3 -14.3 L 20.0 -13.2 L 17.3 -10.3 L 16.2 -7.7 L 16.8 -5.4 L 18.0 -4.4 L 21.9 -1.1 L 22.7 .7 L 22.4 3.0 L 21.1 5.6 L 18.7 7.5 L 17.0 8.3 L 14.6 8.3 L 12.9 8.1 L 11.4 6.7 L 11.1 4.8 L 12.4 1.9 L 14.5 -.1 L 16.7 -1.7 L 22.5 -5.3 L 25.0 -7.5 L 26.5 -9.2 L 26.9 -10.6 L 27.0 -12.7 L 25.9 -13.7 L 24.9 -14.1 L 23.3 -14.3","0 18.0 M 12.2 4.1 L 11.6 6.9 L 13.8 8.2 L 17.1 7.9 L 20.7 5.9 L 23.2 3.1 L 25.1 .2 L 26.3 -3.0 L 27.3 -5.3 L 27.8 -7.7 L 27.7 -10.1 L 26.8 -12.3 L 25.6 -13.4 L 24.0 -13.8 L 22.0 -13.7 L 20.0 -13.1 L 16.7 -10.5 L 15.4 -8.3 L 14.8 -5.1 L 15.6 -2.9 L 17.0 -1.6 L 19.1 -1.0 L 21.6 -1.4 L 23.7 -2.6 L 25.1 -3.6 L 26.4 -5.5 L 27.6 -8.2","0 7.9 M 16.8 -5.9 L 16.1 -5.4 L 16.9 -4.8 L 17.6 -5.4 M 13.3 7.1 L 12.6 7.6 L 13.4 8.2 L 14.1 7.6","0 8.0 M 17.4 -5.9 L 16.7 -5.4 L 17.6 -4.8 L 18.3 -5.4 M 12.9 7.6 L 14.1 6.9 L 13.7 9.7 L 12.2 12.4 L 10.4 13.9","0 15.5 M 24.4 -9.6 L 19.5 -6.1 L 14.1 -2.6 L 18.1 .5 L 20.5 2.9 L 21.4 4.0 L 21.3 4.7","0 17.9 M 13.3 -5.2 L 26.5 -5.1 M 11.9 1.0 L 25.6 1.1","0 15.4 M 15.1 -9.6 L 18.4 -6.2 L 20.0 -4.7 L 22.6 -2.4 L 16.9 .8 L 13.6 3.1 L 12.2 4.3 L 12.5 4.7","0 22.8 M 15.3 7.1 L 14.6 7.6 L 15.4 8.2 L 16.1 7.6 M 18.1 -14.0 L 19.0 -17.4 L 19.8 -18.6 L 21.2 -19.4 L 24.2 -20.1 L 26.7 -20.5 L 28.6 -20.0 L 30.4 -18.7 L 31.4 -16.9 L 31.1 -14.4 L 29.1 -11.6 L 26.8 -10.0 L 24.1 -8.5 L 21.3 -6.8 L 19.7 -5.4 L 18.2 -3.9 L 17.1 -2.1 L 16.9 -.2 L 17.1 1.0 L 17.4 1.7","0 39.6 M 37.7 -11.5 L 33.8 -11.6 L 29.9 -10.9 L 27.3 -8.3 L 24.9 -5.5 L 23.6 -2.4 L 22.9 .1 L 23.3 1.4 L 24.1 1.2 L 26.5 .5 L 29.3 -2.2 L 30.7 -3.8 L 32.7 -6.1 L 35.0 -10.2 L 35.7 -11.2 L 31.0 -1.7 L 30.3 .8 L 30.4 1.8 L 33.6 1.7 L 37.3 .9 L 41.9 -1.4 L 44.3 -4.3 L 45.7 -7.7 L 45.9 -10.7 L 45.2 -13.3 L 42.7 -15.8 L 38.6 -17.6 L 34.8 -18.3 L 30.3 -18.0 L 26.1 -16.8 L 21.0 -14.0 L 16.9 -9.7 L 14.9 -4.8 L 14.5 -.9 L 15.5 3.3 L 17.7 6.2 L 21.4 8.2 L 25.7 8.9 L 30.1 8.6 L 33.1 7.9 L 36.6 6.5 L 39.0 4.7 L 40.5 3.0","0 41.8 M 10.4 3.1 L 9.7 5.1 L 9.8 7.2 L 11.2 8.5 L 12.9 8.8 L 15.6 8.6 L 19.1 6.8 L 23.6 3.7 L 32.0 -3.5 L 37.5 -9.2 L 40.4 -12.4 L 42.7 -14.6 L 45.3 -16.8 L 47.8 -17.9 L 49.5 -18.8 L 50.5 -19.1 L 51.5 -19.1 L 52.8 -19.2 L 54.3 -20.1 L 55.5 -20.6 L 57.1 -20.8 L 55.2 -20.4 L 53.4 -19.5 L 51.9 -18.0 L 49.7 -14.9 L 47.9 -11.4 L 46.2 -8.4 L 44.6 -4.8 L 42.3 -1.0 L 40.8 3.2 L 40.2 5.5 L 40.2 7.3 L 40.8 8.1 L 41.6 8.2 L 42.9 8.3 L 44.3 7.8 L 46.1 6.2 L 47.7 4.6 L 49.8 1.9 M 17.5 .0 L 17.3 -.9 L 18.2 -2.4 L 19.8 -3.2 L 22.4 -4.1 L 24.8 -4.4 L 26.9 -4.5 L 30.3 -4.4 L 34.1 -4.1 L 37.3 -4.1 L 39.8 -4.2 L 40.9 -4.2 L 42.1 -4.9 M 33.3 -11.4 L 32.4 -12.7 L 32.9 -15.1 L 34.6 -17.0 L 37.7 -18.3 L 43.1 -19.0 L 46.4 -18.9 L 50.0 -19.0","0 28.9 M 13.5 -12.1 L 12.5 -13.4 L 12.3 -14.5 L 12.3 -16.0 L 12.7 -16.9 L 13.9 -17.8 L 15.7 -18.5 L 18.1 -18.9 L 20.9 -19.1 L 23.8 -19.3 L 27.0 -19.0 L 29.4 -19.2 L 33.4 -19.0 L 35.4 -18.1 L 36.6 -16.5 L 37.0 -13.2 L 36.0 -10.9 L 34.2 -9.0 L 32.5 -7.7 L 30.0 -6.6 L 28.1 -6.1 L 23.6 -5.3 L 24.1 -5.9 L 29.1 -5.7 L 32.0 -5.1 L 34.5 -3.6 L 34.8 -.8 L 34.2 2.4 L 32.3 4.9 L 30.2 6.7 L 26.8 8.3 L 24.5 8.9 L 20.5 8.9 L 18.2 8.4 L 16.1 7.7 L 15.1 6.9 L 14.5 5.0 L 13.4 6.5 L 15.1 6.9 M 28.2 -18.8 L 25.9 -17.2 L 23.9 -13.9 L 13.0 5.7 L 11.7 7.3 L 10.2 8.6 L 9.5 9.1 L 8.7 9.2","0 29.5 M 36.2 -12.1 L 36.8 -13.7 L 37.4 -15.4 L 37.3 -16.7 L 35.9 -18.1 L 34.5 -18.9 L 32.2 -19.4 L 27.9 -19.0 L 22.9 -17.0 L 18.7 -13.5 L 15.4 -9.9 L 13.5 -6.6 L 12.2 -3.2 L 11.5 .8 L 11.9 4.1 L 13.6 6.8 L 15.5 8.2 L 18.3 9.0 L 22.7 9.2 L 27.0 8.4 L 30.8 7.2 L 34.8 4.7 L 36.5 3.0 L 37.5 1.9","0 31.9 M 12.9 -12.3 L 12.0 -14.2 L 11.9 -15.5 L 12.4 -16.9 L 12.8 -17.5 L 14.7 -18.2 L 16.7 -18.7 L 19.7 -19.1 L 23.9 -19.2 L 28.8 -19.4 L 32.6 -19.2 L 36.0 -18.4 L 38.1 -17.5 L 39.9 -15.6 L 41.2 -12.0 L 40.9 -9.0 L 40.5 -5.3 L 38.1 -.4 L 35.4 3.2 L 31.9 6.1 L 28.5 7.7 L 25.8 8.5 L 22.7 8.8 L 19.8 8.8 L 17.8 8.6 L 16.1 8.0 L 15.3 7.5 L 14.3 4.6 L 13.1 6.1 L 15.0 7.5 M 29.0 -19.3 L 26.0 -17.9 L 24.3 -16.2 L 14.4 3.0 L 13.9 4.4 L 12.4 6.4 L 11.1 7.4 L 10.4 8.1 L 9.3 8.8 L 8.2 9.0","0 27.0 M 27.6 -19.2 L 25.0 -17.9 L 24.2 -16.9 L 13.3 2.1 L 12.0 4.5 L 11.9 6.1 L 12.7 7.1 L 14.2 7.8 L 19.2 8.5 L 23.8 8.4 L 27.0 7.8 L 28.8 7.5 L 30.6 6.4 L 32.6 4.7 L 35.0 1.9 M 14.4 -12.2 L 13.2 -15.0 L 13.5 -16.9 L 14.7 -17.8 L 17.4 -18.6 L 21.0 -19.0 L 32.5 -19.4 L 36.7 -19.0 L 37.4 -17.8 L 37.2 -16.4 L 36.4 -14.5 M 18.2 -6.2 L 28.9 -5.9 L 30.3 -6.1 L 31.4 -6.9","0 29.9 M 39.5 -19.2 L 35.5 -18.0 L 33.7 -16.2 L 29.8 -8.8 L 22.6 4.7 L 21.0 6.7 L 18.9 8.2 L 16.9 9.0 L 14.8 9.3 L 12.7 8.8 L 11.5 8.0 L 10.4 6.6 L 10.2 5.1 L 10.1 2.7 M 21.2 -11.4 L 19.8 -13.0 L 19.2 -14.6 L 19.1 -16.1 L 21.0 -18.1 L 23.3 -18.5 L 26.2 -18.8 L 31.4 -19.3 L 43.8 -19.2 L 45.4 -19.0 L 46.7 -18.9 L 47.3 -18.3 L 47.3 -17.1 L 46.6 -15.1 L 46.4 -14.4 M 28.9 -6.2 L 38.8 -6.0 L 39.7 -5.8 L 39.6 -5.1 L 38.9 -3.5 L 38.6 -3.1","0 29.7 M 35.9 -12.0 L 36.9 -13.8 L 37.4 -15.7 L 36.9 -17.1 L 35.5 -18.7 L 31.2 -19.5 L 23.6 -17.5 L 18.6 -13.8 L 14.4 -8.5 L 12.4 -3.6 L 11.2 2.2 L 12.1 5.0 L 14.2 7.3 L 18.0 9.5 L 22.7 9.6 L 26.7 8.1 L 31.5 5.7 L 33.4 3.2 L 35.4 .2 L 37.7 -4.9 L 33.5 7.2 L 31.0 14.3 L 26.7 21.0 L 21.8 24.3 L 17.1 25.5 L 14.2 25.3 L 11.2 23.5 L 10.1 21.9 L 10.1 19.0 M 24.7 -.8 L 24.2 -2.0 L 24.2 -4.0 L 25.6 -4.9 L 40.6 -5.6","0 41.6 M 19.8 -12.5 L 18.7 -14.5 L 18.7 -16.4 L 20.2 -17.8 L 22.3 -18.5 L 25.3 -18.9 L 27.9 -18.9 L 34.4 -19.2 L 37.5 -19.2 L 34.5 -18.8 L 32.0 -16.1 L 29.5 -12.1 L 25.9 -5.2 L 23.1 .6 L 20.3 4.7 L 18.4 6.9 L 15.5 8.5 L 12.9 8.3 L 10.9 7.8 L 8.9 6.1 L 8.6 4.6 L 8.5 1.8 M 54.5 -20.7 L 51.2 -19.5 L 49.6 -18.7 L 43.4 -7.8 L 38.4 2.1 L 37.7 4.6 L 37.9 6.4 L 38.5 7.8 L 40.0 8.3 L 42.6 8.3 L 44.9 7.2 L 47.8 4.4 L 49.6 1.9 M 18.7 -4.5 L 20.8 -5.1 L 34.4 -4.5 L 38.6 -4.6 L 41.2 -5.4","0 19.0 M 24.5 -12.7 L 23.3 -14.9 L 23.3 -17.2 L 24.9 -18.2 L 26.9 -18.8 L 40.5 -19.1 L 35.0 -18.3 L 32.4 -16.0 L 30.1 -12.1 L 26.4 -4.1 L 23.8 .4 L 21.1 4.5 L 18.6 6.4 L 16.1 7.8 L 13.2 7.8 L 11.1 7.2 L 9.8 5.8 L 9.0 4.2 L 8.9 2.6","0 11.0 M 15.0 -11.4 L 12.8 -14.2 L 12.9 -16.6 L 15.1 -18.1 L 19.5 -19.0 L 28.6 -19.3 L 25.5 -17.5 L 23.7 -16.1 L 20.4 -9.3 L 16.0 .6 L 13.4 6.5 L 10.0 11.4 L 6.9 14.5 L 3.8 15.7 L 1.5 16.0 L -1.3 14.8 L -2.6 12.9 L -2.9 10.5","0 31.0 M 17.5 -12.1 L 16.1 -14.5 L 16.8 -17.0 L 18.0 -18.1 L 19.9 -18.5 L 22.7 -19.0 L 31.0 -19.1 L 28.6 -18.8 L 25.4 -16.3 L 23.3 -13.0 L 17.0 -1.9 L 12.0 6.9 L 9.4 8.8 L 10.8 7.7 L 13.0 7.4 L 12.7 6.0 M 48.4 -17.6 L 46.9 -18.8 L 42.7 -18.6 L 38.3 -16.4 L 32.4 -13.0 L 25.0 -8.4 L 19.1 -4.2 L 20.7 -5.3 L 24.2 1.7 L 27.6 6.1 L 30.7 7.7 L 33.2 7.7 L 35.6 6.1 L 37.4 4.1 L 39.0 1.9","0 28.0 M 33.6 -12.8 L 34.7 -14.9 L 34.9 -17.2 L 33.6 -18.6 L 31.1 -19.5 L 27.5 -18.8 L 25.1 -16.4 L 22.8 -12.6 L 20.3 -7.3 L 18.0 -2.0 L 16.2 2.5 L 14.4 5.1 L 12.8 6.2 L 10.5 7.3 L 8.6 8.7 L 8.6 7.6 L 13.8 7.3 L 22.7 7.5 L 29.9 7.6 L 33.2 6.8 L 33.4 6.0 L 33.5 5.1 L 33.3 4.5 L 31.6 2.3","0 44.8 M 22.9 -11.6 L 20.9 -13.6 L 20.8 -16.1 L 21.7 -17.3 L 23.6 -18.1 L 26.1 -18.8 L 28.1 -19.0 L 36.7 -19.2 L 34.2 -17.8 L 30.7 -14.6 L 28.5 -9.4 L 25.6 -3.2 L 22.8 1.6 L 19.9 4.9 L 16.9 7.6 L 13.9 8.1 L 11.7 7.6 L 9.2 5.4 L 8.8 4.7 L 8.6 2.9 M 35.2 -18.4 L 34.1 -16.1 L 33.9 -11.6 L 33.9 -4.2 L 33.8 .3 L 33.8 2.2 L 33.3 3.5 L 32.2 5.1 L 50.6 -14.2 L 55.6 -19.5 L 56.9 -20.7 L 58.9 -21.3 L 57.0 -20.5 L 54.2 -17.8 L 51.5 -13.7 L 46.7 -4.4 L 44.1 1.4 L 43.1 5.2 L 43.2 7.1 L 44.6 8.3 L 46.4 8.1 L 49.3 6.1 L 51.0 4.2 L 52.8 1.9","0 37.2 M 23.1 -11.5 L 22.7 -11.5 L 21.0 -14.0 L 21.0 -16.3 L 22.4 -17.8 L 25.3 -18.7 L 28.6 -19.0 L 37.4 -19.1 L 37.4 -18.8 L 34.2 -17.8 L 32.5 -16.8 L 30.9 -14.9 L 29.4 -11.1 L 27.3 -6.1 L 25.2 -1.3 L 23.4 2.2 L 20.6 5.4 L 18.0 7.2 L 15.2 8.2 L 12.4 8.0 L 9.4 6.3 L 8.9 4.7 L 8.5 2.8 M 33.2 -16.6 L 33.5 -13.6 L 38.7 3.5 L 40.4 6.9 L 38.3 8.8 L 40.8 3.7 L 45.6 -8.7 L 49.5 -17.1 L 51.9 -20.9 L 53.7 -22.0 L 54.4 -22.1 L 55.7 -22.0 L 56.4 -21.3 L 56.4 -20.7","0 30.5 M 30.0 -19.7 L 24.1 -18.8 L 18.9 -15.8 L 15.0 -11.4 L 11.8 -6.6 L 10.3 -1.8 L 10.2 2.8 L 11.4 5.9 L 13.8 7.7 L 17.3 8.8 L 21.3 8.8 L 27.0 7.2 L 33.7 2.4 L 38.0 -3.4 L 40.0 -9.2 L 40.2 -13.5 L 39.0 -16.7 L 35.9 -18.8 L 33.5 -19.5 L 30.0 -19.7","0 27.8 M 30.1 -19.2 L 27.3 -18.2 L 25.8 -16.9 L 14.5 4.2 L 13.3 6.0 L 12.3 7.3 L 11.0 8.2 L 9.2 8.9 L 12.4 7.3 L 14.8 6.9 L 14.8 3.8 M 13.6 -12.4 L 12.5 -14.5 L 13.0 -17.2 L 14.6 -18.3 L 18.2 -18.9 L 25.0 -19.1 L 30.8 -19.3 L 34.8 -18.8 L 37.3 -16.3 L 37.5 -13.3 L 36.7 -10.4 L 34.6 -7.7 L 32.1 -6.0 L 29.3 -4.9 L 26.9 -4.5 L 22.9 -4.4","0 30.6 M 31.0 -19.7 L 25.8 -19.3 L 19.3 -16.4 L 14.3 -11.3 L 11.4 -6.3 L 9.7 -.9 L 10.0 4.1 L 12.3 6.9 L 15.6 8.3 L 18.9 8.6 L 23.0 8.4 L 26.8 7.1 L 30.6 5.1 L 34.9 .9 L 38.0 -3.9 L 39.9 -9.6 L 39.7 -14.0 L 38.3 -17.1 L 36.4 -18.5 L 33.7 -19.3 L 31.0 -19.7 M 23.5 8.3 L 26.6 13.8 L 29.5 18.5 L 31.4 21.0 L 33.5 21.5 L 36.0 21.2 L 39.2 19.9 L 41.7 17.8","0 33.3 M 13.7 -12.4 L 12.7 -14.4 L 12.4 -16.0 L 13.0 -17.1 L 14.9 -18.0 L 17.6 -18.8 L 21.4 -19.1 L 33.4 -19.0 L 36.1 -18.1 L 37.5 -15.3 L 37.5 -12.9 L 37.0 -10.6 L 35.4 -8.2 L 33.6 -6.4 L 30.8 -5.3 L 27.7 -4.6 L 23.4 -4.5 L 22.8 -4.1 L 26.1 2.3 L 28.7 6.0 L 31.5 8.0 L 34.7 8.2 L 36.8 7.0 L 39.2 4.8 L 41.3 1.9 M 30.0 -19.0 L 26.9 -18.1 L 25.2 -16.1 L 14.7 4.0 L 12.4 7.3 L 9.8 8.9 L 13.1 6.8 L 14.7 6.9 L 14.5 4.7","0 23.1 M 33.0 -12.9 L 34.2 -15.7 L 34.4 -17.7 L 32.5 -19.5 L 29.9 -20.0 L 27.9 -20.0 L 24.9 -18.6 L 23.0 -17.1 L 22.0 -14.0 L 22.5 -10.5 L 25.9 -5.8 L 29.3 .2 L 28.8 4.5 L 27.0 6.9 L 24.7 8.5 L 22.0 9.5 L 17.4 9.0 L 13.7 7.5 L 12.1 6.1 L 11.0 3.7 L 11.1 .7 L 12.2 -1.3","0 21.9 M 38.5 -17.6 L 33.4 -16.1 L 31.5 -14.0 L 29.6 -10.1 L 27.4 -4.4 L 25.2 .0 L 23.8 3.3 L 20.7 6.9 L 17.5 8.8 L 14.7 9.3 L 12.6 8.8 L 10.9 7.6 L 9.9 5.6 L 9.8 3.4 M 11.5 -11.4 L 9.7 -13.3 L 9.1 -14.9 L 9.0 -16.2 L 9.7 -17.2 L 13.5 -18.4 L 18.1 -19.0 L 22.7 -18.7 L 38.8 -17.3 L 42.5 -17.2 L 44.4 -17.3 L 45.4 -18.5","0 33.8 M 10.6 -12.8 L 9.6 -15.2 L 9.3 -16.3 L 10.6 -18.1 L 13.3 -19.0 L 29.8 -19.3 L 25.9 -18.5 L 24.4 -16.7 L 21.2 -9.9 L 17.8 -2.5 L 15.2 3.5 L 14.2 5.5 L 13.9 8.0 L 16.1 8.9 L 18.9 8.3 L 23.8 5.1 L 28.1 .6 L 30.3 -1.7 L 32.9 -5.4 L 42.4 -18.4 L 43.9 -20.0 L 42.0 -18.2 L 39.1 -17.3 L 31.2 -.5 L 29.4 5.7 L 29.9 7.9 L 32.2 8.9 L 34.3 8.4 L 36.4 7.3 L 39.1 4.9 L 41.8 1.9","0 27.7 M 10.9 -12.6 L 9.6 -15.1 L 9.9 -17.3 L 11.9 -18.6 L 14.1 -19.0 L 29.9 -19.0 M 25.6 -19.0 L 27.1 -12.4 L 26.6 -6.1 L 25.2 2.4 L 22.9 10.3 L 23.9 9.5 L 31.5 -.8 L 38.4 -9.1 L 47.3 -17.6 L 51.6 -20.6 L 54.5 -21.5 L 56.9 -21.4 L 57.6 -20.6 L 57.6 -19.2 L 57.0 -16.5","0 46.1 M 22.7 -19.0 L 25.7 -14.7 L 26.5 -7.1 L 25.6 .2 L 23.2 9.0 L 24.6 9.1 L 29.7 1.4 L 36.0 -7.5 L 41.4 -14.0 L 45.1 -16.9 L 48.1 -18.1 L 50.1 -18.5 L 51.3 -18.7 L 46.9 -17.2 L 43.9 -14.7 L 41.7 -11.2 L 40.2 -5.1 L 39.8 1.2 L 39.1 5.0 L 37.6 9.5 L 38.3 9.7 L 42.4 3.8 L 47.7 -3.3 L 53.1 -9.1 L 57.7 -14.0 L 61.5 -17.6 L 67.0 -20.9 L 69.3 -21.5 L 70.8 -21.5 L 71.9 -21.1 L 72.2 -20.0 L 72.1 -18.4 L 71.6 -16.6 M 11.0 -12.6 L 10.3 -14.3 L 9.8 -16.6 L 10.6 -18.3 L 13.2 -18.6 L 17.3 -18.9 L 30.3 -19.0","0 29.8 M 23.0 -18.4 L 22.7 -13.0 L 23.6 -6.3 L 25.0 .0 L 27.6 5.6 L 29.8 7.7 L 32.5 7.6 L 34.7 5.9 L 36.3 4.1 L 37.8 1.9 M 45.4 -15.2 L 46.4 -17.4 L 46.4 -18.9 L 45.0 -19.7 L 42.4 -19.9 L 38.5 -18.1 L 33.2 -13.7 L 27.2 -8.2 L 20.1 -.1 L 12.4 6.7 L 5.8 10.2 L 3.7 10.6 L 3.1 9.4 L 3.2 7.8 L 3.5 7.3 L 4.8 7.4 M 10.6 -12.8 L 9.5 -14.9 L 9.7 -17.1 L 10.5 -17.9 L 11.9 -18.5 L 14.3 -19.0 L 30.1 -18.8","0 23.3 M 22.8 -18.6 L 24.9 -15.9 L 26.0 -10.6 L 25.4 -5.8 L 24.3 -.1 M 44.6 -16.5 L 44.8 -18.8 L 43.9 -20.0 L 41.4 -20.0 L 37.9 -17.5 L 34.2 -13.3 L 30.3 -8.0 L 26.1 -1.5 L 23.3 2.9 L 20.7 6.4 L 18.1 8.5 L 15.1 9.4 L 11.8 9.1 L 10.1 7.9 L 8.9 6.1 L 8.8 3.8 M 13.7 -12.6 L 12.7 -14.9 L 12.5 -16.4 L 13.4 -17.7 L 15.3 -18.5 L 18.5 -19.1 L 29.5 -18.8","0 22.7 M 17.2 -12.9 L 16.2 -14.9 L 16.2 -16.9 L 16.9 -17.8 L 19.1 -18.5 L 23.1 -19.0 L 36.6 -18.8 L 16.9 -1.6 L 11.9 3.0 L 8.6 7.1 L 7.1 9.2 L 7.2 9.9 L 8.0 9.9 L 10.0 5.9 L 12.4 4.2 L 16.6 2.8 L 19.8 2.8 L 23.4 4.9 L 28.4 10.5 L 33.0 15.7 L 37.1 19.1 L 39.7 20.4 L 42.6 20.5 L 44.5 19.3 L 45.3 17.9 L 45.7 16.0 L 45.3 14.5 L 44.9 13.7 L 43.3 11.9","0 18.5 M 35.0 -21.2 L 29.1 -21.7 L 26.0 -20.0 L 23.9 -16.4 L 10.0 13.0 L 19.9 13.1 L 21.5 12.7","0 25.3 M 9.7 -22.1 L 33.0 9.6","0 20.0 M 20.3 -20.9 L 32.1 -21.2 L 16.7 11.4 L 15.5 12.6 L 14.3 13.1 L 11.3 13.3 L 7.4 13.1 L 6.7 13.3","0 15.8 M 12.8 -4.9 L 18.6 -8.5 L 23.2 -4.9","0 7.6 M 10.8 7.2 L 11.9 7.9 L 12.8 7.8 L 12.0 7.0","0 11.7 M 11.0 -13.4 L 16.9 -9.4","0 14.6 M 19.8 -4.9 L 15.9 -5.4 L 11.7 -3.1 L 8.2 1.5 L 6.3 6.2 L 6.9 7.4 L 8.8 7.3 L 14.2 2.8 L 15.5 1.6 L 17.4 -1.5 L 18.4 -3.2 L 18.4 -4.5 L 20.3 -4.9 L 15.5 3.0 L 14.4 5.9 L 14.1 7.5 L 15.1 7.9 L 17.5 6.9 L 20.6 4.2 L 22.6 1.9","0 11.8 M 8.0 1.9 L 10.3 .0 L 12.4 -2.2 L 16.1 -9.5 L 19.2 -14.4 L 23.6 -19.7 L 27.8 -21.9 L 30.1 -22.2 L 31.6 -21.4 L 32.0 -20.2 M 12.1 -2.0 L 9.6 3.1 L 8.3 6.1 L 8.4 7.6 L 9.5 8.2 L 11.7 8.3 L 15.6 5.7 L 18.1 2.3 L 19.8 -.6 L 20.5 -3.0 L 19.8 -4.5 L 18.7 -4.6 L 15.4 -2.0 L 14.0 -.3 L 12.4 .9 L 10.0 3.7","0 11.4 M 18.3 -1.6 L 18.7 -3.7 L 17.9 -5.1 L 16.4 -5.5 L 14.7 -5.1 L 11.9 -3.2 L 9.3 -.4 L 7.2 3.3 L 6.5 6.7 L 7.9 8.3 L 10.6 8.2 L 14.0 6.8 L 17.3 4.2 L 18.7 2.8 L 19.3 1.9","0 14.2 M 35.4 -21.1 L 33.2 -22.4 L 29.5 -21.3 L 25.9 -17.6 L 22.8 -12.0 L 19.2 -5.2 L 17.0 -1.0 L 15.1 1.8 L 12.0 4.8 L 10.3 6.2 L 8.1 7.4 L 6.7 7.6 L 6.3 7.1 L 6.7 4.1 L 9.5 -.7 L 11.8 -3.4 L 13.6 -4.6 L 14.9 -5.4 L 16.9 -5.4 L 17.5 -5.0 L 18.3 -3.7 L 14.8 3.8 L 14.0 6.5 L 14.4 7.8 L 16.3 7.6 L 18.0 6.4 L 20.6 3.9 L 22.2 1.9","0 12.1 M 9.2 1.8 L 13.1 1.3 L 16.1 .0 L 17.9 -1.8 L 18.2 -3.7 L 17.9 -4.9 L 16.5 -5.3 L 13.7 -4.5 L 10.6 -1.8 L 8.1 1.6 L 6.9 5.0 L 7.1 6.8 L 8.1 7.7 L 10.5 8.4 L 12.9 7.8 L 15.6 6.4 L 18.0 4.5 L 20.1 1.9","0 9.2 M 32.2 -20.2 L 32.0 -21.4 L 30.5 -22.1 L 28.1 -22.1 L 25.7 -21.0 L 23.6 -19.3 L 21.4 -16.1 L 18.9 -11.1 L 16.2 -5.1 L 14.3 -.4 L 11.6 6.4 L 9.6 10.5 L 7.2 14.6 L 4.3 17.3 L 2.2 18.6 L -.4 19.5 L -2.1 19.6 L -4.2 19.1 L -6.1 17.6 L -6.7 16.7 L -6.3 14.0 M 13.1 -4.9 L 13.4 -4.9 L 20.3 -5.0 L 21.2 -5.2","0 11.0 M 20.0 -5.1 L 17.4 -2.0 L 15.2 1.1 L 11.8 4.7 L 10.4 6.3 L 7.7 7.5 L 6.6 7.7 L 6.0 6.7 L 7.0 3.6 L 8.6 1.0 L 10.2 -1.0 L 12.7 -3.7 L 14.5 -5.0 L 16.5 -5.2 L 18.3 -4.9 L 19.1 -4.9 L 15.3 4.7 L 11.4 13.4 L 7.6 19.5 L 4.5 22.9 L .7 25.1 L -2.9 25.5 L -7.0 24.1 L -8.5 22.6 L -9.0 21.5 L -8.9 19.1","0 14.4 M 31.7 -19.7 L 31.6 -21.0 L 29.9 -22.5 L 26.7 -22.3 L 23.5 -21.2 L 19.4 -18.5 L 16.0 -14.7 L 13.3 -10.0 L 9.6 -1.9 L 5.7 7.8 L 6.2 7.8 L 9.3 3.0 L 12.2 -.5 L 14.9 -3.2 L 16.8 -4.3 L 18.9 -5.1 L 18.9 -3.9 L 17.9 -2.1 L 14.4 4.5 L 13.6 6.0 L 13.2 7.3 L 13.9 8.1 L 15.4 8.0 L 17.5 7.2 L 19.4 5.6 L 22.4 1.9","0 9.6 M 8.0 1.9 L 10.8 -1.5 L 13.2 -3.8 L 15.1 -5.5 L 14.0 -3.9 L 9.9 3.9 L 8.8 6.6 L 8.8 7.7 L 9.6 8.0 L 11.4 7.6 L 14.4 5.9 L 16.1 3.8 L 17.6 1.9 M 18.1 -13.1 L 17.5 -11.9 L 18.8 -11.9 L 19.1 -13.0","0 6.8 M 17.6 -5.5 L 15.1 -4.4 L 14.2 -3.7 L 11.8 3.3 L 7.8 12.1 L 4.5 18.3 L 1.7 21.6 L -1.7 24.1 L -5.1 25.2 L -8.9 25.3 L -10.9 24.4 L -12.6 22.9 L -13.1 21.1 L -13.0 19.3 M 17.8 -13.3 L 17.2 -12.1 L 18.6 -12.0 L 19.0 -13.2","0 18.9 M 32.4 -20.5 L 32.4 -21.4 L 30.9 -22.3 L 27.4 -21.7 L 23.7 -19.2 L 21.0 -16.2 L 17.4 -10.4 L 14.3 -3.8 L 12.3 1.6 L 10.5 5.4 L 9.3 7.8 L 10.2 7.6 L 12.7 3.3 L 16.5 -.9 L 19.2 -3.5 L 21.6 -4.8 L 23.0 -4.5 L 23.4 -3.9 M 15.8 -1.3 L 16.7 4.0 L 17.6 7.1 L 19.4 7.9 L 21.8 7.4 L 24.3 5.1 L 26.9 1.9","0 11.1 M 8.0 1.9 L 15.4 -4.9 L 19.9 -9.5 L 23.6 -14.9 L 25.5 -18.7 L 26.4 -20.6 L 26.4 -21.6 L 26.1 -22.4 L 25.6 -22.6 L 24.1 -22.6 L 22.3 -20.9 L 19.2 -16.6 L 14.7 -8.1 L 11.2 -1.1 L 9.2 3.3 L 8.9 6.4 L 10.1 7.8 L 13.0 7.6 L 16.0 5.4 L 19.1 1.9","0 24.3 M 8.0 1.9 L 11.6 -2.4 L 13.8 -4.6 L 15.6 -5.0 L 13.7 -2.7 L 11.3 3.1 L 9.5 8.1 L 12.0 2.3 L 16.0 -1.5 L 18.2 -3.3 L 20.5 -4.8 L 21.7 -4.8 L 22.0 -4.1 L 20.4 -1.7 L 17.4 4.2 L 16.3 6.7 L 16.6 7.2 L 18.3 3.3 L 21.4 .1 L 24.0 -2.2 L 25.7 -3.8 L 27.6 -4.7 L 28.6 -4.9 L 29.1 -3.9 L 27.3 -1.0 L 23.9 6.6 L 24.5 8.1 L 27.1 7.1 L 29.7 4.8 L 32.3 1.9","0 17.1 M 8.0 1.9 L 13.4 -4.9 L 14.4 -5.0 L 15.6 -5.4 L 14.0 -3.9 L 8.7 8.1 L 9.2 8.1 L 12.8 1.9 L 16.7 -2.4 L 19.0 -4.1 L 21.0 -4.9 L 22.1 -5.0 L 22.1 -4.2 L 20.0 -1.2 L 17.0 5.2 L 16.4 6.6 L 16.4 7.8 L 17.5 8.4 L 19.0 7.8 L 20.9 6.4 L 25.1 1.9","0 12.8 M 14.7 -5.0 L 10.7 -2.0 L 8.1 1.6 L 6.7 5.1 L 6.8 7.1 L 7.8 8.0 L 10.4 7.9 L 13.6 5.4 L 15.9 2.6 L 17.4 -.1 L 18.4 -2.4 L 18.5 -4.0 L 18.1 -4.9 L 16.9 -5.6 L 16.0 -5.6 L 14.7 -5.0 M 14.1 5.2 L 14.5 5.2 L 15.5 5.7 L 18.2 4.4 L 20.8 1.9","0 11.0 M 18.8 -11.4 L 18.4 -12.3 L 17.1 -12.5 L 14.7 -11.2 L 11.9 -8.5 L 10.0 -4.2 L 8.6 .6 L 6.5 5.4 L 4.2 10.5 L 1.2 16.7 L -1.6 20.4 L -5.4 23.7 L -8.3 25.2 L -12.1 25.6 L -14.6 24.8 L -16.8 22.9 L -17.3 21.7 L -17.4 18.9 M 8.6 1.5 L 12.3 -2.1 L 15.4 -4.4 L 16.9 -4.9 L 17.7 -3.4 L 16.4 -.3 L 14.2 3.3 L 13.2 5.1 L 11.6 6.8 L 9.9 7.8 L 8.0 8.5 L 6.5 8.3 L 6.1 7.0","0 13.7 M 21.0 -5.1 L 18.6 -5.0 L 16.0 -5.4 L 12.3 -3.9 L 10.0 -1.1 L 8.2 1.5 L 6.6 4.9 L 6.2 6.7 L 6.7 7.7 L 7.8 7.8 L 9.0 7.3 L 10.8 5.9 L 12.6 4.5 L 14.1 3.0 L 17.3 -1.3 L 18.5 -3.7 L 18.5 -4.7 L 19.6 -4.8 L 13.3 7.8 L 8.6 17.9 L 5.7 25.1 L 6.8 24.4 L 10.3 17.7 L 14.1 12.1 L 19.2 5.1 L 21.6 1.9","0 11.5 M 8.0 1.9 L 13.3 -4.9 L 15.0 -5.1 L 16.0 -5.8 L 14.1 -3.7 L 8.8 8.4 L 9.3 8.3 L 12.9 .9 L 17.0 -3.7 L 18.8 -4.6 L 19.8 -5.0 L 20.8 -4.8 L 22.0 -3.0 L 21.7 -2.2 L 21.3 -1.3","0 9.5 M 17.2 -1.7 L 17.8 -3.5 L 16.9 -5.2 L 14.8 -5.6 L 13.2 -4.7 L 12.0 -3.7 L 11.4 -2.0 L 12.5 .4 L 14.6 2.9 L 15.3 4.0 L 15.3 6.4 L 13.5 8.3 L 11.2 9.2 L 8.9 8.6 L 7.3 7.8 L 6.3 6.4 L 6.3 5.0 L 6.7 3.9 M 8.0 1.9 L 11.6 -2.8","0 10.6 M 8.0 1.9 L 11.1 -1.3 L 13.4 -4.0 L 15.1 -5.8 L 17.4 -10.6 L 18.1 -11.8 L 19.3 -12.7 L 13.7 -2.2 L 11.0 3.0 L 10.1 6.1 L 9.9 7.5 L 11.0 7.9 L 13.7 6.7 L 16.1 5.1 L 18.6 1.9 M 11.0 -4.8 L 11.9 -5.1 L 20.0 -5.2","0 20.5 M 8.0 1.9 L 11.4 -2.0 L 12.8 -3.4 L 14.7 -4.6 L 15.7 -5.1 L 16.1 -4.6 L 15.2 -2.5 L 11.1 5.0 L 10.4 7.3 L 10.5 7.9 L 11.8 8.1 L 13.5 7.5 L 15.7 5.9 L 17.6 3.7 L 20.0 1.2 L 22.2 -2.3 L 23.2 -4.6 L 26.1 -5.4 L 24.1 -4.6 L 21.5 -.5 L 19.5 4.1 L 19.4 6.9 L 20.9 7.8 L 23.5 6.8 L 25.8 5.2 L 28.5 1.9","0 13.0 M 8.0 1.9 L 11.6 -2.5 L 12.9 -4.0 L 14.9 -5.2 L 13.2 -3.1 L 11.9 .4 L 11.2 5.1 L 11.4 7.3 L 12.9 8.2 L 15.1 7.0 L 18.6 3.3 L 20.7 -.2 L 21.6 -2.6 L 21.9 -4.1 L 21.0 -5.5","0 23.0 M 8.0 1.9 L 12.1 -4.1 L 12.2 -4.5 L 14.5 -4.8 L 13.2 -3.6 L 11.8 1.3 L 11.0 5.8 L 10.9 7.5 L 12.5 8.2 L 14.0 7.4 L 17.2 4.6 L 19.1 1.7 L 20.7 -1.0 L 22.3 -4.3 L 24.0 -5.0 L 22.8 -3.3 L 21.6 .0 L 20.9 3.8 L 20.7 6.4 L 20.9 7.7 L 21.9 8.1 L 24.2 7.5 L 26.9 5.7 L 28.8 3.7 L 30.8 .6 L 32.2 -2.4 L 32.7 -3.7 L 32.6 -5.1 L 32.3 -5.8 L 31.7 -6.2","0 15.9 M 15.6 -4.6 L 14.2 -3.8 L 14.0 -3.1 L 14.6 2.7 L 16.0 6.5 L 17.0 7.6 L 18.7 8.1 L 19.4 7.8 L 21.0 6.6 L 22.3 4.9 L 23.9 1.9 M 25.8 -4.8 L 24.3 -4.6 L 20.7 -2.2 L 17.2 .4 L 12.4 4.6 L 8.3 8.4","0 15.3 M 7.9 2.0 L 12.0 -2.7 L 14.2 -4.8 L 16.5 -4.7 L 15.0 -2.2 L 12.2 2.8 L 10.2 7.0 L 10.4 8.1 L 13.4 7.6 L 17.3 4.3 L 19.9 1.2 L 21.4 -1.3 L 22.4 -3.0 L 23.1 -3.7 L 24.3 -4.7 L 25.9 -5.1 L 23.5 -3.1 L 20.4 3.8 L 16.2 13.1 L 13.6 17.9 L 10.2 21.9 L 7.0 24.3 L 2.9 25.6 L .3 25.4 L -2.9 24.0 L -4.1 21.8 L -4.3 19.1","0 11.8 M 13.0 -3.9 L 13.9 -4.5 L 21.6 -4.6 L 22.2 -4.1 L 16.9 -.1 L 12.2 3.7 L 9.7 6.1 L 8.6 7.3 L 7.7 8.8 L 7.9 9.4 L 8.3 7.9 L 11.0 5.9 L 14.6 5.9 L 16.9 8.2 L 18.5 10.2 L 20.8 12.4 L 22.3 13.6 L 24.1 14.0 L 25.2 13.7 L 26.5 13.0 L 26.8 11.7 L 26.6 10.5 L 25.8 9.7","0 18.1 M 34.6 -20.0 L 31.2 -19.7 L 28.2 -18.5 L 26.0 -16.4 L 24.6 -13.5 L 22.9 -10.3 L 21.2 -7.0 L 18.1 -4.9 L 16.7 -4.0 L 14.7 -3.6 L 12.8 -3.5 L 16.7 -2.5 L 18.2 -1.2 L 18.1 1.3 L 14.8 8.8 L 14.2 11.2 L 14.6 12.2 L 15.7 12.7 L 17.5 13.2 L 18.6 13.3 L 19.3 13.4","0 19.1 M 24.1 -20.7 L 12.5 8.3","0 21.4 M 21.8 -19.8 L 25.5 -19.8 L 27.7 -18.3 L 27.6 -15.0 L 26.1 -12.3 L 24.7 -9.4 L 23.8 -7.0 L 24.1 -4.8 L 25.9 -3.7 L 29.1 -3.0 L 25.4 -2.7 L 22.7 -1.5 L 20.7 .5 L 18.5 4.1 L 17.1 8.1 L 15.1 10.2 L 13.6 11.9 L 12.3 12.6 L 9.6 13.1 L 6.8 13.1","0 14.6 M 12.3 -9.0 L 14.0 -9.8 L 15.4 -9.9 L 17.1 -9.2 L 19.5 -8.3 L 20.9 -8.5 L 22.2 -9.0 L 22.8 -9.5","0 10.5 M 15.2 -11.8 L 13.5 -10.6 L 12.8 -8.9 L 13.2 -7.6 L 15.3 -6.1 L 18.5 -6.8 L 19.9 -8.0 L 20.5 -9.8 L 20.0 -11.5 L 19.1 -12.2 L 16.9 -12.6 L 15.2 -11.8"]
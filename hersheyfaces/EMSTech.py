@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","0 2.8 M 12.3 -14.7 L 12.2 .6 M 12.8 6.2 L 12.1 6.7","0 7.1 M 13.5 -17.5 L 13.4 -11.7 L 13.7 -10.8 M 16.7 -17.5 L 16.6 -11.5 L 16.8 -10.9","0 21.5 M 16.9 -12.2 L 17.2 3.7 M 23.2 -13.0 L 24.0 3.5 M 11.9 -7.1 L 20.9 -8.0 L 30.1 -8.4 M 12.9 -.8 L 21.7 -2.0 L 30.1 -2.8","0 18.6 M 26.8 -11.8 L 20.3 -11.5 L 16.8 -10.7 L 13.8 -9.2 L 12.5 -7.6 L 12.4 -6.1 L 13.3 -4.6 L 15.5 -4.0 L 21.2 -4.0 L 25.2 -4.4 L 27.5 -3.8 L 28.0 -2.5 L 27.5 -1.0 L 25.0 .5 L 22.3 1.9 L 18.4 2.6 L 13.9 2.8 M 19.1 -18.9 L 21.3 8.7","0 20.3 M 16.1 -12.7 L 14.0 -12.2 L 13.5 -10.3 L 13.7 -9.2 L 14.6 -8.5 L 16.9 -8.6 L 18.7 -9.6 L 18.9 -11.5 L 18.0 -12.3 L 16.1 -12.7 M 27.9 -14.3 L 16.3 6.5 M 25.6 2.2 L 24.9 4.2 L 25.6 5.8 L 27.1 5.9 L 28.6 5.7 L 30.4 4.3 L 30.4 2.7 L 29.7 1.9 L 28.0 1.7 L 25.6 2.2","0 23.1 M 32.8 -2.8 L 30.9 -.4 L 28.2 1.8 L 24.5 4.2 L 20.9 6.0 L 17.6 6.9 L 14.9 6.8 L 13.5 6.1 L 13.6 4.1 L 14.4 2.4 L 19.6 -4.5 L 21.7 -8.3 L 22.2 -10.4 L 22.5 -12.6 L 22.0 -14.1 L 21.1 -14.8 L 19.7 -14.6 L 17.9 -13.6 L 16.6 -12.0 L 16.0 -10.6 L 15.9 -7.8 L 16.4 -5.6 L 17.8 -3.5 L 19.0 -2.0 L 21.4 .2 L 24.8 3.1 L 28.1 4.9 L 30.0 5.7 L 30.8 5.7","0 4.5 M 13.7 -12.4 L 12.4 -8.2","0 9.5 M 18.5 -18.8 L 16.3 -16.3 L 14.5 -12.8 L 13.3 -9.4 L 12.6 -5.7 L 12.3 -2.5 L 12.9 .9 L 14.1 4.9 L 15.9 8.1","0 11.2 M 12.6 -18.0 L 15.6 -15.5 L 17.5 -12.4 L 19.2 -8.4 L 19.9 -5.1 L 20.0 -2.1 L 19.5 .8 L 18.3 3.4 L 17.4 5.1 L 15.2 7.6","0 17.0 M 19.3 -6.3 L 22.0 -14.2 L 20.8 -6.6 L 27.2 -8.5 L 20.6 -5.6 L 22.2 2.1 L 19.0 -4.4 L 14.6 1.7 L 18.2 -5.9 L 13.3 -9.8 L 19.3 -7.1","0 17.5 M 18.7 -8.2 L 19.1 -2.7 L 19.7 3.0 L 20.0 5.3 M 12.2 -1.1 L 15.1 -1.7 L 18.6 -2.3 L 22.4 -2.8 L 26.7 -2.9","0 5.3 M 14.0 5.4 L 12.6 8.6 L 11.7 9.8","0 10.1 M 12.5 -.4 L 16.2 -1.0 L 18.8 -1.3","0 3.5 M 12.1 6.7 L 12.6 6.6","0 15.5 M 25.9 -14.4 L 22.0 -8.3 L 19.6 -4.2 L 17.6 -1.3 L 15.2 2.4 L 12.3 6.8","0 20.5 M 21.7 -14.2 L 23.8 -14.0 L 26.4 -12.9 L 28.4 -10.5 L 29.4 -7.8 L 29.9 -4.7 L 29.4 -.8 L 28.0 2.3 L 25.4 5.1 L 22.6 6.4 L 18.3 6.7 L 14.7 5.7 L 12.8 3.7 L 12.0 1.2 L 12.5 -3.3 L 13.7 -7.3 L 15.8 -11.0 L 17.6 -12.9 L 19.7 -14.1 L 21.7 -14.2","0 7.6 M 14.5 -14.3 L 13.9 6.5","0 17.5 M 12.7 -10.7 L 14.9 -12.6 L 17.2 -13.9 L 20.0 -14.6 L 21.6 -14.6 L 23.2 -13.5 L 23.8 -11.9 L 23.5 -9.6 L 22.7 -7.3 L 20.9 -3.8 L 18.5 .1 L 15.6 3.6 L 13.1 6.4 L 16.3 6.4 L 20.3 6.0 L 23.7 5.3 L 26.8 4.5","0 16.6 M 12.2 -12.3 L 13.4 -12.5 L 17.5 -13.9 L 20.5 -14.4 L 23.0 -14.5 L 24.5 -14.2 L 25.3 -13.1 L 25.2 -11.4 L 24.2 -9.8 L 21.4 -7.4 L 17.9 -5.0 L 14.9 -3.4 L 18.8 -5.0 L 22.2 -5.5 L 24.4 -4.7 L 25.3 -3.4 L 25.2 -1.4 L 23.5 1.2 L 20.8 3.7 L 18.0 5.5 L 14.6 6.7 L 13.4 6.9","0 16.4 M 22.7 7.0 L 22.6 -9.9 L 22.3 -13.3 L 21.5 -14.4 L 19.3 -12.7 L 14.2 -6.2 L 12.2 -3.4 L 21.9 -3.8 L 26.1 -4.5","0 17.4 M 27.4 -14.2 L 23.2 -12.9 L 19.1 -11.8 L 16.3 -11.5 L 13.0 -11.2 L 13.2 -14.5 L 12.5 -3.5 L 14.7 -3.7 L 18.5 -4.4 L 22.1 -4.5 L 24.7 -4.2 L 26.6 -2.3 L 26.9 .1 L 26.3 2.2 L 23.9 4.1 L 20.8 5.5 L 17.3 6.3 L 12.6 6.7 L 12.6 5.8","0 21.3 M 22.9 -14.2 L 20.3 -13.4 L 17.9 -11.6 L 15.7 -9.0 L 14.1 -6.7 L 13.0 -3.6 L 12.9 -.4 L 13.4 1.9 L 15.2 4.4 L 17.8 6.1 L 19.7 6.7 L 21.9 6.8 L 24.8 6.5 L 27.9 4.9 L 30.0 2.4 L 30.6 .9 L 30.5 -.9 L 29.7 -2.1 L 28.0 -2.2 L 25.3 -1.1 L 22.5 1.1 L 20.7 2.6 L 19.1 4.2 L 18.0 5.5","0 18.0 M 12.1 -13.2 L 16.8 -13.3 L 22.4 -14.3 L 27.3 -14.8 L 25.5 -12.7 L 23.1 -8.0 L 21.2 -3.8 L 20.2 .4 L 19.7 2.8 L 19.5 5.5","0 20.9 M 21.6 -14.2 L 18.3 -12.7 L 16.4 -10.8 L 15.7 -8.5 L 16.1 -6.7 L 17.5 -5.5 L 19.4 -5.0 L 22.3 -5.9 L 24.1 -6.4 L 26.9 -6.7 L 29.6 -5.6 L 31.4 -3.0 L 31.2 -.1 L 29.1 3.1 L 26.3 5.3 L 23.1 6.5 L 19.2 6.7 L 16.2 6.1 L 13.8 3.8 L 13.4 1.5 L 14.2 -.6 L 15.9 -2.7 L 18.0 -4.5 L 19.3 -5.1 L 25.9 -6.7 L 28.4 -8.4 L 30.1 -9.8 L 30.3 -11.6 L 29.5 -13.1 L 28.3 -13.9 L 25.2 -14.6 L 21.6 -14.2","0 16.9 M 27.3 -7.4 L 23.4 -6.4 L 20.2 -5.9 L 16.9 -5.7 L 14.3 -6.2 L 12.8 -7.2 L 12.7 -8.8 L 13.6 -10.7 L 16.6 -13.0 L 19.8 -14.0 L 22.8 -14.3 L 24.7 -13.4 L 26.2 -11.9 L 27.2 -9.6 L 27.1 -5.7 L 26.3 -2.6 L 25.0 .5 L 23.1 3.6 L 20.9 5.5 L 19.1 6.4","0 5.1 M 12.8 -3.9 L 13.5 -3.8 M 14.2 3.3 L 14.8 3.3","0 2.9 M 12.0 -3.5 L 12.5 -3.5 M 12.7 5.1 L 11.9 8.8 L 11.3 10.5 L 10.6 11.8","0 16.0 M 23.7 -7.0 L 17.4 -2.0 L 15.2 -.1 L 17.5 1.7 L 21.4 3.3 L 22.9 3.9 L 24.1 4.5","0 15.8 M 13.2 -2.5 L 22.9 -3.7 M 13.4 2.0 L 19.6 1.1 L 23.6 .4","0 15.8 M 14.0 -6.3 L 17.5 -5.0 L 20.0 -3.9 L 23.6 -2.7 L 22.0 -1.2 L 19.5 .7 L 17.5 2.2 L 14.6 4.4","0 16.4 M 12.0 -13.5 L 15.2 -14.2 L 18.7 -14.6 L 21.2 -14.6 L 23.8 -13.8 L 25.5 -12.7 L 26.0 -11.3 L 25.8 -9.7 L 24.4 -8.3 L 22.6 -6.9 L 19.2 -4.6 L 15.8 -3.0 L 16.5 -2.2 L 18.5 -1.8 L 20.2 -1.8 M 19.2 6.4 L 20.0 6.4","0 36.1 M 31.8 -8.0 L 29.3 -8.4 L 25.3 -7.2 L 23.5 -5.4 L 23.0 -4.0 L 23.2 -2.4 L 24.6 -1.6 L 27.0 -2.3 L 29.5 -4.0 L 30.9 -5.3 L 31.8 -6.8 L 33.0 -5.0 L 34.7 -4.0 L 36.9 -4.3 L 38.7 -5.3 L 39.2 -6.5 L 39.0 -8.9 L 37.6 -11.4 L 35.6 -13.0 L 31.4 -14.6 L 26.5 -14.7 L 22.3 -13.5 L 19.2 -11.7 L 16.9 -9.6 L 15.0 -6.7 L 13.5 -3.7 L 13.0 -.1 L 14.3 3.3 L 17.4 5.5 L 21.3 6.6 L 25.3 7.1 L 30.0 6.7 L 35.2 5.8 L 39.4 4.5 L 42.7 2.7 L 45.1 .5","0 21.4 M 12.4 6.9 L 16.2 -3.1 L 18.6 -9.7 L 20.3 -14.3 L 20.8 -14.2 L 22.7 -11.1 L 25.5 -5.4 L 27.5 -.4 L 29.3 4.0 L 30.8 6.7 M 15.2 -.7 L 18.9 -1.5 L 23.2 -2.8 L 26.8 -3.5 L 30.2 -4.3","0 24.0 M 13.3 -13.8 L 13.4 -4.7 L 13.8 .9 L 14.5 6.8 L 19.6 6.4 L 25.0 5.2 L 29.3 3.5 L 32.3 1.6 L 32.8 -.3 L 32.1 -2.3 L 29.3 -3.9 L 26.3 -4.3 L 22.9 -4.7 L 19.0 -4.4 L 14.7 -4.0 L 20.8 -5.6 L 24.7 -7.3 L 27.4 -8.9 L 28.3 -10.5 L 28.1 -12.2 L 27.1 -13.0 L 24.6 -14.1 L 21.0 -14.7 L 17.4 -14.8 L 12.0 -14.5","0 23.7 M 27.4 -13.5 L 26.2 -14.6 L 23.2 -15.0 L 19.4 -13.8 L 16.0 -11.4 L 13.9 -8.4 L 12.8 -5.8 L 12.3 -2.9 L 12.2 .1 L 13.8 2.9 L 15.8 5.0 L 18.2 6.1 L 21.4 6.5 L 25.3 5.9 L 28.4 4.3 L 31.1 2.2 L 33.0 .6","0 21.7 M 12.9 -14.4 L 13.0 7.0 L 15.9 6.6 L 19.4 5.5 L 23.1 3.6 L 26.1 1.5 L 28.5 -.9 L 30.4 -3.7 L 31.0 -6.0 L 30.7 -8.6 L 28.6 -11.1 L 25.1 -13.0 L 21.7 -13.9 L 18.2 -14.1 L 15.6 -13.8 L 13.0 -13.2","0 19.7 M 26.1 -14.2 L 13.1 -13.8 L 13.0 -2.8 L 26.4 -4.3 L 13.1 -2.8 L 13.5 6.3 L 28.9 5.3","0 23.3 M 33.1 -14.0 L 26.2 -13.6 L 21.5 -12.8 L 17.2 -12.4 L 13.9 -11.7 L 13.3 -14.6 L 14.3 -9.8 L 15.2 -4.8 L 15.2 -2.0 L 13.2 -1.1 L 17.0 -2.6 L 24.3 -3.8 L 31.0 -4.9 L 16.9 -2.6 L 15.2 -1.8 L 15.1 6.7","0 23.7 M 26.4 -14.6 L 23.5 -14.3 L 20.4 -12.8 L 18.1 -10.8 L 16.3 -8.9 L 14.4 -5.5 L 13.1 -1.9 L 12.9 1.4 L 13.5 3.8 L 15.0 5.5 L 17.9 6.7 L 20.9 6.2 L 24.5 4.5 L 26.8 2.8 L 28.6 1.1 L 29.0 .3 L 29.2 -5.8 L 19.5 -4.1 L 32.6 -6.3 L 29.3 -5.7 L 29.3 8.4","0 19.1 M 13.9 -14.5 L 13.5 -3.9 L 13.5 1.0 L 14.2 7.0 L 13.6 -3.4 L 11.9 -2.8 L 16.0 -3.6 L 20.6 -4.1 L 26.4 -4.4 L 26.4 -14.4 L 26.3 -1.9 L 26.7 2.9 L 27.2 5.4 L 27.8 6.6","0 3.4 M 13.1 -14.3 L 13.0 -6.0 L 12.9 -1.8 L 13.0 1.8 L 13.0 6.3","0 17.4 M 25.9 -14.3 L 26.1 -2.8 L 25.9 1.5 L 25.2 4.2 L 24.2 5.6 L 22.2 6.4 L 19.8 6.3 L 17.5 5.9 L 14.8 5.0 L 13.0 3.6 L 11.8 2.4 L 11.6 1.5","0 19.2 M 13.5 -13.8 L 13.0 -6.4 L 12.9 -1.5 L 12.9 6.7 M 27.9 -14.1 L 22.6 -10.0 L 19.0 -7.3 L 15.3 -5.3 L 13.6 -4.0 L 13.0 -1.4 L 16.6 .0 L 21.3 2.1 L 24.8 3.8 L 27.6 5.6 L 28.9 6.4","0 19.6 M 13.7 -14.3 L 13.7 -14.1 L 13.8 -5.4 L 13.8 -.2 L 13.5 4.3 L 13.4 6.1 L 19.8 6.1 L 28.9 6.3","0 26.7 M 12.6 6.1 L 13.6 -4.0 L 14.4 -11.2 L 15.1 -14.0 L 15.7 -14.2 L 17.1 -13.2 L 19.5 -8.3 L 22.0 -3.5 L 24.2 1.0 L 25.6 -1.0 L 29.3 -7.9 L 32.6 -14.3 L 33.3 -13.8 L 34.0 -10.9 L 34.7 -6.0 L 35.5 -.8 L 36.3 6.6","0 20.8 M 12.8 6.1 L 13.1 -.7 L 13.2 -6.6 L 13.2 -12.9 L 13.7 -13.9 L 17.1 -10.2 L 21.1 -5.0 L 26.3 1.7 L 29.1 5.5 L 29.2 1.8 L 29.2 -5.4 L 29.1 -14.5","0 22.0 M 21.8 -14.5 L 19.2 -14.0 L 16.4 -12.2 L 14.2 -9.5 L 12.5 -6.0 L 12.3 -1.9 L 13.7 2.4 L 15.9 4.5 L 18.3 5.8 L 21.7 6.1 L 25.9 5.7 L 29.3 3.4 L 31.4 -.3 L 31.5 -4.1 L 31.0 -7.8 L 29.0 -10.9 L 27.8 -12.6 L 25.9 -13.7 L 23.6 -14.5 L 21.8 -14.5","0 21.5 M 13.6 6.1 L 13.6 .5 L 13.9 -7.3 L 14.1 -10.5 L 15.0 -12.7 L 17.8 -14.1 L 22.1 -14.8 L 26.4 -14.7 L 30.1 -13.3 L 31.2 -12.1 L 31.1 -9.7 L 29.8 -7.7 L 26.9 -5.9 L 23.3 -4.8 L 19.9 -4.3 L 13.8 -4.1","0 24.2 M 29.1 3.6 L 30.5 2.0 L 31.6 -1.4 L 32.0 -5.8 L 31.3 -9.6 L 28.9 -12.4 L 25.2 -14.2 L 21.8 -14.1 L 18.7 -12.8 L 16.6 -10.7 L 14.5 -7.7 L 13.4 -4.2 L 12.6 -.8 L 13.6 3.3 L 15.9 5.4 L 18.6 6.8 L 21.8 7.3 L 24.5 6.9 L 26.8 6.0 L 29.4 3.9 L 32.7 6.0 L 27.6 2.5 L 23.0 -1.7 L 22.4 -1.8","0 22.0 M 12.9 -14.1 L 13.2 -4.2 L 13.4 6.3 L 13.7 -6.4 L 13.1 -12.2 L 16.3 -14.1 L 20.1 -14.7 L 23.2 -14.3 L 25.6 -14.2 L 27.4 -13.8 L 28.5 -12.7 L 28.8 -11.4 L 27.2 -10.1 L 24.3 -9.0 L 21.6 -7.8 L 18.6 -6.8 L 13.6 -5.3 L 13.4 -4.5 L 17.1 -2.5 L 20.0 -.5 L 24.4 2.1 L 31.2 6.6 L 31.9 6.7","0 21.4 M 29.0 -14.1 L 24.9 -13.4 L 20.7 -12.3 L 16.9 -11.2 L 15.3 -9.9 L 14.5 -8.9 L 14.2 -8.0 L 15.0 -6.6 L 19.2 -5.2 L 23.1 -3.8 L 27.1 -2.2 L 29.3 -1.0 L 30.6 .1 L 30.5 1.2 L 28.8 3.2 L 24.9 5.2 L 20.3 6.7 L 16.9 6.9 L 14.5 6.6 L 13.1 5.9 L 12.6 4.9","0 20.7 M 11.4 -14.3 L 17.5 -14.0 L 22.9 -13.7 L 28.2 -13.7 L 30.7 -14.3 M 19.5 -13.7 L 18.8 -3.7 L 18.5 1.6 L 18.5 6.1","0 18.4 M 13.7 -13.8 L 12.5 -7.0 L 11.9 -1.8 L 11.9 1.5 L 13.1 4.3 L 14.6 6.0 L 18.2 6.3 L 21.7 4.7 L 24.5 2.1 L 26.2 -2.7 L 27.0 -6.9 L 26.8 -14.0 L 26.8 6.2","0 20.1 M 11.7 -14.0 L 20.6 5.6 L 21.8 5.8 L 25.7 -4.1 L 30.2 -14.3","0 32.3 M 12.5 -14.3 L 20.8 6.0 L 23.3 .3 L 28.0 -10.5 L 29.3 -9.2 L 31.5 -5.7 L 35.0 1.4 L 37.4 5.9 L 39.0 1.4 L 40.4 -4.7 L 42.0 -14.0","0 20.3 M 12.3 -14.2 L 18.0 -6.4 L 25.2 1.1 L 30.1 5.6 M 29.6 -14.7 L 22.3 -5.4 L 17.3 .6 L 13.2 5.9 L 12.9 6.0","0 17.0 M 12.5 -14.3 L 14.7 -12.3 L 17.7 -8.9 L 22.2 -4.0 L 26.0 -14.3 L 27.0 -15.2 L 26.1 -14.3 L 21.8 -2.5 L 19.0 6.4","0 20.9 M 12.9 -14.2 L 30.7 -14.3 L 28.1 -10.3 L 21.2 -2.0 L 15.1 5.2 L 14.5 5.9 L 17.7 6.7 L 21.2 6.8 L 31.5 6.2","0 14.3 M 20.9 -19.9 L 12.9 -18.0 L 13.4 -3.4 L 14.4 9.0 L 22.9 7.7","0 16.4 M 11.7 -11.7 L 17.8 -3.0 L 22.2 2.8 L 25.6 6.6","0 18.3 M 12.2 -17.3 L 16.9 -18.2 L 22.4 -18.9 L 24.2 -19.1 L 24.5 -9.2 L 24.8 -2.4 L 25.1 5.2 L 25.3 8.6 L 22.2 9.3 L 18.5 9.7 L 15.5 9.9","0 9.3 M 12.3 -3.8 L 13.1 -5.4 L 15.9 -7.4 L 17.7 -6.3 L 19.8 -4.0","0 23.5 M 13.5 6.9 L 18.7 6.0 L 24.2 5.6 L 32.2 4.9","0 4.5 M 12.3 -12.2 L 14.4 -10.5","0 16.9 M 26.0 -1.8 L 24.2 2.2 L 21.3 4.9 L 19.2 6.1 L 17.2 6.8 L 14.4 6.5 L 12.9 5.5 L 12.5 2.4 L 14.0 -.7 L 16.0 -3.7 L 19.2 -5.9 L 21.6 -7.0 L 23.4 -7.0 L 25.6 -6.6 L 26.0 -5.1 L 26.4 6.9","0 18.7 M 13.6 -14.3 L 13.8 5.7 L 15.3 6.3 L 17.9 5.8 L 21.8 4.2 L 26.6 .4 L 28.5 -2.9 L 29.2 -5.5 L 28.6 -6.9 L 27.1 -7.5 L 23.6 -7.2 L 20.5 -5.1 L 17.1 -2.7 L 14.0 1.7","0 19.1 M 26.0 -6.2 L 25.0 -7.1 L 22.0 -7.4 L 18.8 -6.2 L 16.1 -4.2 L 13.2 -.4 L 12.3 3.6 L 14.2 5.9 L 18.1 7.1 L 22.3 6.9 L 25.3 6.2 L 28.5 4.5","0 17.7 M 26.6 -13.7 L 26.1 -5.3 L 25.9 .1 L 26.1 4.5 L 26.2 6.4 L 26.0 1.2 L 23.1 4.3 L 18.4 6.4 L 15.1 6.6 L 12.8 5.3 L 12.1 1.9 L 13.8 -1.4 L 17.9 -4.2 L 21.6 -4.8 L 24.4 -4.4 L 26.2 -2.5","0 16.9 M 13.4 -2.4 L 17.4 -2.5 L 22.0 -2.6 L 25.0 -3.1 L 25.5 -4.2 L 25.1 -5.3 L 22.5 -7.6 L 19.2 -7.6 L 16.2 -6.5 L 14.1 -4.6 L 12.6 -.7 L 12.1 1.6 L 12.0 3.2 L 13.7 5.4 L 16.5 6.8 L 19.7 6.6 L 23.1 5.8 L 25.5 4.6 L 26.4 3.5","0 19.1 M 28.4 -10.2 L 25.6 -13.2 L 22.3 -14.7 L 20.1 -14.9 L 17.5 -13.2 L 16.3 -10.5 L 16.3 -7.6 L 16.8 -4.9 L 17.9 1.2 L 18.3 6.2 L 17.5 -1.1 L 11.6 -.2 L 22.8 -1.7 L 28.0 -2.4","0 17.5 M 26.6 -1.3 L 24.5 2.3 L 20.7 5.3 L 16.6 6.8 L 13.7 6.8 L 12.8 5.3 L 14.0 1.5 L 17.0 -3.0 L 20.4 -5.8 L 22.6 -6.9 L 24.8 -6.6 L 26.6 -5.2 L 27.1 9.0 L 26.7 13.8 L 25.6 16.8 L 24.2 18.8 L 22.9 19.9 L 21.2 20.2 L 19.9 20.3 L 16.3 20.2","0 16.4 M 13.4 -14.2 L 13.1 -4.3 L 13.4 6.8 L 14.2 -1.6 L 16.7 -4.8 L 19.6 -6.6 L 22.2 -6.5 L 24.0 -5.0 L 25.8 -1.6 L 26.1 1.7 L 26.2 6.1","0 8.0 M 14.7 -13.2 L 15.3 -13.2 M 15.5 -7.2 L 15.8 5.6 L 16.4 6.2","0 5.3 M 11.3 -13.1 L 11.8 -13.8 M 12.0 -8.6 L 12.0 -2.9 L 12.4 3.7 L 12.7 13.2 L 12.4 16.9 L 11.4 18.4 L 10.2 18.8 L 9.3 18.8 L 6.7 18.2 L 5.1 16.9","0 15.9 M 11.9 -14.4 L 12.5 -2.3 L 12.5 6.6 L 12.7 -.8 L 15.5 -3.2 L 22.7 -8.0 L 13.0 -1.2 L 16.8 1.6 L 25.4 6.3","0 6.4 M 14.3 -14.9 L 14.6 -.9 L 14.8 5.7","0 26.9 M 12.9 -7.7 L 13.1 6.9 L 14.3 -3.1 L 16.3 -6.1 L 19.8 -7.6 L 21.9 -7.7 L 23.3 -6.8 L 24.4 -4.1 L 24.0 6.9 L 25.1 -3.3 L 27.5 -6.0 L 30.9 -7.6 L 33.8 -7.6 L 35.6 -6.8 L 36.0 -4.3 L 36.1 .4 L 36.3 6.6","0 15.4 M 11.9 -7.3 L 12.0 6.4 L 11.9 -3.3 L 15.6 -5.7 L 19.2 -7.4 L 21.5 -7.6 L 23.2 -7.4 L 24.3 -6.2 L 25.1 -2.7 L 25.0 6.7","0 17.6 M 20.0 -7.9 L 16.0 -6.1 L 13.9 -3.1 L 12.5 -.1 L 13.2 3.9 L 14.5 6.1 L 18.7 6.8 L 22.2 5.9 L 25.8 3.6 L 27.8 -.1 L 27.1 -4.7 L 25.5 -6.5 L 23.7 -7.6 L 20.0 -7.9","0 16.4 M 12.4 -7.0 L 12.6 19.0 L 12.5 -5.0 L 16.1 -7.0 L 20.2 -7.9 L 24.8 -7.2 L 26.3 -5.0 L 26.0 -1.6 L 24.6 .7 L 21.7 3.2 L 18.7 4.7 L 12.7 6.2","0 16.4 M 25.7 -5.9 L 24.8 -7.4 L 22.6 -7.7 L 18.6 -6.1 L 15.7 -3.4 L 13.7 -.2 L 12.7 2.7 L 13.0 5.4 L 15.6 6.9 L 18.5 6.7 L 21.9 5.2 L 23.7 3.4 L 24.9 1.3 L 25.8 -4.2 L 26.3 19.9","0 16.6 M 13.1 -7.9 L 12.7 6.5 L 13.7 -1.6 L 16.1 -4.7 L 19.2 -6.5 L 21.7 -7.5 L 22.8 -7.6 L 26.1 -7.3 L 26.5 -7.0","0 14.8 M 24.9 -6.6 L 23.9 -7.6 L 20.9 -7.6 L 17.5 -6.9 L 14.4 -5.3 L 13.1 -3.2 L 13.1 -.9 L 14.4 .1 L 17.3 .1 L 20.4 -.5 L 22.4 -.4 L 24.0 .2 L 25.0 1.1 L 24.7 2.6 L 21.6 5.0 L 17.6 6.1 L 15.3 7.0 L 14.3 6.9","0 13.3 M 17.8 -14.3 L 18.3 6.8 L 18.0 -5.0 L 11.9 -5.0 L 23.3 -5.1","0 15.9 M 13.3 -7.6 L 12.5 -3.0 L 12.2 2.3 L 13.4 5.4 L 15.9 6.7 L 20.1 6.4 L 22.5 4.9 L 23.8 4.3 L 25.1 2.5 L 26.0 .6 L 25.3 -8.0 L 26.3 6.6","0 17.1 M 12.9 -7.8 L 19.7 5.2 L 20.5 6.5 L 22.5 1.7 L 26.8 -7.3","0 24.6 M 12.5 -7.6 L 14.7 -.5 L 16.9 3.9 L 18.4 6.2 L 19.0 5.8 L 21.8 -2.9 L 22.3 -4.8 L 23.6 -3.9 L 28.7 5.5 L 30.0 6.3 L 34.6 -7.5","0 15.4 M 12.3 -7.2 L 19.2 .2 L 25.6 6.6 L 19.0 .2 L 24.4 -7.2 L 19.2 .3 L 15.2 4.8 L 13.0 6.9","0 18.7 M 12.6 -6.5 L 22.9 8.2 L 28.6 -6.8 L 18.2 20.5","0 16.0 M 12.8 -7.4 L 13.2 -7.4 L 25.5 -7.3 L 26.1 -6.8 L 22.9 -3.2 L 17.1 2.0 L 13.6 5.4 L 13.3 6.4 L 16.6 6.4 L 25.9 6.4 L 26.7 6.7","0 11.1 M 22.3 -19.1 L 20.7 -19.0 L 18.9 -18.0 L 17.9 -16.2 L 17.6 -13.8 L 17.8 -9.7 L 17.6 -9.1 L 15.0 -6.9 L 14.1 -5.8 L 14.0 -4.5 L 14.6 -3.1 L 17.1 -1.2 L 18.5 .0 L 18.6 4.0 L 19.2 7.4 L 20.6 9.2 L 22.2 10.1 L 23.7 10.3","0 4.4 M 13.4 -15.7 L 13.7 8.2","0 13.1 M 13.9 -19.1 L 16.4 -18.5 L 18.0 -16.9 L 18.5 -12.7 L 18.1 -8.8 L 20.7 -7.2 L 22.5 -5.7 L 22.9 -4.3 L 21.9 -3.5 L 18.0 -.5 L 18.1 2.6 L 17.8 6.2 L 16.6 8.3 L 15.1 9.4 L 12.5 10.2","0 14.3 M 12.5 -2.0 L 13.7 -3.9 L 15.1 -4.9 L 16.2 -4.9 L 17.9 -3.7 L 20.0 -2.0 L 21.6 -2.3 L 22.9 -2.8 L 24.6 -5.3","0 6.7 M 13.1 -6.6 L 11.9 -5.0 L 12.5 -2.3 L 14.7 -1.3 L 16.7 -1.9 L 17.8 -3.7 L 16.5 -6.5 L 15.4 -7.2 L 13.1 -6.6"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["0 8.43","0 9.14 M3.82,-12.43 L3.86,2.14","0 10.95 M3.00,-12.29 L3.00,-6.04M6.93,-12.29 L6.93,-6.04","0 19.00 M1.75,1.11 L16.96,1.11M3.00,-6.00 L18.21,-6.00M11.96,8.25 L15.54,-12.29M4.50,8.25 L8.07,-12.29","0 16.33 M2.36,7.71 Q5.04,7.93 6.04,7.96 Q7.61,8.00 8.36,8.00 Q9.79,8.00 10.46,7.89 Q12.07,7.50 12.50,7.36 Q12.82,7.21 12.96,7.11 Q13.21,6.96 13.39,6.68 Q13.89,5.79 14.04,5.32 Q14.21,4.39 14.21,3.79 Q14.25,2.25 14.14,1.61 Q13.79,0.32 13.57,-0.11 Q13.25,-0.68 12.82,-0.93 Q11.68,-1.43 10.96,-1.68 Q5.39,-2.64 5.39,-2.64 Q4.29,-3.11 3.93,-3.36 Q3.43,-3.71 3.21,-4.14 Q2.79,-5.18 2.68,-5.82 Q2.57,-7.32 2.61,-7.96 Q2.71,-9.29 2.82,-9.75 Q3.07,-10.39 3.25,-10.68 Q3.68,-11.18 3.96,-11.36 Q4.75,-11.71 5.07,-11.82 Q5.36,-11.93 5.96,-11.96 Q7.32,-12.11 8.64,-12.07 Q11.96,-11.89 13.93,-11.75M7.57,12.21 L9.25,-15.64","0 24.10 M3.07,-10.86 Q2.64,-9.86 2.50,-9.46 Q2.36,-8.93 2.32,-8.50 Q2.21,-7.43 2.21,-6.89 Q2.18,-5.82 2.25,-5.25 Q2.39,-3.96 2.57,-3.43 Q2.96,-2.39 3.21,-2.07 Q3.61,-1.57 4.04,-1.39 Q5.11,-0.96 5.75,-0.93 Q7.43,-1.07 7.93,-1.18 Q8.46,-1.39 8.71,-1.57 Q9.18,-1.89 9.39,-2.25 Q9.86,-3.25 10.00,-3.64 Q10.14,-4.21 10.18,-4.64 Q10.29,-5.68 10.29,-6.21 Q10.32,-7.25 10.25,-7.86 Q10.07,-9.29 9.89,-9.82 Q9.50,-10.75 9.25,-11.07 Q8.89,-11.54 8.46,-11.71 Q7.14,-12.11 6.75,-12.18 Q6.21,-12.25 6.11,-12.21 Q5.00,-12.11 4.61,-12.00 Q4.04,-11.75 3.82,-11.61 Q3.46,-11.32 3.36,-11.21 ZM6.11,8.25 L20.14,-12.29M19.93,-3.25 Q18.79,-3.11 18.39,-3.00 Q17.89,-2.79 17.64,-2.61 Q17.18,-2.29 16.96,-1.93 Q16.50,-0.86 16.36,-0.46 Q16.25,0.04 16.21,0.46 Q16.07,1.50 16.07,2.04 Q16.04,3.14 16.11,3.71 Q16.25,5.00 16.43,5.54 Q16.86,6.57 17.11,6.93 Q17.57,7.50 18.04,7.68 Q19.29,8.07 19.93,8.07 Q21.46,7.86 21.93,7.75 Q22.43,7.54 22.68,7.32 Q23.14,6.89 23.36,6.50 Q23.82,5.32 23.93,4.86 Q24.04,4.18 24.07,3.71 Q24.11,2.57 24.11,2.04 Q24.11,1.07 24.00,0.46 Q23.54,-1.21 23.39,-1.64 Q23.29,-1.93 23.11,-2.11 Q22.71,-2.61 22.29,-2.79 Q20.96,-3.18 20.57,-3.25 Z","0 21.57 M8.36,-2.39 Q6.82,-2.11 6.25,-1.96 Q5.25,-1.68 4.89,-1.54 Q4.43,-1.36 4.18,-1.07 Q3.57,-0.25 3.39,0.18 Q3.11,0.89 3.04,1.46 Q2.93,2.89 2.96,3.54 Q3.07,4.79 3.21,5.29 Q3.64,6.29 3.86,6.61 Q4.07,7.00 4.54,7.21 Q6.07,7.75 6.61,7.86 Q7.29,7.93 7.68,7.93 Q8.54,7.93 8.96,7.93 Q9.64,7.96 10.18,7.86 Q11.64,7.54 12.25,7.32 Q13.43,6.79 13.89,6.46 Q14.64,5.86 15.00,5.50 Q15.75,4.71 16.11,4.29M16.21,-7.32 Q16.11,5.50 16.11,5.50 Q16.25,6.21 16.32,6.46 Q16.46,6.79 16.57,6.93 Q16.68,7.18 16.89,7.32 Q17.50,7.68 17.82,7.79 Q18.32,7.86 18.71,7.89 Q19.75,7.93 20.21,7.89 Q21.11,7.82 21.54,7.79M15.21,-11.82 Q12.93,-11.96 12.00,-12.00 Q10.36,-12.00 9.64,-12.00 Q8.64,-11.96 8.04,-11.89 Q6.68,-11.75 6.11,-11.57 Q4.96,-11.07 4.61,-10.82 Q4.25,-10.50 4.07,-10.11 Q3.68,-9.07 3.61,-8.46 Q3.50,-7.18 3.54,-6.54 Q3.75,-5.11 3.89,-4.64 Q4.18,-4.04 4.39,-3.79 Q4.71,-3.39 5.11,-3.21 Q6.21,-2.86 6.75,-2.71 Q7.82,-2.50 8.36,-2.39 L20.71,-2.39","0 7.81 M3.00,-12.29 L3.00,-6.04","0 11.48 M9.29,-14.89 Q7.96,-14.14 7.39,-13.75 Q6.39,-12.96 5.96,-12.50 Q5.04,-11.39 4.71,-10.89 Q4.25,-10.07 4.04,-9.57 Q3.64,-8.61 3.46,-8.00 Q3.11,-6.64 2.96,-5.89 Q2.71,-4.36 2.64,-3.57 Q2.57,-1.93 2.57,-1.11 Q2.57,0.64 2.64,1.43 Q2.79,3.00 2.93,3.71 Q3.25,5.18 3.43,5.79 Q3.82,6.93 4.04,7.39 Q4.46,8.29 4.68,8.64 Q4.96,9.18 5.21,9.50 Q5.82,10.21 6.11,10.50 Q6.64,11.04 6.93,11.29 Q7.43,11.71 7.82,11.96 Q8.75,12.50 9.29,12.79","0 11.48 M1.32,-14.89 Q2.61,-14.18 3.14,-13.82 Q4.18,-13.00 4.50,-12.68 Q4.93,-12.18 5.14,-11.89 Q5.64,-11.25 5.86,-10.86 Q6.29,-10.14 6.50,-9.64 Q6.96,-8.61 7.14,-7.96 Q7.50,-6.64 7.64,-5.89 Q7.86,-4.36 7.93,-3.57 Q8.04,-1.93 8.04,-1.11 Q8.00,0.64 7.93,1.43 Q7.79,3.00 7.64,3.71 Q7.32,5.18 7.14,5.79 Q6.79,6.93 6.57,7.39 Q6.18,8.25 5.93,8.64 Q5.39,9.46 5.11,9.82 Q4.54,10.46 4.25,10.75 Q3.89,11.14 3.39,11.50 Q2.11,12.29 1.32,12.79","0 13.76 M3.93,-3.61 Q6.11,-6.68 6.57,-7.36 Q6.68,-6.86 6.71,-7.68 Q6.75,-10.39 6.75,-12.29M7.61,-7.79 L11.32,-8.96M6.68,-7.61 L9.54,-3.57","0 16.14 M1.93,-0.61 L14.50,-0.61M8.21,-6.57 L8.21,5.36","0 8.07 M2.93,11.75 Q3.25,9.64 3.32,9.04 Q3.36,8.68 3.36,8.07 Q3.29,6.46 3.25,5.46","0 14.29 M2.43,0.75 L11.68,0.75","0 8.05 M2.93,8.25 L3.46,5.46","0 14.90 M1.61,10.07 L13.29,-12.29","0 17.02 M8.39,-12.07 Q6.82,-11.86 6.29,-11.64 Q5.46,-11.29 5.07,-10.89 Q4.21,-9.86 3.93,-9.25 Q3.46,-7.93 3.32,-7.29 Q3.07,-6.11 3.00,-5.43 Q2.89,-3.93 2.86,-3.18 Q2.82,-1.57 2.86,-0.82 Q2.93,0.71 3.00,1.39 Q3.18,2.64 3.32,3.29 Q3.64,4.68 3.93,5.25 Q4.57,6.32 4.96,6.71 Q5.71,7.39 6.29,7.61 Q7.64,8.00 8.36,8.04 Q9.96,7.96 10.57,7.82 Q11.61,7.43 12.07,7.11 Q13.00,6.29 13.29,5.86 Q13.71,5.07 13.89,4.50 Q14.25,3.18 14.39,2.39 Q14.61,0.64 14.64,-0.29 Q14.71,-2.32 14.68,-3.18 Q14.61,-4.79 14.54,-5.43 Q14.39,-6.50 14.25,-7.11 Q13.89,-8.54 13.68,-9.07 Q13.25,-10.00 12.89,-10.39 Q12.11,-11.21 11.61,-11.46 Q10.29,-11.89 9.86,-12.00 Q9.39,-12.07 9.14,-12.07 Z","0 12.12 M1.07,-9.71 L6.39,-11.61 L7.18,-11.68 L7.14,8.25","0 16.29 M2.04,-11.36 Q3.57,-11.68 4.32,-11.79 Q5.82,-12.00 6.57,-12.04 Q8.07,-12.07 8.82,-12.04 Q10.43,-11.89 10.96,-11.79 Q11.75,-11.50 12.00,-11.36 Q12.36,-11.18 12.54,-10.96 Q12.93,-10.54 13.07,-10.07 Q13.32,-8.79 13.32,-8.14 Q13.18,-6.86 13.00,-6.25 Q12.54,-5.04 12.21,-4.46 Q11.46,-3.32 11.04,-2.75 Q10.14,-1.61 9.64,-1.00 L2.89,6.79 L2.57,7.71 L14.86,7.68","0 16.17 M1.86,7.61 Q5.32,7.93 6.43,8.00 Q7.79,8.07 8.43,8.04 Q9.79,7.93 10.36,7.79 Q11.46,7.36 11.82,7.14 Q12.32,6.79 12.57,6.43 Q13.11,5.54 13.29,5.00 Q13.54,3.86 13.57,3.21 Q13.57,1.75 13.46,1.18 Q13.21,0.18 13.00,-0.25 Q12.54,-1.04 12.25,-1.32 Q11.68,-1.75 11.29,-1.93 Q10.36,-2.21 9.86,-2.32 Q10.18,-2.89 10.50,-3.14 Q11.39,-3.54 11.75,-3.86 Q12.36,-4.64 12.57,-5.14 Q12.89,-6.32 12.96,-6.86 Q13.07,-7.93 13.00,-8.46 Q12.79,-9.61 12.64,-10.00 Q12.32,-10.64 12.11,-10.89 Q11.79,-11.29 11.32,-11.46 Q9.82,-11.86 9.29,-11.96 Q8.36,-12.07 8.00,-12.07 Q6.86,-12.07 6.11,-12.04 Q4.18,-11.93 3.50,-11.86 Q2.50,-11.75 2.14,-11.68M4.32,-2.57 L9.82,-2.64","0 17.29 M8.71,-12.29 Q2.18,0.32 2.18,0.32 Q2.11,0.54 2.11,0.71 Q2.14,1.21 2.21,1.39 Q2.36,1.64 2.50,1.75 Q2.82,1.96 3.04,2.04 L13.82,2.11 L16.29,2.04M13.21,8.25 L13.36,-8.39","0 15.60 M1.96,7.32 Q3.86,7.71 4.71,7.82 Q6.36,8.00 7.00,8.04 Q7.93,8.07 8.54,8.00 Q10.07,7.71 10.61,7.54 Q11.32,7.18 11.64,6.89 Q12.29,6.29 12.54,5.75 Q13.00,4.32 13.11,3.64 Q13.21,2.36 13.18,1.71 Q13.04,0.39 12.93,-0.11 Q12.68,-0.89 12.50,-1.21 Q12.18,-1.71 11.79,-1.96 Q10.68,-2.64 10.18,-2.82 Q9.32,-3.04 8.86,-3.11 Q8.39,-3.25 7.36,-3.29 Q4.46,-3.36 2.61,-3.39M3.14,-3.39 L3.54,-11.75 L13.14,-11.75","0 16.48 M2.93,-1.11 Q4.25,-2.50 4.89,-3.00 Q6.18,-3.86 6.75,-4.07 Q7.75,-4.32 8.32,-4.36 Q9.64,-4.43 10.29,-4.36 Q11.64,-4.11 12.07,-3.93 Q12.68,-3.61 12.93,-3.36 Q13.39,-2.96 13.57,-2.54 Q14.00,-1.32 14.11,-0.82 Q14.25,-0.07 14.29,0.43 Q14.32,1.64 14.32,2.21 Q14.36,3.29 14.25,3.86 Q14.00,5.14 13.79,5.68 Q13.29,6.64 12.89,7.00 Q12.07,7.57 11.50,7.75 Q9.89,8.00 9.36,8.04 Q8.54,8.07 8.25,8.04 Q7.00,8.00 6.43,7.86 Q5.36,7.50 4.93,7.18 Q4.18,6.36 3.93,6.00 Q3.61,5.36 3.50,5.00 Q3.29,4.39 3.21,3.86 Q3.04,2.86 3.00,1.86 Q2.93,-1.21 2.93,-2.21 Q2.96,-3.39 3.04,-4.18 Q3.18,-6.11 3.32,-6.89 Q3.57,-8.29 3.82,-8.89 Q4.43,-10.07 4.79,-10.50 Q5.46,-11.18 5.96,-11.43 Q7.18,-11.82 7.68,-11.93 Q8.54,-12.04 9.07,-12.07 Q10.18,-12.11 10.93,-12.07 Q12.57,-11.89 13.50,-11.79","0 15.07 M1.39,-11.75 L12.57,-11.75 L13.11,-11.04 L6.43,8.25","0 17.52 M6.18,-2.79 Q5.71,-1.96 5.71,-1.96 Q4.86,-1.68 4.54,-1.50 Q4.04,-1.18 3.82,-0.82 Q3.32,0.21 3.21,0.61 Q3.11,1.14 3.07,1.54 Q3.04,2.36 3.04,2.89 Q3.07,4.21 3.18,4.75 Q3.50,5.79 3.68,6.14 Q3.93,6.64 4.29,6.89 Q5.14,7.39 5.71,7.57 Q7.07,7.82 7.64,7.89 Q8.57,7.93 9.07,7.93 Q10.00,7.96 10.57,7.89 Q11.96,7.68 12.46,7.57 Q13.21,7.32 13.50,7.14 Q13.96,6.89 14.18,6.57 Q14.71,5.71 14.86,5.29 Q15.04,4.46 15.07,4.07 Q15.14,3.36 15.14,2.93 Q15.14,2.07 15.07,1.54 Q14.71,0.04 14.61,-0.36 Q14.43,-0.71 14.32,-0.86 Q14.14,-1.14 13.93,-1.29 Q13.36,-1.68 13.04,-1.79 Q12.39,-1.96 12.07,-2.04 L11.79,-2.71M10.61,-2.39 Q12.18,-2.75 12.71,-2.93 Q13.46,-3.25 13.71,-3.50 Q14.14,-3.89 14.32,-4.39 Q14.64,-5.93 14.71,-6.46 Q14.75,-7.21 14.71,-7.71 Q14.57,-8.96 14.43,-9.43 Q14.04,-10.29 13.86,-10.57 Q13.71,-10.89 13.39,-11.07 Q12.61,-11.57 12.00,-11.71 Q10.57,-11.93 9.79,-12.00 Q8.86,-12.04 8.39,-12.00 Q7.61,-11.96 7.07,-11.86 Q5.64,-11.50 5.21,-11.32 Q4.68,-11.04 4.43,-10.71 Q3.89,-9.86 3.71,-9.36 Q3.50,-8.18 3.46,-7.71 Q3.39,-7.00 3.46,-6.46 Q3.68,-4.89 3.86,-4.39 Q4.21,-3.75 4.43,-3.54 Q4.89,-3.18 5.18,-3.04 Q5.54,-2.89 6.14,-2.79 Q8.04,-2.50 8.79,-2.43 Z","0 16.50 M3.04,7.79 Q5.00,8.00 5.79,8.04 Q7.00,8.04 7.68,8.00 Q9.25,7.89 9.86,7.75 Q10.82,7.43 11.25,7.14 Q12.07,6.43 12.39,6.00 Q12.96,4.86 13.14,4.46 Q13.32,4.00 13.39,3.57 Q13.54,2.68 13.61,2.00 Q13.79,0.14 13.82,-0.50 Q13.86,-1.04 13.86,-1.89 Q13.82,-4.68 13.79,-5.57 Q13.75,-6.64 13.64,-7.29 Q13.36,-8.93 13.21,-9.43 Q13.04,-10.00 12.82,-10.29 Q12.43,-10.89 12.04,-11.14 Q11.07,-11.71 10.54,-11.86 Q9.29,-12.04 8.79,-12.07 Q7.89,-12.11 7.54,-12.07 Q5.96,-11.89 5.39,-11.71 Q4.46,-11.29 4.07,-10.93 Q3.36,-10.00 3.14,-9.57 Q2.86,-8.71 2.75,-8.32 Q2.61,-7.61 2.57,-7.18 Q2.50,-6.21 2.50,-5.75 Q2.50,-4.89 2.57,-4.36 Q2.75,-3.07 2.93,-2.54 Q3.43,-1.50 3.64,-1.14 Q3.96,-0.68 4.32,-0.46 Q5.39,0.07 5.86,0.21 Q6.68,0.36 7.18,0.36 Q8.32,0.39 8.89,0.29 Q10.11,0.00 10.61,-0.21 Q11.36,-0.57 11.89,-1.04 Q13.14,-2.21 13.86,-2.93","0 8.10 M2.93,-4.64 L3.50,-1.82M2.93,5.46 L3.50,8.25","0 8.14 M2.96,11.75 Q3.25,9.71 3.32,9.11 Q3.39,8.68 3.39,8.07 Q3.36,6.46 3.29,5.46","0 15.81 M13.64,-5.93 L2.39,-0.82 L2.39,-0.32 L13.64,4.68","0 17.00 M2.46,-3.54 L15.04,-3.54M2.46,2.75 L15.04,2.75","0 15.81 M2.39,-5.93 L13.61,-0.82 L13.61,-0.32 L2.39,4.68","0 15.05 M1.46,-11.93 Q2.21,-12.07 3.04,-12.14 Q5.39,-12.32 6.32,-12.36 Q7.89,-12.43 8.61,-12.36 Q10.07,-12.07 10.61,-11.89 Q11.43,-11.46 11.71,-11.21 Q12.14,-10.89 12.32,-10.46 Q12.79,-9.25 12.82,-8.68 Q12.79,-7.46 12.64,-6.96 Q12.29,-6.11 12.07,-5.75 Q11.96,-5.50 11.46,-4.93 Q9.54,-3.04 8.96,-2.36 Q8.29,-1.39 8.04,-0.89 Q7.61,0.14 7.50,0.64 Q7.36,1.64 7.32,2.14","0 19.64 M17.82,-2.82 Q9.75,-2.68 9.75,-2.68 Q9.14,-2.57 8.93,-2.46 Q8.57,-2.32 8.39,-2.14 Q7.96,-1.75 7.82,-1.46 Q7.61,-1.00 7.57,-0.50 Q7.50,1.00 7.54,1.46 Q7.61,2.07 7.71,2.36 Q8.04,2.96 8.25,3.21 Q8.68,3.61 9.11,3.75 Q10.21,4.00 10.79,4.04 Q12.04,3.93 12.50,3.86 Q13.07,3.75 13.50,3.61 Q14.46,3.29 15.04,3.00 Q16.39,2.25 16.86,1.96 Q17.57,1.43 17.82,1.21M17.96,4.39 Q17.82,-5.32 17.82,-5.32 Q17.79,-5.96 17.68,-6.29 Q17.43,-6.89 17.25,-7.14 Q16.82,-7.61 16.54,-7.79 Q15.86,-8.07 15.57,-8.14 Q15.07,-8.21 14.89,-8.21 Q8.93,-8.21 8.93,-8.21 Q7.93,-8.21 7.36,-8.11 Q5.89,-7.82 5.43,-7.64 Q4.82,-7.36 4.57,-7.11 Q4.11,-6.61 3.93,-6.11 Q3.54,-4.71 3.43,-4.11 Q3.32,-3.68 3.29,-2.50 Q3.29,1.89 3.29,3.04 Q3.29,3.82 3.36,4.36 Q3.57,5.75 3.71,6.29 Q4.11,7.29 4.29,7.57 Q4.39,7.89 4.71,8.11 Q5.79,8.64 6.25,8.82 Q7.00,9.04 7.57,9.11 Q8.86,9.21 9.57,9.21 L18.25,9.14","0 17.48 M1.14,8.25 L8.11,-11.46 L8.64,-11.79 L9.46,-11.79 L9.96,-11.46 L16.93,8.25M3.89,0.50 L14.21,0.50","0 17.62 M3.57,-2.39 Q9.79,-2.39 9.79,-2.39 Q11.89,-2.07 12.57,-1.89 Q13.54,-1.57 13.89,-1.36 Q14.39,-1.00 14.64,-0.64 Q15.18,0.21 15.32,0.71 Q15.50,1.82 15.54,2.32 Q15.64,3.11 15.57,3.64 Q15.36,5.18 15.21,5.64 Q14.96,6.25 14.75,6.50 Q14.36,6.93 14.00,7.14 Q13.21,7.54 12.61,7.68 Q11.18,7.86 10.39,7.93 L4.14,7.82 L3.57,7.79 L3.57,-11.82 Q9.68,-11.96 9.68,-11.96 Q10.50,-11.96 11.04,-11.86 Q12.43,-11.54 12.89,-11.39 Q13.46,-11.14 13.71,-10.93 Q14.14,-10.54 14.36,-10.14 Q14.79,-9.11 14.89,-8.50 Q15.04,-7.11 14.96,-6.43 Q14.68,-4.89 14.50,-4.43 Q14.14,-3.82 13.86,-3.57 Q13.18,-3.14 12.82,-3.00 Q12.11,-2.79 11.71,-2.75 L11.75,-2.04","0 16.40 M15.04,-11.64 Q11.18,-12.04 11.18,-12.04 Q9.82,-12.07 9.18,-12.04 Q7.96,-11.96 7.32,-11.79 Q5.89,-11.25 5.39,-10.89 Q4.57,-10.14 4.29,-9.71 Q3.79,-8.79 3.64,-8.39 Q3.43,-7.79 3.32,-7.32 Q3.07,-6.29 3.00,-5.61 Q2.86,-4.11 2.82,-3.29 Q2.79,-1.57 2.82,-0.75 Q2.93,0.89 3.00,1.57 Q3.18,2.71 3.32,3.29 Q3.64,4.54 3.93,5.07 Q4.57,6.14 5.00,6.54 Q6.07,7.29 6.57,7.50 Q7.68,7.86 8.11,7.93 Q8.64,8.04 9.18,8.04 Q10.54,8.04 11.36,8.00 Q13.46,7.86 14.14,7.79 Q15.14,7.64 15.46,7.57","0 18.71 M3.57,7.79 Q10.29,7.93 10.29,7.93 Q11.39,7.89 12.00,7.75 Q13.32,7.36 13.82,7.07 Q14.71,6.54 15.07,6.07 Q15.82,4.79 16.04,4.32 Q16.21,3.71 16.32,3.25 Q16.57,2.21 16.64,1.54 Q16.79,0.00 16.82,-0.79 Q16.86,-2.46 16.82,-3.25 Q16.71,-4.89 16.64,-5.57 Q16.46,-6.71 16.32,-7.29 Q16.00,-8.50 15.71,-9.04 Q15.14,-10.07 14.71,-10.46 Q13.64,-11.21 13.11,-11.46 Q12.00,-11.79 11.61,-11.86 Q10.96,-11.96 10.75,-11.96 L3.57,-11.82 L3.57,8.29","0 16.17 M3.39,-2.71 L13.50,-2.71M14.75,-11.71 Q6.04,-11.75 6.04,-11.75 Q5.43,-11.68 5.18,-11.61 Q4.82,-11.54 4.61,-11.36 Q3.96,-10.86 3.79,-10.57 Q3.54,-9.93 3.46,-9.71 Q3.39,-9.43 3.39,-9.32 Q3.39,5.11 3.39,5.11 Q3.50,5.82 3.57,6.07 Q3.61,6.32 3.79,6.54 Q4.32,7.14 4.61,7.32 Q5.36,7.61 5.61,7.68 Q5.93,7.71 6.04,7.71 L14.75,7.68","0 15.67 M3.46,-2.54 L13.39,-2.54M3.46,8.25 Q3.50,-9.46 3.50,-9.46 Q3.71,-10.21 3.82,-10.46 Q3.93,-10.71 4.14,-10.89 Q4.71,-11.39 5.04,-11.54 Q5.79,-11.71 6.18,-11.75 L14.61,-11.68","0 17.86 M15.64,-3.64 L15.64,5.04 L15.82,8.25M15.64,4.82 Q14.79,5.57 14.32,5.93 Q13.32,6.71 12.79,7.04 Q11.68,7.57 11.04,7.75 Q9.68,7.96 8.96,8.04 Q7.96,8.04 7.43,7.89 Q6.32,7.57 5.82,7.29 Q4.89,6.64 4.54,6.14 Q3.79,4.71 3.57,4.21 Q3.39,3.61 3.29,3.14 Q3.07,2.07 3.00,1.43 Q2.86,-0.04 2.82,-0.82 Q2.79,-2.46 2.82,-3.25 Q2.96,-4.96 3.04,-5.61 Q3.14,-6.61 3.29,-7.14 Q3.61,-8.32 3.82,-8.82 Q4.29,-9.75 4.64,-10.14 Q5.57,-10.96 6.04,-11.25 Q6.89,-11.64 7.46,-11.79 Q8.71,-12.00 9.39,-12.04 Q10.46,-12.11 11.54,-12.04 Q14.18,-11.82 15.75,-11.64","0 18.71 M3.57,-12.29 L3.57,8.25M16.07,-12.29 L16.07,8.25M3.57,-2.75 L16.07,-2.75","0 8.69 M3.57,-12.29 L3.57,8.25","0 10.81 M1.14,7.79 Q2.71,7.96 3.29,7.93 Q4.29,7.79 4.64,7.64 Q5.29,7.29 5.50,7.07 Q5.86,6.57 6.00,6.25 Q6.18,5.57 6.25,5.21 L6.29,-12.29","0 16.57 M3.50,-2.46 Q6.50,-2.50 7.21,-2.46 Q7.57,-2.29 7.71,-2.18 Q7.96,-1.93 8.04,-1.79 L15.36,8.25M3.54,-12.29 L3.54,8.25M7.39,-2.36 L14.89,-12.29","0 15.12 M3.46,-12.29 Q3.46,5.11 3.46,5.11 Q3.64,5.96 3.71,6.21 Q3.89,6.54 4.00,6.68 Q4.21,6.96 4.43,7.11 Q5.14,7.50 5.36,7.61 Q5.68,7.68 5.79,7.68 L14.36,7.64","0 23.48 M3.11,8.25 L4.00,-12.25M4.00,-11.75 L5.25,-11.75 L5.79,-11.43 L11.89,5.50 L12.43,5.82 L13.14,5.82 L13.68,5.50 L19.79,-11.43 L20.32,-11.75 L21.00,-11.75 L21.57,-11.25 L22.46,8.25","0 19.48 M3.54,-12.25 L3.57,8.25M17.04,-12.29 L17.04,7.68M3.54,-11.71 L4.82,-11.71 L5.29,-11.43 L15.21,7.39 L15.71,7.68 L17.64,7.68","0 18.81 M4.29,-9.71 Q3.79,-8.79 3.64,-8.39 Q3.43,-7.79 3.32,-7.32 Q3.07,-6.25 3.00,-5.57 Q2.86,-4.04 2.82,-3.25 Q2.79,-1.54 2.82,-0.75 Q2.93,0.86 3.00,1.54 Q3.18,2.71 3.32,3.29 Q3.68,4.57 3.93,5.07 Q4.39,5.96 4.82,6.36 Q6.00,7.25 6.54,7.50 Q7.61,7.86 8.07,7.93 Q8.79,8.00 9.21,8.04 Q10.04,8.07 10.57,8.04 Q11.89,7.93 12.50,7.75 Q13.71,7.32 14.21,6.96 Q15.14,6.14 15.46,5.71 Q15.96,4.79 16.11,4.39 Q16.32,3.79 16.43,3.32 Q16.64,2.25 16.71,1.57 Q16.86,0.07 16.89,-0.75 Q16.93,-2.46 16.89,-3.29 Q16.79,-4.93 16.71,-5.61 Q16.61,-6.71 16.43,-7.32 Q16.04,-8.71 15.71,-9.29 Q15.04,-10.36 14.54,-10.75 Q13.36,-11.46 12.79,-11.68 Q11.68,-11.93 11.21,-12.00 Q10.43,-12.07 10.11,-12.07 Q8.68,-12.04 8.07,-11.93 Q7.04,-11.79 6.54,-11.54 Q5.29,-10.75 4.96,-10.54 Q4.71,-10.29 4.61,-10.14 Z","0 16.88 M3.57,-0.89 Q10.39,-0.82 10.39,-0.82 Q11.71,-0.96 12.25,-1.11 Q13.21,-1.46 13.54,-1.68 Q14.00,-1.96 14.21,-2.32 Q14.68,-3.18 14.82,-3.75 Q15.04,-5.11 15.07,-5.68 Q15.11,-6.54 15.07,-7.11 Q14.96,-8.46 14.82,-9.04 Q14.43,-10.07 14.21,-10.43 Q13.93,-10.86 13.57,-11.07 Q12.64,-11.57 12.11,-11.71 Q10.93,-11.93 10.29,-11.96 L4.14,-11.86 L3.57,-11.82 L3.57,8.25","0 18.81 M4.29,-9.71 Q3.79,-8.82 3.64,-8.43 Q3.43,-7.82 3.32,-7.36 Q3.11,-6.29 3.04,-5.61 Q2.89,-4.11 2.86,-3.29 Q2.82,-1.57 2.86,-0.75 Q2.96,0.89 3.04,1.57 Q3.18,2.71 3.32,3.29 Q3.68,4.57 3.96,5.11 Q4.61,6.18 5.04,6.57 Q6.04,7.29 6.54,7.50 Q7.61,7.86 8.07,7.93 Q8.79,8.00 9.21,8.04 Q10.04,8.07 10.57,8.04 Q11.89,7.93 12.50,7.75 Q13.71,7.32 14.21,6.96 Q15.14,6.14 15.46,5.71 Q15.96,4.79 16.11,4.39 Q16.32,3.79 16.43,3.32 Q16.64,2.25 16.71,1.57 Q16.86,0.07 16.89,-0.75 Q16.93,-2.46 16.89,-3.29 Q16.79,-4.93 16.71,-5.61 Q16.61,-6.71 16.43,-7.32 Q16.04,-8.71 15.71,-9.29 Q15.04,-10.36 14.54,-10.75 Q13.36,-11.46 12.79,-11.68 Q11.68,-11.93 11.21,-12.00 Q10.43,-12.07 10.11,-12.07 Q8.68,-12.04 8.07,-11.93 Q7.07,-11.79 6.54,-11.54 Q5.29,-10.75 4.96,-10.54 Q4.71,-10.29 4.61,-10.14 ZM8.61,10.07 Q10.25,11.00 10.93,11.32 Q12.07,11.82 12.71,12.04 Q14.18,12.43 14.68,12.54 Q15.43,12.68 15.64,12.71","0 17.52 M3.57,-1.39 Q10.25,-1.36 10.25,-1.36 Q11.79,-0.79 12.29,-0.46 Q12.96,0.36 13.18,0.64 Q13.46,1.07 13.50,1.25 L15.82,8.25M3.57,8.25 L3.57,-11.82 L5.61,-11.93 Q11.39,-11.86 11.39,-11.86 Q12.64,-11.57 13.07,-11.39 Q13.68,-11.14 13.93,-10.86 Q14.50,-10.07 14.68,-9.68 Q14.89,-8.86 14.96,-8.46 Q15.04,-7.75 15.07,-7.36 Q15.11,-6.57 15.07,-6.04 Q14.93,-4.68 14.82,-4.21 Q14.54,-3.54 14.39,-3.25 Q14.18,-2.82 13.89,-2.61 Q13.04,-2.07 12.64,-1.93 Q11.96,-1.71 11.64,-1.68M11.39,-0.89 L11.64,-1.68","0 16.24 M2.29,7.71 Q5.82,7.96 7.00,8.00 Q8.61,8.04 9.39,8.00 Q11.04,7.86 11.61,7.71 Q12.57,7.32 12.89,7.07 Q13.39,6.68 13.57,6.29 Q13.93,5.39 14.04,4.79 Q14.18,3.25 14.14,2.61 Q14.00,1.36 13.89,0.89 Q13.68,0.18 13.46,-0.14 Q13.11,-0.71 12.68,-0.96 Q12.04,-1.39 10.86,-1.68 Q6.75,-2.36 5.68,-2.57 Q4.79,-2.82 4.43,-3.00 Q3.75,-3.39 3.50,-3.68 Q3.11,-4.11 2.93,-4.64 Q2.54,-6.07 2.50,-6.79 Q2.54,-8.43 2.61,-9.00 Q2.75,-9.82 2.89,-10.14 Q3.25,-10.75 3.43,-10.96 Q3.64,-11.21 3.89,-11.36 Q4.68,-11.71 5.00,-11.82 Q5.50,-11.93 5.89,-11.96 Q6.82,-12.04 7.39,-12.04 Q8.21,-12.04 9.29,-12.00 Q12.07,-11.86 13.82,-11.75","0 16.52 M0.79,-11.75 L16.11,-11.75M8.43,-11.75 L8.43,8.25","0 18.88 M3.39,-12.29 Q3.43,1.50 3.43,1.50 Q3.50,2.46 3.57,3.00 Q3.75,4.07 3.96,4.64 Q4.57,5.93 4.89,6.36 Q5.36,6.89 5.82,7.14 Q7.00,7.68 7.64,7.82 Q9.04,8.04 9.75,8.04 Q11.29,8.04 11.96,7.89 Q13.36,7.46 13.82,7.25 Q14.43,6.93 14.75,6.61 Q15.46,5.71 15.68,5.25 Q16.00,4.29 16.11,3.82 Q16.32,2.86 16.36,2.36 L16.43,-12.29","0 17.19 M1.36,-12.29 L7.93,7.39 L8.46,7.75 L9.29,7.75 L9.82,7.43 L16.39,-12.29","0 25.26 M1.61,-12.29 L6.57,7.39 L7.11,7.75 L7.93,7.75 L8.46,7.36 L13.04,-11.43 L13.57,-11.79 L14.25,-11.79 L14.75,-11.43 L19.36,7.36 L19.89,7.75 L20.68,7.75 L21.25,7.39 L26.18,-12.29","0 17.24 M1.75,8.25 L7.89,-2.18 L7.86,-2.71 L2.11,-12.29M9.64,-2.32 L15.68,-12.29M7.89,-2.46 Q9.04,-2.50 9.36,-2.46 Q9.79,-2.29 9.89,-2.18 L16.04,8.25","0 16.05 M1.25,-12.29 L7.57,-0.32 L8.50,0.07 L15.04,-12.29M8.14,-0.07 L8.14,8.25","0 16.33 M1.64,-11.75 L14.32,-11.75 L14.11,-10.89 L2.39,6.86 L2.21,7.71 L15.18,7.71","0 10.52 M8.00,-14.14 L4.14,-14.11 L3.68,-13.54 L3.64,12.11 L4.29,12.64 L8.00,12.71","0 14.90 M1.61,-12.29 L13.29,10.07","0 10.52 M1.43,-14.14 Q4.43,-14.18 5.14,-14.11 Q5.75,-13.93 5.68,-13.79 L5.75,12.11 L5.32,12.64 L1.43,12.71","0 12.55 M1.18,-2.89 L5.71,-8.54 L6.25,-8.54 L10.79,-2.89","0 16.95 M2.29,8.75 L15.14,8.75","0 9.83 M1.71,-12.50 L6.43,-8.32","0 15.88 M2.50,-5.39 Q6.71,-5.79 7.93,-5.86 Q9.25,-5.96 9.82,-5.89 Q11.00,-5.64 11.39,-5.46 Q12.00,-5.04 12.21,-4.79 Q12.57,-4.21 12.68,-3.86 Q12.86,-3.11 12.89,-2.71 L12.89,4.61 L13.07,8.25M12.89,0.00 Q5.25,0.07 5.25,0.07 Q4.29,0.21 3.93,0.36 Q3.29,0.75 3.07,1.00 Q2.71,1.57 2.61,1.86 Q2.50,2.29 2.46,2.79 Q2.43,4.39 2.46,4.93 Q2.54,5.64 2.64,5.96 Q2.89,6.57 3.07,6.82 Q3.43,7.25 3.79,7.43 Q4.71,7.79 5.18,7.86 Q6.11,7.93 6.64,7.86 Q7.93,7.57 8.39,7.43 Q9.00,7.25 9.43,7.04 Q10.46,6.46 10.93,6.18 Q11.89,5.50 12.21,5.25 Q12.71,4.79 12.89,4.61","0 16.36 M3.21,-2.64 Q4.04,-3.36 4.50,-3.68 Q5.36,-4.36 5.89,-4.68 Q7.04,-5.36 7.61,-5.57 Q8.71,-5.86 9.29,-5.89 Q10.46,-5.86 11.00,-5.71 Q12.04,-5.32 12.43,-5.00 Q13.14,-4.18 13.36,-3.75 Q13.64,-2.93 13.75,-2.54 Q13.89,-1.79 13.96,-1.32 Q14.04,-0.29 14.07,0.25 Q14.11,1.39 14.07,1.93 Q14.04,2.93 13.93,3.50 Q13.64,4.93 13.46,5.43 Q13.18,6.11 12.89,6.46 Q12.14,7.21 11.68,7.46 Q10.71,7.86 10.14,7.96 Q8.96,8.04 8.32,8.04 Q7.21,8.00 6.57,7.93 Q5.07,7.68 4.50,7.57 Q3.57,7.36 3.21,7.25 L3.21,-2.61 L3.14,-3.50 L3.21,-12.57","0 14.45 M12.64,-5.46 Q9.79,-5.89 9.79,-5.89 Q8.61,-5.93 8.04,-5.89 Q6.86,-5.79 6.29,-5.64 Q5.11,-5.25 4.68,-5.00 Q4.07,-4.61 3.79,-4.18 Q3.14,-3.07 2.96,-2.50 Q2.75,-1.25 2.68,-0.64 Q2.57,0.50 2.57,1.07 Q2.61,2.18 2.68,2.82 Q2.86,4.36 3.07,4.96 Q3.57,6.11 3.93,6.54 Q4.64,7.18 5.14,7.43 Q6.46,7.82 6.93,7.93 Q7.50,8.04 8.00,8.04 Q9.25,8.04 9.93,8.00 Q11.54,7.86 12.04,7.79 Q12.75,7.64 12.96,7.61","0 16.43 M13.50,-12.57 L13.54,-5.00 L13.50,-4.11 L13.50,4.93 L13.64,8.25M13.50,5.00 Q11.68,6.39 11.00,6.82 Q9.93,7.46 9.46,7.64 Q8.46,7.93 8.11,8.00 Q7.54,8.07 7.29,8.07 Q6.07,8.00 5.57,7.86 Q4.64,7.43 4.32,7.18 Q3.79,6.71 3.57,6.29 Q3.11,5.11 2.96,4.64 Q2.82,3.93 2.75,3.46 Q2.68,2.43 2.64,1.89 Q2.61,0.75 2.64,0.21 Q2.64,-0.75 2.75,-1.36 Q3.00,-2.79 3.18,-3.32 Q3.61,-4.25 3.89,-4.61 Q4.50,-5.18 4.93,-5.39 Q6.04,-5.79 6.57,-5.86 Q7.71,-5.89 8.18,-5.86 Q8.82,-5.79 9.25,-5.71 Q10.14,-5.50 10.64,-5.36 Q11.71,-5.04 12.18,-4.86 Q13.07,-4.54 13.50,-4.36","0 15.62 M2.57,1.18 Q10.89,1.18 10.89,1.18 Q11.54,1.11 11.79,1.04 Q12.18,0.86 12.32,0.75 Q12.54,0.64 12.68,0.43 Q13.11,-0.07 13.21,-0.54 Q13.39,-1.86 13.36,-2.39 Q13.18,-3.43 13.04,-3.79 Q12.82,-4.32 12.50,-4.61 Q11.64,-5.25 11.21,-5.46 Q10.25,-5.71 9.86,-5.79 Q9.11,-5.89 8.79,-5.89 Q7.54,-5.89 6.93,-5.82 Q5.64,-5.54 5.21,-5.36 Q4.57,-5.11 4.25,-4.79 Q3.54,-3.93 3.29,-3.50 Q2.96,-2.57 2.86,-2.14 Q2.71,-1.29 2.68,-0.89 Q2.57,-0.18 2.57,0.29 Q2.54,1.29 2.57,1.86 Q2.64,3.18 2.79,3.82 Q3.18,5.25 3.46,5.79 Q4.11,6.71 4.54,7.04 Q5.46,7.54 5.93,7.71 Q6.82,7.93 7.32,8.00 Q8.29,8.04 8.89,8.04 Q10.43,8.00 11.07,7.96 Q12.36,7.82 12.79,7.75 Q13.39,7.68 13.57,7.61","0 11.60 M0.96,-5.50 L9.89,-5.57M4.18,8.25 Q4.21,-9.82 4.21,-9.82 Q4.36,-10.64 4.50,-10.96 Q4.82,-11.54 5.07,-11.75 Q5.57,-12.14 5.96,-12.25 Q6.57,-12.46 7.43,-12.50 Q9.68,-12.46 11.07,-12.43","0 16.05 M4.50,1.36 Q3.71,2.32 3.50,2.68 Q3.29,3.29 3.25,3.50 Q3.21,3.89 3.25,4.07 Q3.29,4.36 3.36,4.54 Q3.57,4.93 3.68,5.07 Q3.79,5.25 4.04,5.39 Q4.75,5.71 5.21,5.89 Q11.68,7.04 11.68,7.04 Q12.46,7.29 12.71,7.39 Q13.04,7.61 13.18,7.71 Q13.43,7.86 13.54,8.07 Q13.82,8.54 13.89,9.00 Q14.04,10.32 14.00,10.79 Q13.93,11.43 13.79,11.75 Q13.43,12.46 13.21,12.71 Q12.86,13.11 12.43,13.29 Q11.25,13.64 10.71,13.75 Q9.68,13.86 9.18,13.89 Q7.71,13.93 7.11,13.89 Q6.11,13.89 5.50,13.75 Q3.89,13.32 3.43,13.11 Q2.93,12.71 2.75,12.43 Q2.39,11.86 2.29,11.39 Q2.14,10.32 2.18,9.75 Q2.39,8.46 2.57,8.04 Q3.04,7.39 3.18,7.21 Q3.18,7.18 3.50,6.96 Q4.50,6.32 5.18,5.89M11.14,-5.61 Q11.89,-5.14 12.14,-4.89 Q12.54,-4.54 12.71,-4.21 Q13.11,-3.43 13.18,-2.89 Q13.25,-1.57 13.18,-1.04 Q12.89,-0.04 12.68,0.32 Q12.39,0.82 11.96,1.07 Q10.82,1.64 10.14,1.79 Q8.75,1.96 8.00,1.96 Q6.50,1.93 5.86,1.79 Q4.64,1.43 4.21,1.21 Q3.61,0.71 3.39,0.43 Q3.04,-0.11 2.93,-0.57 Q2.71,-1.79 2.75,-2.32 Q2.89,-3.36 3.04,-3.75 Q3.43,-4.43 3.64,-4.68 Q4.04,-5.07 4.39,-5.25 Q5.25,-5.64 5.86,-5.75 Q7.29,-5.93 8.00,-5.93 Q9.71,-5.82 10.14,-5.79 Q9.75,-5.64 10.64,-5.64 Q13.50,-5.68 15.46,-5.71","0 16.62 M3.25,-2.75 Q5.54,-4.25 6.39,-4.71 Q7.79,-5.39 8.36,-5.57 Q9.32,-5.86 9.89,-5.89 Q11.39,-5.82 11.86,-5.71 Q12.54,-5.43 12.79,-5.21 Q13.25,-4.86 13.43,-4.43 Q13.71,-3.36 13.82,-2.71 L13.82,8.25M3.29,8.25 L3.29,-2.64 L3.21,-3.57 L3.29,-12.57","0 8.40 M2.93,-9.36 L3.82,-12.04M3.39,-6.11 L3.39,8.25","0 8.43 M1.50,14.18 Q2.25,13.25 2.54,12.71 Q3.04,11.39 3.18,11.00 Q3.32,10.50 3.32,10.36 L3.39,-6.11M2.96,-9.36 L3.82,-12.04","0 14.48 M3.21,0.07 L6.14,0.07 L6.71,-0.29 L12.29,-6.11M3.29,8.25 L3.29,-12.57M6.32,-0.04 L12.75,8.25","0 9.60 M3.29,-12.57 Q3.32,5.39 3.32,5.39 Q3.50,6.29 3.57,6.54 Q3.71,6.86 3.82,7.00 Q4.11,7.29 4.25,7.39 Q4.43,7.57 4.71,7.64 Q5.32,7.86 5.86,7.89 Q7.11,7.86 7.86,7.79","0 23.93 M3.18,-6.11 L3.29,8.25M3.29,-2.71 Q5.36,-4.29 6.14,-4.75 Q7.36,-5.39 7.89,-5.57 Q8.79,-5.82 9.25,-5.86 Q10.32,-5.89 10.71,-5.82 Q11.43,-5.61 11.64,-5.50 Q11.93,-5.36 12.07,-5.25 Q12.29,-5.11 12.46,-4.82 Q12.93,-3.86 13.04,-3.46 Q13.14,-2.79 13.14,-2.46 L13.14,8.25M13.11,-2.71 Q15.21,-4.25 15.96,-4.71 Q17.18,-5.39 17.71,-5.57 Q18.64,-5.82 19.11,-5.86 Q20.14,-5.89 20.54,-5.82 Q21.21,-5.68 21.50,-5.50 Q22.11,-5.07 22.32,-4.82 Q22.64,-4.32 22.75,-3.96 Q22.93,-3.14 22.96,-2.64 L23.00,8.25","0 16.64 M3.18,-6.11 Q3.21,-4.14 3.21,-3.57 Q3.25,-2.82 3.29,-2.64 L3.29,8.25M3.29,-2.75 Q5.57,-4.29 6.43,-4.75 Q7.79,-5.39 8.36,-5.57 Q9.32,-5.86 9.89,-5.89 Q11.39,-5.82 11.89,-5.71 Q12.57,-5.43 12.82,-5.21 Q13.25,-4.89 13.43,-4.46 Q13.75,-3.39 13.86,-2.71 L13.86,8.25","0 16.38 M3.86,-4.32 Q3.14,-2.96 2.96,-2.46 Q2.82,-1.86 2.75,-1.39 Q2.64,-0.29 2.61,0.25 Q2.57,1.39 2.61,1.93 Q2.64,3.00 2.75,3.54 Q3.04,4.79 3.18,5.25 Q3.43,5.96 3.71,6.32 Q4.39,7.07 4.82,7.32 Q5.75,7.79 6.32,7.89 Q7.68,8.07 8.36,8.07 Q9.82,8.00 10.39,7.89 Q11.46,7.57 11.89,7.32 Q12.68,6.79 13.00,6.32 Q13.61,4.96 13.79,4.46 Q13.93,3.79 14.00,3.36 Q14.07,2.46 14.11,1.93 Q14.14,0.79 14.11,0.25 Q14.07,-0.79 13.96,-1.36 Q13.75,-2.57 13.54,-3.11 Q13.00,-4.18 12.64,-4.57 Q11.89,-5.21 11.36,-5.43 Q9.93,-5.79 9.43,-5.86 Q8.64,-5.93 8.36,-5.89 Q6.93,-5.86 6.32,-5.71 Q5.07,-5.25 4.71,-5.07 Q4.36,-4.86 4.21,-4.71 Z","0 16.48 M3.18,-6.11 L3.29,6.21 L3.25,7.04 L3.29,14.43M3.29,6.43 Q4.54,6.93 5.00,7.11 Q5.68,7.36 6.11,7.46 Q6.96,7.75 7.57,7.86 Q9.07,8.07 9.71,8.07 Q10.93,7.89 11.36,7.79 Q12.00,7.54 12.29,7.36 Q12.79,7.00 13.04,6.64 Q13.61,5.54 13.75,5.14 Q13.89,4.61 13.96,4.21 Q14.14,3.29 14.18,2.75 Q14.21,1.61 14.21,1.07 Q14.21,-0.04 14.18,-0.54 Q14.11,-1.39 13.96,-1.96 Q13.54,-3.54 13.32,-4.00 Q12.96,-4.61 12.68,-4.86 Q12.00,-5.43 11.50,-5.61 Q10.39,-5.82 9.75,-5.89 Q8.29,-5.71 7.71,-5.57 Q6.75,-5.18 6.36,-4.96 Q5.89,-4.75 5.39,-4.36 Q4.07,-3.32 3.29,-2.68","0 16.38 M13.46,14.43 L13.54,5.89 L13.50,4.96 Q13.50,-5.11 13.50,-5.11 Q12.50,-5.39 11.79,-5.50 Q10.00,-5.75 9.32,-5.82 Q8.11,-5.89 7.61,-5.89 Q6.04,-5.68 5.50,-5.50 Q4.64,-5.14 4.29,-4.82 Q3.57,-3.96 3.36,-3.57 Q3.04,-2.79 2.93,-2.39 Q2.82,-1.79 2.75,-1.32 Q2.64,-0.21 2.61,0.32 Q2.57,1.43 2.61,1.96 Q2.64,2.89 2.71,3.46 Q2.93,4.79 3.14,5.36 Q3.64,6.43 3.89,6.79 Q4.25,7.21 4.61,7.43 Q5.54,7.89 6.07,8.00 Q7.36,8.07 7.89,8.00 Q8.89,7.79 9.29,7.64 Q9.50,7.64 10.21,7.21 Q12.21,5.96 13.50,5.11","0 12.24 M3.14,-6.11 L3.29,8.25M3.29,-2.82 Q5.50,-4.29 6.36,-4.75 Q7.93,-5.43 8.39,-5.61 Q8.75,-5.75 9.14,-5.79 Q10.14,-5.86 10.79,-5.89","0 14.93 M2.14,7.79 Q5.00,8.00 6.00,8.04 Q7.61,8.04 8.21,8.00 Q9.18,7.96 9.68,7.89 Q10.86,7.64 11.18,7.54 Q11.39,7.43 11.54,7.32 Q11.86,7.14 12.00,6.93 Q12.32,6.54 12.43,6.04 Q12.57,4.36 12.54,3.82 Q12.32,3.07 12.21,2.82 Q12.00,2.46 11.79,2.29 Q11.25,1.82 10.93,1.68 Q11.04,1.57 9.96,1.39 Q5.64,0.79 4.57,0.57 Q3.75,0.25 3.50,0.11 Q3.21,-0.07 3.07,-0.21 Q2.82,-0.36 2.71,-0.68 Q2.39,-1.68 2.36,-2.21 Q2.43,-3.46 2.46,-3.86 Q2.57,-4.29 2.64,-4.46 Q2.79,-4.79 2.89,-4.93 Q2.96,-5.21 3.32,-5.36 Q4.57,-5.79 5.07,-5.86 Q5.96,-5.89 6.39,-5.89 L12.75,-5.64","0 11.48 M0.96,-5.50 L9.86,-5.57M4.14,-10.54 Q4.14,5.29 4.14,5.29 Q4.21,6.00 4.29,6.25 Q4.39,6.57 4.50,6.71 Q4.71,7.07 4.86,7.21 Q5.00,7.39 5.25,7.50 Q5.79,7.79 6.29,7.86 Q7.75,7.89 8.29,7.89 Q9.21,7.82 9.61,7.79","0 16.40 M3.18,-6.11 Q3.21,5.36 3.21,5.36 Q3.39,6.14 3.50,6.39 Q3.61,6.71 3.79,6.93 Q4.18,7.39 4.54,7.57 Q5.36,7.96 5.93,8.04 Q7.36,8.00 7.93,7.93 Q8.89,7.68 9.32,7.50 Q10.04,7.18 10.46,6.93 Q11.39,6.36 11.89,6.04 Q12.93,5.32 13.46,4.96M13.46,-6.11 Q13.46,4.86 13.46,4.86 Q13.50,5.21 13.54,5.79 Q13.54,7.29 13.57,8.25","0 15.21 M1.43,-6.11 Q7.07,7.71 7.07,7.71 Q7.64,7.79 7.86,7.75 Q8.18,7.61 8.32,7.50 L13.82,-6.11","0 22.40 M1.57,-6.11 Q6.14,7.54 6.14,7.54 Q6.32,7.75 6.64,7.79 Q7.46,7.82 8.00,7.79M7.43,7.79 L11.46,-5.36 L11.96,-5.64 L12.79,-5.36 L16.75,7.50 L17.21,7.79 L18.57,7.79M18.00,7.79 L22.68,-6.11","0 15.17 M1.68,8.25 Q6.75,1.04 6.75,1.04 Q7.00,0.79 7.21,0.75 Q7.75,0.71 7.96,0.75 Q8.32,0.93 8.46,1.04 L13.54,8.25M2.04,-6.11 L6.96,0.89M8.21,0.89 L13.18,-6.11","0 15.19 M1.43,-6.11 L7.25,8.25M2.93,14.11 Q4.25,13.61 4.79,13.25 Q5.68,12.46 6.04,12.04 Q6.68,11.14 6.93,10.64 L13.82,-6.11","0 14.95 M1.64,-5.57 L12.57,-5.57 L12.29,-4.71 L2.54,6.89 L2.25,7.75 L13.39,7.75","0 10.21 M7.57,-14.21 Q6.46,-14.14 6.04,-14.04 Q5.32,-13.71 5.11,-13.57 Q4.89,-13.46 4.75,-13.25 Q4.39,-12.71 4.29,-12.36 Q4.11,-11.61 4.07,-11.18 L3.96,-3.43 Q3.68,-2.68 3.68,-2.68 Q3.32,-2.32 3.04,-2.18 Q2.36,-1.89 1.93,-1.79 Q1.93,-1.21 1.93,-1.21 Q2.96,-0.75 3.25,-0.61 Q3.46,-0.50 3.57,-0.39 Q3.86,-0.14 3.96,0.11 Q4.11,0.79 4.18,1.21 Q4.21,9.68 4.21,9.68 Q4.43,10.96 4.57,11.36 Q4.86,11.86 5.07,12.04 Q5.50,12.43 5.93,12.54 Q7.04,12.68 7.71,12.75","0 8.64 M3.54,-15.00 L3.54,13.29","0 10.24 M1.32,12.75 Q2.46,12.68 2.89,12.57 Q3.57,12.32 3.82,12.14 Q4.25,11.82 4.43,11.43 Q4.75,10.36 4.86,9.71 Q4.89,1.00 4.89,1.00 Q4.93,0.50 5.00,0.29 Q5.11,-0.07 5.29,-0.25 Q5.71,-0.61 6.00,-0.79 Q6.71,-1.07 7.11,-1.21 Q7.11,-1.79 7.11,-1.79 Q5.96,-2.21 5.64,-2.39 Q5.32,-2.61 5.21,-2.89 Q5.07,-3.61 5.00,-4.04 Q4.96,-11.14 4.96,-11.14 Q4.86,-12.00 4.75,-12.36 Q4.57,-12.93 4.36,-13.18 Q4.07,-13.64 3.57,-13.82 Q2.25,-14.11 1.43,-14.21","0 15.64 M2.86,1.18 Q2.89,0.43 2.93,0.18 Q3.04,-0.21 3.11,-0.36 Q3.25,-0.61 3.36,-0.71 Q3.64,-1.00 3.82,-1.07 Q4.00,-1.21 4.36,-1.21 Q5.11,-1.25 5.89,-1.00 Q8.14,0.00 9.04,0.29 Q10.71,0.68 11.14,0.75 Q11.43,0.75 11.61,0.71 Q12.04,0.57 12.18,0.46 Q12.43,0.32 12.54,0.18 Q12.71,-0.04 12.79,-0.32 Q12.93,-1.11 12.96,-1.57","0 20.83 M1.89,-4.36 L14.25,-4.36M1.89,-0.29 L12.79,-0.29M17.07,-11.64 Q14.46,-11.96 13.61,-12.04 Q12.29,-12.07 11.82,-12.04 Q10.79,-12.00 10.21,-11.82 Q8.93,-11.43 8.39,-11.07 Q7.43,-10.32 7.04,-9.79 Q6.25,-8.32 6.04,-7.79 Q5.79,-7.00 5.68,-6.50 Q5.46,-5.36 5.39,-4.79 Q5.32,-3.75 5.29,-3.07 Q5.25,-1.39 5.29,-0.71 Q5.39,0.57 5.46,1.11 Q5.57,2.00 5.71,2.57 Q6.04,3.96 6.36,4.61 Q7.07,5.89 7.54,6.36 Q8.54,7.18 9.14,7.46 Q10.75,7.86 11.21,7.96 Q11.50,8.04 11.93,8.04 Q12.96,8.04 13.68,8.00 Q15.57,7.86 16.18,7.79 Q17.04,7.64 17.32,7.57","0 8.07 M2.93,11.68 Q3.21,9.71 3.29,9.11 Q3.36,8.68 3.36,8.07 Q3.29,6.50 3.25,5.50","0 13.57 M-1.68,11.64 Q0.18,11.75 0.86,11.71 Q1.93,11.57 2.32,11.43 Q2.96,11.07 3.18,10.82 Q3.54,10.36 3.68,10.04 Q3.89,9.29 4.00,8.89 Q5.75,-8.93 5.75,-8.93 Q6.07,-10.11 6.25,-10.50 Q6.61,-11.07 6.86,-11.29 Q7.36,-11.68 7.75,-11.79 Q8.54,-12.00 9.21,-12.04 Q10.82,-12.00 11.75,-11.96M1.68,-2.71 L10.54,-2.79",]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["0 8.43","0 9.14 M3.82,-12.43 L3.86,2.14","0 10.95 M3.00,-12.29 L3.00,-6.04M6.93,-12.29 L6.93,-6.04","0 19.00 M1.75,1.11 L16.96,1.11M3.00,-6.00 L18.21,-6.00M11.96,8.25 L15.54,-12.29M4.50,8.25 L8.07,-12.29","0 22.50 M3.57,-12.29 L3.57,7.79 Q10.25,7.93 10.25,7.93 Q11.54,7.82 12.11,7.68 Q13.32,7.25 13.71,7.04 Q14.18,6.79 14.43,6.32 Q15.00,4.79 15.14,4.29 Q15.21,3.64 15.21,3.25 Q15.25,2.43 15.21,1.89 Q15.11,0.54 14.96,0.04 Q14.64,-0.79 14.46,-1.11 Q14.21,-1.57 13.82,-1.82 Q12.54,-2.46 12.04,-2.61 Q11.25,-2.79 10.93,-2.79 L3.57,-2.86M20.82,-12.29 L20.82,8.25","0 16.64 M3.29,-6.11 L3.29,7.75 L15.07,7.75 L15.18,12.50M13.32,-6.11 L13.32,7.75","0 19.33 M3.25,-6.11 Q3.25,7.82 3.25,7.82 Q7.46,7.93 8.71,7.89 Q10.36,7.68 10.79,7.57 Q11.18,7.43 11.32,7.32 Q11.57,7.14 11.68,7.04 Q11.82,6.93 11.96,6.61 Q12.36,5.54 12.43,5.00 Q12.46,3.86 12.43,3.39 Q12.21,2.46 12.14,2.21 Q12.04,1.93 11.93,1.79 Q11.75,1.50 11.54,1.32 Q11.00,0.96 10.61,0.82 Q9.71,0.64 9.21,0.57 L3.25,0.50M17.11,-6.11 L17.11,8.25","0 7.81 M3.00,-12.29 L3.00,-6.04","0 11.48 M9.29,-14.89 Q7.96,-14.14 7.39,-13.75 Q6.39,-12.96 5.96,-12.50 Q5.04,-11.39 4.71,-10.89 Q4.25,-10.07 4.04,-9.57 Q3.64,-8.61 3.46,-8.00 Q3.11,-6.64 2.96,-5.89 Q2.71,-4.36 2.64,-3.57 Q2.57,-1.93 2.57,-1.11 Q2.57,0.64 2.64,1.43 Q2.79,3.00 2.93,3.71 Q3.25,5.18 3.43,5.79 Q3.82,6.93 4.04,7.39 Q4.46,8.29 4.68,8.64 Q4.96,9.18 5.21,9.50 Q5.82,10.21 6.11,10.50 Q6.64,11.04 6.93,11.29 Q7.43,11.71 7.82,11.96 Q8.75,12.50 9.29,12.79","0 11.48 M1.32,-14.89 Q2.61,-14.18 3.14,-13.82 Q4.18,-13.00 4.50,-12.68 Q4.93,-12.18 5.14,-11.89 Q5.64,-11.25 5.86,-10.86 Q6.29,-10.14 6.50,-9.64 Q6.96,-8.61 7.14,-7.96 Q7.50,-6.64 7.64,-5.89 Q7.86,-4.36 7.93,-3.57 Q8.04,-1.93 8.04,-1.11 Q8.00,0.64 7.93,1.43 Q7.79,3.00 7.64,3.71 Q7.32,5.18 7.14,5.79 Q6.79,6.93 6.57,7.39 Q6.18,8.25 5.93,8.64 Q5.39,9.46 5.11,9.82 Q4.54,10.46 4.25,10.75 Q3.89,11.14 3.39,11.50 Q2.11,12.29 1.32,12.79","0 13.76 M3.93,-3.61 Q6.11,-6.68 6.57,-7.36 Q6.68,-6.86 6.71,-7.68 Q6.75,-10.39 6.75,-12.29M7.61,-7.79 L11.32,-8.96M6.68,-7.61 L9.54,-3.57","0 16.14 M1.93,-0.61 L14.50,-0.61M8.21,-6.57 L8.21,5.36","0 8.07 M2.93,11.75 Q3.25,9.64 3.32,9.04 Q3.36,8.68 3.36,8.07 Q3.29,6.46 3.25,5.46","0 14.29 M2.43,0.75 L11.68,0.75","0 8.05 M2.93,8.25 L3.46,5.46","0 14.90 M1.61,10.07 L13.29,-12.29","0 17.02 M8.39,-12.07 Q6.82,-11.86 6.29,-11.64 Q5.46,-11.29 5.07,-10.89 Q4.21,-9.86 3.93,-9.25 Q3.46,-7.93 3.32,-7.29 Q3.07,-6.11 3.00,-5.43 Q2.89,-3.93 2.86,-3.18 Q2.82,-1.57 2.86,-0.82 Q2.93,0.71 3.00,1.39 Q3.18,2.64 3.32,3.29 Q3.64,4.68 3.93,5.25 Q4.57,6.32 4.96,6.71 Q5.71,7.39 6.29,7.61 Q7.64,8.00 8.36,8.04 Q9.96,7.96 10.57,7.82 Q11.61,7.43 12.07,7.11 Q13.00,6.29 13.29,5.86 Q13.71,5.07 13.89,4.50 Q14.25,3.18 14.39,2.39 Q14.61,0.64 14.64,-0.29 Q14.71,-2.32 14.68,-3.18 Q14.61,-4.79 14.54,-5.43 Q14.39,-6.50 14.25,-7.11 Q13.89,-8.54 13.68,-9.07 Q13.25,-10.00 12.89,-10.39 Q12.11,-11.21 11.61,-11.46 Q10.29,-11.89 9.86,-12.00 Q9.39,-12.07 9.14,-12.07 Z","0 12.12 M1.07,-9.71 L6.39,-11.61 L7.18,-11.68 L7.14,8.25","0 16.29 M2.04,-11.36 Q3.57,-11.68 4.32,-11.79 Q5.82,-12.00 6.57,-12.04 Q8.07,-12.07 8.82,-12.04 Q10.43,-11.89 10.96,-11.79 Q11.75,-11.50 12.00,-11.36 Q12.36,-11.18 12.54,-10.96 Q12.93,-10.54 13.07,-10.07 Q13.32,-8.79 13.32,-8.14 Q13.18,-6.86 13.00,-6.25 Q12.54,-5.04 12.21,-4.46 Q11.46,-3.32 11.04,-2.75 Q10.14,-1.61 9.64,-1.00 L2.89,6.79 L2.57,7.71 L14.86,7.68","0 16.17 M1.86,7.61 Q5.32,7.93 6.43,8.00 Q7.79,8.07 8.43,8.04 Q9.79,7.93 10.36,7.79 Q11.46,7.36 11.82,7.14 Q12.32,6.79 12.57,6.43 Q13.11,5.54 13.29,5.00 Q13.54,3.86 13.57,3.21 Q13.57,1.75 13.46,1.18 Q13.21,0.18 13.00,-0.25 Q12.54,-1.04 12.25,-1.32 Q11.68,-1.75 11.29,-1.93 Q10.36,-2.21 9.86,-2.32 Q10.18,-2.89 10.50,-3.14 Q11.39,-3.54 11.75,-3.86 Q12.36,-4.64 12.57,-5.14 Q12.89,-6.32 12.96,-6.86 Q13.07,-7.93 13.00,-8.46 Q12.79,-9.61 12.64,-10.00 Q12.32,-10.64 12.11,-10.89 Q11.79,-11.29 11.32,-11.46 Q9.82,-11.86 9.29,-11.96 Q8.36,-12.07 8.00,-12.07 Q6.86,-12.07 6.11,-12.04 Q4.18,-11.93 3.50,-11.86 Q2.50,-11.75 2.14,-11.68M4.32,-2.57 L9.82,-2.64","0 17.29 M8.71,-12.29 Q2.18,0.32 2.18,0.32 Q2.11,0.54 2.11,0.71 Q2.14,1.21 2.21,1.39 Q2.36,1.64 2.50,1.75 Q2.82,1.96 3.04,2.04 L13.82,2.11 L16.29,2.04M13.21,8.25 L13.36,-8.39","0 15.60 M1.96,7.32 Q3.86,7.71 4.71,7.82 Q6.36,8.00 7.00,8.04 Q7.93,8.07 8.54,8.00 Q10.07,7.71 10.61,7.54 Q11.32,7.18 11.64,6.89 Q12.29,6.29 12.54,5.75 Q13.00,4.32 13.11,3.64 Q13.21,2.36 13.18,1.71 Q13.04,0.39 12.93,-0.11 Q12.68,-0.89 12.50,-1.21 Q12.18,-1.71 11.79,-1.96 Q10.68,-2.64 10.18,-2.82 Q9.32,-3.04 8.86,-3.11 Q8.39,-3.25 7.36,-3.29 Q4.46,-3.36 2.61,-3.39M3.14,-3.39 L3.54,-11.75 L13.14,-11.75","0 16.48 M2.93,-1.11 Q4.25,-2.50 4.89,-3.00 Q6.18,-3.86 6.75,-4.07 Q7.75,-4.32 8.32,-4.36 Q9.64,-4.43 10.29,-4.36 Q11.64,-4.11 12.07,-3.93 Q12.68,-3.61 12.93,-3.36 Q13.39,-2.96 13.57,-2.54 Q14.00,-1.32 14.11,-0.82 Q14.25,-0.07 14.29,0.43 Q14.32,1.64 14.32,2.21 Q14.36,3.29 14.25,3.86 Q14.00,5.14 13.79,5.68 Q13.29,6.64 12.89,7.00 Q12.07,7.57 11.50,7.75 Q9.89,8.00 9.36,8.04 Q8.54,8.07 8.25,8.04 Q7.00,8.00 6.43,7.86 Q5.36,7.50 4.93,7.18 Q4.18,6.36 3.93,6.00 Q3.61,5.36 3.50,5.00 Q3.29,4.39 3.21,3.86 Q3.04,2.86 3.00,1.86 Q2.93,-1.21 2.93,-2.21 Q2.96,-3.39 3.04,-4.18 Q3.18,-6.11 3.32,-6.89 Q3.57,-8.29 3.82,-8.89 Q4.43,-10.07 4.79,-10.50 Q5.46,-11.18 5.96,-11.43 Q7.18,-11.82 7.68,-11.93 Q8.54,-12.04 9.07,-12.07 Q10.18,-12.11 10.93,-12.07 Q12.57,-11.89 13.50,-11.79","0 15.07 M1.39,-11.75 L12.57,-11.75 L13.11,-11.04 L6.43,8.25","0 17.52 M6.18,-2.79 Q5.71,-1.96 5.71,-1.96 Q4.86,-1.68 4.54,-1.50 Q4.04,-1.18 3.82,-0.82 Q3.32,0.21 3.21,0.61 Q3.11,1.14 3.07,1.54 Q3.04,2.36 3.04,2.89 Q3.07,4.21 3.18,4.75 Q3.50,5.79 3.68,6.14 Q3.93,6.64 4.29,6.89 Q5.14,7.39 5.71,7.57 Q7.07,7.82 7.64,7.89 Q8.57,7.93 9.07,7.93 Q10.00,7.96 10.57,7.89 Q11.96,7.68 12.46,7.57 Q13.21,7.32 13.50,7.14 Q13.96,6.89 14.18,6.57 Q14.71,5.71 14.86,5.29 Q15.04,4.46 15.07,4.07 Q15.14,3.36 15.14,2.93 Q15.14,2.07 15.07,1.54 Q14.71,0.04 14.61,-0.36 Q14.43,-0.71 14.32,-0.86 Q14.14,-1.14 13.93,-1.29 Q13.36,-1.68 13.04,-1.79 Q12.39,-1.96 12.07,-2.04 L11.79,-2.71M10.61,-2.39 Q12.18,-2.75 12.71,-2.93 Q13.46,-3.25 13.71,-3.50 Q14.14,-3.89 14.32,-4.39 Q14.64,-5.93 14.71,-6.46 Q14.75,-7.21 14.71,-7.71 Q14.57,-8.96 14.43,-9.43 Q14.04,-10.29 13.86,-10.57 Q13.71,-10.89 13.39,-11.07 Q12.61,-11.57 12.00,-11.71 Q10.57,-11.93 9.79,-12.00 Q8.86,-12.04 8.39,-12.00 Q7.61,-11.96 7.07,-11.86 Q5.64,-11.50 5.21,-11.32 Q4.68,-11.04 4.43,-10.71 Q3.89,-9.86 3.71,-9.36 Q3.50,-8.18 3.46,-7.71 Q3.39,-7.00 3.46,-6.46 Q3.68,-4.89 3.86,-4.39 Q4.21,-3.75 4.43,-3.54 Q4.89,-3.18 5.18,-3.04 Q5.54,-2.89 6.14,-2.79 Q8.04,-2.50 8.79,-2.43 Z","0 16.50 M3.04,7.79 Q5.00,8.00 5.79,8.04 Q7.00,8.04 7.68,8.00 Q9.25,7.89 9.86,7.75 Q10.82,7.43 11.25,7.14 Q12.07,6.43 12.39,6.00 Q12.96,4.86 13.14,4.46 Q13.32,4.00 13.39,3.57 Q13.54,2.68 13.61,2.00 Q13.79,0.14 13.82,-0.50 Q13.86,-1.04 13.86,-1.89 Q13.82,-4.68 13.79,-5.57 Q13.75,-6.64 13.64,-7.29 Q13.36,-8.93 13.21,-9.43 Q13.04,-10.00 12.82,-10.29 Q12.43,-10.89 12.04,-11.14 Q11.07,-11.71 10.54,-11.86 Q9.29,-12.04 8.79,-12.07 Q7.89,-12.11 7.54,-12.07 Q5.96,-11.89 5.39,-11.71 Q4.46,-11.29 4.07,-10.93 Q3.36,-10.00 3.14,-9.57 Q2.86,-8.71 2.75,-8.32 Q2.61,-7.61 2.57,-7.18 Q2.50,-6.21 2.50,-5.75 Q2.50,-4.89 2.57,-4.36 Q2.75,-3.07 2.93,-2.54 Q3.43,-1.50 3.64,-1.14 Q3.96,-0.68 4.32,-0.46 Q5.39,0.07 5.86,0.21 Q6.68,0.36 7.18,0.36 Q8.32,0.39 8.89,0.29 Q10.11,0.00 10.61,-0.21 Q11.36,-0.57 11.89,-1.04 Q13.14,-2.21 13.86,-2.93","0 8.10 M2.93,-4.64 L3.50,-1.82M2.93,5.46 L3.50,8.25","0 8.14 M2.96,11.75 Q3.25,9.71 3.32,9.11 Q3.39,8.68 3.39,8.07 Q3.36,6.46 3.29,5.46","0 15.81 M13.64,-5.93 L2.39,-0.82 L2.39,-0.32 L13.64,4.68","0 17.00 M2.46,-3.54 L15.04,-3.54M2.46,2.75 L15.04,2.75","0 15.81 M2.39,-5.93 L13.61,-0.82 L13.61,-0.32 L2.39,4.68","0 15.05 M1.46,-11.93 Q2.21,-12.07 3.04,-12.14 Q5.39,-12.32 6.32,-12.36 Q7.89,-12.43 8.61,-12.36 Q10.07,-12.07 10.61,-11.89 Q11.43,-11.46 11.71,-11.21 Q12.14,-10.89 12.32,-10.46 Q12.79,-9.25 12.82,-8.68 Q12.79,-7.46 12.64,-6.96 Q12.29,-6.11 12.07,-5.75 Q11.96,-5.50 11.46,-4.93 Q9.54,-3.04 8.96,-2.36 Q8.29,-1.39 8.04,-0.89 Q7.61,0.14 7.50,0.64 Q7.36,1.64 7.32,2.14","0 19.64 M17.82,-2.82 Q9.75,-2.68 9.75,-2.68 Q9.14,-2.57 8.93,-2.46 Q8.57,-2.32 8.39,-2.14 Q7.96,-1.75 7.82,-1.46 Q7.61,-1.00 7.57,-0.50 Q7.50,1.00 7.54,1.46 Q7.61,2.07 7.71,2.36 Q8.04,2.96 8.25,3.21 Q8.68,3.61 9.11,3.75 Q10.21,4.00 10.79,4.04 Q12.04,3.93 12.50,3.86 Q13.07,3.75 13.50,3.61 Q14.46,3.29 15.04,3.00 Q16.39,2.25 16.86,1.96 Q17.57,1.43 17.82,1.21M17.96,4.39 Q17.82,-5.32 17.82,-5.32 Q17.79,-5.96 17.68,-6.29 Q17.43,-6.89 17.25,-7.14 Q16.82,-7.61 16.54,-7.79 Q15.86,-8.07 15.57,-8.14 Q15.07,-8.21 14.89,-8.21 Q8.93,-8.21 8.93,-8.21 Q7.93,-8.21 7.36,-8.11 Q5.89,-7.82 5.43,-7.64 Q4.82,-7.36 4.57,-7.11 Q4.11,-6.61 3.93,-6.11 Q3.54,-4.71 3.43,-4.11 Q3.32,-3.68 3.29,-2.50 Q3.29,1.89 3.29,3.04 Q3.29,3.82 3.36,4.36 Q3.57,5.75 3.71,6.29 Q4.11,7.29 4.29,7.57 Q4.39,7.89 4.71,8.11 Q5.79,8.64 6.25,8.82 Q7.00,9.04 7.57,9.11 Q8.86,9.21 9.57,9.21 L18.25,9.14","0 17.48 M1.14,8.25 L8.11,-11.46 L8.64,-11.79 L9.46,-11.79 L9.96,-11.46 L16.93,8.25M3.89,0.50 L14.21,0.50","0 17.14 M3.57,-2.43 Q10.93,-2.36 10.93,-2.36 Q12.39,-2.07 12.89,-1.93 Q13.57,-1.61 13.82,-1.43 Q14.21,-1.21 14.43,-0.79 Q14.96,0.54 15.11,1.04 Q15.21,1.71 15.25,2.11 Q15.32,2.82 15.25,3.39 Q15.04,5.00 14.89,5.50 Q14.64,6.14 14.46,6.39 Q14.11,6.86 13.75,7.07 Q12.82,7.54 12.25,7.68 Q11.00,7.89 10.29,7.93 L4.14,7.82 L3.57,7.79 L3.57,-11.79 L14.82,-11.79","0 16.62 M1.43,7.57 Q4.39,7.93 5.43,8.00 Q6.86,8.07 7.57,8.04 Q9.00,7.93 9.68,7.71 Q11.07,7.18 11.61,6.79 Q12.54,5.82 12.86,5.36 Q13.36,4.36 13.50,3.96 Q13.64,3.46 13.71,3.07 Q13.89,2.18 13.96,1.54 Q14.14,-0.14 14.18,-0.75 Q14.21,-1.54 14.21,-2.14 Q14.18,-3.64 14.11,-4.32 Q14.00,-5.64 13.86,-6.32 Q13.57,-7.79 13.32,-8.43 Q12.79,-9.64 12.39,-10.11 Q11.64,-10.89 11.07,-11.18 Q9.43,-11.75 8.96,-11.89 Q8.79,-11.96 8.29,-12.00 Q6.86,-12.04 5.93,-12.04 Q3.61,-11.89 2.89,-11.82 Q1.89,-11.71 1.61,-11.64M4.29,-2.75 L14.21,-2.75","0 18.83 M1.14,12.75 L1.25,7.71 L18.18,7.71 L18.25,12.75M2.86,7.71 Q3.75,5.82 4.07,5.11 Q4.50,3.96 4.68,3.36 Q5.07,2.14 5.21,1.46 Q5.50,0.11 5.64,-0.61 Q5.86,-2.07 5.96,-2.82 Q6.46,-9.21 6.46,-9.21 Q6.61,-9.96 6.68,-10.21 Q6.86,-10.61 6.96,-10.75 Q7.07,-10.96 7.29,-11.11 Q7.93,-11.50 8.21,-11.61 Q8.79,-11.71 9.07,-11.75 L15.61,-11.75 L15.61,7.71","0 19.21 M6.50,-17.86 Q6.64,-16.86 6.75,-16.50 Q6.96,-16.04 7.18,-15.79 Q7.68,-15.25 8.07,-15.04 Q9.00,-14.64 9.54,-14.57 Q10.86,-14.57 11.36,-14.68 Q12.25,-15.04 12.57,-15.25 Q13.07,-15.68 13.25,-15.96 Q13.61,-16.54 13.68,-16.86 Q13.79,-17.50 13.79,-17.86M4.18,7.39 L16.11,-11.43 L16.75,-11.43 L16.79,7.68M3.61,-11.79 L3.54,7.39 L4.71,7.39","0 22.55 M11.61,5.96 Q12.43,5.96 12.82,5.96 Q13.43,5.96 13.89,5.93 Q15.04,5.82 15.68,5.71 Q17.04,5.50 17.68,5.25 Q19.04,4.64 19.57,4.21 Q20.54,3.14 20.82,2.64 Q21.25,1.50 21.36,1.11 Q21.46,0.68 21.54,0.29 Q21.68,-0.61 21.71,-1.21 Q21.75,-2.71 21.71,-3.36 Q21.61,-4.46 21.50,-5.07 Q21.25,-6.32 20.96,-6.89 Q20.36,-8.11 19.86,-8.57 Q18.61,-9.43 18.04,-9.71 Q16.93,-10.11 16.39,-10.21 Q15.54,-10.36 14.93,-10.43 Q13.57,-10.57 12.82,-10.61 Q12.00,-10.61 11.61,-10.61 Q11.00,-10.57 10.54,-10.54 Q9.36,-10.43 8.71,-10.32 Q7.39,-10.11 6.75,-9.86 Q5.36,-9.21 4.82,-8.79 Q3.93,-7.82 3.64,-7.29 Q3.18,-6.07 3.04,-5.68 Q2.96,-5.25 2.89,-4.86 Q2.75,-3.96 2.71,-3.36 Q2.68,-1.86 2.71,-1.21 Q2.82,-0.11 2.93,0.50 Q3.25,1.79 3.46,2.32 Q3.82,3.18 4.25,3.61 Q5.43,4.61 6.00,4.93 Q7.18,5.39 7.75,5.54 Q8.86,5.75 9.50,5.82 ZM12.21,-14.21 L12.21,9.57","0 15.26 M3.46,8.25 Q3.50,-9.43 3.50,-9.43 Q3.75,-10.18 3.86,-10.43 Q3.93,-10.71 4.14,-10.89 Q4.71,-11.39 5.07,-11.54 Q5.82,-11.71 6.21,-11.75 L14.54,-11.68","0 24.10 M2.32,-12.29 Q3.96,-8.36 4.46,-7.29 Q5.00,-6.21 5.29,-5.79 Q5.79,-5.00 6.18,-4.61 Q7.14,-3.64 7.57,-3.36 Q8.18,-2.96 8.82,-2.82 Q10.25,-2.54 11.46,-2.46 Q15.07,-2.39 16.14,-2.46 Q17.43,-2.71 17.93,-2.93 Q18.71,-3.25 19.18,-3.64 Q20.29,-4.82 20.64,-5.25 Q21.07,-5.79 21.29,-6.18 Q21.54,-6.50 22.00,-7.54 Q23.25,-10.43 24.04,-12.29M15.86,-2.46 Q17.50,-2.14 18.04,-2.00 Q18.68,-1.79 19.07,-1.54 Q19.93,-0.89 20.32,-0.43 Q21.11,0.64 21.43,1.14 Q21.96,2.14 22.21,2.61 L24.50,8.25M13.29,-12.29 L13.29,8.25M1.86,8.25 Q3.39,4.36 3.82,3.32 Q4.25,2.39 4.46,1.96 Q4.86,1.21 5.18,0.75 Q6.00,-0.39 6.39,-0.79 Q7.04,-1.43 7.54,-1.68 Q8.68,-2.04 9.32,-2.18 L11.00,-2.50","0 19.21 M4.18,7.39 L16.11,-11.43 L16.75,-11.43 L16.75,7.64M3.57,-11.61 L3.54,7.39 L4.71,7.39","0 17.52 M2.64,-12.29 Q2.64,-3.75 2.64,-3.75 Q2.82,-2.43 3.00,-1.96 Q3.39,-1.29 3.64,-1.04 Q4.21,-0.61 4.57,-0.46 Q5.29,-0.25 5.68,-0.21 Q6.46,-0.14 6.89,-0.18 Q7.89,-0.25 8.36,-0.32 Q9.29,-0.46 9.71,-0.57 Q10.39,-0.75 10.82,-0.89 Q11.61,-1.18 12.25,-1.50 Q13.75,-2.29 14.61,-2.75M14.61,-12.29 L14.61,8.25","0 16.81 M3.50,-2.46 Q6.29,-2.39 7.21,-2.46 Q8.46,-2.75 8.96,-2.96 Q9.93,-3.46 10.32,-3.75 Q10.96,-4.36 11.25,-4.71 Q11.75,-5.39 12.07,-5.96 Q12.71,-7.11 13.18,-8.14 Q14.29,-10.75 14.93,-12.29M7.21,-2.46 Q8.64,-2.07 9.11,-1.93 Q9.61,-1.79 9.96,-1.54 Q10.75,-0.96 11.14,-0.50 Q12.00,0.61 12.32,1.14 Q12.86,2.18 13.07,2.64 L15.43,8.25M3.54,-12.29 L3.54,8.25","0 18.17 M0.46,7.79 Q1.39,7.39 1.86,7.04 Q2.86,6.07 3.18,5.68 Q3.61,5.04 3.82,4.68 Q4.25,3.96 4.39,3.61 Q4.68,2.96 4.79,2.61 Q4.96,2.07 5.11,1.46 Q5.39,-0.14 5.57,-1.14 Q6.46,-9.64 6.46,-9.64 Q6.71,-10.32 6.82,-10.54 Q7.00,-10.82 7.14,-10.96 Q7.39,-11.25 7.61,-11.36 Q8.25,-11.61 8.50,-11.68 Q8.93,-11.75 9.14,-11.75 L15.39,-11.75 L15.39,8.25","0 23.48 M4.00,-11.75 L5.25,-11.75 L5.79,-11.43 L11.89,5.50 L12.43,5.82 L13.14,5.82 L13.68,5.50 L19.79,-11.43 L20.32,-11.75 L21.00,-11.75 L21.57,-11.25 L22.46,8.25M3.11,8.25 L4.00,-11.75","0 18.71 M3.57,-12.29 L3.57,8.25M16.07,-12.29 L16.07,8.25M3.57,-2.75 L16.07,-2.75","0 18.81 M4.29,-9.71 Q3.79,-8.79 3.64,-8.39 Q3.43,-7.79 3.32,-7.32 Q3.07,-6.25 3.00,-5.57 Q2.86,-4.04 2.82,-3.25 Q2.79,-1.54 2.82,-0.75 Q2.93,0.86 3.00,1.54 Q3.18,2.71 3.32,3.29 Q3.68,4.57 3.93,5.07 Q4.39,5.96 4.82,6.36 Q6.00,7.25 6.54,7.50 Q7.61,7.86 8.07,7.93 Q8.79,8.00 9.21,8.04 Q10.04,8.07 10.57,8.04 Q11.89,7.93 12.50,7.75 Q13.71,7.32 14.21,6.96 Q15.14,6.14 15.46,5.71 Q15.96,4.79 16.11,4.39 Q16.32,3.79 16.43,3.32 Q16.64,2.25 16.71,1.57 Q16.86,0.07 16.89,-0.75 Q16.93,-2.46 16.89,-3.29 Q16.79,-4.93 16.71,-5.61 Q16.61,-6.71 16.43,-7.32 Q16.04,-8.71 15.71,-9.29 Q15.04,-10.36 14.54,-10.75 Q13.36,-11.46 12.79,-11.68 Q11.68,-11.93 11.21,-12.00 Q10.43,-12.07 10.11,-12.07 Q8.68,-12.04 8.07,-11.93 Q7.04,-11.79 6.54,-11.54 Q5.29,-10.75 4.96,-10.54 Q4.71,-10.29 4.61,-10.14 Z","0 18.79 M3.57,8.25 L3.57,-11.75 L16.18,-11.75 L16.18,8.25","0 24.62 M3.57,-12.29 L3.57,7.71 L23.46,7.71 L23.46,-12.29M13.50,-12.29 L13.50,7.71","0 16.88 M3.57,-0.89 Q10.39,-0.82 10.39,-0.82 Q11.71,-0.96 12.25,-1.11 Q13.21,-1.46 13.54,-1.68 Q14.00,-1.96 14.21,-2.32 Q14.68,-3.18 14.82,-3.75 Q15.04,-5.11 15.07,-5.68 Q15.11,-6.54 15.07,-7.11 Q14.96,-8.46 14.82,-9.04 Q14.43,-10.07 14.21,-10.43 Q13.93,-10.86 13.57,-11.07 Q12.64,-11.57 12.11,-11.71 Q10.93,-11.93 10.29,-11.96 L4.14,-11.86 L3.57,-11.82 L3.57,8.25","0 16.40 M15.04,-11.64 Q11.18,-12.04 11.18,-12.04 Q9.82,-12.07 9.18,-12.04 Q7.96,-11.96 7.32,-11.79 Q5.89,-11.25 5.39,-10.89 Q4.57,-10.14 4.29,-9.71 Q3.79,-8.79 3.64,-8.39 Q3.43,-7.79 3.32,-7.32 Q3.07,-6.29 3.00,-5.61 Q2.86,-4.11 2.82,-3.29 Q2.79,-1.57 2.82,-0.75 Q2.93,0.89 3.00,1.57 Q3.18,2.71 3.32,3.29 Q3.64,4.54 3.93,5.07 Q4.57,6.14 5.00,6.54 Q6.07,7.29 6.57,7.50 Q7.68,7.86 8.11,7.93 Q8.64,8.04 9.18,8.04 Q10.54,8.04 11.36,8.00 Q13.46,7.86 14.14,7.79 Q15.14,7.64 15.46,7.57","0 16.52 M0.79,-11.75 L16.11,-11.75M8.43,-11.75 L8.43,8.25","0 24.48 M3.57,-12.29 L3.57,8.25M10.18,-1.96 Q10.32,0.71 10.39,1.57 Q10.54,2.68 10.68,3.29 Q11.07,4.64 11.29,5.14 Q11.64,5.89 12.04,6.29 Q12.96,7.14 13.57,7.43 Q15.00,7.86 15.68,7.96 Q17.00,8.07 17.64,8.04 Q18.96,7.93 19.57,7.75 Q20.82,7.29 21.29,6.96 Q22.14,6.32 22.46,5.82 Q23.11,4.46 23.32,3.93 Q23.54,3.11 23.64,2.54 Q23.86,1.18 23.93,0.43 Q24.00,-1.21 24.00,-2.04 Q24.00,-3.71 23.93,-4.46 Q23.75,-5.96 23.64,-6.57 Q23.54,-7.43 23.32,-8.00 Q22.79,-9.39 22.43,-9.89 Q21.75,-10.71 21.21,-11.04 Q19.86,-11.68 19.18,-11.86 Q17.86,-12.04 17.21,-12.07 Q15.96,-12.11 15.29,-11.96 Q13.75,-11.57 13.18,-11.25 Q12.21,-10.61 11.86,-10.14 Q11.18,-8.86 10.96,-8.39 Q10.79,-7.79 10.68,-7.32 Q10.46,-6.14 10.39,-5.61 Q10.29,-4.79 10.25,-4.18 ZM3.57,-2.46 L10.18,-2.46","0 17.62 M3.57,-2.39 Q9.79,-2.39 9.79,-2.39 Q11.89,-2.07 12.57,-1.89 Q13.54,-1.57 13.89,-1.36 Q14.39,-1.00 14.64,-0.64 Q15.18,0.21 15.32,0.71 Q15.50,1.82 15.54,2.32 Q15.64,3.11 15.57,3.64 Q15.36,5.18 15.21,5.64 Q14.96,6.25 14.75,6.50 Q14.36,6.93 14.00,7.14 Q13.21,7.54 12.61,7.68 Q11.18,7.86 10.39,7.93 L4.14,7.82 L3.57,7.79 L3.57,-11.82 Q9.68,-11.96 9.68,-11.96 Q10.50,-11.96 11.04,-11.86 Q12.43,-11.54 12.89,-11.39 Q13.46,-11.14 13.71,-10.93 Q14.14,-10.54 14.36,-10.14 Q14.79,-9.11 14.89,-8.50 Q15.04,-7.11 14.96,-6.43 Q14.68,-4.89 14.50,-4.43 Q14.14,-3.82 13.86,-3.57 Q13.18,-3.14 12.82,-3.00 Q12.11,-2.79 11.71,-2.75 L10.29,-2.25","0 24.88 M3.57,-12.29 L3.57,7.71 L25.75,7.71 L25.82,12.75M23.21,-12.29 L23.21,7.71M13.36,-12.29 L13.36,7.71","0 17.36 M8.32,-2.46 Q9.11,-2.50 9.43,-2.46 Q9.86,-2.29 9.96,-2.18 L16.14,8.25M9.50,-2.46 L9.82,-2.57 L15.75,-12.29M1.79,8.25 L7.96,-2.18 L8.29,-2.46 L7.93,-2.71 L2.18,-12.29","0 15.95 M1.61,-12.29 L6.57,0.93 Q7.00,1.43 7.00,1.43 Q7.14,1.61 7.61,1.64 Q8.89,1.64 9.75,1.64M2.71,7.64 Q4.11,7.93 4.68,7.93 Q5.93,7.82 6.25,7.75 Q6.43,7.75 6.64,7.57 Q7.29,7.00 7.50,6.75 Q7.64,6.68 7.93,6.04 Q8.75,4.18 9.25,2.96 L14.96,-12.29","0 16.00 M4.29,-2.36 L8.32,-2.39M1.32,7.57 Q5.39,7.86 6.57,7.93 Q7.71,7.96 8.36,7.93 Q9.93,7.82 10.54,7.68 Q11.57,7.36 11.93,7.14 Q12.46,6.82 12.68,6.50 Q13.14,5.64 13.29,5.14 Q13.50,4.14 13.50,3.50 Q13.46,1.96 13.36,1.32 Q13.00,0.11 12.82,-0.29 Q12.61,-0.71 12.32,-0.96 Q11.46,-1.57 11.04,-1.75 Q10.21,-2.04 9.64,-2.18 Q8.54,-2.36 8.32,-2.39 Q9.57,-2.64 9.57,-2.64 Q10.75,-2.96 11.11,-3.14 Q11.71,-3.46 11.96,-3.75 Q12.43,-4.36 12.57,-4.82 Q12.86,-5.79 12.89,-6.43 Q12.89,-8.04 12.79,-8.64 Q12.46,-9.75 12.29,-10.14 Q12.04,-10.68 11.64,-10.93 Q10.32,-11.57 9.89,-11.71 Q9.43,-11.82 8.96,-11.86 Q7.79,-11.93 7.07,-11.96 Q5.64,-11.96 4.75,-11.93 Q2.82,-11.75 1.75,-11.64","0 16.17 M3.39,-2.71 L13.50,-2.71M14.75,-11.71 Q6.04,-11.75 6.04,-11.75 Q5.43,-11.68 5.18,-11.61 Q4.82,-11.54 4.61,-11.36 Q3.96,-10.86 3.79,-10.57 Q3.54,-9.93 3.46,-9.71 Q3.39,-9.43 3.39,-9.32 Q3.39,5.11 3.39,5.11 Q3.50,5.82 3.57,6.07 Q3.61,6.32 3.79,6.54 Q4.32,7.14 4.61,7.32 Q5.36,7.61 5.61,7.68 Q5.93,7.71 6.04,7.71 L14.75,7.68","0 14.90 M1.61,-12.29 L13.29,10.07","0 20.74 M0.79,-11.75 L8.21,-11.75 L8.21,7.79 Q14.89,7.93 14.89,7.93 Q16.21,7.82 16.79,7.68 Q17.96,7.29 18.36,7.07 Q18.82,6.79 19.07,6.32 Q19.64,4.79 19.79,4.29 Q19.86,3.64 19.86,3.25 Q19.89,2.43 19.86,1.89 Q19.75,0.54 19.61,0.04 Q19.29,-0.79 19.11,-1.11 Q18.86,-1.57 18.46,-1.82 Q17.18,-2.46 16.68,-2.61 Q15.89,-2.79 15.57,-2.79 L8.21,-2.86","0 17.40 M2.18,8.25 Q4.61,1.32 4.61,1.32 Q5.14,0.46 5.36,0.18 Q5.54,-0.14 6.00,-0.36 Q7.25,-0.82 8.07,-1.07 L14.43,-1.11M7.86,-1.04 Q6.71,-1.29 6.29,-1.43 Q5.54,-1.64 5.18,-1.86 Q4.46,-2.29 4.14,-2.79 Q3.43,-4.32 3.29,-4.82 Q3.21,-5.43 3.18,-5.82 Q3.14,-6.57 3.18,-7.11 Q3.32,-8.46 3.46,-9.00 Q3.82,-10.04 4.14,-10.43 Q4.82,-11.11 5.29,-11.36 Q6.46,-11.75 6.93,-11.86 Q7.68,-11.93 7.96,-11.93 L13.86,-11.86 L14.43,-11.82 L14.43,8.25","0 17.02 M3.57,-12.29 L3.57,7.79 Q10.25,7.93 10.25,7.93 Q11.54,7.82 12.11,7.68 Q13.32,7.25 13.71,7.04 Q14.18,6.79 14.43,6.32 Q15.00,4.79 15.14,4.29 Q15.21,3.64 15.21,3.25 Q15.25,2.43 15.21,1.89 Q15.11,0.54 14.96,0.04 Q14.64,-0.79 14.46,-1.11 Q14.21,-1.57 13.82,-1.82 Q12.54,-2.46 12.04,-2.61 Q11.25,-2.79 10.93,-2.79 L3.57,-2.86","0 19.12 M3.57,-12.29 L3.57,7.71 L18.50,7.71 L18.61,12.75M15.96,-12.29 L15.96,7.71","0 15.90 M2.50,-5.39 Q6.71,-5.79 7.93,-5.86 Q9.36,-5.89 9.89,-5.86 Q10.71,-5.75 11.07,-5.61 Q11.68,-5.32 11.93,-5.07 Q12.39,-4.64 12.57,-4.21 Q12.82,-3.18 12.93,-2.57 L13.07,8.25M12.93,0.00 Q5.21,0.07 5.21,0.07 Q4.50,0.18 4.25,0.25 Q3.86,0.39 3.68,0.50 Q3.43,0.71 3.29,0.82 Q3.04,1.07 2.93,1.25 Q2.71,1.57 2.64,1.79 Q2.54,2.00 2.50,2.50 Q2.46,4.32 2.50,4.89 Q2.54,5.61 2.64,5.93 Q2.89,6.50 3.07,6.75 Q3.50,7.21 3.75,7.39 Q4.25,7.71 4.68,7.79 Q5.75,7.93 6.29,7.89 Q7.50,7.68 7.96,7.57 Q8.57,7.39 9.00,7.21 Q10.11,6.68 10.54,6.43 Q11.14,6.07 11.54,5.79 Q12.43,5.07 12.93,4.64","0 16.43 M3.14,-0.71 Q3.07,0.14 3.07,0.61 Q3.07,1.64 3.11,2.14 Q3.11,3.11 3.25,3.71 Q3.68,5.32 3.89,5.82 Q4.21,6.46 4.54,6.75 Q5.46,7.39 5.89,7.61 Q6.64,7.89 7.18,7.96 Q8.50,8.07 9.18,8.04 Q10.64,7.89 11.21,7.71 Q12.18,7.29 12.57,6.93 Q13.29,6.04 13.50,5.57 Q13.82,4.64 13.93,4.21 Q14.04,3.43 14.07,2.93 Q14.14,1.86 14.14,1.32 Q14.14,0.32 14.07,-0.29 Q13.89,-1.71 13.71,-2.29 Q13.29,-3.36 13.04,-3.71 Q12.64,-4.18 12.29,-4.39 Q11.29,-4.89 10.79,-5.00 Q9.75,-5.11 9.25,-5.14 Q8.04,-5.14 7.43,-5.04 Q6.14,-4.71 5.68,-4.50 Q4.96,-4.04 4.64,-3.64 Q4.04,-2.54 3.79,-2.04 ZM3.04,-0.46 Q3.11,-2.25 3.11,-2.25 Q3.04,-3.57 3.07,-4.14 Q3.14,-5.00 3.25,-5.54 Q3.50,-6.75 3.75,-7.32 Q4.29,-8.54 4.68,-9.00 Q5.71,-9.89 6.11,-10.14 Q6.75,-10.46 7.11,-10.61 Q7.61,-10.79 8.25,-11.00 Q10.36,-11.57 11.00,-11.79 Q11.71,-12.04 12.18,-12.25 Q13.21,-12.82 13.82,-13.14","0 14.64 M1.43,7.61 Q3.89,7.89 4.79,7.93 Q6.11,7.96 6.71,7.93 Q7.86,7.86 8.39,7.71 Q9.57,7.25 9.96,7.04 Q10.50,6.68 10.75,6.36 Q11.25,5.61 11.43,5.04 Q11.79,3.64 11.86,3.04 Q11.96,1.93 11.96,1.39 Q11.96,0.36 11.89,-0.29 Q11.75,-1.75 11.57,-2.36 Q11.14,-3.54 10.82,-3.96 Q10.21,-4.68 9.71,-4.93 Q8.32,-5.43 7.82,-5.54 Q7.18,-5.61 6.68,-5.64 Q5.54,-5.64 4.86,-5.64 Q3.21,-5.54 2.68,-5.50 Q1.86,-5.43 1.61,-5.39M3.82,0.93 L11.96,0.93","0 16.31 M1.29,12.57 L1.39,7.75 L14.68,7.75 L14.75,12.57M2.61,7.75 Q3.00,7.11 3.21,6.64 Q3.68,5.71 3.93,5.07 Q4.43,3.54 4.61,2.82 Q5.00,1.36 5.11,0.75 Q5.18,0.04 5.29,-0.75 Q5.54,-3.32 5.61,-3.93 Q5.71,-4.21 5.79,-4.36 Q5.96,-4.71 6.07,-4.86 Q6.21,-5.04 6.43,-5.14 Q7.07,-5.46 7.29,-5.54 Q6.82,-5.57 7.75,-5.57 Q10.79,-5.61 12.89,-5.61 L12.89,7.75","0 16.88 M4.71,-12.50 Q4.79,-11.64 4.89,-11.29 Q5.14,-10.68 5.36,-10.43 Q5.75,-9.96 6.11,-9.75 Q7.07,-9.29 7.61,-9.18 Q8.79,-9.14 9.21,-9.18 Q9.89,-9.32 10.18,-9.46 Q10.79,-9.82 11.04,-10.04 Q11.46,-10.39 11.64,-10.82 Q11.93,-11.86 12.04,-12.50M3.75,7.46 L13.57,-5.32 L14.07,-5.32 L14.07,8.25M3.25,-6.11 L3.25,7.46 L3.79,7.50","0 19.71 M9.89,8.07 Q10.46,8.11 11.04,8.07 Q12.71,7.93 13.39,7.82 Q14.50,7.61 15.00,7.39 Q16.00,6.96 16.43,6.61 Q17.29,5.75 17.57,5.18 Q18.04,3.68 18.18,3.14 Q18.29,2.43 18.32,1.93 Q18.36,0.86 18.32,0.25 Q18.21,-1.14 18.04,-1.75 Q17.57,-3.04 17.29,-3.50 Q16.75,-4.21 16.32,-4.54 Q15.25,-5.14 14.64,-5.36 Q13.36,-5.64 12.75,-5.75 Q11.61,-5.89 11.04,-5.93 Q9.57,-5.89 9.00,-5.86 Q8.07,-5.79 7.54,-5.68 Q6.36,-5.43 5.82,-5.21 Q4.71,-4.68 4.29,-4.32 Q3.61,-3.61 3.36,-3.11 Q2.86,-1.79 2.75,-1.36 Q2.64,-0.86 2.61,-0.43 Q2.54,0.61 2.54,1.11 Q2.54,2.07 2.61,2.61 Q2.75,3.71 2.93,4.25 Q3.32,5.32 3.61,5.75 Q4.18,6.50 4.71,6.82 Q6.18,7.50 6.75,7.68 Q7.64,7.86 8.18,7.93 ZM10.46,-12.57 L10.46,14.43","0 13.57 M3.21,8.25 Q3.21,-3.25 3.21,-3.25 Q3.39,-4.11 3.46,-4.36 Q3.57,-4.64 3.68,-4.79 Q3.89,-5.07 4.11,-5.18 Q4.68,-5.43 4.93,-5.50 Q5.39,-5.57 5.61,-5.57 L12.39,-5.54","0 21.26 M14.61,0.79 Q16.00,1.18 16.50,1.39 Q17.25,1.82 17.64,2.18 Q18.43,3.11 18.75,3.61 Q19.18,4.32 19.54,5.11 Q20.43,7.07 20.93,8.25M2.29,-6.11 Q3.14,-4.11 3.46,-3.46 Q3.82,-2.64 4.14,-2.18 Q5.04,-1.07 5.32,-0.71 Q5.64,-0.29 5.93,-0.11 Q6.57,0.25 6.96,0.39 Q7.82,0.68 8.32,0.79 Q14.61,0.79 14.61,0.79 Q15.79,0.46 16.21,0.29 Q16.89,-0.07 17.25,-0.39 Q18.04,-1.21 18.32,-1.61 Q18.61,-1.96 18.96,-2.71 Q19.93,-4.79 20.54,-6.11M11.50,8.25 L11.46,-6.07M1.89,8.25 Q3.25,5.18 3.75,4.21 Q4.50,2.93 4.89,2.46 Q5.68,1.71 6.11,1.46 Q7.11,1.14 7.46,1.04 Q8.07,0.86 8.32,0.79","0 16.88 M3.75,7.46 L13.57,-5.32 L14.07,-5.32 L14.07,8.25M3.25,-6.11 L3.25,7.61 L3.71,7.61","0 15.19 M2.43,-6.11 Q2.46,-0.14 2.46,-0.14 Q2.50,0.57 2.57,0.82 Q2.71,1.21 2.82,1.36 Q3.00,1.61 3.14,1.75 Q3.36,2.00 3.68,2.11 Q4.68,2.36 5.07,2.39 Q5.68,2.39 6.11,2.36 Q7.18,2.25 7.68,2.14 Q8.75,1.93 9.21,1.79 Q9.96,1.54 10.43,1.36 Q11.39,0.93 11.93,0.71M11.93,-6.11 L11.93,8.25","0 15.38 M3.21,0.79 Q5.89,0.86 6.75,0.79 Q7.89,0.50 8.43,0.29 Q9.50,-0.25 9.89,-0.57 Q10.57,-1.21 10.82,-1.54 Q11.18,-2.11 11.46,-2.57 Q12.14,-3.82 12.43,-4.39 Q12.96,-5.54 13.21,-6.11M6.75,0.79 Q8.14,1.07 8.71,1.32 Q9.79,1.89 10.18,2.21 Q10.82,2.93 11.07,3.29 Q11.25,3.46 11.68,4.29 Q12.86,6.68 13.61,8.25M3.29,-6.11 L3.29,8.25","0 15.93 M0.71,7.93 Q1.96,7.39 2.43,7.04 Q3.25,6.18 3.54,5.71 Q3.96,4.82 4.14,4.32 Q4.39,3.39 4.54,2.82 Q4.79,1.93 4.93,0.86 Q5.32,-2.64 5.46,-3.54 Q5.68,-4.21 5.79,-4.43 Q5.93,-4.68 6.04,-4.82 Q6.32,-5.11 6.46,-5.21 Q6.61,-5.32 6.86,-5.39 Q6.89,-5.54 7.89,-5.57 Q10.89,-5.61 12.86,-5.61 L12.86,8.25","0 20.31 M3.64,-5.57 Q4.46,-5.64 4.71,-5.61 Q5.11,-5.43 5.21,-5.32 L10.11,6.18 L10.57,6.43 L11.43,6.39 Q16.39,-5.32 16.39,-5.32 Q16.71,-5.57 16.89,-5.61 Q17.29,-5.64 17.46,-5.61 L18.04,-5.14 L18.71,8.25M2.93,8.25 L3.71,-5.61","0 16.57 M3.29,-6.11 L3.29,8.25M13.68,-6.11 L13.68,8.25M3.29,0.61 L13.68,0.61","0 16.40 M8.36,-5.89 Q6.96,-5.86 6.36,-5.71 Q5.18,-5.32 4.79,-5.11 Q4.14,-4.71 3.89,-4.36 Q3.36,-3.61 3.18,-3.07 Q2.86,-1.75 2.75,-1.21 Q2.64,-0.29 2.61,0.25 Q2.57,1.39 2.61,1.93 Q2.64,2.79 2.75,3.36 Q3.00,4.75 3.18,5.29 Q3.57,6.21 3.89,6.57 Q4.68,7.25 5.11,7.46 Q6.04,7.82 6.57,7.93 Q7.75,8.07 8.39,8.07 Q9.89,8.00 10.50,7.86 Q11.64,7.46 12.04,7.25 Q12.64,6.86 12.89,6.50 Q13.46,5.43 13.64,5.04 Q13.79,4.50 13.86,4.14 Q14.00,3.29 14.04,2.79 Q14.14,1.64 14.14,1.07 Q14.11,0.00 14.04,-0.64 Q13.82,-2.21 13.68,-2.79 Q13.32,-3.64 13.11,-4.00 Q12.68,-4.64 12.29,-4.93 Q11.18,-5.50 10.71,-5.64 Q9.89,-5.82 9.50,-5.86 Z","0 16.50 M3.25,8.25 L3.25,-5.57 L13.61,-5.57 L13.61,8.25","0 21.74 M3.29,-6.11 L3.29,7.75 L20.14,7.75 L20.14,-6.11M11.71,-6.11 L11.71,7.75","0 16.50 M3.18,-6.11 L3.29,6.21 L3.25,7.04 L3.29,14.43M3.29,6.43 Q4.18,6.79 4.64,6.96 Q5.68,7.36 6.18,7.50 Q7.14,7.75 7.61,7.86 Q8.36,8.04 8.89,8.04 Q10.32,8.00 10.82,7.93 Q11.61,7.71 11.93,7.57 Q12.43,7.32 12.71,7.00 Q13.36,6.18 13.57,5.71 Q13.86,4.71 13.96,4.21 Q14.14,3.29 14.18,2.75 Q14.21,1.61 14.21,1.07 Q14.21,-0.04 14.18,-0.54 Q14.14,-1.39 14.00,-1.96 Q13.54,-3.54 13.32,-4.00 Q13.00,-4.61 12.71,-4.86 Q12.00,-5.43 11.54,-5.61 Q10.50,-5.82 9.93,-5.89 Q9.07,-5.93 8.57,-5.82 Q7.57,-5.57 7.04,-5.32 Q6.00,-4.79 5.39,-4.36 Q4.04,-3.29 3.29,-2.68","0 14.48 M12.64,-5.46 Q10.57,-5.82 9.79,-5.89 Q8.43,-5.93 7.86,-5.89 Q6.29,-5.68 5.68,-5.46 Q4.61,-4.96 4.25,-4.64 Q3.71,-4.11 3.46,-3.64 Q2.96,-2.32 2.82,-1.82 Q2.71,-1.14 2.68,-0.64 Q2.61,0.50 2.61,1.07 Q2.61,2.18 2.68,2.82 Q2.86,4.36 3.07,4.96 Q3.57,6.07 3.93,6.50 Q4.64,7.18 5.14,7.43 Q6.46,7.82 6.93,7.93 Q7.50,8.04 8.00,8.04 Q9.25,8.04 9.93,8.00 Q11.57,7.86 12.07,7.79 Q12.79,7.64 13.00,7.61","0 14.31 M0.86,-5.57 L13.29,-5.57M7.07,-5.57 L7.07,8.25","0 21.43 M3.29,-6.11 L3.29,8.25M3.29,0.86 L8.89,0.86M8.89,0.25 Q8.89,0.89 8.89,1.32 Q8.89,2.11 8.96,2.71 Q9.14,4.29 9.32,4.89 Q9.79,6.00 10.11,6.43 Q10.86,7.14 11.32,7.36 Q12.36,7.71 12.82,7.82 Q13.61,7.96 14.14,7.96 Q15.32,8.00 15.96,7.89 Q17.57,7.50 18.07,7.29 Q18.68,7.00 18.96,6.64 Q19.64,5.68 19.86,5.14 Q20.14,4.00 20.25,3.46 Q20.36,2.39 20.39,1.86 Q20.43,0.71 20.39,0.18 Q20.36,-0.89 20.25,-1.43 Q20.07,-2.57 19.86,-3.11 Q19.32,-4.18 19.00,-4.54 Q18.46,-5.04 18.00,-5.25 Q16.86,-5.68 16.29,-5.79 Q15.11,-5.93 14.50,-5.93 Q13.07,-5.86 12.46,-5.71 Q11.32,-5.32 10.93,-5.11 Q10.39,-4.79 10.14,-4.39 Q9.54,-3.46 9.36,-2.82 Q9.04,-1.18 8.96,-0.68 Z","0 16.07 M11.46,1.32 Q10.54,1.07 10.25,1.04 L9.21,0.86 Q10.43,0.68 10.43,0.68 Q11.57,0.36 11.89,0.25 Q12.39,-0.07 12.57,-0.21 Q12.86,-0.46 12.96,-0.68 Q13.21,-1.14 13.25,-1.57 Q13.32,-2.75 13.25,-3.21 Q13.04,-3.96 12.89,-4.25 Q12.54,-4.75 12.32,-4.93 Q10.86,-5.43 10.29,-5.57 Q9.29,-5.71 8.86,-5.71 L3.25,-5.64 L3.25,7.82 L3.79,7.86 Q9.54,7.89 9.54,7.89 Q11.11,7.75 11.64,7.64 Q12.50,7.29 12.75,7.18 Q12.96,7.04 13.07,6.93 Q13.29,6.71 13.39,6.50 Q13.64,5.93 13.71,5.54 Q13.82,4.64 13.79,4.18 Q13.57,3.11 13.46,2.79 Q13.25,2.36 13.07,2.18 Q12.64,1.79 12.46,1.68 Q12.29,1.57 12.11,1.50 ZM3.25,0.86 L9.29,0.89","0 22.14 M3.29,-6.11 L3.29,7.75 L21.96,7.75 L22.04,12.50M20.21,-6.11 L20.21,7.75M11.71,-6.11 L11.71,7.75","0 15.19 M1.68,8.25 Q6.75,1.04 6.75,1.04 Q7.04,0.79 7.25,0.75 Q7.79,0.71 8.00,0.75 Q8.32,0.93 8.46,1.04 L13.57,8.25M2.04,-6.11 L7.00,0.89M8.25,0.89 L13.18,-6.11","0 15.21 M1.43,-6.11 L7.11,7.79 L8.14,7.96M1.32,13.96 Q2.86,13.96 3.46,13.86 Q4.54,13.54 4.93,13.29 Q5.61,12.71 5.86,12.43 Q6.21,11.96 6.43,11.61 Q6.89,10.79 7.14,10.32 L13.82,-6.11","0 14.38 M3.46,0.89 L7.54,0.89M1.39,7.64 Q4.32,7.86 5.29,7.89 Q6.57,7.93 7.25,7.89 Q8.86,7.75 9.36,7.64 Q10.04,7.39 10.29,7.29 Q10.61,7.11 10.79,6.93 Q11.18,6.54 11.32,6.21 Q11.61,5.54 11.64,5.07 Q11.64,3.82 11.54,3.36 Q11.29,2.64 11.11,2.39 Q10.86,1.96 10.46,1.79 Q9.39,1.32 8.71,1.14 L7.39,0.89 Q8.46,0.68 8.46,0.68 Q9.79,0.29 10.11,0.14 Q10.46,-0.07 10.61,-0.25 Q10.89,-0.50 11.00,-0.93 Q11.21,-2.18 11.21,-2.71 Q11.00,-3.86 10.89,-4.18 Q10.71,-4.50 10.61,-4.64 Q10.57,-4.79 10.29,-4.93 Q9.21,-5.39 8.86,-5.50 Q8.50,-5.57 8.11,-5.61 Q7.14,-5.68 6.57,-5.71 Q5.29,-5.75 4.46,-5.71 Q2.64,-5.61 1.68,-5.50","0 15.62 M2.57,1.18 Q10.89,1.18 10.89,1.18 Q11.57,1.07 11.82,1.00 Q12.29,0.82 12.43,0.71 Q12.61,0.57 12.75,0.36 Q13.11,-0.04 13.21,-0.50 Q13.39,-1.86 13.36,-2.39 Q13.21,-3.39 13.07,-3.75 Q12.86,-4.29 12.57,-4.57 Q11.89,-5.14 11.43,-5.36 Q10.18,-5.75 9.75,-5.82 Q9.04,-5.89 8.79,-5.89 Q7.54,-5.89 6.93,-5.82 Q5.68,-5.57 5.25,-5.39 Q4.57,-5.04 4.29,-4.79 Q3.82,-4.39 3.57,-3.96 Q3.04,-2.64 2.89,-2.14 Q2.71,-1.29 2.68,-0.89 Q2.61,-0.18 2.61,0.29 Q2.54,1.29 2.57,1.86 Q2.68,3.18 2.82,3.82 Q3.25,5.25 3.46,5.71 Q3.75,6.32 4.07,6.61 Q4.86,7.32 5.39,7.54 Q6.75,7.93 7.32,8.00 Q8.29,8.04 8.93,8.04 Q10.46,8.00 11.11,7.96 Q12.36,7.82 12.79,7.75 Q13.39,7.68 13.57,7.61","0 17.90 M0.86,-5.57 L6.82,-5.57 Q6.82,7.82 6.82,7.82 Q11.07,7.93 12.29,7.89 Q13.64,7.79 14.14,7.68 Q15.00,7.39 15.21,7.29 Q15.43,7.18 15.54,7.07 Q15.79,6.93 15.93,6.61 Q16.36,5.68 16.43,5.07 Q16.43,3.43 16.36,2.89 Q16.11,2.14 15.93,1.86 Q15.57,1.39 15.21,1.18 Q14.07,0.79 13.68,0.68 Q13.04,0.57 12.82,0.57 L6.82,0.50","0 15.62 M2.18,8.25 Q3.36,4.54 3.71,3.68 Q4.00,3.25 4.32,3.04 Q5.07,2.64 5.54,2.50 Q5.89,2.18 7.04,2.11 Q10.32,2.07 12.46,2.11M7.04,2.11 Q5.57,1.79 5.04,1.61 Q4.18,1.21 3.86,0.93 Q3.39,0.39 3.21,-0.04 Q2.89,-1.04 2.86,-1.61 Q2.96,-3.04 3.07,-3.50 Q3.39,-4.18 3.61,-4.43 Q4.04,-4.89 4.39,-5.07 Q5.50,-5.46 5.86,-5.57 Q5.61,-5.64 6.61,-5.64 Q10.96,-5.61 11.93,-5.57 Q12.68,-5.54 12.46,-5.54 L12.46,8.25","0 15.07 M3.25,-6.11 Q3.25,7.82 3.25,7.82 Q7.50,7.93 8.75,7.89 Q10.29,7.79 10.75,7.68 Q11.36,7.46 11.57,7.36 Q11.93,7.11 12.07,7.00 Q12.25,6.89 12.36,6.64 Q12.71,6.14 12.79,5.61 Q12.93,4.11 12.89,3.50 Q12.64,2.39 12.50,2.04 Q12.21,1.57 11.96,1.36 Q11.43,1.00 11.00,0.86 Q9.93,0.64 9.32,0.57 L3.25,0.50","0 20.83 M1.89,-4.36 L14.25,-4.36M1.89,-0.29 L12.79,-0.29M17.07,-11.64 Q14.46,-11.96 13.61,-12.04 Q12.29,-12.07 11.82,-12.04 Q10.79,-12.00 10.21,-11.82 Q8.93,-11.43 8.39,-11.07 Q7.43,-10.32 7.04,-9.79 Q6.25,-8.32 6.04,-7.79 Q5.79,-7.00 5.68,-6.50 Q5.46,-5.36 5.39,-4.79 Q5.32,-3.75 5.29,-3.07 Q5.25,-1.39 5.29,-0.71 Q5.39,0.57 5.46,1.11 Q5.57,2.00 5.71,2.57 Q6.04,3.96 6.36,4.61 Q7.07,5.89 7.54,6.36 Q8.54,7.18 9.14,7.46 Q10.75,7.86 11.21,7.96 Q11.50,8.04 11.93,8.04 Q12.96,8.04 13.68,8.00 Q15.57,7.86 16.18,7.79 Q17.04,7.64 17.32,7.57","0 8.07 M2.93,11.68 Q3.21,9.71 3.29,9.11 Q3.36,8.68 3.36,8.07 Q3.29,6.50 3.25,5.50","0 13.57 M-1.68,11.64 Q0.18,11.75 0.86,11.71 Q1.93,11.57 2.32,11.43 Q2.96,11.07 3.18,10.82 Q3.54,10.36 3.68,10.04 Q3.89,9.29 4.00,8.89 Q5.75,-8.93 5.75,-8.93 Q6.07,-10.11 6.25,-10.50 Q6.61,-11.07 6.86,-11.29 Q7.36,-11.68 7.75,-11.79 Q8.54,-12.00 9.21,-12.04 Q10.82,-12.00 11.75,-11.96M1.68,-2.71 L10.54,-2.79",]
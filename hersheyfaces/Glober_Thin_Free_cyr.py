@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["0 9.26","0 8.38 M3.39,-11.79 L3.39,5.18M3.57,8.93 L3.57,9.36 L3.18,9.36 L3.18,8.93","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 23.19 M21.68,9.39 L21.68,-12.00M3.54,-11.96 L3.57,9.25 Q10.93,9.21 10.93,9.21 Q12.25,9.04 12.79,8.86 Q13.71,8.46 14.14,8.07 Q15.14,6.93 15.43,6.39 Q15.79,5.36 15.89,4.82 Q16.00,3.75 15.96,3.18 Q15.89,1.96 15.64,1.36 Q15.00,0.11 14.54,-0.39 Q13.39,-1.29 12.79,-1.54 Q11.54,-1.82 10.93,-1.89 L3.57,-1.93","0 16.48 M3.07,-6.14 L3.07,9.25 L15.25,9.25 L15.25,13.25M13.36,-6.18 L13.36,9.25","0 19.71 M17.93,-6.21 L17.93,9.46M3.07,-6.18 L3.07,9.25 Q9.43,9.25 9.43,9.25 Q10.57,9.07 10.96,8.93 Q11.54,8.68 11.82,8.39 Q12.46,7.75 12.68,7.25 Q13.00,5.96 13.04,5.32 Q12.96,4.00 12.82,3.50 Q12.43,2.68 12.21,2.39 Q11.82,1.93 11.46,1.71 Q11.00,1.36 10.68,1.25 Q9.61,1.11 9.43,1.11 L3.07,1.11","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 9.62 M6.79,-14.68 Q6.79,-14.36 6.61,-14.07 Q6.11,-13.32 5.82,-12.89 Q5.25,-11.93 5.00,-11.43 Q4.50,-10.50 4.29,-9.96 Q3.89,-8.93 3.68,-8.32 Q3.29,-7.04 3.11,-6.29 Q2.75,-4.75 2.64,-3.93 Q2.46,-2.21 2.43,-1.36 Q2.39,0.39 2.43,1.25 Q2.54,2.96 2.64,3.79 Q2.93,5.43 3.11,6.18 Q3.46,7.61 3.68,8.21 Q4.11,9.36 4.32,9.89 Q4.75,10.86 5.00,11.32 Q5.46,12.21 5.79,12.75 Q6.54,13.89 6.96,14.50","0 9.62 M1.32,-14.61 Q2.14,-13.43 2.46,-12.89 Q3.04,-11.93 3.29,-11.46 Q3.75,-10.54 3.96,-10.00 Q4.39,-8.93 4.61,-8.32 Q5.00,-7.04 5.18,-6.29 Q5.50,-4.71 5.61,-3.89 Q5.82,-2.21 5.86,-1.36 Q5.89,0.39 5.86,1.25 Q5.71,2.96 5.61,3.79 Q5.32,5.43 5.14,6.18 Q4.82,7.61 4.61,8.21 Q4.18,9.32 3.96,9.86 Q3.54,10.82 3.29,11.32 Q2.75,12.25 2.43,12.79 Q1.79,13.93 1.43,14.54","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 7.24 M2.00,11.46 Q2.50,10.79 2.64,10.36 Q2.82,9.43 2.82,8.96 Q2.57,8.89 2.46,8.96 Q2.39,9.25 2.50,9.32 Q2.79,9.39 2.79,9.36","0 11.33 M2.86,0.89 L7.57,0.89","0 6.86 M2.68,8.93 L2.64,9.36 L2.18,9.39 L2.18,8.93 L2.68,8.93","0 12.67 M1.18,10.61 L11.04,-12.46","0 17.81 M14.50,6.64 Q15.04,5.43 15.21,4.89 Q15.43,4.07 15.54,3.54 Q15.71,2.39 15.79,1.68 Q15.89,0.11 15.89,-0.68 Q15.86,-2.32 15.79,-3.00 Q15.64,-4.29 15.54,-4.82 Q15.39,-5.68 15.21,-6.21 Q14.82,-7.43 14.50,-7.96 Q13.71,-9.07 13.29,-9.46 Q12.32,-10.14 11.86,-10.36 Q10.82,-10.68 10.43,-10.75 Q9.82,-10.82 9.61,-10.82 Q8.57,-10.86 8.00,-10.75 Q6.75,-10.46 6.21,-10.18 Q5.25,-9.61 4.82,-9.11 Q3.89,-7.68 3.64,-7.25 Q3.46,-6.79 3.36,-6.43 Q3.11,-5.64 3.00,-5.07 Q2.79,-3.75 2.71,-3.00 Q2.61,-1.43 2.61,-0.64 Q2.64,0.93 2.71,1.68 Q2.89,3.18 3.00,3.75 Q3.18,4.61 3.36,5.11 Q3.68,6.14 4.00,6.64 Q4.75,7.75 5.18,8.14 Q6.14,8.82 6.61,9.04 Q7.50,9.36 8.00,9.43 Q8.96,9.61 9.61,9.54 Q11.18,9.29 11.79,9.07 Q12.89,8.43 13.29,8.14 Q13.86,7.54 14.07,7.29 Z","0 12.10 M1.43,-5.57 Q2.25,-5.82 2.79,-6.07 Q4.00,-6.68 4.57,-7.07 Q5.71,-7.96 6.18,-8.46 Q7.18,-9.75 7.43,-10.07 Q7.71,-10.32 7.75,-10.29 L7.75,9.43","0 15.50 M2.75,-9.82 Q3.54,-10.11 3.96,-10.25 Q4.82,-10.50 5.25,-10.57 Q6.11,-10.71 6.57,-10.75 Q7.36,-10.86 7.93,-10.82 Q9.39,-10.79 10.04,-10.61 Q11.32,-10.11 11.79,-9.82 Q12.46,-9.29 12.71,-8.82 Q13.25,-7.61 13.32,-6.96 Q13.43,-5.57 13.25,-4.89 Q12.64,-3.43 12.29,-2.93 Q11.54,-2.14 11.18,-1.86 Q10.54,-1.39 10.11,-1.11 Q9.43,-0.64 8.54,-0.11 Q5.71,1.46 4.82,2.07 Q3.61,3.00 3.21,3.57 Q2.54,4.89 2.36,5.54 Q2.14,6.82 2.14,7.43 Q2.21,8.64 2.29,9.25 L13.29,9.25","0 15.12 M5.11,-1.18 L7.50,-1.18M1.75,8.64 Q2.14,8.82 2.43,8.89 Q3.14,9.11 3.50,9.18 Q4.25,9.32 4.64,9.39 Q5.39,9.50 5.79,9.50 Q6.54,9.57 7.11,9.50 Q8.61,9.36 9.21,9.18 Q10.39,8.75 10.82,8.43 Q11.57,7.82 11.86,7.32 Q12.46,6.04 12.57,5.36 Q12.64,3.93 12.54,3.29 Q12.21,2.04 11.96,1.54 Q11.46,0.68 11.04,0.32 Q9.89,-0.39 9.39,-0.61 Q7.86,-1.11 7.46,-1.18 Q8.32,-1.39 8.32,-1.39 Q9.50,-1.75 9.96,-2.00 Q10.79,-2.57 11.11,-2.96 Q11.64,-3.71 11.82,-4.29 Q12.07,-5.75 12.07,-6.36 Q11.96,-7.46 11.82,-7.93 Q11.46,-8.75 11.18,-9.11 Q10.61,-9.75 10.18,-10.00 Q9.21,-10.50 8.64,-10.64 Q7.43,-10.79 6.75,-10.82 Q6.00,-10.82 5.57,-10.79 Q4.79,-10.75 4.21,-10.61 Q2.89,-10.25 2.11,-10.00","0 16.57 M11.93,9.43 L11.93,-10.32 L11.50,-10.07 L1.71,3.21 L1.61,3.57 L15.54,3.57","0 15.24 M1.86,9.07 Q2.11,9.00 2.36,9.04 Q3.00,9.21 3.39,9.29 Q4.25,9.43 4.71,9.46 Q5.71,9.54 6.21,9.54 Q7.11,9.54 7.68,9.46 Q9.14,9.25 9.75,9.04 Q10.86,8.57 11.29,8.25 Q12.04,7.64 12.32,7.11 Q12.89,5.71 13.00,5.14 Q13.07,4.21 13.00,3.61 Q12.86,2.18 12.61,1.57 Q12.00,0.46 11.54,0.04 Q10.29,-0.75 9.71,-1.00 Q8.57,-1.29 8.04,-1.36 Q6.96,-1.43 6.43,-1.43 Q5.11,-1.39 4.57,-1.32 Q3.64,-1.18 3.21,-1.11 L3.21,-10.54 L12.43,-10.54","0 16.14 M2.64,-0.36 Q3.89,-1.29 4.43,-1.61 Q5.43,-2.07 5.93,-2.25 Q6.89,-2.54 7.50,-2.61 Q8.89,-2.71 9.54,-2.64 Q10.86,-2.39 11.39,-2.18 Q12.32,-1.68 12.71,-1.32 Q13.43,-0.54 13.68,0.00 Q14.11,1.21 14.21,1.86 Q14.32,3.25 14.29,3.93 Q14.11,5.39 13.89,6.00 Q13.43,7.07 13.07,7.50 Q12.25,8.36 11.79,8.64 Q10.89,9.14 10.29,9.29 Q8.89,9.50 8.11,9.54 Q6.82,9.39 6.29,9.18 Q5.25,8.64 4.79,8.25 Q3.86,7.25 3.57,6.79 Q3.21,6.11 3.04,5.54 Q2.68,4.11 2.61,3.46 Q2.54,2.18 2.54,1.64 Q2.54,0.71 2.57,0.25 Q2.61,-0.61 2.71,-1.21 Q3.07,-2.86 3.21,-3.39 Q3.39,-4.04 3.64,-4.54 Q4.29,-5.82 4.64,-6.36 Q5.32,-7.32 5.75,-7.71 Q6.61,-8.50 7.11,-8.82 Q7.93,-9.36 8.64,-9.64 Q9.82,-10.11 10.61,-10.29 Q12.07,-10.46 12.54,-10.61","0 14.74 M1.25,-10.54 Q13.00,-10.54 13.00,-10.54 Q13.00,-9.43 12.89,-8.82 Q12.57,-7.43 12.39,-6.89 Q12.04,-6.07 11.75,-5.57 Q11.46,-4.86 10.79,-3.89 Q8.39,-0.61 7.79,0.25 Q7.46,0.75 7.25,1.18 Q6.71,2.21 6.50,2.79 Q6.04,4.04 5.86,4.61 Q5.64,5.39 5.54,6.21 Q5.29,8.25 5.18,9.46","0 16.83 M7.11,-1.82 Q6.07,-1.18 5.54,-0.75 Q4.43,0.14 4.00,0.71 Q3.11,1.96 2.86,2.61 Q2.46,3.96 2.43,4.54 Q2.43,5.64 2.57,6.14 Q2.86,7.00 3.21,7.43 Q4.18,8.43 4.79,8.75 Q6.29,9.25 6.82,9.39 Q7.54,9.46 7.96,9.50 Q8.75,9.54 9.32,9.50 Q10.71,9.36 11.36,9.18 Q12.68,8.64 13.14,8.32 Q13.96,7.64 14.25,7.21 Q14.68,6.43 14.79,5.86 Q14.93,4.46 14.82,3.86 Q14.46,2.68 14.18,2.21 Q13.54,1.39 13.04,1.00 Q11.57,0.14 11.14,-0.11 Q11.14,-0.14 10.39,-0.46 Q7.57,-1.61 6.75,-1.96 Q6.00,-2.32 5.57,-2.61 Q4.46,-3.36 4.11,-3.79 Q3.54,-4.61 3.36,-5.11 Q3.11,-6.25 3.11,-6.75 Q3.25,-7.71 3.39,-8.14 Q3.75,-8.93 4.07,-9.25 Q4.79,-9.93 5.32,-10.18 Q6.82,-10.64 7.36,-10.75 Q8.07,-10.86 8.57,-10.82 Q9.79,-10.82 10.43,-10.64 Q11.89,-10.18 12.39,-9.86 Q13.21,-9.07 13.46,-8.68 Q13.89,-8.00 13.96,-7.43 Q14.04,-5.89 13.93,-5.21 Q13.57,-4.00 13.21,-3.46 Q12.32,-2.36 11.86,-1.93 Q10.79,-1.11 10.46,-0.89 Q10.07,-0.68 10.00,-0.64","0 16.14 M3.64,9.46 Q4.14,9.25 4.50,9.14 Q5.43,9.00 5.89,8.89 Q6.71,8.68 7.25,8.46 Q8.54,7.86 9.07,7.54 Q10.04,6.82 10.46,6.43 Q11.32,5.61 11.68,5.11 Q12.36,3.96 12.61,3.50 Q12.93,2.86 13.07,2.36 Q13.39,1.21 13.54,0.61 Q13.82,-0.57 13.86,-1.36 Q13.89,-3.39 13.86,-4.11 Q13.79,-5.07 13.68,-5.57 Q13.54,-6.64 13.29,-7.18 Q12.68,-8.39 12.29,-8.89 Q11.50,-9.75 10.93,-10.07 Q9.39,-10.61 8.96,-10.75 Q8.43,-10.86 8.32,-10.82 Q6.79,-10.75 6.18,-10.61 Q5.11,-10.21 4.64,-9.93 Q3.71,-9.25 3.36,-8.82 Q2.71,-7.89 2.50,-7.29 Q2.18,-5.93 2.14,-5.25 Q2.11,-3.89 2.21,-3.25 Q2.54,-1.93 2.79,-1.39 Q3.39,-0.43 3.79,-0.04 Q4.61,0.64 5.11,0.86 Q6.14,1.25 6.79,1.32 Q8.32,1.36 8.93,1.29 Q10.00,1.11 10.50,0.93 Q11.43,0.61 11.96,0.29 Q13.14,-0.50 13.79,-0.96","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 13.19 M1.39,-10.04 Q2.43,-10.39 2.89,-10.50 Q3.71,-10.64 4.11,-10.71 Q4.75,-10.82 5.29,-10.82 Q6.71,-10.82 7.29,-10.71 Q8.25,-10.46 8.68,-10.25 Q9.46,-9.71 9.79,-9.32 Q10.43,-8.39 10.57,-7.86 Q10.75,-6.71 10.71,-6.14 Q10.54,-4.93 10.32,-4.32 Q9.93,-3.32 9.32,-2.57 Q7.29,-0.57 6.64,0.18 Q5.79,1.39 5.54,1.96 Q5.18,2.93 5.07,3.50 Q4.96,4.64 4.93,5.29M4.54,9.14 L5.36,9.14","0 24.83 M17.57,-1.00 Q17.00,-2.36 16.71,-2.82 Q16.11,-3.50 15.75,-3.75 Q15.00,-4.11 14.68,-4.21 Q14.07,-4.36 13.82,-4.36 Q12.57,-4.29 12.07,-4.14 Q11.21,-3.82 10.86,-3.57 Q10.18,-3.00 9.93,-2.57 Q9.46,-1.64 9.32,-1.07 Q9.14,0.21 9.11,0.86 Q9.07,2.21 9.21,2.89 Q9.64,4.43 9.93,4.93 Q10.50,5.68 10.86,5.93 Q11.50,6.39 12.07,6.50 Q13.71,6.71 14.25,6.68 Q15.00,6.57 15.39,6.32 Q16.29,5.64 16.61,5.25 Q17.18,4.25 17.32,3.89 Q17.54,3.32 17.57,3.07M17.61,-4.50 Q17.61,-2.68 17.61,-2.04 Q17.57,-1.61 17.57,-0.75 Q17.50,2.07 17.57,3.04 Q17.86,4.64 18.00,5.11 Q18.25,5.64 18.46,5.86 Q18.93,6.29 19.18,6.43 Q19.57,6.68 20.04,6.68 Q21.39,6.61 21.89,6.46 Q22.75,6.11 23.07,5.82 Q23.71,5.07 23.93,4.68 Q24.25,3.89 24.36,3.54 Q24.50,2.89 24.57,2.50 Q24.68,1.68 24.71,1.18 Q24.71,0.04 24.68,-0.46 Q24.64,-1.32 24.54,-1.93 Q24.25,-3.36 24.00,-4.04 Q23.39,-5.36 23.04,-5.93 Q22.25,-7.07 21.75,-7.57 Q20.71,-8.50 20.11,-8.86 Q18.86,-9.54 18.18,-9.79 Q16.64,-10.25 16.04,-10.36 Q15.00,-10.46 14.50,-10.50 Q13.50,-10.50 13.00,-10.50 Q12.36,-10.54 11.82,-10.43 Q10.36,-10.18 9.68,-9.93 Q8.32,-9.39 7.71,-9.04 Q6.50,-8.21 5.96,-7.71 Q4.93,-6.64 4.50,-6.04 Q3.68,-4.61 3.43,-4.11 Q3.14,-3.39 3.04,-3.04 Q2.82,-2.32 2.75,-1.93 Q2.57,-1.11 2.54,-0.71 Q2.43,0.07 2.43,0.54 Q2.43,1.54 2.46,2.11 Q2.61,3.43 2.68,3.96 Q2.79,4.86 2.96,5.43 Q3.43,6.82 3.75,7.46 Q4.50,8.68 4.93,9.21 Q5.89,10.21 6.43,10.64 Q7.57,11.43 8.21,11.71 Q9.71,12.21 10.29,12.36 Q11.21,12.54 11.75,12.57 Q12.96,12.64 13.57,12.64 Q14.79,12.57 15.39,12.50 Q16.61,12.29 17.14,12.18 Q17.93,12.00 18.50,11.79 Q19.93,11.14 20.50,10.82 Q21.54,10.21 21.96,9.89","0 18.17 M1.00,9.43 L9.50,-11.54 L17.96,9.43M3.79,2.46 L15.14,2.46","0 17.40 M3.57,-1.93 Q10.89,-1.93 10.89,-1.93 Q12.14,-1.82 12.75,-1.57 Q14.04,-0.93 14.50,-0.46 Q15.32,0.57 15.57,1.11 Q15.89,2.14 15.96,2.68 Q16.04,3.79 15.96,4.36 Q15.86,5.54 15.57,6.11 Q14.82,7.39 14.36,7.86 Q13.36,8.64 12.79,8.86 Q11.61,9.14 10.96,9.21 L3.57,9.25 L3.57,-11.75 L14.11,-11.75","0 16.76 M5.29,-1.43 L14.64,-1.43M1.54,8.57 Q1.82,8.75 2.14,8.82 Q2.93,9.04 3.36,9.14 Q4.25,9.32 4.71,9.39 Q5.61,9.50 6.21,9.50 Q7.71,9.54 8.32,9.46 Q9.39,9.25 9.89,9.07 Q10.79,8.75 11.29,8.36 Q12.50,7.29 12.86,6.82 Q13.36,6.00 13.54,5.64 Q13.75,5.11 13.86,4.75 Q14.07,4.07 14.18,3.50 Q14.43,2.18 14.50,1.39 Q14.64,-0.46 14.64,-1.18 Q14.61,-2.32 14.57,-2.96 Q14.43,-4.46 14.32,-5.07 Q14.18,-6.07 14.00,-6.64 Q13.50,-8.04 13.21,-8.57 Q12.71,-9.50 12.25,-9.96 Q11.04,-10.96 10.50,-11.29 Q9.57,-11.68 9.04,-11.79 Q7.96,-11.96 7.39,-12.00 Q6.68,-12.04 6.25,-12.00 Q5.29,-11.96 4.86,-11.89 Q4.11,-11.82 3.61,-11.68 Q2.54,-11.36 1.93,-11.14","0 18.76 M0.89,13.57 L0.89,9.25 L17.96,9.25 L17.96,13.57M2.71,9.25 Q3.43,8.00 3.64,7.54 Q3.93,6.82 4.07,6.39 Q4.29,5.82 4.43,5.04 Q4.75,3.00 4.93,1.71 L6.00,-11.75 L15.64,-11.75 L15.64,9.25","0 19.24 M6.68,-16.36 Q7.89,-15.68 8.43,-15.46 Q9.46,-15.14 10.00,-15.11 Q11.11,-15.11 11.61,-15.21 Q12.61,-15.54 13.04,-15.71 Q13.86,-16.14 14.21,-16.36M3.50,-11.96 L3.54,9.54 L16.75,-12.00 L16.75,9.39 L16.79,9.46","0 21.71 M11.43,6.04 Q12.39,6.00 12.93,5.96 Q14.14,5.89 14.68,5.82 Q15.50,5.68 16.04,5.54 Q17.21,5.18 17.79,4.89 Q19.00,4.18 19.46,3.75 Q20.21,2.79 20.46,2.36 Q20.82,1.68 20.96,1.11 Q21.21,-0.39 21.29,-0.96 Q21.32,-1.71 21.29,-2.25 Q21.21,-3.57 21.04,-4.21 Q20.57,-5.64 20.21,-6.21 Q19.46,-7.21 18.96,-7.61 Q17.79,-8.36 17.18,-8.61 Q15.96,-9.00 15.43,-9.11 Q14.32,-9.32 13.86,-9.36 Q13.07,-9.43 12.68,-9.43 Q11.86,-9.43 11.43,-9.43 Q10.89,-9.43 10.39,-9.39 Q8.96,-9.29 8.39,-9.18 Q7.39,-9.04 6.86,-8.86 Q5.71,-8.46 5.18,-8.14 Q4.07,-7.36 3.64,-6.89 Q2.96,-5.86 2.71,-5.32 Q2.36,-4.14 2.25,-3.68 Q2.14,-2.93 2.11,-2.46 Q2.04,-1.54 2.11,-0.93 Q2.25,0.54 2.46,1.21 Q2.96,2.54 3.36,3.07 Q4.29,4.11 4.75,4.46 Q5.61,4.96 6.14,5.18 Q7.36,5.61 7.89,5.71 Q8.86,5.86 9.46,5.93 ZM11.64,-12.18 L11.64,9.43","0 14.64 M3.57,9.43 L3.57,-11.75 L13.68,-11.75","0 25.36 M1.21,9.43 L8.93,-1.54 L18.82,-1.64 L26.71,9.39M13.96,-11.93 L13.96,9.43M1.93,-11.93 L9.04,-1.61M18.89,-1.61 L25.93,-11.96","0 19.24 M3.50,-11.96 L3.57,9.36 L16.75,-11.93 L16.75,9.39 L16.79,9.46","0 17.93 M15.11,-11.93 L15.11,9.43M2.32,-11.96 Q2.32,-5.93 2.32,-5.93 Q2.32,-5.14 2.46,-4.57 Q2.89,-3.04 3.11,-2.57 Q3.39,-1.96 3.75,-1.68 Q4.68,-1.00 5.14,-0.79 Q6.07,-0.46 6.50,-0.36 Q7.32,-0.25 7.82,-0.21 Q8.89,-0.21 9.43,-0.25 Q10.57,-0.32 11.11,-0.39 Q12.18,-0.57 12.71,-0.71 Q13.82,-1.07 14.21,-1.21 Q14.86,-1.46 15.11,-1.57","0 17.43 M3.57,-11.93 L3.57,9.43M3.57,-1.64 L8.68,-1.64 L16.79,9.39M8.75,-1.61 L16.04,-11.96","0 18.36 M0.68,9.36 Q1.54,9.43 1.89,9.36 Q2.64,9.25 2.86,9.00 Q3.57,8.18 3.79,7.79 Q4.07,7.00 4.21,6.57 Q4.43,5.79 4.54,5.14 Q4.75,3.61 4.89,2.71 L6.14,-11.75 L15.64,-11.75 L15.64,9.46","0 23.48 M3.57,9.43 L3.57,-11.93 L12.86,3.18 L22.07,-12.07 L22.07,9.39","0 19.00 M3.50,-11.96 L3.57,9.43M16.43,-11.93 L16.43,9.43M3.57,-1.54 L16.43,-1.54","0 19.14 M10.50,9.54 Q11.71,9.43 12.21,9.29 Q13.18,8.96 13.61,8.71 Q14.46,8.18 14.86,7.82 Q15.57,7.04 15.89,6.57 Q16.50,5.39 16.68,4.96 Q16.86,4.43 16.96,4.00 Q17.18,3.11 17.29,2.43 Q17.50,0.86 17.54,0.04 Q17.57,-1.71 17.54,-2.54 Q17.39,-4.21 17.29,-4.93 Q17.14,-6.07 16.93,-6.71 Q16.39,-8.14 16.11,-8.68 Q15.57,-9.61 15.14,-10.04 Q14.11,-10.96 13.46,-11.29 Q11.86,-11.82 11.36,-11.93 Q10.71,-12.04 10.54,-12.00 Q9.32,-12.00 8.75,-11.93 Q7.71,-11.71 7.18,-11.50 Q6.14,-11.04 5.64,-10.61 Q4.57,-9.46 4.21,-8.93 Q3.64,-7.82 3.46,-7.39 Q3.29,-6.82 3.18,-6.39 Q2.96,-5.46 2.86,-4.82 Q2.68,-3.32 2.64,-2.50 Q2.61,-0.82 2.64,0.00 Q2.75,1.64 2.86,2.32 Q3.07,3.54 3.25,4.14 Q3.71,5.54 4.00,6.07 Q4.54,7.00 4.93,7.43 Q5.96,8.36 6.46,8.68 Q7.39,9.11 7.93,9.25 Q9.21,9.46 9.64,9.50 Z","0 18.71 M3.57,9.43 L3.57,-11.75 L16.07,-11.75 L16.07,9.43","0 25.79 M3.57,-11.96 L3.57,9.25 L24.93,9.25 L24.93,-11.96M14.25,-11.93 L14.25,9.25","0 17.19 M3.57,-0.18 Q10.75,-0.14 10.75,-0.14 Q12.36,-0.46 12.93,-0.68 Q13.86,-1.18 14.21,-1.54 Q14.89,-2.29 15.14,-2.86 Q15.57,-4.29 15.68,-4.96 Q15.79,-6.36 15.68,-7.04 Q15.39,-8.46 15.14,-9.04 Q14.57,-10.00 14.21,-10.36 Q13.43,-11.04 12.96,-11.25 Q11.79,-11.64 11.25,-11.75 L3.57,-11.75 L3.57,9.43","0 16.24 M14.82,-11.32 Q14.39,-11.29 14.39,-11.29 Q13.14,-11.68 12.64,-11.79 Q11.75,-11.93 11.32,-11.96 Q10.54,-12.04 10.14,-12.04 Q8.86,-12.00 8.32,-11.89 Q7.36,-11.71 6.82,-11.43 Q5.57,-10.68 5.07,-10.18 Q4.18,-9.04 3.86,-8.46 Q3.39,-7.25 3.21,-6.68 Q3.00,-5.71 2.89,-5.04 Q2.68,-3.32 2.64,-2.57 Q2.61,-1.18 2.61,-0.50 Q2.64,0.75 2.71,1.43 Q2.93,3.04 3.04,3.61 Q3.21,4.43 3.39,4.89 Q3.75,5.93 4.07,6.46 Q4.89,7.64 5.39,8.07 Q6.54,8.82 7.04,9.04 Q7.96,9.32 8.36,9.39 Q8.96,9.46 9.36,9.50 Q10.25,9.50 10.68,9.50 Q11.57,9.46 12.00,9.39 Q12.82,9.32 13.32,9.18 Q14.46,8.82 15.11,8.57","0 15.50 M1.11,-11.75 L14.54,-11.71M7.89,-11.75 L7.89,9.43","0 25.45 M3.50,-11.96 L3.57,9.43M3.57,-1.25 L10.46,-1.25M10.50,-2.71 Q10.46,-1.68 10.46,-1.04 Q10.50,0.50 10.57,1.21 Q10.71,2.46 10.86,3.14 Q11.25,4.68 11.50,5.29 Q11.96,6.32 12.32,6.82 Q13.29,7.93 13.75,8.29 Q14.54,8.86 15.04,9.04 Q16.07,9.36 16.64,9.43 Q17.82,9.57 18.39,9.54 Q19.61,9.43 20.14,9.29 Q21.11,9.00 21.61,8.68 Q22.71,7.86 23.11,7.43 Q23.75,6.61 24.04,6.07 Q24.61,4.75 24.79,4.14 Q25.07,3.04 25.18,2.36 Q25.36,0.82 25.39,0.00 Q25.43,-1.68 25.39,-2.50 Q25.29,-4.14 25.18,-4.82 Q25.00,-6.04 24.82,-6.64 Q24.36,-7.96 24.04,-8.57 Q23.25,-9.79 22.82,-10.21 Q21.96,-10.96 21.50,-11.21 Q20.61,-11.61 20.11,-11.75 Q19.04,-11.93 18.43,-12.00 Q17.21,-12.00 16.64,-11.93 Q15.61,-11.71 15.07,-11.50 Q13.93,-10.96 13.46,-10.57 Q12.57,-9.68 12.25,-9.21 Q11.75,-8.36 11.50,-7.75 Q11.00,-6.32 10.86,-5.64 Q10.68,-4.18 10.61,-3.68 Z","0 17.88 M3.57,-1.32 Q10.43,-1.32 10.43,-1.32 Q10.46,-1.36 11.29,-1.32 Q12.46,-1.14 13.04,-0.93 Q14.11,-0.46 14.50,-0.14 Q15.21,0.54 15.46,0.96 Q15.89,1.93 16.00,2.46 Q16.18,3.46 16.14,4.11 Q16.00,5.61 15.82,6.18 Q15.43,7.11 15.11,7.50 Q14.43,8.21 13.93,8.46 Q12.64,8.96 12.14,9.07 Q11.29,9.18 10.93,9.18 L3.57,9.25 L3.57,-11.75 Q10.50,-11.68 10.50,-11.68 Q12.07,-11.50 12.64,-11.32 Q13.64,-10.86 14.00,-10.54 Q14.61,-9.93 14.86,-9.39 Q15.39,-7.96 15.46,-7.25 Q15.46,-5.64 15.36,-5.04 Q15.07,-4.04 14.82,-3.61 Q14.29,-2.82 13.89,-2.50 Q13.00,-1.93 12.57,-1.75 Q11.71,-1.43 11.29,-1.32","0 26.19 M3.57,-11.96 L3.57,9.25 L27.21,9.25 L27.21,13.61M24.93,-11.93 L24.93,9.25M14.25,-11.93 L14.25,9.25","0 16.55 M1.54,9.43 L15.32,-11.96M1.54,-11.93 L8.36,-1.46 L15.43,9.43","0 17.45 M4.07,9.11 Q5.32,9.29 5.89,9.21 Q6.64,9.18 7.04,9.04 Q7.89,8.68 8.21,8.32 Q9.07,7.18 9.32,6.79 Q9.68,6.14 9.79,5.89 L16.89,-11.89M1.14,-11.93 L9.75,5.96","0 15.90 M1.50,8.93 Q1.79,8.86 2.29,8.93 Q3.89,9.25 4.54,9.36 Q5.64,9.46 6.14,9.50 Q7.14,9.54 7.61,9.50 Q8.43,9.50 9.00,9.36 Q10.54,8.96 11.11,8.68 Q12.04,8.11 12.43,7.64 Q13.21,6.43 13.43,5.82 Q13.68,4.61 13.64,3.96 Q13.46,2.50 13.32,2.00 Q13.07,1.25 12.82,0.93 Q12.32,0.32 11.89,0.00 Q10.82,-0.71 10.25,-0.93 Q9.11,-1.21 8.54,-1.32 Q8.54,-1.54 8.89,-1.71 Q10.18,-2.07 10.71,-2.39 Q11.75,-3.07 12.11,-3.61 Q12.79,-5.00 12.93,-5.68 Q13.07,-7.04 12.96,-7.71 Q12.64,-9.11 12.32,-9.64 Q11.50,-10.64 11.07,-11.00 Q10.21,-11.50 9.64,-11.68 Q8.29,-11.93 7.75,-12.00 Q6.82,-12.04 6.43,-12.00 Q5.61,-11.96 5.14,-11.89 Q4.29,-11.79 3.75,-11.64 Q2.54,-11.32 1.86,-11.11M5.14,-1.46 L8.71,-1.54","0 16.24 M3.57,-1.39 L13.14,-1.39M14.61,-11.75 L3.57,-11.75 L3.57,9.25 L14.93,9.25","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 19.14 M0.86,-11.75 L5.71,-11.75 L5.71,9.25 Q13.11,9.21 13.11,9.21 Q14.39,9.04 14.93,8.86 Q15.89,8.46 16.32,8.07 Q17.32,6.93 17.61,6.39 Q17.96,5.36 18.07,4.82 Q18.18,3.75 18.14,3.18 Q18.07,1.96 17.82,1.36 Q17.18,0.11 16.71,-0.39 Q15.54,-1.29 14.93,-1.54 Q13.71,-1.82 13.11,-1.89 L5.71,-1.93","0 17.64 M14.75,-0.46 Q7.29,-0.46 7.29,-0.46 Q6.18,-0.75 5.64,-0.93 Q4.79,-1.32 4.36,-1.71 Q3.39,-2.75 3.11,-3.32 Q2.68,-4.43 2.61,-5.07 Q2.54,-6.54 2.61,-7.18 Q2.89,-8.43 3.11,-8.93 Q3.61,-9.86 3.96,-10.21 Q4.71,-10.89 5.18,-11.14 Q6.32,-11.54 6.68,-11.64 Q8.00,-11.79 8.18,-11.79 L14.75,-11.75 L14.75,9.43M2.07,9.46 L7.32,-0.57","0 17.40 M3.54,-11.96 L3.57,9.25 Q10.93,9.21 10.93,9.21 Q12.25,9.04 12.79,8.86 Q13.71,8.46 14.14,8.07 Q15.14,6.93 15.43,6.39 Q15.79,5.36 15.89,4.82 Q16.00,3.75 15.96,3.18 Q15.89,1.96 15.64,1.36 Q15.00,0.11 14.54,-0.39 Q13.39,-1.29 12.79,-1.54 Q11.50,-1.89 10.89,-1.96 L3.57,-1.93","0 19.40 M16.43,-11.93 L16.43,9.25M3.57,-11.96 L3.57,9.25 L18.71,9.25 L18.71,13.57 L18.82,13.64","0 15.17 M3.00,-5.46 Q4.57,-5.93 5.14,-6.04 Q5.93,-6.18 6.50,-6.21 Q8.04,-6.29 8.64,-6.21 Q9.75,-6.00 10.18,-5.82 Q10.93,-5.39 11.21,-5.11 Q11.68,-4.54 11.86,-4.04 Q12.18,-3.32 12.25,-2.07 Q12.25,2.21 12.25,3.46 Q12.29,4.46 12.29,5.46 Q12.25,7.96 12.25,9.46M12.21,4.57 Q11.86,5.86 11.57,6.39 Q10.93,7.39 10.50,7.82 Q9.57,8.61 9.07,8.89 Q7.93,9.32 7.43,9.43 Q6.54,9.54 6.11,9.54 Q4.71,9.36 4.21,9.21 Q3.46,8.82 3.18,8.57 Q2.68,8.11 2.46,7.68 Q2.00,6.68 1.96,6.07 Q2.00,4.54 2.14,4.00 Q2.50,3.18 2.75,2.82 Q3.21,2.21 3.71,1.93 Q5.18,1.36 5.68,1.21 Q6.21,1.11 6.68,1.11 Q7.61,1.04 8.54,1.11 Q10.86,1.29 12.25,1.43","0 16.57 M2.93,0.43 Q3.18,-1.00 3.39,-1.64 Q3.89,-2.89 4.25,-3.39 Q5.00,-4.36 5.50,-4.68 Q6.57,-5.25 7.21,-5.39 Q8.61,-5.64 9.25,-5.61 Q10.57,-5.46 11.14,-5.25 Q12.18,-4.71 12.61,-4.32 Q13.43,-3.36 13.68,-2.89 Q14.07,-2.04 14.18,-1.64 Q14.32,-1.00 14.39,-0.54 Q14.54,0.54 14.57,1.11 Q14.61,2.25 14.57,2.82 Q14.50,3.89 14.39,4.46 Q14.18,5.64 13.93,6.21 Q13.36,7.43 13.00,7.86 Q12.36,8.54 11.89,8.79 Q10.68,9.32 10.18,9.43 Q9.25,9.54 8.82,9.54 Q7.46,9.43 6.86,9.25 Q5.71,8.79 5.25,8.43 Q4.36,7.64 4.04,7.07 Q3.39,5.61 3.21,5.04 Q3.07,4.21 3.00,3.71 Q2.89,2.54 2.89,1.96 Q2.96,0.68 2.93,0.25 Q2.82,-0.25 2.79,-0.64 Q2.75,-1.54 2.79,-2.18 Q2.86,-3.82 2.96,-4.57 Q3.21,-6.07 3.43,-6.71 Q3.89,-7.93 4.25,-8.39 Q5.14,-9.25 5.54,-9.54 Q6.25,-10.00 6.61,-10.14 Q6.75,-10.25 7.68,-10.50 Q11.25,-11.32 12.11,-11.54 Q12.71,-11.79 12.89,-11.89 Q13.14,-12.00 13.25,-12.11 Q13.43,-12.32 13.54,-12.46 Q13.71,-12.86 13.82,-13.07","0 13.71 M3.93,1.54 L11.11,1.54M1.57,8.71 Q2.61,9.21 3.21,9.32 Q4.43,9.54 5.07,9.54 Q6.54,9.43 7.11,9.29 Q8.04,8.96 8.50,8.61 Q9.61,7.50 9.93,7.04 Q10.36,6.21 10.50,5.86 Q10.68,5.32 10.75,4.93 Q10.89,4.14 10.96,3.54 Q11.07,2.04 11.07,1.32 Q11.04,-0.11 10.93,-0.75 Q10.71,-1.96 10.50,-2.54 Q10.00,-3.75 9.61,-4.25 Q8.75,-5.18 8.25,-5.50 Q7.07,-6.00 6.54,-6.14 Q5.57,-6.25 5.14,-6.25 Q4.00,-6.21 3.46,-6.11 Q2.43,-5.82 1.93,-5.64","0 16.21 M1.07,13.25 L1.07,9.25 L14.89,9.25 L14.89,13.25M2.54,9.25 Q2.89,8.43 3.04,8.04 Q3.25,7.36 3.36,6.89 Q3.61,5.82 3.71,5.21 L4.75,-5.96 L13.04,-5.96 L13.04,9.25","0 16.76 M3.07,-6.18 L3.18,9.29 L14.04,-6.07 L14.14,9.43M5.50,-11.11 Q6.07,-10.43 6.75,-10.21 Q8.07,-9.64 8.71,-9.68 Q10.21,-9.93 10.68,-10.14 Q11.86,-10.86 12.14,-11.14","0 21.45 M11.50,-12.86 L11.54,16.86M11.32,8.64 Q11.36,8.54 11.75,8.64 Q13.04,9.18 13.68,9.32 Q14.96,9.54 15.61,9.54 Q16.96,9.43 17.46,9.29 Q18.25,8.96 18.61,8.64 Q19.39,7.71 19.64,7.32 Q20.04,6.54 20.14,6.18 Q20.32,5.57 20.39,5.11 Q20.57,4.07 20.61,3.50 Q20.68,2.25 20.68,1.64 Q20.64,0.36 20.61,-0.21 Q20.50,-1.29 20.39,-1.82 Q20.14,-2.96 19.93,-3.50 Q19.32,-4.61 19.00,-4.96 Q18.50,-5.54 18.00,-5.75 Q16.79,-6.11 16.04,-6.25 Q14.68,-6.25 14.04,-6.14 Q12.64,-5.75 12.25,-5.64 Q11.61,-5.07 11.54,-5.00 Q10.93,-5.64 10.39,-5.79 Q8.96,-6.14 8.46,-6.21 Q7.71,-6.25 7.46,-6.25 Q6.11,-6.14 5.61,-6.00 Q4.79,-5.68 4.43,-5.36 Q3.64,-4.43 3.39,-4.04 Q3.00,-3.25 2.89,-2.89 Q2.71,-2.29 2.64,-1.82 Q2.46,-0.79 2.43,-0.21 Q2.36,1.04 2.36,1.64 Q2.39,2.89 2.43,3.46 Q2.54,4.57 2.64,5.11 Q2.93,6.25 3.14,6.79 Q3.71,7.86 4.04,8.25 Q4.68,8.86 5.11,9.07 Q6.14,9.43 6.71,9.50 Q7.79,9.57 8.43,9.50 Q10.07,9.11 10.50,9.00 Q10.82,8.89 10.96,8.82 Z","0 12.36 M3.07,9.46 L3.07,-5.96 L10.71,-5.96","0 21.00 M1.11,9.46 L6.82,1.18 L1.86,-6.18M11.25,9.46 L11.25,-6.14M15.57,1.32 L20.61,-6.18M6.82,1.29 L15.50,1.29 L21.46,9.43","0 16.76 M3.07,-6.04 L3.18,9.25 L14.04,-6.04 L14.14,9.32","0 15.33 M2.14,-6.14 Q2.07,-2.18 2.14,-1.04 Q2.29,0.14 2.46,0.61 Q2.86,1.43 3.14,1.71 Q3.71,2.25 4.18,2.43 Q5.36,2.79 5.86,2.86 Q6.68,2.93 7.11,2.93 Q7.82,2.93 8.32,2.86 Q9.61,2.64 10.18,2.46 Q11.39,1.89 11.75,1.71 Q12.25,1.46 12.36,1.36M12.36,9.43 L12.36,-6.14","0 14.79 M3.07,-6.21 L3.07,9.46M3.07,1.29 L7.46,1.29 L13.75,9.43M7.50,1.32 L12.89,-6.18","0 16.07 M0.71,9.32 Q1.21,9.50 1.43,9.46 Q2.04,9.46 2.18,9.39 Q2.46,9.25 2.64,9.04 Q3.18,8.43 3.39,7.89 Q3.75,6.71 3.93,5.86 Q4.25,3.89 4.39,2.79 L5.11,-5.96 L13.29,-5.96 L13.29,9.43 L13.32,9.50","0 19.07 M3.04,9.43 L3.04,-6.14 L9.89,5.39 L16.96,-6.14 L17.00,9.43","0 16.33 M3.07,-6.18 L3.07,9.46M3.07,1.36 L13.61,1.36M13.57,9.43 L13.61,-6.18","0 15.81 M3.82,7.75 Q4.57,8.54 5.07,8.82 Q6.11,9.32 6.71,9.43 Q8.04,9.61 8.64,9.54 Q9.96,9.29 10.43,9.11 Q11.04,8.89 11.43,8.54 Q12.43,7.39 12.71,6.89 Q13.11,6.04 13.21,5.61 Q13.39,4.93 13.46,4.43 Q13.61,3.25 13.64,2.61 Q13.68,1.32 13.64,0.68 Q13.54,-0.61 13.46,-1.14 Q13.36,-1.96 13.18,-2.50 Q12.61,-3.86 12.29,-4.36 Q11.64,-5.11 11.18,-5.39 Q10.07,-5.96 9.61,-6.11 Q8.71,-6.25 8.32,-6.25 Q6.96,-6.25 6.39,-6.11 Q5.39,-5.79 4.93,-5.46 Q3.89,-4.64 3.54,-4.11 Q2.96,-2.82 2.79,-2.32 Q2.61,-1.64 2.54,-1.14 Q2.39,0.04 2.36,0.68 Q2.32,1.96 2.36,2.61 Q2.43,3.82 2.54,4.43 Q2.82,5.79 3.00,6.29 Q3.39,7.14 3.54,7.39 Z","0 16.07 M3.07,9.39 L3.07,-5.96 L13.29,-5.96 L13.29,9.46","0 22.38 M3.07,-6.14 L3.07,9.25 L21.14,9.25 L21.14,-6.18M12.07,-6.18 L12.07,9.25","0 16.21 M3.11,-6.14 L3.11,-1.25M3.07,16.93 Q3.11,4.75 3.11,4.75 Q3.11,5.21 3.11,4.25 Q3.11,1.29 3.11,0.32 Q3.00,-1.11 3.14,-1.54 Q3.64,-2.89 4.00,-3.50 Q4.82,-4.68 5.32,-5.11 Q6.50,-5.89 7.07,-6.07 Q8.21,-6.29 8.82,-6.25 Q10.14,-6.07 10.68,-5.89 Q11.57,-5.50 11.96,-5.14 Q12.82,-4.18 13.11,-3.71 Q13.54,-2.75 13.68,-2.29 Q13.89,-1.46 13.96,-0.96 Q14.11,0.14 14.14,0.71 Q14.18,1.96 14.14,2.54 Q14.11,3.46 14.00,4.07 Q13.75,5.54 13.54,6.14 Q12.96,7.32 12.64,7.75 Q12.00,8.50 11.54,8.79 Q10.43,9.29 9.96,9.39 Q9.07,9.54 8.68,9.54 Q7.18,9.36 6.54,9.07 Q5.18,8.21 4.75,7.82 Q4.21,7.07 3.93,6.71 Q3.39,5.11 3.11,4.75","0 13.62 M11.36,-5.68 Q10.07,-6.11 9.50,-6.18 Q8.39,-6.25 7.89,-6.25 Q6.54,-6.11 5.96,-5.89 Q4.89,-5.32 4.46,-4.96 Q3.68,-4.11 3.43,-3.68 Q3.00,-2.79 2.86,-2.43 Q2.71,-1.93 2.64,-1.54 Q2.43,-0.64 2.39,-0.11 Q2.32,1.04 2.32,1.64 Q2.36,2.93 2.43,3.46 Q2.54,4.32 2.64,4.82 Q2.89,5.86 3.14,6.36 Q3.75,7.50 4.14,7.93 Q4.89,8.64 5.39,8.89 Q6.68,9.36 7.21,9.46 Q8.14,9.54 8.68,9.50 Q9.89,9.39 10.39,9.25 Q11.29,8.93 11.71,8.71","0 13.05 M1.00,-6.00 L11.61,-5.96M6.29,-5.96 L6.29,9.43","0 21.29 M3.07,-6.14 L3.07,9.46M3.07,1.75 L8.89,1.75M8.89,1.57 Q8.89,2.18 8.93,2.61 Q8.96,3.61 9.07,4.21 Q9.39,5.71 9.61,6.29 Q10.07,7.32 10.43,7.75 Q11.21,8.54 11.71,8.82 Q12.79,9.32 13.39,9.43 Q14.79,9.57 15.43,9.50 Q16.68,9.29 17.21,9.07 Q18.21,8.54 18.61,8.18 Q19.29,7.46 19.57,6.89 Q20.11,5.43 20.25,4.86 Q20.39,4.07 20.43,3.54 Q20.50,2.29 20.50,1.64 Q20.50,0.32 20.43,-0.25 Q20.29,-1.25 20.18,-1.75 Q19.96,-2.82 19.71,-3.32 Q19.11,-4.32 18.75,-4.71 Q18.00,-5.43 17.50,-5.68 Q16.11,-6.07 15.71,-6.18 Q15.21,-6.29 15.07,-6.25 Q13.71,-6.21 13.11,-6.07 Q12.00,-5.75 11.50,-5.43 Q10.57,-4.68 10.21,-4.14 Q9.50,-2.64 9.32,-2.11 Q9.14,-1.54 9.07,-0.93 Z","0 15.21 M3.07,1.50 Q8.71,1.50 8.71,1.50 Q10.18,1.14 10.64,0.96 Q11.21,0.57 11.46,0.36 Q11.89,-0.04 12.04,-0.43 Q12.39,-1.43 12.43,-1.93 Q12.39,-3.04 12.29,-3.50 Q11.96,-4.36 11.71,-4.68 Q11.25,-5.18 10.89,-5.39 Q9.96,-5.75 9.61,-5.86 Q9.07,-5.96 8.86,-5.96 L3.07,-5.96 L3.07,9.25 Q9.29,9.25 9.29,9.25 Q10.61,9.04 11.04,8.89 Q11.64,8.57 11.89,8.36 Q12.39,7.86 12.57,7.54 Q12.93,6.86 12.96,6.32 Q12.96,4.75 12.86,4.21 Q12.61,3.43 12.36,3.07 Q11.71,2.36 11.32,2.11 Q10.32,1.71 9.89,1.61 Q9.14,1.50 8.79,1.46","0 22.71 M12.07,-6.18 L12.07,9.25M21.14,-6.18 L21.14,9.25M3.11,-6.29 L3.07,9.25 L23.04,9.25 L23.04,13.25","0 14.31 M1.39,9.46 L12.68,-6.18M1.46,-6.18 L6.96,1.29 L12.75,9.46","0 15.31 M2.46,16.46 Q3.14,16.75 3.50,16.75 Q4.29,16.68 4.46,16.57 Q4.96,16.39 5.25,16.00 Q5.96,14.86 6.36,14.11 L14.00,-6.21M1.29,-6.18 L8.11,9.57","0 13.74 M4.25,1.54 L6.93,1.57M1.61,8.93 Q1.54,8.89 1.86,8.96 Q2.89,9.29 3.32,9.36 Q4.00,9.46 4.39,9.50 Q5.14,9.54 5.57,9.54 Q6.36,9.54 6.86,9.46 Q8.07,9.32 8.57,9.14 Q9.46,8.79 9.82,8.50 Q10.43,7.96 10.64,7.54 Q11.07,6.36 11.14,5.86 Q11.14,4.89 11.04,4.46 Q10.79,3.68 10.57,3.36 Q10.11,2.75 9.68,2.46 Q8.36,1.89 8.00,1.75 Q6.79,1.54 6.75,1.57 Q7.71,1.29 7.71,1.29 Q8.71,1.00 9.11,0.79 Q9.75,0.32 10.00,0.04 Q10.46,-0.54 10.57,-1.04 Q10.71,-2.46 10.68,-3.00 Q10.54,-3.86 10.36,-4.21 Q9.96,-4.86 9.68,-5.14 Q9.11,-5.64 8.61,-5.82 Q7.32,-6.14 6.57,-6.25 Q5.75,-6.29 5.29,-6.25 Q4.39,-6.21 3.82,-6.11 Q2.61,-5.86 1.93,-5.68","0 15.10 M2.36,1.54 Q12.75,1.54 12.75,1.54 Q12.79,1.54 12.82,1.14 Q13.00,-0.11 13.00,-0.75 Q12.96,-2.11 12.82,-2.71 Q12.36,-3.96 12.07,-4.43 Q11.46,-5.14 11.07,-5.43 Q10.29,-5.93 9.71,-6.07 Q8.43,-6.21 7.71,-6.25 Q6.54,-6.14 5.96,-5.89 Q4.75,-5.21 4.29,-4.79 Q3.46,-3.75 3.21,-3.25 Q2.86,-2.25 2.71,-1.79 Q2.54,-1.04 2.46,-0.43 Q2.36,1.21 2.36,1.75 Q2.36,2.25 2.39,2.71 Q2.43,3.79 2.57,4.43 Q2.93,5.96 3.18,6.57 Q3.75,7.64 4.11,8.04 Q4.86,8.71 5.32,8.96 Q6.50,9.36 7.00,9.46 Q7.89,9.54 8.43,9.50 Q9.71,9.32 10.25,9.18 Q11.21,8.86 11.57,8.68 Q12.14,8.32 12.36,8.14","0 16.36 M0.96,-5.96 L4.71,-5.96 L4.75,9.25 Q11.11,9.25 11.11,9.25 Q12.29,9.07 12.68,8.93 Q13.21,8.68 13.50,8.39 Q14.14,7.75 14.36,7.25 Q14.71,5.96 14.75,5.32 Q14.64,4.00 14.50,3.50 Q14.11,2.68 13.89,2.39 Q13.50,1.93 13.14,1.71 Q12.11,1.29 11.79,1.18 Q11.29,1.11 11.11,1.11 L4.75,1.11","0 15.31 M1.89,9.46 L5.82,2.29M12.32,2.36 Q6.43,2.32 6.43,2.32 Q5.07,2.14 4.61,1.96 Q3.89,1.57 3.61,1.32 Q3.07,0.86 2.89,0.39 Q2.54,-0.75 2.50,-1.39 Q2.57,-2.86 2.68,-3.36 Q2.96,-4.18 3.21,-4.50 Q3.68,-5.07 4.07,-5.29 Q5.18,-5.75 5.57,-5.86 Q6.18,-5.96 6.43,-5.96 L12.32,-5.96 L12.32,9.46","0 14.98 M3.07,-6.18 L3.07,9.25 Q9.43,9.25 9.43,9.25 Q10.57,9.07 10.96,8.93 Q11.54,8.68 11.82,8.39 Q12.46,7.75 12.68,7.25 Q13.00,5.96 13.04,5.32 Q12.96,4.00 12.82,3.50 Q12.43,2.68 12.21,2.39 Q11.82,1.93 11.46,1.71 Q10.79,1.36 10.46,1.25 Q9.61,1.11 9.43,1.11 L3.07,1.11","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04","0 18.21 M4.71,-2.25 L12.32,-7.82M12.32,-7.82 L11.50,-10.46 Q9.32,-10.64 9.32,-10.64 Q8.82,-10.68 8.36,-10.64 Q6.89,-10.54 6.46,-10.46 Q6.21,-10.36 5.71,-10.32 Q4.29,-10.32 3.39,-10.32 Q3.46,-8.86 3.46,-8.39 Q3.46,-7.71 3.46,-7.50 Q5.21,0.00 5.21,0.00 Q4.93,1.07 4.82,1.93 Q4.68,4.36 4.64,5.21 Q4.64,6.57 4.64,7.04 L6.64,8.25 Q13.04,8.25 13.04,8.25 Q13.07,6.04 13.04,5.21 Q12.96,3.86 12.93,3.32 Q14.64,-2.43 14.64,-2.43 Q15.04,-3.68 15.14,-4.29 Q15.25,-5.46 15.21,-6.07 Q15.07,-7.25 14.93,-7.86M8.54,5.04 L8.54,5.04",]
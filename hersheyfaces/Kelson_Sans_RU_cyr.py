@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["0 8.98","0 7.45 M2.00,8.25 L3.82,9.57M2.82,-13.11 L2.82,6.32","0 7.74 M1.68,-8.04 L1.75,-13.11M4.46,-8.04 L4.50,-13.11","0 17.71 M1.07,2.00 L16.04,2.00M2.57,-5.36 L17.50,-5.36M10.79,9.93 L15.39,-12.79M3.04,9.93 L7.68,-12.79","0 19.05 M2.86,-13.04 Q2.86,9.21 2.86,9.21 Q6.86,9.25 8.07,9.18 Q9.61,9.00 10.07,8.86 Q10.64,8.61 10.89,8.39 Q11.32,8.14 11.54,7.68 Q12.07,6.18 12.21,5.61 Q12.29,5.04 12.32,4.21 Q12.36,1.50 12.32,0.64 Q12.32,-0.29 12.18,-0.82 Q11.79,-2.21 11.57,-2.64 Q11.21,-3.18 10.89,-3.43 Q10.07,-3.93 9.57,-4.07 Q8.96,-4.25 7.86,-4.29 Q4.79,-4.29 2.86,-4.29M17.32,-13.04 L17.32,9.93","0 14.90 M2.50,-7.36 L2.50,9.25 L13.46,9.25 L13.46,13.25M11.79,-7.36 L11.79,9.25","0 17.95 M2.50,-7.36 Q2.50,9.25 2.50,9.25 Q6.39,9.29 7.54,9.21 Q8.96,9.00 9.43,8.86 Q10.14,8.57 10.43,8.32 Q10.96,7.79 11.18,7.39 Q11.54,6.54 11.64,6.00 Q11.79,4.82 11.71,4.21 Q11.50,2.89 11.32,2.43 Q11.07,1.82 10.75,1.54 Q9.82,0.82 9.39,0.64 Q8.61,0.39 8.21,0.36 L2.50,0.25M16.32,-7.36 L16.32,9.93","0 5.74 M1.68,-8.04 L1.75,-13.11","0 8.00 M5.57,-12.68 Q4.39,-12.54 4.07,-12.46 Q3.86,-12.39 3.71,-12.29 Q3.43,-12.14 3.25,-11.89 Q2.89,-11.36 2.75,-10.86 Q2.57,-9.61 2.50,-8.86 Q2.50,7.21 2.50,7.21 Q2.64,8.71 2.75,9.18 Q3.00,9.89 3.14,10.11 Q3.36,10.43 3.57,10.57 Q4.21,10.89 4.54,10.96 Q5.21,11.04 5.57,11.04","0 8.21 M0.93,-12.68 Q2.07,-12.54 2.39,-12.46 Q2.79,-12.29 2.93,-12.18 Q3.21,-11.96 3.36,-11.75 Q3.64,-11.29 3.75,-10.82 Q3.89,-9.61 3.96,-8.86 Q3.96,7.21 3.96,7.21 Q3.86,8.82 3.71,9.32 Q3.36,10.04 3.21,10.25 Q2.93,10.54 2.79,10.64 Q2.71,10.75 2.39,10.82 Q1.54,10.96 0.93,11.04","0 8.81 M1.39,-7.86 Q2.64,-9.04 3.18,-9.61 Q4.07,-10.75 4.57,-11.25 Q5.61,-12.21 6.14,-12.64M1.43,-12.64 L3.25,-10.82 L4.29,-10.79 L4.25,-10.79M3.64,-10.11 L3.75,-10.00 L3.79,-10.79M3.54,-10.00 Q3.96,-10.00 4.39,-9.64 Q5.46,-8.61 6.11,-7.89","0 12.98 M1.00,-1.50 L11.36,-1.50M6.18,-6.68 L6.18,3.68","0 6.48 M0.29,13.36 Q1.14,12.75 1.43,12.46 Q1.86,11.96 2.00,11.57 Q2.18,10.68 2.21,10.21 Q2.25,9.25 2.25,8.75","0 12.67 M1.82,0.57 L10.43,0.57","0 6.81 M1.71,8.25 L3.57,9.46","0 11.60 M1.89,10.25 L8.75,-12.96","0 14.19 M6.61,9.39 Q5.21,9.21 4.68,9.04 Q3.79,8.54 3.46,8.21 Q2.89,7.46 2.71,7.07 Q2.46,6.21 2.39,5.86 Q2.29,5.18 2.29,4.86 Q2.32,-8.75 2.32,-8.75 Q2.64,-10.14 2.86,-10.61 Q3.25,-11.25 3.57,-11.54 Q4.29,-12.07 4.86,-12.25 Q6.25,-12.54 6.96,-12.54 Q8.57,-12.43 9.14,-12.29 Q10.07,-11.89 10.43,-11.64 Q10.96,-11.18 11.18,-10.79 Q11.61,-9.68 11.71,-9.29 Q11.82,-8.61 11.82,-8.32 Q11.75,5.79 11.75,5.79 Q11.39,7.07 11.21,7.50 Q10.93,8.07 10.61,8.32 Q9.82,8.89 9.32,9.07 Q8.00,9.36 7.54,9.39 Z","0 12.40 M0.71,9.25 L11.29,9.25M1.50,-12.32 L6.18,-12.32 L6.18,9.25","0 15.02 M2.21,-7.14 Q2.25,-8.46 2.43,-9.07 Q2.96,-10.39 3.29,-10.86 Q3.96,-11.57 4.43,-11.82 Q5.46,-12.29 6.00,-12.39 Q7.11,-12.57 7.71,-12.54 Q9.11,-12.39 9.64,-12.21 Q10.61,-11.86 11.00,-11.54 Q11.79,-10.79 12.07,-10.32 Q12.54,-9.25 12.68,-8.68 Q12.86,-7.54 12.86,-6.86 Q12.79,-5.32 12.61,-4.71 Q12.21,-3.71 11.86,-3.21 Q10.75,-2.14 10.36,-1.82 Q10.32,-1.71 9.43,-1.25 Q6.00,0.36 5.00,0.93 Q3.82,1.79 3.46,2.18 Q3.00,2.82 2.82,3.21 Q2.57,3.54 2.50,4.54 Q2.43,7.36 2.43,9.18 L13.79,9.18","0 14.26 M1.61,-12.29 L11.46,-12.29 L6.54,-3.82 Q6.14,-2.82 6.14,-2.82 Q7.36,-2.82 7.93,-2.71 Q9.07,-2.43 9.54,-2.21 Q10.36,-1.71 10.71,-1.32 Q11.39,-0.39 11.61,0.07 Q11.86,0.82 11.96,1.36 Q12.18,2.64 12.18,3.36 Q12.11,4.93 11.96,5.57 Q11.54,6.89 11.32,7.32 Q11.04,7.89 10.68,8.14 Q9.86,8.71 9.29,8.89 Q7.82,9.18 7.32,9.25 Q6.54,9.29 6.25,9.25 Q4.96,9.11 4.54,8.96 Q3.93,8.75 3.61,8.50 Q2.93,7.93 2.64,7.43 Q2.11,5.93 1.96,5.39 Q1.86,4.50 1.89,4.14","0 15.83 M11.21,9.93 L11.21,2.93 L11.25,-12.18 L10.32,-12.18 L0.89,3.21 L1.07,3.64 L14.32,3.64","0 14.21 M1.89,4.32 Q2.00,5.82 2.14,6.39 Q2.50,7.36 2.75,7.71 Q3.21,8.29 3.57,8.50 Q4.43,8.93 4.96,9.07 Q6.18,9.25 6.79,9.25 Q8.07,9.25 8.68,9.14 Q9.93,8.79 10.32,8.57 Q10.79,8.25 11.04,7.93 Q11.57,7.07 11.75,6.61 Q11.93,5.64 12.00,5.18 Q12.07,4.68 12.07,3.82 Q12.07,1.07 12.04,0.14 Q11.93,-1.18 11.79,-1.71 Q11.36,-2.79 11.14,-3.11 Q10.86,-3.50 10.50,-3.71 Q9.29,-4.25 8.89,-4.39 Q9.18,-4.46 8.11,-4.50 Q4.79,-4.54 2.54,-4.54 L2.54,-12.29 L11.89,-12.29","0 14.38 M2.96,-4.04 Q4.07,-5.18 4.50,-5.50 Q5.14,-5.89 5.61,-6.04 Q6.64,-6.29 7.25,-6.29 Q8.82,-6.14 9.32,-6.04 Q10.00,-5.75 10.29,-5.57 Q10.75,-5.25 10.96,-4.89 Q11.46,-4.00 11.61,-3.39 Q11.82,-2.00 11.89,-1.21 Q11.86,4.43 11.86,4.43 Q11.75,5.86 11.61,6.43 Q11.21,7.54 11.00,7.89 Q10.61,8.39 10.29,8.61 Q9.54,9.11 8.96,9.25 Q7.68,9.39 6.93,9.43 Q5.54,9.29 5.07,9.18 Q4.46,9.00 4.18,8.82 Q3.64,8.50 3.39,8.14 Q2.86,7.14 2.71,6.75 Q2.57,6.18 2.54,5.79 Q2.46,4.89 2.43,4.36 Q2.46,-1.75 2.46,-1.75 Q2.64,-2.96 2.75,-3.46 Q3.00,-4.14 3.18,-4.68 Q3.57,-5.96 3.89,-6.61 Q4.75,-8.04 5.18,-8.64 Q6.04,-9.75 6.39,-10.18 Q6.96,-10.86 7.32,-11.25 Q8.11,-12.21 8.61,-12.50 Q9.71,-12.89 10.29,-13.00","0 13.24 M0.39,-12.36 L11.25,-12.36 L10.96,-11.39 L2.57,9.93","0 15.57 M6.14,-2.50 Q4.82,-3.04 4.39,-3.29 Q3.86,-3.71 3.64,-3.96 Q3.32,-4.50 3.18,-4.86 Q2.96,-5.71 2.89,-6.14 Q2.82,-6.82 2.86,-7.39 Q2.93,-8.96 3.07,-9.57 Q3.50,-10.64 3.71,-11.00 Q4.04,-11.46 4.36,-11.68 Q5.25,-12.18 5.71,-12.32 Q6.64,-12.54 7.21,-12.54 Q8.61,-12.54 9.18,-12.43 Q10.36,-12.04 10.71,-11.89 Q11.07,-11.71 11.25,-11.50 Q11.68,-11.07 11.86,-10.61 Q12.21,-9.25 12.29,-8.71 Q12.32,-7.86 12.32,-7.36 Q12.29,-6.14 12.21,-5.64 Q12.00,-4.82 11.82,-4.46 Q11.54,-3.82 11.07,-3.54 Q9.61,-2.89 9.04,-2.75 Q8.11,-2.61 7.71,-2.64 Q7.07,-2.68 7.07,-2.68 Q5.32,-2.39 4.75,-2.21 Q3.96,-1.82 3.64,-1.57 Q3.11,-1.14 2.86,-0.75 Q2.39,0.32 2.25,0.71 Q2.11,1.25 2.07,1.64 Q1.96,2.50 1.96,3.11 Q2.00,4.64 2.11,5.29 Q2.36,6.39 2.61,6.89 Q3.18,7.86 3.64,8.21 Q4.82,8.89 5.39,9.07 Q6.57,9.25 7.07,9.29 Q7.89,9.32 8.43,9.29 Q9.79,9.18 10.36,9.04 Q11.46,8.61 11.82,8.36 Q12.32,8.00 12.57,7.61 Q13.07,6.64 13.21,6.04 Q13.43,4.46 13.46,3.93 Q13.50,3.25 13.46,2.75 Q13.36,1.46 13.21,0.86 Q12.82,-0.32 12.54,-0.79 Q12.07,-1.50 11.46,-1.82 Q9.79,-2.43 8.79,-2.71","0 14.38 M4.00,9.86 Q5.68,9.14 6.25,8.79 Q7.04,8.04 7.39,7.64 Q8.11,6.82 8.43,6.39 Q9.07,5.57 9.39,5.07 Q10.11,4.07 10.39,3.46 Q10.93,2.07 11.11,1.54 Q11.43,0.71 11.54,0.32 Q11.68,-0.04 11.75,-0.75 Q11.86,-2.89 11.89,-4.04 Q11.89,-6.68 11.86,-7.50 Q11.86,-8.36 11.75,-8.93 Q11.32,-10.43 11.14,-10.86 Q10.82,-11.39 10.57,-11.61 Q10.21,-12.00 9.71,-12.18 Q8.39,-12.43 7.61,-12.57 Q6.54,-12.61 5.96,-12.50 Q4.68,-12.14 4.25,-11.93 Q3.75,-11.64 3.50,-11.29 Q2.89,-10.25 2.75,-9.86 Q2.64,-9.39 2.57,-9.00 Q2.46,-8.11 2.43,-7.57 Q2.43,-1.89 2.43,-1.89 Q2.43,-1.00 2.54,-0.46 Q2.93,0.96 3.11,1.39 Q3.39,1.89 3.68,2.14 Q4.32,2.68 4.82,2.86 Q6.11,3.14 6.79,3.14 Q8.32,3.00 8.82,2.86 Q9.36,2.68 9.79,2.36 Q10.75,1.46 11.32,0.89","0 6.81 M1.64,-1.96 L3.50,-0.68M1.71,7.96 L3.57,9.18","0 6.81 M0.64,13.36 Q1.50,12.75 1.79,12.46 Q2.21,11.96 2.36,11.57 Q2.54,10.68 2.57,10.21 Q2.61,9.25 2.61,8.75M1.64,-1.96 L3.50,-0.68","0 11.02 M7.79,-5.21 L2.32,0.00 L7.79,5.46","0 14.67 M2.32,-2.39 L12.25,-2.39M2.32,2.64 L12.25,2.64","0 11.07 M2.32,5.46 L7.79,0.00 L2.32,-5.21","0 13.60 M1.57,-8.14 Q1.75,-9.75 1.89,-10.25 Q2.14,-10.86 2.36,-11.14 Q2.71,-11.64 3.18,-11.89 Q4.54,-12.43 5.14,-12.57 Q6.21,-12.68 6.82,-12.64 Q8.21,-12.43 8.68,-12.29 Q9.25,-12.07 9.50,-11.86 Q10.00,-11.46 10.21,-11.11 Q10.68,-10.29 10.82,-9.75 Q11.00,-8.89 11.04,-7.96 Q11.07,-5.14 11.00,-4.21 Q10.71,-2.96 10.50,-2.46 Q9.86,-1.43 9.61,-1.14 Q9.43,-0.96 9.07,-0.64 Q7.89,0.25 7.39,0.71 Q6.50,1.64 6.18,2.18 Q5.68,3.43 5.57,3.96 Q5.46,4.96 5.46,5.43M4.57,8.25 L6.43,9.46","0 18.43 M12.32,14.00 Q5.25,13.89 5.25,13.89 Q4.07,13.61 3.68,13.39 Q3.04,12.89 2.82,12.61 Q2.46,12.11 2.36,11.68 Q2.18,10.57 2.11,9.93 Q2.18,-3.18 2.18,-3.18 Q2.50,-4.75 2.68,-5.21 Q3.07,-5.79 3.29,-6.00 Q3.71,-6.36 4.04,-6.50 Q4.89,-6.75 5.29,-6.82 Q6.11,-6.93 6.50,-6.93 Q13.39,-6.89 13.39,-6.89 Q14.86,-6.61 15.25,-6.50 Q15.57,-6.39 15.79,-6.21 Q16.29,-5.86 16.50,-5.46 Q16.93,-4.32 17.04,-3.82 Q17.18,-2.86 17.18,-2.43 Q17.14,7.29 17.14,7.29 Q17.14,7.64 17.07,7.82 Q16.93,8.18 16.82,8.36 Q16.54,8.71 16.36,8.82 Q16.04,9.00 15.86,9.07 Q15.46,9.14 15.25,9.18 Q14.79,9.18 14.54,9.14 Q13.93,9.00 13.71,8.89 Q13.39,8.68 13.25,8.46 Q13.00,8.00 12.86,7.61 Q12.54,6.46 12.50,6.11 Q12.50,5.61 12.57,5.46 Q12.61,-1.14 12.61,-1.14 Q10.25,-1.21 9.46,-1.14 Q8.36,-0.96 7.96,-0.79 Q7.32,-0.43 7.07,-0.18 Q6.64,0.39 6.50,0.71 Q6.32,0.89 6.29,1.71 Q6.25,4.79 6.29,5.64 Q6.43,6.50 6.50,6.79 Q6.71,7.25 6.82,7.39 Q6.93,7.61 7.18,7.75 Q7.71,8.14 8.21,8.21 Q9.71,8.29 10.21,8.21 Q10.96,7.93 11.18,7.79 Q11.36,7.71 11.57,7.43 Q12.14,6.61 12.50,6.07","0 14.17 M1.04,9.93 L6.57,-11.96 L7.43,-11.96 L12.89,9.93M2.68,3.57 L11.25,3.57","0 14.60 M2.54,-2.50 Q6.32,-2.50 7.54,-2.43 Q9.21,-2.29 9.75,-2.14 Q10.54,-1.86 10.86,-1.68 Q11.43,-1.32 11.68,-0.96 Q12.21,0.00 12.39,0.57 Q12.61,2.00 12.64,2.54 Q12.68,3.25 12.64,3.82 Q12.57,5.32 12.43,5.93 Q12.00,7.07 11.79,7.43 Q11.43,7.93 11.04,8.18 Q10.00,8.71 9.39,8.86 Q8.46,9.04 7.32,9.07 Q4.32,9.11 2.50,9.11 L2.54,-12.36 L12.07,-12.36","0 15.83 M2.43,3.93 Q2.57,5.43 2.68,6.00 Q2.89,6.96 3.07,7.32 Q3.39,7.93 3.71,8.21 Q4.50,8.82 4.93,9.00 Q5.79,9.25 6.36,9.32 Q7.75,9.43 8.36,9.39 Q9.57,9.29 10.11,9.14 Q11.25,8.71 11.64,8.46 Q12.18,8.11 12.43,7.71 Q13.00,6.46 13.14,6.11 Q13.21,5.89 13.25,5.50 Q13.36,4.50 13.39,3.86 Q13.39,-6.96 13.39,-6.96 Q13.36,-8.00 13.25,-8.57 Q12.96,-9.86 12.75,-10.32 Q12.39,-11.00 12.07,-11.29 Q11.36,-11.89 10.86,-12.11 Q9.50,-12.46 9.00,-12.54 Q8.21,-12.61 7.93,-12.61 Q6.54,-12.54 6.00,-12.46 Q5.11,-12.32 4.68,-12.11 Q3.79,-11.54 3.50,-11.21 Q3.11,-10.79 2.93,-10.25 Q2.57,-8.64 2.50,-8.11 Q2.43,-7.36 2.43,-7.14M6.39,-1.75 L13.46,-1.75","0 16.19 M0.82,13.50 L0.82,9.25 L15.07,9.25 L15.07,13.50M1.71,9.25 Q2.32,8.64 2.68,8.18 Q3.54,7.00 3.82,6.43 Q4.21,5.32 4.36,4.82 Q4.57,4.00 4.64,3.54 Q4.75,2.57 4.79,2.07 L4.89,-12.36 L13.39,-12.36 L13.39,9.25","0 15.19 M2.86,-13.04 L2.75,8.43 L3.64,8.43 L11.68,-11.43 L12.50,-11.43 L12.39,9.93M4.79,-17.89 Q4.89,-17.00 5.00,-16.71 Q5.21,-16.36 5.32,-16.21 Q5.50,-16.00 5.75,-15.86 Q6.29,-15.50 6.82,-15.43 Q8.43,-15.36 8.96,-15.43 Q9.71,-15.68 9.96,-15.82 Q10.32,-16.11 10.46,-16.25 Q10.64,-16.39 10.71,-16.68 Q10.89,-17.43 10.96,-17.89","0 20.26 M6.04,6.68 Q14.64,6.75 14.64,6.75 Q16.07,6.57 16.54,6.46 Q17.14,6.21 17.43,6.04 Q17.93,5.64 18.14,5.29 Q18.57,4.46 18.71,3.89 Q18.93,2.61 18.96,1.93 Q18.96,-5.07 18.96,-5.07 Q18.96,-5.93 18.86,-6.46 Q18.50,-7.86 18.32,-8.29 Q17.96,-8.86 17.71,-9.07 Q17.21,-9.46 16.79,-9.61 Q15.71,-9.86 15.07,-9.96 Q6.86,-10.00 6.86,-10.00 Q5.43,-9.82 4.96,-9.71 Q4.39,-9.50 4.11,-9.32 Q3.57,-8.96 3.36,-8.57 Q2.86,-7.39 2.71,-6.93 Q2.57,-6.14 2.57,-5.82 Q2.54,1.93 2.54,1.93 Q2.71,3.61 2.86,4.14 Q3.11,4.86 3.29,5.14 Q3.68,5.68 3.93,5.89 Q4.54,6.29 4.79,6.39 Q5.11,6.54 5.32,6.57 ZM10.71,-13.14 L10.71,10.04","0 12.45 M2.82,9.93 L2.82,-12.36 L11.11,-12.36","0 20.31 M1.07,-12.32 Q2.00,-12.39 2.29,-12.39 Q2.57,-12.32 2.75,-12.25 Q3.07,-12.14 3.29,-11.96 Q3.71,-11.64 3.96,-11.21 Q4.50,-10.25 4.79,-9.43 Q5.46,-7.14 5.75,-6.29 Q6.21,-4.79 6.54,-4.21 Q7.14,-3.18 7.57,-2.82 Q8.71,-2.18 9.04,-2.04 Q8.93,-2.00 9.46,-2.00 Q11.75,-2.00 12.32,-2.00 Q12.61,-1.96 12.86,-2.04 Q13.46,-2.29 13.79,-2.50 Q14.43,-3.04 14.71,-3.39 Q15.18,-4.14 15.39,-4.61 Q15.75,-5.39 16.04,-6.29 Q16.82,-9.00 17.14,-9.86 Q17.71,-11.11 17.96,-11.50 Q18.54,-12.00 18.75,-12.14 Q19.00,-12.32 19.32,-12.36 Q20.14,-12.36 20.68,-12.32M1.07,9.93 L8.50,-2.29M10.89,-13.04 L10.89,9.93M13.29,-2.25 L20.68,9.93 L20.68,9.93","0 15.19 M2.86,-13.04 L2.75,8.43 L3.64,8.43 L11.68,-11.43 L12.50,-11.43 L12.39,9.93","0 14.95 M2.61,-13.04 Q2.64,-3.82 2.64,-3.82 Q2.75,-2.21 2.89,-1.68 Q3.21,-0.82 3.39,-0.50 Q3.75,0.00 4.04,0.21 Q4.61,0.61 5.04,0.75 Q6.14,1.00 6.61,1.07 Q7.36,1.07 7.79,1.07 Q8.61,1.07 9.11,1.00 Q10.25,0.82 10.75,0.68 Q11.68,0.32 12.11,0.14M12.11,-13.04 L12.11,9.86","0 14.26 M2.71,-13.04 L2.71,9.93M5.96,-2.32 L13.14,9.93 L13.14,9.93M2.71,-2.04 Q4.68,-2.04 5.14,-2.04 Q5.29,-2.00 5.54,-2.11 Q6.18,-2.29 6.54,-2.61 Q7.46,-3.61 7.71,-3.93 Q7.71,-3.61 8.07,-4.61 Q9.43,-8.71 9.89,-9.86 Q10.46,-11.11 10.75,-11.46 Q11.32,-11.93 11.50,-12.07 Q11.68,-12.21 11.93,-12.25 Q12.64,-12.36 12.93,-12.36 Q13.39,-12.29 13.57,-12.25","0 15.81 M0.18,9.21 Q1.50,9.11 1.93,9.00 Q2.50,8.82 2.82,8.50 Q3.64,7.57 3.89,7.14 Q4.21,6.29 4.32,5.89 Q4.50,5.32 4.57,4.82 Q4.68,3.57 4.71,2.86 L4.75,-12.29 L13.21,-12.29 L13.21,9.93","0 16.86 M2.86,9.93 L2.75,-11.21 L3.57,-11.21 L8.54,3.07 L13.79,-11.21 L14.61,-11.21 L14.50,9.93","0 15.17 M2.86,-13.04 L2.86,9.93M12.43,-13.04 L12.43,9.93M2.86,-2.29 L12.43,-2.29","0 16.55 M9.07,9.43 Q10.46,9.32 11.04,9.18 Q12.14,8.79 12.54,8.50 Q13.25,7.89 13.50,7.43 Q13.96,6.21 14.11,5.71 Q14.25,4.82 14.25,4.46 Q14.29,-6.96 14.29,-6.96 Q14.25,-8.07 14.14,-8.64 Q13.86,-9.89 13.68,-10.32 Q13.29,-10.96 13.00,-11.25 Q12.36,-11.82 11.89,-12.04 Q10.68,-12.36 10.21,-12.46 Q9.43,-12.57 9.11,-12.57 Q8.29,-12.61 7.75,-12.57 Q6.50,-12.50 5.93,-12.36 Q4.68,-11.89 4.29,-11.68 Q3.86,-11.43 3.61,-11.04 Q2.96,-9.68 2.82,-9.29 Q2.75,-9.07 2.71,-8.68 Q2.61,-7.64 2.57,-7.00 Q2.54,3.75 2.54,3.75 Q2.57,4.82 2.68,5.39 Q2.96,6.64 3.18,7.11 Q3.64,7.93 4.04,8.25 Q5.04,8.86 5.46,9.04 Q6.29,9.25 6.68,9.32 Q7.36,9.39 7.75,9.43 Z","0 15.17 M2.86,9.96 L2.86,-12.36 L12.39,-12.36 L12.39,9.93","0 21.50 M2.86,-13.04 L2.86,9.21 L20.29,9.21 L20.29,-13.04M11.57,-13.04 L11.57,9.21","0 14.50 M2.86,1.14 Q6.82,1.21 8.00,1.14 Q9.43,0.96 9.89,0.82 Q10.57,0.54 10.82,0.36 Q11.25,0.00 11.46,-0.36 Q11.93,-1.18 12.07,-1.75 Q12.29,-2.79 12.32,-3.71 Q12.36,-6.46 12.36,-7.29 Q12.32,-8.21 12.25,-8.71 Q12.00,-9.86 11.86,-10.25 Q11.50,-10.89 11.29,-11.14 Q10.89,-11.61 10.50,-11.79 Q9.50,-12.11 8.89,-12.25 L2.86,-12.32 L2.86,9.93","0 15.45 M13.57,-7.18 Q13.57,-8.21 13.46,-8.79 Q13.07,-10.18 12.89,-10.64 Q12.64,-11.18 12.32,-11.46 Q11.46,-12.11 11.00,-12.29 Q10.00,-12.54 9.57,-12.61 Q8.82,-12.68 8.46,-12.68 Q7.21,-12.68 6.57,-12.57 Q5.18,-12.21 4.68,-11.96 Q3.89,-11.43 3.61,-11.04 Q3.07,-10.04 2.89,-9.50 Q2.68,-8.39 2.61,-7.82 Q2.57,3.86 2.57,3.86 Q2.61,4.96 2.71,5.54 Q3.04,6.79 3.21,7.21 Q3.54,7.86 3.86,8.14 Q4.68,8.79 5.11,8.96 Q6.14,9.25 6.54,9.32 Q7.14,9.43 7.54,9.43 Q8.36,9.46 8.89,9.43 Q10.21,9.25 10.68,9.14 Q11.36,8.93 11.64,8.75 Q12.21,8.36 12.43,8.11 Q12.79,7.68 12.96,7.25 Q13.29,6.11 13.39,5.54 Q13.54,4.46 13.57,3.93","0 12.24 M0.25,-12.36 L11.32,-12.36M5.79,-12.36 L5.79,9.93","0 20.45 M2.86,-13.00 L2.86,9.93M2.86,-1.79 L8.29,-1.79M8.39,-7.89 Q8.32,3.75 8.32,3.75 Q8.39,4.93 8.50,5.50 Q8.82,6.82 9.00,7.25 Q9.32,7.86 9.64,8.14 Q10.36,8.75 10.93,8.96 Q12.54,9.29 13.11,9.36 Q13.82,9.43 14.39,9.36 Q16.00,9.18 16.57,8.96 Q17.46,8.54 17.82,8.18 Q18.46,7.29 18.68,6.82 Q18.93,6.00 19.00,5.50 Q19.14,4.36 19.18,3.75 Q19.18,-6.93 19.18,-6.93 Q19.14,-8.14 19.04,-8.71 Q18.75,-10.00 18.54,-10.46 Q18.14,-11.11 17.82,-11.39 Q17.11,-11.96 16.54,-12.14 Q14.96,-12.43 14.39,-12.50 Q13.46,-12.54 13.11,-12.50 Q11.86,-12.39 11.39,-12.29 Q10.57,-12.00 10.25,-11.82 Q9.68,-11.43 9.46,-11.18 Q9.04,-10.61 8.89,-10.25 Q8.61,-9.50 8.54,-9.11 Z","0 14.60 M1.79,9.14 Q7.43,9.11 7.43,9.11 Q8.25,9.11 8.82,8.96 Q10.36,8.54 10.82,8.32 Q11.39,7.96 11.61,7.71 Q12.04,7.14 12.18,6.79 Q12.43,6.04 12.50,5.61 Q12.61,4.79 12.64,4.29 Q12.71,3.21 12.68,2.57 Q12.54,0.93 12.43,0.43 Q12.18,-0.21 12.04,-0.50 Q11.71,-1.00 11.50,-1.18 Q11.14,-1.50 10.79,-1.64 Q9.71,-1.93 9.25,-2.04 Q8.39,-2.25 7.96,-2.36 L2.54,-2.29M2.54,9.14 Q2.57,-12.36 2.57,-12.36 Q6.21,-12.39 7.36,-12.32 Q8.93,-12.14 9.46,-11.96 Q10.36,-11.57 10.68,-11.25 Q11.25,-10.61 11.46,-10.11 Q11.86,-8.93 11.93,-8.32 Q11.96,-7.07 11.89,-6.46 Q11.61,-5.14 11.39,-4.68 Q10.89,-3.89 10.64,-3.64 Q10.36,-3.32 9.86,-3.11 Q8.46,-2.61 7.61,-2.32","0 21.79 M2.86,-13.04 L2.86,9.21 L22.07,9.21 L22.07,13.46M19.57,-13.04 L20.36,0.46 L20.36,9.21M11.61,-13.04 L11.61,9.21","0 13.38 M1.11,9.93 L6.04,-0.79 L6.04,-2.18 L1.54,-13.04M11.43,-13.04 L6.96,-2.18 L6.96,-0.79 L11.89,9.93","0 13.43 M1.14,-13.04 L6.25,2.21 L7.54,2.18 L7.50,2.18M1.32,9.07 Q2.43,9.39 2.86,9.43 Q3.71,9.36 3.96,9.32 Q4.18,9.29 4.39,9.14 Q5.00,8.71 5.21,8.43 Q5.61,7.82 5.75,7.46 L12.14,-13.04","0 14.52 M1.93,4.18 Q2.00,5.50 2.14,6.07 Q2.50,7.07 2.75,7.50 Q3.25,8.29 3.75,8.57 Q5.11,9.18 5.71,9.32 Q6.79,9.39 7.32,9.36 Q8.46,9.29 9.00,9.14 Q10.11,8.71 10.50,8.50 Q11.04,8.14 11.29,7.79 Q11.82,6.86 12.00,6.36 Q12.25,5.18 12.32,4.71 Q12.43,4.07 12.39,3.54 Q12.36,2.14 12.21,1.57 Q11.93,0.46 11.64,0.00 Q10.93,-0.93 10.50,-1.29 Q9.54,-1.86 9.00,-2.07 Q9.39,-3.14 9.39,-3.14 Q10.39,-3.71 10.75,-4.07 Q11.39,-4.86 11.57,-5.32 Q11.86,-6.29 11.89,-6.93 Q11.89,-8.46 11.71,-9.11 Q11.21,-10.36 10.93,-10.82 Q10.39,-11.54 9.89,-11.79 Q8.36,-12.29 7.86,-12.39 Q7.18,-12.46 7.00,-12.43 Q5.89,-12.39 5.36,-12.25 Q4.21,-11.89 3.82,-11.64 Q3.25,-11.25 3.00,-10.82 Q2.46,-9.57 2.32,-9.04 Q2.18,-8.04 2.18,-7.57M5.00,-2.54 Q6.32,-2.50 7.00,-2.54 Q8.32,-2.61 9.00,-2.68","0 14.33 M2.82,-2.36 L11.57,-2.36M12.46,-12.36 L2.82,-12.36 L2.82,9.21 L13.07,9.21","0 11.00 M2.14,-12.96 L8.04,9.96","0 16.31 M-0.07,-12.36 L5.18,-12.36 Q5.18,9.21 5.18,9.21 Q9.18,9.25 10.36,9.18 Q11.89,9.00 12.36,8.86 Q12.96,8.61 13.21,8.39 Q13.64,8.07 13.86,7.68 Q14.36,6.39 14.46,5.93 Q14.57,5.32 14.61,4.82 Q14.64,3.57 14.64,2.86 Q14.64,1.21 14.61,0.61 Q14.57,-0.32 14.50,-0.79 Q14.21,-1.86 14.07,-2.25 Q13.79,-2.82 13.57,-3.07 Q13.29,-3.50 12.86,-3.68 Q11.54,-4.11 11.11,-4.21 Q11.32,-4.29 10.32,-4.29 Q7.25,-4.29 5.18,-4.29","0 14.83 M2.25,9.89 L7.39,0.75M11.96,0.75 Q6.25,0.71 6.25,0.71 Q4.79,0.39 4.32,0.21 Q3.71,-0.21 3.50,-0.46 Q3.11,-0.93 2.96,-1.29 Q2.71,-2.11 2.64,-2.54 Q2.57,-3.18 2.54,-3.75 Q2.50,-5.18 2.50,-5.89 Q2.50,-7.39 2.57,-8.04 Q2.79,-9.25 2.89,-9.71 Q3.14,-10.43 3.32,-10.71 Q3.61,-11.21 3.93,-11.43 Q4.86,-11.93 5.32,-12.07 Q5.71,-12.21 6.82,-12.25 Q9.96,-12.29 11.96,-12.29 L11.96,9.89","0 14.48 M2.86,-13.04 Q2.86,9.21 2.86,9.21 Q6.86,9.25 8.07,9.18 Q9.61,9.00 10.07,8.86 Q10.64,8.61 10.89,8.39 Q11.32,8.14 11.54,7.68 Q12.07,6.18 12.21,5.61 Q12.29,5.04 12.32,4.21 Q12.36,1.50 12.32,0.64 Q12.32,-0.29 12.18,-0.82 Q11.79,-2.21 11.57,-2.64 Q11.21,-3.18 10.89,-3.43 Q10.07,-3.93 9.57,-4.07 Q8.96,-4.25 7.86,-4.29 Q4.79,-4.29 2.86,-4.29","0 15.36 M2.82,-13.04 L2.82,9.21 L14.00,9.21 L14.00,13.46M12.32,-13.04 L12.32,9.21","0 14.52 M2.82,-2.29 Q2.93,-3.68 3.04,-4.18 Q3.25,-4.93 3.43,-5.25 Q3.82,-5.86 4.11,-6.07 Q4.71,-6.46 5.11,-6.61 Q5.96,-6.86 6.57,-6.89 Q8.07,-6.93 8.64,-6.82 Q9.64,-6.54 10.00,-6.32 Q10.64,-5.96 10.89,-5.57 Q11.43,-4.57 11.57,-4.04 Q11.75,-2.96 11.79,-2.43 Q11.82,4.61 11.82,4.61 Q11.71,5.11 11.71,5.54 Q11.86,6.57 11.89,7.29 Q11.89,8.96 11.89,9.93M11.79,4.96 Q11.25,6.46 10.93,7.04 Q10.21,8.00 9.89,8.32 Q9.36,8.71 8.96,8.89 Q7.93,9.21 7.54,9.29 Q6.89,9.36 6.64,9.36 Q5.07,9.29 4.46,9.11 Q3.39,8.61 3.04,8.32 Q2.61,7.93 2.43,7.50 Q2.07,6.39 2.04,5.82 Q2.11,4.50 2.21,4.04 Q2.54,3.32 2.75,3.04 Q3.11,2.57 3.54,2.32 Q4.86,1.75 5.36,1.61 Q6.11,1.46 6.61,1.43 Q7.39,1.36 8.25,1.36 Q10.46,1.43 11.82,1.50","0 14.17 M2.29,-2.64 Q2.93,-4.18 3.25,-4.68 Q3.75,-5.39 4.14,-5.68 Q5.18,-6.14 5.71,-6.29 Q6.71,-6.43 7.25,-6.43 Q8.43,-6.32 8.89,-6.21 Q9.68,-5.93 9.96,-5.75 Q10.39,-5.50 10.64,-5.14 Q11.21,-4.11 11.36,-3.71 Q11.50,-3.25 11.57,-2.86 Q11.68,-1.89 11.71,-1.32 Q11.64,5.36 11.64,5.36 Q11.25,6.96 11.07,7.46 Q10.79,8.04 10.50,8.29 Q9.86,8.86 9.36,9.04 Q8.11,9.32 7.43,9.39 Q6.39,9.46 5.82,9.36 Q4.46,9.00 4.04,8.82 Q3.54,8.43 3.32,8.18 Q2.93,7.75 2.79,7.36 Q2.46,6.39 2.39,5.89 Q2.32,4.93 2.29,4.46 Q2.29,-2.75 2.29,-2.75 Q2.36,-2.89 2.36,-3.32 Q2.25,-4.64 2.25,-5.25 Q2.25,-6.46 2.29,-7.00 Q2.29,-7.89 2.39,-8.50 Q2.79,-10.11 3.00,-10.61 Q3.36,-11.25 3.61,-11.50 Q4.11,-11.96 4.50,-12.14 Q5.32,-12.39 6.00,-12.50 Q7.86,-12.68 8.54,-12.82 Q9.68,-13.04 10.11,-13.25 Q10.79,-13.79 11.07,-14.07","0 14.10 M2.18,4.79 Q2.32,6.29 2.50,6.86 Q2.89,7.79 3.14,8.11 Q3.57,8.57 4.00,8.79 Q5.07,9.21 5.68,9.32 Q7.07,9.43 7.71,9.36 Q9.14,9.04 9.57,8.86 Q10.07,8.64 10.32,8.32 Q10.96,7.46 11.14,7.04 Q11.39,6.21 11.46,5.75 Q11.57,4.82 11.61,4.36 Q11.61,-1.68 11.61,-1.68 Q11.61,-2.43 11.50,-2.96 Q11.07,-4.50 10.86,-4.96 Q10.61,-5.46 10.29,-5.71 Q9.54,-6.29 8.96,-6.46 Q7.64,-6.71 6.89,-6.79 Q5.32,-6.68 4.79,-6.57 Q4.07,-6.29 3.79,-6.11 Q3.29,-5.82 3.07,-5.43 Q2.57,-4.29 2.43,-3.82 Q2.25,-2.93 2.25,-2.54M5.36,1.11 L11.64,1.11","0 15.02 M1.00,13.21 L1.00,9.25 L14.04,9.25 L14.04,13.21M1.89,9.25 Q2.54,8.64 2.89,8.18 Q3.79,6.86 4.04,6.43 Q4.25,5.96 4.36,5.61 Q4.61,4.82 4.71,4.29 Q4.89,3.11 4.96,2.46 Q5.04,1.11 5.07,0.39 L5.11,-6.68 L12.32,-6.68 L12.32,9.25","0 14.48 M2.46,-7.39 L2.46,8.43 L3.11,8.43 L11.36,-6.00 L11.96,-6.00 L11.96,9.82M4.57,-12.75 Q4.71,-11.89 4.79,-11.61 Q4.96,-11.29 5.11,-11.14 Q5.25,-10.89 5.57,-10.75 Q6.57,-10.39 7.07,-10.32 Q8.21,-10.32 8.64,-10.39 Q9.32,-10.64 9.54,-10.75 Q9.89,-10.96 10.00,-11.11 Q10.18,-11.21 10.29,-11.50 Q10.46,-12.29 10.54,-12.75","0 20.60 M10.93,5.64 Q11.79,7.57 12.14,8.11 Q12.71,8.64 13.04,8.82 Q13.54,9.11 14.00,9.18 Q15.18,9.36 15.75,9.32 Q16.93,9.18 17.36,9.04 Q17.96,8.75 18.25,8.50 Q18.82,7.86 19.04,7.50 Q19.39,6.61 19.50,6.25 Q19.64,5.64 19.68,5.36 Q19.71,-2.14 19.71,-2.14 Q19.71,-3.00 19.57,-3.54 Q19.18,-4.93 18.96,-5.36 Q18.64,-5.89 18.29,-6.11 Q17.32,-6.61 16.86,-6.75 Q15.93,-6.86 15.46,-6.86 Q14.54,-6.86 14.11,-6.71 Q13.18,-6.32 12.82,-6.04 Q12.25,-5.54 11.96,-5.00 Q11.36,-3.68 11.04,-2.89M10.93,6.14 Q10.21,7.50 9.93,7.93 Q9.46,8.46 9.21,8.64 Q8.89,8.96 8.39,9.07 Q7.07,9.25 6.25,9.32 Q5.32,9.29 4.89,9.14 Q4.00,8.71 3.64,8.43 Q3.04,7.82 2.82,7.36 Q2.43,6.07 2.32,5.64 Q2.21,4.96 2.21,4.71 Q2.25,-2.14 2.25,-2.14 Q2.36,-3.54 2.50,-4.11 Q2.86,-5.14 3.11,-5.50 Q3.54,-6.04 3.89,-6.25 Q4.71,-6.68 5.32,-6.79 Q6.86,-6.89 7.43,-6.82 Q8.29,-6.61 8.68,-6.36 Q9.39,-5.96 9.79,-5.36 Q10.61,-3.75 11.04,-2.71M11.00,-13.93 L11.04,-2.71 L10.96,-2.00 L10.96,5.07 L10.93,5.54 L11.00,15.32","0 11.29 M2.57,9.93 L2.57,-6.64 L9.79,-6.64","0 18.55 M0.89,-6.68 Q1.86,-6.71 2.14,-6.68 Q2.54,-6.54 2.68,-6.46 Q2.89,-6.39 3.07,-6.18 Q3.36,-6.04 3.68,-5.25 Q4.68,-2.32 5.04,-1.50 Q5.64,-0.54 5.82,-0.29 Q5.86,-0.21 6.11,-0.07 Q7.00,0.43 7.29,0.54 Q6.93,0.57 7.71,0.57 Q10.96,0.64 11.93,0.54 Q13.04,0.11 13.43,-0.18 Q13.82,-0.39 14.18,-1.25 Q15.32,-4.39 15.64,-5.21 Q16.00,-5.93 16.18,-6.14 Q16.54,-6.43 16.71,-6.54 Q16.89,-6.64 17.18,-6.68 Q17.93,-6.71 18.39,-6.68M9.64,9.93 L9.68,-7.36M1.07,9.93 L6.89,0.36M12.46,0.32 L18.21,9.93","0 14.48 M2.46,-7.39 L2.46,8.43 L3.11,8.43 L11.36,-6.00 L11.96,-6.00 L11.96,9.82","0 13.95 M2.07,-7.36 Q2.11,-1.11 2.11,-1.11 Q2.14,-0.14 2.25,0.39 Q2.64,1.79 2.82,2.21 Q3.07,2.68 3.39,2.93 Q4.14,3.50 4.71,3.64 Q6.11,3.89 6.75,3.89 Q8.14,3.71 8.64,3.54 Q9.54,3.04 9.82,2.82 Q10.07,2.54 10.29,2.21 Q11.00,1.29 11.18,0.82 Q11.32,-0.11 11.29,-0.61 L11.32,-7.36M11.18,0.82 L11.29,2.04 L11.29,9.93","0 13.38 M2.43,-7.36 L2.43,9.93M5.68,0.75 L11.89,9.93M2.43,0.93 Q4.46,0.89 4.96,0.89 Q5.14,0.96 5.36,0.89 Q5.93,0.68 6.18,0.57 Q6.57,0.39 6.79,0.14 Q7.11,-0.18 7.43,-1.00 Q8.39,-3.93 8.75,-4.79 Q9.39,-5.86 9.61,-6.14 Q9.89,-6.36 10.07,-6.46 Q10.36,-6.64 10.64,-6.68 Q11.43,-6.71 11.89,-6.68","0 14.60 M0.21,9.29 Q1.14,9.25 1.50,9.14 Q2.14,8.89 2.43,8.68 Q2.86,8.43 3.11,7.96 Q3.71,6.54 3.86,6.00 Q4.00,5.18 4.04,4.68 Q4.11,3.54 4.14,2.89 L4.14,-6.68 L12.14,-6.68 L12.14,9.93","0 15.90 M2.50,9.93 L2.39,-5.68 L3.04,-5.68 L8.00,6.04 L13.21,-5.68 L13.86,-5.68 L13.75,9.93","0 14.52 M2.50,-7.36 L2.50,9.93M12.04,-7.36 L12.04,9.93M2.50,1.00 L12.04,1.00","0 14.19 M6.57,9.43 Q5.25,9.29 4.79,9.14 Q4.14,8.93 3.82,8.68 Q3.18,8.07 2.93,7.61 Q2.50,6.32 2.39,5.79 Q2.25,4.82 2.25,4.36 Q2.29,-1.96 2.29,-1.96 Q2.25,-2.79 2.39,-3.36 Q2.86,-4.86 3.07,-5.29 Q3.36,-5.79 3.68,-6.00 Q4.57,-6.54 5.00,-6.68 Q5.64,-6.86 6.18,-6.89 Q7.57,-6.93 8.14,-6.86 Q9.32,-6.61 9.71,-6.43 Q10.25,-6.21 10.50,-5.89 Q11.11,-5.04 11.29,-4.61 Q11.54,-3.75 11.61,-3.29 Q11.68,-2.36 11.71,-1.89 Q11.64,5.32 11.64,5.32 Q11.46,6.50 11.29,7.00 Q10.89,7.93 10.57,8.29 Q9.86,8.89 9.32,9.07 Q8.11,9.36 7.39,9.43 Z","0 14.55 M2.50,9.93 L2.50,-6.68 L12.07,-6.68 L12.07,9.93","0 19.67 M2.50,-7.36 L2.50,9.25 L18.46,9.25 L18.46,-7.36M10.54,-7.36 L10.54,9.25","0 14.83 M2.61,-7.61 Q2.64,-6.32 2.68,-5.68 Q2.86,-4.36 2.86,-3.86 Q2.82,-3.07 2.75,-2.75 Q2.79,5.79 2.79,5.79 Q2.61,5.96 2.82,6.39 Q3.79,7.93 4.14,8.32 Q4.50,8.68 4.93,8.86 Q6.07,9.21 6.64,9.29 Q7.71,9.36 8.29,9.29 Q9.50,9.07 9.96,8.86 Q10.89,8.29 11.18,8.00 Q11.61,7.46 11.75,7.11 Q12.00,6.25 12.07,5.89 Q12.14,5.18 12.18,4.86 Q12.21,-2.04 12.21,-2.04 Q12.11,-3.39 11.96,-3.96 Q11.57,-5.11 11.36,-5.46 Q11.00,-5.93 10.71,-6.14 Q10.07,-6.61 9.54,-6.75 Q8.32,-6.93 7.61,-6.96 Q6.18,-6.86 5.64,-6.68 Q4.79,-6.25 4.46,-6.00 Q4.04,-5.61 3.75,-5.14 Q3.14,-3.89 2.79,-3.14M2.71,15.36 L2.71,8.46 L2.82,6.39","0 14.00 M11.64,-2.57 Q11.39,-4.21 11.21,-4.71 Q10.93,-5.36 10.68,-5.64 Q10.29,-6.14 9.82,-6.32 Q8.36,-6.75 7.89,-6.82 Q7.21,-6.89 7.00,-6.86 Q5.46,-6.71 4.89,-6.54 Q3.93,-6.07 3.57,-5.75 Q2.96,-4.93 2.79,-4.54 Q2.50,-3.75 2.43,-3.39 Q2.32,-2.68 2.29,-2.32 Q2.29,4.32 2.29,4.32 Q2.25,5.14 2.39,5.71 Q2.82,7.21 3.04,7.64 Q3.36,8.14 3.61,8.36 Q4.00,8.75 4.50,8.93 Q5.93,9.32 6.54,9.39 Q7.64,9.39 8.18,9.32 Q9.32,9.07 9.71,8.89 Q10.36,8.50 10.61,8.25 Q11.00,7.89 11.18,7.43 Q11.61,5.79 11.68,5.36 Q11.75,4.82 11.71,4.75","0 12.14 M0.14,-6.68 L11.18,-6.68M5.68,-6.68 L5.68,9.93","0 18.14 M2.61,-7.36 L2.61,9.93M11.89,9.46 Q10.25,9.25 9.75,9.14 Q9.18,8.89 8.93,8.71 Q8.46,8.43 8.25,8.07 Q7.75,7.00 7.61,6.64 Q7.50,6.18 7.46,5.82 Q7.39,4.93 7.36,4.39 Q7.36,-1.89 7.36,-1.89 Q7.36,-2.82 7.50,-3.36 Q7.89,-4.75 8.11,-5.18 Q8.39,-5.68 8.71,-5.93 Q9.50,-6.46 10.07,-6.61 Q11.43,-6.86 12.11,-6.86 Q13.64,-6.71 14.14,-6.61 Q14.79,-6.39 15.07,-6.21 Q15.54,-5.86 15.75,-5.61 Q16.14,-5.14 16.29,-4.75 Q16.57,-3.79 16.64,-3.32 Q16.75,-2.36 16.79,-1.89 Q16.79,4.46 16.79,4.46 Q16.75,5.36 16.64,5.86 Q16.36,6.96 16.21,7.36 Q15.93,7.93 15.71,8.18 Q15.43,8.54 15.04,8.75 Q13.71,9.25 13.29,9.36 Q12.71,9.46 12.46,9.46 ZM2.61,1.00 L7.32,1.00","0 13.74 M2.39,0.71 Q6.57,0.82 7.79,0.68 Q9.21,0.07 9.64,-0.18 Q10.11,-0.54 10.29,-0.89 Q10.68,-1.71 10.75,-2.29 Q10.75,-3.89 10.68,-4.39 Q10.43,-5.07 10.29,-5.29 Q10.14,-5.57 9.93,-5.75 Q9.43,-6.14 9.04,-6.32 Q7.89,-6.64 7.54,-6.71 Q7.64,-6.75 6.79,-6.75 Q4.18,-6.75 2.39,-6.75 Q2.39,9.36 2.39,9.36 Q6.04,9.36 7.14,9.32 Q8.54,9.21 8.96,9.11 Q9.54,8.93 9.82,8.75 Q10.46,8.29 10.68,8.00 Q11.00,7.50 11.11,7.00 Q11.32,5.68 11.32,4.96 Q11.21,3.25 11.14,2.79 Q11.00,2.39 10.93,2.21 Q10.82,1.93 10.68,1.79 Q10.25,1.43 10.00,1.29 Q9.61,1.11 9.14,1.00 Q7.96,0.79 7.21,0.68","0 20.21 M2.46,-7.36 L2.46,9.25 L20.11,9.25 L20.11,13.25M18.43,-7.36 L18.43,9.25M10.46,-7.36 L10.46,9.25","0 12.67 M1.07,9.93 L5.57,1.46 L5.57,0.43 L1.39,-7.36M10.75,-7.36 L6.46,0.43 L6.46,1.46 L11.00,9.93","0 12.81 M0.82,15.61 Q1.96,15.89 2.43,15.93 Q3.21,15.89 3.54,15.79 Q4.11,15.61 4.39,15.21 Q5.04,14.18 5.36,13.50 L11.07,-7.36M1.25,-7.36 L5.64,7.89 L7.00,7.89","0 13.26 M1.89,5.68 Q2.11,7.18 2.21,7.61 Q2.39,8.00 2.50,8.14 Q2.57,8.39 2.79,8.54 Q3.21,8.93 3.71,9.11 Q5.11,9.50 5.75,9.54 Q6.89,9.54 7.46,9.43 Q8.68,9.00 9.11,8.79 Q9.71,8.39 9.96,8.07 Q10.43,7.25 10.57,6.79 Q10.75,5.82 10.75,5.21 Q10.64,3.79 10.50,3.25 Q10.04,2.32 9.82,2.00 Q9.43,1.57 9.14,1.39 Q8.50,1.07 8.14,0.93 Q8.46,0.11 8.68,-0.18 Q9.29,-0.54 9.50,-0.82 Q9.93,-1.32 10.07,-1.79 Q10.32,-3.04 10.32,-3.54 Q10.18,-4.46 10.07,-4.82 Q9.82,-5.39 9.61,-5.64 Q9.18,-6.14 8.75,-6.36 Q7.43,-6.79 7.00,-6.89 Q6.39,-6.96 6.18,-6.93 Q4.68,-6.79 4.21,-6.68 Q3.50,-6.39 3.29,-6.29 Q3.04,-6.18 2.86,-5.96 Q2.46,-5.50 2.32,-5.07 Q2.14,-4.04 2.07,-3.43M4.21,0.57 Q5.79,0.57 6.43,0.54 Q7.61,0.46 8.14,0.39","0 14.21 M2.29,0.89 Q11.79,0.89 11.79,0.89 Q11.79,-0.21 11.79,-0.79 Q11.75,-2.00 11.68,-2.61 Q11.50,-3.93 11.32,-4.46 Q10.89,-5.43 10.64,-5.75 Q10.29,-6.18 9.82,-6.39 Q8.43,-6.82 7.96,-6.93 Q7.25,-7.00 7.00,-6.96 Q5.64,-6.86 5.11,-6.71 Q4.14,-6.32 3.79,-6.00 Q3.14,-5.29 2.93,-4.86 Q2.64,-3.96 2.54,-3.54 Q2.39,-2.75 2.36,-2.36 Q2.32,4.18 2.32,4.18 Q2.46,5.79 2.61,6.39 Q3.00,7.50 3.21,7.86 Q3.54,8.36 3.89,8.57 Q4.71,9.11 5.32,9.25 Q6.82,9.46 7.50,9.43 Q8.89,9.25 9.36,9.11 Q10.04,8.79 10.32,8.57 Q10.79,8.18 11.00,7.79 Q11.39,6.64 11.50,6.21 Q11.57,5.54 11.57,5.29","0 15.71 M0.04,-6.68 L4.68,-6.68 Q4.68,9.25 4.68,9.25 Q8.61,9.29 9.75,9.21 Q11.14,9.00 11.61,8.86 Q12.32,8.57 12.61,8.32 Q13.14,7.79 13.36,7.39 Q13.71,6.54 13.82,6.00 Q13.93,4.79 13.89,4.21 Q13.71,3.00 13.57,2.57 Q13.32,2.00 13.11,1.71 Q12.61,1.14 12.18,0.93 Q11.04,0.50 10.64,0.39 Q10.75,0.32 9.75,0.29 Q6.71,0.25 4.68,0.25","0 13.19 M1.61,9.93 L5.46,2.29M10.36,2.29 Q4.39,2.25 4.39,2.25 Q3.68,2.11 3.43,2.04 Q3.07,1.86 2.93,1.75 Q2.64,1.57 2.50,1.36 Q2.18,0.82 2.07,0.43 Q1.93,-0.54 1.89,-1.04 Q1.86,-1.89 1.89,-2.46 Q2.00,-4.07 2.11,-4.57 Q2.36,-5.29 2.50,-5.50 Q2.71,-5.82 2.86,-5.93 Q3.00,-6.11 3.25,-6.21 Q4.07,-6.50 4.36,-6.57 Q4.04,-6.61 5.04,-6.61 Q8.18,-6.64 10.36,-6.64 L10.36,9.93","0 13.83 M2.50,-7.36 Q2.50,9.25 2.50,9.25 Q6.39,9.32 7.57,9.25 Q9.00,9.04 9.50,8.86 Q10.25,8.50 10.54,8.25 Q11.00,7.82 11.18,7.46 Q11.57,6.57 11.68,6.04 Q11.79,4.82 11.75,4.25 Q11.57,3.04 11.43,2.61 Q11.21,2.00 10.96,1.71 Q10.46,1.14 10.04,0.93 Q8.86,0.50 8.46,0.39 Q8.57,0.32 7.57,0.29 Q4.54,0.25 2.50,0.25","0 18.79 M3.07,-2.96 Q8.07,-2.96 8.07,-2.96 Q9.14,-4.18 9.43,-4.79 Q9.64,-6.18 9.86,-6.68 Q10.36,-7.46 10.64,-7.75M4.64,-13.07 Q3.50,-9.00 3.21,-7.89 Q3.04,-7.18 3.00,-6.43 Q2.96,-4.50 2.96,-3.32 Q4.50,2.39 4.50,2.39 Q4.43,4.39 4.43,5.00 Q4.39,5.86 4.39,6.14 L9.25,9.93 L13.61,6.25 L13.64,5.11 Q15.61,-2.32 15.61,-2.32 Q15.71,-2.82 15.75,-3.29 Q15.82,-4.36 15.79,-5.04 Q15.64,-6.75 15.57,-7.25 Q15.43,-7.96 15.36,-8.14 L9.25,-13.07M4.46,4.36 Q7.68,3.71 8.46,3.61 Q8.32,3.46 9.21,3.64 Q11.96,4.21 13.79,4.61","0 17.12 M1.00,-3.25 L10.86,-3.25M1.00,0.43 L10.86,0.43M13.57,-11.39 Q12.79,-11.86 12.29,-12.04 Q10.96,-12.43 10.54,-12.54 Q9.89,-12.57 9.68,-12.57 Q8.36,-12.50 7.79,-12.32 Q6.68,-11.86 6.18,-11.46 Q5.21,-10.57 4.86,-10.04 Q4.25,-8.79 4.07,-8.36 Q3.96,-7.93 3.89,-7.43 Q3.79,-6.18 3.75,-5.39 Q3.79,3.57 3.79,3.57 Q3.96,5.11 4.14,5.75 Q4.54,6.89 4.86,7.36 Q5.46,8.21 5.96,8.57 Q7.29,9.32 7.93,9.50 Q9.18,9.68 9.82,9.64 Q11.18,9.50 11.86,9.32 Q13.25,8.89 13.96,8.61","0 12.45 M3.07,-2.96 Q8.07,-2.96 8.07,-2.96 Q9.14,-4.18 9.43,-4.79 Q9.64,-6.18 9.86,-6.68 Q10.36,-7.46 10.64,-7.75M4.64,-13.07 Q3.50,-9.00 3.21,-7.89 Q3.04,-7.18 3.00,-6.43 Q2.96,-4.50 2.96,-3.32 Q4.50,2.39 4.50,2.39 Q4.43,4.39 4.43,5.00 Q4.39,5.86 4.39,6.14 L9.25,9.93 L13.61,6.25 L13.64,5.11 Q15.61,-2.32 15.61,-2.32 Q15.71,-2.82 15.75,-3.29 Q15.82,-4.36 15.79,-5.04 Q15.64,-6.75 15.57,-7.25 Q15.43,-7.96 15.36,-8.14 L9.25,-13.07M4.46,4.36 Q7.68,3.71 8.46,3.61 Q8.32,3.46 9.21,3.64 Q11.96,4.21 13.79,4.61",]
@@ -0,0 +1,6 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+'''Font index of hersheydata.py, see hersheysplit.py.'''
+
+SOURCE_SIZE = 1167495
+NAMES = ('EMSAllure', 'EMSBird', 'EMSBirdSwashCaps', 'EMSBrush', 'EMSCapitol', 'EMSCasualHand', 'EMSDecorousScript', 'EMSDelight', 'EMSDelightSwashCaps', 'EMSElfin', 'EMSFelix', 'EMSHerculean', 'EMSInvite', 'EMSLeague', 'EMSLittlePrincess', 'EMSMistyNight', 'EMSNeato', 'EMSNixish', 'EMSNixishItalic', 'EMSOsmotron', 'EMSPancakes', 'EMSPepita', 'EMSQwandry', 'EMSReadability', 'EMSReadabilityItalic', 'EMSSociety', 'EMSSwiss', 'EMSTech', 'Exo_2_0_Extra_Light', 'Exo_2_0_Extra_Light_cyr', 'Glober_Thin_Free', 'Glober_Thin_Free_cyr', 'Kelson_Sans_RU', 'Kelson_Sans_RU_cyr', 'astrology', 'cursive', 'cyrillic', 'futural', 'futuram', 'gothiceng', 'gothicger', 'gothicita', 'greek', 'japanese', 'markers', 'mathlow', 'mathupp', 'meteorology', 'music', 'scriptc', 'scripts', 'symbolic', 'timesg', 'timesi', 'timesib', 'timesr', 'timesrb')
+GROUPS = {'group_allfonts': [['Kelson_Sans_RU', 'Kelson Sans RU'], ['Kelson_Sans_RU_cyr', 'Kelson Sans RU Cyrillic'], ['Exo_2_0_Extra_Light_cyr', 'Exo 2.0 Extra Light Cyrillic'], ['Exo_2_0_Extra_Light', 'Exo 2.0 Extra Light'], ['Glober_Thin_Free', 'Glober Thin Free'], ['Glober_Thin_Free_cyr', 'Glober Thin Free Cyrillic'], ['futural', 'Sans 1-stroke'], ['futuram', 'Sans bold'], ['timesr', 'Serif medium'], ['timesi', 'Serif medium italic'], ['timesib', 'Serif bold italic'], ['timesrb', 'Serif bold'], ['scripts', 'Script 1-stroke'], ['cursive', 'Script 1-stroke (alt)'], ['scriptc', 'Script medium'], ['gothiceng', 'Gothic English'], ['gothicger', 'Gothic German'], ['gothicita', 'Gothic Italian'], ['EMSAllure', 'EMS Allure'], ['EMSBird', 'EMS Bird'], ['EMSBirdSwashCaps', 'EMS Bird Swash Caps'], ['EMSBrush', 'EMS Brush'], ['EMSCapitol', 'EMS Capitol'], ['EMSCasualHand', 'EMS Casual Hand'], ['EMSDecorousScript', 'EMS Decorous Script'], ['EMSDelight', 'EMS Delight'], ['EMSDelightSwashCaps', 'EMS Delight Swash Caps'], ['EMSElfin', 'EMS Elfin'], ['EMSFelix', 'EMS Felix'], ['EMSHerculean', 'EMS Herculean'], ['EMSInvite', 'EMS Invite'], ['EMSLeague', 'EMS League'], ['EMSLittlePrincess', 'EMS Little Princess'], ['EMSMistyNight', 'EMS Misty Night'], ['EMSNeato', 'EMS Neato'], ['EMSNixish', 'EMS Nixish'], ['EMSNixishItalic', 'EMS Nixish Italic'], ['EMSOsmotron', 'EMS Osmotron'], ['EMSPancakes', 'EMS Pancakes'], ['EMSPepita', 'EMS Pepita'], ['EMSQwandry', 'EMS Qwandry'], ['EMSReadability', 'EMS Readability'], ['EMSReadabilityItalic', 'EMS Readability Italic'], ['EMSSociety', 'EMS Society'], ['EMSSwiss', 'EMS Swiss'], ['EMSTech', 'EMS Tech'], ['greek', 'Greek 1-stroke'], ['timesg', 'Greek medium'], ['cyrillic', 'Cyrillic'], ['japanese', 'Japanese'], ['astrology', 'Astrology'], ['mathlow', 'Math (lower)'], ['mathupp', 'Math (upper)'], ['markers', 'Markers'], ['meteorology', 'Meteorology'], ['music', 'Music'], ['symbolic', 'Symbolic']]}
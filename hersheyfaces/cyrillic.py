@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","-5 5 M 0 -12 L -1 -10 L 0 2 L 1 -10 L 0 -12 M 0 -10 L 0 -4 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-8 8 M -4 -12 L -5 -5 M -3 -12 L -5 -5 M 4 -12 L 3 -5 M 5 -12 L 3 -5","-10 11 M 1 -16 L -6 16 M 7 -16 L 0 16 M -6 -3 L 8 -3 M -7 3 L 7 3","-15 15 M -10 -12 L -10 9 M -9 -12 L -9 9 M -13 -12 L -6 -12 M -9 -2 L -2 -2 L 1 -1 L 2 0 L 3 2 L 3 5 L 2 7 L 1 8 L -2 9 L -13 9 M -2 -2 L 0 -1 L 1 0 L 2 2 L 2 5 L 1 7 L 0 8 L -2 9 M 9 -12 L 9 9 M 10 -12 L 10 9 M 6 -12 L 13 -12 M 6 9 L 13 9","-11 11 M -6 -5 L -6 9 M -5 -5 L -5 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L -2 -5 M 2 -5 L 9 -5 M -9 9 L 9 9 L 9 14 L 8 9","-13 13 M -8 -5 L -8 9 M -7 -5 L -7 9 M -11 -5 L -4 -5 M -7 2 L -3 2 L 0 3 L 1 5 L 1 6 L 0 8 L -3 9 L -11 9 M -3 2 L -1 3 L 0 5 L 0 6 L -1 8 L -3 9 M 7 -5 L 7 9 M 8 -5 L 8 9 M 4 -5 L 11 -5 M 4 9 L 11 9","-4 4 M 0 -12 L -1 -5 M 1 -12 L -1 -5","-7 7 M 3 -16 L 1 -14 L -1 -11 L -3 -7 L -4 -2 L -4 2 L -3 7 L -1 11 L 1 14 L 3 16 L 4 16 M 3 -16 L 4 -16 L 2 -14 L 0 -11 L -2 -7 L -3 -2 L -3 2 L -2 7 L 0 11 L 2 14 L 4 16","-7 7 M -4 -16 L -2 -14 L 0 -11 L 2 -7 L 3 -2 L 3 2 L 2 7 L 0 11 L -2 14 L -4 16 L -3 16 M -4 -16 L -3 -16 L -1 -14 L 1 -11 L 3 -7 L 4 -2 L 4 2 L 3 7 L 1 11 L -1 14 L -3 16","-8 8 M 0 -6 L 0 6 M -5 -3 L 5 3 M 5 -3 L -5 3","-13 13 M 0 -9 L 0 9 M -9 0 L 9 0","-4 4 M 1 5 L 0 6 L -1 5 L 0 4 L 1 5 L 1 7 L -1 9","-13 13 M -9 0 L 9 0","-4 4 M 0 4 L -1 5 L 0 6 L 1 5 L 0 4","-11 11 M 9 -16 L -9 16","-10 10 M -1 -12 L -4 -11 L -6 -8 L -7 -3 L -7 0 L -6 5 L -4 8 L -1 9 L 1 9 L 4 8 L 6 5 L 7 0 L 7 -3 L 6 -8 L 4 -11 L 1 -12 L -1 -12 M -1 -12 L -3 -11 L -4 -10 L -5 -8 L -6 -3 L -6 0 L -5 5 L -4 7 L -3 8 L -1 9 M 1 9 L 3 8 L 4 7 L 5 5 L 6 0 L 6 -3 L 5 -8 L 4 -10 L 3 -11 L 1 -12","-10 10 M -4 -8 L -2 -9 L 1 -12 L 1 9 M 0 -11 L 0 9 M -4 9 L 5 9","-10 10 M -6 -8 L -5 -7 L -6 -6 L -7 -7 L -7 -8 L -6 -10 L -5 -11 L -2 -12 L 2 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -6 L 6 -4 L 3 -2 L -2 0 L -4 1 L -6 3 L -7 6 L -7 9 M 2 -12 L 4 -11 L 5 -10 L 6 -8 L 6 -6 L 5 -4 L 2 -2 L -2 0 M -7 7 L -6 6 L -4 6 L 1 8 L 4 8 L 6 7 L 7 6 M -4 6 L 1 9 L 5 9 L 6 8 L 7 6 L 7 4","-10 10 M -6 -8 L -5 -7 L -6 -6 L -7 -7 L -7 -8 L -6 -10 L -5 -11 L -2 -12 L 2 -12 L 5 -11 L 6 -9 L 6 -6 L 5 -4 L 2 -3 L -1 -3 M 2 -12 L 4 -11 L 5 -9 L 5 -6 L 4 -4 L 2 -3 M 2 -3 L 4 -2 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 2 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 5 -1 L 6 2 L 6 5 L 5 7 L 4 8 L 2 9","-10 10 M 2 -10 L 2 9 M 3 -12 L 3 9 M 3 -12 L -8 3 L 8 3 M -1 9 L 6 9","-10 10 M -5 -12 L -7 -2 M -7 -2 L -5 -4 L -2 -5 L 1 -5 L 4 -4 L 6 -2 L 7 1 L 7 3 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 1 -5 L 3 -4 L 5 -2 L 6 1 L 6 3 L 5 6 L 3 8 L 1 9 M -5 -12 L 5 -12 M -5 -11 L 0 -11 L 5 -12","-10 10 M 5 -9 L 4 -8 L 5 -7 L 6 -8 L 6 -9 L 5 -11 L 3 -12 L 0 -12 L -3 -11 L -5 -9 L -6 -7 L -7 -3 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 3 L 7 2 L 6 -1 L 4 -3 L 1 -4 L 0 -4 L -3 -3 L -5 -1 L -6 2 M 0 -12 L -2 -11 L -4 -9 L -5 -7 L -6 -3 L -6 3 L -5 6 L -3 8 L -1 9 M 1 9 L 3 8 L 5 6 L 6 3 L 6 2 L 5 -1 L 3 -3 L 1 -4","-10 10 M -7 -12 L -7 -6 M -7 -8 L -6 -10 L -4 -12 L -2 -12 L 3 -9 L 5 -9 L 6 -10 L 7 -12 M -6 -10 L -4 -11 L -2 -11 L 3 -9 M 7 -12 L 7 -9 L 6 -6 L 2 -1 L 1 1 L 0 4 L 0 9 M 6 -6 L 1 -1 L 0 1 L -1 4 L -1 9","-10 10 M -2 -12 L -5 -11 L -6 -9 L -6 -6 L -5 -4 L -2 -3 L 2 -3 L 5 -4 L 6 -6 L 6 -9 L 5 -11 L 2 -12 L -2 -12 M -2 -12 L -4 -11 L -5 -9 L -5 -6 L -4 -4 L -2 -3 M 2 -3 L 4 -4 L 5 -6 L 5 -9 L 4 -11 L 2 -12 M -2 -3 L -5 -2 L -6 -1 L -7 1 L -7 5 L -6 7 L -5 8 L -2 9 L 2 9 L 5 8 L 6 7 L 7 5 L 7 1 L 6 -1 L 5 -2 L 2 -3 M -2 -3 L -4 -2 L -5 -1 L -6 1 L -6 5 L -5 7 L -4 8 L -2 9 M 2 9 L 4 8 L 5 7 L 6 5 L 6 1 L 5 -1 L 4 -2 L 2 -3","-10 10 M 6 -5 L 5 -2 L 3 0 L 0 1 L -1 1 L -4 0 L -6 -2 L -7 -5 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 1 -12 L 4 -11 L 6 -9 L 7 -6 L 7 0 L 6 4 L 5 6 L 3 8 L 0 9 L -3 9 L -5 8 L -6 6 L -6 5 L -5 4 L -4 5 L -5 6 M -1 1 L -3 0 L -5 -2 L -6 -5 L -6 -6 L -5 -9 L -3 -11 L -1 -12 M 1 -12 L 3 -11 L 5 -9 L 6 -6 L 6 0 L 5 4 L 4 6 L 2 8 L 0 9","-4 4 M 0 -3 L -1 -2 L 0 -1 L 1 -2 L 0 -3 M 0 4 L -1 5 L 0 6 L 1 5 L 0 4","-4 4 M 0 -3 L -1 -2 L 0 -1 L 1 -2 L 0 -3 M 1 5 L 0 6 L -1 5 L 0 4 L 1 5 L 1 7 L -1 9","-12 12 M 8 -9 L -8 0 L 8 9","-13 13 M -9 -3 L 9 -3 M -9 3 L 9 3","-12 12 M -8 -9 L 8 0 L -8 9","-9 9 M -5 -8 L -4 -7 L -5 -6 L -6 -7 L -6 -8 L -5 -10 L -4 -11 L -2 -12 L 1 -12 L 4 -11 L 5 -10 L 6 -8 L 6 -6 L 5 -4 L 4 -3 L 0 -1 L 0 2 M 1 -12 L 3 -11 L 4 -10 L 5 -8 L 5 -6 L 4 -4 L 2 -2 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-13 14 M 5 -4 L 4 -6 L 2 -7 L -1 -7 L -3 -6 L -4 -5 L -5 -2 L -5 1 L -4 3 L -2 4 L 1 4 L 3 3 L 4 1 M -1 -7 L -3 -5 L -4 -2 L -4 1 L -3 3 L -2 4 M 5 -7 L 4 1 L 4 3 L 6 4 L 8 4 L 10 2 L 11 -1 L 11 -3 L 10 -6 L 9 -8 L 7 -10 L 5 -11 L 2 -12 L -1 -12 L -4 -11 L -6 -10 L -8 -8 L -9 -6 L -10 -3 L -10 0 L -9 3 L -8 5 L -6 7 L -4 8 L -1 9 L 2 9 L 5 8 L 7 7 L 8 6 M 6 -7 L 5 1 L 5 3 L 6 4","-10 10 M 0 -12 L -7 9 M 0 -12 L 7 9 M 0 -9 L 6 9 M -5 3 L 4 3 M -9 9 L -3 9 M 3 9 L 9 9","-11 11 M -6 -12 L -6 9 M -5 -12 L -5 9 M -9 -12 L 7 -12 L 7 -6 L 6 -12 M -5 -2 L 3 -2 L 6 -1 L 7 0 L 8 2 L 8 5 L 7 7 L 6 8 L 3 9 L -9 9 M 3 -2 L 5 -1 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 3 9","-10 11 M -6 -9 L -7 -12 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 1 -12 L 4 -11 L 6 -9 L 7 -7 L 8 -4 L 8 1 L 7 4 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 1 -12 L 3 -11 L 5 -9 L 6 -7 L 7 -4 L 7 1 L 6 4 L 5 6 L 3 8 L 1 9 M -2 -2 L 7 -2","-12 12 M -4 -12 L -4 -6 L -5 2 L -6 6 L -7 8 L -8 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -7 -12 L 10 -12 M -11 9 L 10 9 M -11 9 L -11 16 M -10 9 L -11 16 M 9 9 L 10 16 M 10 9 L 10 16","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -10 -12 L -3 -12 M 3 -12 L 10 -12 M 6 -10 L -6 7 M -10 9 L -3 9 M 3 9 L 10 9","-12 13 M 0 -12 L 0 9 M 1 -12 L 1 9 M -3 -12 L 4 -12 M -2 -9 L -6 -8 L -8 -6 L -9 -3 L -9 0 L -8 3 L -6 5 L -2 6 L 3 6 L 7 5 L 9 3 L 10 0 L 10 -3 L 9 -6 L 7 -8 L 3 -9 L -2 -9 M -2 -9 L -5 -8 L -7 -6 L -8 -3 L -8 0 L -7 3 L -5 5 L -2 6 M 3 6 L 6 5 L 8 3 L 9 0 L 9 -3 L 8 -6 L 6 -8 L 3 -9 M -3 9 L 4 9","-9 9 M -4 -12 L -4 9 M -3 -12 L -3 9 M -7 -12 L 8 -12 L 8 -6 L 7 -12 M -7 9 L 0 9","-15 16 M 0 -12 L 0 9 M 1 -12 L 1 9 M -3 -12 L 4 -12 M -11 -11 L -10 -10 L -11 -9 L -12 -10 L -12 -11 L -11 -12 L -10 -12 L -9 -11 L -8 -9 L -7 -5 L -6 -3 L -4 -2 L 5 -2 L 7 -3 L 8 -5 L 9 -9 L 10 -11 L 11 -12 L 12 -12 L 13 -11 L 13 -10 L 12 -9 L 11 -10 L 12 -11 M -4 -2 L -6 -1 L -7 1 L -8 6 L -9 8 L -10 9 M -4 -2 L -5 -1 L -6 1 L -7 6 L -8 8 L -9 9 L -11 9 L -12 8 L -13 6 M 5 -2 L 7 -1 L 8 1 L 9 6 L 10 8 L 11 9 M 5 -2 L 6 -1 L 7 1 L 8 6 L 9 8 L 10 9 L 12 9 L 13 8 L 14 6 M -3 9 L 4 9","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -10 -12 L -3 -12 M 3 -12 L 10 -12 M 6 -10 L -6 7 M -10 9 L -3 9 M 3 9 L 10 9","-12 11 M -7 -12 L -7 -1 L -6 1 L -3 2 L 0 2 L 3 1 L 5 -1 M -6 -12 L -6 -1 L -5 1 L -3 2 M 5 -12 L 5 9 M 6 -12 L 6 9 M -10 -12 L -3 -12 M 2 -12 L 9 -12 M 2 9 L 9 9","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M -10 -12 L -3 -12 M -6 -2 L 1 -2 L 3 -3 L 4 -5 L 5 -9 L 6 -11 L 7 -12 L 8 -12 L 9 -11 L 9 -10 L 8 -9 L 7 -10 L 8 -11 M 1 -2 L 3 -1 L 4 1 L 5 6 L 6 8 L 7 9 M 1 -2 L 2 -1 L 3 1 L 4 6 L 5 8 L 6 9 L 8 9 L 9 8 L 10 6 M -10 9 L -3 9","-13 12 M -5 -12 L -5 -6 L -6 2 L -7 6 L -8 8 L -9 9 L -10 9 L -11 8 L -11 7 L -10 6 L -9 7 L -10 8 M 6 -12 L 6 9 M 7 -12 L 7 9 M -8 -12 L 10 -12 M 3 9 L 10 9","-12 13 M -7 -12 L -7 9 M -6 -12 L 0 6 M -7 -12 L 0 9 M 7 -12 L 0 9 M 7 -12 L 7 9 M 8 -12 L 8 9 M -10 -12 L -6 -12 M 7 -12 L 11 -12 M -10 9 L -4 9 M 4 9 L 11 9","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -10 -12 L -3 -12 M 3 -12 L 10 -12 M -6 -2 L 6 -2 M -10 9 L -3 9 M 3 9 L 10 9","-11 11 M -1 -12 L -4 -11 L -6 -9 L -7 -7 L -8 -3 L -8 0 L -7 4 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 4 L 8 0 L 8 -3 L 7 -7 L 6 -9 L 4 -11 L 1 -12 L -1 -12 M -1 -12 L -3 -11 L -5 -9 L -6 -7 L -7 -3 L -7 0 L -6 4 L -5 6 L -3 8 L -1 9 M 1 9 L 3 8 L 5 6 L 6 4 L 7 0 L 7 -3 L 6 -7 L 5 -9 L 3 -11 L 1 -12","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -10 -12 L 10 -12 M -10 9 L -3 9 M 3 9 L 10 9","-16 17 M -11 -12 L -11 9 M -10 -12 L -10 9 M 0 -12 L 0 9 M 1 -12 L 1 9 M 11 -12 L 11 9 M 12 -12 L 12 9 M -14 -12 L -7 -12 M -3 -12 L 4 -12 M 8 -12 L 15 -12 M -14 9 L 15 9","-11 11 M -6 -12 L -6 9 M -5 -12 L -5 9 M -9 -12 L 3 -12 L 6 -11 L 7 -10 L 8 -8 L 8 -5 L 7 -3 L 6 -2 L 3 -1 L -5 -1 M 3 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -5 L 6 -3 L 5 -2 L 3 -1 M -9 9 L -2 9","-11 10 M 6 -9 L 7 -6 L 7 -12 L 6 -9 L 4 -11 L 1 -12 L -1 -12 L -4 -11 L -6 -9 L -7 -7 L -8 -4 L -8 1 L -7 4 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 4 M -1 -12 L -3 -11 L -5 -9 L -6 -7 L -7 -4 L -7 1 L -6 4 L -5 6 L -3 8 L -1 9","-9 10 M 0 -12 L 0 9 M 1 -12 L 1 9 M -6 -12 L -7 -6 L -7 -12 L 8 -12 L 8 -6 L 7 -12 M -3 9 L 4 9","-15 16 M -10 -12 L -10 9 M -9 -12 L -9 9 M -13 -12 L -6 -12 M -13 9 L -6 9 M 4 -12 L 1 -11 L -1 -9 L -2 -7 L -3 -3 L -3 0 L -2 4 L -1 6 L 1 8 L 4 9 L 6 9 L 9 8 L 11 6 L 12 4 L 13 0 L 13 -3 L 12 -7 L 11 -9 L 9 -11 L 6 -12 L 4 -12 M 4 -12 L 2 -11 L 0 -9 L -1 -7 L -2 -3 L -2 0 L -1 4 L 0 6 L 2 8 L 4 9 M 6 9 L 8 8 L 10 6 L 11 4 L 12 0 L 12 -3 L 11 -7 L 10 -9 L 8 -11 L 6 -12 M -9 -2 L -3 -2","-11 11 M -6 -12 L -6 9 M -5 -12 L -5 9 M -9 -12 L 3 -12 L 6 -11 L 7 -10 L 8 -8 L 8 -6 L 7 -4 L 6 -3 L 3 -2 M 3 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -6 L 6 -4 L 5 -3 L 3 -2 M -5 -2 L 3 -2 L 6 -1 L 7 0 L 8 2 L 8 5 L 7 7 L 6 8 L 3 9 L -9 9 M 3 -2 L 5 -1 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 3 9","-16 17 M -11 -12 L -11 9 M -10 -12 L -10 9 M 0 -12 L 0 9 M 1 -12 L 1 9 M 11 -12 L 11 9 M 12 -12 L 12 9 M -14 -12 L -7 -12 M -3 -12 L 4 -12 M 8 -12 L 15 -12 M -14 9 L 15 9 M 14 9 L 15 16 M 15 9 L 15 16","-10 10 M -7 -12 L 6 9 M -6 -12 L 7 9 M 7 -12 L -7 9 M -9 -12 L -3 -12 M 3 -12 L 9 -12 M -9 9 L -3 9 M 3 9 L 9 9","-10 11 M -7 -12 L 0 4 M -6 -12 L 1 4 M 8 -12 L 1 4 L -1 7 L -2 8 L -4 9 L -5 9 L -6 8 L -6 7 L -5 6 L -4 7 L -5 8 M -9 -12 L -3 -12 M 4 -12 L 10 -12","-10 10 M -6 -9 L -7 -12 L -7 -6 L -6 -9 L -4 -11 L -2 -12 L 2 -12 L 5 -11 L 6 -9 L 6 -6 L 5 -4 L 2 -3 L -1 -3 M 2 -12 L 4 -11 L 5 -9 L 5 -6 L 4 -4 L 2 -3 M 2 -3 L 4 -2 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 2 9 L -3 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 5 -1 L 6 2 L 6 5 L 5 7 L 4 8 L 2 9","-11 10 M -6 -12 L -6 9 M -5 -12 L -5 9 M 1 -6 L 1 2 M -9 -12 L 7 -12 L 7 -6 L 6 -12 M -5 -2 L 1 -2 M -9 9 L 7 9 L 7 3 L 6 9","-7 7 M -7 -12 L 7 12","-12 14 M -2 -12 L -2 9 M -1 -12 L -1 9 M -9 -12 L -10 -6 L -10 -12 L 2 -12 M -1 -2 L 6 -2 L 9 -1 L 10 0 L 11 2 L 11 5 L 10 7 L 9 8 L 6 9 L -5 9 M 6 -2 L 8 -1 L 9 0 L 10 2 L 10 5 L 9 7 L 8 8 L 6 9","-11 11 M 5 -12 L 5 9 M 6 -12 L 6 9 M 9 -12 L -3 -12 L -6 -11 L -7 -10 L -8 -8 L -8 -6 L -7 -4 L -6 -3 L -3 -2 L 5 -2 M -3 -12 L -5 -11 L -6 -10 L -7 -8 L -7 -6 L -6 -4 L -5 -3 L -3 -2 M 0 -2 L -2 -1 L -3 0 L -6 7 L -7 8 L -8 8 L -9 7 M -2 -1 L -3 1 L -5 8 L -6 9 L -8 9 L -9 7 L -9 6 M 2 9 L 9 9","-10 11 M -5 -12 L -5 9 M -4 -12 L -4 9 M -8 -12 L -1 -12 M -4 -2 L 3 -2 L 6 -1 L 7 0 L 8 2 L 8 5 L 7 7 L 6 8 L 3 9 L -8 9 M 3 -2 L 5 -1 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 3 9","-12 12 M -7 -12 L -7 9 M -6 -12 L -6 9 M 6 -12 L 6 9 M 7 -12 L 7 9 M -10 -12 L -3 -12 M 3 -12 L 10 -12 M -10 9 L 10 9 M 9 9 L 10 16 M 10 9 L 10 16","-9 11 M -4 -3 L -4 -2 L -5 -2 L -5 -3 L -4 -4 L -2 -5 L 2 -5 L 4 -4 L 5 -3 L 6 -1 L 6 6 L 7 8 L 8 9 M 5 -3 L 5 6 L 6 8 L 8 9 L 9 9 M 5 -1 L 4 0 L -2 1 L -5 2 L -6 4 L -6 6 L -5 8 L -2 9 L 1 9 L 3 8 L 5 6 M -2 1 L -4 2 L -5 4 L -5 6 L -4 8 L -2 9","-10 10 M 6 -12 L 5 -11 L -1 -9 L -4 -7 L -6 -4 L -7 -1 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 3 L 7 1 L 6 -2 L 4 -4 L 1 -5 L -1 -5 L -4 -4 L -6 -2 L -7 1 M 6 -12 L 5 -10 L 3 -9 L -1 -8 L -4 -6 L -6 -4 M -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 3 L -5 6 L -3 8 L -1 9 M 1 9 L 3 8 L 5 6 L 6 3 L 6 1 L 5 -2 L 3 -4 L 1 -5","-10 11 M -6 -9 L -7 -12 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 1 -12 L 4 -11 L 6 -9 L 7 -7 L 8 -4 L 8 1 L 7 4 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 1 -12 L 3 -11 L 5 -9 L 6 -7 L 7 -4 L 7 1 L 6 4 L 5 6 L 3 8 L 1 9 M -2 -2 L 7 -2","-12 11 M -4 -5 L -4 -1 L -5 5 L -6 8 L -7 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -7 -5 L 9 -5 M -9 9 L -10 14 L -10 9 L 9 9 L 9 14 L 8 9","-11 11 M -6 -5 L -6 9 M -5 -5 L -5 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L -2 -5 M 2 -5 L 9 -5 M -9 9 L -2 9 M 2 9 L 9 9 M 5 -4 L -5 8 M -3 -11 L -3 -12 L -4 -12 L -4 -11 L -3 -9 L -1 -8 L 1 -8 L 3 -9 L 4 -11","-10 11 M 0 -12 L 0 16 M 1 -12 L 1 16 M -3 -12 L 1 -12 M 0 -2 L -1 -4 L -2 -5 L -4 -5 L -6 -4 L -7 -1 L -7 5 L -6 8 L -4 9 L -2 9 L -1 8 L 0 6 M -4 -5 L -5 -4 L -6 -1 L -6 5 L -5 8 L -4 9 M 5 -5 L 6 -4 L 7 -1 L 7 5 L 6 8 L 5 9 M 1 -2 L 2 -4 L 3 -5 L 5 -5 L 7 -4 L 8 -1 L 8 5 L 7 8 L 5 9 L 3 9 L 2 8 L 1 6 M -3 16 L 4 16","-10 8 M -5 -5 L -5 9 M -4 -5 L -4 9 M -8 -5 L 6 -5 L 6 0 L 5 -5 M -8 9 L -1 9","-13 14 M 0 -5 L 0 9 M 1 -5 L 1 9 M -3 -5 L 4 -5 M -8 -4 L -9 -3 L -10 -4 L -9 -5 L -8 -5 L -7 -4 L -5 0 L -4 1 L -2 2 L 3 2 L 5 1 L 6 0 L 8 -4 L 9 -5 L 10 -5 L 11 -4 L 10 -3 L 9 -4 M -2 2 L -4 3 L -5 4 L -7 8 L -8 9 M -2 2 L -4 4 L -6 8 L -7 9 L -9 9 L -10 8 L -11 6 M 3 2 L 5 3 L 6 4 L 8 8 L 9 9 M 3 2 L 5 4 L 7 8 L 8 9 L 10 9 L 11 8 L 12 6 M -3 9 L 4 9","-11 11 M -6 -5 L -6 9 M -5 -5 L -5 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L -2 -5 M 2 -5 L 9 -5 M -9 9 L -2 9 M 2 9 L 9 9 M 5 -4 L -5 8","-11 11 M -6 -5 L -6 2 L -5 4 L -2 5 L 0 5 L 3 4 L 5 2 M -5 -5 L -5 2 L -4 4 L -2 5 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L -2 -5 M 2 -5 L 9 -5 M 2 9 L 9 9","-10 10 M -5 -5 L -5 9 M -4 -5 L -4 9 M -8 -5 L -1 -5 M -4 2 L -2 2 L 1 1 L 2 0 L 4 -4 L 5 -5 L 6 -5 L 7 -4 L 6 -3 L 5 -4 M -2 2 L 1 3 L 2 4 L 4 8 L 5 9 M -2 2 L 0 3 L 1 4 L 3 8 L 4 9 L 6 9 L 7 8 L 8 6 M -8 9 L -1 9","-11 11 M -4 -5 L -4 -1 L -5 5 L -6 8 L -7 9 L -8 9 L -9 8 L -8 7 L -7 8 M 5 -5 L 5 9 M 6 -5 L 6 9 M -7 -5 L 9 -5 M 2 9 L 9 9","-11 12 M -6 -5 L -6 9 M -6 -5 L 0 9 M -5 -5 L 0 7 M 6 -5 L 0 9 M 6 -5 L 6 9 M 7 -5 L 7 9 M -9 -5 L -5 -5 M 6 -5 L 10 -5 M -9 9 L -3 9 M 3 9 L 10 9","-11 11 M -6 -5 L -6 9 M -5 -5 L -5 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L -2 -5 M 2 -5 L 9 -5 M -5 2 L 5 2 M -9 9 L -2 9 M 2 9 L 9 9","-10 10 M -1 -5 L -4 -4 L -6 -2 L -7 1 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 3 L 7 1 L 6 -2 L 4 -4 L 1 -5 L -1 -5 M -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 3 L -5 6 L -3 8 L -1 9 M 1 9 L 3 8 L 5 6 L 6 3 L 6 1 L 5 -2 L 3 -4 L 1 -5","-11 11 M -6 -5 L -6 9 M -5 -5 L -5 9 M 5 -5 L 5 9 M 6 -5 L 6 9 M -9 -5 L 9 -5 M -9 9 L -2 9 M 2 9 L 9 9","-15 16 M -10 -5 L -10 9 M -9 -5 L -9 9 M 0 -5 L 0 9 M 1 -5 L 1 9 M 10 -5 L 10 9 M 11 -5 L 11 9 M -13 -5 L -6 -5 M -3 -5 L 4 -5 M 7 -5 L 14 -5 M -13 9 L 14 9","-11 10 M -6 -5 L -6 16 M -5 -5 L -5 16 M -5 -2 L -3 -4 L -1 -5 L 1 -5 L 4 -4 L 6 -2 L 7 1 L 7 3 L 6 6 L 4 8 L 1 9 L -1 9 L -3 8 L -5 6 M 1 -5 L 3 -4 L 5 -2 L 6 1 L 6 3 L 5 6 L 3 8 L 1 9 M -9 -5 L -5 -5 M -9 16 L -2 16","-10 9 M 5 -2 L 4 -1 L 5 0 L 6 -1 L 6 -2 L 4 -4 L 2 -5 L -1 -5 L -4 -4 L -6 -2 L -7 1 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 M -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 3 L -5 6 L -3 8 L -1 9","-9 10 M 0 -5 L 0 9 M 1 -5 L 1 9 M -5 -5 L -6 0 L -6 -5 L 7 -5 L 7 0 L 6 -5 M -3 9 L 4 9","-14 15 M -9 -5 L -9 9 M -8 -5 L -8 9 M -12 -5 L -5 -5 M -12 9 L -5 9 M 4 -5 L 1 -4 L -1 -2 L -2 1 L -2 3 L -1 6 L 1 8 L 4 9 L 6 9 L 9 8 L 11 6 L 12 3 L 12 1 L 11 -2 L 9 -4 L 6 -5 L 4 -5 M 4 -5 L 2 -4 L 0 -2 L -1 1 L -1 3 L 0 6 L 2 8 L 4 9 M 6 9 L 8 8 L 10 6 L 11 3 L 11 1 L 10 -2 L 8 -4 L 6 -5 M -8 2 L -2 2","-10 10 M -5 -5 L -5 9 M -4 -5 L -4 9 M -8 -5 L 3 -5 L 6 -4 L 7 -2 L 7 -1 L 6 1 L 3 2 M 3 -5 L 5 -4 L 6 -2 L 6 -1 L 5 1 L 3 2 M -4 2 L 3 2 L 6 3 L 7 5 L 7 6 L 6 8 L 3 9 L -8 9 M 3 2 L 5 3 L 6 5 L 6 6 L 5 8 L 3 9","-15 16 M -10 -5 L -10 9 M -9 -5 L -9 9 M 0 -5 L 0 9 M 1 -5 L 1 9 M 10 -5 L 10 9 M 11 -5 L 11 9 M -13 -5 L -6 -5 M -3 -5 L 4 -5 M 7 -5 L 14 -5 M -13 9 L 14 9 L 14 14 L 13 9","-10 10 M -6 -5 L 5 9 M -5 -5 L 6 9 M 6 -5 L -6 9 M -8 -5 L -2 -5 M 2 -5 L 8 -5 M -8 9 L -2 9 M 2 9 L 8 9","-9 9 M -6 -5 L 0 9 M -5 -5 L 0 7 M 6 -5 L 0 9 L -2 13 L -4 15 L -6 16 L -7 16 L -8 15 L -7 14 L -6 15 M -8 -5 L -2 -5 M 2 -5 L 8 -5","-9 9 M -5 -3 L -6 -5 L -6 -1 L -5 -3 L -4 -4 L -2 -5 L 2 -5 L 5 -4 L 6 -2 L 6 -1 L 5 1 L 2 2 M 2 -5 L 4 -4 L 5 -2 L 5 -1 L 4 1 L 2 2 M -1 2 L 2 2 L 5 3 L 6 5 L 6 6 L 5 8 L 2 9 L -2 9 L -5 8 L -6 6 L -6 5 L -5 4 L -4 5 L -5 6 M 2 2 L 4 3 L 5 5 L 5 6 L 4 8 L 2 9","-10 9 M -6 1 L 6 1 L 6 -1 L 5 -3 L 4 -4 L 2 -5 L -1 -5 L -4 -4 L -6 -2 L -7 1 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 M 5 1 L 5 -2 L 4 -4 M -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 3 L -5 6 L -3 8 L -1 9","-10 11 M -1 -5 L -1 9 M 0 -5 L 0 9 M -6 -5 L -7 0 L -7 -5 L 3 -5 M 0 2 L 4 2 L 7 3 L 8 5 L 8 6 L 7 8 L 4 9 L -4 9 M 4 2 L 6 3 L 7 5 L 7 6 L 6 8 L 4 9","-11 10 M 4 -5 L 4 9 M 5 -5 L 5 9 M 8 -5 L -3 -5 L -6 -4 L -7 -2 L -7 -1 L -6 1 L -3 2 L 4 2 M -3 -5 L -5 -4 L -6 -2 L -6 -1 L -5 1 L -3 2 M 2 2 L -1 3 L -2 4 L -4 8 L -5 9 M 2 2 L 0 3 L -1 4 L -3 8 L -4 9 L -6 9 L -7 8 L -8 6 M 1 9 L 8 9","-8 9 M -3 -5 L -3 9 M -2 -5 L -2 9 M -6 -5 L 1 -5 M -2 2 L 2 2 L 5 3 L 6 5 L 6 6 L 5 8 L 2 9 L -6 9 M 2 2 L 4 3 L 5 5 L 5 6 L 4 8 L 2 9","-12 12 M -9 3 L -9 1 L -8 -2 L -6 -3 L -4 -3 L -2 -2 L 2 1 L 4 2 L 6 2 L 8 1 L 9 -1 M -9 1 L -8 -1 L -6 -2 L -4 -2 L -2 -1 L 2 2 L 4 3 L 6 3 L 8 2 L 9 -1 L 9 -3"]
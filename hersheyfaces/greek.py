@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","-5 5 M 0 -12 L 0 2 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-8 8 M -4 -12 L -4 -5 M 4 -12 L 4 -5","-10 11 M 1 -16 L -6 16 M 7 -16 L 0 16 M -6 -3 L 8 -3 M -7 3 L 7 3","-10 10 M -2 -16 L -2 13 M 2 -16 L 2 13 M 7 -9 L 5 -11 L 2 -12 L -2 -12 L -5 -11 L -7 -9 L -7 -7 L -6 -5 L -5 -4 L -3 -3 L 3 -1 L 5 0 L 6 1 L 7 3 L 7 6 L 5 8 L 2 9 L -2 9 L -5 8 L -7 6","-12 12 M 9 -12 L -9 9 M -4 -12 L -2 -10 L -2 -8 L -3 -6 L -5 -5 L -7 -5 L -9 -7 L -9 -9 L -8 -11 L -6 -12 L -4 -12 L -2 -11 L 1 -10 L 4 -10 L 7 -11 L 9 -12 M 5 2 L 3 3 L 2 5 L 2 7 L 4 9 L 6 9 L 8 8 L 9 6 L 9 4 L 7 2 L 5 2","-13 13 M 10 -3 L 10 -4 L 9 -5 L 8 -5 L 7 -4 L 6 -2 L 4 3 L 2 6 L 0 8 L -2 9 L -6 9 L -8 8 L -9 7 L -10 5 L -10 3 L -9 1 L -8 0 L -1 -4 L 0 -5 L 1 -7 L 1 -9 L 0 -11 L -2 -12 L -4 -11 L -5 -9 L -5 -7 L -4 -4 L -2 -1 L 3 6 L 5 8 L 7 9 L 9 9 L 10 8 L 10 7","-5 5 M 0 -10 L -1 -11 L 0 -12 L 1 -11 L 1 -9 L 0 -7 L -1 -6","-7 7 M 4 -16 L 2 -14 L 0 -11 L -2 -7 L -3 -2 L -3 2 L -2 7 L 0 11 L 2 14 L 4 16","-7 7 M -4 -16 L -2 -14 L 0 -11 L 2 -7 L 3 -2 L 3 2 L 2 7 L 0 11 L -2 14 L -4 16","-8 8 M 0 -6 L 0 6 M -5 -3 L 5 3 M 5 -3 L -5 3","-13 13 M 0 -9 L 0 9 M -9 0 L 9 0","-4 4 M 1 5 L 0 6 L -1 5 L 0 4 L 1 5 L 1 7 L -1 9","-13 13 M -9 0 L 9 0","-4 4 M 0 4 L -1 5 L 0 6 L 1 5 L 0 4","-11 11 M 9 -16 L -9 16","-10 10 M -1 -12 L -4 -11 L -6 -8 L -7 -3 L -7 0 L -6 5 L -4 8 L -1 9 L 1 9 L 4 8 L 6 5 L 7 0 L 7 -3 L 6 -8 L 4 -11 L 1 -12 L -1 -12","-10 10 M -4 -8 L -2 -9 L 1 -12 L 1 9","-10 10 M -6 -7 L -6 -8 L -5 -10 L -4 -11 L -2 -12 L 2 -12 L 4 -11 L 5 -10 L 6 -8 L 6 -6 L 5 -4 L 3 -1 L -7 9 L 7 9","-10 10 M -5 -12 L 6 -12 L 0 -4 L 3 -4 L 5 -3 L 6 -2 L 7 1 L 7 3 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5","-10 10 M 3 -12 L -7 2 L 8 2 M 3 -12 L 3 9","-10 10 M 5 -12 L -5 -12 L -6 -3 L -5 -4 L -2 -5 L 1 -5 L 4 -4 L 6 -2 L 7 1 L 7 3 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5","-10 10 M 6 -9 L 5 -11 L 2 -12 L 0 -12 L -3 -11 L -5 -8 L -6 -3 L -6 2 L -5 6 L -3 8 L 0 9 L 1 9 L 4 8 L 6 6 L 7 3 L 7 2 L 6 -1 L 4 -3 L 1 -4 L 0 -4 L -3 -3 L -5 -1 L -6 2","-10 10 M 7 -12 L -3 9 M -7 -12 L 7 -12","-10 10 M -2 -12 L -5 -11 L -6 -9 L -6 -7 L -5 -5 L -3 -4 L 1 -3 L 4 -2 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 2 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 2 L -6 0 L -4 -2 L -1 -3 L 3 -4 L 5 -5 L 6 -7 L 6 -9 L 5 -11 L 2 -12 L -2 -12","-10 10 M 6 -5 L 5 -2 L 3 0 L 0 1 L -1 1 L -4 0 L -6 -2 L -7 -5 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 0 -12 L 3 -11 L 5 -9 L 6 -5 L 6 0 L 5 5 L 3 8 L 0 9 L -2 9 L -5 8 L -6 6","-4 4 M 0 -3 L -1 -2 L 0 -1 L 1 -2 L 0 -3 M 0 4 L -1 5 L 0 6 L 1 5 L 0 4","-4 4 M 0 -3 L -1 -2 L 0 -1 L 1 -2 L 0 -3 M 1 5 L 0 6 L -1 5 L 0 4 L 1 5 L 1 7 L -1 9","-12 12 M 8 -9 L -8 0 L 8 9","-13 13 M -9 -3 L 9 -3 M -9 3 L 9 3","-12 12 M -8 -9 L 8 0 L -8 9","-9 9 M -6 -7 L -6 -8 L -5 -10 L -4 -11 L -2 -12 L 2 -12 L 4 -11 L 5 -10 L 6 -8 L 6 -6 L 5 -4 L 4 -3 L 0 -1 L 0 2 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-13 14 M 5 -4 L 4 -6 L 2 -7 L -1 -7 L -3 -6 L -4 -5 L -5 -2 L -5 1 L -4 3 L -2 4 L 1 4 L 3 3 L 4 1 M -1 -7 L -3 -5 L -4 -2 L -4 1 L -3 3 L -2 4 M 5 -7 L 4 1 L 4 3 L 6 4 L 8 4 L 10 2 L 11 -1 L 11 -3 L 10 -6 L 9 -8 L 7 -10 L 5 -11 L 2 -12 L -1 -12 L -4 -11 L -6 -10 L -8 -8 L -9 -6 L -10 -3 L -10 0 L -9 3 L -8 5 L -6 7 L -4 8 L -1 9 L 2 9 L 5 8 L 7 7 L 8 6 M 6 -7 L 5 1 L 5 3 L 6 4","-9 9 M 0 -12 L -8 9 M 0 -12 L 8 9 M -5 2 L 5 2","-11 10 M -7 -12 L -7 9 M -7 -12 L 2 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -6 L 6 -4 L 5 -3 L 2 -2 M -7 -2 L 2 -2 L 5 -1 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 2 9 L -7 9","-10 10 M -7 -12 L 7 9 M -7 9 L 7 -12","-9 9 M 0 -12 L -8 9 M 0 -12 L 8 9 M -8 9 L 8 9","-10 9 M -6 -12 L -6 9 M -6 -12 L 7 -12 M -6 -2 L 2 -2 M -6 9 L 7 9","-10 10 M 0 -12 L 0 9 M -2 -7 L -5 -6 L -6 -5 L -7 -3 L -7 0 L -6 2 L -5 3 L -2 4 L 2 4 L 5 3 L 6 2 L 7 0 L 7 -3 L 6 -5 L 5 -6 L 2 -7 L -2 -7","-10 7 M -6 -12 L -6 9 M -6 -12 L 6 -12","-11 11 M -7 -12 L -7 9 M 7 -12 L 7 9 M -7 -2 L 7 -2","-4 4 M 0 -12 L 0 9","-2 3 M 0 -1 L 0 0 L 1 0 L 1 -1 L 0 -1","-11 10 M -7 -12 L -7 9 M 7 -12 L -7 2 M -2 -3 L 7 9","-9 9 M 0 -12 L -8 9 M 0 -12 L 8 9","-12 12 M -8 -12 L -8 9 M -8 -12 L 0 9 M 8 -12 L 0 9 M 8 -12 L 8 9","-11 11 M -7 -12 L -7 9 M -7 -12 L 7 9 M 7 -12 L 7 9","-11 11 M -2 -12 L -4 -11 L -6 -9 L -7 -7 L -8 -4 L -8 1 L -7 4 L -6 6 L -4 8 L -2 9 L 2 9 L 4 8 L 6 6 L 7 4 L 8 1 L 8 -4 L 7 -7 L 6 -9 L 4 -11 L 2 -12 L -2 -12","-11 11 M -7 -12 L -7 9 M 7 -12 L 7 9 M -7 -12 L 7 -12","-11 11 M -2 -12 L -4 -11 L -6 -9 L -7 -7 L -8 -4 L -8 1 L -7 4 L -6 6 L -4 8 L -2 9 L 2 9 L 4 8 L 6 6 L 7 4 L 8 1 L 8 -4 L 7 -7 L 6 -9 L 4 -11 L 2 -12 L -2 -12 M -3 -2 L 3 -2","-11 10 M -7 -12 L -7 9 M -7 -12 L 2 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -5 L 6 -3 L 5 -2 L 2 -1 L -7 -1","-9 9 M -7 -12 L 0 -2 L -7 9 M -7 -12 L 7 -12 M -7 9 L 7 9","-8 8 M 0 -12 L 0 9 M -7 -12 L 7 -12","-9 9 M -7 -7 L -7 -9 L -6 -11 L -5 -12 L -3 -12 L -2 -11 L -1 -9 L 0 -5 L 0 9 M 7 -7 L 7 -9 L 6 -11 L 5 -12 L 3 -12 L 2 -11 L 1 -9 L 0 -5","-7 7 M -1 -12 L -3 -11 L -4 -9 L -4 -7 L -3 -5 L -1 -4 L 1 -4 L 3 -5 L 4 -7 L 4 -9 L 3 -11 L 1 -12 L -1 -12","-10 10 M -7 9 L -3 9 L -6 2 L -7 -2 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 1 -12 L 4 -11 L 6 -9 L 7 -6 L 7 -2 L 6 2 L 3 9 L 7 9","-9 9 M -7 -12 L 7 -12 M -3 -2 L 3 -2 M -7 9 L 7 9","-11 11 M 0 -12 L 0 9 M -9 -6 L -8 -6 L -7 -5 L -6 -1 L -5 1 L -4 2 L -1 3 L 1 3 L 4 2 L 5 1 L 6 -1 L 7 -5 L 8 -6 L 9 -6","-10 10 M 7 -12 L -7 9 M -7 -12 L 7 -12 M -7 9 L 7 9","-7 7 M -3 -16 L -3 16 M -2 -16 L -2 16 M -3 -16 L 4 -16 M -3 16 L 4 16","-7 7 M -7 -12 L 7 12","-7 7 M 2 -16 L 2 16 M 3 -16 L 3 16 M -4 -16 L 3 -16 M -4 16 L 3 16","-8 8 M 0 -14 L -8 0 M 0 -14 L 8 0","-9 9 M -9 16 L 9 16","-4 4 M 1 -7 L -1 -5 L -1 -3 L 0 -2 L 1 -3 L 0 -4 L -1 -3","-10 11 M -1 -5 L -3 -4 L -5 -2 L -6 0 L -7 3 L -7 6 L -6 8 L -4 9 L -2 9 L 0 8 L 3 5 L 5 2 L 7 -2 L 8 -5 M -1 -5 L 1 -5 L 2 -4 L 3 -2 L 5 6 L 6 8 L 7 9 L 8 9","-9 10 M 3 -12 L 1 -11 L -1 -9 L -3 -5 L -4 -2 L -5 2 L -6 8 L -7 16 M 3 -12 L 5 -12 L 7 -10 L 7 -7 L 6 -5 L 5 -4 L 3 -3 L 0 -3 M 0 -3 L 2 -2 L 4 0 L 5 2 L 5 5 L 4 7 L 3 8 L 1 9 L -1 9 L -3 8 L -4 7 L -5 4","-9 9 M -7 -5 L -5 -5 L -3 -3 L 3 14 L 5 16 L 7 16 M 8 -5 L 7 -3 L 5 0 L -5 11 L -7 14 L -8 16","-9 9 M 2 -5 L -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 4 L -5 7 L -4 8 L -2 9 L 0 9 L 2 8 L 4 6 L 5 3 L 5 0 L 4 -3 L 2 -5 L 0 -7 L -1 -9 L -1 -11 L 0 -12 L 2 -12 L 4 -11 L 6 -9","-8 8 M 5 -3 L 4 -4 L 2 -5 L -1 -5 L -3 -4 L -3 -2 L -2 0 L 1 1 M 1 1 L -3 2 L -5 4 L -5 6 L -4 8 L -2 9 L 1 9 L 3 8 L 5 6","-11 11 M -3 -4 L -5 -3 L -7 -1 L -8 2 L -8 5 L -7 7 L -6 8 L -4 9 L -1 9 L 2 8 L 5 6 L 7 3 L 8 0 L 8 -3 L 6 -5 L 4 -5 L 2 -3 L 0 1 L -2 6 L -5 16","-9 10 M -8 -2 L -6 -4 L -4 -5 L -3 -5 L -1 -4 L 0 -3 L 1 0 L 1 4 L 0 9 M 8 -5 L 7 -2 L 6 0 L 0 9 L -2 13 L -3 16","-10 10 M -9 -1 L -8 -3 L -6 -5 L -4 -5 L -3 -4 L -3 -2 L -4 2 L -6 9 M -4 2 L -2 -2 L 0 -4 L 2 -5 L 4 -5 L 6 -3 L 6 0 L 5 5 L 2 16","-6 5 M 0 -5 L -2 2 L -3 6 L -3 8 L -2 9 L 0 9 L 2 7 L 3 5","-11 11 M -7 -7 L 7 7 M 7 -7 L -7 7","-9 9 M -3 -5 L -7 9 M 7 -4 L 6 -5 L 5 -5 L 3 -4 L -1 0 L -3 1 L -4 1 M -4 1 L -2 2 L -1 3 L 1 8 L 2 9 L 3 9 L 4 8","-8 8 M -7 -12 L -5 -12 L -3 -11 L -2 -10 L 6 9 M 0 -5 L -6 9","-10 11 M -3 -5 L -9 16 M -4 -1 L -5 4 L -5 7 L -3 9 L -1 9 L 1 8 L 3 6 L 5 2 M 7 -5 L 5 2 L 4 6 L 4 8 L 5 9 L 7 9 L 9 7 L 10 5","-9 9 M -6 -5 L -3 -5 L -4 1 L -5 6 L -6 9 M 7 -5 L 6 -2 L 5 0 L 3 3 L 0 6 L -3 8 L -6 9","-8 9 M 0 -5 L -2 -4 L -4 -2 L -5 1 L -5 4 L -4 7 L -3 8 L -1 9 L 1 9 L 3 8 L 5 6 L 6 3 L 6 0 L 5 -3 L 4 -4 L 2 -5 L 0 -5","-11 11 M -2 -5 L -6 9 M 3 -5 L 4 1 L 5 6 L 6 9 M -9 -2 L -7 -4 L -4 -5 L 9 -5","-11 10 M -10 -1 L -9 -3 L -7 -5 L -5 -5 L -4 -4 L -4 -2 L -5 3 L -5 6 L -4 8 L -3 9 L -1 9 L 1 8 L 3 5 L 4 3 L 5 0 L 6 -5 L 6 -8 L 5 -11 L 3 -12 L 1 -12 L 0 -10 L 0 -8 L 1 -5 L 3 -2 L 5 0 L 8 2","-9 9 M -5 1 L -5 4 L -4 7 L -3 8 L -1 9 L 1 9 L 3 8 L 5 6 L 6 3 L 6 0 L 5 -3 L 4 -4 L 2 -5 L 0 -5 L -2 -4 L -4 -2 L -5 1 L -9 16","-9 11 M 9 -5 L -1 -5 L -3 -4 L -5 -2 L -6 1 L -6 4 L -5 7 L -4 8 L -2 9 L 0 9 L 2 8 L 4 6 L 5 3 L 5 0 L 4 -3 L 3 -4 L 1 -5","-10 10 M 1 -5 L -2 9 M -8 -2 L -6 -4 L -3 -5 L 8 -5","-10 10 M -9 -1 L -8 -3 L -6 -5 L -4 -5 L -3 -4 L -3 -2 L -5 4 L -5 7 L -3 9 L -1 9 L 2 8 L 4 6 L 6 2 L 7 -2 L 7 -5","-13 13 M 0 -9 L -1 -8 L 0 -7 L 1 -8 L 0 -9 M -9 0 L 9 0 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-12 11 M -4 -5 L -6 -4 L -8 -1 L -9 2 L -9 5 L -8 8 L -7 9 L -5 9 L -3 8 L -1 5 M 0 1 L -1 5 L 0 8 L 1 9 L 3 9 L 5 8 L 7 5 L 8 2 L 8 -1 L 7 -4 L 6 -5","-8 8 M 2 -12 L 0 -11 L -1 -10 L -1 -9 L 0 -8 L 3 -7 L 6 -7 M 3 -7 L 0 -6 L -2 -5 L -3 -3 L -3 -1 L -1 1 L 2 2 L 4 2 M 2 2 L -2 3 L -4 4 L -5 6 L -5 8 L -3 10 L 1 12 L 2 13 L 2 15 L 0 16 L -2 16","-12 11 M 4 -12 L -4 16 M -11 -1 L -10 -3 L -8 -5 L -6 -5 L -5 -4 L -5 -2 L -6 3 L -6 6 L -5 8 L -3 9 L -1 9 L 2 8 L 4 6 L 6 3 L 8 -2 L 9 -5","-8 7 M 2 -12 L 0 -11 L -1 -10 L -1 -9 L 0 -8 L 3 -7 L 6 -7 M 6 -7 L 2 -5 L -1 -3 L -4 0 L -5 3 L -5 5 L -4 7 L -2 9 L 1 11 L 2 13 L 2 15 L 1 16 L -1 16 L -2 14","-7 7 M 2 -16 L 0 -15 L -1 -14 L -2 -12 L -2 -10 L -1 -8 L 0 -7 L 1 -5 L 1 -3 L -1 -1 M 0 -15 L -1 -13 L -1 -11 L 0 -9 L 1 -8 L 2 -6 L 2 -4 L 1 -2 L -3 0 L 1 2 L 2 4 L 2 6 L 1 8 L 0 9 L -1 11 L -1 13 L 0 15 M -1 1 L 1 3 L 1 5 L 0 7 L -1 8 L -2 10 L -2 12 L -1 14 L 0 15 L 2 16","-4 4 M 0 -16 L 0 16","-7 7 M -2 -16 L 0 -15 L 1 -14 L 2 -12 L 2 -10 L 1 -8 L 0 -7 L -1 -5 L -1 -3 L 1 -1 M 0 -15 L 1 -13 L 1 -11 L 0 -9 L -1 -8 L -2 -6 L -2 -4 L -1 -2 L 3 0 L -1 2 L -2 4 L -2 6 L -1 8 L 0 9 L 1 11 L 1 13 L 0 15 M 1 1 L -1 3 L -1 5 L 0 7 L 1 8 L 2 10 L 2 12 L 1 14 L 0 15 L -2 16","-12 12 M -9 3 L -9 1 L -8 -2 L -6 -3 L -4 -3 L -2 -2 L 2 1 L 4 2 L 6 2 L 8 1 L 9 -1 M -9 1 L -8 -1 L -6 -2 L -4 -2 L -2 -1 L 2 2 L 4 3 L 6 3 L 8 2 L 9 -1 L 9 -3","-8 8 M -8 -12 L -8 9 L -7 9 L -7 -12 L -6 -12 L -6 9 L -5 9 L -5 -12 L -4 -12 L -4 9 L -3 9 L -3 -12 L -2 -12 L -2 9 L -1 9 L -1 -12 L 0 -12 L 0 9 L 1 9 L 1 -12 L 2 -12 L 2 9 L 3 9 L 3 -12 L 4 -12 L 4 9 L 5 9 L 5 -12 L 6 -12 L 6 9 L 7 9 L 7 -12 L 8 -12 L 8 9"]
@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-7 7 M -1 -7 L -4 -6 L -6 -4 L -7 -1 L -7 1 L -6 4 L -4 6 L -1 7 L 1 7 L 4 6 L 6 4 L 7 1 L 7 -1 L 6 -4 L 4 -6 L 1 -7 L -1 -7","-6 6 M -6 -6 L -6 6 L 6 6 L 6 -6 L -6 -6","-7 7 M 0 -8 L -7 4 L 7 4 L 0 -8","-6 6 M 0 -10 L -6 0 L 0 10 L 6 0 L 0 -10","-8 8 M 0 -9 L -2 -3 L -8 -3 L -3 1 L -5 7 L 0 3 L 5 7 L 3 1 L 8 -3 L 2 -3 L 0 -9","-6 6 M -2 -6 L -2 -2 L -6 -2 L -6 2 L -2 2 L -2 6 L 2 6 L 2 2 L 6 2 L 6 -2 L 2 -2 L 2 -6 L -2 -6","-7 7 M 0 -7 L 0 7 M -7 0 L 7 0","-5 5 M -5 -5 L 5 5 M 5 -5 L -5 5","-5 5 M 0 -6 L 0 6 M -5 -3 L 5 3 M 5 -3 L -5 3","-4 4 M -1 -4 L -3 -3 L -4 -1 L -4 1 L -3 3 L -1 4 L 1 4 L 3 3 L 4 1 L 4 -1 L 3 -3 L 1 -4 L -1 -4 M -3 -1 L -3 1 M -2 -2 L -2 2 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -2 L 2 2 M 3 -1 L 3 1","-4 4 M -4 -4 L -4 4 L 4 4 L 4 -4 L -4 -4 M -3 -3 L -3 3 M -2 -3 L -2 3 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -3 L 2 3 M 3 -3 L 3 3","-5 5 M 0 -6 L -5 3 L 5 3 L 0 -6 M 0 -3 L -3 2 M 0 -3 L 3 2 M 0 0 L -1 2 M 0 0 L 1 2","-6 3 M -6 0 L 3 5 L 3 -5 L -6 0 M -3 0 L 2 3 M -3 0 L 2 -3 M 0 0 L 2 1 M 0 0 L 2 -1","-5 5 M 0 6 L 5 -3 L -5 -3 L 0 6 M 0 3 L 3 -2 M 0 3 L -3 -2 M 0 0 L 1 -2 M 0 0 L -1 -2","-3 6 M 6 0 L -3 -5 L -3 5 L 6 0 M 3 0 L -2 -3 M 3 0 L -2 3 M 0 0 L -2 -1 M 0 0 L -2 1","-14 14 M -14 0 L 14 0 M -14 0 L 0 16 M 14 0 L 0 16","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-7 7 M -1 -7 L -4 -6 L -6 -4 L -7 -1 L -7 1 L -6 4 L -4 6 L -1 7 L 1 7 L 4 6 L 6 4 L 7 1 L 7 -1 L 6 -4 L 4 -6 L 1 -7 L -1 -7","-6 6 M -6 -6 L -6 6 L 6 6 L 6 -6 L -6 -6","-7 7 M 0 -8 L -7 4 L 7 4 L 0 -8","-6 6 M 0 -10 L -6 0 L 0 10 L 6 0 L 0 -10","-8 8 M 0 -9 L -2 -3 L -8 -3 L -3 1 L -5 7 L 0 3 L 5 7 L 3 1 L 8 -3 L 2 -3 L 0 -9","-6 6 M -2 -6 L -2 -2 L -6 -2 L -6 2 L -2 2 L -2 6 L 2 6 L 2 2 L 6 2 L 6 -2 L 2 -2 L 2 -6 L -2 -6","-7 7 M 0 -7 L 0 7 M -7 0 L 7 0","-5 5 M -5 -5 L 5 5 M 5 -5 L -5 5","-5 5 M 0 -6 L 0 6 M -5 -3 L 5 3 M 5 -3 L -5 3","-4 4 M -1 -4 L -3 -3 L -4 -1 L -4 1 L -3 3 L -1 4 L 1 4 L 3 3 L 4 1 L 4 -1 L 3 -3 L 1 -4 L -1 -4 M -3 -1 L -3 1 M -2 -2 L -2 2 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -2 L 2 2 M 3 -1 L 3 1","-4 4 M -4 -4 L -4 4 L 4 4 L 4 -4 L -4 -4 M -3 -3 L -3 3 M -2 -3 L -2 3 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -3 L 2 3 M 3 -3 L 3 3","-5 5 M 0 -6 L -5 3 L 5 3 L 0 -6 M 0 -3 L -3 2 M 0 -3 L 3 2 M 0 0 L -1 2 M 0 0 L 1 2","-6 3 M -6 0 L 3 5 L 3 -5 L -6 0 M -3 0 L 2 3 M -3 0 L 2 -3 M 0 0 L 2 1 M 0 0 L 2 -1","-5 5 M 0 6 L 5 -3 L -5 -3 L 0 6 M 0 3 L 3 -2 M 0 3 L -3 -2 M 0 0 L 1 -2 M 0 0 L -1 -2","-3 6 M 6 0 L -3 -5 L -3 5 L 6 0 M 3 0 L -2 -3 M 3 0 L -2 3 M 0 0 L -2 -1 M 0 0 L -2 1","-14 14 M -14 0 L 14 0 M -14 0 L 0 16 M 14 0 L 0 16","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8","-8 8"]
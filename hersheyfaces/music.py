@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","-5 5 M 0 -12 L -1 -10 L 0 2 L 1 -10 L 0 -12 M 0 -10 L 0 -4 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-8 8 M -5 -2 L -1 0 L 2 2 L 4 4 L 5 7 L 5 9 L 4 11 L 3 12 M -5 -1 L 1 2 M -5 0 L -2 1 L 2 3 L 4 5 L 5 7","-8 8 M 5 -7 L 4 -5 L 2 -3 L -2 -1 L -5 0 M 1 -2 L -5 1 M 3 -12 L 4 -11 L 5 -9 L 5 -7 L 4 -4 L 2 -2 L -1 0 L -5 2","-10 10 M 1 -5 L -3 -4 L -6 -2 L -7 0 L -7 2 L -6 4 L -4 5 L -1 5 L 3 4 L 6 2 L 7 0 L 7 -2 L 6 -4 L 4 -5 L 1 -5 M 6 -4 L 1 -5 M 4 -5 L -1 -4 L -6 -2 M -3 -4 L -7 0 M -6 4 L -1 5 M -4 5 L 1 4 L 6 2 M 3 4 L 7 0","-10 10 M 1 -5 L -3 -4 L -6 -2 L -7 0 L -7 2 L -6 4 L -4 5 L -1 5 L 3 4 L 6 2 L 7 0 L 7 -2 L 6 -4 L 4 -5 L 1 -5 M 6 -4 L 1 -5 M 4 -5 L -1 -4 L -6 -2 M -3 -4 L -7 0 M -6 4 L -1 5 M -4 5 L 1 4 L 6 2 M 3 4 L 7 0","-8 9 M 1 -5 L -2 -4 L -4 -2 L -5 0 L -5 2 L -4 4 L -2 5 L 0 5 L 3 4 L 5 2 L 6 0 L 6 -2 L 5 -4 L 3 -5 L 1 -5 M -3 -2 L 3 -5 M -4 0 L 4 -4 M -5 2 L 5 -3 M -4 3 L 6 -2 M -3 4 L 5 0 M -2 5 L 4 2","-8 8 M -3 -11 L -3 12 M 3 -12 L 3 11 M -5 -4 L 5 -6 M -5 -3 L 5 -5 M -5 5 L 5 3 M -5 6 L 5 4","-8 8 M -4 -12 L -4 6 M 4 -6 L 4 12 M -4 -4 L 4 -6 M -4 -3 L 4 -5 M -4 5 L 4 3 M -4 6 L 4 4","-8 8 M -4 -16 L -4 5 M -4 -4 L -1 -6 L 2 -6 L 4 -5 L 5 -3 L 5 -1 L 4 1 L 1 3 L -1 4 L -4 5 M -4 -4 L -1 -5 L 2 -5 L 4 -4 M 3 -5 L 4 -3 L 4 -1 L 3 1 L 1 3","-13 13 M -10 -9 L -10 -6 M 10 -9 L 10 -6 M -10 -9 L 10 -9 M -10 -8 L 10 -8 M -10 -7 L 10 -7 M -10 -6 L 10 -6","-8 8 M -5 -4 L -5 -1 M 5 -4 L 5 -1 M -5 -4 L 5 -4 M -5 -3 L 5 -3 M -5 -2 L 5 -2 M -5 -1 L 5 -1","-8 8 M -5 -6 L 5 6 M -5 -6 L -3 -4 L -1 -3 L 2 -3 L 4 -4 L 5 -5 L 5 -7 L 3 -7 L 3 -5 L 2 -3 M -3 -4 L 2 -3 M -1 -3 L 5 -5 M 4 -7 L 4 -4 M 3 -6 L 5 -6 M 5 6 L 3 4 L 1 3 L -2 3 L -4 4 L -5 5 L -5 7 L -3 7 L -3 5 L -2 3 M 3 4 L -2 3 M 1 3 L -5 5 M -4 4 L -4 7 M -5 6 L -3 6","-8 8 M -2 -3 L -3 -5 L -3 -7 L -5 -7 L -5 -5 L -4 -4 L -2 -3 L 1 -3 L 3 -4 L 5 -6 M -4 -7 L -4 -4 M -5 -6 L -3 -6 M -5 -5 L 1 -3 M -2 -3 L 3 -4 M 5 -6 L 5 7","-8 8 M -1 -15 L 4 -5 L 0 2 L 0 3 M 3 -6 L -1 1 M 2 -9 L 2 -7 L -2 0 L 0 3 L 3 7 M 5 10 L 3 7 L 1 6 L -1 6 L -3 7 L -4 9 L -4 11 L -3 13 L 0 15 M 5 10 L 3 8 L 1 7 L -3 7 L -3 11 L -2 13 L 0 15 M 1 6 L -2 8 L -4 11","-13 20 M -4 1 L -3 3 L -1 4 L 1 4 L 3 3 L 4 1 L 4 -1 L 3 -3 L 1 -4 L -1 -4 L -3 -3 L -4 -2 L -5 1 L -5 4 L -4 7 L -2 9 L 1 10 L 4 10 L 7 9 L 9 7 L 10 5 L 11 2 L 11 -2 L 10 -5 L 8 -8 L 6 -9 L 3 -10 L 0 -10 L -3 -9 L -5 -8 L -7 -6 L -9 -3 L -10 1 L -10 6 L -9 11 L -7 15 L -5 17 L -2 19 L 2 20 L 7 20 L 11 19 L 14 17 L 16 15 M -7 -6 L -8 -4 L -9 0 L -9 6 L -8 10 L -6 14 L -4 16 L -1 18 L 3 19 L 7 19 L 11 18 L 13 17 L 16 15 M -2 -3 L 2 -3 M -3 -2 L 3 -2 M -4 -1 L 4 -1 M -4 0 L 4 0 M -4 1 L 4 1 M -3 2 L 3 2 M -2 3 L 2 3 M 15 -6 L 15 -4 L 17 -4 L 17 -6 L 15 -6 M 16 -6 L 16 -4 M 15 -5 L 17 -5 M 15 4 L 15 6 L 17 6 L 17 4 L 15 4 M 16 4 L 16 6 M 15 5 L 17 5","-10 10 M -1 -12 L -4 -11 L -6 -8 L -7 -3 L -7 0 L -6 5 L -4 8 L -1 9 L 1 9 L 4 8 L 6 5 L 7 0 L 7 -3 L 6 -8 L 4 -11 L 1 -12 L -1 -12 M -1 -12 L -3 -11 L -4 -10 L -5 -8 L -6 -3 L -6 0 L -5 5 L -4 7 L -3 8 L -1 9 M 1 9 L 3 8 L 4 7 L 5 5 L 6 0 L 6 -3 L 5 -8 L 4 -10 L 3 -11 L 1 -12","-10 10 M -4 -8 L -2 -9 L 1 -12 L 1 9 M 0 -11 L 0 9 M -4 9 L 5 9","-10 10 M -6 -8 L -5 -7 L -6 -6 L -7 -7 L -7 -8 L -6 -10 L -5 -11 L -2 -12 L 2 -12 L 5 -11 L 6 -10 L 7 -8 L 7 -6 L 6 -4 L 3 -2 L -2 0 L -4 1 L -6 3 L -7 6 L -7 9 M 2 -12 L 4 -11 L 5 -10 L 6 -8 L 6 -6 L 5 -4 L 2 -2 L -2 0 M -7 7 L -6 6 L -4 6 L 1 8 L 4 8 L 6 7 L 7 6 M -4 6 L 1 9 L 5 9 L 6 8 L 7 6 L 7 4","-10 10 M -6 -8 L -5 -7 L -6 -6 L -7 -7 L -7 -8 L -6 -10 L -5 -11 L -2 -12 L 2 -12 L 5 -11 L 6 -9 L 6 -6 L 5 -4 L 2 -3 L -1 -3 M 2 -12 L 4 -11 L 5 -9 L 5 -6 L 4 -4 L 2 -3 M 2 -3 L 4 -2 L 6 0 L 7 2 L 7 5 L 6 7 L 5 8 L 2 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 5 -1 L 6 2 L 6 5 L 5 7 L 4 8 L 2 9","-10 10 M 2 -10 L 2 9 M 3 -12 L 3 9 M 3 -12 L -8 3 L 8 3 M -1 9 L 6 9","-10 10 M -5 -12 L -7 -2 M -7 -2 L -5 -4 L -2 -5 L 1 -5 L 4 -4 L 6 -2 L 7 1 L 7 3 L 6 6 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -7 5 L -7 4 L -6 3 L -5 4 L -6 5 M 1 -5 L 3 -4 L 5 -2 L 6 1 L 6 3 L 5 6 L 3 8 L 1 9 M -5 -12 L 5 -12 M -5 -11 L 0 -11 L 5 -12","-10 10 M 5 -9 L 4 -8 L 5 -7 L 6 -8 L 6 -9 L 5 -11 L 3 -12 L 0 -12 L -3 -11 L -5 -9 L -6 -7 L -7 -3 L -7 3 L -6 6 L -4 8 L -1 9 L 1 9 L 4 8 L 6 6 L 7 3 L 7 2 L 6 -1 L 4 -3 L 1 -4 L 0 -4 L -3 -3 L -5 -1 L -6 2 M 0 -12 L -2 -11 L -4 -9 L -5 -7 L -6 -3 L -6 3 L -5 6 L -3 8 L -1 9 M 1 9 L 3 8 L 5 6 L 6 3 L 6 2 L 5 -1 L 3 -3 L 1 -4","-10 10 M -7 -12 L -7 -6 M -7 -8 L -6 -10 L -4 -12 L -2 -12 L 3 -9 L 5 -9 L 6 -10 L 7 -12 M -6 -10 L -4 -11 L -2 -11 L 3 -9 M 7 -12 L 7 -9 L 6 -6 L 2 -1 L 1 1 L 0 4 L 0 9 M 6 -6 L 1 -1 L 0 1 L -1 4 L -1 9","-10 10 M -2 -12 L -5 -11 L -6 -9 L -6 -6 L -5 -4 L -2 -3 L 2 -3 L 5 -4 L 6 -6 L 6 -9 L 5 -11 L 2 -12 L -2 -12 M -2 -12 L -4 -11 L -5 -9 L -5 -6 L -4 -4 L -2 -3 M 2 -3 L 4 -4 L 5 -6 L 5 -9 L 4 -11 L 2 -12 M -2 -3 L -5 -2 L -6 -1 L -7 1 L -7 5 L -6 7 L -5 8 L -2 9 L 2 9 L 5 8 L 6 7 L 7 5 L 7 1 L 6 -1 L 5 -2 L 2 -3 M -2 -3 L -4 -2 L -5 -1 L -6 1 L -6 5 L -5 7 L -4 8 L -2 9 M 2 9 L 4 8 L 5 7 L 6 5 L 6 1 L 5 -1 L 4 -2 L 2 -3","-10 10 M 6 -5 L 5 -2 L 3 0 L 0 1 L -1 1 L -4 0 L -6 -2 L -7 -5 L -7 -6 L -6 -9 L -4 -11 L -1 -12 L 1 -12 L 4 -11 L 6 -9 L 7 -6 L 7 0 L 6 4 L 5 6 L 3 8 L 0 9 L -3 9 L -5 8 L -6 6 L -6 5 L -5 4 L -4 5 L -5 6 M -1 1 L -3 0 L -5 -2 L -6 -5 L -6 -6 L -5 -9 L -3 -11 L -1 -12 M 1 -12 L 3 -11 L 5 -9 L 6 -6 L 6 0 L 5 4 L 4 6 L 2 8 L 0 9","-5 5 M 0 -5 L -1 -4 L 0 -3 L 1 -4 L 0 -5 M 0 7 L -1 8 L 0 9 L 1 8 L 0 7","-17 12 M -11 20 L -10 20 L -9 19 L -9 18 L -10 17 L -11 17 L -12 18 L -12 20 L -11 22 L -9 23 L -7 23 L -4 22 L -2 20 L -1 18 L 0 14 L 0 3 L -1 -23 L -1 -30 L 0 -35 L 1 -37 L 3 -38 L 4 -38 L 6 -37 L 7 -35 L 7 -31 L 6 -28 L 5 -26 L 3 -23 L -2 -19 L -8 -15 L -10 -13 L -12 -10 L -13 -8 L -14 -4 L -14 0 L -13 4 L -11 7 L -8 9 L -4 10 L 0 10 L 4 9 L 6 8 L 8 5 L 9 2 L 9 -2 L 8 -5 L 7 -7 L 5 -9 L 2 -10 L -2 -10 L -5 -9 L -7 -7 L -8 -4 L -8 0 L -7 3 L -5 5 M -11 18 L -11 19 L -10 19 L -10 18 L -11 18 M 3 -23 L -1 -19 L -6 -15 L -9 -12 L -11 -9 L -12 -7 L -13 -4 L -13 0 L -12 4 L -11 6 L -8 9 M 0 10 L 3 9 L 5 8 L 7 5 L 8 2 L 8 -2 L 7 -5 L 6 -7 L 4 -9 L 2 -10","-13 20 M -4 1 L -3 3 L -1 4 L 1 4 L 3 3 L 4 1 L 4 -1 L 3 -3 L 1 -4 L -1 -4 L -3 -3 L -4 -2 L -5 1 L -5 4 L -4 7 L -2 9 L 1 10 L 4 10 L 7 9 L 9 7 L 10 5 L 11 2 L 11 -2 L 10 -5 L 8 -8 L 6 -9 L 3 -10 L 0 -10 L -3 -9 L -5 -8 L -7 -6 L -9 -3 L -10 1 L -10 6 L -9 11 L -7 15 L -5 17 L -2 19 L 2 20 L 7 20 L 11 19 L 14 17 L 16 15 M -7 -6 L -8 -4 L -9 0 L -9 6 L -8 10 L -6 14 L -4 16 L -1 18 L 3 19 L 7 19 L 11 18 L 13 17 L 16 15 M -2 -3 L 2 -3 M -3 -2 L 3 -2 M -4 -1 L 4 -1 M -4 0 L 4 0 M -4 1 L 4 1 M -3 2 L 3 2 M -2 3 L 2 3 M 15 -6 L 15 -4 L 17 -4 L 17 -6 L 15 -6 M 16 -6 L 16 -4 M 15 -5 L 17 -5 M 15 4 L 15 6 L 17 6 L 17 4 L 15 4 M 16 4 L 16 6 M 15 5 L 17 5","-9 24 M -4 -1 L -3 -3 L -1 -4 L 1 -4 L 3 -3 L 4 -1 L 4 1 L 3 3 L 1 4 L -1 4 L -3 3 L -4 2 L -5 -1 L -5 -4 L -4 -7 L -2 -9 L 1 -10 L 5 -10 L 9 -9 L 12 -7 L 14 -4 L 15 0 L 15 5 L 14 9 L 13 11 L 11 14 L 8 17 L 4 20 L -1 23 L -5 25 M 5 -10 L 8 -9 L 11 -7 L 13 -4 L 14 0 L 14 5 L 13 9 L 12 11 L 10 14 L 7 17 L 2 21 L -1 23 M -2 -3 L 2 -3 M -3 -2 L 3 -2 M -4 -1 L 4 -1 M -4 0 L 4 0 M -4 1 L 4 1 M -3 2 L 3 2 M -2 3 L 2 3 M 19 -6 L 19 -4 L 21 -4 L 21 -6 L 19 -6 M 20 -6 L 20 -4 M 19 -5 L 21 -5 M 19 4 L 19 6 L 21 6 L 21 4 L 19 4 M 20 4 L 20 6 M 19 5 L 21 5","-14 14 M -10 -18 L -10 18 M -5 -18 L -5 18 M 5 -18 L 5 18 M 10 -18 L 10 18 M -5 -5 L 5 -7 M -5 -4 L 5 -6 M -5 -3 L 5 -5 M -5 5 L 5 3 M -5 6 L 5 4 M -5 7 L 5 5","-14 14 M -10 -20 L -10 20 M -9 -20 L -9 20 M -5 -20 L -5 20 M -1 -16 L 1 -16 L 1 -14 L -1 -14 L -1 -17 L 0 -19 L 2 -20 L 5 -20 L 7 -19 L 9 -17 L 10 -14 L 10 -9 L 9 -6 L 7 -4 L 5 -3 L 3 -3 L 1 -4 L 0 -6 L -1 -4 L -3 -1 L -4 0 L -3 1 L -1 4 L 0 6 L 1 4 L 3 3 L 5 3 L 7 4 L 9 6 L 10 9 L 10 14 L 9 17 L 7 19 L 5 20 L 2 20 L 0 19 L -1 17 L -1 14 L 1 14 L 1 16 L -1 16 M 0 -16 L 0 -14 M -1 -15 L 1 -15 M 7 -19 L 8 -17 L 9 -14 L 9 -9 L 8 -6 L 7 -4 M 0 -6 L 0 -4 L -2 -1 L -4 0 L -2 1 L 0 4 L 0 6 M 7 4 L 8 6 L 9 9 L 9 14 L 8 17 L 7 19 M 0 14 L 0 16 M -1 15 L 1 15","-8 8 M -5 -4 L -5 -1 M 5 -4 L 5 -1 M -5 -4 L 5 -4 M -5 -3 L 5 -3 M -5 -2 L 5 -2 M -5 -1 L 5 -1","-10 10 M 3 -12 L -10 9 M 3 -12 L 4 9 M 2 -10 L 3 9 M -6 3 L 3 3 M -12 9 L -6 9 M 0 9 L 6 9","-12 12 M -3 -12 L -9 9 M -2 -12 L -8 9 M -6 -12 L 5 -12 L 8 -11 L 9 -9 L 9 -7 L 8 -4 L 7 -3 L 4 -2 M 5 -12 L 7 -11 L 8 -9 L 8 -7 L 7 -4 L 6 -3 L 4 -2 M -5 -2 L 4 -2 L 6 -1 L 7 1 L 7 3 L 6 6 L 4 8 L 0 9 L -12 9 M 4 -2 L 5 -1 L 6 1 L 6 3 L 5 6 L 3 8 L 0 9","-10 11 M 8 -10 L 9 -10 L 10 -12 L 9 -6 L 9 -8 L 8 -10 L 7 -11 L 5 -12 L 2 -12 L -1 -11 L -3 -9 L -5 -6 L -6 -3 L -7 1 L -7 4 L -6 7 L -5 8 L -2 9 L 1 9 L 3 8 L 5 6 L 6 4 M 2 -12 L 0 -11 L -2 -9 L -4 -6 L -5 -3 L -6 1 L -6 4 L -5 7 L -4 8 L -2 9","-12 11 M -3 -12 L -9 9 M -2 -12 L -8 9 M -6 -12 L 3 -12 L 6 -11 L 7 -10 L 8 -7 L 8 -3 L 7 1 L 5 5 L 3 7 L 1 8 L -3 9 L -12 9 M 3 -12 L 5 -11 L 6 -10 L 7 -7 L 7 -3 L 6 1 L 4 5 L 2 7 L 0 8 L -3 9","-12 11 M -3 -12 L -9 9 M -2 -12 L -8 9 M 2 -6 L 0 2 M -6 -12 L 9 -12 L 8 -6 L 8 -12 M -5 -2 L 1 -2 M -12 9 L 3 9 L 5 4 L 2 9","-12 10 M -3 -12 L -9 9 M -2 -12 L -8 9 M 2 -6 L 0 2 M -6 -12 L 9 -12 L 8 -6 L 8 -12 M -5 -2 L 1 -2 M -12 9 L -5 9","-10 12 M 8 -10 L 9 -10 L 10 -12 L 9 -6 L 9 -8 L 8 -10 L 7 -11 L 5 -12 L 2 -12 L -1 -11 L -3 -9 L -5 -6 L -6 -3 L -7 1 L -7 4 L -6 7 L -5 8 L -2 9 L 0 9 L 3 8 L 5 6 L 7 2 M 2 -12 L 0 -11 L -2 -9 L -4 -6 L -5 -3 L -6 1 L -6 4 L -5 7 L -4 8 L -2 9 M 0 9 L 2 8 L 4 6 L 6 2 M 3 2 L 10 2","-13 13 M -4 -12 L -10 9 M -3 -12 L -9 9 M 9 -12 L 3 9 M 10 -12 L 4 9 M -7 -12 L 0 -12 M 6 -12 L 13 -12 M -6 -2 L 6 -2 M -13 9 L -6 9 M 0 9 L 7 9","-6 7 M 3 -12 L -3 9 M 4 -12 L -2 9 M 0 -12 L 7 -12 M -6 9 L 1 9","-9 9 M 6 -12 L 1 5 L 0 7 L -1 8 L -3 9 L -5 9 L -7 8 L -8 6 L -8 4 L -7 3 L -6 4 L -7 5 M 5 -12 L 0 5 L -1 7 L -3 9 M 2 -12 L 9 -12","-12 11 M -3 -12 L -9 9 M -2 -12 L -8 9 M 11 -12 L -6 1 M 1 -3 L 5 9 M 0 -3 L 4 9 M -6 -12 L 1 -12 M 7 -12 L 13 -12 M -12 9 L -5 9 M 1 9 L 7 9","-10 10 M -1 -12 L -7 9 M 0 -12 L -6 9 M -4 -12 L 3 -12 M -10 9 L 5 9 L 7 3 L 4 9","-13 14 M -4 -12 L -10 9 M -4 -12 L -3 9 M -3 -12 L -2 7 M 10 -12 L -3 9 M 10 -12 L 4 9 M 11 -12 L 5 9 M -7 -12 L -3 -12 M 10 -12 L 14 -12 M -13 9 L -7 9 M 1 9 L 8 9","-12 13 M -3 -12 L -9 9 M -3 -12 L 4 6 M -3 -9 L 4 9 M 10 -12 L 4 9 M -6 -12 L -3 -12 M 7 -12 L 13 -12 M -12 9 L -6 9","-11 11 M 1 -12 L -2 -11 L -4 -9 L -6 -6 L -7 -3 L -8 1 L -8 4 L -7 7 L -6 8 L -4 9 L -1 9 L 2 8 L 4 6 L 6 3 L 7 0 L 8 -4 L 8 -7 L 7 -10 L 6 -11 L 4 -12 L 1 -12 M 1 -12 L -1 -11 L -3 -9 L -5 -6 L -6 -3 L -7 1 L -7 4 L -6 7 L -4 9 M -1 9 L 1 8 L 3 6 L 5 3 L 6 0 L 7 -4 L 7 -7 L 6 -10 L 4 -12","-12 11 M -3 -12 L -9 9 M -2 -12 L -8 9 M -6 -12 L 6 -12 L 9 -11 L 10 -9 L 10 -7 L 9 -4 L 7 -2 L 3 -1 L -5 -1 M 6 -12 L 8 -11 L 9 -9 L 9 -7 L 8 -4 L 6 -2 L 3 -1 M -12 9 L -5 9","-11 11 M 1 -12 L -2 -11 L -4 -9 L -6 -6 L -7 -3 L -8 1 L -8 4 L -7 7 L -6 8 L -4 9 L -1 9 L 2 8 L 4 6 L 6 3 L 7 0 L 8 -4 L 8 -7 L 7 -10 L 6 -11 L 4 -12 L 1 -12 M 1 -12 L -1 -11 L -3 -9 L -5 -6 L -6 -3 L -7 1 L -7 4 L -6 7 L -4 9 M -1 9 L 1 8 L 3 6 L 5 3 L 6 0 L 7 -4 L 7 -7 L 6 -10 L 4 -12 M -6 7 L -6 6 L -5 4 L -3 3 L -2 3 L 0 4 L 1 6 L 1 13 L 2 14 L 4 14 L 5 12 L 5 11 M 1 6 L 2 12 L 3 13 L 4 13 L 5 12","-12 12 M -3 -12 L -9 9 M -2 -12 L -8 9 M -6 -12 L 5 -12 L 8 -11 L 9 -9 L 9 -7 L 8 -4 L 7 -3 L 4 -2 L -5 -2 M 5 -12 L 7 -11 L 8 -9 L 8 -7 L 7 -4 L 6 -3 L 4 -2 M 0 -2 L 2 -1 L 3 0 L 4 8 L 5 9 L 7 9 L 8 7 L 8 6 M 3 0 L 5 7 L 6 8 L 7 8 L 8 7 M -12 9 L -5 9","-11 12 M 8 -10 L 9 -10 L 10 -12 L 9 -6 L 9 -8 L 8 -10 L 7 -11 L 4 -12 L 0 -12 L -3 -11 L -5 -9 L -5 -7 L -4 -5 L -3 -4 L 4 0 L 6 2 M -5 -7 L -3 -5 L 4 -1 L 5 0 L 6 2 L 6 5 L 5 7 L 4 8 L 1 9 L -3 9 L -6 8 L -7 7 L -8 5 L -8 3 L -9 9 L -8 7 L -7 7","-10 11 M 3 -12 L -3 9 M 4 -12 L -2 9 M -3 -12 L -6 -6 L -4 -12 L 11 -12 L 10 -6 L 10 -12 M -6 9 L 1 9","-12 13 M -4 -12 L -7 -1 L -8 3 L -8 6 L -7 8 L -4 9 L 0 9 L 3 8 L 5 6 L 6 3 L 10 -12 M -3 -12 L -6 -1 L -7 3 L -7 6 L -6 8 L -4 9 M -7 -12 L 0 -12 M 7 -12 L 13 -12","-10 10 M -4 -12 L -3 9 M -3 -12 L -2 7 M 10 -12 L -3 9 M -6 -12 L 0 -12 M 6 -12 L 12 -12","-13 13 M -5 -12 L -7 9 M -4 -12 L -6 7 M 3 -12 L -7 9 M 3 -12 L 1 9 M 4 -12 L 2 7 M 11 -12 L 1 9 M -8 -12 L -1 -12 M 8 -12 L 14 -12","-11 11 M -4 -12 L 3 9 M -3 -12 L 4 9 M 10 -12 L -10 9 M -6 -12 L 0 -12 M 6 -12 L 12 -12 M -12 9 L -6 9 M 0 9 L 6 9","-10 11 M -4 -12 L 0 -2 L -3 9 M -3 -12 L 1 -2 L -2 9 M 11 -12 L 1 -2 M -6 -12 L 0 -12 M 7 -12 L 13 -12 M -6 9 L 1 9","-11 11 M 9 -12 L -10 9 M 10 -12 L -9 9 M -3 -12 L -6 -6 L -4 -12 L 10 -12 M -10 9 L 4 9 L 6 3 L 3 9","-7 7 M -3 -16 L -3 16 M -2 -16 L -2 16 M -3 -16 L 4 -16 M -3 16 L 4 16","-7 7 M -7 -12 L 7 12","-7 7 M 2 -16 L 2 16 M 3 -16 L 3 16 M -4 -16 L 3 -16 M -4 16 L 3 16","-6 6 M 2 -12 L -3 -6 M 2 -12 L 3 -11 L -3 -6","-13 13 M -9 0 L 9 0","-6 6 M -2 -12 L 3 -6 M -2 -12 L -3 -11 L 3 -6","-10 11 M 6 -5 L 4 2 L 3 6 L 3 8 L 4 9 L 7 9 L 9 7 L 10 5 M 7 -5 L 5 2 L 4 6 L 4 8 L 5 9 M 4 2 L 4 -1 L 3 -4 L 1 -5 L -1 -5 L -4 -4 L -6 -1 L -7 2 L -7 5 L -6 7 L -5 8 L -3 9 L -1 9 L 1 8 L 3 5 L 4 2 M -1 -5 L -3 -4 L -5 -1 L -6 2 L -6 6 L -5 8","-10 9 M -2 -12 L -6 1 L -6 4 L -5 7 L -4 8 M -1 -12 L -5 1 M -5 1 L -4 -2 L -2 -4 L 0 -5 L 2 -5 L 4 -4 L 5 -3 L 6 -1 L 6 2 L 5 5 L 3 8 L 0 9 L -2 9 L -4 8 L -5 5 L -5 1 M 4 -4 L 5 -2 L 5 2 L 4 5 L 2 8 L 0 9 M -5 -12 L -1 -12","-9 9 M 5 -2 L 5 -1 L 6 -1 L 6 -2 L 5 -4 L 3 -5 L 0 -5 L -3 -4 L -5 -1 L -6 2 L -6 5 L -5 7 L -4 8 L -2 9 L 0 9 L 3 8 L 5 5 M 0 -5 L -2 -4 L -4 -1 L -5 2 L -5 6 L -4 8","-10 11 M 8 -12 L 4 2 L 3 6 L 3 8 L 4 9 L 7 9 L 9 7 L 10 5 M 9 -12 L 5 2 L 4 6 L 4 8 L 5 9 M 4 2 L 4 -1 L 3 -4 L 1 -5 L -1 -5 L -4 -4 L -6 -1 L -7 2 L -7 5 L -6 7 L -5 8 L -3 9 L -1 9 L 1 8 L 3 5 L 4 2 M -1 -5 L -3 -4 L -5 -1 L -6 2 L -6 6 L -5 8 M 5 -12 L 9 -12","-9 9 M -5 4 L -1 3 L 2 2 L 5 0 L 6 -2 L 5 -4 L 3 -5 L 0 -5 L -3 -4 L -5 -1 L -6 2 L -6 5 L -5 7 L -4 8 L -2 9 L 0 9 L 3 8 L 5 6 M 0 -5 L -2 -4 L -4 -1 L -5 2 L -5 6 L -4 8","-7 8 M 8 -11 L 7 -10 L 8 -9 L 9 -10 L 9 -11 L 8 -12 L 6 -12 L 4 -11 L 3 -10 L 2 -8 L 1 -5 L -2 9 L -3 13 L -4 15 M 6 -12 L 4 -10 L 3 -8 L 2 -4 L 0 5 L -1 9 L -2 12 L -3 14 L -4 15 L -6 16 L -8 16 L -9 15 L -9 14 L -8 13 L -7 14 L -8 15 M -3 -5 L 7 -5","-10 10 M 7 -5 L 3 9 L 2 12 L 0 15 L -3 16 L -6 16 L -8 15 L -9 14 L -9 13 L -8 12 L -7 13 L -8 14 M 6 -5 L 2 9 L 1 12 L -1 15 L -3 16 M 4 2 L 4 -1 L 3 -4 L 1 -5 L -1 -5 L -4 -4 L -6 -1 L -7 2 L -7 5 L -6 7 L -5 8 L -3 9 L -1 9 L 1 8 L 3 5 L 4 2 M -1 -5 L -3 -4 L -5 -1 L -6 2 L -6 6 L -5 8","-10 11 M -2 -12 L -8 9 M -1 -12 L -7 9 M -5 2 L -3 -2 L -1 -4 L 1 -5 L 3 -5 L 5 -4 L 6 -3 L 6 -1 L 4 5 L 4 8 L 5 9 M 3 -5 L 5 -3 L 5 -1 L 3 5 L 3 8 L 4 9 L 7 9 L 9 7 L 10 5 M -5 -12 L -1 -12","-6 7 M 3 -12 L 2 -11 L 3 -10 L 4 -11 L 3 -12 M -5 -1 L -4 -3 L -2 -5 L 1 -5 L 2 -4 L 2 -1 L 0 5 L 0 8 L 1 9 M 0 -5 L 1 -4 L 1 -1 L -1 5 L -1 8 L 0 9 L 3 9 L 5 7 L 6 5","-6 7 M 4 -12 L 3 -11 L 4 -10 L 5 -11 L 4 -12 M -4 -1 L -3 -3 L -1 -5 L 2 -5 L 3 -4 L 3 -1 L 0 9 L -1 12 L -2 14 L -3 15 L -5 16 L -7 16 L -8 15 L -8 14 L -7 13 L -6 14 L -7 15 M 1 -5 L 2 -4 L 2 -1 L -1 9 L -2 12 L -3 14 L -5 16","-10 10 M -2 -12 L -8 9 M -1 -12 L -7 9 M 6 -4 L 5 -3 L 6 -2 L 7 -3 L 7 -4 L 6 -5 L 5 -5 L 3 -4 L -1 0 L -3 1 L -5 1 M -3 1 L -1 2 L 1 8 L 2 9 M -3 1 L -2 2 L 0 8 L 1 9 L 3 9 L 5 8 L 7 5 M -5 -12 L -1 -12","-5 7 M 3 -12 L -1 2 L -2 6 L -2 8 L -1 9 L 2 9 L 4 7 L 5 5 M 4 -12 L 0 2 L -1 6 L -1 8 L 0 9 M 0 -12 L 4 -12","-17 16 M -16 -1 L -15 -3 L -13 -5 L -10 -5 L -9 -4 L -9 -2 L -10 2 L -12 9 M -11 -5 L -10 -4 L -10 -2 L -11 2 L -13 9 M -10 2 L -8 -2 L -6 -4 L -4 -5 L -2 -5 L 0 -4 L 1 -3 L 1 -1 L -2 9 M -2 -5 L 0 -3 L 0 -1 L -3 9 M 0 2 L 2 -2 L 4 -4 L 6 -5 L 8 -5 L 10 -4 L 11 -3 L 11 -1 L 9 5 L 9 8 L 10 9 M 8 -5 L 10 -3 L 10 -1 L 8 5 L 8 8 L 9 9 L 12 9 L 14 7 L 15 5","-12 11 M -11 -1 L -10 -3 L -8 -5 L -5 -5 L -4 -4 L -4 -2 L -5 2 L -7 9 M -6 -5 L -5 -4 L -5 -2 L -6 2 L -8 9 M -5 2 L -3 -2 L -1 -4 L 1 -5 L 3 -5 L 5 -4 L 6 -3 L 6 -1 L 4 5 L 4 8 L 5 9 M 3 -5 L 5 -3 L 5 -1 L 3 5 L 3 8 L 4 9 L 7 9 L 9 7 L 10 5","-9 9 M 0 -5 L -3 -4 L -5 -1 L -6 2 L -6 5 L -5 7 L -4 8 L -2 9 L 0 9 L 3 8 L 5 5 L 6 2 L 6 -1 L 5 -3 L 4 -4 L 2 -5 L 0 -5 M 0 -5 L -2 -4 L -4 -1 L -5 2 L -5 6 L -4 8 M 0 9 L 2 8 L 4 5 L 5 2 L 5 -2 L 4 -4","-11 10 M -10 -1 L -9 -3 L -7 -5 L -4 -5 L -3 -4 L -3 -2 L -4 2 L -8 16 M -5 -5 L -4 -4 L -4 -2 L -5 2 L -9 16 M -4 2 L -3 -1 L -1 -4 L 1 -5 L 3 -5 L 5 -4 L 6 -3 L 7 -1 L 7 2 L 6 5 L 4 8 L 1 9 L -1 9 L -3 8 L -4 5 L -4 2 M 5 -4 L 6 -2 L 6 2 L 5 5 L 3 8 L 1 9 M -12 16 L -5 16","-10 10 M 6 -5 L 0 16 M 7 -5 L 1 16 M 4 2 L 4 -1 L 3 -4 L 1 -5 L -1 -5 L -4 -4 L -6 -1 L -7 2 L -7 5 L -6 7 L -5 8 L -3 9 L -1 9 L 1 8 L 3 5 L 4 2 M -1 -5 L -3 -4 L -5 -1 L -6 2 L -6 6 L -5 8 M -3 16 L 4 16","-9 8 M -8 -1 L -7 -3 L -5 -5 L -2 -5 L -1 -4 L -1 -2 L -2 2 L -4 9 M -3 -5 L -2 -4 L -2 -2 L -3 2 L -5 9 M -2 2 L 0 -2 L 2 -4 L 4 -5 L 6 -5 L 7 -4 L 7 -3 L 6 -2 L 5 -3 L 6 -4","-8 9 M 6 -3 L 6 -2 L 7 -2 L 7 -3 L 6 -4 L 3 -5 L 0 -5 L -3 -4 L -4 -3 L -4 -1 L -3 0 L 4 4 L 5 5 M -4 -2 L -3 -1 L 4 3 L 5 4 L 5 7 L 4 8 L 1 9 L -2 9 L -5 8 L -6 7 L -6 6 L -5 6 L -5 7","-7 7 M 2 -12 L -2 2 L -3 6 L -3 8 L -2 9 L 1 9 L 3 7 L 4 5 M 3 -12 L -1 2 L -2 6 L -2 8 L -1 9 M -4 -5 L 5 -5","-12 11 M -11 -1 L -10 -3 L -8 -5 L -5 -5 L -4 -4 L -4 -1 L -6 5 L -6 7 L -4 9 M -6 -5 L -5 -4 L -5 -1 L -7 5 L -7 7 L -6 8 L -4 9 L -2 9 L 0 8 L 2 6 L 4 2 M 6 -5 L 4 2 L 3 6 L 3 8 L 4 9 L 7 9 L 9 7 L 10 5 M 7 -5 L 5 2 L 4 6 L 4 8 L 5 9","-10 10 M -9 -1 L -8 -3 L -6 -5 L -3 -5 L -2 -4 L -2 -1 L -4 5 L -4 7 L -2 9 M -4 -5 L -3 -4 L -3 -1 L -5 5 L -5 7 L -4 8 L -2 9 L -1 9 L 2 8 L 4 6 L 6 3 L 7 -1 L 7 -5 L 6 -5 L 7 -3","-15 14 M -14 -1 L -13 -3 L -11 -5 L -8 -5 L -7 -4 L -7 -1 L -9 5 L -9 7 L -7 9 M -9 -5 L -8 -4 L -8 -1 L -10 5 L -10 7 L -9 8 L -7 9 L -5 9 L -3 8 L -1 6 L 0 4 M 2 -5 L 0 4 L 0 7 L 1 8 L 3 9 L 5 9 L 7 8 L 9 6 L 10 4 L 11 0 L 11 -5 L 10 -5 L 11 -3 M 3 -5 L 1 4 L 1 7 L 3 9","-10 10 M -7 -1 L -5 -4 L -3 -5 L 0 -5 L 1 -3 L 1 0 M -1 -5 L 0 -3 L 0 0 L -1 4 L -2 6 L -4 8 L -6 9 L -7 9 L -8 8 L -8 7 L -7 6 L -6 7 L -7 8 M -1 4 L -1 7 L 0 9 L 3 9 L 5 8 L 7 5 M 7 -4 L 6 -3 L 7 -2 L 8 -3 L 8 -4 L 7 -5 L 6 -5 L 4 -4 L 2 -2 L 1 0 L 0 4 L 0 7 L 1 9","-11 10 M -10 -1 L -9 -3 L -7 -5 L -4 -5 L -3 -4 L -3 -1 L -5 5 L -5 7 L -3 9 M -5 -5 L -4 -4 L -4 -1 L -6 5 L -6 7 L -5 8 L -3 9 L -1 9 L 1 8 L 3 6 L 5 2 M 8 -5 L 4 9 L 3 12 L 1 15 L -2 16 L -5 16 L -7 15 L -8 14 L -8 13 L -7 12 L -6 13 L -7 14 M 7 -5 L 3 9 L 2 12 L 0 15 L -2 16","-10 10 M 7 -5 L 6 -3 L 4 -1 L -4 5 L -6 7 L -7 9 M -6 -1 L -5 -3 L -3 -5 L 0 -5 L 4 -3 M -5 -3 L -3 -4 L 0 -4 L 4 -3 L 6 -3 M -6 7 L -4 7 L 0 8 L 3 8 L 5 7 M -4 7 L 0 9 L 3 9 L 5 7 L 6 5","-7 7 M 2 -16 L 0 -15 L -1 -14 L -2 -12 L -2 -10 L -1 -8 L 0 -7 L 1 -5 L 1 -3 L -1 -1 M 0 -15 L -1 -13 L -1 -11 L 0 -9 L 1 -8 L 2 -6 L 2 -4 L 1 -2 L -3 0 L 1 2 L 2 4 L 2 6 L 1 8 L 0 9 L -1 11 L -1 13 L 0 15 M -1 1 L 1 3 L 1 5 L 0 7 L -1 8 L -2 10 L -2 12 L -1 14 L 0 15 L 2 16","-4 4 M 0 -16 L 0 16","-7 7 M -2 -16 L 0 -15 L 1 -14 L 2 -12 L 2 -10 L 1 -8 L 0 -7 L -1 -5 L -1 -3 L 1 -1 M 0 -15 L 1 -13 L 1 -11 L 0 -9 L -1 -8 L -2 -6 L -2 -4 L -1 -2 L 3 0 L -1 2 L -2 4 L -2 6 L -1 8 L 0 9 L 1 11 L 1 13 L 0 15 M 1 1 L -1 3 L -1 5 L 0 7 L 1 8 L 2 10 L 2 12 L 1 14 L 0 15 L -2 16","-12 12 M -9 3 L -9 1 L -8 -2 L -6 -3 L -4 -3 L -2 -2 L 2 1 L 4 2 L 6 2 L 8 1 L 9 -1 M -9 1 L -8 -1 L -6 -2 L -4 -2 L -2 -1 L 2 2 L 4 3 L 6 3 L 8 2 L 9 -1 L 9 -3","-8 8 M -8 -12 L -8 9 L -7 9 L -7 -12 L -6 -12 L -6 9 L -5 9 L -5 -12 L -4 -12 L -4 9 L -3 9 L -3 -12 L -2 -12 L -2 9 L -1 9 L -1 -12 L 0 -12 L 0 9 L 1 9 L 1 -12 L 2 -12 L 2 9 L 3 9 L 3 -12 L 4 -12 L 4 9 L 5 9 L 5 -12 L 6 -12 L 6 9 L 7 9 L 7 -12 L 8 -12 L 8 9"]
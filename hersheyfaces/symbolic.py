@@ -0,0 +1,2 @@
+# generated by hersheysplit.py from hersheydata.py, do not edit
+glyphs = ["-8 8","-14 14 M -14 0 L 14 0","-14 14 M -14 14 L 14 -14","0 0 M 0 -20 L 0 20","-14 14 M -14 -14 L 14 14","-14 14 M -14 0 L 14 0","-12 12 M -12 7 L 12 -7","-7 7 M -7 12 L 7 -12","0 0 M 0 -14 L 0 14","-7 7 M -7 -12 L 7 12","-12 12 M -12 -7 L 12 7","-7 7 M -7 0 L 7 0","-5 5 M -5 5 L 5 -5","0 0 M 0 -7 L 0 7","-5 5 M -5 -5 L 5 5","-11 0 M 0 -11 L -2 -11 L -5 -10 L -8 -8 L -10 -5 L -11 -2 L -11 0","-11 0 M -11 0 L -11 2 L -10 5 L -8 8 L -5 10 L -2 11 L 0 11","0 11 M 0 11 L 2 11 L 5 10 L 8 8 L 10 5 L 11 2 L 11 0","0 11 M 11 0 L 11 -2 L 10 -5 L 8 -8 L 5 -10 L 2 -11 L 0 -11","-14 14 M -14 -3 L -11 -1 L -7 1 L -2 2 L 2 2 L 7 1 L 11 -1 L 14 -3","-2 3 M 3 -14 L 1 -11 L -1 -7 L -2 -2 L -2 2 L -1 7 L 1 11 L 3 14","-3 2 M -3 -14 L -1 -11 L 1 -7 L 2 -2 L 2 2 L 1 7 L -1 11 L -3 14","-14 14 M -14 3 L -11 1 L -7 -1 L -2 -2 L 2 -2 L 7 -1 L 11 1 L 14 3","-7 7 M 0 -8 L 7 -4 L -7 4 L 0 8","-8 8 M -8 0 L -4 -7 L 4 7 L 8 0","-7 7 M -7 4 L -7 -4 L 7 4 L 7 -4","-8 8 M -6 6 L -8 -2 L 8 2 L 6 -6","-8 8 M -8 11 L -6 11 L -3 10 L -1 9 L 2 6 L 3 4 L 4 1 L 4 -3 L 3 -6 L 2 -8 L 1 -9 L -1 -9 L -2 -8 L -3 -6 L -4 -3 L -4 1 L -3 4 L -2 6 L 1 9 L 3 10 L 6 11 L 8 11","-9 11 M 11 8 L 11 6 L 10 3 L 9 1 L 6 -2 L 4 -3 L 1 -4 L -3 -4 L -6 -3 L -8 -2 L -9 -1 L -9 1 L -8 2 L -6 3 L -3 4 L 1 4 L 4 3 L 6 2 L 9 -1 L 10 -3 L 11 -6 L 11 -8","-8 8 M 8 -11 L 6 -11 L 3 -10 L 1 -9 L -2 -6 L -3 -4 L -4 -1 L -4 3 L -3 6 L -2 8 L -1 9 L 1 9 L 2 8 L 3 6 L 4 3 L 4 -1 L 3 -4 L 2 -6 L -1 -9 L -3 -10 L -6 -11 L -8 -11","-11 9 M -11 -8 L -11 -6 L -10 -3 L -9 -1 L -6 2 L -4 3 L -1 4 L 3 4 L 6 3 L 8 2 L 9 1 L 9 -1 L 8 -2 L 6 -3 L 3 -4 L -1 -4 L -4 -3 L -6 -2 L -9 1 L -10 3 L -11 6 L -11 8","-13 9 M -13 -2 L -12 0 L -10 2 L -8 3 L -5 4 L -1 4 L 3 3 L 6 1 L 8 -2 L 9 -4 L 8 -6 L 5 -6 L 1 -5 L -1 -4 L -4 -2 L -6 1 L -7 4 L -7 7 L -6 10 L -5 12","-13 7 M -13 2 L -10 4 L -7 5 L -2 5 L 1 4 L 4 2 L 6 -1 L 7 -4 L 7 -6 L 6 -7 L 4 -7 L 1 -6 L -2 -4 L -4 -1 L -5 2 L -5 7 L -4 10 L -2 13","-3 3 M -1 -3 L -3 -1 L -3 1 L -1 3 L 1 3 L 3 1 L 3 -1 L 1 -3 L -1 -3 M -1 -2 L -2 -1 L -2 1 L -1 2 L 1 2 L 2 1 L 2 -1 L 1 -2 L -1 -2 M 0 -1 L -1 0 L 0 1 L 1 0 L 0 -1","0 5 M 0 -5 L 1 -5 L 3 -4 L 4 -3 L 5 -1 L 5 1 L 4 3 L 3 4 L 1 5 L 0 5","-14 14 M -14 0 L -8 0 M -3 0 L 3 0 M 8 0 L 14 0","-14 14 M -14 3 L -14 -3 L 14 -3 L 14 3","-8 8 M 0 -14 L -8 0 M 0 -14 L 8 0","-14 14 M -14 0 L 14 0 M -8 7 L 8 7 M -2 14 L 2 14","-14 14 M -14 0 L 14 0 M -14 0 L 0 16 M 14 0 L 0 16","-7 7 M -1 -7 L -4 -6 L -6 -4 L -7 -1 L -7 1 L -6 4 L -4 6 L -1 7 L 1 7 L 4 6 L 6 4 L 7 1 L 7 -1 L 6 -4 L 4 -6 L 1 -7 L -1 -7","-6 6 M -6 -6 L -6 6 L 6 6 L 6 -6 L -6 -6","-7 7 M 0 -8 L -7 4 L 7 4 L 0 -8","-6 6 M 0 -10 L -6 0 L 0 10 L 6 0 L 0 -10","-8 8 M 0 -9 L -2 -3 L -8 -3 L -3 1 L -5 7 L 0 3 L 5 7 L 3 1 L 8 -3 L 2 -3 L 0 -9","-7 7 M 0 -7 L 0 7 M -7 0 L 7 0","-5 5 M -5 -5 L 5 5 M 5 -5 L -5 5","-5 5 M 0 -6 L 0 6 M -5 -3 L 5 3 M 5 -3 L -5 3","-4 4 M -1 -4 L -3 -3 L -4 -1 L -4 1 L -3 3 L -1 4 L 1 4 L 3 3 L 4 1 L 4 -1 L 3 -3 L 1 -4 L -1 -4 M -3 -1 L -3 1 M -2 -2 L -2 2 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -2 L 2 2 M 3 -1 L 3 1","-4 4 M -4 -4 L -4 4 L 4 4 L 4 -4 L -4 -4 M -3 -3 L -3 3 M -2 -3 L -2 3 M -1 -3 L -1 3 M 0 -3 L 0 3 M 1 -3 L 1 3 M 2 -3 L 2 3 M 3 -3 L 3 3","-5 5 M 0 -6 L -5 3 L 5 3 L 0 -6 M 0 -3 L -3 2 M 0 -3 L 3 2 M 0 0 L -1 2 M 0 0 L 1 2","-6 3 M -6 0 L 3 5 L 3 -5 L -6 0 M -3 0 L 2 3 M -3 0 L 2 -3 M 0 0 L 2 1 M 0 0 L 2 -1","-5 5 M 0 6 L 5 -3 L -5 -3 L 0 6 M 0 3 L 3 -2 M 0 3 L -3 -2 M 0 0 L 1 -2 M 0 0 L -1 -2","-3 6 M 6 0 L -3 -5 L -3 5 L 6 0 M 3 0 L -2 -3 M 3 0 L -2 3 M 0 0 L -2 -1 M 0 0 L -2 1","0 7 M 0 -7 L 0 7 M 0 -7 L 7 -4 L 0 -1 M 1 -5 L 4 -4 L 1 -3","-9 9 M 0 -11 L 0 4 M -5 -8 L 5 -2 M 5 -8 L -5 -2 M -9 4 L -6 10 M 9 4 L 6 10 M -9 4 L 9 4 M -6 10 L 6 10","-5 5 M 0 -6 L 0 6 M -3 -3 L 3 -3 M -5 3 L -3 5 L -1 6 L 1 6 L 3 5 L 5 3","-6 6 M 0 -6 L 0 6 M -6 -1 L -5 -3 L 5 -3 L 6 -1 M -2 5 L 2 5","-7 7 M -5 -4 L 5 6 M 5 -4 L -5 6 M -3 -6 L -6 -3 L -7 -1 M 3 -6 L 6 -3 L 7 -1","-9 9 M -4 -9 L -9 9 M 4 -9 L 9 9 M -5 -5 L 9 9 M 5 -5 L -9 9 M -4 -9 L 4 -9 M -5 -5 L 5 -5","-7 7 M -7 -12 L 7 12","-11 9 M -5 -8 L 1 4 M -7 -2 L 1 -6 M -11 10 L 9 10 L 9 0 L -11 10","-6 6 M -2 -6 L -2 -2 L -6 -2 L -6 2 L -2 2 L -2 6 L 2 6 L 2 2 L 6 2 L 6 -2 L 2 -2 L 2 -6 L -2 -6","-7 7 M 7 -2 L 6 -4 L 4 -6 L 1 -7 L -1 -7 L -4 -6 L -6 -4 L -7 -1 L -7 1 L -6 4 L -4 6 L -1 7 L 1 7 L 4 6 L 6 4 L 7 2 M 7 -2 L 5 -4 L 3 -5 L 1 -5 L -1 -4 L -2 -3 L -3 -1 L -3 1 L -2 3 L -1 4 L 1 5 L 3 5 L 5 4 L 7 2","-7 7 M 0 -8 L -7 4 L 7 4 L 0 -8 M 0 8 L 7 -4 L -7 -4 L 0 8","-11 11 M -2 -9 L -2 -11 L -1 -12 L 1 -12 L 2 -11 L 2 -9 M -11 8 L -10 6 L -8 4 L -7 2 L -6 -2 L -6 -7 L -5 -8 L -3 -9 L 3 -9 L 5 -8 L 6 -7 L 6 -2 L 7 2 L 8 4 L 10 6 L 11 8 M -11 8 L 11 8 M -1 8 L -2 9 L -1 10 L 1 10 L 2 9 L 1 8","-8 8 M 0 -5 L 0 1 M 0 1 L -1 10 M 0 1 L 1 10 M -1 10 L 1 10 M 0 -5 L -1 -8 L -2 -10 L -4 -11 M -1 -8 L -4 -11 M 0 -5 L 1 -8 L 2 -10 L 4 -11 M 1 -8 L 4 -11 M 0 -5 L -4 -7 L -6 -7 L -8 -5 M -2 -6 L -6 -6 L -8 -5 M 0 -5 L 4 -7 L 6 -7 L 8 -5 M 2 -6 L 6 -6 L 8 -5 M 0 -5 L -2 -4 L -3 -3 L -3 0 M 0 -5 L -2 -3 L -3 0 M 0 -5 L 2 -4 L 3 -3 L 3 0 M 0 -5 L 2 -3 L 3 0","-8 8 M 0 -9 L 0 -7 M 0 -4 L 0 -2 M 0 1 L 0 3 M 0 7 L -1 10 M 0 7 L 1 10 M -1 10 L 1 10 M 0 -11 L -1 -9 L -2 -8 M 0 -11 L 1 -9 L 2 -8 M -2 -8 L 0 -9 L 2 -8 M 0 -7 L -2 -4 L -4 -3 L -5 -4 M 0 -7 L 2 -4 L 4 -3 L 5 -4 M -4 -3 L -2 -3 L 0 -4 L 2 -3 L 4 -3 M 0 -2 L -2 1 L -4 2 L -6 2 L -7 0 L -7 1 L -6 2 M 0 -2 L 2 1 L 4 2 L 6 2 L 7 0 L 7 1 L 6 2 M -4 2 L -2 2 L 0 1 L 2 2 L 4 2 M 0 3 L -2 6 L -3 7 L -5 8 L -6 8 L -7 7 L -8 5 L -8 7 L -6 8 M 0 3 L 2 6 L 3 7 L 5 8 L 6 8 L 7 7 L 8 5 L 8 7 L 6 8 M -5 8 L -3 8 L 0 7 L 3 8 L 5 8","-8 8 M 0 7 L -1 10 M 0 7 L 1 10 M -1 10 L 1 10 M 0 7 L 3 8 L 6 8 L 8 6 L 8 3 L 7 2 L 5 2 L 7 0 L 8 -3 L 7 -5 L 5 -6 L 3 -5 L 4 -8 L 3 -10 L 1 -11 L -1 -11 L -3 -10 L -4 -8 L -3 -5 L -5 -6 L -7 -5 L -8 -3 L -7 0 L -5 2 L -7 2 L -8 3 L -8 6 L -6 8 L -3 8 L 0 7","-8 8 M 0 7 L -1 10 M 0 7 L 1 10 M -1 10 L 1 10 M 0 7 L 4 6 L 4 4 L 6 3 L 6 0 L 8 -1 L 8 -6 L 7 -9 L 6 -10 L 4 -10 L 2 -11 L -2 -11 L -4 -10 L -6 -10 L -7 -9 L -8 -6 L -8 -1 L -6 0 L -6 3 L -4 4 L -4 6 L 0 7","-9 9 M -9 -2 L -7 0 M -6 -7 L -4 -2 M 0 -11 L 0 -3 M 6 -7 L 4 -2 M 9 -2 L 7 0","-11 11 M -9 -9 L -8 -7 L -7 -3 L -7 3 L -8 7 L -9 9 M 9 -9 L 8 -7 L 7 -3 L 7 3 L 8 7 L 9 9 M -9 -9 L -7 -8 L -3 -7 L 3 -7 L 7 -8 L 9 -9 M -9 9 L -7 8 L -3 7 L 3 7 L 7 8 L 9 9","-12 12 M 0 0 L 0 9 L -1 10 M 0 4 L -1 10 M 0 -9 L -1 -10 L -3 -10 L -4 -9 L -4 -7 L -3 -4 L 0 0 M 0 -9 L 1 -10 L 3 -10 L 4 -9 L 4 -7 L 3 -4 L 0 0 M 0 0 L -4 -3 L -6 -4 L -8 -4 L -9 -3 L -9 -1 L -8 0 M 0 0 L 4 -3 L 6 -4 L 8 -4 L 9 -3 L 9 -1 L 8 0 M 0 0 L -4 3 L -6 4 L -8 4 L -9 3 L -9 1 L -8 0 M 0 0 L 4 3 L 6 4 L 8 4 L 9 3 L 9 1 L 8 0","-8 8 M 3 -9 L 2 -8 L 3 -7 L 4 -8 L 4 -9 L 3 -11 L 1 -12 L -1 -12 L -3 -11 L -4 -9 L -4 -7 L -3 -5 L -1 -3 L 4 0 M -3 -5 L 2 -2 L 4 0 L 5 2 L 5 4 L 4 6 L 2 8 M -2 -4 L -4 -2 L -5 0 L -5 2 L -4 4 L -2 6 L 3 9 M -4 4 L 1 7 L 3 9 L 4 11 L 4 13 L 3 15 L 1 16 L -1 16 L -3 15 L -4 13 L -4 12 L -3 11 L -2 12 L -3 13","-8 8 M 0 -12 L -1 -10 L 0 -8 L 1 -10 L 0 -12 M 0 -12 L 0 16 M 0 -1 L -1 2 L 0 16 L 1 2 L 0 -1 M -6 -5 L -4 -4 L -2 -5 L -4 -6 L -6 -5 M -6 -5 L 6 -5 M 2 -5 L 4 -4 L 6 -5 L 4 -6 L 2 -5","-8 8 M 0 -12 L -1 -10 L 0 -8 L 1 -10 L 0 -12 M 0 -12 L 0 2 M 0 -2 L -1 0 L 1 4 L 0 6 L -1 4 L 1 0 L 0 -2 M 0 2 L 0 16 M 0 12 L -1 14 L 0 16 L 1 14 L 0 12 M -6 -5 L -4 -4 L -2 -5 L -4 -6 L -6 -5 M -6 -5 L 6 -5 M 2 -5 L 4 -4 L 6 -5 L 4 -6 L 2 -5 M -6 9 L -4 10 L -2 9 L -4 8 L -6 9 M -6 9 L 6 9 M 2 9 L 4 10 L 6 9 L 4 8 L 2 9","-13 13 M 0 -9 L -1 -8 L 0 -7 L 1 -8 L 0 -9 M -9 7 L -10 8 L -9 9 L -8 8 L -9 7 M 9 7 L 8 8 L 9 9 L 10 8 L 9 7","-12 12 M 0 -10 L -4 -6 L -7 -2 L -8 1 L -8 3 L -7 5 L -5 6 L -3 6 L -1 5 L 0 3 M 0 -10 L 4 -6 L 7 -2 L 8 1 L 8 3 L 7 5 L 5 6 L 3 6 L 1 5 L 0 3 M 0 3 L -1 7 L -2 10 M 0 3 L 1 7 L 2 10 M -2 10 L 2 10","-12 12 M 0 -4 L -1 -7 L -2 -9 L -4 -10 L -5 -10 L -7 -9 L -8 -7 L -8 -3 L -7 0 L -6 2 L -4 5 L 0 10 M 0 -4 L 1 -7 L 2 -9 L 4 -10 L 5 -10 L 7 -9 L 8 -7 L 8 -3 L 7 0 L 6 2 L 4 5 L 0 10","-12 12 M 0 -11 L -2 -8 L -6 -3 L -9 0 M 0 -11 L 2 -8 L 6 -3 L 9 0 M -9 0 L -6 3 L -2 8 L 0 11 M 9 0 L 6 3 L 2 8 L 0 11","-12 12 M 0 2 L 2 5 L 4 6 L 6 6 L 8 5 L 9 3 L 9 1 L 8 -1 L 6 -2 L 4 -2 L 1 -1 M 1 -1 L 3 -3 L 4 -5 L 4 -7 L 3 -9 L 1 -10 L -1 -10 L -3 -9 L -4 -7 L -4 -5 L -3 -3 L -1 -1 M -1 -1 L -4 -2 L -6 -2 L -8 -1 L -9 1 L -9 3 L -8 5 L -6 6 L -4 6 L -2 5 L 0 2 M 0 2 L -1 7 L -2 10 M 0 2 L 1 7 L 2 10 M -2 10 L 2 10","-9 9 M 4 -39 L 1 -37 L -1 -35 L -2 -33 L -3 -30 L -3 -26 L -2 -22 L 2 -14 L 3 -11 L 3 -8 L 2 -5 L 0 -2 M 1 -37 L -1 -34 L -2 -30 L -2 -26 L -1 -23 L 3 -15 L 4 -11 L 4 -8 L 3 -5 L 0 -2 L -4 0 L 0 2 L 3 5 L 4 8 L 4 11 L 3 15 L -1 23 L -2 26 L -2 30 L -1 34 L 1 37 M 0 2 L 2 5 L 3 8 L 3 11 L 2 14 L -2 22 L -3 26 L -3 30 L -2 33 L -1 35 L 1 37 L 4 39","-9 9 M -4 -39 L -1 -37 L 1 -35 L 2 -33 L 3 -30 L 3 -26 L 2 -22 L -2 -14 L -3 -11 L -3 -8 L -2 -5 L 0 -2 M -1 -37 L 1 -34 L 2 -30 L 2 -26 L 1 -23 L -3 -15 L -4 -11 L -4 -8 L -3 -5 L 0 -2 L 4 0 L 0 2 L -3 5 L -4 8 L -4 11 L -3 15 L 1 23 L 2 26 L 2 30 L 1 34 L -1 37 M 0 2 L -2 5 L -3 8 L -3 11 L -2 14 L 2 22 L 3 26 L 3 30 L 2 33 L 1 35 L -1 37 L -4 39","-9 9 M 4 -36 L 1 -33 L -1 -30 L -3 -26 L -4 -21 L -4 -15 L -3 -9 L -2 -5 L 1 6 L 2 10 L 3 16 L 3 21 L 2 26 L 1 29 L -1 33 M 1 -33 L -1 -29 L -2 -26 L -3 -21 L -3 -16 L -2 -10 L -1 -6 L 2 5 L 3 9 L 4 15 L 4 21 L 3 26 L 1 30 L -1 33 L -4 36","-9 9 M -4 -36 L -1 -33 L 1 -30 L 3 -26 L 4 -21 L 4 -15 L 3 -9 L 2 -5 L -1 6 L -2 10 L -3 16 L -3 21 L -2 26 L -1 29 L 1 33 M -1 -33 L 1 -29 L 2 -26 L 3 -21 L 3 -16 L 2 -10 L 1 -6 L -2 5 L -3 9 L -4 15 L -4 21 L -3 26 L -1 30 L 1 33 L 4 36","-27 8 M -24 0 L -17 0 L 0 29 M -18 0 L -1 29 M -19 0 L 0 32 M 8 -48 L 4 -8 L 0 32","-9 9 M 2 -5 L 4 -4 L 6 -2 L 6 -3 L 5 -4 L 2 -5 L -1 -5 L -4 -4 L -5 -3 L -6 -1 L -6 1 L -5 3 L -3 5 L 1 8 M -1 -5 L -3 -4 L -4 -3 L -5 -1 L -5 1 L -4 3 L 1 8 L 2 10 L 2 12 L 1 13 L -1 13","-11 11 M -6 -5 L -7 -4 L -8 -2 L -8 0 L -7 3 L -3 7 L -2 9 M -8 0 L -7 2 L -3 6 L -2 9 L -2 11 L -3 14 L -5 16 L -6 16 L -7 15 L -8 13 L -8 10 L -7 6 L -5 2 L -3 -1 L 0 -4 L 2 -5 L 4 -5 L 7 -4 L 8 -2 L 8 2 L 7 6 L 5 8 L 3 9 L 2 9 L 1 8 L 1 6 L 2 5 L 3 6 L 2 7 M 4 -5 L 6 -4 L 7 -2 L 7 2 L 6 6 L 5 8","-13 13 M 7 -11 L 6 -10 L 7 -9 L 8 -10 L 7 -11 L 5 -12 L 2 -12 L -1 -11 L -3 -9 L -4 -7 L -5 -4 L -6 0 L -8 9 L -9 13 L -10 15 M 2 -12 L 0 -11 L -2 -9 L -3 -7 L -4 -4 L -6 5 L -7 9 L -8 12 L -9 14 L -10 15 L -12 16 L -14 16 L -15 15 L -15 14 L -14 13 L -13 14 L -14 15 M 13 -11 L 12 -10 L 13 -9 L 14 -10 L 14 -11 L 13 -12 L 11 -12 L 9 -11 L 8 -10 L 7 -8 L 6 -5 L 3 9 L 2 13 L 1 15 M 11 -12 L 9 -10 L 8 -8 L 7 -4 L 5 5 L 4 9 L 3 12 L 2 14 L 1 15 L -1 16 L -3 16 L -4 15 L -4 14 L -3 13 L -2 14 L -3 15 M -9 -5 L 12 -5","-12 12 M 9 -11 L 8 -10 L 9 -9 L 10 -10 L 9 -11 L 6 -12 L 3 -12 L 0 -11 L -2 -9 L -3 -7 L -4 -4 L -5 0 L -7 9 L -8 13 L -9 15 M 3 -12 L 1 -11 L -1 -9 L -2 -7 L -3 -4 L -5 5 L -6 9 L -7 12 L -8 14 L -9 15 L -11 16 L -13 16 L -14 15 L -14 14 L -13 13 L -12 14 L -13 15 M 7 -5 L 5 2 L 4 6 L 4 8 L 5 9 L 8 9 L 10 7 L 11 5 M 8 -5 L 6 2 L 5 6 L 5 8 L 6 9 M -8 -5 L 8 -5","-12 12 M 7 -11 L 6 -10 L 7 -9 L 8 -10 L 8 -11 L 6 -12 M 10 -12 L 3 -12 L 0 -11 L -2 -9 L -3 -7 L -4 -4 L -5 0 L -7 9 L -8 13 L -9 15 M 3 -12 L 1 -11 L -1 -9 L -2 -7 L -3 -4 L -5 5 L -6 9 L -7 12 L -8 14 L -9 15 L -11 16 L -13 16 L -14 15 L -14 14 L -13 13 L -12 14 L -13 15 M 9 -12 L 5 2 L 4 6 L 4 8 L 5 9 L 8 9 L 10 7 L 11 5 M 10 -12 L 6 2 L 5 6 L 5 8 L 6 9 M -8 -5 L 7 -5","-18 17 M 2 -11 L 1 -10 L 2 -9 L 3 -10 L 2 -11 L 0 -12 L -3 -12 L -6 -11 L -8 -9 L -9 -7 L -10 -4 L -11 0 L -13 9 L -14 13 L -15 15 M -3 -12 L -5 -11 L -7 -9 L -8 -7 L -9 -4 L -11 5 L -12 9 L -13 12 L -14 14 L -15 15 L -17 16 L -19 16 L -20 15 L -20 14 L -19 13 L -18 14 L -19 15 M 14 -11 L 13 -10 L 14 -9 L 15 -10 L 14 -11 L 11 -12 L 8 -12 L 5 -11 L 3 -9 L 2 -7 L 1 -4 L 0 0 L -2 9 L -3 13 L -4 15 M 8 -12 L 6 -11 L 4 -9 L 3 -7 L 2 -4 L 0 5 L -1 9 L -2 12 L -3 14 L -4 15 L -6 16 L -8 16 L -9 15 L -9 14 L -8 13 L -7 14 L -8 15 M 12 -5 L 10 2 L 9 6 L 9 8 L 10 9 L 13 9 L 15 7 L 16 5 M 13 -5 L 11 2 L 10 6 L 10 8 L 11 9 M -14 -5 L 13 -5","-18 17 M 2 -11 L 1 -10 L 2 -9 L 3 -10 L 2 -11 L 0 -12 L -3 -12 L -6 -11 L -8 -9 L -9 -7 L -10 -4 L -11 0 L -13 9 L -14 13 L -15 15 M -3 -12 L -5 -11 L -7 -9 L -8 -7 L -9 -4 L -11 5 L -12 9 L -13 12 L -14 14 L -15 15 L -17 16 L -19 16 L -20 15 L -20 14 L -19 13 L -18 14 L -19 15 M 12 -11 L 11 -10 L 12 -9 L 13 -10 L 13 -11 L 11 -12 M 15 -12 L 8 -12 L 5 -11 L 3 -9 L 2 -7 L 1 -4 L 0 0 L -2 9 L -3 13 L -4 15 M 8 -12 L 6 -11 L 4 -9 L 3 -7 L 2 -4 L 0 5 L -1 9 L -2 12 L -3 14 L -4 15 L -6 16 L -8 16 L -9 15 L -9 14 L -8 13 L -7 14 L -8 15 M 14 -12 L 10 2 L 9 6 L 9 8 L 10 9 L 13 9 L 15 7 L 16 5 M 15 -12 L 11 2 L 10 6 L 10 8 L 11 9 M -14 -5 L 12 -5","-6 7 M -5 -1 L -4 -3 L -2 -5 L 1 -5 L 2 -4 L 2 -1 L 0 5 L 0 8 L 1 9 M 0 -5 L 1 -4 L 1 -1 L -1 5 L -1 8 L 0 9 L 3 9 L 5 7 L 6 5","-6 6 M 0 -6 L -4 5 L 6 -2 L -6 -2 L 4 5 L 0 -6 M 0 0 L 0 -6 M 0 0 L -6 -2 M 0 0 L -4 5 M 0 0 L 4 5 M 0 0 L 6 -2","-12 12 M -9 3 L -9 1 L -8 -2 L -6 -3 L -4 -3 L -2 -2 L 2 1 L 4 2 L 6 2 L 8 1 L 9 -1 M -9 1 L -8 -1 L -6 -2 L -4 -2 L -2 -1 L 2 2 L 4 3 L 6 3 L 8 2 L 9 -1 L 9 -3"]
@@ -0,0 +1,141 @@
+'''
+hersheyflatten.py
+
+Curve flattening and polyline simplification for Hershey Text output.
+
+Fonts made by the converter draw their strokes with cubic Bezier curves
+(C, closed with Z), but many plotter and engraver controllers only take
+polylines. flatten_path() turns every curve into line segments by
+adaptive subdivision: a curve is split in half until its control points
+lie within the chord tolerance of the chord, so flat stretches get few
+points and tight bends many. Closed subpaths end with a line back to
+their start instead of Z. Optionally a Douglas-Peucker pass then drops
+the points that lie within the simplification tolerance of the line
+through their neighbours.
+
+Results are cached per path and tolerances, so every glyph is flattened
+once per run; the converter can also store fonts flattened (converter.py
+--flatten), which leaves the renderer nothing to do.
+'''
+
+import hersheyfonts
+import hersheyplot
+
+TOLERANCE = 0.1      # default chord tolerance, in font units
+MAX_DEPTH = 12       # subdivision limit, at most 4096 segments per curve
+
+_flat = {}   # (path, tolerance, simplify) -> flattened path
+
+
+def _distance( x, y, x0, y0, x1, y1 ):
+    """Distance of the point (x, y) from the line through (x0, y0) and (x1, y1)."""
+    dx = x1 - x0
+    dy = y1 - y0
+    length = (dx * dx + dy * dy) ** 0.5
+    if length == 0:
+        return ((x - x0) ** 2 + (y - y0) ** 2) ** 0.5
+    return abs(dx * (y - y0) - dy * (x - x0)) / length
+
+
+def _segment_distance( x, y, x0, y0, x1, y1 ):
+    """Distance of the point (x, y) from the line segment (x0, y0) - (x1, y1)."""
+    dx = x1 - x0
+    dy = y1 - y0
+    length2 = dx * dx + dy * dy
+    t = 0
+    if length2 > 0:
+        t = min(max(((x - x0) * dx + (y - y0) * dy) / length2, 0), 1)
+    return ((x - x0 - t * dx) ** 2 + (y - y0 - t * dy) ** 2) ** 0.5
+
+
+def flatten_curve( points, tolerance, out, depth=0 ):
+    """
+    Append line segment end points approximating a Bezier curve to out. points are
+    the start point and the control and end points (x0, y0, x1, y1, ...), quadratic or cubic.
+    The curve is flat when its control points lie within tolerance of the chord (the
+    segment, so that control points beyond its ends are not taken for flat).
+    """
+    x0, y0, xn, yn = points[0], points[1], points[-2], points[-1]
+    flat = True
+    for k in range(2, len(points) - 2, 2):
+        if _segment_distance(points[k], points[k + 1], x0, y0, xn, yn) > tolerance:
+            flat = False
+            break
+    if flat or depth >= MAX_DEPTH:
+        out.extend( (xn, yn) )
+        return
+    # de Casteljau split at t = 1/2
+    left = [x0, y0]
+    right = [xn, yn]
+    level = points
+    while len(level) > 2:
+        level = [(level[k] + level[k + 2]) * 0.5 for k in range(len(level) - 2)]
+        left.extend(level[:2])
+        right[:0] = level[-2:]
+    flatten_curve(left, tolerance, out, depth + 1)
+    flatten_curve(right, tolerance, out, depth + 1)
+
+
+def simplify_polyline( points, tolerance ):
+    """Douglas-Peucker simplification of a polyline (x0, y0, x1, y1, ...); the end points are kept."""
+    n = len(points) // 2
+    if n < 3:
+        return points
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        x0, y0 = points[2 * first], points[2 * first + 1]
+        x1, y1 = points[2 * last], points[2 * last + 1]
+        worst = 0
+        index = None
+        for i in range(first + 1, last):
+            d = _distance(points[2 * i], points[2 * i + 1], x0, y0, x1, y1)
+            if d > worst:
+                worst = d
+                index = i
+        if index is not None and worst > tolerance:
+            keep[index] = True
+            stack.append( (first, index) )
+            stack.append( (index, last) )
+    result = []
+    for i in range(n):
+        if keep[i]:
+            result.extend(points[2 * i:2 * i + 2])
+    return result
+
+
+def polylines( segments, tolerance=TOLERANCE, simplify=0 ):
+    """Flatten path segments (see hersheyfonts.split_path) into polylines, one flat point list per subpath."""
+    lines = []
+    for subpath in hersheyplot.split_subpaths(segments):
+        points = list(subpath[0][1])
+        for cmd, coords in subpath[1:]:
+            if cmd == 'L':
+                points.extend(coords)
+            elif cmd == 'Z':
+                if points[-2:] != points[:2]:
+                    points.extend(points[:2])
+            else:
+                flatten_curve(points[-2:] + coords, tolerance, points)
+        if simplify:
+            points = simplify_polyline(points, simplify)
+        lines.append(points)
+    return lines
+
+
+def flatten_path( pathString, tolerance=TOLERANCE, simplify=0 ):
+    """Return a path string with its curves flattened (and simplified if simplify > 0), as M and L only."""
+    key = (pathString, tolerance, simplify)
+    flat = _flat.get(key)
+    if flat is None:
+        parts = []
+        for points in polylines(hersheyfonts.parse_path(pathString), tolerance, simplify):
+            coords = [hersheyfonts.format_number(points[k]) + ',' + hersheyfonts.format_number(points[k + 1])
+                      for k in range(0, len(points), 2)]
+            parts.append('M' + coords[0])
+            if len(coords) > 1:
+                parts.append('L' + ' '.join(coords[1:]))
+        flat = _flat[key] = ' '.join(parts)
+    return flat
@@ -0,0 +1,279 @@
+'''
+hersheyfonts.py
+
+Lazy font registry for the Hershey Text plugin.
+
+hersheydata.py holds every font as one long list literal. Importing it
+builds all of them, even though a render usually needs one or two faces.
+Instead, each font is loaded from its own small module in hersheyfaces,
+written from hersheydata.py by hersheysplit.py, with the font names and
+groups in the package's index. If that index is missing or was made from
+a different hersheydata.py, the registry reads the source of
+hersheydata.py as text and evaluates only the assignment of the requested
+font (or font group). If the source file is not available either (e.g.
+only a compiled hersheydata.pyc is installed), it imports the module.
+
+If a compiled font pack (hersheydata.hfp, see hersheypack.py) is next to
+hersheydata.py and not older than it, fonts and font groups are read from
+the pack instead, which needs neither the source nor parsing.
+
+Fonts are looked up by name (the variable name in hersheydata.py, which
+is also the value used by --fontface and --fontface_cyr). Unknown names
+are rejected with a ValueError. Loaded fonts are kept as glyph tables,
+see compile_glyphs(), so each face is resolved once per run. A glyph
+table knows its font name, which names its glyphs in SVG definitions
+(see glyph_id()), and its coverage: a bitmap with bit i set if glyph i
+has strokes, so entries with widths only do not count as covered.
+'''
+
+import os
+import re
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hersheydata.py')
+PACK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hersheydata.hfp')
+FACES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hersheyfaces')
+
+# matches the start of any top-level assignment, i.e. the end of the previous one
+ASSIGNMENT = re.compile(r'^[A-Za-z_]\w*\s*=', re.M)
+
+# path commands and numbers of a glyph path body (absolute commands only, as in hersheydata)
+PATH_TOKEN = re.compile(r'[A-Za-z]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+_source = None
+_pack = None
+_faces = None
+_module = None
+_names = None
+_fonts = {}
+_paths = {}
+
+
+class GlyphTable( list ):
+    """The glyph table of a loaded font: a list as built by compile_glyphs(), with the font name and coverage."""
+    def __init__( self, name, glyphs ):
+        list.__init__( self, glyphs )
+        self.name = name
+        self.coverage = 0
+        for i, glyph in enumerate(glyphs):
+            if glyph[2] is not None:
+                self.coverage |= 1 << i
+
+    def covers( self, index ):
+        return (self.coverage >> index) & 1 == 1
+
+
+def compile_glyphs( face ):
+    """
+    Build the glyph table of a hersheydata font list.
+    Each entry is (left bearing, advance width, path body after the first move);
+    the path body is None for glyphs that have widths only (e.g. space).
+    """
+    glyphs = []
+    for pathString in face:
+        splitString = pathString.split()
+        left = float(splitString[0])
+        advance = float(splitString[1]) - left
+        splitpoint = pathString.find("M")
+        if splitpoint > 0:
+            glyphs.append( (left, advance, pathString[splitpoint:]) )
+        else:
+            glyphs.append( (left, advance, None) )
+    return glyphs
+
+
+def split_path( pathString ):
+    """
+    Split a path string into a list of (command, coordinates) segments, where
+    coordinates is a flat list x0, y0, x1, y1, ...
+    """
+    segments = []
+    for token in PATH_TOKEN.findall(pathString):
+        if token.isalpha():
+            segments.append( (token, []) )
+        else:
+            segments[-1][1].append(float(token))
+    return segments
+
+
+def parse_path( pathString ):
+    """Like split_path(), for glyph path bodies; results are cached per path string."""
+    segments = _paths.get(pathString)
+    if segments is None:
+        segments = split_path(pathString)
+        _paths[pathString] = segments
+    return segments
+
+
+def remember_path( pathString, segments ):
+    """Enter the segments of a path string built from them (e.g. by a font pack) into the parse_path() cache."""
+    _paths[pathString] = segments
+
+
+def format_number( x ):
+    s = '%.3f' % x
+    s = s.rstrip('0').rstrip('.')
+    if s == '-0':
+        s = '0'
+    return s
+
+
+def format_path( segments, dx=0, dy=0 ):
+    """Write path segments, moved by (dx, dy), as a path string."""
+    parts = []
+    for cmd, coords in segments:
+        points = [format_number(coords[k] + dx) + ',' + format_number(coords[k + 1] + dy)
+                  for k in range(0, len(coords), 2)]
+        parts.append(cmd + ' '.join(points))
+    return ' '.join(parts)
+
+
+def translate_path( pathString, dx, dy ):
+    """Return a glyph path body moved by (dx, dy), with the offset baked into its coordinates."""
+    return format_path(parse_path(pathString), dx, dy)
+
+
+def glyph_id( fontName, index, flatten=0, simplify=0 ):
+    """
+    SVG id for the definition of a glyph (index into the font's glyph table), drawn
+    as polylines with the given tolerances if flatten is set (see hersheyflatten).
+    """
+    if flatten:
+        return 'hershey-{}-{}-f{}-s{}'.format(fontName, index, format_number(flatten), format_number(simplify))
+    return 'hershey-{}-{}'.format(fontName, index)
+
+
+def _read_source():
+    global _source
+    if _source is None:
+        try:
+            with open(DATA_FILE) as f:
+                _source = f.read()
+        except IOError:
+            _source = ''
+    return _source
+
+
+def _font_pack():
+    """The compiled font pack, or None if there is none or it is older than hersheydata.py."""
+    global _pack
+    if _pack is None:
+        _pack = False
+        try:
+            if os.path.getmtime(PACK_FILE) >= os.path.getmtime(DATA_FILE):
+                import hersheypack
+                _pack = hersheypack.FontPack(PACK_FILE)
+        except (OSError, IOError):
+            pass
+    return _pack or None
+
+
+def _face_index():
+    """The hersheyfaces index module, or None if there is none or it was made from another hersheydata.py."""
+    global _faces
+    if _faces is None:
+        _faces = False
+        try:
+            import hersheyfaces
+            if not os.path.exists(DATA_FILE) or os.path.getsize(DATA_FILE) == hersheyfaces.SOURCE_SIZE:
+                _faces = hersheyfaces
+        except (ImportError, OSError, AttributeError):
+            pass
+    return _faces or None
+
+
+def assignments( source ):
+    """The top-level assignments of a font source file as (name, right-hand side source) pairs."""
+    matches = list(ASSIGNMENT.finditer(source))
+    for k, match in enumerate(matches):
+        end = matches[k + 1].start() if k + 1 < len(matches) else len(source)
+        yield match.group(0).split('=')[0].strip(), source[match.end():end].strip()
+
+
+def read_font_lists( path ):
+    """
+    Read every top-level list assignment of a font source file (hersheydata.py, or a
+    font written by font_converter/converter.py) as a list of (name, list) pairs.
+    """
+    import ast
+    with open(path) as f:
+        source = f.read()
+    return [(name, ast.literal_eval(rhs)) for name, rhs in assignments(source)]
+
+
+def _data_module():
+    global _module
+    if _module is None:
+        import hersheydata
+        _module = hersheydata
+    return _module
+
+
+def _load_literal( name ):
+    """Evaluate the right-hand side of 'name = ...' in hersheydata.py, without importing it."""
+    import ast
+    source = _read_source()
+    match = re.search(r'^' + re.escape(name) + r'\s*=', source, re.M)
+    if match is not None:
+        end = ASSIGNMENT.search(source, match.end())
+        if end is None:
+            rhs = source[match.end():]
+        else:
+            rhs = source[match.end():end.start()]
+        return ast.literal_eval(rhs.strip())
+    return getattr(_data_module(), name)
+
+
+def font_names():
+    """Return the set of font names defined in hersheydata, without loading any font."""
+    global _names
+    if _names is None:
+        pack = _font_pack()
+        faces = _face_index()
+        if pack:
+            names = pack.names()
+        elif faces:
+            names = faces.NAMES
+        elif _read_source():
+            names = set(m.group(0).split('=')[0].strip() for m in ASSIGNMENT.finditer(_read_source()))
+        else:
+            module = _data_module()
+            names = set(n for n in dir(module) if isinstance(getattr(module, n), list))
+        _names = set(n for n in names if not n.startswith('group_'))
+    return _names
+
+
+def font_group( name ):
+    """Return a font group from hersheydata (e.g. 'group_allfonts') as a list of [font name, label]."""
+    pack = _font_pack()
+    if pack:
+        group = pack.font_group(name)
+        if group is not None:
+            return group
+    faces = _face_index()
+    if faces and name in faces.GROUPS:
+        return faces.GROUPS[name]
+    return _load_literal(name)
+
+
+def load_font( name ):
+    """
+    Return the glyph table of the named font, loading it on first use.
+    Raises ValueError if hersheydata has no font of that name.
+    """
+    glyphs = _fonts.get(name)
+    if glyphs is None:
+        pack = _font_pack()
+        if pack:
+            glyphs = pack.load_font(name)
+            if glyphs is None:
+                raise ValueError('Unknown font face "{}"'.format(name))
+        else:
+            if name not in font_names():
+                raise ValueError('Unknown font face "{}"'.format(name))
+            if _face_index():
+                glyphs = compile_glyphs(__import__('hersheyfaces.' + name, fromlist=['glyphs']).glyphs)
+            else:
+                glyphs = compile_glyphs(_load_literal(name))
+        glyphs = GlyphTable(name, glyphs)
+        _fonts[name] = glyphs
+    return glyphs
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+'''
+hersheypack.py
+
+Compiled font packs for the Hershey Text plugin.
+
+A font pack holds fonts as binary data instead of Python string literals,
+so nothing has to be parsed to use them. The file is memory-mapped: a
+font is decoded only when it is loaded, and processes that map the same
+pack share its pages through the page cache. Looking up a font is a
+binary search of the sorted font directory, so opening a pack does not
+get slower with the number of fonts in it.
+
+Layout (little-endian):
+
+    header      magic 'HFPK', version, font count, directory offset,
+                offset and size of the font groups (JSON)
+    directory   one fixed-width entry per font, sorted by name:
+                name (NUL padded), offset of the font block, glyph count
+    font block  font header: glyph count, coordinate scale, segment
+                count, bytes per coordinate (2 or 4);
+                one record per glyph: left and right edge, segment
+                count and coordinate count; no segments = no path;
+                the segments of all glyphs: path command and coordinate
+                count (runs of the same command are joined);
+                the coordinates of all glyphs
+
+All numbers are stored as integers times the coordinate scale of their
+font, the smallest power of ten that keeps them exact.
+
+Glyph paths are rebuilt from the coordinates (see
+hersheyfonts.format_path()), so they match the source geometrically but
+are written in one normalised style.
+
+Build the pack next to hersheydata.py, where hersheyfonts picks it up,
+from hersheydata.py and any fonts written by font_converter/converter.py:
+
+    python hersheypack.py [-o hersheydata.hfp] [MyFont.py ...]
+'''
+
+import argparse
+import array
+import json
+import mmap
+import re
+import struct
+import sys
+
+import hersheyfonts
+
+MAGIC = b'HFPK'
+VERSION = 1
+NAME_SIZE = 32
+
+HEADER = struct.Struct('<4sHHIIII')   # magic, version, reserved, font count, directory, groups offset and size
+ENTRY = struct.Struct('<%dsII' % NAME_SIZE)   # name, font block offset, glyph count
+FONT = struct.Struct('<IIII')         # glyph count, scale, segment count, bytes per coordinate
+GLYPH = struct.Struct('<iiHH')        # left, right, segment count, coordinate count
+SEGMENT = struct.Struct('<cB')        # command, coordinate count
+MAX_RUN = 254                         # coordinates per segment
+ARITY = {'C': 6, 'S': 4, 'Q': 4}      # coordinates per drawing step, 2 for the other commands
+
+SCALES = (1, 10, 100, 1000)
+
+# group entry written as a comment by converter.py: # ['name','label'],
+GROUP_ENTRY = re.compile(r"^#\s*\['([^']*)',\s*'([^']*)'\],", re.M)
+
+
+def coordinate_scale( values ):
+    """Smallest of SCALES that makes every value an exact integer when multiplied."""
+    for scale in SCALES:
+        if all(round(x * scale) / float(scale) == x for x in values):
+            return scale
+    raise ValueError('Coordinates need more than {} decimals'.format(len(SCALES) - 1))
+
+
+def join_runs( segments ):
+    """
+    Join consecutive segments with the same drawing command (L x y L x y is L x y x y)
+    and split them into runs of at most MAX_RUN coordinates; the points after the
+    first of a move are lines (M x y x y is M x y L x y).
+    """
+    joined = []
+    for cmd, coords in segments:
+        pieces = [(cmd, coords)]
+        if cmd in 'Mm' and len(coords) > 2:
+            pieces = [(cmd, coords[:2]), ('L' if cmd == 'M' else 'l', coords[2:])]
+        for cmd, coords in pieces:
+            run = MAX_RUN - MAX_RUN % ARITY.get(cmd.upper(), 2)
+            coords = list(coords)
+            if joined and cmd == joined[-1][0] and cmd not in 'Mm':
+                last = joined[-1][1]
+                free = run - len(last)
+                last.extend(coords[:free])
+                coords = coords[free:]
+                if not coords:
+                    continue
+            for k in range(0, max(len(coords), 1), run):
+                joined.append( (cmd, coords[k:k + run]) )
+    return joined
+
+
+def pack_font( face ):
+    """Binary font block for a font list as stored in hersheydata."""
+    glyphs = []
+    for pathString in face:
+        splitString = pathString.split()
+        splitpoint = pathString.find("M")
+        body = pathString[splitpoint:] if splitpoint > 0 else None
+        segments = join_runs(hersheyfonts.split_path(body)) if body is not None else []
+        glyphs.append( (float(splitString[0]), float(splitString[1]), segments) )
+    values = [x for left, right, segments in glyphs for x in [left, right] +
+              [x for cmd, coords in segments for x in coords]]
+    scale = coordinate_scale(values)
+    ints = [int(round(x * scale)) for x in values]
+    typecode, size = ('h', 2) if all(-32768 <= v < 32768 for v in ints) else ('i', 4)
+    if size == 4 and not all(-2 ** 31 <= v < 2 ** 31 for v in ints):
+        raise ValueError('Coordinates out of range')
+
+    records = []
+    segmentData = []
+    coordinates = array.array(typecode)
+    for left, right, segments in glyphs:
+        count = 0
+        for cmd, coords in segments:
+            segmentData.append(SEGMENT.pack(cmd.encode('ascii'), len(coords)))
+            coordinates.extend(int(round(x * scale)) for x in coords)
+            count += len(coords)
+        records.append(GLYPH.pack(int(round(left * scale)), int(round(right * scale)), len(segments), count))
+    if sys.byteorder == 'big':
+        coordinates.byteswap()
+    return b''.join([FONT.pack(len(glyphs), scale, len(segmentData), size)] + records + segmentData +
+                    [coordinates.tostring() if sys.version_info[0] < 3 else coordinates.tobytes()])
+
+
+def build_pack( fonts, groups ):
+    """Font pack file contents for fonts (name -> hersheydata font list) and groups (name -> list)."""
+    names = sorted(fonts)
+    for name in names:
+        if len(name.encode('ascii')) > NAME_SIZE:
+            raise ValueError('Font name "{}" is longer than {} characters'.format(name, NAME_SIZE))
+    groupData = json.dumps(groups, sort_keys=True).encode('utf-8')
+    offset = HEADER.size + ENTRY.size * len(names) + len(groupData)
+    entries = []
+    blocks = []
+    for name in names:
+        block = pack_font(fonts[name])
+        block += b'\0' * (-len(block) % 8)
+        entries.append(ENTRY.pack(name.encode('ascii'), offset, len(fonts[name])))
+        blocks.append(block)
+        offset += len(block)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(names), HEADER.size,
+                         HEADER.size + ENTRY.size * len(names), len(groupData))
+    return b''.join([header] + entries + [groupData] + blocks)
+
+
+class FontPack( object ):
+    """A memory-mapped font pack. Raises ValueError if the file is not one."""
+    def __init__( self, path ):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, reserved, self.count, self.directory, groupsAt, groupsSize = \
+            HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('"{}" is not a version {} Hershey font pack'.format(path, VERSION))
+        self.groups = (groupsAt, groupsSize)
+        self._groups = None
+
+    def entry_name( self, i ):
+        start = self.directory + i * ENTRY.size
+        return self.data[start:start + NAME_SIZE].rstrip(b'\0')
+
+    def find( self, name ):
+        """Directory entry (font block offset, glyph count) of a font, or None."""
+        key = name.encode('ascii', 'replace')
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.entry_name(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self.entry_name(lo) == key:
+            return ENTRY.unpack_from(self.data, self.directory + lo * ENTRY.size)[1:]
+        return None
+
+    def names( self ):
+        return set(self.entry_name(i).decode('ascii') for i in range(self.count))
+
+    def font_group( self, name ):
+        if self._groups is None:
+            start, size = self.groups
+            self._groups = json.loads(self.data[start:start + size].decode('utf-8'))
+        return self._groups.get(name)
+
+    def load_font( self, name ):
+        """
+        Decode a font into a glyph table as built by hersheyfonts.compile_glyphs(), or
+        return None if the pack has no font of that name. The parsed paths go straight
+        into the hersheyfonts path cache.
+        """
+        found = self.find(name)
+        if found is None:
+            return None
+        offset, count = found
+        data = self.data
+        count, scale, segmentCount, size = FONT.unpack_from(data, offset)
+        recordsAt = offset + FONT.size
+        segmentsAt = recordsAt + GLYPH.size * count
+        valuesAt = segmentsAt + SEGMENT.size * segmentCount
+        records = [GLYPH.unpack_from(data, recordsAt + GLYPH.size * i) for i in range(count)]
+        valueCount = sum(record[3] for record in records)
+        values = array.array('h' if size == 2 else 'i', data[valuesAt:valuesAt + size * valueCount])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        # fonts reuse few distinct coordinates; convert and format each of them once
+        scale = float(scale)
+        numbers = dict((v, v / scale) for v in set(values))
+        texts = dict((v, hersheyfonts.format_number(x)) for v, x in numbers.items())
+
+        glyphs = []
+        nextSegment = nextValue = 0
+        for left, right, segmentCount, valueCount in records:
+            # as in compile_glyphs(): advance = right - left
+            left = left / scale
+            advance = right / scale - left
+            if segmentCount == 0:
+                glyphs.append( (left, advance, None) )
+                continue
+            segments = []
+            parts = []
+            for i in range(nextSegment, nextSegment + segmentCount):
+                cmd, n = SEGMENT.unpack_from(data, segmentsAt + SEGMENT.size * i)
+                cmd = cmd.decode('ascii')
+                run = values[nextValue:nextValue + n]
+                nextValue += n
+                segments.append( (cmd, [numbers[v] for v in run]) )
+                parts.append(cmd + ' '.join([texts[run[k]] + ',' + texts[run[k + 1]] for k in range(0, n, 2)]))
+            nextSegment += segmentCount
+            pathString = ' '.join(parts)   # as hersheyfonts.format_path(segments)
+            hersheyfonts.remember_path(pathString, segments)
+            glyphs.append( (left, advance, pathString) )
+        return glyphs
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Compile Hershey fonts into a binary font pack.")
+    parser.add_argument("fonts", metavar="FONT.py", nargs="*",
+                        help="fonts written by font_converter/converter.py to add to the pack")
+    parser.add_argument("-o", "--output", default=hersheyfonts.PACK_FILE)
+    parser.add_argument("--no-hersheydata", dest="hersheydata", action="store_false", default=True,
+                        help="leave out the fonts of hersheydata.py")
+    options = parser.parse_args(args)
+
+    fonts = {}
+    groups = {}
+    sources = ([hersheyfonts.DATA_FILE] if options.hersheydata else []) + options.fonts
+    for path in sources:
+        for name, value in hersheyfonts.read_font_lists(path):
+            if name.startswith('group_'):
+                groups[name] = value
+            else:
+                fonts[name] = value
+    # fonts from the converter come with commented group_allfonts entries
+    for path in options.fonts:
+        with open(path) as f:
+            for name, label in GROUP_ENTRY.findall(f.read()):
+                if name in fonts and name not in [entry[0] for entry in groups.get('group_allfonts', [])]:
+                    groups.setdefault('group_allfonts', []).append([name, label])
+    if not fonts:
+        parser.error("no fonts to pack")
+
+    data = build_pack(fonts, groups)
+    with open(options.output, 'wb') as f:
+        f.write(data)
+    sys.stderr.write("packed {} fonts into {} ({} bytes)\n".format(len(fonts), options.output, len(data)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
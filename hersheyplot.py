@@ -0,0 +1,167 @@
+'''
+hersheyplot.py
+
+Pen plotter post-processing for Hershey Text output.
+
+Strokes come out of the renderer in character order, so the pen often
+travels a long way while lifted. order_subpaths() reorders the subpaths
+(optionally drawing some of them backwards) with a nearest-neighbour
+search over a uniform grid of subpath end points, which keeps it close
+to linear for large documents.
+
+Subpaths are lists of (command, coordinates) segments as returned by
+hersheyfonts.split_path(), with absolute M, L, Q, C and Z commands.
+'''
+
+import math
+
+from hersheyfonts import format_number
+
+# number of points taken by one step of each path command
+POINTS_PER_STEP = { 'M': 1, 'L': 1, 'Q': 2, 'C': 3, 'Z': 0 }
+
+
+def split_subpaths( segments, dx=0, dy=0 ):
+    """
+    Split path segments into subpaths moved by (dx, dy). Each segment of the result
+    is a single drawing step; the first segment of each subpath is its move.
+    """
+    subpaths = []
+    for cmd, coords in segments:
+        n = POINTS_PER_STEP.get(cmd)
+        if n is None:
+            raise ValueError('Unsupported path command "{}"'.format(cmd))
+        points = [coords[k] + (dy if k % 2 else dx) for k in range(len(coords))]
+        if n == 0:
+            subpaths[-1].append( ('Z', []) )
+            continue
+        for k in range(0, len(points), 2 * n):
+            step = points[k:k + 2 * n]
+            if cmd == 'M' and k == 0:
+                subpaths.append( [('M', step)] )
+            else:
+                # extra points after a move are implicit line-tos
+                subpaths[-1].append( ('L' if cmd == 'M' else cmd, step) )
+    return subpaths
+
+
+def subpath_ends( subpath ):
+    """Return the start and end point of a subpath."""
+    start = tuple(subpath[0][1])
+    if subpath[-1][0] == 'Z':
+        return start, start
+    return start, tuple(subpath[-1][1][-2:])
+
+
+def reverse_subpath( subpath ):
+    """Return the subpath drawn from its end to its start. Closed subpaths are returned as they are."""
+    if subpath[-1][0] == 'Z':
+        return subpath
+    reversed_path = [('M', list(subpath[-1][1][-2:]))]
+    for k in range(len(subpath) - 1, 0, -1):
+        cmd, coords = subpath[k]
+        controls = coords[:-2]
+        pairs = [controls[m:m + 2] for m in range(len(controls) - 2, -2, -2)]
+        points = []
+        for pair in pairs:
+            points.extend(pair)
+        points.extend(subpath[k - 1][1][-2:])
+        reversed_path.append( (cmd, points) )
+    return reversed_path
+
+
+def travel_distance( subpaths, x=0, y=0 ):
+    """Pen-up distance to draw the subpaths in order, starting with the pen at (x, y)."""
+    total = 0
+    for subpath in subpaths:
+        start, end = subpath_ends(subpath)
+        total += math.hypot(start[0] - x, start[1] - y)
+        x, y = end
+    return total
+
+
+def order_subpaths( subpaths, reverse=True, x=0, y=0 ):
+    """
+    Reorder subpaths for short pen-up travel, starting with the pen at (x, y):
+    repeatedly draw the subpath whose start (or, with reverse, either end) is nearest
+    to the pen. Returns the new list; subpaths drawn backwards are reversed.
+    """
+    n = len(subpaths)
+    if n == 0:
+        return []
+    ends = [subpath_ends(sp) for sp in subpaths]
+    canReverse = [reverse and sp[-1][0] != 'Z' for sp in subpaths]
+
+    xs = [p[0] for e in ends for p in e]
+    ys = [p[1] for e in ends for p in e]
+    xmin, xmax, ymin, ymax = min(xs), max(xs), min(ys), max(ys)
+    area = (xmax - xmin) * (ymax - ymin)
+    if area > 0:
+        cell = math.sqrt(area / n)
+    else:
+        cell = max(xmax - xmin, ymax - ymin, 1.0) / n
+    cell = max(cell, 1e-6)
+
+    # grid cell -> list of (subpath index, 0 for start / 1 for end)
+    grid = {}
+    for i in range(n):
+        for e in ((0, 1) if canReverse[i] else (0,)):
+            p = ends[i][e]
+            key = (int(math.floor(p[0] / cell)), int(math.floor(p[1] / cell)))
+            grid.setdefault(key, []).append( (i, e) )
+    gxmin, gxmax = int(math.floor(xmin / cell)), int(math.floor(xmax / cell))
+    gymin, gymax = int(math.floor(ymin / cell)), int(math.floor(ymax / cell))
+
+    done = [False] * n
+    ordered = []
+    for _ in range(n):
+        gx, gy = int(math.floor(x / cell)), int(math.floor(y / cell))
+        maxr = max(abs(gx - gxmin), abs(gx - gxmax), abs(gy - gymin), abs(gy - gymax))
+        best = None
+        bestd = 0
+        r = 0
+        while r <= maxr:
+            if r == 0:
+                ring = [(gx, gy)]
+            else:
+                ring = [(gx + k, gy - r) for k in range(-r, r + 1)]
+                ring += [(gx + k, gy + r) for k in range(-r, r + 1)]
+                ring += [(gx - r, gy + k) for k in range(-r + 1, r)]
+                ring += [(gx + r, gy + k) for k in range(-r + 1, r)]
+            for key in ring:
+                entries = grid.get(key)
+                if not entries:
+                    continue
+                live = [t for t in entries if not done[t[0]]]
+                if len(live) != len(entries):
+                    grid[key] = live
+                for i, e in live:
+                    p = ends[i][e]
+                    d = (p[0] - x) ** 2 + (p[1] - y) ** 2
+                    if best is None or d < bestd:
+                        best = (i, e)
+                        bestd = d
+            # anything beyond this ring is at least r cells away
+            if best is not None and bestd <= (r * cell) ** 2:
+                break
+            r += 1
+
+        i, e = best
+        done[i] = True
+        subpath = subpaths[i]
+        if e == 1:
+            subpath = reverse_subpath(subpath)
+        ordered.append(subpath)
+        x, y = subpath_ends(subpath)[1]
+    return ordered
+
+
+def format_subpaths( subpaths ):
+    """Write subpaths back as a path string."""
+    parts = []
+    for subpath in subpaths:
+        for cmd, coords in subpath:
+            points = [format_number(coords[k]) + ',' + format_number(coords[k + 1])
+                      for k in range(0, len(coords), 2)]
+            parts.append(cmd + ' '.join(points))
+    return ' '.join(parts)
@@ -0,0 +1,75 @@
+'''
+hersheyprofile.py
+
+Per-phase timing and counters for the Hershey Text plugin and the font
+converter, written as a JSON report (--profile FILE).
+
+A Profile adds up the wall time spent in each phase (with
+profile.phase(name): ...) and keeps named counters (profile.count()).
+Phases may nest, e.g. the measure and wrap phases of a render are also
+part of its render phase. Code that is not being profiled uses OFF,
+whose phases and counters do nothing, so the instrumentation costs next
+to nothing unless a report was asked for.
+'''
+
+import json
+import time
+from collections import OrderedDict
+
+
+class _Phase( object ):
+    def __init__( self, profile, name ):
+        self.profile = profile
+        self.name = name
+
+    def __enter__( self ):
+        self.start = time.time()
+
+    def __exit__( self, *exc ):
+        phases = self.profile.phases
+        phases[self.name] = phases.get(self.name, 0) + time.time() - self.start
+
+
+class Profile( object ):
+    """Wall time per phase and counters of one run."""
+    def __init__( self ):
+        self.phases = OrderedDict()     # phase name -> seconds
+        self.counters = OrderedDict()   # counter name -> value
+
+    def phase( self, name ):
+        return _Phase(self, name)
+
+    def count( self, name, n=1 ):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def report( self ):
+        return OrderedDict([
+            ('phases', OrderedDict((name, round(seconds, 6)) for name, seconds in self.phases.items())),
+            ('counters', self.counters)])
+
+    def write( self, path ):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=1)
+            f.write('\n')
+
+
+class _NoPhase( object ):
+    def __enter__( self ):
+        pass
+
+    def __exit__( self, *exc ):
+        pass
+
+
+class _NoProfile( object ):
+    """Stands in for a Profile when profiling is off."""
+    _phase = _NoPhase()
+
+    def phase( self, name ):
+        return self._phase
+
+    def count( self, name, n=1 ):
+        pass
+
+
+OFF = _NoProfile()
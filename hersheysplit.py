@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+'''
+hersheysplit.py
+
+Splits hersheydata.py into one small module per font for fast loading.
+
+hersheydata.py keeps every font in one 1 MB source file, so finding and
+parsing a single font in it takes longer than the whole rest of a render.
+This writes the package hersheyfaces next to it: hersheyfaces/<font>.py
+holds the glyph list of one font, and hersheyfaces/__init__.py the font
+names, the font groups and the size of the hersheydata.py it was made
+from. hersheyfonts loads a face by importing just its module (compiled
+once to a .pyc like any module) and falls back to reading hersheydata.py
+when the index is missing or was made from a different hersheydata.py.
+
+Run it again after adding fonts to hersheydata.py:
+
+    python hersheysplit.py [-o hersheyfaces] [hersheydata.py]
+'''
+
+import argparse
+import ast
+import io
+import os
+import sys
+
+import hersheyfonts
+
+HEADER = '# generated by hersheysplit.py from hersheydata.py, do not edit\n'
+
+
+def write_module( path, text ):
+    with io.open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+
+
+def split_fonts( source, size, directory ):
+    """Write the font modules and the index for the source of hersheydata.py; returns the font names."""
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    names = []
+    groups = {}
+    for name, rhs in hersheyfonts.assignments(source):
+        if name.startswith('group_'):
+            groups[str(name)] = [[str(value) for value in entry] for entry in ast.literal_eval(rhs)]
+        else:
+            names.append(str(name))
+            write_module(os.path.join(directory, name + '.py'), HEADER + u'glyphs = ' + rhs + u'\n')
+    write_module(os.path.join(directory, '__init__.py'), HEADER +
+                 u"'''Font index of hersheydata.py, see hersheysplit.py.'''\n\n" +
+                 u'SOURCE_SIZE = {}\n'.format(size) +
+                 u'NAMES = {!r}\n'.format(tuple(sorted(names))) +
+                 u'GROUPS = {!r}\n'.format(groups))
+    return names
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("source", nargs="?", default=hersheyfonts.DATA_FILE, help="hersheydata.py")
+    parser.add_argument("-o", "--output", default=hersheyfonts.FACES_DIR, help="package directory to write")
+    options = parser.parse_args(args)
+
+    with io.open(options.source, encoding='utf-8') as f:
+        source = f.read()
+    names = split_fonts(source, os.path.getsize(options.source), options.output)
+    sys.stderr.write("wrote {} fonts to {}\n".format(len(names), options.output))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
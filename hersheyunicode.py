@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+hersheyunicode.py
+
+Unicode input for the Hershey Text plugin: resolves each codepoint of
+the text to a font and a glyph of that font.
+
+Hershey fonts only have the 96 ASCII slots (code - 32 is the glyph
+index), so other scripts live in the ASCII slots of their own fonts.
+CODEPOINTS, built once at import, maps each supported codepoint to a
+font role and a glyph index:
+
+    LATIN       ASCII, in the font being drawn; Latin letters with
+                diacritics (U+00C0 to U+017F) fall back to their base
+                letter, typographic quotes and dashes to ASCII ones
+    CYRILLIC    U+0410 to U+044F, in the Cyrillic font (fontface_cyr),
+                whose ASCII slots hold the letters as in CP1251_SLOTS;
+                Ё and ё are drawn as Е and е, as no font has them
+    GREEK       the Greek letters, in the slots of the Symbol layout of
+                the Greek fonts (greek, or timesg if that is the font)
+    font name   the symbol fonts have no Unicode equivalent; glyph i of
+                the k-th font of SYMBOL_FONTS is at U+E000 + 0x100 * k + i
+                in the Private Use Area
+
+CharMap turns roles into the glyph tables of one pair of fonts, once
+per codepoint, so the renderer resolves any character of mixed-script
+text with a single dictionary lookup.
+
+A CharMap may have a fallback chain of further fonts. Glyphs the
+primary font of a role does not cover (see GlyphTable.coverage) are
+taken from the first font of the chain that has the same layout
+(font_script()) and covers them. Which font that is gets worked out
+for every glyph slot when the CharMap is made, from the coverage
+bitmaps, so resolving a codepoint stays a plain lookup.
+'''
+
+import unicodedata
+
+import hersheyfonts
+
+try:
+    unichr
+except NameError:
+    unichr = chr
+
+LATIN = 0
+CYRILLIC = 1
+GREEK = 2
+
+GREEK_FONTS = ('greek', 'timesg')
+
+SYMBOL_FONTS = ['astrology', 'japanese', 'markers', 'mathlow', 'mathupp', 'meteorology', 'music', 'symbolic']
+
+PRIVATE_USE_START = 0xE000
+
+# cp1251 code of each Cyrillic letter -> ASCII slot holding it in Cyrillic layout fonts
+CP1251_SLOTS = {
+
+    192 : ord("A"),
+    193 : ord("B"),
+    194 : ord("V"),
+    195 : ord("G"),
+    196 : ord("D"),
+    197 : ord("["),
+    198 : ord("H"),
+    199 : ord("Z"),
+    200 : ord("I"),
+    201 : ord("E"),
+    202 : ord("K"),
+    203 : ord("L"),
+    204 : ord("M"),
+    205 : ord("N"),
+    206 : ord("O"),
+    207 : ord("P"),
+    208 : ord("R"),
+    209 : ord("S"),
+    210 : ord("T"),
+    211 : ord("Y"),
+    212 : ord("F"),
+    213 : ord("X"), # Х
+    214 : ord("`"),
+    215 : ord("J"),
+    216 : ord("Q"),
+    217 : ord("W"),
+    218 : ord("]"), # Ь
+    219 : ord("$"),
+    220 : ord("_"),
+    221 : ord("C"),
+    222 : ord("U"),
+    223 : ord("^"), # Я
+    224 : ord("a"),
+    225 : ord("b"),
+    226 : ord("v"),
+    227 : ord("g"),
+    228 : ord("d"),
+    229 : ord("{"),
+    230 : ord("h"),
+    231 : ord("z"),
+    232 : ord("i"),
+    233 : ord("e"),
+    234 : ord("k"),
+    235 : ord("l"),
+    236 : ord("m"),
+    237 : ord("n"),
+    238 : ord("o"),
+    239 : ord("p"),
+    240 : ord("r"),
+    241 : ord("s"),
+    242 : ord("t"),
+    243 : ord("y"),
+    244 : ord("f"),
+    245 : ord("x"),
+    246 : ord("%"), # ц
+    247 : ord("j"),
+    248 : ord("q"),
+    249 : ord("w"),
+    250 : ord("|"),
+    251 : ord("&"),
+    252 : ord("~"),
+    253 : ord("c"),
+    254 : ord("u"),
+    255 : ord("}"),
+}
+
+# Greek letter -> slot of the Symbol font layout used by the Greek Hershey fonts
+GREEK_SLOTS = u"\u0391A\u0392B\u0393G\u0394D\u0395E\u0396Z\u0397H\u0398Q\u0399I\u039aK\u039bL\u039cM" \
+              u"\u039dN\u039eX\u039fO\u03a0P\u03a1R\u03a3S\u03a4T\u03a5U\u03a6F\u03a7C\u03a8Y\u03a9W" \
+              u"\u03b1a\u03b2b\u03b3g\u03b4d\u03b5e\u03b6z\u03b7h\u03b8q\u03b9i\u03bak\u03bbl\u03bcm" \
+              u"\u03bdn\u03bex\u03bfo\u03c0p\u03c1r\u03c2s\u03c3s\u03c4t\u03c5u\u03c6f\u03c7c\u03c8y\u03c9w"
+
+# typographic punctuation -> ASCII stand-in
+PUNCTUATION = u"\u2018'\u2019'\u201a,\u201c\"\u201d\"\u201e\"\u00ab\"\u00bb\"\u2010-\u2011-\u2012-\u2013-\u2014-\u2212-"
+
+
+def _build_codepoints():
+    codepoints = {}
+    for q in range(32, 128):
+        codepoints[q] = (LATIN, q - 32)
+    for q in range(0xC0, 0x180):
+        base = unicodedata.normalize('NFD', unichr(q))[0]
+        if ord(base) < 127 and base.isalpha():
+            codepoints[q] = (LATIN, ord(base) - 32)
+    for k in range(0, len(PUNCTUATION), 2):
+        codepoints[ord(PUNCTUATION[k])] = (LATIN, ord(PUNCTUATION[k + 1]) - 32)
+    for code, slot in CP1251_SLOTS.items():
+        codepoints[ord(bytearray([code]).decode('cp1251'))] = (CYRILLIC, slot - 32)
+    codepoints[0x401] = codepoints[0x415]   # Ё as Е
+    codepoints[0x451] = codepoints[0x435]   # ё as е
+    for k in range(0, len(GREEK_SLOTS), 2):
+        codepoints[ord(GREEK_SLOTS[k])] = (GREEK, ord(GREEK_SLOTS[k + 1]) - 32)
+    for k, name in enumerate(SYMBOL_FONTS):
+        for i in range(0x100):
+            codepoints[PRIVATE_USE_START + 0x100 * k + i] = (name, i)
+    return codepoints
+
+
+CODEPOINTS = _build_codepoints()
+
+MISSING = (None, None)
+
+
+def font_script( name ):
+    """Role whose glyphs a font holds in its ASCII slots: a symbol font's own name, CYRILLIC, GREEK or LATIN."""
+    if name in SYMBOL_FONTS:
+        return name
+    if name == 'cyrillic' or name.endswith('_cyr'):
+        return CYRILLIC
+    if name in GREEK_FONTS:
+        return GREEK
+    return LATIN
+
+
+def fallback_chain( value ):
+    """Parse a fallback chain given as a comma separated list of font names."""
+    return tuple(name.strip() for name in value.split(',') if name.strip())
+
+
+def decode_text( data ):
+    """Decode input text given as bytes: UTF-8, or cp1251 if it is not valid UTF-8. Text is returned as it is."""
+    if isinstance(data, bytes):
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            return data.decode('cp1251', 'replace')
+    return data
+
+
+class CharMap( object ):
+    """
+    Resolves codepoints for a font and Cyrillic font pair, with an optional fallback
+    chain (font names). glyphs maps each codepoint seen so far to (glyph table, glyph
+    index): the table is None for Latin glyphs of the primary font, which are taken
+    from whatever font is being drawn; both are None for codepoints no font covers.
+    Look codepoints up as glyphs.get(q) or resolve(q). Unknown font names raise
+    ValueError.
+    """
+    def __init__( self, fontface, fontface_cyr, fallback=() ):
+        self.fontface = fontface
+        self.font_cyr = hersheyfonts.load_font(fontface_cyr)
+        chain = [hersheyfonts.load_font(name) for name in fallback]
+        greek = fontface if fontface in GREEK_FONTS else 'greek'
+        self.owners = {}   # role -> font of each glyph slot, see first_covering()
+        for role, primary in ((LATIN, hersheyfonts.load_font(fontface)),
+                              (CYRILLIC, self.font_cyr),
+                              (GREEK, None)):
+            fallbacks = [table for table in chain if font_script(table.name) == role]
+            if primary is None:
+                if not fallbacks:
+                    continue    # loaded on first use, see resolve()
+                primary = hersheyfonts.load_font(greek)
+            self.owners[role] = self.first_covering(primary, fallbacks, role == LATIN)
+        self.greek = greek
+        self.glyphs = {}
+
+    def first_covering( self, primary, fallbacks, drawn=False ):
+        """
+        For each glyph slot, the first of primary and fallbacks that covers it. Slots
+        none of them covers stay with the primary font (e.g. spaces, which have widths
+        only), or are False if it has no such slot. With drawn, None stands for
+        the primary font, i.e. the font being drawn.
+        """
+        size = max(len(table) for table in [primary] + fallbacks)
+        owners = [primary if k < len(primary) else False for k in range(size)]
+        for k in range(size):
+            for table in [primary] + fallbacks:
+                if table.covers(k):
+                    owners[k] = table
+                    break
+        if drawn:
+            owners = [None if table is primary else table for table in owners]
+        return owners
+
+    def resolve( self, q ):
+        target = CODEPOINTS.get(q)
+        if target is None:
+            glyph = MISSING
+        else:
+            role, index = target
+            owners = self.owners.get(role)
+            if owners is not None:
+                table = owners[index] if index < len(owners) else False
+            elif role == GREEK:
+                table = hersheyfonts.load_font(self.greek)
+            else:
+                table = hersheyfonts.load_font(role)
+                if index >= len(table):
+                    table = False
+            glyph = MISSING if table is False else (table, index)
+        self.glyphs[q] = glyph
+        return glyph
+
+
+_charmaps = {}
+
+
+def charmap( fontface, fontface_cyr, fallback=() ):
+    """The CharMap of a font pair and fallback chain, shared by everything that renders or measures with it."""
+    key = (fontface, fontface_cyr, tuple(fallback))
+    cmap = _charmaps.get(key)
+    if cmap is None:
+        cmap = _charmaps[key] = CharMap(fontface, fontface_cyr, fallback)
+    return cmap
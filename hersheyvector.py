@@ -0,0 +1,110 @@
+'''
+hersheyvector.py
+
+Absolute coordinate output for the Hershey Text plugin, with NumPy.
+
+Normally every glyph is placed with its own translate(...) and the
+document scale is applied to the whole group. For tools that want plain
+absolute coordinates, transform_paths() bakes the glyph offsets and an
+affine transform (scale, rotation, placement) into the path data. The
+points of all paths go through the transform together, as one NumPy
+array, instead of glyph by glyph.
+
+NumPy is only needed for this mode; it is imported on first use.
+'''
+
+import math
+
+import hersheyfonts
+
+_numpy = None
+_arrays = {}   # path data -> (commands with their point counts, points as an n x 2 array)
+
+
+def require_numpy():
+    """Import NumPy, with an explanation if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('Absolute coordinates need NumPy, which is not installed (pip install numpy)')
+        _numpy = numpy
+    return _numpy
+
+
+def affine( scale=1, rotate=0, dx=0, dy=0, cx=0, cy=0 ):
+    """
+    Matrix (a, b, c, d, e, f) of the SVG transform
+    translate(dx, dy) rotate(rotate) scale(scale) translate(-cx, -cy),
+    which puts the point (cx, cy) at (dx, dy); rotate is in degrees.
+    """
+    r = math.radians(rotate)
+    cos, sin = math.cos(r) * scale, math.sin(r) * scale
+    return (cos, sin, -sin, cos, dx - cos * cx + sin * cy, dy - sin * cx - cos * cy)
+
+
+def path_arrays( pathString, cache=True ):
+    """
+    The points of a path as an n x 2 array, with a template that writes the
+    path back from its formatted points (template % points), cached per path string
+    unless cache is false (for paths that will not come up again, like merged lines).
+    """
+    arrays = _arrays.get(pathString)
+    if arrays is None:
+        np = require_numpy()
+        if cache:
+            segments = hersheyfonts.parse_path(pathString)
+        else:
+            segments = hersheyfonts.split_path(pathString)
+        template = ' '.join(cmd + ' '.join(['%s'] * (len(coords) // 2)) for cmd, coords in segments)
+        points = np.array([x for cmd, coords in segments for x in coords], dtype=float).reshape(-1, 2)
+        arrays = (template, points)
+        if cache:
+            _arrays[pathString] = arrays
+    return arrays
+
+
+def format_numbers( values ):
+    """
+    Format an array of numbers like hersheyfonts.format_number(); returns a list.
+    Glyph coordinates repeat a lot, so each distinct value is formatted once.
+    """
+    np = require_numpy()
+    distinct, inverse = np.unique(values, return_inverse=True)
+    texts = np.array([hersheyfonts.format_number(x) for x in distinct.tolist()], dtype=object)
+    return texts[inverse.reshape(-1)].tolist()
+
+
+def transform_paths( paths, matrix ):
+    """
+    Apply each path's offset and then matrix (see affine()) to engine paths (d, x, y);
+    returns them as paths (d, None, None) with absolute coordinates.
+    """
+    np = require_numpy()
+    if not paths:
+        return []
+    templates = []
+    blocks = []
+    offsets = []
+    counts = []
+    for d, x, y in paths:
+        # glyphs (placed by offset) repeat, merged paths (no offset) are one-offs
+        template, points = path_arrays(d, x is not None)
+        templates.append(template)
+        blocks.append(points)
+        offsets.append( (x or 0, y or 0) )
+        counts.append(len(points))
+
+    a, b, c, d, e, f = matrix
+    points = np.concatenate(blocks) + np.repeat(np.array(offsets, dtype=float), counts, axis=0)
+    placed = points.dot(np.array([[a, b], [c, d]])) + np.array([e, f])
+    texts = format_numbers(placed)
+    coords = [x + ',' + y for x, y in zip(texts[0::2], texts[1::2])]
+
+    result = []
+    k = 0
+    for template, n in zip(templates, counts):
+        result.append( (template % tuple(coords[k:k + n]), None, None) )
+        k += n
+    return result
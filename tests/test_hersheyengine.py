@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+'''
+test_hersheyengine.py
+
+Tests of text layout and glyph emission in hersheyengine.py.
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hersheyengine import HersheyEngine, spacing
+
+
+def positions( paths ):
+    return [(round(x, 6), y) for d, x, y in paths]
+
+
+class ParagraphTest( unittest.TestCase ):
+
+    def test_spaces_match_default_layout( self ):
+        # render_paragraphs() keeps space runs and indentation as render_text() draws them
+        text = '  indented  twice   spaced\n\nlast  line '
+        for boxwidth in (0, 80, 200):
+            engine = HersheyEngine(boxwidth=boxwidth)
+            paths = engine.run('render', text)[0]
+            engine.render_paragraphs(text)
+            self.assertEqual(positions(engine.paths), positions(paths))
+
+    def test_indentation_kept( self ):
+        indented = HersheyEngine(layout='optimal').run('render', '    ab')[0]
+        plain = HersheyEngine(layout='optimal').run('render', 'ab')[0]
+        self.assertEqual(indented[0][1] - plain[0][1], 4 * 2 * spacing)
+
+
+class FallbackTest( unittest.TestCase ):
+
+    def test_sample_sheet_ignores_fallback( self ):
+        # each row of the sample sheet is drawn in its own font, not in the fallback chain
+        plain = HersheyEngine('markers', 'cyrillic').run('sample', 'AB')
+        chained = HersheyEngine('markers', 'cyrillic', fallback=('EMSTech',)).run('sample', 'AB')
+        self.assertEqual(chained, plain)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+'''
+test_hersheyunicode.py
+
+Tests of the codepoint table and glyph resolution in hersheyunicode.py.
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hersheyengine
+import hersheyunicode
+
+
+class CodepointTest( unittest.TestCase ):
+
+    def test_ascii_slots( self ):
+        for q in range(32, 128):
+            self.assertEqual(hersheyunicode.CODEPOINTS[q], (hersheyunicode.LATIN, q - 32))
+
+    def test_last_ascii_glyph( self ):
+        # U+007F is drawn with glyph 95, the last of the 96 ASCII slots
+        cmap = hersheyunicode.charmap('futural', 'cyrillic')
+        table, index = cmap.resolve(0x7F)
+        self.assertEqual(index, 95)
+        paths, width, v = hersheyengine.HersheyEngine('futural', 'cyrillic').run('render', u'\x7f')
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(width, hersheyengine.text_width('futural', 'cyrillic', u'\x7f'))
+
+
+if __name__ == '__main__':
+    unittest.main()